@@ -0,0 +1,189 @@
+#!/usr/bin/python3
+#
+# Copyright 2026 The ANGLE Project Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+#
+# autogen_writer.py:
+#   Output helpers shared by the code generators run by scripts/run_code_generation.py.
+#   Generated files are rendered in memory and only replaced when their content changes, so
+#   that regenerating unchanged files doesn't bump their mtime and trigger C++ rebuilds.
+#
+#   run_code_generation.py formats the outputs after the generators run, so a formatted output
+#   doesn't match what its generator renders. A hash of the rendered content of each output is
+#   kept in scripts/.autogen_hashes/ to recognize the formatted outputs as up to date.
+#
+#   Usage from a generator:
+#
+#     with autogen_writer.open_output('foo_autogen.cpp') as out_file:
+#         out_file.write(content)
+#
+#   or autogen_writer.write_if_changed('foo_autogen.cpp', content).
+#
+#   Set ANGLE_AUTOGEN_REPORT=1 (run_code_generation.py --report-outputs) to print how many outputs
+#   each generator wrote.
+
+import atexit
+import contextlib
+import hashlib
+import io
+import json
+import os
+import shutil
+import sys
+
+REPORT_ENV_VAR = 'ANGLE_AUTOGEN_REPORT'
+
+# Local, untracked records of the rendered and on-disk hashes of each output, one file per output
+# so that generators running concurrently don't share any file.
+HASH_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.autogen_hashes')
+
+# Outputs handled in this process, for the report.
+_written = []
+_unchanged = []
+
+
+def _read_existing(path, binary, open_args):
+    try:
+        with open(path, 'rb' if binary else 'r', **open_args) as f:
+            return f.read()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _file_hash(path):
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.md5(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def _record_path(path):
+    return os.path.join(HASH_DIR,
+                        hashlib.md5(os.path.abspath(path).encode()).hexdigest() + '.json')
+
+
+def _load_record(path):
+    try:
+        with open(_record_path(path)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_record(path, rendered_hash, output_hash):
+    record = {'path': os.path.abspath(path), 'rendered': rendered_hash, 'output': output_hash}
+    if _load_record(path) == record:
+        return
+    os.makedirs(HASH_DIR, exist_ok=True)
+    record_path = _record_path(path)
+    temp_path = '%s.%d.tmp' % (record_path, os.getpid())
+    with open(temp_path, 'w') as f:
+        json.dump(record, f)
+    os.replace(temp_path, record_path)
+
+
+# Hash of the content a generator renders for an output, before any formatting.
+def content_hash(content):
+    if isinstance(content, str):
+        content = content.encode()
+    return hashlib.md5(content).hexdigest()
+
+
+# Returns whether path was written from content hashing to rendered_hash, and wasn't modified
+# since other than by the formatting that follows the first run that wrote it.
+def is_up_to_date(path, rendered_hash):
+    record = _load_record(path)
+    if not record or record.get('rendered') != rendered_hash:
+        return False
+    output_hash = _file_hash(path)
+    if output_hash is None:
+        return False
+    if record.get('output') is None:
+        # First run since the output was written: its current content is the formatted output.
+        _save_record(path, rendered_hash, output_hash)
+        return True
+    return record['output'] == output_hash
+
+
+# Writes content (str, or bytes if mode is 'wb') to path unless the file already holds exactly
+# that content, or holds the formatted version of it. The file is replaced atomically so that
+# readers never see a partial output. open_args (e.g. newline, encoding) are used both to compare
+# and to write. Returns whether the file was written.
+def write_if_changed(path, content, mode='w', **open_args):
+    binary = 'b' in mode
+    rendered_hash = content_hash(content)
+    if _read_existing(path, binary, open_args) == content:
+        _save_record(path, rendered_hash, _file_hash(path))
+        _unchanged.append(path)
+        return False
+    if is_up_to_date(path, rendered_hash):
+        _unchanged.append(path)
+        return False
+
+    temp_path = '%s.%d.tmp' % (path, os.getpid())
+    try:
+        with open(temp_path, mode, **open_args) as f:
+            f.write(content)
+        if os.path.exists(path):
+            shutil.copymode(path, temp_path)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    # The hash of the file on disk is recorded on the next run, after it's formatted.
+    _save_record(path, rendered_hash, None)
+    _written.append(path)
+    return True
+
+
+# Records an output that the generator knows to be up to date without rendering it.
+def mark_unchanged(path):
+    _unchanged.append(path)
+
+
+class _TextBuffer(io.StringIO):
+
+    # Generators often close their output explicitly inside the with block.
+    def close(self):
+        pass
+
+
+class _BinaryBuffer(io.BytesIO):
+
+    def close(self):
+        pass
+
+
+# Drop-in replacement for open(path, mode) for generated outputs: everything written to the
+# returned file object is buffered and passed to write_if_changed when the block exits normally.
+@contextlib.contextmanager
+def open_output(path, mode='w', **open_args):
+    assert 'w' in mode, 'open_output is only for writing outputs'
+    buffer = _BinaryBuffer() if 'b' in mode else _TextBuffer()
+    yield buffer
+    write_if_changed(path, buffer.getvalue(), mode, **open_args)
+
+
+def get_stats():
+    return len(_written), len(_unchanged)
+
+
+def reset_stats():
+    del _written[:]
+    del _unchanged[:]
+
+
+def report(name=None):
+    if os.environ.get(REPORT_ENV_VAR) != '1':
+        return
+    written, unchanged = get_stats()
+    if written or unchanged:
+        print('%s: %d output(s) written, %d unchanged' %
+              (name or os.path.basename(sys.argv[0]), written, unchanged))
+
+
+# Generators run as scripts report when they exit. run_code_generation.py --in-process reports
+# and resets the stats after each generator instead.
+atexit.register(report)
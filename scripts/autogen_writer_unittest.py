@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# Copyright 2026 The ANGLE Project Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+"""
+autogen_writer_unittest.py: Tests that regenerating unchanged outputs leaves them untouched, even
+once they are formatted.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import autogen_writer
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(SCRIPTS_DIR)
+
+# Far enough in the past that any rewrite of an output changes its mtime.
+OLD_MTIME_NS = 1000000000 * 10**9
+
+
+def _ReadFile(path):
+    with open(path) as f:
+        return f.read()
+
+
+def _WriteFile(path, content):
+    with open(path, 'w') as f:
+        f.write(content)
+
+
+# Stands in for the git cl format call of run_code_generation.py.
+def _FormatOutput(path):
+    _WriteFile(path, _ReadFile(path).replace('    ', '  ') + '// formatted\n')
+    os.utime(path, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+
+
+class WriteIfChangedTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        patcher = mock.patch.object(autogen_writer, 'HASH_DIR',
+                                    os.path.join(self.temp_dir.name, 'hashes'))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(autogen_writer.reset_stats)
+        self.path = os.path.join(self.temp_dir.name, 'foo_autogen.h')
+
+    def test_unchanged_content(self):
+        self.assertTrue(autogen_writer.write_if_changed(self.path, 'int foo;\n'))
+        os.utime(self.path, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+        self.assertFalse(autogen_writer.write_if_changed(self.path, 'int foo;\n'))
+        self.assertEqual(os.stat(self.path).st_mtime_ns, OLD_MTIME_NS)
+
+    def test_formatted_output(self):
+        autogen_writer.write_if_changed(self.path, 'int    foo;\n')
+        _FormatOutput(self.path)
+        formatted = _ReadFile(self.path)
+        for _ in range(2):
+            self.assertFalse(autogen_writer.write_if_changed(self.path, 'int    foo;\n'))
+            self.assertEqual(_ReadFile(self.path), formatted)
+            self.assertEqual(os.stat(self.path).st_mtime_ns, OLD_MTIME_NS)
+
+        self.assertTrue(autogen_writer.write_if_changed(self.path, 'int    bar;\n'))
+        self.assertEqual(_ReadFile(self.path), 'int    bar;\n')
+
+    def test_modified_output(self):
+        autogen_writer.write_if_changed(self.path, 'int    foo;\n')
+        _FormatOutput(self.path)
+        self.assertFalse(autogen_writer.write_if_changed(self.path, 'int    foo;\n'))
+
+        _WriteFile(self.path, 'int edited;\n')
+        self.assertTrue(autogen_writer.write_if_changed(self.path, 'int    foo;\n'))
+        self.assertEqual(_ReadFile(self.path), 'int    foo;\n')
+
+
+class GeneratorTest(unittest.TestCase):
+
+    # Runs a copy of a generator in a scratch tree, so that its outputs and hashes are its own.
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        os.makedirs(os.path.join(self.temp_dir.name, 'scripts'))
+        shutil.copy(
+            os.path.join(SCRIPTS_DIR, 'autogen_writer.py'),
+            os.path.join(self.temp_dir.name, 'scripts'))
+        self.generator_dir = os.path.join(self.temp_dir.name, 'src', 'common')
+        os.makedirs(self.generator_dir)
+        shutil.copy(
+            os.path.join(ROOT_DIR, 'src', 'common', 'gen_uniform_type_table.py'),
+            self.generator_dir)
+
+    def run_generator(self):
+        subprocess.check_call([sys.executable, 'gen_uniform_type_table.py'],
+                              cwd=self.generator_dir)
+
+    def test_regenerate_formatted_outputs(self):
+        self.run_generator()
+        outputs = [
+            os.path.join(self.generator_dir, output)
+            for output in ['uniform_type_info_autogen.cpp', 'uniform_type_info_autogen.h']
+        ]
+        for output in outputs:
+            _FormatOutput(output)
+        formatted = [_ReadFile(output) for output in outputs]
+
+        for _ in range(2):
+            self.run_generator()
+            self.assertEqual([_ReadFile(output) for output in outputs], formatted)
+            self.assertEqual([os.stat(output).st_mtime_ns for output in outputs],
+                             [OLD_MTIME_NS] * len(outputs))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+#!/usr/bin/python3
+#
+# Copyright 2026 The ANGLE Project Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+#
+# c_array_writer.py:
+#   Formats binary data as C array initializers for the code generators. Formatting every byte
+#   separately in Python is slow on large blobs (e.g. compressed SPIR-V), so the bytes are
+#   formatted one line at a time with bytes.hex() or a table of per-byte tokens.
+
+
+# Returns the table for format_bytes_with_tokens where each byte is formatted with fmt.
+def byte_tokens(fmt):
+    return [fmt % value for value in range(256)]
+
+
+def _lines(data, bytes_per_line):
+    data = memoryview(data).cast('B')
+    return (data[i:i + bytes_per_line] for i in range(0, len(data), bytes_per_line))
+
+
+# Returns data as lowercase '0x..' bytes separated by commas, bytes_per_line per line, the lines
+# joined with line_separator (which should include the comma).
+def format_hex_bytes(data, bytes_per_line=16, line_separator=',\n    '):
+    return line_separator.join(
+        '0x' + line.hex(',').replace(',', ',0x') for line in _lines(data, bytes_per_line))
+
+
+# Like format_hex_bytes, but each byte is formatted as tokens[byte], the bytes of a line joined with
+# element_separator.
+def format_bytes_with_tokens(data,
+                             tokens,
+                             bytes_per_line=16,
+                             line_separator=',\n    ',
+                             element_separator=','):
+    assert len(tokens) == 256
+    return line_separator.join(
+        element_separator.join(map(tokens.__getitem__, line))
+        for line in _lines(data, bytes_per_line))
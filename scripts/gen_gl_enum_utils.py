@@ -5,12 +5,16 @@
 # found in the LICENSE file.
 #
 # gen_gl_enum_utils.py:
-#   Generates GLenum value to string mapping for ANGLE
+#   Generates GLenum value to string mapping for ANGLE. The enum names are stored in a single
+#   string pool, looked up with a minimal perfect hash of the name by StringToGLenum and with the
+#   sorted values of each enum group by GLenumToString.
 #   NOTE: don't run this script directly. Run scripts/run_code_generation.py.
 
 import sys
 import os
 
+import autogen_writer
+import minimal_perfect_hash
 import registry_xml
 
 template_gl_enums_header = """// GENERATED FILE - DO NOT EDIT.
@@ -57,7 +61,6 @@ template_gl_enums_source = """// GENERATED FILE - DO NOT EDIT.
 #include "common/debug.h"
 #include "common/gl_enum_utils.h"
 
-#include <algorithm>
 #include <cstring>
 
 namespace gl
@@ -71,47 +74,126 @@ const char *UnknownEnumToString(unsigned int value)
     snprintf(sBuffer, kBufferSize, "0x%04X", value);
     return sBuffer;
 }}
-}}  // anonymous namespace
 
-const char *GLenumToString(GLESEnum enumGroup, unsigned int value)
+{perfect_hash_function}
+
+// The names of all GLenums, stored back to back so that the tables below refer to them by offset
+// rather than with pointers that need relocations. A single string literal would exceed the
+// maximum length of string literals of MSVC.
+struct EnumStrings
 {{
-    switch (enumGroup)
-    {{
-        {gles_enums_value_to_string_table}
-        default:
-            return UnknownEnumToString(value);
-    }}
+    // clang-format off
+{string_pool_members}
+    // clang-format on
+}};
+
+// clang-format off
+constexpr EnumStrings kEnumStrings = {{
+{string_pool}
+}};
+// clang-format on
+static_assert(sizeof(EnumStrings) == {string_pool_size}, "EnumStrings must not be padded");
+
+struct EnumEntry
+{{
+    uint32_t nameOffset;
+    unsigned int value;
+}};
+
+struct EnumGroupEntries
+{{
+    uint32_t first;
+    uint32_t count;
+}};
+
+// The values of each enum group, sorted by value. Groups with the same values share their entries.
+// clang-format off
+constexpr EnumEntry kEnumValues[] = {{
+{enum_values}
+}};
+// clang-format on
+
+// The entries of each group of GLESEnum and BigGLEnum in kEnumValues, in enum order.
+constexpr EnumGroupEntries kGLESEnumGroups[] = {{
+{gles_enum_groups}
+}};
+
+constexpr EnumGroupEntries kBigGLEnumGroups[] = {{
+{gl_enum_groups}
+}};
+
+// The entries of StringToGLenum, ordered by the minimal perfect hash of their names.
+constexpr uint16_t kStringEnumSeeds[] = {{{string_enum_seeds}}};
+
+// clang-format off
+constexpr EnumEntry kStringEnums[] = {{
+{string_enums}
+}};
+// clang-format on
+
+const char *GetEnumString(uint32_t nameOffset)
+{{
+    return reinterpret_cast<const char *>(&kEnumStrings) + nameOffset;
 }}
 
-const char *GLenumToString(BigGLEnum enumGroup, unsigned int value)
+template <size_t kGroupCount>
+const char *EnumGroupValueToString(const EnumGroupEntries (&groups)[kGroupCount],
+                                   size_t groupIndex,
+                                   unsigned int value)
 {{
-    switch (enumGroup)
+    if (groupIndex >= kGroupCount)
+    {{
+        return UnknownEnumToString(value);
+    }}
+
+    const EnumGroupEntries &group = groups[groupIndex];
+    const EnumEntry *begin        = kEnumValues + group.first;
+
+    // The values of dense groups are found directly at their offset from the smallest value.
+    if (group.count > 0)
+    {{
+        const unsigned int index = value - begin->value;
+        if (index < group.count && begin[index].value == value)
+        {{
+            return GetEnumString(begin[index].nameOffset);
+        }}
+    }}
+
+    // Otherwise, binary search without branches: the path through the values depends on the
+    // value looked up and is hard to predict.
+    const EnumEntry *entry = begin;
+    for (uint32_t count = group.count; count > 1;)
+    {{
+        const uint32_t half = count / 2;
+        entry               = entry[half].value <= value ? entry + half : entry;
+        count -= half;
+    }}
+    if (group.count > 0 && entry->value == value)
     {{
-        {gl_enums_value_to_string_table}
-        default:
-            return UnknownEnumToString(value);
+        return GetEnumString(entry->nameOffset);
     }}
+
+    return UnknownEnumToString(value);
 }}
+}}  // anonymous namespace
 
-namespace
+const char *GLenumToString(GLESEnum enumGroup, unsigned int value)
 {{
-using StringEnumEntry = std::pair<const char*, unsigned int>;
-static StringEnumEntry g_stringEnumTable[] = {{
-    {string_to_enum_table}
-}};
+    return EnumGroupValueToString(kGLESEnumGroups, static_cast<size_t>(enumGroup), value);
+}}
 
-const size_t g_numStringEnums = std::size(g_stringEnumTable);
-}}  // anonymous namespace
+const char *GLenumToString(BigGLEnum enumGroup, unsigned int value)
+{{
+    return EnumGroupValueToString(kBigGLEnumGroups, static_cast<size_t>(enumGroup), value);
+}}
 
 unsigned int StringToGLenum(const char *str)
 {{
-    auto it = std::lower_bound(
-        &g_stringEnumTable[0], &g_stringEnumTable[g_numStringEnums], str,
-        [](const StringEnumEntry& a, const char* b) {{ return strcmp(a.first, b) < 0; }});
-
-    if (strcmp(it->first, str) == 0)
+    const EnumEntry &entry =
+        kStringEnums[MinimalPerfectHash(str, kStringEnumSeeds, {num_string_enum_seeds}, {num_string_enums})];
+    if (strcmp(GetEnumString(entry.nameOffset), str) == 0)
     {{
-        return it->second;
+        return entry.value;
     }}
 
     UNREACHABLE();
@@ -121,16 +203,6 @@ unsigned int StringToGLenum(const char *str)
 
 """
 
-template_enum_group_case = """case {api_enum}::{group_name}: {{
-    switch (value) {{
-        {inner_group_cases}
-        default:
-            return UnknownEnumToString(value);
-    }}
-}}
-"""
-
-template_enum_value_to_string_case = """case {value}: return {name};"""
 exclude_enum_groups = {'SpecialNumbers'}
 
 # Special enum groups that don't have any enum values.
@@ -138,91 +210,95 @@ exclude_enum_groups = {'SpecialNumbers'}
 empty_enum_groups = ['SemaphoreParameterName', 'ShaderBinaryFormat']
 
 
-def dump_value_to_string_mapping(enum_groups, api_enum):
-    exporting_groups = list()
-    for group_name, inner_mapping in enum_groups.items():
-        # Convert to pairs and strip out-of-range values.
-        string_value_pairs = list(
-            filter(lambda x: x[1] >= 0 and x[1] <= 0xFFFFFFFFF, inner_mapping.items()))
-        if not string_value_pairs:
-            continue
-
-        # sort according values
-        string_value_pairs.sort(key=lambda x: (x[1], len(x[0]), x[0]))
-
-        # remove all duplicate values from the pairs list
-        # some value may have more than one GLenum mapped to them, such as:
-        #     GL_DRAW_FRAMEBUFFER_BINDING and GL_FRAMEBUFFER_BINDING
-        #     GL_BLEND_EQUATION_RGB and GL_BLEND_EQUATION
-        # it is safe to output either one of them, for simplity here just
-        # choose the shorter one which comes first in the sorted list
-        exporting_string_value_pairs = list()
-        for index, pair in enumerate(string_value_pairs):
-            if index == 0 or pair[1] != string_value_pairs[index - 1][1]:
-                exporting_string_value_pairs.append(pair)
-
-        inner_code_block = "\n".join([
-            template_enum_value_to_string_case.format(
-                value='0x%X' % value,
-                name='"%s"' % name,
-            ) for name, value in exporting_string_value_pairs
-        ])
-
-        exporting_groups.append((group_name, inner_code_block))
-
-    return "\n".join([
-        template_enum_group_case.format(
-            api_enum=api_enum,
-            group_name=group_name,
-            inner_group_cases=inner_code_block,
-        ) for group_name, inner_code_block in sorted(exporting_groups, key=lambda x: x[0])
-    ])
-
-
-def dump_string_to_value_mapping(enums_and_values):
-
-    def f(value):
-        if value < 0:
-            return str(value)
-        if value < 0xFFFF:
-            return "0x%04X" % value
-        if value <= 0xFFFFFFFF:
-            return "0x%X" % value
-        else:
-            return "0xFFFFFFFF"
-
-    return '\n'.join('{"%s", %s},' % (k, f(v)) for k, v in sorted(enums_and_values))
+# Interns the GLenum names in a single block of memory, where they are referred to by offset.
+class StringPool:
 
+    def __init__(self, names):
+        self.names = sorted(set(names))
+        self.offsets = {}
+        self.size = 0
+        for name in self.names:
+            self.offsets[name] = self.size
+            self.size += len(name) + 1
+
+    def format_members(self):
+        return '\n'.join(
+            '    char s%d[%d];' % (index, len(name) + 1) for index, name in enumerate(self.names))
+
+    def format_values(self):
+        return '\n'.join('    "%s",' % name for name in self.names)
+
+    def format_entry(self, name, value):
+        return '    {%d, %s},  // %s' % (self.offsets[name], format_value(value), name)
 
-def main(header_output_path, source_output_path):
-    xml = registry_xml.RegistryXML('gl.xml', 'gl_angle_ext.xml')
 
+def format_value(value):
+    # Negative values wrap around like when they were converted to unsigned int.
+    if value < 0:
+        return "0x%X" % (value & 0xFFFFFFFF)
+    if value < 0xFFFF:
+        return "0x%04X" % value
+    if value <= 0xFFFFFFFF:
+        return "0x%X" % value
+    else:
+        return "0xFFFFFFFF"
+
+
+def get_value_to_string_pairs(inner_mapping):
+    # Convert to pairs and strip out-of-range values.
+    string_value_pairs = list(
+        filter(lambda x: x[1] >= 0 and x[1] <= 0xFFFFFFFFF, inner_mapping.items()))
+
+    # sort according values
+    string_value_pairs.sort(key=lambda x: (x[1], len(x[0]), x[0]))
+
+    # remove all duplicate values from the pairs list
+    # some value may have more than one GLenum mapped to them, such as:
+    #     GL_DRAW_FRAMEBUFFER_BINDING and GL_FRAMEBUFFER_BINDING
+    #     GL_BLEND_EQUATION_RGB and GL_BLEND_EQUATION
+    # it is safe to output either one of them, for simplity here just
+    # choose the shorter one which comes first in the sorted list
+    exporting_string_value_pairs = list()
+    for index, pair in enumerate(string_value_pairs):
+        if index == 0 or pair[1] != string_value_pairs[index - 1][1]:
+            exporting_string_value_pairs.append(pair)
+    return tuple(exporting_string_value_pairs)
+
+
+# Adds the values of the enum groups to value_entries, reusing the entries of identical groups
+# (from group_entries), and returns the group table in enum order.
+def dump_value_to_string_groups(enum_groups, value_entries, group_entries):
+    groups = []
+    for group_name in sorted(enum_groups.keys()):
+        pairs = get_value_to_string_pairs(enum_groups[group_name])
+        if pairs not in group_entries:
+            group_entries[pairs] = len(value_entries)
+            value_entries.extend(pairs)
+        groups.append('    {%d, %d},  // %s' % (group_entries[pairs], len(pairs), group_name))
+    return '\n'.join(groups)
+
+
+# Returns the GLenum groups of GLES and desktop GL, as maps from group name to a map from enum name to
+# value, and the (name, value) pairs of all GLenums.
+def get_enum_groups(xml):
     # Compute a list of all GLES enums.
     gles_enums = set()
     bigl_enums = set()
-    for feature in xml.root.findall('feature'):
-        for require in feature.findall('require'):
-            assert 'api' not in require.attrib
-            if 'gles' in feature.attrib['api']:
-                for enum in require.findall('enum'):
-                    gles_enums.add(enum.attrib['name'])
-            if feature.attrib['api'] == 'gl':
-                for enum in require.findall('enum'):
-                    bigl_enums.add(enum.attrib['name'])
-
-    for extensions in xml.root.findall('extensions'):
-        for extension in extensions.findall('extension'):
-            if extension.attrib['name'] in registry_xml.supported_extensions:
-                for require in extension.findall('require'):
-                    ext_apis = extension.attrib['supported'].split('|')
-                    if ('api' not in require.attrib or 'gles' in require.attrib['api']) and (
-                            'gles' in extension.attrib['supported']):
-                        for enum in require.findall('enum'):
-                            gles_enums.add(enum.attrib['name'])
-                    if ('api' not in require.attrib or
-                            feature.attrib['api'] == 'gl') and ('gl' in ext_apis):
-                        for enum in require.findall('enum'):
-                            bigl_enums.add(enum.attrib['name'])
+    for feature_api, require_api, enum_names in xml.snapshot['feature_enums']:
+        assert require_api is None
+        if 'gles' in feature_api:
+            gles_enums.update(enum_names)
+        if feature_api == 'gl':
+            bigl_enums.update(enum_names)
+
+    for extension_name, supported, require_api, enum_names in xml.snapshot['extension_enums']:
+        if extension_name in registry_xml.supported_extensions:
+            ext_apis = supported.split('|')
+            if (require_api is None or 'gles' in require_api) and ('gles' in supported):
+                gles_enums.update(enum_names)
+            # Uses the api of the last feature, as the XML walk this replaced did.
+            if (require_api is None or feature_api == 'gl') and ('gl' in ext_apis):
+                bigl_enums.update(enum_names)
 
     # Build a map from GLenum name to its value
     gl_enum_groups = dict()
@@ -235,29 +311,27 @@ def main(header_output_path, source_output_path):
     gles_enum_groups[registry_xml.default_enum_group_name] = gles_default_enums
     enums_and_values = []
 
-    for enums_node in xml.root.findall('enums'):
-        for enum in enums_node.findall('enum'):
-            enum_name = enum.attrib['name']
-            enum_value = int(enum.attrib['value'], base=16)
-            enums_and_values.append((enum_name, enum_value))
-
-            if enum_name in gles_enums:
-                gles_default_enums[enum_name] = enum_value
-            if enum_name in bigl_enums:
-                gl_default_enums[enum_name] = enum_value
-
-            if 'group' in enum.attrib:
-                for enum_group in enum.attrib['group'].split(','):
-                    if enum_group in exclude_enum_groups:
-                        continue
-                    if enum_name in gles_enums:
-                        if enum_group not in gles_enum_groups:
-                            gles_enum_groups[enum_group] = dict()
-                        gles_enum_groups[enum_group][enum_name] = enum_value
-                    if enum_name in bigl_enums:
-                        if enum_group not in gl_enum_groups:
-                            gl_enum_groups[enum_group] = dict()
-                        gl_enum_groups[enum_group][enum_name] = enum_value
+    for enum_name, value, groups in xml.snapshot['enums']:
+        enum_value = int(value, base=16)
+        enums_and_values.append((enum_name, enum_value))
+
+        if enum_name in gles_enums:
+            gles_default_enums[enum_name] = enum_value
+        if enum_name in bigl_enums:
+            gl_default_enums[enum_name] = enum_value
+
+        if groups is not None:
+            for enum_group in groups.split(','):
+                if enum_group in exclude_enum_groups:
+                    continue
+                if enum_name in gles_enums:
+                    if enum_group not in gles_enum_groups:
+                        gles_enum_groups[enum_group] = dict()
+                    gles_enum_groups[enum_group][enum_name] = enum_value
+                if enum_name in bigl_enums:
+                    if enum_group not in gl_enum_groups:
+                        gl_enum_groups[enum_group] = dict()
+                    gl_enum_groups[enum_group][enum_name] = enum_value
 
     for empty_group in empty_enum_groups:
         assert not empty_group in gles_enum_groups or not empty_group in gl_enum_groups, 'Remove %s from the empty groups list, it has enums now.' % empty_group
@@ -266,6 +340,13 @@ def main(header_output_path, source_output_path):
         if empty_group not in gl_enum_groups:
             gl_enum_groups[empty_group] = dict()
 
+    return gles_enum_groups, gl_enum_groups, enums_and_values
+
+
+def main(header_output_path, source_output_path):
+    xml = registry_xml.RegistryXML('gl.xml', 'gl_angle_ext.xml')
+    gles_enum_groups, gl_enum_groups, enums_and_values = get_enum_groups(xml)
+
     # Write GLenum groups into the header file.
     header_content = template_gl_enums_header.format(
         script_name=os.path.basename(sys.argv[0]),
@@ -274,23 +355,45 @@ def main(header_output_path, source_output_path):
         gl_enum_groups=',\n'.join(sorted(gl_enum_groups.keys())))
 
     header_output_path = registry_xml.script_relative(header_output_path)
-    with open(header_output_path, 'w') as f:
+    with autogen_writer.open_output(header_output_path, 'w') as f:
         f.write(header_content)
 
     # Write mapping to source file
-    gles_enums_value_to_string_table = dump_value_to_string_mapping(gles_enum_groups, 'GLESEnum')
-    gl_enums_value_to_string_table = dump_value_to_string_mapping(gl_enum_groups, 'BigGLEnum')
-    string_to_enum_table = dump_string_to_value_mapping(enums_and_values)
+    string_pool = StringPool(name for name, _ in enums_and_values)
+    value_entries = []
+    group_entries = {}
+    gles_enum_groups_table = dump_value_to_string_groups(gles_enum_groups, value_entries,
+                                                         group_entries)
+    gl_enum_groups_table = dump_value_to_string_groups(gl_enum_groups, value_entries,
+                                                       group_entries)
+
+    # Names with several values map to the smallest one.
+    string_to_enum = {}
+    for name, value in sorted(enums_and_values):
+        string_to_enum.setdefault(name, value)
+    hashfn = minimal_perfect_hash.build(list(string_to_enum.keys()))
+    string_enums = sorted(string_to_enum.items(), key=lambda pair: hashfn.hash(pair[0]))
+
     source_content = template_gl_enums_source.format(
         script_name=os.path.basename(sys.argv[0]),
         data_source_name="gl.xml and gl_angle_ext.xml",
-        gles_enums_value_to_string_table=gles_enums_value_to_string_table,
-        gl_enums_value_to_string_table=gl_enums_value_to_string_table,
-        string_to_enum_table=string_to_enum_table,
+        perfect_hash_function=minimal_perfect_hash.CPP_LOOKUP_FUNCTION,
+        string_pool_members=string_pool.format_members(),
+        string_pool=string_pool.format_values(),
+        string_pool_size=string_pool.size,
+        enum_values='\n'.join(
+            string_pool.format_entry(name, value) for name, value in value_entries),
+        gles_enum_groups=gles_enum_groups_table,
+        gl_enum_groups=gl_enum_groups_table,
+        string_enum_seeds=hashfn.format_seeds(),
+        string_enums='\n'.join(
+            string_pool.format_entry(name, value) for name, value in string_enums),
+        num_string_enum_seeds=len(hashfn.seeds),
+        num_string_enums=len(string_enums),
     )
 
     source_output_path = registry_xml.script_relative(source_output_path)
-    with open(source_output_path, 'w') as f:
+    with autogen_writer.open_output(source_output_path, 'w') as f:
         f.write(source_content)
 
     return 0
@@ -301,6 +404,8 @@ if __name__ == '__main__':
         '../third_party/OpenGL-Registry/src/xml/gl.xml',
         'gl_angle_ext.xml',
         'registry_xml.py',
+        'autogen_writer.py',
+        'minimal_perfect_hash.py',
     ]
 
     gl_enum_utils_autogen_base_path = '../src/common/gl_enum_utils_autogen'
@@ -12,12 +12,69 @@ import os
 import re
 import sys
 
+import autogen_writer
+import minimal_perfect_hash
 import registry_xml
 
 EXIT_SUCCESS = 0
 EXIT_FAILURE = 1
 
 BASE_PATH = '../util/capture/trace_interpreter_autogen'
+FUNCTIONS_H_PATH = '../util/capture/trace_interpreter_functions_autogen.h'
+
+FUNCTIONS_H_TEMPLATE = """\
+// GENERATED FILE - DO NOT EDIT.
+// Generated by {script_name} using data from {data_source_name}.
+//
+// Copyright 2026 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// {file_name}:
+//   Lookup of the entry points and trace fixture functions known to the trace interpreter by
+//   name. Kept separate from the interpreter so that it can be unit tested.
+
+#ifndef ANGLE_TRACE_INTERPRETER_FUNCTIONS_AUTOGEN_H_
+#define ANGLE_TRACE_INTERPRETER_FUNCTIONS_AUTOGEN_H_
+
+#include <stdint.h>
+#include <string.h>
+
+namespace angle
+{{
+namespace interpreter
+{{
+{perfect_hash_function}
+
+constexpr uint16_t kInterpreterFunctionSeeds[] = {{{seeds}}};
+
+// The entry points and trace fixture functions, indexed by GetInterpreterFunctionHash.
+constexpr const char *kInterpreterFunctionNames[] = {{
+{names}
+}};
+
+constexpr uint32_t kNumInterpreterFunctions = {num_functions};
+
+constexpr uint32_t GetInterpreterFunctionHash(const char *name)
+{{
+    return MinimalPerfectHash(name, kInterpreterFunctionSeeds, {num_seeds}, kNumInterpreterFunctions);
+}}
+
+// Checks that the C++ hash matches the one computed by {script_name}.
+{hash_tests}
+
+// Returns the index of the function in kInterpreterFunctionNames, or kNumInterpreterFunctions if
+// the function is not known.
+inline uint32_t GetInterpreterFunctionIndex(const char *name)
+{{
+    uint32_t index = GetInterpreterFunctionHash(name);
+    return strcmp(name, kInterpreterFunctionNames[index]) == 0 ? index : kNumInterpreterFunctions;
+}}
+}}  // namespace interpreter
+}}  // namespace angle
+
+#endif  // ANGLE_TRACE_INTERPRETER_FUNCTIONS_AUTOGEN_H_
+"""
 
 CPP_TEMPLATE = """\
 // GENERATED FILE - DO NOT EDIT.
@@ -33,12 +90,21 @@ CPP_TEMPLATE = """\
 #include "angle_trace_gl.h"
 #include "trace_fixture.h"
 #include "trace_interpreter.h"
+#include "trace_interpreter_functions_autogen.h"
 
 namespace angle
 {{
+using interpreter::GetInterpreterFunctionIndex;
+
 CallCapture ParseCallCapture(const Token &nameToken, size_t numParamTokens, const Token *paramTokens, const TraceStringMap &strings)
 {{
+    switch (GetInterpreterFunctionIndex(nameToken))
+    {{
 {parse_cases}
+        default:
+            break;
+    }}
+
     if (numParamTokens > 0)
     {{
         printf("Expected zero parameter tokens for %s\\n", nameToken);
@@ -54,7 +120,12 @@ void ReplayCustomFunctionCall(const CallCapture &call, const TraceFunctionMap &c
     ASSERT(call.entryPoint == EntryPoint::Invalid);
     const Captures &captures = call.params.getParamCaptures();
 
+    switch (GetInterpreterFunctionIndex(call.customFunctionName.c_str()))
+    {{
 {custom_dispatch_cases}
+        default:
+            break;
+    }}
 
     auto iter = customFunctions.find(call.customFunctionName);
     if (iter == customFunctions.end())
@@ -76,21 +147,21 @@ void ReplayCustomFunctionCall(const CallCapture &call, const TraceFunctionMap &c
 """
 
 PARSE_CASE = """\
-    if (strcmp(nameToken, "{ep}") == 0)
-    {{
-        ParamBuffer params = ParseParameters<{pfn}>(paramTokens, strings);
-        return CallCapture({call}, std::move(params));
-    }}
+        case {index}:  // {ep}
+        {{
+            ParamBuffer params = ParseParameters<{pfn}>(paramTokens, strings);
+            return CallCapture({call}, std::move(params));
+        }}
 """
 
 CUSTOM_DISPATCH_CASE = """\
-    if (call.customFunctionName == "{fn}")
-    {{
-        DispatchCallCapture({fn}, captures);
-        return;
-    }}
+        case {index}:
+            DispatchCallCapture({fn}, captures);
+            return;
 """
 
+HASH_TEST = 'static_assert(GetInterpreterFunctionHash("{name}") == {hash});'
+
 DISPATCH_CASE = """\
 template <typename Fn, EnableIfNArgs<Fn, {nargs}> = 0>
 void DispatchCallCapture(Fn *fn, const Captures &cap)
@@ -133,18 +204,29 @@ def main(cpp_output_path):
     fixture_functions, arg_counts = GetFunctionsFromFixture()
 
     eps_and_enums = sorted(list(set(gles.GetEnums() + egl.GetEnums())))
+
+    # Calls are dispatched with a switch on the perfect hash of the function name, rather than by
+    # comparing the name with every known function.
+    names = [ep for (enum, ep) in eps_and_enums] + fixture_functions
+    hashfn = minimal_perfect_hash.build(names)
+    names_by_hash = sorted(names, key=hashfn.hash)
+
     parse_cases = [
-        PARSE_CASE.format(ep=ep, pfn=fn(ep), call='EntryPoint::%s' % enum)
+        PARSE_CASE.format(index=hashfn.hash(ep), ep=ep, pfn=fn(ep), call='EntryPoint::%s' % enum)
         for (enum, ep) in eps_and_enums
     ]
     parse_cases += [
-        PARSE_CASE.format(ep=fn, pfn='decltype(%s)' % fn, call='"%s"' % fn)
+        PARSE_CASE.format(index=hashfn.hash(fn), ep=fn, pfn='decltype(%s)' % fn, call='"%s"' % fn)
         for fn in fixture_functions
     ]
 
     dispatch_cases = [DISPATCH_CASE.format(nargs=n, args=get_dispatch(n)) for n in arg_counts]
 
-    custom_dispatch_cases = [CUSTOM_DISPATCH_CASE.format(fn=fn) for fn in fixture_functions]
+    custom_dispatch_cases = [
+        CUSTOM_DISPATCH_CASE.format(index=hashfn.hash(fn), fn=fn) for fn in fixture_functions
+    ]
+
+    hash_tests = [HASH_TEST.format(name=name, hash=hashfn.hash(name)) for name in names]
 
     format_args = {
         'script_name': os.path.basename(sys.argv[0]),
@@ -155,18 +237,35 @@ def main(cpp_output_path):
         'custom_dispatch_cases': ''.join(custom_dispatch_cases),
     }
 
+    functions_h_args = {
+        'script_name': os.path.basename(sys.argv[0]),
+        'data_source_name': 'gl.xml and gl_angle_ext.xml',
+        'file_name': os.path.basename(FUNCTIONS_H_PATH),
+        'perfect_hash_function': minimal_perfect_hash.CPP_LOOKUP_FUNCTION,
+        'seeds': hashfn.format_seeds(),
+        'num_seeds': len(hashfn.seeds),
+        'names': ',\n'.join('"%s"' % name for name in names_by_hash),
+        'num_functions': len(names),
+        'hash_tests': '\n'.join(hash_tests),
+    }
+
     cpp_content = CPP_TEMPLATE.format(**format_args)
     cpp_output_path = registry_xml.script_relative(cpp_output_path)
-    with open(cpp_output_path, 'w') as f:
+    with autogen_writer.open_output(cpp_output_path, 'w') as f:
         f.write(cpp_content)
 
+    functions_h_content = FUNCTIONS_H_TEMPLATE.format(**functions_h_args)
+    with autogen_writer.open_output(registry_xml.script_relative(FUNCTIONS_H_PATH), 'w') as f:
+        f.write(functions_h_content)
+
     return EXIT_SUCCESS
 
 
 if __name__ == '__main__':
-    inputs = registry_xml.xml_inputs + [FIXTURE_H]
+    inputs = registry_xml.xml_inputs + [FIXTURE_H, 'autogen_writer.py', 'minimal_perfect_hash.py']
     outputs = [
         '%s.cpp' % BASE_PATH,
+        FUNCTIONS_H_PATH,
     ]
 
     if len(sys.argv) > 1:
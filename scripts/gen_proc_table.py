@@ -9,6 +9,8 @@
 
 import os
 import sys
+import autogen_writer
+import minimal_perfect_hash
 import registry_xml
 
 out_file_name_gles = "../src/libGLESv2/proc_table_egl_autogen.cpp"
@@ -19,6 +21,10 @@ out_file_name_cl_map = "../src/libOpenCL/libOpenCL_autogen.map"
 
 strip_suffixes = ["ANGLE", "EXT", "KHR", "OES", "CHROMIUM", "OVR"]
 
+# The getProcAddress lookups hash the entry point names with a minimal perfect hash built by
+# minimal_perfect_hash.py. Set to False to binary search a sorted table instead.
+use_perfect_hash = True
+
 template_cpp = """// GENERATED FILE - DO NOT EDIT.
 // Generated by {script_name} using data from {data_source_name}.
 //
@@ -36,49 +42,50 @@ template_cpp = """// GENERATED FILE - DO NOT EDIT.
 
 namespace {namespace}
 {{
-// clang-format off
+{lookup_tables}// clang-format off
 const ProcEntry g_procTable[] = {{
 {proc_data}
 }};
 // clang-format on
 const size_t g_numProcs = {num_procs};
-}}  // namespace {namespace}
+{find_proc_entry}}}  // namespace {namespace}
 """
 
+# The hashed tables keep the slots of the compiled out entries so that the hash stays valid.
 desktop_only_macro_definition = """
 #if defined(ANGLE_ENABLE_GL_DESKTOP_FRONTEND)
 #   define DESKTOP_ONLY(func, angleFunc) {func, P(angleFunc)},
 #else
-#   define DESKTOP_ONLY(func, angleFunc)
+#   define DESKTOP_ONLY(func, angleFunc)%s
 #endif
 """
 
-# FOR OPENCL
-template_map_cpp = """// GENERATED FILE - DO NOT EDIT.
-// Generated by {script_name} using data from {data_source_name}.
-//
-// Copyright 2021 The ANGLE Project Authors. All rights reserved.
-// Use of this source code is governed by a BSD-style license that can be
-// found in the LICENSE file.
-//
-// proc_table:
-//   Mapping from a string entry point name to function address.
-//
+template_lookup_tables_hashed = """namespace
+{{
+{perfect_hash_function}
 
-{includes}
-#define P(FUNC) reinterpret_cast<{cast}>(FUNC)
+constexpr uint16_t kProcSeeds[] = {{{seeds}}};
+}}  // anonymous namespace
 
-namespace {namespace}
-{{
+"""
 
-const ProcTable &GetProcTable()
+template_find_proc_entry_hashed = """
+const ProcEntry *FindProcEntry(const char *name)
 {{
-    static angle::base::NoDestructor<ProcTable> sProcTable(
-        {{{proc_data}}});
-    return *sProcTable;
+    const ProcEntry &entry =
+        g_procTable[MinimalPerfectHash(name, kProcSeeds, {num_seeds}, {num_procs})];
+    return entry.first != nullptr && strcmp(entry.first, name) == 0 ? &entry : nullptr;
 }}
+"""
 
-}}  // namespace {namespace}
+find_proc_entry_sorted = """
+const ProcEntry *FindProcEntry(const char *name)
+{
+    const ProcEntry *end   = g_procTable + g_numProcs;
+    const ProcEntry *entry = std::lower_bound(
+        g_procTable, end, name, [](const ProcEntry &a, const char *b) { return strcmp(a.first, b) < 0; });
+    return entry != end && strcmp(entry->first, name) == 0 ? entry : nullptr;
+}
 """
 
 # FOR OPENCL
@@ -158,10 +165,7 @@ includes_cl = """#include "libGLESv2/proc_table_cl.h"
 
 #include "libGLESv2/entry_points_cl_autogen.h"
 
-#include "anglebase/no_destructor.h"
-
-// Using fully qualified entry point identifiers to make sure that missing entry points would not
-// pick up the global declarations of OpenCL
+#include <iterator>
 """
 
 sys.path.append('../src/libANGLE/renderer')
@@ -172,11 +176,57 @@ def _get_annotations(versions):
     return ["%d_%d" % version for version in versions]
 
 
+# Writes the g_procTable of namespace and its FindProcEntry lookup. entries is a list of (name,
+# initializer) pairs, and the entries of desktop_only are wrapped in DESKTOP_ONLY.
+def _write_proc_table(out_file_name, data_source_name, includes, cast, namespace, entries,
+                      desktop_only):
+    entries = sorted(entries)
+    if use_perfect_hash:
+        hashfn = minimal_perfect_hash.build([name for name, _ in entries])
+        entries.sort(key=lambda entry: hashfn.hash(entry[0]))
+        lookup_includes = "#include <cstring>\n"
+        lookup_tables = template_lookup_tables_hashed.format(
+            perfect_hash_function=minimal_perfect_hash.CPP_LOOKUP_FUNCTION,
+            seeds=hashfn.format_seeds())
+        find_proc_entry = template_find_proc_entry_hashed.format(
+            num_seeds=len(hashfn.seeds), num_procs=len(entries))
+        disabled_desktop_entry = " {nullptr, nullptr},"
+    else:
+        lookup_includes = "#include <algorithm>\n#include <cstring>\n"
+        lookup_tables = ""
+        find_proc_entry = find_proc_entry_sorted
+        disabled_desktop_entry = ""
+    desktop_only_macros = (
+        desktop_only_macro_definition % disabled_desktop_entry if desktop_only else '')
+
+    proc_data = []
+    for name, angle_func in entries:
+        if name in desktop_only:
+            proc_data.append('    DESKTOP_ONLY("%s", %s)' % (name, angle_func))
+        else:
+            proc_data.append('    {"%s", P(%s)},' % (name, angle_func))
+
+    with autogen_writer.open_output(out_file_name, 'w') as out_file:
+        output_cpp = template_cpp.format(
+            script_name=os.path.basename(sys.argv[0]),
+            data_source_name=data_source_name,
+            includes=includes + lookup_includes,
+            cast=cast,
+            namespace=namespace,
+            lookup_tables=lookup_tables,
+            proc_data="\n".join(proc_data),
+            num_procs="std::size(g_procTable)",
+            find_proc_entry=find_proc_entry,
+            desktop_only_macro_definition=desktop_only_macros)
+        out_file.write(output_cpp)
+        out_file.close()
+
+
 def main():
 
     # auto_script parameters.
     if len(sys.argv) > 1:
-        inputs = [source for source in registry_xml.xml_inputs]
+        inputs = registry_xml.xml_inputs + ['autogen_writer.py', 'minimal_perfect_hash.py']
         outputs = [
             out_file_name_gles, out_file_name_wgl, out_file_name_glx, out_file_name_cl,
             out_file_name_cl_map
@@ -245,26 +295,10 @@ def main():
         else:
             all_functions[function] = function
 
-    proc_data = []
     gl_only_data = gl_data.difference(gles_data)
-    for func, angle_func in sorted(all_functions.items()):
-        if func in gl_only_data:
-            proc_data.append('    DESKTOP_ONLY("%s", %s)' % (func, angle_func))
-        else:
-            proc_data.append('    {"%s", P(%s)},' % (func, angle_func))
-
-    with open(out_file_name_gles, 'w') as out_file:
-        output_cpp = template_cpp.format(
-            script_name=os.path.basename(sys.argv[0]),
-            data_source_name="gl.xml, gl_angle_ext.xml, egl.xml, egl_angle_ext.xml",
-            includes=includes_gles,
-            cast="__eglMustCastToProperFunctionPointerType",
-            namespace="egl",
-            proc_data="\n".join(proc_data),
-            num_procs="std::size(g_procTable)",
-            desktop_only_macro_definition=desktop_only_macro_definition)
-        out_file.write(output_cpp)
-        out_file.close()
+    _write_proc_table(out_file_name_gles, "gl.xml, gl_angle_ext.xml, egl.xml, egl_angle_ext.xml",
+                      includes_gles, "__eglMustCastToProperFunctionPointerType", "egl",
+                      list(all_functions.items()), gl_only_data)
 
     def WriteWindowingProcTable(api_name, out_file_name, includes, cast):
         xml_file_name = '{}.xml'.format(api_name)
@@ -283,25 +317,13 @@ def main():
         ]
 
         # Start with all of the GLES + Desktop entry points, filtering out the EGL ones
-        proc_data = [
-            '    {"%s", P(%s)},' % (func, angle_func)
-            for func, angle_func in sorted(all_functions.items())
-            if not func.startswith('egl')
-        ]
-        proc_data.extend(['    {"%s", P(%s)},' % (cmd, cmd) for cmd in sorted(commands)])
-
-        with open(out_file_name, 'w') as out_file:
-            output_cpp = template_cpp.format(
-                script_name=os.path.basename(sys.argv[0]),
-                data_source_name="gl.xml, gl_angle_ext.xml, {}".format(xml_file_name),
-                includes=includes,
-                cast=cast,
-                namespace=api_name,
-                proc_data="\n".join(proc_data),
-                num_procs="std::size(g_procTable)",
-                desktop_only_macro_definition='')
-            out_file.write(output_cpp)
-            out_file.close()
+        entries = [(func, angle_func)
+                   for func, angle_func in all_functions.items()
+                   if not func.startswith('egl')]
+        entries.extend([(cmd, cmd) for cmd in commands])
+
+        _write_proc_table(out_file_name, "gl.xml, gl_angle_ext.xml, {}".format(xml_file_name),
+                          includes, cast, api_name, entries, set())
 
     WriteWindowingProcTable('wgl', out_file_name_wgl, includes_wgl, "PROC")
     WriteWindowingProcTable('glx', out_file_name_glx, includes_glx, "__GLXextFuncPtr")
@@ -327,20 +349,12 @@ def main():
 
     clxml.AddExtensionCommands(registry_xml.supported_cl_extensions, ['cl'])
     cl_commands = clxml.all_cmd_names.get_all_commands()
-    proc_data = ['{"%s", P(::cl::%s)}' % (cmd, cmd) for cmd in cl_commands]
-
-    with open(out_file_name_cl, 'w') as out_file:
-        output_cpp = template_map_cpp.format(
-            script_name=os.path.basename(sys.argv[0]),
-            data_source_name="cl.xml",
-            includes=includes_cl,
-            cast="void *",
-            namespace="cl",
-            proc_data=",\n         ".join(proc_data))
-        out_file.write(output_cpp)
-        out_file.close()
+    # Using fully qualified entry point identifiers to make sure that missing entry points would not
+    # pick up the global declarations of OpenCL
+    _write_proc_table(out_file_name_cl, "cl.xml", includes_cl, "void *", "cl",
+                      [(cmd, "::cl::" + cmd) for cmd in cl_commands], set())
 
-    with open(out_file_name_cl_map, 'w') as out_file:
+    with autogen_writer.open_output(out_file_name_cl_map, 'w') as out_file:
         output_map = template_map.format(
             script_name=os.path.basename(sys.argv[0]),
             data_source_name="cl.xml",
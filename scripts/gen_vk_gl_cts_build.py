@@ -9,10 +9,13 @@
 #  NOTE: don't run this script directly. Run scripts/run_code_generation.py.
 
 import errno
+import io
 import os
 import sys
 import shutil
 
+import autogen_writer
+
 
 def initDataDirectories(dataDirectories):
     dataDirectories.append(os.path.join("data", "gles2"))
@@ -38,20 +41,13 @@ def initPathReplacements(pathReplacements):
     pathReplacements[pathToReplace] = ""
 
 
-def createBuildGnFile(buildGnPath):
-    # Cleanup the old file
-    if os.path.exists(buildGnPath):
-        os.remove(buildGnPath)
-    # Make the new one
-    return open(buildGnPath, "w+")
+# The outputs are built in memory and only written if they changed, see autogen_writer.py.
+def createBuildGnFile():
+    return io.StringIO()
 
 
-def createGniFile(gniFilename):
-    # Cleanup the old file
-    if os.path.exists(gniFilename):
-        os.remove(gniFilename)
-    # Make the new one
-    return open(gniFilename, "w+")
+def createGniFile():
+    return io.StringIO()
 
 
 def writeFileHeader(fileIn):
@@ -124,6 +120,7 @@ def main():
         # All CMakeLists.txt in the dEQP source tree (at the time)
         cmakeDirs = getCMakeLists(deqpSourceDirectory)
         inputs = [os.path.join(deqpSourceDirectory, "%s" % dir) for dir in cmakeDirs]
+        inputs += ['autogen_writer.py']
         outputs = [dataGniFilename, buildGnPath]
 
         if sys.argv[1] == 'inputs':
@@ -163,7 +160,7 @@ def main():
     #
     # BUILD.gn
     #
-    buildGnFile = createBuildGnFile(buildGnPath)
+    buildGnFile = createBuildGnFile()
     writeFileHeader(buildGnFile)
     # Definitions
     buildGnFile.write("deqp_path = \"../../../third_party/VK-GL-CTS/src\"\n")
@@ -191,11 +188,12 @@ copy("vk_gl_cts_data_{relDir}") {{
             filesToCopy=filesToCopy,
             destDir=destDir.replace(os.sep, '/'))
         buildGnFile.write(copyCommand)
+    autogen_writer.write_if_changed(buildGnPath, buildGnFile.getvalue())
 
     #
     # .gni
     #
-    gniFile = createGniFile(dataGniFilename)
+    gniFile = createGniFile()
     writeFileHeader(gniFile)
     # Imports
     templateImports = """import("deqp.gni")
@@ -231,6 +229,7 @@ angle_deqp_data_copy_targets = [
             deqpSupportDirectory=deqpSupportDirectory,
             relDir=convertPathToVarName(relativeDirectory))
     gniFile.write(templateCopyTargets.format(targets=targets))
+    autogen_writer.write_if_changed(dataGniFilename, gniFile.getvalue())
 
 
 if __name__ == '__main__':
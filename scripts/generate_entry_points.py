@@ -10,6 +10,10 @@
 
 import sys, os, pprint, json
 import fnmatch
+import hashlib
+import pickle
+import xml.etree.ElementTree as etree
+import autogen_writer
 import registry_xml
 from registry_xml import apis, script_relative, strip_api_prefix, api_enums
 
@@ -18,6 +22,7 @@ CL_STUBS_HEADER_PATH = "../src/libGLESv2/cl_stubs_autogen.h"
 EGL_GET_LABELED_OBJECT_DATA_PATH = "../src/libGLESv2/egl_get_labeled_object_data.json"
 EGL_STUBS_HEADER_PATH = "../src/libGLESv2/egl_stubs_autogen.h"
 EGL_EXT_STUBS_HEADER_PATH = "../src/libGLESv2/egl_ext_stubs_autogen.h"
+ENTRY_POINTS_CACHE_PATH = ".entry_points_cache.pickle"
 
 # List of GLES1 extensions for which we don't need to add Context.h decls.
 GLES1_NO_CONTEXT_DECL_EXTENSIONS = [
@@ -287,6 +292,9 @@ enum class EntryPoint
 {entry_points_list}
 }};
 
+// Number of values of EntryPoint, including Invalid.
+constexpr int kEntryPointCount = {entry_points_count};
+
 const char *GetEntryPointName(EntryPoint ep);
 }}  // namespace angle
 #endif  // COMMON_ENTRY_POINTS_ENUM_AUTOGEN_H_
@@ -2270,6 +2278,95 @@ def path_to(folder, file):
     return os.path.join(script_relative(".."), "src", folder, file)
 
 
+# Formatting the entry points of every command is the bulk of this script's work. The results are
+# cached per registry slice (e.g. the commands of one GLES version or of the extensions), keyed on
+# the XML of those commands and on everything else the formatting depends on, so that a registry
+# change only reformats the slices it touches. Outputs are keyed on the arguments they're rendered
+# from, and are neither rendered nor written again while those and the file on disk are unchanged.
+class EntryPointsCache:
+
+    RESULTS = [
+        'decls', 'defs', 'export_defs', 'validation_protos', 'context_private_call_protos',
+        'context_private_call_functions', 'context_lock_protos', 'capture_protos',
+        'capture_methods', 'capture_pointer_funcs', 'added_param_types'
+    ]
+
+    def __init__(self, path):
+        self.path = path
+        self.old_slices = {}
+        self.old_outputs = {}
+        self.slices = {}
+        self.outputs = {}
+        try:
+            with open(path, 'rb') as f:
+                cache = pickle.load(f)
+            self.old_slices = cache['slices']
+            self.old_outputs = cache['outputs']
+        except (OSError, EOFError, KeyError, TypeError, pickle.UnpicklingError):
+            pass
+
+        # Formatting depends on the tables and helpers of this script and of registry_xml.
+        self.code_hash = hashlib.md5()
+        for source in [os.path.abspath(__file__), os.path.abspath(registry_xml.__file__)]:
+            with open(source, 'rb') as f:
+                self.code_hash.update(f.read())
+
+    def fingerprint(self, infos, *args):
+        fingerprint = self.code_hash.copy()
+        fingerprint.update(json.dumps(args, sort_keys=True, default=sorted).encode())
+        for (cmd_name, command_node, _, _) in infos:
+            fingerprint.update(cmd_name.encode())
+            fingerprint.update(etree.tostring(command_node))
+        return fingerprint.hexdigest()
+
+    def get(self, fingerprint):
+        results = self.old_slices.get(fingerprint)
+        if results is not None:
+            self.slices[fingerprint] = results
+        return results
+
+    def set(self, fingerprint, results):
+        self.slices[fingerprint] = results
+
+    # Renders template with args to path, unless a previous run rendered path from the same args
+    # and the file still holds that rendered output, formatted or not.
+    def write_output(self, path, template, **args):
+        key = self.code_hash.copy()
+        key.update(json.dumps(args, sort_keys=True).encode())
+        key = key.hexdigest()
+        output = os.path.abspath(path)
+        recorded = self.old_outputs.get(output)
+        if recorded and recorded[0] == key and autogen_writer.is_up_to_date(path, recorded[1]):
+            autogen_writer.mark_unchanged(path)
+        else:
+            content = template.format(**args)
+            autogen_writer.write_if_changed(path, content)
+            recorded = (key, autogen_writer.content_hash(content))
+        self.outputs[output] = recorded
+
+    def save(self):
+        # Only keep the slices and outputs of this run so the cache doesn't grow forever.
+        if self.slices == self.old_slices and self.outputs == self.old_outputs:
+            return
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            pickle.dump({
+                'slices': self.slices,
+                'outputs': self.outputs
+            }, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, self.path)
+
+
+_entry_points_cache = None
+
+
+def get_entry_points_cache():
+    global _entry_points_cache
+    if _entry_points_cache is None:
+        _entry_points_cache = EntryPointsCache(script_relative(ENTRY_POINTS_CACHE_PATH))
+    return _entry_points_cache
+
+
 class ANGLEEntryPoints(registry_xml.EntryPoints):
 
     def __init__(self,
@@ -2284,6 +2381,25 @@ class ANGLEEntryPoints(registry_xml.EntryPoints):
                  is_gles1=False):
         super().__init__(api, xml, commands)
 
+        cache = get_entry_points_cache()
+        fingerprint = cache.fingerprint(self.get_infos(), api, cmd_packed_enums, export_template,
+                                        packed_param_types, ep_to_object, is_gles1)
+        results = cache.get(fingerprint)
+        if results is None:
+            results = self._format(all_param_types, cmd_packed_enums, export_template,
+                                   packed_param_types, ep_to_object, is_gles1)
+            cache.set(fingerprint, results)
+
+        for name in EntryPointsCache.RESULTS:
+            setattr(self, name, list(results[name]))
+        all_param_types.update(self.added_param_types)
+
+    def _format(self, all_param_types, cmd_packed_enums, export_template, packed_param_types,
+                ep_to_object, is_gles1):
+        api = self.api
+        # Track the param types used by this slice so they can be restored from the cache.
+        slice_param_types = set()
+
         self.decls = []
         self.defs = []
         self.export_defs = []
@@ -2326,11 +2442,14 @@ class ANGLEEntryPoints(registry_xml.EntryPoints):
                                      packed_param_types))
             self.capture_methods.append(
                 format_capture_method(self.api, command_node, cmd_name, proto_text, param_text,
-                                      all_param_types, self.capture_pointer_funcs,
+                                      slice_param_types, self.capture_pointer_funcs,
                                       cmd_packed_enums, packed_param_types))
 
         # Ensure we store GLint64 in the param types for use with the replay interpreter.
-        all_param_types.add('GLint64')
+        slice_param_types.add('GLint64')
+        self.added_param_types = sorted(slice_param_types)
+
+        return {name: getattr(self, name) for name in EntryPointsCache.RESULTS}
 
 
 class GLEntryPoints(ANGLEEntryPoints):
@@ -2510,7 +2629,11 @@ def get_glext_decls(all_commands, gles_commands, version):
 
 def write_file(annotation, comment, template, entry_points, suffix, includes, lib, file):
 
-    content = template.format(
+    path = path_to(lib, "entry_points_{}_autogen.{}".format(annotation.lower(), suffix))
+
+    get_entry_points_cache().write_output(
+        path,
+        template,
         script_name=os.path.basename(sys.argv[0]),
         data_source_name=file,
         annotation_lower=annotation.lower(),
@@ -2520,15 +2643,13 @@ def write_file(annotation, comment, template, entry_points, suffix, includes, li
         includes=includes,
         entry_points=entry_points)
 
-    path = path_to(lib, "entry_points_{}_autogen.{}".format(annotation.lower(), suffix))
-
-    with open(path, "w") as out:
-        out.write(content)
-        out.close()
-
 
 def write_export_files(entry_points, includes, source, lib_name, lib_description, lib_dir=None):
-    content = TEMPLATE_LIB_ENTRY_POINT_SOURCE.format(
+    path = path_to(lib_name if not lib_dir else lib_dir, "{}_autogen.cpp".format(lib_name))
+
+    get_entry_points_cache().write_output(
+        path,
+        TEMPLATE_LIB_ENTRY_POINT_SOURCE,
         script_name=os.path.basename(sys.argv[0]),
         data_source_name=source,
         lib_name=lib_name,
@@ -2537,12 +2658,6 @@ def write_export_files(entry_points, includes, source, lib_name, lib_description
         entry_points=entry_points,
     )
 
-    path = path_to(lib_name if not lib_dir else lib_dir, "{}_autogen.cpp".format(lib_name))
-
-    with open(path, "w") as out:
-        out.write(content)
-        out.close()
-
 
 def write_context_api_decls(decls, api):
     for (major, minor), version_decls in sorted(decls['core'].items()):
@@ -2552,7 +2667,11 @@ def write_context_api_decls(decls, api):
         else:
             annotation = '{}_{}_{}'.format(api, major, minor)
             version = '{}_{}'.format(major, minor)
-        content = CONTEXT_HEADER.format(
+        path = path_to("libANGLE", "Context_%s_autogen.h" % annotation.lower())
+
+        get_entry_points_cache().write_output(
+            path,
+            CONTEXT_HEADER,
             annotation_lower=annotation.lower(),
             annotation_upper=annotation.upper(),
             script_name=os.path.basename(sys.argv[0]),
@@ -2560,12 +2679,6 @@ def write_context_api_decls(decls, api):
             version=version,
             interface="\n".join(version_decls))
 
-        path = path_to("libANGLE", "Context_%s_autogen.h" % annotation.lower())
-
-        with open(path, "w") as out:
-            out.write(content)
-            out.close()
-
     if 'exts' in decls.keys():
         interface_lines = []
         for annotation in decls['exts'].keys():
@@ -2575,7 +2688,11 @@ def write_context_api_decls(decls, api):
                 interface_lines.append("    /* " + extname + " */ \\")
                 interface_lines.extend(decls['exts'][annotation][extname])
 
-        content = CONTEXT_HEADER.format(
+        path = path_to("libANGLE", "Context_gles_ext_autogen.h")
+
+        get_entry_points_cache().write_output(
+            path,
+            CONTEXT_HEADER,
             annotation_lower='gles_ext',
             annotation_upper='GLES_EXT',
             script_name=os.path.basename(sys.argv[0]),
@@ -2583,44 +2700,38 @@ def write_context_api_decls(decls, api):
             version='EXT',
             interface="\n".join(interface_lines))
 
-        path = path_to("libANGLE", "Context_gles_ext_autogen.h")
-
-        with open(path, "w") as out:
-            out.write(content)
-            out.close()
-
 
 def write_validation_header(annotation, comment, protos, source, template):
-    content = template.format(
+    path = path_to("libANGLE", "validation%s_autogen.h" % annotation)
+
+    get_entry_points_cache().write_output(
+        path,
+        template,
         script_name=os.path.basename(sys.argv[0]),
         data_source_name=source,
         annotation=annotation,
         comment=comment,
         prototypes="\n".join(protos))
 
-    path = path_to("libANGLE", "validation%s_autogen.h" % annotation)
-
-    with open(path, "w") as out:
-        out.write(content)
-        out.close()
-
 
 def write_context_private_call_header(annotation, protos, source, template):
-    content = TEMPLATE_CONTEXT_PRIVATE_CALL_HEADER.format(
+    path = path_to("libANGLE", "context_private_call_%s_autogen.h" % annotation)
+
+    get_entry_points_cache().write_output(
+        path,
+        TEMPLATE_CONTEXT_PRIVATE_CALL_HEADER,
         script_name=os.path.basename(sys.argv[0]),
         data_source_name=source,
         annotation=annotation,
         prototypes="\n".join(protos))
 
-    path = path_to("libANGLE", "context_private_call_%s_autogen.h" % annotation)
-
-    with open(path, "w") as out:
-        out.write(content)
-        out.close()
-
 
 def write_context_lock_header(annotation, comment, protos, source, template):
-    content = template.format(
+    path = path_to("libGLESv2", "%s_context_lock_autogen.h" % annotation.lower())
+
+    get_entry_points_cache().write_output(
+        path,
+        template,
         script_name=os.path.basename(sys.argv[0]),
         data_source_name=source,
         annotation_lower=annotation.lower(),
@@ -2628,12 +2739,6 @@ def write_context_lock_header(annotation, comment, protos, source, template):
         comment=comment,
         prototypes="\n".join(protos))
 
-    path = path_to("libGLESv2", "%s_context_lock_autogen.h" % annotation.lower())
-
-    with open(path, "w") as out:
-        out.write(content)
-        out.close()
-
 
 def write_gl_validation_header(annotation, comment, protos, source):
     return write_validation_header(annotation, comment, protos, source,
@@ -2645,7 +2750,11 @@ def write_capture_header(api, annotation, comment, protos, capture_pointer_funcs
     combined_protos = ["\n// Method Captures\n"] + protos
     if capture_pointer_funcs:
         combined_protos += ["\n// Parameter Captures\n"] + capture_pointer_funcs
-    content = TEMPLATE_CAPTURE_HEADER.format(
+    path = path_to(os.path.join("libANGLE", "capture"), "capture_%s_autogen.h" % annotation)
+
+    get_entry_points_cache().write_output(
+        path,
+        TEMPLATE_CAPTURE_HEADER,
         script_name=os.path.basename(sys.argv[0]),
         data_source_name="%s.xml and %s_angle_ext.xml" % (ns, ns),
         annotation_lower=annotation.lower(),
@@ -2654,16 +2763,15 @@ def write_capture_header(api, annotation, comment, protos, capture_pointer_funcs
         namespace=ns,
         prototypes="\n".join(combined_protos))
 
-    path = path_to(os.path.join("libANGLE", "capture"), "capture_%s_autogen.h" % annotation)
-
-    with open(path, "w") as out:
-        out.write(content)
-        out.close()
-
 
 def write_capture_source(api, annotation_with_dash, annotation_no_dash, comment, capture_methods):
     ns = 'egl' if api == apis.EGL else 'gl'
-    content = TEMPLATE_CAPTURE_SOURCE.format(
+    path = path_to(
+        os.path.join("libANGLE", "capture"), "capture_%s_autogen.cpp" % annotation_with_dash)
+
+    get_entry_points_cache().write_output(
+        path,
+        TEMPLATE_CAPTURE_SOURCE,
         script_name=os.path.basename(sys.argv[0]),
         data_source_name="%s.xml and %s_angle_ext.xml" % (ns, ns),
         annotation_with_dash=annotation_with_dash,
@@ -2672,13 +2780,6 @@ def write_capture_source(api, annotation_with_dash, annotation_no_dash, comment,
         namespace=ns,
         capture_methods="\n".join(capture_methods))
 
-    path = path_to(
-        os.path.join("libANGLE", "capture"), "capture_%s_autogen.cpp" % annotation_with_dash)
-
-    with open(path, "w") as out:
-        out.write(content)
-        out.close()
-
 
 def is_packed_enum_param_type(param_type):
     return not param_type.startswith("GL") and not param_type.startswith(
@@ -2827,7 +2928,11 @@ def write_capture_helper_header(all_param_types):
     resource_id_types = format_resource_id_types(all_param_types)
     convert_structs = format_resource_id_convert_structs(all_param_types)
 
-    content = TEMPLATE_FRAME_CAPTURE_UTILS_HEADER.format(
+    path = path_to("common", "frame_capture_utils_autogen.h")
+
+    get_entry_points_cache().write_output(
+        path,
+        TEMPLATE_FRAME_CAPTURE_UTILS_HEADER,
         script_name=os.path.basename(sys.argv[0]),
         data_source_name="gl.xml and gl_angle_ext.xml",
         param_types=param_types,
@@ -2840,12 +2945,6 @@ def write_capture_helper_header(all_param_types):
         resource_id_types=resource_id_types,
         type_to_resource_id_type_structs=convert_structs)
 
-    path = path_to("common", "frame_capture_utils_autogen.h")
-
-    with open(path, "w") as out:
-        out.write(content)
-        out.close()
-
 
 def format_param_type_to_string_case(param_type):
     return TEMPLATE_PARAM_TYPE_TO_STRING_CASE.format(
@@ -2887,7 +2986,11 @@ def write_capture_helper_source(all_param_types):
     resource_id_type_name_cases = "\n".join(
         [format_resource_id_type_name_case(t) for t in resource_id_types])
 
-    content = TEMPLATE_FRAME_CAPTURE_UTILS_SOURCE.format(
+    path = path_to("common", "frame_capture_utils_autogen.cpp")
+
+    get_entry_points_cache().write_output(
+        path,
+        TEMPLATE_FRAME_CAPTURE_UTILS_SOURCE,
         script_name=os.path.basename(sys.argv[0]),
         data_source_name="gl.xml and gl_angle_ext.xml",
         write_param_type_to_stream_cases=write_param_type_to_stream_cases,
@@ -2895,12 +2998,6 @@ def write_capture_helper_source(all_param_types):
         param_type_resource_id_cases=param_type_resource_id_cases,
         resource_id_type_name_cases=resource_id_type_name_cases)
 
-    path = path_to("common", "frame_capture_utils_autogen.cpp")
-
-    with open(path, "w") as out:
-        out.write(content)
-        out.close()
-
 
 def get_command_params_text(command_node, cmd_name):
     param_text_list = list()
@@ -2987,31 +3084,29 @@ def write_capture_replay_source(gl_command_nodes, gl_command_names, gl_packed_en
         call_replay_cases += format_capture_replay_call_case(api, command_to_param_types_mapping,
                                                              packed_enums, resource_id_types)
 
-    source_content = TEMPLATE_CAPTURE_REPLAY_SOURCE.format(
+    source_file_path = registry_xml.script_relative(
+        "../util/capture/frame_capture_replay_autogen.cpp")
+    get_entry_points_cache().write_output(
+        source_file_path,
+        TEMPLATE_CAPTURE_REPLAY_SOURCE,
         script_name=os.path.basename(sys.argv[0]),
         data_source_name="gl.xml and gl_angle_ext.xml",
         call_replay_cases=call_replay_cases,
     )
-    source_file_path = registry_xml.script_relative(
-        "../util/capture/frame_capture_replay_autogen.cpp")
-    with open(source_file_path, 'w') as f:
-        f.write(source_content)
 
 
 def write_windows_def_file(data_source_name, lib, libexport, folder, exports):
 
-    content = TEMPLATE_WINDOWS_DEF_FILE.format(
+    path = path_to(folder, "%s_autogen.def" % lib)
+
+    get_entry_points_cache().write_output(
+        path,
+        TEMPLATE_WINDOWS_DEF_FILE,
         script_name=os.path.basename(sys.argv[0]),
         data_source_name=data_source_name,
         exports="\n".join(exports),
         lib=libexport)
 
-    path = path_to(folder, "%s_autogen.def" % lib)
-
-    with open(path, "w") as out:
-        out.write(content)
-        out.close()
-
 
 def get_exports(commands, fmt=None):
     if fmt:
@@ -3274,10 +3369,7 @@ def write_stubs_header(api, annotation, title, data_source, out_file, all_comman
         "title": title,
     }
 
-    output = get_stubs_header_template(api).format(**args)
-
-    with open(out_file, "w") as f:
-        f.write(output)
+    get_entry_points_cache().write_output(out_file, get_stubs_header_template(api), **args)
 
 
 def main():
@@ -3286,7 +3378,7 @@ def main():
     if len(sys.argv) > 1:
         inputs = [
             'entry_point_packed_egl_enums.json', 'entry_point_packed_gl_enums.json',
-            EGL_GET_LABELED_OBJECT_DATA_PATH
+            EGL_GET_LABELED_OBJECT_DATA_PATH, 'autogen_writer.py'
         ] + registry_xml.xml_inputs
         outputs = [
             CL_STUBS_HEADER_PATH,
@@ -3888,31 +3980,28 @@ def main():
     ) + wglxml.GetEnums('wgl')
     all_enums = [('Invalid', 'Invalid')] + sorted(list(set(unsorted_enums)))
 
-    entry_points_enum_header = TEMPLATE_ENTRY_POINTS_ENUM_HEADER.format(
+    entry_points_enum_header_path = path_to("common", "entry_points_enum_autogen.h")
+    get_entry_points_cache().write_output(
+        entry_points_enum_header_path,
+        TEMPLATE_ENTRY_POINTS_ENUM_HEADER,
         script_name=os.path.basename(sys.argv[0]),
         data_source_name="gl.xml and gl_angle_ext.xml",
         lib="GL/GLES",
-        entry_points_list=",\n".join(["    " + enum for (enum, _) in all_enums]))
-
-    entry_points_enum_header_path = path_to("common", "entry_points_enum_autogen.h")
-    with open(entry_points_enum_header_path, "w") as out:
-        out.write(entry_points_enum_header)
-        out.close()
+        entry_points_list=",\n".join(["    " + enum for (enum, _) in all_enums]),
+        entry_points_count=len(all_enums))
 
     entry_points_cases = [
         TEMPLATE_ENTRY_POINTS_NAME_CASE.format(enum=enum, cmd=cmd) for (enum, cmd) in all_enums
     ]
-    entry_points_enum_source = TEMPLATE_ENTRY_POINTS_ENUM_SOURCE.format(
+    entry_points_enum_source_path = path_to("common", "entry_points_enum_autogen.cpp")
+    get_entry_points_cache().write_output(
+        entry_points_enum_source_path,
+        TEMPLATE_ENTRY_POINTS_ENUM_SOURCE,
         script_name=os.path.basename(sys.argv[0]),
         data_source_name="gl.xml and gl_angle_ext.xml",
         lib="GL/GLES",
         entry_points_name_cases="\n".join(entry_points_cases))
 
-    entry_points_enum_source_path = path_to("common", "entry_points_enum_autogen.cpp")
-    with open(entry_points_enum_source_path, "w") as out:
-        out.write(entry_points_enum_source)
-        out.close()
-
     write_export_files("\n".join([item for item in libgles_ep_defs]), LIBGLESV2_EXPORT_INCLUDES,
                        "gl.xml and gl_angle_ext.xml", "libGLESv2", "OpenGL ES")
     write_export_files("\n".join([item for item in libegl_ep_defs]),
@@ -3950,6 +4039,8 @@ def main():
                                 GLEntryPoints.get_packed_enums(), eglxml.all_commands,
                                 egl_commands, EGLEntryPoints.get_packed_enums(), resource_id_types)
 
+    get_entry_points_cache().save()
+
 
 if __name__ == '__main__':
     sys.exit(main())
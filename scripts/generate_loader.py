@@ -9,9 +9,9 @@
 #   NOTE: don't run this script directly. Run scripts/run_code_generation.py.
 
 import sys, os, pprint, json
+import autogen_writer
 import registry_xml
 
-
 DEFAULT_INTERNAL_PREFIX = "l_"
 
 
@@ -35,7 +35,7 @@ def write_header(data_source_name,
             return cmd
         return prefix + cmd[len(api):]
 
-    with open(header_path, "w") as out:
+    with autogen_writer.open_output(header_path, "w") as out:
         defines = [
             "#define %s%s %s%s%s" % (ns, pre(cmd), internal_prefix, ns, pre(cmd))
             for cmd in all_cmds
@@ -79,7 +79,7 @@ def write_source(data_source_name,
             return cmd
         return prefix + cmd[len(api):]
 
-    with open(source_path, "w") as out:
+    with autogen_writer.open_output(source_path, "w") as out:
         var_defs = [
             "%sPFN%sPROC %s%s%s;" % (export, cmd.upper(), internal_prefix, ns, pre(cmd))
             for cmd in all_cmds
@@ -270,7 +270,7 @@ def main():
 
     # Handle inputs/outputs for run_code_generation.py's auto_script
     if len(sys.argv) > 1:
-        inputs = registry_xml.xml_inputs
+        inputs = registry_xml.xml_inputs + ['autogen_writer.py']
         outputs = [
             '../src/libEGL/egl_loader_autogen.cpp',
             '../src/libEGL/egl_loader_autogen.h',
@@ -0,0 +1,124 @@
+#!/usr/bin/python3
+#
+# Copyright 2026 The ANGLE Project Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+#
+# minimal_perfect_hash.py:
+#   Builds minimal perfect hash functions for the string tables of the code generators. The keys
+#   are hashed with 32-bit FNV-1a, spread into buckets of a few keys each, and every bucket gets a
+#   16-bit seed such that
+#
+#     hash = Fnv1a(key)
+#     slot = Range(Mix(hash ^ seeds[Range(hash, len(seeds))]), len(keys))
+#
+#   maps the keys to distinct slots in [0, len(keys)). Mix is the MurmurHash3 finalizer and
+#   Range(x, n) is (x * n) >> 32. Seeds are searched for the largest buckets first, which makes the
+#   construction deterministic and fast. The lookup reads the key once and does a single table
+#   access; see CPP_LOOKUP_FUNCTION for the generated C++ code.
+
+import math
+
+FNV_OFFSET_BASIS = 0x811c9dc5
+FNV_PRIME = 16777619
+MAX_SEED = 0xffff
+DEFAULT_KEYS_PER_BUCKET = 3
+
+# Generic C++ lookup, to be emitted once in the generated file. The seeds and the numbers of seeds
+# and keys are those of the MinimalPerfectHash.
+CPP_LOOKUP_FUNCTION = """// Minimal perfect hash function built by scripts/minimal_perfect_hash.py.
+constexpr uint32_t MinimalPerfectHash(const char *key,
+                                      const uint16_t *seeds,
+                                      uint32_t numSeeds,
+                                      uint32_t numKeys)
+{
+    uint32_t hash = 0x811c9dc5u;
+    for (; *key != '\\0'; ++key)
+    {
+        hash = (hash ^ static_cast<unsigned char>(*key)) * 16777619u;
+    }
+    hash ^= seeds[(static_cast<uint64_t>(hash) * numSeeds) >> 32];
+    hash ^= hash >> 16;
+    hash *= 0x85ebca6bu;
+    hash ^= hash >> 13;
+    hash *= 0xc2b2ae35u;
+    hash ^= hash >> 16;
+    return static_cast<uint32_t>((static_cast<uint64_t>(hash) * numKeys) >> 32);
+}"""
+
+
+def fnv1a(key):
+    hash = FNV_OFFSET_BASIS
+    for byte in key.encode():
+        hash = ((hash ^ byte) * FNV_PRIME) & 0xffffffff
+    return hash
+
+
+def _mix(hash):
+    hash ^= hash >> 16
+    hash = (hash * 0x85ebca6b) & 0xffffffff
+    hash ^= hash >> 13
+    hash = (hash * 0xc2b2ae35) & 0xffffffff
+    return hash ^ (hash >> 16)
+
+
+def _range(hash, n):
+    return (hash * n) >> 32
+
+
+class MinimalPerfectHash:
+
+    def __init__(self, num_keys, seeds):
+        self.num_keys = num_keys
+        self.seeds = seeds
+
+    def hash(self, key):
+        hash = fnv1a(key)
+        return _range(_mix(hash ^ self.seeds[_range(hash, len(self.seeds))]), self.num_keys)
+
+    # The seeds formatted as a C array initializer.
+    def format_seeds(self):
+        return ', '.join(str(seed) for seed in self.seeds)
+
+
+def _find_seeds(key_hashes, num_keys, num_buckets):
+    buckets = [[] for _ in range(num_buckets)]
+    for hash in key_hashes:
+        buckets[_range(hash, num_buckets)].append(hash)
+
+    seeds = [0] * num_buckets
+    used_slots = [False] * num_keys
+    # Larger buckets are harder to place, so place them while the table is still mostly empty.
+    for bucket_index in sorted(range(num_buckets), key=lambda index: -len(buckets[index])):
+        bucket = buckets[bucket_index]
+        if not bucket:
+            break
+        for seed in range(MAX_SEED + 1):
+            slots = [_range(_mix(hash ^ seed), num_keys) for hash in bucket]
+            if len(set(slots)) == len(slots) and not any(used_slots[slot] for slot in slots):
+                break
+        else:
+            return None
+        seeds[bucket_index] = seed
+        for slot in slots:
+            used_slots[slot] = True
+    return seeds
+
+
+# Returns a MinimalPerfectHash mapping the given distinct keys to [0, len(keys)). If some bucket
+# can't be placed with 16-bit seeds, smaller buckets are tried.
+def build(keys, keys_per_bucket=DEFAULT_KEYS_PER_BUCKET):
+    key_hashes = {}
+    for key in keys:
+        hash = fnv1a(key)
+        if hash in key_hashes:
+            raise Exception('FNV-1a collision between "%s" and "%s"' % (key_hashes[hash], key))
+        key_hashes[hash] = key
+
+    num_keys = len(keys)
+    for bucket_size in range(keys_per_bucket, 0, -1):
+        num_buckets = max(1, math.ceil(num_keys / bucket_size))
+        seeds = _find_seeds(key_hashes, num_keys, num_buckets)
+        if seeds is not None:
+            return MinimalPerfectHash(num_keys, seeds)
+    raise Exception('Could not build a minimal perfect hash for %d keys' % num_keys)
@@ -0,0 +1,237 @@
+#!/usr/bin/python3
+#
+# Copyright 2026 The ANGLE Project Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+#
+# minimal_perfect_hash_benchmark.py:
+#   Compares the hash functions built by minimal_perfect_hash.py for the built-in symbol tables of
+#   the translator with those previously built by the perfect_hash package: build time, size of
+#   the generated tables and lookup cost. The lookups are timed with the generated C++ code when a
+#   C++ compiler is found, and with the Python implementations otherwise. The perfect_hash package
+#   is only needed for the comparison.
+
+import argparse
+import importlib.util
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+
+import minimal_perfect_hash
+
+translator_dir = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'compiler', 'translator')
+sys.path.append(translator_dir)
+import gen_builtin_symbols
+
+# The lookup previously emitted by gen_builtin_symbols.py for perfect_hash.Hash2.
+CPP_SALT_LOOKUP_FUNCTION = """int SaltHashG(const char *key, const int *T, const int *G, int NG)
+{
+    int sum = 0;
+    for (int i = 0; key[i] != '\\0'; i++)
+    {
+        sum += T[i] * key[i];
+        sum %= NG;
+    }
+    return G[sum];
+}
+
+int SaltPerfectHash(const char *key, const int *T1, const int *T2, const int *G, int NG, int NS)
+{
+    if (strlen(key) > static_cast<size_t>(NS))
+        return 0;
+    return (SaltHashG(key, T1, G, NG) + SaltHashG(key, T2, G, NG)) % NG;
+}"""
+
+CPP_BENCHMARK = """#include <chrono>
+#include <cstdint>
+#include <cstdio>
+#include <cstring>
+
+namespace
+{{
+{lookup_functions}
+
+constexpr const char *kKeys[] = {{{keys}}};
+{tables}
+}}  // namespace
+
+int main()
+{{
+    uint32_t sink = 0;
+    double best   = 1e30;
+    for (int repeat = 0; repeat < {repeat}; ++repeat)
+    {{
+        auto start = std::chrono::steady_clock::now();
+        for (int iteration = 0; iteration < {iterations}; ++iteration)
+        {{
+            for (const char *key : kKeys)
+            {{
+                sink += {lookup};
+            }}
+        }}
+        std::chrono::duration<double> elapsed = std::chrono::steady_clock::now() - start;
+        best = elapsed.count() < best ? elapsed.count() : best;
+    }}
+    printf("%.17g %u\\n", best, sink);
+    return 0;
+}}
+"""
+
+
+def format_ints(values):
+    return ', '.join(str(value) for value in values)
+
+
+class SaltHash:
+
+    def __init__(self, f1, f2, G):
+        self.f1 = f1
+        self.f2 = f2
+        self.G = G
+
+    def hash(self, key):
+        return (self.G[self.f1(key)] + self.G[self.f2(key)]) % len(self.G)
+
+    def table_size(self):
+        return 4 * (len(self.f1.salt) + len(self.f2.salt) + len(self.G))
+
+
+def build_salt_hash(keys):
+    from perfect_hash import generate_hash, Hash2
+    # gen_builtin_symbols.py seeded the random module once before building its hashes.
+    random.seed(0)
+    f1, f2, G = generate_hash(dict(zip(keys, range(len(keys)))), Hash2)
+    return SaltHash(f1, f2, G)
+
+
+def get_key_sets():
+    with open(os.path.join(translator_dir, 'builtin_variables.json')) as f:
+        variables = json.load(f, object_pairs_hook=OrderedDict)
+    database = gen_builtin_symbols.BuiltinSymbolDatabase(
+        gen_builtin_symbols.get_parsed_functions(
+            os.path.join(translator_dir, 'builtin_function_declarations.txt')), variables)
+    essl_database = database.get_essl_only_view()
+    return OrderedDict([
+        ('mangled', database.mangled_names),
+        ('unmangled', database.unmangled_names),
+        ('ESSL mangled', essl_database.mangled_names),
+        ('ESSL unmangled', essl_database.unmangled_names),
+    ])
+
+
+def time_build(build, keys, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        hashfn = build(keys)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return hashfn, best
+
+
+def get_cpp_compiler():
+    for compiler in ['c++', 'clang++', 'g++']:
+        path = shutil.which(compiler)
+        if path:
+            return path
+    return None
+
+
+# Returns the time per lookup of the generated C++ code, in nanoseconds.
+def time_cpp_lookup(compiler, keys, lookup_functions, tables, lookup, repeat):
+    iterations = max(1, 2000000 // len(keys))
+    source = CPP_BENCHMARK.format(
+        lookup_functions=lookup_functions,
+        keys=', '.join('"%s"' % key for key in keys),
+        tables=tables,
+        lookup=lookup,
+        repeat=repeat,
+        iterations=iterations)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        source_path = os.path.join(temp_dir, 'benchmark.cpp')
+        binary_path = os.path.join(temp_dir, 'benchmark')
+        with open(source_path, 'w') as f:
+            f.write(source)
+        subprocess.check_call([compiler, '-std=c++17', '-O2', '-o', binary_path, source_path])
+        elapsed = float(subprocess.check_output([binary_path]).split()[0])
+    return elapsed * 1e9 / (iterations * len(keys))
+
+
+def time_python_lookup(hashfn, keys, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for key in keys:
+            hashfn.hash(key)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1e9 / len(keys)
+
+
+def benchmark_minimal_hash(keys, compiler, repeat):
+    hashfn, build_time = time_build(minimal_perfect_hash.build, keys, repeat)
+    assert sorted(hashfn.hash(key) for key in keys) == list(range(len(keys)))
+    if compiler:
+        lookup = time_cpp_lookup(
+            compiler, keys, minimal_perfect_hash.CPP_LOOKUP_FUNCTION,
+            'constexpr uint16_t kSeeds[] = {%s};' % hashfn.format_seeds(),
+            'MinimalPerfectHash(key, kSeeds, %d, %d)' % (len(hashfn.seeds), len(keys)), repeat)
+    else:
+        lookup = time_python_lookup(hashfn, keys, repeat)
+    return build_time, 2 * len(hashfn.seeds), lookup
+
+
+def benchmark_salt_hash(keys, compiler, repeat):
+    hashfn, build_time = time_build(build_salt_hash, keys, repeat)
+    if compiler:
+        tables = '\n'.join([
+            'constexpr int kT1[] = {%s};' % format_ints(hashfn.f1.salt),
+            'constexpr int kT2[] = {%s};' % format_ints(hashfn.f2.salt),
+            'constexpr int kG[] = {%s};' % format_ints(hashfn.G),
+        ])
+        lookup = time_cpp_lookup(
+            compiler, keys, CPP_SALT_LOOKUP_FUNCTION, tables,
+            'SaltPerfectHash(key, kT1, kT2, kG, %d, %d)' % (len(hashfn.G), len(hashfn.f1.salt)),
+            repeat)
+    else:
+        lookup = time_python_lookup(hashfn, keys, repeat)
+    return build_time, hashfn.table_size(), lookup
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compares minimal_perfect_hash.py with the perfect_hash package.')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument(
+        '--python-lookup',
+        action='store_true',
+        help='time the lookups in Python even if a C++ compiler is available')
+    args = parser.parse_args()
+
+    compiler = None if args.python_lookup else get_cpp_compiler()
+    print('Lookups timed with %s' % (compiler or 'Python'))
+    have_perfect_hash = importlib.util.find_spec('perfect_hash') is not None
+    if not have_perfect_hash:
+        print('perfect_hash is not installed, only timing minimal_perfect_hash.py')
+
+    print('%-16s %6s %-13s %12s %14s %16s' %
+          ('keys', 'count', 'builder', 'build (ms)', 'tables (bytes)', 'lookup (ns/key)'))
+    for name, keys in get_key_sets().items():
+        results = [('minimal', benchmark_minimal_hash(keys, compiler, args.repeat))]
+        if have_perfect_hash:
+            results.append(('perfect_hash', benchmark_salt_hash(keys, compiler, args.repeat)))
+        for builder, (build_time, table_size, lookup) in results:
+            print('%-16s %6d %-13s %12.1f %14d %16.2f' %
+                  (name, len(keys), builder, build_time * 1e3, table_size, lookup))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
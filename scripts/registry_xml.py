@@ -11,7 +11,9 @@
 # available in gl.xml.
 
 import difflib
+import hashlib
 import os
+import pickle
 import sys
 import xml.etree.ElementTree as etree
 
@@ -453,6 +455,7 @@ class apis:
     EGL = 'EGL'
     CL = 'CL'
 
+
 # For GLenum types
 api_enums = {apis.GL: 'BigGLEnum', apis.GLES: 'GLESEnum'}
 default_enum_group_name = 'AllEnums'
@@ -462,6 +465,166 @@ def script_relative(path):
     return os.path.join(os.path.dirname(sys.argv[0]), path)
 
 
+# Merged registry trees (Khronos XML plus the optional ANGLE extension XML), shared read-only by
+# all RegistryXML instances and generators running in the same process.
+_registry_roots = {}
+
+# Snapshots of the merged registries are stored here, see load_registry_snapshot.
+snapshot_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.registry_snapshots')
+
+# Bump to discard snapshots written by older versions of this script.
+SNAPSHOT_VERSION = 2
+
+# Command nodes parsed from the snapshots by snapshot key, shared read-only like _registry_roots.
+_registry_commands = {}
+
+# Snapshot keys by registry, with the modification times of the files they were computed from.
+_snapshot_keys = {}
+
+
+def _registry_input_path(xml_file):
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), find_xml_input(xml_file))
+
+
+def load_registry_root(xml_file, ext_file=None):
+    key = (xml_file, ext_file)
+    if key not in _registry_roots:
+        root = etree.parse(_registry_input_path(xml_file)).getroot()
+        if ext_file:
+            _append_angle_exts(root, etree.parse(_registry_input_path(ext_file)).getroot())
+        _registry_roots[key] = root
+    return _registry_roots[key]
+
+
+def _append_angle_exts(root, angle_ext_root):
+    insertion_point = root.findall("./commands")[0]
+    for command in angle_ext_root.iter('commands'):
+        insertion_point.extend(command)
+
+    insertion_point = root.findall("./extensions")[0]
+    for extension in angle_ext_root.iter('extensions'):
+        insertion_point.extend(extension)
+
+    insertion_point = root
+    for enums in angle_ext_root.iter('enums'):
+        insertion_point.append(enums)
+
+
+# Parses the registries used by the generators up front, so that worker processes forked
+# afterwards share them (see run_code_generation.py --in-process).
+def preload_xml_inputs():
+    for xml_file, ext_file in [('gl.xml', 'gl_angle_ext.xml'), ('egl.xml', 'egl_angle_ext.xml'),
+                               ('gl.xml', None), ('glx.xml', None), ('wgl.xml', None),
+                               ('cl.xml', None)]:
+        if os.path.isfile(_registry_input_path(xml_file)):
+            load_registry_commands(xml_file, ext_file)
+
+
+def _snapshot_key(xml_file, ext_file):
+    # The snapshot contents depend on the code extracting them as well as on the XML.
+    paths = [os.path.abspath(__file__), _registry_input_path(xml_file)]
+    if ext_file:
+        paths.append(_registry_input_path(ext_file))
+    # Generators construct many RegistryXML instances, only hash the inputs again if they changed.
+    mtimes = [os.stat(path).st_mtime_ns for path in paths]
+    cached = _snapshot_keys.get((xml_file, ext_file))
+    if cached and cached[0] == mtimes:
+        return cached[1]
+
+    key = hashlib.md5(str(SNAPSHOT_VERSION).encode())
+    for path in paths:
+        with open(path, 'rb') as f:
+            key.update(f.read())
+    _snapshot_keys[(xml_file, ext_file)] = (mtimes, key.hexdigest())
+    return key.hexdigest()
+
+
+def _build_registry_snapshot(root):
+    features = {}
+    for feature in root.iter('feature'):
+        commands = features.setdefault(feature.attrib['name'], [])
+        commands += [command.attrib['name'] for command in feature.iter('command')]
+
+    # The enums required by each feature and extension are listed with the feature api or the
+    # extension's supported apis, and the api of the require node.
+    feature_enums = []
+    for feature in root.findall('feature'):
+        for require in feature.findall('require'):
+            feature_enums.append((feature.attrib.get('api'), require.attrib.get('api'),
+                                  [enum.attrib['name'] for enum in require.findall('enum')]))
+
+    extensions = []
+    extension_enums = []
+    for extension in root.findall("extensions/extension"):
+        requires = []
+        supported = extension.attrib.get('supported', '')
+        for require in extension.findall('require'):
+            requires.append((require.attrib.get('api'), require.attrib.get('comment'),
+                             [command.attrib['name'] for command in require.findall('command')]))
+            extension_enums.append((extension.attrib['name'], supported, require.attrib.get('api'),
+                                    [enum.attrib['name'] for enum in require.findall('enum')]))
+        extensions.append((extension.attrib['name'], supported, requires))
+
+    # The enum values with their comma-separated groups.
+    enums = [(enum.attrib['name'], enum.attrib.get('value'), enum.attrib.get('group'))
+             for enum in root.findall('enums/enum')]
+
+    # The prototypes and params of the commands are kept as XML, since generators format them from
+    # the command nodes. This is a small part of the registry, and parses much faster than all of it.
+    commands = etree.Element('commands')
+    commands.extend(root.findall('commands/command'))
+
+    return {
+        'features': features,
+        'extensions': extensions,
+        'feature_enums': feature_enums,
+        'extension_enums': extension_enums,
+        'enums': enums,
+        'commands': etree.tostring(commands),
+    }
+
+
+# Returns the parts of the merged registry that generators read: the command lists of features and
+# extensions, the command nodes, and the enums with their groups. Snapshots are pickled to disk
+# keyed on the hashes of the XML inputs, so generators don't parse the multi-megabyte XML at all
+# once a snapshot exists.
+def load_registry_snapshot(xml_file, ext_file=None):
+    key = _snapshot_key(xml_file, ext_file)
+    snapshot_name = '%s%s.pickle' % (xml_file, '+' + ext_file if ext_file else '')
+    snapshot_path = os.path.join(snapshot_dir, snapshot_name)
+
+    try:
+        with open(snapshot_path, 'rb') as f:
+            snapshot = pickle.load(f)
+        if snapshot['key'] == key:
+            return snapshot['registry']
+    except (OSError, EOFError, KeyError, pickle.UnpicklingError):
+        pass
+
+    registry = _build_registry_snapshot(load_registry_root(xml_file, ext_file))
+    try:
+        os.makedirs(snapshot_dir, exist_ok=True)
+        # Generators may run concurrently, so write to a private file and rename it in place.
+        temp_path = '%s.%d.tmp' % (snapshot_path, os.getpid())
+        with open(temp_path, 'wb') as f:
+            pickle.dump({'key': key, 'registry': registry}, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, snapshot_path)
+    except OSError:
+        # The snapshot is only an optimization, e.g. the checkout may be read-only.
+        pass
+    return registry
+
+
+# Returns the command nodes of the merged registry. They're shared with other RegistryXML instances
+# and must not be modified.
+def load_registry_commands(xml_file, ext_file=None):
+    key = _snapshot_key(xml_file, ext_file)
+    if key not in _registry_commands:
+        snapshot = load_registry_snapshot(xml_file, ext_file)
+        _registry_commands[key] = etree.fromstring(snapshot['commands']).findall('command')
+    return _registry_commands[key]
+
+
 def path_to(folder, file):
     return os.path.join(script_relative(".."), "src", folder, file)
 
@@ -487,17 +650,25 @@ class CommandNames:
 
     def __init__(self):
         self.command_names = {}
+        # Index of every added command, for constant time duplicate checks.
+        self.all_command_names = set()
+        self._all_commands_cache = None
 
     def get_commands(self, version):
         return self.command_names[version]
 
+    def has_command(self, cmd_name):
+        return cmd_name in self.all_command_names
+
     def get_all_commands(self):
-        cmd_names = []
-        # Combine all the version lists into a single list
-        for version, version_cmd_names in sorted(self.command_names.items()):
-            cmd_names += version_cmd_names
+        # Combine all the version lists into a single list. The result is cached until more
+        # commands are added, callers get their own copy since some extend it.
+        if self._all_commands_cache is None:
+            self._all_commands_cache = []
+            for version, version_cmd_names in sorted(self.command_names.items()):
+                self._all_commands_cache += version_cmd_names
 
-        return cmd_names
+        return list(self._all_commands_cache)
 
     def add_commands(self, version, commands):
         # Add key if it doesn't exist
@@ -505,50 +676,56 @@ class CommandNames:
             self.command_names[version] = []
         # Add the commands that aren't duplicates
         self.command_names[version] += commands
+        self.all_command_names.update(commands)
+        self._all_commands_cache = None
 
 
 class RegistryXML:
 
     def __init__(self, xml_file, ext_file=None):
-        tree = etree.parse(script_relative(find_xml_input(xml_file)))
-        self.root = tree.getroot()
-        if (ext_file):
-            self._AppendANGLEExts(find_xml_input(ext_file))
-        self.all_commands = self.root.findall('commands/command')
+        self.xml_file = xml_file
+        self.ext_file = ext_file
+        self.snapshot = load_registry_snapshot(xml_file, ext_file)
+        self._all_commands = None
+        self._command_index = None
         self.all_cmd_names = CommandNames()
         self.commands = {}
 
-    def _AppendANGLEExts(self, ext_file):
-        angle_ext_tree = etree.parse(script_relative(ext_file))
-        angle_ext_root = angle_ext_tree.getroot()
-
-        insertion_point = self.root.findall("./commands")[0]
-        for command in angle_ext_root.iter('commands'):
-            insertion_point.extend(command)
-
-        insertion_point = self.root.findall("./extensions")[0]
-        for extension in angle_ext_root.iter('extensions'):
-            insertion_point.extend(extension)
-
-        insertion_point = self.root
-        for enums in angle_ext_root.iter('enums'):
-            insertion_point.append(enums)
+    # The XML tree is only parsed for generators that walk it directly, others read the snapshot.
+    # It's shared with other RegistryXML instances and must not be modified.
+    @property
+    def root(self):
+        return load_registry_root(self.xml_file, self.ext_file)
+
+    @property
+    def all_commands(self):
+        if self._all_commands is None:
+            self._all_commands = load_registry_commands(self.xml_file, self.ext_file)
+        return self._all_commands
+
+    # Maps command names to their (position in all_commands, command node) pairs. Registries may
+    # declare a command more than once, hence the lists.
+    @property
+    def command_index(self):
+        if self._command_index is None:
+            self._command_index = {}
+            for position, command_node in enumerate(self.all_commands):
+                self._command_index.setdefault(get_cmd_name(command_node), []).append(
+                    (position, command_node))
+        return self._command_index
 
     def AddCommands(self, feature_name, annotation):
-        xpath = ".//feature[@name='%s']//command" % feature_name
-        commands = [cmd.attrib['name'] for cmd in self.root.findall(xpath)]
+        commands = list(self.snapshot['features'].get(feature_name, []))
 
         # Remove commands that have already been processed
-        current_cmds = self.all_cmd_names.get_all_commands()
-        commands = [cmd for cmd in commands if cmd not in current_cmds]
+        commands = [cmd for cmd in commands if not self.all_cmd_names.has_command(cmd)]
 
         self.all_cmd_names.add_commands(annotation, commands)
         self.commands[annotation] = commands
 
-    def _ClassifySupport(self, extension):
-        supported = extension.attrib['supported']
+    def _ClassifySupport(self, extension_name, supported):
         # Desktop GL extensions exposed in ANGLE GLES for Chrome.
-        if extension.attrib['name'] in ['GL_ARB_sync', 'GL_NV_robustness_video_memory_purge']:
+        if extension_name in ['GL_ARB_sync', 'GL_NV_robustness_video_memory_purge']:
             supported += "|gles2"
         if 'gles2' in supported:
             return 'gl2ext'
@@ -563,8 +740,7 @@ class RegistryXML:
         elif 'cl' in supported:
             return 'clext'
         else:
-            assert False, 'Cannot classify support for %s: %s' % (extension.attrib['name'],
-                                                                  supported)
+            assert False, 'Cannot classify support for %s: %s' % (extension_name, supported)
             return 'unknown'
 
     def AddExtensionCommands(self, supported_extensions, apis):
@@ -573,44 +749,39 @@ class RegistryXML:
         self.ext_data = {}
         self.ext_dupes = {}
         ext_annotations = {}
+        supported_extensions = set(supported_extensions)
 
-        for extension in self.root.findall("extensions/extension"):
-            extension_name = extension.attrib['name']
+        for extension_name, supported, requires in self.snapshot['extensions']:
             if not extension_name in supported_extensions:
                 continue
 
-            ext_annotations[extension_name] = self._ClassifySupport(extension)
+            ext_annotations[extension_name] = self._ClassifySupport(extension_name, supported)
 
             ext_cmd_names = []
 
             # There's an extra step here to filter out 'api=gl' extensions. This
             # is necessary for handling KHR extensions, which have separate entry
-            # point signatures (without the suffix) for desktop GL. Note that this
-            # extra step is necessary because of Etree's limited Xpath support.
-            for require in extension.findall('require'):
-                if 'api' in require.attrib and require.attrib['api'] not in apis:
+            # point signatures (without the suffix) for desktop GL.
+            for require_api, require_comment, extension_commands in requires:
+                if require_api is not None and require_api not in apis:
                     continue
 
                 # A special case for EXT_texture_storage
                 filter_out_comment = "Supported only if GL_EXT_direct_state_access is supported"
-                if 'comment' in require.attrib and require.attrib['comment'] == filter_out_comment:
+                if require_comment == filter_out_comment:
                     continue
 
-                extension_commands = require.findall('command')
-                ext_cmd_names += [command.attrib['name'] for command in extension_commands]
+                ext_cmd_names += extension_commands
 
             self.ext_data[extension_name] = sorted(ext_cmd_names)
 
         for extension_name, ext_cmd_names in sorted(self.ext_data.items()):
 
             # Detect and filter duplicate extensions.
-            dupes = []
-            for ext_cmd in ext_cmd_names:
-                if ext_cmd in self.all_cmd_names.get_all_commands():
-                    dupes.append(ext_cmd)
-
-            for dupe in dupes:
-                ext_cmd_names.remove(dupe)
+            dupes = [cmd for cmd in ext_cmd_names if self.all_cmd_names.has_command(cmd)]
+            ext_cmd_names = [
+                cmd for cmd in ext_cmd_names if not self.all_cmd_names.has_command(cmd)
+            ]
 
             self.ext_data[extension_name] = sorted(ext_cmd_names)
             self.ext_dupes[extension_name] = dupes
@@ -632,15 +803,21 @@ class EntryPoints:
         self.api = api
         self._cmd_info = []
 
-        for command_node in xml.all_commands:
-            cmd_name = get_cmd_name(command_node)
-
-            if api == apis.WGL:
+        command_index = xml.command_index
+        if api == apis.WGL:
+            # wgl.xml lists some commands without their prefix.
+            command_index = {}
+            for cmd_name, nodes in xml.command_index.items():
                 cmd_name = cmd_name if cmd_name.startswith('wgl') else 'wgl' + cmd_name
+                command_index.setdefault(cmd_name, []).extend(nodes)
 
-            if cmd_name not in commands:
-                continue
+        # Look up the requested commands by name, then restore the registry order.
+        command_nodes = []
+        for cmd_name in set(commands):
+            command_nodes += [(position, cmd_name, command_node)
+                              for position, command_node in command_index.get(cmd_name, [])]
 
+        for _, cmd_name, command_node in sorted(command_nodes, key=lambda node: node[0]):
             param_text = ["".join(param.itertext()) for param in command_node.findall('param')]
 
             # Treat (void) as ()
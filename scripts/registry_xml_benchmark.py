@@ -0,0 +1,158 @@
+#!/usr/bin/python3
+#
+# Copyright 2026 The ANGLE Project Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+#
+# registry_xml_benchmark.py:
+#   Times the command de-duplication done when setting up registries with registry_xml.py.
+#   Synthetic registries of growing size are built to check that the setup scales linearly with
+#   the number of commands and extensions. The real GLES, EGL and CL registries are timed too when
+#   the Khronos XML files are checked out.
+
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import time
+
+import registry_xml
+
+SYNTHETIC_VERSIONS = ['1_0', '2_0', '3_0']
+
+
+def write_synthetic_registry(path, num_commands, num_extensions):
+    commands = ['glCommand%d' % i for i in range(num_commands)]
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>', '<registry>', '<commands>']
+    for cmd in commands:
+        lines.append('<command><proto>void <name>%s</name></proto>'
+                     '<param><ptype>GLint</ptype> <name>x</name></param></command>' % cmd)
+    lines.append('</commands>')
+
+    # Versions overlap so that later versions re-declare some commands of earlier ones.
+    per_version = num_commands // len(SYNTHETIC_VERSIONS)
+    for index, version in enumerate(SYNTHETIC_VERSIONS):
+        lines.append('<feature api="gles2" name="GL_ES_VERSION_%s"><require>' % version)
+        first = max(0, index * per_version - per_version // 4)
+        lines += [
+            '<command name="%s"/>' % cmd for cmd in commands[first:(index + 1) * per_version]
+        ]
+        lines.append('</require></feature>')
+
+    # Extensions all duplicate core commands, which is the worst case for de-duplication.
+    lines.append('<extensions>')
+    for index in range(num_extensions):
+        lines.append('<extension name="GL_EXT_synthetic%d" supported="gles2"><require>' % index)
+        lines += [
+            '<command name="%s"/>' % commands[(index * 3 + i) % num_commands] for i in range(3)
+        ]
+        lines.append('</require></extension>')
+    lines += ['</extensions>', '</registry>']
+
+    with open(path, 'w') as f:
+        f.write('\n'.join(lines))
+
+
+def build_registry(xml_file, versions, feature_prefix, extensions, extension_apis):
+    xml = registry_xml.RegistryXML(xml_file)
+    for version in versions:
+        xml.AddCommands(feature_prefix + version, version)
+    xml.AddExtensionCommands(extensions, extension_apis)
+    registry_xml.EntryPoints(registry_xml.apis.GLES, xml, xml.all_cmd_names.get_all_commands())
+    return xml
+
+
+# Like timeit, keep the garbage collector out of the measurements; its cost grows with the number
+# of live objects and would hide the scaling of the code under test.
+def time_call(func, repeat):
+    best = None
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+    finally:
+        gc.enable()
+    return best
+
+
+def benchmark_synthetic(base_commands, steps, repeat):
+    print('Synthetic registries (best of %d):' % repeat)
+    print('%10s %10s %12s %16s' % ('commands', 'extensions', 'time (ms)', 'us per command'))
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Build snapshots in the temporary directory, not next to the real ones.
+        registry_xml.snapshot_dir = temp_dir
+        per_command = []
+        for step in range(steps):
+            num_commands = base_commands * (2**step)
+            num_extensions = num_commands // 2
+            xml_path = os.path.join(temp_dir, 'synthetic%d.xml' % step)
+            write_synthetic_registry(xml_path, num_commands, num_extensions)
+            registry_xml.xml_inputs.append(xml_path)
+
+            extensions = ['GL_EXT_synthetic%d' % i for i in range(num_extensions)]
+            # Parse and snapshot outside of the timed section.
+            build_registry(xml_path, SYNTHETIC_VERSIONS, 'GL_ES_VERSION_', extensions, ['gles2'])
+            elapsed = time_call(
+                lambda: build_registry(xml_path, SYNTHETIC_VERSIONS, 'GL_ES_VERSION_', extensions,
+                                       ['gles2']), repeat)
+            per_command.append(elapsed * 1e6 / num_commands)
+            print('%10d %10d %12.2f %16.3f' %
+                  (num_commands, num_extensions, elapsed * 1e3, per_command[-1]))
+
+    growth = per_command[-1] / per_command[0]
+    print('Cost per command grew %.2fx over a %dx larger registry.' % (growth, 2**(steps - 1)))
+    return growth
+
+
+def benchmark_khronos(repeat):
+
+    def build_cl():
+        xml = registry_xml.RegistryXML('cl.xml')
+        for major_version, minor_version in registry_xml.CL_VERSIONS:
+            version = '%d_%d' % (major_version, minor_version)
+            xml.AddCommands('CL_VERSION_' + version, version)
+        xml.AddExtensionCommands(registry_xml.supported_cl_extensions, ['cl'])
+        return xml
+
+    def build_all():
+        registry_xml.GetGLES()
+        registry_xml.GetEGL()
+        build_cl()
+
+    try:
+        build_all()
+    except OSError as e:
+        print('Skipping the Khronos registries: %s' % e)
+        return
+    print('GLES+EGL+CL registry setup: %.2f ms (best of %d)' %
+          (time_call(build_all, repeat) * 1e3, repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Times the command de-duplication in registry_xml.py.')
+    parser.add_argument('--base-commands', type=int, default=1000)
+    parser.add_argument('--steps', type=int, default=5)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument(
+        '--max-growth',
+        type=float,
+        default=2.0,
+        help='fail if the cost per command grows more than this between the smallest and the '
+        'largest synthetic registry')
+    args = parser.parse_args()
+
+    benchmark_khronos(args.repeat)
+    growth = benchmark_synthetic(args.base_commands, args.steps, args.repeat)
+    if growth > args.max_growth:
+        print('Registry setup does not scale linearly.')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -12,15 +12,28 @@ from concurrent import futures
 import hashlib
 import json
 import os
+import runpy
 import subprocess
 import sys
 import platform
+import time
+
+import autogen_writer
 
 script_dir = sys.path[0]
 root_dir = os.path.abspath(os.path.join(script_dir, '..'))
 
 hash_dir = os.path.join(script_dir, 'code_generation_hashes')
 
+# Local, untracked cache of generator manifests and file hashes. Bump the version whenever the
+# layout of the cache changes so stale caches are discarded instead of misread.
+cache_file = os.path.join(script_dir, '.code_generation_cache.json')
+CACHE_VERSION = 1
+
+# Files modified this recently may still be changing within the same mtime tick, so their hashes
+# are not cached (the same "racy" window git uses for its index).
+CACHE_RACY_SECONDS = 2
+
 
 def get_child_script_dirname(script):
     # All script names are relative to ANGLE's root
@@ -132,7 +145,6 @@ generators = {
         'src/libANGLE/renderer/wgpu/gen_wgpu_format_table.py',
 }
 
-
 # Fast and supports --verify-only without hashes.
 hashless_generators = {
     'ANGLE features': 'include/platform/gen_features.py',
@@ -152,11 +164,226 @@ def md5(fname):
     return hash_md5.hexdigest()
 
 
+def dir_listing_hash(dirname):
+    return hashlib.md5('\n'.join(sorted(os.listdir(dirname))).encode()).hexdigest()
+
+
+# Persistent cache that avoids launching every generator just to query its inputs and outputs, and
+# avoids re-hashing files that have not been touched since the last run.
+#
+# - File hashes are keyed by path and reused while the file's (mtime, size) stat is unchanged.
+# - A generator's auto_script manifest is reused while the generator script, every input it listed
+#   and the file listing of every directory holding those inputs are unchanged. The directory
+#   listing catches generators that glob their inputs (e.g. shader sources).
+# - Hashless generators that passed --verify-only are not run again until the content of their
+#   script, inputs or outputs changes.
+class ManifestCache:
+
+    def __init__(self, path, enabled=True):
+        self.path = path
+        self.enabled = enabled
+        self.modified = False
+        self.files = {}
+        self.manifests = {}
+        self.verified = {}
+
+        if not enabled or not os.path.isfile(path):
+            return
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except ValueError:
+            print('Ignoring corrupt code generation cache "%s"' % path)
+            return
+        if data.get('version') != CACHE_VERSION:
+            return
+        self.files = data['files']
+        self.manifests = data['manifests']
+        self.verified = data['verified']
+
+    def md5(self, fname):
+        if not self.enabled:
+            return md5(fname)
+
+        st = os.stat(fname)
+        stat_key = [st.st_mtime_ns, st.st_size]
+        entry = self.files.get(fname)
+        if entry and entry['stat'] == stat_key:
+            return entry['md5']
+
+        digest = md5(fname)
+        if time.time() - st.st_mtime > CACHE_RACY_SECONDS:
+            self.files[fname] = {'stat': stat_key, 'md5': digest}
+            self.modified = True
+        elif fname in self.files:
+            del self.files[fname]
+            self.modified = True
+        return digest
+
+    def _optional_md5(self, fname):
+        return self.md5(fname) if os.path.isfile(fname) else None
+
+    def _fingerprint(self, filenames):
+        fingerprint = hashlib.md5()
+        for fname in sorted(set(filenames)):
+            fingerprint.update(('%s:%s\n' % (fname, self._optional_md5(fname))).encode())
+        return fingerprint.hexdigest()
+
+    def _manifest_still_valid(self, script, entry):
+        if entry['script'] != self._optional_md5(script):
+            return False
+        for fname, digest in entry['inputs'].items():
+            if self._optional_md5(fname) != digest:
+                return False
+        for dirname, listing in entry['dirs'].items():
+            if not os.path.isdir(dirname) or dir_listing_hash(dirname) != listing:
+                return False
+        return True
+
+    def get_manifest(self, script):
+        entry = self.manifests.get(script)
+        if not self.enabled or not entry or not self._manifest_still_valid(script, entry):
+            return None
+        return entry['info']
+
+    def set_manifest(self, script, info):
+        if not self.enabled:
+            return
+        dirs = set(os.path.dirname(fname) or '.' for fname in info['inputs'])
+        self.manifests[script] = {
+            'script': self._optional_md5(script),
+            'inputs': {
+                fname: self._optional_md5(fname) for fname in info['inputs']
+            },
+            'dirs': {
+                dirname: dir_listing_hash(dirname) for dirname in dirs if os.path.isdir(dirname)
+            },
+            'info': info,
+        }
+        self.modified = True
+
+    def is_verified(self, script, info):
+        if not self.enabled or script not in self.verified:
+            return False
+        filenames = [script] + info['inputs'] + info['outputs']
+        return self.verified[script] == self._fingerprint(filenames)
+
+    def set_verified(self, script, info):
+        if not self.enabled:
+            return
+        self.verified[script] = self._fingerprint([script] + info['inputs'] + info['outputs'])
+        self.modified = True
+
+    def save(self):
+        if not self.enabled or not self.modified:
+            return
+        data = {
+            'version': CACHE_VERSION,
+            'files': self.files,
+            'manifests': self.manifests,
+            'verified': self.verified,
+        }
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump(data, f, sort_keys=True)
+        os.replace(temp_path, self.path)
+        self.modified = False
+
+
+def cached_auto_script(cache, script):
+    info = cache.get_manifest(script)
+    if info is None:
+        info = auto_script(script)
+        cache.set_manifest(script, info)
+    return info
+
+
+def get_generator_dependencies(infos, scripts):
+    # A generator depends on every other generator that produces one of its inputs.
+    producers = {}
+    for script in scripts:
+        for output in infos[script]['outputs']:
+            producers[output] = script
+    dependencies = {}
+    for script in scripts:
+        dependencies[script] = set(producers[fname]
+                                   for fname in infos[script]['inputs']
+                                   if fname in producers and producers[fname] != script)
+    return dependencies
+
+
+# Runs generators as soon as the generators producing their inputs have finished. is_dirty is only
+# called once all of a generator's dependencies are done so that it sees their fresh outputs.
+def schedule_generators(dependencies, is_dirty, run_generator, executor):
+    pending = dict(dependencies)
+    running = {}
+    done = set()
+    while pending or running:
+        ready = sorted(script for script, deps in pending.items() if deps <= done)
+        for script in ready:
+            del pending[script]
+            if is_dirty(script):
+                running[executor.submit(run_generator, script)] = script
+            else:
+                done.add(script)
+        if running:
+            finished, _ = futures.wait(running, return_when=futures.FIRST_COMPLETED)
+            for future in finished:
+                future.result()
+                done.add(running.pop(future))
+        elif pending and not ready:
+            raise Exception('Dependency cycle between code generators: %s' %
+                            ', '.join(sorted(pending)))
+
+
+def run_generator_subprocess(script):
+    exe = get_executable_name(script)
+    subprocess.check_call([exe, os.path.basename(script)], cwd=get_child_script_dirname(script))
+
+
+def init_in_process_worker():
+    import registry_xml
+    registry_xml.preload_xml_inputs()
+
+
+# Emulates "cd <script dir> && python3 <script>" inside a worker process, so that the generator's
+# imports and the registry XML parsed by init_in_process_worker are reused across generators.
+def run_generator_in_process(script):
+    script_path = os.path.join(root_dir, script)
+    child_dir = os.path.dirname(script_path)
+
+    saved_cwd = os.getcwd()
+    saved_argv = sys.argv
+    saved_path = list(sys.path)
+    saved_modules = set(sys.modules)
+    os.chdir(child_dir)
+    sys.argv = [os.path.basename(script_path)]
+    sys.path.insert(0, child_dir)
+    try:
+        runpy.run_path(sys.argv[0], run_name='__main__')
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            raise Exception('%s failed with exit code %s' % (script, e.code))
+    finally:
+        # The worker outlives the generator, so report its outputs now rather than at exit.
+        autogen_writer = sys.modules.get('autogen_writer')
+        if autogen_writer:
+            autogen_writer.report(script)
+            autogen_writer.reset_stats()
+        os.chdir(saved_cwd)
+        sys.argv = saved_argv
+        sys.path[:] = saved_path
+        # Helper modules of different generators may share names, so don't leak them. Modules
+        # loaded by the worker initializer (e.g. registry_xml) stay to keep their parsed data.
+        for module in set(sys.modules) - saved_modules:
+            del sys.modules[module]
+
+
 def get_hash_file_name(name):
     return name.replace(' ', '_').replace('/', '_') + '.json'
 
 
-def any_hash_dirty(name, filenames, new_hashes, old_hashes):
+def any_hash_dirty(cache, name, filenames, new_hashes, old_hashes):
     found_dirty_hash = False
 
     for fname in filenames:
@@ -164,7 +391,7 @@ def any_hash_dirty(name, filenames, new_hashes, old_hashes):
             print('File not found: "%s". Code gen dirty for %s' % (fname, name))
             found_dirty_hash = True
         else:
-            new_hashes[fname] = md5(fname)
+            new_hashes[fname] = cache.md5(fname)
             if (not fname in old_hashes) or (old_hashes[fname] != new_hashes[fname]):
                 print('Hash for "%s" dirty for %s generator.' % (fname, name))
                 found_dirty_hash = True
@@ -185,12 +412,12 @@ def any_old_hash_missing(all_new_hashes, all_old_hashes):
     return result
 
 
-def update_output_hashes(script, outputs, new_hashes):
+def update_output_hashes(cache, script, outputs, new_hashes):
     for output in outputs:
         if not os.path.isfile(output):
             print('Output is missing from %s: %s' % (script, output))
             sys.exit(1)
-        new_hashes[output] = md5(output)
+        new_hashes[output] = cache.md5(output)
 
 
 def load_hashes():
@@ -208,7 +435,6 @@ def load_hashes():
 def main():
     all_old_hashes = load_hashes()
     all_new_hashes = {}
-    any_dirty = False
 
     parser = argparse.ArgumentParser(description='Generate ANGLE internal code.')
     parser.add_argument(
@@ -219,8 +445,41 @@ def main():
         help='verify hashes are not dirty')
     parser.add_argument(
         '-g', '--generator', action='append', nargs='*', type=str, dest='specified_generators'),
+    parser.add_argument(
+        '--no-cache',
+        dest='use_cache',
+        action='store_false',
+        help='ignore the local manifest and file hash cache and query every generator')
+    parser.add_argument(
+        '--in-process',
+        action='store_true',
+        help='run dirty generators by importing them in a pool of worker processes that share '
+        'pre-parsed registry XML, instead of launching one interpreter per generator')
+    parser.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        default=os.cpu_count(),
+        help='number of generators to run concurrently with --in-process (default: %(default)s)')
+    parser.add_argument(
+        '--report-outputs',
+        action='store_true',
+        help='print the number of outputs each generator wrote or left unchanged')
 
     args = parser.parse_args()
+    if args.report_outputs:
+        # Inherited by the generators, whether they run in subprocesses or in worker processes.
+        os.environ[autogen_writer.REPORT_ENV_VAR] = '1'
+
+    cache = ManifestCache(cache_file, enabled=args.use_cache)
+    try:
+        return run_generators(args, cache, all_old_hashes, all_new_hashes)
+    finally:
+        cache.save()
+
+
+def run_generators(args, cache, all_old_hashes, all_new_hashes):
+    any_dirty = False
 
     ranGenerators = generators
     runningSingleGenerator = False
@@ -232,41 +491,77 @@ def main():
         print("No valid generators specified.")
         return 1
 
-    # Just get 'inputs' and 'outputs' from scripts but this runs the scripts so it's a bit slow
+    # Get 'inputs' and 'outputs' from the cache when possible. Otherwise this runs the scripts so
+    # it's a bit slow.
     infos = {}
-    with futures.ThreadPoolExecutor(max_workers=8) as executor:
-        for _, script in sorted(ranGenerators.items()):
-            infos[script] = executor.submit(auto_script, script)
-
-    for name, script in sorted(ranGenerators.items()):
-        info = infos[script].result()
+    stale_scripts = []
+    for _, script in sorted(ranGenerators.items()):
+        info = cache.get_manifest(script)
+        if info is None:
+            stale_scripts.append(script)
+        else:
+            infos[script] = info
+    if stale_scripts:
+        with futures.ThreadPoolExecutor(max_workers=args.jobs) as executor:
+            stale_infos = {script: executor.submit(auto_script, script) for script in stale_scripts}
+        for script, info in stale_infos.items():
+            infos[script] = info.result()
+            cache.set_manifest(script, infos[script])
+
+    names = {script: name for name, script in ranGenerators.items()}
+
+    def is_dirty(script):
+        nonlocal any_dirty
+        name = names[script]
+        info = infos[script]
         fname = get_hash_file_name(name)
         filenames = info['inputs'] + info['outputs'] + [script]
         new_hashes = {}
         if fname not in all_old_hashes:
             all_old_hashes[fname] = {}
-        if any_hash_dirty(name, filenames, new_hashes, all_old_hashes[fname]):
-            any_dirty = True
-
-            if not args.verify_only:
-                print('Running ' + name + ' code generator')
-
-                exe = get_executable_name(script)
-                subprocess.check_call([exe, os.path.basename(script)],
-                                      cwd=get_child_script_dirname(script))
+        dirty = any_hash_dirty(cache, name, filenames, new_hashes, all_old_hashes[fname])
+        any_dirty = any_dirty or dirty
 
         # Update the hash dictionary.
         all_new_hashes[fname] = new_hashes
 
+        if dirty and not args.verify_only:
+            print('Running ' + name + ' code generator')
+            return True
+        return False
+
+    # Generators whose outputs feed other generators run first. Independent generators run in
+    # parallel with --in-process, and one at a time otherwise.
+    dependencies = get_generator_dependencies(infos, names.keys())
+    if args.in_process:
+        init_in_process_worker()
+        executor = futures.ProcessPoolExecutor(
+            max_workers=args.jobs, initializer=init_in_process_worker)
+        run_generator = run_generator_in_process
+    else:
+        executor = futures.ThreadPoolExecutor(max_workers=1)
+        run_generator = run_generator_subprocess
+    with executor:
+        schedule_generators(dependencies, is_dirty, run_generator, executor)
+
     if not runningSingleGenerator and any_old_hash_missing(all_new_hashes, all_old_hashes):
         any_dirty = True
 
     # Handle hashless_generators separately as these don't have hash maps.
     hashless_generators_dirty = False
     for name, script in sorted(hashless_generators.items()):
+        # A failing auto_script only disables caching; --verify-only below reports the problem.
+        try:
+            info = cached_auto_script(cache, script)
+        except subprocess.CalledProcessError:
+            info = None
+        if info and cache.is_verified(script, info):
+            continue
         cmd = [get_executable_name(script), os.path.basename(script)]
         rc = subprocess.call(cmd + ['--verify-only'], cwd=get_child_script_dirname(script))
-        if rc != 0:
+        if rc == 0 and info:
+            cache.set_verified(script, info)
+        else:
             print(name + ' generator dirty')
             # Don't set any_dirty as we don't need git cl format in this case.
             hashless_generators_dirty = True
@@ -286,9 +581,9 @@ def main():
 
         # Update the output hashes again since they can be formatted.
         for name, script in sorted(ranGenerators.items()):
-            info = auto_script(script)
+            info = cached_auto_script(cache, script)
             fname = get_hash_file_name(name)
-            update_output_hashes(name, info['outputs'], all_new_hashes[fname])
+            update_output_hashes(cache, name, info['outputs'], all_new_hashes[fname])
 
         for fname, new_hashes in all_new_hashes.items():
             hash_fname = os.path.join(hash_dir, fname)
@@ -1760,6 +1760,9 @@ enum class EntryPoint
     WGLUseFontOutlinesW
 };
 
+// Number of values of EntryPoint, including Invalid.
+constexpr int kEntryPointCount = 1743;
+
 const char *GetEntryPointName(EntryPoint ep);
 }  // namespace angle
 #endif  // COMMON_ENTRY_POINTS_ENUM_AUTOGEN_H_
@@ -11,6 +11,9 @@ import json, os, sys
 from collections import namedtuple
 from collections import OrderedDict
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../scripts'))
+import autogen_writer
+
 Enum = namedtuple('Enum', ['name', 'values', 'max_value'])
 EnumValue = namedtuple('EnumValue', ['name', 'gl_name', 'value'])
 
@@ -140,7 +143,7 @@ def write_header(enums, path_prefix, file_name, data_source_name, includes, name
         namespace=namespace,
         api_enum_name=api_enum_name)
 
-    with (open(path_prefix + file_name, 'wt')) as f:
+    with autogen_writer.open_output(path_prefix + file_name, 'wt') as f:
         f.write(header)
 
 
@@ -235,7 +238,7 @@ def write_cpp(enums, path_prefix, file_name, data_source_name, namespace, api_en
         namespace=namespace,
         api_enum_name=api_enum_name)
 
-    with (open(path_prefix + file_name, 'wt')) as f:
+    with autogen_writer.open_output(path_prefix + file_name, 'wt') as f:
         f.write(cpp)
 
 
@@ -243,7 +246,7 @@ def main():
 
     # auto_script parameters.
     if len(sys.argv) > 1:
-        inputs = []
+        inputs = ['../../scripts/autogen_writer.py']
         outputs = []
         for generator in Generators:
             inputs += [generator['json']]
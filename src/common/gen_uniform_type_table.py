@@ -10,6 +10,9 @@
 import os
 import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../scripts'))
+import autogen_writer
+
 all_uniform_types = [
     "GL_NONE", "GL_BOOL", "GL_BOOL_VEC2", "GL_BOOL_VEC3", "GL_BOOL_VEC4", "GL_FLOAT",
     "GL_FLOAT_MAT2", "GL_FLOAT_MAT2x3", "GL_FLOAT_MAT2x4", "GL_FLOAT_MAT3", "GL_FLOAT_MAT3x2",
@@ -292,7 +295,7 @@ def main():
 
     # auto_script parameters.
     if len(sys.argv) > 1:
-        inputs = []
+        inputs = ['../../scripts/autogen_writer.py']
         outputs = ['uniform_type_info_autogen.cpp', 'uniform_type_info_autogen.h']
 
         if sys.argv[1] == 'inputs':
@@ -313,7 +316,7 @@ def main():
     uniform_element_components = ", ".join(
         get_components(uniform_type) for uniform_type in all_uniform_types)
 
-    with open('uniform_type_info_autogen.cpp', 'wt') as out_file:
+    with autogen_writer.open_output('uniform_type_info_autogen.cpp', 'wt') as out_file:
         output_cpp = template_cpp.format(
             script_name=os.path.basename(sys.argv[0]),
             total_count=len(all_uniform_types),
@@ -321,7 +324,7 @@ def main():
             uniform_type_index_cases=uniform_type_index_cases)
         out_file.write(output_cpp)
 
-    with open('uniform_type_info_autogen.h', 'wt') as out_file:
+    with autogen_writer.open_output('uniform_type_info_autogen.h', 'wt') as out_file:
         output_h = template_h.format(
             script_name=os.path.basename(sys.argv[0]),
             total_count=len(all_uniform_types),
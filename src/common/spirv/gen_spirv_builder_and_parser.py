@@ -12,6 +12,9 @@ import json
 import os
 import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../scripts'))
+import autogen_writer
+
 # ANGLE uses instructions from SPIR-V 1.0 mostly, but also OpCopyLogical from SPIR-V 1.4.
 SPIRV_GRAMMAR_FILE = '../../../third_party/spirv-headers/src/include/spirv/unified1/spirv.core.grammar.json'
 
@@ -244,16 +247,20 @@ class Writer:
             'function_list': ''.join(self.instruction_parser_impl)
         }
 
-        with (open(self.path_prefix + SPIRV_BUILDER_FILE + '_autogen.h', 'w')) as f:
+        with autogen_writer.open_output(self.path_prefix + SPIRV_BUILDER_FILE + '_autogen.h',
+                                        'w') as f:
             f.write(HEADER_TEMPLATE.format(**builder_template_args))
 
-        with (open(self.path_prefix + SPIRV_BUILDER_FILE + '_autogen.cpp', 'w')) as f:
+        with autogen_writer.open_output(self.path_prefix + SPIRV_BUILDER_FILE + '_autogen.cpp',
+                                        'w') as f:
             f.write(SOURCE_TEMPLATE.format(**builder_template_args))
 
-        with (open(self.path_prefix + SPIRV_PARSER_FILE + '_autogen.h', 'w')) as f:
+        with autogen_writer.open_output(self.path_prefix + SPIRV_PARSER_FILE + '_autogen.h',
+                                        'w') as f:
             f.write(HEADER_TEMPLATE.format(**parser_template_args))
 
-        with (open(self.path_prefix + SPIRV_PARSER_FILE + '_autogen.cpp', 'w')) as f:
+        with autogen_writer.open_output(self.path_prefix + SPIRV_PARSER_FILE + '_autogen.cpp',
+                                        'w') as f:
             f.write(SOURCE_TEMPLATE.format(**parser_template_args))
 
     def requires_unsupported_capability(self, item):
@@ -569,7 +576,7 @@ def main():
     # auto_script parameters.
     if len(sys.argv) > 1:
         if sys.argv[1] == 'inputs':
-            print(SPIRV_GRAMMAR_FILE)
+            print(','.join([SPIRV_GRAMMAR_FILE, '../../../scripts/autogen_writer.py']))
         elif sys.argv[1] == 'outputs':
             output_files_base = [SPIRV_BUILDER_FILE, SPIRV_PARSER_FILE]
             output_files = [
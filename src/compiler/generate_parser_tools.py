@@ -9,8 +9,14 @@
 
 import os
 import platform
+import shutil
 import subprocess
 import sys
+import tempfile
+
+scripts_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'scripts')
+sys.path.append(scripts_dir)
+import autogen_writer
 
 is_linux = platform.system() == 'Linux'
 is_windows = platform.system() == 'Windows'
@@ -51,7 +57,10 @@ def get_tool_file_sha1s():
     return [f + '.sha1' for f in files]
 
 
-def run_flex(basename):
+# flex and bison run in work_dir, which holds a copy of the inputs, so that their outputs have the
+# same names (and content) as in the source directory. The outputs are then copied to the source
+# directory with autogen_writer, which leaves unchanged outputs untouched.
+def run_flex(basename, work_dir):
     flex = get_tool_path('flex')
     input_file = basename + '.l'
     output_source = basename + '_lex_autogen.cpp'
@@ -62,7 +71,7 @@ def run_flex(basename):
     if is_windows:
         flex_env['M4'] = get_tool_path_platform('m4.exe', 'windows')
 
-    process = subprocess.Popen(flex_args, env=flex_env, cwd=sys.path[0])
+    process = subprocess.Popen(flex_args, env=flex_env, cwd=work_dir)
     process.communicate()
     if process.returncode != 0:
         return process.returncode
@@ -79,7 +88,7 @@ def run_flex(basename):
             ret, num_to_read );
         yyg->yy_n_chars = static_cast<int>(ret);"""
 
-    with open(output_source, 'r') as flex_output:
+    with open(os.path.join(work_dir, output_source), 'r') as flex_output:
         output = flex_output.read()
 
         # If flex's output changes such that this line no longer exists, the patch needs to be
@@ -92,13 +101,12 @@ def run_flex(basename):
     # files.
     patched = patched.replace('\t', '    ')
 
-    with open(output_source, 'w') as flex_output_patched:
-        flex_output_patched.write(patched)
+    autogen_writer.write_if_changed(os.path.join(sys.path[0], output_source), patched)
 
     return 0
 
 
-def run_bison(basename, generate_header):
+def run_bison(basename, generate_header, work_dir):
     bison = get_tool_path('bison')
     input_file = basename + '.y'
     output_header = basename + '_tab_autogen.h'
@@ -114,9 +122,16 @@ def run_bison(basename, generate_header):
     if is_windows:
         bison_env['M4'] = get_tool_path_platform('m4.exe', 'windows')
 
-    process = subprocess.Popen(bison_args, env=bison_env, cwd=sys.path[0])
+    process = subprocess.Popen(bison_args, env=bison_env, cwd=work_dir)
     process.communicate()
-    return process.returncode
+    if process.returncode != 0:
+        return process.returncode
+
+    for output in [output_source] + ([output_header] if generate_header else []):
+        with open(os.path.join(work_dir, output), 'rb') as f:
+            autogen_writer.write_if_changed(os.path.join(sys.path[0], output), f.read(), 'wb')
+
+    return 0
 
 
 def get_input_files(basename):
@@ -140,20 +155,25 @@ def generate_parser(basename, generate_header):
             if current_file.endswith('.pyc'):
                 current_file = current_file[:-1]
             inputs += [current_file]
+            inputs += [os.path.join(scripts_dir, 'autogen_writer.py')]
             print(','.join(inputs))
         if sys.argv[1] == 'outputs':
             print(','.join(get_output_files(basename, generate_header)))
         return 0
 
-    # Call flex and bison to generate the lexer and parser.
-    flex_result = run_flex(basename)
-    if flex_result != 0:
-        print('Failed to run flex. Error %s' % str(flex_result))
-        return 1
+    with tempfile.TemporaryDirectory() as work_dir:
+        for input_file in get_input_files(basename):
+            shutil.copy(input_file, work_dir)
+
+        # Call flex and bison to generate the lexer and parser.
+        flex_result = run_flex(basename, work_dir)
+        if flex_result != 0:
+            print('Failed to run flex. Error %s' % str(flex_result))
+            return 1
 
-    bison_result = run_bison(basename, generate_header)
-    if bison_result != 0:
-        print('Failed to run bison. Error %s' % str(bison_result))
-        return 2
+        bison_result = run_bison(basename, generate_header, work_dir)
+        if bison_result != 0:
+            print('Failed to run bison. Error %s' % str(bison_result))
+            return 2
 
     return 0
@@ -21869,7080 +21869,7080 @@ using Rule = SymbolRule;
 
 // Rules used to initialize the mangled name array.
 constexpr SymbolRule kRules[] = {
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&radians_00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&radians_10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&radians_20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&radians_30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&degrees_00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&degrees_10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&degrees_20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&degrees_30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&sin_00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&sin_10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&sin_20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&sin_30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01O00D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicExchangeExt_01O00D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01U00D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicAndExt_01U00D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01P10D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicAddExt_01P10D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGradOffset_00J20B20B20B20D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01T10D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicAndExt_01T10D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&texture_00K20B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01Y20D00E00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicCompSwapExt_01Y20D00E00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitCount_10D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01d20D00E00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicCompSwapExt_01d20D00E00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicAdd_00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(EXT_YUV_target)>(&yuv_2_rgb_20B00H),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&dFdx_00B),
+    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(OES_standard_derivatives)>(&dFdxExt_00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&intBitsToFloat_30D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01T10D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicExchangeExt_01T10D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&length_00B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&greaterThan_30B30B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00L20B00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01b10D00D00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicCompSwapExt_01b10D00D00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&TableBase::m_gl_MaxVertexOutputVectors),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&uintBitsToFloat_30E),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&texture_00a20B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01W20D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicExchangeExt_01W20D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_EGL_image_external_essl3)>(
+        &textureProj_00M30B00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&floatBitsToUint_20B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&findMSB_30E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&notFunc_10F),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&max_20E00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&fract_30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01I10D00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicExchangeExt_01I10D00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&mix_30B30B30F),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(OES_EGL_image_external_essl3)>(
+        &textureProj_00M30B),
+    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(OES_texture_3D)>(&texture3D_00J20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01W20D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicMaxExt_01W20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&texture_00l30B00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
+        &textureExt_00l30B00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
+        &textureExt_00l30B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01V10D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicAddExt_01V10D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&equal_30B30B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProj_00X30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01C20D00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicExchangeExt_01C20D00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01c20D00D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicAddExt_01c20D00D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_00z10D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicMaxExt_00z10D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&sign_30D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLod_00J20B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01F10D00D00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicExchangeExt_01F10D00D00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ANGLE_shader_pixel_local_storage)>(
+        &pixelLocalLoadANGLE_01g),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01c20D00D00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicCompSwapExt_01c20D00D00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&matrixCompMult_90B90B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGradOffset_00S20B20B20B20D),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProjOffset_00Y30B20D00B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&lessThanEqual_30B30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01X20D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicAndExt_01X20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01W20D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicMaxExt_01W20D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&equal_10E10E),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProj_00J30B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&texture_00s30B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
+        &textureExt_00s30B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
+        &textureExt_00s30B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLod_00Y20B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01a10D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicMaxExt_01a10D00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&TableBase::m_gl_MaxCombinedTextureImageUnits),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ARB_texture_rectangle)>(&textureProj_00O30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01Z00D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicExchangeExt_01Z00D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01J00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicAndExt_01J00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureSize_00R00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&max_10E00E),
+    Rule::Get<Spec::ESSL, 320, Shader::TESS_CONTROL_EXT, 0>(
+        &TableBase::m_gl_BoundingBoxOESTCSES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(EXT_tessellation_shader)>(
+        &TableBase::m_gl_BoundingBoxOESTCS),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(OES_tessellation_shader)>(
+        &TableBase::m_gl_BoundingBoxOESTCS),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01J00D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicAddExt_01J00D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00d10B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01I10D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicAndExt_01I10D00D),
+    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, 0>(&BuiltInVariable::kgl_FragCoord),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&BuiltInVariable::kgl_FragCoord300),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageLoad_00z10D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01K10D00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicCompSwapExt_01K10D00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitCount_30D),
+    Rule::Get<Spec::ESSL, 300, Shader::NOT_COMPUTE, EXT_INDEX(EXT_clip_cull_distance)>(
+        &TableBase::m_gl_CullDistance),
+    Rule::Get<Spec::ESSL, 300, Shader::NOT_COMPUTE, EXT_INDEX(ANGLE_clip_cull_distance)>(
+        &TableBase::m_gl_CullDistance),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01I10D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicMaxExt_01I10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_00z10D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicXorExt_00z10D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGrad_00I20B10B10B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&mod_20B20B),
     Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&cos_00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&cos_10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&cos_20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&cos_30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&tan_00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&tan_10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&tan_20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&tan_30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&asin_00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&asin_10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&asin_20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&asin_30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&acos_00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&acos_10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&acos_20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&acos_30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&atan_00B00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&atan_10B10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&atan_20B20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&atan_30B30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&atan_00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&atan_10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&atan_20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&atan_30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&sinh_00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01Q10D00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicXorExt_01Q10D00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00e20B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&findLSB_30D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&findLSB_10E),
+    Rule::Get<Spec::ESSL, 0, Shader::FRAGMENT, 0>(&BuiltInVariable::kgl_FrontFacing),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitCount_00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&min_30E30E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGatherOffset_00L20B10D),
+    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::ALL, 0>(&subpassLoad_01o00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureSize_00w),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_buffer)>(&textureSizeExt_00w),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_buffer)>(&textureSizeExt_00w),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&min_10B00B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&TableBase::m_gl_MaxDrawBuffers),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&TableBase::m_gl_MaxGeometryAtomicCountersES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_geometry_shader)>(
+        &TableBase::m_gl_MaxGeometryAtomicCounters),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_geometry_shader)>(
+        &TableBase::m_gl_MaxGeometryAtomicCounters),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01D00D00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicExchangeExt_01D00D00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetch_00a20D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&step_20B20B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&greaterThanEqual_20E20E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01G20D00D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicAddExt_01G20D00D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&umulExtended_00E00E00E00E),
     Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&sinh_10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&sinh_20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&sinh_30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&cosh_00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&cosh_10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&cosh_20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&cosh_30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&tanh_00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&tanh_10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&tanh_20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&tanh_30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&asinh_00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&asinh_10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&asinh_20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&asinh_30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&acosh_00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&acosh_10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&acosh_20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&acosh_30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&atanh_00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&atanh_10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&atanh_20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&atanh_30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&pow_00B00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&pow_10B10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&pow_20B20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&pow_30B30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&exp_00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&exp_10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&exp_20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&exp_30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&log_00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&log_10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&log_20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&log_30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&exp2_00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&exp2_10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&exp2_20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&exp2_30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&log2_00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&log2_10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&log2_20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&log2_30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&sqrt_00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&sqrt_10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&sqrt_20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&sqrt_30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&inversesqrt_00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&inversesqrt_10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&inversesqrt_20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&inversesqrt_30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&abs_00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&intBitsToFloat_20D),
     Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&abs_10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&abs_20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&abs_30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&abs_00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&abs_10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&abs_20D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&abs_30D),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&sign_00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&sign_10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&sign_20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&sign_30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&sign_00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&sign_10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&sign_20D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&sign_30D),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&floor_00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&floor_10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&floor_20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&floor_30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&trunc_00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&trunc_10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&trunc_20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&trunc_30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&round_00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&round_10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&round_20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&round_30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&roundEven_00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&roundEven_10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&roundEven_20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&roundEven_30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&ceil_00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&ceil_10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&ceil_20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&ceil_30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&fract_00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&fract_10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&fract_20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&fract_30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&mod_00B00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&mod_10B00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&mod_20B00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&mod_30B00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&mod_10B10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&mod_20B20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&mod_30B30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&min_00B00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&min_10B00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&min_20B00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&min_30B00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&min_10B10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&min_20B20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&min_30B30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&min_00D00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&min_10D10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&min_20D20D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&min_30D30D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&min_10D00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&min_20D00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&min_30D00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&min_00E00E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&min_10E10E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&min_20E20E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&min_30E30E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&min_10E00E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&min_20E00E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&min_30E00E),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&max_00B00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&max_10B00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&max_20B00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&max_30B00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&max_10B10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&max_20B20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&max_30B30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&max_00D00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&max_10D10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&max_20D20D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&max_30D30D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&max_10D00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&max_20D00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&max_30D00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&max_00E00E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&max_10E10E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&max_20E20E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&max_30E30E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&max_10E00E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&max_20E00E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&max_30E00E),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&clamp_00B00B00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&clamp_10B00B00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&clamp_20B00B00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&clamp_30B00B00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&clamp_10B10B10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&clamp_20B20B20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&clamp_30B30B30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&clamp_00D00D00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&clamp_10D00D00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&clamp_20D00D00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&clamp_30D00D00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&clamp_10D10D10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&clamp_20D20D20D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&clamp_30D30D30D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&clamp_00E00E00E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&clamp_10E00E00E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&clamp_20E00E00E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&clamp_30E00E00E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&clamp_10E10E10E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&clamp_20E20E20E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&clamp_30E30E30E),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&mix_00B00B00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&mix_10B10B00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&mix_20B20B00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&mix_30B30B00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&mix_10B10B10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&mix_20B20B20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&mix_30B30B30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&mix_00B00B00F),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&mix_10B10B10F),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&mix_20B20B20F),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&mix_30B30B30F),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&mix_00D00D00F),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&mix_10D10D10F),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&mix_20D20D20F),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&mix_30D30D30F),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&mix_00E00E00F),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&mix_10E10E10F),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&mix_20E20E20F),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&mix_30E30E30F),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&mix_00F00F00F),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&mix_10F10F10F),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&mix_20F20F20F),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&mix_30F30F30F),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&step_00B00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&step_10B10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&step_20B20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&step_30B30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&step_00B10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&step_00B20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&step_00B30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&smoothstep_00B00B00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&smoothstep_10B10B10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&smoothstep_20B20B20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&smoothstep_30B30B30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&smoothstep_00B00B10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&smoothstep_00B00B20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&smoothstep_00B00B30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&modf_00B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&modf_10B10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&modf_20B20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&modf_30B30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&isnan_00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&isnan_10B),
     Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&isnan_20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&isnan_30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&isinf_00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&isinf_10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&isinf_20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&isinf_30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&floatBitsToInt_00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&floatBitsToInt_10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&floatBitsToInt_20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&floatBitsToInt_30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&floatBitsToUint_00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&floatBitsToUint_10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&floatBitsToUint_20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&floatBitsToUint_30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&intBitsToFloat_00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&intBitsToFloat_10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&intBitsToFloat_20D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&intBitsToFloat_30D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&uintBitsToFloat_00E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&uintBitsToFloat_10E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&uintBitsToFloat_20E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&uintBitsToFloat_30E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&fma_00B00B00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_gpu_shader5)>(&fmaExt_00B00B00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_gpu_shader5)>(&fmaExt_00B00B00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&fma_10B10B10B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_gpu_shader5)>(&fmaExt_10B10B10B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_gpu_shader5)>(&fmaExt_10B10B10B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&fma_20B20B20B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_gpu_shader5)>(&fmaExt_20B20B20B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_gpu_shader5)>(&fmaExt_20B20B20B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&fma_30B30B30B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_gpu_shader5)>(&fmaExt_30B30B30B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_gpu_shader5)>(&fmaExt_30B30B30B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&frexp_00B00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&frexp_10B10D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&frexp_20B20D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&frexp_30B30D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&ldexp_00B00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&ldexp_10B10D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&ldexp_20B20D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&ldexp_30B30D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&packSnorm2x16_10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&packHalf2x16_10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&unpackSnorm2x16_00E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&unpackHalf2x16_00E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&packUnorm2x16_10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&unpackUnorm2x16_00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&packUnorm4x8_30B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&packSnorm4x8_30B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&unpackUnorm4x8_00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&unpackSnorm4x8_00E),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&length_00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&length_10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&length_20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&length_30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&distance_00B00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&distance_10B10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&distance_20B20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&distance_30B30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&dot_00B00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&dot_10B10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&dot_20B20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&dot_30B30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&cross_20B20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&normalize_00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&normalize_10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&normalize_20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&normalize_30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&faceforward_00B00B00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&faceforward_10B10B10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&faceforward_20B20B20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&faceforward_30B30B30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&reflect_00B00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&reflect_10B10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&reflect_20B20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&reflect_30B30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&refract_00B00B00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&refract_10B10B00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&refract_20B20B00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&refract_30B30B00B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&matrixCompMult_50B50B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&matrixCompMult_A0BA0B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&matrixCompMult_F0BF0B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&matrixCompMult_90B90B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&matrixCompMult_60B60B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&matrixCompMult_D0BD0B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&mix_00B00B00F),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00X10B00D),
+    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(ARB_texture_rectangle)>(
+        &texture2DRectProj_00O20B),
     Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&matrixCompMult_70B70B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&matrixCompMult_E0BE0B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&matrixCompMult_B0BB0B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&outerProduct_10B10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&outerProduct_20B20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&outerProduct_30B30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&outerProduct_20B10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&outerProduct_10B20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&outerProduct_30B10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&outerProduct_10B30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&outerProduct_30B20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&outerProduct_20B30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&transpose_50B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00e20B00B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&acos_30B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&texelFetch_00V10D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ANGLE_texture_multisample)>(
+        &texelFetchExt_00V10D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01D00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicOrExt_01D00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicXor_00E00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureSize_00Y00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(
+        &TableBase::m_gl_MaxGeometryAtomicCounterBuffersES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_geometry_shader)>(
+        &TableBase::m_gl_MaxGeometryAtomicCounterBuffers),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_geometry_shader)>(
+        &TableBase::m_gl_MaxGeometryAtomicCounterBuffers),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&lessThanEqual_30E30E),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureOffset_00d20B10D00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01L20D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicAddExt_01L20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01e10D00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicCompSwapExt_01e10D00D00D),
+    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::ALL, 0>(&subpassLoad_01k),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01E10D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicXorExt_01E10D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01U00D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicMinExt_01U00D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&TableBase::m_gl_MaxTessPatchComponentsES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
+        &TableBase::m_gl_MaxTessPatchComponents),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
+        &TableBase::m_gl_MaxTessPatchComponents),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&abs_30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01W20D00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicExchangeExt_01W20D00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProj_00S30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01B20D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicXorExt_01B20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01B20D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicExchangeExt_01B20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01A20D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicMinExt_01A20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01E10D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicOrExt_01E10D00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&smoothstep_00B00B30B),
+    Rule::Get<Spec::ESSL, 0, Shader::VERTEX, 0>(&BuiltInVariable::kgl_Position),
+    Rule::Get<Spec::ESSL, 320, Shader::GEOMETRY_EXT, 0>(&TableBase::m_gl_PositionGSES3_2),
+    Rule::Get<Spec::ESSL, 320, Shader::TESS_CONTROL_EXT, 0>(&TableBase::m_gl_PositionTCSES3_2),
+    Rule::Get<Spec::ESSL, 320, Shader::TESS_EVALUATION_EXT, 0>(&TableBase::m_gl_PositionTESES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY_EXT, EXT_INDEX(EXT_geometry_shader)>(
+        &TableBase::m_gl_PositionGS),
+    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY_EXT, EXT_INDEX(OES_geometry_shader)>(
+        &TableBase::m_gl_PositionGS),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(EXT_tessellation_shader)>(
+        &TableBase::m_gl_PositionTCS),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(OES_tessellation_shader)>(
+        &TableBase::m_gl_PositionTCS),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_EVALUATION_EXT, EXT_INDEX(EXT_tessellation_shader)>(
+        &TableBase::m_gl_PositionTES),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_EVALUATION_EXT, EXT_INDEX(OES_tessellation_shader)>(
+        &TableBase::m_gl_PositionTES),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01H20D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicOrExt_01H20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01O00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicMaxExt_01O00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01Z00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicAndExt_01Z00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01e10D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicAddExt_01e10D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLod_00I10B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_00z10D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicOrExt_00z10D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texture_00Z20B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&log_10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01b10D00D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicMaxExt_01b10D00D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01B20D00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicCompSwapExt_01B20D00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLod_00d20B00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureOffset_00U20B10D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01N20D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicXorExt_01N20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01c20D00D00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicExchangeExt_01c20D00D00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&clamp_20D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::TESS_CONTROL_EXT, 0>(&TableBase::m_gl_outTCSES3_2),
+    Rule::Get<Spec::ESSL, 320, Shader::TESS_EVALUATION_EXT, 0>(&TableBase::m_gl_outTESES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(EXT_tessellation_shader)>(
+        &TableBase::m_gl_outTCS),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(OES_tessellation_shader)>(
+        &TableBase::m_gl_outTCS),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_EVALUATION_EXT, EXT_INDEX(EXT_tessellation_shader)>(
+        &TableBase::m_gl_outTES),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_EVALUATION_EXT, EXT_INDEX(OES_tessellation_shader)>(
+        &TableBase::m_gl_outTES),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01K10D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicOrExt_01K10D00E),
+    Rule::Get<Spec::ESSL,
+              0,
+              Shader::VERTEX,
+              EXT_INDEX(ANGLE_base_vertex_base_instance_shader_builtin)>(
+        &BuiltInVariable::kangle_BaseInstance),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00X10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01T10D00E00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicCompSwapExt_01T10D00E00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01S20D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicAddExt_01S20D00D),
+    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(EXT_shader_texture_lod)>(
+        &textureCubeGradEXT_00K20B20B20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01N20D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicMinExt_01N20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01W20D00E00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicCompSwapExt_01W20D00E00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGrad_00S20B20B20B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&max_30D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01J00D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicMinExt_01J00D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01K10D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicMinExt_01K10D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&mix_10B10B10F),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_00z10D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicAddExt_00z10D00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&cos_20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01P10D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicExchangeExt_01P10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01f00D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicMaxExt_01f00D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&texelFetch_00j00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_buffer)>(&texelFetchExt_00j00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_buffer)>(&texelFetchExt_00j00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&tanh_30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01f00D00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicExchangeExt_01f00D00B),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&dFdy_30B),
+    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(OES_standard_derivatives)>(&dFdyExt_30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01I10D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicMinExt_01I10D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_EGL_image_external_essl3)>(
+        &textureProj_00M20B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01G20D00D00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicExchangeExt_01G20D00D00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&memoryBarrier_),
+    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, 0>(&TableBase::m_gl_FragData),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureSize_00Z00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&fma_30B30B30B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_gpu_shader5)>(&fmaExt_30B30B30B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_gpu_shader5)>(&fmaExt_30B30B30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01C20D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicAddExt_01C20D00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&normalize_20B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&floatBitsToUint_00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGather_00s30B00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
+        &textureGatherExt_00s30B00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
+        &textureGatherExt_00s30B00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&frexp_10B10D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&usubBorrow_20E20E20E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGather_00k30B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
+        &textureGatherExt_00k30B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
+        &textureGatherExt_00k30B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&notEqual_20F20F),
+    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&interpolateAtOffset_10B10B),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_shader_multisample_interpolation)>(
+        &interpolateAtOffsetExt_10B10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01X20D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicMinExt_01X20D00D),
     Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&transpose_A0B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&transpose_F0B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&transpose_60B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&transpose_90B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&transpose_70B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&transpose_D0B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&transpose_B0B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&transpose_E0B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&determinant_50B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&determinant_A0B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&determinant_F0B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&inverse_50B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&inverse_A0B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&inverse_F0B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&lessThan_10B10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&lessThan_20B20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&lessThan_30B30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&lessThan_10D10D),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&lessThan_20D20D),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&lessThan_30D30D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&lessThan_10E10E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&lessThan_20E20E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&lessThan_30E30E),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&lessThanEqual_10B10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&lessThanEqual_20B20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&lessThanEqual_30B30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&lessThanEqual_10D10D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&clamp_10B00B00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGrad_00d30B10B10B),
     Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&lessThanEqual_20D20D),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&lessThanEqual_30D30D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&lessThanEqual_10E10E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&lessThanEqual_20E20E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&lessThanEqual_30E30E),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&greaterThan_10B10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&greaterThan_20B20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&greaterThan_30B30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&greaterThan_10D10D),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&greaterThan_20D20D),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&greaterThan_30D30D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&greaterThan_10E10E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&greaterThan_20E20E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&greaterThan_30E30E),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&greaterThanEqual_10B10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&greaterThanEqual_20B20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&greaterThanEqual_30B30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&greaterThanEqual_10D10D),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&greaterThanEqual_20D20D),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&greaterThanEqual_30D30D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&greaterThanEqual_10E10E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&greaterThanEqual_20E20E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&greaterThanEqual_30E30E),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&equal_10B10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&equal_20B20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&equal_30B30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&equal_10D10D),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&equal_20D20D),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&equal_30D30D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&equal_10E10E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&equal_20E20E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&equal_30E30E),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&equal_10F10F),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&TableBase::m_gl_MaxTessGenLevelES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
+        &TableBase::m_gl_MaxTessGenLevel),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
+        &TableBase::m_gl_MaxTessGenLevel),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01Z00D00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicExchangeExt_01Z00D00B),
+    Rule::Get<Spec::ESSL, 320, Shader::TESS_CONTROL_EXT, 0>(
+        &TableBase::m_gl_BoundingBoxEXTTCSES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(EXT_tessellation_shader)>(
+        &TableBase::m_gl_BoundingBoxEXTTCS),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(OES_tessellation_shader)>(
+        &TableBase::m_gl_BoundingBoxEXTTCS),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&min_30D00D),
     Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&equal_20F20F),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&equal_30F30F),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&notEqual_10B10B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&notEqual_20B20B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&notEqual_30B30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&notEqual_10D10D),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&notEqual_20D20D),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&notEqual_30D30D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&notEqual_10E10E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&notEqual_20E20E),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&notEqual_30E30E),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&notEqual_10F10F),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&notEqual_20F20F),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&notEqual_30F30F),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&any_10F),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&any_20F),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&any_30F),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&all_10F),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&all_20F),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&all_30F),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&notFunc_10F),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&notFunc_20F),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&notFunc_30F),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldExtract_00D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldExtract_10D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldExtract_20D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldExtract_30D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldExtract_00E00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldExtract_10E00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldExtract_20E00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldExtract_30E00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldInsert_00D00D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldInsert_10D10D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldInsert_20D20D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldInsert_30D30D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldInsert_00E00E00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldInsert_10E10E00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldInsert_20E20E00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldInsert_30E30E00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldReverse_00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldReverse_10D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldReverse_20D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldReverse_30D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldReverse_00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldReverse_10E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldReverse_20E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldReverse_30E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitCount_00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitCount_10D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitCount_20D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitCount_30D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitCount_00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitCount_10E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitCount_20E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitCount_30E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&findLSB_00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&findLSB_10D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&findLSB_20D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&findLSB_30D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&findLSB_00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&findLSB_10E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&findLSB_20E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&findLSB_30E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&findMSB_00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&findMSB_10D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&findMSB_20D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&findMSB_30D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&findMSB_00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&findMSB_10E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&findMSB_20E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&findMSB_30E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&uaddCarry_00E00E00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&uaddCarry_10E10E10E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&uaddCarry_20E20E20E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&uaddCarry_30E30E30E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&usubBorrow_00E00E00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&usubBorrow_10E10E10E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&usubBorrow_20E20E20E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&usubBorrow_30E30E30E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&umulExtended_00E00E00E00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&umulExtended_10E10E10E10E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&umulExtended_20E20E20E20E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&umulExtended_30E30E30E30E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imulExtended_00D00D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imulExtended_10D10D10D10D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imulExtended_20D20D20D20D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imulExtended_30D30D30D30D),
-    Rule::Get<Spec::ESSL, 100, Shader::ALL, 0>(&texture2D_00I10B),
-    Rule::Get<Spec::ESSL, 100, Shader::ALL, 0>(&texture2DProj_00I20B),
-    Rule::Get<Spec::ESSL, 100, Shader::ALL, 0>(&texture2DProj_00I30B),
-    Rule::Get<Spec::ESSL, 100, Shader::ALL, 0>(&textureCube_00K20B),
-    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(OES_texture_3D)>(&texture3D_00J20B),
-    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(OES_texture_3D)>(&texture3DProj_00J30B),
-    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(EXT_shadow_samplers)>(&shadow2DEXT_00d20B),
-    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(EXT_shadow_samplers)>(
-        &shadow2DProjEXT_00d30B),
-    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(OES_EGL_image_external)>(&texture2D_00M10B),
-    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(NV_EGL_stream_consumer_external)>(
-        &texture2D_00M10B),
-    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(OES_EGL_image_external)>(
-        &texture2DProj_00M20B),
-    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(NV_EGL_stream_consumer_external)>(
-        &texture2DProj_00M20B),
-    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(OES_EGL_image_external)>(
-        &texture2DProj_00M30B),
-    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(NV_EGL_stream_consumer_external)>(
-        &texture2DProj_00M30B),
-    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(ARB_texture_rectangle)>(
-        &texture2DRect_00O10B),
-    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(ARB_texture_rectangle)>(
-        &texture2DRectProj_00O20B),
-    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(ARB_texture_rectangle)>(
-        &texture2DRectProj_00O30B),
-    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(EXT_shader_texture_lod)>(
-        &texture2DGradEXT_00I10B10B10B),
-    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(EXT_shader_texture_lod)>(
-        &texture2DProjGradEXT_00I20B10B10B),
-    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(EXT_shader_texture_lod)>(
-        &texture2DProjGradEXT_00I30B10B10B),
-    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(EXT_shader_texture_lod)>(
-        &textureCubeGradEXT_00K20B20B20B),
-    Rule::Get<Spec::ESSL, 100, Shader::ALL, 0>(&textureVideoWEBGL_00y10B),
-    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, 0>(&texture2D_00I10B00B),
-    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, 0>(&texture2DProj_00I20B00B),
-    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, 0>(&texture2DProj_00I30B00B),
-    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, 0>(&textureCube_00K20B00B),
-    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(OES_texture_3D)>(&texture3D_00J20B00B),
-    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(OES_texture_3D)>(
-        &texture3DProj_00J30B00B),
-    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(OES_texture_3D)>(&texture3DLod_00J20B00B),
-    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(OES_texture_3D)>(&texture3DProjLod_00J30B00B),
-    Rule::Get<Spec::ESSL, 100, Shader::VERTEX, 0>(&texture2DLod_00I10B00B),
-    Rule::Get<Spec::ESSL, 100, Shader::VERTEX, 0>(&texture2DProjLod_00I20B00B),
-    Rule::Get<Spec::ESSL, 100, Shader::VERTEX, 0>(&texture2DProjLod_00I30B00B),
-    Rule::Get<Spec::ESSL, 100, Shader::VERTEX, 0>(&textureCubeLod_00K20B00B),
-    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(EXT_shader_texture_lod)>(
-        &texture2DLodEXT_00I10B00B),
-    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(EXT_shader_texture_lod)>(
-        &texture2DProjLodEXT_00I20B00B),
-    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(EXT_shader_texture_lod)>(
-        &texture2DProjLodEXT_00I30B00B),
-    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(EXT_shader_texture_lod)>(
-        &textureCubeLodEXT_00K20B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texture_00I10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texture_00R10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texture_00X10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texture_00J20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texture_00S20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texture_00Y20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texture_00K20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texture_00T20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texture_00Z20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texture_00L20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texture_00U20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texture_00a20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texture_00d20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texture_00e30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texture_00f30B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&texture_00k30B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
-        &textureExt_00k30B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
-        &textureExt_00k30B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&texture_00s30B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
-        &textureExt_00s30B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
-        &textureExt_00s30B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&texture_00x30B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
-        &textureExt_00x30B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
-        &textureExt_00x30B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&texture_00l30B00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&clamp_20E00E00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&radians_30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01I10D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicOrExt_01I10D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetch_00U20D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&dFdy_20B),
+    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(OES_standard_derivatives)>(&dFdyExt_20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01Q10D00D00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicCompSwapExt_01Q10D00D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01X20D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicAndExt_01X20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01K10D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicMaxExt_01K10D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjOffset_00J30B20D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00Z20B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&max_10B00B),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&fwidth_30B),
+    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(OES_standard_derivatives)>(
+        &fwidthExt_30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGather_00x30B),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
-        &textureExt_00l30B00B),
+        &textureGatherExt_00x30B),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
-        &textureExt_00l30B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(OES_EGL_image_external_essl3)>(
-        &texture_00M10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(EXT_YUV_target)>(&texture_00N10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ARB_texture_rectangle)>(&texture_00O10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texture_00y10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProj_00I20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProj_00R20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProj_00X20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProj_00I30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProj_00R30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProj_00X30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProj_00J30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProj_00S30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProj_00Y30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProj_00d30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(OES_EGL_image_external_essl3)>(
-        &textureProj_00M20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(OES_EGL_image_external_essl3)>(
-        &textureProj_00M30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(EXT_YUV_target)>(&textureProj_00N20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(EXT_YUV_target)>(&textureProj_00N30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ARB_texture_rectangle)>(&textureProj_00O20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ARB_texture_rectangle)>(&textureProj_00O30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLod_00I10B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLod_00R10B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLod_00X10B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLod_00J20B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLod_00S20B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLod_00Y20B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLod_00K20B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLod_00T20B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLod_00Z20B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLod_00L20B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLod_00U20B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLod_00a20B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLod_00d20B00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureLod_00k30B00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
-        &textureLodExt_00k30B00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
-        &textureLodExt_00k30B00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureLod_00s30B00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
-        &textureLodExt_00s30B00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
-        &textureLodExt_00s30B00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureLod_00x30B00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
-        &textureLodExt_00x30B00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
-        &textureLodExt_00x30B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureSize_00I00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureSize_00R00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureSize_00X00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureSize_00J00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureSize_00S00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureSize_00Y00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureSize_00K00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureSize_00T00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureSize_00Z00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureSize_00L00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureSize_00U00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureSize_00a00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureSize_00d00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureSize_00e00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureSize_00f00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureSize_00k00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
-        &textureSizeExt_00k00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
-        &textureSizeExt_00k00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureSize_00s00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
-        &textureSizeExt_00s00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
-        &textureSizeExt_00s00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureSize_00x00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
-        &textureSizeExt_00x00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
-        &textureSizeExt_00x00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureSize_00l00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
-        &textureSizeExt_00l00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
-        &textureSizeExt_00l00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureSize_00j),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_buffer)>(&textureSizeExt_00j),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_buffer)>(&textureSizeExt_00j),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureSize_00r),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_buffer)>(&textureSizeExt_00r),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_buffer)>(&textureSizeExt_00r),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureSize_00w),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_buffer)>(&textureSizeExt_00w),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_buffer)>(&textureSizeExt_00w),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureSize_00P),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ANGLE_texture_multisample)>(
-        &textureSizeExt_00P),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureSize_00V),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ANGLE_texture_multisample)>(
-        &textureSizeExt_00V),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureSize_00b),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ANGLE_texture_multisample)>(
-        &textureSizeExt_00b),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureSize_00Q),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_storage_multisample_2d_array)>(
-        &textureSizeExt_00Q),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureSize_00W),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_storage_multisample_2d_array)>(
-        &textureSizeExt_00W),
+        &textureGatherExt_00x30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01M20D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicXorExt_01M20D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::COMPUTE, 0>(&BuiltInVariable::kgl_LocalInvocationID),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01Y20D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicOrExt_01Y20D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imulExtended_10D10D10D10D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01I10D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicXorExt_01I10D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&memoryBarrierImage_),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&transpose_60B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01U00D00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicCompSwapExt_01U00D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGatherOffsets_00L20B10Dx4),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_gpu_shader5)>(
+        &textureGatherOffsetsExt_00L20B10Dx4),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_gpu_shader5)>(
+        &textureGatherOffsetsExt_00L20B10Dx4),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&acosh_30B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldReverse_20E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&modf_10B10B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&clamp_20D20D20D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01d20D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicMaxExt_01d20D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&fract_10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01S20D00E00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicCompSwapExt_01S20D00E00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01f00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicOrExt_01f00D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&any_10F),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&mix_10E10E10F),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureOffset_00S20B20D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01I10D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicExchangeExt_01I10D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&atanh_10B),
     Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureSize_00c),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_storage_multisample_2d_array)>(
         &textureSizeExt_00c),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(OES_EGL_image_external_essl3)>(
-        &textureSize_00M00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(EXT_YUV_target)>(&textureSize_00N00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLod_00I20B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLod_00R20B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLod_00X20B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLod_00I30B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLod_00R30B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLod_00X30B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLod_00J30B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLod_00S30B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLod_00Y30B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLod_00d30B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetch_00I10D00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetch_00R10D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01L20D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicAndExt_01L20D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texture_00a20B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&packHalf2x16_10B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&uaddCarry_30E30E30E),
     Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetch_00X10D00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetch_00J20D00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetch_00S20D00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetch_00Y20D00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetch_00L20D00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetch_00U20D00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetch_00a20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&texelFetch_00j00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_buffer)>(&texelFetchExt_00j00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_buffer)>(&texelFetchExt_00j00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&texelFetch_00r00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_buffer)>(&texelFetchExt_00r00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_buffer)>(&texelFetchExt_00r00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&texelFetch_00w00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_buffer)>(&texelFetchExt_00w00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_buffer)>(&texelFetchExt_00w00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&texelFetch_00P10D00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ANGLE_texture_multisample)>(
-        &texelFetchExt_00P10D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&texelFetch_00V10D00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ANGLE_texture_multisample)>(
-        &texelFetchExt_00V10D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&texelFetch_00b10D00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ANGLE_texture_multisample)>(
-        &texelFetchExt_00b10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&texelFetch_00Q20D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_storage_multisample_2d_array)>(
-        &texelFetchExt_00Q20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&texelFetch_00W20D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_storage_multisample_2d_array)>(
-        &texelFetchExt_00W20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&texelFetch_00c20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureSize_00Q),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_storage_multisample_2d_array)>(
-        &texelFetchExt_00c20D00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(OES_EGL_image_external_essl3)>(
-        &texelFetch_00M10D00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(EXT_YUV_target)>(&texelFetch_00N10D00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGrad_00I10B10B10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGrad_00R10B10B10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGrad_00X10B10B10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGrad_00J20B20B20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGrad_00S20B20B20B),
+        &textureSizeExt_00Q),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01W20D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicAddExt_01W20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01P10D00E00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicCompSwapExt_01P10D00E00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00K20B00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01V10D00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicExchangeExt_01V10D00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01f00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicXorExt_01f00D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&greaterThan_10B10B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageSize_01N),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01N20D00E00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicCompSwapExt_01N20D00E00E),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_EVALUATION_EXT, 0>(&BuiltInVariable::kgl_TessCoord),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01f00D00E00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicCompSwapExt_01f00D00E00E),
     Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGrad_00Y20B20B20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGrad_00K20B20B20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGrad_00T20B20B20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGrad_00Z20B20B20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGrad_00d20B10B10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGrad_00e30B20B20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGrad_00L20B10B10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGrad_00U20B10B10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGrad_00a20B10B10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGrad_00f30B10B10B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGrad_00k30B20B20B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
-        &textureGradExt_00k30B20B20B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
-        &textureGradExt_00k30B20B20B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGrad_00s30B20B20B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&degrees_10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageLoad_01d20D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
-        &textureGradExt_00s30B20B20B),
+        &imageLoadExt_01d20D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
-        &textureGradExt_00s30B20B20B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGrad_00x30B20B20B),
+        &imageLoadExt_01d20D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, EXT_INDEX(APPLE_clip_distance)>(
+        &TableBase::m_gl_MaxClipDistancesAPPLE),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(EXT_clip_cull_distance)>(
+        &TableBase::m_gl_MaxClipDistances),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ANGLE_clip_cull_distance)>(
+        &TableBase::m_gl_MaxClipDistances),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&mix_00F00F00F),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01E10D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicMinExt_01E10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&texture_00x30B),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
-        &textureGradExt_00x30B20B20B),
+        &textureExt_00x30B),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
-        &textureGradExt_00x30B20B20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGrad_00I20B10B10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGrad_00R20B10B10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGrad_00X20B10B10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGrad_00I30B10B10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGrad_00R30B10B10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGrad_00X30B10B10B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGrad_00J30B20B20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGrad_00S30B20B20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGrad_00Y30B20B20B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGrad_00d30B10B10B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&texture_00I10B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&texture_00R10B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&texture_00X10B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&texture_00J20B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&texture_00S20B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&texture_00Y20B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&texture_00K20B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&texture_00T20B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&texture_00Z20B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&texture_00L20B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&texture_00U20B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&texture_00a20B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProj_00I20B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProj_00R20B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProj_00X20B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProj_00I30B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProj_00R30B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProj_00X30B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProj_00J30B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProj_00S30B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProj_00Y30B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&texture_00d20B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&texture_00e30B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProj_00d30B00B),
-    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&texture_00k30B00B),
-    Rule::Get<Spec::ESSL, 310, Shader::FRAGMENT, EXT_INDEX(OES_texture_cube_map_array)>(
-        &textureExt_00k30B00B),
-    Rule::Get<Spec::ESSL, 310, Shader::FRAGMENT, EXT_INDEX(EXT_texture_cube_map_array)>(
-        &textureExt_00k30B00B),
-    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&texture_00s30B00B),
-    Rule::Get<Spec::ESSL, 310, Shader::FRAGMENT, EXT_INDEX(OES_texture_cube_map_array)>(
-        &textureExt_00s30B00B),
-    Rule::Get<Spec::ESSL, 310, Shader::FRAGMENT, EXT_INDEX(EXT_texture_cube_map_array)>(
-        &textureExt_00s30B00B),
-    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&texture_00x30B00B),
-    Rule::Get<Spec::ESSL, 310, Shader::FRAGMENT, EXT_INDEX(OES_texture_cube_map_array)>(
-        &textureExt_00x30B00B),
-    Rule::Get<Spec::ESSL, 310, Shader::FRAGMENT, EXT_INDEX(EXT_texture_cube_map_array)>(
-        &textureExt_00x30B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_EGL_image_external_essl3)>(
-        &texture_00M10B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_EGL_image_external_essl3)>(
-        &textureProj_00M20B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_EGL_image_external_essl3)>(
-        &textureProj_00M30B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(EXT_YUV_target)>(&texture_00N10B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(EXT_YUV_target)>(&textureProj_00N20B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(EXT_YUV_target)>(&textureProj_00N30B00B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureOffset_00I10B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureOffset_00R10B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureOffset_00X10B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureOffset_00J20B20D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureOffset_00S20B20D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureOffset_00Y20B20D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureOffset_00d20B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureOffset_00L20B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureOffset_00U20B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureOffset_00a20B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjOffset_00I20B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjOffset_00R20B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjOffset_00X20B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjOffset_00I30B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjOffset_00R30B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjOffset_00X30B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjOffset_00J30B20D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjOffset_00S30B20D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjOffset_00Y30B20D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjOffset_00d30B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLodOffset_00I10B00B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLodOffset_00R10B00B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLodOffset_00X10B00B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLodOffset_00J20B00B20D),
+        &textureExt_00x30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01f00D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicAddExt_01f00D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01H20D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicMinExt_01H20D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGrad_00X20B10B10B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetch_00I10D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00R10B00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01T10D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicXorExt_01T10D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01U00D00E00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicCompSwapExt_01U00D00E00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&mix_30B30B30B),
     Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLodOffset_00S20B00B20D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLodOffset_00Y20B00B20D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLodOffset_00d20B00B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLodOffset_00L20B00B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLodOffset_00U20B00B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLodOffset_00a20B00B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLodOffset_00I20B00B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLodOffset_00R20B00B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLodOffset_00X20B00B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLodOffset_00I30B00B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLodOffset_00R30B00B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLodOffset_00X30B00B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLodOffset_00J30B00B20D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLodOffset_00S30B00B20D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLodOffset_00Y30B00B20D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLodOffset_00d30B00B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetchOffset_00I10D00D10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetchOffset_00R10D00D10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetchOffset_00X10D00D10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetchOffset_00J20D00D20D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetchOffset_00S20D00D20D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetchOffset_00Y20D00D20D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetchOffset_00L20D00D10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetchOffset_00U20D00D10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetchOffset_00a20D00D10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGradOffset_00I10B10B10B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGradOffset_00R10B10B10B10D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01J00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicOrExt_01J00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01N20D00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicCompSwapExt_01N20D00D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&smoothstep_00B00B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01R20D00D00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicExchangeExt_01R20D00D00B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&max_00B00B),
     Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGradOffset_00X10B10B10B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGradOffset_00J20B20B20B20D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGradOffset_00S20B20B20B20D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGradOffset_00Y20B20B20B20D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGradOffset_00d20B10B10B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGradOffset_00L20B10B10B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGradOffset_00U20B10B10B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGradOffset_00a20B10B10B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGradOffset_00f30B10B10B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGradOffset_00I20B10B10B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGradOffset_00R20B10B10B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGradOffset_00X20B10B10B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGradOffset_00I30B10B10B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGradOffset_00R30B10B10B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGradOffset_00X30B10B10B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGradOffset_00J30B20B20B20D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGradOffset_00S30B20B20B20D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGradOffset_00Y30B20B20B20D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGradOffset_00d30B10B10B10D),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureOffset_00I10B10D00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureOffset_00R10B10D00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureOffset_00X10B10D00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureOffset_00J20B20D00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureOffset_00S20B20D00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureOffset_00Y20B20D00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureOffset_00d20B10D00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureOffset_00L20B10D00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureOffset_00U20B10D00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureOffset_00a20B10D00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProjOffset_00I20B10D00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProjOffset_00R20B10D00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProjOffset_00X20B10D00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProjOffset_00I30B10D00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProjOffset_00R30B10D00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProjOffset_00X30B10D00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProjOffset_00J30B20D00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProjOffset_00S30B20D00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProjOffset_00Y30B20D00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProjOffset_00d30B10D00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00I10B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00R10B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00X10B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00I10B00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00R10B00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00X10B00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00L20B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00U20B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00a20B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00L20B00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00U20B00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00a20B00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00K20B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00T20B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00Z20B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00K20B00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00T20B00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00Z20B00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGather_00k30B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
-        &textureGatherExt_00k30B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
-        &textureGatherExt_00k30B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGather_00s30B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
-        &textureGatherExt_00s30B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
-        &textureGatherExt_00s30B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGather_00x30B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
-        &textureGatherExt_00x30B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
-        &textureGatherExt_00x30B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGather_00k30B00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
-        &textureGatherExt_00k30B00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
-        &textureGatherExt_00k30B00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGather_00s30B00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
-        &textureGatherExt_00s30B00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
-        &textureGatherExt_00s30B00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGather_00x30B00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
-        &textureGatherExt_00x30B00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
-        &textureGatherExt_00x30B00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGather_00l30B00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
-        &textureGatherExt_00l30B00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
-        &textureGatherExt_00l30B00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00d10B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00d10B00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00f20B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00f20B00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00e20B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00e20B00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGatherOffset_00I10B10D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGatherOffset_00R10B10D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGatherOffset_00X10B10D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGatherOffset_00L20B10D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGatherOffset_00U20B10D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGatherOffset_00a20B10D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGatherOffset_00d10B00B10D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGatherOffset_00f20B00B10D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01e10D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicMaxExt_01e10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01D00D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicMinExt_01D00D00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&refract_00B00B00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicXor_00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGatherOffset_00I10B10D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGatherOffset_00R10B10D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGatherOffset_00X10B10D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGatherOffset_00L20B10D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGatherOffset_00U20B10D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGatherOffset_00a20B10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGatherOffsets_00I10B10Dx4),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_gpu_shader5)>(
-        &textureGatherOffsetsExt_00I10B10Dx4),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_gpu_shader5)>(
-        &textureGatherOffsetsExt_00I10B10Dx4),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGatherOffsets_00R10B10Dx4),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGatherOffsets_00a20B10Dx4),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_gpu_shader5)>(
-        &textureGatherOffsetsExt_00R10B10Dx4),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_gpu_shader5)>(
-        &textureGatherOffsetsExt_00R10B10Dx4),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGatherOffsets_00X10B10Dx4),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_gpu_shader5)>(
-        &textureGatherOffsetsExt_00X10B10Dx4),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_gpu_shader5)>(
-        &textureGatherOffsetsExt_00X10B10Dx4),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGatherOffsets_00L20B10Dx4),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_gpu_shader5)>(
-        &textureGatherOffsetsExt_00L20B10Dx4),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_gpu_shader5)>(
-        &textureGatherOffsetsExt_00L20B10Dx4),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGatherOffsets_00U20B10Dx4),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_gpu_shader5)>(
-        &textureGatherOffsetsExt_00U20B10Dx4),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_gpu_shader5)>(
-        &textureGatherOffsetsExt_00U20B10Dx4),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGatherOffsets_00a20B10Dx4),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_gpu_shader5)>(
-        &textureGatherOffsetsExt_00a20B10Dx4),
+        &textureGatherOffsetsExt_00a20B10Dx4),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_gpu_shader5)>(
         &textureGatherOffsetsExt_00a20B10Dx4),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGatherOffsets_00d10B00B10Dx4),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_gpu_shader5)>(
-        &textureGatherOffsetsExt_00d10B00B10Dx4),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_gpu_shader5)>(
-        &textureGatherOffsetsExt_00d10B00B10Dx4),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGatherOffsets_00f20B00B10Dx4),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_gpu_shader5)>(
-        &textureGatherOffsetsExt_00f20B00B10Dx4),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_gpu_shader5)>(
-        &textureGatherOffsetsExt_00f20B00B10Dx4),
+    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(EXT_shader_texture_lod)>(
+        &texture2DProjGradEXT_00I30B10B10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01e10D00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicExchangeExt_01e10D00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureSize_00b),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ANGLE_texture_multisample)>(
+        &textureSizeExt_00b),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProj_00R30B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01S20D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicXorExt_01S20D00D),
     Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGatherOffsets_00I10B10Dx400D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_gpu_shader5)>(
         &textureGatherOffsetsExt_00I10B10Dx400D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_gpu_shader5)>(
         &textureGatherOffsetsExt_00I10B10Dx400D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGatherOffsets_00R10B10Dx400D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_gpu_shader5)>(
-        &textureGatherOffsetsExt_00R10B10Dx400D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_gpu_shader5)>(
-        &textureGatherOffsetsExt_00R10B10Dx400D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGatherOffsets_00X10B10Dx400D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_gpu_shader5)>(
-        &textureGatherOffsetsExt_00X10B10Dx400D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_gpu_shader5)>(
-        &textureGatherOffsetsExt_00X10B10Dx400D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGatherOffsets_00L20B10Dx400D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_gpu_shader5)>(
-        &textureGatherOffsetsExt_00L20B10Dx400D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_gpu_shader5)>(
-        &textureGatherOffsetsExt_00L20B10Dx400D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGatherOffsets_00U20B10Dx400D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_gpu_shader5)>(
-        &textureGatherOffsetsExt_00U20B10Dx400D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_gpu_shader5)>(
-        &textureGatherOffsetsExt_00U20B10Dx400D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGatherOffsets_00a20B10Dx400D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_gpu_shader5)>(
-        &textureGatherOffsetsExt_00a20B10Dx400D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_gpu_shader5)>(
-        &textureGatherOffsetsExt_00a20B10Dx400D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(EXT_YUV_target)>(&rgb_2_yuv_20B00H),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(EXT_YUV_target)>(&yuv_2_rgb_20B00H),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&dFdx_00B),
-    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(OES_standard_derivatives)>(&dFdxExt_00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&dFdx_10B),
-    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(OES_standard_derivatives)>(&dFdxExt_10B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&dFdx_20B),
-    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(OES_standard_derivatives)>(&dFdxExt_20B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&dFdx_30B),
-    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(OES_standard_derivatives)>(&dFdxExt_30B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&dFdy_00B),
-    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(OES_standard_derivatives)>(&dFdyExt_00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&dFdy_10B),
-    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(OES_standard_derivatives)>(&dFdyExt_10B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&dFdy_20B),
-    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(OES_standard_derivatives)>(&dFdyExt_20B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&dFdy_30B),
-    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(OES_standard_derivatives)>(&dFdyExt_30B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&fwidth_00B),
-    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(OES_standard_derivatives)>(
-        &fwidthExt_00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&fwidth_10B),
-    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(OES_standard_derivatives)>(
-        &fwidthExt_10B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&fwidth_20B),
-    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(OES_standard_derivatives)>(
-        &fwidthExt_20B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&fwidth_30B),
-    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(OES_standard_derivatives)>(
-        &fwidthExt_30B),
-    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&interpolateAtCentroid_00B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_shader_multisample_interpolation)>(
-        &interpolateAtCentroidExt_00B),
-    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&interpolateAtCentroid_10B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_shader_multisample_interpolation)>(
-        &interpolateAtCentroidExt_10B),
-    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&interpolateAtCentroid_20B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_shader_multisample_interpolation)>(
-        &interpolateAtCentroidExt_20B),
-    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&interpolateAtCentroid_30B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_shader_multisample_interpolation)>(
-        &interpolateAtCentroidExt_30B),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&texture_00X10B00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicCounter_00G),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01S20D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicMaxExt_01S20D00E),
+    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, 0>(&texture2D_00I10B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01V10D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicAndExt_01V10D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&exp2_30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&TableBase::m_gl_MaxGeometryUniformComponentsES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_geometry_shader)>(
+        &TableBase::m_gl_MaxGeometryUniformComponents),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_geometry_shader)>(
+        &TableBase::m_gl_MaxGeometryUniformComponents),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldInsert_10D10D00D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&floor_10B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&equal_30D30D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&findMSB_30D),
+    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::ALL, 0>(&endInvocationInterlockNV_),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01A20D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicExchangeExt_01A20D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLod_00T20B00B),
     Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&interpolateAtSample_00B00D),
     Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_shader_multisample_interpolation)>(
         &interpolateAtSampleExt_00B00D),
-    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&interpolateAtSample_10B00D),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_shader_multisample_interpolation)>(
-        &interpolateAtSampleExt_10B00D),
-    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&interpolateAtSample_20B00D),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_shader_multisample_interpolation)>(
-        &interpolateAtSampleExt_20B00D),
-    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&interpolateAtSample_30B00D),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_shader_multisample_interpolation)>(
-        &interpolateAtSampleExt_30B00D),
-    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&interpolateAtOffset_00B10B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_shader_multisample_interpolation)>(
-        &interpolateAtOffsetExt_00B10B),
-    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&interpolateAtOffset_10B10B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_shader_multisample_interpolation)>(
-        &interpolateAtOffsetExt_10B10B),
-    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&interpolateAtOffset_20B10B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_shader_multisample_interpolation)>(
-        &interpolateAtOffsetExt_20B10B),
-    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&interpolateAtOffset_30B10B),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_shader_multisample_interpolation)>(
-        &interpolateAtOffsetExt_30B10B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicCounter_00G),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicCounterIncrement_00G),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicCounterDecrement_00G),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicAdd_00E00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicAdd_00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicMin_00E00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicMin_00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicMax_00E00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicMax_00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicAnd_00E00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicAnd_00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicOr_00E00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicOr_00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicXor_00E00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicXor_00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicExchange_00E00E),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&fwidth_00B),
+    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(OES_standard_derivatives)>(
+        &fwidthExt_00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetchOffset_00I10D00D10D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01G20D00D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicMaxExt_01G20D00D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(EXT_YUV_target)>(&textureProj_00N30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01f00D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicExchangeExt_01f00D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01B20D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicOrExt_01B20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01H20D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicMaxExt_01H20D00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&lessThanEqual_10B10B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&distance_30B30B),
+    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, 0>(&texture2DProj_00I30B00B),
+    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(EXT_shader_texture_lod)>(
+        &texture2DProjLodEXT_00I30B00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLodOffset_00I20B00B10D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(EXT_YUV_target)>(&rgb_2_yuv_20B00H),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicExchange_00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicCompSwap_00E00E00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicCompSwap_00D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageSize_00z),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageSize_01K),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageSize_01V),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageSize_01A),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageSize_01L),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageSize_01W),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageSize_01B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageSize_01M),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageSize_01X),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageSize_01C),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageSize_01N),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageSize_01Y),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageSize_01H),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
-        &imageSizeExt_01H),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
-        &imageSizeExt_01H),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageSize_01S),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
-        &imageSizeExt_01S),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
-        &imageSizeExt_01S),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageSize_01d),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
-        &imageSizeExt_01d),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
-        &imageSizeExt_01d),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageSize_01J),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_buffer)>(&imageSizeExt_01J),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_buffer)>(&imageSizeExt_01J),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageSize_01U),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_buffer)>(&imageSizeExt_01U),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_buffer)>(&imageSizeExt_01U),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageSize_01f),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_buffer)>(&imageSizeExt_01f),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_buffer)>(&imageSizeExt_01f),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageStore_00z10D30B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageStore_01K10D30D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageStore_01V10D30E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageStore_01A20D30B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageStore_01L20D30D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageStore_01W20D30E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageStore_01B20D30B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageStore_01M20D30D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageStore_01X20D30E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageStore_01C20D30B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageStore_01N20D30D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageStore_01Y20D30E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageStore_01H20D30B),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&texture_00T20B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageLoad_01H20D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
-        &imageStoreExt_01H20D30B),
+        &imageLoadExt_01H20D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
-        &imageStoreExt_01H20D30B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageStore_01S20D30D),
+        &imageLoadExt_01H20D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texture_00d20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGather_00k30B00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
-        &imageStoreExt_01S20D30D),
+        &textureGatherExt_00k30B00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
-        &imageStoreExt_01S20D30D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageStore_01d20D30E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
-        &imageStoreExt_01d20D30E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
-        &imageStoreExt_01d20D30E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageStore_01J00D30B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_buffer)>(
-        &imageStoreExt_01J00D30B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_buffer)>(
-        &imageStoreExt_01J00D30B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageStore_01U00D30D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_buffer)>(
-        &imageStoreExt_01U00D30D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_buffer)>(
-        &imageStoreExt_01U00D30D),
+        &textureGatherExt_00k30B00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&ceil_00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01F10D00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicXorExt_01F10D00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLodOffset_00L20B00B10D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&mix_20F20F20F),
+    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::ALL, 0>(
+        &beginFragmentShaderOrderingINTEL_),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&step_30B30B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(OES_EGL_image_external_essl3)>(
+        &textureSize_00M00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01V10D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicMinExt_01V10D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&acos_10B),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProj_00d30B00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&uintBitsToFloat_00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01E10D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicMaxExt_01E10D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxCombinedAtomicCounterBuffers),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&umulExtended_30E30E30E30E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01J00D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicMaxExt_01J00D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01J00D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicExchangeExt_01J00D00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&log2_00B),
     Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageStore_01f00D30E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_buffer)>(
         &imageStoreExt_01f00D30E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_buffer)>(
         &imageStoreExt_01f00D30E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageLoad_00z10D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageLoad_01K10D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageLoad_01V10D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageLoad_01A20D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageLoad_01L20D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageLoad_01W20D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageLoad_01B20D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageLoad_01M20D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageLoad_01X20D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageLoad_01C20D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageLoad_01N20D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageLoad_01Y20D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageLoad_01H20D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
-        &imageLoadExt_01H20D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
-        &imageLoadExt_01H20D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageLoad_01S20D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
-        &imageLoadExt_01S20D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
-        &imageLoadExt_01S20D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageLoad_01d20D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&texelFetch_00w00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_buffer)>(&texelFetchExt_00w00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_buffer)>(&texelFetchExt_00w00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&greaterThan_30E30E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&TableBase::m_gl_MaxGeometryOutputComponentsES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_geometry_shader)>(
+        &TableBase::m_gl_MaxGeometryOutputComponents),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_geometry_shader)>(
+        &TableBase::m_gl_MaxGeometryOutputComponents),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGrad_00X10B10B10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01d20D00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicCompSwapExt_01d20D00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&modf_30B30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&TableBase::m_gl_MaxGeometryInputComponentsES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_geometry_shader)>(
+        &TableBase::m_gl_MaxGeometryInputComponents),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_geometry_shader)>(
+        &TableBase::m_gl_MaxGeometryInputComponents),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureSize_00x00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
-        &imageLoadExt_01d20D),
+        &textureSizeExt_00x00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
-        &imageLoadExt_01d20D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageLoad_01J00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_buffer)>(&imageLoadExt_01J00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_buffer)>(&imageLoadExt_01J00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageLoad_01U00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_buffer)>(&imageLoadExt_01U00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_buffer)>(&imageLoadExt_01U00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageLoad_01f00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_buffer)>(&imageLoadExt_01f00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_buffer)>(&imageLoadExt_01f00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_00z10D00E),
+        &textureSizeExt_00x00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&determinant_A0B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLod_00X30B00B),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&texture_00S20B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01S20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_00z10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01K10D00E),
+        &imageAtomicOrExt_01S20D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::VERTEX, 0>(&BuiltInVariable::kgl_VertexID),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&matrixCompMult_F0BF0B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01R20D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01K10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01V10D00E),
+        &imageAtomicOrExt_01R20D00D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&asinh_10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01H20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01V10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01A20D00E),
+        &imageAtomicXorExt_01H20D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProjOffset_00I20B10D00B),
+    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&BuiltInVariable::kgl_SampleIDES3_2),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_sample_variables)>(
+        &BuiltInVariable::kgl_SampleID),
+    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&interpolateAtOffset_30B10B),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_shader_multisample_interpolation)>(
+        &interpolateAtOffsetExt_30B10B),
+    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::ALL, 0>(
+        &beginInvocationInterlockNV_),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01K10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01A20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01L20D00E),
+        &imageAtomicAndExt_01K10D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLodOffset_00Y30B00B20D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGatherOffset_00d10B00B10D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&exp2_10B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&asinh_00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01A20D00B),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01L20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01W20D00E),
+        &imageAtomicExchangeExt_01A20D00B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&lessThan_20B20B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLodOffset_00d30B00B10D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01R20D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01W20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01C20D00E),
+        &imageAtomicMaxExt_01R20D00D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&max_00E00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&cosh_10B),
+    Rule::Get<Spec::ESSL, 320, Shader::TESS_CONTROL_EXT, 0>(
+        &TableBase::m_gl_TessLevelOuterTCSES3_2),
+    Rule::Get<Spec::ESSL, 320, Shader::TESS_EVALUATION_EXT, 0>(
+        &TableBase::m_gl_TessLevelOuterTESES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(EXT_tessellation_shader)>(
+        &TableBase::m_gl_TessLevelOuterTCS),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(OES_tessellation_shader)>(
+        &TableBase::m_gl_TessLevelOuterTCS),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_EVALUATION_EXT, EXT_INDEX(EXT_tessellation_shader)>(
+        &TableBase::m_gl_TessLevelOuterTES),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_EVALUATION_EXT, EXT_INDEX(OES_tessellation_shader)>(
+        &TableBase::m_gl_TessLevelOuterTES),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01e10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01C20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01N20D00E),
+        &imageAtomicAndExt_01e10D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01E10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01N20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01Y20D00E),
+        &imageAtomicExchangeExt_01E10D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGatherOffsets_00U20B10Dx400D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_gpu_shader5)>(
+        &textureGatherOffsetsExt_00U20B10Dx400D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_gpu_shader5)>(
+        &textureGatherOffsetsExt_00U20B10Dx400D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProj_00R30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGather_00x30B00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
+        &textureGatherExt_00x30B00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
+        &textureGatherExt_00x30B00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01O00D00E00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01Y20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01J00D00E),
+        &imageAtomicCompSwapExt_01O00D00E00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGradOffset_00L20B10B10B10D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLodOffset_00R20B00B10D),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProj_00S30B00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageSize_01W),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&max_20B20B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&mod_10B10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGrad_00x30B20B20B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
+        &textureGradExt_00x30B20B20B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
+        &textureGradExt_00x30B20B20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01b10D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01J00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01U00D00E),
+        &imageAtomicMinExt_01b10D00D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01e10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01U00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01f00D00E),
+        &imageAtomicMinExt_01e10D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&sin_00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01N20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01f00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01B20D00E),
+        &imageAtomicXorExt_01N20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01J00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01B20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01M20D00E),
+        &imageAtomicXorExt_01J00D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01B20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01M20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01X20D00E),
+        &imageAtomicMinExt_01B20D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldInsert_00D00D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01F10D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01X20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01H20D00E),
+        &imageAtomicXorExt_01F10D00D00E),
+    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::ALL, 0>(&subpassLoad_01j),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01K10D00E00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01H20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01S20D00E),
+        &imageAtomicCompSwapExt_01K10D00E00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01W20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01S20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01d20D00E),
+        &imageAtomicOrExt_01W20D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageStore_01X20D30E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldInsert_20D20D00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&texture_00d20B00B),
+    Rule::Get<Spec::ESSL, 100, Shader::ALL, 0>(&texture2DProj_00I20B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldReverse_30E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProj_00R20B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&findLSB_10D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&TableBase::m_gl_MaxTessControlInputComponentsES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
+        &TableBase::m_gl_MaxTessControlInputComponents),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
+        &TableBase::m_gl_MaxTessControlInputComponents),
+    Rule::Get<Spec::ESSL, 320, Shader::GEOMETRY_EXT, 0>(&BuiltInVariable::kgl_InvocationIDES3_2),
+    Rule::Get<Spec::ESSL, 320, Shader::TESS_CONTROL_EXT, 0>(
+        &BuiltInVariable::kgl_InvocationIDTCSES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY_EXT, EXT_INDEX(EXT_geometry_shader)>(
+        &BuiltInVariable::kgl_InvocationID),
+    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY_EXT, EXT_INDEX(OES_geometry_shader)>(
+        &BuiltInVariable::kgl_InvocationID),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(EXT_tessellation_shader)>(
+        &BuiltInVariable::kgl_InvocationIDTCS),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(OES_tessellation_shader)>(
+        &BuiltInVariable::kgl_InvocationIDTCS),
+    Rule::Get<Spec::ESSL, 100, Shader::ALL, 0>(&textureVideoWEBGL_00y10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01R20D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01d20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01D00D00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01O00D00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01O00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01Z00D00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01Z00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01E10D00E),
+        &imageAtomicAddExt_01R20D00D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&floatBitsToInt_30B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageStore_01L20D30D),
+    Rule::Get<Spec::ESSL, 100, Shader::ALL, 0>(&texture2D_00I10B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLodOffset_00R30B00B10D),
+    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(OES_texture_3D)>(&texture3DLod_00J20B00B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&sin_20B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&trunc_20B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&mix_20D20D20F),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(OES_EGL_image_external_essl3)>(
+        &texture_00M10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01F10D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01E10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01P10D00E),
+        &imageAtomicAndExt_01F10D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01a10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01P10D00E),
+        &imageAtomicMaxExt_01a10D00D),
     Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01a10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
         &imageAtomicAddExt_01a10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01I10D00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&pow_10B10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01Q10D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01I10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01T10D00E),
+        &imageAtomicAddExt_01Q10D00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&uintBitsToFloat_10E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01N20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01T10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01e10D00E),
+        &imageAtomicOrExt_01N20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01A20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01e10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01F10D00D00E),
+        &imageAtomicXorExt_01A20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01B20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01F10D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01Q10D00D00E),
+        &imageAtomicMinExt_01B20D00E),
+    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::FRAGMENT, 0>(&samplePosition_00E),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProj_00X20B00B),
+    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(EXT_frag_depth)>(
+        &TableBase::m_gl_FragDepthEXT),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&all_30F),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01S20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01Q10D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01b10D00D00E),
+        &imageAtomicMaxExt_01S20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01Y20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01b10D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01G20D00D00E),
+        &imageAtomicMaxExt_01Y20D00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&asin_20B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGatherOffset_00X10B10D),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProjOffset_00R30B10D00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureLod_00x30B00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
+        &textureLodExt_00x30B00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
+        &textureLodExt_00x30B00B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&refract_30B30B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01d20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01G20D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01R20D00D00E),
+        &imageAtomicAddExt_01d20D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLodOffset_00U20B00B10D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&tan_20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01I10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01R20D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01c20D00D00E),
+        &imageAtomicMaxExt_01I10D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01O00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01c20D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_00z10D00D),
+        &imageAtomicExchangeExt_01O00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01B20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_00z10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01K10D00D),
+        &imageAtomicXorExt_01B20D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldReverse_10E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&atanh_00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLodOffset_00d20B00B10D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01P10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01K10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01V10D00D),
+        &imageAtomicXorExt_01P10D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&mix_10D10D10F),
+    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&TableBase::m_gl_SampleMaskInES3_2),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_sample_variables)>(
+        &TableBase::m_gl_SampleMaskIn),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&lessThan_10D10D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLodOffset_00R10B00B10D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicMax_00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&min_00E00E),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(EXT_YUV_target)>(&textureProj_00N30B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01E10D00E00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01V10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01A20D00D),
+        &imageAtomicCompSwapExt_01E10D00E00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageStore_01C20D30B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ANGLE_shader_pixel_local_storage)>(
+        &pixelLocalLoadANGLE_01i),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&abs_20D),
+    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(EXT_shader_texture_lod)>(
+        &texture2DProjGradEXT_00I20B10B10B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&equal_10F10F),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetch_00R10D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&faceforward_20B20B20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01U00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01A20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01L20D00D),
+        &imageAtomicAddExt_01U00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::COMPUTE, 0>(&BuiltInVariable::kgl_GlobalInvocationID),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&mix_30E30E30F),
+    Rule::Get<Spec::ESSL, 100, Shader::ALL, 0>(&TableBase::m_gl_MaxVaryingVectors),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_00z10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01L20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01W20D00D),
+        &imageAtomicExchangeExt_00z10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageStore_01d20D30E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
+        &imageStoreExt_01d20D30E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
+        &imageStoreExt_01d20D30E),
+    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::ALL, 0>(&subpassLoad_01m00D),
+    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(EXT_shadow_samplers)>(&shadow2DEXT_00d20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01I10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01W20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01C20D00D),
+        &imageAtomicAndExt_01I10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGrad_00s30B20B20B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
+        &textureGradExt_00s30B20B20B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
+        &textureGradExt_00s30B20B20B),
+    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(EXT_shader_framebuffer_fetch)>(
+        &TableBase::m_gl_LastFragData),
+    Rule::Get<Spec::ESSL,
+              100,
+              Shader::FRAGMENT,
+              EXT_INDEX(EXT_shader_framebuffer_fetch_non_coherent)>(&TableBase::m_gl_LastFragData),
+    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(NV_shader_framebuffer_fetch)>(
+        &TableBase::m_gl_LastFragDataNV),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&clamp_30D30D30D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&min_00B00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetch_00J20D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureOffset_00I10B10D00B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&sqrt_20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01A20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01C20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01N20D00D),
+        &imageAtomicOrExt_01A20D00D),
+    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(EXT_shader_texture_lod)>(
+        &texture2DProjLodEXT_00I20B00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGradOffset_00I20B10B10B10D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageSize_01J),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_buffer)>(&imageSizeExt_01J),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_buffer)>(&imageSizeExt_01J),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&mix_20E20E20F),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&sqrt_30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01b10D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01N20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01Y20D00D),
+        &imageAtomicOrExt_01b10D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGatherOffsets_00R10B10Dx400D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_gpu_shader5)>(
+        &textureGatherOffsetsExt_00R10B10Dx400D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_gpu_shader5)>(
+        &textureGatherOffsetsExt_00R10B10Dx400D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjOffset_00d30B10D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texture_00y10B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&mix_20B20B20B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ANGLE_shader_pixel_local_storage)>(
+        &pixelLocalLoadANGLE_01h),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&greaterThanEqual_30B30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01S20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01Y20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01J00D00D),
+        &imageAtomicExchangeExt_01S20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_00z10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01J00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01U00D00D),
+        &imageAtomicAndExt_00z10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01f00D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01U00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01f00D00D),
+        &imageAtomicCompSwapExt_01f00D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01L20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01f00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01B20D00D),
+        &imageAtomicExchangeExt_01L20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01b10D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01B20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01M20D00D),
+        &imageAtomicAndExt_01b10D00D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageLoad_01W20D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01Z00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01M20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01X20D00D),
+        &imageAtomicAddExt_01Z00D00D),
+    Rule::Get<Spec::ESSL,
+              300,
+              Shader::VERTEX,
+              EXT_INDEX(ANGLE_base_vertex_base_instance_shader_builtin)>(
+        &BuiltInVariable::kgl_BaseInstance),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01H20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01X20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01H20D00D),
+        &imageAtomicAndExt_01H20D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProj_00Y30B00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjOffset_00X30B10D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01J00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01H20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01S20D00D),
+        &imageAtomicXorExt_01J00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&clamp_00E00E00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&outerProduct_20B20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01a10D00E00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01S20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01d20D00D),
+        &imageAtomicCompSwapExt_01a10D00E00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_00z10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01d20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01D00D00D),
+        &imageAtomicMaxExt_00z10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01R20D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01D00D00D),
+        &imageAtomicMinExt_01R20D00D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&inversesqrt_10B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&atan_20B),
+    Rule::Get<Spec::ESSL,
+              0,
+              Shader::VERTEX,
+              EXT_INDEX(ANGLE_base_vertex_base_instance_shader_builtin)>(
+        &BuiltInVariable::kangle_BaseVertex),
     Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01O00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
         &imageAtomicAddExt_01O00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01Z00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01Z00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01E10D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldInsert_20E20E00D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&log2_10B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGatherOffset_00R10B10D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01A20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01E10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01P10D00D),
+        &imageAtomicAddExt_01A20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01c20D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01P10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01a10D00D),
+        &imageAtomicExchangeExt_01c20D00D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&any_30F),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&TableBase::m_gl_DepthRangeParameters),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01K10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01a10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01I10D00D),
+        &imageAtomicAndExt_01K10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01a10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01I10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01T10D00D),
+        &imageAtomicMinExt_01a10D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&findMSB_10E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&atan_20B20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01T10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01T10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01e10D00D),
+        &imageAtomicMaxExt_01T10D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01Y20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01e10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01F10D00D00D),
+        &imageAtomicXorExt_01Y20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&interpolateAtSample_20B00D),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_shader_multisample_interpolation)>(
+        &interpolateAtSampleExt_20B00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01M20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01F10D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01Q10D00D00D),
+        &imageAtomicAddExt_01M20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01R20D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01Q10D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01b10D00D00D),
+        &imageAtomicOrExt_01R20D00D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&radians_10B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&atanh_30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(
+        &TableBase::m_gl_MaxGeometryTotalOutputComponentsES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_geometry_shader)>(
+        &TableBase::m_gl_MaxGeometryTotalOutputComponents),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_geometry_shader)>(
+        &TableBase::m_gl_MaxGeometryTotalOutputComponents),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01Q10D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01b10D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01G20D00D00D),
+        &imageAtomicMinExt_01Q10D00D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01V10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01G20D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01R20D00D00D),
+        &imageAtomicAndExt_01V10D00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&max_30B00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGrad_00L20B10B10B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&notEqual_30F30F),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&exp_00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00R10B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texture_00J20B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&atan_00B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::TESS_CONTROL_EXT, 0>(
+        &TableBase::m_gl_TessLevelInnerTCSES3_2),
+    Rule::Get<Spec::ESSL, 320, Shader::TESS_EVALUATION_EXT, 0>(
+        &TableBase::m_gl_TessLevelInnerTESES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(EXT_tessellation_shader)>(
+        &TableBase::m_gl_TessLevelInnerTCS),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(OES_tessellation_shader)>(
+        &TableBase::m_gl_TessLevelInnerTCS),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_EVALUATION_EXT, EXT_INDEX(EXT_tessellation_shader)>(
+        &TableBase::m_gl_TessLevelInnerTES),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_EVALUATION_EXT, EXT_INDEX(OES_tessellation_shader)>(
+        &TableBase::m_gl_TessLevelInnerTES),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&mix_20B20B20F),
+    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&interpolateAtCentroid_10B),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_shader_multisample_interpolation)>(
+        &interpolateAtCentroidExt_10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01C20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01R20D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01c20D00D00D),
+        &imageAtomicXorExt_01C20D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&abs_00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&mix_20B20B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01Y20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAddExt_01c20D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_00z10D00E),
+        &imageAtomicXorExt_01Y20D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldReverse_00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01d20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_00z10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01K10D00E),
+        &imageAtomicExchangeExt_01d20D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGradOffset_00Y20B20B20B20D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldExtract_30D00D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&min_30B30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01S20D00B),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01K10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01V10D00E),
+        &imageAtomicExchangeExt_01S20D00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texture_00Y20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&texelFetch_00r00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_buffer)>(&texelFetchExt_00r00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_buffer)>(&texelFetchExt_00r00D),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&BuiltInVariable::kgl_FragDepth),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGrad_00e30B20B20B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&inversesqrt_20B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&lessThan_30E30E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&round_30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01J00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01V10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01A20D00E),
+        &imageAtomicExchangeExt_01J00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01Z00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01A20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01L20D00E),
+        &imageAtomicMaxExt_01Z00D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitCount_20D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGatherOffsets_00U20B10Dx4),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_gpu_shader5)>(
+        &textureGatherOffsetsExt_00U20B10Dx4),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_gpu_shader5)>(
+        &textureGatherOffsetsExt_00U20B10Dx4),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&reflect_30B30B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGrad_00Y30B20B20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01D00D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01L20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01W20D00E),
+        &imageAtomicCompSwapExt_01D00D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01D00D00E00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01W20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01C20D00E),
+        &imageAtomicCompSwapExt_01D00D00E00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01Q10D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01C20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01N20D00E),
+        &imageAtomicAndExt_01Q10D00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&isnan_00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01c20D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01N20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01Y20D00E),
+        &imageAtomicOrExt_01c20D00D00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&equal_10B10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01Q10D00D00E00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01Y20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01J00D00E),
+        &imageAtomicCompSwapExt_01Q10D00D00E00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01B20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01J00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01U00D00E),
+        &imageAtomicAddExt_01B20D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&clamp_30E00E00E),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProjOffset_00X20B10D00B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&notEqual_10F10F),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01b10D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01U00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01f00D00E),
+        &imageAtomicXorExt_01b10D00D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00d10B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&asinh_30B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&inverse_A0B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&lessThan_20E20E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGrad_00R20B10B10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01c20D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01f00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01B20D00E),
+        &imageAtomicAndExt_01c20D00D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&findLSB_00D),
+    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::FRAGMENT, 0>(
+        &interpolateAtCenter_00B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&inversesqrt_00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProj_00X20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01G20D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01B20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01M20D00E),
+        &imageAtomicMaxExt_01G20D00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00U20B),
+    Rule::Get<Spec::ESSL, 0, Shader::FRAGMENT, EXT_INDEX(ARM_shader_framebuffer_fetch)>(
+        &BuiltInVariable::kgl_LastFragColorARM),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&sinh_30B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&step_10B10B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureSize_00L00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01G20D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01M20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01X20D00E),
+        &imageAtomicExchangeExt_01G20D00D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGradOffset_00X20B10B10B10D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&notEqual_30E30E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureSize_00d00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01c20D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01X20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01H20D00E),
+        &imageAtomicMaxExt_01c20D00D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01Q10D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01H20D00E),
+        &imageAtomicExchangeExt_01Q10D00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageStore_01M20D30D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01b10D00D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicAddExt_01b10D00D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01b10D00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicExchangeExt_01b10D00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00U20B00D),
     Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01S20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
         &imageAtomicMinExt_01S20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01d20D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&sign_10D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imulExtended_20D20D20D20D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldReverse_00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01F10D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01d20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01D00D00E),
+        &imageAtomicMaxExt_01F10D00D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&log_30B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(OES_EGL_image_external_essl3)>(
+        &texelFetch_00M10D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&clamp_10B10B10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01f00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01O00D00E),
+        &imageAtomicAddExt_01f00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01X20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01O00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01Z00D00E),
+        &imageAtomicMaxExt_01X20D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureOffset_00d20B10D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&normalize_00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01E10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01Z00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01E10D00E),
+        &imageAtomicAddExt_01E10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01F10D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01E10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01P10D00E),
+        &imageAtomicMinExt_01F10D00D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&abs_30D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGradOffset_00R30B10B10B10D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01U00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01P10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01a10D00E),
+        &imageAtomicMaxExt_01U00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&BuiltInVariable::kgl_SamplePositionES3_2),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_sample_variables)>(
+        &BuiltInVariable::kgl_SamplePosition),
+    Rule::Get<Spec::ESSL, 310, Shader::COMPUTE, 0>(&BuiltInVariable::kgl_WorkGroupSize),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&TableBase::m_gl_MinProgramTexelOffset),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&packSnorm4x8_30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01B20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01a10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01I10D00E),
+        &imageAtomicMaxExt_01B20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01F10D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01I10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01T10D00E),
+        &imageAtomicExchangeExt_01F10D00D00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&cos_30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01K10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01T10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01e10D00E),
+        &imageAtomicXorExt_01K10D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01a10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01e10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01F10D00D00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01F10D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01Q10D00D00E),
+        &imageAtomicXorExt_01a10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01f00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01Q10D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01b10D00D00E),
+        &imageAtomicMaxExt_01f00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01C20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01b10D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01G20D00D00E),
+        &imageAtomicMinExt_01C20D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjOffset_00Y30B20D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01d20D00B),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01G20D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01R20D00D00E),
+        &imageAtomicExchangeExt_01d20D00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01O00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01R20D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01c20D00D00E),
+        &imageAtomicOrExt_01O00D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&distance_00B00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&findMSB_10D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&ceil_20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01G20D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01c20D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_00z10D00D),
+        &imageAtomicXorExt_01G20D00D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&memoryBarrierAtomicCounter_),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&min_20B00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGrad_00K20B20B20B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&max_10E10E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01C20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_00z10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01K10D00D),
+        &imageAtomicExchangeExt_01C20D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&sinh_00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageStore_01U00D30D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_buffer)>(
+        &imageStoreExt_01U00D30D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_buffer)>(
+        &imageStoreExt_01U00D30D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&isinf_20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01L20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01K10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01V10D00D),
+        &imageAtomicMaxExt_01L20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(
+        &TableBase::m_gl_MaxTessEvaluationTextureImageUnitsES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
+        &TableBase::m_gl_MaxTessEvaluationTextureImageUnits),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
+        &TableBase::m_gl_MaxTessEvaluationTextureImageUnits),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageLoad_01N20D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&modf_00B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_00z10D00E00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01V10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01A20D00D),
+        &imageAtomicCompSwapExt_00z10D00E00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&min_30D30D),
+    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(NV_shader_framebuffer_fetch)>(
+        &BuiltInVariable::kgl_LastFragColor),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureSize_00J00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicCompSwap_00E00E00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&lessThanEqual_10D10D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&roundEven_20B),
+    Rule::Get<Spec::ESSL, 100, Shader::VERTEX, 0>(&textureCubeLod_00K20B00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&uaddCarry_20E20E20E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&round_00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01A20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01L20D00D),
+        &imageAtomicMinExt_01D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01Z00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01L20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01W20D00D),
+        &imageAtomicAndExt_01Z00D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01W20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01C20D00D),
+        &imageAtomicOrExt_01D00D00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&refract_20B20B00B),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProjOffset_00d30B10D00B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&mod_20B00B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&notEqual_30B30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01Z00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01C20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01N20D00D),
+        &imageAtomicMinExt_01Z00D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&max_20E20E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxFragmentAtomicCounters),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&lessThan_20D20D),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&dFdx_30B),
+    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(OES_standard_derivatives)>(&dFdxExt_30B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texture_00U20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01A20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01N20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01Y20D00D),
+        &imageAtomicMaxExt_01A20D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&mix_00E00E00F),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProj_00I30B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ARB_texture_rectangle)>(&texture_00O10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01a10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01Y20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01J00D00D),
+        &imageAtomicOrExt_01a10D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldInsert_00E00E00D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&notFunc_20F),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProjOffset_00I30B10D00B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&TableBase::m_gl_MaxVertexTextureImageUnits),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&texture_00J20B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01G20D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01J00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01U00D00D),
+        &imageAtomicAndExt_01G20D00D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01R20D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01U00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01f00D00D),
+        &imageAtomicAddExt_01R20D00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&sign_20D),
+    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::FRAGMENT, 0>(
+        &interpolateAtCenter_10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01F10D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01f00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01B20D00D),
+        &imageAtomicMaxExt_01F10D00D00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&TableBase::m_gl_MaxTextureImageUnits),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&length_30B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&lessThanEqual_10E10E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&pow_20B20B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&transpose_B0B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01O00D00B),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01B20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01M20D00D),
+        &imageAtomicExchangeExt_01O00D00B),
+    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&interpolateAtCentroid_00B),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_shader_multisample_interpolation)>(
+        &interpolateAtCentroidExt_00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&TableBase::m_gl_MaxTessControlImageUniformsES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
+        &TableBase::m_gl_MaxTessControlImageUniforms),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
+        &TableBase::m_gl_MaxTessControlImageUniforms),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGradOffset_00J30B20B20B20D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&min_30E00E),
+    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(EXT_shader_texture_lod)>(
+        &texture2DLodEXT_00I10B00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&outerProduct_20B10B),
+    Rule::Get<Spec::ESSL, 100, Shader::ALL, 0>(&texture2DProj_00I30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageSize_01U),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_buffer)>(&imageSizeExt_01U),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_buffer)>(&imageSizeExt_01U),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&isinf_10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01K10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01M20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01X20D00D),
+        &imageAtomicOrExt_01K10D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLod_00X20B00B),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProjOffset_00X30B10D00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01d20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01X20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01H20D00D),
+        &imageAtomicAddExt_01d20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGatherOffsets_00L20B10Dx400D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_gpu_shader5)>(
+        &textureGatherOffsetsExt_00L20B10Dx400D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_gpu_shader5)>(
+        &textureGatherOffsetsExt_00L20B10Dx400D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLod_00I30B00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetchOffset_00Y20D00D20D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureSize_00W),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_storage_multisample_2d_array)>(
+        &textureSizeExt_00W),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01b10D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01H20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01S20D00D),
+        &imageAtomicAddExt_01b10D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01f00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01S20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01d20D00D),
+        &imageAtomicMinExt_01f00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01J00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01d20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01D00D00D),
+        &imageAtomicAndExt_01J00D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&max_20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01V10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01D00D00D),
+        &imageAtomicOrExt_01V10D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(OES_EGL_image_external_essl3)>(
+        &textureProj_00M20B),
     Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01O00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
         &imageAtomicMinExt_01O00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01Z00D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::FRAGMENT, 0>(&BuiltInVariable::kgl_PointCoord),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&notFunc_30F),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&unpackSnorm2x16_00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01P10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01Z00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01E10D00D),
+        &imageAtomicMaxExt_01P10D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProj_00J30B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&usubBorrow_00E00E00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01c20D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01E10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01P10D00D),
+        &imageAtomicMinExt_01c20D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&texture_00s30B00B),
+    Rule::Get<Spec::ESSL, 310, Shader::FRAGMENT, EXT_INDEX(OES_texture_cube_map_array)>(
+        &textureExt_00s30B00B),
+    Rule::Get<Spec::ESSL, 310, Shader::FRAGMENT, EXT_INDEX(EXT_texture_cube_map_array)>(
+        &textureExt_00s30B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&TableBase::m_gl_MaxGeometryImageUniformsES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_geometry_shader)>(
+        &TableBase::m_gl_MaxGeometryImageUniforms),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_geometry_shader)>(
+        &TableBase::m_gl_MaxGeometryImageUniforms),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01b10D00D00B),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01P10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01a10D00D),
+        &imageAtomicExchangeExt_01b10D00D00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01B20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01a10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01I10D00D),
+        &imageAtomicAndExt_01B20D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ANGLE_shader_pixel_local_storage)>(
+        &pixelLocalStoreANGLE_01h30D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01E10D00B),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01I10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01T10D00D),
+        &imageAtomicExchangeExt_01E10D00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01a10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01T10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01e10D00D),
+        &imageAtomicAndExt_01a10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01A20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01e10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01F10D00D00D),
+        &imageAtomicAndExt_01A20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&interpolateAtSample_10B00D),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_shader_multisample_interpolation)>(
+        &interpolateAtSampleExt_10B00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01J00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01F10D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01Q10D00D00D),
+        &imageAtomicAddExt_01J00D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&TableBase::m_gl_MaxVertexUniformVectors),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01H20D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01Q10D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01b10D00D00D),
+        &imageAtomicCompSwapExt_01H20D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01K10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01b10D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01G20D00D00D),
+        &imageAtomicExchangeExt_01K10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_00z10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01G20D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01R20D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01R20D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01c20D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMinExt_01c20D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_00z10D00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_00z10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01K10D00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01K10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01V10D00E),
+        &imageAtomicExchangeExt_00z10D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01L20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01V10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01A20D00E),
+        &imageAtomicAddExt_01L20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01M20D00E00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01A20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01L20D00E),
+        &imageAtomicCompSwapExt_01M20D00E00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01H20D00E00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01L20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01W20D00E),
+        &imageAtomicCompSwapExt_01H20D00E00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01C20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01W20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01C20D00E),
+        &imageAtomicAddExt_01C20D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(EXT_YUV_target)>(&textureProj_00N20B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGrad_00Z20B20B20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01b10D00D00E00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01C20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01N20D00E),
+        &imageAtomicCompSwapExt_01b10D00D00E00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01f00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01N20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01Y20D00E),
+        &imageAtomicAndExt_01f00D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&atan_00B),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&texture_00Y20B00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageStore_01V10D30E),
+    Rule::Get<Spec::ESSL, 0, Shader::VERTEX, EXT_INDEX(ANGLE_multi_draw)>(
+        &BuiltInVariable::kgl_DrawID),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&clamp_10E10E10E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&lessThan_30B30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01U00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01Y20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01J00D00E),
+        &imageAtomicXorExt_01U00D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&intBitsToFloat_00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLodOffset_00X10B00B10D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&floor_00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjOffset_00I30B10D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01J00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01U00D00E),
+        &imageAtomicAddExt_01D00D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01e10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01U00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01f00D00E),
+        &imageAtomicOrExt_01e10D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01A20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01f00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01B20D00E),
+        &imageAtomicOrExt_01A20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01L20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01B20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01M20D00E),
+        &imageAtomicXorExt_01L20D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&greaterThan_30D30D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&trunc_00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_00z10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01M20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01X20D00E),
+        &imageAtomicXorExt_00z10D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texture_00L20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01L20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01X20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01H20D00E),
+        &imageAtomicOrExt_01L20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01L20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01H20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01S20D00E),
+        &imageAtomicXorExt_01L20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01Q10D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01S20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01d20D00E),
+        &imageAtomicMinExt_01Q10D00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageSize_01B),
+    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::ALL, 0>(&subpassLoad_01n00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLod_00d30B00B),
+    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, 0>(&textureCube_00K20B00B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&degrees_00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01X20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01d20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01D00D00E),
+        &imageAtomicExchangeExt_01X20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01Q10D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01O00D00E),
+        &imageAtomicOrExt_01Q10D00D00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&greaterThanEqual_10D10D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageSize_01d),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
+        &imageSizeExt_01d),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
+        &imageSizeExt_01d),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01b10D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01O00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01Z00D00E),
+        &imageAtomicExchangeExt_01b10D00D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&usubBorrow_10E10E10E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&sqrt_10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01L20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01Z00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01E10D00E),
+        &imageAtomicMinExt_01L20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01L20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01E10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01P10D00E),
+        &imageAtomicMinExt_01L20D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetch_00Y20D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imulExtended_00D00D00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLod_00a20B00B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&atan_10B10B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxComputeImageUniforms),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&any_20F),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01W20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01P10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01a10D00E),
+        &imageAtomicMinExt_01W20D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLod_00U20B00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&clamp_30D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01d20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01a10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01I10D00E),
+        &imageAtomicAndExt_01d20D00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&pow_30B30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01Z00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01I10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01T10D00E),
+        &imageAtomicOrExt_01Z00D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxImageUnits),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01B20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01T10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01e10D00E),
+        &imageAtomicAndExt_01B20D00D),
+    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::ALL, 0>(
+        &endInvocationInterlockARB_),
+    Rule::Get<Spec::ESSL, 320, Shader::TESS_CONTROL_EXT, 0>(
+        &BuiltInVariable::kgl_PatchVerticesInTCSES3_2),
+    Rule::Get<Spec::ESSL, 320, Shader::TESS_EVALUATION_EXT, 0>(
+        &BuiltInVariable::kgl_PatchVerticesInTESES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(EXT_tessellation_shader)>(
+        &BuiltInVariable::kgl_PatchVerticesInTCS),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(OES_tessellation_shader)>(
+        &BuiltInVariable::kgl_PatchVerticesInTCS),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_EVALUATION_EXT, EXT_INDEX(EXT_tessellation_shader)>(
+        &BuiltInVariable::kgl_PatchVerticesInTES),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_EVALUATION_EXT, EXT_INDEX(OES_tessellation_shader)>(
+        &BuiltInVariable::kgl_PatchVerticesInTES),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01H20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01e10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01F10D00D00E),
+        &imageAtomicAddExt_01H20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01P10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01F10D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01Q10D00D00E),
+        &imageAtomicMinExt_01P10D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageStore_01Y20D30E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&clamp_00B00B00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGatherOffset_00X10B10D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01A20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01Q10D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01b10D00D00E),
+        &imageAtomicExchangeExt_01A20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01c20D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01b10D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01G20D00D00E),
+        &imageAtomicAddExt_01c20D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&interpolateAtOffset_20B10B),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_shader_multisample_interpolation)>(
+        &interpolateAtOffsetExt_20B10B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&isnan_30B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&findMSB_20E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&isnan_10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureLod_00k30B00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
+        &textureLodExt_00k30B00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
+        &textureLodExt_00k30B00B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&mod_30B30B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLod_00Y30B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01V10D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01G20D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01R20D00D00E),
+        &imageAtomicCompSwapExt_01V10D00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLod_00L20B00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjOffset_00R30B10D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&abs_20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01a10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01R20D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01c20D00D00E),
+        &imageAtomicMinExt_01a10D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::FRAGMENT, 0>(&BuiltInVariable::kgl_HelperInvocation),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01b10D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01c20D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_00z10D00D),
+        &imageAtomicMinExt_01b10D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01S20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_00z10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01K10D00D),
+        &imageAtomicXorExt_01S20D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&min_20E00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicAdd_00E00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01I10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01K10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01V10D00D),
+        &imageAtomicAddExt_01I10D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&dFdx_20B),
+    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(OES_standard_derivatives)>(&dFdxExt_20B),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&texture_00e30B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&fma_20B20B20B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_gpu_shader5)>(&fmaExt_20B20B20B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_gpu_shader5)>(&fmaExt_20B20B20B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(EXT_clip_cull_distance)>(
+        &TableBase::m_gl_MaxCullDistances),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ANGLE_clip_cull_distance)>(
+        &TableBase::m_gl_MaxCullDistances),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01C20D00E00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01V10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01A20D00D),
+        &imageAtomicCompSwapExt_01C20D00E00E),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&dFdy_00B),
+    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(OES_standard_derivatives)>(&dFdyExt_00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureSize_00j),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_buffer)>(&textureSizeExt_00j),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_buffer)>(&textureSizeExt_00j),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01M20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01A20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01L20D00D),
+        &imageAtomicOrExt_01M20D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ARB_texture_rectangle)>(&textureProj_00O20B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&sign_00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01U00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01L20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01W20D00D),
+        &imageAtomicOrExt_01U00D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&max_20B00B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&exp_10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01K10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01W20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01C20D00D),
+        &imageAtomicAddExt_01K10D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01H20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01C20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01N20D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01N20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01Y20D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01Y20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01J00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01J00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01U00D00D),
+        &imageAtomicExchangeExt_01H20D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&length_20B),
+    Rule::Get<Spec::ESSL, 310, Shader::COMPUTE, 0>(&memoryBarrierShared_),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ANGLE_shader_pixel_local_storage)>(
+        &pixelLocalStoreANGLE_01i30E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGradOffset_00R10B10B10B10D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxAtomicCounterBufferSize),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageStore_01H20D30B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
+        &imageStoreExt_01H20D30B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
+        &imageStoreExt_01H20D30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01F10D00D00E00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01U00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01f00D00D),
+        &imageAtomicCompSwapExt_01F10D00D00E00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&atan_30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&fma_10B10B10B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_gpu_shader5)>(&fmaExt_10B10B10B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_gpu_shader5)>(&fmaExt_10B10B10B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureOffset_00a20B10D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&greaterThanEqual_20D20D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxCombinedShaderOutputResources),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01J00D00E00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01f00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01B20D00D),
+        &imageAtomicCompSwapExt_01J00D00E00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_00z10D00B),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01B20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01M20D00D),
+        &imageAtomicExchangeExt_00z10D00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01T10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01M20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01X20D00D),
+        &imageAtomicAddExt_01T10D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&exp2_20B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLod_00J30B00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&min_20E20E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01a10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01X20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01H20D00D),
+        &imageAtomicAddExt_01a10D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&outerProduct_10B10B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&roundEven_00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&max_10D10D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&acos_00B),
+    Rule::Get<Spec::ESSL, 310, Shader::COMPUTE, 0>(&barrier_),
+    Rule::Get<Spec::ESSL, 320, Shader::TESS_CONTROL_EXT, 0>(&barrierTCSES3_2_),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(EXT_tessellation_shader)>(
+        &barrierTCS_),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(OES_tessellation_shader)>(
+        &barrierTCS_),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&texture_00L20B00B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&equal_20B20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01S20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01H20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01S20D00D),
+        &imageAtomicOrExt_01S20D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&dot_20B20B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureOffset_00X10B10D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01B20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01S20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01d20D00D),
+        &imageAtomicOrExt_01B20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01S20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01d20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01D00D00D),
+        &imageAtomicExchangeExt_01S20D00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&notEqual_30D30D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01J00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01O00D00D),
+        &imageAtomicMinExt_01J00D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&normalize_30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01Y20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01O00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01Z00D00D),
+        &imageAtomicOrExt_01Y20D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGradOffset_00a20B10B10B10D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01K10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01Z00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01E10D00D),
+        &imageAtomicMinExt_01K10D00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&notEqual_10D10D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&outerProduct_10B30B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureOffset_00L20B10D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01J00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01E10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01P10D00D),
+        &imageAtomicOrExt_01J00D00E),
+    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::ALL, 0>(&saturate_00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01P10D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01P10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01a10D00D),
+        &imageAtomicCompSwapExt_01P10D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01Y20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01a10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01I10D00D),
+        &imageAtomicMaxExt_01Y20D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&mix_30D30D30F),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01e10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01I10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01T10D00D),
+        &imageAtomicXorExt_01e10D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(
+        &TableBase::m_gl_MaxTessEvaluationUniformComponentsES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
+        &TableBase::m_gl_MaxTessEvaluationUniformComponents),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
+        &TableBase::m_gl_MaxTessEvaluationUniformComponents),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&notEqual_20B20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01c20D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01T10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01e10D00D),
+        &imageAtomicXorExt_01c20D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01M20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01e10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01F10D00D00D),
+        &imageAtomicOrExt_01M20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01M20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01F10D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01Q10D00D00D),
+        &imageAtomicXorExt_01M20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01J00D00B),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01Q10D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01b10D00D00D),
+        &imageAtomicExchangeExt_01J00D00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&umulExtended_20E20E20E20E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&tanh_10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01K10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01b10D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01G20D00D00D),
+        &imageAtomicExchangeExt_01K10D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&reflect_20B20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01G20D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01R20D00D00D),
+        &imageAtomicXorExt_01D00D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&greaterThan_10D10D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01P10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01R20D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01c20D00D00D),
+        &imageAtomicAndExt_01P10D00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&lessThan_30D30D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01G20D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicMaxExt_01c20D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_00z10D00E),
+        &imageAtomicOrExt_01G20D00D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01J00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_00z10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01K10D00E),
+        &imageAtomicMaxExt_01J00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01V10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01K10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01V10D00E),
+        &imageAtomicXorExt_01V10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01X20D00B),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01V10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01A20D00E),
+        &imageAtomicExchangeExt_01X20D00B),
+    Rule::Get<Spec::ESSL, 310, Shader::COMPUTE, 0>(&BuiltInVariable::kgl_LocalInvocationIndex),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&texture_00Z20B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01C20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01A20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01L20D00E),
+        &imageAtomicMinExt_01C20D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureSize_00e00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&memoryBarrierBuffer_),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&min_20D20D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&equal_30E30E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01X20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01L20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01W20D00E),
+        &imageAtomicXorExt_01X20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::GEOMETRY_EXT, 0>(&BuiltInVariable::kgl_PrimitiveIDInES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY_EXT, EXT_INDEX(EXT_geometry_shader)>(
+        &BuiltInVariable::kgl_PrimitiveIDIn),
+    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY_EXT, EXT_INDEX(OES_geometry_shader)>(
+        &BuiltInVariable::kgl_PrimitiveIDIn),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldReverse_30D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&matrixCompMult_60B60B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&atanh_20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01b10D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01W20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01C20D00E),
+        &imageAtomicAndExt_01b10D00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00I10B00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01U00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01C20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01N20D00E),
+        &imageAtomicExchangeExt_01U00D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGatherOffset_00a20B10D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&greaterThanEqual_10E10E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01X20D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01N20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01Y20D00E),
+        &imageAtomicCompSwapExt_01X20D00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicAnd_00E00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01U00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01Y20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01J00D00E),
+        &imageAtomicXorExt_01U00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageStore_00z10D30B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&max_30B30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&texelFetch_00c20D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_storage_multisample_2d_array)>(
+        &texelFetchExt_00c20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01R20D00D00E00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01J00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01U00D00E),
+        &imageAtomicCompSwapExt_01R20D00D00E00E),
+    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, 0>(&BuiltInVariable::kgl_FragColor),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&clamp_20E20E20E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01P10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01U00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01f00D00E),
+        &imageAtomicMinExt_01P10D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxComputeUniformComponents),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&isinf_30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01U00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01f00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01B20D00E),
+        &imageAtomicExchangeExt_01U00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01C20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01B20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01M20D00E),
+        &imageAtomicOrExt_01C20D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjOffset_00I20B10D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageSize_01K),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01Y20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01M20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01X20D00E),
+        &imageAtomicAddExt_01Y20D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGrad_00T20B20B20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageSize_01f),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_buffer)>(&imageSizeExt_01f),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_buffer)>(&imageSizeExt_01f),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01M20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01X20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01H20D00E),
+        &imageAtomicMinExt_01M20D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageLoad_01X20D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01E10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01H20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01S20D00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01S20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01d20D00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01d20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01D00D00E),
+        &imageAtomicAndExt_01E10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&interpolateAtSample_30B00D),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_shader_multisample_interpolation)>(
+        &interpolateAtSampleExt_30B00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicMin_00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGrad_00R30B10B10B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&cosh_20B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&faceforward_30B30B30B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&cos_10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&texelFetch_00Q20D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_storage_multisample_2d_array)>(
+        &texelFetchExt_00Q20D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitCount_00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldReverse_20D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01L20D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01O00D00E),
+        &imageAtomicCompSwapExt_01L20D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01E10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01O00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01Z00D00E),
+        &imageAtomicExchangeExt_01E10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&TableBase::m_gl_MaxTessControlAtomicCountersES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
+        &TableBase::m_gl_MaxTessControlAtomicCounters),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
+        &TableBase::m_gl_MaxTessControlAtomicCounters),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&max_30D30D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&dot_30B30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01Q10D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01Z00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01E10D00E),
+        &imageAtomicMaxExt_01Q10D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01Z00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01E10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01P10D00E),
+        &imageAtomicMinExt_01Z00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01C20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01P10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01a10D00E),
+        &imageAtomicAndExt_01C20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01L20D00B),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01a10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01I10D00E),
+        &imageAtomicExchangeExt_01L20D00B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&radians_20B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&sign_00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureSize_00s00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
+        &textureSizeExt_00s00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
+        &textureSizeExt_00s00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&min_10E10E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01M20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01I10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01T10D00E),
+        &imageAtomicAndExt_01M20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01b10D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01T10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01e10D00E),
+        &imageAtomicMaxExt_01b10D00D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&max_10B10B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageStore_01N20D30D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&min_00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01Z00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01e10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01F10D00D00E),
+        &imageAtomicExchangeExt_01Z00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&outerProduct_30B10B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicMin_00E00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01R20D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01F10D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01Q10D00D00E),
+        &imageAtomicExchangeExt_01R20D00D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldInsert_30E30E00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&ldexp_30B30D),
+    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::ALL, 0>(&saturate_10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01H20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01Q10D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01b10D00D00E),
+        &imageAtomicMinExt_01H20D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetchOffset_00J20D00D20D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&asin_10B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureSize_00U00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxVertexAtomicCounters),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01Y20D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01b10D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01G20D00D00E),
+        &imageAtomicCompSwapExt_01Y20D00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureOffset_00a20B10D00B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&smoothstep_00B00B10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01G20D00D00E00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01G20D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01R20D00D00E),
+        &imageAtomicCompSwapExt_01G20D00D00E00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGradOffset_00R20B10B10B10D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01W20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01R20D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01c20D00D00E),
+        &imageAtomicMinExt_01W20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01X20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01c20D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_00z10D00D),
+        &imageAtomicAddExt_01X20D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageLoad_01K10D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(
+        &TableBase::m_gl_MaxTessControlUniformComponentsES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
+        &TableBase::m_gl_MaxTessControlUniformComponents),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
+        &TableBase::m_gl_MaxTessControlUniformComponents),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(
+        &TableBase::m_gl_MaxTessControlOutputComponentsES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
+        &TableBase::m_gl_MaxTessControlOutputComponents),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
+        &TableBase::m_gl_MaxTessControlOutputComponents),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&asinh_20B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGradOffset_00d20B10B10B10D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&texelFetch_00b10D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ANGLE_texture_multisample)>(
+        &texelFetchExt_00b10D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&sign_10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01M20D00B),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_00z10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01K10D00D),
+        &imageAtomicExchangeExt_01M20D00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&min_10D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01a10D00B),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01K10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01V10D00D),
+        &imageAtomicExchangeExt_01a10D00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&TableBase::m_gl_MaxGeometryTextureImageUnitsES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_geometry_shader)>(
+        &TableBase::m_gl_MaxGeometryTextureImageUnits),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_geometry_shader)>(
+        &TableBase::m_gl_MaxGeometryTextureImageUnits),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01a10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01V10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01A20D00D),
+        &imageAtomicExchangeExt_01a10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01N20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01A20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01L20D00D),
+        &imageAtomicAddExt_01N20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01X20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01L20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01W20D00D),
+        &imageAtomicExchangeExt_01X20D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00f20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01d20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01W20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01C20D00D),
+        &imageAtomicOrExt_01d20D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGradOffset_00X30B10B10B10D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageSize_01M),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureSize_00f00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxCombinedAtomicCounters),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01d20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01C20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01N20D00D),
+        &imageAtomicMaxExt_01d20D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureSize_00T00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&greaterThan_20B20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01X20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01N20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01Y20D00D),
+        &imageAtomicMaxExt_01X20D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureOffset_00J20B20D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01M20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01Y20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01J00D00D),
+        &imageAtomicMaxExt_01M20D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&TableBase::m_gl_MaxProgramTexelOffset),
+    Rule::Get<Spec::ESSL, 320, Shader::GEOMETRY_EXT, 0>(&TableBase::m_gl_PerVertexES3_2),
+    Rule::Get<Spec::ESSL, 320, Shader::TESS_CONTROL_EXT, 0>(&TableBase::m_gl_PerVertexTCSES3_2),
+    Rule::Get<Spec::ESSL, 320, Shader::TESS_EVALUATION_EXT, 0>(&TableBase::m_gl_PerVertexTESES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY_EXT, EXT_INDEX(EXT_geometry_shader)>(
+        &TableBase::m_gl_PerVertex),
+    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY_EXT, EXT_INDEX(OES_geometry_shader)>(
+        &TableBase::m_gl_PerVertex),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(EXT_tessellation_shader)>(
+        &TableBase::m_gl_PerVertexTCS),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(OES_tessellation_shader)>(
+        &TableBase::m_gl_PerVertexTCS),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_EVALUATION_EXT, EXT_INDEX(EXT_tessellation_shader)>(
+        &TableBase::m_gl_PerVertexTES),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_EVALUATION_EXT, EXT_INDEX(OES_tessellation_shader)>(
+        &TableBase::m_gl_PerVertexTES),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGatherOffset_00I10B10D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&sign_30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01N20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01J00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01U00D00D),
+        &imageAtomicExchangeExt_01N20D00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&tan_10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(
+        &TableBase::m_gl_MaxTessControlAtomicCounterBuffersES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
+        &TableBase::m_gl_MaxTessControlAtomicCounterBuffers),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
+        &TableBase::m_gl_MaxTessControlAtomicCounterBuffers),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageStore_01B20D30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01R20D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01U00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01f00D00D),
+        &imageAtomicMinExt_01R20D00D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&findLSB_00E),
+    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::FRAGMENT, 0>(&numSamples_),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01L20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01f00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01B20D00D),
+        &imageAtomicExchangeExt_01L20D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&smoothstep_20B20B20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01f00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01B20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01M20D00D),
+        &imageAtomicOrExt_01f00D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureOffset_00U20B10D00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&ldexp_20B20D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01T10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01M20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01X20D00D),
+        &imageAtomicExchangeExt_01T10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01P10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01X20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01H20D00D),
+        &imageAtomicAndExt_01P10D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&cosh_00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&max_20D20D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&texelFetch_00P10D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ANGLE_texture_multisample)>(
+        &texelFetchExt_00P10D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01T10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01H20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01S20D00D),
+        &imageAtomicMinExt_01T10D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01G20D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01S20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01d20D00D),
+        &imageAtomicAddExt_01G20D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01V10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01d20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01D00D00D),
+        &imageAtomicMaxExt_01V10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&interpolateAtCentroid_30B),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_shader_multisample_interpolation)>(
+        &interpolateAtCentroidExt_30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01R20D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01O00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01O00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01Z00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01Z00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01E10D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01E10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01P10D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01P10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01a10D00D),
+        &imageAtomicXorExt_01R20D00D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&greaterThan_20E20E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texture_00K20B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&tan_00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&modf_20B20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01U00D00B),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01a10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01I10D00D),
+        &imageAtomicExchangeExt_01U00D00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&inverse_F0B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&lessThanEqual_20E20E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLod_00I20B00B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&dot_00B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageSize_01H),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
+        &imageSizeExt_01H),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
+        &imageSizeExt_01H),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&uintBitsToFloat_20E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texture_00S20B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&faceforward_10B10B10B),
+    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(ARB_texture_rectangle)>(
+        &texture2DRectProj_00O30B),
+    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(OES_texture_3D)>(&texture3DProjLod_00J30B00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureSize_00P),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ANGLE_texture_multisample)>(
+        &textureSizeExt_00P),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01c20D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01I10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01T10D00D),
+        &imageAtomicMaxExt_01c20D00D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&all_20F),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicExchange_00E00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&unpackUnorm4x8_00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01Z00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01T10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01e10D00D),
+        &imageAtomicXorExt_01Z00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&matrixCompMult_B0BB0B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGatherOffsets_00d10B00B10Dx4),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_gpu_shader5)>(
+        &textureGatherOffsetsExt_00d10B00B10Dx4),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_gpu_shader5)>(
+        &textureGatherOffsetsExt_00d10B00B10Dx4),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01V10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01e10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01F10D00D00D),
+        &imageAtomicExchangeExt_01V10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&TableBase::m_gl_SampleMaskES3_2),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_sample_variables)>(
+        &TableBase::m_gl_SampleMask),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureSize_00l00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
+        &textureSizeExt_00l00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
+        &textureSizeExt_00l00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&dot_10B10B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&lessThan_10E10E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01G20D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01F10D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01Q10D00D00D),
+        &imageAtomicMinExt_01G20D00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLodOffset_00X30B00B10D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureSize_00K00D),
+    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&BuiltInVariable::kgl_PrimitiveIDES3_2),
+    Rule::Get<Spec::ESSL, 320, Shader::GEOMETRY_EXT, 0>(&BuiltInVariable::kgl_PrimitiveIDGSES3_2),
+    Rule::Get<Spec::ESSL, 320, Shader::TESS_CONTROL_EXT, 0>(
+        &BuiltInVariable::kgl_PrimitiveIDTCSES3_2),
+    Rule::Get<Spec::ESSL, 320, Shader::TESS_EVALUATION_EXT, 0>(
+        &BuiltInVariable::kgl_PrimitiveIDTESES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::FRAGMENT, EXT_INDEX(EXT_geometry_shader)>(
+        &BuiltInVariable::kgl_PrimitiveID),
+    Rule::Get<Spec::ESSL, 310, Shader::FRAGMENT, EXT_INDEX(OES_geometry_shader)>(
+        &BuiltInVariable::kgl_PrimitiveID),
+    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY_EXT, EXT_INDEX(EXT_geometry_shader)>(
+        &BuiltInVariable::kgl_PrimitiveIDGS),
+    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY_EXT, EXT_INDEX(OES_geometry_shader)>(
+        &BuiltInVariable::kgl_PrimitiveIDGS),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(EXT_tessellation_shader)>(
+        &BuiltInVariable::kgl_PrimitiveIDTCS),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(OES_tessellation_shader)>(
+        &BuiltInVariable::kgl_PrimitiveIDTCS),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_EVALUATION_EXT, EXT_INDEX(EXT_tessellation_shader)>(
+        &BuiltInVariable::kgl_PrimitiveIDTES),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_EVALUATION_EXT, EXT_INDEX(OES_tessellation_shader)>(
+        &BuiltInVariable::kgl_PrimitiveIDTES),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01e10D00E00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01Q10D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01b10D00D00D),
+        &imageAtomicCompSwapExt_01e10D00E00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01O00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01b10D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01G20D00D00D),
+        &imageAtomicMaxExt_01O00D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProj_00I30B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(
+        &TableBase::m_gl_MaxTessEvaluationOutputComponentsES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
+        &TableBase::m_gl_MaxTessEvaluationOutputComponents),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
+        &TableBase::m_gl_MaxTessEvaluationOutputComponents),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01R20D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01G20D00D00D),
+        &imageAtomicExchangeExt_01R20D00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&abs_10D),
     Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01R20D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
         &imageAtomicAndExt_01R20D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01c20D00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageSize_00z),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01R20D00D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicAndExt_01c20D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_00z10D00E),
+        &imageAtomicCompSwapExt_01R20D00D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01d20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_00z10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01K10D00E),
+        &imageAtomicAndExt_01d20D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&uaddCarry_10E10E10E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01E10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01K10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01V10D00E),
+        &imageAtomicAddExt_01E10D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&trunc_10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01V10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01A20D00E),
+        &imageAtomicAndExt_01D00D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&matrixCompMult_E0BE0B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01O00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01A20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01L20D00E),
+        &imageAtomicAddExt_01O00D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&TableBase::m_gl_MaxFragmentInputVectors),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&equal_30F30F),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureSize_00V),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ANGLE_texture_multisample)>(
+        &textureSizeExt_00V),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&max_30E30E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&smoothstep_10B10B10B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&findLSB_20E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&notEqual_20E20E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01E10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01L20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01W20D00E),
+        &imageAtomicMaxExt_01E10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01M20D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01W20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01C20D00E),
+        &imageAtomicCompSwapExt_01M20D00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageLoad_01C20D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&mix_10F10F10F),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGatherOffset_00U20B10D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGrad_00a20B10B10B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageLoad_01M20D),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&fwidth_20B),
+    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(OES_standard_derivatives)>(
+        &fwidthExt_20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01C20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01N20D00E),
+        &imageAtomicXorExt_01D00D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGatherOffsets_00X10B10Dx4),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_gpu_shader5)>(
+        &textureGatherOffsetsExt_00X10B10Dx4),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_gpu_shader5)>(
+        &textureGatherOffsetsExt_00X10B10Dx4),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01A20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01N20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01Y20D00E),
+        &imageAtomicMinExt_01A20D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetchOffset_00R10D00D10D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&faceforward_00B00B00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGrad_00R10B10B10B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&findLSB_30E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&floatBitsToUint_10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01O00D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01Y20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01J00D00E),
+        &imageAtomicCompSwapExt_01O00D00D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&exp2_00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&tanh_00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01f00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01J00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01U00D00E),
+        &imageAtomicMinExt_01f00D00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&lessThanEqual_20B20B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageLoad_01B20D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureLod_00s30B00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
+        &textureLodExt_00s30B00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
+        &textureLodExt_00s30B00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGrad_00I10B10B10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(
+        &TableBase::m_gl_MaxTessEvaluationAtomicCountersES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
+        &TableBase::m_gl_MaxTessEvaluationAtomicCounters),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
+        &TableBase::m_gl_MaxTessEvaluationAtomicCounters),
+    Rule::Get<Spec::ESSL, 0, Shader::VERTEX, EXT_INDEX(APPLE_clip_distance)>(
+        &TableBase::m_gl_ClipDistanceAPPLE),
+    Rule::Get<Spec::ESSL, 300, Shader::NOT_COMPUTE, EXT_INDEX(EXT_clip_cull_distance)>(
+        &TableBase::m_gl_ClipDistance),
+    Rule::Get<Spec::ESSL, 300, Shader::NOT_COMPUTE, EXT_INDEX(ANGLE_clip_cull_distance)>(
+        &TableBase::m_gl_ClipDistance),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01H20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01U00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01f00D00E),
+        &imageAtomicAndExt_01H20D00E),
+    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(ARB_texture_rectangle)>(
+        &texture2DRect_00O10B),
+    Rule::Get<Spec::ESSL, 320, Shader::GEOMETRY_EXT, 0>(&TableBase::m_gl_inES3_2),
+    Rule::Get<Spec::ESSL, 320, Shader::TESS_CONTROL_EXT, 0>(&TableBase::m_gl_inTCSES3_2),
+    Rule::Get<Spec::ESSL, 320, Shader::TESS_EVALUATION_EXT, 0>(&TableBase::m_gl_inTESES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY_EXT, EXT_INDEX(EXT_geometry_shader)>(
+        &TableBase::m_gl_in),
+    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY_EXT, EXT_INDEX(OES_geometry_shader)>(
+        &TableBase::m_gl_in),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(EXT_tessellation_shader)>(
+        &TableBase::m_gl_inTCS),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(OES_tessellation_shader)>(
+        &TableBase::m_gl_inTCS),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_EVALUATION_EXT, EXT_INDEX(EXT_tessellation_shader)>(
+        &TableBase::m_gl_inTES),
+    Rule::Get<Spec::ESSL, 310, Shader::TESS_EVALUATION_EXT, EXT_INDEX(OES_tessellation_shader)>(
+        &TableBase::m_gl_inTES),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&isinf_00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGrad_00f30B10B10B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&findMSB_00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01Y20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01f00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01B20D00E),
+        &imageAtomicMinExt_01Y20D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&floatBitsToInt_10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01L20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01B20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01M20D00E),
+        &imageAtomicAndExt_01L20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01e10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01M20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01X20D00E),
+        &imageAtomicMinExt_01e10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01V10D00E00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01X20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01H20D00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01H20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01S20D00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01S20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01d20D00E),
+        &imageAtomicCompSwapExt_01V10D00E00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&unpackUnorm2x16_00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&roundEven_30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01Q10D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01d20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01D00D00E),
+        &imageAtomicAndExt_01Q10D00D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01M20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01O00D00E),
+        &imageAtomicAndExt_01M20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01O00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01O00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01Z00D00E),
+        &imageAtomicMinExt_01O00D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01V10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01Z00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01E10D00E),
+        &imageAtomicAddExt_01V10D00E),
+    Rule::Get<Spec::ESSL, 100, Shader::ALL, 0>(&textureCube_00K20B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGrad_00U20B10B10B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageSize_01A),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01V10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01E10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01P10D00E),
+        &imageAtomicExchangeExt_01V10D00D),
+    Rule::Get<Spec::ESSL, 100, Shader::VERTEX, 0>(&texture2DLod_00I10B00B),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(EXT_YUV_target)>(&textureProj_00N20B00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageSize_01C),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01T10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01P10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01a10D00E),
+        &imageAtomicMinExt_01T10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01E10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01a10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01I10D00E),
+        &imageAtomicXorExt_01E10D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProj_00X30B00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxVertexAtomicCounterBuffers),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01F10D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01I10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01T10D00E),
+        &imageAtomicOrExt_01F10D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01C20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01T10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01e10D00E),
+        &imageAtomicOrExt_01C20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_00z10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01e10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01F10D00D00E),
+        &imageAtomicAndExt_00z10D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&min_10B10B),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProjOffset_00J30B20D00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01F10D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01F10D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01Q10D00D00E),
+        &imageAtomicAddExt_01F10D00D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01W20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01Q10D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01b10D00D00E),
+        &imageAtomicOrExt_01W20D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageLoad_01V10D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProj_00d30B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&sin_10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGrad_00k30B20B20B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
+        &textureGradExt_00k30B20B20B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
+        &textureGradExt_00k30B20B20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01I10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01b10D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01G20D00D00E),
+        &imageAtomicExchangeExt_01I10D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01a10D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01G20D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01R20D00D00E),
+        &imageAtomicCompSwapExt_01a10D00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureOffset_00Y20B20D),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureOffset_00R10B10D00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldExtract_10D00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGrad_00S30B20B20B),
+    Rule::Get<Spec::ESSL, 300, Shader::NOT_COMPUTE, EXT_INDEX(OVR_multiview)>(
+        &BuiltInVariable::kgl_ViewID_OVR),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&equal_20D20D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageLoad_01L20D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&degrees_30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01d20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01R20D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01c20D00D00E),
+        &imageAtomicExchangeExt_01d20D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&ldexp_00B00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01G20D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01c20D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_00z10D00D),
+        &imageAtomicExchangeExt_01G20D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(
+        &TableBase::m_gl_MaxTessControlTotalOutputComponentsES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
+        &TableBase::m_gl_MaxTessControlTotalOutputComponents),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
+        &TableBase::m_gl_MaxTessControlTotalOutputComponents),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&trunc_30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01M20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_00z10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01K10D00D),
+        &imageAtomicExchangeExt_01M20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01P10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01K10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01V10D00D),
+        &imageAtomicXorExt_01P10D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetch_00L20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01C20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01V10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01A20D00D),
+        &imageAtomicMaxExt_01C20D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxComputeAtomicCounters),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldExtract_10E00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01V10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01A20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01L20D00D),
+        &imageAtomicOrExt_01V10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01W20D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01L20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01W20D00D),
+        &imageAtomicCompSwapExt_01W20D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01Y20D00B),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01W20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01C20D00D),
+        &imageAtomicExchangeExt_01Y20D00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01d20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01C20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01N20D00D),
+        &imageAtomicMinExt_01d20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01M20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01N20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01Y20D00D),
+        &imageAtomicMinExt_01M20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01A20D00E00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01Y20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01J00D00D),
+        &imageAtomicCompSwapExt_01A20D00E00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01W20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01J00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01U00D00D),
+        &imageAtomicExchangeExt_01W20D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&asin_00B),
+    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::ALL, 0>(&saturate_30B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxComputeWorkGroupCount),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&packSnorm2x16_10B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageStore_01W20D30E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01S20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01U00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01f00D00D),
+        &imageAtomicAndExt_01S20D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&acosh_20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01G20D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01f00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01B20D00D),
+        &imageAtomicMinExt_01G20D00D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxFragmentAtomicCounterBuffers),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01H20D00B),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01B20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01M20D00D),
+        &imageAtomicExchangeExt_01H20D00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01N20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01M20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01X20D00D),
+        &imageAtomicMinExt_01N20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01T10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01X20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01H20D00D),
+        &imageAtomicOrExt_01T10D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01U00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01H20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01S20D00D),
+        &imageAtomicMinExt_01U00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01G20D00D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01S20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01d20D00D),
+        &imageAtomicCompSwapExt_01G20D00D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01B20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01d20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01D00D00D),
+        &imageAtomicAddExt_01B20D00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&fract_00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureSize_00k00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
+        &textureSizeExt_00k00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
+        &textureSizeExt_00k00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageLoad_01A20D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&packUnorm2x16_10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01I10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01O00D00D),
+        &imageAtomicOrExt_01I10D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureOffset_00I10B10D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&frexp_20B20D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&BuiltInVariable::kgl_NumSamplesES3_2),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(OES_sample_variables)>(
+        &BuiltInVariable::kgl_NumSamples),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&atan_30B30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01e10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01O00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01Z00D00D),
+        &imageAtomicAndExt_01e10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01Y20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01Z00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01E10D00D),
+        &imageAtomicAndExt_01Y20D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureOffset_00Y20B20D00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldInsert_10E10E00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldExtract_00D00D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&degrees_20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01Y20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01E10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01P10D00D),
+        &imageAtomicAndExt_01Y20D00E),
+    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(EXT_shadow_samplers)>(
+        &shadow2DProjEXT_00d30B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(EXT_YUV_target)>(&texture_00N10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01X20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01P10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01a10D00D),
+        &imageAtomicAddExt_01X20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01N20D00B),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01a10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01I10D00D),
+        &imageAtomicExchangeExt_01N20D00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_00z10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01I10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01T10D00D),
+        &imageAtomicAddExt_00z10D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&outerProduct_30B20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01b10D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01T10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01e10D00D),
+        &imageAtomicOrExt_01b10D00D00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&mod_00B00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&outerProduct_30B30B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&acosh_10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01Z00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01e10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01F10D00D00D),
+        &imageAtomicMaxExt_01Z00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01H20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01F10D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01Q10D00D00D),
+        &imageAtomicMaxExt_01H20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01d20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01Q10D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01b10D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01b10D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01G20D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01G20D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01R20D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01R20D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01c20D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicOrExt_01c20D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_00z10D00E),
+        &imageAtomicXorExt_01d20D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&fract_20B),
+    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&interpolateAtCentroid_20B),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_shader_multisample_interpolation)>(
+        &interpolateAtCentroidExt_20B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texture_00X10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01A20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_00z10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01K10D00E),
+        &imageAtomicMaxExt_01A20D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGradOffset_00U20B10B10B10D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01c20D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01K10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01V10D00E),
+        &imageAtomicAndExt_01c20D00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&outerProduct_20B30B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&greaterThanEqual_10B10B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&asin_30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01Q10D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01V10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01A20D00E),
+        &imageAtomicOrExt_01Q10D00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProj_00Y30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01L20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01A20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01L20D00E),
+        &imageAtomicOrExt_01L20D00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&inversesqrt_30B),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&dFdy_10B),
+    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(OES_standard_derivatives)>(&dFdyExt_10B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&notEqual_20D20D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&sign_20B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&frexp_00B00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texture_00f30B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetchOffset_00L20D00D10D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01P10D00B),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01L20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01W20D00E),
+        &imageAtomicExchangeExt_01P10D00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageLoad_01f00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_buffer)>(&imageLoadExt_01f00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_buffer)>(&imageLoadExt_01f00D),
+    Rule::Get<Spec::ESSL, 310, Shader::COMPUTE, 0>(&BuiltInVariable::kgl_WorkGroupID),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&inverse_50B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01F10D00D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01W20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01C20D00E),
+        &imageAtomicCompSwapExt_01F10D00D00D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&floor_20B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&transpose_90B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&mix_00B00B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&texture_00k30B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
+        &textureExt_00k30B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
+        &textureExt_00k30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01V10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01C20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01N20D00E),
+        &imageAtomicMaxExt_01V10D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01Y20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01N20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01Y20D00E),
+        &imageAtomicAddExt_01Y20D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&usubBorrow_30E30E30E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01K10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01Y20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01J00D00E),
+        &imageAtomicMaxExt_01K10D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00L20B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&unpackSnorm4x8_00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&findLSB_20D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01O00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01J00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01U00D00E),
+        &imageAtomicXorExt_01O00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&roundEven_10B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&max_00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01E10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01U00D00E),
+        &imageAtomicMinExt_01E10D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLodOffset_00I10B00B10D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGradOffset_00Y30B20B20B20D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&tanh_20B),
     Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01f00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
         &imageAtomicXorExt_01f00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01B20D00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01B20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01M20D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGradOffset_00d30B10B10B10D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01Q10D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01M20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01X20D00E),
+        &imageAtomicAddExt_01Q10D00D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(EXT_YUV_target)>(&texelFetch_00N10D00D),
+    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(OES_EGL_image_external)>(
+        &texture2DProj_00M30B),
+    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(NV_EGL_stream_consumer_external)>(
+        &texture2DProj_00M30B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&greaterThanEqual_30D30D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetch_00S20D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texture_00e30B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&mod_10B00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetchOffset_00a20D00D10D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicCounterIncrement_00G),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01b10D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01X20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01H20D00E),
+        &imageAtomicXorExt_01b10D00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::VERTEX, 0>(&BuiltInVariable::kgl_InstanceID),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01F10D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01H20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01S20D00E),
+        &imageAtomicExchangeExt_01F10D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01c20D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01S20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01d20D00E),
+        &imageAtomicExchangeExt_01c20D00D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01d20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01D00D00E),
+        &imageAtomicMaxExt_01D00D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&determinant_F0B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLod_00Z20B00B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&step_00B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01Q10D00D00B),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01O00D00E),
+        &imageAtomicExchangeExt_01Q10D00D00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01Z00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01O00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01Z00D00E),
+        &imageAtomicOrExt_01Z00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01C20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01Z00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01E10D00E),
+        &imageAtomicExchangeExt_01C20D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureOffset_00R10B10D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01M20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01E10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01P10D00E),
+        &imageAtomicMaxExt_01M20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGatherOffsets_00X10B10Dx400D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_gpu_shader5)>(
+        &textureGatherOffsetsExt_00X10B10Dx400D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_gpu_shader5)>(
+        &textureGatherOffsetsExt_00X10B10Dx400D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01a10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01P10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01a10D00E),
+        &imageAtomicOrExt_01a10D00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&normalize_10B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&min_20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01N20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01a10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01I10D00E),
+        &imageAtomicAndExt_01N20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01a10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01I10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01T10D00E),
+        &imageAtomicExchangeExt_01a10D00D),
+    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::FRAGMENT, 0>(
+        &interpolateAtCenter_20B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&transpose_50B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&abs_00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01X20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01T10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01e10D00E),
+        &imageAtomicOrExt_01X20D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texture_00I10B),
+    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(OES_texture_3D)>(&texture3D_00J20B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01P10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01e10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01F10D00D00E),
+        &imageAtomicAddExt_01P10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_00z10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01F10D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01Q10D00D00E),
+        &imageAtomicMinExt_00z10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01Q10D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01b10D00D00E),
+        &imageAtomicMaxExt_01D00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&transpose_E0B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&unpackHalf2x16_00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLodOffset_00X20B00B10D),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&texture_00U20B00B),
+    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(OES_texture_3D)>(
+        &texture3DProj_00J30B00B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&clamp_30B30B30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01C20D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01b10D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01G20D00D00E),
+        &imageAtomicCompSwapExt_01C20D00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageSize_01X),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01N20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01G20D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01R20D00D00E),
+        &imageAtomicMaxExt_01N20D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&atan_10B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&sin_30B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLod_00S30B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01e10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01R20D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01c20D00D00E),
+        &imageAtomicAddExt_01e10D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(EXT_clip_cull_distance)>(
+        &TableBase::m_gl_MaxCombinedClipAndCullDistances),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ANGLE_clip_cull_distance)>(
+        &TableBase::m_gl_MaxCombinedClipAndCullDistances),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01e10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01c20D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_00z10D00D),
+        &imageAtomicMaxExt_01e10D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGradOffset_00f30B10B10B10D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01Z00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_00z10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01K10D00D),
+        &imageAtomicAddExt_01Z00D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLodOffset_00a20B00B10D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageStore_01K10D30D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_00z10D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01K10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01V10D00D),
+        &imageAtomicCompSwapExt_00z10D00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&equal_20E20E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01N20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01V10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01A20D00D),
+        &imageAtomicMaxExt_01N20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01e10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01A20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01L20D00D),
+        &imageAtomicXorExt_01e10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01Y20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01L20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01W20D00D),
+        &imageAtomicExchangeExt_01Y20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01X20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01W20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01C20D00D),
+        &imageAtomicOrExt_01X20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01Q10D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01C20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01N20D00D),
+        &imageAtomicMaxExt_01Q10D00D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01c20D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01N20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01Y20D00D),
+        &imageAtomicOrExt_01c20D00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&intBitsToFloat_10D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01C20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01Y20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01J00D00D),
+        &imageAtomicAndExt_01C20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01M20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01J00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01U00D00D),
+        &imageAtomicAddExt_01M20D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGrad_00d20B10B10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01U00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01f00D00D),
+        &imageAtomicExchangeExt_01D00D00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&radians_00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01U00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01f00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01B20D00D),
+        &imageAtomicOrExt_01U00D00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&step_00B10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01S20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01B20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01M20D00D),
+        &imageAtomicAndExt_01S20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01I10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01M20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01X20D00D),
+        &imageAtomicAddExt_01I10D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&dFdx_10B),
+    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(OES_standard_derivatives)>(&dFdxExt_10B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicOr_00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_00z10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01X20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01H20D00D),
+        &imageAtomicOrExt_00z10D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&umulExtended_10E10E10E10E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&transpose_F0B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01U00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01H20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01S20D00D),
+        &imageAtomicAddExt_01U00D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxComputeTextureImageUnits),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&matrixCompMult_50B50B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&clamp_20B20B20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01J00D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01S20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01d20D00D),
+        &imageAtomicCompSwapExt_01J00D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01G20D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01d20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01D00D00D),
+        &imageAtomicAndExt_01G20D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01H20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01O00D00D),
+        &imageAtomicExchangeExt_01H20D00E),
+    Rule::Get<Spec::ESSL, 100, Shader::VERTEX, 0>(&texture2DProjLod_00I20B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01U00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01O00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01Z00D00D),
+        &imageAtomicMaxExt_01U00D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&fma_00B00B00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_gpu_shader5)>(&fmaExt_00B00B00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_gpu_shader5)>(&fmaExt_00B00B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageLoad_01S20D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
+        &imageLoadExt_01S20D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
+        &imageLoadExt_01S20D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&cross_20B20B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxComputeAtomicCounterBuffers),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01T10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01Z00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01E10D00D),
+        &imageAtomicOrExt_01T10D00E),
+    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(OES_texture_3D)>(&texture3DProj_00J30B),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureOffset_00X10B10D00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01G20D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01E10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01P10D00D),
+        &imageAtomicOrExt_01G20D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01M20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01P10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01a10D00D),
+        &imageAtomicExchangeExt_01M20D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetchOffset_00U20D00D10D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicCompSwap_00D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(
+        &TableBase::m_gl_MaxTessEvaluationAtomicCounterBuffersES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
+        &TableBase::m_gl_MaxTessEvaluationAtomicCounterBuffers),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
+        &TableBase::m_gl_MaxTessEvaluationAtomicCounterBuffers),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&mix_30B30B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01Q10D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01a10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01I10D00D),
+        &imageAtomicExchangeExt_01Q10D00D00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&log2_20B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetchOffset_00X10D00D10D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&floor_30B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGrad_00J20B20B20B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&mix_30F30F30F),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGatherOffset_00a20B10D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01N20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01I10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01T10D00D),
+        &imageAtomicOrExt_01N20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01X20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01T10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01e10D00D),
+        &imageAtomicMinExt_01X20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01Z00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01e10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01F10D00D00D),
+        &imageAtomicXorExt_01Z00D00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&min_20B20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01d20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01F10D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01Q10D00D00D),
+        &imageAtomicXorExt_01d20D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLod_00S20B00B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&acos_20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(
+        &TableBase::m_gl_MaxTessEvaluationInputComponentsES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
+        &TableBase::m_gl_MaxTessEvaluationInputComponents),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
+        &TableBase::m_gl_MaxTessEvaluationInputComponents),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01T10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01Q10D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01b10D00D00D),
+        &imageAtomicAddExt_01T10D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldExtract_30E00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01E10D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01b10D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01G20D00D00D),
+        &imageAtomicCompSwapExt_01E10D00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texture_00T20B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&ldexp_10B10D),
+    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&interpolateAtOffset_00B10B),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_shader_multisample_interpolation)>(
+        &interpolateAtOffsetExt_00B10B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldReverse_10D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&exp_20B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldExtract_20D00D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&reflect_10B10B),
+    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::ALL, 0>(&saturate_20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageSize_01S),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
+        &imageSizeExt_01S),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
+        &imageSizeExt_01S),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&distance_10B10B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&tan_30B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGradOffset_00I30B10B10B10D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGrad_00I30B10B10B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLodOffset_00J20B00B20D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&log_00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGatherOffsets_00I10B10Dx4),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_gpu_shader5)>(
+        &textureGatherOffsetsExt_00I10B10Dx4),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_gpu_shader5)>(
+        &textureGatherOffsetsExt_00I10B10Dx4),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01Y20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01G20D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01R20D00D00D),
+        &imageAtomicMinExt_01Y20D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&floatBitsToInt_00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxVertexImageUniforms),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01c20D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01R20D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01c20D00D00D),
+        &imageAtomicXorExt_01c20D00D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00a20B00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01U00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicXorExt_01c20D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_00z10D00E),
+        &imageAtomicAndExt_01U00D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&sqrt_00B),
+    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(OES_EGL_image_external)>(
+        &texture2DProj_00M20B),
+    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(NV_EGL_stream_consumer_external)>(
+        &texture2DProj_00M20B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&log2_30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01C20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_00z10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01K10D00E),
+        &imageAtomicMaxExt_01C20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01F10D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01K10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01V10D00E),
+        &imageAtomicMinExt_01F10D00D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&clamp_20B00B00B),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&texture_00R10B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01B20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01V10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01A20D00E),
+        &imageAtomicExchangeExt_01B20D00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&ceil_10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGather_00l30B00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
+        &textureGatherExt_00l30B00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
+        &textureGatherExt_00l30B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01Q10D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01A20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01L20D00E),
+        &imageAtomicXorExt_01Q10D00D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&TableBase::m_gl_MaxSamplesES3_2),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(OES_sample_variables)>(
+        &TableBase::m_gl_MaxSamples),
+    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(EXT_shader_texture_lod)>(
+        &textureCubeLodEXT_00K20B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01L20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01W20D00E),
+        &imageAtomicAndExt_01D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01R20D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01W20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01C20D00E),
+        &imageAtomicMaxExt_01R20D00D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&matrixCompMult_A0BA0B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGatherOffset_00f20B00B10D),
+    Rule::Get<Spec::ESSL, 310, Shader::COMPUTE, 0>(&BuiltInVariable::kgl_NumWorkGroups),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01B20D00B),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01C20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01N20D00E),
+        &imageAtomicExchangeExt_01B20D00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01H20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01N20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01Y20D00E),
+        &imageAtomicXorExt_01H20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01f00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01Y20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01J00D00E),
+        &imageAtomicAndExt_01f00D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01W20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01J00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01U00D00E),
+        &imageAtomicAndExt_01W20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01P10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01U00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01f00D00E),
+        &imageAtomicOrExt_01P10D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureSize_00X00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&transpose_D0B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01H20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01f00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01B20D00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01B20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01M20D00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01M20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01X20D00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01X20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01H20D00E),
+        &imageAtomicAddExt_01H20D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&greaterThanEqual_20B20B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldInsert_30D30D00D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&notEqual_10B10B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&smoothstep_00B00B20B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGatherOffset_00L20B10D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00T20B00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&max_30E00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00f20B00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&findMSB_20D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&all_10F),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureSize_00r),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_buffer)>(&textureSizeExt_00r),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_buffer)>(&textureSizeExt_00r),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGrad_00J30B20B20B),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureOffset_00S20B20D00B),
+    Rule::Get<Spec::ESSL, 320, Shader::TESS_CONTROL_EXT, 0>(&TableBase::m_gl_BoundingBoxTCSES3_2),
+    Rule::Get<Spec::ESSL, 320, Shader::TESS_CONTROL_EXT, EXT_INDEX(EXT_tessellation_shader)>(
+        &TableBase::m_gl_BoundingBoxTCS),
+    Rule::Get<Spec::ESSL, 320, Shader::TESS_CONTROL_EXT, EXT_INDEX(OES_tessellation_shader)>(
+        &TableBase::m_gl_BoundingBoxTCS),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01P10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01H20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01S20D00E),
+        &imageAtomicOrExt_01P10D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&lessThan_10B10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01K10D00B),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01S20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01d20D00E),
+        &imageAtomicExchangeExt_01K10D00B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&mix_10B10B00B),
+    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(EXT_blend_func_extended)>(
+        &TableBase::m_gl_SecondaryFragDataEXT),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texelFetchOffset_00S20D00D20D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&exp_30B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitCount_20E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&frexp_30B30D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01T10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01d20D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01D00D00E),
+        &imageAtomicAndExt_01T10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01c20D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01O00D00E),
+        &imageAtomicMinExt_01c20D00D00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, EXT_INDEX(EXT_blend_func_extended)>(
+        &TableBase::m_gl_MaxDualSourceDrawBuffersEXT),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01V10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01O00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01Z00D00E),
+        &imageAtomicMinExt_01V10D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitCount_30E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&round_20B),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureOffset_00L20B10D00B),
+    Rule::Get<Spec::ESSL, 320, Shader::GEOMETRY, 0>(&EndPrimitiveES3_2_),
+    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY, EXT_INDEX(EXT_geometry_shader)>(&EndPrimitive_),
+    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY, EXT_INDEX(OES_geometry_shader)>(&EndPrimitive_),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01I10D00E00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01Z00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01E10D00E),
+        &imageAtomicCompSwapExt_01I10D00E00E),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProjOffset_00S30B20D00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&clamp_00D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01X20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01E10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01P10D00E),
+        &imageAtomicXorExt_01X20D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&floatBitsToInt_20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01f00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01P10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01a10D00E),
+        &imageAtomicExchangeExt_01f00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&TableBase::m_gl_MaxPatchVerticesES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
+        &TableBase::m_gl_MaxPatchVertices),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
+        &TableBase::m_gl_MaxPatchVertices),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01N20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01a10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01I10D00E),
+        &imageAtomicAndExt_01N20D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjOffset_00R20B10D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01S20D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01I10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01T10D00E),
+        &imageAtomicCompSwapExt_01S20D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01I10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01T10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01e10D00E),
+        &imageAtomicXorExt_01I10D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01H20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01e10D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01F10D00D00E),
+        &imageAtomicOrExt_01H20D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&clamp_10D10D10D),
+    Rule::Get<Spec::ESSL, 310, Shader::COMPUTE, 0>(&groupMemoryBarrier_),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&max_10D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&greaterThanEqual_30E30E),
+    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(EXT_shader_texture_lod)>(
+        &texture2DGradEXT_00I10B10B10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01Y20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01F10D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01Q10D00D00E),
+        &imageAtomicExchangeExt_01Y20D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&acosh_00B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&TableBase::m_gl_MaxFragmentUniformVectors),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&length_10B),
+    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, 0>(&texture2DProj_00I20B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGatherOffsets_00a20B10Dx400D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_gpu_shader5)>(
+        &textureGatherOffsetsExt_00a20B10Dx400D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_gpu_shader5)>(
+        &textureGatherOffsetsExt_00a20B10Dx400D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProj_00I20B),
+    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(OES_EGL_image_external)>(&texture2D_00M10B),
+    Rule::Get<Spec::ESSL, 100, Shader::ALL, EXT_INDEX(NV_EGL_stream_consumer_external)>(
+        &texture2D_00M10B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxFragmentImageUniforms),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&fwidth_10B),
+    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(OES_standard_derivatives)>(
+        &fwidthExt_10B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&clamp_10D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01T10D00B),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01Q10D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01b10D00D00E),
+        &imageAtomicExchangeExt_01T10D00B),
+    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&texture_00k30B00B),
+    Rule::Get<Spec::ESSL, 310, Shader::FRAGMENT, EXT_INDEX(OES_texture_cube_map_array)>(
+        &textureExt_00k30B00B),
+    Rule::Get<Spec::ESSL, 310, Shader::FRAGMENT, EXT_INDEX(EXT_texture_cube_map_array)>(
+        &textureExt_00k30B00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGatherOffset_00U20B10D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01O00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01b10D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01G20D00D00E),
+        &imageAtomicOrExt_01O00D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProjOffset_00R20B10D00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageStore_01S20D30D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
+        &imageStoreExt_01S20D30D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
+        &imageStoreExt_01S20D30D),
+    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&BuiltInVariable::kgl_LayerES3_2),
+    Rule::Get<Spec::ESSL, 320, Shader::GEOMETRY_EXT, 0>(&BuiltInVariable::kgl_LayerGSES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::FRAGMENT, EXT_INDEX(EXT_geometry_shader)>(
+        &BuiltInVariable::kgl_Layer),
+    Rule::Get<Spec::ESSL, 310, Shader::FRAGMENT, EXT_INDEX(OES_geometry_shader)>(
+        &BuiltInVariable::kgl_Layer),
+    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY_EXT, EXT_INDEX(EXT_geometry_shader)>(
+        &BuiltInVariable::kgl_LayerGS),
+    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY_EXT, EXT_INDEX(OES_geometry_shader)>(
+        &BuiltInVariable::kgl_LayerGS),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&uaddCarry_00E00E00E),
+    Rule::Get<Spec::ESSL, 320, Shader::GEOMETRY, 0>(&EmitVertexES3_2_),
+    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY, EXT_INDEX(EXT_geometry_shader)>(&EmitVertex_),
+    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY, EXT_INDEX(OES_geometry_shader)>(&EmitVertex_),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&distance_20B20B),
+    Rule::Get<Spec::ESSL,
+              300,
+              Shader::VERTEX,
+              EXT_INDEX(ANGLE_base_vertex_base_instance_shader_builtin)>(
+        &BuiltInVariable::kgl_BaseVertex),
+    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::ALL, 0>(
+        &beginInvocationInterlockARB_),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01O00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01G20D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01R20D00D00E),
+        &imageAtomicXorExt_01O00D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&findMSB_00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&TableBase::m_gl_MaxVertexAttribs),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01A20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01R20D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01c20D00D00E),
+        &imageAtomicXorExt_01A20D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(EXT_YUV_target)>(&textureSize_00N00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00Z20B00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&packUnorm4x8_30B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureSize_00S00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&equal_10D10D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&clamp_30B00B00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxCombinedImageUniforms),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01A20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01c20D00D00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_00z10D00D),
+        &imageAtomicAddExt_01A20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGatherOffsets_00f20B00B10Dx4),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_gpu_shader5)>(
+        &textureGatherOffsetsExt_00f20B00B10Dx4),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_gpu_shader5)>(
+        &textureGatherOffsetsExt_00f20B00B10Dx4),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01E10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_00z10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01K10D00D),
+        &imageAtomicOrExt_01E10D00D),
+    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::FRAGMENT, 0>(
+        &interpolateAtCenter_30B),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(EXT_YUV_target)>(&texture_00N10B00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicOr_00E00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00K20B),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&log_20B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicMax_00E00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicAnd_00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01F10D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01K10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01V10D00D),
+        &imageAtomicOrExt_01F10D00D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01R20D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01V10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01A20D00D),
+        &imageAtomicXorExt_01R20D00D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&lessThanEqual_30D30D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureSize_00I00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01T10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01A20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01L20D00D),
+        &imageAtomicXorExt_01T10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01O00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01L20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01W20D00D),
+        &imageAtomicAndExt_01O00D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01A20D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01W20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01C20D00D),
+        &imageAtomicCompSwapExt_01A20D00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&TableBase::m_gl_MaxGeometryOutputVerticesES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_geometry_shader)>(
+        &TableBase::m_gl_MaxGeometryOutputVertices),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_geometry_shader)>(
+        &TableBase::m_gl_MaxGeometryOutputVertices),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01T10D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01C20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01N20D00D),
+        &imageAtomicCompSwapExt_01T10D00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxComputeWorkGroupSize),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGrad_00X30B10B10B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLodOffset_00Y20B00B20D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&smoothstep_30B30B30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01W20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01N20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01Y20D00D),
+        &imageAtomicAndExt_01W20D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&TableBase::m_gl_DepthRange),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageStore_01A20D30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01F10D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01Y20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01J00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01J00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01U00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01U00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01f00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01f00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01B20D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01B20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01M20D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01M20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01X20D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01X20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01H20D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01H20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01S20D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01S20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01d20D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01d20D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01O00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01O00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01Z00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01Z00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01E10D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01E10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01P10D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01P10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01a10D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01a10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01I10D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01I10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01T10D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01T10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01e10D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01e10D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01F10D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01F10D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01Q10D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01Q10D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01b10D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01b10D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01G20D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01G20D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01R20D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01R20D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01c20D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01c20D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_00z10D00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_00z10D00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01K10D00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01K10D00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01V10D00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01V10D00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01A20D00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01A20D00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01L20D00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01L20D00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01W20D00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01W20D00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01C20D00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01C20D00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01N20D00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01N20D00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01Y20D00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01Y20D00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01J00D00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01J00D00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01U00D00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01U00D00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01f00D00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01f00D00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01B20D00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01B20D00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01M20D00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01M20D00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01X20D00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01X20D00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01H20D00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01H20D00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01S20D00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01S20D00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01d20D00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01d20D00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01D00D00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01D00D00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01O00D00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01O00D00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01Z00D00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01Z00D00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01E10D00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01E10D00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01P10D00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01P10D00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01a10D00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01a10D00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01I10D00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01I10D00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01T10D00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01T10D00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01e10D00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01e10D00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01F10D00D00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01F10D00D00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01Q10D00D00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01Q10D00D00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01b10D00D00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01b10D00D00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01G20D00D00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01G20D00D00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01R20D00D00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01R20D00D00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01c20D00D00B),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicExchangeExt_01c20D00D00B),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_00z10D00E00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_00z10D00E00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01K10D00E00E),
+        &imageAtomicAddExt_01F10D00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&mix_00D00D00F),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGatherOffset_00R10B10D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&texelFetch_00W20D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_storage_multisample_2d_array)>(
+        &texelFetchExt_00W20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(
+        &TableBase::m_gl_MaxTessEvaluationImageUniformsES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
+        &TableBase::m_gl_MaxTessEvaluationImageUniforms),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
+        &TableBase::m_gl_MaxTessEvaluationImageUniforms),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLodOffset_00J30B00B20D),
+    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(EXT_blend_func_extended)>(
+        &BuiltInVariable::kgl_SecondaryFragColorEXT),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01F10D00D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01K10D00E00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01V10D00E00E),
+        &imageAtomicAndExt_01F10D00D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01B20D00E00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01V10D00E00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01A20D00E00E),
+        &imageAtomicCompSwapExt_01B20D00E00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00T20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01S20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01A20D00E00E),
+        &imageAtomicMinExt_01S20D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&clamp_10E00E00E),
     Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01L20D00E00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
         &imageAtomicCompSwapExt_01L20D00E00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01W20D00E00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01d20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01W20D00E00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01C20D00E00E),
+        &imageAtomicMinExt_01d20D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&mix_10B10B10B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageSize_01L),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imulExtended_30D30D30D30D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&greaterThan_10E10E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGather_00s30B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_cube_map_array)>(
+        &textureGatherExt_00s30B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_cube_map_array)>(
+        &textureGatherExt_00s30B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxAtomicCounterBindings),
+    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&texture_00x30B00B),
+    Rule::Get<Spec::ESSL, 310, Shader::FRAGMENT, EXT_INDEX(OES_texture_cube_map_array)>(
+        &textureExt_00x30B00B),
+    Rule::Get<Spec::ESSL, 310, Shader::FRAGMENT, EXT_INDEX(EXT_texture_cube_map_array)>(
+        &textureExt_00x30B00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLod_00X10B00B),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureOffset_00J20B20D00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLodOffset_00I30B00B10D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01G20D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01C20D00E00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01N20D00E00E),
+        &imageAtomicXorExt_01G20D00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&min_10E00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01E10D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01N20D00E00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01Y20D00E00E),
+        &imageAtomicAndExt_01E10D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&greaterThan_20D20D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageLoad_01U00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_buffer)>(&imageLoadExt_01U00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_buffer)>(&imageLoadExt_01U00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLod_00K20B00B),
+    Rule::Get<Spec::ESSL, 100, Shader::VERTEX, 0>(&BuiltInVariable::kgl_PointSize),
+    Rule::Get<Spec::ESSL, 300, Shader::VERTEX, 0>(&BuiltInVariable::kgl_PointSize300),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01e10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01Y20D00E00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01J00D00E00E),
+        &imageAtomicOrExt_01e10D00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&step_00B20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01e10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01J00D00E00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01U00D00E00E),
+        &imageAtomicExchangeExt_01e10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01K10D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01U00D00E00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01f00D00E00E),
+        &imageAtomicXorExt_01K10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01S20D00E),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01f00D00E00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01B20D00E00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01B20D00E00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01M20D00E00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01M20D00E00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01X20D00E00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01X20D00E00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01H20D00E00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01H20D00E00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01S20D00E00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01S20D00E00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01d20D00E00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01d20D00E00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01D00D00E00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01D00D00E00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01O00D00E00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01O00D00E00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01Z00D00E00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01Z00D00E00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01E10D00E00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01E10D00E00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01P10D00E00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01P10D00E00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01a10D00E00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01a10D00E00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01I10D00E00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01I10D00E00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01T10D00E00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01T10D00E00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01e10D00E00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01e10D00E00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01F10D00D00E00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01F10D00D00E00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01Q10D00D00E00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01Q10D00D00E00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01b10D00D00E00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01b10D00D00E00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01G20D00D00E00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01G20D00D00E00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01R20D00D00E00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01R20D00D00E00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01c20D00D00E00E),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01c20D00D00E00E),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_00z10D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_00z10D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01K10D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01K10D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01V10D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01V10D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01A20D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01A20D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01L20D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01L20D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01W20D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01W20D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01C20D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01C20D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01N20D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01N20D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01Y20D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01Y20D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01J00D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01J00D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01U00D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01U00D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01f00D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01f00D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01B20D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01B20D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01M20D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01M20D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01X20D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01X20D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01H20D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01H20D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01S20D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01S20D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01d20D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01d20D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01D00D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01D00D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01O00D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01O00D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01Z00D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01Z00D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01E10D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01E10D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01P10D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01P10D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01a10D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01a10D00D00D),
+        &imageAtomicAddExt_01S20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageStore_01J00D30B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_buffer)>(
+        &imageStoreExt_01J00D30B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_buffer)>(
+        &imageStoreExt_01J00D30B),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_EGL_image_external_essl3)>(
+        &texture_00M10B00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageSize_01Y),
     Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01I10D00D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
         &imageAtomicCompSwapExt_01I10D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01T10D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01T10D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01e10D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01e10D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01F10D00D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01F10D00D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01Q10D00D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01Q10D00D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01b10D00D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01b10D00D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01G20D00D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01G20D00D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01R20D00D00D00D),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01R20D00D00D00D),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01c20D00D00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&texture_00I10B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01L20D00D),
     Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
-        &imageAtomicCompSwapExt_01c20D00D00D00D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ANGLE_shader_pixel_local_storage)>(
-        &pixelLocalLoadANGLE_01g),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ANGLE_shader_pixel_local_storage)>(
-        &pixelLocalLoadANGLE_01h),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ANGLE_shader_pixel_local_storage)>(
-        &pixelLocalLoadANGLE_01i),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ANGLE_shader_pixel_local_storage)>(
-        &pixelLocalStoreANGLE_01g30B),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ANGLE_shader_pixel_local_storage)>(
-        &pixelLocalStoreANGLE_01h30D),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ANGLE_shader_pixel_local_storage)>(
-        &pixelLocalStoreANGLE_01i30E),
-    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::ALL, 0>(
-        &beginInvocationInterlockNV_),
-    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::ALL, 0>(&endInvocationInterlockNV_),
-    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::ALL, 0>(
-        &beginFragmentShaderOrderingINTEL_),
-    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::ALL, 0>(
-        &beginInvocationInterlockARB_),
-    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::ALL, 0>(
-        &endInvocationInterlockARB_),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&memoryBarrier_),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&memoryBarrierAtomicCounter_),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&memoryBarrierBuffer_),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&memoryBarrierImage_),
-    Rule::Get<Spec::ESSL, 310, Shader::COMPUTE, 0>(&barrier_),
-    Rule::Get<Spec::ESSL, 320, Shader::TESS_CONTROL_EXT, 0>(&barrierTCSES3_2_),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(EXT_tessellation_shader)>(
-        &barrierTCS_),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(OES_tessellation_shader)>(
-        &barrierTCS_),
-    Rule::Get<Spec::ESSL, 310, Shader::COMPUTE, 0>(&memoryBarrierShared_),
-    Rule::Get<Spec::ESSL, 310, Shader::COMPUTE, 0>(&groupMemoryBarrier_),
-    Rule::Get<Spec::ESSL, 320, Shader::GEOMETRY, 0>(&EmitVertexES3_2_),
-    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY, EXT_INDEX(EXT_geometry_shader)>(&EmitVertex_),
-    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY, EXT_INDEX(OES_geometry_shader)>(&EmitVertex_),
-    Rule::Get<Spec::ESSL, 320, Shader::GEOMETRY, 0>(&EndPrimitiveES3_2_),
-    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY, EXT_INDEX(EXT_geometry_shader)>(&EndPrimitive_),
-    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY, EXT_INDEX(OES_geometry_shader)>(&EndPrimitive_),
-    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::ALL, 0>(&subpassLoad_01j),
-    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::ALL, 0>(&subpassLoad_01k),
-    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::ALL, 0>(&subpassLoad_01l),
-    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::ALL, 0>(&subpassLoad_01m00D),
-    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::ALL, 0>(&subpassLoad_01n00D),
-    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::ALL, 0>(&subpassLoad_01o00D),
-    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::FRAGMENT, 0>(&numSamples_),
-    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::FRAGMENT, 0>(&samplePosition_00E),
-    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::FRAGMENT, 0>(
-        &interpolateAtCenter_00B),
-    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::FRAGMENT, 0>(
-        &interpolateAtCenter_10B),
-    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::FRAGMENT, 0>(
-        &interpolateAtCenter_20B),
-    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::FRAGMENT, 0>(
-        &interpolateAtCenter_30B),
-    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::ALL, 0>(&saturate_00B),
-    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::ALL, 0>(&saturate_10B),
-    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::ALL, 0>(&saturate_20B),
-    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::ALL, 0>(&saturate_30B),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&TableBase::m_gl_DepthRangeParameters),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&TableBase::m_gl_DepthRange),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&BuiltInVariable::kgl_NumSamplesES3_2),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(OES_sample_variables)>(
-        &BuiltInVariable::kgl_NumSamples),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&TableBase::m_gl_MaxVertexAttribs),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&TableBase::m_gl_MaxVertexUniformVectors),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&TableBase::m_gl_MaxVertexTextureImageUnits),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&TableBase::m_gl_MaxCombinedTextureImageUnits),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&TableBase::m_gl_MaxTextureImageUnits),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&TableBase::m_gl_MaxFragmentUniformVectors),
-    Rule::Get<Spec::ESSL, 100, Shader::ALL, 0>(&TableBase::m_gl_MaxVaryingVectors),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&TableBase::m_gl_MaxDrawBuffers),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, EXT_INDEX(EXT_blend_func_extended)>(
-        &TableBase::m_gl_MaxDualSourceDrawBuffersEXT),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&TableBase::m_gl_MaxVertexOutputVectors),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&TableBase::m_gl_MaxFragmentInputVectors),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&TableBase::m_gl_MinProgramTexelOffset),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&TableBase::m_gl_MaxProgramTexelOffset),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxImageUnits),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxVertexImageUniforms),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxFragmentImageUniforms),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxComputeImageUniforms),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxCombinedImageUniforms),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxCombinedShaderOutputResources),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxComputeWorkGroupCount),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxComputeWorkGroupSize),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxComputeUniformComponents),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxComputeTextureImageUnits),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxComputeAtomicCounters),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxComputeAtomicCounterBuffers),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxVertexAtomicCounters),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxFragmentAtomicCounters),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxCombinedAtomicCounters),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxAtomicCounterBindings),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxVertexAtomicCounterBuffers),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxFragmentAtomicCounterBuffers),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxCombinedAtomicCounterBuffers),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&TableBase::m_gl_MaxAtomicCounterBufferSize),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&TableBase::m_gl_MaxGeometryInputComponentsES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_geometry_shader)>(
-        &TableBase::m_gl_MaxGeometryInputComponents),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_geometry_shader)>(
-        &TableBase::m_gl_MaxGeometryInputComponents),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&TableBase::m_gl_MaxGeometryOutputComponentsES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_geometry_shader)>(
-        &TableBase::m_gl_MaxGeometryOutputComponents),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_geometry_shader)>(
-        &TableBase::m_gl_MaxGeometryOutputComponents),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&TableBase::m_gl_MaxGeometryImageUniformsES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_geometry_shader)>(
-        &TableBase::m_gl_MaxGeometryImageUniforms),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_geometry_shader)>(
-        &TableBase::m_gl_MaxGeometryImageUniforms),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&TableBase::m_gl_MaxGeometryTextureImageUnitsES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_geometry_shader)>(
-        &TableBase::m_gl_MaxGeometryTextureImageUnits),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_geometry_shader)>(
-        &TableBase::m_gl_MaxGeometryTextureImageUnits),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&TableBase::m_gl_MaxGeometryOutputVerticesES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_geometry_shader)>(
-        &TableBase::m_gl_MaxGeometryOutputVertices),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_geometry_shader)>(
-        &TableBase::m_gl_MaxGeometryOutputVertices),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(
-        &TableBase::m_gl_MaxGeometryTotalOutputComponentsES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_geometry_shader)>(
-        &TableBase::m_gl_MaxGeometryTotalOutputComponents),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_geometry_shader)>(
-        &TableBase::m_gl_MaxGeometryTotalOutputComponents),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&TableBase::m_gl_MaxGeometryUniformComponentsES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_geometry_shader)>(
-        &TableBase::m_gl_MaxGeometryUniformComponents),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_geometry_shader)>(
-        &TableBase::m_gl_MaxGeometryUniformComponents),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&TableBase::m_gl_MaxGeometryAtomicCountersES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_geometry_shader)>(
-        &TableBase::m_gl_MaxGeometryAtomicCounters),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_geometry_shader)>(
-        &TableBase::m_gl_MaxGeometryAtomicCounters),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(
-        &TableBase::m_gl_MaxGeometryAtomicCounterBuffersES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_geometry_shader)>(
-        &TableBase::m_gl_MaxGeometryAtomicCounterBuffers),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_geometry_shader)>(
-        &TableBase::m_gl_MaxGeometryAtomicCounterBuffers),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&TableBase::m_gl_MaxTessControlInputComponentsES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
-        &TableBase::m_gl_MaxTessControlInputComponents),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
-        &TableBase::m_gl_MaxTessControlInputComponents),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(
-        &TableBase::m_gl_MaxTessControlOutputComponentsES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
-        &TableBase::m_gl_MaxTessControlOutputComponents),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
-        &TableBase::m_gl_MaxTessControlOutputComponents),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(
-        &TableBase::m_gl_MaxTessControlTextureImageUnitsES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
-        &TableBase::m_gl_MaxTessControlTextureImageUnits),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
-        &TableBase::m_gl_MaxTessControlTextureImageUnits),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(
-        &TableBase::m_gl_MaxTessControlUniformComponentsES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
-        &TableBase::m_gl_MaxTessControlUniformComponents),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
-        &TableBase::m_gl_MaxTessControlUniformComponents),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(
-        &TableBase::m_gl_MaxTessControlTotalOutputComponentsES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
-        &TableBase::m_gl_MaxTessControlTotalOutputComponents),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
-        &TableBase::m_gl_MaxTessControlTotalOutputComponents),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&TableBase::m_gl_MaxTessControlImageUniformsES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
-        &TableBase::m_gl_MaxTessControlImageUniforms),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
-        &TableBase::m_gl_MaxTessControlImageUniforms),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&TableBase::m_gl_MaxTessControlAtomicCountersES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
-        &TableBase::m_gl_MaxTessControlAtomicCounters),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
-        &TableBase::m_gl_MaxTessControlAtomicCounters),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(
-        &TableBase::m_gl_MaxTessControlAtomicCounterBuffersES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
-        &TableBase::m_gl_MaxTessControlAtomicCounterBuffers),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
-        &TableBase::m_gl_MaxTessControlAtomicCounterBuffers),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&TableBase::m_gl_MaxTessPatchComponentsES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
-        &TableBase::m_gl_MaxTessPatchComponents),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
-        &TableBase::m_gl_MaxTessPatchComponents),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&TableBase::m_gl_MaxPatchVerticesES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
-        &TableBase::m_gl_MaxPatchVertices),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
-        &TableBase::m_gl_MaxPatchVertices),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&TableBase::m_gl_MaxTessGenLevelES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
-        &TableBase::m_gl_MaxTessGenLevel),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
-        &TableBase::m_gl_MaxTessGenLevel),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(
-        &TableBase::m_gl_MaxTessEvaluationInputComponentsES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
-        &TableBase::m_gl_MaxTessEvaluationInputComponents),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
-        &TableBase::m_gl_MaxTessEvaluationInputComponents),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(
-        &TableBase::m_gl_MaxTessEvaluationOutputComponentsES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
-        &TableBase::m_gl_MaxTessEvaluationOutputComponents),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
-        &TableBase::m_gl_MaxTessEvaluationOutputComponents),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(
-        &TableBase::m_gl_MaxTessEvaluationTextureImageUnitsES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
-        &TableBase::m_gl_MaxTessEvaluationTextureImageUnits),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
-        &TableBase::m_gl_MaxTessEvaluationTextureImageUnits),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(
-        &TableBase::m_gl_MaxTessEvaluationUniformComponentsES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
-        &TableBase::m_gl_MaxTessEvaluationUniformComponents),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
-        &TableBase::m_gl_MaxTessEvaluationUniformComponents),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(
-        &TableBase::m_gl_MaxTessEvaluationImageUniformsES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
-        &TableBase::m_gl_MaxTessEvaluationImageUniforms),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
-        &TableBase::m_gl_MaxTessEvaluationImageUniforms),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(
-        &TableBase::m_gl_MaxTessEvaluationAtomicCountersES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
-        &TableBase::m_gl_MaxTessEvaluationAtomicCounters),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
-        &TableBase::m_gl_MaxTessEvaluationAtomicCounters),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(
-        &TableBase::m_gl_MaxTessEvaluationAtomicCounterBuffersES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
-        &TableBase::m_gl_MaxTessEvaluationAtomicCounterBuffers),
-    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
-        &TableBase::m_gl_MaxTessEvaluationAtomicCounterBuffers),
-    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&TableBase::m_gl_MaxSamplesES3_2),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(OES_sample_variables)>(
-        &TableBase::m_gl_MaxSamples),
-    Rule::Get<Spec::ESSL, 0, Shader::ALL, EXT_INDEX(APPLE_clip_distance)>(
-        &TableBase::m_gl_MaxClipDistancesAPPLE),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(EXT_clip_cull_distance)>(
-        &TableBase::m_gl_MaxClipDistances),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ANGLE_clip_cull_distance)>(
-        &TableBase::m_gl_MaxClipDistances),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(EXT_clip_cull_distance)>(
-        &TableBase::m_gl_MaxCullDistances),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ANGLE_clip_cull_distance)>(
-        &TableBase::m_gl_MaxCullDistances),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(EXT_clip_cull_distance)>(
-        &TableBase::m_gl_MaxCombinedClipAndCullDistances),
-    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ANGLE_clip_cull_distance)>(
-        &TableBase::m_gl_MaxCombinedClipAndCullDistances),
-    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, 0>(&BuiltInVariable::kgl_FragCoord),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&BuiltInVariable::kgl_FragCoord300),
-    Rule::Get<Spec::ESSL, 0, Shader::FRAGMENT, 0>(&BuiltInVariable::kgl_FrontFacing),
-    Rule::Get<Spec::ESSL, 0, Shader::FRAGMENT, 0>(&BuiltInVariable::kgl_PointCoord),
-    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, 0>(&BuiltInVariable::kgl_FragColor),
-    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, 0>(&TableBase::m_gl_FragData),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&BuiltInVariable::kgl_FragDepth),
-    Rule::Get<Spec::ESSL, 310, Shader::FRAGMENT, 0>(&BuiltInVariable::kgl_HelperInvocation),
-    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(EXT_blend_func_extended)>(
-        &BuiltInVariable::kgl_SecondaryFragColorEXT),
-    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(EXT_blend_func_extended)>(
-        &TableBase::m_gl_SecondaryFragDataEXT),
-    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(EXT_frag_depth)>(
-        &TableBase::m_gl_FragDepthEXT),
-    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(EXT_shader_framebuffer_fetch)>(
-        &TableBase::m_gl_LastFragData),
-    Rule::Get<Spec::ESSL,
-              100,
-              Shader::FRAGMENT,
-              EXT_INDEX(EXT_shader_framebuffer_fetch_non_coherent)>(&TableBase::m_gl_LastFragData),
-    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(NV_shader_framebuffer_fetch)>(
-        &TableBase::m_gl_LastFragDataNV),
-    Rule::Get<Spec::ESSL, 100, Shader::FRAGMENT, EXT_INDEX(NV_shader_framebuffer_fetch)>(
-        &BuiltInVariable::kgl_LastFragColor),
-    Rule::Get<Spec::ESSL, 0, Shader::FRAGMENT, EXT_INDEX(ARM_shader_framebuffer_fetch)>(
-        &BuiltInVariable::kgl_LastFragColorARM),
-    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&BuiltInVariable::kgl_PrimitiveIDES3_2),
-    Rule::Get<Spec::ESSL, 320, Shader::GEOMETRY_EXT, 0>(&BuiltInVariable::kgl_PrimitiveIDGSES3_2),
-    Rule::Get<Spec::ESSL, 320, Shader::TESS_CONTROL_EXT, 0>(
-        &BuiltInVariable::kgl_PrimitiveIDTCSES3_2),
-    Rule::Get<Spec::ESSL, 320, Shader::TESS_EVALUATION_EXT, 0>(
-        &BuiltInVariable::kgl_PrimitiveIDTESES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::FRAGMENT, EXT_INDEX(EXT_geometry_shader)>(
-        &BuiltInVariable::kgl_PrimitiveID),
-    Rule::Get<Spec::ESSL, 310, Shader::FRAGMENT, EXT_INDEX(OES_geometry_shader)>(
-        &BuiltInVariable::kgl_PrimitiveID),
-    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY_EXT, EXT_INDEX(EXT_geometry_shader)>(
-        &BuiltInVariable::kgl_PrimitiveIDGS),
-    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY_EXT, EXT_INDEX(OES_geometry_shader)>(
-        &BuiltInVariable::kgl_PrimitiveIDGS),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(EXT_tessellation_shader)>(
-        &BuiltInVariable::kgl_PrimitiveIDTCS),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(OES_tessellation_shader)>(
-        &BuiltInVariable::kgl_PrimitiveIDTCS),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_EVALUATION_EXT, EXT_INDEX(EXT_tessellation_shader)>(
-        &BuiltInVariable::kgl_PrimitiveIDTES),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_EVALUATION_EXT, EXT_INDEX(OES_tessellation_shader)>(
-        &BuiltInVariable::kgl_PrimitiveIDTES),
-    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&BuiltInVariable::kgl_LayerES3_2),
-    Rule::Get<Spec::ESSL, 320, Shader::GEOMETRY_EXT, 0>(&BuiltInVariable::kgl_LayerGSES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::FRAGMENT, EXT_INDEX(EXT_geometry_shader)>(
-        &BuiltInVariable::kgl_Layer),
-    Rule::Get<Spec::ESSL, 310, Shader::FRAGMENT, EXT_INDEX(OES_geometry_shader)>(
-        &BuiltInVariable::kgl_Layer),
-    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY_EXT, EXT_INDEX(EXT_geometry_shader)>(
-        &BuiltInVariable::kgl_LayerGS),
-    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY_EXT, EXT_INDEX(OES_geometry_shader)>(
-        &BuiltInVariable::kgl_LayerGS),
-    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&BuiltInVariable::kgl_SampleIDES3_2),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_sample_variables)>(
-        &BuiltInVariable::kgl_SampleID),
-    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&BuiltInVariable::kgl_SamplePositionES3_2),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_sample_variables)>(
-        &BuiltInVariable::kgl_SamplePosition),
-    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&TableBase::m_gl_SampleMaskInES3_2),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_sample_variables)>(
-        &TableBase::m_gl_SampleMaskIn),
-    Rule::Get<Spec::ESSL, 320, Shader::FRAGMENT, 0>(&TableBase::m_gl_SampleMaskES3_2),
-    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, EXT_INDEX(OES_sample_variables)>(
-        &TableBase::m_gl_SampleMask),
-    Rule::Get<Spec::ESSL, 0, Shader::VERTEX, 0>(&BuiltInVariable::kgl_Position),
-    Rule::Get<Spec::ESSL, 320, Shader::GEOMETRY_EXT, 0>(&TableBase::m_gl_PositionGSES3_2),
-    Rule::Get<Spec::ESSL, 320, Shader::TESS_CONTROL_EXT, 0>(&TableBase::m_gl_PositionTCSES3_2),
-    Rule::Get<Spec::ESSL, 320, Shader::TESS_EVALUATION_EXT, 0>(&TableBase::m_gl_PositionTESES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY_EXT, EXT_INDEX(EXT_geometry_shader)>(
-        &TableBase::m_gl_PositionGS),
-    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY_EXT, EXT_INDEX(OES_geometry_shader)>(
-        &TableBase::m_gl_PositionGS),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(EXT_tessellation_shader)>(
-        &TableBase::m_gl_PositionTCS),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(OES_tessellation_shader)>(
-        &TableBase::m_gl_PositionTCS),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_EVALUATION_EXT, EXT_INDEX(EXT_tessellation_shader)>(
-        &TableBase::m_gl_PositionTES),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_EVALUATION_EXT, EXT_INDEX(OES_tessellation_shader)>(
-        &TableBase::m_gl_PositionTES),
-    Rule::Get<Spec::ESSL, 100, Shader::VERTEX, 0>(&BuiltInVariable::kgl_PointSize),
-    Rule::Get<Spec::ESSL, 300, Shader::VERTEX, 0>(&BuiltInVariable::kgl_PointSize300),
-    Rule::Get<Spec::ESSL, 300, Shader::VERTEX, 0>(&BuiltInVariable::kgl_InstanceID),
-    Rule::Get<Spec::ESSL, 300, Shader::VERTEX, 0>(&BuiltInVariable::kgl_VertexID),
-    Rule::Get<Spec::ESSL, 0, Shader::VERTEX, EXT_INDEX(ANGLE_multi_draw)>(
-        &BuiltInVariable::kgl_DrawID),
-    Rule::Get<Spec::ESSL,
-              300,
-              Shader::VERTEX,
-              EXT_INDEX(ANGLE_base_vertex_base_instance_shader_builtin)>(
-        &BuiltInVariable::kgl_BaseVertex),
-    Rule::Get<Spec::ESSL,
-              300,
-              Shader::VERTEX,
-              EXT_INDEX(ANGLE_base_vertex_base_instance_shader_builtin)>(
-        &BuiltInVariable::kgl_BaseInstance),
-    Rule::Get<Spec::ESSL,
-              0,
-              Shader::VERTEX,
-              EXT_INDEX(ANGLE_base_vertex_base_instance_shader_builtin)>(
-        &BuiltInVariable::kangle_BaseVertex),
-    Rule::Get<Spec::ESSL,
-              0,
-              Shader::VERTEX,
-              EXT_INDEX(ANGLE_base_vertex_base_instance_shader_builtin)>(
-        &BuiltInVariable::kangle_BaseInstance),
-    Rule::Get<Spec::ESSL, 0, Shader::VERTEX, EXT_INDEX(APPLE_clip_distance)>(
-        &TableBase::m_gl_ClipDistanceAPPLE),
-    Rule::Get<Spec::ESSL, 300, Shader::NOT_COMPUTE, EXT_INDEX(EXT_clip_cull_distance)>(
-        &TableBase::m_gl_ClipDistance),
-    Rule::Get<Spec::ESSL, 300, Shader::NOT_COMPUTE, EXT_INDEX(ANGLE_clip_cull_distance)>(
-        &TableBase::m_gl_ClipDistance),
-    Rule::Get<Spec::ESSL, 310, Shader::COMPUTE, 0>(&BuiltInVariable::kgl_NumWorkGroups),
-    Rule::Get<Spec::ESSL, 310, Shader::COMPUTE, 0>(&BuiltInVariable::kgl_WorkGroupSize),
-    Rule::Get<Spec::ESSL, 310, Shader::COMPUTE, 0>(&BuiltInVariable::kgl_WorkGroupID),
-    Rule::Get<Spec::ESSL, 310, Shader::COMPUTE, 0>(&BuiltInVariable::kgl_LocalInvocationID),
-    Rule::Get<Spec::ESSL, 310, Shader::COMPUTE, 0>(&BuiltInVariable::kgl_GlobalInvocationID),
-    Rule::Get<Spec::ESSL, 310, Shader::COMPUTE, 0>(&BuiltInVariable::kgl_LocalInvocationIndex),
-    Rule::Get<Spec::ESSL, 320, Shader::GEOMETRY_EXT, 0>(&BuiltInVariable::kgl_PrimitiveIDInES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY_EXT, EXT_INDEX(EXT_geometry_shader)>(
-        &BuiltInVariable::kgl_PrimitiveIDIn),
-    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY_EXT, EXT_INDEX(OES_geometry_shader)>(
-        &BuiltInVariable::kgl_PrimitiveIDIn),
-    Rule::Get<Spec::ESSL, 320, Shader::GEOMETRY_EXT, 0>(&BuiltInVariable::kgl_InvocationIDES3_2),
-    Rule::Get<Spec::ESSL, 320, Shader::TESS_CONTROL_EXT, 0>(
-        &BuiltInVariable::kgl_InvocationIDTCSES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY_EXT, EXT_INDEX(EXT_geometry_shader)>(
-        &BuiltInVariable::kgl_InvocationID),
-    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY_EXT, EXT_INDEX(OES_geometry_shader)>(
-        &BuiltInVariable::kgl_InvocationID),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(EXT_tessellation_shader)>(
-        &BuiltInVariable::kgl_InvocationIDTCS),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(OES_tessellation_shader)>(
-        &BuiltInVariable::kgl_InvocationIDTCS),
-    Rule::Get<Spec::ESSL, 320, Shader::GEOMETRY_EXT, 0>(&TableBase::m_gl_PerVertexES3_2),
-    Rule::Get<Spec::ESSL, 320, Shader::TESS_CONTROL_EXT, 0>(&TableBase::m_gl_PerVertexTCSES3_2),
-    Rule::Get<Spec::ESSL, 320, Shader::TESS_EVALUATION_EXT, 0>(&TableBase::m_gl_PerVertexTESES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY_EXT, EXT_INDEX(EXT_geometry_shader)>(
-        &TableBase::m_gl_PerVertex),
-    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY_EXT, EXT_INDEX(OES_geometry_shader)>(
-        &TableBase::m_gl_PerVertex),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(EXT_tessellation_shader)>(
-        &TableBase::m_gl_PerVertexTCS),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(OES_tessellation_shader)>(
-        &TableBase::m_gl_PerVertexTCS),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_EVALUATION_EXT, EXT_INDEX(EXT_tessellation_shader)>(
-        &TableBase::m_gl_PerVertexTES),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_EVALUATION_EXT, EXT_INDEX(OES_tessellation_shader)>(
-        &TableBase::m_gl_PerVertexTES),
-    Rule::Get<Spec::ESSL, 320, Shader::GEOMETRY_EXT, 0>(&TableBase::m_gl_inES3_2),
-    Rule::Get<Spec::ESSL, 320, Shader::TESS_CONTROL_EXT, 0>(&TableBase::m_gl_inTCSES3_2),
-    Rule::Get<Spec::ESSL, 320, Shader::TESS_EVALUATION_EXT, 0>(&TableBase::m_gl_inTESES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY_EXT, EXT_INDEX(EXT_geometry_shader)>(
-        &TableBase::m_gl_in),
-    Rule::Get<Spec::ESSL, 310, Shader::GEOMETRY_EXT, EXT_INDEX(OES_geometry_shader)>(
-        &TableBase::m_gl_in),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(EXT_tessellation_shader)>(
-        &TableBase::m_gl_inTCS),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(OES_tessellation_shader)>(
-        &TableBase::m_gl_inTCS),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_EVALUATION_EXT, EXT_INDEX(EXT_tessellation_shader)>(
-        &TableBase::m_gl_inTES),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_EVALUATION_EXT, EXT_INDEX(OES_tessellation_shader)>(
-        &TableBase::m_gl_inTES),
-    Rule::Get<Spec::ESSL, 320, Shader::TESS_CONTROL_EXT, 0>(
-        &BuiltInVariable::kgl_PatchVerticesInTCSES3_2),
-    Rule::Get<Spec::ESSL, 320, Shader::TESS_EVALUATION_EXT, 0>(
-        &BuiltInVariable::kgl_PatchVerticesInTESES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(EXT_tessellation_shader)>(
-        &BuiltInVariable::kgl_PatchVerticesInTCS),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(OES_tessellation_shader)>(
-        &BuiltInVariable::kgl_PatchVerticesInTCS),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_EVALUATION_EXT, EXT_INDEX(EXT_tessellation_shader)>(
-        &BuiltInVariable::kgl_PatchVerticesInTES),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_EVALUATION_EXT, EXT_INDEX(OES_tessellation_shader)>(
-        &BuiltInVariable::kgl_PatchVerticesInTES),
-    Rule::Get<Spec::ESSL, 320, Shader::TESS_CONTROL_EXT, 0>(
-        &TableBase::m_gl_TessLevelOuterTCSES3_2),
-    Rule::Get<Spec::ESSL, 320, Shader::TESS_EVALUATION_EXT, 0>(
-        &TableBase::m_gl_TessLevelOuterTESES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(EXT_tessellation_shader)>(
-        &TableBase::m_gl_TessLevelOuterTCS),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(OES_tessellation_shader)>(
-        &TableBase::m_gl_TessLevelOuterTCS),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_EVALUATION_EXT, EXT_INDEX(EXT_tessellation_shader)>(
-        &TableBase::m_gl_TessLevelOuterTES),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_EVALUATION_EXT, EXT_INDEX(OES_tessellation_shader)>(
-        &TableBase::m_gl_TessLevelOuterTES),
-    Rule::Get<Spec::ESSL, 320, Shader::TESS_CONTROL_EXT, 0>(
-        &TableBase::m_gl_TessLevelInnerTCSES3_2),
-    Rule::Get<Spec::ESSL, 320, Shader::TESS_EVALUATION_EXT, 0>(
-        &TableBase::m_gl_TessLevelInnerTESES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(EXT_tessellation_shader)>(
-        &TableBase::m_gl_TessLevelInnerTCS),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(OES_tessellation_shader)>(
-        &TableBase::m_gl_TessLevelInnerTCS),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_EVALUATION_EXT, EXT_INDEX(EXT_tessellation_shader)>(
-        &TableBase::m_gl_TessLevelInnerTES),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_EVALUATION_EXT, EXT_INDEX(OES_tessellation_shader)>(
-        &TableBase::m_gl_TessLevelInnerTES),
-    Rule::Get<Spec::ESSL, 320, Shader::TESS_CONTROL_EXT, 0>(&TableBase::m_gl_outTCSES3_2),
-    Rule::Get<Spec::ESSL, 320, Shader::TESS_EVALUATION_EXT, 0>(&TableBase::m_gl_outTESES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(EXT_tessellation_shader)>(
-        &TableBase::m_gl_outTCS),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(OES_tessellation_shader)>(
-        &TableBase::m_gl_outTCS),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_EVALUATION_EXT, EXT_INDEX(EXT_tessellation_shader)>(
-        &TableBase::m_gl_outTES),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_EVALUATION_EXT, EXT_INDEX(OES_tessellation_shader)>(
-        &TableBase::m_gl_outTES),
-    Rule::Get<Spec::ESSL, 320, Shader::TESS_CONTROL_EXT, 0>(&TableBase::m_gl_BoundingBoxTCSES3_2),
-    Rule::Get<Spec::ESSL, 320, Shader::TESS_CONTROL_EXT, EXT_INDEX(EXT_tessellation_shader)>(
-        &TableBase::m_gl_BoundingBoxTCS),
-    Rule::Get<Spec::ESSL, 320, Shader::TESS_CONTROL_EXT, EXT_INDEX(OES_tessellation_shader)>(
-        &TableBase::m_gl_BoundingBoxTCS),
-    Rule::Get<Spec::ESSL, 320, Shader::TESS_CONTROL_EXT, 0>(
-        &TableBase::m_gl_BoundingBoxEXTTCSES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(EXT_tessellation_shader)>(
-        &TableBase::m_gl_BoundingBoxEXTTCS),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(OES_tessellation_shader)>(
-        &TableBase::m_gl_BoundingBoxEXTTCS),
-    Rule::Get<Spec::ESSL, 320, Shader::TESS_CONTROL_EXT, 0>(
-        &TableBase::m_gl_BoundingBoxOESTCSES3_2),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(EXT_tessellation_shader)>(
-        &TableBase::m_gl_BoundingBoxOESTCS),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_CONTROL_EXT, EXT_INDEX(OES_tessellation_shader)>(
-        &TableBase::m_gl_BoundingBoxOESTCS),
-    Rule::Get<Spec::ESSL, 310, Shader::TESS_EVALUATION_EXT, 0>(&BuiltInVariable::kgl_TessCoord),
-    Rule::Get<Spec::ESSL, 300, Shader::NOT_COMPUTE, EXT_INDEX(OVR_multiview)>(
-        &BuiltInVariable::kgl_ViewID_OVR),
-    Rule::Get<Spec::ESSL, 300, Shader::NOT_COMPUTE, EXT_INDEX(EXT_clip_cull_distance)>(
-        &TableBase::m_gl_CullDistance),
-    Rule::Get<Spec::ESSL, 300, Shader::NOT_COMPUTE, EXT_INDEX(ANGLE_clip_cull_distance)>(
-        &TableBase::m_gl_CullDistance)};
-
-// Flat array of all mangled names.
-constexpr const char *kMangledNames[] = {"radians(00B",
-                                         "radians(10B",
-                                         "radians(20B",
-                                         "radians(30B",
-                                         "degrees(00B",
-                                         "degrees(10B",
-                                         "degrees(20B",
-                                         "degrees(30B",
-                                         "sin(00B",
-                                         "sin(10B",
-                                         "sin(20B",
-                                         "sin(30B",
-                                         "cos(00B",
-                                         "cos(10B",
-                                         "cos(20B",
-                                         "cos(30B",
-                                         "tan(00B",
-                                         "tan(10B",
-                                         "tan(20B",
-                                         "tan(30B",
-                                         "asin(00B",
-                                         "asin(10B",
-                                         "asin(20B",
-                                         "asin(30B",
-                                         "acos(00B",
-                                         "acos(10B",
-                                         "acos(20B",
-                                         "acos(30B",
-                                         "atan(00B00B",
-                                         "atan(10B10B",
-                                         "atan(20B20B",
-                                         "atan(30B30B",
-                                         "atan(00B",
-                                         "atan(10B",
-                                         "atan(20B",
-                                         "atan(30B",
-                                         "sinh(00B",
-                                         "sinh(10B",
-                                         "sinh(20B",
-                                         "sinh(30B",
-                                         "cosh(00B",
-                                         "cosh(10B",
-                                         "cosh(20B",
-                                         "cosh(30B",
-                                         "tanh(00B",
-                                         "tanh(10B",
-                                         "tanh(20B",
-                                         "tanh(30B",
-                                         "asinh(00B",
-                                         "asinh(10B",
-                                         "asinh(20B",
-                                         "asinh(30B",
-                                         "acosh(00B",
-                                         "acosh(10B",
-                                         "acosh(20B",
-                                         "acosh(30B",
-                                         "atanh(00B",
-                                         "atanh(10B",
-                                         "atanh(20B",
-                                         "atanh(30B",
-                                         "pow(00B00B",
-                                         "pow(10B10B",
-                                         "pow(20B20B",
-                                         "pow(30B30B",
-                                         "exp(00B",
-                                         "exp(10B",
-                                         "exp(20B",
-                                         "exp(30B",
-                                         "log(00B",
-                                         "log(10B",
-                                         "log(20B",
-                                         "log(30B",
-                                         "exp2(00B",
-                                         "exp2(10B",
-                                         "exp2(20B",
-                                         "exp2(30B",
-                                         "log2(00B",
-                                         "log2(10B",
-                                         "log2(20B",
-                                         "log2(30B",
-                                         "sqrt(00B",
-                                         "sqrt(10B",
-                                         "sqrt(20B",
-                                         "sqrt(30B",
-                                         "inversesqrt(00B",
-                                         "inversesqrt(10B",
-                                         "inversesqrt(20B",
-                                         "inversesqrt(30B",
-                                         "abs(00B",
-                                         "abs(10B",
-                                         "abs(20B",
-                                         "abs(30B",
-                                         "abs(00D",
-                                         "abs(10D",
-                                         "abs(20D",
-                                         "abs(30D",
-                                         "sign(00B",
-                                         "sign(10B",
-                                         "sign(20B",
-                                         "sign(30B",
-                                         "sign(00D",
-                                         "sign(10D",
-                                         "sign(20D",
-                                         "sign(30D",
-                                         "floor(00B",
-                                         "floor(10B",
-                                         "floor(20B",
-                                         "floor(30B",
-                                         "trunc(00B",
-                                         "trunc(10B",
-                                         "trunc(20B",
-                                         "trunc(30B",
-                                         "round(00B",
-                                         "round(10B",
-                                         "round(20B",
-                                         "round(30B",
-                                         "roundEven(00B",
-                                         "roundEven(10B",
-                                         "roundEven(20B",
-                                         "roundEven(30B",
-                                         "ceil(00B",
-                                         "ceil(10B",
-                                         "ceil(20B",
-                                         "ceil(30B",
-                                         "fract(00B",
-                                         "fract(10B",
-                                         "fract(20B",
-                                         "fract(30B",
-                                         "mod(00B00B",
-                                         "mod(10B00B",
-                                         "mod(20B00B",
-                                         "mod(30B00B",
-                                         "mod(10B10B",
-                                         "mod(20B20B",
-                                         "mod(30B30B",
-                                         "min(00B00B",
-                                         "min(10B00B",
-                                         "min(20B00B",
-                                         "min(30B00B",
-                                         "min(10B10B",
-                                         "min(20B20B",
-                                         "min(30B30B",
-                                         "min(00D00D",
-                                         "min(10D10D",
-                                         "min(20D20D",
-                                         "min(30D30D",
-                                         "min(10D00D",
-                                         "min(20D00D",
-                                         "min(30D00D",
-                                         "min(00E00E",
-                                         "min(10E10E",
-                                         "min(20E20E",
-                                         "min(30E30E",
-                                         "min(10E00E",
-                                         "min(20E00E",
-                                         "min(30E00E",
-                                         "max(00B00B",
-                                         "max(10B00B",
-                                         "max(20B00B",
-                                         "max(30B00B",
-                                         "max(10B10B",
-                                         "max(20B20B",
-                                         "max(30B30B",
-                                         "max(00D00D",
-                                         "max(10D10D",
-                                         "max(20D20D",
-                                         "max(30D30D",
-                                         "max(10D00D",
-                                         "max(20D00D",
-                                         "max(30D00D",
-                                         "max(00E00E",
-                                         "max(10E10E",
-                                         "max(20E20E",
-                                         "max(30E30E",
-                                         "max(10E00E",
-                                         "max(20E00E",
-                                         "max(30E00E",
-                                         "clamp(00B00B00B",
-                                         "clamp(10B00B00B",
-                                         "clamp(20B00B00B",
-                                         "clamp(30B00B00B",
-                                         "clamp(10B10B10B",
-                                         "clamp(20B20B20B",
-                                         "clamp(30B30B30B",
-                                         "clamp(00D00D00D",
-                                         "clamp(10D00D00D",
-                                         "clamp(20D00D00D",
-                                         "clamp(30D00D00D",
-                                         "clamp(10D10D10D",
-                                         "clamp(20D20D20D",
-                                         "clamp(30D30D30D",
-                                         "clamp(00E00E00E",
-                                         "clamp(10E00E00E",
-                                         "clamp(20E00E00E",
-                                         "clamp(30E00E00E",
-                                         "clamp(10E10E10E",
-                                         "clamp(20E20E20E",
-                                         "clamp(30E30E30E",
-                                         "mix(00B00B00B",
-                                         "mix(10B10B00B",
-                                         "mix(20B20B00B",
-                                         "mix(30B30B00B",
-                                         "mix(10B10B10B",
-                                         "mix(20B20B20B",
-                                         "mix(30B30B30B",
-                                         "mix(00B00B00F",
-                                         "mix(10B10B10F",
-                                         "mix(20B20B20F",
-                                         "mix(30B30B30F",
-                                         "mix(00D00D00F",
-                                         "mix(10D10D10F",
-                                         "mix(20D20D20F",
-                                         "mix(30D30D30F",
-                                         "mix(00E00E00F",
-                                         "mix(10E10E10F",
-                                         "mix(20E20E20F",
-                                         "mix(30E30E30F",
-                                         "mix(00F00F00F",
-                                         "mix(10F10F10F",
-                                         "mix(20F20F20F",
-                                         "mix(30F30F30F",
-                                         "step(00B00B",
-                                         "step(10B10B",
-                                         "step(20B20B",
-                                         "step(30B30B",
-                                         "step(00B10B",
-                                         "step(00B20B",
-                                         "step(00B30B",
-                                         "smoothstep(00B00B00B",
-                                         "smoothstep(10B10B10B",
-                                         "smoothstep(20B20B20B",
-                                         "smoothstep(30B30B30B",
-                                         "smoothstep(00B00B10B",
-                                         "smoothstep(00B00B20B",
-                                         "smoothstep(00B00B30B",
-                                         "modf(00B00B",
-                                         "modf(10B10B",
-                                         "modf(20B20B",
-                                         "modf(30B30B",
-                                         "isnan(00B",
-                                         "isnan(10B",
-                                         "isnan(20B",
-                                         "isnan(30B",
-                                         "isinf(00B",
-                                         "isinf(10B",
-                                         "isinf(20B",
-                                         "isinf(30B",
-                                         "floatBitsToInt(00B",
-                                         "floatBitsToInt(10B",
-                                         "floatBitsToInt(20B",
-                                         "floatBitsToInt(30B",
-                                         "floatBitsToUint(00B",
-                                         "floatBitsToUint(10B",
-                                         "floatBitsToUint(20B",
-                                         "floatBitsToUint(30B",
-                                         "intBitsToFloat(00D",
-                                         "intBitsToFloat(10D",
-                                         "intBitsToFloat(20D",
-                                         "intBitsToFloat(30D",
-                                         "uintBitsToFloat(00E",
-                                         "uintBitsToFloat(10E",
-                                         "uintBitsToFloat(20E",
-                                         "uintBitsToFloat(30E",
-                                         "fma(00B00B00B",
-                                         "fma(10B10B10B",
-                                         "fma(20B20B20B",
-                                         "fma(30B30B30B",
-                                         "frexp(00B00D",
-                                         "frexp(10B10D",
-                                         "frexp(20B20D",
-                                         "frexp(30B30D",
-                                         "ldexp(00B00D",
-                                         "ldexp(10B10D",
-                                         "ldexp(20B20D",
-                                         "ldexp(30B30D",
-                                         "packSnorm2x16(10B",
-                                         "packHalf2x16(10B",
-                                         "unpackSnorm2x16(00E",
-                                         "unpackHalf2x16(00E",
-                                         "packUnorm2x16(10B",
-                                         "unpackUnorm2x16(00E",
-                                         "packUnorm4x8(30B",
-                                         "packSnorm4x8(30B",
-                                         "unpackUnorm4x8(00E",
-                                         "unpackSnorm4x8(00E",
-                                         "length(00B",
-                                         "length(10B",
-                                         "length(20B",
-                                         "length(30B",
-                                         "distance(00B00B",
-                                         "distance(10B10B",
-                                         "distance(20B20B",
-                                         "distance(30B30B",
-                                         "dot(00B00B",
-                                         "dot(10B10B",
-                                         "dot(20B20B",
-                                         "dot(30B30B",
-                                         "cross(20B20B",
-                                         "normalize(00B",
-                                         "normalize(10B",
-                                         "normalize(20B",
-                                         "normalize(30B",
-                                         "faceforward(00B00B00B",
-                                         "faceforward(10B10B10B",
-                                         "faceforward(20B20B20B",
-                                         "faceforward(30B30B30B",
-                                         "reflect(00B00B",
-                                         "reflect(10B10B",
-                                         "reflect(20B20B",
-                                         "reflect(30B30B",
-                                         "refract(00B00B00B",
-                                         "refract(10B10B00B",
-                                         "refract(20B20B00B",
-                                         "refract(30B30B00B",
-                                         "matrixCompMult(50B50B",
-                                         "matrixCompMult(A0BA0B",
-                                         "matrixCompMult(F0BF0B",
-                                         "matrixCompMult(90B90B",
-                                         "matrixCompMult(60B60B",
-                                         "matrixCompMult(D0BD0B",
-                                         "matrixCompMult(70B70B",
-                                         "matrixCompMult(E0BE0B",
-                                         "matrixCompMult(B0BB0B",
-                                         "outerProduct(10B10B",
-                                         "outerProduct(20B20B",
-                                         "outerProduct(30B30B",
-                                         "outerProduct(20B10B",
-                                         "outerProduct(10B20B",
-                                         "outerProduct(30B10B",
-                                         "outerProduct(10B30B",
-                                         "outerProduct(30B20B",
-                                         "outerProduct(20B30B",
-                                         "transpose(50B",
-                                         "transpose(A0B",
-                                         "transpose(F0B",
-                                         "transpose(60B",
-                                         "transpose(90B",
-                                         "transpose(70B",
-                                         "transpose(D0B",
-                                         "transpose(B0B",
-                                         "transpose(E0B",
-                                         "determinant(50B",
-                                         "determinant(A0B",
-                                         "determinant(F0B",
-                                         "inverse(50B",
-                                         "inverse(A0B",
-                                         "inverse(F0B",
-                                         "lessThan(10B10B",
-                                         "lessThan(20B20B",
-                                         "lessThan(30B30B",
-                                         "lessThan(10D10D",
-                                         "lessThan(20D20D",
-                                         "lessThan(30D30D",
-                                         "lessThan(10E10E",
-                                         "lessThan(20E20E",
-                                         "lessThan(30E30E",
-                                         "lessThanEqual(10B10B",
-                                         "lessThanEqual(20B20B",
-                                         "lessThanEqual(30B30B",
-                                         "lessThanEqual(10D10D",
-                                         "lessThanEqual(20D20D",
-                                         "lessThanEqual(30D30D",
-                                         "lessThanEqual(10E10E",
-                                         "lessThanEqual(20E20E",
-                                         "lessThanEqual(30E30E",
-                                         "greaterThan(10B10B",
-                                         "greaterThan(20B20B",
-                                         "greaterThan(30B30B",
-                                         "greaterThan(10D10D",
-                                         "greaterThan(20D20D",
-                                         "greaterThan(30D30D",
-                                         "greaterThan(10E10E",
-                                         "greaterThan(20E20E",
-                                         "greaterThan(30E30E",
-                                         "greaterThanEqual(10B10B",
-                                         "greaterThanEqual(20B20B",
-                                         "greaterThanEqual(30B30B",
-                                         "greaterThanEqual(10D10D",
-                                         "greaterThanEqual(20D20D",
-                                         "greaterThanEqual(30D30D",
-                                         "greaterThanEqual(10E10E",
-                                         "greaterThanEqual(20E20E",
-                                         "greaterThanEqual(30E30E",
-                                         "equal(10B10B",
-                                         "equal(20B20B",
-                                         "equal(30B30B",
-                                         "equal(10D10D",
-                                         "equal(20D20D",
-                                         "equal(30D30D",
-                                         "equal(10E10E",
-                                         "equal(20E20E",
-                                         "equal(30E30E",
-                                         "equal(10F10F",
-                                         "equal(20F20F",
-                                         "equal(30F30F",
-                                         "notEqual(10B10B",
-                                         "notEqual(20B20B",
-                                         "notEqual(30B30B",
-                                         "notEqual(10D10D",
-                                         "notEqual(20D20D",
-                                         "notEqual(30D30D",
-                                         "notEqual(10E10E",
-                                         "notEqual(20E20E",
-                                         "notEqual(30E30E",
-                                         "notEqual(10F10F",
-                                         "notEqual(20F20F",
-                                         "notEqual(30F30F",
-                                         "any(10F",
-                                         "any(20F",
-                                         "any(30F",
-                                         "all(10F",
-                                         "all(20F",
-                                         "all(30F",
-                                         "not(10F",
-                                         "not(20F",
-                                         "not(30F",
-                                         "bitfieldExtract(00D00D00D",
-                                         "bitfieldExtract(10D00D00D",
-                                         "bitfieldExtract(20D00D00D",
-                                         "bitfieldExtract(30D00D00D",
-                                         "bitfieldExtract(00E00D00D",
-                                         "bitfieldExtract(10E00D00D",
-                                         "bitfieldExtract(20E00D00D",
-                                         "bitfieldExtract(30E00D00D",
-                                         "bitfieldInsert(00D00D00D00D",
-                                         "bitfieldInsert(10D10D00D00D",
-                                         "bitfieldInsert(20D20D00D00D",
-                                         "bitfieldInsert(30D30D00D00D",
-                                         "bitfieldInsert(00E00E00D00D",
-                                         "bitfieldInsert(10E10E00D00D",
-                                         "bitfieldInsert(20E20E00D00D",
-                                         "bitfieldInsert(30E30E00D00D",
-                                         "bitfieldReverse(00D",
-                                         "bitfieldReverse(10D",
-                                         "bitfieldReverse(20D",
-                                         "bitfieldReverse(30D",
-                                         "bitfieldReverse(00E",
-                                         "bitfieldReverse(10E",
-                                         "bitfieldReverse(20E",
-                                         "bitfieldReverse(30E",
-                                         "bitCount(00D",
+        &imageAtomicMaxExt_01L20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01W20D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicAddExt_01W20D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldExtract_00E00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&round_10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01D00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicExchangeExt_01D00D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&ceil_30B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureGradOffset_00I10B10B10B10D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&matrixCompMult_D0BD0B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00a20B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&transpose_70B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLod_00R30B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01A20D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicAndExt_01A20D00E),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&step_00B30B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageLoad_01Y20D),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProj_00I20B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01T10D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicMaxExt_01T10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageLoad_01J00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_texture_buffer)>(&imageLoadExt_01J00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_texture_buffer)>(&imageLoadExt_01J00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01B20D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicMaxExt_01B20D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&min_30B00B),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&textureGather_00I10B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&textureGatherOffsets_00R10B10Dx4),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_gpu_shader5)>(
+        &textureGatherOffsetsExt_00R10B10Dx4),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_gpu_shader5)>(
+        &textureGatherOffsetsExt_00R10B10Dx4),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&floatBitsToUint_30B),
+    Rule::Get<Spec::ESSL, 300, Shader::FRAGMENT, 0>(&textureProj_00R20B00B),
+    Rule::Get<Spec::ESSL, 100, Shader::VERTEX, 0>(&texture2DProjLod_00I30B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01W20D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicXorExt_01W20D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&bitfieldExtract_20E00D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01c20D00D00E00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicCompSwapExt_01c20D00D00E00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01C20D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicXorExt_01C20D00E),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&notEqual_10E10E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01R20D00D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicAndExt_01R20D00D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01K10D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicAddExt_01K10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01D00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicAddExt_01D00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjOffset_00X20B10D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01X20D00E00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicCompSwapExt_01X20D00E00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(
+        &TableBase::m_gl_MaxTessControlTextureImageUnitsES3_2),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(EXT_tessellation_shader)>(
+        &TableBase::m_gl_MaxTessControlTextureImageUnits),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_tessellation_shader)>(
+        &TableBase::m_gl_MaxTessControlTextureImageUnits),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&imageSize_01V),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&determinant_50B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, EXT_INDEX(ANGLE_shader_pixel_local_storage)>(
+        &pixelLocalStoreANGLE_01g30B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjOffset_00S30B20D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&texture_00R10B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&min_10D10D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&cosh_30B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01V10D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicXorExt_01V10D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicOr_01d20D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicOrExt_01d20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01W20D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicXorExt_01W20D00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMax_01P10D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicMaxExt_01P10D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&clamp_30E30E30E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01Z00D00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicCompSwapExt_01Z00D00D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&sinh_20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01e10D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicExchangeExt_01e10D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&pow_00B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicXor_01a10D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicXorExt_01a10D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLod_00R20B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_00z10D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicMinExt_00z10D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjLodOffset_00S30B00B20D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01O00D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicAndExt_01O00D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&reflect_00B00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureLod_00R10B00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&outerProduct_10B20B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAdd_01N20D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicAddExt_01N20D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicAnd_01a10D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicAndExt_01a10D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, 0>(&atomicCounterDecrement_00G),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01N20D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicExchangeExt_01N20D00D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&mod_30B00B),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureProjGradOffset_00S30B20B20B20D),
+    Rule::Get<Spec::ESSL, 0, Shader::ALL, 0>(&refract_10B10B00B),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicMin_01I10D00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicMinExt_01I10D00E),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicExchange_01P10D00D),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicExchangeExt_01P10D00D),
+    Rule::Get<Spec::ESSL, 300, Shader::ALL, 0>(&textureSize_00a00D),
+    Rule::Get<Spec::ESSL, 320, Shader::ALL, 0>(&imageAtomicCompSwap_01Z00D00E00E),
+    Rule::Get<Spec::ESSL, 310, Shader::ALL, EXT_INDEX(OES_shader_image_atomic)>(
+        &imageAtomicCompSwapExt_01Z00D00E00E),
+    Rule::Get<Spec::ESSL, kESSLInternalBackendBuiltIns, Shader::ALL, 0>(&subpassLoad_01l)};
+
+// Flat array of all mangled names.
+constexpr const char *kMangledNames[] = {"imageAtomicExchange(01O00D00E",
+                                         "imageAtomicAnd(01U00D00E",
+                                         "imageAtomicAdd(01P10D00D",
+                                         "textureGradOffset(00J20B20B20B20D",
+                                         "imageAtomicAnd(01T10D00D",
+                                         "texture(00K20B00B",
+                                         "imageAtomicCompSwap(01Y20D00E00E",
                                          "bitCount(10D",
-                                         "bitCount(20D",
-                                         "bitCount(30D",
-                                         "bitCount(00E",
-                                         "bitCount(10E",
-                                         "bitCount(20E",
-                                         "bitCount(30E",
-                                         "findLSB(00D",
-                                         "findLSB(10D",
-                                         "findLSB(20D",
-                                         "findLSB(30D",
-                                         "findLSB(00E",
-                                         "findLSB(10E",
-                                         "findLSB(20E",
-                                         "findLSB(30E",
-                                         "findMSB(00D",
-                                         "findMSB(10D",
-                                         "findMSB(20D",
-                                         "findMSB(30D",
-                                         "findMSB(00E",
-                                         "findMSB(10E",
-                                         "findMSB(20E",
+                                         "imageAtomicCompSwap(01d20D00E00E",
+                                         "atomicAdd(00D00D",
+                                         "yuv_2_rgb(20B00H",
+                                         "dFdx(00B",
+                                         "intBitsToFloat(30D",
+                                         "imageAtomicExchange(01T10D00D",
+                                         "length(00B",
+                                         "greaterThan(30B30B",
+                                         "textureGather(00L20B00D",
+                                         "imageAtomicCompSwap(01b10D00D00D00D",
+                                         "gl_MaxVertexOutputVectors",
+                                         "uintBitsToFloat(30E",
+                                         "texture(00a20B00B",
+                                         "imageAtomicExchange(01W20D00E",
+                                         "textureProj(00M30B00B",
+                                         "floatBitsToUint(20B",
                                          "findMSB(30E",
-                                         "uaddCarry(00E00E00E",
-                                         "uaddCarry(10E10E10E",
-                                         "uaddCarry(20E20E20E",
-                                         "uaddCarry(30E30E30E",
-                                         "usubBorrow(00E00E00E",
-                                         "usubBorrow(10E10E10E",
-                                         "usubBorrow(20E20E20E",
-                                         "usubBorrow(30E30E30E",
-                                         "umulExtended(00E00E00E00E",
-                                         "umulExtended(10E10E10E10E",
-                                         "umulExtended(20E20E20E20E",
-                                         "umulExtended(30E30E30E30E",
-                                         "imulExtended(00D00D00D00D",
-                                         "imulExtended(10D10D10D10D",
-                                         "imulExtended(20D20D20D20D",
-                                         "imulExtended(30D30D30D30D",
-                                         "texture2D(00I10B",
-                                         "texture2DProj(00I20B",
-                                         "texture2DProj(00I30B",
-                                         "textureCube(00K20B",
+                                         "not(10F",
+                                         "max(20E00E",
+                                         "fract(30B",
+                                         "imageAtomicExchange(01I10D00B",
+                                         "mix(30B30B30F",
+                                         "textureProj(00M30B",
                                          "texture3D(00J20B",
-                                         "texture3DProj(00J30B",
-                                         "shadow2DEXT(00d20B",
-                                         "shadow2DProjEXT(00d30B",
-                                         "texture2D(00M10B",
-                                         "texture2DProj(00M20B",
-                                         "texture2DProj(00M30B",
-                                         "texture2DRect(00O10B",
-                                         "texture2DRectProj(00O20B",
-                                         "texture2DRectProj(00O30B",
-                                         "texture2DGradEXT(00I10B10B10B",
-                                         "texture2DProjGradEXT(00I20B10B10B",
-                                         "texture2DProjGradEXT(00I30B10B10B",
-                                         "textureCubeGradEXT(00K20B20B20B",
-                                         "textureVideoWEBGL(00y10B",
-                                         "texture2D(00I10B00B",
-                                         "texture2DProj(00I20B00B",
-                                         "texture2DProj(00I30B00B",
-                                         "textureCube(00K20B00B",
-                                         "texture3D(00J20B00B",
-                                         "texture3DProj(00J30B00B",
-                                         "texture3DLod(00J20B00B",
-                                         "texture3DProjLod(00J30B00B",
-                                         "texture2DLod(00I10B00B",
-                                         "texture2DProjLod(00I20B00B",
-                                         "texture2DProjLod(00I30B00B",
-                                         "textureCubeLod(00K20B00B",
-                                         "texture2DLodEXT(00I10B00B",
-                                         "texture2DProjLodEXT(00I20B00B",
-                                         "texture2DProjLodEXT(00I30B00B",
-                                         "textureCubeLodEXT(00K20B00B",
-                                         "texture(00I10B",
-                                         "texture(00R10B",
-                                         "texture(00X10B",
-                                         "texture(00J20B",
-                                         "texture(00S20B",
-                                         "texture(00Y20B",
-                                         "texture(00K20B",
-                                         "texture(00T20B",
-                                         "texture(00Z20B",
-                                         "texture(00L20B",
-                                         "texture(00U20B",
-                                         "texture(00a20B",
-                                         "texture(00d20B",
-                                         "texture(00e30B",
-                                         "texture(00f30B",
-                                         "texture(00k30B",
-                                         "texture(00s30B",
-                                         "texture(00x30B",
+                                         "imageAtomicMax(01W20D00D",
                                          "texture(00l30B00B",
-                                         "texture(00M10B",
-                                         "texture(00N10B",
-                                         "texture(00O10B",
-                                         "texture(00y10B",
-                                         "textureProj(00I20B",
-                                         "textureProj(00R20B",
-                                         "textureProj(00X20B",
-                                         "textureProj(00I30B",
-                                         "textureProj(00R30B",
+                                         "imageAtomicAdd(01V10D00D",
+                                         "equal(30B30B",
                                          "textureProj(00X30B",
-                                         "textureProj(00J30B",
-                                         "textureProj(00S30B",
-                                         "textureProj(00Y30B",
-                                         "textureProj(00d30B",
-                                         "textureProj(00M20B",
-                                         "textureProj(00M30B",
-                                         "textureProj(00N20B",
-                                         "textureProj(00N30B",
-                                         "textureProj(00O20B",
-                                         "textureProj(00O30B",
-                                         "textureLod(00I10B00B",
-                                         "textureLod(00R10B00B",
-                                         "textureLod(00X10B00B",
+                                         "imageAtomicExchange(01C20D00B",
+                                         "imageAtomicAdd(01c20D00D00E",
+                                         "imageAtomicMax(00z10D00D",
+                                         "sign(30D",
                                          "textureLod(00J20B00B",
-                                         "textureLod(00S20B00B",
+                                         "imageAtomicExchange(01F10D00D00B",
+                                         "pixelLocalLoadANGLE(01g",
+                                         "imageAtomicCompSwap(01c20D00D00D00D",
+                                         "matrixCompMult(90B90B",
+                                         "textureGradOffset(00S20B20B20B20D",
+                                         "textureProjOffset(00Y30B20D00B",
+                                         "lessThanEqual(30B30B",
+                                         "imageAtomicAnd(01X20D00E",
+                                         "imageAtomicMax(01W20D00E",
+                                         "equal(10E10E",
+                                         "textureProj(00J30B00B",
+                                         "texture(00s30B",
                                          "textureLod(00Y20B00B",
-                                         "textureLod(00K20B00B",
-                                         "textureLod(00T20B00B",
-                                         "textureLod(00Z20B00B",
-                                         "textureLod(00L20B00B",
-                                         "textureLod(00U20B00B",
-                                         "textureLod(00a20B00B",
-                                         "textureLod(00d20B00B",
-                                         "textureLod(00k30B00B",
-                                         "textureLod(00s30B00B",
-                                         "textureLod(00x30B00B",
-                                         "textureSize(00I00D",
+                                         "imageAtomicMax(01a10D00E",
+                                         "gl_MaxCombinedTextureImageUnits",
+                                         "textureProj(00O30B",
+                                         "imageAtomicExchange(01Z00D00E",
+                                         "imageAtomicAnd(01J00D00D",
                                          "textureSize(00R00D",
-                                         "textureSize(00X00D",
-                                         "textureSize(00J00D",
-                                         "textureSize(00S00D",
-                                         "textureSize(00Y00D",
-                                         "textureSize(00K00D",
-                                         "textureSize(00T00D",
-                                         "textureSize(00Z00D",
-                                         "textureSize(00L00D",
-                                         "textureSize(00U00D",
-                                         "textureSize(00a00D",
-                                         "textureSize(00d00D",
-                                         "textureSize(00e00D",
-                                         "textureSize(00f00D",
-                                         "textureSize(00k00D",
-                                         "textureSize(00s00D",
-                                         "textureSize(00x00D",
-                                         "textureSize(00l00D",
-                                         "textureSize(00j",
-                                         "textureSize(00r",
-                                         "textureSize(00w",
-                                         "textureSize(00P",
-                                         "textureSize(00V",
-                                         "textureSize(00b",
-                                         "textureSize(00Q",
-                                         "textureSize(00W",
-                                         "textureSize(00c",
-                                         "textureSize(00M00D",
-                                         "textureSize(00N00D",
-                                         "textureProjLod(00I20B00B",
-                                         "textureProjLod(00R20B00B",
-                                         "textureProjLod(00X20B00B",
-                                         "textureProjLod(00I30B00B",
-                                         "textureProjLod(00R30B00B",
-                                         "textureProjLod(00X30B00B",
-                                         "textureProjLod(00J30B00B",
-                                         "textureProjLod(00S30B00B",
-                                         "textureProjLod(00Y30B00B",
-                                         "textureProjLod(00d30B00B",
-                                         "texelFetch(00I10D00D",
-                                         "texelFetch(00R10D00D",
-                                         "texelFetch(00X10D00D",
-                                         "texelFetch(00J20D00D",
-                                         "texelFetch(00S20D00D",
-                                         "texelFetch(00Y20D00D",
-                                         "texelFetch(00L20D00D",
-                                         "texelFetch(00U20D00D",
-                                         "texelFetch(00a20D00D",
-                                         "texelFetch(00j00D",
-                                         "texelFetch(00r00D",
-                                         "texelFetch(00w00D",
-                                         "texelFetch(00P10D00D",
-                                         "texelFetch(00V10D00D",
-                                         "texelFetch(00b10D00D",
-                                         "texelFetch(00Q20D00D",
-                                         "texelFetch(00W20D00D",
-                                         "texelFetch(00c20D00D",
-                                         "texelFetch(00M10D00D",
-                                         "texelFetch(00N10D00D",
-                                         "textureGrad(00I10B10B10B",
-                                         "textureGrad(00R10B10B10B",
-                                         "textureGrad(00X10B10B10B",
-                                         "textureGrad(00J20B20B20B",
-                                         "textureGrad(00S20B20B20B",
-                                         "textureGrad(00Y20B20B20B",
-                                         "textureGrad(00K20B20B20B",
-                                         "textureGrad(00T20B20B20B",
-                                         "textureGrad(00Z20B20B20B",
-                                         "textureGrad(00d20B10B10B",
-                                         "textureGrad(00e30B20B20B",
-                                         "textureGrad(00L20B10B10B",
-                                         "textureGrad(00U20B10B10B",
-                                         "textureGrad(00a20B10B10B",
-                                         "textureGrad(00f30B10B10B",
-                                         "textureGrad(00k30B20B20B",
-                                         "textureGrad(00s30B20B20B",
-                                         "textureGrad(00x30B20B20B",
-                                         "textureProjGrad(00I20B10B10B",
-                                         "textureProjGrad(00R20B10B10B",
-                                         "textureProjGrad(00X20B10B10B",
-                                         "textureProjGrad(00I30B10B10B",
-                                         "textureProjGrad(00R30B10B10B",
-                                         "textureProjGrad(00X30B10B10B",
-                                         "textureProjGrad(00J30B20B20B",
-                                         "textureProjGrad(00S30B20B20B",
-                                         "textureProjGrad(00Y30B20B20B",
-                                         "textureProjGrad(00d30B10B10B",
-                                         "texture(00I10B00B",
-                                         "texture(00R10B00B",
-                                         "texture(00X10B00B",
-                                         "texture(00J20B00B",
-                                         "texture(00S20B00B",
-                                         "texture(00Y20B00B",
-                                         "texture(00K20B00B",
-                                         "texture(00T20B00B",
-                                         "texture(00Z20B00B",
-                                         "texture(00L20B00B",
-                                         "texture(00U20B00B",
-                                         "texture(00a20B00B",
-                                         "textureProj(00I20B00B",
-                                         "textureProj(00R20B00B",
-                                         "textureProj(00X20B00B",
-                                         "textureProj(00I30B00B",
-                                         "textureProj(00R30B00B",
-                                         "textureProj(00X30B00B",
-                                         "textureProj(00J30B00B",
-                                         "textureProj(00S30B00B",
-                                         "textureProj(00Y30B00B",
-                                         "texture(00d20B00B",
-                                         "texture(00e30B00B",
-                                         "textureProj(00d30B00B",
-                                         "texture(00k30B00B",
-                                         "texture(00s30B00B",
-                                         "texture(00x30B00B",
-                                         "texture(00M10B00B",
-                                         "textureProj(00M20B00B",
-                                         "textureProj(00M30B00B",
-                                         "texture(00N10B00B",
-                                         "textureProj(00N20B00B",
-                                         "textureProj(00N30B00B",
-                                         "textureOffset(00I10B10D",
-                                         "textureOffset(00R10B10D",
-                                         "textureOffset(00X10B10D",
-                                         "textureOffset(00J20B20D",
-                                         "textureOffset(00S20B20D",
-                                         "textureOffset(00Y20B20D",
-                                         "textureOffset(00d20B10D",
-                                         "textureOffset(00L20B10D",
-                                         "textureOffset(00U20B10D",
-                                         "textureOffset(00a20B10D",
-                                         "textureProjOffset(00I20B10D",
-                                         "textureProjOffset(00R20B10D",
-                                         "textureProjOffset(00X20B10D",
-                                         "textureProjOffset(00I30B10D",
-                                         "textureProjOffset(00R30B10D",
-                                         "textureProjOffset(00X30B10D",
-                                         "textureProjOffset(00J30B20D",
-                                         "textureProjOffset(00S30B20D",
-                                         "textureProjOffset(00Y30B20D",
-                                         "textureProjOffset(00d30B10D",
-                                         "textureLodOffset(00I10B00B10D",
-                                         "textureLodOffset(00R10B00B10D",
-                                         "textureLodOffset(00X10B00B10D",
-                                         "textureLodOffset(00J20B00B20D",
-                                         "textureLodOffset(00S20B00B20D",
-                                         "textureLodOffset(00Y20B00B20D",
-                                         "textureLodOffset(00d20B00B10D",
-                                         "textureLodOffset(00L20B00B10D",
-                                         "textureLodOffset(00U20B00B10D",
-                                         "textureLodOffset(00a20B00B10D",
-                                         "textureProjLodOffset(00I20B00B10D",
-                                         "textureProjLodOffset(00R20B00B10D",
-                                         "textureProjLodOffset(00X20B00B10D",
-                                         "textureProjLodOffset(00I30B00B10D",
-                                         "textureProjLodOffset(00R30B00B10D",
-                                         "textureProjLodOffset(00X30B00B10D",
-                                         "textureProjLodOffset(00J30B00B20D",
-                                         "textureProjLodOffset(00S30B00B20D",
-                                         "textureProjLodOffset(00Y30B00B20D",
-                                         "textureProjLodOffset(00d30B00B10D",
-                                         "texelFetchOffset(00I10D00D10D",
-                                         "texelFetchOffset(00R10D00D10D",
-                                         "texelFetchOffset(00X10D00D10D",
-                                         "texelFetchOffset(00J20D00D20D",
-                                         "texelFetchOffset(00S20D00D20D",
-                                         "texelFetchOffset(00Y20D00D20D",
-                                         "texelFetchOffset(00L20D00D10D",
-                                         "texelFetchOffset(00U20D00D10D",
-                                         "texelFetchOffset(00a20D00D10D",
-                                         "textureGradOffset(00I10B10B10B10D",
-                                         "textureGradOffset(00R10B10B10B10D",
-                                         "textureGradOffset(00X10B10B10B10D",
-                                         "textureGradOffset(00J20B20B20B20D",
-                                         "textureGradOffset(00S20B20B20B20D",
-                                         "textureGradOffset(00Y20B20B20B20D",
-                                         "textureGradOffset(00d20B10B10B10D",
-                                         "textureGradOffset(00L20B10B10B10D",
-                                         "textureGradOffset(00U20B10B10B10D",
-                                         "textureGradOffset(00a20B10B10B10D",
-                                         "textureGradOffset(00f30B10B10B10D",
-                                         "textureProjGradOffset(00I20B10B10B10D",
-                                         "textureProjGradOffset(00R20B10B10B10D",
-                                         "textureProjGradOffset(00X20B10B10B10D",
-                                         "textureProjGradOffset(00I30B10B10B10D",
-                                         "textureProjGradOffset(00R30B10B10B10D",
-                                         "textureProjGradOffset(00X30B10B10B10D",
-                                         "textureProjGradOffset(00J30B20B20B20D",
-                                         "textureProjGradOffset(00S30B20B20B20D",
-                                         "textureProjGradOffset(00Y30B20B20B20D",
-                                         "textureProjGradOffset(00d30B10B10B10D",
-                                         "textureOffset(00I10B10D00B",
-                                         "textureOffset(00R10B10D00B",
-                                         "textureOffset(00X10B10D00B",
-                                         "textureOffset(00J20B20D00B",
-                                         "textureOffset(00S20B20D00B",
-                                         "textureOffset(00Y20B20D00B",
+                                         "max(10E00E",
+                                         "gl_BoundingBoxOES",
+                                         "imageAtomicAdd(01J00D00E",
+                                         "textureGather(00d10B00B",
+                                         "imageAtomicAnd(01I10D00D",
+                                         "gl_FragCoord",
+                                         "imageLoad(00z10D",
+                                         "imageAtomicCompSwap(01K10D00D00D",
+                                         "bitCount(30D",
+                                         "gl_CullDistance",
+                                         "imageAtomicMax(01I10D00E",
+                                         "imageAtomicXor(00z10D00D",
+                                         "textureProjGrad(00I20B10B10B",
+                                         "mod(20B20B",
+                                         "cos(00B",
+                                         "imageAtomicXor(01Q10D00D00D",
+                                         "textureGather(00e20B",
+                                         "findLSB(30D",
+                                         "findLSB(10E",
+                                         "gl_FrontFacing",
+                                         "bitCount(00E",
+                                         "min(30E30E",
+                                         "textureGatherOffset(00L20B10D",
+                                         "subpassLoad(01o00D",
+                                         "textureSize(00w",
+                                         "min(10B00B",
+                                         "gl_MaxDrawBuffers",
+                                         "gl_MaxGeometryAtomicCounters",
+                                         "imageAtomicExchange(01D00D00B",
+                                         "texelFetch(00a20D00D",
+                                         "step(20B20B",
+                                         "greaterThanEqual(20E20E",
+                                         "imageAtomicAdd(01G20D00D00E",
+                                         "umulExtended(00E00E00E00E",
+                                         "sinh(10B",
+                                         "intBitsToFloat(20D",
+                                         "abs(10B",
+                                         "isnan(20B",
+                                         "mix(00B00B00F",
+                                         "textureGather(00X10B00D",
+                                         "texture2DRectProj(00O20B",
+                                         "matrixCompMult(70B70B",
+                                         "textureGather(00e20B00B",
+                                         "acos(30B",
+                                         "texelFetch(00V10D00D",
+                                         "imageAtomicOr(01D00D00D",
+                                         "atomicXor(00E00E",
+                                         "textureSize(00Y00D",
+                                         "gl_MaxGeometryAtomicCounterBuffers",
+                                         "lessThanEqual(30E30E",
                                          "textureOffset(00d20B10D00B",
-                                         "textureOffset(00L20B10D00B",
-                                         "textureOffset(00U20B10D00B",
-                                         "textureOffset(00a20B10D00B",
-                                         "textureProjOffset(00I20B10D00B",
-                                         "textureProjOffset(00R20B10D00B",
-                                         "textureProjOffset(00X20B10D00B",
-                                         "textureProjOffset(00I30B10D00B",
-                                         "textureProjOffset(00R30B10D00B",
-                                         "textureProjOffset(00X30B10D00B",
-                                         "textureProjOffset(00J30B20D00B",
-                                         "textureProjOffset(00S30B20D00B",
-                                         "textureProjOffset(00Y30B20D00B",
-                                         "textureProjOffset(00d30B10D00B",
-                                         "textureGather(00I10B",
-                                         "textureGather(00R10B",
+                                         "imageAtomicAdd(01L20D00D",
+                                         "imageAtomicCompSwap(01e10D00D00D",
+                                         "subpassLoad(01k",
+                                         "imageAtomicXor(01E10D00D",
+                                         "imageAtomicMin(01U00D00E",
+                                         "gl_MaxTessPatchComponents",
+                                         "abs(30B",
+                                         "imageAtomicExchange(01W20D00B",
+                                         "textureProj(00S30B",
+                                         "imageAtomicXor(01B20D00E",
+                                         "imageAtomicExchange(01B20D00D",
+                                         "imageAtomicMin(01A20D00E",
+                                         "imageAtomicOr(01E10D00E",
+                                         "smoothstep(00B00B30B",
+                                         "gl_Position",
+                                         "imageAtomicOr(01H20D00E",
+                                         "imageAtomicMax(01O00D00D",
+                                         "imageAtomicAnd(01Z00D00D",
+                                         "imageAtomicAdd(01e10D00E",
+                                         "textureLod(00I10B00B",
+                                         "imageAtomicOr(00z10D00D",
+                                         "texture(00Z20B",
+                                         "log(10B",
+                                         "imageAtomicMax(01b10D00D00E",
+                                         "imageAtomicCompSwap(01B20D00D00D",
+                                         "textureLod(00d20B00B",
+                                         "textureOffset(00U20B10D",
+                                         "imageAtomicXor(01N20D00E",
+                                         "imageAtomicExchange(01c20D00D00B",
+                                         "clamp(20D00D00D",
+                                         "gl_out",
+                                         "imageAtomicOr(01K10D00E",
+                                         "angle_BaseInstance",
                                          "textureGather(00X10B",
-                                         "textureGather(00I10B00D",
-                                         "textureGather(00R10B00D",
-                                         "textureGather(00X10B00D",
-                                         "textureGather(00L20B",
-                                         "textureGather(00U20B",
-                                         "textureGather(00a20B",
-                                         "textureGather(00L20B00D",
-                                         "textureGather(00U20B00D",
-                                         "textureGather(00a20B00D",
-                                         "textureGather(00K20B",
-                                         "textureGather(00T20B",
-                                         "textureGather(00Z20B",
-                                         "textureGather(00K20B00D",
-                                         "textureGather(00T20B00D",
-                                         "textureGather(00Z20B00D",
+                                         "imageAtomicCompSwap(01T10D00E00E",
+                                         "imageAtomicAdd(01S20D00D",
+                                         "textureCubeGradEXT(00K20B20B20B",
+                                         "imageAtomicMin(01N20D00E",
+                                         "imageAtomicCompSwap(01W20D00E00E",
+                                         "textureGrad(00S20B20B20B",
+                                         "max(30D00D",
+                                         "imageAtomicMin(01J00D00E",
+                                         "imageAtomicMin(01K10D00D",
+                                         "mix(10B10B10F",
+                                         "imageAtomicAdd(00z10D00E",
+                                         "cos(20B",
+                                         "imageAtomicExchange(01P10D00E",
+                                         "imageAtomicMax(01f00D00E",
+                                         "texelFetch(00j00D",
+                                         "tanh(30B",
+                                         "imageAtomicExchange(01f00D00B",
+                                         "dFdy(30B",
+                                         "imageAtomicMin(01I10D00D",
+                                         "textureProj(00M20B00B",
+                                         "imageAtomicExchange(01G20D00D00B",
+                                         "memoryBarrier(",
+                                         "gl_FragData",
+                                         "textureSize(00Z00D",
+                                         "fma(30B30B30B",
+                                         "imageAtomicAdd(01C20D00E",
+                                         "normalize(20B",
+                                         "floatBitsToUint(00B",
+                                         "textureGather(00s30B00D",
+                                         "frexp(10B10D",
+                                         "usubBorrow(20E20E20E",
                                          "textureGather(00k30B",
-                                         "textureGather(00s30B",
+                                         "notEqual(20F20F",
+                                         "interpolateAtOffset(10B10B",
+                                         "imageAtomicMin(01X20D00D",
+                                         "transpose(A0B",
+                                         "clamp(10B00B00B",
+                                         "textureProjGrad(00d30B10B10B",
+                                         "lessThanEqual(20D20D",
+                                         "gl_MaxTessGenLevel",
+                                         "imageAtomicExchange(01Z00D00B",
+                                         "gl_BoundingBoxEXT",
+                                         "min(30D00D",
+                                         "equal(20F20F",
+                                         "bitCount(10E",
+                                         "clamp(20E00E00E",
+                                         "radians(30B",
+                                         "imageAtomicOr(01I10D00D",
+                                         "texelFetch(00U20D00D",
+                                         "dFdy(20B",
+                                         "imageAtomicCompSwap(01Q10D00D00D00D",
+                                         "imageAtomicAnd(01X20D00D",
+                                         "imageAtomicMax(01K10D00D",
+                                         "textureProjOffset(00J30B20D",
+                                         "textureGather(00Z20B",
+                                         "max(10B00B",
+                                         "fwidth(30B",
+                                         "",
                                          "textureGather(00x30B",
-                                         "textureGather(00k30B00D",
-                                         "textureGather(00s30B00D",
-                                         "textureGather(00x30B00D",
-                                         "textureGather(00l30B00B",
-                                         "textureGather(00d10B",
-                                         "textureGather(00d10B00B",
-                                         "textureGather(00f20B",
-                                         "textureGather(00f20B00B",
-                                         "textureGather(00e20B",
-                                         "textureGather(00e20B00B",
-                                         "textureGatherOffset(00I10B10D",
-                                         "textureGatherOffset(00R10B10D",
-                                         "textureGatherOffset(00X10B10D",
-                                         "textureGatherOffset(00L20B10D",
-                                         "textureGatherOffset(00U20B10D",
-                                         "textureGatherOffset(00a20B10D",
-                                         "textureGatherOffset(00d10B00B10D",
-                                         "textureGatherOffset(00f20B00B10D",
-                                         "textureGatherOffset(00I10B10D00D",
-                                         "textureGatherOffset(00R10B10D00D",
-                                         "textureGatherOffset(00X10B10D00D",
-                                         "textureGatherOffset(00L20B10D00D",
-                                         "textureGatherOffset(00U20B10D00D",
-                                         "textureGatherOffset(00a20B10D00D",
-                                         "textureGatherOffsets(00I10B10Dx4",
-                                         "textureGatherOffsets(00R10B10Dx4",
-                                         "textureGatherOffsets(00X10B10Dx4",
+                                         "imageAtomicXor(01M20D00D",
+                                         "gl_LocalInvocationID",
+                                         "imageAtomicOr(01Y20D00E",
+                                         "imulExtended(10D10D10D10D",
+                                         "imageAtomicXor(01I10D00E",
+                                         "memoryBarrierImage(",
+                                         "transpose(60B",
+                                         "imageAtomicCompSwap(01U00D00D00D",
                                          "textureGatherOffsets(00L20B10Dx4",
-                                         "textureGatherOffsets(00U20B10Dx4",
+                                         "acosh(30B",
+                                         "bitfieldReverse(20E",
+                                         "modf(10B10B",
+                                         "clamp(20D20D20D",
+                                         "imageAtomicMax(01d20D00D",
+                                         "fract(10B",
+                                         "imageAtomicCompSwap(01S20D00E00E",
+                                         "imageAtomicOr(01f00D00D",
+                                         "any(10F",
+                                         "mix(10E10E10F",
+                                         "textureOffset(00S20B20D",
+                                         "imageAtomicExchange(01I10D00E",
+                                         "atanh(10B",
+                                         "textureSize(00c",
+                                         "imageAtomicAnd(01L20D00D",
+                                         "texture(00a20B",
+                                         "packHalf2x16(10B",
+                                         "uaddCarry(30E30E30E",
+                                         "texelFetch(00X10D00D",
+                                         "textureSize(00Q",
+                                         "imageAtomicAdd(01W20D00E",
+                                         "imageAtomicCompSwap(01P10D00E00E",
+                                         "textureGather(00K20B00D",
+                                         "imageAtomicExchange(01V10D00B",
+                                         "imageAtomicXor(01f00D00D",
+                                         "greaterThan(10B10B",
+                                         "imageSize(01N",
+                                         "imageAtomicCompSwap(01N20D00E00E",
+                                         "gl_TessCoord",
+                                         "imageAtomicCompSwap(01f00D00E00E",
+                                         "textureGrad(00Y20B20B20B",
+                                         "degrees(10B",
+                                         "imageLoad(01d20D",
+                                         "gl_MaxClipDistances",
+                                         "mix(00F00F00F",
+                                         "imageAtomicMin(01E10D00E",
+                                         "texture(00x30B",
+                                         "imageAtomicAdd(01f00D00E",
+                                         "imageAtomicMin(01H20D00D",
+                                         "textureProjGrad(00X20B10B10B",
+                                         "texelFetch(00I10D00D",
+                                         "textureGather(00R10B00D",
+                                         "imageAtomicXor(01T10D00D",
+                                         "imageAtomicCompSwap(01U00D00E00E",
+                                         "mix(30B30B30B",
+                                         "textureLodOffset(00S20B00B20D",
+                                         "imageAtomicOr(01J00D00D",
+                                         "imageAtomicCompSwap(01N20D00D00D",
+                                         "smoothstep(00B00B00B",
+                                         "imageAtomicExchange(01R20D00D00B",
+                                         "max(00B00B",
+                                         "textureGradOffset(00X10B10B10B10D",
+                                         "imageAtomicMax(01e10D00E",
+                                         "imageAtomicMin(01D00D00E",
+                                         "refract(00B00B00B",
+                                         "atomicXor(00D00D",
+                                         "textureGatherOffset(00I10B10D00D",
                                          "textureGatherOffsets(00a20B10Dx4",
-                                         "textureGatherOffsets(00d10B00B10Dx4",
-                                         "textureGatherOffsets(00f20B00B10Dx4",
+                                         "texture2DProjGradEXT(00I30B10B10B",
+                                         "imageAtomicExchange(01e10D00B",
+                                         "textureSize(00b",
+                                         "textureProj(00R30B00B",
+                                         "imageAtomicXor(01S20D00D",
                                          "textureGatherOffsets(00I10B10Dx400D",
-                                         "textureGatherOffsets(00R10B10Dx400D",
-                                         "textureGatherOffsets(00X10B10Dx400D",
-                                         "textureGatherOffsets(00L20B10Dx400D",
-                                         "textureGatherOffsets(00U20B10Dx400D",
-                                         "textureGatherOffsets(00a20B10Dx400D",
-                                         "rgb_2_yuv(20B00H",
-                                         "yuv_2_rgb(20B00H",
-                                         "dFdx(00B",
-                                         "dFdx(10B",
-                                         "dFdx(20B",
-                                         "dFdx(30B",
-                                         "dFdy(00B",
-                                         "dFdy(10B",
-                                         "dFdy(20B",
-                                         "dFdy(30B",
-                                         "fwidth(00B",
-                                         "fwidth(10B",
-                                         "fwidth(20B",
-                                         "fwidth(30B",
-                                         "interpolateAtCentroid(00B",
-                                         "interpolateAtCentroid(10B",
-                                         "interpolateAtCentroid(20B",
-                                         "interpolateAtCentroid(30B",
-                                         "interpolateAtSample(00B00D",
-                                         "interpolateAtSample(10B00D",
-                                         "interpolateAtSample(20B00D",
-                                         "interpolateAtSample(30B00D",
-                                         "interpolateAtOffset(00B10B",
-                                         "interpolateAtOffset(10B10B",
-                                         "interpolateAtOffset(20B10B",
-                                         "interpolateAtOffset(30B10B",
+                                         "texture(00X10B00B",
                                          "atomicCounter(00G",
-                                         "atomicCounterIncrement(00G",
-                                         "atomicCounterDecrement(00G",
-                                         "atomicAdd(00E00E",
-                                         "atomicAdd(00D00D",
-                                         "atomicMin(00E00E",
-                                         "atomicMin(00D00D",
-                                         "atomicMax(00E00E",
-                                         "atomicMax(00D00D",
-                                         "atomicAnd(00E00E",
-                                         "atomicAnd(00D00D",
-                                         "atomicOr(00E00E",
-                                         "atomicOr(00D00D",
-                                         "atomicXor(00E00E",
-                                         "atomicXor(00D00D",
-                                         "atomicExchange(00E00E",
+                                         "imageAtomicMax(01S20D00E",
+                                         "texture2D(00I10B00B",
+                                         "imageAtomicAnd(01V10D00D",
+                                         "exp2(30B",
+                                         "gl_MaxGeometryUniformComponents",
+                                         "bitfieldInsert(10D10D00D00D",
+                                         "floor(10B",
+                                         "equal(30D30D",
+                                         "findMSB(30D",
+                                         "endInvocationInterlockNV(",
+                                         "imageAtomicExchange(01A20D00E",
+                                         "textureLod(00T20B00B",
+                                         "interpolateAtSample(00B00D",
+                                         "fwidth(00B",
+                                         "texelFetchOffset(00I10D00D10D",
+                                         "imageAtomicMax(01G20D00D00E",
+                                         "textureProj(00N30B",
+                                         "imageAtomicExchange(01f00D00E",
+                                         "imageAtomicOr(01B20D00D",
+                                         "imageAtomicMax(01H20D00E",
+                                         "lessThanEqual(10B10B",
+                                         "distance(30B30B",
+                                         "texture2DProj(00I30B00B",
+                                         "texture2DProjLodEXT(00I30B00B",
+                                         "textureProjLodOffset(00I20B00B10D",
+                                         "rgb_2_yuv(20B00H",
                                          "atomicExchange(00D00D",
-                                         "atomicCompSwap(00E00E00E",
-                                         "atomicCompSwap(00D00D00D",
-                                         "imageSize(00z",
-                                         "imageSize(01K",
-                                         "imageSize(01V",
-                                         "imageSize(01A",
-                                         "imageSize(01L",
+                                         "texture(00T20B00B",
+                                         "imageLoad(01H20D",
+                                         "texture(00d20B",
+                                         "textureGather(00k30B00D",
+                                         "ceil(00B",
+                                         "imageAtomicXor(01F10D00D00D",
+                                         "textureLodOffset(00L20B00B10D",
+                                         "mix(20F20F20F",
+                                         "beginFragmentShaderOrderingINTEL(",
+                                         "step(30B30B",
+                                         "textureSize(00M00D",
+                                         "imageAtomicMin(01V10D00D",
+                                         "acos(10B",
+                                         "textureProj(00d30B00B",
+                                         "uintBitsToFloat(00E",
+                                         "imageAtomicMax(01E10D00D",
+                                         "gl_MaxCombinedAtomicCounterBuffers",
+                                         "umulExtended(30E30E30E30E",
+                                         "imageAtomicMax(01J00D00E",
+                                         "imageAtomicExchange(01J00D00E",
+                                         "log2(00B",
+                                         "imageStore(01f00D30E",
+                                         "texelFetch(00w00D",
+                                         "greaterThan(30E30E",
+                                         "gl_MaxGeometryOutputComponents",
+                                         "textureGrad(00X10B10B10B",
+                                         "imageAtomicCompSwap(01d20D00D00D",
+                                         "modf(30B30B",
+                                         "gl_MaxGeometryInputComponents",
+                                         "textureSize(00x00D",
+                                         "determinant(A0B",
+                                         "textureProjLod(00X30B00B",
+                                         "texture(00S20B00B",
+                                         "imageAtomicOr(01S20D00E",
+                                         "gl_VertexID",
+                                         "matrixCompMult(F0BF0B",
+                                         "imageAtomicOr(01R20D00D00E",
+                                         "asinh(10B",
+                                         "imageAtomicXor(01H20D00D",
+                                         "textureProjOffset(00I20B10D00B",
+                                         "gl_SampleID",
+                                         "interpolateAtOffset(30B10B",
+                                         "beginInvocationInterlockNV(",
+                                         "imageAtomicAnd(01K10D00D",
+                                         "textureProjLodOffset(00Y30B00B20D",
+                                         "textureGatherOffset(00d10B00B10D",
+                                         "exp2(10B",
+                                         "asinh(00B",
+                                         "imageAtomicExchange(01A20D00B",
+                                         "lessThan(20B20B",
+                                         "textureProjLodOffset(00d30B00B10D",
+                                         "imageAtomicMax(01R20D00D00E",
+                                         "max(00E00E",
+                                         "cosh(10B",
+                                         "gl_TessLevelOuter",
+                                         "imageAtomicAnd(01e10D00D",
+                                         "imageAtomicExchange(01E10D00D",
+                                         "textureGatherOffsets(00U20B10Dx400D",
+                                         "textureProj(00R30B",
+                                         "textureGather(00x30B00D",
+                                         "imageAtomicCompSwap(01O00D00E00E",
+                                         "textureGradOffset(00L20B10B10B10D",
+                                         "textureProjLodOffset(00R20B00B10D",
+                                         "textureProj(00S30B00B",
                                          "imageSize(01W",
-                                         "imageSize(01B",
-                                         "imageSize(01M",
-                                         "imageSize(01X",
-                                         "imageSize(01C",
-                                         "imageSize(01N",
-                                         "imageSize(01Y",
-                                         "imageSize(01H",
-                                         "imageSize(01S",
-                                         "imageSize(01d",
-                                         "imageSize(01J",
-                                         "imageSize(01U",
-                                         "imageSize(01f",
-                                         "imageStore(00z10D30B",
-                                         "imageStore(01K10D30D",
-                                         "imageStore(01V10D30E",
-                                         "imageStore(01A20D30B",
-                                         "imageStore(01L20D30D",
-                                         "imageStore(01W20D30E",
-                                         "imageStore(01B20D30B",
-                                         "imageStore(01M20D30D",
+                                         "max(20B20B",
+                                         "mod(10B10B",
+                                         "textureGrad(00x30B20B20B",
+                                         "imageAtomicMin(01b10D00D00E",
+                                         "imageAtomicMin(01e10D00D",
+                                         "sin(00B",
+                                         "imageAtomicXor(01N20D00D",
+                                         "imageAtomicXor(01J00D00E",
+                                         "imageAtomicMin(01B20D00D",
+                                         "bitfieldInsert(00D00D00D00D",
+                                         "imageAtomicXor(01F10D00D00E",
+                                         "subpassLoad(01j",
+                                         "imageAtomicCompSwap(01K10D00E00E",
+                                         "imageAtomicOr(01W20D00D",
                                          "imageStore(01X20D30E",
-                                         "imageStore(01C20D30B",
-                                         "imageStore(01N20D30D",
-                                         "imageStore(01Y20D30E",
-                                         "imageStore(01H20D30B",
-                                         "imageStore(01S20D30D",
-                                         "imageStore(01d20D30E",
-                                         "imageStore(01J00D30B",
-                                         "imageStore(01U00D30D",
-                                         "imageStore(01f00D30E",
-                                         "imageLoad(00z10D",
-                                         "imageLoad(01K10D",
-                                         "imageLoad(01V10D",
-                                         "imageLoad(01A20D",
-                                         "imageLoad(01L20D",
-                                         "imageLoad(01W20D",
-                                         "imageLoad(01B20D",
-                                         "imageLoad(01M20D",
-                                         "imageLoad(01X20D",
-                                         "imageLoad(01C20D",
-                                         "imageLoad(01N20D",
-                                         "imageLoad(01Y20D",
-                                         "imageLoad(01H20D",
-                                         "imageLoad(01S20D",
-                                         "imageLoad(01d20D",
-                                         "imageLoad(01J00D",
-                                         "imageLoad(01U00D",
-                                         "imageLoad(01f00D",
-                                         "imageAtomicAdd(00z10D00E",
-                                         "imageAtomicAdd(01K10D00E",
-                                         "imageAtomicAdd(01V10D00E",
-                                         "imageAtomicAdd(01A20D00E",
-                                         "imageAtomicAdd(01L20D00E",
-                                         "imageAtomicAdd(01W20D00E",
-                                         "imageAtomicAdd(01C20D00E",
-                                         "imageAtomicAdd(01N20D00E",
-                                         "imageAtomicAdd(01Y20D00E",
-                                         "imageAtomicAdd(01J00D00E",
-                                         "imageAtomicAdd(01U00D00E",
-                                         "imageAtomicAdd(01f00D00E",
-                                         "imageAtomicAdd(01B20D00E",
-                                         "imageAtomicAdd(01M20D00E",
-                                         "imageAtomicAdd(01X20D00E",
-                                         "imageAtomicAdd(01H20D00E",
-                                         "imageAtomicAdd(01S20D00E",
-                                         "imageAtomicAdd(01d20D00E",
-                                         "imageAtomicAdd(01D00D00E",
-                                         "imageAtomicAdd(01O00D00E",
-                                         "imageAtomicAdd(01Z00D00E",
-                                         "imageAtomicAdd(01E10D00E",
-                                         "imageAtomicAdd(01P10D00E",
+                                         "bitfieldInsert(20D20D00D00D",
+                                         "texture(00d20B00B",
+                                         "texture2DProj(00I20B",
+                                         "bitfieldReverse(30E",
+                                         "textureProj(00R20B",
+                                         "findLSB(10D",
+                                         "gl_MaxTessControlInputComponents",
+                                         "gl_InvocationID",
+                                         "textureVideoWEBGL(00y10B",
+                                         "imageAtomicAdd(01R20D00D00E",
+                                         "floatBitsToInt(30B",
+                                         "imageStore(01L20D30D",
+                                         "texture2D(00I10B",
+                                         "textureProjLodOffset(00R30B00B10D",
+                                         "texture3DLod(00J20B00B",
+                                         "sin(20B",
+                                         "trunc(20B",
+                                         "mix(20D20D20F",
+                                         "texture(00M10B",
+                                         "imageAtomicAnd(01F10D00D00D",
+                                         "imageAtomicMax(01a10D00D",
                                          "imageAtomicAdd(01a10D00E",
-                                         "imageAtomicAdd(01I10D00E",
-                                         "imageAtomicAdd(01T10D00E",
-                                         "imageAtomicAdd(01e10D00E",
-                                         "imageAtomicAdd(01F10D00D00E",
-                                         "imageAtomicAdd(01Q10D00D00E",
-                                         "imageAtomicAdd(01b10D00D00E",
-                                         "imageAtomicAdd(01G20D00D00E",
-                                         "imageAtomicAdd(01R20D00D00E",
-                                         "imageAtomicAdd(01c20D00D00E",
-                                         "imageAtomicAdd(00z10D00D",
-                                         "imageAtomicAdd(01K10D00D",
-                                         "imageAtomicAdd(01V10D00D",
-                                         "imageAtomicAdd(01A20D00D",
-                                         "imageAtomicAdd(01L20D00D",
-                                         "imageAtomicAdd(01W20D00D",
-                                         "imageAtomicAdd(01C20D00D",
-                                         "imageAtomicAdd(01N20D00D",
-                                         "imageAtomicAdd(01Y20D00D",
-                                         "imageAtomicAdd(01J00D00D",
-                                         "imageAtomicAdd(01U00D00D",
-                                         "imageAtomicAdd(01f00D00D",
-                                         "imageAtomicAdd(01B20D00D",
-                                         "imageAtomicAdd(01M20D00D",
-                                         "imageAtomicAdd(01X20D00D",
-                                         "imageAtomicAdd(01H20D00D",
-                                         "imageAtomicAdd(01S20D00D",
-                                         "imageAtomicAdd(01d20D00D",
-                                         "imageAtomicAdd(01D00D00D",
-                                         "imageAtomicAdd(01O00D00D",
-                                         "imageAtomicAdd(01Z00D00D",
-                                         "imageAtomicAdd(01E10D00D",
-                                         "imageAtomicAdd(01P10D00D",
-                                         "imageAtomicAdd(01a10D00D",
-                                         "imageAtomicAdd(01I10D00D",
-                                         "imageAtomicAdd(01T10D00D",
-                                         "imageAtomicAdd(01e10D00D",
-                                         "imageAtomicAdd(01F10D00D00D",
+                                         "pow(10B10B",
                                          "imageAtomicAdd(01Q10D00D00D",
-                                         "imageAtomicAdd(01b10D00D00D",
-                                         "imageAtomicAdd(01G20D00D00D",
-                                         "imageAtomicAdd(01R20D00D00D",
-                                         "imageAtomicAdd(01c20D00D00D",
-                                         "imageAtomicMin(00z10D00E",
-                                         "imageAtomicMin(01K10D00E",
-                                         "imageAtomicMin(01V10D00E",
-                                         "imageAtomicMin(01A20D00E",
-                                         "imageAtomicMin(01L20D00E",
-                                         "imageAtomicMin(01W20D00E",
-                                         "imageAtomicMin(01C20D00E",
-                                         "imageAtomicMin(01N20D00E",
-                                         "imageAtomicMin(01Y20D00E",
-                                         "imageAtomicMin(01J00D00E",
-                                         "imageAtomicMin(01U00D00E",
-                                         "imageAtomicMin(01f00D00E",
+                                         "uintBitsToFloat(10E",
+                                         "imageAtomicOr(01N20D00D",
+                                         "imageAtomicXor(01A20D00D",
                                          "imageAtomicMin(01B20D00E",
-                                         "imageAtomicMin(01M20D00E",
-                                         "imageAtomicMin(01X20D00E",
-                                         "imageAtomicMin(01H20D00E",
-                                         "imageAtomicMin(01S20D00E",
-                                         "imageAtomicMin(01d20D00E",
-                                         "imageAtomicMin(01D00D00E",
-                                         "imageAtomicMin(01O00D00E",
-                                         "imageAtomicMin(01Z00D00E",
-                                         "imageAtomicMin(01E10D00E",
-                                         "imageAtomicMin(01P10D00E",
+                                         "samplePosition(00E",
+                                         "textureProj(00X20B00B",
+                                         "gl_FragDepthEXT",
+                                         "all(30F",
+                                         "imageAtomicMax(01S20D00D",
+                                         "",
+                                         "imageAtomicMax(01Y20D00E",
+                                         "asin(20B",
+                                         "textureGatherOffset(00X10B10D",
+                                         "textureProjOffset(00R30B10D00B",
+                                         "textureLod(00x30B00B",
+                                         "refract(30B30B00B",
+                                         "imageAtomicAdd(01d20D00D",
+                                         "textureLodOffset(00U20B00B10D",
+                                         "tan(20B",
+                                         "imageAtomicMax(01I10D00D",
+                                         "imageAtomicExchange(01O00D00D",
+                                         "imageAtomicXor(01B20D00D",
+                                         "bitfieldReverse(10E",
+                                         "atanh(00B",
+                                         "textureLodOffset(00d20B00B10D",
+                                         "imageAtomicXor(01P10D00E",
+                                         "mix(10D10D10F",
+                                         "gl_SampleMaskIn",
+                                         "lessThan(10D10D",
+                                         "textureLodOffset(00R10B00B10D",
+                                         "atomicMax(00D00D",
+                                         "min(00E00E",
+                                         "textureProj(00N30B00B",
+                                         "imageAtomicCompSwap(01E10D00E00E",
+                                         "imageStore(01C20D30B",
+                                         "pixelLocalLoadANGLE(01i",
+                                         "abs(20D",
+                                         "texture2DProjGradEXT(00I20B10B10B",
+                                         "equal(10F10F",
+                                         "texelFetch(00R10D00D",
+                                         "faceforward(20B20B20B",
+                                         "imageAtomicAdd(01U00D00D",
+                                         "gl_GlobalInvocationID",
+                                         "mix(30E30E30F",
+                                         "gl_MaxVaryingVectors",
+                                         "imageAtomicExchange(00z10D00E",
+                                         "imageStore(01d20D30E",
+                                         "subpassLoad(01m00D",
+                                         "shadow2DEXT(00d20B",
+                                         "imageAtomicAnd(01I10D00E",
+                                         "textureGrad(00s30B20B20B",
+                                         "gl_LastFragData",
+                                         "clamp(30D30D30D",
+                                         "min(00B00B",
+                                         "texelFetch(00J20D00D",
+                                         "textureOffset(00I10B10D00B",
+                                         "sqrt(20B",
+                                         "imageAtomicOr(01A20D00D",
+                                         "texture2DProjLodEXT(00I20B00B",
+                                         "textureProjGradOffset(00I20B10B10B10D",
+                                         "imageSize(01J",
+                                         "mix(20E20E20F",
+                                         "sqrt(30B",
+                                         "imageAtomicOr(01b10D00D00D",
+                                         "textureGatherOffsets(00R10B10Dx400D",
+                                         "textureProjOffset(00d30B10D",
+                                         "texture(00y10B",
+                                         "mix(20B20B20B",
+                                         "pixelLocalLoadANGLE(01h",
+                                         "greaterThanEqual(30B30B",
+                                         "imageAtomicExchange(01S20D00D",
+                                         "imageAtomicAnd(00z10D00E",
+                                         "imageAtomicCompSwap(01f00D00D00D",
+                                         "imageAtomicExchange(01L20D00E",
+                                         "imageAtomicAnd(01b10D00D00E",
+                                         "imageLoad(01W20D",
+                                         "imageAtomicAdd(01Z00D00D",
+                                         "gl_BaseInstance",
+                                         "imageAtomicAnd(01H20D00D",
+                                         "textureProj(00Y30B00B",
+                                         "textureProjOffset(00X30B10D",
+                                         "imageAtomicXor(01J00D00D",
+                                         "clamp(00E00E00E",
+                                         "outerProduct(20B20B",
+                                         "imageAtomicCompSwap(01a10D00E00E",
+                                         "imageAtomicMax(00z10D00E",
+                                         "imageAtomicMin(01R20D00D00D",
+                                         "inversesqrt(10B",
+                                         "atan(20B",
+                                         "angle_BaseVertex",
+                                         "imageAtomicAdd(01O00D00D",
+                                         "bitfieldInsert(20E20E00D00D",
+                                         "log2(10B",
+                                         "textureGatherOffset(00R10B10D00D",
+                                         "imageAtomicAdd(01A20D00E",
+                                         "imageAtomicExchange(01c20D00D00D",
+                                         "any(30F",
+                                         "gl_DepthRangeParameters",
+                                         "imageAtomicAnd(01K10D00E",
                                          "imageAtomicMin(01a10D00E",
-                                         "imageAtomicMin(01I10D00E",
-                                         "imageAtomicMin(01T10D00E",
-                                         "imageAtomicMin(01e10D00E",
-                                         "imageAtomicMin(01F10D00D00E",
+                                         "findMSB(10E",
+                                         "atan(20B20B",
+                                         "imageAtomicMax(01T10D00D",
+                                         "imageAtomicXor(01Y20D00E",
+                                         "interpolateAtSample(20B00D",
+                                         "imageAtomicAdd(01M20D00D",
+                                         "imageAtomicOr(01R20D00D00D",
+                                         "radians(10B",
+                                         "atanh(30B",
+                                         "gl_MaxGeometryTotalOutputComponents",
                                          "imageAtomicMin(01Q10D00D00E",
-                                         "imageAtomicMin(01b10D00D00E",
-                                         "imageAtomicMin(01G20D00D00E",
-                                         "imageAtomicMin(01R20D00D00E",
-                                         "imageAtomicMin(01c20D00D00E",
-                                         "imageAtomicMin(00z10D00D",
-                                         "imageAtomicMin(01K10D00D",
-                                         "imageAtomicMin(01V10D00D",
-                                         "imageAtomicMin(01A20D00D",
-                                         "imageAtomicMin(01L20D00D",
-                                         "imageAtomicMin(01W20D00D",
-                                         "imageAtomicMin(01C20D00D",
-                                         "imageAtomicMin(01N20D00D",
-                                         "imageAtomicMin(01Y20D00D",
-                                         "imageAtomicMin(01J00D00D",
-                                         "imageAtomicMin(01U00D00D",
-                                         "imageAtomicMin(01f00D00D",
-                                         "imageAtomicMin(01B20D00D",
-                                         "imageAtomicMin(01M20D00D",
-                                         "imageAtomicMin(01X20D00D",
-                                         "imageAtomicMin(01H20D00D",
-                                         "imageAtomicMin(01S20D00D",
-                                         "imageAtomicMin(01d20D00D",
-                                         "imageAtomicMin(01D00D00D",
-                                         "imageAtomicMin(01O00D00D",
-                                         "imageAtomicMin(01Z00D00D",
-                                         "imageAtomicMin(01E10D00D",
-                                         "imageAtomicMin(01P10D00D",
-                                         "imageAtomicMin(01a10D00D",
-                                         "imageAtomicMin(01I10D00D",
-                                         "imageAtomicMin(01T10D00D",
-                                         "imageAtomicMin(01e10D00D",
-                                         "imageAtomicMin(01F10D00D00D",
-                                         "imageAtomicMin(01Q10D00D00D",
-                                         "imageAtomicMin(01b10D00D00D",
-                                         "imageAtomicMin(01G20D00D00D",
-                                         "imageAtomicMin(01R20D00D00D",
-                                         "imageAtomicMin(01c20D00D00D",
-                                         "imageAtomicMax(00z10D00E",
-                                         "imageAtomicMax(01K10D00E",
-                                         "imageAtomicMax(01V10D00E",
-                                         "imageAtomicMax(01A20D00E",
-                                         "imageAtomicMax(01L20D00E",
-                                         "imageAtomicMax(01W20D00E",
-                                         "imageAtomicMax(01C20D00E",
-                                         "imageAtomicMax(01N20D00E",
-                                         "imageAtomicMax(01Y20D00E",
-                                         "imageAtomicMax(01J00D00E",
-                                         "imageAtomicMax(01U00D00E",
-                                         "imageAtomicMax(01f00D00E",
-                                         "imageAtomicMax(01B20D00E",
-                                         "imageAtomicMax(01M20D00E",
-                                         "imageAtomicMax(01X20D00E",
-                                         "imageAtomicMax(01H20D00E",
-                                         "imageAtomicMax(01S20D00E",
-                                         "imageAtomicMax(01d20D00E",
-                                         "imageAtomicMax(01D00D00E",
-                                         "imageAtomicMax(01O00D00E",
+                                         "imageAtomicAnd(01V10D00E",
+                                         "max(30B00B",
+                                         "textureGrad(00L20B10B10B",
+                                         "notEqual(30F30F",
+                                         "exp(00B",
+                                         "textureGather(00R10B",
+                                         "texture(00J20B",
+                                         "atan(00B00B",
+                                         "gl_TessLevelInner",
+                                         "mix(20B20B20F",
+                                         "interpolateAtCentroid(10B",
+                                         "imageAtomicXor(01C20D00D",
+                                         "abs(00D",
+                                         "mix(20B20B00B",
+                                         "imageAtomicXor(01Y20D00D",
+                                         "bitfieldReverse(00D",
+                                         "imageAtomicExchange(01d20D00D",
+                                         "textureGradOffset(00Y20B20B20B20D",
+                                         "bitfieldExtract(30D00D00D",
+                                         "min(30B30B",
+                                         "imageAtomicExchange(01S20D00B",
+                                         "texture(00Y20B",
+                                         "texelFetch(00r00D",
+                                         "gl_FragDepth",
+                                         "textureGrad(00e30B20B20B",
+                                         "inversesqrt(20B",
+                                         "lessThan(30E30E",
+                                         "round(30B",
+                                         "imageAtomicExchange(01J00D00D",
                                          "imageAtomicMax(01Z00D00E",
-                                         "imageAtomicMax(01E10D00E",
-                                         "imageAtomicMax(01P10D00E",
-                                         "imageAtomicMax(01a10D00E",
-                                         "imageAtomicMax(01I10D00E",
-                                         "imageAtomicMax(01T10D00E",
-                                         "imageAtomicMax(01e10D00E",
-                                         "imageAtomicMax(01F10D00D00E",
-                                         "imageAtomicMax(01Q10D00D00E",
-                                         "imageAtomicMax(01b10D00D00E",
-                                         "imageAtomicMax(01G20D00D00E",
-                                         "imageAtomicMax(01R20D00D00E",
+                                         "bitCount(20D",
+                                         "textureGatherOffsets(00U20B10Dx4",
+                                         "reflect(30B30B",
+                                         "textureProjGrad(00Y30B20B20B",
+                                         "imageAtomicCompSwap(01D00D00D00D",
+                                         "imageAtomicCompSwap(01D00D00E00E",
+                                         "imageAtomicAnd(01Q10D00D00D",
+                                         "isnan(00B",
+                                         "imageAtomicOr(01c20D00D00E",
+                                         "equal(10B10B",
+                                         "imageAtomicCompSwap(01Q10D00D00E00E",
+                                         "imageAtomicAdd(01B20D00D",
+                                         "clamp(30E00E00E",
+                                         "textureProjOffset(00X20B10D00B",
+                                         "notEqual(10F10F",
+                                         "imageAtomicXor(01b10D00D00E",
+                                         "textureGather(00d10B",
+                                         "asinh(30B",
+                                         "inverse(A0B",
+                                         "lessThan(20E20E",
+                                         "textureProjGrad(00R20B10B10B",
+                                         "imageAtomicAnd(01c20D00D00E",
+                                         "findLSB(00D",
+                                         "interpolateAtCenter(00B",
+                                         "inversesqrt(00B",
+                                         "textureProj(00X20B",
+                                         "imageAtomicMax(01G20D00D00D",
+                                         "textureGather(00U20B",
+                                         "gl_LastFragColorARM",
+                                         "sinh(30B",
+                                         "step(10B10B",
+                                         "textureSize(00L00D",
+                                         "",
+                                         "imageAtomicExchange(01G20D00D00E",
+                                         "textureProjGradOffset(00X20B10B10B10D",
+                                         "notEqual(30E30E",
+                                         "textureSize(00d00D",
                                          "imageAtomicMax(01c20D00D00E",
-                                         "imageAtomicMax(00z10D00D",
-                                         "imageAtomicMax(01K10D00D",
-                                         "imageAtomicMax(01V10D00D",
-                                         "imageAtomicMax(01A20D00D",
-                                         "imageAtomicMax(01L20D00D",
-                                         "imageAtomicMax(01W20D00D",
-                                         "imageAtomicMax(01C20D00D",
-                                         "imageAtomicMax(01N20D00D",
-                                         "imageAtomicMax(01Y20D00D",
-                                         "imageAtomicMax(01J00D00D",
+                                         "imageAtomicExchange(01Q10D00D00D",
+                                         "imageStore(01M20D30D",
+                                         "imageAtomicAdd(01b10D00D00E",
+                                         "imageAtomicExchange(01b10D00D00D",
+                                         "textureGather(00U20B00D",
+                                         "imageAtomicMin(01S20D00E",
+                                         "sign(10D",
+                                         "imulExtended(20D20D20D20D",
+                                         "bitfieldReverse(00E",
+                                         "imageAtomicMax(01F10D00D00D",
+                                         "log(30B",
+                                         "texelFetch(00M10D00D",
+                                         "clamp(10B10B10B",
+                                         "imageAtomicAdd(01f00D00D",
+                                         "imageAtomicMax(01X20D00D",
+                                         "textureOffset(00d20B10D",
+                                         "normalize(00B",
+                                         "imageAtomicAdd(01E10D00E",
+                                         "imageAtomicMin(01F10D00D00E",
+                                         "abs(30D",
+                                         "textureProjGradOffset(00R30B10B10B10D",
                                          "imageAtomicMax(01U00D00D",
+                                         "gl_SamplePosition",
+                                         "gl_WorkGroupSize",
+                                         "gl_MinProgramTexelOffset",
+                                         "packSnorm4x8(30B",
+                                         "imageAtomicMax(01B20D00E",
+                                         "imageAtomicExchange(01F10D00D00E",
+                                         "cos(30B",
+                                         "imageAtomicXor(01K10D00D",
+                                         "imageAtomicXor(01a10D00E",
                                          "imageAtomicMax(01f00D00D",
-                                         "imageAtomicMax(01B20D00D",
-                                         "imageAtomicMax(01M20D00D",
-                                         "imageAtomicMax(01X20D00D",
-                                         "imageAtomicMax(01H20D00D",
-                                         "imageAtomicMax(01S20D00D",
-                                         "imageAtomicMax(01d20D00D",
-                                         "imageAtomicMax(01D00D00D",
-                                         "imageAtomicMax(01O00D00D",
-                                         "imageAtomicMax(01Z00D00D",
-                                         "imageAtomicMax(01E10D00D",
-                                         "imageAtomicMax(01P10D00D",
-                                         "imageAtomicMax(01a10D00D",
-                                         "imageAtomicMax(01I10D00D",
-                                         "imageAtomicMax(01T10D00D",
-                                         "imageAtomicMax(01e10D00D",
-                                         "imageAtomicMax(01F10D00D00D",
-                                         "imageAtomicMax(01Q10D00D00D",
-                                         "imageAtomicMax(01b10D00D00D",
-                                         "imageAtomicMax(01G20D00D00D",
-                                         "imageAtomicMax(01R20D00D00D",
-                                         "imageAtomicMax(01c20D00D00D",
-                                         "imageAtomicAnd(00z10D00E",
-                                         "imageAtomicAnd(01K10D00E",
-                                         "imageAtomicAnd(01V10D00E",
-                                         "imageAtomicAnd(01A20D00E",
-                                         "imageAtomicAnd(01L20D00E",
-                                         "imageAtomicAnd(01W20D00E",
-                                         "imageAtomicAnd(01C20D00E",
-                                         "imageAtomicAnd(01N20D00E",
-                                         "imageAtomicAnd(01Y20D00E",
-                                         "imageAtomicAnd(01J00D00E",
-                                         "imageAtomicAnd(01U00D00E",
-                                         "imageAtomicAnd(01f00D00E",
-                                         "imageAtomicAnd(01B20D00E",
-                                         "imageAtomicAnd(01M20D00E",
-                                         "imageAtomicAnd(01X20D00E",
-                                         "imageAtomicAnd(01H20D00E",
-                                         "imageAtomicAnd(01S20D00E",
-                                         "imageAtomicAnd(01d20D00E",
-                                         "imageAtomicAnd(01D00D00E",
-                                         "imageAtomicAnd(01O00D00E",
+                                         "imageAtomicMin(01C20D00D",
+                                         "textureProjOffset(00Y30B20D",
+                                         "imageAtomicExchange(01d20D00B",
+                                         "imageAtomicOr(01O00D00D",
+                                         "distance(00B00B",
+                                         "findMSB(10D",
+                                         "ceil(20B",
+                                         "imageAtomicXor(01G20D00D00E",
+                                         "memoryBarrierAtomicCounter(",
+                                         "min(20B00B",
+                                         "textureGrad(00K20B20B20B",
+                                         "max(10E10E",
+                                         "imageAtomicExchange(01C20D00E",
+                                         "sinh(00B",
+                                         "imageStore(01U00D30D",
+                                         "isinf(20B",
+                                         "imageAtomicMax(01L20D00E",
+                                         "gl_MaxTessEvaluationTextureImageUnits",
+                                         "imageLoad(01N20D",
+                                         "modf(00B00B",
+                                         "imageAtomicCompSwap(00z10D00E00E",
+                                         "min(30D30D",
+                                         "gl_LastFragColor",
+                                         "textureSize(00J00D",
+                                         "atomicCompSwap(00E00E00E",
+                                         "lessThanEqual(10D10D",
+                                         "roundEven(20B",
+                                         "textureCubeLod(00K20B00B",
+                                         "uaddCarry(20E20E20E",
+                                         "round(00B",
+                                         "imageAtomicMin(01D00D00D",
                                          "imageAtomicAnd(01Z00D00E",
-                                         "imageAtomicAnd(01E10D00E",
-                                         "imageAtomicAnd(01P10D00E",
-                                         "imageAtomicAnd(01a10D00E",
-                                         "imageAtomicAnd(01I10D00E",
-                                         "imageAtomicAnd(01T10D00E",
-                                         "imageAtomicAnd(01e10D00E",
-                                         "imageAtomicAnd(01F10D00D00E",
-                                         "imageAtomicAnd(01Q10D00D00E",
-                                         "imageAtomicAnd(01b10D00D00E",
-                                         "imageAtomicAnd(01G20D00D00E",
-                                         "imageAtomicAnd(01R20D00D00E",
-                                         "imageAtomicAnd(01c20D00D00E",
-                                         "imageAtomicAnd(00z10D00D",
-                                         "imageAtomicAnd(01K10D00D",
-                                         "imageAtomicAnd(01V10D00D",
-                                         "imageAtomicAnd(01A20D00D",
-                                         "imageAtomicAnd(01L20D00D",
-                                         "imageAtomicAnd(01W20D00D",
-                                         "imageAtomicAnd(01C20D00D",
-                                         "imageAtomicAnd(01N20D00D",
-                                         "imageAtomicAnd(01Y20D00D",
-                                         "imageAtomicAnd(01J00D00D",
-                                         "imageAtomicAnd(01U00D00D",
-                                         "imageAtomicAnd(01f00D00D",
-                                         "imageAtomicAnd(01B20D00D",
-                                         "imageAtomicAnd(01M20D00D",
-                                         "imageAtomicAnd(01X20D00D",
-                                         "imageAtomicAnd(01H20D00D",
-                                         "imageAtomicAnd(01S20D00D",
-                                         "imageAtomicAnd(01d20D00D",
-                                         "imageAtomicAnd(01D00D00D",
-                                         "imageAtomicAnd(01O00D00D",
-                                         "imageAtomicAnd(01Z00D00D",
-                                         "imageAtomicAnd(01E10D00D",
-                                         "imageAtomicAnd(01P10D00D",
-                                         "imageAtomicAnd(01a10D00D",
-                                         "imageAtomicAnd(01I10D00D",
-                                         "imageAtomicAnd(01T10D00D",
-                                         "imageAtomicAnd(01e10D00D",
-                                         "imageAtomicAnd(01F10D00D00D",
-                                         "imageAtomicAnd(01Q10D00D00D",
-                                         "imageAtomicAnd(01b10D00D00D",
-                                         "imageAtomicAnd(01G20D00D00D",
-                                         "imageAtomicAnd(01R20D00D00D",
-                                         "imageAtomicAnd(01c20D00D00D",
-                                         "imageAtomicOr(00z10D00E",
-                                         "imageAtomicOr(01K10D00E",
-                                         "imageAtomicOr(01V10D00E",
-                                         "imageAtomicOr(01A20D00E",
-                                         "imageAtomicOr(01L20D00E",
-                                         "imageAtomicOr(01W20D00E",
-                                         "imageAtomicOr(01C20D00E",
-                                         "imageAtomicOr(01N20D00E",
-                                         "imageAtomicOr(01Y20D00E",
-                                         "imageAtomicOr(01J00D00E",
-                                         "imageAtomicOr(01U00D00E",
-                                         "imageAtomicOr(01f00D00E",
-                                         "imageAtomicOr(01B20D00E",
-                                         "imageAtomicOr(01M20D00E",
-                                         "imageAtomicOr(01X20D00E",
-                                         "imageAtomicOr(01H20D00E",
-                                         "imageAtomicOr(01S20D00E",
-                                         "imageAtomicOr(01d20D00E",
                                          "imageAtomicOr(01D00D00E",
-                                         "imageAtomicOr(01O00D00E",
-                                         "imageAtomicOr(01Z00D00E",
-                                         "imageAtomicOr(01E10D00E",
-                                         "imageAtomicOr(01P10D00E",
-                                         "imageAtomicOr(01a10D00E",
-                                         "imageAtomicOr(01I10D00E",
-                                         "imageAtomicOr(01T10D00E",
-                                         "imageAtomicOr(01e10D00E",
-                                         "imageAtomicOr(01F10D00D00E",
-                                         "imageAtomicOr(01Q10D00D00E",
-                                         "imageAtomicOr(01b10D00D00E",
-                                         "imageAtomicOr(01G20D00D00E",
-                                         "imageAtomicOr(01R20D00D00E",
-                                         "imageAtomicOr(01c20D00D00E",
-                                         "imageAtomicOr(00z10D00D",
+                                         "refract(20B20B00B",
+                                         "textureProjOffset(00d30B10D00B",
+                                         "mod(20B00B",
+                                         "notEqual(30B30B",
+                                         "imageAtomicMin(01Z00D00E",
+                                         "max(20E20E",
+                                         "gl_MaxFragmentAtomicCounters",
+                                         "lessThan(20D20D",
+                                         "dFdx(30B",
+                                         "texture(00U20B",
+                                         "imageAtomicMax(01A20D00D",
+                                         "mix(00E00E00F",
+                                         "textureProj(00I30B",
+                                         "texture(00O10B",
+                                         "imageAtomicOr(01a10D00D",
+                                         "bitfieldInsert(00E00E00D00D",
+                                         "not(20F",
+                                         "textureProjOffset(00I30B10D00B",
+                                         "gl_MaxVertexTextureImageUnits",
+                                         "texture(00J20B00B",
+                                         "imageAtomicAnd(01G20D00D00E",
+                                         "imageAtomicAdd(01R20D00D00D",
+                                         "sign(20D",
+                                         "interpolateAtCenter(10B",
+                                         "imageAtomicMax(01F10D00D00E",
+                                         "gl_MaxTextureImageUnits",
+                                         "length(30B",
+                                         "lessThanEqual(10E10E",
+                                         "pow(20B20B",
+                                         "transpose(B0B",
+                                         "imageAtomicExchange(01O00D00B",
+                                         "interpolateAtCentroid(00B",
+                                         "gl_MaxTessControlImageUniforms",
+                                         "textureProjGradOffset(00J30B20B20B20D",
+                                         "min(30E00E",
+                                         "texture2DLodEXT(00I10B00B",
+                                         "outerProduct(20B10B",
+                                         "texture2DProj(00I30B",
+                                         "imageSize(01U",
+                                         "isinf(10B",
                                          "imageAtomicOr(01K10D00D",
+                                         "textureProjLod(00X20B00B",
+                                         "textureProjOffset(00X30B10D00B",
+                                         "imageAtomicAdd(01d20D00E",
+                                         "textureGatherOffsets(00L20B10Dx400D",
+                                         "textureProjLod(00I30B00B",
+                                         "texelFetchOffset(00Y20D00D20D",
+                                         "textureSize(00W",
+                                         "imageAtomicAdd(01b10D00D00D",
+                                         "imageAtomicMin(01f00D00D",
+                                         "imageAtomicAnd(01J00D00E",
+                                         "max(20D00D",
                                          "imageAtomicOr(01V10D00D",
-                                         "imageAtomicOr(01A20D00D",
-                                         "imageAtomicOr(01L20D00D",
-                                         "imageAtomicOr(01W20D00D",
-                                         "imageAtomicOr(01C20D00D",
-                                         "imageAtomicOr(01N20D00D",
-                                         "imageAtomicOr(01Y20D00D",
-                                         "imageAtomicOr(01J00D00D",
-                                         "imageAtomicOr(01U00D00D",
-                                         "imageAtomicOr(01f00D00D",
-                                         "imageAtomicOr(01B20D00D",
-                                         "imageAtomicOr(01M20D00D",
-                                         "imageAtomicOr(01X20D00D",
-                                         "imageAtomicOr(01H20D00D",
-                                         "imageAtomicOr(01S20D00D",
-                                         "imageAtomicOr(01d20D00D",
-                                         "imageAtomicOr(01D00D00D",
-                                         "imageAtomicOr(01O00D00D",
-                                         "imageAtomicOr(01Z00D00D",
-                                         "imageAtomicOr(01E10D00D",
-                                         "imageAtomicOr(01P10D00D",
-                                         "imageAtomicOr(01a10D00D",
-                                         "imageAtomicOr(01I10D00D",
-                                         "imageAtomicOr(01T10D00D",
+                                         "textureProj(00M20B",
+                                         "imageAtomicMin(01O00D00D",
+                                         "gl_PointCoord",
+                                         "not(30F",
+                                         "unpackSnorm2x16(00E",
+                                         "imageAtomicMax(01P10D00E",
+                                         "textureProj(00J30B",
+                                         "usubBorrow(00E00E00E",
+                                         "imageAtomicMin(01c20D00D00D",
+                                         "texture(00s30B00B",
+                                         "gl_MaxGeometryImageUniforms",
+                                         "imageAtomicExchange(01b10D00D00B",
+                                         "imageAtomicAnd(01B20D00E",
+                                         "pixelLocalStoreANGLE(01h30D",
+                                         "imageAtomicExchange(01E10D00B",
+                                         "imageAtomicAnd(01a10D00E",
+                                         "imageAtomicAnd(01A20D00D",
+                                         "interpolateAtSample(10B00D",
+                                         "imageAtomicAdd(01J00D00D",
+                                         "gl_MaxVertexUniformVectors",
+                                         "imageAtomicCompSwap(01H20D00D00D",
+                                         "imageAtomicExchange(01K10D00E",
+                                         "imageAtomicExchange(00z10D00D",
+                                         "imageAtomicAdd(01L20D00E",
+                                         "imageAtomicCompSwap(01M20D00E00E",
+                                         "imageAtomicCompSwap(01H20D00E00E",
+                                         "imageAtomicAdd(01C20D00D",
+                                         "textureProj(00N20B",
+                                         "textureGrad(00Z20B20B20B",
+                                         "imageAtomicCompSwap(01b10D00D00E00E",
+                                         "imageAtomicAnd(01f00D00D",
+                                         "atan(00B",
+                                         "texture(00Y20B00B",
+                                         "imageStore(01V10D30E",
+                                         "gl_DrawID",
+                                         "clamp(10E10E10E",
+                                         "lessThan(30B30B",
+                                         "imageAtomicXor(01U00D00E",
+                                         "intBitsToFloat(00D",
+                                         "textureLodOffset(00X10B00B10D",
+                                         "floor(00B",
+                                         "textureProjOffset(00I30B10D",
+                                         "imageAtomicAdd(01D00D00E",
                                          "imageAtomicOr(01e10D00D",
-                                         "imageAtomicOr(01F10D00D00D",
-                                         "imageAtomicOr(01Q10D00D00D",
-                                         "imageAtomicOr(01b10D00D00D",
-                                         "imageAtomicOr(01G20D00D00D",
-                                         "imageAtomicOr(01R20D00D00D",
-                                         "imageAtomicOr(01c20D00D00D",
+                                         "imageAtomicOr(01A20D00E",
+                                         "imageAtomicXor(01L20D00D",
+                                         "greaterThan(30D30D",
+                                         "trunc(00B",
                                          "imageAtomicXor(00z10D00E",
-                                         "imageAtomicXor(01K10D00E",
-                                         "imageAtomicXor(01V10D00E",
-                                         "imageAtomicXor(01A20D00E",
+                                         "texture(00L20B",
+                                         "imageAtomicOr(01L20D00D",
                                          "imageAtomicXor(01L20D00E",
-                                         "imageAtomicXor(01W20D00E",
-                                         "imageAtomicXor(01C20D00E",
-                                         "imageAtomicXor(01N20D00E",
-                                         "imageAtomicXor(01Y20D00E",
-                                         "imageAtomicXor(01J00D00E",
-                                         "imageAtomicXor(01U00D00E",
-                                         "imageAtomicXor(01f00D00E",
-                                         "imageAtomicXor(01B20D00E",
-                                         "imageAtomicXor(01M20D00E",
-                                         "imageAtomicXor(01X20D00E",
-                                         "imageAtomicXor(01H20D00E",
+                                         "imageAtomicMin(01Q10D00D00D",
+                                         "imageSize(01B",
+                                         "subpassLoad(01n00D",
+                                         "textureProjLod(00d30B00B",
+                                         "textureCube(00K20B00B",
+                                         "degrees(00B",
+                                         "imageAtomicExchange(01X20D00D",
+                                         "imageAtomicOr(01Q10D00D00E",
+                                         "greaterThanEqual(10D10D",
+                                         "imageSize(01d",
+                                         "imageAtomicExchange(01b10D00D00E",
+                                         "usubBorrow(10E10E10E",
+                                         "sqrt(10B",
+                                         "imageAtomicMin(01L20D00E",
+                                         "imageAtomicMin(01L20D00D",
+                                         "texelFetch(00Y20D00D",
+                                         "imulExtended(00D00D00D00D",
+                                         "textureLod(00a20B00B",
+                                         "atan(10B10B",
+                                         "gl_MaxComputeImageUniforms",
+                                         "any(20F",
+                                         "imageAtomicMin(01W20D00D",
+                                         "textureLod(00U20B00B",
+                                         "clamp(30D00D00D",
+                                         "imageAtomicAnd(01d20D00E",
+                                         "pow(30B30B",
+                                         "imageAtomicOr(01Z00D00E",
+                                         "gl_MaxImageUnits",
+                                         "imageAtomicAnd(01B20D00D",
+                                         "endInvocationInterlockARB(",
+                                         "gl_PatchVerticesIn",
+                                         "imageAtomicAdd(01H20D00E",
+                                         "imageAtomicMin(01P10D00D",
+                                         "imageStore(01Y20D30E",
+                                         "clamp(00B00B00B",
+                                         "textureGatherOffset(00X10B10D00D",
+                                         "imageAtomicExchange(01A20D00D",
+                                         "imageAtomicAdd(01c20D00D00D",
+                                         "interpolateAtOffset(20B10B",
+                                         "isnan(30B",
+                                         "findMSB(20E",
+                                         "isnan(10B",
+                                         "textureLod(00k30B00B",
+                                         "mod(30B30B",
+                                         "textureProjLod(00Y30B00B",
+                                         "imageAtomicCompSwap(01V10D00D00D",
+                                         "textureLod(00L20B00B",
+                                         "textureProjOffset(00R30B10D",
+                                         "abs(20B",
+                                         "imageAtomicMin(01a10D00D",
+                                         "gl_HelperInvocation",
+                                         "imageAtomicMin(01b10D00D00D",
                                          "imageAtomicXor(01S20D00E",
-                                         "imageAtomicXor(01d20D00E",
-                                         "imageAtomicXor(01D00D00E",
-                                         "imageAtomicXor(01O00D00E",
-                                         "imageAtomicXor(01Z00D00E",
-                                         "imageAtomicXor(01E10D00E",
-                                         "imageAtomicXor(01P10D00E",
-                                         "imageAtomicXor(01a10D00E",
-                                         "imageAtomicXor(01I10D00E",
-                                         "imageAtomicXor(01T10D00E",
-                                         "imageAtomicXor(01e10D00E",
-                                         "imageAtomicXor(01F10D00D00E",
-                                         "imageAtomicXor(01Q10D00D00E",
-                                         "imageAtomicXor(01b10D00D00E",
-                                         "imageAtomicXor(01G20D00D00E",
-                                         "imageAtomicXor(01R20D00D00E",
-                                         "imageAtomicXor(01c20D00D00E",
-                                         "imageAtomicXor(00z10D00D",
-                                         "imageAtomicXor(01K10D00D",
-                                         "imageAtomicXor(01V10D00D",
-                                         "imageAtomicXor(01A20D00D",
-                                         "imageAtomicXor(01L20D00D",
-                                         "imageAtomicXor(01W20D00D",
-                                         "imageAtomicXor(01C20D00D",
-                                         "imageAtomicXor(01N20D00D",
-                                         "imageAtomicXor(01Y20D00D",
-                                         "imageAtomicXor(01J00D00D",
-                                         "imageAtomicXor(01U00D00D",
-                                         "imageAtomicXor(01f00D00D",
-                                         "imageAtomicXor(01B20D00D",
-                                         "imageAtomicXor(01M20D00D",
-                                         "imageAtomicXor(01X20D00D",
-                                         "imageAtomicXor(01H20D00D",
-                                         "imageAtomicXor(01S20D00D",
-                                         "imageAtomicXor(01d20D00D",
-                                         "imageAtomicXor(01D00D00D",
-                                         "imageAtomicXor(01O00D00D",
-                                         "imageAtomicXor(01Z00D00D",
-                                         "imageAtomicXor(01E10D00D",
-                                         "imageAtomicXor(01P10D00D",
-                                         "imageAtomicXor(01a10D00D",
-                                         "imageAtomicXor(01I10D00D",
-                                         "imageAtomicXor(01T10D00D",
+                                         "min(20E00E",
+                                         "atomicAdd(00E00E",
+                                         "imageAtomicAdd(01I10D00E",
+                                         "dFdx(20B",
+                                         "texture(00e30B00B",
+                                         "fma(20B20B20B",
+                                         "gl_MaxCullDistances",
+                                         "imageAtomicCompSwap(01C20D00E00E",
+                                         "dFdy(00B",
+                                         "textureSize(00j",
+                                         "imageAtomicOr(01M20D00E",
+                                         "textureProj(00O20B",
+                                         "sign(00B",
+                                         "imageAtomicOr(01U00D00D",
+                                         "max(20B00B",
+                                         "exp(10B",
+                                         "imageAtomicAdd(01K10D00D",
+                                         "imageAtomicExchange(01H20D00D",
+                                         "length(20B",
+                                         "memoryBarrierShared(",
+                                         "pixelLocalStoreANGLE(01i30E",
+                                         "textureGradOffset(00R10B10B10B10D",
+                                         "gl_MaxAtomicCounterBufferSize",
+                                         "imageStore(01H20D30B",
+                                         "imageAtomicCompSwap(01F10D00D00E00E",
+                                         "atan(30B",
+                                         "fma(10B10B10B",
+                                         "textureOffset(00a20B10D",
+                                         "greaterThanEqual(20D20D",
+                                         "gl_MaxCombinedShaderOutputResources",
+                                         "imageAtomicCompSwap(01J00D00E00E",
+                                         "imageAtomicExchange(00z10D00B",
+                                         "imageAtomicAdd(01T10D00D",
+                                         "exp2(20B",
+                                         "textureProjLod(00J30B00B",
+                                         "min(20E20E",
+                                         "imageAtomicAdd(01a10D00D",
+                                         "outerProduct(10B10B",
+                                         "roundEven(00B",
+                                         "max(10D10D",
+                                         "acos(00B",
+                                         "barrier(",
+                                         "texture(00L20B00B",
+                                         "equal(20B20B",
+                                         "imageAtomicOr(01S20D00D",
+                                         "dot(20B20B",
+                                         "textureOffset(00X10B10D",
+                                         "imageAtomicOr(01B20D00E",
+                                         "imageAtomicExchange(01S20D00E",
+                                         "notEqual(30D30D",
+                                         "imageAtomicMin(01J00D00D",
+                                         "normalize(30B",
+                                         "imageAtomicOr(01Y20D00D",
+                                         "textureGradOffset(00a20B10B10B10D",
+                                         "imageAtomicMin(01K10D00E",
+                                         "notEqual(10D10D",
+                                         "outerProduct(10B30B",
+                                         "textureOffset(00L20B10D",
+                                         "imageAtomicOr(01J00D00E",
+                                         "saturate(00B",
+                                         "imageAtomicCompSwap(01P10D00D00D",
+                                         "imageAtomicMax(01Y20D00D",
+                                         "mix(30D30D30F",
                                          "imageAtomicXor(01e10D00D",
-                                         "imageAtomicXor(01F10D00D00D",
-                                         "imageAtomicXor(01Q10D00D00D",
-                                         "imageAtomicXor(01b10D00D00D",
-                                         "imageAtomicXor(01G20D00D00D",
-                                         "imageAtomicXor(01R20D00D00D",
+                                         "gl_MaxTessEvaluationUniformComponents",
+                                         "notEqual(20B20B",
                                          "imageAtomicXor(01c20D00D00D",
-                                         "imageAtomicExchange(00z10D00E",
-                                         "imageAtomicExchange(01K10D00E",
-                                         "imageAtomicExchange(01V10D00E",
-                                         "imageAtomicExchange(01A20D00E",
-                                         "imageAtomicExchange(01L20D00E",
-                                         "imageAtomicExchange(01W20D00E",
-                                         "imageAtomicExchange(01C20D00E",
-                                         "imageAtomicExchange(01N20D00E",
-                                         "imageAtomicExchange(01Y20D00E",
-                                         "imageAtomicExchange(01J00D00E",
+                                         "imageAtomicOr(01M20D00D",
+                                         "imageAtomicXor(01M20D00E",
+                                         "imageAtomicExchange(01J00D00B",
+                                         "umulExtended(20E20E20E20E",
+                                         "tanh(10B",
+                                         "imageAtomicExchange(01K10D00D",
+                                         "reflect(20B20B",
+                                         "imageAtomicXor(01D00D00D",
+                                         "greaterThan(10D10D",
+                                         "imageAtomicAnd(01P10D00E",
+                                         "lessThan(30D30D",
+                                         "imageAtomicOr(01G20D00D00E",
+                                         "imageAtomicMax(01J00D00D",
+                                         "imageAtomicXor(01V10D00E",
+                                         "imageAtomicExchange(01X20D00B",
+                                         "gl_LocalInvocationIndex",
+                                         "texture(00Z20B00B",
+                                         "imageAtomicMin(01C20D00E",
+                                         "textureSize(00e00D",
+                                         "memoryBarrierBuffer(",
+                                         "min(20D20D",
+                                         "equal(30E30E",
+                                         "imageAtomicXor(01X20D00E",
+                                         "gl_PrimitiveIDIn",
+                                         "bitfieldReverse(30D",
+                                         "matrixCompMult(60B60B",
+                                         "atanh(20B",
+                                         "imageAtomicAnd(01b10D00D00D",
+                                         "textureGather(00I10B00D",
                                          "imageAtomicExchange(01U00D00E",
-                                         "imageAtomicExchange(01f00D00E",
-                                         "imageAtomicExchange(01B20D00E",
-                                         "imageAtomicExchange(01M20D00E",
-                                         "imageAtomicExchange(01X20D00E",
-                                         "imageAtomicExchange(01H20D00E",
-                                         "imageAtomicExchange(01S20D00E",
-                                         "imageAtomicExchange(01d20D00E",
-                                         "imageAtomicExchange(01D00D00E",
-                                         "imageAtomicExchange(01O00D00E",
-                                         "imageAtomicExchange(01Z00D00E",
+                                         "textureGatherOffset(00a20B10D00D",
+                                         "greaterThanEqual(10E10E",
+                                         "imageAtomicCompSwap(01X20D00D00D",
+                                         "atomicAnd(00E00E",
+                                         "imageAtomicXor(01U00D00D",
+                                         "imageStore(00z10D30B",
+                                         "max(30B30B",
+                                         "texelFetch(00c20D00D",
+                                         "imageAtomicCompSwap(01R20D00D00E00E",
+                                         "gl_FragColor",
+                                         "clamp(20E20E20E",
+                                         "imageAtomicMin(01P10D00E",
+                                         "gl_MaxComputeUniformComponents",
+                                         "isinf(30B",
+                                         "imageAtomicExchange(01U00D00D",
+                                         "imageAtomicOr(01C20D00E",
+                                         "textureProjOffset(00I20B10D",
+                                         "imageSize(01K",
+                                         "imageAtomicAdd(01Y20D00D",
+                                         "textureGrad(00T20B20B20B",
+                                         "imageSize(01f",
+                                         "imageAtomicMin(01M20D00E",
+                                         "imageLoad(01X20D",
+                                         "imageAtomicAnd(01E10D00E",
+                                         "interpolateAtSample(30B00D",
+                                         "atomicMin(00D00D",
+                                         "textureProjGrad(00R30B10B10B",
+                                         "cosh(20B",
+                                         "faceforward(30B30B30B",
+                                         "cos(10B",
+                                         "texelFetch(00Q20D00D",
+                                         "bitCount(00D",
+                                         "bitfieldReverse(20D",
+                                         "imageAtomicCompSwap(01L20D00D00D",
                                          "imageAtomicExchange(01E10D00E",
-                                         "imageAtomicExchange(01P10D00E",
+                                         "gl_MaxTessControlAtomicCounters",
+                                         "max(30D30D",
+                                         "dot(30B30B",
+                                         "imageAtomicMax(01Q10D00D00D",
+                                         "imageAtomicMin(01Z00D00D",
+                                         "imageAtomicAnd(01C20D00E",
+                                         "imageAtomicExchange(01L20D00B",
+                                         "radians(20B",
+                                         "sign(00D",
+                                         "textureSize(00s00D",
+                                         "min(10E10E",
+                                         "imageAtomicAnd(01M20D00D",
+                                         "imageAtomicMax(01b10D00D00D",
+                                         "max(10B10B",
+                                         "imageStore(01N20D30D",
+                                         "min(00D00D",
+                                         "imageAtomicExchange(01Z00D00D",
+                                         "outerProduct(30B10B",
+                                         "atomicMin(00E00E",
+                                         "imageAtomicExchange(01R20D00D00E",
+                                         "bitfieldInsert(30E30E00D00D",
+                                         "ldexp(30B30D",
+                                         "saturate(10B",
+                                         "imageAtomicMin(01H20D00E",
+                                         "texelFetchOffset(00J20D00D20D",
+                                         "asin(10B",
+                                         "textureSize(00U00D",
+                                         "gl_MaxVertexAtomicCounters",
+                                         "imageAtomicCompSwap(01Y20D00D00D",
+                                         "textureOffset(00a20B10D00B",
+                                         "smoothstep(00B00B10B",
+                                         "imageAtomicCompSwap(01G20D00D00E00E",
+                                         "textureProjGradOffset(00R20B10B10B10D",
+                                         "imageAtomicMin(01W20D00E",
+                                         "imageAtomicAdd(01X20D00D",
+                                         "imageLoad(01K10D",
+                                         "gl_MaxTessControlUniformComponents",
+                                         "gl_MaxTessControlOutputComponents",
+                                         "asinh(20B",
+                                         "textureGradOffset(00d20B10B10B10D",
+                                         "texelFetch(00b10D00D",
+                                         "sign(10B",
+                                         "imageAtomicExchange(01M20D00B",
+                                         "min(10D00D",
+                                         "imageAtomicExchange(01a10D00B",
+                                         "gl_MaxGeometryTextureImageUnits",
                                          "imageAtomicExchange(01a10D00E",
-                                         "imageAtomicExchange(01I10D00E",
+                                         "imageAtomicAdd(01N20D00D",
+                                         "imageAtomicExchange(01X20D00E",
+                                         "textureGather(00f20B",
+                                         "imageAtomicOr(01d20D00E",
+                                         "textureProjGradOffset(00X30B10B10B10D",
+                                         "imageSize(01M",
+                                         "textureSize(00f00D",
+                                         "gl_MaxCombinedAtomicCounters",
+                                         "imageAtomicMax(01d20D00E",
+                                         "textureSize(00T00D",
+                                         "greaterThan(20B20B",
+                                         "imageAtomicMax(01X20D00E",
+                                         "textureOffset(00J20B20D",
+                                         "imageAtomicMax(01M20D00E",
+                                         "gl_MaxProgramTexelOffset",
+                                         "gl_PerVertex",
+                                         "textureGatherOffset(00I10B10D",
+                                         "sign(30B",
+                                         "imageAtomicExchange(01N20D00E",
+                                         "tan(10B",
+                                         "gl_MaxTessControlAtomicCounterBuffers",
+                                         "imageStore(01B20D30B",
+                                         "imageAtomicMin(01R20D00D00E",
+                                         "findLSB(00E",
+                                         "numSamples(",
+                                         "imageAtomicExchange(01L20D00D",
+                                         "smoothstep(20B20B20B",
+                                         "imageAtomicOr(01f00D00E",
+                                         "textureOffset(00U20B10D00B",
+                                         "ldexp(20B20D",
                                          "imageAtomicExchange(01T10D00E",
-                                         "imageAtomicExchange(01e10D00E",
-                                         "imageAtomicExchange(01F10D00D00E",
-                                         "imageAtomicExchange(01Q10D00D00E",
-                                         "imageAtomicExchange(01b10D00D00E",
-                                         "imageAtomicExchange(01G20D00D00E",
-                                         "imageAtomicExchange(01R20D00D00E",
-                                         "imageAtomicExchange(01c20D00D00E",
-                                         "imageAtomicExchange(00z10D00D",
-                                         "imageAtomicExchange(01K10D00D",
+                                         "imageAtomicAnd(01P10D00D",
+                                         "cosh(00B",
+                                         "max(20D20D",
+                                         "texelFetch(00P10D00D",
+                                         "imageAtomicMin(01T10D00D",
+                                         "imageAtomicAdd(01G20D00D00D",
+                                         "imageAtomicMax(01V10D00E",
+                                         "interpolateAtCentroid(30B",
+                                         "imageAtomicXor(01R20D00D00E",
+                                         "greaterThan(20E20E",
+                                         "texture(00K20B",
+                                         "tan(00B",
+                                         "modf(20B20B",
+                                         "imageAtomicExchange(01U00D00B",
+                                         "inverse(F0B",
+                                         "lessThanEqual(20E20E",
+                                         "textureProjLod(00I20B00B",
+                                         "dot(00B00B",
+                                         "imageSize(01H",
+                                         "uintBitsToFloat(20E",
+                                         "texture(00S20B",
+                                         "faceforward(10B10B10B",
+                                         "texture2DRectProj(00O30B",
+                                         "texture3DProjLod(00J30B00B",
+                                         "textureSize(00P",
+                                         "imageAtomicMax(01c20D00D00D",
+                                         "all(20F",
+                                         "atomicExchange(00E00E",
+                                         "unpackUnorm4x8(00E",
+                                         "imageAtomicXor(01Z00D00D",
+                                         "matrixCompMult(B0BB0B",
+                                         "textureGatherOffsets(00d10B00B10Dx4",
+                                         "imageAtomicExchange(01V10D00E",
+                                         "gl_SampleMask",
+                                         "textureSize(00l00D",
+                                         "dot(10B10B",
+                                         "lessThan(10E10E",
+                                         "imageAtomicMin(01G20D00D00D",
+                                         "textureProjLodOffset(00X30B00B10D",
+                                         "textureSize(00K00D",
+                                         "gl_PrimitiveID",
+                                         "imageAtomicCompSwap(01e10D00E00E",
+                                         "imageAtomicMax(01O00D00E",
+                                         "textureProj(00I30B00B",
+                                         "gl_MaxTessEvaluationOutputComponents",
+                                         "imageAtomicExchange(01R20D00D00D",
+                                         "abs(10D",
+                                         "imageAtomicAnd(01R20D00D00D",
+                                         "imageSize(00z",
+                                         "imageAtomicCompSwap(01R20D00D00D00D",
+                                         "imageAtomicAnd(01d20D00D",
+                                         "uaddCarry(10E10E10E",
+                                         "imageAtomicAdd(01E10D00D",
+                                         "trunc(10B",
+                                         "imageAtomicAnd(01D00D00E",
+                                         "matrixCompMult(E0BE0B",
+                                         "imageAtomicAdd(01O00D00E",
+                                         "gl_MaxFragmentInputVectors",
+                                         "equal(30F30F",
+                                         "textureSize(00V",
+                                         "max(30E30E",
+                                         "smoothstep(10B10B10B",
+                                         "findLSB(20E",
+                                         "notEqual(20E20E",
+                                         "imageAtomicMax(01E10D00E",
+                                         "imageAtomicCompSwap(01M20D00D00D",
+                                         "imageLoad(01C20D",
+                                         "mix(10F10F10F",
+                                         "textureGatherOffset(00U20B10D00D",
+                                         "textureGrad(00a20B10B10B",
+                                         "imageLoad(01M20D",
+                                         "fwidth(20B",
+                                         "imageAtomicXor(01D00D00E",
+                                         "textureGatherOffsets(00X10B10Dx4",
+                                         "imageAtomicMin(01A20D00D",
+                                         "texelFetchOffset(00R10D00D10D",
+                                         "faceforward(00B00B00B",
+                                         "textureGrad(00R10B10B10B",
+                                         "findLSB(30E",
+                                         "floatBitsToUint(10B",
+                                         "imageAtomicCompSwap(01O00D00D00D",
+                                         "exp2(00B",
+                                         "tanh(00B",
+                                         "imageAtomicMin(01f00D00E",
+                                         "lessThanEqual(20B20B",
+                                         "imageLoad(01B20D",
+                                         "textureLod(00s30B00B",
+                                         "textureGrad(00I10B10B10B",
+                                         "gl_MaxTessEvaluationAtomicCounters",
+                                         "gl_ClipDistance",
+                                         "imageAtomicAnd(01H20D00E",
+                                         "texture2DRect(00O10B",
+                                         "gl_in",
+                                         "isinf(00B",
+                                         "textureGrad(00f30B10B10B",
+                                         "findMSB(00E",
+                                         "imageAtomicMin(01Y20D00E",
+                                         "floatBitsToInt(10B",
+                                         "imageAtomicAnd(01L20D00E",
+                                         "imageAtomicMin(01e10D00E",
+                                         "imageAtomicCompSwap(01V10D00E00E",
+                                         "unpackUnorm2x16(00E",
+                                         "roundEven(30B",
+                                         "imageAtomicAnd(01Q10D00D00E",
+                                         "imageAtomicAnd(01M20D00E",
+                                         "imageAtomicMin(01O00D00E",
+                                         "imageAtomicAdd(01V10D00E",
+                                         "textureCube(00K20B",
+                                         "textureGrad(00U20B10B10B",
+                                         "imageSize(01A",
                                          "imageAtomicExchange(01V10D00D",
-                                         "imageAtomicExchange(01A20D00D",
-                                         "imageAtomicExchange(01L20D00D",
-                                         "imageAtomicExchange(01W20D00D",
-                                         "imageAtomicExchange(01C20D00D",
-                                         "imageAtomicExchange(01N20D00D",
-                                         "imageAtomicExchange(01Y20D00D",
-                                         "imageAtomicExchange(01J00D00D",
-                                         "imageAtomicExchange(01U00D00D",
-                                         "imageAtomicExchange(01f00D00D",
-                                         "imageAtomicExchange(01B20D00D",
-                                         "imageAtomicExchange(01M20D00D",
-                                         "imageAtomicExchange(01X20D00D",
-                                         "imageAtomicExchange(01H20D00D",
-                                         "imageAtomicExchange(01S20D00D",
-                                         "imageAtomicExchange(01d20D00D",
-                                         "imageAtomicExchange(01D00D00D",
-                                         "imageAtomicExchange(01O00D00D",
-                                         "imageAtomicExchange(01Z00D00D",
-                                         "imageAtomicExchange(01E10D00D",
-                                         "imageAtomicExchange(01P10D00D",
-                                         "imageAtomicExchange(01a10D00D",
+                                         "texture2DLod(00I10B00B",
+                                         "textureProj(00N20B00B",
+                                         "imageSize(01C",
+                                         "imageAtomicMin(01T10D00E",
+                                         "imageAtomicXor(01E10D00E",
+                                         "textureProj(00X30B00B",
+                                         "gl_MaxVertexAtomicCounterBuffers",
+                                         "imageAtomicOr(01F10D00D00D",
+                                         "imageAtomicOr(01C20D00D",
+                                         "imageAtomicAnd(00z10D00D",
+                                         "min(10B10B",
+                                         "textureProjOffset(00J30B20D00B",
+                                         "imageAtomicAdd(01F10D00D00E",
+                                         "imageAtomicOr(01W20D00E",
+                                         "imageLoad(01V10D",
+                                         "textureProj(00d30B",
+                                         "sin(10B",
+                                         "textureGrad(00k30B20B20B",
                                          "imageAtomicExchange(01I10D00D",
-                                         "imageAtomicExchange(01T10D00D",
-                                         "imageAtomicExchange(01e10D00D",
-                                         "imageAtomicExchange(01F10D00D00D",
-                                         "imageAtomicExchange(01Q10D00D00D",
-                                         "imageAtomicExchange(01b10D00D00D",
+                                         "imageAtomicCompSwap(01a10D00D00D",
+                                         "textureOffset(00Y20B20D",
+                                         "textureOffset(00R10B10D00B",
+                                         "bitfieldExtract(10D00D00D",
+                                         "textureProjGrad(00S30B20B20B",
+                                         "gl_ViewID_OVR",
+                                         "equal(20D20D",
+                                         "imageLoad(01L20D",
+                                         "degrees(30B",
+                                         "imageAtomicExchange(01d20D00E",
+                                         "ldexp(00B00D",
                                          "imageAtomicExchange(01G20D00D00D",
-                                         "imageAtomicExchange(01R20D00D00D",
-                                         "imageAtomicExchange(01c20D00D00D",
-                                         "imageAtomicExchange(00z10D00B",
-                                         "imageAtomicExchange(01K10D00B",
-                                         "imageAtomicExchange(01V10D00B",
-                                         "imageAtomicExchange(01A20D00B",
-                                         "imageAtomicExchange(01L20D00B",
-                                         "imageAtomicExchange(01W20D00B",
-                                         "imageAtomicExchange(01C20D00B",
-                                         "imageAtomicExchange(01N20D00B",
+                                         "gl_MaxTessControlTotalOutputComponents",
+                                         "trunc(30B",
+                                         "imageAtomicExchange(01M20D00E",
+                                         "imageAtomicXor(01P10D00D",
+                                         "texelFetch(00L20D00D",
+                                         "imageAtomicMax(01C20D00E",
+                                         "gl_MaxComputeAtomicCounters",
+                                         "bitfieldExtract(10E00D00D",
+                                         "imageAtomicOr(01V10D00E",
+                                         "imageAtomicCompSwap(01W20D00D00D",
                                          "imageAtomicExchange(01Y20D00B",
-                                         "imageAtomicExchange(01J00D00B",
-                                         "imageAtomicExchange(01U00D00B",
-                                         "imageAtomicExchange(01f00D00B",
-                                         "imageAtomicExchange(01B20D00B",
-                                         "imageAtomicExchange(01M20D00B",
-                                         "imageAtomicExchange(01X20D00B",
+                                         "imageAtomicMin(01d20D00E",
+                                         "imageAtomicMin(01M20D00D",
+                                         "imageAtomicCompSwap(01A20D00E00E",
+                                         "imageAtomicExchange(01W20D00D",
+                                         "asin(00B",
+                                         "saturate(30B",
+                                         "gl_MaxComputeWorkGroupCount",
+                                         "packSnorm2x16(10B",
+                                         "imageStore(01W20D30E",
+                                         "imageAtomicAnd(01S20D00D",
+                                         "acosh(20B",
+                                         "imageAtomicMin(01G20D00D00E",
+                                         "gl_MaxFragmentAtomicCounterBuffers",
                                          "imageAtomicExchange(01H20D00B",
-                                         "imageAtomicExchange(01S20D00B",
-                                         "imageAtomicExchange(01d20D00B",
-                                         "imageAtomicExchange(01D00D00B",
-                                         "imageAtomicExchange(01O00D00B",
-                                         "imageAtomicExchange(01Z00D00B",
-                                         "imageAtomicExchange(01E10D00B",
+                                         "imageAtomicMin(01N20D00D",
+                                         "imageAtomicOr(01T10D00D",
+                                         "imageAtomicMin(01U00D00D",
+                                         "imageAtomicCompSwap(01G20D00D00D00D",
+                                         "imageAtomicAdd(01B20D00E",
+                                         "fract(00B",
+                                         "textureSize(00k00D",
+                                         "imageLoad(01A20D",
+                                         "packUnorm2x16(10B",
+                                         "imageAtomicOr(01I10D00E",
+                                         "textureOffset(00I10B10D",
+                                         "frexp(20B20D",
+                                         "gl_NumSamples",
+                                         "atan(30B30B",
+                                         "imageAtomicAnd(01e10D00E",
+                                         "imageAtomicAnd(01Y20D00D",
+                                         "textureOffset(00Y20B20D00B",
+                                         "bitfieldInsert(10E10E00D00D",
+                                         "bitfieldExtract(00D00D00D",
+                                         "degrees(20B",
+                                         "imageAtomicAnd(01Y20D00E",
+                                         "shadow2DProjEXT(00d30B",
+                                         "texture(00N10B",
+                                         "imageAtomicAdd(01X20D00E",
+                                         "imageAtomicExchange(01N20D00B",
+                                         "imageAtomicAdd(00z10D00D",
+                                         "outerProduct(30B20B",
+                                         "imageAtomicOr(01b10D00D00E",
+                                         "mod(00B00B",
+                                         "outerProduct(30B30B",
+                                         "acosh(10B",
+                                         "imageAtomicMax(01Z00D00D",
+                                         "imageAtomicMax(01H20D00D",
+                                         "imageAtomicXor(01d20D00D",
+                                         "fract(20B",
+                                         "interpolateAtCentroid(20B",
+                                         "texture(00X10B",
+                                         "imageAtomicMax(01A20D00E",
+                                         "textureGradOffset(00U20B10B10B10D",
+                                         "imageAtomicAnd(01c20D00D00D",
+                                         "outerProduct(20B30B",
+                                         "greaterThanEqual(10B10B",
+                                         "asin(30B",
+                                         "imageAtomicOr(01Q10D00D00D",
+                                         "textureProj(00Y30B",
+                                         "imageAtomicOr(01L20D00E",
+                                         "inversesqrt(30B",
+                                         "dFdy(10B",
+                                         "notEqual(20D20D",
+                                         "sign(20B",
+                                         "frexp(00B00D",
+                                         "texture(00f30B",
+                                         "texelFetchOffset(00L20D00D10D",
                                          "imageAtomicExchange(01P10D00B",
-                                         "imageAtomicExchange(01a10D00B",
-                                         "imageAtomicExchange(01I10D00B",
-                                         "imageAtomicExchange(01T10D00B",
-                                         "imageAtomicExchange(01e10D00B",
-                                         "imageAtomicExchange(01F10D00D00B",
+                                         "imageLoad(01f00D",
+                                         "gl_WorkGroupID",
+                                         "inverse(50B",
+                                         "imageAtomicCompSwap(01F10D00D00D00D",
+                                         "floor(20B",
+                                         "transpose(90B",
+                                         "mix(00B00B00B",
+                                         "texture(00k30B",
+                                         "imageAtomicMax(01V10D00D",
+                                         "imageAtomicAdd(01Y20D00E",
+                                         "usubBorrow(30E30E30E",
+                                         "imageAtomicMax(01K10D00E",
+                                         "textureGather(00L20B",
+                                         "unpackSnorm4x8(00E",
+                                         "findLSB(20D",
+                                         "imageAtomicXor(01O00D00D",
+                                         "roundEven(10B",
+                                         "max(00D00D",
+                                         "imageAtomicMin(01E10D00D",
+                                         "textureLodOffset(00I10B00B10D",
+                                         "textureProjGradOffset(00Y30B20B20B20D",
+                                         "tanh(20B",
+                                         "imageAtomicXor(01f00D00E",
+                                         "textureProjGradOffset(00d30B10B10B10D",
+                                         "imageAtomicAdd(01Q10D00D00E",
+                                         "texelFetch(00N10D00D",
+                                         "texture2DProj(00M30B",
+                                         "greaterThanEqual(30D30D",
+                                         "texelFetch(00S20D00D",
+                                         "texture(00e30B",
+                                         "mod(10B00B",
+                                         "texelFetchOffset(00a20D00D10D",
+                                         "atomicCounterIncrement(00G",
+                                         "imageAtomicXor(01b10D00D00D",
+                                         "gl_InstanceID",
+                                         "imageAtomicExchange(01F10D00D00D",
+                                         "imageAtomicExchange(01c20D00D00E",
+                                         "imageAtomicMax(01D00D00E",
+                                         "determinant(F0B",
+                                         "textureLod(00Z20B00B",
+                                         "step(00B00B",
                                          "imageAtomicExchange(01Q10D00D00B",
-                                         "imageAtomicExchange(01b10D00D00B",
-                                         "imageAtomicExchange(01G20D00D00B",
-                                         "imageAtomicExchange(01R20D00D00B",
-                                         "imageAtomicExchange(01c20D00D00B",
-                                         "imageAtomicCompSwap(00z10D00E00E",
-                                         "imageAtomicCompSwap(01K10D00E00E",
-                                         "imageAtomicCompSwap(01V10D00E00E",
-                                         "imageAtomicCompSwap(01A20D00E00E",
-                                         "imageAtomicCompSwap(01L20D00E00E",
-                                         "imageAtomicCompSwap(01W20D00E00E",
-                                         "imageAtomicCompSwap(01C20D00E00E",
-                                         "imageAtomicCompSwap(01N20D00E00E",
-                                         "imageAtomicCompSwap(01Y20D00E00E",
-                                         "imageAtomicCompSwap(01J00D00E00E",
-                                         "imageAtomicCompSwap(01U00D00E00E",
-                                         "imageAtomicCompSwap(01f00D00E00E",
-                                         "imageAtomicCompSwap(01B20D00E00E",
-                                         "imageAtomicCompSwap(01M20D00E00E",
-                                         "imageAtomicCompSwap(01X20D00E00E",
-                                         "imageAtomicCompSwap(01H20D00E00E",
-                                         "imageAtomicCompSwap(01S20D00E00E",
-                                         "imageAtomicCompSwap(01d20D00E00E",
-                                         "imageAtomicCompSwap(01D00D00E00E",
-                                         "imageAtomicCompSwap(01O00D00E00E",
-                                         "imageAtomicCompSwap(01Z00D00E00E",
-                                         "imageAtomicCompSwap(01E10D00E00E",
-                                         "imageAtomicCompSwap(01P10D00E00E",
-                                         "imageAtomicCompSwap(01a10D00E00E",
-                                         "imageAtomicCompSwap(01I10D00E00E",
-                                         "imageAtomicCompSwap(01T10D00E00E",
-                                         "imageAtomicCompSwap(01e10D00E00E",
-                                         "imageAtomicCompSwap(01F10D00D00E00E",
-                                         "imageAtomicCompSwap(01Q10D00D00E00E",
-                                         "imageAtomicCompSwap(01b10D00D00E00E",
-                                         "imageAtomicCompSwap(01G20D00D00E00E",
-                                         "imageAtomicCompSwap(01R20D00D00E00E",
-                                         "imageAtomicCompSwap(01c20D00D00E00E",
-                                         "imageAtomicCompSwap(00z10D00D00D",
-                                         "imageAtomicCompSwap(01K10D00D00D",
-                                         "imageAtomicCompSwap(01V10D00D00D",
-                                         "imageAtomicCompSwap(01A20D00D00D",
-                                         "imageAtomicCompSwap(01L20D00D00D",
-                                         "imageAtomicCompSwap(01W20D00D00D",
+                                         "imageAtomicOr(01Z00D00D",
+                                         "imageAtomicExchange(01C20D00D",
+                                         "textureOffset(00R10B10D",
+                                         "imageAtomicMax(01M20D00D",
+                                         "textureGatherOffsets(00X10B10Dx400D",
+                                         "imageAtomicOr(01a10D00E",
+                                         "normalize(10B",
+                                         "min(20D00D",
+                                         "imageAtomicAnd(01N20D00D",
+                                         "imageAtomicExchange(01a10D00D",
+                                         "interpolateAtCenter(20B",
+                                         "transpose(50B",
+                                         "abs(00B",
+                                         "imageAtomicOr(01X20D00E",
+                                         "texture(00I10B",
+                                         "texture3D(00J20B00B",
+                                         "imageAtomicAdd(01P10D00E",
+                                         "imageAtomicMin(00z10D00E",
+                                         "imageAtomicMax(01D00D00D",
+                                         "transpose(E0B",
+                                         "unpackHalf2x16(00E",
+                                         "textureProjLodOffset(00X20B00B10D",
+                                         "texture(00U20B00B",
+                                         "texture3DProj(00J30B00B",
+                                         "clamp(30B30B30B",
                                          "imageAtomicCompSwap(01C20D00D00D",
-                                         "imageAtomicCompSwap(01N20D00D00D",
-                                         "imageAtomicCompSwap(01Y20D00D00D",
+                                         "imageSize(01X",
+                                         "imageAtomicMax(01N20D00D",
+                                         "atan(10B",
+                                         "sin(30B",
+                                         "textureProjLod(00S30B00B",
+                                         "imageAtomicAdd(01e10D00D",
+                                         "gl_MaxCombinedClipAndCullDistances",
+                                         "imageAtomicMax(01e10D00D",
+                                         "textureGradOffset(00f30B10B10B10D",
+                                         "imageAtomicAdd(01Z00D00E",
+                                         "textureLodOffset(00a20B00B10D",
+                                         "imageStore(01K10D30D",
+                                         "imageAtomicCompSwap(00z10D00D00D",
+                                         "equal(20E20E",
+                                         "imageAtomicMax(01N20D00E",
+                                         "imageAtomicXor(01e10D00E",
+                                         "imageAtomicExchange(01Y20D00D",
+                                         "imageAtomicOr(01X20D00D",
+                                         "imageAtomicMax(01Q10D00D00E",
+                                         "imageAtomicOr(01c20D00D00D",
+                                         "intBitsToFloat(10D",
+                                         "imageAtomicAnd(01C20D00D",
+                                         "imageAtomicAdd(01M20D00E",
+                                         "textureGrad(00d20B10B10B",
+                                         "imageAtomicExchange(01D00D00E",
+                                         "radians(00B",
+                                         "imageAtomicOr(01U00D00E",
+                                         "step(00B10B",
+                                         "imageAtomicAnd(01S20D00E",
+                                         "imageAtomicAdd(01I10D00D",
+                                         "dFdx(10B",
+                                         "atomicOr(00D00D",
+                                         "imageAtomicOr(00z10D00E",
+                                         "umulExtended(10E10E10E10E",
+                                         "transpose(F0B",
+                                         "imageAtomicAdd(01U00D00E",
+                                         "gl_MaxComputeTextureImageUnits",
+                                         "matrixCompMult(50B50B",
+                                         "clamp(20B20B20B",
                                          "imageAtomicCompSwap(01J00D00D00D",
-                                         "imageAtomicCompSwap(01U00D00D00D",
-                                         "imageAtomicCompSwap(01f00D00D00D",
-                                         "imageAtomicCompSwap(01B20D00D00D",
-                                         "imageAtomicCompSwap(01M20D00D00D",
-                                         "imageAtomicCompSwap(01X20D00D00D",
-                                         "imageAtomicCompSwap(01H20D00D00D",
-                                         "imageAtomicCompSwap(01S20D00D00D",
-                                         "imageAtomicCompSwap(01d20D00D00D",
-                                         "imageAtomicCompSwap(01D00D00D00D",
-                                         "imageAtomicCompSwap(01O00D00D00D",
-                                         "imageAtomicCompSwap(01Z00D00D00D",
+                                         "imageAtomicAnd(01G20D00D00D",
+                                         "imageAtomicExchange(01H20D00E",
+                                         "texture2DProjLod(00I20B00B",
+                                         "imageAtomicMax(01U00D00E",
+                                         "fma(00B00B00B",
+                                         "imageLoad(01S20D",
+                                         "cross(20B20B",
+                                         "gl_MaxComputeAtomicCounterBuffers",
+                                         "imageAtomicOr(01T10D00E",
+                                         "texture3DProj(00J30B",
+                                         "textureOffset(00X10B10D00B",
+                                         "imageAtomicOr(01G20D00D00D",
+                                         "imageAtomicExchange(01M20D00D",
+                                         "texelFetchOffset(00U20D00D10D",
+                                         "atomicCompSwap(00D00D00D",
+                                         "gl_MaxTessEvaluationAtomicCounterBuffers",
+                                         "mix(30B30B00B",
+                                         "imageAtomicExchange(01Q10D00D00E",
+                                         "log2(20B",
+                                         "texelFetchOffset(00X10D00D10D",
+                                         "floor(30B",
+                                         "textureGrad(00J20B20B20B",
+                                         "mix(30F30F30F",
+                                         "textureGatherOffset(00a20B10D",
+                                         "imageAtomicOr(01N20D00E",
+                                         "imageAtomicMin(01X20D00E",
+                                         "imageAtomicXor(01Z00D00E",
+                                         "min(20B20B",
+                                         "imageAtomicXor(01d20D00E",
+                                         "textureLod(00S20B00B",
+                                         "acos(20B",
+                                         "gl_MaxTessEvaluationInputComponents",
+                                         "imageAtomicAdd(01T10D00E",
+                                         "bitfieldExtract(30E00D00D",
                                          "imageAtomicCompSwap(01E10D00D00D",
-                                         "imageAtomicCompSwap(01P10D00D00D",
-                                         "imageAtomicCompSwap(01a10D00D00D",
-                                         "imageAtomicCompSwap(01I10D00D00D",
-                                         "imageAtomicCompSwap(01T10D00D00D",
-                                         "imageAtomicCompSwap(01e10D00D00D",
-                                         "imageAtomicCompSwap(01F10D00D00D00D",
-                                         "imageAtomicCompSwap(01Q10D00D00D00D",
-                                         "imageAtomicCompSwap(01b10D00D00D00D",
-                                         "imageAtomicCompSwap(01G20D00D00D00D",
-                                         "imageAtomicCompSwap(01R20D00D00D00D",
-                                         "imageAtomicCompSwap(01c20D00D00D00D",
-                                         "pixelLocalLoadANGLE(01g",
-                                         "pixelLocalLoadANGLE(01h",
-                                         "pixelLocalLoadANGLE(01i",
-                                         "pixelLocalStoreANGLE(01g30B",
-                                         "pixelLocalStoreANGLE(01h30D",
-                                         "pixelLocalStoreANGLE(01i30E",
-                                         "beginInvocationInterlockNV(",
-                                         "endInvocationInterlockNV(",
-                                         "beginFragmentShaderOrderingINTEL(",
-                                         "beginInvocationInterlockARB(",
-                                         "endInvocationInterlockARB(",
-                                         "memoryBarrier(",
-                                         "memoryBarrierAtomicCounter(",
-                                         "memoryBarrierBuffer(",
-                                         "memoryBarrierImage(",
-                                         "barrier(",
-                                         "memoryBarrierShared(",
-                                         "groupMemoryBarrier(",
-                                         "EmitVertex(",
+                                         "texture(00T20B",
+                                         "ldexp(10B10D",
+                                         "interpolateAtOffset(00B10B",
+                                         "bitfieldReverse(10D",
+                                         "exp(20B",
+                                         "bitfieldExtract(20D00D00D",
+                                         "reflect(10B10B",
+                                         "saturate(20B",
+                                         "imageSize(01S",
+                                         "distance(10B10B",
+                                         "tan(30B",
+                                         "textureProjGradOffset(00I30B10B10B10D",
+                                         "textureProjGrad(00I30B10B10B",
+                                         "textureLodOffset(00J20B00B20D",
+                                         "log(00B",
+                                         "textureGatherOffsets(00I10B10Dx4",
+                                         "imageAtomicMin(01Y20D00D",
+                                         "floatBitsToInt(00B",
+                                         "gl_MaxVertexImageUniforms",
+                                         "imageAtomicXor(01c20D00D00E",
+                                         "textureGather(00a20B00D",
+                                         "imageAtomicAnd(01U00D00D",
+                                         "sqrt(00B",
+                                         "texture2DProj(00M20B",
+                                         "log2(30B",
+                                         "imageAtomicMax(01C20D00D",
+                                         "imageAtomicMin(01F10D00D00D",
+                                         "clamp(20B00B00B",
+                                         "texture(00R10B00B",
+                                         "imageAtomicExchange(01B20D00E",
+                                         "ceil(10B",
+                                         "textureGather(00l30B00B",
+                                         "imageAtomicXor(01Q10D00D00E",
+                                         "gl_MaxSamples",
+                                         "textureCubeLodEXT(00K20B00B",
+                                         "imageAtomicAnd(01D00D00D",
+                                         "imageAtomicMax(01R20D00D00D",
+                                         "matrixCompMult(A0BA0B",
+                                         "textureGatherOffset(00f20B00B10D",
+                                         "gl_NumWorkGroups",
+                                         "imageAtomicExchange(01B20D00B",
+                                         "imageAtomicXor(01H20D00E",
+                                         "imageAtomicAnd(01f00D00E",
+                                         "imageAtomicAnd(01W20D00E",
+                                         "imageAtomicOr(01P10D00E",
+                                         "textureSize(00X00D",
+                                         "transpose(D0B",
+                                         "imageAtomicAdd(01H20D00D",
+                                         "greaterThanEqual(20B20B",
+                                         "bitfieldInsert(30D30D00D00D",
+                                         "notEqual(10B10B",
+                                         "smoothstep(00B00B20B",
+                                         "textureGatherOffset(00L20B10D00D",
+                                         "textureGather(00T20B00D",
+                                         "max(30E00E",
+                                         "textureGather(00f20B00B",
+                                         "findMSB(20D",
+                                         "all(10F",
+                                         "textureSize(00r",
+                                         "textureProjGrad(00J30B20B20B",
+                                         "textureOffset(00S20B20D00B",
+                                         "gl_BoundingBox",
+                                         "imageAtomicOr(01P10D00D",
+                                         "lessThan(10B10B",
+                                         "imageAtomicExchange(01K10D00B",
+                                         "mix(10B10B00B",
+                                         "gl_SecondaryFragDataEXT",
+                                         "texelFetchOffset(00S20D00D20D",
+                                         "exp(30B",
+                                         "bitCount(20E",
+                                         "frexp(30B30D",
+                                         "imageAtomicAnd(01T10D00E",
+                                         "imageAtomicMin(01c20D00D00E",
+                                         "gl_MaxDualSourceDrawBuffersEXT",
+                                         "imageAtomicMin(01V10D00E",
+                                         "bitCount(30E",
+                                         "round(20B",
+                                         "textureOffset(00L20B10D00B",
                                          "EndPrimitive(",
-                                         "subpassLoad(01j",
-                                         "subpassLoad(01k",
-                                         "subpassLoad(01l",
-                                         "subpassLoad(01m00D",
-                                         "subpassLoad(01n00D",
-                                         "subpassLoad(01o00D",
-                                         "numSamples(",
-                                         "samplePosition(00E",
-                                         "interpolateAtCenter(00B",
-                                         "interpolateAtCenter(10B",
-                                         "interpolateAtCenter(20B",
-                                         "interpolateAtCenter(30B",
-                                         "saturate(00B",
-                                         "saturate(10B",
-                                         "saturate(20B",
-                                         "saturate(30B",
-                                         "gl_DepthRangeParameters",
-                                         "gl_DepthRange",
-                                         "gl_NumSamples",
-                                         "gl_MaxVertexAttribs",
-                                         "gl_MaxVertexUniformVectors",
-                                         "gl_MaxVertexTextureImageUnits",
-                                         "gl_MaxCombinedTextureImageUnits",
-                                         "gl_MaxTextureImageUnits",
+                                         "imageAtomicCompSwap(01I10D00E00E",
+                                         "textureProjOffset(00S30B20D00B",
+                                         "clamp(00D00D00D",
+                                         "imageAtomicXor(01X20D00D",
+                                         "floatBitsToInt(20B",
+                                         "imageAtomicExchange(01f00D00D",
+                                         "gl_MaxPatchVertices",
+                                         "imageAtomicAnd(01N20D00E",
+                                         "textureProjOffset(00R20B10D",
+                                         "imageAtomicCompSwap(01S20D00D00D",
+                                         "imageAtomicXor(01I10D00D",
+                                         "imageAtomicOr(01H20D00D",
+                                         "clamp(10D10D10D",
+                                         "groupMemoryBarrier(",
+                                         "max(10D00D",
+                                         "greaterThanEqual(30E30E",
+                                         "texture2DGradEXT(00I10B10B10B",
+                                         "imageAtomicExchange(01Y20D00E",
+                                         "acosh(00B",
                                          "gl_MaxFragmentUniformVectors",
-                                         "gl_MaxVaryingVectors",
-                                         "gl_MaxDrawBuffers",
-                                         "gl_MaxDualSourceDrawBuffersEXT",
-                                         "gl_MaxVertexOutputVectors",
-                                         "gl_MaxFragmentInputVectors",
-                                         "gl_MinProgramTexelOffset",
-                                         "gl_MaxProgramTexelOffset",
-                                         "gl_MaxImageUnits",
-                                         "gl_MaxVertexImageUniforms",
+                                         "length(10B",
+                                         "texture2DProj(00I20B00B",
+                                         "textureGatherOffsets(00a20B10Dx400D",
+                                         "textureProj(00I20B",
+                                         "texture2D(00M10B",
                                          "gl_MaxFragmentImageUniforms",
-                                         "gl_MaxComputeImageUniforms",
+                                         "fwidth(10B",
+                                         "clamp(10D00D00D",
+                                         "imageAtomicExchange(01T10D00B",
+                                         "texture(00k30B00B",
+                                         "textureGatherOffset(00U20B10D",
+                                         "imageAtomicOr(01O00D00E",
+                                         "textureProjOffset(00R20B10D00B",
+                                         "imageStore(01S20D30D",
+                                         "gl_Layer",
+                                         "uaddCarry(00E00E00E",
+                                         "EmitVertex(",
+                                         "distance(20B20B",
+                                         "gl_BaseVertex",
+                                         "beginInvocationInterlockARB(",
+                                         "imageAtomicXor(01O00D00E",
+                                         "findMSB(00D",
+                                         "gl_MaxVertexAttribs",
+                                         "imageAtomicXor(01A20D00E",
+                                         "textureSize(00N00D",
+                                         "textureGather(00Z20B00D",
+                                         "packUnorm4x8(30B",
+                                         "textureSize(00S00D",
+                                         "equal(10D10D",
+                                         "clamp(30B00B00B",
                                          "gl_MaxCombinedImageUniforms",
-                                         "gl_MaxCombinedShaderOutputResources",
-                                         "gl_MaxComputeWorkGroupCount",
-                                         "gl_MaxComputeWorkGroupSize",
-                                         "gl_MaxComputeUniformComponents",
-                                         "gl_MaxComputeTextureImageUnits",
-                                         "gl_MaxComputeAtomicCounters",
-                                         "gl_MaxComputeAtomicCounterBuffers",
-                                         "gl_MaxVertexAtomicCounters",
-                                         "gl_MaxFragmentAtomicCounters",
-                                         "gl_MaxCombinedAtomicCounters",
-                                         "gl_MaxAtomicCounterBindings",
-                                         "gl_MaxVertexAtomicCounterBuffers",
-                                         "gl_MaxFragmentAtomicCounterBuffers",
-                                         "gl_MaxCombinedAtomicCounterBuffers",
-                                         "gl_MaxAtomicCounterBufferSize",
-                                         "gl_MaxGeometryInputComponents",
-                                         "gl_MaxGeometryOutputComponents",
-                                         "gl_MaxGeometryImageUniforms",
-                                         "gl_MaxGeometryTextureImageUnits",
+                                         "imageAtomicAdd(01A20D00D",
+                                         "textureGatherOffsets(00f20B00B10Dx4",
+                                         "imageAtomicOr(01E10D00D",
+                                         "interpolateAtCenter(30B",
+                                         "texture(00N10B00B",
+                                         "atomicOr(00E00E",
+                                         "textureGather(00K20B",
+                                         "log(20B",
+                                         "atomicMax(00E00E",
+                                         "atomicAnd(00D00D",
+                                         "imageAtomicOr(01F10D00D00E",
+                                         "imageAtomicXor(01R20D00D00D",
+                                         "lessThanEqual(30D30D",
+                                         "textureSize(00I00D",
+                                         "imageAtomicXor(01T10D00E",
+                                         "imageAtomicAnd(01O00D00E",
+                                         "imageAtomicCompSwap(01A20D00D00D",
                                          "gl_MaxGeometryOutputVertices",
-                                         "gl_MaxGeometryTotalOutputComponents",
-                                         "gl_MaxGeometryUniformComponents",
-                                         "gl_MaxGeometryAtomicCounters",
-                                         "gl_MaxGeometryAtomicCounterBuffers",
-                                         "gl_MaxTessControlInputComponents",
-                                         "gl_MaxTessControlOutputComponents",
-                                         "gl_MaxTessControlTextureImageUnits",
-                                         "gl_MaxTessControlUniformComponents",
-                                         "gl_MaxTessControlTotalOutputComponents",
-                                         "gl_MaxTessControlImageUniforms",
-                                         "gl_MaxTessControlAtomicCounters",
-                                         "gl_MaxTessControlAtomicCounterBuffers",
-                                         "gl_MaxTessPatchComponents",
-                                         "gl_MaxPatchVertices",
-                                         "gl_MaxTessGenLevel",
-                                         "gl_MaxTessEvaluationInputComponents",
-                                         "gl_MaxTessEvaluationOutputComponents",
-                                         "gl_MaxTessEvaluationTextureImageUnits",
-                                         "gl_MaxTessEvaluationUniformComponents",
+                                         "imageAtomicCompSwap(01T10D00D00D",
+                                         "gl_MaxComputeWorkGroupSize",
+                                         "textureProjGrad(00X30B10B10B",
+                                         "textureLodOffset(00Y20B00B20D",
+                                         "smoothstep(30B30B30B",
+                                         "imageAtomicAnd(01W20D00D",
+                                         "gl_DepthRange",
+                                         "imageStore(01A20D30B",
+                                         "imageAtomicAdd(01F10D00D00D",
+                                         "mix(00D00D00F",
+                                         "textureGatherOffset(00R10B10D",
+                                         "texelFetch(00W20D00D",
                                          "gl_MaxTessEvaluationImageUniforms",
-                                         "gl_MaxTessEvaluationAtomicCounters",
-                                         "gl_MaxTessEvaluationAtomicCounterBuffers",
-                                         "gl_MaxSamples",
-                                         "gl_MaxClipDistances",
-                                         "gl_MaxCullDistances",
-                                         "gl_MaxCombinedClipAndCullDistances",
-                                         "gl_FragCoord",
-                                         "gl_FrontFacing",
-                                         "gl_PointCoord",
-                                         "gl_FragColor",
-                                         "gl_FragData",
-                                         "gl_FragDepth",
-                                         "gl_HelperInvocation",
+                                         "textureProjLodOffset(00J30B00B20D",
                                          "gl_SecondaryFragColorEXT",
-                                         "gl_SecondaryFragDataEXT",
-                                         "gl_FragDepthEXT",
-                                         "gl_LastFragData",
-                                         "gl_LastFragColor",
-                                         "gl_LastFragColorARM",
-                                         "gl_PrimitiveID",
-                                         "gl_Layer",
-                                         "gl_SampleID",
-                                         "gl_SamplePosition",
-                                         "gl_SampleMaskIn",
-                                         "gl_SampleMask",
-                                         "gl_Position",
+                                         "imageAtomicAnd(01F10D00D00E",
+                                         "imageAtomicCompSwap(01B20D00E00E",
+                                         "textureGather(00T20B",
+                                         "imageAtomicMin(01S20D00D",
+                                         "clamp(10E00E00E",
+                                         "imageAtomicCompSwap(01L20D00E00E",
+                                         "imageAtomicMin(01d20D00D",
+                                         "mix(10B10B10B",
+                                         "imageSize(01L",
+                                         "imulExtended(30D30D30D30D",
+                                         "greaterThan(10E10E",
+                                         "textureGather(00s30B",
+                                         "gl_MaxAtomicCounterBindings",
+                                         "texture(00x30B00B",
+                                         "textureLod(00X10B00B",
+                                         "textureOffset(00J20B20D00B",
+                                         "textureProjLodOffset(00I30B00B10D",
+                                         "imageAtomicXor(01G20D00D00D",
+                                         "min(10E00E",
+                                         "imageAtomicAnd(01E10D00D",
+                                         "greaterThan(20D20D",
+                                         "imageLoad(01U00D",
+                                         "textureLod(00K20B00B",
                                          "gl_PointSize",
-                                         "gl_InstanceID",
-                                         "",
-                                         "gl_VertexID",
-                                         "",
-                                         "",
-                                         "gl_DrawID",
-                                         "gl_BaseVertex",
-                                         "gl_BaseInstance",
-                                         "angle_BaseVertex",
-                                         "angle_BaseInstance",
-                                         "gl_ClipDistance",
-                                         "gl_NumWorkGroups",
-                                         "gl_WorkGroupSize",
-                                         "gl_WorkGroupID",
-                                         "gl_LocalInvocationID",
-                                         "gl_GlobalInvocationID",
-                                         "gl_LocalInvocationIndex",
-                                         "gl_PrimitiveIDIn",
-                                         "gl_InvocationID",
-                                         "gl_PerVertex",
-                                         "gl_in",
-                                         "gl_PatchVerticesIn",
-                                         "gl_TessLevelOuter",
-                                         "gl_TessLevelInner",
-                                         "gl_out",
-                                         "gl_BoundingBox",
-                                         "gl_BoundingBoxEXT",
-                                         "gl_BoundingBoxOES",
-                                         "gl_TessCoord",
-                                         "gl_ViewID_OVR",
-                                         "gl_CullDistance"};
+                                         "imageAtomicOr(01e10D00E",
+                                         "step(00B20B",
+                                         "imageAtomicExchange(01e10D00E",
+                                         "imageAtomicXor(01K10D00E",
+                                         "imageAtomicAdd(01S20D00E",
+                                         "imageStore(01J00D30B",
+                                         "texture(00M10B00B",
+                                         "imageSize(01Y",
+                                         "imageAtomicCompSwap(01I10D00D00D",
+                                         "texture(00I10B00B",
+                                         "imageAtomicMax(01L20D00D",
+                                         "imageAtomicAdd(01W20D00D",
+                                         "bitfieldExtract(00E00D00D",
+                                         "round(10B",
+                                         "imageAtomicExchange(01D00D00D",
+                                         "ceil(30B",
+                                         "textureGradOffset(00I10B10B10B10D",
+                                         "matrixCompMult(D0BD0B",
+                                         "textureGather(00a20B",
+                                         "transpose(70B",
+                                         "textureProjLod(00R30B00B",
+                                         "imageAtomicAnd(01A20D00E",
+                                         "step(00B30B",
+                                         "imageLoad(01Y20D",
+                                         "textureProj(00I20B00B",
+                                         "imageAtomicMax(01T10D00E",
+                                         "imageLoad(01J00D",
+                                         "imageAtomicMax(01B20D00D",
+                                         "min(30B00B",
+                                         "textureGather(00I10B",
+                                         "textureGatherOffsets(00R10B10Dx4",
+                                         "floatBitsToUint(30B",
+                                         "textureProj(00R20B00B",
+                                         "texture2DProjLod(00I30B00B",
+                                         "imageAtomicXor(01W20D00E",
+                                         "bitfieldExtract(20E00D00D",
+                                         "imageAtomicCompSwap(01c20D00D00E00E",
+                                         "imageAtomicXor(01C20D00E",
+                                         "notEqual(10E10E",
+                                         "imageAtomicAnd(01R20D00D00E",
+                                         "imageAtomicAdd(01K10D00E",
+                                         "imageAtomicAdd(01D00D00D",
+                                         "textureProjOffset(00X20B10D",
+                                         "imageAtomicCompSwap(01X20D00E00E",
+                                         "gl_MaxTessControlTextureImageUnits",
+                                         "imageSize(01V",
+                                         "determinant(50B",
+                                         "pixelLocalStoreANGLE(01g30B",
+                                         "textureProjOffset(00S30B20D",
+                                         "texture(00R10B",
+                                         "min(10D10D",
+                                         "cosh(30B",
+                                         "imageAtomicXor(01V10D00D",
+                                         "imageAtomicOr(01d20D00D",
+                                         "imageAtomicXor(01W20D00D",
+                                         "imageAtomicMax(01P10D00D",
+                                         "clamp(30E30E30E",
+                                         "imageAtomicCompSwap(01Z00D00D00D",
+                                         "sinh(20B",
+                                         "imageAtomicExchange(01e10D00D",
+                                         "pow(00B00B",
+                                         "imageAtomicXor(01a10D00D",
+                                         "textureProjLod(00R20B00B",
+                                         "imageAtomicMin(00z10D00D",
+                                         "textureProjLodOffset(00S30B00B20D",
+                                         "imageAtomicAnd(01O00D00D",
+                                         "reflect(00B00B",
+                                         "textureLod(00R10B00B",
+                                         "outerProduct(10B20B",
+                                         "imageAtomicAdd(01N20D00E",
+                                         "imageAtomicAnd(01a10D00D",
+                                         "atomicCounterDecrement(00G",
+                                         "imageAtomicExchange(01N20D00D",
+                                         "mod(30B00B",
+                                         "textureProjGradOffset(00S30B20B20B20D",
+                                         "refract(10B10B00B",
+                                         "imageAtomicMin(01I10D00E",
+                                         "imageAtomicExchange(01P10D00D",
+                                         "textureSize(00a00D",
+                                         "imageAtomicCompSwap(01Z00D00E00E",
+                                         "subpassLoad(01l"};
 
 // Flat array of offsets from a symbol into the rules table.
 constexpr uint16_t kMangledOffsets[] = {
-    0,     // radians_00B
-    1,     // radians_10B
-    2,     // radians_20B
-    3,     // radians_30B
-    4,     // degrees_00B
-    5,     // degrees_10B
-    6,     // degrees_20B
-    7,     // degrees_30B
-    8,     // sin_00B
-    9,     // sin_10B
-    10,    // sin_20B
-    11,    // sin_30B
-    12,    // cos_00B
-    13,    // cos_10B
-    14,    // cos_20B
-    15,    // cos_30B
-    16,    // tan_00B
-    17,    // tan_10B
-    18,    // tan_20B
-    19,    // tan_30B
-    20,    // asin_00B
-    21,    // asin_10B
-    22,    // asin_20B
-    23,    // asin_30B
-    24,    // acos_00B
-    25,    // acos_10B
-    26,    // acos_20B
-    27,    // acos_30B
-    28,    // atan_00B00B
-    29,    // atan_10B10B
-    30,    // atan_20B20B
-    31,    // atan_30B30B
-    32,    // atan_00B
-    33,    // atan_10B
-    34,    // atan_20B
-    35,    // atan_30B
-    36,    // sinh_00B
-    37,    // sinh_10B
-    38,    // sinh_20B
-    39,    // sinh_30B
-    40,    // cosh_00B
-    41,    // cosh_10B
-    42,    // cosh_20B
-    43,    // cosh_30B
-    44,    // tanh_00B
-    45,    // tanh_10B
-    46,    // tanh_20B
-    47,    // tanh_30B
-    48,    // asinh_00B
-    49,    // asinh_10B
-    50,    // asinh_20B
-    51,    // asinh_30B
-    52,    // acosh_00B
-    53,    // acosh_10B
-    54,    // acosh_20B
-    55,    // acosh_30B
-    56,    // atanh_00B
-    57,    // atanh_10B
-    58,    // atanh_20B
-    59,    // atanh_30B
-    60,    // pow_00B00B
-    61,    // pow_10B10B
-    62,    // pow_20B20B
-    63,    // pow_30B30B
-    64,    // exp_00B
-    65,    // exp_10B
-    66,    // exp_20B
-    67,    // exp_30B
-    68,    // log_00B
-    69,    // log_10B
-    70,    // log_20B
-    71,    // log_30B
-    72,    // exp2_00B
-    73,    // exp2_10B
-    74,    // exp2_20B
-    75,    // exp2_30B
-    76,    // log2_00B
-    77,    // log2_10B
-    78,    // log2_20B
-    79,    // log2_30B
-    80,    // sqrt_00B
-    81,    // sqrt_10B
-    82,    // sqrt_20B
-    83,    // sqrt_30B
-    84,    // inversesqrt_00B
-    85,    // inversesqrt_10B
-    86,    // inversesqrt_20B
-    87,    // inversesqrt_30B
-    88,    // abs_00B
-    89,    // abs_10B
-    90,    // abs_20B
-    91,    // abs_30B
-    92,    // abs_00D
-    93,    // abs_10D
-    94,    // abs_20D
-    95,    // abs_30D
-    96,    // sign_00B
-    97,    // sign_10B
-    98,    // sign_20B
-    99,    // sign_30B
-    100,   // sign_00D
-    101,   // sign_10D
-    102,   // sign_20D
-    103,   // sign_30D
-    104,   // floor_00B
-    105,   // floor_10B
-    106,   // floor_20B
-    107,   // floor_30B
-    108,   // trunc_00B
-    109,   // trunc_10B
-    110,   // trunc_20B
-    111,   // trunc_30B
-    112,   // round_00B
-    113,   // round_10B
-    114,   // round_20B
-    115,   // round_30B
-    116,   // roundEven_00B
-    117,   // roundEven_10B
-    118,   // roundEven_20B
-    119,   // roundEven_30B
-    120,   // ceil_00B
-    121,   // ceil_10B
-    122,   // ceil_20B
-    123,   // ceil_30B
-    124,   // fract_00B
-    125,   // fract_10B
-    126,   // fract_20B
-    127,   // fract_30B
-    128,   // mod_00B00B
-    129,   // mod_10B00B
-    130,   // mod_20B00B
-    131,   // mod_30B00B
-    132,   // mod_10B10B
-    133,   // mod_20B20B
-    134,   // mod_30B30B
-    135,   // min_00B00B
-    136,   // min_10B00B
-    137,   // min_20B00B
-    138,   // min_30B00B
-    139,   // min_10B10B
-    140,   // min_20B20B
-    141,   // min_30B30B
-    142,   // min_00D00D
-    143,   // min_10D10D
-    144,   // min_20D20D
-    145,   // min_30D30D
-    146,   // min_10D00D
-    147,   // min_20D00D
-    148,   // min_30D00D
-    149,   // min_00E00E
-    150,   // min_10E10E
-    151,   // min_20E20E
-    152,   // min_30E30E
-    153,   // min_10E00E
-    154,   // min_20E00E
-    155,   // min_30E00E
-    156,   // max_00B00B
-    157,   // max_10B00B
-    158,   // max_20B00B
-    159,   // max_30B00B
-    160,   // max_10B10B
-    161,   // max_20B20B
-    162,   // max_30B30B
-    163,   // max_00D00D
-    164,   // max_10D10D
-    165,   // max_20D20D
-    166,   // max_30D30D
-    167,   // max_10D00D
-    168,   // max_20D00D
-    169,   // max_30D00D
-    170,   // max_00E00E
-    171,   // max_10E10E
-    172,   // max_20E20E
-    173,   // max_30E30E
-    174,   // max_10E00E
-    175,   // max_20E00E
-    176,   // max_30E00E
-    177,   // clamp_00B00B00B
-    178,   // clamp_10B00B00B
-    179,   // clamp_20B00B00B
-    180,   // clamp_30B00B00B
-    181,   // clamp_10B10B10B
-    182,   // clamp_20B20B20B
-    183,   // clamp_30B30B30B
-    184,   // clamp_00D00D00D
-    185,   // clamp_10D00D00D
-    186,   // clamp_20D00D00D
-    187,   // clamp_30D00D00D
-    188,   // clamp_10D10D10D
-    189,   // clamp_20D20D20D
-    190,   // clamp_30D30D30D
-    191,   // clamp_00E00E00E
-    192,   // clamp_10E00E00E
-    193,   // clamp_20E00E00E
-    194,   // clamp_30E00E00E
-    195,   // clamp_10E10E10E
-    196,   // clamp_20E20E20E
-    197,   // clamp_30E30E30E
-    198,   // mix_00B00B00B
-    199,   // mix_10B10B00B
-    200,   // mix_20B20B00B
-    201,   // mix_30B30B00B
-    202,   // mix_10B10B10B
-    203,   // mix_20B20B20B
-    204,   // mix_30B30B30B
-    205,   // mix_00B00B00F
-    206,   // mix_10B10B10F
-    207,   // mix_20B20B20F
-    208,   // mix_30B30B30F
-    209,   // mix_00D00D00F
-    210,   // mix_10D10D10F
-    211,   // mix_20D20D20F
-    212,   // mix_30D30D30F
-    213,   // mix_00E00E00F
-    214,   // mix_10E10E10F
-    215,   // mix_20E20E20F
-    216,   // mix_30E30E30F
-    217,   // mix_00F00F00F
-    218,   // mix_10F10F10F
-    219,   // mix_20F20F20F
-    220,   // mix_30F30F30F
-    221,   // step_00B00B
-    222,   // step_10B10B
-    223,   // step_20B20B
-    224,   // step_30B30B
-    225,   // step_00B10B
-    226,   // step_00B20B
-    227,   // step_00B30B
-    228,   // smoothstep_00B00B00B
-    229,   // smoothstep_10B10B10B
-    230,   // smoothstep_20B20B20B
-    231,   // smoothstep_30B30B30B
-    232,   // smoothstep_00B00B10B
-    233,   // smoothstep_00B00B20B
-    234,   // smoothstep_00B00B30B
-    235,   // modf_00B00B
-    236,   // modf_10B10B
-    237,   // modf_20B20B
-    238,   // modf_30B30B
-    239,   // isnan_00B
-    240,   // isnan_10B
-    241,   // isnan_20B
-    242,   // isnan_30B
-    243,   // isinf_00B
-    244,   // isinf_10B
-    245,   // isinf_20B
-    246,   // isinf_30B
-    247,   // floatBitsToInt_00B
-    248,   // floatBitsToInt_10B
-    249,   // floatBitsToInt_20B
-    250,   // floatBitsToInt_30B
-    251,   // floatBitsToUint_00B
-    252,   // floatBitsToUint_10B
-    253,   // floatBitsToUint_20B
-    254,   // floatBitsToUint_30B
-    255,   // intBitsToFloat_00D
-    256,   // intBitsToFloat_10D
-    257,   // intBitsToFloat_20D
-    258,   // intBitsToFloat_30D
-    259,   // uintBitsToFloat_00E
-    260,   // uintBitsToFloat_10E
-    261,   // uintBitsToFloat_20E
-    262,   // uintBitsToFloat_30E
-    263,   // fma_00B00B00B
-    266,   // fma_10B10B10B
-    269,   // fma_20B20B20B
-    272,   // fma_30B30B30B
-    275,   // frexp_00B00D
-    276,   // frexp_10B10D
-    277,   // frexp_20B20D
-    278,   // frexp_30B30D
-    279,   // ldexp_00B00D
-    280,   // ldexp_10B10D
-    281,   // ldexp_20B20D
-    282,   // ldexp_30B30D
-    283,   // packSnorm2x16_10B
-    284,   // packHalf2x16_10B
-    285,   // unpackSnorm2x16_00E
-    286,   // unpackHalf2x16_00E
-    287,   // packUnorm2x16_10B
-    288,   // unpackUnorm2x16_00E
-    289,   // packUnorm4x8_30B
-    290,   // packSnorm4x8_30B
-    291,   // unpackUnorm4x8_00E
-    292,   // unpackSnorm4x8_00E
-    293,   // length_00B
-    294,   // length_10B
-    295,   // length_20B
-    296,   // length_30B
-    297,   // distance_00B00B
-    298,   // distance_10B10B
-    299,   // distance_20B20B
-    300,   // distance_30B30B
-    301,   // dot_00B00B
-    302,   // dot_10B10B
-    303,   // dot_20B20B
-    304,   // dot_30B30B
-    305,   // cross_20B20B
-    306,   // normalize_00B
-    307,   // normalize_10B
-    308,   // normalize_20B
-    309,   // normalize_30B
-    310,   // faceforward_00B00B00B
-    311,   // faceforward_10B10B10B
-    312,   // faceforward_20B20B20B
-    313,   // faceforward_30B30B30B
-    314,   // reflect_00B00B
-    315,   // reflect_10B10B
-    316,   // reflect_20B20B
-    317,   // reflect_30B30B
-    318,   // refract_00B00B00B
-    319,   // refract_10B10B00B
-    320,   // refract_20B20B00B
-    321,   // refract_30B30B00B
-    322,   // matrixCompMult_50B50B
-    323,   // matrixCompMult_A0BA0B
-    324,   // matrixCompMult_F0BF0B
-    325,   // matrixCompMult_90B90B
-    326,   // matrixCompMult_60B60B
-    327,   // matrixCompMult_D0BD0B
-    328,   // matrixCompMult_70B70B
-    329,   // matrixCompMult_E0BE0B
-    330,   // matrixCompMult_B0BB0B
-    331,   // outerProduct_10B10B
-    332,   // outerProduct_20B20B
-    333,   // outerProduct_30B30B
-    334,   // outerProduct_20B10B
-    335,   // outerProduct_10B20B
-    336,   // outerProduct_30B10B
-    337,   // outerProduct_10B30B
-    338,   // outerProduct_30B20B
-    339,   // outerProduct_20B30B
-    340,   // transpose_50B
-    341,   // transpose_A0B
-    342,   // transpose_F0B
-    343,   // transpose_60B
-    344,   // transpose_90B
-    345,   // transpose_70B
-    346,   // transpose_D0B
-    347,   // transpose_B0B
-    348,   // transpose_E0B
-    349,   // determinant_50B
-    350,   // determinant_A0B
-    351,   // determinant_F0B
-    352,   // inverse_50B
-    353,   // inverse_A0B
-    354,   // inverse_F0B
-    355,   // lessThan_10B10B
-    356,   // lessThan_20B20B
-    357,   // lessThan_30B30B
-    358,   // lessThan_10D10D
-    359,   // lessThan_20D20D
-    360,   // lessThan_30D30D
-    361,   // lessThan_10E10E
-    362,   // lessThan_20E20E
-    363,   // lessThan_30E30E
-    364,   // lessThanEqual_10B10B
-    365,   // lessThanEqual_20B20B
-    366,   // lessThanEqual_30B30B
-    367,   // lessThanEqual_10D10D
-    368,   // lessThanEqual_20D20D
-    369,   // lessThanEqual_30D30D
-    370,   // lessThanEqual_10E10E
-    371,   // lessThanEqual_20E20E
-    372,   // lessThanEqual_30E30E
-    373,   // greaterThan_10B10B
-    374,   // greaterThan_20B20B
-    375,   // greaterThan_30B30B
-    376,   // greaterThan_10D10D
-    377,   // greaterThan_20D20D
-    378,   // greaterThan_30D30D
-    379,   // greaterThan_10E10E
-    380,   // greaterThan_20E20E
-    381,   // greaterThan_30E30E
-    382,   // greaterThanEqual_10B10B
-    383,   // greaterThanEqual_20B20B
-    384,   // greaterThanEqual_30B30B
-    385,   // greaterThanEqual_10D10D
-    386,   // greaterThanEqual_20D20D
-    387,   // greaterThanEqual_30D30D
-    388,   // greaterThanEqual_10E10E
-    389,   // greaterThanEqual_20E20E
-    390,   // greaterThanEqual_30E30E
-    391,   // equal_10B10B
-    392,   // equal_20B20B
-    393,   // equal_30B30B
-    394,   // equal_10D10D
-    395,   // equal_20D20D
-    396,   // equal_30D30D
-    397,   // equal_10E10E
-    398,   // equal_20E20E
-    399,   // equal_30E30E
-    400,   // equal_10F10F
-    401,   // equal_20F20F
-    402,   // equal_30F30F
-    403,   // notEqual_10B10B
-    404,   // notEqual_20B20B
-    405,   // notEqual_30B30B
-    406,   // notEqual_10D10D
-    407,   // notEqual_20D20D
-    408,   // notEqual_30D30D
-    409,   // notEqual_10E10E
-    410,   // notEqual_20E20E
-    411,   // notEqual_30E30E
-    412,   // notEqual_10F10F
-    413,   // notEqual_20F20F
-    414,   // notEqual_30F30F
-    415,   // any_10F
-    416,   // any_20F
-    417,   // any_30F
-    418,   // all_10F
-    419,   // all_20F
-    420,   // all_30F
-    421,   // not_10F
-    422,   // not_20F
-    423,   // not_30F
-    424,   // bitfieldExtract_00D00D00D
-    425,   // bitfieldExtract_10D00D00D
-    426,   // bitfieldExtract_20D00D00D
-    427,   // bitfieldExtract_30D00D00D
-    428,   // bitfieldExtract_00E00D00D
-    429,   // bitfieldExtract_10E00D00D
-    430,   // bitfieldExtract_20E00D00D
-    431,   // bitfieldExtract_30E00D00D
-    432,   // bitfieldInsert_00D00D00D00D
-    433,   // bitfieldInsert_10D10D00D00D
-    434,   // bitfieldInsert_20D20D00D00D
-    435,   // bitfieldInsert_30D30D00D00D
-    436,   // bitfieldInsert_00E00E00D00D
-    437,   // bitfieldInsert_10E10E00D00D
-    438,   // bitfieldInsert_20E20E00D00D
-    439,   // bitfieldInsert_30E30E00D00D
-    440,   // bitfieldReverse_00D
-    441,   // bitfieldReverse_10D
-    442,   // bitfieldReverse_20D
-    443,   // bitfieldReverse_30D
-    444,   // bitfieldReverse_00E
-    445,   // bitfieldReverse_10E
-    446,   // bitfieldReverse_20E
-    447,   // bitfieldReverse_30E
-    448,   // bitCount_00D
-    449,   // bitCount_10D
-    450,   // bitCount_20D
-    451,   // bitCount_30D
-    452,   // bitCount_00E
-    453,   // bitCount_10E
-    454,   // bitCount_20E
-    455,   // bitCount_30E
-    456,   // findLSB_00D
-    457,   // findLSB_10D
-    458,   // findLSB_20D
-    459,   // findLSB_30D
-    460,   // findLSB_00E
-    461,   // findLSB_10E
-    462,   // findLSB_20E
-    463,   // findLSB_30E
-    464,   // findMSB_00D
-    465,   // findMSB_10D
-    466,   // findMSB_20D
-    467,   // findMSB_30D
-    468,   // findMSB_00E
-    469,   // findMSB_10E
-    470,   // findMSB_20E
-    471,   // findMSB_30E
-    472,   // uaddCarry_00E00E00E
-    473,   // uaddCarry_10E10E10E
-    474,   // uaddCarry_20E20E20E
-    475,   // uaddCarry_30E30E30E
-    476,   // usubBorrow_00E00E00E
-    477,   // usubBorrow_10E10E10E
-    478,   // usubBorrow_20E20E20E
-    479,   // usubBorrow_30E30E30E
-    480,   // umulExtended_00E00E00E00E
-    481,   // umulExtended_10E10E10E10E
-    482,   // umulExtended_20E20E20E20E
-    483,   // umulExtended_30E30E30E30E
-    484,   // imulExtended_00D00D00D00D
-    485,   // imulExtended_10D10D10D10D
-    486,   // imulExtended_20D20D20D20D
-    487,   // imulExtended_30D30D30D30D
-    488,   // texture2D_00I10B
-    489,   // texture2DProj_00I20B
-    490,   // texture2DProj_00I30B
-    491,   // textureCube_00K20B
-    492,   // texture3D_00J20B
-    493,   // texture3DProj_00J30B
-    494,   // shadow2DEXT_00d20B
-    495,   // shadow2DProjEXT_00d30B
-    496,   // texture2D_00M10B
-    498,   // texture2DProj_00M20B
-    500,   // texture2DProj_00M30B
-    502,   // texture2DRect_00O10B
-    503,   // texture2DRectProj_00O20B
-    504,   // texture2DRectProj_00O30B
-    505,   // texture2DGradEXT_00I10B10B10B
-    506,   // texture2DProjGradEXT_00I20B10B10B
-    507,   // texture2DProjGradEXT_00I30B10B10B
-    508,   // textureCubeGradEXT_00K20B20B20B
-    509,   // textureVideoWEBGL_00y10B
-    510,   // texture2D_00I10B00B
-    511,   // texture2DProj_00I20B00B
-    512,   // texture2DProj_00I30B00B
-    513,   // textureCube_00K20B00B
-    514,   // texture3D_00J20B00B
-    515,   // texture3DProj_00J30B00B
-    516,   // texture3DLod_00J20B00B
-    517,   // texture3DProjLod_00J30B00B
-    518,   // texture2DLod_00I10B00B
-    519,   // texture2DProjLod_00I20B00B
-    520,   // texture2DProjLod_00I30B00B
-    521,   // textureCubeLod_00K20B00B
-    522,   // texture2DLodEXT_00I10B00B
-    523,   // texture2DProjLodEXT_00I20B00B
-    524,   // texture2DProjLodEXT_00I30B00B
-    525,   // textureCubeLodEXT_00K20B00B
-    526,   // texture_00I10B
-    527,   // texture_00R10B
-    528,   // texture_00X10B
-    529,   // texture_00J20B
-    530,   // texture_00S20B
-    531,   // texture_00Y20B
-    532,   // texture_00K20B
-    533,   // texture_00T20B
-    534,   // texture_00Z20B
-    535,   // texture_00L20B
-    536,   // texture_00U20B
-    537,   // texture_00a20B
-    538,   // texture_00d20B
-    539,   // texture_00e30B
-    540,   // texture_00f30B
-    541,   // texture_00k30B
-    544,   // texture_00s30B
-    547,   // texture_00x30B
-    550,   // texture_00l30B00B
-    553,   // texture_00M10B
-    554,   // texture_00N10B
-    555,   // texture_00O10B
-    556,   // texture_00y10B
-    557,   // textureProj_00I20B
-    558,   // textureProj_00R20B
-    559,   // textureProj_00X20B
-    560,   // textureProj_00I30B
-    561,   // textureProj_00R30B
-    562,   // textureProj_00X30B
-    563,   // textureProj_00J30B
-    564,   // textureProj_00S30B
-    565,   // textureProj_00Y30B
-    566,   // textureProj_00d30B
-    567,   // textureProj_00M20B
-    568,   // textureProj_00M30B
-    569,   // textureProj_00N20B
-    570,   // textureProj_00N30B
-    571,   // textureProj_00O20B
-    572,   // textureProj_00O30B
-    573,   // textureLod_00I10B00B
-    574,   // textureLod_00R10B00B
-    575,   // textureLod_00X10B00B
-    576,   // textureLod_00J20B00B
-    577,   // textureLod_00S20B00B
-    578,   // textureLod_00Y20B00B
-    579,   // textureLod_00K20B00B
-    580,   // textureLod_00T20B00B
-    581,   // textureLod_00Z20B00B
-    582,   // textureLod_00L20B00B
-    583,   // textureLod_00U20B00B
-    584,   // textureLod_00a20B00B
-    585,   // textureLod_00d20B00B
-    586,   // textureLod_00k30B00B
-    589,   // textureLod_00s30B00B
-    592,   // textureLod_00x30B00B
-    595,   // textureSize_00I00D
-    596,   // textureSize_00R00D
-    597,   // textureSize_00X00D
-    598,   // textureSize_00J00D
-    599,   // textureSize_00S00D
-    600,   // textureSize_00Y00D
-    601,   // textureSize_00K00D
-    602,   // textureSize_00T00D
-    603,   // textureSize_00Z00D
-    604,   // textureSize_00L00D
-    605,   // textureSize_00U00D
-    606,   // textureSize_00a00D
-    607,   // textureSize_00d00D
-    608,   // textureSize_00e00D
-    609,   // textureSize_00f00D
-    610,   // textureSize_00k00D
-    613,   // textureSize_00s00D
-    616,   // textureSize_00x00D
-    619,   // textureSize_00l00D
-    622,   // textureSize_00j
-    625,   // textureSize_00r
-    628,   // textureSize_00w
-    631,   // textureSize_00P
-    633,   // textureSize_00V
-    635,   // textureSize_00b
-    637,   // textureSize_00Q
-    639,   // textureSize_00W
-    641,   // textureSize_00c
-    643,   // textureSize_00M00D
-    644,   // textureSize_00N00D
-    645,   // textureProjLod_00I20B00B
-    646,   // textureProjLod_00R20B00B
-    647,   // textureProjLod_00X20B00B
-    648,   // textureProjLod_00I30B00B
-    649,   // textureProjLod_00R30B00B
-    650,   // textureProjLod_00X30B00B
-    651,   // textureProjLod_00J30B00B
-    652,   // textureProjLod_00S30B00B
-    653,   // textureProjLod_00Y30B00B
-    654,   // textureProjLod_00d30B00B
-    655,   // texelFetch_00I10D00D
-    656,   // texelFetch_00R10D00D
-    657,   // texelFetch_00X10D00D
-    658,   // texelFetch_00J20D00D
-    659,   // texelFetch_00S20D00D
-    660,   // texelFetch_00Y20D00D
-    661,   // texelFetch_00L20D00D
-    662,   // texelFetch_00U20D00D
-    663,   // texelFetch_00a20D00D
-    664,   // texelFetch_00j00D
-    667,   // texelFetch_00r00D
-    670,   // texelFetch_00w00D
-    673,   // texelFetch_00P10D00D
-    675,   // texelFetch_00V10D00D
-    677,   // texelFetch_00b10D00D
-    679,   // texelFetch_00Q20D00D
-    681,   // texelFetch_00W20D00D
-    683,   // texelFetch_00c20D00D
-    685,   // texelFetch_00M10D00D
-    686,   // texelFetch_00N10D00D
-    687,   // textureGrad_00I10B10B10B
-    688,   // textureGrad_00R10B10B10B
-    689,   // textureGrad_00X10B10B10B
-    690,   // textureGrad_00J20B20B20B
-    691,   // textureGrad_00S20B20B20B
-    692,   // textureGrad_00Y20B20B20B
-    693,   // textureGrad_00K20B20B20B
-    694,   // textureGrad_00T20B20B20B
-    695,   // textureGrad_00Z20B20B20B
-    696,   // textureGrad_00d20B10B10B
-    697,   // textureGrad_00e30B20B20B
-    698,   // textureGrad_00L20B10B10B
-    699,   // textureGrad_00U20B10B10B
-    700,   // textureGrad_00a20B10B10B
-    701,   // textureGrad_00f30B10B10B
-    702,   // textureGrad_00k30B20B20B
-    705,   // textureGrad_00s30B20B20B
-    708,   // textureGrad_00x30B20B20B
-    711,   // textureProjGrad_00I20B10B10B
-    712,   // textureProjGrad_00R20B10B10B
-    713,   // textureProjGrad_00X20B10B10B
-    714,   // textureProjGrad_00I30B10B10B
-    715,   // textureProjGrad_00R30B10B10B
-    716,   // textureProjGrad_00X30B10B10B
-    717,   // textureProjGrad_00J30B20B20B
-    718,   // textureProjGrad_00S30B20B20B
-    719,   // textureProjGrad_00Y30B20B20B
-    720,   // textureProjGrad_00d30B10B10B
-    721,   // texture_00I10B00B
-    722,   // texture_00R10B00B
-    723,   // texture_00X10B00B
-    724,   // texture_00J20B00B
-    725,   // texture_00S20B00B
-    726,   // texture_00Y20B00B
-    727,   // texture_00K20B00B
-    728,   // texture_00T20B00B
-    729,   // texture_00Z20B00B
-    730,   // texture_00L20B00B
-    731,   // texture_00U20B00B
-    732,   // texture_00a20B00B
-    733,   // textureProj_00I20B00B
-    734,   // textureProj_00R20B00B
-    735,   // textureProj_00X20B00B
-    736,   // textureProj_00I30B00B
-    737,   // textureProj_00R30B00B
-    738,   // textureProj_00X30B00B
-    739,   // textureProj_00J30B00B
-    740,   // textureProj_00S30B00B
-    741,   // textureProj_00Y30B00B
-    742,   // texture_00d20B00B
-    743,   // texture_00e30B00B
-    744,   // textureProj_00d30B00B
-    745,   // texture_00k30B00B
-    748,   // texture_00s30B00B
-    751,   // texture_00x30B00B
-    754,   // texture_00M10B00B
-    755,   // textureProj_00M20B00B
-    756,   // textureProj_00M30B00B
-    757,   // texture_00N10B00B
-    758,   // textureProj_00N20B00B
-    759,   // textureProj_00N30B00B
-    760,   // textureOffset_00I10B10D
-    761,   // textureOffset_00R10B10D
-    762,   // textureOffset_00X10B10D
-    763,   // textureOffset_00J20B20D
-    764,   // textureOffset_00S20B20D
-    765,   // textureOffset_00Y20B20D
-    766,   // textureOffset_00d20B10D
-    767,   // textureOffset_00L20B10D
-    768,   // textureOffset_00U20B10D
-    769,   // textureOffset_00a20B10D
-    770,   // textureProjOffset_00I20B10D
-    771,   // textureProjOffset_00R20B10D
-    772,   // textureProjOffset_00X20B10D
-    773,   // textureProjOffset_00I30B10D
-    774,   // textureProjOffset_00R30B10D
-    775,   // textureProjOffset_00X30B10D
-    776,   // textureProjOffset_00J30B20D
-    777,   // textureProjOffset_00S30B20D
-    778,   // textureProjOffset_00Y30B20D
-    779,   // textureProjOffset_00d30B10D
-    780,   // textureLodOffset_00I10B00B10D
-    781,   // textureLodOffset_00R10B00B10D
-    782,   // textureLodOffset_00X10B00B10D
-    783,   // textureLodOffset_00J20B00B20D
-    784,   // textureLodOffset_00S20B00B20D
-    785,   // textureLodOffset_00Y20B00B20D
-    786,   // textureLodOffset_00d20B00B10D
-    787,   // textureLodOffset_00L20B00B10D
-    788,   // textureLodOffset_00U20B00B10D
-    789,   // textureLodOffset_00a20B00B10D
-    790,   // textureProjLodOffset_00I20B00B10D
-    791,   // textureProjLodOffset_00R20B00B10D
-    792,   // textureProjLodOffset_00X20B00B10D
-    793,   // textureProjLodOffset_00I30B00B10D
-    794,   // textureProjLodOffset_00R30B00B10D
-    795,   // textureProjLodOffset_00X30B00B10D
-    796,   // textureProjLodOffset_00J30B00B20D
-    797,   // textureProjLodOffset_00S30B00B20D
-    798,   // textureProjLodOffset_00Y30B00B20D
-    799,   // textureProjLodOffset_00d30B00B10D
-    800,   // texelFetchOffset_00I10D00D10D
-    801,   // texelFetchOffset_00R10D00D10D
-    802,   // texelFetchOffset_00X10D00D10D
-    803,   // texelFetchOffset_00J20D00D20D
-    804,   // texelFetchOffset_00S20D00D20D
-    805,   // texelFetchOffset_00Y20D00D20D
-    806,   // texelFetchOffset_00L20D00D10D
-    807,   // texelFetchOffset_00U20D00D10D
-    808,   // texelFetchOffset_00a20D00D10D
-    809,   // textureGradOffset_00I10B10B10B10D
-    810,   // textureGradOffset_00R10B10B10B10D
-    811,   // textureGradOffset_00X10B10B10B10D
-    812,   // textureGradOffset_00J20B20B20B20D
-    813,   // textureGradOffset_00S20B20B20B20D
-    814,   // textureGradOffset_00Y20B20B20B20D
-    815,   // textureGradOffset_00d20B10B10B10D
-    816,   // textureGradOffset_00L20B10B10B10D
-    817,   // textureGradOffset_00U20B10B10B10D
-    818,   // textureGradOffset_00a20B10B10B10D
-    819,   // textureGradOffset_00f30B10B10B10D
-    820,   // textureProjGradOffset_00I20B10B10B10D
-    821,   // textureProjGradOffset_00R20B10B10B10D
-    822,   // textureProjGradOffset_00X20B10B10B10D
-    823,   // textureProjGradOffset_00I30B10B10B10D
-    824,   // textureProjGradOffset_00R30B10B10B10D
-    825,   // textureProjGradOffset_00X30B10B10B10D
-    826,   // textureProjGradOffset_00J30B20B20B20D
-    827,   // textureProjGradOffset_00S30B20B20B20D
-    828,   // textureProjGradOffset_00Y30B20B20B20D
-    829,   // textureProjGradOffset_00d30B10B10B10D
-    830,   // textureOffset_00I10B10D00B
-    831,   // textureOffset_00R10B10D00B
-    832,   // textureOffset_00X10B10D00B
-    833,   // textureOffset_00J20B20D00B
-    834,   // textureOffset_00S20B20D00B
-    835,   // textureOffset_00Y20B20D00B
-    836,   // textureOffset_00d20B10D00B
-    837,   // textureOffset_00L20B10D00B
-    838,   // textureOffset_00U20B10D00B
-    839,   // textureOffset_00a20B10D00B
-    840,   // textureProjOffset_00I20B10D00B
-    841,   // textureProjOffset_00R20B10D00B
-    842,   // textureProjOffset_00X20B10D00B
-    843,   // textureProjOffset_00I30B10D00B
-    844,   // textureProjOffset_00R30B10D00B
-    845,   // textureProjOffset_00X30B10D00B
-    846,   // textureProjOffset_00J30B20D00B
-    847,   // textureProjOffset_00S30B20D00B
-    848,   // textureProjOffset_00Y30B20D00B
-    849,   // textureProjOffset_00d30B10D00B
-    850,   // textureGather_00I10B
-    851,   // textureGather_00R10B
-    852,   // textureGather_00X10B
-    853,   // textureGather_00I10B00D
-    854,   // textureGather_00R10B00D
-    855,   // textureGather_00X10B00D
-    856,   // textureGather_00L20B
-    857,   // textureGather_00U20B
-    858,   // textureGather_00a20B
-    859,   // textureGather_00L20B00D
-    860,   // textureGather_00U20B00D
-    861,   // textureGather_00a20B00D
-    862,   // textureGather_00K20B
-    863,   // textureGather_00T20B
-    864,   // textureGather_00Z20B
-    865,   // textureGather_00K20B00D
-    866,   // textureGather_00T20B00D
-    867,   // textureGather_00Z20B00D
-    868,   // textureGather_00k30B
-    871,   // textureGather_00s30B
-    874,   // textureGather_00x30B
-    877,   // textureGather_00k30B00D
-    880,   // textureGather_00s30B00D
-    883,   // textureGather_00x30B00D
-    886,   // textureGather_00l30B00B
-    889,   // textureGather_00d10B
-    890,   // textureGather_00d10B00B
-    891,   // textureGather_00f20B
-    892,   // textureGather_00f20B00B
-    893,   // textureGather_00e20B
-    894,   // textureGather_00e20B00B
-    895,   // textureGatherOffset_00I10B10D
-    896,   // textureGatherOffset_00R10B10D
-    897,   // textureGatherOffset_00X10B10D
-    898,   // textureGatherOffset_00L20B10D
-    899,   // textureGatherOffset_00U20B10D
-    900,   // textureGatherOffset_00a20B10D
-    901,   // textureGatherOffset_00d10B00B10D
-    902,   // textureGatherOffset_00f20B00B10D
-    903,   // textureGatherOffset_00I10B10D00D
-    904,   // textureGatherOffset_00R10B10D00D
-    905,   // textureGatherOffset_00X10B10D00D
-    906,   // textureGatherOffset_00L20B10D00D
-    907,   // textureGatherOffset_00U20B10D00D
-    908,   // textureGatherOffset_00a20B10D00D
-    909,   // textureGatherOffsets_00I10B10Dx4
-    912,   // textureGatherOffsets_00R10B10Dx4
-    915,   // textureGatherOffsets_00X10B10Dx4
-    918,   // textureGatherOffsets_00L20B10Dx4
-    921,   // textureGatherOffsets_00U20B10Dx4
-    924,   // textureGatherOffsets_00a20B10Dx4
-    927,   // textureGatherOffsets_00d10B00B10Dx4
-    930,   // textureGatherOffsets_00f20B00B10Dx4
-    933,   // textureGatherOffsets_00I10B10Dx400D
-    936,   // textureGatherOffsets_00R10B10Dx400D
-    939,   // textureGatherOffsets_00X10B10Dx400D
-    942,   // textureGatherOffsets_00L20B10Dx400D
-    945,   // textureGatherOffsets_00U20B10Dx400D
-    948,   // textureGatherOffsets_00a20B10Dx400D
-    951,   // rgb_2_yuv_20B00H
-    952,   // yuv_2_rgb_20B00H
-    953,   // dFdx_00B
-    955,   // dFdx_10B
-    957,   // dFdx_20B
-    959,   // dFdx_30B
-    961,   // dFdy_00B
-    963,   // dFdy_10B
-    965,   // dFdy_20B
-    967,   // dFdy_30B
-    969,   // fwidth_00B
-    971,   // fwidth_10B
-    973,   // fwidth_20B
-    975,   // fwidth_30B
-    977,   // interpolateAtCentroid_00B
-    979,   // interpolateAtCentroid_10B
-    981,   // interpolateAtCentroid_20B
-    983,   // interpolateAtCentroid_30B
-    985,   // interpolateAtSample_00B00D
-    987,   // interpolateAtSample_10B00D
-    989,   // interpolateAtSample_20B00D
-    991,   // interpolateAtSample_30B00D
-    993,   // interpolateAtOffset_00B10B
-    995,   // interpolateAtOffset_10B10B
-    997,   // interpolateAtOffset_20B10B
-    999,   // interpolateAtOffset_30B10B
-    1001,  // atomicCounter_00G
-    1002,  // atomicCounterIncrement_00G
-    1003,  // atomicCounterDecrement_00G
-    1004,  // atomicAdd_00E00E
-    1005,  // atomicAdd_00D00D
-    1006,  // atomicMin_00E00E
-    1007,  // atomicMin_00D00D
-    1008,  // atomicMax_00E00E
-    1009,  // atomicMax_00D00D
-    1010,  // atomicAnd_00E00E
-    1011,  // atomicAnd_00D00D
-    1012,  // atomicOr_00E00E
-    1013,  // atomicOr_00D00D
-    1014,  // atomicXor_00E00E
-    1015,  // atomicXor_00D00D
-    1016,  // atomicExchange_00E00E
-    1017,  // atomicExchange_00D00D
-    1018,  // atomicCompSwap_00E00E00E
-    1019,  // atomicCompSwap_00D00D00D
-    1020,  // imageSize_00z
-    1021,  // imageSize_01K
-    1022,  // imageSize_01V
-    1023,  // imageSize_01A
-    1024,  // imageSize_01L
-    1025,  // imageSize_01W
-    1026,  // imageSize_01B
-    1027,  // imageSize_01M
-    1028,  // imageSize_01X
-    1029,  // imageSize_01C
-    1030,  // imageSize_01N
-    1031,  // imageSize_01Y
-    1032,  // imageSize_01H
-    1035,  // imageSize_01S
-    1038,  // imageSize_01d
-    1041,  // imageSize_01J
-    1044,  // imageSize_01U
-    1047,  // imageSize_01f
-    1050,  // imageStore_00z10D30B
-    1051,  // imageStore_01K10D30D
-    1052,  // imageStore_01V10D30E
-    1053,  // imageStore_01A20D30B
-    1054,  // imageStore_01L20D30D
-    1055,  // imageStore_01W20D30E
-    1056,  // imageStore_01B20D30B
-    1057,  // imageStore_01M20D30D
-    1058,  // imageStore_01X20D30E
-    1059,  // imageStore_01C20D30B
-    1060,  // imageStore_01N20D30D
-    1061,  // imageStore_01Y20D30E
-    1062,  // imageStore_01H20D30B
-    1065,  // imageStore_01S20D30D
-    1068,  // imageStore_01d20D30E
-    1071,  // imageStore_01J00D30B
-    1074,  // imageStore_01U00D30D
-    1077,  // imageStore_01f00D30E
-    1080,  // imageLoad_00z10D
-    1081,  // imageLoad_01K10D
-    1082,  // imageLoad_01V10D
-    1083,  // imageLoad_01A20D
-    1084,  // imageLoad_01L20D
-    1085,  // imageLoad_01W20D
-    1086,  // imageLoad_01B20D
-    1087,  // imageLoad_01M20D
-    1088,  // imageLoad_01X20D
-    1089,  // imageLoad_01C20D
-    1090,  // imageLoad_01N20D
-    1091,  // imageLoad_01Y20D
-    1092,  // imageLoad_01H20D
-    1095,  // imageLoad_01S20D
-    1098,  // imageLoad_01d20D
-    1101,  // imageLoad_01J00D
-    1104,  // imageLoad_01U00D
-    1107,  // imageLoad_01f00D
-    1110,  // imageAtomicAdd_00z10D00E
-    1112,  // imageAtomicAdd_01K10D00E
-    1114,  // imageAtomicAdd_01V10D00E
-    1116,  // imageAtomicAdd_01A20D00E
-    1118,  // imageAtomicAdd_01L20D00E
-    1120,  // imageAtomicAdd_01W20D00E
-    1122,  // imageAtomicAdd_01C20D00E
-    1124,  // imageAtomicAdd_01N20D00E
-    1126,  // imageAtomicAdd_01Y20D00E
-    1128,  // imageAtomicAdd_01J00D00E
-    1130,  // imageAtomicAdd_01U00D00E
-    1132,  // imageAtomicAdd_01f00D00E
-    1134,  // imageAtomicAdd_01B20D00E
-    1136,  // imageAtomicAdd_01M20D00E
-    1138,  // imageAtomicAdd_01X20D00E
-    1140,  // imageAtomicAdd_01H20D00E
-    1142,  // imageAtomicAdd_01S20D00E
-    1144,  // imageAtomicAdd_01d20D00E
-    1146,  // imageAtomicAdd_01D00D00E
-    1148,  // imageAtomicAdd_01O00D00E
-    1150,  // imageAtomicAdd_01Z00D00E
-    1152,  // imageAtomicAdd_01E10D00E
-    1154,  // imageAtomicAdd_01P10D00E
-    1156,  // imageAtomicAdd_01a10D00E
-    1158,  // imageAtomicAdd_01I10D00E
-    1160,  // imageAtomicAdd_01T10D00E
-    1162,  // imageAtomicAdd_01e10D00E
-    1164,  // imageAtomicAdd_01F10D00D00E
-    1166,  // imageAtomicAdd_01Q10D00D00E
-    1168,  // imageAtomicAdd_01b10D00D00E
-    1170,  // imageAtomicAdd_01G20D00D00E
-    1172,  // imageAtomicAdd_01R20D00D00E
-    1174,  // imageAtomicAdd_01c20D00D00E
-    1176,  // imageAtomicAdd_00z10D00D
-    1178,  // imageAtomicAdd_01K10D00D
-    1180,  // imageAtomicAdd_01V10D00D
-    1182,  // imageAtomicAdd_01A20D00D
-    1184,  // imageAtomicAdd_01L20D00D
-    1186,  // imageAtomicAdd_01W20D00D
-    1188,  // imageAtomicAdd_01C20D00D
-    1190,  // imageAtomicAdd_01N20D00D
-    1192,  // imageAtomicAdd_01Y20D00D
-    1194,  // imageAtomicAdd_01J00D00D
-    1196,  // imageAtomicAdd_01U00D00D
-    1198,  // imageAtomicAdd_01f00D00D
-    1200,  // imageAtomicAdd_01B20D00D
-    1202,  // imageAtomicAdd_01M20D00D
-    1204,  // imageAtomicAdd_01X20D00D
-    1206,  // imageAtomicAdd_01H20D00D
-    1208,  // imageAtomicAdd_01S20D00D
-    1210,  // imageAtomicAdd_01d20D00D
-    1212,  // imageAtomicAdd_01D00D00D
-    1214,  // imageAtomicAdd_01O00D00D
-    1216,  // imageAtomicAdd_01Z00D00D
-    1218,  // imageAtomicAdd_01E10D00D
-    1220,  // imageAtomicAdd_01P10D00D
-    1222,  // imageAtomicAdd_01a10D00D
-    1224,  // imageAtomicAdd_01I10D00D
-    1226,  // imageAtomicAdd_01T10D00D
-    1228,  // imageAtomicAdd_01e10D00D
-    1230,  // imageAtomicAdd_01F10D00D00D
-    1232,  // imageAtomicAdd_01Q10D00D00D
-    1234,  // imageAtomicAdd_01b10D00D00D
-    1236,  // imageAtomicAdd_01G20D00D00D
-    1238,  // imageAtomicAdd_01R20D00D00D
-    1240,  // imageAtomicAdd_01c20D00D00D
-    1242,  // imageAtomicMin_00z10D00E
-    1244,  // imageAtomicMin_01K10D00E
-    1246,  // imageAtomicMin_01V10D00E
-    1248,  // imageAtomicMin_01A20D00E
-    1250,  // imageAtomicMin_01L20D00E
-    1252,  // imageAtomicMin_01W20D00E
-    1254,  // imageAtomicMin_01C20D00E
-    1256,  // imageAtomicMin_01N20D00E
-    1258,  // imageAtomicMin_01Y20D00E
-    1260,  // imageAtomicMin_01J00D00E
-    1262,  // imageAtomicMin_01U00D00E
-    1264,  // imageAtomicMin_01f00D00E
-    1266,  // imageAtomicMin_01B20D00E
-    1268,  // imageAtomicMin_01M20D00E
-    1270,  // imageAtomicMin_01X20D00E
-    1272,  // imageAtomicMin_01H20D00E
-    1274,  // imageAtomicMin_01S20D00E
-    1276,  // imageAtomicMin_01d20D00E
-    1278,  // imageAtomicMin_01D00D00E
-    1280,  // imageAtomicMin_01O00D00E
-    1282,  // imageAtomicMin_01Z00D00E
-    1284,  // imageAtomicMin_01E10D00E
-    1286,  // imageAtomicMin_01P10D00E
-    1288,  // imageAtomicMin_01a10D00E
-    1290,  // imageAtomicMin_01I10D00E
-    1292,  // imageAtomicMin_01T10D00E
-    1294,  // imageAtomicMin_01e10D00E
-    1296,  // imageAtomicMin_01F10D00D00E
-    1298,  // imageAtomicMin_01Q10D00D00E
-    1300,  // imageAtomicMin_01b10D00D00E
-    1302,  // imageAtomicMin_01G20D00D00E
-    1304,  // imageAtomicMin_01R20D00D00E
-    1306,  // imageAtomicMin_01c20D00D00E
-    1308,  // imageAtomicMin_00z10D00D
-    1310,  // imageAtomicMin_01K10D00D
-    1312,  // imageAtomicMin_01V10D00D
-    1314,  // imageAtomicMin_01A20D00D
-    1316,  // imageAtomicMin_01L20D00D
-    1318,  // imageAtomicMin_01W20D00D
-    1320,  // imageAtomicMin_01C20D00D
-    1322,  // imageAtomicMin_01N20D00D
-    1324,  // imageAtomicMin_01Y20D00D
-    1326,  // imageAtomicMin_01J00D00D
-    1328,  // imageAtomicMin_01U00D00D
-    1330,  // imageAtomicMin_01f00D00D
-    1332,  // imageAtomicMin_01B20D00D
-    1334,  // imageAtomicMin_01M20D00D
-    1336,  // imageAtomicMin_01X20D00D
-    1338,  // imageAtomicMin_01H20D00D
-    1340,  // imageAtomicMin_01S20D00D
-    1342,  // imageAtomicMin_01d20D00D
-    1344,  // imageAtomicMin_01D00D00D
-    1346,  // imageAtomicMin_01O00D00D
-    1348,  // imageAtomicMin_01Z00D00D
-    1350,  // imageAtomicMin_01E10D00D
-    1352,  // imageAtomicMin_01P10D00D
-    1354,  // imageAtomicMin_01a10D00D
-    1356,  // imageAtomicMin_01I10D00D
-    1358,  // imageAtomicMin_01T10D00D
-    1360,  // imageAtomicMin_01e10D00D
-    1362,  // imageAtomicMin_01F10D00D00D
-    1364,  // imageAtomicMin_01Q10D00D00D
-    1366,  // imageAtomicMin_01b10D00D00D
-    1368,  // imageAtomicMin_01G20D00D00D
-    1370,  // imageAtomicMin_01R20D00D00D
-    1372,  // imageAtomicMin_01c20D00D00D
-    1374,  // imageAtomicMax_00z10D00E
-    1376,  // imageAtomicMax_01K10D00E
-    1378,  // imageAtomicMax_01V10D00E
-    1380,  // imageAtomicMax_01A20D00E
-    1382,  // imageAtomicMax_01L20D00E
-    1384,  // imageAtomicMax_01W20D00E
-    1386,  // imageAtomicMax_01C20D00E
-    1388,  // imageAtomicMax_01N20D00E
-    1390,  // imageAtomicMax_01Y20D00E
-    1392,  // imageAtomicMax_01J00D00E
-    1394,  // imageAtomicMax_01U00D00E
-    1396,  // imageAtomicMax_01f00D00E
-    1398,  // imageAtomicMax_01B20D00E
-    1400,  // imageAtomicMax_01M20D00E
-    1402,  // imageAtomicMax_01X20D00E
-    1404,  // imageAtomicMax_01H20D00E
-    1406,  // imageAtomicMax_01S20D00E
-    1408,  // imageAtomicMax_01d20D00E
-    1410,  // imageAtomicMax_01D00D00E
-    1412,  // imageAtomicMax_01O00D00E
-    1414,  // imageAtomicMax_01Z00D00E
-    1416,  // imageAtomicMax_01E10D00E
-    1418,  // imageAtomicMax_01P10D00E
-    1420,  // imageAtomicMax_01a10D00E
-    1422,  // imageAtomicMax_01I10D00E
-    1424,  // imageAtomicMax_01T10D00E
-    1426,  // imageAtomicMax_01e10D00E
-    1428,  // imageAtomicMax_01F10D00D00E
-    1430,  // imageAtomicMax_01Q10D00D00E
-    1432,  // imageAtomicMax_01b10D00D00E
-    1434,  // imageAtomicMax_01G20D00D00E
-    1436,  // imageAtomicMax_01R20D00D00E
-    1438,  // imageAtomicMax_01c20D00D00E
-    1440,  // imageAtomicMax_00z10D00D
-    1442,  // imageAtomicMax_01K10D00D
-    1444,  // imageAtomicMax_01V10D00D
-    1446,  // imageAtomicMax_01A20D00D
-    1448,  // imageAtomicMax_01L20D00D
-    1450,  // imageAtomicMax_01W20D00D
-    1452,  // imageAtomicMax_01C20D00D
-    1454,  // imageAtomicMax_01N20D00D
-    1456,  // imageAtomicMax_01Y20D00D
-    1458,  // imageAtomicMax_01J00D00D
-    1460,  // imageAtomicMax_01U00D00D
-    1462,  // imageAtomicMax_01f00D00D
-    1464,  // imageAtomicMax_01B20D00D
-    1466,  // imageAtomicMax_01M20D00D
-    1468,  // imageAtomicMax_01X20D00D
-    1470,  // imageAtomicMax_01H20D00D
-    1472,  // imageAtomicMax_01S20D00D
-    1474,  // imageAtomicMax_01d20D00D
-    1476,  // imageAtomicMax_01D00D00D
-    1478,  // imageAtomicMax_01O00D00D
-    1480,  // imageAtomicMax_01Z00D00D
-    1482,  // imageAtomicMax_01E10D00D
-    1484,  // imageAtomicMax_01P10D00D
-    1486,  // imageAtomicMax_01a10D00D
-    1488,  // imageAtomicMax_01I10D00D
-    1490,  // imageAtomicMax_01T10D00D
-    1492,  // imageAtomicMax_01e10D00D
-    1494,  // imageAtomicMax_01F10D00D00D
-    1496,  // imageAtomicMax_01Q10D00D00D
-    1498,  // imageAtomicMax_01b10D00D00D
-    1500,  // imageAtomicMax_01G20D00D00D
-    1502,  // imageAtomicMax_01R20D00D00D
-    1504,  // imageAtomicMax_01c20D00D00D
-    1506,  // imageAtomicAnd_00z10D00E
-    1508,  // imageAtomicAnd_01K10D00E
-    1510,  // imageAtomicAnd_01V10D00E
-    1512,  // imageAtomicAnd_01A20D00E
-    1514,  // imageAtomicAnd_01L20D00E
-    1516,  // imageAtomicAnd_01W20D00E
-    1518,  // imageAtomicAnd_01C20D00E
-    1520,  // imageAtomicAnd_01N20D00E
-    1522,  // imageAtomicAnd_01Y20D00E
-    1524,  // imageAtomicAnd_01J00D00E
-    1526,  // imageAtomicAnd_01U00D00E
-    1528,  // imageAtomicAnd_01f00D00E
-    1530,  // imageAtomicAnd_01B20D00E
-    1532,  // imageAtomicAnd_01M20D00E
-    1534,  // imageAtomicAnd_01X20D00E
-    1536,  // imageAtomicAnd_01H20D00E
-    1538,  // imageAtomicAnd_01S20D00E
-    1540,  // imageAtomicAnd_01d20D00E
-    1542,  // imageAtomicAnd_01D00D00E
-    1544,  // imageAtomicAnd_01O00D00E
-    1546,  // imageAtomicAnd_01Z00D00E
-    1548,  // imageAtomicAnd_01E10D00E
-    1550,  // imageAtomicAnd_01P10D00E
-    1552,  // imageAtomicAnd_01a10D00E
-    1554,  // imageAtomicAnd_01I10D00E
-    1556,  // imageAtomicAnd_01T10D00E
-    1558,  // imageAtomicAnd_01e10D00E
-    1560,  // imageAtomicAnd_01F10D00D00E
-    1562,  // imageAtomicAnd_01Q10D00D00E
-    1564,  // imageAtomicAnd_01b10D00D00E
-    1566,  // imageAtomicAnd_01G20D00D00E
-    1568,  // imageAtomicAnd_01R20D00D00E
-    1570,  // imageAtomicAnd_01c20D00D00E
-    1572,  // imageAtomicAnd_00z10D00D
-    1574,  // imageAtomicAnd_01K10D00D
-    1576,  // imageAtomicAnd_01V10D00D
-    1578,  // imageAtomicAnd_01A20D00D
-    1580,  // imageAtomicAnd_01L20D00D
-    1582,  // imageAtomicAnd_01W20D00D
-    1584,  // imageAtomicAnd_01C20D00D
-    1586,  // imageAtomicAnd_01N20D00D
-    1588,  // imageAtomicAnd_01Y20D00D
-    1590,  // imageAtomicAnd_01J00D00D
-    1592,  // imageAtomicAnd_01U00D00D
-    1594,  // imageAtomicAnd_01f00D00D
-    1596,  // imageAtomicAnd_01B20D00D
-    1598,  // imageAtomicAnd_01M20D00D
-    1600,  // imageAtomicAnd_01X20D00D
-    1602,  // imageAtomicAnd_01H20D00D
-    1604,  // imageAtomicAnd_01S20D00D
-    1606,  // imageAtomicAnd_01d20D00D
-    1608,  // imageAtomicAnd_01D00D00D
-    1610,  // imageAtomicAnd_01O00D00D
-    1612,  // imageAtomicAnd_01Z00D00D
-    1614,  // imageAtomicAnd_01E10D00D
-    1616,  // imageAtomicAnd_01P10D00D
-    1618,  // imageAtomicAnd_01a10D00D
-    1620,  // imageAtomicAnd_01I10D00D
-    1622,  // imageAtomicAnd_01T10D00D
-    1624,  // imageAtomicAnd_01e10D00D
-    1626,  // imageAtomicAnd_01F10D00D00D
-    1628,  // imageAtomicAnd_01Q10D00D00D
-    1630,  // imageAtomicAnd_01b10D00D00D
-    1632,  // imageAtomicAnd_01G20D00D00D
-    1634,  // imageAtomicAnd_01R20D00D00D
-    1636,  // imageAtomicAnd_01c20D00D00D
-    1638,  // imageAtomicOr_00z10D00E
-    1640,  // imageAtomicOr_01K10D00E
-    1642,  // imageAtomicOr_01V10D00E
-    1644,  // imageAtomicOr_01A20D00E
-    1646,  // imageAtomicOr_01L20D00E
-    1648,  // imageAtomicOr_01W20D00E
-    1650,  // imageAtomicOr_01C20D00E
-    1652,  // imageAtomicOr_01N20D00E
-    1654,  // imageAtomicOr_01Y20D00E
-    1656,  // imageAtomicOr_01J00D00E
-    1658,  // imageAtomicOr_01U00D00E
-    1660,  // imageAtomicOr_01f00D00E
-    1662,  // imageAtomicOr_01B20D00E
-    1664,  // imageAtomicOr_01M20D00E
-    1666,  // imageAtomicOr_01X20D00E
-    1668,  // imageAtomicOr_01H20D00E
-    1670,  // imageAtomicOr_01S20D00E
-    1672,  // imageAtomicOr_01d20D00E
-    1674,  // imageAtomicOr_01D00D00E
-    1676,  // imageAtomicOr_01O00D00E
-    1678,  // imageAtomicOr_01Z00D00E
-    1680,  // imageAtomicOr_01E10D00E
-    1682,  // imageAtomicOr_01P10D00E
-    1684,  // imageAtomicOr_01a10D00E
-    1686,  // imageAtomicOr_01I10D00E
-    1688,  // imageAtomicOr_01T10D00E
-    1690,  // imageAtomicOr_01e10D00E
-    1692,  // imageAtomicOr_01F10D00D00E
-    1694,  // imageAtomicOr_01Q10D00D00E
-    1696,  // imageAtomicOr_01b10D00D00E
-    1698,  // imageAtomicOr_01G20D00D00E
-    1700,  // imageAtomicOr_01R20D00D00E
-    1702,  // imageAtomicOr_01c20D00D00E
-    1704,  // imageAtomicOr_00z10D00D
-    1706,  // imageAtomicOr_01K10D00D
-    1708,  // imageAtomicOr_01V10D00D
-    1710,  // imageAtomicOr_01A20D00D
-    1712,  // imageAtomicOr_01L20D00D
-    1714,  // imageAtomicOr_01W20D00D
-    1716,  // imageAtomicOr_01C20D00D
-    1718,  // imageAtomicOr_01N20D00D
-    1720,  // imageAtomicOr_01Y20D00D
-    1722,  // imageAtomicOr_01J00D00D
-    1724,  // imageAtomicOr_01U00D00D
-    1726,  // imageAtomicOr_01f00D00D
-    1728,  // imageAtomicOr_01B20D00D
-    1730,  // imageAtomicOr_01M20D00D
-    1732,  // imageAtomicOr_01X20D00D
-    1734,  // imageAtomicOr_01H20D00D
-    1736,  // imageAtomicOr_01S20D00D
-    1738,  // imageAtomicOr_01d20D00D
-    1740,  // imageAtomicOr_01D00D00D
-    1742,  // imageAtomicOr_01O00D00D
-    1744,  // imageAtomicOr_01Z00D00D
-    1746,  // imageAtomicOr_01E10D00D
-    1748,  // imageAtomicOr_01P10D00D
-    1750,  // imageAtomicOr_01a10D00D
-    1752,  // imageAtomicOr_01I10D00D
-    1754,  // imageAtomicOr_01T10D00D
-    1756,  // imageAtomicOr_01e10D00D
-    1758,  // imageAtomicOr_01F10D00D00D
-    1760,  // imageAtomicOr_01Q10D00D00D
-    1762,  // imageAtomicOr_01b10D00D00D
-    1764,  // imageAtomicOr_01G20D00D00D
-    1766,  // imageAtomicOr_01R20D00D00D
-    1768,  // imageAtomicOr_01c20D00D00D
-    1770,  // imageAtomicXor_00z10D00E
-    1772,  // imageAtomicXor_01K10D00E
-    1774,  // imageAtomicXor_01V10D00E
-    1776,  // imageAtomicXor_01A20D00E
-    1778,  // imageAtomicXor_01L20D00E
-    1780,  // imageAtomicXor_01W20D00E
-    1782,  // imageAtomicXor_01C20D00E
-    1784,  // imageAtomicXor_01N20D00E
-    1786,  // imageAtomicXor_01Y20D00E
-    1788,  // imageAtomicXor_01J00D00E
-    1790,  // imageAtomicXor_01U00D00E
-    1792,  // imageAtomicXor_01f00D00E
-    1794,  // imageAtomicXor_01B20D00E
-    1796,  // imageAtomicXor_01M20D00E
-    1798,  // imageAtomicXor_01X20D00E
-    1800,  // imageAtomicXor_01H20D00E
-    1802,  // imageAtomicXor_01S20D00E
-    1804,  // imageAtomicXor_01d20D00E
-    1806,  // imageAtomicXor_01D00D00E
-    1808,  // imageAtomicXor_01O00D00E
-    1810,  // imageAtomicXor_01Z00D00E
-    1812,  // imageAtomicXor_01E10D00E
-    1814,  // imageAtomicXor_01P10D00E
-    1816,  // imageAtomicXor_01a10D00E
-    1818,  // imageAtomicXor_01I10D00E
-    1820,  // imageAtomicXor_01T10D00E
-    1822,  // imageAtomicXor_01e10D00E
-    1824,  // imageAtomicXor_01F10D00D00E
-    1826,  // imageAtomicXor_01Q10D00D00E
-    1828,  // imageAtomicXor_01b10D00D00E
-    1830,  // imageAtomicXor_01G20D00D00E
-    1832,  // imageAtomicXor_01R20D00D00E
-    1834,  // imageAtomicXor_01c20D00D00E
-    1836,  // imageAtomicXor_00z10D00D
-    1838,  // imageAtomicXor_01K10D00D
-    1840,  // imageAtomicXor_01V10D00D
-    1842,  // imageAtomicXor_01A20D00D
-    1844,  // imageAtomicXor_01L20D00D
-    1846,  // imageAtomicXor_01W20D00D
-    1848,  // imageAtomicXor_01C20D00D
-    1850,  // imageAtomicXor_01N20D00D
-    1852,  // imageAtomicXor_01Y20D00D
-    1854,  // imageAtomicXor_01J00D00D
-    1856,  // imageAtomicXor_01U00D00D
-    1858,  // imageAtomicXor_01f00D00D
-    1860,  // imageAtomicXor_01B20D00D
-    1862,  // imageAtomicXor_01M20D00D
-    1864,  // imageAtomicXor_01X20D00D
-    1866,  // imageAtomicXor_01H20D00D
-    1868,  // imageAtomicXor_01S20D00D
-    1870,  // imageAtomicXor_01d20D00D
-    1872,  // imageAtomicXor_01D00D00D
-    1874,  // imageAtomicXor_01O00D00D
-    1876,  // imageAtomicXor_01Z00D00D
-    1878,  // imageAtomicXor_01E10D00D
-    1880,  // imageAtomicXor_01P10D00D
-    1882,  // imageAtomicXor_01a10D00D
-    1884,  // imageAtomicXor_01I10D00D
-    1886,  // imageAtomicXor_01T10D00D
-    1888,  // imageAtomicXor_01e10D00D
-    1890,  // imageAtomicXor_01F10D00D00D
-    1892,  // imageAtomicXor_01Q10D00D00D
-    1894,  // imageAtomicXor_01b10D00D00D
-    1896,  // imageAtomicXor_01G20D00D00D
-    1898,  // imageAtomicXor_01R20D00D00D
-    1900,  // imageAtomicXor_01c20D00D00D
-    1902,  // imageAtomicExchange_00z10D00E
-    1904,  // imageAtomicExchange_01K10D00E
-    1906,  // imageAtomicExchange_01V10D00E
-    1908,  // imageAtomicExchange_01A20D00E
-    1910,  // imageAtomicExchange_01L20D00E
-    1912,  // imageAtomicExchange_01W20D00E
-    1914,  // imageAtomicExchange_01C20D00E
-    1916,  // imageAtomicExchange_01N20D00E
-    1918,  // imageAtomicExchange_01Y20D00E
-    1920,  // imageAtomicExchange_01J00D00E
-    1922,  // imageAtomicExchange_01U00D00E
-    1924,  // imageAtomicExchange_01f00D00E
-    1926,  // imageAtomicExchange_01B20D00E
-    1928,  // imageAtomicExchange_01M20D00E
-    1930,  // imageAtomicExchange_01X20D00E
-    1932,  // imageAtomicExchange_01H20D00E
-    1934,  // imageAtomicExchange_01S20D00E
-    1936,  // imageAtomicExchange_01d20D00E
-    1938,  // imageAtomicExchange_01D00D00E
-    1940,  // imageAtomicExchange_01O00D00E
-    1942,  // imageAtomicExchange_01Z00D00E
-    1944,  // imageAtomicExchange_01E10D00E
-    1946,  // imageAtomicExchange_01P10D00E
-    1948,  // imageAtomicExchange_01a10D00E
-    1950,  // imageAtomicExchange_01I10D00E
-    1952,  // imageAtomicExchange_01T10D00E
-    1954,  // imageAtomicExchange_01e10D00E
-    1956,  // imageAtomicExchange_01F10D00D00E
-    1958,  // imageAtomicExchange_01Q10D00D00E
-    1960,  // imageAtomicExchange_01b10D00D00E
-    1962,  // imageAtomicExchange_01G20D00D00E
-    1964,  // imageAtomicExchange_01R20D00D00E
+    0,     // imageAtomicExchange_01O00D00E
+    2,     // imageAtomicAnd_01U00D00E
+    4,     // imageAtomicAdd_01P10D00D
+    6,     // textureGradOffset_00J20B20B20B20D
+    7,     // imageAtomicAnd_01T10D00D
+    9,     // texture_00K20B00B
+    10,    // imageAtomicCompSwap_01Y20D00E00E
+    12,    // bitCount_10D
+    13,    // imageAtomicCompSwap_01d20D00E00E
+    15,    // atomicAdd_00D00D
+    16,    // yuv_2_rgb_20B00H
+    17,    // dFdx_00B
+    19,    // intBitsToFloat_30D
+    20,    // imageAtomicExchange_01T10D00D
+    22,    // length_00B
+    23,    // greaterThan_30B30B
+    24,    // textureGather_00L20B00D
+    25,    // imageAtomicCompSwap_01b10D00D00D00D
+    27,    // gl_MaxVertexOutputVectors
+    28,    // uintBitsToFloat_30E
+    29,    // texture_00a20B00B
+    30,    // imageAtomicExchange_01W20D00E
+    32,    // textureProj_00M30B00B
+    33,    // floatBitsToUint_20B
+    34,    // findMSB_30E
+    35,    // not_10F
+    36,    // max_20E00E
+    37,    // fract_30B
+    38,    // imageAtomicExchange_01I10D00B
+    40,    // mix_30B30B30F
+    41,    // textureProj_00M30B
+    42,    // texture3D_00J20B
+    43,    // imageAtomicMax_01W20D00D
+    45,    // texture_00l30B00B
+    48,    // imageAtomicAdd_01V10D00D
+    50,    // equal_30B30B
+    51,    // textureProj_00X30B
+    52,    // imageAtomicExchange_01C20D00B
+    54,    // imageAtomicAdd_01c20D00D00E
+    56,    // imageAtomicMax_00z10D00D
+    58,    // sign_30D
+    59,    // textureLod_00J20B00B
+    60,    // imageAtomicExchange_01F10D00D00B
+    62,    // pixelLocalLoadANGLE_01g
+    63,    // imageAtomicCompSwap_01c20D00D00D00D
+    65,    // matrixCompMult_90B90B
+    66,    // textureGradOffset_00S20B20B20B20D
+    67,    // textureProjOffset_00Y30B20D00B
+    68,    // lessThanEqual_30B30B
+    69,    // imageAtomicAnd_01X20D00E
+    71,    // imageAtomicMax_01W20D00E
+    73,    // equal_10E10E
+    74,    // textureProj_00J30B00B
+    75,    // texture_00s30B
+    78,    // textureLod_00Y20B00B
+    79,    // imageAtomicMax_01a10D00E
+    81,    // gl_MaxCombinedTextureImageUnits
+    82,    // textureProj_00O30B
+    83,    // imageAtomicExchange_01Z00D00E
+    85,    // imageAtomicAnd_01J00D00D
+    87,    // textureSize_00R00D
+    88,    // max_10E00E
+    89,    // gl_BoundingBoxOES
+    92,    // imageAtomicAdd_01J00D00E
+    94,    // textureGather_00d10B00B
+    95,    // imageAtomicAnd_01I10D00D
+    97,    // gl_FragCoord
+    99,    // imageLoad_00z10D
+    100,   // imageAtomicCompSwap_01K10D00D00D
+    102,   // bitCount_30D
+    103,   // gl_CullDistance
+    105,   // imageAtomicMax_01I10D00E
+    107,   // imageAtomicXor_00z10D00D
+    109,   // textureProjGrad_00I20B10B10B
+    110,   // mod_20B20B
+    111,   // cos_00B
+    112,   // imageAtomicXor_01Q10D00D00D
+    114,   // textureGather_00e20B
+    115,   // findLSB_30D
+    116,   // findLSB_10E
+    117,   // gl_FrontFacing
+    118,   // bitCount_00E
+    119,   // min_30E30E
+    120,   // textureGatherOffset_00L20B10D
+    121,   // subpassLoad_01o00D
+    122,   // textureSize_00w
+    125,   // min_10B00B
+    126,   // gl_MaxDrawBuffers
+    127,   // gl_MaxGeometryAtomicCounters
+    130,   // imageAtomicExchange_01D00D00B
+    132,   // texelFetch_00a20D00D
+    133,   // step_20B20B
+    134,   // greaterThanEqual_20E20E
+    135,   // imageAtomicAdd_01G20D00D00E
+    137,   // umulExtended_00E00E00E00E
+    138,   // sinh_10B
+    139,   // intBitsToFloat_20D
+    140,   // abs_10B
+    141,   // isnan_20B
+    142,   // mix_00B00B00F
+    143,   // textureGather_00X10B00D
+    144,   // texture2DRectProj_00O20B
+    145,   // matrixCompMult_70B70B
+    146,   // textureGather_00e20B00B
+    147,   // acos_30B
+    148,   // texelFetch_00V10D00D
+    150,   // imageAtomicOr_01D00D00D
+    152,   // atomicXor_00E00E
+    153,   // textureSize_00Y00D
+    154,   // gl_MaxGeometryAtomicCounterBuffers
+    157,   // lessThanEqual_30E30E
+    158,   // textureOffset_00d20B10D00B
+    159,   // imageAtomicAdd_01L20D00D
+    161,   // imageAtomicCompSwap_01e10D00D00D
+    163,   // subpassLoad_01k
+    164,   // imageAtomicXor_01E10D00D
+    166,   // imageAtomicMin_01U00D00E
+    168,   // gl_MaxTessPatchComponents
+    171,   // abs_30B
+    172,   // imageAtomicExchange_01W20D00B
+    174,   // textureProj_00S30B
+    175,   // imageAtomicXor_01B20D00E
+    177,   // imageAtomicExchange_01B20D00D
+    179,   // imageAtomicMin_01A20D00E
+    181,   // imageAtomicOr_01E10D00E
+    183,   // smoothstep_00B00B30B
+    184,   // gl_Position
+    194,   // imageAtomicOr_01H20D00E
+    196,   // imageAtomicMax_01O00D00D
+    198,   // imageAtomicAnd_01Z00D00D
+    200,   // imageAtomicAdd_01e10D00E
+    202,   // textureLod_00I10B00B
+    203,   // imageAtomicOr_00z10D00D
+    205,   // texture_00Z20B
+    206,   // log_10B
+    207,   // imageAtomicMax_01b10D00D00E
+    209,   // imageAtomicCompSwap_01B20D00D00D
+    211,   // textureLod_00d20B00B
+    212,   // textureOffset_00U20B10D
+    213,   // imageAtomicXor_01N20D00E
+    215,   // imageAtomicExchange_01c20D00D00B
+    217,   // clamp_20D00D00D
+    218,   // gl_out
+    224,   // imageAtomicOr_01K10D00E
+    226,   // angle_BaseInstance
+    227,   // textureGather_00X10B
+    228,   // imageAtomicCompSwap_01T10D00E00E
+    230,   // imageAtomicAdd_01S20D00D
+    232,   // textureCubeGradEXT_00K20B20B20B
+    233,   // imageAtomicMin_01N20D00E
+    235,   // imageAtomicCompSwap_01W20D00E00E
+    237,   // textureGrad_00S20B20B20B
+    238,   // max_30D00D
+    239,   // imageAtomicMin_01J00D00E
+    241,   // imageAtomicMin_01K10D00D
+    243,   // mix_10B10B10F
+    244,   // imageAtomicAdd_00z10D00E
+    246,   // cos_20B
+    247,   // imageAtomicExchange_01P10D00E
+    249,   // imageAtomicMax_01f00D00E
+    251,   // texelFetch_00j00D
+    254,   // tanh_30B
+    255,   // imageAtomicExchange_01f00D00B
+    257,   // dFdy_30B
+    259,   // imageAtomicMin_01I10D00D
+    261,   // textureProj_00M20B00B
+    262,   // imageAtomicExchange_01G20D00D00B
+    264,   // memoryBarrier_
+    265,   // gl_FragData
+    266,   // textureSize_00Z00D
+    267,   // fma_30B30B30B
+    270,   // imageAtomicAdd_01C20D00E
+    272,   // normalize_20B
+    273,   // floatBitsToUint_00B
+    274,   // textureGather_00s30B00D
+    277,   // frexp_10B10D
+    278,   // usubBorrow_20E20E20E
+    279,   // textureGather_00k30B
+    282,   // notEqual_20F20F
+    283,   // interpolateAtOffset_10B10B
+    285,   // imageAtomicMin_01X20D00D
+    287,   // transpose_A0B
+    288,   // clamp_10B00B00B
+    289,   // textureProjGrad_00d30B10B10B
+    290,   // lessThanEqual_20D20D
+    291,   // gl_MaxTessGenLevel
+    294,   // imageAtomicExchange_01Z00D00B
+    296,   // gl_BoundingBoxEXT
+    299,   // min_30D00D
+    300,   // equal_20F20F
+    301,   // bitCount_10E
+    302,   // clamp_20E00E00E
+    303,   // radians_30B
+    304,   // imageAtomicOr_01I10D00D
+    306,   // texelFetch_00U20D00D
+    307,   // dFdy_20B
+    309,   // imageAtomicCompSwap_01Q10D00D00D00D
+    311,   // imageAtomicAnd_01X20D00D
+    313,   // imageAtomicMax_01K10D00D
+    315,   // textureProjOffset_00J30B20D
+    316,   // textureGather_00Z20B
+    317,   // max_10B00B
+    318,   // fwidth_30B
+    320,   // Empty
+    320,   // textureGather_00x30B
+    323,   // imageAtomicXor_01M20D00D
+    325,   // gl_LocalInvocationID
+    326,   // imageAtomicOr_01Y20D00E
+    328,   // imulExtended_10D10D10D10D
+    329,   // imageAtomicXor_01I10D00E
+    331,   // memoryBarrierImage_
+    332,   // transpose_60B
+    333,   // imageAtomicCompSwap_01U00D00D00D
+    335,   // textureGatherOffsets_00L20B10Dx4
+    338,   // acosh_30B
+    339,   // bitfieldReverse_20E
+    340,   // modf_10B10B
+    341,   // clamp_20D20D20D
+    342,   // imageAtomicMax_01d20D00D
+    344,   // fract_10B
+    345,   // imageAtomicCompSwap_01S20D00E00E
+    347,   // imageAtomicOr_01f00D00D
+    349,   // any_10F
+    350,   // mix_10E10E10F
+    351,   // textureOffset_00S20B20D
+    352,   // imageAtomicExchange_01I10D00E
+    354,   // atanh_10B
+    355,   // textureSize_00c
+    357,   // imageAtomicAnd_01L20D00D
+    359,   // texture_00a20B
+    360,   // packHalf2x16_10B
+    361,   // uaddCarry_30E30E30E
+    362,   // texelFetch_00X10D00D
+    363,   // textureSize_00Q
+    365,   // imageAtomicAdd_01W20D00E
+    367,   // imageAtomicCompSwap_01P10D00E00E
+    369,   // textureGather_00K20B00D
+    370,   // imageAtomicExchange_01V10D00B
+    372,   // imageAtomicXor_01f00D00D
+    374,   // greaterThan_10B10B
+    375,   // imageSize_01N
+    376,   // imageAtomicCompSwap_01N20D00E00E
+    378,   // gl_TessCoord
+    379,   // imageAtomicCompSwap_01f00D00E00E
+    381,   // textureGrad_00Y20B20B20B
+    382,   // degrees_10B
+    383,   // imageLoad_01d20D
+    386,   // gl_MaxClipDistances
+    389,   // mix_00F00F00F
+    390,   // imageAtomicMin_01E10D00E
+    392,   // texture_00x30B
+    395,   // imageAtomicAdd_01f00D00E
+    397,   // imageAtomicMin_01H20D00D
+    399,   // textureProjGrad_00X20B10B10B
+    400,   // texelFetch_00I10D00D
+    401,   // textureGather_00R10B00D
+    402,   // imageAtomicXor_01T10D00D
+    404,   // imageAtomicCompSwap_01U00D00E00E
+    406,   // mix_30B30B30B
+    407,   // textureLodOffset_00S20B00B20D
+    408,   // imageAtomicOr_01J00D00D
+    410,   // imageAtomicCompSwap_01N20D00D00D
+    412,   // smoothstep_00B00B00B
+    413,   // imageAtomicExchange_01R20D00D00B
+    415,   // max_00B00B
+    416,   // textureGradOffset_00X10B10B10B10D
+    417,   // imageAtomicMax_01e10D00E
+    419,   // imageAtomicMin_01D00D00E
+    421,   // refract_00B00B00B
+    422,   // atomicXor_00D00D
+    423,   // textureGatherOffset_00I10B10D00D
+    424,   // textureGatherOffsets_00a20B10Dx4
+    427,   // texture2DProjGradEXT_00I30B10B10B
+    428,   // imageAtomicExchange_01e10D00B
+    430,   // textureSize_00b
+    432,   // textureProj_00R30B00B
+    433,   // imageAtomicXor_01S20D00D
+    435,   // textureGatherOffsets_00I10B10Dx400D
+    438,   // texture_00X10B00B
+    439,   // atomicCounter_00G
+    440,   // imageAtomicMax_01S20D00E
+    442,   // texture2D_00I10B00B
+    443,   // imageAtomicAnd_01V10D00D
+    445,   // exp2_30B
+    446,   // gl_MaxGeometryUniformComponents
+    449,   // bitfieldInsert_10D10D00D00D
+    450,   // floor_10B
+    451,   // equal_30D30D
+    452,   // findMSB_30D
+    453,   // endInvocationInterlockNV_
+    454,   // imageAtomicExchange_01A20D00E
+    456,   // textureLod_00T20B00B
+    457,   // interpolateAtSample_00B00D
+    459,   // fwidth_00B
+    461,   // texelFetchOffset_00I10D00D10D
+    462,   // imageAtomicMax_01G20D00D00E
+    464,   // textureProj_00N30B
+    465,   // imageAtomicExchange_01f00D00E
+    467,   // imageAtomicOr_01B20D00D
+    469,   // imageAtomicMax_01H20D00E
+    471,   // lessThanEqual_10B10B
+    472,   // distance_30B30B
+    473,   // texture2DProj_00I30B00B
+    474,   // texture2DProjLodEXT_00I30B00B
+    475,   // textureProjLodOffset_00I20B00B10D
+    476,   // rgb_2_yuv_20B00H
+    477,   // atomicExchange_00D00D
+    478,   // texture_00T20B00B
+    479,   // imageLoad_01H20D
+    482,   // texture_00d20B
+    483,   // textureGather_00k30B00D
+    486,   // ceil_00B
+    487,   // imageAtomicXor_01F10D00D00D
+    489,   // textureLodOffset_00L20B00B10D
+    490,   // mix_20F20F20F
+    491,   // beginFragmentShaderOrderingINTEL_
+    492,   // step_30B30B
+    493,   // textureSize_00M00D
+    494,   // imageAtomicMin_01V10D00D
+    496,   // acos_10B
+    497,   // textureProj_00d30B00B
+    498,   // uintBitsToFloat_00E
+    499,   // imageAtomicMax_01E10D00D
+    501,   // gl_MaxCombinedAtomicCounterBuffers
+    502,   // umulExtended_30E30E30E30E
+    503,   // imageAtomicMax_01J00D00E
+    505,   // imageAtomicExchange_01J00D00E
+    507,   // log2_00B
+    508,   // imageStore_01f00D30E
+    511,   // texelFetch_00w00D
+    514,   // greaterThan_30E30E
+    515,   // gl_MaxGeometryOutputComponents
+    518,   // textureGrad_00X10B10B10B
+    519,   // imageAtomicCompSwap_01d20D00D00D
+    521,   // modf_30B30B
+    522,   // gl_MaxGeometryInputComponents
+    525,   // textureSize_00x00D
+    528,   // determinant_A0B
+    529,   // textureProjLod_00X30B00B
+    530,   // texture_00S20B00B
+    531,   // imageAtomicOr_01S20D00E
+    533,   // gl_VertexID
+    534,   // matrixCompMult_F0BF0B
+    535,   // imageAtomicOr_01R20D00D00E
+    537,   // asinh_10B
+    538,   // imageAtomicXor_01H20D00D
+    540,   // textureProjOffset_00I20B10D00B
+    541,   // gl_SampleID
+    543,   // interpolateAtOffset_30B10B
+    545,   // beginInvocationInterlockNV_
+    546,   // imageAtomicAnd_01K10D00D
+    548,   // textureProjLodOffset_00Y30B00B20D
+    549,   // textureGatherOffset_00d10B00B10D
+    550,   // exp2_10B
+    551,   // asinh_00B
+    552,   // imageAtomicExchange_01A20D00B
+    554,   // lessThan_20B20B
+    555,   // textureProjLodOffset_00d30B00B10D
+    556,   // imageAtomicMax_01R20D00D00E
+    558,   // max_00E00E
+    559,   // cosh_10B
+    560,   // gl_TessLevelOuter
+    566,   // imageAtomicAnd_01e10D00D
+    568,   // imageAtomicExchange_01E10D00D
+    570,   // textureGatherOffsets_00U20B10Dx400D
+    573,   // textureProj_00R30B
+    574,   // textureGather_00x30B00D
+    577,   // imageAtomicCompSwap_01O00D00E00E
+    579,   // textureGradOffset_00L20B10B10B10D
+    580,   // textureProjLodOffset_00R20B00B10D
+    581,   // textureProj_00S30B00B
+    582,   // imageSize_01W
+    583,   // max_20B20B
+    584,   // mod_10B10B
+    585,   // textureGrad_00x30B20B20B
+    588,   // imageAtomicMin_01b10D00D00E
+    590,   // imageAtomicMin_01e10D00D
+    592,   // sin_00B
+    593,   // imageAtomicXor_01N20D00D
+    595,   // imageAtomicXor_01J00D00E
+    597,   // imageAtomicMin_01B20D00D
+    599,   // bitfieldInsert_00D00D00D00D
+    600,   // imageAtomicXor_01F10D00D00E
+    602,   // subpassLoad_01j
+    603,   // imageAtomicCompSwap_01K10D00E00E
+    605,   // imageAtomicOr_01W20D00D
+    607,   // imageStore_01X20D30E
+    608,   // bitfieldInsert_20D20D00D00D
+    609,   // texture_00d20B00B
+    610,   // texture2DProj_00I20B
+    611,   // bitfieldReverse_30E
+    612,   // textureProj_00R20B
+    613,   // findLSB_10D
+    614,   // gl_MaxTessControlInputComponents
+    617,   // gl_InvocationID
+    623,   // textureVideoWEBGL_00y10B
+    624,   // imageAtomicAdd_01R20D00D00E
+    626,   // floatBitsToInt_30B
+    627,   // imageStore_01L20D30D
+    628,   // texture2D_00I10B
+    629,   // textureProjLodOffset_00R30B00B10D
+    630,   // texture3DLod_00J20B00B
+    631,   // sin_20B
+    632,   // trunc_20B
+    633,   // mix_20D20D20F
+    634,   // texture_00M10B
+    635,   // imageAtomicAnd_01F10D00D00D
+    637,   // imageAtomicMax_01a10D00D
+    639,   // imageAtomicAdd_01a10D00E
+    641,   // pow_10B10B
+    642,   // imageAtomicAdd_01Q10D00D00D
+    644,   // uintBitsToFloat_10E
+    645,   // imageAtomicOr_01N20D00D
+    647,   // imageAtomicXor_01A20D00D
+    649,   // imageAtomicMin_01B20D00E
+    651,   // samplePosition_00E
+    652,   // textureProj_00X20B00B
+    653,   // gl_FragDepthEXT
+    654,   // all_30F
+    655,   // imageAtomicMax_01S20D00D
+    657,   // Empty
+    657,   // imageAtomicMax_01Y20D00E
+    659,   // asin_20B
+    660,   // textureGatherOffset_00X10B10D
+    661,   // textureProjOffset_00R30B10D00B
+    662,   // textureLod_00x30B00B
+    665,   // refract_30B30B00B
+    666,   // imageAtomicAdd_01d20D00D
+    668,   // textureLodOffset_00U20B00B10D
+    669,   // tan_20B
+    670,   // imageAtomicMax_01I10D00D
+    672,   // imageAtomicExchange_01O00D00D
+    674,   // imageAtomicXor_01B20D00D
+    676,   // bitfieldReverse_10E
+    677,   // atanh_00B
+    678,   // textureLodOffset_00d20B00B10D
+    679,   // imageAtomicXor_01P10D00E
+    681,   // mix_10D10D10F
+    682,   // gl_SampleMaskIn
+    684,   // lessThan_10D10D
+    685,   // textureLodOffset_00R10B00B10D
+    686,   // atomicMax_00D00D
+    687,   // min_00E00E
+    688,   // textureProj_00N30B00B
+    689,   // imageAtomicCompSwap_01E10D00E00E
+    691,   // imageStore_01C20D30B
+    692,   // pixelLocalLoadANGLE_01i
+    693,   // abs_20D
+    694,   // texture2DProjGradEXT_00I20B10B10B
+    695,   // equal_10F10F
+    696,   // texelFetch_00R10D00D
+    697,   // faceforward_20B20B20B
+    698,   // imageAtomicAdd_01U00D00D
+    700,   // gl_GlobalInvocationID
+    701,   // mix_30E30E30F
+    702,   // gl_MaxVaryingVectors
+    703,   // imageAtomicExchange_00z10D00E
+    705,   // imageStore_01d20D30E
+    708,   // subpassLoad_01m00D
+    709,   // shadow2DEXT_00d20B
+    710,   // imageAtomicAnd_01I10D00E
+    712,   // textureGrad_00s30B20B20B
+    715,   // gl_LastFragData
+    718,   // clamp_30D30D30D
+    719,   // min_00B00B
+    720,   // texelFetch_00J20D00D
+    721,   // textureOffset_00I10B10D00B
+    722,   // sqrt_20B
+    723,   // imageAtomicOr_01A20D00D
+    725,   // texture2DProjLodEXT_00I20B00B
+    726,   // textureProjGradOffset_00I20B10B10B10D
+    727,   // imageSize_01J
+    730,   // mix_20E20E20F
+    731,   // sqrt_30B
+    732,   // imageAtomicOr_01b10D00D00D
+    734,   // textureGatherOffsets_00R10B10Dx400D
+    737,   // textureProjOffset_00d30B10D
+    738,   // texture_00y10B
+    739,   // mix_20B20B20B
+    740,   // pixelLocalLoadANGLE_01h
+    741,   // greaterThanEqual_30B30B
+    742,   // imageAtomicExchange_01S20D00D
+    744,   // imageAtomicAnd_00z10D00E
+    746,   // imageAtomicCompSwap_01f00D00D00D
+    748,   // imageAtomicExchange_01L20D00E
+    750,   // imageAtomicAnd_01b10D00D00E
+    752,   // imageLoad_01W20D
+    753,   // imageAtomicAdd_01Z00D00D
+    755,   // gl_BaseInstance
+    756,   // imageAtomicAnd_01H20D00D
+    758,   // textureProj_00Y30B00B
+    759,   // textureProjOffset_00X30B10D
+    760,   // imageAtomicXor_01J00D00D
+    762,   // clamp_00E00E00E
+    763,   // outerProduct_20B20B
+    764,   // imageAtomicCompSwap_01a10D00E00E
+    766,   // imageAtomicMax_00z10D00E
+    768,   // imageAtomicMin_01R20D00D00D
+    770,   // inversesqrt_10B
+    771,   // atan_20B
+    772,   // angle_BaseVertex
+    773,   // imageAtomicAdd_01O00D00D
+    775,   // bitfieldInsert_20E20E00D00D
+    776,   // log2_10B
+    777,   // textureGatherOffset_00R10B10D00D
+    778,   // imageAtomicAdd_01A20D00E
+    780,   // imageAtomicExchange_01c20D00D00D
+    782,   // any_30F
+    783,   // gl_DepthRangeParameters
+    784,   // imageAtomicAnd_01K10D00E
+    786,   // imageAtomicMin_01a10D00E
+    788,   // findMSB_10E
+    789,   // atan_20B20B
+    790,   // imageAtomicMax_01T10D00D
+    792,   // imageAtomicXor_01Y20D00E
+    794,   // interpolateAtSample_20B00D
+    796,   // imageAtomicAdd_01M20D00D
+    798,   // imageAtomicOr_01R20D00D00D
+    800,   // radians_10B
+    801,   // atanh_30B
+    802,   // gl_MaxGeometryTotalOutputComponents
+    805,   // imageAtomicMin_01Q10D00D00E
+    807,   // imageAtomicAnd_01V10D00E
+    809,   // max_30B00B
+    810,   // textureGrad_00L20B10B10B
+    811,   // notEqual_30F30F
+    812,   // exp_00B
+    813,   // textureGather_00R10B
+    814,   // texture_00J20B
+    815,   // atan_00B00B
+    816,   // gl_TessLevelInner
+    822,   // mix_20B20B20F
+    823,   // interpolateAtCentroid_10B
+    825,   // imageAtomicXor_01C20D00D
+    827,   // abs_00D
+    828,   // mix_20B20B00B
+    829,   // imageAtomicXor_01Y20D00D
+    831,   // bitfieldReverse_00D
+    832,   // imageAtomicExchange_01d20D00D
+    834,   // textureGradOffset_00Y20B20B20B20D
+    835,   // bitfieldExtract_30D00D00D
+    836,   // min_30B30B
+    837,   // imageAtomicExchange_01S20D00B
+    839,   // texture_00Y20B
+    840,   // texelFetch_00r00D
+    843,   // gl_FragDepth
+    844,   // textureGrad_00e30B20B20B
+    845,   // inversesqrt_20B
+    846,   // lessThan_30E30E
+    847,   // round_30B
+    848,   // imageAtomicExchange_01J00D00D
+    850,   // imageAtomicMax_01Z00D00E
+    852,   // bitCount_20D
+    853,   // textureGatherOffsets_00U20B10Dx4
+    856,   // reflect_30B30B
+    857,   // textureProjGrad_00Y30B20B20B
+    858,   // imageAtomicCompSwap_01D00D00D00D
+    860,   // imageAtomicCompSwap_01D00D00E00E
+    862,   // imageAtomicAnd_01Q10D00D00D
+    864,   // isnan_00B
+    865,   // imageAtomicOr_01c20D00D00E
+    867,   // equal_10B10B
+    868,   // imageAtomicCompSwap_01Q10D00D00E00E
+    870,   // imageAtomicAdd_01B20D00D
+    872,   // clamp_30E00E00E
+    873,   // textureProjOffset_00X20B10D00B
+    874,   // notEqual_10F10F
+    875,   // imageAtomicXor_01b10D00D00E
+    877,   // textureGather_00d10B
+    878,   // asinh_30B
+    879,   // inverse_A0B
+    880,   // lessThan_20E20E
+    881,   // textureProjGrad_00R20B10B10B
+    882,   // imageAtomicAnd_01c20D00D00E
+    884,   // findLSB_00D
+    885,   // interpolateAtCenter_00B
+    886,   // inversesqrt_00B
+    887,   // textureProj_00X20B
+    888,   // imageAtomicMax_01G20D00D00D
+    890,   // textureGather_00U20B
+    891,   // gl_LastFragColorARM
+    892,   // sinh_30B
+    893,   // step_10B10B
+    894,   // textureSize_00L00D
+    895,   // Empty
+    895,   // imageAtomicExchange_01G20D00D00E
+    897,   // textureProjGradOffset_00X20B10B10B10D
+    898,   // notEqual_30E30E
+    899,   // textureSize_00d00D
+    900,   // imageAtomicMax_01c20D00D00E
+    902,   // imageAtomicExchange_01Q10D00D00D
+    904,   // imageStore_01M20D30D
+    905,   // imageAtomicAdd_01b10D00D00E
+    907,   // imageAtomicExchange_01b10D00D00D
+    909,   // textureGather_00U20B00D
+    910,   // imageAtomicMin_01S20D00E
+    912,   // sign_10D
+    913,   // imulExtended_20D20D20D20D
+    914,   // bitfieldReverse_00E
+    915,   // imageAtomicMax_01F10D00D00D
+    917,   // log_30B
+    918,   // texelFetch_00M10D00D
+    919,   // clamp_10B10B10B
+    920,   // imageAtomicAdd_01f00D00D
+    922,   // imageAtomicMax_01X20D00D
+    924,   // textureOffset_00d20B10D
+    925,   // normalize_00B
+    926,   // imageAtomicAdd_01E10D00E
+    928,   // imageAtomicMin_01F10D00D00E
+    930,   // abs_30D
+    931,   // textureProjGradOffset_00R30B10B10B10D
+    932,   // imageAtomicMax_01U00D00D
+    934,   // gl_SamplePosition
+    936,   // gl_WorkGroupSize
+    937,   // gl_MinProgramTexelOffset
+    938,   // packSnorm4x8_30B
+    939,   // imageAtomicMax_01B20D00E
+    941,   // imageAtomicExchange_01F10D00D00E
+    943,   // cos_30B
+    944,   // imageAtomicXor_01K10D00D
+    946,   // imageAtomicXor_01a10D00E
+    948,   // imageAtomicMax_01f00D00D
+    950,   // imageAtomicMin_01C20D00D
+    952,   // textureProjOffset_00Y30B20D
+    953,   // imageAtomicExchange_01d20D00B
+    955,   // imageAtomicOr_01O00D00D
+    957,   // distance_00B00B
+    958,   // findMSB_10D
+    959,   // ceil_20B
+    960,   // imageAtomicXor_01G20D00D00E
+    962,   // memoryBarrierAtomicCounter_
+    963,   // min_20B00B
+    964,   // textureGrad_00K20B20B20B
+    965,   // max_10E10E
+    966,   // imageAtomicExchange_01C20D00E
+    968,   // sinh_00B
+    969,   // imageStore_01U00D30D
+    972,   // isinf_20B
+    973,   // imageAtomicMax_01L20D00E
+    975,   // gl_MaxTessEvaluationTextureImageUnits
+    978,   // imageLoad_01N20D
+    979,   // modf_00B00B
+    980,   // imageAtomicCompSwap_00z10D00E00E
+    982,   // min_30D30D
+    983,   // gl_LastFragColor
+    984,   // textureSize_00J00D
+    985,   // atomicCompSwap_00E00E00E
+    986,   // lessThanEqual_10D10D
+    987,   // roundEven_20B
+    988,   // textureCubeLod_00K20B00B
+    989,   // uaddCarry_20E20E20E
+    990,   // round_00B
+    991,   // imageAtomicMin_01D00D00D
+    993,   // imageAtomicAnd_01Z00D00E
+    995,   // imageAtomicOr_01D00D00E
+    997,   // refract_20B20B00B
+    998,   // textureProjOffset_00d30B10D00B
+    999,   // mod_20B00B
+    1000,  // notEqual_30B30B
+    1001,  // imageAtomicMin_01Z00D00E
+    1003,  // max_20E20E
+    1004,  // gl_MaxFragmentAtomicCounters
+    1005,  // lessThan_20D20D
+    1006,  // dFdx_30B
+    1008,  // texture_00U20B
+    1009,  // imageAtomicMax_01A20D00D
+    1011,  // mix_00E00E00F
+    1012,  // textureProj_00I30B
+    1013,  // texture_00O10B
+    1014,  // imageAtomicOr_01a10D00D
+    1016,  // bitfieldInsert_00E00E00D00D
+    1017,  // not_20F
+    1018,  // textureProjOffset_00I30B10D00B
+    1019,  // gl_MaxVertexTextureImageUnits
+    1020,  // texture_00J20B00B
+    1021,  // imageAtomicAnd_01G20D00D00E
+    1023,  // imageAtomicAdd_01R20D00D00D
+    1025,  // sign_20D
+    1026,  // interpolateAtCenter_10B
+    1027,  // imageAtomicMax_01F10D00D00E
+    1029,  // gl_MaxTextureImageUnits
+    1030,  // length_30B
+    1031,  // lessThanEqual_10E10E
+    1032,  // pow_20B20B
+    1033,  // transpose_B0B
+    1034,  // imageAtomicExchange_01O00D00B
+    1036,  // interpolateAtCentroid_00B
+    1038,  // gl_MaxTessControlImageUniforms
+    1041,  // textureProjGradOffset_00J30B20B20B20D
+    1042,  // min_30E00E
+    1043,  // texture2DLodEXT_00I10B00B
+    1044,  // outerProduct_20B10B
+    1045,  // texture2DProj_00I30B
+    1046,  // imageSize_01U
+    1049,  // isinf_10B
+    1050,  // imageAtomicOr_01K10D00D
+    1052,  // textureProjLod_00X20B00B
+    1053,  // textureProjOffset_00X30B10D00B
+    1054,  // imageAtomicAdd_01d20D00E
+    1056,  // textureGatherOffsets_00L20B10Dx400D
+    1059,  // textureProjLod_00I30B00B
+    1060,  // texelFetchOffset_00Y20D00D20D
+    1061,  // textureSize_00W
+    1063,  // imageAtomicAdd_01b10D00D00D
+    1065,  // imageAtomicMin_01f00D00D
+    1067,  // imageAtomicAnd_01J00D00E
+    1069,  // max_20D00D
+    1070,  // imageAtomicOr_01V10D00D
+    1072,  // textureProj_00M20B
+    1073,  // imageAtomicMin_01O00D00D
+    1075,  // gl_PointCoord
+    1076,  // not_30F
+    1077,  // unpackSnorm2x16_00E
+    1078,  // imageAtomicMax_01P10D00E
+    1080,  // textureProj_00J30B
+    1081,  // usubBorrow_00E00E00E
+    1082,  // imageAtomicMin_01c20D00D00D
+    1084,  // texture_00s30B00B
+    1087,  // gl_MaxGeometryImageUniforms
+    1090,  // imageAtomicExchange_01b10D00D00B
+    1092,  // imageAtomicAnd_01B20D00E
+    1094,  // pixelLocalStoreANGLE_01h30D
+    1095,  // imageAtomicExchange_01E10D00B
+    1097,  // imageAtomicAnd_01a10D00E
+    1099,  // imageAtomicAnd_01A20D00D
+    1101,  // interpolateAtSample_10B00D
+    1103,  // imageAtomicAdd_01J00D00D
+    1105,  // gl_MaxVertexUniformVectors
+    1106,  // imageAtomicCompSwap_01H20D00D00D
+    1108,  // imageAtomicExchange_01K10D00E
+    1110,  // imageAtomicExchange_00z10D00D
+    1112,  // imageAtomicAdd_01L20D00E
+    1114,  // imageAtomicCompSwap_01M20D00E00E
+    1116,  // imageAtomicCompSwap_01H20D00E00E
+    1118,  // imageAtomicAdd_01C20D00D
+    1120,  // textureProj_00N20B
+    1121,  // textureGrad_00Z20B20B20B
+    1122,  // imageAtomicCompSwap_01b10D00D00E00E
+    1124,  // imageAtomicAnd_01f00D00D
+    1126,  // atan_00B
+    1127,  // texture_00Y20B00B
+    1128,  // imageStore_01V10D30E
+    1129,  // gl_DrawID
+    1130,  // clamp_10E10E10E
+    1131,  // lessThan_30B30B
+    1132,  // imageAtomicXor_01U00D00E
+    1134,  // intBitsToFloat_00D
+    1135,  // textureLodOffset_00X10B00B10D
+    1136,  // floor_00B
+    1137,  // textureProjOffset_00I30B10D
+    1138,  // imageAtomicAdd_01D00D00E
+    1140,  // imageAtomicOr_01e10D00D
+    1142,  // imageAtomicOr_01A20D00E
+    1144,  // imageAtomicXor_01L20D00D
+    1146,  // greaterThan_30D30D
+    1147,  // trunc_00B
+    1148,  // imageAtomicXor_00z10D00E
+    1150,  // texture_00L20B
+    1151,  // imageAtomicOr_01L20D00D
+    1153,  // imageAtomicXor_01L20D00E
+    1155,  // imageAtomicMin_01Q10D00D00D
+    1157,  // imageSize_01B
+    1158,  // subpassLoad_01n00D
+    1159,  // textureProjLod_00d30B00B
+    1160,  // textureCube_00K20B00B
+    1161,  // degrees_00B
+    1162,  // imageAtomicExchange_01X20D00D
+    1164,  // imageAtomicOr_01Q10D00D00E
+    1166,  // greaterThanEqual_10D10D
+    1167,  // imageSize_01d
+    1170,  // imageAtomicExchange_01b10D00D00E
+    1172,  // usubBorrow_10E10E10E
+    1173,  // sqrt_10B
+    1174,  // imageAtomicMin_01L20D00E
+    1176,  // imageAtomicMin_01L20D00D
+    1178,  // texelFetch_00Y20D00D
+    1179,  // imulExtended_00D00D00D00D
+    1180,  // textureLod_00a20B00B
+    1181,  // atan_10B10B
+    1182,  // gl_MaxComputeImageUniforms
+    1183,  // any_20F
+    1184,  // imageAtomicMin_01W20D00D
+    1186,  // textureLod_00U20B00B
+    1187,  // clamp_30D00D00D
+    1188,  // imageAtomicAnd_01d20D00E
+    1190,  // pow_30B30B
+    1191,  // imageAtomicOr_01Z00D00E
+    1193,  // gl_MaxImageUnits
+    1194,  // imageAtomicAnd_01B20D00D
+    1196,  // endInvocationInterlockARB_
+    1197,  // gl_PatchVerticesIn
+    1203,  // imageAtomicAdd_01H20D00E
+    1205,  // imageAtomicMin_01P10D00D
+    1207,  // imageStore_01Y20D30E
+    1208,  // clamp_00B00B00B
+    1209,  // textureGatherOffset_00X10B10D00D
+    1210,  // imageAtomicExchange_01A20D00D
+    1212,  // imageAtomicAdd_01c20D00D00D
+    1214,  // interpolateAtOffset_20B10B
+    1216,  // isnan_30B
+    1217,  // findMSB_20E
+    1218,  // isnan_10B
+    1219,  // textureLod_00k30B00B
+    1222,  // mod_30B30B
+    1223,  // textureProjLod_00Y30B00B
+    1224,  // imageAtomicCompSwap_01V10D00D00D
+    1226,  // textureLod_00L20B00B
+    1227,  // textureProjOffset_00R30B10D
+    1228,  // abs_20B
+    1229,  // imageAtomicMin_01a10D00D
+    1231,  // gl_HelperInvocation
+    1232,  // imageAtomicMin_01b10D00D00D
+    1234,  // imageAtomicXor_01S20D00E
+    1236,  // min_20E00E
+    1237,  // atomicAdd_00E00E
+    1238,  // imageAtomicAdd_01I10D00E
+    1240,  // dFdx_20B
+    1242,  // texture_00e30B00B
+    1243,  // fma_20B20B20B
+    1246,  // gl_MaxCullDistances
+    1248,  // imageAtomicCompSwap_01C20D00E00E
+    1250,  // dFdy_00B
+    1252,  // textureSize_00j
+    1255,  // imageAtomicOr_01M20D00E
+    1257,  // textureProj_00O20B
+    1258,  // sign_00B
+    1259,  // imageAtomicOr_01U00D00D
+    1261,  // max_20B00B
+    1262,  // exp_10B
+    1263,  // imageAtomicAdd_01K10D00D
+    1265,  // imageAtomicExchange_01H20D00D
+    1267,  // length_20B
+    1268,  // memoryBarrierShared_
+    1269,  // pixelLocalStoreANGLE_01i30E
+    1270,  // textureGradOffset_00R10B10B10B10D
+    1271,  // gl_MaxAtomicCounterBufferSize
+    1272,  // imageStore_01H20D30B
+    1275,  // imageAtomicCompSwap_01F10D00D00E00E
+    1277,  // atan_30B
+    1278,  // fma_10B10B10B
+    1281,  // textureOffset_00a20B10D
+    1282,  // greaterThanEqual_20D20D
+    1283,  // gl_MaxCombinedShaderOutputResources
+    1284,  // imageAtomicCompSwap_01J00D00E00E
+    1286,  // imageAtomicExchange_00z10D00B
+    1288,  // imageAtomicAdd_01T10D00D
+    1290,  // exp2_20B
+    1291,  // textureProjLod_00J30B00B
+    1292,  // min_20E20E
+    1293,  // imageAtomicAdd_01a10D00D
+    1295,  // outerProduct_10B10B
+    1296,  // roundEven_00B
+    1297,  // max_10D10D
+    1298,  // acos_00B
+    1299,  // barrier_
+    1303,  // texture_00L20B00B
+    1304,  // equal_20B20B
+    1305,  // imageAtomicOr_01S20D00D
+    1307,  // dot_20B20B
+    1308,  // textureOffset_00X10B10D
+    1309,  // imageAtomicOr_01B20D00E
+    1311,  // imageAtomicExchange_01S20D00E
+    1313,  // notEqual_30D30D
+    1314,  // imageAtomicMin_01J00D00D
+    1316,  // normalize_30B
+    1317,  // imageAtomicOr_01Y20D00D
+    1319,  // textureGradOffset_00a20B10B10B10D
+    1320,  // imageAtomicMin_01K10D00E
+    1322,  // notEqual_10D10D
+    1323,  // outerProduct_10B30B
+    1324,  // textureOffset_00L20B10D
+    1325,  // imageAtomicOr_01J00D00E
+    1327,  // saturate_00B
+    1328,  // imageAtomicCompSwap_01P10D00D00D
+    1330,  // imageAtomicMax_01Y20D00D
+    1332,  // mix_30D30D30F
+    1333,  // imageAtomicXor_01e10D00D
+    1335,  // gl_MaxTessEvaluationUniformComponents
+    1338,  // notEqual_20B20B
+    1339,  // imageAtomicXor_01c20D00D00D
+    1341,  // imageAtomicOr_01M20D00D
+    1343,  // imageAtomicXor_01M20D00E
+    1345,  // imageAtomicExchange_01J00D00B
+    1347,  // umulExtended_20E20E20E20E
+    1348,  // tanh_10B
+    1349,  // imageAtomicExchange_01K10D00D
+    1351,  // reflect_20B20B
+    1352,  // imageAtomicXor_01D00D00D
+    1354,  // greaterThan_10D10D
+    1355,  // imageAtomicAnd_01P10D00E
+    1357,  // lessThan_30D30D
+    1358,  // imageAtomicOr_01G20D00D00E
+    1360,  // imageAtomicMax_01J00D00D
+    1362,  // imageAtomicXor_01V10D00E
+    1364,  // imageAtomicExchange_01X20D00B
+    1366,  // gl_LocalInvocationIndex
+    1367,  // texture_00Z20B00B
+    1368,  // imageAtomicMin_01C20D00E
+    1370,  // textureSize_00e00D
+    1371,  // memoryBarrierBuffer_
+    1372,  // min_20D20D
+    1373,  // equal_30E30E
+    1374,  // imageAtomicXor_01X20D00E
+    1376,  // gl_PrimitiveIDIn
+    1379,  // bitfieldReverse_30D
+    1380,  // matrixCompMult_60B60B
+    1381,  // atanh_20B
+    1382,  // imageAtomicAnd_01b10D00D00D
+    1384,  // textureGather_00I10B00D
+    1385,  // imageAtomicExchange_01U00D00E
+    1387,  // textureGatherOffset_00a20B10D00D
+    1388,  // greaterThanEqual_10E10E
+    1389,  // imageAtomicCompSwap_01X20D00D00D
+    1391,  // atomicAnd_00E00E
+    1392,  // imageAtomicXor_01U00D00D
+    1394,  // imageStore_00z10D30B
+    1395,  // max_30B30B
+    1396,  // texelFetch_00c20D00D
+    1398,  // imageAtomicCompSwap_01R20D00D00E00E
+    1400,  // gl_FragColor
+    1401,  // clamp_20E20E20E
+    1402,  // imageAtomicMin_01P10D00E
+    1404,  // gl_MaxComputeUniformComponents
+    1405,  // isinf_30B
+    1406,  // imageAtomicExchange_01U00D00D
+    1408,  // imageAtomicOr_01C20D00E
+    1410,  // textureProjOffset_00I20B10D
+    1411,  // imageSize_01K
+    1412,  // imageAtomicAdd_01Y20D00D
+    1414,  // textureGrad_00T20B20B20B
+    1415,  // imageSize_01f
+    1418,  // imageAtomicMin_01M20D00E
+    1420,  // imageLoad_01X20D
+    1421,  // imageAtomicAnd_01E10D00E
+    1423,  // interpolateAtSample_30B00D
+    1425,  // atomicMin_00D00D
+    1426,  // textureProjGrad_00R30B10B10B
+    1427,  // cosh_20B
+    1428,  // faceforward_30B30B30B
+    1429,  // cos_10B
+    1430,  // texelFetch_00Q20D00D
+    1432,  // bitCount_00D
+    1433,  // bitfieldReverse_20D
+    1434,  // imageAtomicCompSwap_01L20D00D00D
+    1436,  // imageAtomicExchange_01E10D00E
+    1438,  // gl_MaxTessControlAtomicCounters
+    1441,  // max_30D30D
+    1442,  // dot_30B30B
+    1443,  // imageAtomicMax_01Q10D00D00D
+    1445,  // imageAtomicMin_01Z00D00D
+    1447,  // imageAtomicAnd_01C20D00E
+    1449,  // imageAtomicExchange_01L20D00B
+    1451,  // radians_20B
+    1452,  // sign_00D
+    1453,  // textureSize_00s00D
+    1456,  // min_10E10E
+    1457,  // imageAtomicAnd_01M20D00D
+    1459,  // imageAtomicMax_01b10D00D00D
+    1461,  // max_10B10B
+    1462,  // imageStore_01N20D30D
+    1463,  // min_00D00D
+    1464,  // imageAtomicExchange_01Z00D00D
+    1466,  // outerProduct_30B10B
+    1467,  // atomicMin_00E00E
+    1468,  // imageAtomicExchange_01R20D00D00E
+    1470,  // bitfieldInsert_30E30E00D00D
+    1471,  // ldexp_30B30D
+    1472,  // saturate_10B
+    1473,  // imageAtomicMin_01H20D00E
+    1475,  // texelFetchOffset_00J20D00D20D
+    1476,  // asin_10B
+    1477,  // textureSize_00U00D
+    1478,  // gl_MaxVertexAtomicCounters
+    1479,  // imageAtomicCompSwap_01Y20D00D00D
+    1481,  // textureOffset_00a20B10D00B
+    1482,  // smoothstep_00B00B10B
+    1483,  // imageAtomicCompSwap_01G20D00D00E00E
+    1485,  // textureProjGradOffset_00R20B10B10B10D
+    1486,  // imageAtomicMin_01W20D00E
+    1488,  // imageAtomicAdd_01X20D00D
+    1490,  // imageLoad_01K10D
+    1491,  // gl_MaxTessControlUniformComponents
+    1494,  // gl_MaxTessControlOutputComponents
+    1497,  // asinh_20B
+    1498,  // textureGradOffset_00d20B10B10B10D
+    1499,  // texelFetch_00b10D00D
+    1501,  // sign_10B
+    1502,  // imageAtomicExchange_01M20D00B
+    1504,  // min_10D00D
+    1505,  // imageAtomicExchange_01a10D00B
+    1507,  // gl_MaxGeometryTextureImageUnits
+    1510,  // imageAtomicExchange_01a10D00E
+    1512,  // imageAtomicAdd_01N20D00D
+    1514,  // imageAtomicExchange_01X20D00E
+    1516,  // textureGather_00f20B
+    1517,  // imageAtomicOr_01d20D00E
+    1519,  // textureProjGradOffset_00X30B10B10B10D
+    1520,  // imageSize_01M
+    1521,  // textureSize_00f00D
+    1522,  // gl_MaxCombinedAtomicCounters
+    1523,  // imageAtomicMax_01d20D00E
+    1525,  // textureSize_00T00D
+    1526,  // greaterThan_20B20B
+    1527,  // imageAtomicMax_01X20D00E
+    1529,  // textureOffset_00J20B20D
+    1530,  // imageAtomicMax_01M20D00E
+    1532,  // gl_MaxProgramTexelOffset
+    1533,  // gl_PerVertex
+    1542,  // textureGatherOffset_00I10B10D
+    1543,  // sign_30B
+    1544,  // imageAtomicExchange_01N20D00E
+    1546,  // tan_10B
+    1547,  // gl_MaxTessControlAtomicCounterBuffers
+    1550,  // imageStore_01B20D30B
+    1551,  // imageAtomicMin_01R20D00D00E
+    1553,  // findLSB_00E
+    1554,  // numSamples_
+    1555,  // imageAtomicExchange_01L20D00D
+    1557,  // smoothstep_20B20B20B
+    1558,  // imageAtomicOr_01f00D00E
+    1560,  // textureOffset_00U20B10D00B
+    1561,  // ldexp_20B20D
+    1562,  // imageAtomicExchange_01T10D00E
+    1564,  // imageAtomicAnd_01P10D00D
+    1566,  // cosh_00B
+    1567,  // max_20D20D
+    1568,  // texelFetch_00P10D00D
+    1570,  // imageAtomicMin_01T10D00D
+    1572,  // imageAtomicAdd_01G20D00D00D
+    1574,  // imageAtomicMax_01V10D00E
+    1576,  // interpolateAtCentroid_30B
+    1578,  // imageAtomicXor_01R20D00D00E
+    1580,  // greaterThan_20E20E
+    1581,  // texture_00K20B
+    1582,  // tan_00B
+    1583,  // modf_20B20B
+    1584,  // imageAtomicExchange_01U00D00B
+    1586,  // inverse_F0B
+    1587,  // lessThanEqual_20E20E
+    1588,  // textureProjLod_00I20B00B
+    1589,  // dot_00B00B
+    1590,  // imageSize_01H
+    1593,  // uintBitsToFloat_20E
+    1594,  // texture_00S20B
+    1595,  // faceforward_10B10B10B
+    1596,  // texture2DRectProj_00O30B
+    1597,  // texture3DProjLod_00J30B00B
+    1598,  // textureSize_00P
+    1600,  // imageAtomicMax_01c20D00D00D
+    1602,  // all_20F
+    1603,  // atomicExchange_00E00E
+    1604,  // unpackUnorm4x8_00E
+    1605,  // imageAtomicXor_01Z00D00D
+    1607,  // matrixCompMult_B0BB0B
+    1608,  // textureGatherOffsets_00d10B00B10Dx4
+    1611,  // imageAtomicExchange_01V10D00E
+    1613,  // gl_SampleMask
+    1615,  // textureSize_00l00D
+    1618,  // dot_10B10B
+    1619,  // lessThan_10E10E
+    1620,  // imageAtomicMin_01G20D00D00D
+    1622,  // textureProjLodOffset_00X30B00B10D
+    1623,  // textureSize_00K00D
+    1624,  // gl_PrimitiveID
+    1636,  // imageAtomicCompSwap_01e10D00E00E
+    1638,  // imageAtomicMax_01O00D00E
+    1640,  // textureProj_00I30B00B
+    1641,  // gl_MaxTessEvaluationOutputComponents
+    1644,  // imageAtomicExchange_01R20D00D00D
+    1646,  // abs_10D
+    1647,  // imageAtomicAnd_01R20D00D00D
+    1649,  // imageSize_00z
+    1650,  // imageAtomicCompSwap_01R20D00D00D00D
+    1652,  // imageAtomicAnd_01d20D00D
+    1654,  // uaddCarry_10E10E10E
+    1655,  // imageAtomicAdd_01E10D00D
+    1657,  // trunc_10B
+    1658,  // imageAtomicAnd_01D00D00E
+    1660,  // matrixCompMult_E0BE0B
+    1661,  // imageAtomicAdd_01O00D00E
+    1663,  // gl_MaxFragmentInputVectors
+    1664,  // equal_30F30F
+    1665,  // textureSize_00V
+    1667,  // max_30E30E
+    1668,  // smoothstep_10B10B10B
+    1669,  // findLSB_20E
+    1670,  // notEqual_20E20E
+    1671,  // imageAtomicMax_01E10D00E
+    1673,  // imageAtomicCompSwap_01M20D00D00D
+    1675,  // imageLoad_01C20D
+    1676,  // mix_10F10F10F
+    1677,  // textureGatherOffset_00U20B10D00D
+    1678,  // textureGrad_00a20B10B10B
+    1679,  // imageLoad_01M20D
+    1680,  // fwidth_20B
+    1682,  // imageAtomicXor_01D00D00E
+    1684,  // textureGatherOffsets_00X10B10Dx4
+    1687,  // imageAtomicMin_01A20D00D
+    1689,  // texelFetchOffset_00R10D00D10D
+    1690,  // faceforward_00B00B00B
+    1691,  // textureGrad_00R10B10B10B
+    1692,  // findLSB_30E
+    1693,  // floatBitsToUint_10B
+    1694,  // imageAtomicCompSwap_01O00D00D00D
+    1696,  // exp2_00B
+    1697,  // tanh_00B
+    1698,  // imageAtomicMin_01f00D00E
+    1700,  // lessThanEqual_20B20B
+    1701,  // imageLoad_01B20D
+    1702,  // textureLod_00s30B00B
+    1705,  // textureGrad_00I10B10B10B
+    1706,  // gl_MaxTessEvaluationAtomicCounters
+    1709,  // gl_ClipDistance
+    1712,  // imageAtomicAnd_01H20D00E
+    1714,  // texture2DRect_00O10B
+    1715,  // gl_in
+    1724,  // isinf_00B
+    1725,  // textureGrad_00f30B10B10B
+    1726,  // findMSB_00E
+    1727,  // imageAtomicMin_01Y20D00E
+    1729,  // floatBitsToInt_10B
+    1730,  // imageAtomicAnd_01L20D00E
+    1732,  // imageAtomicMin_01e10D00E
+    1734,  // imageAtomicCompSwap_01V10D00E00E
+    1736,  // unpackUnorm2x16_00E
+    1737,  // roundEven_30B
+    1738,  // imageAtomicAnd_01Q10D00D00E
+    1740,  // imageAtomicAnd_01M20D00E
+    1742,  // imageAtomicMin_01O00D00E
+    1744,  // imageAtomicAdd_01V10D00E
+    1746,  // textureCube_00K20B
+    1747,  // textureGrad_00U20B10B10B
+    1748,  // imageSize_01A
+    1749,  // imageAtomicExchange_01V10D00D
+    1751,  // texture2DLod_00I10B00B
+    1752,  // textureProj_00N20B00B
+    1753,  // imageSize_01C
+    1754,  // imageAtomicMin_01T10D00E
+    1756,  // imageAtomicXor_01E10D00E
+    1758,  // textureProj_00X30B00B
+    1759,  // gl_MaxVertexAtomicCounterBuffers
+    1760,  // imageAtomicOr_01F10D00D00D
+    1762,  // imageAtomicOr_01C20D00D
+    1764,  // imageAtomicAnd_00z10D00D
+    1766,  // min_10B10B
+    1767,  // textureProjOffset_00J30B20D00B
+    1768,  // imageAtomicAdd_01F10D00D00E
+    1770,  // imageAtomicOr_01W20D00E
+    1772,  // imageLoad_01V10D
+    1773,  // textureProj_00d30B
+    1774,  // sin_10B
+    1775,  // textureGrad_00k30B20B20B
+    1778,  // imageAtomicExchange_01I10D00D
+    1780,  // imageAtomicCompSwap_01a10D00D00D
+    1782,  // textureOffset_00Y20B20D
+    1783,  // textureOffset_00R10B10D00B
+    1784,  // bitfieldExtract_10D00D00D
+    1785,  // textureProjGrad_00S30B20B20B
+    1786,  // gl_ViewID_OVR
+    1787,  // equal_20D20D
+    1788,  // imageLoad_01L20D
+    1789,  // degrees_30B
+    1790,  // imageAtomicExchange_01d20D00E
+    1792,  // ldexp_00B00D
+    1793,  // imageAtomicExchange_01G20D00D00D
+    1795,  // gl_MaxTessControlTotalOutputComponents
+    1798,  // trunc_30B
+    1799,  // imageAtomicExchange_01M20D00E
+    1801,  // imageAtomicXor_01P10D00D
+    1803,  // texelFetch_00L20D00D
+    1804,  // imageAtomicMax_01C20D00E
+    1806,  // gl_MaxComputeAtomicCounters
+    1807,  // bitfieldExtract_10E00D00D
+    1808,  // imageAtomicOr_01V10D00E
+    1810,  // imageAtomicCompSwap_01W20D00D00D
+    1812,  // imageAtomicExchange_01Y20D00B
+    1814,  // imageAtomicMin_01d20D00E
+    1816,  // imageAtomicMin_01M20D00D
+    1818,  // imageAtomicCompSwap_01A20D00E00E
+    1820,  // imageAtomicExchange_01W20D00D
+    1822,  // asin_00B
+    1823,  // saturate_30B
+    1824,  // gl_MaxComputeWorkGroupCount
+    1825,  // packSnorm2x16_10B
+    1826,  // imageStore_01W20D30E
+    1827,  // imageAtomicAnd_01S20D00D
+    1829,  // acosh_20B
+    1830,  // imageAtomicMin_01G20D00D00E
+    1832,  // gl_MaxFragmentAtomicCounterBuffers
+    1833,  // imageAtomicExchange_01H20D00B
+    1835,  // imageAtomicMin_01N20D00D
+    1837,  // imageAtomicOr_01T10D00D
+    1839,  // imageAtomicMin_01U00D00D
+    1841,  // imageAtomicCompSwap_01G20D00D00D00D
+    1843,  // imageAtomicAdd_01B20D00E
+    1845,  // fract_00B
+    1846,  // textureSize_00k00D
+    1849,  // imageLoad_01A20D
+    1850,  // packUnorm2x16_10B
+    1851,  // imageAtomicOr_01I10D00E
+    1853,  // textureOffset_00I10B10D
+    1854,  // frexp_20B20D
+    1855,  // gl_NumSamples
+    1857,  // atan_30B30B
+    1858,  // imageAtomicAnd_01e10D00E
+    1860,  // imageAtomicAnd_01Y20D00D
+    1862,  // textureOffset_00Y20B20D00B
+    1863,  // bitfieldInsert_10E10E00D00D
+    1864,  // bitfieldExtract_00D00D00D
+    1865,  // degrees_20B
+    1866,  // imageAtomicAnd_01Y20D00E
+    1868,  // shadow2DProjEXT_00d30B
+    1869,  // texture_00N10B
+    1870,  // imageAtomicAdd_01X20D00E
+    1872,  // imageAtomicExchange_01N20D00B
+    1874,  // imageAtomicAdd_00z10D00D
+    1876,  // outerProduct_30B20B
+    1877,  // imageAtomicOr_01b10D00D00E
+    1879,  // mod_00B00B
+    1880,  // outerProduct_30B30B
+    1881,  // acosh_10B
+    1882,  // imageAtomicMax_01Z00D00D
+    1884,  // imageAtomicMax_01H20D00D
+    1886,  // imageAtomicXor_01d20D00D
+    1888,  // fract_20B
+    1889,  // interpolateAtCentroid_20B
+    1891,  // texture_00X10B
+    1892,  // imageAtomicMax_01A20D00E
+    1894,  // textureGradOffset_00U20B10B10B10D
+    1895,  // imageAtomicAnd_01c20D00D00D
+    1897,  // outerProduct_20B30B
+    1898,  // greaterThanEqual_10B10B
+    1899,  // asin_30B
+    1900,  // imageAtomicOr_01Q10D00D00D
+    1902,  // textureProj_00Y30B
+    1903,  // imageAtomicOr_01L20D00E
+    1905,  // inversesqrt_30B
+    1906,  // dFdy_10B
+    1908,  // notEqual_20D20D
+    1909,  // sign_20B
+    1910,  // frexp_00B00D
+    1911,  // texture_00f30B
+    1912,  // texelFetchOffset_00L20D00D10D
+    1913,  // imageAtomicExchange_01P10D00B
+    1915,  // imageLoad_01f00D
+    1918,  // gl_WorkGroupID
+    1919,  // inverse_50B
+    1920,  // imageAtomicCompSwap_01F10D00D00D00D
+    1922,  // floor_20B
+    1923,  // transpose_90B
+    1924,  // mix_00B00B00B
+    1925,  // texture_00k30B
+    1928,  // imageAtomicMax_01V10D00D
+    1930,  // imageAtomicAdd_01Y20D00E
+    1932,  // usubBorrow_30E30E30E
+    1933,  // imageAtomicMax_01K10D00E
+    1935,  // textureGather_00L20B
+    1936,  // unpackSnorm4x8_00E
+    1937,  // findLSB_20D
+    1938,  // imageAtomicXor_01O00D00D
+    1940,  // roundEven_10B
+    1941,  // max_00D00D
+    1942,  // imageAtomicMin_01E10D00D
+    1944,  // textureLodOffset_00I10B00B10D
+    1945,  // textureProjGradOffset_00Y30B20B20B20D
+    1946,  // tanh_20B
+    1947,  // imageAtomicXor_01f00D00E
+    1949,  // textureProjGradOffset_00d30B10B10B10D
+    1950,  // imageAtomicAdd_01Q10D00D00E
+    1952,  // texelFetch_00N10D00D
+    1953,  // texture2DProj_00M30B
+    1955,  // greaterThanEqual_30D30D
+    1956,  // texelFetch_00S20D00D
+    1957,  // texture_00e30B
+    1958,  // mod_10B00B
+    1959,  // texelFetchOffset_00a20D00D10D
+    1960,  // atomicCounterIncrement_00G
+    1961,  // imageAtomicXor_01b10D00D00D
+    1963,  // gl_InstanceID
+    1964,  // imageAtomicExchange_01F10D00D00D
     1966,  // imageAtomicExchange_01c20D00D00E
-    1968,  // imageAtomicExchange_00z10D00D
-    1970,  // imageAtomicExchange_01K10D00D
-    1972,  // imageAtomicExchange_01V10D00D
-    1974,  // imageAtomicExchange_01A20D00D
-    1976,  // imageAtomicExchange_01L20D00D
-    1978,  // imageAtomicExchange_01W20D00D
-    1980,  // imageAtomicExchange_01C20D00D
-    1982,  // imageAtomicExchange_01N20D00D
-    1984,  // imageAtomicExchange_01Y20D00D
-    1986,  // imageAtomicExchange_01J00D00D
-    1988,  // imageAtomicExchange_01U00D00D
-    1990,  // imageAtomicExchange_01f00D00D
-    1992,  // imageAtomicExchange_01B20D00D
-    1994,  // imageAtomicExchange_01M20D00D
-    1996,  // imageAtomicExchange_01X20D00D
-    1998,  // imageAtomicExchange_01H20D00D
-    2000,  // imageAtomicExchange_01S20D00D
-    2002,  // imageAtomicExchange_01d20D00D
-    2004,  // imageAtomicExchange_01D00D00D
-    2006,  // imageAtomicExchange_01O00D00D
-    2008,  // imageAtomicExchange_01Z00D00D
-    2010,  // imageAtomicExchange_01E10D00D
-    2012,  // imageAtomicExchange_01P10D00D
-    2014,  // imageAtomicExchange_01a10D00D
-    2016,  // imageAtomicExchange_01I10D00D
-    2018,  // imageAtomicExchange_01T10D00D
-    2020,  // imageAtomicExchange_01e10D00D
-    2022,  // imageAtomicExchange_01F10D00D00D
-    2024,  // imageAtomicExchange_01Q10D00D00D
-    2026,  // imageAtomicExchange_01b10D00D00D
-    2028,  // imageAtomicExchange_01G20D00D00D
-    2030,  // imageAtomicExchange_01R20D00D00D
-    2032,  // imageAtomicExchange_01c20D00D00D
-    2034,  // imageAtomicExchange_00z10D00B
-    2036,  // imageAtomicExchange_01K10D00B
-    2038,  // imageAtomicExchange_01V10D00B
-    2040,  // imageAtomicExchange_01A20D00B
-    2042,  // imageAtomicExchange_01L20D00B
-    2044,  // imageAtomicExchange_01W20D00B
-    2046,  // imageAtomicExchange_01C20D00B
-    2048,  // imageAtomicExchange_01N20D00B
-    2050,  // imageAtomicExchange_01Y20D00B
-    2052,  // imageAtomicExchange_01J00D00B
-    2054,  // imageAtomicExchange_01U00D00B
-    2056,  // imageAtomicExchange_01f00D00B
-    2058,  // imageAtomicExchange_01B20D00B
-    2060,  // imageAtomicExchange_01M20D00B
-    2062,  // imageAtomicExchange_01X20D00B
-    2064,  // imageAtomicExchange_01H20D00B
-    2066,  // imageAtomicExchange_01S20D00B
-    2068,  // imageAtomicExchange_01d20D00B
-    2070,  // imageAtomicExchange_01D00D00B
-    2072,  // imageAtomicExchange_01O00D00B
-    2074,  // imageAtomicExchange_01Z00D00B
-    2076,  // imageAtomicExchange_01E10D00B
-    2078,  // imageAtomicExchange_01P10D00B
-    2080,  // imageAtomicExchange_01a10D00B
-    2082,  // imageAtomicExchange_01I10D00B
-    2084,  // imageAtomicExchange_01T10D00B
-    2086,  // imageAtomicExchange_01e10D00B
-    2088,  // imageAtomicExchange_01F10D00D00B
-    2090,  // imageAtomicExchange_01Q10D00D00B
-    2092,  // imageAtomicExchange_01b10D00D00B
-    2094,  // imageAtomicExchange_01G20D00D00B
-    2096,  // imageAtomicExchange_01R20D00D00B
-    2098,  // imageAtomicExchange_01c20D00D00B
-    2100,  // imageAtomicCompSwap_00z10D00E00E
-    2102,  // imageAtomicCompSwap_01K10D00E00E
-    2104,  // imageAtomicCompSwap_01V10D00E00E
-    2106,  // imageAtomicCompSwap_01A20D00E00E
-    2108,  // imageAtomicCompSwap_01L20D00E00E
-    2110,  // imageAtomicCompSwap_01W20D00E00E
-    2112,  // imageAtomicCompSwap_01C20D00E00E
-    2114,  // imageAtomicCompSwap_01N20D00E00E
-    2116,  // imageAtomicCompSwap_01Y20D00E00E
-    2118,  // imageAtomicCompSwap_01J00D00E00E
-    2120,  // imageAtomicCompSwap_01U00D00E00E
-    2122,  // imageAtomicCompSwap_01f00D00E00E
-    2124,  // imageAtomicCompSwap_01B20D00E00E
-    2126,  // imageAtomicCompSwap_01M20D00E00E
-    2128,  // imageAtomicCompSwap_01X20D00E00E
-    2130,  // imageAtomicCompSwap_01H20D00E00E
-    2132,  // imageAtomicCompSwap_01S20D00E00E
-    2134,  // imageAtomicCompSwap_01d20D00E00E
-    2136,  // imageAtomicCompSwap_01D00D00E00E
-    2138,  // imageAtomicCompSwap_01O00D00E00E
-    2140,  // imageAtomicCompSwap_01Z00D00E00E
-    2142,  // imageAtomicCompSwap_01E10D00E00E
-    2144,  // imageAtomicCompSwap_01P10D00E00E
-    2146,  // imageAtomicCompSwap_01a10D00E00E
-    2148,  // imageAtomicCompSwap_01I10D00E00E
-    2150,  // imageAtomicCompSwap_01T10D00E00E
-    2152,  // imageAtomicCompSwap_01e10D00E00E
-    2154,  // imageAtomicCompSwap_01F10D00D00E00E
-    2156,  // imageAtomicCompSwap_01Q10D00D00E00E
-    2158,  // imageAtomicCompSwap_01b10D00D00E00E
-    2160,  // imageAtomicCompSwap_01G20D00D00E00E
-    2162,  // imageAtomicCompSwap_01R20D00D00E00E
-    2164,  // imageAtomicCompSwap_01c20D00D00E00E
-    2166,  // imageAtomicCompSwap_00z10D00D00D
-    2168,  // imageAtomicCompSwap_01K10D00D00D
-    2170,  // imageAtomicCompSwap_01V10D00D00D
-    2172,  // imageAtomicCompSwap_01A20D00D00D
-    2174,  // imageAtomicCompSwap_01L20D00D00D
-    2176,  // imageAtomicCompSwap_01W20D00D00D
-    2178,  // imageAtomicCompSwap_01C20D00D00D
-    2180,  // imageAtomicCompSwap_01N20D00D00D
-    2182,  // imageAtomicCompSwap_01Y20D00D00D
-    2184,  // imageAtomicCompSwap_01J00D00D00D
-    2186,  // imageAtomicCompSwap_01U00D00D00D
-    2188,  // imageAtomicCompSwap_01f00D00D00D
-    2190,  // imageAtomicCompSwap_01B20D00D00D
-    2192,  // imageAtomicCompSwap_01M20D00D00D
-    2194,  // imageAtomicCompSwap_01X20D00D00D
-    2196,  // imageAtomicCompSwap_01H20D00D00D
-    2198,  // imageAtomicCompSwap_01S20D00D00D
-    2200,  // imageAtomicCompSwap_01d20D00D00D
-    2202,  // imageAtomicCompSwap_01D00D00D00D
-    2204,  // imageAtomicCompSwap_01O00D00D00D
-    2206,  // imageAtomicCompSwap_01Z00D00D00D
-    2208,  // imageAtomicCompSwap_01E10D00D00D
-    2210,  // imageAtomicCompSwap_01P10D00D00D
-    2212,  // imageAtomicCompSwap_01a10D00D00D
-    2214,  // imageAtomicCompSwap_01I10D00D00D
-    2216,  // imageAtomicCompSwap_01T10D00D00D
-    2218,  // imageAtomicCompSwap_01e10D00D00D
-    2220,  // imageAtomicCompSwap_01F10D00D00D00D
-    2222,  // imageAtomicCompSwap_01Q10D00D00D00D
-    2224,  // imageAtomicCompSwap_01b10D00D00D00D
-    2226,  // imageAtomicCompSwap_01G20D00D00D00D
-    2228,  // imageAtomicCompSwap_01R20D00D00D00D
-    2230,  // imageAtomicCompSwap_01c20D00D00D00D
-    2232,  // pixelLocalLoadANGLE_01g
-    2233,  // pixelLocalLoadANGLE_01h
-    2234,  // pixelLocalLoadANGLE_01i
-    2235,  // pixelLocalStoreANGLE_01g30B
-    2236,  // pixelLocalStoreANGLE_01h30D
-    2237,  // pixelLocalStoreANGLE_01i30E
-    2238,  // beginInvocationInterlockNV_
-    2239,  // endInvocationInterlockNV_
-    2240,  // beginFragmentShaderOrderingINTEL_
-    2241,  // beginInvocationInterlockARB_
-    2242,  // endInvocationInterlockARB_
-    2243,  // memoryBarrier_
-    2244,  // memoryBarrierAtomicCounter_
-    2245,  // memoryBarrierBuffer_
-    2246,  // memoryBarrierImage_
-    2247,  // barrier_
-    2251,  // memoryBarrierShared_
-    2252,  // groupMemoryBarrier_
-    2253,  // EmitVertex_
-    2256,  // EndPrimitive_
-    2259,  // subpassLoad_01j
-    2260,  // subpassLoad_01k
-    2261,  // subpassLoad_01l
-    2262,  // subpassLoad_01m00D
-    2263,  // subpassLoad_01n00D
-    2264,  // subpassLoad_01o00D
-    2265,  // numSamples_
-    2266,  // samplePosition_00E
-    2267,  // interpolateAtCenter_00B
-    2268,  // interpolateAtCenter_10B
-    2269,  // interpolateAtCenter_20B
-    2270,  // interpolateAtCenter_30B
-    2271,  // saturate_00B
-    2272,  // saturate_10B
-    2273,  // saturate_20B
-    2274,  // saturate_30B
-    2275,  // gl_DepthRangeParameters
-    2276,  // gl_DepthRange
-    2277,  // gl_NumSamples
-    2279,  // gl_MaxVertexAttribs
-    2280,  // gl_MaxVertexUniformVectors
-    2281,  // gl_MaxVertexTextureImageUnits
-    2282,  // gl_MaxCombinedTextureImageUnits
-    2283,  // gl_MaxTextureImageUnits
-    2284,  // gl_MaxFragmentUniformVectors
-    2285,  // gl_MaxVaryingVectors
-    2286,  // gl_MaxDrawBuffers
-    2287,  // gl_MaxDualSourceDrawBuffersEXT
-    2288,  // gl_MaxVertexOutputVectors
-    2289,  // gl_MaxFragmentInputVectors
-    2290,  // gl_MinProgramTexelOffset
-    2291,  // gl_MaxProgramTexelOffset
-    2292,  // gl_MaxImageUnits
-    2293,  // gl_MaxVertexImageUniforms
-    2294,  // gl_MaxFragmentImageUniforms
-    2295,  // gl_MaxComputeImageUniforms
-    2296,  // gl_MaxCombinedImageUniforms
-    2297,  // gl_MaxCombinedShaderOutputResources
-    2298,  // gl_MaxComputeWorkGroupCount
-    2299,  // gl_MaxComputeWorkGroupSize
-    2300,  // gl_MaxComputeUniformComponents
-    2301,  // gl_MaxComputeTextureImageUnits
-    2302,  // gl_MaxComputeAtomicCounters
-    2303,  // gl_MaxComputeAtomicCounterBuffers
-    2304,  // gl_MaxVertexAtomicCounters
-    2305,  // gl_MaxFragmentAtomicCounters
-    2306,  // gl_MaxCombinedAtomicCounters
-    2307,  // gl_MaxAtomicCounterBindings
-    2308,  // gl_MaxVertexAtomicCounterBuffers
-    2309,  // gl_MaxFragmentAtomicCounterBuffers
-    2310,  // gl_MaxCombinedAtomicCounterBuffers
-    2311,  // gl_MaxAtomicCounterBufferSize
-    2312,  // gl_MaxGeometryInputComponents
-    2315,  // gl_MaxGeometryOutputComponents
-    2318,  // gl_MaxGeometryImageUniforms
-    2321,  // gl_MaxGeometryTextureImageUnits
-    2324,  // gl_MaxGeometryOutputVertices
-    2327,  // gl_MaxGeometryTotalOutputComponents
-    2330,  // gl_MaxGeometryUniformComponents
-    2333,  // gl_MaxGeometryAtomicCounters
-    2336,  // gl_MaxGeometryAtomicCounterBuffers
-    2339,  // gl_MaxTessControlInputComponents
-    2342,  // gl_MaxTessControlOutputComponents
-    2345,  // gl_MaxTessControlTextureImageUnits
-    2348,  // gl_MaxTessControlUniformComponents
-    2351,  // gl_MaxTessControlTotalOutputComponents
-    2354,  // gl_MaxTessControlImageUniforms
-    2357,  // gl_MaxTessControlAtomicCounters
-    2360,  // gl_MaxTessControlAtomicCounterBuffers
-    2363,  // gl_MaxTessPatchComponents
-    2366,  // gl_MaxPatchVertices
-    2369,  // gl_MaxTessGenLevel
-    2372,  // gl_MaxTessEvaluationInputComponents
-    2375,  // gl_MaxTessEvaluationOutputComponents
-    2378,  // gl_MaxTessEvaluationTextureImageUnits
-    2381,  // gl_MaxTessEvaluationUniformComponents
-    2384,  // gl_MaxTessEvaluationImageUniforms
-    2387,  // gl_MaxTessEvaluationAtomicCounters
-    2390,  // gl_MaxTessEvaluationAtomicCounterBuffers
-    2393,  // gl_MaxSamples
-    2395,  // gl_MaxClipDistances
-    2398,  // gl_MaxCullDistances
-    2400,  // gl_MaxCombinedClipAndCullDistances
-    2402,  // gl_FragCoord
-    2404,  // gl_FrontFacing
-    2405,  // gl_PointCoord
-    2406,  // gl_FragColor
-    2407,  // gl_FragData
-    2408,  // gl_FragDepth
-    2409,  // gl_HelperInvocation
-    2410,  // gl_SecondaryFragColorEXT
-    2411,  // gl_SecondaryFragDataEXT
-    2412,  // gl_FragDepthEXT
-    2413,  // gl_LastFragData
-    2416,  // gl_LastFragColor
-    2417,  // gl_LastFragColorARM
-    2418,  // gl_PrimitiveID
-    2430,  // gl_Layer
-    2436,  // gl_SampleID
-    2438,  // gl_SamplePosition
-    2440,  // gl_SampleMaskIn
-    2442,  // gl_SampleMask
-    2444,  // gl_Position
-    2454,  // gl_PointSize
-    2456,  // gl_InstanceID
-    2457,  // Empty
-    2457,  // gl_VertexID
-    2458,  // Empty
-    2458,  // Empty
-    2458,  // gl_DrawID
-    2459,  // gl_BaseVertex
-    2460,  // gl_BaseInstance
-    2461,  // angle_BaseVertex
-    2462,  // angle_BaseInstance
-    2463,  // gl_ClipDistance
-    2466,  // gl_NumWorkGroups
-    2467,  // gl_WorkGroupSize
-    2468,  // gl_WorkGroupID
-    2469,  // gl_LocalInvocationID
-    2470,  // gl_GlobalInvocationID
-    2471,  // gl_LocalInvocationIndex
-    2472,  // gl_PrimitiveIDIn
-    2475,  // gl_InvocationID
-    2481,  // gl_PerVertex
-    2490,  // gl_in
-    2499,  // gl_PatchVerticesIn
-    2505,  // gl_TessLevelOuter
-    2511,  // gl_TessLevelInner
-    2517,  // gl_out
-    2523,  // gl_BoundingBox
-    2526,  // gl_BoundingBoxEXT
-    2529,  // gl_BoundingBoxOES
-    2532,  // gl_TessCoord
-    2533,  // gl_ViewID_OVR
-    2534,  // gl_CullDistance
+    1968,  // imageAtomicMax_01D00D00E
+    1970,  // determinant_F0B
+    1971,  // textureLod_00Z20B00B
+    1972,  // step_00B00B
+    1973,  // imageAtomicExchange_01Q10D00D00B
+    1975,  // imageAtomicOr_01Z00D00D
+    1977,  // imageAtomicExchange_01C20D00D
+    1979,  // textureOffset_00R10B10D
+    1980,  // imageAtomicMax_01M20D00D
+    1982,  // textureGatherOffsets_00X10B10Dx400D
+    1985,  // imageAtomicOr_01a10D00E
+    1987,  // normalize_10B
+    1988,  // min_20D00D
+    1989,  // imageAtomicAnd_01N20D00D
+    1991,  // imageAtomicExchange_01a10D00D
+    1993,  // interpolateAtCenter_20B
+    1994,  // transpose_50B
+    1995,  // abs_00B
+    1996,  // imageAtomicOr_01X20D00E
+    1998,  // texture_00I10B
+    1999,  // texture3D_00J20B00B
+    2000,  // imageAtomicAdd_01P10D00E
+    2002,  // imageAtomicMin_00z10D00E
+    2004,  // imageAtomicMax_01D00D00D
+    2006,  // transpose_E0B
+    2007,  // unpackHalf2x16_00E
+    2008,  // textureProjLodOffset_00X20B00B10D
+    2009,  // texture_00U20B00B
+    2010,  // texture3DProj_00J30B00B
+    2011,  // clamp_30B30B30B
+    2012,  // imageAtomicCompSwap_01C20D00D00D
+    2014,  // imageSize_01X
+    2015,  // imageAtomicMax_01N20D00D
+    2017,  // atan_10B
+    2018,  // sin_30B
+    2019,  // textureProjLod_00S30B00B
+    2020,  // imageAtomicAdd_01e10D00D
+    2022,  // gl_MaxCombinedClipAndCullDistances
+    2024,  // imageAtomicMax_01e10D00D
+    2026,  // textureGradOffset_00f30B10B10B10D
+    2027,  // imageAtomicAdd_01Z00D00E
+    2029,  // textureLodOffset_00a20B00B10D
+    2030,  // imageStore_01K10D30D
+    2031,  // imageAtomicCompSwap_00z10D00D00D
+    2033,  // equal_20E20E
+    2034,  // imageAtomicMax_01N20D00E
+    2036,  // imageAtomicXor_01e10D00E
+    2038,  // imageAtomicExchange_01Y20D00D
+    2040,  // imageAtomicOr_01X20D00D
+    2042,  // imageAtomicMax_01Q10D00D00E
+    2044,  // imageAtomicOr_01c20D00D00D
+    2046,  // intBitsToFloat_10D
+    2047,  // imageAtomicAnd_01C20D00D
+    2049,  // imageAtomicAdd_01M20D00E
+    2051,  // textureGrad_00d20B10B10B
+    2052,  // imageAtomicExchange_01D00D00E
+    2054,  // radians_00B
+    2055,  // imageAtomicOr_01U00D00E
+    2057,  // step_00B10B
+    2058,  // imageAtomicAnd_01S20D00E
+    2060,  // imageAtomicAdd_01I10D00D
+    2062,  // dFdx_10B
+    2064,  // atomicOr_00D00D
+    2065,  // imageAtomicOr_00z10D00E
+    2067,  // umulExtended_10E10E10E10E
+    2068,  // transpose_F0B
+    2069,  // imageAtomicAdd_01U00D00E
+    2071,  // gl_MaxComputeTextureImageUnits
+    2072,  // matrixCompMult_50B50B
+    2073,  // clamp_20B20B20B
+    2074,  // imageAtomicCompSwap_01J00D00D00D
+    2076,  // imageAtomicAnd_01G20D00D00D
+    2078,  // imageAtomicExchange_01H20D00E
+    2080,  // texture2DProjLod_00I20B00B
+    2081,  // imageAtomicMax_01U00D00E
+    2083,  // fma_00B00B00B
+    2086,  // imageLoad_01S20D
+    2089,  // cross_20B20B
+    2090,  // gl_MaxComputeAtomicCounterBuffers
+    2091,  // imageAtomicOr_01T10D00E
+    2093,  // texture3DProj_00J30B
+    2094,  // textureOffset_00X10B10D00B
+    2095,  // imageAtomicOr_01G20D00D00D
+    2097,  // imageAtomicExchange_01M20D00D
+    2099,  // texelFetchOffset_00U20D00D10D
+    2100,  // atomicCompSwap_00D00D00D
+    2101,  // gl_MaxTessEvaluationAtomicCounterBuffers
+    2104,  // mix_30B30B00B
+    2105,  // imageAtomicExchange_01Q10D00D00E
+    2107,  // log2_20B
+    2108,  // texelFetchOffset_00X10D00D10D
+    2109,  // floor_30B
+    2110,  // textureGrad_00J20B20B20B
+    2111,  // mix_30F30F30F
+    2112,  // textureGatherOffset_00a20B10D
+    2113,  // imageAtomicOr_01N20D00E
+    2115,  // imageAtomicMin_01X20D00E
+    2117,  // imageAtomicXor_01Z00D00E
+    2119,  // min_20B20B
+    2120,  // imageAtomicXor_01d20D00E
+    2122,  // textureLod_00S20B00B
+    2123,  // acos_20B
+    2124,  // gl_MaxTessEvaluationInputComponents
+    2127,  // imageAtomicAdd_01T10D00E
+    2129,  // bitfieldExtract_30E00D00D
+    2130,  // imageAtomicCompSwap_01E10D00D00D
+    2132,  // texture_00T20B
+    2133,  // ldexp_10B10D
+    2134,  // interpolateAtOffset_00B10B
+    2136,  // bitfieldReverse_10D
+    2137,  // exp_20B
+    2138,  // bitfieldExtract_20D00D00D
+    2139,  // reflect_10B10B
+    2140,  // saturate_20B
+    2141,  // imageSize_01S
+    2144,  // distance_10B10B
+    2145,  // tan_30B
+    2146,  // textureProjGradOffset_00I30B10B10B10D
+    2147,  // textureProjGrad_00I30B10B10B
+    2148,  // textureLodOffset_00J20B00B20D
+    2149,  // log_00B
+    2150,  // textureGatherOffsets_00I10B10Dx4
+    2153,  // imageAtomicMin_01Y20D00D
+    2155,  // floatBitsToInt_00B
+    2156,  // gl_MaxVertexImageUniforms
+    2157,  // imageAtomicXor_01c20D00D00E
+    2159,  // textureGather_00a20B00D
+    2160,  // imageAtomicAnd_01U00D00D
+    2162,  // sqrt_00B
+    2163,  // texture2DProj_00M20B
+    2165,  // log2_30B
+    2166,  // imageAtomicMax_01C20D00D
+    2168,  // imageAtomicMin_01F10D00D00D
+    2170,  // clamp_20B00B00B
+    2171,  // texture_00R10B00B
+    2172,  // imageAtomicExchange_01B20D00E
+    2174,  // ceil_10B
+    2175,  // textureGather_00l30B00B
+    2178,  // imageAtomicXor_01Q10D00D00E
+    2180,  // gl_MaxSamples
+    2182,  // textureCubeLodEXT_00K20B00B
+    2183,  // imageAtomicAnd_01D00D00D
+    2185,  // imageAtomicMax_01R20D00D00D
+    2187,  // matrixCompMult_A0BA0B
+    2188,  // textureGatherOffset_00f20B00B10D
+    2189,  // gl_NumWorkGroups
+    2190,  // imageAtomicExchange_01B20D00B
+    2192,  // imageAtomicXor_01H20D00E
+    2194,  // imageAtomicAnd_01f00D00E
+    2196,  // imageAtomicAnd_01W20D00E
+    2198,  // imageAtomicOr_01P10D00E
+    2200,  // textureSize_00X00D
+    2201,  // transpose_D0B
+    2202,  // imageAtomicAdd_01H20D00D
+    2204,  // greaterThanEqual_20B20B
+    2205,  // bitfieldInsert_30D30D00D00D
+    2206,  // notEqual_10B10B
+    2207,  // smoothstep_00B00B20B
+    2208,  // textureGatherOffset_00L20B10D00D
+    2209,  // textureGather_00T20B00D
+    2210,  // max_30E00E
+    2211,  // textureGather_00f20B00B
+    2212,  // findMSB_20D
+    2213,  // all_10F
+    2214,  // textureSize_00r
+    2217,  // textureProjGrad_00J30B20B20B
+    2218,  // textureOffset_00S20B20D00B
+    2219,  // gl_BoundingBox
+    2222,  // imageAtomicOr_01P10D00D
+    2224,  // lessThan_10B10B
+    2225,  // imageAtomicExchange_01K10D00B
+    2227,  // mix_10B10B00B
+    2228,  // gl_SecondaryFragDataEXT
+    2229,  // texelFetchOffset_00S20D00D20D
+    2230,  // exp_30B
+    2231,  // bitCount_20E
+    2232,  // frexp_30B30D
+    2233,  // imageAtomicAnd_01T10D00E
+    2235,  // imageAtomicMin_01c20D00D00E
+    2237,  // gl_MaxDualSourceDrawBuffersEXT
+    2238,  // imageAtomicMin_01V10D00E
+    2240,  // bitCount_30E
+    2241,  // round_20B
+    2242,  // textureOffset_00L20B10D00B
+    2243,  // EndPrimitive_
+    2246,  // imageAtomicCompSwap_01I10D00E00E
+    2248,  // textureProjOffset_00S30B20D00B
+    2249,  // clamp_00D00D00D
+    2250,  // imageAtomicXor_01X20D00D
+    2252,  // floatBitsToInt_20B
+    2253,  // imageAtomicExchange_01f00D00D
+    2255,  // gl_MaxPatchVertices
+    2258,  // imageAtomicAnd_01N20D00E
+    2260,  // textureProjOffset_00R20B10D
+    2261,  // imageAtomicCompSwap_01S20D00D00D
+    2263,  // imageAtomicXor_01I10D00D
+    2265,  // imageAtomicOr_01H20D00D
+    2267,  // clamp_10D10D10D
+    2268,  // groupMemoryBarrier_
+    2269,  // max_10D00D
+    2270,  // greaterThanEqual_30E30E
+    2271,  // texture2DGradEXT_00I10B10B10B
+    2272,  // imageAtomicExchange_01Y20D00E
+    2274,  // acosh_00B
+    2275,  // gl_MaxFragmentUniformVectors
+    2276,  // length_10B
+    2277,  // texture2DProj_00I20B00B
+    2278,  // textureGatherOffsets_00a20B10Dx400D
+    2281,  // textureProj_00I20B
+    2282,  // texture2D_00M10B
+    2284,  // gl_MaxFragmentImageUniforms
+    2285,  // fwidth_10B
+    2287,  // clamp_10D00D00D
+    2288,  // imageAtomicExchange_01T10D00B
+    2290,  // texture_00k30B00B
+    2293,  // textureGatherOffset_00U20B10D
+    2294,  // imageAtomicOr_01O00D00E
+    2296,  // textureProjOffset_00R20B10D00B
+    2297,  // imageStore_01S20D30D
+    2300,  // gl_Layer
+    2306,  // uaddCarry_00E00E00E
+    2307,  // EmitVertex_
+    2310,  // distance_20B20B
+    2311,  // gl_BaseVertex
+    2312,  // beginInvocationInterlockARB_
+    2313,  // imageAtomicXor_01O00D00E
+    2315,  // findMSB_00D
+    2316,  // gl_MaxVertexAttribs
+    2317,  // imageAtomicXor_01A20D00E
+    2319,  // textureSize_00N00D
+    2320,  // textureGather_00Z20B00D
+    2321,  // packUnorm4x8_30B
+    2322,  // textureSize_00S00D
+    2323,  // equal_10D10D
+    2324,  // clamp_30B00B00B
+    2325,  // gl_MaxCombinedImageUniforms
+    2326,  // imageAtomicAdd_01A20D00D
+    2328,  // textureGatherOffsets_00f20B00B10Dx4
+    2331,  // imageAtomicOr_01E10D00D
+    2333,  // interpolateAtCenter_30B
+    2334,  // texture_00N10B00B
+    2335,  // atomicOr_00E00E
+    2336,  // textureGather_00K20B
+    2337,  // log_20B
+    2338,  // atomicMax_00E00E
+    2339,  // atomicAnd_00D00D
+    2340,  // imageAtomicOr_01F10D00D00E
+    2342,  // imageAtomicXor_01R20D00D00D
+    2344,  // lessThanEqual_30D30D
+    2345,  // textureSize_00I00D
+    2346,  // imageAtomicXor_01T10D00E
+    2348,  // imageAtomicAnd_01O00D00E
+    2350,  // imageAtomicCompSwap_01A20D00D00D
+    2352,  // gl_MaxGeometryOutputVertices
+    2355,  // imageAtomicCompSwap_01T10D00D00D
+    2357,  // gl_MaxComputeWorkGroupSize
+    2358,  // textureProjGrad_00X30B10B10B
+    2359,  // textureLodOffset_00Y20B00B20D
+    2360,  // smoothstep_30B30B30B
+    2361,  // imageAtomicAnd_01W20D00D
+    2363,  // gl_DepthRange
+    2364,  // imageStore_01A20D30B
+    2365,  // imageAtomicAdd_01F10D00D00D
+    2367,  // mix_00D00D00F
+    2368,  // textureGatherOffset_00R10B10D
+    2369,  // texelFetch_00W20D00D
+    2371,  // gl_MaxTessEvaluationImageUniforms
+    2374,  // textureProjLodOffset_00J30B00B20D
+    2375,  // gl_SecondaryFragColorEXT
+    2376,  // imageAtomicAnd_01F10D00D00E
+    2378,  // imageAtomicCompSwap_01B20D00E00E
+    2380,  // textureGather_00T20B
+    2381,  // imageAtomicMin_01S20D00D
+    2383,  // clamp_10E00E00E
+    2384,  // imageAtomicCompSwap_01L20D00E00E
+    2386,  // imageAtomicMin_01d20D00D
+    2388,  // mix_10B10B10B
+    2389,  // imageSize_01L
+    2390,  // imulExtended_30D30D30D30D
+    2391,  // greaterThan_10E10E
+    2392,  // textureGather_00s30B
+    2395,  // gl_MaxAtomicCounterBindings
+    2396,  // texture_00x30B00B
+    2399,  // textureLod_00X10B00B
+    2400,  // textureOffset_00J20B20D00B
+    2401,  // textureProjLodOffset_00I30B00B10D
+    2402,  // imageAtomicXor_01G20D00D00D
+    2404,  // min_10E00E
+    2405,  // imageAtomicAnd_01E10D00D
+    2407,  // greaterThan_20D20D
+    2408,  // imageLoad_01U00D
+    2411,  // textureLod_00K20B00B
+    2412,  // gl_PointSize
+    2414,  // imageAtomicOr_01e10D00E
+    2416,  // step_00B20B
+    2417,  // imageAtomicExchange_01e10D00E
+    2419,  // imageAtomicXor_01K10D00E
+    2421,  // imageAtomicAdd_01S20D00E
+    2423,  // imageStore_01J00D30B
+    2426,  // texture_00M10B00B
+    2427,  // imageSize_01Y
+    2428,  // imageAtomicCompSwap_01I10D00D00D
+    2430,  // texture_00I10B00B
+    2431,  // imageAtomicMax_01L20D00D
+    2433,  // imageAtomicAdd_01W20D00D
+    2435,  // bitfieldExtract_00E00D00D
+    2436,  // round_10B
+    2437,  // imageAtomicExchange_01D00D00D
+    2439,  // ceil_30B
+    2440,  // textureGradOffset_00I10B10B10B10D
+    2441,  // matrixCompMult_D0BD0B
+    2442,  // textureGather_00a20B
+    2443,  // transpose_70B
+    2444,  // textureProjLod_00R30B00B
+    2445,  // imageAtomicAnd_01A20D00E
+    2447,  // step_00B30B
+    2448,  // imageLoad_01Y20D
+    2449,  // textureProj_00I20B00B
+    2450,  // imageAtomicMax_01T10D00E
+    2452,  // imageLoad_01J00D
+    2455,  // imageAtomicMax_01B20D00D
+    2457,  // min_30B00B
+    2458,  // textureGather_00I10B
+    2459,  // textureGatherOffsets_00R10B10Dx4
+    2462,  // floatBitsToUint_30B
+    2463,  // textureProj_00R20B00B
+    2464,  // texture2DProjLod_00I30B00B
+    2465,  // imageAtomicXor_01W20D00E
+    2467,  // bitfieldExtract_20E00D00D
+    2468,  // imageAtomicCompSwap_01c20D00D00E00E
+    2470,  // imageAtomicXor_01C20D00E
+    2472,  // notEqual_10E10E
+    2473,  // imageAtomicAnd_01R20D00D00E
+    2475,  // imageAtomicAdd_01K10D00E
+    2477,  // imageAtomicAdd_01D00D00D
+    2479,  // textureProjOffset_00X20B10D
+    2480,  // imageAtomicCompSwap_01X20D00E00E
+    2482,  // gl_MaxTessControlTextureImageUnits
+    2485,  // imageSize_01V
+    2486,  // determinant_50B
+    2487,  // pixelLocalStoreANGLE_01g30B
+    2488,  // textureProjOffset_00S30B20D
+    2489,  // texture_00R10B
+    2490,  // min_10D10D
+    2491,  // cosh_30B
+    2492,  // imageAtomicXor_01V10D00D
+    2494,  // imageAtomicOr_01d20D00D
+    2496,  // imageAtomicXor_01W20D00D
+    2498,  // imageAtomicMax_01P10D00D
+    2500,  // clamp_30E30E30E
+    2501,  // imageAtomicCompSwap_01Z00D00D00D
+    2503,  // sinh_20B
+    2504,  // imageAtomicExchange_01e10D00D
+    2506,  // pow_00B00B
+    2507,  // imageAtomicXor_01a10D00D
+    2509,  // textureProjLod_00R20B00B
+    2510,  // imageAtomicMin_00z10D00D
+    2512,  // textureProjLodOffset_00S30B00B20D
+    2513,  // imageAtomicAnd_01O00D00D
+    2515,  // reflect_00B00B
+    2516,  // textureLod_00R10B00B
+    2517,  // outerProduct_10B20B
+    2518,  // imageAtomicAdd_01N20D00E
+    2520,  // imageAtomicAnd_01a10D00D
+    2522,  // atomicCounterDecrement_00G
+    2523,  // imageAtomicExchange_01N20D00D
+    2525,  // mod_30B00B
+    2526,  // textureProjGradOffset_00S30B20B20B20D
+    2527,  // refract_10B10B00B
+    2528,  // imageAtomicMin_01I10D00E
+    2530,  // imageAtomicExchange_01P10D00D
+    2532,  // textureSize_00a00D
+    2533,  // imageAtomicCompSwap_01Z00D00E00E
+    2535,  // subpassLoad_01l
 };
 
 using Ext = TExtension;
 
 // Flat array of all unmangled name identifiers.
 constexpr UnmangledEntry unmangled[] = {
-    {"radians", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
-    {"degrees", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
-    {"sin", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
-    {"cos", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
-    {"tan", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
-    {"asin", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
-    {"acos", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
+    {"isnan", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130, Shader::ALL},
     {"atan", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
+    {"packUnorm2x16", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 400,
+     Shader::ALL},
     {"sinh", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130, Shader::ALL},
-    {"cosh", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130, Shader::ALL},
-    {"tanh", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130, Shader::ALL},
+    {"rgb_2_yuv", std::array<TExtension, 1>{{Ext::EXT_YUV_target}}, Ext::UNDEFINED, 300, -1,
+     Shader::ALL},
+    {"imageLoad", std::array<TExtension, 2>{{Ext::OES_texture_buffer, Ext::EXT_texture_buffer}},
+     Ext::UNDEFINED, 310, -1, Shader::ALL},
     {"asinh", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130, Shader::ALL},
-    {"acosh", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130, Shader::ALL},
-    {"atanh", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130, Shader::ALL},
-    {"pow", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
-    {"exp", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
-    {"log", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
-    {"exp2", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
-    {"log2", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
-    {"sqrt", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
-    {"inversesqrt", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
-    {"abs", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130, Shader::ALL},
-    {"sign", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130, Shader::ALL},
-    {"floor", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
-    {"trunc", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130, Shader::ALL},
-    {"round", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130, Shader::ALL},
-    {"roundEven", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130,
+    {"atomicCompSwap", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 430,
      Shader::ALL},
-    {"ceil", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
-    {"fract", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
-    {"mod", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
-    {"min", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130, Shader::ALL},
-    {"max", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130, Shader::ALL},
-    {"clamp", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130, Shader::ALL},
+    {"log2", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
     {"mix", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 450, Shader::ALL},
-    {"step", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
-    {"smoothstep", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
-    {"modf", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130, Shader::ALL},
-    {"isnan", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130, Shader::ALL},
-    {"isinf", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130, Shader::ALL},
-    {"floatBitsToInt", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 330,
+    {"dot", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
+    {"samplePosition", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED,
+     kESSLInternalBackendBuiltIns, -1, Shader::FRAGMENT},
+    {"texture2DGradEXT", std::array<TExtension, 1>{{Ext::EXT_shader_texture_lod}}, Ext::UNDEFINED,
+     100, -1, Shader::ALL},
+    {"memoryBarrierImage", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 430,
      Shader::ALL},
-    {"floatBitsToUint", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 330,
+    {"barrier", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 320, -1,
+     Shader::TESS_CONTROL_EXT},
+    {"textureProj", std::array<TExtension, 1>{{Ext::OES_EGL_image_external_essl3}}, Ext::UNDEFINED,
+     300, -1, Shader::FRAGMENT},
+    {"textureGatherOffsets",
+     std::array<TExtension, 2>{{Ext::EXT_gpu_shader5, Ext::OES_gpu_shader5}}, Ext::UNDEFINED, 310,
+     -1, Shader::ALL},
+    {"equal", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
+    {"imageSize", std::array<TExtension, 2>{{Ext::OES_texture_buffer, Ext::EXT_texture_buffer}},
+     Ext::UNDEFINED, 310, -1, Shader::ALL},
+    {"textureGradOffset", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130,
      Shader::ALL},
-    {"intBitsToFloat", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 330,
+    {"beginInvocationInterlockARB", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED,
+     kESSLInternalBackendBuiltIns, -1, Shader::ALL},
+    {"shadow2DEXT", std::array<TExtension, 1>{{Ext::EXT_shadow_samplers}}, Ext::UNDEFINED, 100, -1,
      Shader::ALL},
-    {"uintBitsToFloat", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 330,
+    {"roundEven", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130,
      Shader::ALL},
-    {"fma", std::array<TExtension, 2>{{Ext::EXT_gpu_shader5, Ext::OES_gpu_shader5}}, Ext::UNDEFINED,
+    {"atomicMax", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 430,
+     Shader::ALL},
+    {"imageAtomicMin", std::array<TExtension, 1>{{Ext::OES_shader_image_atomic}}, Ext::UNDEFINED,
      310, -1, Shader::ALL},
-    {"frexp", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400, Shader::ALL},
-    {"ldexp", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400, Shader::ALL},
-    {"packSnorm2x16", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 420,
+    {"imageAtomicExchange", std::array<TExtension, 1>{{Ext::OES_shader_image_atomic}},
+     Ext::UNDEFINED, 310, -1, Shader::ALL},
+    {"modf", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130, Shader::ALL},
+    {"texture2D", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 100, 0,
+     Shader::FRAGMENT},
+    {"all", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
+    {"log", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
+    {"beginFragmentShaderOrderingINTEL", std::array<TExtension, 1>{{Ext::UNDEFINED}},
+     Ext::UNDEFINED, kESSLInternalBackendBuiltIns, -1, Shader::ALL},
+    {"exp2", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
+    {"inversesqrt", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
+    {"bitfieldReverse", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400,
      Shader::ALL},
-    {"packHalf2x16", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 420,
+    {"max", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130, Shader::ALL},
+    {"atomicCounterDecrement", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310,
+     420, Shader::ALL},
+    {"texture3DProjLod", std::array<TExtension, 1>{{Ext::OES_texture_3D}}, Ext::UNDEFINED, 100, -1,
      Shader::ALL},
+    {"shadow2DProjEXT", std::array<TExtension, 1>{{Ext::EXT_shadow_samplers}}, Ext::UNDEFINED, 100,
+     -1, Shader::ALL},
+    {"saturate", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED,
+     kESSLInternalBackendBuiltIns, -1, Shader::ALL},
+    {"interpolateAtCenter", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED,
+     kESSLInternalBackendBuiltIns, -1, Shader::FRAGMENT},
     {"unpackSnorm2x16", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 420,
      Shader::ALL},
-    {"unpackHalf2x16", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 420,
+    {"textureProjLod", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130,
      Shader::ALL},
-    {"packUnorm2x16", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 400,
+    {"acosh", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130, Shader::ALL},
+    {"matrixCompMult", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, -1,
      Shader::ALL},
-    {"unpackUnorm2x16", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 400,
+    {"textureCubeLodEXT", std::array<TExtension, 1>{{Ext::EXT_shader_texture_lod}}, Ext::UNDEFINED,
+     100, -1, Shader::FRAGMENT},
+    {"EndPrimitive", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 320, -1,
+     Shader::GEOMETRY},
+    {"sin", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
+    {"greaterThanEqual", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130,
      Shader::ALL},
-    {"packUnorm4x8", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400,
+    {"interpolateAtOffset", std::array<TExtension, 1>{{Ext::OES_shader_multisample_interpolation}},
+     Ext::UNDEFINED, 300, -1, Shader::FRAGMENT},
+    {"texture2DProjLodEXT", std::array<TExtension, 1>{{Ext::EXT_shader_texture_lod}},
+     Ext::UNDEFINED, 100, -1, Shader::FRAGMENT},
+    {"imageAtomicCompSwap", std::array<TExtension, 1>{{Ext::OES_shader_image_atomic}},
+     Ext::UNDEFINED, 310, -1, Shader::ALL},
+    {"mod", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
+    {"textureVideoWEBGL", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 100, 0,
      Shader::ALL},
+    {"atomicMin", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 430,
+     Shader::ALL},
+    {"floor", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
     {"packSnorm4x8", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400,
      Shader::ALL},
-    {"unpackUnorm4x8", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400,
+    {"texture2DRect", std::array<TExtension, 1>{{Ext::ARB_texture_rectangle}}, Ext::UNDEFINED, 100,
+     -1, Shader::ALL},
+    {"umulExtended", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400,
      Shader::ALL},
-    {"unpackSnorm4x8", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400,
+    {"textureGrad",
+     std::array<TExtension, 2>{{Ext::OES_texture_cube_map_array, Ext::EXT_texture_cube_map_array}},
+     Ext::UNDEFINED, 310, -1, Shader::ALL},
+    {"determinant", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, -1,
      Shader::ALL},
-    {"length", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
-    {"distance", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
-    {"dot", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
-    {"cross", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
-    {"normalize", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
-    {"faceforward", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
-    {"reflect", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
-    {"refract", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
-    {"matrixCompMult", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, -1,
+    {"step", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
+    {"degrees", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
+    {"ldexp", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400, Shader::ALL},
+    {"textureGatherOffset", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400,
      Shader::ALL},
-    {"outerProduct", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 120,
+    {"imageAtomicAdd", std::array<TExtension, 1>{{Ext::OES_shader_image_atomic}}, Ext::UNDEFINED,
+     310, -1, Shader::ALL},
+    {"floatBitsToUint", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 330,
      Shader::ALL},
-    {"transpose", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 120,
+    {"textureProjLodOffset", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130,
      Shader::ALL},
-    {"determinant", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, -1,
+    {"uintBitsToFloat", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 330,
      Shader::ALL},
+    {"exp", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
+    {"findLSB", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400, Shader::ALL},
     {"inverse", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 140, Shader::ALL},
-    {"lessThan", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130,
+    {"cos", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
+    {"pixelLocalLoadANGLE", std::array<TExtension, 1>{{Ext::ANGLE_shader_pixel_local_storage}},
+     Ext::UNDEFINED, 300, -1, Shader::ALL},
+    {"texture3D", std::array<TExtension, 1>{{Ext::OES_texture_3D}}, Ext::UNDEFINED, 100, -1,
+     Shader::FRAGMENT},
+    {"usubBorrow", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400,
      Shader::ALL},
-    {"lessThanEqual", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130,
+    {"packUnorm4x8", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400,
      Shader::ALL},
+    {"texture2DRectProj", std::array<TExtension, 1>{{Ext::ARB_texture_rectangle}}, Ext::UNDEFINED,
+     100, -1, Shader::ALL},
+    {"distance", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
+    {"textureCubeLod", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 100, -1,
+     Shader::VERTEX},
+    {"imageAtomicMax", std::array<TExtension, 1>{{Ext::OES_shader_image_atomic}}, Ext::UNDEFINED,
+     310, -1, Shader::ALL},
     {"greaterThan", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130,
      Shader::ALL},
-    {"greaterThanEqual", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130,
-     Shader::ALL},
-    {"equal", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
-    {"notEqual", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
-    {"any", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
-    {"all", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
     {"not", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
-    {"bitfieldExtract", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400,
+    {"atomicExchange", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 430,
      Shader::ALL},
-    {"bitfieldInsert", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400,
+    {"findMSB", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400, Shader::ALL},
+    {"asin", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
+    {"floatBitsToInt", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 330,
+     Shader::ALL},
+    {"texture2DLodEXT", std::array<TExtension, 1>{{Ext::EXT_shader_texture_lod}}, Ext::UNDEFINED,
+     100, -1, Shader::FRAGMENT},
+    {"packHalf2x16", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 420,
+     Shader::ALL},
+    {"fwidth", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 0,
+     Shader::FRAGMENT},
+    {"packSnorm2x16", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 420,
+     Shader::ALL},
+    {"unpackHalf2x16", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 420,
      Shader::ALL},
-    {"bitfieldReverse", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400,
+    {"beginInvocationInterlockNV", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED,
+     kESSLInternalBackendBuiltIns, -1, Shader::ALL},
+    {"imulExtended", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400,
      Shader::ALL},
-    {"bitCount", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400,
+    {"textureCubeGradEXT", std::array<TExtension, 1>{{Ext::EXT_shader_texture_lod}}, Ext::UNDEFINED,
+     100, -1, Shader::ALL},
+    {"lessThan", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130,
      Shader::ALL},
-    {"findLSB", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400, Shader::ALL},
-    {"findMSB", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400, Shader::ALL},
-    {"uaddCarry", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400,
+    {"unpackUnorm2x16", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 400,
      Shader::ALL},
-    {"usubBorrow", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400,
+    {"frexp", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400, Shader::ALL},
+    {"ceil", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
+    {"interpolateAtSample", std::array<TExtension, 1>{{Ext::OES_shader_multisample_interpolation}},
+     Ext::UNDEFINED, 300, -1, Shader::FRAGMENT},
+    {"lessThanEqual", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130,
      Shader::ALL},
-    {"umulExtended", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400,
+    {"textureProjGrad", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130,
      Shader::ALL},
-    {"imulExtended", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400,
+    {"endInvocationInterlockARB", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED,
+     kESSLInternalBackendBuiltIns, -1, Shader::ALL},
+    {"subpassLoad", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED,
+     kESSLInternalBackendBuiltIns, 460, Shader::ALL},
+    {"textureSize", std::array<TExtension, 1>{{Ext::OES_EGL_image_external_essl3}}, Ext::UNDEFINED,
+     300, -1, Shader::ALL},
+    {"textureProjOffset", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130,
      Shader::ALL},
-    {"texture2D", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 100, 0,
-     Shader::FRAGMENT},
-    {"texture2DProj", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 100, 0,
-     Shader::FRAGMENT},
-    {"textureCube", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 100, 0,
+    {"normalize", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
+    {"textureLodOffset", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130,
      Shader::ALL},
-    {"texture3D", std::array<TExtension, 1>{{Ext::OES_texture_3D}}, Ext::UNDEFINED, 100, -1,
-     Shader::FRAGMENT},
-    {"texture3DProj", std::array<TExtension, 1>{{Ext::OES_texture_3D}}, Ext::UNDEFINED, 100, -1,
-     Shader::FRAGMENT},
-    {"shadow2DEXT", std::array<TExtension, 1>{{Ext::EXT_shadow_samplers}}, Ext::UNDEFINED, 100, -1,
+    {"atomicXor", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 430,
      Shader::ALL},
-    {"shadow2DProjEXT", std::array<TExtension, 1>{{Ext::EXT_shadow_samplers}}, Ext::UNDEFINED, 100,
-     -1, Shader::ALL},
-    {"texture2DRect", std::array<TExtension, 1>{{Ext::ARB_texture_rectangle}}, Ext::UNDEFINED, 100,
-     -1, Shader::ALL},
-    {"texture2DRectProj", std::array<TExtension, 1>{{Ext::ARB_texture_rectangle}}, Ext::UNDEFINED,
-     100, -1, Shader::ALL},
-    {"texture2DGradEXT", std::array<TExtension, 1>{{Ext::EXT_shader_texture_lod}}, Ext::UNDEFINED,
-     100, -1, Shader::ALL},
+    {"refract", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
     {"texture2DProjGradEXT", std::array<TExtension, 1>{{Ext::EXT_shader_texture_lod}},
      Ext::UNDEFINED, 100, -1, Shader::ALL},
-    {"textureCubeGradEXT", std::array<TExtension, 1>{{Ext::EXT_shader_texture_lod}}, Ext::UNDEFINED,
-     100, -1, Shader::ALL},
-    {"textureVideoWEBGL", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 100, 0,
+    {"transpose", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 120,
      Shader::ALL},
+    {"abs", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130, Shader::ALL},
+    {"length", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
     {"texture3DLod", std::array<TExtension, 1>{{Ext::OES_texture_3D}}, Ext::UNDEFINED, 100, -1,
      Shader::ALL},
-    {"texture3DProjLod", std::array<TExtension, 1>{{Ext::OES_texture_3D}}, Ext::UNDEFINED, 100, -1,
-     Shader::ALL},
+    {"cross", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
     {"texture2DLod", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 100, -1,
      Shader::VERTEX},
-    {"texture2DProjLod", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 100, -1,
-     Shader::VERTEX},
-    {"textureCubeLod", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 100, -1,
-     Shader::VERTEX},
-    {"texture2DLodEXT", std::array<TExtension, 1>{{Ext::EXT_shader_texture_lod}}, Ext::UNDEFINED,
-     100, -1, Shader::FRAGMENT},
-    {"texture2DProjLodEXT", std::array<TExtension, 1>{{Ext::EXT_shader_texture_lod}},
-     Ext::UNDEFINED, 100, -1, Shader::FRAGMENT},
-    {"textureCubeLodEXT", std::array<TExtension, 1>{{Ext::EXT_shader_texture_lod}}, Ext::UNDEFINED,
-     100, -1, Shader::FRAGMENT},
-    {"texture", std::array<TExtension, 1>{{Ext::OES_EGL_image_external_essl3}}, Ext::UNDEFINED, 300,
-     -1, Shader::FRAGMENT},
-    {"textureProj", std::array<TExtension, 1>{{Ext::OES_EGL_image_external_essl3}}, Ext::UNDEFINED,
-     300, -1, Shader::FRAGMENT},
-    {"textureLod",
-     std::array<TExtension, 2>{{Ext::OES_texture_cube_map_array, Ext::EXT_texture_cube_map_array}},
-     Ext::UNDEFINED, 310, -1, Shader::ALL},
-    {"textureSize", std::array<TExtension, 1>{{Ext::OES_EGL_image_external_essl3}}, Ext::UNDEFINED,
-     300, -1, Shader::ALL},
-    {"textureProjLod", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130,
+    {"fract", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
+    {"endInvocationInterlockNV", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED,
+     kESSLInternalBackendBuiltIns, -1, Shader::ALL},
+    {"acos", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
+    {"bitfieldExtract", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400,
+     Shader::ALL},
+    {"bitfieldInsert", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400,
      Shader::ALL},
+    {"imageAtomicXor", std::array<TExtension, 1>{{Ext::OES_shader_image_atomic}}, Ext::UNDEFINED,
+     310, -1, Shader::ALL},
     {"texelFetch", std::array<TExtension, 1>{{Ext::OES_EGL_image_external_essl3}}, Ext::UNDEFINED,
      300, -1, Shader::ALL},
-    {"textureGrad",
-     std::array<TExtension, 2>{{Ext::OES_texture_cube_map_array, Ext::EXT_texture_cube_map_array}},
-     Ext::UNDEFINED, 310, -1, Shader::ALL},
-    {"textureProjGrad", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130,
-     Shader::ALL},
-    {"textureOffset", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130,
-     Shader::ALL},
-    {"textureProjOffset", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130,
-     Shader::ALL},
-    {"textureLodOffset", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130,
-     Shader::ALL},
-    {"textureProjLodOffset", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130,
-     Shader::ALL},
+    {"memoryBarrierShared", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 430,
+     Shader::COMPUTE},
+    {"interpolateAtCentroid",
+     std::array<TExtension, 1>{{Ext::OES_shader_multisample_interpolation}}, Ext::UNDEFINED, 300,
+     -1, Shader::FRAGMENT},
+    {"fma", std::array<TExtension, 2>{{Ext::EXT_gpu_shader5, Ext::OES_gpu_shader5}}, Ext::UNDEFINED,
+     310, -1, Shader::ALL},
+    {"texture", std::array<TExtension, 1>{{Ext::OES_EGL_image_external_essl3}}, Ext::UNDEFINED, 300,
+     -1, Shader::FRAGMENT},
+    {"radians", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
     {"texelFetchOffset", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130,
      Shader::ALL},
-    {"textureGradOffset", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130,
-     Shader::ALL},
+    {"reflect", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
     {"textureProjGradOffset", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130,
      Shader::ALL},
-    {"textureGather", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400,
+    {"textureCube", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 100, 0,
      Shader::ALL},
-    {"textureGatherOffset", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400,
+    {"memoryBarrierAtomicCounter", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310,
+     430, Shader::ALL},
+    {"atanh", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130, Shader::ALL},
+    {"textureLod",
+     std::array<TExtension, 2>{{Ext::OES_texture_cube_map_array, Ext::EXT_texture_cube_map_array}},
+     Ext::UNDEFINED, 310, -1, Shader::ALL},
+    {"trunc", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130, Shader::ALL},
+    {"tanh", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130, Shader::ALL},
+    {"round", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130, Shader::ALL},
+    {"unpackSnorm4x8", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400,
      Shader::ALL},
-    {"textureGatherOffsets",
-     std::array<TExtension, 2>{{Ext::EXT_gpu_shader5, Ext::OES_gpu_shader5}}, Ext::UNDEFINED, 310,
-     -1, Shader::ALL},
-    {"rgb_2_yuv", std::array<TExtension, 1>{{Ext::EXT_YUV_target}}, Ext::UNDEFINED, 300, -1,
+    {"dFdx", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 0, Shader::FRAGMENT},
+    {"pow", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
+    {"atomicAdd", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 430,
+     Shader::ALL},
+    {"imageAtomicAnd", std::array<TExtension, 1>{{Ext::OES_shader_image_atomic}}, Ext::UNDEFINED,
+     310, -1, Shader::ALL},
+    {"pixelLocalStoreANGLE", std::array<TExtension, 1>{{Ext::ANGLE_shader_pixel_local_storage}},
+     Ext::UNDEFINED, 300, -1, Shader::ALL},
+    {"sign", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130, Shader::ALL},
+    {"sqrt", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
+    {"bitCount", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400,
      Shader::ALL},
     {"yuv_2_rgb", std::array<TExtension, 1>{{Ext::EXT_YUV_target}}, Ext::UNDEFINED, 300, -1,
      Shader::ALL},
-    {"dFdx", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 0, Shader::FRAGMENT},
-    {"dFdy", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 0, Shader::FRAGMENT},
-    {"fwidth", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 0,
+    {"cosh", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130, Shader::ALL},
+    {"isinf", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130, Shader::ALL},
+    {"texture3DProj", std::array<TExtension, 1>{{Ext::OES_texture_3D}}, Ext::UNDEFINED, 100, -1,
      Shader::FRAGMENT},
-    {"interpolateAtCentroid",
-     std::array<TExtension, 1>{{Ext::OES_shader_multisample_interpolation}}, Ext::UNDEFINED, 300,
-     -1, Shader::FRAGMENT},
-    {"interpolateAtSample", std::array<TExtension, 1>{{Ext::OES_shader_multisample_interpolation}},
-     Ext::UNDEFINED, 300, -1, Shader::FRAGMENT},
-    {"interpolateAtOffset", std::array<TExtension, 1>{{Ext::OES_shader_multisample_interpolation}},
-     Ext::UNDEFINED, 300, -1, Shader::FRAGMENT},
+    {"outerProduct", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 120,
+     Shader::ALL},
+    {"imageStore", std::array<TExtension, 2>{{Ext::OES_texture_buffer, Ext::EXT_texture_buffer}},
+     Ext::UNDEFINED, 310, -1, Shader::ALL},
     {"atomicCounter", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 420,
      Shader::ALL},
     {"atomicCounterIncrement", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310,
      420, Shader::ALL},
-    {"atomicCounterDecrement", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310,
-     420, Shader::ALL},
-    {"atomicAdd", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 430,
-     Shader::ALL},
-    {"atomicMin", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 430,
-     Shader::ALL},
-    {"atomicMax", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 430,
-     Shader::ALL},
-    {"atomicAnd", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 430,
-     Shader::ALL},
-    {"atomicOr", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 430,
-     Shader::ALL},
-    {"atomicXor", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 430,
+    {"notEqual", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
+    {"faceforward", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
+    {"uaddCarry", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400,
      Shader::ALL},
-    {"atomicExchange", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 430,
+    {"memoryBarrierBuffer", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 430,
      Shader::ALL},
-    {"atomicCompSwap", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 430,
+    {"texture2DProj", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 100, 0,
+     Shader::FRAGMENT},
+    {"smoothstep", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
+    {"intBitsToFloat", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 330,
      Shader::ALL},
-    {"imageSize", std::array<TExtension, 2>{{Ext::OES_texture_buffer, Ext::EXT_texture_buffer}},
-     Ext::UNDEFINED, 310, -1, Shader::ALL},
-    {"imageStore", std::array<TExtension, 2>{{Ext::OES_texture_buffer, Ext::EXT_texture_buffer}},
-     Ext::UNDEFINED, 310, -1, Shader::ALL},
-    {"imageLoad", std::array<TExtension, 2>{{Ext::OES_texture_buffer, Ext::EXT_texture_buffer}},
-     Ext::UNDEFINED, 310, -1, Shader::ALL},
-    {"imageAtomicAdd", std::array<TExtension, 1>{{Ext::OES_shader_image_atomic}}, Ext::UNDEFINED,
-     310, -1, Shader::ALL},
-    {"imageAtomicMin", std::array<TExtension, 1>{{Ext::OES_shader_image_atomic}}, Ext::UNDEFINED,
-     310, -1, Shader::ALL},
-    {"imageAtomicMax", std::array<TExtension, 1>{{Ext::OES_shader_image_atomic}}, Ext::UNDEFINED,
-     310, -1, Shader::ALL},
-    {"imageAtomicAnd", std::array<TExtension, 1>{{Ext::OES_shader_image_atomic}}, Ext::UNDEFINED,
-     310, -1, Shader::ALL},
+    {"groupMemoryBarrier", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 430,
+     Shader::COMPUTE},
     {"imageAtomicOr", std::array<TExtension, 1>{{Ext::OES_shader_image_atomic}}, Ext::UNDEFINED,
      310, -1, Shader::ALL},
-    {"imageAtomicXor", std::array<TExtension, 1>{{Ext::OES_shader_image_atomic}}, Ext::UNDEFINED,
-     310, -1, Shader::ALL},
-    {"imageAtomicExchange", std::array<TExtension, 1>{{Ext::OES_shader_image_atomic}},
-     Ext::UNDEFINED, 310, -1, Shader::ALL},
-    {"imageAtomicCompSwap", std::array<TExtension, 1>{{Ext::OES_shader_image_atomic}},
-     Ext::UNDEFINED, 310, -1, Shader::ALL},
-    {"pixelLocalLoadANGLE", std::array<TExtension, 1>{{Ext::ANGLE_shader_pixel_local_storage}},
-     Ext::UNDEFINED, 300, -1, Shader::ALL},
-    {"pixelLocalStoreANGLE", std::array<TExtension, 1>{{Ext::ANGLE_shader_pixel_local_storage}},
-     Ext::UNDEFINED, 300, -1, Shader::ALL},
-    {"beginInvocationInterlockNV", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED,
-     kESSLInternalBackendBuiltIns, -1, Shader::ALL},
-    {"endInvocationInterlockNV", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED,
-     kESSLInternalBackendBuiltIns, -1, Shader::ALL},
-    {"beginFragmentShaderOrderingINTEL", std::array<TExtension, 1>{{Ext::UNDEFINED}},
-     Ext::UNDEFINED, kESSLInternalBackendBuiltIns, -1, Shader::ALL},
-    {"beginInvocationInterlockARB", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED,
-     kESSLInternalBackendBuiltIns, -1, Shader::ALL},
-    {"endInvocationInterlockARB", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED,
-     kESSLInternalBackendBuiltIns, -1, Shader::ALL},
+    {"clamp", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130, Shader::ALL},
+    {"tan", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
     {"memoryBarrier", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 420,
      Shader::ALL},
-    {"memoryBarrierAtomicCounter", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310,
-     430, Shader::ALL},
-    {"memoryBarrierBuffer", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 430,
+    {"dFdy", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 0, Shader::FRAGMENT},
+    {"textureGather", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400,
      Shader::ALL},
-    {"memoryBarrierImage", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 430,
+    {"texture2DProjLod", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 100, -1,
+     Shader::VERTEX},
+    {"textureOffset", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130,
+     Shader::ALL},
+    {"atomicOr", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 430,
+     Shader::ALL},
+    {"min", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 300, 130, Shader::ALL},
+    {"atomicAnd", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 430,
      Shader::ALL},
-    {"barrier", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 320, -1,
-     Shader::TESS_CONTROL_EXT},
-    {"memoryBarrierShared", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 430,
-     Shader::COMPUTE},
-    {"groupMemoryBarrier", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 430,
-     Shader::COMPUTE},
-    {"EmitVertex", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 320, -1,
-     Shader::GEOMETRY},
-    {"EndPrimitive", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 320, -1,
-     Shader::GEOMETRY},
-    {"subpassLoad", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED,
-     kESSLInternalBackendBuiltIns, 460, Shader::ALL},
     {"numSamples", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED,
      kESSLInternalBackendBuiltIns, -1, Shader::FRAGMENT},
-    {"samplePosition", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED,
-     kESSLInternalBackendBuiltIns, -1, Shader::FRAGMENT},
-    {"interpolateAtCenter", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED,
-     kESSLInternalBackendBuiltIns, -1, Shader::FRAGMENT},
-    {"saturate", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED,
-     kESSLInternalBackendBuiltIns, -1, Shader::ALL}};
+    {"unpackUnorm4x8", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 310, 400,
+     Shader::ALL},
+    {"any", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 0, 0, Shader::ALL},
+    {"EmitVertex", std::array<TExtension, 1>{{Ext::UNDEFINED}}, Ext::UNDEFINED, 320, -1,
+     Shader::GEOMETRY}};
 
 }  // namespace BuiltInArray
 
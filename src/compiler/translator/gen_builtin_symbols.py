@@ -1,11 +1,4 @@
-#!/usr/bin/env vpython3
-#
-# [VPYTHON:BEGIN]
-# wheel: <
-#   name: "infra/python/wheels/perfect-hash-py2_py3"
-#   version: "version:0.2.1"
-# >
-# [VPYTHON:END]
+#!/usr/bin/env python3
 #
 # Copyright 2018 The ANGLE Project Authors. All rights reserved.
 # Use of this source code is governed by a BSD-style license that can be
@@ -15,10 +8,6 @@
 #  Code generation for the built-in symbol tables.
 import sys
 
-# Conditional import enables getting inputs/outputs with python3 instead of vpython3
-if len(sys.argv) < 2:
-    from perfect_hash import generate_hash, Hash2
-
 from collections import OrderedDict
 import argparse
 import copy
@@ -26,7 +15,11 @@ import hashlib
 import json
 import re
 import os
-import random
+import pickle
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../scripts'))
+import autogen_writer
+import minimal_perfect_hash
 
 template_immutablestring_cpp = """// GENERATED FILE - DO NOT EDIT.
 // Generated by {script_name} using data from {variable_data_source_name} and
@@ -47,63 +40,15 @@ std::ostream &operator<<(std::ostream &os, const sh::ImmutableString &str)
     return os.write(str.data(), str.length());
 }}
 
-#if defined(_MSC_VER)
-#    pragma warning(disable : 4309)  // truncation of constant value
-#endif
-
-
 namespace
 {{
 
-constexpr int mangledkT1[] = {{{mangled_S1}}};
-constexpr int mangledkT2[] = {{{mangled_S2}}};
-constexpr int mangledkG[] = {{{mangled_G}}};
-
-int MangledHashG(const char *key, const int *T)
-{{
-    int sum = 0;
-
-    for (int i = 0; key[i] != '\\0'; i++)
-    {{
-        sum += T[i] * key[i];
-        sum %= {mangled_NG};
-    }}
-    return mangledkG[sum];
-}}
-
-int MangledPerfectHash(const char *key)
-{{
-    if (strlen(key) > {mangled_NS})
-        return 0;
-
-    return (MangledHashG(key, mangledkT1) + MangledHashG(key, mangledkT2)) % {mangled_NG};
-}}
-
-constexpr int unmangledkT1[] = {{{unmangled_S1}}};
-constexpr int unmangledkT2[] = {{{unmangled_S2}}};
-constexpr int unmangledkG[] = {{{unmangled_G}}};
-
-int UnmangledHashG(const char *key, const int *T)
-{{
-    int sum = 0;
-
-    for (int i = 0; key[i] != '\\0'; i++)
-    {{
-        sum += T[i] * key[i];
-        sum %= {unmangled_NG};
-    }}
-    return unmangledkG[sum];
-}}
+{perfect_hash_function}
 
-int UnmangledPerfectHash(const char *key)
-{{
-    if (strlen(key) > {unmangled_NS})
-        return 0;
+constexpr uint16_t kMangledSeeds[]   = {{{mangled_seeds}}};
+constexpr uint16_t kUnmangledSeeds[] = {{{unmangled_seeds}}};
 
-    return (UnmangledHashG(key, unmangledkT1) + UnmangledHashG(key, unmangledkT2)) % {unmangled_NG};
-}}
-
-}}
+}}  // namespace
 
 namespace sh
 {{
@@ -124,12 +69,12 @@ const size_t ImmutableString::FowlerNollVoHash<8>::kFnvOffsetBasis =
 
 uint32_t ImmutableString::mangledNameHash() const
 {{
-    return MangledPerfectHash(data());
+    return MinimalPerfectHash(data(), kMangledSeeds, {num_mangled_seeds}, {num_mangled_names});
 }}
 
 uint32_t ImmutableString::unmangledNameHash() const
 {{
-    return UnmangledPerfectHash(data());
+    return MinimalPerfectHash(data(), kUnmangledSeeds, {num_unmangled_seeds}, {num_unmangled_names});
 }}
 
 }}  // namespace sh
@@ -646,6 +591,8 @@ basic_types_enumeration = [
 
 id_counter = 0
 
+BUILTIN_SYMBOLS_CACHE_PATH = '.builtin_symbols_cache.pickle'
+
 
 def set_working_dir():
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -1310,18 +1257,7 @@ class FunctionsData:
             search_index += direction
 
 
-class HashFunction:
-
-    def __init__(self, f1, f2, G):
-        self.f1 = f1
-        self.f2 = f2
-        self.G = G
-
-    def hash(self, key):
-        return (self.G[self.f1(key)] + self.G[self.f2(key)]) % len(self.G)
-
-
-def get_parsed_functions(functions_txt_filename, essl_only):
+def get_parsed_functions(functions_txt_filename):
 
     def parse_function_parameters(parameters):
         if parameters == '':
@@ -1385,18 +1321,27 @@ def get_parsed_functions(functions_txt_filename, essl_only):
                     'parameters': parse_function_parameters(parameters)
                 }
                 function_props.update(default_metadata)
-                if essl_only:
-                    # Skip GLSL-only functions
-                    if 'essl_level' in function_props:
-                        group_stack[-1]['functions'].append(function_props)
-                else:
-                    group_stack[-1]['functions'].append(function_props)
+                group_stack[-1]['functions'].append(function_props)
             else:
                 raise Exception('Unexpected function input line: ' + line)
 
     return parsed_functions
 
 
+# Returns a copy of the parsed function groups without the GLSL-only functions.
+def get_essl_functions(groups):
+    essl_groups = OrderedDict()
+    for group_name, group in groups.items():
+        essl_group = dict(group)
+        essl_group['functions'] = [
+            function_props for function_props in group['functions']
+            if 'essl_level' in function_props
+        ]
+        essl_group['subgroups'] = get_essl_functions(group['subgroups'])
+        essl_groups[group_name] = essl_group
+    return essl_groups
+
+
 def mangledNameHash(str, hashfn, script_generated_hash_tests, unmangled, save_test=True):
     hash = hashfn.hash(str)
     if save_test:
@@ -2052,7 +1997,66 @@ def process_variable_group(shader_type, group_name, group, symbols, variables, m
                                    mangled_builtins)
 
 
-def generate_files(essl_only, args, functions_txt_filename, variables_json_filename,
+# The parsed built-in functions and variables, and the names the perfect hashes are built for.
+# The inputs are parsed once; the ESSL-only outputs are generated from a filtered view of the
+# database of the complete (GLSL + ESSL) outputs.
+class BuiltinSymbolDatabase:
+
+    def __init__(self, functions, variables):
+        self.functions = functions
+        self.variables = variables
+
+        mangled_names = []
+        unmangled_names = []
+        for group_name, group in functions.items():
+            get_function_names(group, mangled_names, unmangled_names)
+        for group_name, group in variables.items():
+            get_variable_names(group, mangled_names)
+        self.mangled_names = list(dict.fromkeys(mangled_names))
+        self.unmangled_names = list(dict.fromkeys(unmangled_names))
+
+    def get_essl_only_view(self):
+        # TODO(http://anglebug.com/42262479): skip GLSL-only vars when they are added
+        return BuiltinSymbolDatabase(get_essl_functions(self.functions), self.variables)
+
+
+# Returns the databases of the complete and of the ESSL-only outputs. They are cached on disk,
+# keyed on the inputs and on this script.
+def get_symbol_databases(functions_txt_filename, variables_json_filename):
+    key = hashlib.sha256()
+    for path in [os.path.abspath(__file__), functions_txt_filename, variables_json_filename]:
+        with open(path, 'rb') as f:
+            key.update(f.read())
+    key = key.hexdigest()
+
+    try:
+        with open(BUILTIN_SYMBOLS_CACHE_PATH, 'rb') as f:
+            cached_key, databases = pickle.load(f)
+        if cached_key == key:
+            return databases
+    except (OSError, EOFError, AttributeError, ValueError, pickle.UnpicklingError):
+        pass
+
+    with open(variables_json_filename) as f:
+        parsed_variables = json.load(f, object_pairs_hook=OrderedDict)
+    database = BuiltinSymbolDatabase(
+        get_parsed_functions(functions_txt_filename), parsed_variables)
+    databases = (database, database.get_essl_only_view())
+
+    # Caching is best effort. Pickling fails when this script is not the __main__ module, e.g. when
+    # profiled.
+    temp_path = BUILTIN_SYMBOLS_CACHE_PATH + '.tmp'
+    try:
+        with open(temp_path, 'wb') as f:
+            pickle.dump((key, databases), f, pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, BUILTIN_SYMBOLS_CACHE_PATH)
+    except (OSError, pickle.PicklingError):
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return databases
+
+
+def generate_files(essl_only, args, database, functions_txt_filename, variables_json_filename,
                    immutablestring_cpp_filename, immutablestringtest_cpp_filename,
                    builtin_header_filename, symboltable_cpp_filename, operator_header_filename,
                    symboltable_header_filename):
@@ -2061,7 +2065,8 @@ def generate_files(essl_only, args, functions_txt_filename, variables_json_filen
     variables = VariablesData()
     functions = FunctionsData()
 
-    parsed_functions = get_parsed_functions(functions_txt_filename, essl_only)
+    parsed_functions = database.functions
+    parsed_variables = database.variables
 
     if args.dump_intermediate_json:
         with open('builtin_functions_ESSL.json' if essl_only else 'builtin_functions.json',
@@ -2076,40 +2081,21 @@ def generate_files(essl_only, args, functions_txt_filename, variables_json_filen
             json.dump(
                 parsed_functions, outfile, indent=4, separators=(',', ': '), default=serialize_obj)
 
-    parsed_variables = None
-    with open(variables_json_filename) as f:
-        # TODO(http://anglebug.com/42262479): skip loading GLSL-only vars when they are added if essl_only
-        parsed_variables = json.load(f, object_pairs_hook=OrderedDict)
-
     # This script uses a perfect hash function to avoid dealing with collisions
-    mangled_names = []
-    unmangled_names = []
-    for group_name, group in parsed_functions.items():
-        get_function_names(group, mangled_names, unmangled_names)
-    for group_name, group in parsed_variables.items():
-        get_variable_names(group, mangled_names)
 
     # Hashing mangled names
-    mangled_names = list(dict.fromkeys(mangled_names))
+    mangled_names = database.mangled_names
     num_mangled_names = len(mangled_names)
-    mangled_names_dict = dict(zip(mangled_names, range(0, len(mangled_names))))
     # Generate the perfect hash function
-    f1, f2, mangled_G = generate_hash(mangled_names_dict, Hash2)
-    mangled_hashfn = HashFunction(f1, f2, mangled_G)
-    mangled_S1 = f1.salt
-    mangled_S2 = f2.salt
+    mangled_hashfn = minimal_perfect_hash.build(mangled_names)
     # Array for querying mangled builtins
     mangled_builtins = GroupedList(mangled_hashfn, num_mangled_names)
 
     # Hashing unmangled names
-    unmangled_names = list(dict.fromkeys(unmangled_names))
+    unmangled_names = database.unmangled_names
     num_unmangled_names = len(unmangled_names)
-    unmangled_names_dict = dict(zip(unmangled_names, range(0, len(unmangled_names))))
     # Generate the perfect hash function
-    f1, f2, unmangled_G = generate_hash(unmangled_names_dict, Hash2)
-    unmangled_hashfn = HashFunction(f1, f2, unmangled_G)
-    unmangled_S1 = f1.salt
-    unmangled_S2 = f2.salt
+    unmangled_hashfn = minimal_perfect_hash.build(unmangled_names)
     # Array for querying unmangled builtins
     unmangled_function_if_statements = UnmangledGroupedList(unmangled_hashfn, num_unmangled_names)
 
@@ -2178,60 +2164,49 @@ def generate_files(essl_only, args, functions_txt_filename, variables_json_filen
             '\n'.join(symbols.script_generated_hash_tests.keys()),
         'unmangled_script_generated_hash_tests':
             '\n'.join(symbols.unmangled_script_generated_hash_tests.keys()),
-        'mangled_S1':
-            str(mangled_S1).replace('[', ' ').replace(']', ' '),
-        'mangled_S2':
-            str(mangled_S2).replace('[', ' ').replace(']', ' '),
-        'mangled_G':
-            str(mangled_G).replace('[', ' ').replace(']', ' '),
-        'mangled_NG':
-            len(mangled_G),
-        'mangled_NS':
-            len(mangled_S1),
-        'unmangled_S1':
-            str(unmangled_S1).replace('[', ' ').replace(']', ' '),
-        'unmangled_S2':
-            str(unmangled_S2).replace('[', ' ').replace(']', ' '),
-        'unmangled_G':
-            str(unmangled_G).replace('[', ' ').replace(']', ' '),
-        'unmangled_NG':
-            len(unmangled_G),
-        'unmangled_NS':
-            len(unmangled_S1),
+        'perfect_hash_function':
+            minimal_perfect_hash.CPP_LOOKUP_FUNCTION,
+        'mangled_seeds':
+            mangled_hashfn.format_seeds(),
+        'num_mangled_seeds':
+            len(mangled_hashfn.seeds),
+        'unmangled_seeds':
+            unmangled_hashfn.format_seeds(),
+        'num_unmangled_seeds':
+            len(unmangled_hashfn.seeds),
         'header_label':
             'ESSL_' if essl_only else 'complete_',
         'source_label':
             'ESSL_' if essl_only else ''
     }
 
-    with open(immutablestring_cpp_filename, 'wt') as outfile_cpp:
+    with autogen_writer.open_output(immutablestring_cpp_filename, 'wt') as outfile_cpp:
         output_cpp = template_immutablestring_cpp.format(**output_strings)
         outfile_cpp.write(output_cpp)
 
-    with open(immutablestringtest_cpp_filename, 'wt') as outfile_cpp:
+    with autogen_writer.open_output(immutablestringtest_cpp_filename, 'wt') as outfile_cpp:
         output_cpp = template_immutablestringtest_cpp.format(**output_strings)
         outfile_cpp.write(output_cpp)
 
-    with open(builtin_header_filename, 'wt') as outfile_header:
+    with autogen_writer.open_output(builtin_header_filename, 'wt') as outfile_header:
         output_header = template_builtin_header.format(**output_strings)
         outfile_header.write(output_header)
 
-    with open(symboltable_cpp_filename, 'wt') as outfile_cpp:
+    with autogen_writer.open_output(symboltable_cpp_filename, 'wt') as outfile_cpp:
         output_cpp = template_symboltable_cpp.format(**output_strings)
         outfile_cpp.write(output_cpp)
 
     if not essl_only:
-        with open(operator_header_filename, 'wt') as outfile_header:
+        with autogen_writer.open_output(operator_header_filename, 'wt') as outfile_header:
             output_header = template_operator_header.format(**output_strings)
             outfile_header.write(output_header)
 
-        with open(symboltable_header_filename, 'wt') as outfile_h:
+        with autogen_writer.open_output(symboltable_header_filename, 'wt') as outfile_h:
             output_h = template_symboltable_header.format(**output_strings)
             outfile_h.write(output_h)
 
 
 def main():
-    random.seed(0)
     set_working_dir()
 
     parser = argparse.ArgumentParser()
@@ -2252,6 +2227,8 @@ def main():
         inputs = [
             functions_txt_filename,
             variables_json_filename,
+            '../../../scripts/autogen_writer.py',
+            '../../../scripts/minimal_perfect_hash.py',
         ]
         outputs = [
             'ImmutableString_autogen.cpp',
@@ -2275,15 +2252,20 @@ def main():
             return 1
         return 0
 
+    database, essl_database = get_symbol_databases(functions_txt_filename, variables_json_filename)
+
+    # The ids of the ESSL-only symbols follow those of the complete symbol table, so the outputs are
+    # generated in order.
+
     # Generate files based on GLSL + ESSL symbols
-    generate_files(False, args, functions_txt_filename, variables_json_filename,
+    generate_files(False, args, database, functions_txt_filename, variables_json_filename,
                    'ImmutableString_autogen.cpp', test_filename,
                    'tree_util/BuiltIn_complete_autogen.h', 'SymbolTable_autogen.cpp',
                    'Operator_autogen.h', 'SymbolTable_autogen.h')
 
     # Generate files based on only ESSL symbols
     # Symbol table with GLSL + ESSL symbols is too large for Android
-    generate_files(True, args, functions_txt_filename, variables_json_filename,
+    generate_files(True, args, essl_database, functions_txt_filename, variables_json_filename,
                    'ImmutableString_ESSL_autogen.cpp', essl_test_filename,
                    'tree_util/BuiltIn_ESSL_autogen.h', 'SymbolTable_ESSL_autogen.cpp',
                    'Operator_autogen.h', 'SymbolTable_autogen.h')
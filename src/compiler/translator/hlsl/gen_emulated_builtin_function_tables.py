@@ -10,6 +10,9 @@
 import json
 import os, sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../../scripts'))
+import autogen_writer
+
 template_emulated_builtin_functions_hlsl = """// GENERATED FILE - DO NOT EDIT.
 // Generated by {script_name} using data from {data_source_name}.
 //
@@ -118,7 +121,7 @@ def main():
 
     # auto_script parameters.
     if len(sys.argv) > 1:
-        inputs = [input_script]
+        inputs = [input_script, '../../../../scripts/autogen_writer.py']
         outputs = [hlsl_fname]
 
         if sys.argv[1] == 'inputs':
@@ -141,7 +144,7 @@ def main():
         data_source_name=input_script,
         emulated_functions="".join(emulated_functions))
 
-    with open(hlsl_fname, 'wt') as f:
+    with autogen_writer.open_output(hlsl_fname, 'wt') as f:
         f.write(hlsl_gen)
         f.close()
 
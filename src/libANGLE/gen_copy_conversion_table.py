@@ -13,6 +13,9 @@ import os
 sys.path.append('renderer')
 import angle_format
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../scripts'))
+import autogen_writer
+
 template_cpp = """// GENERATED FILE - DO NOT EDIT.
 // Generated by {script_name} using data from {data_source_name}.
 //
@@ -74,7 +77,7 @@ def main():
 
     # auto_script parameters.
     if len(sys.argv) > 1:
-        inputs = ['renderer/angle_format.py', data_source_name]
+        inputs = ['renderer/angle_format.py', data_source_name, '../../scripts/autogen_writer.py']
         outputs = [out_file_name]
 
         if sys.argv[1] == 'inputs':
@@ -101,7 +104,7 @@ def main():
     for texture_format, framebuffer_formats in sorted(format_map.items()):
         texture_format_cases += parse_texture_format_case(texture_format, framebuffer_formats)
 
-    with open(out_file_name, 'wt') as out_file:
+    with autogen_writer.open_output(out_file_name, 'wt') as out_file:
         output_cpp = template_cpp.format(
             script_name=os.path.basename(sys.argv[0]),
             data_source_name=data_source_name,
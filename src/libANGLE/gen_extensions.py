@@ -19,6 +19,7 @@ ANGLE_SRC_DIR = d(d(THIS_DIR))
 SCRIPTS_DIR = os.path.join(ANGLE_SRC_DIR, 'scripts')
 sys.path.insert(0, SCRIPTS_DIR)
 
+import autogen_writer
 import registry_xml
 
 _MD_GLES_GPU_CONFIGS = [
@@ -335,7 +336,7 @@ def format_ext_strings(ext_infos):
 
 
 def write_file(fname, template, format_args):
-    with open(fname, 'w') as f:
+    with autogen_writer.open_output(fname, 'w') as f:
         formatted = template.format(**format_args)
         f.write(formatted)
         f.close()
@@ -395,7 +396,7 @@ def main():
     ]
     if len(sys.argv) > 1:
         inputs = ['../../scripts/%s' % xml_input for xml_input in registry_xml.xml_inputs
-                 ] + ext_jsons + gles1_ext_jsons
+                 ] + ext_jsons + gles1_ext_jsons + ['../../scripts/autogen_writer.py']
         outputs = [gles_h_output_name, gles_cpp_output_name, md_output_name]
         if sys.argv[1] == 'inputs':
             print(','.join(inputs))
@@ -14,6 +14,9 @@ import os
 sys.path.append('renderer')
 import angle_format
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../scripts'))
+import autogen_writer
+
 template_cpp = """// GENERATED FILE - DO NOT EDIT.
 // Generated by {script_name} using data from {data_source_name}.
 // ES3 format info from {es3_data_source_name}.
@@ -128,7 +131,8 @@ def main():
     # auto_script parameters.
     if len(sys.argv) > 1:
         inputs = [
-            'renderer/angle_format.py', 'es3_format_type_combinations.json', 'format_map_data.json'
+            'renderer/angle_format.py', 'es3_format_type_combinations.json',
+            'format_map_data.json', '../../scripts/autogen_writer.py'
         ]
         outputs = ['format_map_autogen.cpp']
 
@@ -192,7 +196,7 @@ def main():
 
         es3_combo_cases += template_format_case.format(format=format, type_cases=this_type_cases)
 
-    with open('format_map_autogen.cpp', 'wt') as out_file:
+    with autogen_writer.open_output('format_map_autogen.cpp', 'wt') as out_file:
         output_cpp = template_cpp.format(
             script_name=os.path.basename(sys.argv[0]),
             data_source_name=input_script,
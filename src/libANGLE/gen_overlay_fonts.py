@@ -20,6 +20,11 @@
 #  NOTE: don't run this script directly. Run scripts/run_code_generation.py.
 
 import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../scripts'))
+import autogen_writer
+import c_array_writer
 
 # Conditional import enables getting inputs/outputs with python3 instead of vpython3
 if len(sys.argv) < 2:
@@ -119,8 +124,8 @@ const uint8_t *OverlayState::getFontData() const
 
 def main():
     if len(sys.argv) == 2 and sys.argv[1] == 'inputs':
-        # disabled because of issues on Windows. http://anglebug.com/42262538
-        # print(font_file)
+        # font_file is not listed because of issues on Windows. http://anglebug.com/42262538
+        print('../../scripts/autogen_writer.py,../../scripts/c_array_writer.py')
         return
     if len(sys.argv) == 2 and sys.argv[1] == 'outputs':
         print(','.join([out_file_cpp, out_file_h]))
@@ -132,6 +137,8 @@ def main():
             '@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\]^_' + \
             '`abcdefghijklmnopqrstuvwxyz{|}~'
     char_count = len(chars)
+    # Empty pixels are padded to the width of the others so the glyphs line up in the output.
+    pixel_tokens = ['   0,'] + c_array_writer.byte_tokens('0x%02X,')[1:]
 
     font_glyph_widths = []
     font_glyph_heights = []
@@ -200,23 +207,23 @@ def main():
             assert (offset_x + width <= glyph_width)
             assert (offset_y + rows <= glyph_height)
 
-            # Write the character bitmap in the font image.
-            for y in range(glyph_height):
-                for x in range(glyph_width):
-                    if y < offset_y or y >= offset_y + rows or x < offset_x or x >= offset_x + width:
-                        font_data += '   0,'
-                    else:
-                        pixel_value = bitmap.buffer[(y - offset_y) * pitch + (x - offset_x)]
-                        if pixel_value == 0:
-                            font_data += '   0,'
-                        else:
-                            font_data += '0x{:02X},'.format(pixel_value)
-                font_data += '\n'
+            # Write the character bitmap in the font image, clipping the columns left of the glyph
+            # when bitmap_left is negative.
+            src_x = max(0, -offset_x)
+            dst_x = max(0, offset_x)
+            copy_width = max(0, width - src_x)
+            glyph = bytearray(glyph_width * glyph_height)
+            for row in range(max(0, -offset_y), rows):
+                src = row * pitch + src_x
+                dst = (offset_y + row) * glyph_width + dst_x
+                glyph[dst:dst + copy_width] = bitmap.buffer[src:src + copy_width]
+            font_data += c_array_writer.format_bytes_with_tokens(
+                glyph, pixel_tokens, glyph_width, line_separator='\n', element_separator='') + '\n'
 
         font_mips.append('constexpr uint32_t ' + font_mip_symbol + ' = ' + font_mip + ';')
         current_font_mip += 1
 
-    with open(out_file_h, 'w') as outfile:
+    with autogen_writer.open_output(out_file_h, 'w') as outfile:
         outfile.write(
             template_out_file_h.format(
                 script_name=os.path.basename(__file__),
@@ -232,7 +239,7 @@ def main():
                 font_mips='\n'.join(font_mips)))
         outfile.close()
 
-    with open(out_file_cpp, 'w') as outfile:
+    with autogen_writer.open_output(out_file_cpp, 'w') as outfile:
         outfile.write(
             template_out_file_cpp.format(
                 script_name=os.path.basename(__file__),
@@ -13,6 +13,9 @@ import json
 import os
 import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../scripts'))
+import autogen_writer
+
 OUT_SOURCE_FILE_NAME = 'Overlay_autogen.cpp'
 OUT_HEADER_FILE_NAME = 'Overlay_autogen.h'
 
@@ -360,7 +363,7 @@ def generate_widget_init(widget):
 
 def main():
     if len(sys.argv) == 2 and sys.argv[1] == 'inputs':
-        print(IN_JSON_FILE_NAME)
+        print(','.join([IN_JSON_FILE_NAME, '../../scripts/autogen_writer.py']))
         return
     if len(sys.argv) == 2 and sys.argv[1] == 'outputs':
         outputs = [
@@ -389,7 +392,7 @@ def main():
     for widget_properties in widgets:
         init_widgets.append(generate_widget_init(overlay_widgets[widget_properties['name']]))
 
-    with open(OUT_SOURCE_FILE_NAME, 'w') as outfile:
+    with autogen_writer.open_output(OUT_SOURCE_FILE_NAME, 'w') as outfile:
         outfile.write(
             OUT_SOURCE_FILE_TEMPLATE.format(
                 script_name=os.path.basename(__file__),
@@ -398,7 +401,7 @@ def main():
                 init_widgets='\n'.join(init_widgets)))
         outfile.close()
 
-    with open(OUT_HEADER_FILE_NAME, 'w') as outfile:
+    with autogen_writer.open_output(OUT_HEADER_FILE_NAME, 'w') as outfile:
         widget_ids = [WIDGET_ID_TEMPLATE.format(**widget) for widget in widgets]
         widget_x_defs = ["PROC(" + widget['name'] + ")" for widget in widgets]
 
@@ -10,6 +10,9 @@
 
 import sys, os, pprint
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../../../scripts'))
+import autogen_writer
+
 template_blitshader_source = """// GENERATED FILE - DO NOT EDIT.
 // Generated by {script_name}.
 //
@@ -294,7 +297,7 @@ def write_inc_file(get_blitshaders_case_list, add_blitshader_case_list, shader_i
 
     path = os.path.join("Blit11Helper_autogen.inc")
 
-    with open(path, "w") as out:
+    with autogen_writer.open_output(path, "w") as out:
         out.write(content)
         out.close()
 
@@ -306,7 +309,7 @@ def write_gni_file(shader_filename_list):
 
     path = os.path.join("d3d11_blit_shaders_autogen.gni")
 
-    with open(path, "w") as out:
+    with autogen_writer.open_output(path, "w") as out:
         out.write(content)
         out.close()
 
@@ -315,7 +318,7 @@ def main():
 
     # auto_script parameters.
     if len(sys.argv) > 1:
-        inputs = []
+        inputs = ['../../../../../scripts/autogen_writer.py']
         outputs = ['Blit11Helper_autogen.inc', 'd3d11_blit_shaders_autogen.gni']
 
         if sys.argv[1] == 'inputs':
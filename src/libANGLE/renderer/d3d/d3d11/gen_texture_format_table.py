@@ -17,6 +17,9 @@ import sys
 sys.path.append('../..')
 import angle_format
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../../../scripts'))
+import autogen_writer
+
 template_texture_format_table_autogen_cpp = """// GENERATED FILE - DO NOT EDIT.
 // Generated by {script_name} using data from {data_source_name}
 //
@@ -298,7 +301,10 @@ def main():
 
     # auto_script parameters.
     if len(sys.argv) > 1:
-        inputs = ['../../angle_format.py', data_source_name, map_file_name]
+        inputs = [
+            '../../angle_format.py', data_source_name, map_file_name,
+            '../../../../../scripts/autogen_writer.py'
+        ]
         outputs = ['texture_format_table_autogen.cpp']
 
         if sys.argv[1] == 'inputs':
@@ -318,7 +324,7 @@ def main():
         script_name=os.path.basename(sys.argv[0]),
         angle_format_info_cases=angle_format_cases,
         data_source_name=data_source_name)
-    with open('texture_format_table_autogen.cpp', 'wt') as out_file:
+    with autogen_writer.open_output('texture_format_table_autogen.cpp', 'wt') as out_file:
         out_file.write(output_cpp)
         out_file.close()
     return 0
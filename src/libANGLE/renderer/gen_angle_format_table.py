@@ -16,6 +16,9 @@ import pprint
 import re
 import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../scripts'))
+import autogen_writer
+
 template_autogen_h = """// GENERATED FILE - DO NOT EDIT.
 // Generated by {script_name} using data from {data_source_name}
 //
@@ -409,7 +412,10 @@ def main():
 
     # auto_script parameters.
     if len(sys.argv) > 1:
-        inputs = ['angle_format.py', 'angle_format_data.json', 'angle_format_map.json']
+        inputs = [
+            'angle_format.py', 'angle_format_data.json', 'angle_format_map.json',
+            '../../../scripts/autogen_writer.py'
+        ]
         outputs = ['Format_table_autogen.cpp', 'FormatID_autogen.h']
 
         if sys.argv[1] == 'inputs':
@@ -434,7 +440,7 @@ def main():
         angle_format_info_cases=angle_format_cases,
         angle_format_switch=switch_data,
         data_source_name=data_source_name)
-    with open('Format_table_autogen.cpp', 'wt') as out_file:
+    with autogen_writer.open_output('Format_table_autogen.cpp', 'wt') as out_file:
         out_file.write(output_cpp)
         out_file.close()
 
@@ -445,7 +451,7 @@ def main():
         angle_format_enum=enum_data,
         data_source_name=data_source_name,
         num_angle_formats=num_angle_formats)
-    with open('FormatID_autogen.h', 'wt') as out_file:
+    with autogen_writer.open_output('FormatID_autogen.h', 'wt') as out_file:
         out_file.write(output_h)
         out_file.close()
 
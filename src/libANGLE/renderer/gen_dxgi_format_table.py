@@ -13,6 +13,9 @@ import os
 
 from functools import reduce
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../scripts'))
+import autogen_writer
+
 template_cpp = """// GENERATED FILE - DO NOT EDIT.
 // Generated by {script_name} using data from {data_source_name}.
 //
@@ -92,6 +95,7 @@ def main():
             'angle_format.py',
             'angle_format_map.json',
             'dxgi_format_data.json',
+            '../../../scripts/autogen_writer.py',
         ]
         outputs = ['dxgi_format_map_autogen.cpp']
 
@@ -145,7 +149,7 @@ def main():
         else:
             format_cases += undefined_case(dxgi_format)
 
-    with open('dxgi_format_map_autogen.cpp', 'wt') as out_file:
+    with autogen_writer.open_output('dxgi_format_map_autogen.cpp', 'wt') as out_file:
         output_cpp = template_cpp.format(
             script_name=os.path.basename(sys.argv[0]),
             data_source_name=input_data,
@@ -21,6 +21,10 @@
 
 import sys
 import json
+import os
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../scripts'))
+import autogen_writer
 
 macro_prefix = 'F_'
 
@@ -302,7 +306,7 @@ def main():
 
     # auto_script parameters.
     if len(sys.argv) > 1:
-        inputs = ['dxgi_support_data.json']
+        inputs = ['dxgi_support_data.json', '../../../scripts/autogen_writer.py']
         outputs = ['dxgi_support_table_autogen.cpp']
 
         if sys.argv[1] == 'inputs':
@@ -332,7 +336,7 @@ def main():
             table_data_11_0=table_data['11_0'],
             table_data_11_1=table_data['11_1'])
 
-        with open('dxgi_support_table_autogen.cpp', 'wt') as out_file:
+        with autogen_writer.open_output('dxgi_support_table_autogen.cpp', 'wt') as out_file:
             out_file.write(out_data)
             out_file.close()
     return 0
@@ -14,6 +14,10 @@ import json, sys
 
 sys.path.append('../..')
 import angle_format
+import os
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../scripts'))
+import autogen_writer
 
 template = """// GENERATED FILE - DO NOT EDIT.
 // Generated by gen_load_functions_table.py using data from load_functions_data.json
@@ -201,7 +205,9 @@ def main():
 
     # auto_script parameters.
     if len(sys.argv) > 1:
-        inputs = ['angle_format.py', 'load_functions_data.json']
+        inputs = [
+            'angle_format.py', 'load_functions_data.json', '../../../scripts/autogen_writer.py'
+        ]
         outputs = ['load_functions_table_autogen.cpp']
 
         if sys.argv[1] == 'inputs':
@@ -222,7 +228,7 @@ def main():
         switch_data=switch_data,
         load_functions_data=load_functions_data)
 
-    with open('load_functions_table_autogen.cpp', 'wt') as out_file:
+    with autogen_writer.open_output('load_functions_table_autogen.cpp', 'wt') as out_file:
         out_file.write(output)
         out_file.close()
     return 0
@@ -12,12 +12,16 @@ import os
 import re
 import xml.etree.ElementTree as etree
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../../scripts'))
+import autogen_writer
+
 # Set the CWD to the script directory.
 os.chdir(os.path.dirname(os.path.abspath(sys.argv[0])))
 
 sys.path.append('..')
 import angle_format
 
+
 def safe_append(the_dict, key, element):
     if key not in the_dict:
         the_dict[key] = []
@@ -252,6 +256,7 @@ def main():
             '../../../../third_party/OpenGL-Registry/src/xml/gl.xml',
             '../angle_format.py',
             'gl_bindings_data.json',
+            '../../../../scripts/autogen_writer.py',
         ]
         outputs = [
             'DispatchTableGL_autogen.cpp',
@@ -410,7 +415,7 @@ def main():
         file_name=dispatch_header_path,
         table_data="\n\n".join(table_data))
 
-    with open(dispatch_header_path, "w") as out:
+    with autogen_writer.open_output(dispatch_header_path, "w") as out:
         out.write(dispatch_table_header)
 
     gl_data = []
@@ -451,7 +456,7 @@ def main():
         gles2_null_extensions_data="\n\n".join(nullify(gles2_extensions_data)),
         both_null_extensions_data="\n\n".join(nullify(both_extensions_data)))
 
-    with open(dispatch_source_path, "w") as out:
+    with autogen_writer.open_output(dispatch_source_path, "w") as out:
         out.write(dispatch_table_source)
 
     # Generate the NULL/stub entry points.
@@ -488,7 +493,7 @@ def main():
         file_name=null_functions_header_path,
         table_data="\n".join(null_decls))
 
-    with open(null_functions_header_path, "w") as out:
+    with autogen_writer.open_output(null_functions_header_path, "w") as out:
         out.write(null_functions_header)
 
     null_functions_source = null_functions_source_template.format(
@@ -497,7 +502,7 @@ def main():
         file_name=null_functions_source_path,
         table_data="\n\n".join(null_stubs))
 
-    with open(null_functions_source_path, "w") as out:
+    with autogen_writer.open_output(null_functions_source_path, "w") as out:
         out.write(null_functions_source)
     return 0
 
@@ -24,6 +24,9 @@ import sys
 sys.path.append('..')
 import angle_format as angle_format_utils
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../../scripts'))
+import autogen_writer
+
 template_autogen_inl = """// GENERATED FILE - DO NOT EDIT.
 // Generated by {script_name} using data from {data_source_name}
 //
@@ -726,7 +729,10 @@ def main():
     data_source_name = 'mtl_format_map.json'
     # auto_script parameters.
     if len(sys.argv) > 1:
-        inputs = ['../angle_format.py', '../angle_format_map.json', data_source_name]
+        inputs = [
+            '../angle_format.py', '../angle_format_map.json', data_source_name,
+            '../../../../scripts/autogen_writer.py'
+        ]
         outputs = ['mtl_format_table_autogen.mm']
 
         if sys.argv[1] == 'inputs':
@@ -758,7 +764,7 @@ def main():
         mtl_pixel_format_switch=image_mtl_to_angle_switch_data,
         angle_vertex_format_switch=vertex_switch_data,
         metal_format_caps=caps_init_str)
-    with open('mtl_format_table_autogen.mm', 'wt') as out_file:
+    with autogen_writer.open_output('mtl_format_table_autogen.mm', 'wt') as out_file:
         out_file.write(output_cpp)
         out_file.close()
 
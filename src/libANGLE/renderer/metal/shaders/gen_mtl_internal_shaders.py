@@ -16,6 +16,9 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
 import angle_format
 import gen_angle_format_table
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../../../scripts'))
+import autogen_writer
+
 metal_source_output_header = "mtl_internal_shaders_src_autogen.h"
 
 metal_shader_output_file = "mtl_internal_shaders_autogen.metal"
@@ -29,6 +32,7 @@ template_header_boilerplate = """// GENERATED FILE - DO NOT EDIT.
 //
 """
 
+
 def gen_shader_enums_code(angle_formats):
 
     code = """// This file is similar to src/libANGLE/renderer/FormatID_autogen.h but is used by Metal default
@@ -116,7 +120,7 @@ def generate_combined_metal_src_header(combined_metal_src, dest_header):
     boilerplate_code = template_header_boilerplate.format(
         script_name=os.path.basename(sys.argv[0]))
 
-    with open(dest_header, 'wt') as out_file:
+    with autogen_writer.open_output(dest_header, 'wt') as out_file:
         out_file.write(boilerplate_code)
         out_file.write('\n')
         out_file.write('// C++ string version of combined Metal default shaders.\n\n')
@@ -131,7 +135,7 @@ def generate_combined_metal_shader_file(combined_metal_src, dest_file):
     boilerplate_code = template_header_boilerplate.format(
         script_name=os.path.basename(sys.argv[0]))
 
-    with open(dest_file, 'wt') as out_file:
+    with autogen_writer.open_output(dest_file, 'wt') as out_file:
         out_file.write(boilerplate_code)
         out_file.write('\n')
         out_file.write('// Combined Metal default shaders.\n\n')
@@ -151,7 +155,9 @@ def main():
 
     # auto_script parameters.
     if len(sys.argv) > 1:
-        inputs = angle_format_script_files + src_files + ['common.h', 'constants.h']
+        inputs = angle_format_script_files + src_files + [
+            'common.h', 'constants.h', '../../../../../scripts/autogen_writer.py'
+        ]
         outputs = [metal_source_output_header, metal_shader_output_file]
 
         if sys.argv[1] == 'inputs':
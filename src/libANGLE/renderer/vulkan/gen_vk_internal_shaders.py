@@ -9,16 +9,26 @@
 #  Because this script can be slow direct invocation is supported. But before
 #  code upload please run scripts/run_code_generation.py.
 
+import concurrent.futures
+import hashlib
 import io
 import json
+import logging
 import multiprocessing
 import os
+import pickle
 import platform
 import re
 import subprocess
 import sys
+import threading
+import time
 import gzip
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../../scripts'))
+import autogen_writer
+import c_array_writer
+
 out_file_cpp = 'vk_internal_shaders_autogen.cpp'
 out_file_h = 'vk_internal_shaders_autogen.h'
 out_file_gni = 'vk_internal_shaders_autogen.gni'
@@ -26,6 +36,15 @@ out_file_gni = 'vk_internal_shaders_autogen.gni'
 is_windows = platform.system() == 'Windows'
 is_linux = platform.system() == 'Linux'
 
+# Compiled shaders are cached here, see SpirvCache. Point ANGLE_VK_SHADER_CACHE_DIR to a directory
+# shared between checkouts to also reuse the cache from a clean checkout.
+spirv_cache_dir = os.environ.get('ANGLE_VK_SHADER_CACHE_DIR', '.spirv_cache')
+# Bump when the cached data or the way it's produced changes.
+SPIRV_CACHE_VERSION = 1
+# The least recently used entries beyond this are removed from the cache after each run. This keeps
+# the variations of a number of branches or shader edits around.
+SPIRV_CACHE_MAX_ENTRIES = 4096
+
 # Templates for the generated files:
 template_shader_library_cpp = u"""// GENERATED FILE - DO NOT EDIT.
 // Generated by {script_name} using data from {input_file_name}
@@ -194,6 +213,7 @@ constexpr uint8_t {variable_name}[] = {{
 {preprocessed_source}
 """
 
+
 # Gets the constant variable name for a generated shader.
 def get_var_name(output, prefix='k'):
     return prefix + output.replace(".", "_")
@@ -220,6 +240,11 @@ def get_output_path(name):
     return os.path.join('shaders', 'gen', name + ".inc")
 
 
+# Returns the name of the temporary file glslang writes the SPIR-V binary to.
+def get_spirv_path(output_path):
+    return output_path + '.spv'
+
+
 # Finds a path to GN's out directory
 def get_linux_glslang_exe_path():
     return '../../../../tools/glslang/glslang_validator'
@@ -314,6 +339,15 @@ def cleanup_preprocessed_shader(shader_text):
     return compact_newlines_regex.sub('\n\n', shader_text.strip())
 
 
+# Cleans up the output of the glslang preprocessor and comments it out, to be appended to the
+# generated file.
+def format_preprocessor_output(out):
+    # Clean up excessive empty lines.
+    out = cleanup_preprocessed_shader(out)
+    # Comment it out!
+    return '\n'.join([('// ' + line).strip() for line in out.splitlines()])
+
+
 def read_and_compress_spirv_blob(blob_path):
     with open(blob_path, 'rb') as blob_file:
         blob = blob_file.read()
@@ -326,8 +360,7 @@ def read_and_compress_spirv_blob(blob_path):
 
 def write_compressed_spirv_blob_as_c_array(output_path, variable_name, compressed_blob,
                                            preprocessed_source):
-    hex_array = ['0x{:02x}'.format(byte) for byte in compressed_blob]
-    blob = ',\n    '.join(','.join(hex_array[i:i + 16]) for i in range(0, len(hex_array), 16))
+    blob = c_array_writer.format_hex_bytes(compressed_blob)
     text = template_spirv_blob_inc.format(
         script_name=os.path.basename(__file__),
         out_file_name=output_path.replace('\\', '/'),
@@ -335,89 +368,186 @@ def write_compressed_spirv_blob_as_c_array(output_path, variable_name, compresse
         blob=blob,
         preprocessed_source=preprocessed_source)
 
-    with open(output_path, 'wb') as incfile:
+    with autogen_writer.open_output(output_path, 'wb') as incfile:
         incfile.write(str.encode(text))
 
 
-class CompileQueue:
-
-    class CompressAndAppendPreprocessorOutput:
-
-        def __init__(self, shader_file, preprocessor_args, output_path, variable_name):
-            # Asynchronously launch the preprocessor job.
-            self.process = subprocess.Popen(
-                preprocessor_args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-            # Store the file name for output to be appended to.
-            self.output_path = output_path
-            self.variable_name = variable_name
-            # Store info for error description.
-            self.shader_file = shader_file
-
-        def wait(self, queue):
-            (out, err) = self.process.communicate()
-            if self.process.returncode == 0:
-                # Use unix line endings.
-                out = out.replace('\r\n', '\n')
-                # Use Linux-style slashes in #line directives.
-                out = out.replace('shaders\\src\\', 'shaders/src/')
-                # Clean up excessive empty lines.
-                out = cleanup_preprocessed_shader(out)
-                # Comment it out!
-                out = '\n'.join([('// ' + line).strip() for line in out.splitlines()])
-
-                # Read the SPIR-V blob and compress it.
-                compressed_blob = read_and_compress_spirv_blob(self.output_path)
+# Persistent cache of compiled shader variations. The key covers everything the compressed SPIR-V
+# depends on: the preprocessed source (so edits to included headers are accounted for), the
+# glslang binary and the glslang arguments. Editing a shader thus only recompiles its own
+# variations, and unchanged ones are reused even across branches.
+class SpirvCache:
+
+    def __init__(self, glslang_path, cache_dir=spirv_cache_dir):
+        self.cache_dir = cache_dir
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(glslang_path, 'rb') as glslang_file:
+            self.glslang_hash = hashlib.sha256(glslang_file.read()).hexdigest()
+        self.hits = 0
+        self.misses = 0
+        # Jobs look up the cache from several threads.
+        self.lock = threading.Lock()
+
+    def key(self, compile_args, preprocessed_source):
+        key = hashlib.sha256()
+        key.update(json.dumps([SPIRV_CACHE_VERSION, self.glslang_hash, compile_args[1:]]).encode())
+        key.update(preprocessed_source.encode())
+        return key.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + '.pickle')
+
+    # Returns the compressed SPIR-V blob of the given key, or None if it was never compiled.
+    def get(self, key):
+        try:
+            with open(self._path(key), 'rb') as cache_file:
+                compressed_blob = pickle.load(cache_file)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            with self.lock:
+                self.misses += 1
+            return None
+        # Mark the entry as recently used for prune().
+        try:
+            os.utime(self._path(key))
+        except OSError:
+            pass
+        with self.lock:
+            self.hits += 1
+        return compressed_blob
+
+    def set(self, key, compressed_blob):
+        path = self._path(key)
+        temp_path = '%s.%d.tmp' % (path, os.getpid())
+        with open(temp_path, 'wb') as cache_file:
+            pickle.dump(compressed_blob, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+
+    # Removes the least recently used entries beyond SPIRV_CACHE_MAX_ENTRIES, and returns how many
+    # were removed. Another run may be pruning the same cache, so missing files are ignored.
+    def prune(self):
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if not entry.name.endswith('.pickle'):
+                continue
+            try:
+                entries.append((entry.stat().st_mtime, entry.path))
+            except OSError:
+                pass
+        entries.sort(reverse=True)
+        removed = 0
+        for _, path in entries[SPIRV_CACHE_MAX_ENTRIES:]:
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                pass
+        return removed
 
-                # Write the compressed blob as a C array in the output file, followed by the
-                # preprocessor output.
-                write_compressed_spirv_blob_as_c_array(self.output_path, self.variable_name,
-                                                       compressed_blob, out)
 
-                out = None
-            return (out, err, self.process.returncode, None,
-                    "Error running preprocessor on " + self.shader_file)
+class CompileQueue:
 
-    class CompileToSPIRV:
+    # Compiles one shader variation. Every variation is preprocessed first. The variation is then
+    # either found in the cache or compiled, and its .inc file is written. run() is called on a
+    # worker thread, and returns (out, err, returncode, description, exception_description).
+    class Job:
 
         def __init__(self, shader_file, shader_basename, variation_string, output_path,
-                     compile_args, preprocessor_args, variable_name):
-            # Asynchronously launch the compile job.
-            self.process = subprocess.Popen(
-                compile_args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-            # Store info for launching the preprocessor.
+                     compile_args, preprocessor_args, variable_name, spirv_cache):
+            self.compile_args = compile_args
             self.preprocessor_args = preprocessor_args
             self.output_path = output_path
+            self.spirv_path = get_spirv_path(output_path)
+            self.variable_name = variable_name
+            self.spirv_cache = spirv_cache
             # Store info for job and error description.
             self.shader_file = shader_file
             self.shader_basename = shader_basename
             self.variation_string = variation_string
-            self.variable_name = variable_name
+            # Filled in by run().
+            self.compiled = False
+            self.elapsed = 0
+
+        def run(self):
+            start_time = time.perf_counter()
+            try:
+                return self._run()
+            except Exception as e:
+                # e.g. glslang couldn't be started or the output couldn't be written. Report it
+                # like a failed compile, so the queue cancels the remaining jobs and raises it.
+                return (None, None, 1, None,
+                        'Error processing %s%s: %r' % (self.shader_file, self.variation_string, e))
+            finally:
+                self.elapsed = time.perf_counter() - start_time
+
+        def _run(self):
+            preprocessor = subprocess.run(
+                self.preprocessor_args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+            if preprocessor.returncode != 0:
+                return (preprocessor.stdout, preprocessor.stderr, preprocessor.returncode, None,
+                        "Error running preprocessor on " + self.shader_file)
+
+            # Use unix line endings.
+            out = preprocessor.stdout.replace('\r\n', '\n')
+            # Use Linux-style slashes in #line directives.
+            out = out.replace('shaders\\src\\', 'shaders/src/')
+
+            cache_key = self.spirv_cache.key(self.compile_args, out)
+            preprocessed_source = format_preprocessor_output(out)
+            compressed_blob = self.spirv_cache.get(cache_key)
+
+            (out, err, description) = (None, None, None)
+            if compressed_blob is None:
+                self.compiled = True
+                compiler = subprocess.run(
+                    self.compile_args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+                (out, err) = (compiler.stdout, compiler.stderr)
+                # If all the output says is the source file name, don't bother printing it.
+                if out.strip() == self.shader_file:
+                    out = None
+                description = self.output_path + ': ' + self.shader_basename + self.variation_string
+                if compiler.returncode != 0:
+                    return (out, err, compiler.returncode, description,
+                            "Error compiling " + self.shader_file)
 
-        def wait(self, queue):
-            (out, err) = self.process.communicate()
-            if self.process.returncode == 0:
-                # Insert the preprocessor job in the queue.
-                queue.append(
-                    CompileQueue.CompressAndAppendPreprocessorOutput(self.shader_file,
-                                                                     self.preprocessor_args,
-                                                                     self.output_path,
-                                                                     self.variable_name))
-            # If all the output says is the source file name, don't bother printing it.
-            if out.strip() == self.shader_file:
-                out = None
-            description = self.output_path + ': ' + self.shader_basename + self.variation_string
-            return (out, err, self.process.returncode, description,
-                    "Error compiling " + self.shader_file)
-
-    def __init__(self):
-        # Compile with as many CPU threads are detected.  Once a shader is compiled, another job is
-        # automatically added to the queue to append the preprocessor output to the generated file.
-        self.queue = []
+                # Read the SPIR-V blob and compress it.
+                compressed_blob = read_and_compress_spirv_blob(self.spirv_path)
+                os.remove(self.spirv_path)
+                self.spirv_cache.set(cache_key, compressed_blob)
+
+            # Write the compressed blob as a C array in the output file, followed by the
+            # preprocessor output.
+            write_compressed_spirv_blob_as_c_array(self.output_path, self.variable_name,
+                                                   compressed_blob, preprocessed_source)
+            return (out, err, 0, description, None)
+
+    def __init__(self, spirv_cache=None):
+        # Jobs are collected by add_job and run by finish with as many CPU threads as are detected.
+        # Each job runs its glslang processes, compression and output on its own worker thread, and
+        # jobs are reaped in whichever order they complete.
+        self.jobs = []
         self.thread_count = multiprocessing.cpu_count()
-
-    def _wait_first(self, ignore_output=False):
-        (out, err, returncode, description, exception_description) = self.queue[0].wait(self.queue)
-        self.queue.pop(0)
+        self.spirv_cache = spirv_cache
+
+    def _compile_times_path(self):
+        return os.path.join(self.spirv_cache.cache_dir, 'compile_times.json')
+
+    # Compile times of the variations recorded by the previous runs, by variable name.
+    def _load_compile_times(self):
+        try:
+            with open(self._compile_times_path()) as times_file:
+                return json.load(times_file)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_compile_times(self, compile_times):
+        path = self._compile_times_path()
+        temp_path = '%s.%d.tmp' % (path, os.getpid())
+        with open(temp_path, 'w') as times_file:
+            json.dump(compile_times, times_file, indent=1, sort_keys=True)
+        os.replace(temp_path, path)
+
+    def _report_job(self, result, ignore_output):
+        (out, err, returncode, description, exception_description) = result
         if not ignore_output:
             if description:
                 print(description)
@@ -429,42 +559,61 @@ class CompileQueue:
                 return exception_description
         return None
 
-    # Wait for all pending tasks.  If called after error is detected, ignore_output can be used to
-    # make sure errors in later jobs are suppressed to avoid cluttering the output.  This is
-    # because the same compile error is likely present in other variations of the same shader and
-    # outputting the same error multiple times is not useful.
-    def _wait_all(self, ignore_output=False):
-        exception_description = None
-        while len(self.queue) > 0:
-            this_job_exception = self._wait_first(ignore_output)
-            # If encountered an error, keep it to be raised, ignoring errors from following jobs.
-            if this_job_exception and not ignore_output:
-                exception_description = this_job_exception
-                ignore_output = True
-
-        return exception_description
+    def _print_timing_report(self, elapsed):
+        compiled = [job for job in self.jobs if job.compiled]
+        if not compiled:
+            return
+        job_time = sum(job.elapsed for job in self.jobs)
+        # Jobs are independent, so the slowest one bounds the time the whole queue can take.
+        slowest = max(self.jobs, key=lambda job: job.elapsed)
+        logging.debug('Compiled %d variation(s) in %.2fs on %d threads (%.2fs of jobs). Critical '
+                      'path: %s (%.2fs)' % (len(compiled), elapsed, self.thread_count, job_time,
+                                            slowest.variable_name, slowest.elapsed))
 
     def add_job(self, shader_file, shader_basename, variation_string, output_path, compile_args,
                 preprocessor_args, variable_name):
-        # If the queue is full, wait until there is at least one slot available.
-        while len(self.queue) >= self.thread_count:
-            exception = self._wait_first(False)
-            # If encountered an exception, cleanup following jobs and raise it.
-            if exception:
-                self._wait_all(True)
-                raise Exception(exception)
-
-        # Add a compile job
-        self.queue.append(
-            CompileQueue.CompileToSPIRV(shader_file, shader_basename, variation_string,
-                                        output_path, compile_args, preprocessor_args,
-                                        variable_name))
+        self.jobs.append(
+            CompileQueue.Job(shader_file, shader_basename, variation_string, output_path,
+                             compile_args, preprocessor_args, variable_name, self.spirv_cache))
 
     def finish(self):
-        exception = self._wait_all(False)
-        # If encountered an exception, cleanup following jobs and raise it.
-        if exception is not None:
-            raise Exception(exception)
+        if not self.jobs:
+            return
+
+        # Start the variations that took longest last time first, so that a slow compile doesn't
+        # end up running alone at the end.
+        compile_times = self._load_compile_times()
+        self.jobs.sort(key=lambda job: compile_times.get(job.variable_name, 0), reverse=True)
+
+        start_time = time.perf_counter()
+        exception_description = None
+        with concurrent.futures.ThreadPoolExecutor(self.thread_count) as executor:
+            pending = set(executor.submit(job.run) for job in self.jobs)
+            while pending:
+                done, pending = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    if future.cancelled():
+                        continue
+                    # After an error, suppress the output of the remaining jobs: the same compile
+                    # error is likely present in other variations of the same shader and
+                    # outputting it multiple times is not useful.
+                    suppress_output = exception_description is not None
+                    this_job_exception = self._report_job(future.result(), suppress_output)
+                    # If encountered an error, cancel the jobs that haven't started and raise it.
+                    if this_job_exception and exception_description is None:
+                        exception_description = this_job_exception
+                        for pending_future in pending:
+                            pending_future.cancel()
+
+        if exception_description is not None:
+            raise Exception(exception_description)
+
+        for job in self.jobs:
+            if job.compiled:
+                compile_times[job.variable_name] = round(job.elapsed, 3)
+        self._save_compile_times(compile_times)
+        self._print_timing_report(time.perf_counter() - start_time)
 
 
 # If the option is just a string, that's the name.  Otherwise, it could be
@@ -525,7 +674,7 @@ def compile_variation(glslang_path, compile_queue, shader_file, shader_basename,
         glslang_args += ['-Os']  # Optimize by default.
         glslang_args += ['-g0']  # Strip debug info to save on binary size.
         glslang_args += variation_extra_args  # Add other flags, or override -Os or -g0
-        glslang_args += ['-o', output_path]  # Output file
+        glslang_args += ['-o', get_spirv_path(output_path)]  # Output file
         glslang_args.append(shader_file)  # Input GLSL shader
 
         compile_queue.add_job(shader_file, shader_basename, variation_string, output_path,
@@ -682,6 +831,11 @@ def shader_path(shader):
 
 
 def main():
+    # --verbose reports the SPIR-V cache statistics and the compile times.
+    if '--verbose' in sys.argv:
+        sys.argv.remove('--verbose')
+        logging.basicConfig(level=logging.DEBUG, format='%(message)s')
+
     # STEP 0: Handle inputs/outputs for run_code_generation.py's auto_script
     shaders_dir = os.path.join('shaders', 'src')
     if not os.path.isdir(shaders_dir):
@@ -713,8 +867,9 @@ def main():
         input_shaders_variations = [
             variations for variations in input_shaders_variations if variations is not None
         ]
-        print(",".join(input_shaders + shader_headers + input_shaders_variations +
-                       glslang_binary_hashes))
+        print(",".join(
+            input_shaders + shader_headers + input_shaders_variations + glslang_binary_hashes +
+            ['../../../../scripts/autogen_writer.py', '../../../../scripts/c_array_writer.py']))
         return 0
 
     # STEP 1: Call glslang to generate the internal shaders into small .inc files.
@@ -730,7 +885,10 @@ def main():
         ShaderAndVariations(shader_file) for shader_file in input_shaders
     ]
 
-    compile_queue = CompileQueue()
+    spirv_cache = None
+    if not print_outputs:
+        spirv_cache = SpirvCache(glslang_path)
+    compile_queue = CompileQueue(spirv_cache)
 
     for shader_and_variation in input_shaders_and_variations:
         shader_file = shader_and_variation.shader_file
@@ -765,9 +923,12 @@ def main():
         return 0
 
     compile_queue.finish()
+    pruned = spirv_cache.prune()
+    logging.debug('SPIR-V cache: %d hits, %d misses, %d pruned' %
+                  (spirv_cache.hits, spirv_cache.misses, pruned))
 
     # STEP 2: Consolidate the .inc files into an auto-generated cpp/h library.
-    with open(out_file_cpp, 'w') as outfile:
+    with autogen_writer.open_output(out_file_cpp, 'w') as outfile:
         includes = "\n".join([gen_shader_include(shader) for shader in output_shaders])
         shader_tables_cpp = '\n'.join(
             [get_shader_table_cpp(s) for s in input_shaders_and_variations])
@@ -787,7 +948,7 @@ def main():
         outfile.write(outcode)
         outfile.close()
 
-    with open(out_file_h, 'w') as outfile:
+    with autogen_writer.open_output(out_file_h, 'w') as outfile:
         shader_variation_definitions = '\n'.join(
             [get_variation_definition(s) for s in input_shaders_and_variations])
         shader_get_functions_h = '\n'.join(
@@ -804,7 +965,7 @@ def main():
         outfile.close()
 
     # STEP 3: Create a gni file with the generated files.
-    with io.open(out_file_gni, 'w', newline='\n') as outfile:
+    with autogen_writer.open_output(out_file_gni, 'w', newline='\n') as outfile:
         outcode = template_shader_includes_gni.format(
             script_name=os.path.basename(__file__),
             out_file_name=out_file_gni.replace('\\', '/'),
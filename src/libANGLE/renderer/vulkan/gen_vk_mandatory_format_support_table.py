@@ -14,6 +14,9 @@ import angle_format
 import xml.etree.ElementTree as etree
 import sys, os
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../../scripts'))
+import autogen_writer
+
 TEMPLATE_TABLE_AUTOGEN_CPP = """// GENERATED FILE - DO NOT EDIT.
 // Generated by {script_name} using data from {input_file_name} and
 // the vk.xml file situated at
@@ -108,6 +111,7 @@ def main():
             input_file_name,
             vk_format_map_path,
             vk_xml_file,
+            '../../../../scripts/autogen_writer.py',
         ]
         outputs = [out_file_name]
 
@@ -136,7 +140,7 @@ def main():
         out_file_name=out_file_name,
         input_file_name=input_file_name)
 
-    with open(out_file_name, 'wt') as out_file:
+    with autogen_writer.open_output(out_file_name, 'wt') as out_file:
         out_file.write(output_cpp)
         out_file.close()
     return 0
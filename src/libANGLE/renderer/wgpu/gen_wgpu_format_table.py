@@ -17,6 +17,9 @@ import sys
 sys.path.append('..')
 import angle_format
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../../scripts'))
+import autogen_writer
+
 template_table_autogen_cpp = """// GENERATED FILE - DO NOT EDIT.
 // Generated by {script_name} using data from {input_file_name}
 //
@@ -255,7 +258,10 @@ def main():
 
     # auto_script parameters.
     if len(sys.argv) > 1:
-        inputs = ['../angle_format.py', '../angle_format_map.json', input_file_name]
+        inputs = [
+            '../angle_format.py', '../angle_format_map.json', input_file_name,
+            '../../../../scripts/autogen_writer.py'
+        ]
         outputs = [out_file_name]
 
         if sys.argv[1] == 'inputs':
@@ -307,7 +313,7 @@ def main():
         out_file_name=out_file_name,
         input_file_name=input_file_name)
 
-    with open(out_file_name, 'wt') as out_file:
+    with autogen_writer.open_output(out_file_name, 'wt') as out_file:
         out_file.write(output_cpp)
         out_file.close()
     return 0
@@ -1205,9 +1205,8 @@ void *GetExtensionFunctionAddress(const char *func_name)
     {
         return nullptr;
     }
-    const ProcTable &procTable = GetProcTable();
-    const auto it              = procTable.find(func_name);
-    return it != procTable.cend() ? it->second : nullptr;
+    const ProcEntry *entry = FindProcEntry(func_name);
+    return entry != nullptr ? entry->second : nullptr;
 }
 
 cl_command_queue CreateCommandQueue(cl_context context,
@@ -24,11 +24,6 @@ namespace egl
 namespace
 {
 
-bool CompareProc(const ProcEntry &a, const char *b)
-{
-    return strcmp(a.first, b) < 0;
-}
-
 void ClipConfigs(const std::vector<const Config *> &filteredConfigs,
                  EGLConfig *outputConfigs,
                  EGLint configSize,
@@ -487,17 +482,11 @@ EGLDisplay GetPlatformDisplay(Thread *thread,
 
 __eglMustCastToProperFunctionPointerType GetProcAddress(Thread *thread, const char *procname)
 {
-    const ProcEntry *entry =
-        std::lower_bound(&g_procTable[0], &g_procTable[g_numProcs], procname, CompareProc);
+    const ProcEntry *entry = FindProcEntry(procname);
 
     thread->setSuccess();
 
-    if (entry == &g_procTable[g_numProcs] || strcmp(entry->first, procname) != 0)
-    {
-        return nullptr;
-    }
-
-    return entry->second;
+    return entry != nullptr ? entry->second : nullptr;
 }
 
 EGLBoolean GetSyncAttrib(Thread *thread,
@@ -28,11 +28,6 @@ using namespace egl;
 namespace
 {
 
-bool CompareProc(const ProcEntry &a, const char *b)
-{
-    return strcmp(a.first, b) < 0;
-}
-
 void ClipConfigs(const std::vector<const Config *> &filteredConfigs,
                  EGLConfig *output_configs,
                  EGLint config_size,
@@ -231,17 +226,11 @@ PROC GL_APIENTRY wglGetProcAddress(LPCSTR lpszProc)
     WGL_EVENT(GetProcAddress, "const char *procname = \"%s\"", lpszProc);
     egl::Thread *thread = egl::GetCurrentThread();
 
-    const ProcEntry *entry =
-        std::lower_bound(&g_procTable[0], &g_procTable[g_numProcs], lpszProc, CompareProc);
+    const ProcEntry *entry = FindProcEntry(lpszProc);
 
     thread->setSuccess();
 
-    if (entry == &g_procTable[g_numProcs] || strcmp(entry->first, lpszProc) != 0)
-    {
-        return nullptr;
-    }
-
-    return entry->second;
+    return entry != nullptr ? entry->second : nullptr;
 }
 
 BOOL GL_APIENTRY wglMakeCurrent(HDC hDc, HGLRC newContext)
@@ -10,15 +10,19 @@
 #ifndef LIBGLESV2_PROC_TABLE_CL_H_
 #define LIBGLESV2_PROC_TABLE_CL_H_
 
-#include <string>
-#include <unordered_map>
+#include <stddef.h>
+#include <utility>
 
 namespace cl
 {
 
-using ProcTable = std::unordered_map<std::string, void *>;
+using ProcEntry = std::pair<const char *, void *>;
 
-const ProcTable &GetProcTable();
+extern const ProcEntry g_procTable[];
+extern const size_t g_numProcs;
+
+// Returns the entry of g_procTable named |name|, or nullptr if there is none.
+const ProcEntry *FindProcEntry(const char *name);
 
 }  // namespace cl
 
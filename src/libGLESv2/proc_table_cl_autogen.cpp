@@ -1,11 +1,11 @@
 // GENERATED FILE - DO NOT EDIT.
 // Generated by gen_proc_table.py using data from cl.xml.
 //
-// Copyright 2021 The ANGLE Project Authors. All rights reserved.
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
 // Use of this source code is governed by a BSD-style license that can be
 // found in the LICENSE file.
 //
-// proc_table:
+// getProcAddress loader table:
 //   Mapping from a string entry point name to function address.
 //
 
@@ -13,136 +13,164 @@
 
 #include "libGLESv2/entry_points_cl_autogen.h"
 
-#include "anglebase/no_destructor.h"
-
-// Using fully qualified entry point identifiers to make sure that missing entry points would not
-// pick up the global declarations of OpenCL
+#include <cstring>
+#include <iterator>
 
 #define P(FUNC) reinterpret_cast<void *>(FUNC)
 
 namespace cl
 {
-
-const ProcTable &GetProcTable()
+namespace
 {
-    static angle::base::NoDestructor<ProcTable> sProcTable(
-        {{"clGetPlatformIDs", P(::cl::clGetPlatformIDs)},
-         {"clGetPlatformInfo", P(::cl::clGetPlatformInfo)},
-         {"clGetDeviceIDs", P(::cl::clGetDeviceIDs)},
-         {"clGetDeviceInfo", P(::cl::clGetDeviceInfo)},
-         {"clCreateContext", P(::cl::clCreateContext)},
-         {"clCreateContextFromType", P(::cl::clCreateContextFromType)},
-         {"clRetainContext", P(::cl::clRetainContext)},
-         {"clReleaseContext", P(::cl::clReleaseContext)},
-         {"clGetContextInfo", P(::cl::clGetContextInfo)},
-         {"clRetainCommandQueue", P(::cl::clRetainCommandQueue)},
-         {"clReleaseCommandQueue", P(::cl::clReleaseCommandQueue)},
-         {"clGetCommandQueueInfo", P(::cl::clGetCommandQueueInfo)},
-         {"clCreateBuffer", P(::cl::clCreateBuffer)},
-         {"clRetainMemObject", P(::cl::clRetainMemObject)},
-         {"clReleaseMemObject", P(::cl::clReleaseMemObject)},
-         {"clGetSupportedImageFormats", P(::cl::clGetSupportedImageFormats)},
-         {"clGetMemObjectInfo", P(::cl::clGetMemObjectInfo)},
-         {"clGetImageInfo", P(::cl::clGetImageInfo)},
-         {"clRetainSampler", P(::cl::clRetainSampler)},
-         {"clReleaseSampler", P(::cl::clReleaseSampler)},
-         {"clGetSamplerInfo", P(::cl::clGetSamplerInfo)},
-         {"clCreateProgramWithSource", P(::cl::clCreateProgramWithSource)},
-         {"clCreateProgramWithBinary", P(::cl::clCreateProgramWithBinary)},
-         {"clRetainProgram", P(::cl::clRetainProgram)},
-         {"clReleaseProgram", P(::cl::clReleaseProgram)},
-         {"clBuildProgram", P(::cl::clBuildProgram)},
-         {"clGetProgramInfo", P(::cl::clGetProgramInfo)},
-         {"clGetProgramBuildInfo", P(::cl::clGetProgramBuildInfo)},
-         {"clCreateKernel", P(::cl::clCreateKernel)},
-         {"clCreateKernelsInProgram", P(::cl::clCreateKernelsInProgram)},
-         {"clRetainKernel", P(::cl::clRetainKernel)},
-         {"clReleaseKernel", P(::cl::clReleaseKernel)},
-         {"clSetKernelArg", P(::cl::clSetKernelArg)},
-         {"clGetKernelInfo", P(::cl::clGetKernelInfo)},
-         {"clGetKernelWorkGroupInfo", P(::cl::clGetKernelWorkGroupInfo)},
-         {"clWaitForEvents", P(::cl::clWaitForEvents)},
-         {"clGetEventInfo", P(::cl::clGetEventInfo)},
-         {"clRetainEvent", P(::cl::clRetainEvent)},
-         {"clReleaseEvent", P(::cl::clReleaseEvent)},
-         {"clGetEventProfilingInfo", P(::cl::clGetEventProfilingInfo)},
-         {"clFlush", P(::cl::clFlush)},
-         {"clFinish", P(::cl::clFinish)},
-         {"clEnqueueReadBuffer", P(::cl::clEnqueueReadBuffer)},
-         {"clEnqueueWriteBuffer", P(::cl::clEnqueueWriteBuffer)},
-         {"clEnqueueCopyBuffer", P(::cl::clEnqueueCopyBuffer)},
-         {"clEnqueueReadImage", P(::cl::clEnqueueReadImage)},
-         {"clEnqueueWriteImage", P(::cl::clEnqueueWriteImage)},
-         {"clEnqueueCopyImage", P(::cl::clEnqueueCopyImage)},
-         {"clEnqueueCopyImageToBuffer", P(::cl::clEnqueueCopyImageToBuffer)},
-         {"clEnqueueCopyBufferToImage", P(::cl::clEnqueueCopyBufferToImage)},
-         {"clEnqueueMapBuffer", P(::cl::clEnqueueMapBuffer)},
-         {"clEnqueueMapImage", P(::cl::clEnqueueMapImage)},
-         {"clEnqueueUnmapMemObject", P(::cl::clEnqueueUnmapMemObject)},
-         {"clEnqueueNDRangeKernel", P(::cl::clEnqueueNDRangeKernel)},
-         {"clEnqueueNativeKernel", P(::cl::clEnqueueNativeKernel)},
-         {"clSetCommandQueueProperty", P(::cl::clSetCommandQueueProperty)},
-         {"clCreateImage2D", P(::cl::clCreateImage2D)},
-         {"clCreateImage3D", P(::cl::clCreateImage3D)},
-         {"clEnqueueMarker", P(::cl::clEnqueueMarker)},
-         {"clEnqueueWaitForEvents", P(::cl::clEnqueueWaitForEvents)},
-         {"clEnqueueBarrier", P(::cl::clEnqueueBarrier)},
-         {"clUnloadCompiler", P(::cl::clUnloadCompiler)},
-         {"clGetExtensionFunctionAddress", P(::cl::clGetExtensionFunctionAddress)},
-         {"clCreateCommandQueue", P(::cl::clCreateCommandQueue)},
-         {"clCreateSampler", P(::cl::clCreateSampler)},
-         {"clEnqueueTask", P(::cl::clEnqueueTask)},
-         {"clCreateSubBuffer", P(::cl::clCreateSubBuffer)},
-         {"clSetMemObjectDestructorCallback", P(::cl::clSetMemObjectDestructorCallback)},
-         {"clCreateUserEvent", P(::cl::clCreateUserEvent)},
-         {"clSetUserEventStatus", P(::cl::clSetUserEventStatus)},
-         {"clSetEventCallback", P(::cl::clSetEventCallback)},
-         {"clEnqueueReadBufferRect", P(::cl::clEnqueueReadBufferRect)},
-         {"clEnqueueWriteBufferRect", P(::cl::clEnqueueWriteBufferRect)},
-         {"clEnqueueCopyBufferRect", P(::cl::clEnqueueCopyBufferRect)},
-         {"clCreateSubDevices", P(::cl::clCreateSubDevices)},
-         {"clRetainDevice", P(::cl::clRetainDevice)},
-         {"clReleaseDevice", P(::cl::clReleaseDevice)},
-         {"clCreateImage", P(::cl::clCreateImage)},
-         {"clCreateProgramWithBuiltInKernels", P(::cl::clCreateProgramWithBuiltInKernels)},
-         {"clCompileProgram", P(::cl::clCompileProgram)},
-         {"clLinkProgram", P(::cl::clLinkProgram)},
-         {"clUnloadPlatformCompiler", P(::cl::clUnloadPlatformCompiler)},
-         {"clGetKernelArgInfo", P(::cl::clGetKernelArgInfo)},
-         {"clEnqueueFillBuffer", P(::cl::clEnqueueFillBuffer)},
-         {"clEnqueueFillImage", P(::cl::clEnqueueFillImage)},
-         {"clEnqueueMigrateMemObjects", P(::cl::clEnqueueMigrateMemObjects)},
-         {"clEnqueueMarkerWithWaitList", P(::cl::clEnqueueMarkerWithWaitList)},
-         {"clEnqueueBarrierWithWaitList", P(::cl::clEnqueueBarrierWithWaitList)},
-         {"clGetExtensionFunctionAddressForPlatform",
-          P(::cl::clGetExtensionFunctionAddressForPlatform)},
-         {"clCreateCommandQueueWithProperties", P(::cl::clCreateCommandQueueWithProperties)},
-         {"clCreatePipe", P(::cl::clCreatePipe)},
-         {"clGetPipeInfo", P(::cl::clGetPipeInfo)},
-         {"clSVMAlloc", P(::cl::clSVMAlloc)},
-         {"clSVMFree", P(::cl::clSVMFree)},
-         {"clCreateSamplerWithProperties", P(::cl::clCreateSamplerWithProperties)},
-         {"clSetKernelArgSVMPointer", P(::cl::clSetKernelArgSVMPointer)},
-         {"clSetKernelExecInfo", P(::cl::clSetKernelExecInfo)},
-         {"clEnqueueSVMFree", P(::cl::clEnqueueSVMFree)},
-         {"clEnqueueSVMMemcpy", P(::cl::clEnqueueSVMMemcpy)},
-         {"clEnqueueSVMMemFill", P(::cl::clEnqueueSVMMemFill)},
-         {"clEnqueueSVMMap", P(::cl::clEnqueueSVMMap)},
-         {"clEnqueueSVMUnmap", P(::cl::clEnqueueSVMUnmap)},
-         {"clSetDefaultDeviceCommandQueue", P(::cl::clSetDefaultDeviceCommandQueue)},
-         {"clGetDeviceAndHostTimer", P(::cl::clGetDeviceAndHostTimer)},
-         {"clGetHostTimer", P(::cl::clGetHostTimer)},
-         {"clCreateProgramWithIL", P(::cl::clCreateProgramWithIL)},
-         {"clCloneKernel", P(::cl::clCloneKernel)},
-         {"clGetKernelSubGroupInfo", P(::cl::clGetKernelSubGroupInfo)},
-         {"clEnqueueSVMMigrateMem", P(::cl::clEnqueueSVMMigrateMem)},
-         {"clSetProgramSpecializationConstant", P(::cl::clSetProgramSpecializationConstant)},
-         {"clSetProgramReleaseCallback", P(::cl::clSetProgramReleaseCallback)},
-         {"clSetContextDestructorCallback", P(::cl::clSetContextDestructorCallback)},
-         {"clCreateBufferWithProperties", P(::cl::clCreateBufferWithProperties)},
-         {"clCreateImageWithProperties", P(::cl::clCreateImageWithProperties)},
-         {"clIcdGetPlatformIDsKHR", P(::cl::clIcdGetPlatformIDsKHR)}});
-    return *sProcTable;
+// Minimal perfect hash function built by scripts/minimal_perfect_hash.py.
+constexpr uint32_t MinimalPerfectHash(const char *key,
+                                      const uint16_t *seeds,
+                                      uint32_t numSeeds,
+                                      uint32_t numKeys)
+{
+    uint32_t hash = 0x811c9dc5u;
+    for (; *key != '\0'; ++key)
+    {
+        hash = (hash ^ static_cast<unsigned char>(*key)) * 16777619u;
+    }
+    hash ^= seeds[(static_cast<uint64_t>(hash) * numSeeds) >> 32];
+    hash ^= hash >> 16;
+    hash *= 0x85ebca6bu;
+    hash ^= hash >> 13;
+    hash *= 0xc2b2ae35u;
+    hash ^= hash >> 16;
+    return static_cast<uint32_t>((static_cast<uint64_t>(hash) * numKeys) >> 32);
 }
 
+constexpr uint16_t kProcSeeds[] = {0,  45, 0,  1, 2,  15, 43,  34, 89, 0,   39, 1,   1,
+                                   0,  2,  18, 7, 2,  3,  0,   14, 4,  14,  5,  171, 10,
+                                   71, 16, 26, 0, 14, 44, 140, 16, 30, 247, 24, 1,   552};
+}  // anonymous namespace
+
+// clang-format off
+const ProcEntry g_procTable[] = {
+    {"clCreatePipe", P(::cl::clCreatePipe)},
+    {"clEnqueueBarrierWithWaitList", P(::cl::clEnqueueBarrierWithWaitList)},
+    {"clEnqueueSVMMemcpy", P(::cl::clEnqueueSVMMemcpy)},
+    {"clEnqueueWaitForEvents", P(::cl::clEnqueueWaitForEvents)},
+    {"clSetMemObjectDestructorCallback", P(::cl::clSetMemObjectDestructorCallback)},
+    {"clCreateSubBuffer", P(::cl::clCreateSubBuffer)},
+    {"clReleaseCommandQueue", P(::cl::clReleaseCommandQueue)},
+    {"clCreateUserEvent", P(::cl::clCreateUserEvent)},
+    {"clReleaseEvent", P(::cl::clReleaseEvent)},
+    {"clGetSamplerInfo", P(::cl::clGetSamplerInfo)},
+    {"clEnqueueReadImage", P(::cl::clEnqueueReadImage)},
+    {"clReleaseDevice", P(::cl::clReleaseDevice)},
+    {"clRetainEvent", P(::cl::clRetainEvent)},
+    {"clEnqueueSVMFree", P(::cl::clEnqueueSVMFree)},
+    {"clCreateCommandQueue", P(::cl::clCreateCommandQueue)},
+    {"clCreateSubDevices", P(::cl::clCreateSubDevices)},
+    {"clUnloadPlatformCompiler", P(::cl::clUnloadPlatformCompiler)},
+    {"clGetProgramBuildInfo", P(::cl::clGetProgramBuildInfo)},
+    {"clSetEventCallback", P(::cl::clSetEventCallback)},
+    {"clCreateProgramWithBuiltInKernels", P(::cl::clCreateProgramWithBuiltInKernels)},
+    {"clEnqueueCopyBufferToImage", P(::cl::clEnqueueCopyBufferToImage)},
+    {"clEnqueueMarkerWithWaitList", P(::cl::clEnqueueMarkerWithWaitList)},
+    {"clCreateSamplerWithProperties", P(::cl::clCreateSamplerWithProperties)},
+    {"clGetMemObjectInfo", P(::cl::clGetMemObjectInfo)},
+    {"clEnqueueCopyImageToBuffer", P(::cl::clEnqueueCopyImageToBuffer)},
+    {"clGetEventInfo", P(::cl::clGetEventInfo)},
+    {"clCreateBuffer", P(::cl::clCreateBuffer)},
+    {"clSetProgramSpecializationConstant", P(::cl::clSetProgramSpecializationConstant)},
+    {"clRetainProgram", P(::cl::clRetainProgram)},
+    {"clEnqueueSVMMigrateMem", P(::cl::clEnqueueSVMMigrateMem)},
+    {"clEnqueueWriteBuffer", P(::cl::clEnqueueWriteBuffer)},
+    {"clCreateKernelsInProgram", P(::cl::clCreateKernelsInProgram)},
+    {"clSetKernelArgSVMPointer", P(::cl::clSetKernelArgSVMPointer)},
+    {"clReleaseKernel", P(::cl::clReleaseKernel)},
+    {"clSetUserEventStatus", P(::cl::clSetUserEventStatus)},
+    {"clEnqueueCopyBuffer", P(::cl::clEnqueueCopyBuffer)},
+    {"clRetainSampler", P(::cl::clRetainSampler)},
+    {"clUnloadCompiler", P(::cl::clUnloadCompiler)},
+    {"clGetSupportedImageFormats", P(::cl::clGetSupportedImageFormats)},
+    {"clFinish", P(::cl::clFinish)},
+    {"clSetProgramReleaseCallback", P(::cl::clSetProgramReleaseCallback)},
+    {"clEnqueueMapImage", P(::cl::clEnqueueMapImage)},
+    {"clGetProgramInfo", P(::cl::clGetProgramInfo)},
+    {"clEnqueueTask", P(::cl::clEnqueueTask)},
+    {"clEnqueueReadBufferRect", P(::cl::clEnqueueReadBufferRect)},
+    {"clCreateKernel", P(::cl::clCreateKernel)},
+    {"clEnqueueBarrier", P(::cl::clEnqueueBarrier)},
+    {"clEnqueueWriteBufferRect", P(::cl::clEnqueueWriteBufferRect)},
+    {"clGetKernelWorkGroupInfo", P(::cl::clGetKernelWorkGroupInfo)},
+    {"clEnqueueFillBuffer", P(::cl::clEnqueueFillBuffer)},
+    {"clEnqueueNDRangeKernel", P(::cl::clEnqueueNDRangeKernel)},
+    {"clSVMAlloc", P(::cl::clSVMAlloc)},
+    {"clGetEventProfilingInfo", P(::cl::clGetEventProfilingInfo)},
+    {"clCreateImageWithProperties", P(::cl::clCreateImageWithProperties)},
+    {"clEnqueueSVMUnmap", P(::cl::clEnqueueSVMUnmap)},
+    {"clBuildProgram", P(::cl::clBuildProgram)},
+    {"clGetContextInfo", P(::cl::clGetContextInfo)},
+    {"clEnqueueWriteImage", P(::cl::clEnqueueWriteImage)},
+    {"clCreateImage2D", P(::cl::clCreateImage2D)},
+    {"clEnqueueFillImage", P(::cl::clEnqueueFillImage)},
+    {"clGetHostTimer", P(::cl::clGetHostTimer)},
+    {"clEnqueueCopyBufferRect", P(::cl::clEnqueueCopyBufferRect)},
+    {"clReleaseContext", P(::cl::clReleaseContext)},
+    {"clGetKernelInfo", P(::cl::clGetKernelInfo)},
+    {"clReleaseSampler", P(::cl::clReleaseSampler)},
+    {"clEnqueueSVMMap", P(::cl::clEnqueueSVMMap)},
+    {"clRetainCommandQueue", P(::cl::clRetainCommandQueue)},
+    {"clReleaseProgram", P(::cl::clReleaseProgram)},
+    {"clCloneKernel", P(::cl::clCloneKernel)},
+    {"clEnqueueNativeKernel", P(::cl::clEnqueueNativeKernel)},
+    {"clGetExtensionFunctionAddressForPlatform", P(::cl::clGetExtensionFunctionAddressForPlatform)},
+    {"clGetCommandQueueInfo", P(::cl::clGetCommandQueueInfo)},
+    {"clEnqueueSVMMemFill", P(::cl::clEnqueueSVMMemFill)},
+    {"clEnqueueReadBuffer", P(::cl::clEnqueueReadBuffer)},
+    {"clRetainDevice", P(::cl::clRetainDevice)},
+    {"clRetainContext", P(::cl::clRetainContext)},
+    {"clEnqueueMigrateMemObjects", P(::cl::clEnqueueMigrateMemObjects)},
+    {"clGetKernelArgInfo", P(::cl::clGetKernelArgInfo)},
+    {"clGetImageInfo", P(::cl::clGetImageInfo)},
+    {"clEnqueueCopyImage", P(::cl::clEnqueueCopyImage)},
+    {"clCreateContext", P(::cl::clCreateContext)},
+    {"clGetExtensionFunctionAddress", P(::cl::clGetExtensionFunctionAddress)},
+    {"clSetCommandQueueProperty", P(::cl::clSetCommandQueueProperty)},
+    {"clEnqueueMarker", P(::cl::clEnqueueMarker)},
+    {"clEnqueueUnmapMemObject", P(::cl::clEnqueueUnmapMemObject)},
+    {"clReleaseMemObject", P(::cl::clReleaseMemObject)},
+    {"clWaitForEvents", P(::cl::clWaitForEvents)},
+    {"clCreateCommandQueueWithProperties", P(::cl::clCreateCommandQueueWithProperties)},
+    {"clCreateContextFromType", P(::cl::clCreateContextFromType)},
+    {"clEnqueueMapBuffer", P(::cl::clEnqueueMapBuffer)},
+    {"clGetPlatformIDs", P(::cl::clGetPlatformIDs)},
+    {"clSetKernelExecInfo", P(::cl::clSetKernelExecInfo)},
+    {"clFlush", P(::cl::clFlush)},
+    {"clSetDefaultDeviceCommandQueue", P(::cl::clSetDefaultDeviceCommandQueue)},
+    {"clSVMFree", P(::cl::clSVMFree)},
+    {"clRetainKernel", P(::cl::clRetainKernel)},
+    {"clSetContextDestructorCallback", P(::cl::clSetContextDestructorCallback)},
+    {"clGetPipeInfo", P(::cl::clGetPipeInfo)},
+    {"clCreateProgramWithBinary", P(::cl::clCreateProgramWithBinary)},
+    {"clCreateImage", P(::cl::clCreateImage)},
+    {"clCreateBufferWithProperties", P(::cl::clCreateBufferWithProperties)},
+    {"clGetPlatformInfo", P(::cl::clGetPlatformInfo)},
+    {"clCreateProgramWithSource", P(::cl::clCreateProgramWithSource)},
+    {"clRetainMemObject", P(::cl::clRetainMemObject)},
+    {"clIcdGetPlatformIDsKHR", P(::cl::clIcdGetPlatformIDsKHR)},
+    {"clLinkProgram", P(::cl::clLinkProgram)},
+    {"clGetDeviceAndHostTimer", P(::cl::clGetDeviceAndHostTimer)},
+    {"clCreateImage3D", P(::cl::clCreateImage3D)},
+    {"clCreateProgramWithIL", P(::cl::clCreateProgramWithIL)},
+    {"clCompileProgram", P(::cl::clCompileProgram)},
+    {"clGetDeviceInfo", P(::cl::clGetDeviceInfo)},
+    {"clCreateSampler", P(::cl::clCreateSampler)},
+    {"clSetKernelArg", P(::cl::clSetKernelArg)},
+    {"clGetKernelSubGroupInfo", P(::cl::clGetKernelSubGroupInfo)},
+    {"clGetDeviceIDs", P(::cl::clGetDeviceIDs)},
+};
+// clang-format on
+const size_t g_numProcs = std::size(g_procTable);
+
+const ProcEntry *FindProcEntry(const char *name)
+{
+    const ProcEntry &entry = g_procTable[MinimalPerfectHash(name, kProcSeeds, 39, 115)];
+    return entry.first != nullptr && strcmp(entry.first, name) == 0 ? &entry : nullptr;
+}
 }  // namespace cl
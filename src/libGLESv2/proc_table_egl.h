@@ -20,6 +20,10 @@ using ProcEntry = std::pair<const char *, __eglMustCastToProperFunctionPointerTy
 
 extern const ProcEntry g_procTable[];
 extern const size_t g_numProcs;
+
+// Returns the entry of g_procTable named |name|, or nullptr if there is none. Compiled out entries
+// of the table have a null name.
+const ProcEntry *FindProcEntry(const char *name);
 }  // namespace egl
 
 #endif  // LIBGLESV2_PROC_TABLE_H_
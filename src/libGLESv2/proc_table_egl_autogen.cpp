@@ -29,6 +29,7 @@
 #    include "libGLESv2/entry_points_gl_4_autogen.h"
 #endif
 
+#include <cstring>
 #include <iterator>
 
 #define P(FUNC) reinterpret_cast<__eglMustCastToProperFunctionPointerType>(FUNC)
@@ -36,1617 +37,1677 @@
 #if defined(ANGLE_ENABLE_GL_DESKTOP_FRONTEND)
 #    define DESKTOP_ONLY(func, angleFunc) {func, P(angleFunc)},
 #else
-#    define DESKTOP_ONLY(func, angleFunc)
+#    define DESKTOP_ONLY(func, angleFunc) {nullptr, nullptr},
 #endif
 
 namespace egl
 {
+namespace
+{
+// Minimal perfect hash function built by scripts/minimal_perfect_hash.py.
+constexpr uint32_t MinimalPerfectHash(const char *key,
+                                      const uint16_t *seeds,
+                                      uint32_t numSeeds,
+                                      uint32_t numKeys)
+{
+    uint32_t hash = 0x811c9dc5u;
+    for (; *key != '\0'; ++key)
+    {
+        hash = (hash ^ static_cast<unsigned char>(*key)) * 16777619u;
+    }
+    hash ^= seeds[(static_cast<uint64_t>(hash) * numSeeds) >> 32];
+    hash ^= hash >> 16;
+    hash *= 0x85ebca6bu;
+    hash ^= hash >> 13;
+    hash *= 0xc2b2ae35u;
+    hash ^= hash >> 16;
+    return static_cast<uint32_t>((static_cast<uint64_t>(hash) * numKeys) >> 32);
+}
+
+constexpr uint16_t kProcSeeds[] = {
+    0,   5,   14, 13,  29,  7,   9,  18,  19, 38,  0,   9,   3,   0,   5,   5,   13,   9,   21,
+    1,   1,   1,  1,   5,   39,  1,  13,  13, 0,   23,  10,  31,  0,   1,   1,   0,    68,  3,
+    39,  3,   7,  8,   3,   4,   14, 7,   41, 8,   9,   2,   0,   3,   32,  27,  0,    2,   4,
+    3,   12,  12, 7,   4,   0,   5,  1,   0,  3,   12,  0,   1,   2,   20,  0,   1,    2,   39,
+    31,  5,   8,  26,  1,   5,   43, 5,   3,  51,  45,  0,   84,  17,  0,   12,  14,   59,  15,
+    7,   13,  2,  7,   1,   1,   1,  6,   0,  61,  3,   10,  5,   4,   47,  4,   19,   61,  4,
+    13,  1,   0,  5,   2,   2,   11, 4,   3,  23,  3,   0,   0,   11,  65,  4,   44,   13,  19,
+    2,   24,  11, 48,  10,  0,   1,  3,   33, 26,  35,  4,   19,  2,   1,   37,  44,   6,   25,
+    44,  86,  30, 47,  17,  33,  0,  5,   75, 5,   26,  11,  94,  0,   49,  2,   7,    38,  1,
+    1,   3,   2,  11,  4,   27,  17, 25,  42, 13,  2,   1,   23,  4,   76,  2,   20,   0,   0,
+    21,  17,  0,  34,  1,   146, 1,  3,   16, 0,   35,  13,  7,   40,  2,   52,  56,   4,   2,
+    18,  62,  28, 4,   19,  117, 0,  4,   11, 0,   0,   33,  68,  24,  1,   119, 1,    48,  19,
+    0,   81,  28, 15,  0,   70,  3,  45,  2,  2,   2,   29,  1,   45,  2,   10,  5,    4,   1,
+    5,   6,   3,  5,   1,   47,  8,  9,   0,  2,   1,   92,  17,  0,   5,   0,   70,   34,  0,
+    129, 20,  12, 6,   8,   4,   0,  25,  0,  16,  2,   9,   62,  11,  1,   4,   9,    1,   11,
+    7,   48,  23, 3,   27,  81,  7,  84,  9,  30,  40,  6,   38,  105, 3,   65,  27,   9,   1,
+    80,  5,   32, 83,  170, 0,   39, 58,  0,  12,  127, 11,  60,  6,   47,  9,   214,  24,  13,
+    32,  42,  0,  27,  15,  2,   13, 39,  0,  28,  54,  35,  32,  10,  0,   0,   54,   98,  0,
+    27,  20,  2,  0,   17,  37,  32, 56,  4,  11,  3,   198, 21,  45,  6,   10,  6,    0,   0,
+    1,   6,   50, 120, 34,  71,  2,  10,  15, 0,   7,   53,  223, 135, 19,  27,  0,    4,   77,
+    1,   21,  59, 72,  29,  26,  27, 0,   22, 69,  108, 0,   22,  126, 5,   3,   65,   15,  377,
+    4,   27,  0,  1,   142, 101, 32, 240, 8,  4,   378, 96,  162, 153, 135, 345, 40,   6,   6,
+    0,   78,  21, 131, 18,  39,  0,  63,  31, 161, 64,  33,  36,  267, 107, 128, 62,   5,   1,
+    125, 1,   12, 30,  399, 71,  1,  5,   92, 8,   1,   166, 0,   15,  17,  94,  6,    16,  0,
+    140, 35,  16, 6,   180, 36,  0,  51,  9,  18,  52,  405, 79,  204, 15,  2,   5,    189, 89,
+    3,   251, 0,  15,  168, 860, 63, 48,  85, 8,   13,  21,  2,   170, 120, 180, 4,    79,  177,
+    124, 35,  32, 137, 39,  381, 0,  977, 78, 119, 18,  285, 18,  557, 98,  0,   1024, 621, 89,
+    37,  7,   25, 9,   48,  4,   3,  345, 27, 207, 118, 4,   355, 0,   5,   92,  901,  0,   35,
+    85,  0,   34};
+}  // anonymous namespace
+
 // clang-format off
 const ProcEntry g_procTable[] = {
-    {"ANGLEGetDisplayPlatform", P(ANGLEGetDisplayPlatform)},
-    {"ANGLEResetDisplayPlatform", P(ANGLEResetDisplayPlatform)},
-    {"eglAcquireExternalContextANGLE", P(EGL_AcquireExternalContextANGLE)},
-    {"eglBindAPI", P(EGL_BindAPI)},
-    {"eglBindTexImage", P(EGL_BindTexImage)},
-    {"eglChooseConfig", P(EGL_ChooseConfig)},
-    {"eglClientWaitSync", P(EGL_ClientWaitSync)},
-    {"eglClientWaitSyncKHR", P(EGL_ClientWaitSyncKHR)},
-    {"eglCopyBuffers", P(EGL_CopyBuffers)},
-    {"eglCopyMetalSharedEventANGLE", P(EGL_CopyMetalSharedEventANGLE)},
-    {"eglCreateContext", P(EGL_CreateContext)},
+    {"eglStreamPostD3DTextureANGLE", P(EGL_StreamPostD3DTextureANGLE)},
+    DESKTOP_ONLY("glMultTransposeMatrixd", GL_MultTransposeMatrixd)
+    {"eglQuerySurface", P(EGL_QuerySurface)},
+    {"glSamplerParameterIivOES", P(GL_SamplerParameterIivOES)},
+    {"glGetBufferParameteri64v", P(GL_GetBufferParameteri64v)},
+    {"glFrontFace", P(GL_FrontFace)},
+    {"glActiveTexture", P(GL_ActiveTexture)},
+    DESKTOP_ONLY("glGetNamedBufferPointerv", GL_GetNamedBufferPointerv)
+    DESKTOP_ONLY("glGetnPolygonStipple", GL_GetnPolygonStipple)
+    DESKTOP_ONLY("glIndexub", GL_Indexub)
+    {"glGetQueryObjectui64vEXT", P(GL_GetQueryObjectui64vEXT)},
+    DESKTOP_ONLY("glBitmap", GL_Bitmap)
+    {"glFogx", P(GL_Fogx)},
+    {"glRenderbufferStorage", P(GL_RenderbufferStorage)},
+    {"glTexEnvxv", P(GL_TexEnvxv)},
+    {"glUniformMatrix2x4fv", P(GL_UniformMatrix2x4fv)},
+    {"glPushGroupMarkerEXT", P(GL_PushGroupMarkerEXT)},
+    {"glFramebufferParameteriMESA", P(GL_FramebufferParameteriMESA)},
     {"eglCreateDeviceANGLE", P(EGL_CreateDeviceANGLE)},
-    {"eglCreateImage", P(EGL_CreateImage)},
-    {"eglCreateImageKHR", P(EGL_CreateImageKHR)},
-    {"eglCreateNativeClientBufferANDROID", P(EGL_CreateNativeClientBufferANDROID)},
-    {"eglCreatePbufferFromClientBuffer", P(EGL_CreatePbufferFromClientBuffer)},
-    {"eglCreatePbufferSurface", P(EGL_CreatePbufferSurface)},
-    {"eglCreatePixmapSurface", P(EGL_CreatePixmapSurface)},
-    {"eglCreatePlatformPixmapSurface", P(EGL_CreatePlatformPixmapSurface)},
-    {"eglCreatePlatformPixmapSurfaceEXT", P(EGL_CreatePlatformPixmapSurfaceEXT)},
-    {"eglCreatePlatformWindowSurface", P(EGL_CreatePlatformWindowSurface)},
-    {"eglCreatePlatformWindowSurfaceEXT", P(EGL_CreatePlatformWindowSurfaceEXT)},
-    {"eglCreateStreamKHR", P(EGL_CreateStreamKHR)},
-    {"eglCreateStreamProducerD3DTextureANGLE", P(EGL_CreateStreamProducerD3DTextureANGLE)},
-    {"eglCreateSync", P(EGL_CreateSync)},
-    {"eglCreateSyncKHR", P(EGL_CreateSyncKHR)},
-    {"eglCreateWindowSurface", P(EGL_CreateWindowSurface)},
-    {"eglDebugMessageControlKHR", P(EGL_DebugMessageControlKHR)},
-    {"eglDestroyContext", P(EGL_DestroyContext)},
-    {"eglDestroyImage", P(EGL_DestroyImage)},
-    {"eglDestroyImageKHR", P(EGL_DestroyImageKHR)},
-    {"eglDestroyStreamKHR", P(EGL_DestroyStreamKHR)},
-    {"eglDestroySurface", P(EGL_DestroySurface)},
-    {"eglDestroySync", P(EGL_DestroySync)},
-    {"eglDestroySyncKHR", P(EGL_DestroySyncKHR)},
-    {"eglDupNativeFenceFDANDROID", P(EGL_DupNativeFenceFDANDROID)},
-    {"eglExportVkImageANGLE", P(EGL_ExportVkImageANGLE)},
-    {"eglForceGPUSwitchANGLE", P(EGL_ForceGPUSwitchANGLE)},
-    {"eglGetCompositorTimingANDROID", P(EGL_GetCompositorTimingANDROID)},
+    {"glFlushMappedBufferRange", P(GL_FlushMappedBufferRange)},
+    {"glBlendFunciEXT", P(GL_BlendFunciEXT)},
     {"eglGetCompositorTimingSupportedANDROID", P(EGL_GetCompositorTimingSupportedANDROID)},
-    {"eglGetConfigAttrib", P(EGL_GetConfigAttrib)},
-    {"eglGetConfigs", P(EGL_GetConfigs)},
-    {"eglGetCurrentContext", P(EGL_GetCurrentContext)},
-    {"eglGetCurrentDisplay", P(EGL_GetCurrentDisplay)},
-    {"eglGetCurrentSurface", P(EGL_GetCurrentSurface)},
-    {"eglGetDisplay", P(EGL_GetDisplay)},
+    DESKTOP_ONLY("glPopAttrib", GL_PopAttrib)
+    {"glCompressedTexSubImage3D", P(GL_CompressedTexSubImage3D)},
+    {"glGetFramebufferPixelLocalStorageParameterivRobustANGLE", P(GL_GetFramebufferPixelLocalStorageParameterivRobustANGLE)},
+    {"glTexBufferRangeOES", P(GL_TexBufferRangeOES)},
+    DESKTOP_ONLY("glTexCoord1d", GL_TexCoord1d)
+    DESKTOP_ONLY("glUniformMatrix4x2dv", GL_UniformMatrix4x2dv)
+    {"glLightModelfv", P(GL_LightModelfv)},
+    {"glBeginTransformFeedback", P(GL_BeginTransformFeedback)},
+    {"glColor4ub", P(GL_Color4ub)},
+    DESKTOP_ONLY("glVertexAttrib2dv", GL_VertexAttrib2dv)
+    {"glGetShaderiv", P(GL_GetShaderiv)},
+    DESKTOP_ONLY("glIndexubv", GL_Indexubv)
+    {"glSampleMaskiANGLE", P(GL_SampleMaskiANGLE)},
+    {"glProgramUniform4fv", P(GL_ProgramUniform4fv)},
+    DESKTOP_ONLY("glViewportArrayv", GL_ViewportArrayv)
+    DESKTOP_ONLY("glPointParameteriv", GL_PointParameteriv)
+    {"glTexStorageMem3DEXT", P(GL_TexStorageMem3DEXT)},
+    {"glUniform4uiv", P(GL_Uniform4uiv)},
+    DESKTOP_ONLY("glTexStorage1D", GL_TexStorage1D)
+    {"glRenderbufferStorageMultisample", P(GL_RenderbufferStorageMultisample)},
+    {"glProgramUniformMatrix3x2fv", P(GL_ProgramUniformMatrix3x2fv)},
+    DESKTOP_ONLY("glRasterPos2f", GL_RasterPos2f)
+    {"glGetBufferParameteriv", P(GL_GetBufferParameteriv)},
+    {"glTexEnvi", P(GL_TexEnvi)},
+    DESKTOP_ONLY("glVertexAttrib1s", GL_VertexAttrib1s)
+    {"glGetnUniformfvRobustANGLE", P(GL_GetnUniformfvRobustANGLE)},
+    {"glDisablei", P(GL_Disablei)},
+    {"glClipPlanef", P(GL_ClipPlanef)},
+    DESKTOP_ONLY("glProgramUniformMatrix2x3dv", GL_ProgramUniformMatrix2x3dv)
+    {"eglSwapBuffersWithFrameTokenANGLE", P(EGL_SwapBuffersWithFrameTokenANGLE)},
+    DESKTOP_ONLY("glTexCoord2i", GL_TexCoord2i)
+    {"glUniform3f", P(GL_Uniform3f)},
+    DESKTOP_ONLY("glInterleavedArrays", GL_InterleavedArrays)
+    {"eglStreamAttribKHR", P(EGL_StreamAttribKHR)},
+    {"glUniform2uiv", P(GL_Uniform2uiv)},
+    DESKTOP_ONLY("glWindowPos3fv", GL_WindowPos3fv)
+    DESKTOP_ONLY("glIndexf", GL_Indexf)
+    DESKTOP_ONLY("glPrimitiveRestartIndex", GL_PrimitiveRestartIndex)
+    DESKTOP_ONLY("glNamedFramebufferDrawBuffers", GL_NamedFramebufferDrawBuffers)
+    {"eglCreatePbufferFromClientBuffer", P(EGL_CreatePbufferFromClientBuffer)},
+    {"glGetnUniformivRobustANGLE", P(GL_GetnUniformivRobustANGLE)},
+    DESKTOP_ONLY("glTextureParameteriv", GL_TextureParameteriv)
+    {"glUniformMatrix3fv", P(GL_UniformMatrix3fv)},
+    {"glBlendFuncSeparatei", P(GL_BlendFuncSeparatei)},
+    DESKTOP_ONLY("glVertexAttrib4usv", GL_VertexAttrib4usv)
+    DESKTOP_ONLY("glVertexAttrib2sv", GL_VertexAttrib2sv)
+    {"glRenderbufferStorageMultisampleANGLE", P(GL_RenderbufferStorageMultisampleANGLE)},
+    {"glMultiDrawArraysIndirectEXT", P(GL_MultiDrawArraysIndirectEXT)},
+    {"glTexImage2DRobustANGLE", P(GL_TexImage2DRobustANGLE)},
+    DESKTOP_ONLY("glTexCoordP3ui", GL_TexCoordP3ui)
+    DESKTOP_ONLY("glUniform1d", GL_Uniform1d)
+    {"glCreateShaderProgramvEXT", P(GL_CreateShaderProgramvEXT)},
+    DESKTOP_ONLY("glSecondaryColor3uiv", GL_SecondaryColor3uiv)
+    {"glQueryCounterEXT", P(GL_QueryCounterEXT)},
+    {"glMemoryObjectParameterivEXT", P(GL_MemoryObjectParameterivEXT)},
+    DESKTOP_ONLY("glVertexAttribI2uiv", GL_VertexAttribI2uiv)
+    {"glDeleteBuffers", P(GL_DeleteBuffers)},
+    {"glTexParameterIuivRobustANGLE", P(GL_TexParameterIuivRobustANGLE)},
     {"eglGetError", P(EGL_GetError)},
-    {"eglGetFrameTimestampSupportedANDROID", P(EGL_GetFrameTimestampSupportedANDROID)},
-    {"eglGetFrameTimestampsANDROID", P(EGL_GetFrameTimestampsANDROID)},
-    {"eglGetMscRateANGLE", P(EGL_GetMscRateANGLE)},
-    {"eglGetNativeClientBufferANDROID", P(EGL_GetNativeClientBufferANDROID)},
-    {"eglGetNextFrameIdANDROID", P(EGL_GetNextFrameIdANDROID)},
-    {"eglGetPlatformDisplay", P(EGL_GetPlatformDisplay)},
-    {"eglGetPlatformDisplayEXT", P(EGL_GetPlatformDisplayEXT)},
-    {"eglGetProcAddress", P(EGL_GetProcAddress)},
-    {"eglGetSyncAttrib", P(EGL_GetSyncAttrib)},
-    {"eglGetSyncAttribKHR", P(EGL_GetSyncAttribKHR)},
-    {"eglGetSyncValuesCHROMIUM", P(EGL_GetSyncValuesCHROMIUM)},
-    {"eglHandleGPUSwitchANGLE", P(EGL_HandleGPUSwitchANGLE)},
-    {"eglInitialize", P(EGL_Initialize)},
-    {"eglLabelObjectKHR", P(EGL_LabelObjectKHR)},
-    {"eglLockSurfaceKHR", P(EGL_LockSurfaceKHR)},
-    {"eglMakeCurrent", P(EGL_MakeCurrent)},
-    {"eglPostSubBufferNV", P(EGL_PostSubBufferNV)},
-    {"eglPrepareSwapBuffersANGLE", P(EGL_PrepareSwapBuffersANGLE)},
-    {"eglPresentationTimeANDROID", P(EGL_PresentationTimeANDROID)},
-    {"eglProgramCacheGetAttribANGLE", P(EGL_ProgramCacheGetAttribANGLE)},
-    {"eglProgramCachePopulateANGLE", P(EGL_ProgramCachePopulateANGLE)},
-    {"eglProgramCacheQueryANGLE", P(EGL_ProgramCacheQueryANGLE)},
-    {"eglProgramCacheResizeANGLE", P(EGL_ProgramCacheResizeANGLE)},
-    {"eglQueryAPI", P(EGL_QueryAPI)},
-    {"eglQueryContext", P(EGL_QueryContext)},
-    {"eglQueryDebugKHR", P(EGL_QueryDebugKHR)},
-    {"eglQueryDeviceAttribEXT", P(EGL_QueryDeviceAttribEXT)},
-    {"eglQueryDeviceStringEXT", P(EGL_QueryDeviceStringEXT)},
-    {"eglQueryDisplayAttribANGLE", P(EGL_QueryDisplayAttribANGLE)},
-    {"eglQueryDisplayAttribEXT", P(EGL_QueryDisplayAttribEXT)},
-    {"eglQueryDmaBufFormatsEXT", P(EGL_QueryDmaBufFormatsEXT)},
-    {"eglQueryDmaBufModifiersEXT", P(EGL_QueryDmaBufModifiersEXT)},
-    {"eglQueryStreamKHR", P(EGL_QueryStreamKHR)},
-    {"eglQueryStreamu64KHR", P(EGL_QueryStreamu64KHR)},
-    {"eglQueryString", P(EGL_QueryString)},
-    {"eglQueryStringiANGLE", P(EGL_QueryStringiANGLE)},
-    {"eglQuerySurface", P(EGL_QuerySurface)},
-    {"eglQuerySurface64KHR", P(EGL_QuerySurface64KHR)},
-    {"eglQuerySurfacePointerANGLE", P(EGL_QuerySurfacePointerANGLE)},
-    {"eglReacquireHighPowerGPUANGLE", P(EGL_ReacquireHighPowerGPUANGLE)},
-    {"eglReleaseDeviceANGLE", P(EGL_ReleaseDeviceANGLE)},
-    {"eglReleaseExternalContextANGLE", P(EGL_ReleaseExternalContextANGLE)},
-    {"eglReleaseHighPowerGPUANGLE", P(EGL_ReleaseHighPowerGPUANGLE)},
-    {"eglReleaseTexImage", P(EGL_ReleaseTexImage)},
-    {"eglReleaseThread", P(EGL_ReleaseThread)},
+    {"glUniform3uiv", P(GL_Uniform3uiv)},
     {"eglSetBlobCacheFuncsANDROID", P(EGL_SetBlobCacheFuncsANDROID)},
-    {"eglSetDamageRegionKHR", P(EGL_SetDamageRegionKHR)},
-    {"eglSetValidationEnabledANGLE", P(EGL_SetValidationEnabledANGLE)},
-    {"eglSignalSyncKHR", P(EGL_SignalSyncKHR)},
-    {"eglStreamAttribKHR", P(EGL_StreamAttribKHR)},
-    {"eglStreamConsumerAcquireKHR", P(EGL_StreamConsumerAcquireKHR)},
-    {"eglStreamConsumerGLTextureExternalAttribsNV", P(EGL_StreamConsumerGLTextureExternalAttribsNV)},
+    {"glLightfv", P(GL_Lightfv)},
+    {"glGetSamplerParameterIuiv", P(GL_GetSamplerParameterIuiv)},
+    {"glMatrixMode", P(GL_MatrixMode)},
+    {"glPushDebugGroup", P(GL_PushDebugGroup)},
+    {"glBindBuffer", P(GL_BindBuffer)},
+    {"glGetBufferPointervRobustANGLE", P(GL_GetBufferPointervRobustANGLE)},
+    DESKTOP_ONLY("glWindowPos3d", GL_WindowPos3d)
+    {"glTexStorage3DEXT", P(GL_TexStorage3DEXT)},
+    {"glGetTexParameterIuivRobustANGLE", P(GL_GetTexParameterIuivRobustANGLE)},
+    {"glTexGeniOES", P(GL_TexGeniOES)},
+    {"glClearBufferfv", P(GL_ClearBufferfv)},
+    DESKTOP_ONLY("glColorP3ui", GL_ColorP3ui)
+    DESKTOP_ONLY("glEdgeFlagPointer", GL_EdgeFlagPointer)
+    DESKTOP_ONLY("glTexSubImage1D", GL_TexSubImage1D)
+    {"glGetFramebufferAttachmentParameterivOES", P(GL_GetFramebufferAttachmentParameterivOES)},
+    {"glCopyImageSubDataOES", P(GL_CopyImageSubDataOES)},
+    DESKTOP_ONLY("glWindowPos2d", GL_WindowPos2d)
+    DESKTOP_ONLY("glMap2d", GL_Map2d)
+    DESKTOP_ONLY("glTexGenfv", GL_TexGenfv)
+    DESKTOP_ONLY("glVertexAttribI4usv", GL_VertexAttribI4usv)
+    {"glUniform3fv", P(GL_Uniform3fv)},
+    DESKTOP_ONLY("glColor3iv", GL_Color3iv)
+    {"glTexImage3DRobustANGLE", P(GL_TexImage3DRobustANGLE)},
+    {"glPointParameterx", P(GL_PointParameterx)},
+    DESKTOP_ONLY("glVertexAttribL3d", GL_VertexAttribL3d)
     {"eglStreamConsumerGLTextureExternalKHR", P(EGL_StreamConsumerGLTextureExternalKHR)},
-    {"eglStreamConsumerReleaseKHR", P(EGL_StreamConsumerReleaseKHR)},
-    {"eglStreamPostD3DTextureANGLE", P(EGL_StreamPostD3DTextureANGLE)},
-    {"eglSurfaceAttrib", P(EGL_SurfaceAttrib)},
-    {"eglSwapBuffers", P(EGL_SwapBuffers)},
-    {"eglSwapBuffersWithDamageKHR", P(EGL_SwapBuffersWithDamageKHR)},
-    {"eglSwapBuffersWithFrameTokenANGLE", P(EGL_SwapBuffersWithFrameTokenANGLE)},
-    {"eglSwapInterval", P(EGL_SwapInterval)},
-    {"eglTerminate", P(EGL_Terminate)},
-    {"eglUnlockSurfaceKHR", P(EGL_UnlockSurfaceKHR)},
-    {"eglWaitClient", P(EGL_WaitClient)},
-    {"eglWaitGL", P(EGL_WaitGL)},
-    {"eglWaitNative", P(EGL_WaitNative)},
-    {"eglWaitSync", P(EGL_WaitSync)},
+    {"glProgramUniform3uivEXT", P(GL_ProgramUniform3uivEXT)},
+    DESKTOP_ONLY("glDrawElementsInstancedBaseInstance", GL_DrawElementsInstancedBaseInstance)
+    DESKTOP_ONLY("glColor3dv", GL_Color3dv)
+    DESKTOP_ONLY("glColor4us", GL_Color4us)
+    DESKTOP_ONLY("glGetTextureParameterIuiv", GL_GetTextureParameterIuiv)
+    {"glSamplerParameterIuiv", P(GL_SamplerParameterIuiv)},
+    {"glProgramUniform4fEXT", P(GL_ProgramUniform4fEXT)},
+    {"eglGetDisplay", P(EGL_GetDisplay)},
+    {"glFramebufferTexture", P(GL_FramebufferTexture)},
+    {"eglCopyBuffers", P(EGL_CopyBuffers)},
+    {"glBlendEquationi", P(GL_BlendEquationi)},
+    DESKTOP_ONLY("glGetTexGendv", GL_GetTexGendv)
+    {"glGetActiveUniformsiv", P(GL_GetActiveUniformsiv)},
+    {"eglGetPlatformDisplayEXT", P(EGL_GetPlatformDisplayEXT)},
+    DESKTOP_ONLY("glEvalCoord2dv", GL_EvalCoord2dv)
+    {"eglCopyMetalSharedEventANGLE", P(EGL_CopyMetalSharedEventANGLE)},
+    {"glGetTexGenivOES", P(GL_GetTexGenivOES)},
+    {"glIsQuery", P(GL_IsQuery)},
+    DESKTOP_ONLY("glInvalidateTexImage", GL_InvalidateTexImage)
+    DESKTOP_ONLY("glVertexAttribI3uiv", GL_VertexAttribI3uiv)
+    {"glVertexAttribI4iv", P(GL_VertexAttribI4iv)},
+    DESKTOP_ONLY("glVertex2sv", GL_Vertex2sv)
+    {"glProgramUniform3ui", P(GL_ProgramUniform3ui)},
+    {"eglDestroyImageKHR", P(EGL_DestroyImageKHR)},
+    {"glGetVertexAttribPointervRobustANGLE", P(GL_GetVertexAttribPointervRobustANGLE)},
+    DESKTOP_ONLY("glWindowPos2fv", GL_WindowPos2fv)
+    DESKTOP_ONLY("glGetTextureLevelParameterfv", GL_GetTextureLevelParameterfv)
+    {"glFramebufferTextureLayer", P(GL_FramebufferTextureLayer)},
     {"eglWaitSyncKHR", P(EGL_WaitSyncKHR)},
-    {"eglWaitUntilWorkScheduledANGLE", P(EGL_WaitUntilWorkScheduledANGLE)},
-    DESKTOP_ONLY("glAccum", GL_Accum)
-    {"glAcquireTexturesANGLE", P(GL_AcquireTexturesANGLE)},
-    {"glActiveShaderProgram", P(GL_ActiveShaderProgram)},
-    {"glActiveShaderProgramEXT", P(GL_ActiveShaderProgramEXT)},
-    {"glActiveTexture", P(GL_ActiveTexture)},
-    {"glAlphaFunc", P(GL_AlphaFunc)},
-    {"glAlphaFuncx", P(GL_AlphaFuncx)},
-    DESKTOP_ONLY("glAreTexturesResident", GL_AreTexturesResident)
-    DESKTOP_ONLY("glArrayElement", GL_ArrayElement)
-    {"glAttachShader", P(GL_AttachShader)},
-    DESKTOP_ONLY("glBegin", GL_Begin)
-    DESKTOP_ONLY("glBeginConditionalRender", GL_BeginConditionalRender)
-    {"glBeginPerfMonitorAMD", P(GL_BeginPerfMonitorAMD)},
-    {"glBeginPixelLocalStorageANGLE", P(GL_BeginPixelLocalStorageANGLE)},
-    {"glBeginQuery", P(GL_BeginQuery)},
-    {"glBeginQueryEXT", P(GL_BeginQueryEXT)},
-    DESKTOP_ONLY("glBeginQueryIndexed", GL_BeginQueryIndexed)
-    {"glBeginTransformFeedback", P(GL_BeginTransformFeedback)},
-    {"glBindAttribLocation", P(GL_BindAttribLocation)},
-    {"glBindBuffer", P(GL_BindBuffer)},
-    {"glBindBufferBase", P(GL_BindBufferBase)},
-    {"glBindBufferRange", P(GL_BindBufferRange)},
-    DESKTOP_ONLY("glBindBuffersBase", GL_BindBuffersBase)
-    DESKTOP_ONLY("glBindBuffersRange", GL_BindBuffersRange)
-    DESKTOP_ONLY("glBindFragDataLocation", GL_BindFragDataLocation)
-    {"glBindFragDataLocationEXT", P(GL_BindFragDataLocationEXT)},
-    DESKTOP_ONLY("glBindFragDataLocationIndexed", GL_BindFragDataLocationIndexed)
-    {"glBindFragDataLocationIndexedEXT", P(GL_BindFragDataLocationIndexedEXT)},
-    {"glBindFramebuffer", P(GL_BindFramebuffer)},
-    {"glBindFramebufferOES", P(GL_BindFramebufferOES)},
-    {"glBindImageTexture", P(GL_BindImageTexture)},
-    DESKTOP_ONLY("glBindImageTextures", GL_BindImageTextures)
-    {"glBindProgramPipeline", P(GL_BindProgramPipeline)},
-    {"glBindProgramPipelineEXT", P(GL_BindProgramPipelineEXT)},
-    {"glBindRenderbuffer", P(GL_BindRenderbuffer)},
-    {"glBindRenderbufferOES", P(GL_BindRenderbufferOES)},
-    {"glBindSampler", P(GL_BindSampler)},
-    DESKTOP_ONLY("glBindSamplers", GL_BindSamplers)
-    {"glBindTexture", P(GL_BindTexture)},
-    DESKTOP_ONLY("glBindTextureUnit", GL_BindTextureUnit)
-    DESKTOP_ONLY("glBindTextures", GL_BindTextures)
-    {"glBindTransformFeedback", P(GL_BindTransformFeedback)},
-    {"glBindUniformLocationCHROMIUM", P(GL_BindUniformLocationCHROMIUM)},
-    {"glBindVertexArray", P(GL_BindVertexArray)},
-    {"glBindVertexArrayOES", P(GL_BindVertexArrayOES)},
-    {"glBindVertexBuffer", P(GL_BindVertexBuffer)},
-    DESKTOP_ONLY("glBindVertexBuffers", GL_BindVertexBuffers)
-    DESKTOP_ONLY("glBitmap", GL_Bitmap)
-    {"glBlendBarrier", P(GL_BlendBarrier)},
-    {"glBlendBarrierKHR", P(GL_BlendBarrierKHR)},
-    {"glBlendColor", P(GL_BlendColor)},
-    {"glBlendEquation", P(GL_BlendEquation)},
-    {"glBlendEquationSeparate", P(GL_BlendEquationSeparate)},
-    {"glBlendEquationSeparatei", P(GL_BlendEquationSeparatei)},
-    {"glBlendEquationSeparateiEXT", P(GL_BlendEquationSeparateiEXT)},
-    {"glBlendEquationSeparateiOES", P(GL_BlendEquationSeparateiOES)},
-    {"glBlendEquationi", P(GL_BlendEquationi)},
-    {"glBlendEquationiEXT", P(GL_BlendEquationiEXT)},
-    {"glBlendEquationiOES", P(GL_BlendEquationiOES)},
-    {"glBlendFunc", P(GL_BlendFunc)},
-    {"glBlendFuncSeparate", P(GL_BlendFuncSeparate)},
-    {"glBlendFuncSeparatei", P(GL_BlendFuncSeparatei)},
-    {"glBlendFuncSeparateiEXT", P(GL_BlendFuncSeparateiEXT)},
-    {"glBlendFuncSeparateiOES", P(GL_BlendFuncSeparateiOES)},
-    {"glBlendFunci", P(GL_BlendFunci)},
-    {"glBlendFunciEXT", P(GL_BlendFunciEXT)},
-    {"glBlendFunciOES", P(GL_BlendFunciOES)},
-    {"glBlitFramebuffer", P(GL_BlitFramebuffer)},
-    {"glBlitFramebufferANGLE", P(GL_BlitFramebufferANGLE)},
-    {"glBlitFramebufferNV", P(GL_BlitFramebufferNV)},
-    DESKTOP_ONLY("glBlitNamedFramebuffer", GL_BlitNamedFramebuffer)
-    {"glBufferData", P(GL_BufferData)},
-    DESKTOP_ONLY("glBufferStorage", GL_BufferStorage)
-    {"glBufferStorageEXT", P(GL_BufferStorageEXT)},
-    {"glBufferStorageExternalEXT", P(GL_BufferStorageExternalEXT)},
-    {"glBufferStorageMemEXT", P(GL_BufferStorageMemEXT)},
-    {"glBufferSubData", P(GL_BufferSubData)},
-    DESKTOP_ONLY("glCallList", GL_CallList)
-    DESKTOP_ONLY("glCallLists", GL_CallLists)
-    {"glCheckFramebufferStatus", P(GL_CheckFramebufferStatus)},
-    {"glCheckFramebufferStatusOES", P(GL_CheckFramebufferStatusOES)},
-    DESKTOP_ONLY("glCheckNamedFramebufferStatus", GL_CheckNamedFramebufferStatus)
-    DESKTOP_ONLY("glClampColor", GL_ClampColor)
-    {"glClear", P(GL_Clear)},
-    DESKTOP_ONLY("glClearAccum", GL_ClearAccum)
-    DESKTOP_ONLY("glClearBufferData", GL_ClearBufferData)
-    DESKTOP_ONLY("glClearBufferSubData", GL_ClearBufferSubData)
-    {"glClearBufferfi", P(GL_ClearBufferfi)},
-    {"glClearBufferfv", P(GL_ClearBufferfv)},
-    {"glClearBufferiv", P(GL_ClearBufferiv)},
-    {"glClearBufferuiv", P(GL_ClearBufferuiv)},
-    {"glClearColor", P(GL_ClearColor)},
-    {"glClearColorx", P(GL_ClearColorx)},
-    DESKTOP_ONLY("glClearDepth", GL_ClearDepth)
-    {"glClearDepthf", P(GL_ClearDepthf)},
-    {"glClearDepthx", P(GL_ClearDepthx)},
-    DESKTOP_ONLY("glClearIndex", GL_ClearIndex)
-    DESKTOP_ONLY("glClearNamedBufferData", GL_ClearNamedBufferData)
-    DESKTOP_ONLY("glClearNamedBufferSubData", GL_ClearNamedBufferSubData)
-    DESKTOP_ONLY("glClearNamedFramebufferfi", GL_ClearNamedFramebufferfi)
-    DESKTOP_ONLY("glClearNamedFramebufferfv", GL_ClearNamedFramebufferfv)
-    DESKTOP_ONLY("glClearNamedFramebufferiv", GL_ClearNamedFramebufferiv)
-    DESKTOP_ONLY("glClearNamedFramebufferuiv", GL_ClearNamedFramebufferuiv)
-    {"glClearStencil", P(GL_ClearStencil)},
-    DESKTOP_ONLY("glClearTexImage", GL_ClearTexImage)
-    {"glClearTexImageEXT", P(GL_ClearTexImageEXT)},
-    DESKTOP_ONLY("glClearTexSubImage", GL_ClearTexSubImage)
-    {"glClearTexSubImageEXT", P(GL_ClearTexSubImageEXT)},
+    {"glDrawTexsOES", P(GL_DrawTexsOES)},
+    DESKTOP_ONLY("glDeleteLists", GL_DeleteLists)
+    {"glGetActiveUniformBlockiv", P(GL_GetActiveUniformBlockiv)},
+    DESKTOP_ONLY("glNormal3bv", GL_Normal3bv)
     {"glClientActiveTexture", P(GL_ClientActiveTexture)},
-    {"glClientWaitSync", P(GL_ClientWaitSync)},
-    DESKTOP_ONLY("glClipControl", GL_ClipControl)
-    {"glClipControlEXT", P(GL_ClipControlEXT)},
-    DESKTOP_ONLY("glClipPlane", GL_ClipPlane)
-    {"glClipPlanef", P(GL_ClipPlanef)},
-    {"glClipPlanex", P(GL_ClipPlanex)},
-    DESKTOP_ONLY("glColor3b", GL_Color3b)
-    DESKTOP_ONLY("glColor3bv", GL_Color3bv)
-    DESKTOP_ONLY("glColor3d", GL_Color3d)
-    DESKTOP_ONLY("glColor3dv", GL_Color3dv)
-    DESKTOP_ONLY("glColor3f", GL_Color3f)
-    DESKTOP_ONLY("glColor3fv", GL_Color3fv)
-    DESKTOP_ONLY("glColor3i", GL_Color3i)
-    DESKTOP_ONLY("glColor3iv", GL_Color3iv)
-    DESKTOP_ONLY("glColor3s", GL_Color3s)
-    DESKTOP_ONLY("glColor3sv", GL_Color3sv)
-    DESKTOP_ONLY("glColor3ub", GL_Color3ub)
-    DESKTOP_ONLY("glColor3ubv", GL_Color3ubv)
-    DESKTOP_ONLY("glColor3ui", GL_Color3ui)
-    DESKTOP_ONLY("glColor3uiv", GL_Color3uiv)
-    DESKTOP_ONLY("glColor3us", GL_Color3us)
-    DESKTOP_ONLY("glColor3usv", GL_Color3usv)
-    DESKTOP_ONLY("glColor4b", GL_Color4b)
-    DESKTOP_ONLY("glColor4bv", GL_Color4bv)
-    DESKTOP_ONLY("glColor4d", GL_Color4d)
-    DESKTOP_ONLY("glColor4dv", GL_Color4dv)
-    {"glColor4f", P(GL_Color4f)},
-    DESKTOP_ONLY("glColor4fv", GL_Color4fv)
-    DESKTOP_ONLY("glColor4i", GL_Color4i)
-    DESKTOP_ONLY("glColor4iv", GL_Color4iv)
-    DESKTOP_ONLY("glColor4s", GL_Color4s)
-    DESKTOP_ONLY("glColor4sv", GL_Color4sv)
-    {"glColor4ub", P(GL_Color4ub)},
-    DESKTOP_ONLY("glColor4ubv", GL_Color4ubv)
+    {"glGetUniformBlockIndex", P(GL_GetUniformBlockIndex)},
+    DESKTOP_ONLY("glTexCoord3iv", GL_TexCoord3iv)
+    {"glTexEnvx", P(GL_TexEnvx)},
+    {"glCoverageModulationCHROMIUM", P(GL_CoverageModulationCHROMIUM)},
+    {"glProgramUniformMatrix3x4fv", P(GL_ProgramUniformMatrix3x4fv)},
     DESKTOP_ONLY("glColor4ui", GL_Color4ui)
-    DESKTOP_ONLY("glColor4uiv", GL_Color4uiv)
-    DESKTOP_ONLY("glColor4us", GL_Color4us)
-    DESKTOP_ONLY("glColor4usv", GL_Color4usv)
-    {"glColor4x", P(GL_Color4x)},
-    {"glColorMask", P(GL_ColorMask)},
-    {"glColorMaski", P(GL_ColorMaski)},
-    {"glColorMaskiEXT", P(GL_ColorMaskiEXT)},
-    {"glColorMaskiOES", P(GL_ColorMaskiOES)},
-    DESKTOP_ONLY("glColorMaterial", GL_ColorMaterial)
-    DESKTOP_ONLY("glColorP3ui", GL_ColorP3ui)
-    DESKTOP_ONLY("glColorP3uiv", GL_ColorP3uiv)
-    DESKTOP_ONLY("glColorP4ui", GL_ColorP4ui)
-    DESKTOP_ONLY("glColorP4uiv", GL_ColorP4uiv)
+    DESKTOP_ONLY("glMultMatrixd", GL_MultMatrixd)
+    DESKTOP_ONLY("glSecondaryColor3ub", GL_SecondaryColor3ub)
+    {"glMultiDrawElementsBaseVertexEXT", P(GL_MultiDrawElementsBaseVertexEXT)},
+    {"glMapBufferRangeEXT", P(GL_MapBufferRangeEXT)},
+    {"glAttachShader", P(GL_AttachShader)},
     {"glColorPointer", P(GL_ColorPointer)},
-    {"glCompileShader", P(GL_CompileShader)},
-    {"glCompressedCopyTextureCHROMIUM", P(GL_CompressedCopyTextureCHROMIUM)},
-    DESKTOP_ONLY("glCompressedTexImage1D", GL_CompressedTexImage1D)
-    {"glCompressedTexImage2D", P(GL_CompressedTexImage2D)},
-    {"glCompressedTexImage2DRobustANGLE", P(GL_CompressedTexImage2DRobustANGLE)},
-    {"glCompressedTexImage3D", P(GL_CompressedTexImage3D)},
-    {"glCompressedTexImage3DOES", P(GL_CompressedTexImage3DOES)},
-    {"glCompressedTexImage3DRobustANGLE", P(GL_CompressedTexImage3DRobustANGLE)},
-    DESKTOP_ONLY("glCompressedTexSubImage1D", GL_CompressedTexSubImage1D)
-    {"glCompressedTexSubImage2D", P(GL_CompressedTexSubImage2D)},
-    {"glCompressedTexSubImage2DRobustANGLE", P(GL_CompressedTexSubImage2DRobustANGLE)},
-    {"glCompressedTexSubImage3D", P(GL_CompressedTexSubImage3D)},
-    {"glCompressedTexSubImage3DOES", P(GL_CompressedTexSubImage3DOES)},
-    {"glCompressedTexSubImage3DRobustANGLE", P(GL_CompressedTexSubImage3DRobustANGLE)},
-    DESKTOP_ONLY("glCompressedTextureSubImage1D", GL_CompressedTextureSubImage1D)
-    DESKTOP_ONLY("glCompressedTextureSubImage2D", GL_CompressedTextureSubImage2D)
-    DESKTOP_ONLY("glCompressedTextureSubImage3D", GL_CompressedTextureSubImage3D)
-    {"glCopyBufferSubData", P(GL_CopyBufferSubData)},
-    {"glCopyImageSubData", P(GL_CopyImageSubData)},
-    {"glCopyImageSubDataEXT", P(GL_CopyImageSubDataEXT)},
-    {"glCopyImageSubDataOES", P(GL_CopyImageSubDataOES)},
-    DESKTOP_ONLY("glCopyNamedBufferSubData", GL_CopyNamedBufferSubData)
-    DESKTOP_ONLY("glCopyPixels", GL_CopyPixels)
-    {"glCopySubTexture3DANGLE", P(GL_CopySubTexture3DANGLE)},
-    {"glCopySubTextureCHROMIUM", P(GL_CopySubTextureCHROMIUM)},
-    DESKTOP_ONLY("glCopyTexImage1D", GL_CopyTexImage1D)
-    {"glCopyTexImage2D", P(GL_CopyTexImage2D)},
-    DESKTOP_ONLY("glCopyTexSubImage1D", GL_CopyTexSubImage1D)
-    {"glCopyTexSubImage2D", P(GL_CopyTexSubImage2D)},
-    {"glCopyTexSubImage3D", P(GL_CopyTexSubImage3D)},
-    {"glCopyTexSubImage3DOES", P(GL_CopyTexSubImage3DOES)},
-    {"glCopyTexture3DANGLE", P(GL_CopyTexture3DANGLE)},
-    {"glCopyTextureCHROMIUM", P(GL_CopyTextureCHROMIUM)},
-    DESKTOP_ONLY("glCopyTextureSubImage1D", GL_CopyTextureSubImage1D)
-    DESKTOP_ONLY("glCopyTextureSubImage2D", GL_CopyTextureSubImage2D)
-    DESKTOP_ONLY("glCopyTextureSubImage3D", GL_CopyTextureSubImage3D)
-    {"glCoverageModulationCHROMIUM", P(GL_CoverageModulationCHROMIUM)},
-    DESKTOP_ONLY("glCreateBuffers", GL_CreateBuffers)
-    DESKTOP_ONLY("glCreateFramebuffers", GL_CreateFramebuffers)
-    {"glCreateMemoryObjectsEXT", P(GL_CreateMemoryObjectsEXT)},
-    {"glCreateProgram", P(GL_CreateProgram)},
-    DESKTOP_ONLY("glCreateProgramPipelines", GL_CreateProgramPipelines)
-    DESKTOP_ONLY("glCreateQueries", GL_CreateQueries)
-    DESKTOP_ONLY("glCreateRenderbuffers", GL_CreateRenderbuffers)
-    DESKTOP_ONLY("glCreateSamplers", GL_CreateSamplers)
-    {"glCreateShader", P(GL_CreateShader)},
-    {"glCreateShaderProgramv", P(GL_CreateShaderProgramv)},
-    {"glCreateShaderProgramvEXT", P(GL_CreateShaderProgramvEXT)},
-    DESKTOP_ONLY("glCreateTextures", GL_CreateTextures)
-    DESKTOP_ONLY("glCreateTransformFeedbacks", GL_CreateTransformFeedbacks)
-    DESKTOP_ONLY("glCreateVertexArrays", GL_CreateVertexArrays)
-    {"glCullFace", P(GL_CullFace)},
-    {"glCurrentPaletteMatrixOES", P(GL_CurrentPaletteMatrixOES)},
-    {"glDebugMessageCallback", P(GL_DebugMessageCallback)},
-    {"glDebugMessageCallbackKHR", P(GL_DebugMessageCallbackKHR)},
-    {"glDebugMessageControl", P(GL_DebugMessageControl)},
-    {"glDebugMessageControlKHR", P(GL_DebugMessageControlKHR)},
-    {"glDebugMessageInsert", P(GL_DebugMessageInsert)},
-    {"glDebugMessageInsertKHR", P(GL_DebugMessageInsertKHR)},
-    {"glDeleteBuffers", P(GL_DeleteBuffers)},
-    {"glDeleteFencesNV", P(GL_DeleteFencesNV)},
-    {"glDeleteFramebuffers", P(GL_DeleteFramebuffers)},
-    {"glDeleteFramebuffersOES", P(GL_DeleteFramebuffersOES)},
-    DESKTOP_ONLY("glDeleteLists", GL_DeleteLists)
-    {"glDeleteMemoryObjectsEXT", P(GL_DeleteMemoryObjectsEXT)},
-    {"glDeletePerfMonitorsAMD", P(GL_DeletePerfMonitorsAMD)},
-    {"glDeleteProgram", P(GL_DeleteProgram)},
-    {"glDeleteProgramPipelines", P(GL_DeleteProgramPipelines)},
-    {"glDeleteProgramPipelinesEXT", P(GL_DeleteProgramPipelinesEXT)},
-    {"glDeleteQueries", P(GL_DeleteQueries)},
-    {"glDeleteQueriesEXT", P(GL_DeleteQueriesEXT)},
-    {"glDeleteRenderbuffers", P(GL_DeleteRenderbuffers)},
-    {"glDeleteRenderbuffersOES", P(GL_DeleteRenderbuffersOES)},
-    {"glDeleteSamplers", P(GL_DeleteSamplers)},
-    {"glDeleteSemaphoresEXT", P(GL_DeleteSemaphoresEXT)},
-    {"glDeleteShader", P(GL_DeleteShader)},
-    {"glDeleteSync", P(GL_DeleteSync)},
-    {"glDeleteTextures", P(GL_DeleteTextures)},
-    {"glDeleteTransformFeedbacks", P(GL_DeleteTransformFeedbacks)},
-    {"glDeleteVertexArrays", P(GL_DeleteVertexArrays)},
-    {"glDeleteVertexArraysOES", P(GL_DeleteVertexArraysOES)},
-    {"glDepthFunc", P(GL_DepthFunc)},
-    {"glDepthMask", P(GL_DepthMask)},
-    DESKTOP_ONLY("glDepthRange", GL_DepthRange)
-    DESKTOP_ONLY("glDepthRangeArrayv", GL_DepthRangeArrayv)
-    DESKTOP_ONLY("glDepthRangeIndexed", GL_DepthRangeIndexed)
-    {"glDepthRangef", P(GL_DepthRangef)},
-    {"glDepthRangex", P(GL_DepthRangex)},
-    {"glDetachShader", P(GL_DetachShader)},
-    {"glDisable", P(GL_Disable)},
-    {"glDisableClientState", P(GL_DisableClientState)},
-    {"glDisableExtensionANGLE", P(GL_DisableExtensionANGLE)},
-    DESKTOP_ONLY("glDisableVertexArrayAttrib", GL_DisableVertexArrayAttrib)
-    {"glDisableVertexAttribArray", P(GL_DisableVertexAttribArray)},
-    {"glDisablei", P(GL_Disablei)},
-    {"glDisableiEXT", P(GL_DisableiEXT)},
-    {"glDisableiOES", P(GL_DisableiOES)},
-    {"glDiscardFramebufferEXT", P(GL_DiscardFramebufferEXT)},
-    {"glDispatchCompute", P(GL_DispatchCompute)},
-    {"glDispatchComputeIndirect", P(GL_DispatchComputeIndirect)},
-    {"glDrawArrays", P(GL_DrawArrays)},
-    {"glDrawArraysIndirect", P(GL_DrawArraysIndirect)},
-    {"glDrawArraysInstanced", P(GL_DrawArraysInstanced)},
-    {"glDrawArraysInstancedANGLE", P(GL_DrawArraysInstancedANGLE)},
-    DESKTOP_ONLY("glDrawArraysInstancedBaseInstance", GL_DrawArraysInstancedBaseInstance)
-    {"glDrawArraysInstancedBaseInstanceANGLE", P(GL_DrawArraysInstancedBaseInstanceANGLE)},
-    {"glDrawArraysInstancedBaseInstanceEXT", P(GL_DrawArraysInstancedBaseInstanceEXT)},
-    {"glDrawArraysInstancedEXT", P(GL_DrawArraysInstancedEXT)},
-    DESKTOP_ONLY("glDrawBuffer", GL_DrawBuffer)
-    {"glDrawBuffers", P(GL_DrawBuffers)},
-    {"glDrawBuffersEXT", P(GL_DrawBuffersEXT)},
-    {"glDrawElements", P(GL_DrawElements)},
-    {"glDrawElementsBaseVertex", P(GL_DrawElementsBaseVertex)},
-    {"glDrawElementsBaseVertexEXT", P(GL_DrawElementsBaseVertexEXT)},
-    {"glDrawElementsBaseVertexOES", P(GL_DrawElementsBaseVertexOES)},
-    {"glDrawElementsIndirect", P(GL_DrawElementsIndirect)},
-    {"glDrawElementsInstanced", P(GL_DrawElementsInstanced)},
-    {"glDrawElementsInstancedANGLE", P(GL_DrawElementsInstancedANGLE)},
-    DESKTOP_ONLY("glDrawElementsInstancedBaseInstance", GL_DrawElementsInstancedBaseInstance)
-    {"glDrawElementsInstancedBaseInstanceEXT", P(GL_DrawElementsInstancedBaseInstanceEXT)},
-    {"glDrawElementsInstancedBaseVertex", P(GL_DrawElementsInstancedBaseVertex)},
-    DESKTOP_ONLY("glDrawElementsInstancedBaseVertexBaseInstance", GL_DrawElementsInstancedBaseVertexBaseInstance)
-    {"glDrawElementsInstancedBaseVertexBaseInstanceANGLE", P(GL_DrawElementsInstancedBaseVertexBaseInstanceANGLE)},
-    {"glDrawElementsInstancedBaseVertexBaseInstanceEXT", P(GL_DrawElementsInstancedBaseVertexBaseInstanceEXT)},
-    {"glDrawElementsInstancedBaseVertexEXT", P(GL_DrawElementsInstancedBaseVertexEXT)},
-    {"glDrawElementsInstancedBaseVertexOES", P(GL_DrawElementsInstancedBaseVertexOES)},
-    {"glDrawElementsInstancedEXT", P(GL_DrawElementsInstancedEXT)},
-    DESKTOP_ONLY("glDrawPixels", GL_DrawPixels)
-    {"glDrawRangeElements", P(GL_DrawRangeElements)},
-    {"glDrawRangeElementsBaseVertex", P(GL_DrawRangeElementsBaseVertex)},
-    {"glDrawRangeElementsBaseVertexEXT", P(GL_DrawRangeElementsBaseVertexEXT)},
-    {"glDrawRangeElementsBaseVertexOES", P(GL_DrawRangeElementsBaseVertexOES)},
-    {"glDrawTexfOES", P(GL_DrawTexfOES)},
-    {"glDrawTexfvOES", P(GL_DrawTexfvOES)},
-    {"glDrawTexiOES", P(GL_DrawTexiOES)},
-    {"glDrawTexivOES", P(GL_DrawTexivOES)},
-    {"glDrawTexsOES", P(GL_DrawTexsOES)},
-    {"glDrawTexsvOES", P(GL_DrawTexsvOES)},
-    {"glDrawTexxOES", P(GL_DrawTexxOES)},
-    {"glDrawTexxvOES", P(GL_DrawTexxvOES)},
-    DESKTOP_ONLY("glDrawTransformFeedback", GL_DrawTransformFeedback)
-    DESKTOP_ONLY("glDrawTransformFeedbackInstanced", GL_DrawTransformFeedbackInstanced)
-    DESKTOP_ONLY("glDrawTransformFeedbackStream", GL_DrawTransformFeedbackStream)
-    DESKTOP_ONLY("glDrawTransformFeedbackStreamInstanced", GL_DrawTransformFeedbackStreamInstanced)
-    {"glEGLImageTargetRenderbufferStorageOES", P(GL_EGLImageTargetRenderbufferStorageOES)},
-    {"glEGLImageTargetTexStorageEXT", P(GL_EGLImageTargetTexStorageEXT)},
-    {"glEGLImageTargetTexture2DOES", P(GL_EGLImageTargetTexture2DOES)},
-    {"glEGLImageTargetTextureStorageEXT", P(GL_EGLImageTargetTextureStorageEXT)},
-    DESKTOP_ONLY("glEdgeFlag", GL_EdgeFlag)
-    DESKTOP_ONLY("glEdgeFlagPointer", GL_EdgeFlagPointer)
-    DESKTOP_ONLY("glEdgeFlagv", GL_EdgeFlagv)
-    {"glEnable", P(GL_Enable)},
-    {"glEnableClientState", P(GL_EnableClientState)},
-    DESKTOP_ONLY("glEnableVertexArrayAttrib", GL_EnableVertexArrayAttrib)
-    {"glEnableVertexAttribArray", P(GL_EnableVertexAttribArray)},
-    {"glEnablei", P(GL_Enablei)},
-    {"glEnableiEXT", P(GL_EnableiEXT)},
-    {"glEnableiOES", P(GL_EnableiOES)},
-    DESKTOP_ONLY("glEnd", GL_End)
-    DESKTOP_ONLY("glEndConditionalRender", GL_EndConditionalRender)
-    DESKTOP_ONLY("glEndList", GL_EndList)
-    {"glEndPerfMonitorAMD", P(GL_EndPerfMonitorAMD)},
-    {"glEndPixelLocalStorageANGLE", P(GL_EndPixelLocalStorageANGLE)},
-    {"glEndQuery", P(GL_EndQuery)},
-    {"glEndQueryEXT", P(GL_EndQueryEXT)},
-    DESKTOP_ONLY("glEndQueryIndexed", GL_EndQueryIndexed)
-    {"glEndTilingQCOM", P(GL_EndTilingQCOM)},
-    {"glEndTransformFeedback", P(GL_EndTransformFeedback)},
-    DESKTOP_ONLY("glEvalCoord1d", GL_EvalCoord1d)
-    DESKTOP_ONLY("glEvalCoord1dv", GL_EvalCoord1dv)
-    DESKTOP_ONLY("glEvalCoord1f", GL_EvalCoord1f)
-    DESKTOP_ONLY("glEvalCoord1fv", GL_EvalCoord1fv)
-    DESKTOP_ONLY("glEvalCoord2d", GL_EvalCoord2d)
-    DESKTOP_ONLY("glEvalCoord2dv", GL_EvalCoord2dv)
-    DESKTOP_ONLY("glEvalCoord2f", GL_EvalCoord2f)
-    DESKTOP_ONLY("glEvalCoord2fv", GL_EvalCoord2fv)
-    DESKTOP_ONLY("glEvalMesh1", GL_EvalMesh1)
-    DESKTOP_ONLY("glEvalMesh2", GL_EvalMesh2)
-    DESKTOP_ONLY("glEvalPoint1", GL_EvalPoint1)
-    DESKTOP_ONLY("glEvalPoint2", GL_EvalPoint2)
-    DESKTOP_ONLY("glFeedbackBuffer", GL_FeedbackBuffer)
-    {"glFenceSync", P(GL_FenceSync)},
-    {"glFinish", P(GL_Finish)},
-    {"glFinishFenceNV", P(GL_FinishFenceNV)},
-    {"glFlush", P(GL_Flush)},
-    {"glFlushMappedBufferRange", P(GL_FlushMappedBufferRange)},
-    {"glFlushMappedBufferRangeEXT", P(GL_FlushMappedBufferRangeEXT)},
-    DESKTOP_ONLY("glFlushMappedNamedBufferRange", GL_FlushMappedNamedBufferRange)
-    DESKTOP_ONLY("glFogCoordPointer", GL_FogCoordPointer)
-    DESKTOP_ONLY("glFogCoordd", GL_FogCoordd)
-    DESKTOP_ONLY("glFogCoorddv", GL_FogCoorddv)
-    DESKTOP_ONLY("glFogCoordf", GL_FogCoordf)
-    DESKTOP_ONLY("glFogCoordfv", GL_FogCoordfv)
-    {"glFogf", P(GL_Fogf)},
-    {"glFogfv", P(GL_Fogfv)},
-    DESKTOP_ONLY("glFogi", GL_Fogi)
-    DESKTOP_ONLY("glFogiv", GL_Fogiv)
-    {"glFogx", P(GL_Fogx)},
-    {"glFogxv", P(GL_Fogxv)},
-    {"glFramebufferFetchBarrierEXT", P(GL_FramebufferFetchBarrierEXT)},
-    {"glFramebufferFoveationConfigQCOM", P(GL_FramebufferFoveationConfigQCOM)},
-    {"glFramebufferFoveationParametersQCOM", P(GL_FramebufferFoveationParametersQCOM)},
-    {"glFramebufferMemorylessPixelLocalStorageANGLE", P(GL_FramebufferMemorylessPixelLocalStorageANGLE)},
-    {"glFramebufferParameteri", P(GL_FramebufferParameteri)},
-    {"glFramebufferParameteriMESA", P(GL_FramebufferParameteriMESA)},
-    {"glFramebufferPixelLocalClearValuefvANGLE", P(GL_FramebufferPixelLocalClearValuefvANGLE)},
-    {"glFramebufferPixelLocalClearValueivANGLE", P(GL_FramebufferPixelLocalClearValueivANGLE)},
-    {"glFramebufferPixelLocalClearValueuivANGLE", P(GL_FramebufferPixelLocalClearValueuivANGLE)},
-    {"glFramebufferPixelLocalStorageInterruptANGLE", P(GL_FramebufferPixelLocalStorageInterruptANGLE)},
-    {"glFramebufferPixelLocalStorageRestoreANGLE", P(GL_FramebufferPixelLocalStorageRestoreANGLE)},
-    {"glFramebufferRenderbuffer", P(GL_FramebufferRenderbuffer)},
-    {"glFramebufferRenderbufferOES", P(GL_FramebufferRenderbufferOES)},
-    {"glFramebufferTexture", P(GL_FramebufferTexture)},
-    DESKTOP_ONLY("glFramebufferTexture1D", GL_FramebufferTexture1D)
-    {"glFramebufferTexture2D", P(GL_FramebufferTexture2D)},
-    {"glFramebufferTexture2DMultisampleEXT", P(GL_FramebufferTexture2DMultisampleEXT)},
-    {"glFramebufferTexture2DOES", P(GL_FramebufferTexture2DOES)},
-    DESKTOP_ONLY("glFramebufferTexture3D", GL_FramebufferTexture3D)
-    {"glFramebufferTexture3DOES", P(GL_FramebufferTexture3DOES)},
-    {"glFramebufferTextureEXT", P(GL_FramebufferTextureEXT)},
-    {"glFramebufferTextureLayer", P(GL_FramebufferTextureLayer)},
-    {"glFramebufferTextureMultiviewOVR", P(GL_FramebufferTextureMultiviewOVR)},
-    {"glFramebufferTextureOES", P(GL_FramebufferTextureOES)},
-    {"glFramebufferTexturePixelLocalStorageANGLE", P(GL_FramebufferTexturePixelLocalStorageANGLE)},
-    {"glFrontFace", P(GL_FrontFace)},
-    DESKTOP_ONLY("glFrustum", GL_Frustum)
-    {"glFrustumf", P(GL_Frustumf)},
-    {"glFrustumx", P(GL_Frustumx)},
-    {"glGenBuffers", P(GL_GenBuffers)},
-    {"glGenFencesNV", P(GL_GenFencesNV)},
-    {"glGenFramebuffers", P(GL_GenFramebuffers)},
-    {"glGenFramebuffersOES", P(GL_GenFramebuffersOES)},
-    DESKTOP_ONLY("glGenLists", GL_GenLists)
-    {"glGenPerfMonitorsAMD", P(GL_GenPerfMonitorsAMD)},
-    {"glGenProgramPipelines", P(GL_GenProgramPipelines)},
-    {"glGenProgramPipelinesEXT", P(GL_GenProgramPipelinesEXT)},
-    {"glGenQueries", P(GL_GenQueries)},
-    {"glGenQueriesEXT", P(GL_GenQueriesEXT)},
-    {"glGenRenderbuffers", P(GL_GenRenderbuffers)},
-    {"glGenRenderbuffersOES", P(GL_GenRenderbuffersOES)},
-    {"glGenSamplers", P(GL_GenSamplers)},
-    {"glGenSemaphoresEXT", P(GL_GenSemaphoresEXT)},
-    {"glGenTextures", P(GL_GenTextures)},
-    {"glGenTransformFeedbacks", P(GL_GenTransformFeedbacks)},
-    {"glGenVertexArrays", P(GL_GenVertexArrays)},
-    {"glGenVertexArraysOES", P(GL_GenVertexArraysOES)},
-    {"glGenerateMipmap", P(GL_GenerateMipmap)},
-    {"glGenerateMipmapOES", P(GL_GenerateMipmapOES)},
-    DESKTOP_ONLY("glGenerateTextureMipmap", GL_GenerateTextureMipmap)
-    DESKTOP_ONLY("glGetActiveAtomicCounterBufferiv", GL_GetActiveAtomicCounterBufferiv)
-    {"glGetActiveAttrib", P(GL_GetActiveAttrib)},
-    DESKTOP_ONLY("glGetActiveSubroutineName", GL_GetActiveSubroutineName)
-    DESKTOP_ONLY("glGetActiveSubroutineUniformName", GL_GetActiveSubroutineUniformName)
-    DESKTOP_ONLY("glGetActiveSubroutineUniformiv", GL_GetActiveSubroutineUniformiv)
-    {"glGetActiveUniform", P(GL_GetActiveUniform)},
-    {"glGetActiveUniformBlockName", P(GL_GetActiveUniformBlockName)},
-    {"glGetActiveUniformBlockiv", P(GL_GetActiveUniformBlockiv)},
-    {"glGetActiveUniformBlockivRobustANGLE", P(GL_GetActiveUniformBlockivRobustANGLE)},
-    DESKTOP_ONLY("glGetActiveUniformName", GL_GetActiveUniformName)
-    {"glGetActiveUniformsiv", P(GL_GetActiveUniformsiv)},
-    {"glGetAttachedShaders", P(GL_GetAttachedShaders)},
-    {"glGetAttribLocation", P(GL_GetAttribLocation)},
-    {"glGetBooleani_v", P(GL_GetBooleani_v)},
-    {"glGetBooleani_vRobustANGLE", P(GL_GetBooleani_vRobustANGLE)},
-    {"glGetBooleanv", P(GL_GetBooleanv)},
-    {"glGetBooleanvRobustANGLE", P(GL_GetBooleanvRobustANGLE)},
-    {"glGetBufferParameteri64v", P(GL_GetBufferParameteri64v)},
-    {"glGetBufferParameteri64vRobustANGLE", P(GL_GetBufferParameteri64vRobustANGLE)},
-    {"glGetBufferParameteriv", P(GL_GetBufferParameteriv)},
-    {"glGetBufferParameterivRobustANGLE", P(GL_GetBufferParameterivRobustANGLE)},
-    {"glGetBufferPointerv", P(GL_GetBufferPointerv)},
-    {"glGetBufferPointervOES", P(GL_GetBufferPointervOES)},
-    {"glGetBufferPointervRobustANGLE", P(GL_GetBufferPointervRobustANGLE)},
-    DESKTOP_ONLY("glGetBufferSubData", GL_GetBufferSubData)
-    DESKTOP_ONLY("glGetClipPlane", GL_GetClipPlane)
-    {"glGetClipPlanef", P(GL_GetClipPlanef)},
-    {"glGetClipPlanex", P(GL_GetClipPlanex)},
-    DESKTOP_ONLY("glGetCompressedTexImage", GL_GetCompressedTexImage)
-    {"glGetCompressedTexImageANGLE", P(GL_GetCompressedTexImageANGLE)},
-    DESKTOP_ONLY("glGetCompressedTextureImage", GL_GetCompressedTextureImage)
-    DESKTOP_ONLY("glGetCompressedTextureSubImage", GL_GetCompressedTextureSubImage)
-    {"glGetDebugMessageLog", P(GL_GetDebugMessageLog)},
-    {"glGetDebugMessageLogKHR", P(GL_GetDebugMessageLogKHR)},
-    DESKTOP_ONLY("glGetDoublei_v", GL_GetDoublei_v)
-    DESKTOP_ONLY("glGetDoublev", GL_GetDoublev)
-    {"glGetError", P(GL_GetError)},
-    {"glGetFenceivNV", P(GL_GetFenceivNV)},
-    {"glGetFixedv", P(GL_GetFixedv)},
-    DESKTOP_ONLY("glGetFloati_v", GL_GetFloati_v)
-    {"glGetFloatv", P(GL_GetFloatv)},
-    {"glGetFloatvRobustANGLE", P(GL_GetFloatvRobustANGLE)},
-    DESKTOP_ONLY("glGetFragDataIndex", GL_GetFragDataIndex)
-    {"glGetFragDataIndexEXT", P(GL_GetFragDataIndexEXT)},
-    {"glGetFragDataLocation", P(GL_GetFragDataLocation)},
-    {"glGetFramebufferAttachmentParameteriv", P(GL_GetFramebufferAttachmentParameteriv)},
-    {"glGetFramebufferAttachmentParameterivOES", P(GL_GetFramebufferAttachmentParameterivOES)},
-    {"glGetFramebufferAttachmentParameterivRobustANGLE", P(GL_GetFramebufferAttachmentParameterivRobustANGLE)},
-    {"glGetFramebufferParameteriv", P(GL_GetFramebufferParameteriv)},
-    {"glGetFramebufferParameterivMESA", P(GL_GetFramebufferParameterivMESA)},
-    {"glGetFramebufferParameterivRobustANGLE", P(GL_GetFramebufferParameterivRobustANGLE)},
-    {"glGetFramebufferPixelLocalStorageParameterfvANGLE", P(GL_GetFramebufferPixelLocalStorageParameterfvANGLE)},
-    {"glGetFramebufferPixelLocalStorageParameterfvRobustANGLE", P(GL_GetFramebufferPixelLocalStorageParameterfvRobustANGLE)},
-    {"glGetFramebufferPixelLocalStorageParameterivANGLE", P(GL_GetFramebufferPixelLocalStorageParameterivANGLE)},
-    {"glGetFramebufferPixelLocalStorageParameterivRobustANGLE", P(GL_GetFramebufferPixelLocalStorageParameterivRobustANGLE)},
-    {"glGetGraphicsResetStatus", P(GL_GetGraphicsResetStatus)},
-    {"glGetGraphicsResetStatusEXT", P(GL_GetGraphicsResetStatusEXT)},
-    {"glGetGraphicsResetStatusKHR", P(GL_GetGraphicsResetStatusKHR)},
-    {"glGetInteger64i_v", P(GL_GetInteger64i_v)},
-    {"glGetInteger64i_vRobustANGLE", P(GL_GetInteger64i_vRobustANGLE)},
-    {"glGetInteger64v", P(GL_GetInteger64v)},
-    {"glGetInteger64vEXT", P(GL_GetInteger64vEXT)},
-    {"glGetInteger64vRobustANGLE", P(GL_GetInteger64vRobustANGLE)},
-    {"glGetIntegeri_v", P(GL_GetIntegeri_v)},
-    {"glGetIntegeri_vRobustANGLE", P(GL_GetIntegeri_vRobustANGLE)},
-    {"glGetIntegerv", P(GL_GetIntegerv)},
-    {"glGetIntegervRobustANGLE", P(GL_GetIntegervRobustANGLE)},
-    DESKTOP_ONLY("glGetInternalformati64v", GL_GetInternalformati64v)
-    {"glGetInternalformativ", P(GL_GetInternalformativ)},
-    {"glGetInternalformativRobustANGLE", P(GL_GetInternalformativRobustANGLE)},
-    {"glGetLightfv", P(GL_GetLightfv)},
-    DESKTOP_ONLY("glGetLightiv", GL_GetLightiv)
-    {"glGetLightxv", P(GL_GetLightxv)},
-    DESKTOP_ONLY("glGetMapdv", GL_GetMapdv)
-    DESKTOP_ONLY("glGetMapfv", GL_GetMapfv)
-    DESKTOP_ONLY("glGetMapiv", GL_GetMapiv)
-    {"glGetMaterialfv", P(GL_GetMaterialfv)},
-    DESKTOP_ONLY("glGetMaterialiv", GL_GetMaterialiv)
-    {"glGetMaterialxv", P(GL_GetMaterialxv)},
-    {"glGetMemoryObjectParameterivEXT", P(GL_GetMemoryObjectParameterivEXT)},
-    {"glGetMultisamplefv", P(GL_GetMultisamplefv)},
-    {"glGetMultisamplefvANGLE", P(GL_GetMultisamplefvANGLE)},
-    {"glGetMultisamplefvRobustANGLE", P(GL_GetMultisamplefvRobustANGLE)},
-    DESKTOP_ONLY("glGetNamedBufferParameteri64v", GL_GetNamedBufferParameteri64v)
-    DESKTOP_ONLY("glGetNamedBufferParameteriv", GL_GetNamedBufferParameteriv)
-    DESKTOP_ONLY("glGetNamedBufferPointerv", GL_GetNamedBufferPointerv)
-    DESKTOP_ONLY("glGetNamedBufferSubData", GL_GetNamedBufferSubData)
-    DESKTOP_ONLY("glGetNamedFramebufferAttachmentParameteriv", GL_GetNamedFramebufferAttachmentParameteriv)
-    DESKTOP_ONLY("glGetNamedFramebufferParameteriv", GL_GetNamedFramebufferParameteriv)
-    DESKTOP_ONLY("glGetNamedRenderbufferParameteriv", GL_GetNamedRenderbufferParameteriv)
-    {"glGetObjectLabel", P(GL_GetObjectLabel)},
-    {"glGetObjectLabelEXT", P(GL_GetObjectLabelEXT)},
-    {"glGetObjectLabelKHR", P(GL_GetObjectLabelKHR)},
-    {"glGetObjectPtrLabel", P(GL_GetObjectPtrLabel)},
-    {"glGetObjectPtrLabelKHR", P(GL_GetObjectPtrLabelKHR)},
-    {"glGetPerfMonitorCounterDataAMD", P(GL_GetPerfMonitorCounterDataAMD)},
-    {"glGetPerfMonitorCounterInfoAMD", P(GL_GetPerfMonitorCounterInfoAMD)},
-    {"glGetPerfMonitorCounterStringAMD", P(GL_GetPerfMonitorCounterStringAMD)},
-    {"glGetPerfMonitorCountersAMD", P(GL_GetPerfMonitorCountersAMD)},
-    {"glGetPerfMonitorGroupStringAMD", P(GL_GetPerfMonitorGroupStringAMD)},
-    {"glGetPerfMonitorGroupsAMD", P(GL_GetPerfMonitorGroupsAMD)},
-    DESKTOP_ONLY("glGetPixelMapfv", GL_GetPixelMapfv)
-    DESKTOP_ONLY("glGetPixelMapuiv", GL_GetPixelMapuiv)
-    DESKTOP_ONLY("glGetPixelMapusv", GL_GetPixelMapusv)
-    {"glGetPointerv", P(GL_GetPointerv)},
-    {"glGetPointervKHR", P(GL_GetPointervKHR)},
-    {"glGetPointervRobustANGLERobustANGLE", P(GL_GetPointervRobustANGLERobustANGLE)},
-    DESKTOP_ONLY("glGetPolygonStipple", GL_GetPolygonStipple)
-    {"glGetProgramBinary", P(GL_GetProgramBinary)},
-    {"glGetProgramBinaryOES", P(GL_GetProgramBinaryOES)},
-    {"glGetProgramInfoLog", P(GL_GetProgramInfoLog)},
-    {"glGetProgramInterfaceiv", P(GL_GetProgramInterfaceiv)},
-    {"glGetProgramInterfaceivRobustANGLE", P(GL_GetProgramInterfaceivRobustANGLE)},
-    {"glGetProgramPipelineInfoLog", P(GL_GetProgramPipelineInfoLog)},
-    {"glGetProgramPipelineInfoLogEXT", P(GL_GetProgramPipelineInfoLogEXT)},
-    {"glGetProgramPipelineiv", P(GL_GetProgramPipelineiv)},
-    {"glGetProgramPipelineivEXT", P(GL_GetProgramPipelineivEXT)},
-    {"glGetProgramResourceIndex", P(GL_GetProgramResourceIndex)},
-    {"glGetProgramResourceLocation", P(GL_GetProgramResourceLocation)},
-    DESKTOP_ONLY("glGetProgramResourceLocationIndex", GL_GetProgramResourceLocationIndex)
-    {"glGetProgramResourceLocationIndexEXT", P(GL_GetProgramResourceLocationIndexEXT)},
-    {"glGetProgramResourceName", P(GL_GetProgramResourceName)},
-    {"glGetProgramResourceiv", P(GL_GetProgramResourceiv)},
-    DESKTOP_ONLY("glGetProgramStageiv", GL_GetProgramStageiv)
-    {"glGetProgramiv", P(GL_GetProgramiv)},
-    {"glGetProgramivRobustANGLE", P(GL_GetProgramivRobustANGLE)},
-    DESKTOP_ONLY("glGetQueryBufferObjecti64v", GL_GetQueryBufferObjecti64v)
-    DESKTOP_ONLY("glGetQueryBufferObjectiv", GL_GetQueryBufferObjectiv)
-    DESKTOP_ONLY("glGetQueryBufferObjectui64v", GL_GetQueryBufferObjectui64v)
-    DESKTOP_ONLY("glGetQueryBufferObjectuiv", GL_GetQueryBufferObjectuiv)
-    DESKTOP_ONLY("glGetQueryIndexediv", GL_GetQueryIndexediv)
-    DESKTOP_ONLY("glGetQueryObjecti64v", GL_GetQueryObjecti64v)
-    {"glGetQueryObjecti64vEXT", P(GL_GetQueryObjecti64vEXT)},
-    {"glGetQueryObjecti64vRobustANGLE", P(GL_GetQueryObjecti64vRobustANGLE)},
-    DESKTOP_ONLY("glGetQueryObjectiv", GL_GetQueryObjectiv)
-    {"glGetQueryObjectivEXT", P(GL_GetQueryObjectivEXT)},
-    {"glGetQueryObjectivRobustANGLE", P(GL_GetQueryObjectivRobustANGLE)},
-    DESKTOP_ONLY("glGetQueryObjectui64v", GL_GetQueryObjectui64v)
-    {"glGetQueryObjectui64vEXT", P(GL_GetQueryObjectui64vEXT)},
-    {"glGetQueryObjectui64vRobustANGLE", P(GL_GetQueryObjectui64vRobustANGLE)},
-    {"glGetQueryObjectuiv", P(GL_GetQueryObjectuiv)},
-    {"glGetQueryObjectuivEXT", P(GL_GetQueryObjectuivEXT)},
-    {"glGetQueryObjectuivRobustANGLE", P(GL_GetQueryObjectuivRobustANGLE)},
-    {"glGetQueryiv", P(GL_GetQueryiv)},
-    {"glGetQueryivEXT", P(GL_GetQueryivEXT)},
-    {"glGetQueryivRobustANGLE", P(GL_GetQueryivRobustANGLE)},
-    {"glGetRenderbufferImageANGLE", P(GL_GetRenderbufferImageANGLE)},
-    {"glGetRenderbufferParameteriv", P(GL_GetRenderbufferParameteriv)},
-    {"glGetRenderbufferParameterivOES", P(GL_GetRenderbufferParameterivOES)},
-    {"glGetRenderbufferParameterivRobustANGLE", P(GL_GetRenderbufferParameterivRobustANGLE)},
-    {"glGetSamplerParameterIiv", P(GL_GetSamplerParameterIiv)},
-    {"glGetSamplerParameterIivEXT", P(GL_GetSamplerParameterIivEXT)},
-    {"glGetSamplerParameterIivOES", P(GL_GetSamplerParameterIivOES)},
-    {"glGetSamplerParameterIivRobustANGLE", P(GL_GetSamplerParameterIivRobustANGLE)},
-    {"glGetSamplerParameterIuiv", P(GL_GetSamplerParameterIuiv)},
-    {"glGetSamplerParameterIuivEXT", P(GL_GetSamplerParameterIuivEXT)},
-    {"glGetSamplerParameterIuivOES", P(GL_GetSamplerParameterIuivOES)},
-    {"glGetSamplerParameterIuivRobustANGLE", P(GL_GetSamplerParameterIuivRobustANGLE)},
-    {"glGetSamplerParameterfv", P(GL_GetSamplerParameterfv)},
-    {"glGetSamplerParameterfvRobustANGLE", P(GL_GetSamplerParameterfvRobustANGLE)},
-    {"glGetSamplerParameteriv", P(GL_GetSamplerParameteriv)},
-    {"glGetSamplerParameterivRobustANGLE", P(GL_GetSamplerParameterivRobustANGLE)},
-    {"glGetSemaphoreParameterui64vEXT", P(GL_GetSemaphoreParameterui64vEXT)},
-    {"glGetShaderInfoLog", P(GL_GetShaderInfoLog)},
-    {"glGetShaderPrecisionFormat", P(GL_GetShaderPrecisionFormat)},
-    {"glGetShaderSource", P(GL_GetShaderSource)},
-    {"glGetShaderiv", P(GL_GetShaderiv)},
-    {"glGetShaderivRobustANGLE", P(GL_GetShaderivRobustANGLE)},
-    {"glGetString", P(GL_GetString)},
-    {"glGetStringi", P(GL_GetStringi)},
-    DESKTOP_ONLY("glGetSubroutineIndex", GL_GetSubroutineIndex)
-    DESKTOP_ONLY("glGetSubroutineUniformLocation", GL_GetSubroutineUniformLocation)
-    {"glGetSynciv", P(GL_GetSynciv)},
-    {"glGetTexEnvfv", P(GL_GetTexEnvfv)},
-    {"glGetTexEnviv", P(GL_GetTexEnviv)},
-    {"glGetTexEnvxv", P(GL_GetTexEnvxv)},
-    DESKTOP_ONLY("glGetTexGendv", GL_GetTexGendv)
-    DESKTOP_ONLY("glGetTexGenfv", GL_GetTexGenfv)
-    {"glGetTexGenfvOES", P(GL_GetTexGenfvOES)},
-    DESKTOP_ONLY("glGetTexGeniv", GL_GetTexGeniv)
-    {"glGetTexGenivOES", P(GL_GetTexGenivOES)},
-    {"glGetTexGenxvOES", P(GL_GetTexGenxvOES)},
-    DESKTOP_ONLY("glGetTexImage", GL_GetTexImage)
-    {"glGetTexImageANGLE", P(GL_GetTexImageANGLE)},
+    DESKTOP_ONLY("glSecondaryColorPointer", GL_SecondaryColorPointer)
+    DESKTOP_ONLY("glGetPixelMapuiv", GL_GetPixelMapuiv)
+    DESKTOP_ONLY("glSecondaryColor3dv", GL_SecondaryColor3dv)
+    {"glUniform1iv", P(GL_Uniform1iv)},
+    {"eglGetNativeClientBufferANDROID", P(EGL_GetNativeClientBufferANDROID)},
+    DESKTOP_ONLY("glShaderStorageBlockBinding", GL_ShaderStorageBlockBinding)
+    DESKTOP_ONLY("glEvalPoint2", GL_EvalPoint2)
     {"glGetTexLevelParameterfv", P(GL_GetTexLevelParameterfv)},
-    {"glGetTexLevelParameterfvANGLE", P(GL_GetTexLevelParameterfvANGLE)},
-    {"glGetTexLevelParameterfvRobustANGLE", P(GL_GetTexLevelParameterfvRobustANGLE)},
-    {"glGetTexLevelParameteriv", P(GL_GetTexLevelParameteriv)},
-    {"glGetTexLevelParameterivANGLE", P(GL_GetTexLevelParameterivANGLE)},
-    {"glGetTexLevelParameterivRobustANGLE", P(GL_GetTexLevelParameterivRobustANGLE)},
-    {"glGetTexParameterIiv", P(GL_GetTexParameterIiv)},
-    {"glGetTexParameterIivEXT", P(GL_GetTexParameterIivEXT)},
-    {"glGetTexParameterIivOES", P(GL_GetTexParameterIivOES)},
-    {"glGetTexParameterIivRobustANGLE", P(GL_GetTexParameterIivRobustANGLE)},
-    {"glGetTexParameterIuiv", P(GL_GetTexParameterIuiv)},
-    {"glGetTexParameterIuivEXT", P(GL_GetTexParameterIuivEXT)},
-    {"glGetTexParameterIuivOES", P(GL_GetTexParameterIuivOES)},
-    {"glGetTexParameterIuivRobustANGLE", P(GL_GetTexParameterIuivRobustANGLE)},
-    {"glGetTexParameterfv", P(GL_GetTexParameterfv)},
-    {"glGetTexParameterfvRobustANGLE", P(GL_GetTexParameterfvRobustANGLE)},
-    {"glGetTexParameteriv", P(GL_GetTexParameteriv)},
-    {"glGetTexParameterivRobustANGLE", P(GL_GetTexParameterivRobustANGLE)},
-    {"glGetTexParameterxv", P(GL_GetTexParameterxv)},
-    DESKTOP_ONLY("glGetTextureImage", GL_GetTextureImage)
-    DESKTOP_ONLY("glGetTextureLevelParameterfv", GL_GetTextureLevelParameterfv)
-    DESKTOP_ONLY("glGetTextureLevelParameteriv", GL_GetTextureLevelParameteriv)
-    DESKTOP_ONLY("glGetTextureParameterIiv", GL_GetTextureParameterIiv)
-    DESKTOP_ONLY("glGetTextureParameterIuiv", GL_GetTextureParameterIuiv)
-    DESKTOP_ONLY("glGetTextureParameterfv", GL_GetTextureParameterfv)
-    DESKTOP_ONLY("glGetTextureParameteriv", GL_GetTextureParameteriv)
-    DESKTOP_ONLY("glGetTextureSubImage", GL_GetTextureSubImage)
-    {"glGetTransformFeedbackVarying", P(GL_GetTransformFeedbackVarying)},
-    DESKTOP_ONLY("glGetTransformFeedbacki64_v", GL_GetTransformFeedbacki64_v)
-    DESKTOP_ONLY("glGetTransformFeedbacki_v", GL_GetTransformFeedbacki_v)
-    DESKTOP_ONLY("glGetTransformFeedbackiv", GL_GetTransformFeedbackiv)
-    {"glGetTranslatedShaderSourceANGLE", P(GL_GetTranslatedShaderSourceANGLE)},
-    {"glGetUniformBlockIndex", P(GL_GetUniformBlockIndex)},
-    {"glGetUniformIndices", P(GL_GetUniformIndices)},
-    {"glGetUniformLocation", P(GL_GetUniformLocation)},
-    DESKTOP_ONLY("glGetUniformSubroutineuiv", GL_GetUniformSubroutineuiv)
-    DESKTOP_ONLY("glGetUniformdv", GL_GetUniformdv)
-    {"glGetUniformfv", P(GL_GetUniformfv)},
-    {"glGetUniformfvRobustANGLE", P(GL_GetUniformfvRobustANGLE)},
-    {"glGetUniformiv", P(GL_GetUniformiv)},
-    {"glGetUniformivRobustANGLE", P(GL_GetUniformivRobustANGLE)},
-    {"glGetUniformuiv", P(GL_GetUniformuiv)},
-    {"glGetUniformuivRobustANGLE", P(GL_GetUniformuivRobustANGLE)},
-    {"glGetUnsignedBytei_vEXT", P(GL_GetUnsignedBytei_vEXT)},
-    {"glGetUnsignedBytevEXT", P(GL_GetUnsignedBytevEXT)},
-    DESKTOP_ONLY("glGetVertexArrayIndexed64iv", GL_GetVertexArrayIndexed64iv)
-    DESKTOP_ONLY("glGetVertexArrayIndexediv", GL_GetVertexArrayIndexediv)
-    DESKTOP_ONLY("glGetVertexArrayiv", GL_GetVertexArrayiv)
-    {"glGetVertexAttribIiv", P(GL_GetVertexAttribIiv)},
-    {"glGetVertexAttribIivRobustANGLE", P(GL_GetVertexAttribIivRobustANGLE)},
-    {"glGetVertexAttribIuiv", P(GL_GetVertexAttribIuiv)},
-    {"glGetVertexAttribIuivRobustANGLE", P(GL_GetVertexAttribIuivRobustANGLE)},
-    DESKTOP_ONLY("glGetVertexAttribLdv", GL_GetVertexAttribLdv)
-    {"glGetVertexAttribPointerv", P(GL_GetVertexAttribPointerv)},
-    {"glGetVertexAttribPointervRobustANGLE", P(GL_GetVertexAttribPointervRobustANGLE)},
-    DESKTOP_ONLY("glGetVertexAttribdv", GL_GetVertexAttribdv)
-    {"glGetVertexAttribfv", P(GL_GetVertexAttribfv)},
-    {"glGetVertexAttribfvRobustANGLE", P(GL_GetVertexAttribfvRobustANGLE)},
-    {"glGetVertexAttribiv", P(GL_GetVertexAttribiv)},
-    {"glGetVertexAttribivRobustANGLE", P(GL_GetVertexAttribivRobustANGLE)},
-    DESKTOP_ONLY("glGetnColorTable", GL_GetnColorTable)
-    DESKTOP_ONLY("glGetnCompressedTexImage", GL_GetnCompressedTexImage)
-    DESKTOP_ONLY("glGetnConvolutionFilter", GL_GetnConvolutionFilter)
-    DESKTOP_ONLY("glGetnHistogram", GL_GetnHistogram)
-    DESKTOP_ONLY("glGetnMapdv", GL_GetnMapdv)
-    DESKTOP_ONLY("glGetnMapfv", GL_GetnMapfv)
-    DESKTOP_ONLY("glGetnMapiv", GL_GetnMapiv)
-    DESKTOP_ONLY("glGetnMinmax", GL_GetnMinmax)
-    DESKTOP_ONLY("glGetnPixelMapfv", GL_GetnPixelMapfv)
-    DESKTOP_ONLY("glGetnPixelMapuiv", GL_GetnPixelMapuiv)
-    DESKTOP_ONLY("glGetnPixelMapusv", GL_GetnPixelMapusv)
-    DESKTOP_ONLY("glGetnPolygonStipple", GL_GetnPolygonStipple)
-    DESKTOP_ONLY("glGetnSeparableFilter", GL_GetnSeparableFilter)
-    DESKTOP_ONLY("glGetnTexImage", GL_GetnTexImage)
-    DESKTOP_ONLY("glGetnUniformdv", GL_GetnUniformdv)
-    {"glGetnUniformfv", P(GL_GetnUniformfv)},
-    {"glGetnUniformfvEXT", P(GL_GetnUniformfvEXT)},
-    {"glGetnUniformfvKHR", P(GL_GetnUniformfvKHR)},
-    {"glGetnUniformfvRobustANGLE", P(GL_GetnUniformfvRobustANGLE)},
-    {"glGetnUniformiv", P(GL_GetnUniformiv)},
-    {"glGetnUniformivEXT", P(GL_GetnUniformivEXT)},
-    {"glGetnUniformivKHR", P(GL_GetnUniformivKHR)},
-    {"glGetnUniformivRobustANGLE", P(GL_GetnUniformivRobustANGLE)},
-    {"glGetnUniformuiv", P(GL_GetnUniformuiv)},
-    {"glGetnUniformuivKHR", P(GL_GetnUniformuivKHR)},
-    {"glGetnUniformuivRobustANGLE", P(GL_GetnUniformuivRobustANGLE)},
-    {"glHint", P(GL_Hint)},
-    {"glImportMemoryFdEXT", P(GL_ImportMemoryFdEXT)},
-    {"glImportMemoryZirconHandleANGLE", P(GL_ImportMemoryZirconHandleANGLE)},
-    {"glImportSemaphoreFdEXT", P(GL_ImportSemaphoreFdEXT)},
-    {"glImportSemaphoreZirconHandleANGLE", P(GL_ImportSemaphoreZirconHandleANGLE)},
-    DESKTOP_ONLY("glIndexMask", GL_IndexMask)
-    DESKTOP_ONLY("glIndexPointer", GL_IndexPointer)
-    DESKTOP_ONLY("glIndexd", GL_Indexd)
-    DESKTOP_ONLY("glIndexdv", GL_Indexdv)
-    DESKTOP_ONLY("glIndexf", GL_Indexf)
-    DESKTOP_ONLY("glIndexfv", GL_Indexfv)
-    DESKTOP_ONLY("glIndexi", GL_Indexi)
-    DESKTOP_ONLY("glIndexiv", GL_Indexiv)
-    DESKTOP_ONLY("glIndexs", GL_Indexs)
-    DESKTOP_ONLY("glIndexsv", GL_Indexsv)
-    DESKTOP_ONLY("glIndexub", GL_Indexub)
-    DESKTOP_ONLY("glIndexubv", GL_Indexubv)
-    DESKTOP_ONLY("glInitNames", GL_InitNames)
-    {"glInsertEventMarkerEXT", P(GL_InsertEventMarkerEXT)},
-    DESKTOP_ONLY("glInterleavedArrays", GL_InterleavedArrays)
-    DESKTOP_ONLY("glInvalidateBufferData", GL_InvalidateBufferData)
-    DESKTOP_ONLY("glInvalidateBufferSubData", GL_InvalidateBufferSubData)
-    {"glInvalidateFramebuffer", P(GL_InvalidateFramebuffer)},
-    DESKTOP_ONLY("glInvalidateNamedFramebufferData", GL_InvalidateNamedFramebufferData)
-    DESKTOP_ONLY("glInvalidateNamedFramebufferSubData", GL_InvalidateNamedFramebufferSubData)
-    {"glInvalidateSubFramebuffer", P(GL_InvalidateSubFramebuffer)},
-    DESKTOP_ONLY("glInvalidateTexImage", GL_InvalidateTexImage)
-    DESKTOP_ONLY("glInvalidateTexSubImage", GL_InvalidateTexSubImage)
-    {"glInvalidateTextureANGLE", P(GL_InvalidateTextureANGLE)},
-    {"glIsBuffer", P(GL_IsBuffer)},
-    {"glIsEnabled", P(GL_IsEnabled)},
-    {"glIsEnabledi", P(GL_IsEnabledi)},
-    {"glIsEnablediEXT", P(GL_IsEnablediEXT)},
-    {"glIsEnablediOES", P(GL_IsEnablediOES)},
-    {"glIsFenceNV", P(GL_IsFenceNV)},
-    {"glIsFramebuffer", P(GL_IsFramebuffer)},
-    {"glIsFramebufferOES", P(GL_IsFramebufferOES)},
-    DESKTOP_ONLY("glIsList", GL_IsList)
-    {"glIsMemoryObjectEXT", P(GL_IsMemoryObjectEXT)},
-    {"glIsProgram", P(GL_IsProgram)},
-    {"glIsProgramPipeline", P(GL_IsProgramPipeline)},
-    {"glIsProgramPipelineEXT", P(GL_IsProgramPipelineEXT)},
-    {"glIsQuery", P(GL_IsQuery)},
-    {"glIsQueryEXT", P(GL_IsQueryEXT)},
-    {"glIsRenderbuffer", P(GL_IsRenderbuffer)},
-    {"glIsRenderbufferOES", P(GL_IsRenderbufferOES)},
-    {"glIsSampler", P(GL_IsSampler)},
-    {"glIsSemaphoreEXT", P(GL_IsSemaphoreEXT)},
-    {"glIsShader", P(GL_IsShader)},
-    {"glIsSync", P(GL_IsSync)},
     {"glIsTexture", P(GL_IsTexture)},
-    {"glIsTransformFeedback", P(GL_IsTransformFeedback)},
-    {"glIsVertexArray", P(GL_IsVertexArray)},
-    {"glIsVertexArrayOES", P(GL_IsVertexArrayOES)},
-    {"glLabelObjectEXT", P(GL_LabelObjectEXT)},
-    {"glLightModelf", P(GL_LightModelf)},
-    {"glLightModelfv", P(GL_LightModelfv)},
-    DESKTOP_ONLY("glLightModeli", GL_LightModeli)
-    DESKTOP_ONLY("glLightModeliv", GL_LightModeliv)
-    {"glLightModelx", P(GL_LightModelx)},
-    {"glLightModelxv", P(GL_LightModelxv)},
-    {"glLightf", P(GL_Lightf)},
-    {"glLightfv", P(GL_Lightfv)},
-    DESKTOP_ONLY("glLighti", GL_Lighti)
-    DESKTOP_ONLY("glLightiv", GL_Lightiv)
-    {"glLightx", P(GL_Lightx)},
-    {"glLightxv", P(GL_Lightxv)},
-    DESKTOP_ONLY("glLineStipple", GL_LineStipple)
-    {"glLineWidth", P(GL_LineWidth)},
-    {"glLineWidthx", P(GL_LineWidthx)},
-    {"glLinkProgram", P(GL_LinkProgram)},
-    DESKTOP_ONLY("glListBase", GL_ListBase)
-    {"glLoadIdentity", P(GL_LoadIdentity)},
-    DESKTOP_ONLY("glLoadMatrixd", GL_LoadMatrixd)
-    {"glLoadMatrixf", P(GL_LoadMatrixf)},
-    {"glLoadMatrixx", P(GL_LoadMatrixx)},
-    DESKTOP_ONLY("glLoadName", GL_LoadName)
-    {"glLoadPaletteFromModelViewMatrixOES", P(GL_LoadPaletteFromModelViewMatrixOES)},
-    DESKTOP_ONLY("glLoadTransposeMatrixd", GL_LoadTransposeMatrixd)
-    DESKTOP_ONLY("glLoadTransposeMatrixf", GL_LoadTransposeMatrixf)
-    {"glLogicOp", P(GL_LogicOp)},
-    {"glLogicOpANGLE", P(GL_LogicOpANGLE)},
-    {"glLoseContextCHROMIUM", P(GL_LoseContextCHROMIUM)},
-    DESKTOP_ONLY("glMap1d", GL_Map1d)
-    DESKTOP_ONLY("glMap1f", GL_Map1f)
-    DESKTOP_ONLY("glMap2d", GL_Map2d)
-    DESKTOP_ONLY("glMap2f", GL_Map2f)
-    DESKTOP_ONLY("glMapBuffer", GL_MapBuffer)
-    {"glMapBufferOES", P(GL_MapBufferOES)},
-    {"glMapBufferRange", P(GL_MapBufferRange)},
-    {"glMapBufferRangeEXT", P(GL_MapBufferRangeEXT)},
-    DESKTOP_ONLY("glMapGrid1d", GL_MapGrid1d)
-    DESKTOP_ONLY("glMapGrid1f", GL_MapGrid1f)
-    DESKTOP_ONLY("glMapGrid2d", GL_MapGrid2d)
-    DESKTOP_ONLY("glMapGrid2f", GL_MapGrid2f)
-    DESKTOP_ONLY("glMapNamedBuffer", GL_MapNamedBuffer)
-    DESKTOP_ONLY("glMapNamedBufferRange", GL_MapNamedBufferRange)
-    {"glMaterialf", P(GL_Materialf)},
-    {"glMaterialfv", P(GL_Materialfv)},
-    DESKTOP_ONLY("glMateriali", GL_Materiali)
-    DESKTOP_ONLY("glMaterialiv", GL_Materialiv)
-    {"glMaterialx", P(GL_Materialx)},
-    {"glMaterialxv", P(GL_Materialxv)},
-    {"glMatrixIndexPointerOES", P(GL_MatrixIndexPointerOES)},
-    {"glMatrixMode", P(GL_MatrixMode)},
-    {"glMaxShaderCompilerThreadsKHR", P(GL_MaxShaderCompilerThreadsKHR)},
-    {"glMemoryBarrier", P(GL_MemoryBarrier)},
-    {"glMemoryBarrierByRegion", P(GL_MemoryBarrierByRegion)},
-    {"glMemoryObjectParameterivEXT", P(GL_MemoryObjectParameterivEXT)},
-    {"glMinSampleShading", P(GL_MinSampleShading)},
-    {"glMinSampleShadingOES", P(GL_MinSampleShadingOES)},
-    DESKTOP_ONLY("glMultMatrixd", GL_MultMatrixd)
-    {"glMultMatrixf", P(GL_MultMatrixf)},
-    {"glMultMatrixx", P(GL_MultMatrixx)},
-    DESKTOP_ONLY("glMultTransposeMatrixd", GL_MultTransposeMatrixd)
+    DESKTOP_ONLY("glProgramUniformMatrix3x4dv", GL_ProgramUniformMatrix3x4dv)
+    DESKTOP_ONLY("glVertexAttrib4Nbv", GL_VertexAttrib4Nbv)
     DESKTOP_ONLY("glMultTransposeMatrixf", GL_MultTransposeMatrixf)
-    DESKTOP_ONLY("glMultiDrawArrays", GL_MultiDrawArrays)
-    {"glMultiDrawArraysANGLE", P(GL_MultiDrawArraysANGLE)},
-    DESKTOP_ONLY("glMultiDrawArraysIndirect", GL_MultiDrawArraysIndirect)
-    DESKTOP_ONLY("glMultiDrawArraysIndirectCount", GL_MultiDrawArraysIndirectCount)
-    {"glMultiDrawArraysIndirectEXT", P(GL_MultiDrawArraysIndirectEXT)},
-    {"glMultiDrawArraysInstancedANGLE", P(GL_MultiDrawArraysInstancedANGLE)},
-    {"glMultiDrawArraysInstancedBaseInstanceANGLE", P(GL_MultiDrawArraysInstancedBaseInstanceANGLE)},
-    DESKTOP_ONLY("glMultiDrawElements", GL_MultiDrawElements)
-    {"glMultiDrawElementsANGLE", P(GL_MultiDrawElementsANGLE)},
-    DESKTOP_ONLY("glMultiDrawElementsBaseVertex", GL_MultiDrawElementsBaseVertex)
-    {"glMultiDrawElementsBaseVertexEXT", P(GL_MultiDrawElementsBaseVertexEXT)},
-    DESKTOP_ONLY("glMultiDrawElementsIndirect", GL_MultiDrawElementsIndirect)
+    {"eglProgramCachePopulateANGLE", P(EGL_ProgramCachePopulateANGLE)},
+    DESKTOP_ONLY("glDepthRange", GL_DepthRange)
+    DESKTOP_ONLY("glTextureStorage2D", GL_TextureStorage2D)
+    DESKTOP_ONLY("glWindowPos3dv", GL_WindowPos3dv)
+    DESKTOP_ONLY("glVertexAttribL3dv", GL_VertexAttribL3dv)
+    {"glFramebufferPixelLocalClearValueuivANGLE", P(GL_FramebufferPixelLocalClearValueuivANGLE)},
+    {"glGenProgramPipelinesEXT", P(GL_GenProgramPipelinesEXT)},
+    {"glGetTexLevelParameterivANGLE", P(GL_GetTexLevelParameterivANGLE)},
+    {"glIsRenderbufferOES", P(GL_IsRenderbufferOES)},
+    DESKTOP_ONLY("glTextureSubImage3D", GL_TextureSubImage3D)
+    {"glIsSemaphoreEXT", P(GL_IsSemaphoreEXT)},
+    DESKTOP_ONLY("glFlushMappedNamedBufferRange", GL_FlushMappedNamedBufferRange)
     DESKTOP_ONLY("glMultiDrawElementsIndirectCount", GL_MultiDrawElementsIndirectCount)
-    {"glMultiDrawElementsIndirectEXT", P(GL_MultiDrawElementsIndirectEXT)},
-    {"glMultiDrawElementsInstancedANGLE", P(GL_MultiDrawElementsInstancedANGLE)},
+    DESKTOP_ONLY("glGetnCompressedTexImage", GL_GetnCompressedTexImage)
+    {"glDrawElementsBaseVertexEXT", P(GL_DrawElementsBaseVertexEXT)},
+    {"glTexParameterIivRobustANGLE", P(GL_TexParameterIivRobustANGLE)},
+    {"glGetFramebufferParameterivMESA", P(GL_GetFramebufferParameterivMESA)},
+    {"glGetRenderbufferParameteriv", P(GL_GetRenderbufferParameteriv)},
+    DESKTOP_ONLY("glGetBufferSubData", GL_GetBufferSubData)
+    {"eglMakeCurrent", P(EGL_MakeCurrent)},
+    DESKTOP_ONLY("glClearNamedFramebufferfv", GL_ClearNamedFramebufferfv)
+    DESKTOP_ONLY("glProgramUniformMatrix3dv", GL_ProgramUniformMatrix3dv)
+    {"glPolygonOffsetClampEXT", P(GL_PolygonOffsetClampEXT)},
+    {"eglQueryContext", P(EGL_QueryContext)},
+    {"glGetTexParameterIivEXT", P(GL_GetTexParameterIivEXT)},
+    DESKTOP_ONLY("glGetMaterialiv", GL_GetMaterialiv)
+    {"eglLockSurfaceKHR", P(EGL_LockSurfaceKHR)},
+    {"eglCreateImage", P(EGL_CreateImage)},
+    {"glIsBuffer", P(GL_IsBuffer)},
+    {"glProgramUniform3f", P(GL_ProgramUniform3f)},
+    DESKTOP_ONLY("glFogCoordPointer", GL_FogCoordPointer)
+    {"glLineWidth", P(GL_LineWidth)},
+    {"glGenFencesNV", P(GL_GenFencesNV)},
+    DESKTOP_ONLY("glGetInternalformati64v", GL_GetInternalformati64v)
+    {"glProgramUniform3i", P(GL_ProgramUniform3i)},
+    {"glEnable", P(GL_Enable)},
+    {"glProgramUniformMatrix2x3fv", P(GL_ProgramUniformMatrix2x3fv)},
+    DESKTOP_ONLY("glNormal3iv", GL_Normal3iv)
+    {"glTexSubImage2DRobustANGLE", P(GL_TexSubImage2DRobustANGLE)},
+    {"glObjectLabelKHR", P(GL_ObjectLabelKHR)},
+    DESKTOP_ONLY("glTextureParameterIiv", GL_TextureParameterIiv)
+    {"glProgramUniformMatrix4fvEXT", P(GL_ProgramUniformMatrix4fvEXT)},
+    {"glLoadMatrixf", P(GL_LoadMatrixf)},
     {"glMultiDrawElementsInstancedBaseVertexBaseInstanceANGLE", P(GL_MultiDrawElementsInstancedBaseVertexBaseInstanceANGLE)},
-    DESKTOP_ONLY("glMultiTexCoord1d", GL_MultiTexCoord1d)
-    DESKTOP_ONLY("glMultiTexCoord1dv", GL_MultiTexCoord1dv)
-    DESKTOP_ONLY("glMultiTexCoord1f", GL_MultiTexCoord1f)
-    DESKTOP_ONLY("glMultiTexCoord1fv", GL_MultiTexCoord1fv)
-    DESKTOP_ONLY("glMultiTexCoord1i", GL_MultiTexCoord1i)
-    DESKTOP_ONLY("glMultiTexCoord1iv", GL_MultiTexCoord1iv)
-    DESKTOP_ONLY("glMultiTexCoord1s", GL_MultiTexCoord1s)
-    DESKTOP_ONLY("glMultiTexCoord1sv", GL_MultiTexCoord1sv)
-    DESKTOP_ONLY("glMultiTexCoord2d", GL_MultiTexCoord2d)
-    DESKTOP_ONLY("glMultiTexCoord2dv", GL_MultiTexCoord2dv)
-    DESKTOP_ONLY("glMultiTexCoord2f", GL_MultiTexCoord2f)
-    DESKTOP_ONLY("glMultiTexCoord2fv", GL_MultiTexCoord2fv)
-    DESKTOP_ONLY("glMultiTexCoord2i", GL_MultiTexCoord2i)
-    DESKTOP_ONLY("glMultiTexCoord2iv", GL_MultiTexCoord2iv)
-    DESKTOP_ONLY("glMultiTexCoord2s", GL_MultiTexCoord2s)
-    DESKTOP_ONLY("glMultiTexCoord2sv", GL_MultiTexCoord2sv)
-    DESKTOP_ONLY("glMultiTexCoord3d", GL_MultiTexCoord3d)
-    DESKTOP_ONLY("glMultiTexCoord3dv", GL_MultiTexCoord3dv)
-    DESKTOP_ONLY("glMultiTexCoord3f", GL_MultiTexCoord3f)
-    DESKTOP_ONLY("glMultiTexCoord3fv", GL_MultiTexCoord3fv)
-    DESKTOP_ONLY("glMultiTexCoord3i", GL_MultiTexCoord3i)
-    DESKTOP_ONLY("glMultiTexCoord3iv", GL_MultiTexCoord3iv)
-    DESKTOP_ONLY("glMultiTexCoord3s", GL_MultiTexCoord3s)
-    DESKTOP_ONLY("glMultiTexCoord3sv", GL_MultiTexCoord3sv)
-    DESKTOP_ONLY("glMultiTexCoord4d", GL_MultiTexCoord4d)
-    DESKTOP_ONLY("glMultiTexCoord4dv", GL_MultiTexCoord4dv)
-    {"glMultiTexCoord4f", P(GL_MultiTexCoord4f)},
-    DESKTOP_ONLY("glMultiTexCoord4fv", GL_MultiTexCoord4fv)
-    DESKTOP_ONLY("glMultiTexCoord4i", GL_MultiTexCoord4i)
-    DESKTOP_ONLY("glMultiTexCoord4iv", GL_MultiTexCoord4iv)
-    DESKTOP_ONLY("glMultiTexCoord4s", GL_MultiTexCoord4s)
-    DESKTOP_ONLY("glMultiTexCoord4sv", GL_MultiTexCoord4sv)
-    {"glMultiTexCoord4x", P(GL_MultiTexCoord4x)},
-    DESKTOP_ONLY("glMultiTexCoordP1ui", GL_MultiTexCoordP1ui)
-    DESKTOP_ONLY("glMultiTexCoordP1uiv", GL_MultiTexCoordP1uiv)
-    DESKTOP_ONLY("glMultiTexCoordP2ui", GL_MultiTexCoordP2ui)
-    DESKTOP_ONLY("glMultiTexCoordP2uiv", GL_MultiTexCoordP2uiv)
-    DESKTOP_ONLY("glMultiTexCoordP3ui", GL_MultiTexCoordP3ui)
+    {"glGetMemoryObjectParameterivEXT", P(GL_GetMemoryObjectParameterivEXT)},
+    DESKTOP_ONLY("glDisableVertexArrayAttrib", GL_DisableVertexArrayAttrib)
+    {"glUniformMatrix3x2fv", P(GL_UniformMatrix3x2fv)},
+    {"glGetObjectPtrLabel", P(GL_GetObjectPtrLabel)},
+    DESKTOP_ONLY("glTexImage1D", GL_TexImage1D)
     DESKTOP_ONLY("glMultiTexCoordP3uiv", GL_MultiTexCoordP3uiv)
-    DESKTOP_ONLY("glMultiTexCoordP4ui", GL_MultiTexCoordP4ui)
-    DESKTOP_ONLY("glMultiTexCoordP4uiv", GL_MultiTexCoordP4uiv)
-    DESKTOP_ONLY("glNamedBufferData", GL_NamedBufferData)
-    DESKTOP_ONLY("glNamedBufferStorage", GL_NamedBufferStorage)
+    {"glGetTexGenxvOES", P(GL_GetTexGenxvOES)},
+    {"glBufferStorageMemEXT", P(GL_BufferStorageMemEXT)},
+    DESKTOP_ONLY("glVertexArrayAttribIFormat", GL_VertexArrayAttribIFormat)
+    DESKTOP_ONLY("glGetVertexArrayiv", GL_GetVertexArrayiv)
+    DESKTOP_ONLY("glBindImageTextures", GL_BindImageTextures)
+    {"glDisableVertexAttribArray", P(GL_DisableVertexAttribArray)},
+    DESKTOP_ONLY("glMultiTexCoord4sv", GL_MultiTexCoord4sv)
+    {"glScalef", P(GL_Scalef)},
+    {"glBindRenderbufferOES", P(GL_BindRenderbufferOES)},
+    {"glCreateShader", P(GL_CreateShader)},
     {"glNamedBufferStorageExternalEXT", P(GL_NamedBufferStorageExternalEXT)},
-    DESKTOP_ONLY("glNamedBufferSubData", GL_NamedBufferSubData)
-    DESKTOP_ONLY("glNamedFramebufferDrawBuffer", GL_NamedFramebufferDrawBuffer)
-    DESKTOP_ONLY("glNamedFramebufferDrawBuffers", GL_NamedFramebufferDrawBuffers)
-    DESKTOP_ONLY("glNamedFramebufferParameteri", GL_NamedFramebufferParameteri)
-    DESKTOP_ONLY("glNamedFramebufferReadBuffer", GL_NamedFramebufferReadBuffer)
-    DESKTOP_ONLY("glNamedFramebufferRenderbuffer", GL_NamedFramebufferRenderbuffer)
-    DESKTOP_ONLY("glNamedFramebufferTexture", GL_NamedFramebufferTexture)
-    DESKTOP_ONLY("glNamedFramebufferTextureLayer", GL_NamedFramebufferTextureLayer)
-    DESKTOP_ONLY("glNamedRenderbufferStorage", GL_NamedRenderbufferStorage)
+    {"glStencilOp", P(GL_StencilOp)},
+    {"glFinish", P(GL_Finish)},
+    {"glDisableiEXT", P(GL_DisableiEXT)},
+    {"glGetCompressedTexImageANGLE", P(GL_GetCompressedTexImageANGLE)},
+    DESKTOP_ONLY("glUniform3d", GL_Uniform3d)
+    {"glUniform1i", P(GL_Uniform1i)},
+    {"glGetProgramBinary", P(GL_GetProgramBinary)},
+    DESKTOP_ONLY("glClearBufferSubData", GL_ClearBufferSubData)
+    DESKTOP_ONLY("glProgramUniform4d", GL_ProgramUniform4d)
+    DESKTOP_ONLY("glVertexAttribP4uiv", GL_VertexAttribP4uiv)
+    {"glIsEnablediOES", P(GL_IsEnablediOES)},
+    DESKTOP_ONLY("glVertex2fv", GL_Vertex2fv)
+    DESKTOP_ONLY("glTextureParameteri", GL_TextureParameteri)
+    {"glReadPixelsRobustANGLE", P(GL_ReadPixelsRobustANGLE)},
+    DESKTOP_ONLY("glVertexAttrib4uiv", GL_VertexAttrib4uiv)
+    {"glGetBooleani_vRobustANGLE", P(GL_GetBooleani_vRobustANGLE)},
+    {"glStartTilingQCOM", P(GL_StartTilingQCOM)},
+    {"glGetProgramPipelineiv", P(GL_GetProgramPipelineiv)},
     DESKTOP_ONLY("glNamedRenderbufferStorageMultisample", GL_NamedRenderbufferStorageMultisample)
-    DESKTOP_ONLY("glNewList", GL_NewList)
-    DESKTOP_ONLY("glNormal3b", GL_Normal3b)
-    DESKTOP_ONLY("glNormal3bv", GL_Normal3bv)
-    DESKTOP_ONLY("glNormal3d", GL_Normal3d)
-    DESKTOP_ONLY("glNormal3dv", GL_Normal3dv)
-    {"glNormal3f", P(GL_Normal3f)},
-    DESKTOP_ONLY("glNormal3fv", GL_Normal3fv)
-    DESKTOP_ONLY("glNormal3i", GL_Normal3i)
-    DESKTOP_ONLY("glNormal3iv", GL_Normal3iv)
-    DESKTOP_ONLY("glNormal3s", GL_Normal3s)
-    DESKTOP_ONLY("glNormal3sv", GL_Normal3sv)
-    {"glNormal3x", P(GL_Normal3x)},
-    DESKTOP_ONLY("glNormalP3ui", GL_NormalP3ui)
-    DESKTOP_ONLY("glNormalP3uiv", GL_NormalP3uiv)
-    {"glNormalPointer", P(GL_NormalPointer)},
-    {"glObjectLabel", P(GL_ObjectLabel)},
-    {"glObjectLabelKHR", P(GL_ObjectLabelKHR)},
-    {"glObjectPtrLabel", P(GL_ObjectPtrLabel)},
-    {"glObjectPtrLabelKHR", P(GL_ObjectPtrLabelKHR)},
-    DESKTOP_ONLY("glOrtho", GL_Ortho)
-    {"glOrthof", P(GL_Orthof)},
-    {"glOrthox", P(GL_Orthox)},
-    DESKTOP_ONLY("glPassThrough", GL_PassThrough)
-    DESKTOP_ONLY("glPatchParameterfv", GL_PatchParameterfv)
-    {"glPatchParameteri", P(GL_PatchParameteri)},
-    {"glPatchParameteriEXT", P(GL_PatchParameteriEXT)},
-    {"glPatchParameteriOES", P(GL_PatchParameteriOES)},
-    {"glPauseTransformFeedback", P(GL_PauseTransformFeedback)},
-    {"glPixelLocalStorageBarrierANGLE", P(GL_PixelLocalStorageBarrierANGLE)},
-    DESKTOP_ONLY("glPixelMapfv", GL_PixelMapfv)
-    DESKTOP_ONLY("glPixelMapuiv", GL_PixelMapuiv)
-    DESKTOP_ONLY("glPixelMapusv", GL_PixelMapusv)
-    DESKTOP_ONLY("glPixelStoref", GL_PixelStoref)
-    {"glPixelStorei", P(GL_PixelStorei)},
-    DESKTOP_ONLY("glPixelTransferf", GL_PixelTransferf)
-    DESKTOP_ONLY("glPixelTransferi", GL_PixelTransferi)
-    DESKTOP_ONLY("glPixelZoom", GL_PixelZoom)
-    {"glPointParameterf", P(GL_PointParameterf)},
-    {"glPointParameterfv", P(GL_PointParameterfv)},
-    DESKTOP_ONLY("glPointParameteri", GL_PointParameteri)
-    DESKTOP_ONLY("glPointParameteriv", GL_PointParameteriv)
-    {"glPointParameterx", P(GL_PointParameterx)},
-    {"glPointParameterxv", P(GL_PointParameterxv)},
+    DESKTOP_ONLY("glWindowPos3i", GL_WindowPos3i)
+    {"glImportMemoryZirconHandleANGLE", P(GL_ImportMemoryZirconHandleANGLE)},
+    {"glIsEnablediEXT", P(GL_IsEnablediEXT)},
+    {"glGetBooleanvRobustANGLE", P(GL_GetBooleanvRobustANGLE)},
+    {"glTexStorageMem2DMultisampleEXT", P(GL_TexStorageMem2DMultisampleEXT)},
+    {"eglLabelObjectKHR", P(EGL_LabelObjectKHR)},
+    DESKTOP_ONLY("glMultiTexCoord2i", GL_MultiTexCoord2i)
+    DESKTOP_ONLY("glVertex4f", GL_Vertex4f)
+    DESKTOP_ONLY("glWindowPos2sv", GL_WindowPos2sv)
+    {"glProgramUniform1fv", P(GL_ProgramUniform1fv)},
+    {"glPopMatrix", P(GL_PopMatrix)},
+    {"glCopyTexImage2D", P(GL_CopyTexImage2D)},
+    DESKTOP_ONLY("glVertex4i", GL_Vertex4i)
+    {"glGetGraphicsResetStatusKHR", P(GL_GetGraphicsResetStatusKHR)},
+    {"glTexBuffer", P(GL_TexBuffer)},
+    {"glCopyTexSubImage3DOES", P(GL_CopyTexSubImage3DOES)},
+    {"glDrawElementsInstancedANGLE", P(GL_DrawElementsInstancedANGLE)},
+    {"glGenQueriesEXT", P(GL_GenQueriesEXT)},
+    {"glCopyImageSubData", P(GL_CopyImageSubData)},
+    {"glProvokingVertexANGLE", P(GL_ProvokingVertexANGLE)},
+    {"glSemaphoreParameterui64vEXT", P(GL_SemaphoreParameterui64vEXT)},
+    {"glFramebufferFoveationConfigQCOM", P(GL_FramebufferFoveationConfigQCOM)},
+    {"glFramebufferPixelLocalClearValueivANGLE", P(GL_FramebufferPixelLocalClearValueivANGLE)},
+    DESKTOP_ONLY("glTextureStorage3D", GL_TextureStorage3D)
+    {"glUniformBlockBinding", P(GL_UniformBlockBinding)},
+    {"glDrawElementsInstancedBaseInstanceEXT", P(GL_DrawElementsInstancedBaseInstanceEXT)},
+    {"glGetQueryObjecti64vRobustANGLE", P(GL_GetQueryObjecti64vRobustANGLE)},
+    {"glGetPerfMonitorGroupsAMD", P(GL_GetPerfMonitorGroupsAMD)},
+    {"glUniformMatrix3x4fv", P(GL_UniformMatrix3x4fv)},
+    {"glGetTexParameterIivOES", P(GL_GetTexParameterIivOES)},
+    DESKTOP_ONLY("glWindowPos2f", GL_WindowPos2f)
+    DESKTOP_ONLY("glVertexAttrib2s", GL_VertexAttrib2s)
+    {"glGetUniformLocation", P(GL_GetUniformLocation)},
+    DESKTOP_ONLY("glVertexAttrib4iv", GL_VertexAttrib4iv)
+    DESKTOP_ONLY("glVertexAttrib4sv", GL_VertexAttrib4sv)
+    DESKTOP_ONLY("glVertexAttrib4Nusv", GL_VertexAttrib4Nusv)
+    DESKTOP_ONLY("glMultiTexCoord3i", GL_MultiTexCoord3i)
+    DESKTOP_ONLY("glTextureParameterIuiv", GL_TextureParameterIuiv)
+    DESKTOP_ONLY("glClampColor", GL_ClampColor)
+    DESKTOP_ONLY("glTexCoord1fv", GL_TexCoord1fv)
+    {"glLinkProgram", P(GL_LinkProgram)},
+    {"glDrawElementsBaseVertexOES", P(GL_DrawElementsBaseVertexOES)},
     {"glPointSize", P(GL_PointSize)},
-    {"glPointSizePointerOES", P(GL_PointSizePointerOES)},
+    {"glGetShaderSource", P(GL_GetShaderSource)},
+    {"glGetDebugMessageLogKHR", P(GL_GetDebugMessageLogKHR)},
+    DESKTOP_ONLY("glVertexAttribL1d", GL_VertexAttribL1d)
+    {"glGetnUniformivKHR", P(GL_GetnUniformivKHR)},
+    {"glBlendEquationSeparatei", P(GL_BlendEquationSeparatei)},
+    {"glProgramUniform1uiEXT", P(GL_ProgramUniform1uiEXT)},
+    {"glLineWidthx", P(GL_LineWidthx)},
+    {"glUniformMatrix4x3fv", P(GL_UniformMatrix4x3fv)},
+    {"glGetnUniformiv", P(GL_GetnUniformiv)},
+    {"glTexBufferRangeEXT", P(GL_TexBufferRangeEXT)},
+    {"glMaterialx", P(GL_Materialx)},
+    DESKTOP_ONLY("glMultiTexCoord3fv", GL_MultiTexCoord3fv)
+    DESKTOP_ONLY("glLoadMatrixd", GL_LoadMatrixd)
+    {"glBindProgramPipelineEXT", P(GL_BindProgramPipelineEXT)},
+    {"glGetGraphicsResetStatus", P(GL_GetGraphicsResetStatus)},
+    {"glShaderSource", P(GL_ShaderSource)},
+    {"eglClientWaitSync", P(EGL_ClientWaitSync)},
+    {"glDiscardFramebufferEXT", P(GL_DiscardFramebufferEXT)},
+    DESKTOP_ONLY("glTransformFeedbackBufferRange", GL_TransformFeedbackBufferRange)
+    {"eglQueryDeviceAttribEXT", P(EGL_QueryDeviceAttribEXT)},
+    DESKTOP_ONLY("glVertexAttrib3sv", GL_VertexAttrib3sv)
+    DESKTOP_ONLY("glNormal3fv", GL_Normal3fv)
+    {"eglCreateContext", P(EGL_CreateContext)},
+    {"glTexGenivOES", P(GL_TexGenivOES)},
+    {"glClientWaitSync", P(GL_ClientWaitSync)},
+    {"glDebugMessageCallbackKHR", P(GL_DebugMessageCallbackKHR)},
+    DESKTOP_ONLY("glCreateTextures", GL_CreateTextures)
+    {"glCompressedTexSubImage3DOES", P(GL_CompressedTexSubImage3DOES)},
+    DESKTOP_ONLY("glMaterialiv", GL_Materialiv)
+    {"glMinSampleShading", P(GL_MinSampleShading)},
+    {"eglQueryString", P(EGL_QueryString)},
+    {"glGetUniformivRobustANGLE", P(GL_GetUniformivRobustANGLE)},
+    DESKTOP_ONLY("glMultiTexCoord3f", GL_MultiTexCoord3f)
+    {"glDrawTexxvOES", P(GL_DrawTexxvOES)},
+    {"glUseProgramStages", P(GL_UseProgramStages)},
+    DESKTOP_ONLY("glVertexArrayVertexBuffers", GL_VertexArrayVertexBuffers)
+    DESKTOP_ONLY("glTextureBufferRange", GL_TextureBufferRange)
+    {"glUniform3iv", P(GL_Uniform3iv)},
+    {"glGetQueryivRobustANGLE", P(GL_GetQueryivRobustANGLE)},
+    DESKTOP_ONLY("glBlitNamedFramebuffer", GL_BlitNamedFramebuffer)
+    {"eglChooseConfig", P(EGL_ChooseConfig)},
+    DESKTOP_ONLY("glMap1d", GL_Map1d)
+    {"glClearBufferiv", P(GL_ClearBufferiv)},
+    {"glBindTransformFeedback", P(GL_BindTransformFeedback)},
+    {"glPopGroupMarkerEXT", P(GL_PopGroupMarkerEXT)},
+    {"glValidateProgramPipelineEXT", P(GL_ValidateProgramPipelineEXT)},
+    {"glDrawBuffersEXT", P(GL_DrawBuffersEXT)},
+    {"eglCreateStreamKHR", P(EGL_CreateStreamKHR)},
+    DESKTOP_ONLY("glColor4bv", GL_Color4bv)
+    {"glUniform2ui", P(GL_Uniform2ui)},
+    {"glProgramUniform1iv", P(GL_ProgramUniform1iv)},
+    DESKTOP_ONLY("glSecondaryColor3fv", GL_SecondaryColor3fv)
+    {"glClearTexSubImageEXT", P(GL_ClearTexSubImageEXT)},
     {"glPointSizex", P(GL_PointSizex)},
-    DESKTOP_ONLY("glPolygonMode", GL_PolygonMode)
-    {"glPolygonModeANGLE", P(GL_PolygonModeANGLE)},
-    {"glPolygonModeNV", P(GL_PolygonModeNV)},
-    {"glPolygonOffset", P(GL_PolygonOffset)},
-    DESKTOP_ONLY("glPolygonOffsetClamp", GL_PolygonOffsetClamp)
-    {"glPolygonOffsetClampEXT", P(GL_PolygonOffsetClampEXT)},
+    DESKTOP_ONLY("glVertexAttrib4d", GL_VertexAttrib4d)
+    {"glGetTexEnvxv", P(GL_GetTexEnvxv)},
+    {"glTexParameterfv", P(GL_TexParameterfv)},
+    DESKTOP_ONLY("glVertex4dv", GL_Vertex4dv)
+    {"glFramebufferTexture2DMultisampleEXT", P(GL_FramebufferTexture2DMultisampleEXT)},
+    DESKTOP_ONLY("glArrayElement", GL_ArrayElement)
+    {"glDeleteProgramPipelinesEXT", P(GL_DeleteProgramPipelinesEXT)},
+    {"eglDestroyContext", P(EGL_DestroyContext)},
+    DESKTOP_ONLY("glGetnPixelMapusv", GL_GetnPixelMapusv)
+    DESKTOP_ONLY("glGetActiveAtomicCounterBufferiv", GL_GetActiveAtomicCounterBufferiv)
+    {"glProgramUniform4uiv", P(GL_ProgramUniform4uiv)},
+    {"glGetUniformuivRobustANGLE", P(GL_GetUniformuivRobustANGLE)},
+    {"glFlushMappedBufferRangeEXT", P(GL_FlushMappedBufferRangeEXT)},
+    {"glDeleteRenderbuffers", P(GL_DeleteRenderbuffers)},
+    {"glDrawElementsInstanced", P(GL_DrawElementsInstanced)},
+    {"glGetTexParameterIuivOES", P(GL_GetTexParameterIuivOES)},
+    {"glProgramUniform1i", P(GL_ProgramUniform1i)},
+    DESKTOP_ONLY("glDrawArraysInstancedBaseInstance", GL_DrawArraysInstancedBaseInstance)
+    DESKTOP_ONLY("glWindowPos2dv", GL_WindowPos2dv)
+    {"glCompressedCopyTextureCHROMIUM", P(GL_CompressedCopyTextureCHROMIUM)},
+    {"glDepthRangex", P(GL_DepthRangex)},
+    {"glGetTexParameterfvRobustANGLE", P(GL_GetTexParameterfvRobustANGLE)},
+    DESKTOP_ONLY("glGetQueryObjectiv", GL_GetQueryObjectiv)
+    {"glDrawArrays", P(GL_DrawArrays)},
+    DESKTOP_ONLY("glRasterPos3d", GL_RasterPos3d)
+    {"glDebugMessageInsertKHR", P(GL_DebugMessageInsertKHR)},
+    {"glTexParameterIivOES", P(GL_TexParameterIivOES)},
+    {"glGetUniformiv", P(GL_GetUniformiv)},
+    DESKTOP_ONLY("glTexCoord3i", GL_TexCoord3i)
+    DESKTOP_ONLY("glRasterPos2fv", GL_RasterPos2fv)
+    DESKTOP_ONLY("glGetnColorTable", GL_GetnColorTable)
+    {"glLightModelx", P(GL_LightModelx)},
+    {"glOrthof", P(GL_Orthof)},
+    {"eglCreatePbufferSurface", P(EGL_CreatePbufferSurface)},
+    {"glDisableClientState", P(GL_DisableClientState)},
+    DESKTOP_ONLY("glVertexArrayAttribFormat", GL_VertexArrayAttribFormat)
+    DESKTOP_ONLY("glGetLightiv", GL_GetLightiv)
     {"glPolygonOffsetx", P(GL_PolygonOffsetx)},
-    DESKTOP_ONLY("glPolygonStipple", GL_PolygonStipple)
-    DESKTOP_ONLY("glPopAttrib", GL_PopAttrib)
-    DESKTOP_ONLY("glPopClientAttrib", GL_PopClientAttrib)
-    {"glPopDebugGroup", P(GL_PopDebugGroup)},
-    {"glPopDebugGroupKHR", P(GL_PopDebugGroupKHR)},
-    {"glPopGroupMarkerEXT", P(GL_PopGroupMarkerEXT)},
-    {"glPopMatrix", P(GL_PopMatrix)},
-    DESKTOP_ONLY("glPopName", GL_PopName)
+    {"glBindFragDataLocationIndexedEXT", P(GL_BindFragDataLocationIndexedEXT)},
+    DESKTOP_ONLY("glVertexAttribP2uiv", GL_VertexAttribP2uiv)
+    {"glGetInternalformativRobustANGLE", P(GL_GetInternalformativRobustANGLE)},
+    {"eglQueryDeviceStringEXT", P(EGL_QueryDeviceStringEXT)},
+    {"glDispatchComputeIndirect", P(GL_DispatchComputeIndirect)},
+    DESKTOP_ONLY("glProgramUniformMatrix2dv", GL_ProgramUniformMatrix2dv)
+    {"glViewport", P(GL_Viewport)},
+    {"glUniform1fv", P(GL_Uniform1fv)},
+    DESKTOP_ONLY("glPolygonOffsetClamp", GL_PolygonOffsetClamp)
+    DESKTOP_ONLY("glDrawTransformFeedback", GL_DrawTransformFeedback)
+    {"glMultMatrixf", P(GL_MultMatrixf)},
+    DESKTOP_ONLY("glCreateProgramPipelines", GL_CreateProgramPipelines)
+    {"glTexStorage2D", P(GL_TexStorage2D)},
+    {"glTexGenxOES", P(GL_TexGenxOES)},
+    {"glGetTexParameterIuiv", P(GL_GetTexParameterIuiv)},
+    DESKTOP_ONLY("glGetActiveSubroutineUniformName", GL_GetActiveSubroutineUniformName)
+    DESKTOP_ONLY("glFrustum", GL_Frustum)
+    {"glTexParameterIuivOES", P(GL_TexParameterIuivOES)},
+    DESKTOP_ONLY("glNamedFramebufferRenderbuffer", GL_NamedFramebufferRenderbuffer)
     {"glPrimitiveBoundingBox", P(GL_PrimitiveBoundingBox)},
-    {"glPrimitiveBoundingBoxEXT", P(GL_PrimitiveBoundingBoxEXT)},
-    {"glPrimitiveBoundingBoxOES", P(GL_PrimitiveBoundingBoxOES)},
-    DESKTOP_ONLY("glPrimitiveRestartIndex", GL_PrimitiveRestartIndex)
-    DESKTOP_ONLY("glPrioritizeTextures", GL_PrioritizeTextures)
-    {"glProgramBinary", P(GL_ProgramBinary)},
-    {"glProgramBinaryOES", P(GL_ProgramBinaryOES)},
-    {"glProgramParameteri", P(GL_ProgramParameteri)},
-    {"glProgramParameteriEXT", P(GL_ProgramParameteriEXT)},
-    DESKTOP_ONLY("glProgramUniform1d", GL_ProgramUniform1d)
-    DESKTOP_ONLY("glProgramUniform1dv", GL_ProgramUniform1dv)
-    {"glProgramUniform1f", P(GL_ProgramUniform1f)},
-    {"glProgramUniform1fEXT", P(GL_ProgramUniform1fEXT)},
-    {"glProgramUniform1fv", P(GL_ProgramUniform1fv)},
-    {"glProgramUniform1fvEXT", P(GL_ProgramUniform1fvEXT)},
-    {"glProgramUniform1i", P(GL_ProgramUniform1i)},
-    {"glProgramUniform1iEXT", P(GL_ProgramUniform1iEXT)},
-    {"glProgramUniform1iv", P(GL_ProgramUniform1iv)},
-    {"glProgramUniform1ivEXT", P(GL_ProgramUniform1ivEXT)},
-    {"glProgramUniform1ui", P(GL_ProgramUniform1ui)},
-    {"glProgramUniform1uiEXT", P(GL_ProgramUniform1uiEXT)},
+    DESKTOP_ONLY("glGetnPixelMapfv", GL_GetnPixelMapfv)
+    DESKTOP_ONLY("glTexCoord1f", GL_TexCoord1f)
+    DESKTOP_ONLY("glMultiDrawElementsBaseVertex", GL_MultiDrawElementsBaseVertex)
+    {"glGenQueries", P(GL_GenQueries)},
+    DESKTOP_ONLY("glVertex3f", GL_Vertex3f)
+    {"glClearStencil", P(GL_ClearStencil)},
+    {"eglWaitUntilWorkScheduledANGLE", P(EGL_WaitUntilWorkScheduledANGLE)},
+    {"glUniformMatrix4fv", P(GL_UniformMatrix4fv)},
+    DESKTOP_ONLY("glMultiTexCoord2s", GL_MultiTexCoord2s)
+    {"glGetProgramInfoLog", P(GL_GetProgramInfoLog)},
+    {"glValidateProgram", P(GL_ValidateProgram)},
+    DESKTOP_ONLY("glVertexAttribI4sv", GL_VertexAttribI4sv)
+    {"glGetIntegeri_vRobustANGLE", P(GL_GetIntegeri_vRobustANGLE)},
+    {"glGetUnsignedBytei_vEXT", P(GL_GetUnsignedBytei_vEXT)},
+    {"eglReleaseDeviceANGLE", P(EGL_ReleaseDeviceANGLE)},
+    {"glUniform1ui", P(GL_Uniform1ui)},
+    DESKTOP_ONLY("glTexCoord1dv", GL_TexCoord1dv)
+    {"glGetUniformuiv", P(GL_GetUniformuiv)},
+    {"glGenTextures", P(GL_GenTextures)},
+    DESKTOP_ONLY("glRasterPos4d", GL_RasterPos4d)
+    DESKTOP_ONLY("glIndexd", GL_Indexd)
+    DESKTOP_ONLY("glRasterPos4i", GL_RasterPos4i)
+    DESKTOP_ONLY("glListBase", GL_ListBase)
+    DESKTOP_ONLY("glGetnMapdv", GL_GetnMapdv)
+    DESKTOP_ONLY("glSecondaryColorP3uiv", GL_SecondaryColorP3uiv)
+    {"glMultiTexCoord4x", P(GL_MultiTexCoord4x)},
+    {"glGetFragDataLocation", P(GL_GetFragDataLocation)},
+    {"eglGetMscRateANGLE", P(EGL_GetMscRateANGLE)},
+    {"glGetSamplerParameterIuivRobustANGLE", P(GL_GetSamplerParameterIuivRobustANGLE)},
+    DESKTOP_ONLY("glMapNamedBufferRange", GL_MapNamedBufferRange)
+    DESKTOP_ONLY("glTextureSubImage2D", GL_TextureSubImage2D)
+    DESKTOP_ONLY("glColor3uiv", GL_Color3uiv)
+    DESKTOP_ONLY("glColor4ubv", GL_Color4ubv)
+    DESKTOP_ONLY("glMapGrid2d", GL_MapGrid2d)
+    {"glGetActiveUniformBlockName", P(GL_GetActiveUniformBlockName)},
+    DESKTOP_ONLY("glGetQueryObjectui64v", GL_GetQueryObjectui64v)
+    DESKTOP_ONLY("glColor3bv", GL_Color3bv)
+    {"eglQuerySurface64KHR", P(EGL_QuerySurface64KHR)},
+    {"glGetMultisamplefvRobustANGLE", P(GL_GetMultisamplefvRobustANGLE)},
+    DESKTOP_ONLY("glTexCoord3d", GL_TexCoord3d)
+    {"glScissor", P(GL_Scissor)},
+    {"glTexStorage3DMultisampleOES", P(GL_TexStorage3DMultisampleOES)},
+    {"glGetVertexAttribIuivRobustANGLE", P(GL_GetVertexAttribIuivRobustANGLE)},
+    DESKTOP_ONLY("glCreateRenderbuffers", GL_CreateRenderbuffers)
+    DESKTOP_ONLY("glGetPixelMapusv", GL_GetPixelMapusv)
+    DESKTOP_ONLY("glGetDoublev", GL_GetDoublev)
+    {"glRenderbufferStorageMultisampleEXT", P(GL_RenderbufferStorageMultisampleEXT)},
+    {"eglSignalSyncKHR", P(EGL_SignalSyncKHR)},
+    {"eglCreatePlatformWindowSurfaceEXT", P(EGL_CreatePlatformWindowSurfaceEXT)},
+    {"glFramebufferTexture3DOES", P(GL_FramebufferTexture3DOES)},
+    DESKTOP_ONLY("glVertexAttribL2dv", GL_VertexAttribL2dv)
+    {"glVertexAttribIFormat", P(GL_VertexAttribIFormat)},
+    {"glDisableiOES", P(GL_DisableiOES)},
+    {"glTranslatex", P(GL_Translatex)},
+    DESKTOP_ONLY("glRectd", GL_Rectd)
+    {"glGetTexLevelParameteriv", P(GL_GetTexLevelParameteriv)},
+    {"glGetIntegeri_v", P(GL_GetIntegeri_v)},
+    {"eglCreatePixmapSurface", P(EGL_CreatePixmapSurface)},
+    DESKTOP_ONLY("glGetSubroutineIndex", GL_GetSubroutineIndex)
+    DESKTOP_ONLY("glVertexAttribI1uiv", GL_VertexAttribI1uiv)
+    DESKTOP_ONLY("glScissorIndexed", GL_ScissorIndexed)
+    DESKTOP_ONLY("glSecondaryColor3f", GL_SecondaryColor3f)
+    DESKTOP_ONLY("glMap2f", GL_Map2f)
+    DESKTOP_ONLY("glLightModeliv", GL_LightModeliv)
+    DESKTOP_ONLY("glGetnMapfv", GL_GetnMapfv)
+    {"glBindFramebufferOES", P(GL_BindFramebufferOES)},
+    {"glGetTexParameterxv", P(GL_GetTexParameterxv)},
+    {"glReadBuffer", P(GL_ReadBuffer)},
+    DESKTOP_ONLY("glProgramUniformMatrix2x4dv", GL_ProgramUniformMatrix2x4dv)
+    DESKTOP_ONLY("glLighti", GL_Lighti)
+    {"glSelectPerfMonitorCountersAMD", P(GL_SelectPerfMonitorCountersAMD)},
+    DESKTOP_ONLY("glOrtho", GL_Ortho)
+    DESKTOP_ONLY("glCompressedTextureSubImage3D", GL_CompressedTextureSubImage3D)
+    {"glClipPlanex", P(GL_ClipPlanex)},
     {"glProgramUniform1uiv", P(GL_ProgramUniform1uiv)},
-    {"glProgramUniform1uivEXT", P(GL_ProgramUniform1uivEXT)},
-    DESKTOP_ONLY("glProgramUniform2d", GL_ProgramUniform2d)
-    DESKTOP_ONLY("glProgramUniform2dv", GL_ProgramUniform2dv)
-    {"glProgramUniform2f", P(GL_ProgramUniform2f)},
-    {"glProgramUniform2fEXT", P(GL_ProgramUniform2fEXT)},
-    {"glProgramUniform2fv", P(GL_ProgramUniform2fv)},
-    {"glProgramUniform2fvEXT", P(GL_ProgramUniform2fvEXT)},
-    {"glProgramUniform2i", P(GL_ProgramUniform2i)},
-    {"glProgramUniform2iEXT", P(GL_ProgramUniform2iEXT)},
-    {"glProgramUniform2iv", P(GL_ProgramUniform2iv)},
-    {"glProgramUniform2ivEXT", P(GL_ProgramUniform2ivEXT)},
-    {"glProgramUniform2ui", P(GL_ProgramUniform2ui)},
-    {"glProgramUniform2uiEXT", P(GL_ProgramUniform2uiEXT)},
-    {"glProgramUniform2uiv", P(GL_ProgramUniform2uiv)},
-    {"glProgramUniform2uivEXT", P(GL_ProgramUniform2uivEXT)},
-    DESKTOP_ONLY("glProgramUniform3d", GL_ProgramUniform3d)
-    DESKTOP_ONLY("glProgramUniform3dv", GL_ProgramUniform3dv)
-    {"glProgramUniform3f", P(GL_ProgramUniform3f)},
-    {"glProgramUniform3fEXT", P(GL_ProgramUniform3fEXT)},
-    {"glProgramUniform3fv", P(GL_ProgramUniform3fv)},
-    {"glProgramUniform3fvEXT", P(GL_ProgramUniform3fvEXT)},
-    {"glProgramUniform3i", P(GL_ProgramUniform3i)},
-    {"glProgramUniform3iEXT", P(GL_ProgramUniform3iEXT)},
-    {"glProgramUniform3iv", P(GL_ProgramUniform3iv)},
-    {"glProgramUniform3ivEXT", P(GL_ProgramUniform3ivEXT)},
-    {"glProgramUniform3ui", P(GL_ProgramUniform3ui)},
-    {"glProgramUniform3uiEXT", P(GL_ProgramUniform3uiEXT)},
-    {"glProgramUniform3uiv", P(GL_ProgramUniform3uiv)},
-    {"glProgramUniform3uivEXT", P(GL_ProgramUniform3uivEXT)},
-    DESKTOP_ONLY("glProgramUniform4d", GL_ProgramUniform4d)
-    DESKTOP_ONLY("glProgramUniform4dv", GL_ProgramUniform4dv)
-    {"glProgramUniform4f", P(GL_ProgramUniform4f)},
-    {"glProgramUniform4fEXT", P(GL_ProgramUniform4fEXT)},
-    {"glProgramUniform4fv", P(GL_ProgramUniform4fv)},
-    {"glProgramUniform4fvEXT", P(GL_ProgramUniform4fvEXT)},
-    {"glProgramUniform4i", P(GL_ProgramUniform4i)},
-    {"glProgramUniform4iEXT", P(GL_ProgramUniform4iEXT)},
-    {"glProgramUniform4iv", P(GL_ProgramUniform4iv)},
-    {"glProgramUniform4ivEXT", P(GL_ProgramUniform4ivEXT)},
-    {"glProgramUniform4ui", P(GL_ProgramUniform4ui)},
-    {"glProgramUniform4uiEXT", P(GL_ProgramUniform4uiEXT)},
-    {"glProgramUniform4uiv", P(GL_ProgramUniform4uiv)},
+    {"glGetnUniformuivKHR", P(GL_GetnUniformuivKHR)},
+    {"glTexStorage2DMultisampleANGLE", P(GL_TexStorage2DMultisampleANGLE)},
+    DESKTOP_ONLY("glColor4b", GL_Color4b)
+    {"glProgramUniformMatrix4x2fvEXT", P(GL_ProgramUniformMatrix4x2fvEXT)},
+    DESKTOP_ONLY("glGetVertexAttribdv", GL_GetVertexAttribdv)
+    {"glProgramUniform1ui", P(GL_ProgramUniform1ui)},
+    {"glGetnUniformuiv", P(GL_GetnUniformuiv)},
+    DESKTOP_ONLY("glVertexAttribL4d", GL_VertexAttribL4d)
+    DESKTOP_ONLY("glIsList", GL_IsList)
+    {"glDrawArraysIndirect", P(GL_DrawArraysIndirect)},
+    {"glCompressedTexImage3DOES", P(GL_CompressedTexImage3DOES)},
+    {"glReadPixels", P(GL_ReadPixels)},
+    {"glGetUniformfv", P(GL_GetUniformfv)},
+    {"glMultiDrawArraysInstancedANGLE", P(GL_MultiDrawArraysInstancedANGLE)},
+    DESKTOP_ONLY("glDrawBuffer", GL_DrawBuffer)
+    DESKTOP_ONLY("glColorP4uiv", GL_ColorP4uiv)
+    DESKTOP_ONLY("glNewList", GL_NewList)
+    {"glGetProgramInterfaceiv", P(GL_GetProgramInterfaceiv)},
+    {"glCreateProgram", P(GL_CreateProgram)},
+    {"glVertexAttrib3fv", P(GL_VertexAttrib3fv)},
+    {"eglCreateNativeClientBufferANDROID", P(EGL_CreateNativeClientBufferANDROID)},
+    DESKTOP_ONLY("glUnmapNamedBuffer", GL_UnmapNamedBuffer)
+    DESKTOP_ONLY("glClearDepth", GL_ClearDepth)
+    DESKTOP_ONLY("glTexGenf", GL_TexGenf)
+    {"eglProgramCacheResizeANGLE", P(EGL_ProgramCacheResizeANGLE)},
+    {"glUniformMatrix2fv", P(GL_UniformMatrix2fv)},
+    {"glSamplerParameterIiv", P(GL_SamplerParameterIiv)},
+    DESKTOP_ONLY("glGetNamedBufferParameteriv", GL_GetNamedBufferParameteriv)
+    {"glGetSamplerParameterivRobustANGLE", P(GL_GetSamplerParameterivRobustANGLE)},
+    {"glGetSamplerParameterfvRobustANGLE", P(GL_GetSamplerParameterfvRobustANGLE)},
+    DESKTOP_ONLY("glBeginConditionalRender", GL_BeginConditionalRender)
+    {"glProgramUniform1f", P(GL_ProgramUniform1f)},
+    DESKTOP_ONLY("glTexCoord2sv", GL_TexCoord2sv)
+    {"glVertexAttribIPointer", P(GL_VertexAttribIPointer)},
+    DESKTOP_ONLY("glRasterPos3sv", GL_RasterPos3sv)
+    DESKTOP_ONLY("glVertexAttribL1dv", GL_VertexAttribL1dv)
+    DESKTOP_ONLY("glPixelStoref", GL_PixelStoref)
+    {"glGetInternalformativ", P(GL_GetInternalformativ)},
+    {"glBlendEquation", P(GL_BlendEquation)},
+    {"glTexParameterxv", P(GL_TexParameterxv)},
+    DESKTOP_ONLY("glMultiDrawElements", GL_MultiDrawElements)
+    DESKTOP_ONLY("glVertexAttrib4Nsv", GL_VertexAttrib4Nsv)
+    {"glTexParameteri", P(GL_TexParameteri)},
+    {"glBindVertexArrayOES", P(GL_BindVertexArrayOES)},
+    {"eglReleaseHighPowerGPUANGLE", P(EGL_ReleaseHighPowerGPUANGLE)},
+    {"glIsMemoryObjectEXT", P(GL_IsMemoryObjectEXT)},
+    {"glUniform2f", P(GL_Uniform2f)},
+    DESKTOP_ONLY("glLightModeli", GL_LightModeli)
+    {"glDeleteTextures", P(GL_DeleteTextures)},
     {"glProgramUniform4uivEXT", P(GL_ProgramUniform4uivEXT)},
-    DESKTOP_ONLY("glProgramUniformMatrix2dv", GL_ProgramUniformMatrix2dv)
-    {"glProgramUniformMatrix2fv", P(GL_ProgramUniformMatrix2fv)},
-    {"glProgramUniformMatrix2fvEXT", P(GL_ProgramUniformMatrix2fvEXT)},
-    DESKTOP_ONLY("glProgramUniformMatrix2x3dv", GL_ProgramUniformMatrix2x3dv)
-    {"glProgramUniformMatrix2x3fv", P(GL_ProgramUniformMatrix2x3fv)},
-    {"glProgramUniformMatrix2x3fvEXT", P(GL_ProgramUniformMatrix2x3fvEXT)},
-    DESKTOP_ONLY("glProgramUniformMatrix2x4dv", GL_ProgramUniformMatrix2x4dv)
-    {"glProgramUniformMatrix2x4fv", P(GL_ProgramUniformMatrix2x4fv)},
-    {"glProgramUniformMatrix2x4fvEXT", P(GL_ProgramUniformMatrix2x4fvEXT)},
-    DESKTOP_ONLY("glProgramUniformMatrix3dv", GL_ProgramUniformMatrix3dv)
-    {"glProgramUniformMatrix3fv", P(GL_ProgramUniformMatrix3fv)},
+    DESKTOP_ONLY("glGetQueryObjecti64v", GL_GetQueryObjecti64v)
+    DESKTOP_ONLY("glWindowPos2i", GL_WindowPos2i)
+    DESKTOP_ONLY("glVertexAttribL4dv", GL_VertexAttribL4dv)
+    DESKTOP_ONLY("glMultiTexCoordP3ui", GL_MultiTexCoordP3ui)
+    DESKTOP_ONLY("glScissorIndexedv", GL_ScissorIndexedv)
+    {"glProgramUniform3uiEXT", P(GL_ProgramUniform3uiEXT)},
     {"glProgramUniformMatrix3fvEXT", P(GL_ProgramUniformMatrix3fvEXT)},
-    DESKTOP_ONLY("glProgramUniformMatrix3x2dv", GL_ProgramUniformMatrix3x2dv)
-    {"glProgramUniformMatrix3x2fv", P(GL_ProgramUniformMatrix3x2fv)},
-    {"glProgramUniformMatrix3x2fvEXT", P(GL_ProgramUniformMatrix3x2fvEXT)},
-    DESKTOP_ONLY("glProgramUniformMatrix3x4dv", GL_ProgramUniformMatrix3x4dv)
-    {"glProgramUniformMatrix3x4fv", P(GL_ProgramUniformMatrix3x4fv)},
-    {"glProgramUniformMatrix3x4fvEXT", P(GL_ProgramUniformMatrix3x4fvEXT)},
-    DESKTOP_ONLY("glProgramUniformMatrix4dv", GL_ProgramUniformMatrix4dv)
-    {"glProgramUniformMatrix4fv", P(GL_ProgramUniformMatrix4fv)},
-    {"glProgramUniformMatrix4fvEXT", P(GL_ProgramUniformMatrix4fvEXT)},
-    DESKTOP_ONLY("glProgramUniformMatrix4x2dv", GL_ProgramUniformMatrix4x2dv)
-    {"glProgramUniformMatrix4x2fv", P(GL_ProgramUniformMatrix4x2fv)},
-    {"glProgramUniformMatrix4x2fvEXT", P(GL_ProgramUniformMatrix4x2fvEXT)},
-    DESKTOP_ONLY("glProgramUniformMatrix4x3dv", GL_ProgramUniformMatrix4x3dv)
-    {"glProgramUniformMatrix4x3fv", P(GL_ProgramUniformMatrix4x3fv)},
-    {"glProgramUniformMatrix4x3fvEXT", P(GL_ProgramUniformMatrix4x3fvEXT)},
-    DESKTOP_ONLY("glProvokingVertex", GL_ProvokingVertex)
-    {"glProvokingVertexANGLE", P(GL_ProvokingVertexANGLE)},
-    DESKTOP_ONLY("glPushAttrib", GL_PushAttrib)
-    DESKTOP_ONLY("glPushClientAttrib", GL_PushClientAttrib)
-    {"glPushDebugGroup", P(GL_PushDebugGroup)},
-    {"glPushDebugGroupKHR", P(GL_PushDebugGroupKHR)},
-    {"glPushGroupMarkerEXT", P(GL_PushGroupMarkerEXT)},
-    {"glPushMatrix", P(GL_PushMatrix)},
-    DESKTOP_ONLY("glPushName", GL_PushName)
-    DESKTOP_ONLY("glQueryCounter", GL_QueryCounter)
-    {"glQueryCounterEXT", P(GL_QueryCounterEXT)},
-    {"glQueryMatrixxOES", P(GL_QueryMatrixxOES)},
-    DESKTOP_ONLY("glRasterPos2d", GL_RasterPos2d)
+    DESKTOP_ONLY("glColor3ubv", GL_Color3ubv)
+    {"glEnablei", P(GL_Enablei)},
+    DESKTOP_ONLY("glTexCoord2f", GL_TexCoord2f)
+    DESKTOP_ONLY("glVertexAttrib4Nub", GL_VertexAttrib4Nub)
+    {"glIsTransformFeedback", P(GL_IsTransformFeedback)},
+    {"glPolygonModeNV", P(GL_PolygonModeNV)},
+    DESKTOP_ONLY("glGetQueryBufferObjectiv", GL_GetQueryBufferObjectiv)
+    {"glGetQueryObjectuivRobustANGLE", P(GL_GetQueryObjectuivRobustANGLE)},
+    {"glProgramBinaryOES", P(GL_ProgramBinaryOES)},
+    {"glDeleteShader", P(GL_DeleteShader)},
+    DESKTOP_ONLY("glLoadName", GL_LoadName)
+    {"glSamplerParameterIivRobustANGLE", P(GL_SamplerParameterIivRobustANGLE)},
+    {"glGetQueryObjectuivEXT", P(GL_GetQueryObjectuivEXT)},
+    DESKTOP_ONLY("glTextureStorage2DMultisample", GL_TextureStorage2DMultisample)
+    DESKTOP_ONLY("glMapNamedBuffer", GL_MapNamedBuffer)
+    DESKTOP_ONLY("glVertexArrayAttribBinding", GL_VertexArrayAttribBinding)
+    DESKTOP_ONLY("glVertexP4ui", GL_VertexP4ui)
+    {"glGetInteger64vEXT", P(GL_GetInteger64vEXT)},
+    {"glSamplerParameterfv", P(GL_SamplerParameterfv)},
+    {"glShaderBinary", P(GL_ShaderBinary)},
+    {"glTextureFoveationParametersQCOM", P(GL_TextureFoveationParametersQCOM)},
+    {"glGetBufferPointerv", P(GL_GetBufferPointerv)},
+    {"eglUnlockSurfaceKHR", P(EGL_UnlockSurfaceKHR)},
+    {"glEGLImageTargetTextureStorageEXT", P(GL_EGLImageTargetTextureStorageEXT)},
+    DESKTOP_ONLY("glGetTextureSubImage", GL_GetTextureSubImage)
+    {"glGetUniformIndices", P(GL_GetUniformIndices)},
+    {"glCurrentPaletteMatrixOES", P(GL_CurrentPaletteMatrixOES)},
+    DESKTOP_ONLY("glEvalCoord1f", GL_EvalCoord1f)
+    DESKTOP_ONLY("glCreateBuffers", GL_CreateBuffers)
+    {"glGetFragDataIndexEXT", P(GL_GetFragDataIndexEXT)},
+    {"glAlphaFuncx", P(GL_AlphaFuncx)},
+    DESKTOP_ONLY("glNamedBufferStorage", GL_NamedBufferStorage)
+    DESKTOP_ONLY("glMapGrid1d", GL_MapGrid1d)
+    DESKTOP_ONLY("glGetQueryBufferObjectuiv", GL_GetQueryBufferObjectuiv)
+    {"glBlendEquationSeparate", P(GL_BlendEquationSeparate)},
+    DESKTOP_ONLY("glWindowPos3s", GL_WindowPos3s)
+    DESKTOP_ONLY("glInitNames", GL_InitNames)
     DESKTOP_ONLY("glRasterPos2dv", GL_RasterPos2dv)
-    DESKTOP_ONLY("glRasterPos2f", GL_RasterPos2f)
-    DESKTOP_ONLY("glRasterPos2fv", GL_RasterPos2fv)
-    DESKTOP_ONLY("glRasterPos2i", GL_RasterPos2i)
+    DESKTOP_ONLY("glMultiTexCoord2d", GL_MultiTexCoord2d)
+    DESKTOP_ONLY("glInvalidateBufferData", GL_InvalidateBufferData)
+    {"glGenVertexArrays", P(GL_GenVertexArrays)},
+    DESKTOP_ONLY("glVertexAttrib4ubv", GL_VertexAttrib4ubv)
+    DESKTOP_ONLY("glColor3fv", GL_Color3fv)
+    {"glVertexPointer", P(GL_VertexPointer)},
+    DESKTOP_ONLY("glTextureParameterf", GL_TextureParameterf)
+    {"eglProgramCacheGetAttribANGLE", P(EGL_ProgramCacheGetAttribANGLE)},
+    {"glDrawArraysInstanced", P(GL_DrawArraysInstanced)},
     DESKTOP_ONLY("glRasterPos2iv", GL_RasterPos2iv)
-    DESKTOP_ONLY("glRasterPos2s", GL_RasterPos2s)
+    DESKTOP_ONLY("glGetPixelMapfv", GL_GetPixelMapfv)
+    {"glProgramUniform2iv", P(GL_ProgramUniform2iv)},
+    DESKTOP_ONLY("glMultiTexCoord1i", GL_MultiTexCoord1i)
+    DESKTOP_ONLY("glGetTransformFeedbacki64_v", GL_GetTransformFeedbacki64_v)
+    {"eglReleaseThread", P(EGL_ReleaseThread)},
+    {"glInvalidateSubFramebuffer", P(GL_InvalidateSubFramebuffer)},
+    {"glGetProgramBinaryOES", P(GL_GetProgramBinaryOES)},
+    DESKTOP_ONLY("glCopyTexImage1D", GL_CopyTexImage1D)
+    {"glDrawArraysInstancedANGLE", P(GL_DrawArraysInstancedANGLE)},
+    DESKTOP_ONLY("glPushClientAttrib", GL_PushClientAttrib)
+    {"eglSwapInterval", P(EGL_SwapInterval)},
+    {"glGetRenderbufferParameterivRobustANGLE", P(GL_GetRenderbufferParameterivRobustANGLE)},
+    {"glBlendEquationiEXT", P(GL_BlendEquationiEXT)},
+    DESKTOP_ONLY("glNormal3d", GL_Normal3d)
+    DESKTOP_ONLY("glUniformMatrix3x4dv", GL_UniformMatrix3x4dv)
+    {"glProgramBinary", P(GL_ProgramBinary)},
+    {"glTexStorageMem2DEXT", P(GL_TexStorageMem2DEXT)},
+    DESKTOP_ONLY("glMultiTexCoord1f", GL_MultiTexCoord1f)
+    {"glCompileShader", P(GL_CompileShader)},
     DESKTOP_ONLY("glRasterPos2sv", GL_RasterPos2sv)
-    DESKTOP_ONLY("glRasterPos3d", GL_RasterPos3d)
-    DESKTOP_ONLY("glRasterPos3dv", GL_RasterPos3dv)
-    DESKTOP_ONLY("glRasterPos3f", GL_RasterPos3f)
-    DESKTOP_ONLY("glRasterPos3fv", GL_RasterPos3fv)
+    {"eglPresentationTimeANDROID", P(EGL_PresentationTimeANDROID)},
+    {"eglReleaseExternalContextANGLE", P(EGL_ReleaseExternalContextANGLE)},
+    {"glMultiTexCoord4f", P(GL_MultiTexCoord4f)},
+    {"glMultiDrawElementsIndirectEXT", P(GL_MultiDrawElementsIndirectEXT)},
+    DESKTOP_ONLY("glUniform1dv", GL_Uniform1dv)
+    DESKTOP_ONLY("glVertex3dv", GL_Vertex3dv)
+    DESKTOP_ONLY("glVertexAttribP2ui", GL_VertexAttribP2ui)
+    {"glUniform2i", P(GL_Uniform2i)},
+    {"glGetPointervRobustANGLERobustANGLE", P(GL_GetPointervRobustANGLERobustANGLE)},
+    DESKTOP_ONLY("glBufferStorage", GL_BufferStorage)
+    {"glGetInteger64v", P(GL_GetInteger64v)},
+    DESKTOP_ONLY("glPixelZoom", GL_PixelZoom)
+    DESKTOP_ONLY("glSecondaryColor3ui", GL_SecondaryColor3ui)
+    DESKTOP_ONLY("glVertexAttrib1sv", GL_VertexAttrib1sv)
+    {"eglProgramCacheQueryANGLE", P(EGL_ProgramCacheQueryANGLE)},
+    DESKTOP_ONLY("glPolygonMode", GL_PolygonMode)
+    {"glGetFixedv", P(GL_GetFixedv)},
+    {"glActiveShaderProgramEXT", P(GL_ActiveShaderProgramEXT)},
+    DESKTOP_ONLY("glUniform2dv", GL_Uniform2dv)
+    DESKTOP_ONLY("glInvalidateNamedFramebufferSubData", GL_InvalidateNamedFramebufferSubData)
+    {"glGetBufferParameteri64vRobustANGLE", P(GL_GetBufferParameteri64vRobustANGLE)},
+    DESKTOP_ONLY("glMultiDrawArraysIndirect", GL_MultiDrawArraysIndirect)
+    {"glColor4f", P(GL_Color4f)},
+    DESKTOP_ONLY("glGetUniformSubroutineuiv", GL_GetUniformSubroutineuiv)
+    {"glGetGraphicsResetStatusEXT", P(GL_GetGraphicsResetStatusEXT)},
+    DESKTOP_ONLY("glTextureView", GL_TextureView)
+    {"eglQueryDmaBufModifiersEXT", P(EGL_QueryDmaBufModifiersEXT)},
+    DESKTOP_ONLY("glVertex3fv", GL_Vertex3fv)
+    DESKTOP_ONLY("glMultiTexCoord4d", GL_MultiTexCoord4d)
+    {"glEnableiOES", P(GL_EnableiOES)},
+    {"glReadnPixelsEXT", P(GL_ReadnPixelsEXT)},
+    {"glFramebufferParameteri", P(GL_FramebufferParameteri)},
+    DESKTOP_ONLY("glViewportIndexedfv", GL_ViewportIndexedfv)
+    {"glTexStorageMemFlags3DANGLE", P(GL_TexStorageMemFlags3DANGLE)},
+    {"glDeleteVertexArrays", P(GL_DeleteVertexArrays)},
+    {"eglSurfaceAttrib", P(EGL_SurfaceAttrib)},
+    {"glProgramUniform2uiv", P(GL_ProgramUniform2uiv)},
+    DESKTOP_ONLY("glCompressedTexImage1D", GL_CompressedTexImage1D)
+    DESKTOP_ONLY("glVertex3s", GL_Vertex3s)
+    {"glDeleteSamplers", P(GL_DeleteSamplers)},
+    DESKTOP_ONLY("glGetTexGenfv", GL_GetTexGenfv)
+    DESKTOP_ONLY("glPrioritizeTextures", GL_PrioritizeTextures)
+    DESKTOP_ONLY("glVertexAttribI2i", GL_VertexAttribI2i)
+    {"glDrawRangeElementsBaseVertex", P(GL_DrawRangeElementsBaseVertex)},
+    DESKTOP_ONLY("glVertexAttribP3uiv", GL_VertexAttribP3uiv)
+    DESKTOP_ONLY("glMapGrid1f", GL_MapGrid1f)
+    {"glEndPerfMonitorAMD", P(GL_EndPerfMonitorAMD)},
+    DESKTOP_ONLY("glPatchParameterfv", GL_PatchParameterfv)
+    DESKTOP_ONLY("glVertex4iv", GL_Vertex4iv)
+    {"glFramebufferPixelLocalStorageRestoreANGLE", P(GL_FramebufferPixelLocalStorageRestoreANGLE)},
+    {"eglDestroyImage", P(EGL_DestroyImage)},
+    {"glFrustumf", P(GL_Frustumf)},
+    DESKTOP_ONLY("glTexCoordP4uiv", GL_TexCoordP4uiv)
+    {"glDrawElementsInstancedBaseVertexEXT", P(GL_DrawElementsInstancedBaseVertexEXT)},
+    {"eglCreateSyncKHR", P(EGL_CreateSyncKHR)},
+    DESKTOP_ONLY("glTexCoord2dv", GL_TexCoord2dv)
+    {"glGetVertexAttribIivRobustANGLE", P(GL_GetVertexAttribIivRobustANGLE)},
+    {"glGetnUniformfvEXT", P(GL_GetnUniformfvEXT)},
+    {"glProgramUniform2iEXT", P(GL_ProgramUniform2iEXT)},
+    DESKTOP_ONLY("glColor3b", GL_Color3b)
+    {"glFenceSync", P(GL_FenceSync)},
+    {"glGetProgramResourceLocationIndexEXT", P(GL_GetProgramResourceLocationIndexEXT)},
+    {"glNormalPointer", P(GL_NormalPointer)},
+    DESKTOP_ONLY("glTextureStorage3DMultisample", GL_TextureStorage3DMultisample)
+    {"glGetnUniformfvKHR", P(GL_GetnUniformfvKHR)},
+    DESKTOP_ONLY("glColor4d", GL_Color4d)
+    {"eglQueryDebugKHR", P(EGL_QueryDebugKHR)},
+    {"glGetObjectLabel", P(GL_GetObjectLabel)},
+    {"glIsEnabledi", P(GL_IsEnabledi)},
     DESKTOP_ONLY("glRasterPos3i", GL_RasterPos3i)
-    DESKTOP_ONLY("glRasterPos3iv", GL_RasterPos3iv)
+    DESKTOP_ONLY("glVertexAttribP4ui", GL_VertexAttribP4ui)
+    DESKTOP_ONLY("glMultiTexCoord4iv", GL_MultiTexCoord4iv)
+    {"glFrustumx", P(GL_Frustumx)},
+    {"glEndTransformFeedback", P(GL_EndTransformFeedback)},
+    {"glPopDebugGroup", P(GL_PopDebugGroup)},
+    DESKTOP_ONLY("glVertexP2uiv", GL_VertexP2uiv)
+    {"glGetBufferParameterivRobustANGLE", P(GL_GetBufferParameterivRobustANGLE)},
+    DESKTOP_ONLY("glVertexAttrib3dv", GL_VertexAttrib3dv)
+    {"eglGetPlatformDisplay", P(EGL_GetPlatformDisplay)},
+    {"eglSetValidationEnabledANGLE", P(EGL_SetValidationEnabledANGLE)},
+    {"glProgramUniformMatrix4fv", P(GL_ProgramUniformMatrix4fv)},
+    DESKTOP_ONLY("glDrawElementsInstancedBaseVertexBaseInstance", GL_DrawElementsInstancedBaseVertexBaseInstance)
+    DESKTOP_ONLY("glRecti", GL_Recti)
+    DESKTOP_ONLY("glBeginQueryIndexed", GL_BeginQueryIndexed)
+    {"glLightxv", P(GL_Lightxv)},
+    {"glDrawTexfvOES", P(GL_DrawTexfvOES)},
+    {"glIsEnabled", P(GL_IsEnabled)},
+    {"glEGLImageTargetRenderbufferStorageOES", P(GL_EGLImageTargetRenderbufferStorageOES)},
+    DESKTOP_ONLY("glCreateFramebuffers", GL_CreateFramebuffers)
+    DESKTOP_ONLY("glMapGrid2f", GL_MapGrid2f)
+    {"glDrawElementsInstancedBaseVertexBaseInstanceANGLE", P(GL_DrawElementsInstancedBaseVertexBaseInstanceANGLE)},
+    {"eglBindAPI", P(EGL_BindAPI)},
+    DESKTOP_ONLY("glVertexAttrib3d", GL_VertexAttrib3d)
+    {"glBindAttribLocation", P(GL_BindAttribLocation)},
+    {"glVertexAttribPointer", P(GL_VertexAttribPointer)},
+    {"glLoseContextCHROMIUM", P(GL_LoseContextCHROMIUM)},
+    {"glGenSemaphoresEXT", P(GL_GenSemaphoresEXT)},
+    {"glLightModelf", P(GL_LightModelf)},
+    DESKTOP_ONLY("glAccum", GL_Accum)
+    {"glDeletePerfMonitorsAMD", P(GL_DeletePerfMonitorsAMD)},
+    {"glDrawElementsInstancedBaseVertexBaseInstanceEXT", P(GL_DrawElementsInstancedBaseVertexBaseInstanceEXT)},
+    DESKTOP_ONLY("glScissorArrayv", GL_ScissorArrayv)
+    {"glUniform3i", P(GL_Uniform3i)},
+    DESKTOP_ONLY("glSecondaryColor3usv", GL_SecondaryColor3usv)
+    DESKTOP_ONLY("glFogCoordfv", GL_FogCoordfv)
+    {"glColorMask", P(GL_ColorMask)},
+    DESKTOP_ONLY("glRasterPos4fv", GL_RasterPos4fv)
+    DESKTOP_ONLY("glCopyNamedBufferSubData", GL_CopyNamedBufferSubData)
+    {"glMemoryBarrier", P(GL_MemoryBarrier)},
+    DESKTOP_ONLY("glVertexArrayAttribLFormat", GL_VertexArrayAttribLFormat)
+    {"glTexStorageMemFlags2DANGLE", P(GL_TexStorageMemFlags2DANGLE)},
     DESKTOP_ONLY("glRasterPos3s", GL_RasterPos3s)
-    DESKTOP_ONLY("glRasterPos3sv", GL_RasterPos3sv)
-    DESKTOP_ONLY("glRasterPos4d", GL_RasterPos4d)
+    DESKTOP_ONLY("glProgramUniformMatrix4x3dv", GL_ProgramUniformMatrix4x3dv)
+    DESKTOP_ONLY("glGetVertexArrayIndexediv", GL_GetVertexArrayIndexediv)
+    {"glCopySubTextureCHROMIUM", P(GL_CopySubTextureCHROMIUM)},
+    DESKTOP_ONLY("glMultiTexCoordP1ui", GL_MultiTexCoordP1ui)
+    {"glGetBooleanv", P(GL_GetBooleanv)},
+    {"eglGetSyncValuesCHROMIUM", P(EGL_GetSyncValuesCHROMIUM)},
+    DESKTOP_ONLY("glTexCoord4dv", GL_TexCoord4dv)
+    DESKTOP_ONLY("glMultiTexCoord2f", GL_MultiTexCoord2f)
+    {"glTexBufferOES", P(GL_TexBufferOES)},
+    DESKTOP_ONLY("glTextureSubImage1D", GL_TextureSubImage1D)
+    DESKTOP_ONLY("glPixelMapfv", GL_PixelMapfv)
+    DESKTOP_ONLY("glColor3d", GL_Color3d)
+    DESKTOP_ONLY("glDrawPixels", GL_DrawPixels)
+    DESKTOP_ONLY("glBindBuffersBase", GL_BindBuffersBase)
+    {"glDebugMessageInsert", P(GL_DebugMessageInsert)},
+    DESKTOP_ONLY("glVertex4d", GL_Vertex4d)
+    DESKTOP_ONLY("glGetCompressedTextureImage", GL_GetCompressedTextureImage)
+    {"glGenFramebuffers", P(GL_GenFramebuffers)},
+    {"glDrawTexxOES", P(GL_DrawTexxOES)},
+    DESKTOP_ONLY("glTexGeni", GL_TexGeni)
+    DESKTOP_ONLY("glGetNamedBufferSubData", GL_GetNamedBufferSubData)
+    {"glSignalSemaphoreEXT", P(GL_SignalSemaphoreEXT)},
+    {"glInvalidateTextureANGLE", P(GL_InvalidateTextureANGLE)},
+    {"glDeleteQueries", P(GL_DeleteQueries)},
+    {"glGetSamplerParameterIivEXT", P(GL_GetSamplerParameterIivEXT)},
+    DESKTOP_ONLY("glVertexAttribP1uiv", GL_VertexAttribP1uiv)
+    {"glShadeModel", P(GL_ShadeModel)},
+    DESKTOP_ONLY("glColor3us", GL_Color3us)
+    DESKTOP_ONLY("glGetSubroutineUniformLocation", GL_GetSubroutineUniformLocation)
+    {"glImportSemaphoreFdEXT", P(GL_ImportSemaphoreFdEXT)},
+    DESKTOP_ONLY("glUniform3dv", GL_Uniform3dv)
+    {"glTexParameterfvRobustANGLE", P(GL_TexParameterfvRobustANGLE)},
+    DESKTOP_ONLY("glTexGeniv", GL_TexGeniv)
+    {"glGetShaderivRobustANGLE", P(GL_GetShaderivRobustANGLE)},
+    DESKTOP_ONLY("glSecondaryColor3b", GL_SecondaryColor3b)
+    {"eglQueryStreamu64KHR", P(EGL_QueryStreamu64KHR)},
+    DESKTOP_ONLY("glVertexAttrib1dv", GL_VertexAttrib1dv)
+    DESKTOP_ONLY("glSecondaryColor3sv", GL_SecondaryColor3sv)
+    {"glVertexAttribBinding", P(GL_VertexAttribBinding)},
+    DESKTOP_ONLY("glGetMapiv", GL_GetMapiv)
+    {"glTexParameteriv", P(GL_TexParameteriv)},
+    {"glWaitSync", P(GL_WaitSync)},
+    {"glGetProgramResourceIndex", P(GL_GetProgramResourceIndex)},
+    DESKTOP_ONLY("glTextureStorage1D", GL_TextureStorage1D)
+    {"glGetQueryObjecti64vEXT", P(GL_GetQueryObjecti64vEXT)},
+    {"glPixelLocalStorageBarrierANGLE", P(GL_PixelLocalStorageBarrierANGLE)},
+    {"glColorMaski", P(GL_ColorMaski)},
+    {"glPolygonModeANGLE", P(GL_PolygonModeANGLE)},
+    {"eglCreatePlatformPixmapSurfaceEXT", P(EGL_CreatePlatformPixmapSurfaceEXT)},
+    {"glDrawArraysInstancedBaseInstanceEXT", P(GL_DrawArraysInstancedBaseInstanceEXT)},
+    DESKTOP_ONLY("glCopyTextureSubImage2D", GL_CopyTextureSubImage2D)
+    {"glBlitFramebuffer", P(GL_BlitFramebuffer)},
+    {"glSamplerParameterIuivRobustANGLE", P(GL_SamplerParameterIuivRobustANGLE)},
+    DESKTOP_ONLY("glGetnHistogram", GL_GetnHistogram)
+    DESKTOP_ONLY("glEvalCoord2f", GL_EvalCoord2f)
+    {"glLightf", P(GL_Lightf)},
+    {"glIsSampler", P(GL_IsSampler)},
+    DESKTOP_ONLY("glClearNamedBufferSubData", GL_ClearNamedBufferSubData)
+    DESKTOP_ONLY("glVertexArrayElementBuffer", GL_VertexArrayElementBuffer)
+    DESKTOP_ONLY("glVertexAttribI1iv", GL_VertexAttribI1iv)
+    {"glVertexAttribDivisor", P(GL_VertexAttribDivisor)},
+    {"glUniform2iv", P(GL_Uniform2iv)},
+    {"glProgramUniform2uivEXT", P(GL_ProgramUniform2uivEXT)},
     DESKTOP_ONLY("glRasterPos4dv", GL_RasterPos4dv)
-    DESKTOP_ONLY("glRasterPos4f", GL_RasterPos4f)
-    DESKTOP_ONLY("glRasterPos4fv", GL_RasterPos4fv)
-    DESKTOP_ONLY("glRasterPos4i", GL_RasterPos4i)
-    DESKTOP_ONLY("glRasterPos4iv", GL_RasterPos4iv)
-    DESKTOP_ONLY("glRasterPos4s", GL_RasterPos4s)
-    DESKTOP_ONLY("glRasterPos4sv", GL_RasterPos4sv)
-    {"glReadBuffer", P(GL_ReadBuffer)},
-    {"glReadPixels", P(GL_ReadPixels)},
-    {"glReadPixelsRobustANGLE", P(GL_ReadPixelsRobustANGLE)},
-    {"glReadnPixels", P(GL_ReadnPixels)},
-    {"glReadnPixelsEXT", P(GL_ReadnPixelsEXT)},
+    {"glGetMaterialxv", P(GL_GetMaterialxv)},
+    DESKTOP_ONLY("glGetActiveSubroutineUniformiv", GL_GetActiveSubroutineUniformiv)
+    DESKTOP_ONLY("glGenerateTextureMipmap", GL_GenerateTextureMipmap)
+    {"eglCreatePlatformWindowSurface", P(EGL_CreatePlatformWindowSurface)},
+    {"glAcquireTexturesANGLE", P(GL_AcquireTexturesANGLE)},
+    DESKTOP_ONLY("glPixelTransferi", GL_PixelTransferi)
+    {"glVertexAttribDivisorANGLE", P(GL_VertexAttribDivisorANGLE)},
+    {"glProgramUniform4i", P(GL_ProgramUniform4i)},
+    DESKTOP_ONLY("glGetFloati_v", GL_GetFloati_v)
+    DESKTOP_ONLY("glSelectBuffer", GL_SelectBuffer)
+    DESKTOP_ONLY("glSecondaryColorP3ui", GL_SecondaryColorP3ui)
+    {"glBufferStorageExternalEXT", P(GL_BufferStorageExternalEXT)},
+    {"glFramebufferPixelLocalClearValuefvANGLE", P(GL_FramebufferPixelLocalClearValuefvANGLE)},
+    {"glSamplerParameterIivEXT", P(GL_SamplerParameterIivEXT)},
+    DESKTOP_ONLY("glMultiTexCoordP2uiv", GL_MultiTexCoordP2uiv)
+    {"glGetMultisamplefv", P(GL_GetMultisamplefv)},
+    DESKTOP_ONLY("glTexCoord4sv", GL_TexCoord4sv)
+    DESKTOP_ONLY("glIndexiv", GL_Indexiv)
+    DESKTOP_ONLY("glMapBuffer", GL_MapBuffer)
+    DESKTOP_ONLY("glEvalMesh2", GL_EvalMesh2)
+    {"glBufferData", P(GL_BufferData)},
+    DESKTOP_ONLY("glInvalidateBufferSubData", GL_InvalidateBufferSubData)
+    DESKTOP_ONLY("glEnableVertexArrayAttrib", GL_EnableVertexArrayAttrib)
+    {"glGetFramebufferAttachmentParameteriv", P(GL_GetFramebufferAttachmentParameteriv)},
+    DESKTOP_ONLY("glMultiTexCoord3sv", GL_MultiTexCoord3sv)
+    {"eglGetConfigAttrib", P(EGL_GetConfigAttrib)},
+    {"glDeleteVertexArraysOES", P(GL_DeleteVertexArraysOES)},
+    DESKTOP_ONLY("glSpecializeShader", GL_SpecializeShader)
+    DESKTOP_ONLY("glVertexAttrib4dv", GL_VertexAttrib4dv)
+    {"glGetShaderInfoLog", P(GL_GetShaderInfoLog)},
+    {"eglGetFrameTimestampsANDROID", P(EGL_GetFrameTimestampsANDROID)},
+    {"glGetInteger64vRobustANGLE", P(GL_GetInteger64vRobustANGLE)},
+    {"glGetVertexAttribIiv", P(GL_GetVertexAttribIiv)},
+    {"glGenPerfMonitorsAMD", P(GL_GenPerfMonitorsAMD)},
+    {"glIsFenceNV", P(GL_IsFenceNV)},
+    DESKTOP_ONLY("glGetProgramStageiv", GL_GetProgramStageiv)
+    {"glIsFramebuffer", P(GL_IsFramebuffer)},
+    DESKTOP_ONLY("glColor4s", GL_Color4s)
+    {"eglSwapBuffers", P(EGL_SwapBuffers)},
+    DESKTOP_ONLY("glPixelMapusv", GL_PixelMapusv)
     {"glReadnPixelsKHR", P(GL_ReadnPixelsKHR)},
-    {"glReadnPixelsRobustANGLE", P(GL_ReadnPixelsRobustANGLE)},
-    DESKTOP_ONLY("glRectd", GL_Rectd)
-    DESKTOP_ONLY("glRectdv", GL_Rectdv)
+    {"glDeleteProgram", P(GL_DeleteProgram)},
+    {"glBindImageTexture", P(GL_BindImageTexture)},
+    DESKTOP_ONLY("glTexCoord3sv", GL_TexCoord3sv)
+    {"glProgramUniformMatrix2x4fv", P(GL_ProgramUniformMatrix2x4fv)},
+    {"glTexCoordPointer", P(GL_TexCoordPointer)},
+    {"glCopyTextureCHROMIUM", P(GL_CopyTextureCHROMIUM)},
+    DESKTOP_ONLY("glNormal3i", GL_Normal3i)
+    DESKTOP_ONLY("glNamedFramebufferTexture", GL_NamedFramebufferTexture)
+    {"glMapBufferOES", P(GL_MapBufferOES)},
+    {"glNormal3x", P(GL_Normal3x)},
     DESKTOP_ONLY("glRectf", GL_Rectf)
-    DESKTOP_ONLY("glRectfv", GL_Rectfv)
-    DESKTOP_ONLY("glRecti", GL_Recti)
-    DESKTOP_ONLY("glRectiv", GL_Rectiv)
-    DESKTOP_ONLY("glRects", GL_Rects)
-    DESKTOP_ONLY("glRectsv", GL_Rectsv)
-    {"glReleaseShaderCompiler", P(GL_ReleaseShaderCompiler)},
+    DESKTOP_ONLY("glVertex2i", GL_Vertex2i)
+    DESKTOP_ONLY("glColor3i", GL_Color3i)
+    DESKTOP_ONLY("glTexCoord4d", GL_TexCoord4d)
+    DESKTOP_ONLY("glNamedFramebufferDrawBuffer", GL_NamedFramebufferDrawBuffer)
+    {"glUniform3ui", P(GL_Uniform3ui)},
+    DESKTOP_ONLY("glRasterPos4s", GL_RasterPos4s)
+    {"glMultiDrawElementsANGLE", P(GL_MultiDrawElementsANGLE)},
+    {"glTestFenceNV", P(GL_TestFenceNV)},
+    {"glTexImage2D", P(GL_TexImage2D)},
+    {"glGetSamplerParameterIuivEXT", P(GL_GetSamplerParameterIuivEXT)},
+    DESKTOP_ONLY("glLoadTransposeMatrixd", GL_LoadTransposeMatrixd)
+    DESKTOP_ONLY("glRasterPos2i", GL_RasterPos2i)
+    DESKTOP_ONLY("glTexCoordP1ui", GL_TexCoordP1ui)
+    {"glIsProgramPipeline", P(GL_IsProgramPipeline)},
+    DESKTOP_ONLY("glInvalidateTexSubImage", GL_InvalidateTexSubImage)
+    {"glBufferSubData", P(GL_BufferSubData)},
+    DESKTOP_ONLY("glVertexAttribI3iv", GL_VertexAttribI3iv)
+    DESKTOP_ONLY("glClearNamedFramebufferfi", GL_ClearNamedFramebufferfi)
+    {"glBindFragDataLocationEXT", P(GL_BindFragDataLocationEXT)},
+    {"glFogfv", P(GL_Fogfv)},
+    {"eglGetProcAddress", P(EGL_GetProcAddress)},
+    {"glSamplerParameterfvRobustANGLE", P(GL_SamplerParameterfvRobustANGLE)},
+    DESKTOP_ONLY("glMultiTexCoordP4ui", GL_MultiTexCoordP4ui)
+    {"glBindBufferBase", P(GL_BindBufferBase)},
+    DESKTOP_ONLY("glTextureParameterfv", GL_TextureParameterfv)
+    DESKTOP_ONLY("glMultiTexCoord1iv", GL_MultiTexCoord1iv)
+    DESKTOP_ONLY("glNormal3b", GL_Normal3b)
+    {"glVertexAttrib2f", P(GL_VertexAttrib2f)},
+    {"glSamplerParameteriv", P(GL_SamplerParameteriv)},
+    DESKTOP_ONLY("glVertexAttribI2iv", GL_VertexAttribI2iv)
+    {"eglClientWaitSyncKHR", P(EGL_ClientWaitSyncKHR)},
+    {"glGetVertexAttribivRobustANGLE", P(GL_GetVertexAttribivRobustANGLE)},
+    DESKTOP_ONLY("glUniformMatrix3x2dv", GL_UniformMatrix3x2dv)
+    {"glProgramUniform2fv", P(GL_ProgramUniform2fv)},
+    {"glGetProgramPipelineInfoLog", P(GL_GetProgramPipelineInfoLog)},
+    {"glVertexAttrib1fv", P(GL_VertexAttrib1fv)},
+    DESKTOP_ONLY("glGetnMinmax", GL_GetnMinmax)
+    {"glPolygonOffset", P(GL_PolygonOffset)},
+    {"glPatchParameteri", P(GL_PatchParameteri)},
+    {"glGenFramebuffersOES", P(GL_GenFramebuffersOES)},
+    DESKTOP_ONLY("glCreateSamplers", GL_CreateSamplers)
+    {"glTexGenxvOES", P(GL_TexGenxvOES)},
+    {"glGetSamplerParameterfv", P(GL_GetSamplerParameterfv)},
+    {"glBindFramebuffer", P(GL_BindFramebuffer)},
+    DESKTOP_ONLY("glGetVertexAttribLdv", GL_GetVertexAttribLdv)
+    DESKTOP_ONLY("glColor4dv", GL_Color4dv)
+    {"glBlendColor", P(GL_BlendColor)},
+    {"glIsProgram", P(GL_IsProgram)},
+    DESKTOP_ONLY("glMultiTexCoordP1uiv", GL_MultiTexCoordP1uiv)
+    {"glTexParameterIuivEXT", P(GL_TexParameterIuivEXT)},
+    {"glMultMatrixx", P(GL_MultMatrixx)},
+    DESKTOP_ONLY("glGetVertexArrayIndexed64iv", GL_GetVertexArrayIndexed64iv)
+    {"glGetRenderbufferImageANGLE", P(GL_GetRenderbufferImageANGLE)},
+    {"glUnmapBufferOES", P(GL_UnmapBufferOES)},
+    DESKTOP_ONLY("glMultiTexCoordP2ui", GL_MultiTexCoordP2ui)
+    {"eglQuerySurfacePointerANGLE", P(EGL_QuerySurfacePointerANGLE)},
+    DESKTOP_ONLY("glGenLists", GL_GenLists)
+    {"glBufferStorageEXT", P(GL_BufferStorageEXT)},
+    {"glBindVertexArray", P(GL_BindVertexArray)},
+    DESKTOP_ONLY("glDepthRangeIndexed", GL_DepthRangeIndexed)
+    {"glGetUnsignedBytevEXT", P(GL_GetUnsignedBytevEXT)},
+    {"glSampleCoverage", P(GL_SampleCoverage)},
+    {"eglExportVkImageANGLE", P(EGL_ExportVkImageANGLE)},
+    DESKTOP_ONLY("glClearBufferData", GL_ClearBufferData)
+    {"glCompressedTexImage2D", P(GL_CompressedTexImage2D)},
+    DESKTOP_ONLY("glColor3f", GL_Color3f)
+    {"glFramebufferFetchBarrierEXT", P(GL_FramebufferFetchBarrierEXT)},
+    DESKTOP_ONLY("glClearAccum", GL_ClearAccum)
+    {"eglQueryStreamKHR", P(EGL_QueryStreamKHR)},
+    {"eglWaitGL", P(EGL_WaitGL)},
+    {"glProgramUniform1fvEXT", P(GL_ProgramUniform1fvEXT)},
+    {"glUniform2fv", P(GL_Uniform2fv)},
+    DESKTOP_ONLY("glIndexPointer", GL_IndexPointer)
+    DESKTOP_ONLY("glQueryCounter", GL_QueryCounter)
+    DESKTOP_ONLY("glMultiTexCoord1fv", GL_MultiTexCoord1fv)
+    {"glGetPointervKHR", P(GL_GetPointervKHR)},
+    {"glGetMaterialfv", P(GL_GetMaterialfv)},
+    {"glCompressedTexSubImage2D", P(GL_CompressedTexSubImage2D)},
+    {"eglPostSubBufferNV", P(EGL_PostSubBufferNV)},
+    DESKTOP_ONLY("glClearNamedFramebufferuiv", GL_ClearNamedFramebufferuiv)
+    {"glTexStorage3DMultisample", P(GL_TexStorage3DMultisample)},
+    DESKTOP_ONLY("glLightiv", GL_Lightiv)
+    {"glHint", P(GL_Hint)},
+    {"glIsShader", P(GL_IsShader)},
     {"glReleaseTexturesANGLE", P(GL_ReleaseTexturesANGLE)},
-    DESKTOP_ONLY("glRenderMode", GL_RenderMode)
-    {"glRenderbufferStorage", P(GL_RenderbufferStorage)},
-    {"glRenderbufferStorageMultisample", P(GL_RenderbufferStorageMultisample)},
-    {"glRenderbufferStorageMultisampleANGLE", P(GL_RenderbufferStorageMultisampleANGLE)},
-    {"glRenderbufferStorageMultisampleEXT", P(GL_RenderbufferStorageMultisampleEXT)},
-    {"glRenderbufferStorageOES", P(GL_RenderbufferStorageOES)},
+    {"eglQueryAPI", P(EGL_QueryAPI)},
+    {"glFramebufferRenderbufferOES", P(GL_FramebufferRenderbufferOES)},
+    {"eglGetCurrentContext", P(EGL_GetCurrentContext)},
+    DESKTOP_ONLY("glColor3sv", GL_Color3sv)
+    {"glBlendEquationSeparateiEXT", P(GL_BlendEquationSeparateiEXT)},
+    DESKTOP_ONLY("glIndexfv", GL_Indexfv)
+    DESKTOP_ONLY("glProgramUniform2d", GL_ProgramUniform2d)
+    {"eglSwapBuffersWithDamageKHR", P(EGL_SwapBuffersWithDamageKHR)},
+    {"glMaterialxv", P(GL_Materialxv)},
+    {"glFogf", P(GL_Fogf)},
+    DESKTOP_ONLY("glGetTextureParameterIiv", GL_GetTextureParameterIiv)
+    {"glGetVertexAttribfv", P(GL_GetVertexAttribfv)},
+    DESKTOP_ONLY("glCallLists", GL_CallLists)
+    {"glPushMatrix", P(GL_PushMatrix)},
+    {"glPrimitiveBoundingBoxEXT", P(GL_PrimitiveBoundingBoxEXT)},
+    {"glFramebufferRenderbuffer", P(GL_FramebufferRenderbuffer)},
+    DESKTOP_ONLY("glGetTexImage", GL_GetTexImage)
+    DESKTOP_ONLY("glPointParameteri", GL_PointParameteri)
+    {"glDetachShader", P(GL_DetachShader)},
+    {"glGetTexParameterIivRobustANGLE", P(GL_GetTexParameterIivRobustANGLE)},
+    {"glSamplerParameteri", P(GL_SamplerParameteri)},
+    {"glTexParameterIuiv", P(GL_TexParameterIuiv)},
+    {"glGetTexLevelParameterfvANGLE", P(GL_GetTexLevelParameterfvANGLE)},
+    {"glGetTexParameterIuivEXT", P(GL_GetTexParameterIuivEXT)},
+    {"glProgramUniform4iEXT", P(GL_ProgramUniform4iEXT)},
+    {"glTexGenfOES", P(GL_TexGenfOES)},
+    {"glEndPixelLocalStorageANGLE", P(GL_EndPixelLocalStorageANGLE)},
+    DESKTOP_ONLY("glEdgeFlag", GL_EdgeFlag)
+    DESKTOP_ONLY("glUniform4d", GL_Uniform4d)
+    DESKTOP_ONLY("glGetProgramResourceLocationIndex", GL_GetProgramResourceLocationIndex)
+    DESKTOP_ONLY("glPopName", GL_PopName)
+    {"glDrawElementsInstancedBaseVertexOES", P(GL_DrawElementsInstancedBaseVertexOES)},
+    {"glDepthRangef", P(GL_DepthRangef)},
+    DESKTOP_ONLY("glNamedFramebufferTextureLayer", GL_NamedFramebufferTextureLayer)
+    {"glGetTexParameterIiv", P(GL_GetTexParameterIiv)},
+    {"glTexParameterx", P(GL_TexParameterx)},
+    DESKTOP_ONLY("glColorP4ui", GL_ColorP4ui)
+    DESKTOP_ONLY("glEvalCoord1d", GL_EvalCoord1d)
+    {"glVertexAttribI4uiv", P(GL_VertexAttribI4uiv)},
+    {"glMinSampleShadingOES", P(GL_MinSampleShadingOES)},
+    {"glGetFramebufferAttachmentParameterivRobustANGLE", P(GL_GetFramebufferAttachmentParameterivRobustANGLE)},
+    {"glTexParameterivRobustANGLE", P(GL_TexParameterivRobustANGLE)},
+    {"eglForceGPUSwitchANGLE", P(EGL_ForceGPUSwitchANGLE)},
+    DESKTOP_ONLY("glBindTextures", GL_BindTextures)
+    {"glGetVertexAttribfvRobustANGLE", P(GL_GetVertexAttribfvRobustANGLE)},
+    {"glPauseTransformFeedback", P(GL_PauseTransformFeedback)},
+    DESKTOP_ONLY("glPushAttrib", GL_PushAttrib)
+    {"glVertexAttrib4fv", P(GL_VertexAttrib4fv)},
+    {"glStencilMaskSeparate", P(GL_StencilMaskSeparate)},
+    {"glDrawElementsInstancedBaseVertex", P(GL_DrawElementsInstancedBaseVertex)},
+    {"glGetClipPlanex", P(GL_GetClipPlanex)},
+    {"glLoadIdentity", P(GL_LoadIdentity)},
+    {"glVertexAttrib3f", P(GL_VertexAttrib3f)},
+    DESKTOP_ONLY("glIndexMask", GL_IndexMask)
+    DESKTOP_ONLY("glTexCoordP1uiv", GL_TexCoordP1uiv)
     {"glRequestExtensionANGLE", P(GL_RequestExtensionANGLE)},
-    {"glResumeTransformFeedback", P(GL_ResumeTransformFeedback)},
-    DESKTOP_ONLY("glRotated", GL_Rotated)
-    {"glRotatef", P(GL_Rotatef)},
+    DESKTOP_ONLY("glUniformMatrix2dv", GL_UniformMatrix2dv)
+    {"glProgramParameteri", P(GL_ProgramParameteri)},
+    DESKTOP_ONLY("glMultiTexCoord2dv", GL_MultiTexCoord2dv)
+    {"glGetInteger64i_v", P(GL_GetInteger64i_v)},
+    DESKTOP_ONLY("glMultiTexCoord1d", GL_MultiTexCoord1d)
+    DESKTOP_ONLY("glUniformMatrix4dv", GL_UniformMatrix4dv)
+    DESKTOP_ONLY("glMultiTexCoord2fv", GL_MultiTexCoord2fv)
+    DESKTOP_ONLY("glTexImage2DMultisample", GL_TexImage2DMultisample)
+    DESKTOP_ONLY("glVertexAttribI4bv", GL_VertexAttribI4bv)
+    DESKTOP_ONLY("glTextureBuffer", GL_TextureBuffer)
+    {"glGetPerfMonitorCounterStringAMD", P(GL_GetPerfMonitorCounterStringAMD)},
+    {"glDepthMask", P(GL_DepthMask)},
+    DESKTOP_ONLY("glVertexAttribI1ui", GL_VertexAttribI1ui)
+    {"glCheckFramebufferStatus", P(GL_CheckFramebufferStatus)},
+    {"glGetTexParameterfv", P(GL_GetTexParameterfv)},
     {"glRotatex", P(GL_Rotatex)},
-    {"glSampleCoverage", P(GL_SampleCoverage)},
-    {"glSampleCoveragex", P(GL_SampleCoveragex)},
-    {"glSampleMaski", P(GL_SampleMaski)},
-    {"glSampleMaskiANGLE", P(GL_SampleMaskiANGLE)},
-    {"glSamplerParameterIiv", P(GL_SamplerParameterIiv)},
-    {"glSamplerParameterIivEXT", P(GL_SamplerParameterIivEXT)},
-    {"glSamplerParameterIivOES", P(GL_SamplerParameterIivOES)},
-    {"glSamplerParameterIivRobustANGLE", P(GL_SamplerParameterIivRobustANGLE)},
-    {"glSamplerParameterIuiv", P(GL_SamplerParameterIuiv)},
-    {"glSamplerParameterIuivEXT", P(GL_SamplerParameterIuivEXT)},
+    {"glProgramUniformMatrix4x2fv", P(GL_ProgramUniformMatrix4x2fv)},
+    {"glGetLightxv", P(GL_GetLightxv)},
+    DESKTOP_ONLY("glGetTextureParameteriv", GL_GetTextureParameteriv)
+    {"glPatchParameteriOES", P(GL_PatchParameteriOES)},
+    {"glTexImage3D", P(GL_TexImage3D)},
+    DESKTOP_ONLY("glBindTextureUnit", GL_BindTextureUnit)
+    DESKTOP_ONLY("glProgramUniformMatrix3x2dv", GL_ProgramUniformMatrix3x2dv)
+    DESKTOP_ONLY("glSecondaryColor3iv", GL_SecondaryColor3iv)
+    {"glProgramUniform3ivEXT", P(GL_ProgramUniform3ivEXT)},
+    DESKTOP_ONLY("glVertexAttribLFormat", GL_VertexAttribLFormat)
+    {"glTexEnvfv", P(GL_TexEnvfv)},
+    {"glMapBufferRange", P(GL_MapBufferRange)},
+    {"glFramebufferTexture2DOES", P(GL_FramebufferTexture2DOES)},
+    DESKTOP_ONLY("glColor3usv", GL_Color3usv)
+    {"glBindRenderbuffer", P(GL_BindRenderbuffer)},
+    {"glDeleteFramebuffers", P(GL_DeleteFramebuffers)},
+    {"glGetVertexAttribIuiv", P(GL_GetVertexAttribIuiv)},
+    {"glTexBufferEXT", P(GL_TexBufferEXT)},
+    {"glUseProgram", P(GL_UseProgram)},
+    DESKTOP_ONLY("glFogiv", GL_Fogiv)
+    DESKTOP_ONLY("glGetnUniformdv", GL_GetnUniformdv)
     {"glSamplerParameterIuivOES", P(GL_SamplerParameterIuivOES)},
-    {"glSamplerParameterIuivRobustANGLE", P(GL_SamplerParameterIuivRobustANGLE)},
-    {"glSamplerParameterf", P(GL_SamplerParameterf)},
-    {"glSamplerParameterfv", P(GL_SamplerParameterfv)},
-    {"glSamplerParameterfvRobustANGLE", P(GL_SamplerParameterfvRobustANGLE)},
-    {"glSamplerParameteri", P(GL_SamplerParameteri)},
-    {"glSamplerParameteriv", P(GL_SamplerParameteriv)},
+    DESKTOP_ONLY("glVertex2dv", GL_Vertex2dv)
+    DESKTOP_ONLY("glMultiTexCoord1dv", GL_MultiTexCoord1dv)
+    {"glGetTexImageANGLE", P(GL_GetTexImageANGLE)},
+    {"glGetClipPlanef", P(GL_GetClipPlanef)},
     {"glSamplerParameterivRobustANGLE", P(GL_SamplerParameterivRobustANGLE)},
-    DESKTOP_ONLY("glScaled", GL_Scaled)
-    {"glScalef", P(GL_Scalef)},
-    {"glScalex", P(GL_Scalex)},
-    {"glScissor", P(GL_Scissor)},
-    DESKTOP_ONLY("glScissorArrayv", GL_ScissorArrayv)
-    DESKTOP_ONLY("glScissorIndexed", GL_ScissorIndexed)
-    DESKTOP_ONLY("glScissorIndexedv", GL_ScissorIndexedv)
-    DESKTOP_ONLY("glSecondaryColor3b", GL_SecondaryColor3b)
-    DESKTOP_ONLY("glSecondaryColor3bv", GL_SecondaryColor3bv)
-    DESKTOP_ONLY("glSecondaryColor3d", GL_SecondaryColor3d)
-    DESKTOP_ONLY("glSecondaryColor3dv", GL_SecondaryColor3dv)
-    DESKTOP_ONLY("glSecondaryColor3f", GL_SecondaryColor3f)
-    DESKTOP_ONLY("glSecondaryColor3fv", GL_SecondaryColor3fv)
-    DESKTOP_ONLY("glSecondaryColor3i", GL_SecondaryColor3i)
-    DESKTOP_ONLY("glSecondaryColor3iv", GL_SecondaryColor3iv)
-    DESKTOP_ONLY("glSecondaryColor3s", GL_SecondaryColor3s)
-    DESKTOP_ONLY("glSecondaryColor3sv", GL_SecondaryColor3sv)
-    DESKTOP_ONLY("glSecondaryColor3ub", GL_SecondaryColor3ub)
-    DESKTOP_ONLY("glSecondaryColor3ubv", GL_SecondaryColor3ubv)
-    DESKTOP_ONLY("glSecondaryColor3ui", GL_SecondaryColor3ui)
-    DESKTOP_ONLY("glSecondaryColor3uiv", GL_SecondaryColor3uiv)
-    DESKTOP_ONLY("glSecondaryColor3us", GL_SecondaryColor3us)
-    DESKTOP_ONLY("glSecondaryColor3usv", GL_SecondaryColor3usv)
-    DESKTOP_ONLY("glSecondaryColorP3ui", GL_SecondaryColorP3ui)
-    DESKTOP_ONLY("glSecondaryColorP3uiv", GL_SecondaryColorP3uiv)
-    DESKTOP_ONLY("glSecondaryColorPointer", GL_SecondaryColorPointer)
-    DESKTOP_ONLY("glSelectBuffer", GL_SelectBuffer)
-    {"glSelectPerfMonitorCountersAMD", P(GL_SelectPerfMonitorCountersAMD)},
-    {"glSemaphoreParameterui64vEXT", P(GL_SemaphoreParameterui64vEXT)},
-    {"glSetFenceNV", P(GL_SetFenceNV)},
-    {"glShadeModel", P(GL_ShadeModel)},
-    {"glShaderBinary", P(GL_ShaderBinary)},
-    {"glShaderSource", P(GL_ShaderSource)},
-    DESKTOP_ONLY("glShaderStorageBlockBinding", GL_ShaderStorageBlockBinding)
-    {"glShadingRateQCOM", P(GL_ShadingRateQCOM)},
-    {"glSignalSemaphoreEXT", P(GL_SignalSemaphoreEXT)},
-    DESKTOP_ONLY("glSpecializeShader", GL_SpecializeShader)
-    {"glStartTilingQCOM", P(GL_StartTilingQCOM)},
-    {"glStencilFunc", P(GL_StencilFunc)},
-    {"glStencilFuncSeparate", P(GL_StencilFuncSeparate)},
+    {"glDrawTexsvOES", P(GL_DrawTexsvOES)},
+    DESKTOP_ONLY("glTexGendv", GL_TexGendv)
+    {"glTexParameterf", P(GL_TexParameterf)},
+    {"glDrawRangeElementsBaseVertexEXT", P(GL_DrawRangeElementsBaseVertexEXT)},
+    {"glProgramUniformMatrix3x4fvEXT", P(GL_ProgramUniformMatrix3x4fvEXT)},
+    DESKTOP_ONLY("glEnd", GL_End)
+    DESKTOP_ONLY("glColor3ui", GL_Color3ui)
+    {"glBlendBarrierKHR", P(GL_BlendBarrierKHR)},
+    DESKTOP_ONLY("glVertexAttribI4ubv", GL_VertexAttribI4ubv)
+    DESKTOP_ONLY("glNamedFramebufferReadBuffer", GL_NamedFramebufferReadBuffer)
+    {"glVertexAttrib4f", P(GL_VertexAttrib4f)},
+    {"glProgramUniform2fEXT", P(GL_ProgramUniform2fEXT)},
+    {"glBeginQuery", P(GL_BeginQuery)},
+    {"glGenProgramPipelines", P(GL_GenProgramPipelines)},
+    DESKTOP_ONLY("glMultiTexCoord4s", GL_MultiTexCoord4s)
+    {"glProgramUniformMatrix2fv", P(GL_ProgramUniformMatrix2fv)},
+    {"glVertexBindingDivisor", P(GL_VertexBindingDivisor)},
+    {"glIsVertexArray", P(GL_IsVertexArray)},
+    {"glGetObjectPtrLabelKHR", P(GL_GetObjectPtrLabelKHR)},
+    {"glGetShaderPrecisionFormat", P(GL_GetShaderPrecisionFormat)},
+    DESKTOP_ONLY("glCopyTextureSubImage1D", GL_CopyTextureSubImage1D)
+    {"glGetPerfMonitorCounterDataAMD", P(GL_GetPerfMonitorCounterDataAMD)},
+    {"glCreateShaderProgramv", P(GL_CreateShaderProgramv)},
+    {"glBlendEquationSeparateiOES", P(GL_BlendEquationSeparateiOES)},
+    {"glGetObjectLabelEXT", P(GL_GetObjectLabelEXT)},
     {"glStencilMask", P(GL_StencilMask)},
-    {"glStencilMaskSeparate", P(GL_StencilMaskSeparate)},
-    {"glStencilOp", P(GL_StencilOp)},
-    {"glStencilOpSeparate", P(GL_StencilOpSeparate)},
-    {"glTestFenceNV", P(GL_TestFenceNV)},
-    {"glTexBuffer", P(GL_TexBuffer)},
-    {"glTexBufferEXT", P(GL_TexBufferEXT)},
-    {"glTexBufferOES", P(GL_TexBufferOES)},
-    {"glTexBufferRange", P(GL_TexBufferRange)},
-    {"glTexBufferRangeEXT", P(GL_TexBufferRangeEXT)},
-    {"glTexBufferRangeOES", P(GL_TexBufferRangeOES)},
-    DESKTOP_ONLY("glTexCoord1d", GL_TexCoord1d)
-    DESKTOP_ONLY("glTexCoord1dv", GL_TexCoord1dv)
-    DESKTOP_ONLY("glTexCoord1f", GL_TexCoord1f)
-    DESKTOP_ONLY("glTexCoord1fv", GL_TexCoord1fv)
-    DESKTOP_ONLY("glTexCoord1i", GL_TexCoord1i)
-    DESKTOP_ONLY("glTexCoord1iv", GL_TexCoord1iv)
-    DESKTOP_ONLY("glTexCoord1s", GL_TexCoord1s)
-    DESKTOP_ONLY("glTexCoord1sv", GL_TexCoord1sv)
+    {"glGetPointerv", P(GL_GetPointerv)},
+    {"glGetProgramResourceName", P(GL_GetProgramResourceName)},
+    DESKTOP_ONLY("glGetQueryBufferObjectui64v", GL_GetQueryBufferObjectui64v)
+    {"glStencilFuncSeparate", P(GL_StencilFuncSeparate)},
+    DESKTOP_ONLY("glTexCoord3dv", GL_TexCoord3dv)
+    DESKTOP_ONLY("glIndexs", GL_Indexs)
+    {"glDeleteQueriesEXT", P(GL_DeleteQueriesEXT)},
+    DESKTOP_ONLY("glColor4i", GL_Color4i)
+    DESKTOP_ONLY("glProgramUniform4dv", GL_ProgramUniform4dv)
+    {"glGetnUniformfv", P(GL_GetnUniformfv)},
+    {"glGetFramebufferPixelLocalStorageParameterfvANGLE", P(GL_GetFramebufferPixelLocalStorageParameterfvANGLE)},
+    {"glGetString", P(GL_GetString)},
+    {"glTexStorage1DEXT", P(GL_TexStorage1DEXT)},
+    {"glFogxv", P(GL_Fogxv)},
+    DESKTOP_ONLY("glGetActiveSubroutineName", GL_GetActiveSubroutineName)
+    {"glDrawElements", P(GL_DrawElements)},
+    DESKTOP_ONLY("glSecondaryColor3i", GL_SecondaryColor3i)
     DESKTOP_ONLY("glTexCoord2d", GL_TexCoord2d)
-    DESKTOP_ONLY("glTexCoord2dv", GL_TexCoord2dv)
-    DESKTOP_ONLY("glTexCoord2f", GL_TexCoord2f)
+    {"glPatchParameteriEXT", P(GL_PatchParameteriEXT)},
+    {"ANGLEGetDisplayPlatform", P(ANGLEGetDisplayPlatform)},
+    {"glGetSemaphoreParameterui64vEXT", P(GL_GetSemaphoreParameterui64vEXT)},
+    DESKTOP_ONLY("glPixelTransferf", GL_PixelTransferf)
+    DESKTOP_ONLY("glGetTextureParameterfv", GL_GetTextureParameterfv)
+    {"glProgramUniform4uiEXT", P(GL_ProgramUniform4uiEXT)},
+    {"eglGetConfigs", P(EGL_GetConfigs)},
+    {"glGenSamplers", P(GL_GenSamplers)},
+    {"glProgramUniform2fvEXT", P(GL_ProgramUniform2fvEXT)},
+    {"glDeleteRenderbuffersOES", P(GL_DeleteRenderbuffersOES)},
+    DESKTOP_ONLY("glTexCoord1sv", GL_TexCoord1sv)
+    DESKTOP_ONLY("glColor3ub", GL_Color3ub)
+    {"glGenerateMipmapOES", P(GL_GenerateMipmapOES)},
+    {"glGetBooleani_v", P(GL_GetBooleani_v)},
+    {"eglGetSyncAttrib", P(EGL_GetSyncAttrib)},
+    {"glMultiDrawElementsInstancedANGLE", P(GL_MultiDrawElementsInstancedANGLE)},
+    {"glColorMaskiEXT", P(GL_ColorMaskiEXT)},
+    DESKTOP_ONLY("glVertexAttribLPointer", GL_VertexAttribLPointer)
+    {"glProgramUniform1ivEXT", P(GL_ProgramUniform1ivEXT)},
+    {"eglInitialize", P(EGL_Initialize)},
+    {"glGenRenderbuffersOES", P(GL_GenRenderbuffersOES)},
+    {"glGetTexEnvfv", P(GL_GetTexEnvfv)},
+    DESKTOP_ONLY("glPopClientAttrib", GL_PopClientAttrib)
+    DESKTOP_ONLY("glBindSamplers", GL_BindSamplers)
+    {"glIsVertexArrayOES", P(GL_IsVertexArrayOES)},
     DESKTOP_ONLY("glTexCoord2fv", GL_TexCoord2fv)
-    DESKTOP_ONLY("glTexCoord2i", GL_TexCoord2i)
-    DESKTOP_ONLY("glTexCoord2iv", GL_TexCoord2iv)
-    DESKTOP_ONLY("glTexCoord2s", GL_TexCoord2s)
-    DESKTOP_ONLY("glTexCoord2sv", GL_TexCoord2sv)
-    DESKTOP_ONLY("glTexCoord3d", GL_TexCoord3d)
-    DESKTOP_ONLY("glTexCoord3dv", GL_TexCoord3dv)
-    DESKTOP_ONLY("glTexCoord3f", GL_TexCoord3f)
-    DESKTOP_ONLY("glTexCoord3fv", GL_TexCoord3fv)
-    DESKTOP_ONLY("glTexCoord3i", GL_TexCoord3i)
-    DESKTOP_ONLY("glTexCoord3iv", GL_TexCoord3iv)
-    DESKTOP_ONLY("glTexCoord3s", GL_TexCoord3s)
-    DESKTOP_ONLY("glTexCoord3sv", GL_TexCoord3sv)
-    DESKTOP_ONLY("glTexCoord4d", GL_TexCoord4d)
-    DESKTOP_ONLY("glTexCoord4dv", GL_TexCoord4dv)
-    DESKTOP_ONLY("glTexCoord4f", GL_TexCoord4f)
-    DESKTOP_ONLY("glTexCoord4fv", GL_TexCoord4fv)
-    DESKTOP_ONLY("glTexCoord4i", GL_TexCoord4i)
-    DESKTOP_ONLY("glTexCoord4iv", GL_TexCoord4iv)
-    DESKTOP_ONLY("glTexCoord4s", GL_TexCoord4s)
-    DESKTOP_ONLY("glTexCoord4sv", GL_TexCoord4sv)
-    DESKTOP_ONLY("glTexCoordP1ui", GL_TexCoordP1ui)
-    DESKTOP_ONLY("glTexCoordP1uiv", GL_TexCoordP1uiv)
-    DESKTOP_ONLY("glTexCoordP2ui", GL_TexCoordP2ui)
-    DESKTOP_ONLY("glTexCoordP2uiv", GL_TexCoordP2uiv)
-    DESKTOP_ONLY("glTexCoordP3ui", GL_TexCoordP3ui)
-    DESKTOP_ONLY("glTexCoordP3uiv", GL_TexCoordP3uiv)
-    DESKTOP_ONLY("glTexCoordP4ui", GL_TexCoordP4ui)
-    DESKTOP_ONLY("glTexCoordP4uiv", GL_TexCoordP4uiv)
-    {"glTexCoordPointer", P(GL_TexCoordPointer)},
-    {"glTexEnvf", P(GL_TexEnvf)},
-    {"glTexEnvfv", P(GL_TexEnvfv)},
-    {"glTexEnvi", P(GL_TexEnvi)},
-    {"glTexEnviv", P(GL_TexEnviv)},
-    {"glTexEnvx", P(GL_TexEnvx)},
-    {"glTexEnvxv", P(GL_TexEnvxv)},
-    DESKTOP_ONLY("glTexGend", GL_TexGend)
-    DESKTOP_ONLY("glTexGendv", GL_TexGendv)
-    DESKTOP_ONLY("glTexGenf", GL_TexGenf)
-    {"glTexGenfOES", P(GL_TexGenfOES)},
-    DESKTOP_ONLY("glTexGenfv", GL_TexGenfv)
+    {"glGenBuffers", P(GL_GenBuffers)},
+    {"glGetTransformFeedbackVarying", P(GL_GetTransformFeedbackVarying)},
+    DESKTOP_ONLY("glVertexAttrib4Nubv", GL_VertexAttrib4Nubv)
+    {"glGetnUniformuivRobustANGLE", P(GL_GetnUniformuivRobustANGLE)},
+    DESKTOP_ONLY("glVertex2f", GL_Vertex2f)
+    DESKTOP_ONLY("glTransformFeedbackBufferBase", GL_TransformFeedbackBufferBase)
+    {"glBeginPerfMonitorAMD", P(GL_BeginPerfMonitorAMD)},
+    {"glUniform4ui", P(GL_Uniform4ui)},
+    DESKTOP_ONLY("glRotated", GL_Rotated)
+    DESKTOP_ONLY("glEvalCoord1fv", GL_EvalCoord1fv)
+    DESKTOP_ONLY("glVertexAttrib4bv", GL_VertexAttrib4bv)
+    {"glGetActiveUniform", P(GL_GetActiveUniform)},
     {"glTexGenfvOES", P(GL_TexGenfvOES)},
-    DESKTOP_ONLY("glTexGeni", GL_TexGeni)
-    {"glTexGeniOES", P(GL_TexGeniOES)},
-    DESKTOP_ONLY("glTexGeniv", GL_TexGeniv)
-    {"glTexGenivOES", P(GL_TexGenivOES)},
-    {"glTexGenxOES", P(GL_TexGenxOES)},
-    {"glTexGenxvOES", P(GL_TexGenxvOES)},
-    DESKTOP_ONLY("glTexImage1D", GL_TexImage1D)
-    {"glTexImage2D", P(GL_TexImage2D)},
-    {"glTexImage2DExternalANGLE", P(GL_TexImage2DExternalANGLE)},
-    DESKTOP_ONLY("glTexImage2DMultisample", GL_TexImage2DMultisample)
-    {"glTexImage2DRobustANGLE", P(GL_TexImage2DRobustANGLE)},
-    {"glTexImage3D", P(GL_TexImage3D)},
-    DESKTOP_ONLY("glTexImage3DMultisample", GL_TexImage3DMultisample)
-    {"glTexImage3DOES", P(GL_TexImage3DOES)},
-    {"glTexImage3DRobustANGLE", P(GL_TexImage3DRobustANGLE)},
-    {"glTexParameterIiv", P(GL_TexParameterIiv)},
-    {"glTexParameterIivEXT", P(GL_TexParameterIivEXT)},
-    {"glTexParameterIivOES", P(GL_TexParameterIivOES)},
-    {"glTexParameterIivRobustANGLE", P(GL_TexParameterIivRobustANGLE)},
-    {"glTexParameterIuiv", P(GL_TexParameterIuiv)},
-    {"glTexParameterIuivEXT", P(GL_TexParameterIuivEXT)},
-    {"glTexParameterIuivOES", P(GL_TexParameterIuivOES)},
-    {"glTexParameterIuivRobustANGLE", P(GL_TexParameterIuivRobustANGLE)},
-    {"glTexParameterf", P(GL_TexParameterf)},
-    {"glTexParameterfv", P(GL_TexParameterfv)},
-    {"glTexParameterfvRobustANGLE", P(GL_TexParameterfvRobustANGLE)},
-    {"glTexParameteri", P(GL_TexParameteri)},
-    {"glTexParameteriv", P(GL_TexParameteriv)},
-    {"glTexParameterivRobustANGLE", P(GL_TexParameterivRobustANGLE)},
-    {"glTexParameterx", P(GL_TexParameterx)},
-    {"glTexParameterxv", P(GL_TexParameterxv)},
-    DESKTOP_ONLY("glTexStorage1D", GL_TexStorage1D)
-    {"glTexStorage1DEXT", P(GL_TexStorage1DEXT)},
-    {"glTexStorage2D", P(GL_TexStorage2D)},
-    {"glTexStorage2DEXT", P(GL_TexStorage2DEXT)},
-    {"glTexStorage2DMultisample", P(GL_TexStorage2DMultisample)},
-    {"glTexStorage2DMultisampleANGLE", P(GL_TexStorage2DMultisampleANGLE)},
-    {"glTexStorage3D", P(GL_TexStorage3D)},
-    {"glTexStorage3DEXT", P(GL_TexStorage3DEXT)},
-    {"glTexStorage3DMultisample", P(GL_TexStorage3DMultisample)},
-    {"glTexStorage3DMultisampleOES", P(GL_TexStorage3DMultisampleOES)},
-    {"glTexStorageMem2DEXT", P(GL_TexStorageMem2DEXT)},
-    {"glTexStorageMem2DMultisampleEXT", P(GL_TexStorageMem2DMultisampleEXT)},
-    {"glTexStorageMem3DEXT", P(GL_TexStorageMem3DEXT)},
-    {"glTexStorageMem3DMultisampleEXT", P(GL_TexStorageMem3DMultisampleEXT)},
-    {"glTexStorageMemFlags2DANGLE", P(GL_TexStorageMemFlags2DANGLE)},
-    {"glTexStorageMemFlags2DMultisampleANGLE", P(GL_TexStorageMemFlags2DMultisampleANGLE)},
-    {"glTexStorageMemFlags3DANGLE", P(GL_TexStorageMemFlags3DANGLE)},
-    {"glTexStorageMemFlags3DMultisampleANGLE", P(GL_TexStorageMemFlags3DMultisampleANGLE)},
-    DESKTOP_ONLY("glTexSubImage1D", GL_TexSubImage1D)
+    {"glGetProgramResourceiv", P(GL_GetProgramResourceiv)},
+    DESKTOP_ONLY("glAreTexturesResident", GL_AreTexturesResident)
+    {"eglDestroySurface", P(EGL_DestroySurface)},
+    DESKTOP_ONLY("glMultiTexCoord4fv", GL_MultiTexCoord4fv)
+    {"glGenVertexArraysOES", P(GL_GenVertexArraysOES)},
+    {"glDeleteMemoryObjectsEXT", P(GL_DeleteMemoryObjectsEXT)},
+    DESKTOP_ONLY("glRectfv", GL_Rectfv)
+    DESKTOP_ONLY("glNormalP3ui", GL_NormalP3ui)
+    {"glGetActiveUniformBlockivRobustANGLE", P(GL_GetActiveUniformBlockivRobustANGLE)},
+    {"eglStreamConsumerReleaseKHR", P(EGL_StreamConsumerReleaseKHR)},
+    DESKTOP_ONLY("glTexCoord4iv", GL_TexCoord4iv)
+    DESKTOP_ONLY("glTexGend", GL_TexGend)
+    {"glActiveShaderProgram", P(GL_ActiveShaderProgram)},
+    {"glDrawRangeElements", P(GL_DrawRangeElements)},
     {"glTexSubImage2D", P(GL_TexSubImage2D)},
-    {"glTexSubImage2DRobustANGLE", P(GL_TexSubImage2DRobustANGLE)},
-    {"glTexSubImage3D", P(GL_TexSubImage3D)},
+    DESKTOP_ONLY("glGetnSeparableFilter", GL_GetnSeparableFilter)
+    {"glGetQueryObjectui64vRobustANGLE", P(GL_GetQueryObjectui64vRobustANGLE)},
+    {"glEGLImageTargetTexStorageEXT", P(GL_EGLImageTargetTexStorageEXT)},
+    DESKTOP_ONLY("glProgramUniformMatrix4dv", GL_ProgramUniformMatrix4dv)
+    DESKTOP_ONLY("glProgramUniform3dv", GL_ProgramUniform3dv)
+    DESKTOP_ONLY("glIndexdv", GL_Indexdv)
+    {"eglGetCompositorTimingANDROID", P(EGL_GetCompositorTimingANDROID)},
+    DESKTOP_ONLY("glMultiTexCoord1s", GL_MultiTexCoord1s)
+    {"glQueryMatrixxOES", P(GL_QueryMatrixxOES)},
+    {"glGetSamplerParameteriv", P(GL_GetSamplerParameteriv)},
+    {"eglReacquireHighPowerGPUANGLE", P(EGL_ReacquireHighPowerGPUANGLE)},
+    {"glCheckFramebufferStatusOES", P(GL_CheckFramebufferStatusOES)},
+    {"glCopySubTexture3DANGLE", P(GL_CopySubTexture3DANGLE)},
+    {"glClear", P(GL_Clear)},
+    DESKTOP_ONLY("glGetTexGeniv", GL_GetTexGeniv)
+    DESKTOP_ONLY("glGetNamedBufferParameteri64v", GL_GetNamedBufferParameteri64v)
+    {"glImportMemoryFdEXT", P(GL_ImportMemoryFdEXT)},
     {"glTexSubImage3DOES", P(GL_TexSubImage3DOES)},
-    {"glTexSubImage3DRobustANGLE", P(GL_TexSubImage3DRobustANGLE)},
+    DESKTOP_ONLY("glRectsv", GL_Rectsv)
+    {"glPointParameterf", P(GL_PointParameterf)},
+    DESKTOP_ONLY("glMap1f", GL_Map1f)
+    {"eglStreamConsumerAcquireKHR", P(EGL_StreamConsumerAcquireKHR)},
+    {"glGetTexLevelParameterfvRobustANGLE", P(GL_GetTexLevelParameterfvRobustANGLE)},
+    {"glCopyBufferSubData", P(GL_CopyBufferSubData)},
+    {"glIsSync", P(GL_IsSync)},
+    {"glInvalidateFramebuffer", P(GL_InvalidateFramebuffer)},
+    DESKTOP_ONLY("glUniform4dv", GL_Uniform4dv)
+    {"glVertexAttribI4ui", P(GL_VertexAttribI4ui)},
+    {"glBlendFuncSeparateiEXT", P(GL_BlendFuncSeparateiEXT)},
+    DESKTOP_ONLY("glVertexAttribL2d", GL_VertexAttribL2d)
+    {"glEnableiEXT", P(GL_EnableiEXT)},
+    {"glProgramUniform4ui", P(GL_ProgramUniform4ui)},
+    {"glGetIntegervRobustANGLE", P(GL_GetIntegervRobustANGLE)},
+    DESKTOP_ONLY("glVertex3d", GL_Vertex3d)
+    {"glBlendEquationiOES", P(GL_BlendEquationiOES)},
+    DESKTOP_ONLY("glTexCoord2s", GL_TexCoord2s)
+    DESKTOP_ONLY("glRasterPos3f", GL_RasterPos3f)
+    {"glObjectLabel", P(GL_ObjectLabel)},
+    {"eglTerminate", P(EGL_Terminate)},
+    DESKTOP_ONLY("glCompressedTextureSubImage2D", GL_CompressedTextureSubImage2D)
+    DESKTOP_ONLY("glCopyPixels", GL_CopyPixels)
+    {"glGetInteger64i_vRobustANGLE", P(GL_GetInteger64i_vRobustANGLE)},
+    DESKTOP_ONLY("glVertexP2ui", GL_VertexP2ui)
+    {"glDeleteProgramPipelines", P(GL_DeleteProgramPipelines)},
+    {"glLoadMatrixx", P(GL_LoadMatrixx)},
+    DESKTOP_ONLY("glGetTextureImage", GL_GetTextureImage)
+    {"glTranslatef", P(GL_Translatef)},
+    {"eglGetCurrentDisplay", P(EGL_GetCurrentDisplay)},
+    {"glGetFramebufferPixelLocalStorageParameterivANGLE", P(GL_GetFramebufferPixelLocalStorageParameterivANGLE)},
+    DESKTOP_ONLY("glBindFragDataLocationIndexed", GL_BindFragDataLocationIndexed)
+    {"glUniformMatrix2x3fv", P(GL_UniformMatrix2x3fv)},
+    DESKTOP_ONLY("glLineStipple", GL_LineStipple)
+    {"glAlphaFunc", P(GL_AlphaFunc)},
+    DESKTOP_ONLY("glUniformMatrix4x3dv", GL_UniformMatrix4x3dv)
     DESKTOP_ONLY("glTextureBarrier", GL_TextureBarrier)
-    DESKTOP_ONLY("glTextureBuffer", GL_TextureBuffer)
-    DESKTOP_ONLY("glTextureBufferRange", GL_TextureBufferRange)
-    {"glTextureFoveationParametersQCOM", P(GL_TextureFoveationParametersQCOM)},
-    DESKTOP_ONLY("glTextureParameterIiv", GL_TextureParameterIiv)
-    DESKTOP_ONLY("glTextureParameterIuiv", GL_TextureParameterIuiv)
-    DESKTOP_ONLY("glTextureParameterf", GL_TextureParameterf)
-    DESKTOP_ONLY("glTextureParameterfv", GL_TextureParameterfv)
-    DESKTOP_ONLY("glTextureParameteri", GL_TextureParameteri)
-    DESKTOP_ONLY("glTextureParameteriv", GL_TextureParameteriv)
-    DESKTOP_ONLY("glTextureStorage1D", GL_TextureStorage1D)
-    DESKTOP_ONLY("glTextureStorage2D", GL_TextureStorage2D)
-    DESKTOP_ONLY("glTextureStorage2DMultisample", GL_TextureStorage2DMultisample)
-    DESKTOP_ONLY("glTextureStorage3D", GL_TextureStorage3D)
-    DESKTOP_ONLY("glTextureStorage3DMultisample", GL_TextureStorage3DMultisample)
-    DESKTOP_ONLY("glTextureSubImage1D", GL_TextureSubImage1D)
-    DESKTOP_ONLY("glTextureSubImage2D", GL_TextureSubImage2D)
-    DESKTOP_ONLY("glTextureSubImage3D", GL_TextureSubImage3D)
-    DESKTOP_ONLY("glTextureView", GL_TextureView)
-    DESKTOP_ONLY("glTransformFeedbackBufferBase", GL_TransformFeedbackBufferBase)
-    DESKTOP_ONLY("glTransformFeedbackBufferRange", GL_TransformFeedbackBufferRange)
-    {"glTransformFeedbackVaryings", P(GL_TransformFeedbackVaryings)},
+    {"eglWaitSync", P(EGL_WaitSync)},
+    {"glResumeTransformFeedback", P(GL_ResumeTransformFeedback)},
+    {"glUseProgramStagesEXT", P(GL_UseProgramStagesEXT)},
+    {"glPixelStorei", P(GL_PixelStorei)},
+    DESKTOP_ONLY("glSecondaryColor3s", GL_SecondaryColor3s)
+    {"eglWaitClient", P(EGL_WaitClient)},
+    DESKTOP_ONLY("glMultiTexCoord3d", GL_MultiTexCoord3d)
+    {"glClearColorx", P(GL_ClearColorx)},
+    DESKTOP_ONLY("glProgramUniform1d", GL_ProgramUniform1d)
+    {"glStencilOpSeparate", P(GL_StencilOpSeparate)},
+    DESKTOP_ONLY("glNamedBufferSubData", GL_NamedBufferSubData)
+    DESKTOP_ONLY("glUniformSubroutinesuiv", GL_UniformSubroutinesuiv)
+    {"glDeleteFencesNV", P(GL_DeleteFencesNV)},
+    {"glObjectPtrLabel", P(GL_ObjectPtrLabel)},
+    {"glProgramUniform4ivEXT", P(GL_ProgramUniform4ivEXT)},
+    DESKTOP_ONLY("glVertex2d", GL_Vertex2d)
+    {"glGetStringi", P(GL_GetStringi)},
+    {"glFramebufferTexture2D", P(GL_FramebufferTexture2D)},
+    {"glEndTilingQCOM", P(GL_EndTilingQCOM)},
+    DESKTOP_ONLY("glColor4sv", GL_Color4sv)
+    {"glTexStorageMem3DMultisampleEXT", P(GL_TexStorageMem3DMultisampleEXT)},
+    {"eglQueryDisplayAttribEXT", P(EGL_QueryDisplayAttribEXT)},
+    {"glOrthox", P(GL_Orthox)},
+    DESKTOP_ONLY("glCreateTransformFeedbacks", GL_CreateTransformFeedbacks)
+    DESKTOP_ONLY("glEndQueryIndexed", GL_EndQueryIndexed)
+    DESKTOP_ONLY("glDepthRangeArrayv", GL_DepthRangeArrayv)
+    DESKTOP_ONLY("glMultiDrawArrays", GL_MultiDrawArrays)
+    DESKTOP_ONLY("glColor4iv", GL_Color4iv)
+    {"glTexStorage2DEXT", P(GL_TexStorage2DEXT)},
+    {"glColorMaskiOES", P(GL_ColorMaskiOES)},
+    DESKTOP_ONLY("glWindowPos2iv", GL_WindowPos2iv)
+    {"glDepthFunc", P(GL_DepthFunc)},
+    {"glGetFloatv", P(GL_GetFloatv)},
+    {"glReadnPixelsRobustANGLE", P(GL_ReadnPixelsRobustANGLE)},
+    {"glGetQueryObjectuiv", P(GL_GetQueryObjectuiv)},
+    {"glCopyTexture3DANGLE", P(GL_CopyTexture3DANGLE)},
+    {"glEndQueryEXT", P(GL_EndQueryEXT)},
+    {"ANGLEResetDisplayPlatform", P(ANGLEResetDisplayPlatform)},
+    {"glGetTexParameterivRobustANGLE", P(GL_GetTexParameterivRobustANGLE)},
+    {"eglQueryStringiANGLE", P(EGL_QueryStringiANGLE)},
+    {"glClearDepthx", P(GL_ClearDepthx)},
+    DESKTOP_ONLY("glWindowPos3f", GL_WindowPos3f)
+    DESKTOP_ONLY("glSecondaryColor3d", GL_SecondaryColor3d)
+    {"glDeleteSync", P(GL_DeleteSync)},
+    DESKTOP_ONLY("glMultiDrawArraysIndirectCount", GL_MultiDrawArraysIndirectCount)
+    {"glGetQueryObjectivRobustANGLE", P(GL_GetQueryObjectivRobustANGLE)},
+    {"glIsRenderbuffer", P(GL_IsRenderbuffer)},
+    DESKTOP_ONLY("glColor4fv", GL_Color4fv)
+    DESKTOP_ONLY("glEvalCoord2d", GL_EvalCoord2d)
+    {"glProgramUniformMatrix4x3fvEXT", P(GL_ProgramUniformMatrix4x3fvEXT)},
+    DESKTOP_ONLY("glEndConditionalRender", GL_EndConditionalRender)
+    {"glGetRenderbufferParameterivOES", P(GL_GetRenderbufferParameterivOES)},
+    {"glGetPerfMonitorCounterInfoAMD", P(GL_GetPerfMonitorCounterInfoAMD)},
+    {"glGetFramebufferParameteriv", P(GL_GetFramebufferParameteriv)},
+    DESKTOP_ONLY("glGetnTexImage", GL_GetnTexImage)
+    {"glClearBufferuiv", P(GL_ClearBufferuiv)},
+    DESKTOP_ONLY("glCallList", GL_CallList)
+    {"glPointParameterfv", P(GL_PointParameterfv)},
+    DESKTOP_ONLY("glDrawTransformFeedbackInstanced", GL_DrawTransformFeedbackInstanced)
+    DESKTOP_ONLY("glMultiTexCoord3iv", GL_MultiTexCoord3iv)
+    DESKTOP_ONLY("glProgramUniform1dv", GL_ProgramUniform1dv)
+    DESKTOP_ONLY("glTexCoordP2uiv", GL_TexCoordP2uiv)
+    {"glGetVertexAttribPointerv", P(GL_GetVertexAttribPointerv)},
+    {"glGetAttribLocation", P(GL_GetAttribLocation)},
+    {"eglGetFrameTimestampSupportedANDROID", P(EGL_GetFrameTimestampSupportedANDROID)},
+    DESKTOP_ONLY("glTexCoord4f", GL_TexCoord4f)
+    DESKTOP_ONLY("glNormal3s", GL_Normal3s)
+    {"glIsProgramPipelineEXT", P(GL_IsProgramPipelineEXT)},
+    {"eglPrepareSwapBuffersANGLE", P(EGL_PrepareSwapBuffersANGLE)},
+    {"glSampleCoveragex", P(GL_SampleCoveragex)},
+    {"glVertexAttrib2fv", P(GL_VertexAttrib2fv)},
+    {"glColor4x", P(GL_Color4x)},
+    {"glFramebufferMemorylessPixelLocalStorageANGLE", P(GL_FramebufferMemorylessPixelLocalStorageANGLE)},
+    {"glDebugMessageCallback", P(GL_DebugMessageCallback)},
+    {"glProgramUniform1uivEXT", P(GL_ProgramUniform1uivEXT)},
+    DESKTOP_ONLY("glGetFragDataIndex", GL_GetFragDataIndex)
+    {"glWeightPointerOES", P(GL_WeightPointerOES)},
+    {"glGetError", P(GL_GetError)},
+    {"glDrawTexivOES", P(GL_DrawTexivOES)},
+    {"glGetFramebufferPixelLocalStorageParameterfvRobustANGLE", P(GL_GetFramebufferPixelLocalStorageParameterfvRobustANGLE)},
+    {"eglQueryDisplayAttribANGLE", P(EGL_QueryDisplayAttribANGLE)},
+    DESKTOP_ONLY("glVertex4fv", GL_Vertex4fv)
+    DESKTOP_ONLY("glFramebufferTexture3D", GL_FramebufferTexture3D)
+    {"glFramebufferTexturePixelLocalStorageANGLE", P(GL_FramebufferTexturePixelLocalStorageANGLE)},
+    {"glInsertEventMarkerEXT", P(GL_InsertEventMarkerEXT)},
+    {"eglCreateSync", P(EGL_CreateSync)},
+    {"glGenTransformFeedbacks", P(GL_GenTransformFeedbacks)},
+    {"glDrawArraysInstancedBaseInstanceANGLE", P(GL_DrawArraysInstancedBaseInstanceANGLE)},
+    DESKTOP_ONLY("glTexCoordP4ui", GL_TexCoordP4ui)
+    {"glPrimitiveBoundingBoxOES", P(GL_PrimitiveBoundingBoxOES)},
+    DESKTOP_ONLY("glUniformMatrix3dv", GL_UniformMatrix3dv)
+    {"eglCreateImageKHR", P(EGL_CreateImageKHR)},
+    {"glCompressedTexImage2DRobustANGLE", P(GL_CompressedTexImage2DRobustANGLE)},
+    DESKTOP_ONLY("glClearTexSubImage", GL_ClearTexSubImage)
+    {"glGetnUniformivEXT", P(GL_GetnUniformivEXT)},
+    DESKTOP_ONLY("glIndexsv", GL_Indexsv)
+    {"glClearBufferfi", P(GL_ClearBufferfi)},
+    DESKTOP_ONLY("glProgramUniform2dv", GL_ProgramUniform2dv)
+    {"eglSetDamageRegionKHR", P(EGL_SetDamageRegionKHR)},
+    {"glDrawArraysInstancedEXT", P(GL_DrawArraysInstancedEXT)},
+    {"glCullFace", P(GL_CullFace)},
+    {"glBindUniformLocationCHROMIUM", P(GL_BindUniformLocationCHROMIUM)},
+    {"glTexBufferRange", P(GL_TexBufferRange)},
+    {"glLoadPaletteFromModelViewMatrixOES", P(GL_LoadPaletteFromModelViewMatrixOES)},
+    {"glGetSamplerParameterIivOES", P(GL_GetSamplerParameterIivOES)},
+    DESKTOP_ONLY("glPushName", GL_PushName)
+    DESKTOP_ONLY("glVertexAttribI3i", GL_VertexAttribI3i)
+    DESKTOP_ONLY("glGetNamedFramebufferAttachmentParameteriv", GL_GetNamedFramebufferAttachmentParameteriv)
+    {"glMaterialfv", P(GL_Materialfv)},
+    DESKTOP_ONLY("glUniformMatrix2x3dv", GL_UniformMatrix2x3dv)
+    {"glGenRenderbuffers", P(GL_GenRenderbuffers)},
+    {"glBlendFuncSeparate", P(GL_BlendFuncSeparate)},
+    {"glDisableExtensionANGLE", P(GL_DisableExtensionANGLE)},
+    {"glProgramUniformMatrix4x3fv", P(GL_ProgramUniformMatrix4x3fv)},
+    {"glNormal3f", P(GL_Normal3f)},
+    DESKTOP_ONLY("glBindVertexBuffers", GL_BindVertexBuffers)
+    DESKTOP_ONLY("glNormal3dv", GL_Normal3dv)
+    DESKTOP_ONLY("glVertexAttrib4s", GL_VertexAttrib4s)
+    DESKTOP_ONLY("glCompressedTextureSubImage1D", GL_CompressedTextureSubImage1D)
+    DESKTOP_ONLY("glMultiTexCoord3dv", GL_MultiTexCoord3dv)
+    {"glCopyTexSubImage3D", P(GL_CopyTexSubImage3D)},
+    {"glCompressedTexSubImage3DRobustANGLE", P(GL_CompressedTexSubImage3DRobustANGLE)},
+    {"glProgramUniformMatrix2x4fvEXT", P(GL_ProgramUniformMatrix2x4fvEXT)},
+    DESKTOP_ONLY("glDrawTransformFeedbackStreamInstanced", GL_DrawTransformFeedbackStreamInstanced)
+    {"glDrawElementsIndirect", P(GL_DrawElementsIndirect)},
+    DESKTOP_ONLY("glEvalCoord2fv", GL_EvalCoord2fv)
+    DESKTOP_ONLY("glVertexAttribP3ui", GL_VertexAttribP3ui)
+    DESKTOP_ONLY("glVertexAttrib1d", GL_VertexAttrib1d)
+    {"glClipControlEXT", P(GL_ClipControlEXT)},
     DESKTOP_ONLY("glTranslated", GL_Translated)
-    {"glTranslatef", P(GL_Translatef)},
-    {"glTranslatex", P(GL_Translatex)},
-    DESKTOP_ONLY("glUniform1d", GL_Uniform1d)
-    DESKTOP_ONLY("glUniform1dv", GL_Uniform1dv)
-    {"glUniform1f", P(GL_Uniform1f)},
-    {"glUniform1fv", P(GL_Uniform1fv)},
-    {"glUniform1i", P(GL_Uniform1i)},
-    {"glUniform1iv", P(GL_Uniform1iv)},
-    {"glUniform1ui", P(GL_Uniform1ui)},
-    {"glUniform1uiv", P(GL_Uniform1uiv)},
+    {"glDebugMessageControlKHR", P(GL_DebugMessageControlKHR)},
+    {"glMultiDrawArraysANGLE", P(GL_MultiDrawArraysANGLE)},
+    {"glVertexAttribI4i", P(GL_VertexAttribI4i)},
+    {"glBlitFramebufferNV", P(GL_BlitFramebufferNV)},
+    DESKTOP_ONLY("glPolygonStipple", GL_PolygonStipple)
+    {"eglDestroySync", P(EGL_DestroySync)},
     DESKTOP_ONLY("glUniform2d", GL_Uniform2d)
-    DESKTOP_ONLY("glUniform2dv", GL_Uniform2dv)
-    {"glUniform2f", P(GL_Uniform2f)},
-    {"glUniform2fv", P(GL_Uniform2fv)},
-    {"glUniform2i", P(GL_Uniform2i)},
-    {"glUniform2iv", P(GL_Uniform2iv)},
-    {"glUniform2ui", P(GL_Uniform2ui)},
-    {"glUniform2uiv", P(GL_Uniform2uiv)},
-    DESKTOP_ONLY("glUniform3d", GL_Uniform3d)
-    DESKTOP_ONLY("glUniform3dv", GL_Uniform3dv)
-    {"glUniform3f", P(GL_Uniform3f)},
-    {"glUniform3fv", P(GL_Uniform3fv)},
-    {"glUniform3i", P(GL_Uniform3i)},
-    {"glUniform3iv", P(GL_Uniform3iv)},
-    {"glUniform3ui", P(GL_Uniform3ui)},
-    {"glUniform3uiv", P(GL_Uniform3uiv)},
-    DESKTOP_ONLY("glUniform4d", GL_Uniform4d)
-    DESKTOP_ONLY("glUniform4dv", GL_Uniform4dv)
-    {"glUniform4f", P(GL_Uniform4f)},
-    {"glUniform4fv", P(GL_Uniform4fv)},
+    {"glBindProgramPipeline", P(GL_BindProgramPipeline)},
+    {"eglBindTexImage", P(EGL_BindTexImage)},
+    {"glProgramUniform3iv", P(GL_ProgramUniform3iv)},
+    DESKTOP_ONLY("glVertex2iv", GL_Vertex2iv)
+    DESKTOP_ONLY("glCreateVertexArrays", GL_CreateVertexArrays)
     {"glUniform4i", P(GL_Uniform4i)},
+    {"eglGetNextFrameIdANDROID", P(EGL_GetNextFrameIdANDROID)},
+    {"glFlush", P(GL_Flush)},
+    DESKTOP_ONLY("glRasterPos4sv", GL_RasterPos4sv)
+    DESKTOP_ONLY("glTexImage3DMultisample", GL_TexImage3DMultisample)
+    {"glDispatchCompute", P(GL_DispatchCompute)},
+    {"glBlendFunc", P(GL_BlendFunc)},
+    {"glTexParameterIiv", P(GL_TexParameterIiv)},
+    {"glPointParameterxv", P(GL_PointParameterxv)},
+    {"glDeleteFramebuffersOES", P(GL_DeleteFramebuffersOES)},
+    {"eglReleaseTexImage", P(EGL_ReleaseTexImage)},
+    DESKTOP_ONLY("glGetNamedRenderbufferParameteriv", GL_GetNamedRenderbufferParameteriv)
+    {"glProgramUniform2i", P(GL_ProgramUniform2i)},
+    DESKTOP_ONLY("glEdgeFlagv", GL_EdgeFlagv)
+    DESKTOP_ONLY("glClearIndex", GL_ClearIndex)
+    {"glProgramUniform1fEXT", P(GL_ProgramUniform1fEXT)},
+    {"glProgramUniform4fvEXT", P(GL_ProgramUniform4fvEXT)},
+    {"eglStreamConsumerGLTextureExternalAttribsNV", P(EGL_StreamConsumerGLTextureExternalAttribsNV)},
+    DESKTOP_ONLY("glCompressedTexSubImage1D", GL_CompressedTexSubImage1D)
+    {"glFramebufferFoveationParametersQCOM", P(GL_FramebufferFoveationParametersQCOM)},
+    {"glRenderbufferStorageOES", P(GL_RenderbufferStorageOES)},
+    DESKTOP_ONLY("glRasterPos4f", GL_RasterPos4f)
+    DESKTOP_ONLY("glTexCoord3fv", GL_TexCoord3fv)
+    {"eglCreatePlatformPixmapSurface", P(EGL_CreatePlatformPixmapSurface)},
+    DESKTOP_ONLY("glColor4usv", GL_Color4usv)
+    {"glProgramUniform3uiv", P(GL_ProgramUniform3uiv)},
+    {"eglWaitNative", P(EGL_WaitNative)},
+    DESKTOP_ONLY("glVertexAttribI2ui", GL_VertexAttribI2ui)
+    DESKTOP_ONLY("glVertexAttrib2d", GL_VertexAttrib2d)
+    DESKTOP_ONLY("glRasterPos3fv", GL_RasterPos3fv)
+    {"glRotatef", P(GL_Rotatef)},
+    DESKTOP_ONLY("glRects", GL_Rects)
+    {"glMultiDrawArraysInstancedBaseInstanceANGLE", P(GL_MultiDrawArraysInstancedBaseInstanceANGLE)},
+    {"glObjectPtrLabelKHR", P(GL_ObjectPtrLabelKHR)},
+    DESKTOP_ONLY("glFramebufferTexture1D", GL_FramebufferTexture1D)
+    DESKTOP_ONLY("glMultiTexCoord4dv", GL_MultiTexCoord4dv)
+    {"glTexStorageMemFlags3DMultisampleANGLE", P(GL_TexStorageMemFlags3DMultisampleANGLE)},
+    DESKTOP_ONLY("glEvalPoint1", GL_EvalPoint1)
+    DESKTOP_ONLY("glRasterPos3dv", GL_RasterPos3dv)
+    DESKTOP_ONLY("glLoadTransposeMatrixf", GL_LoadTransposeMatrixf)
+    DESKTOP_ONLY("glTexCoord3f", GL_TexCoord3f)
+    DESKTOP_ONLY("glWindowPos2s", GL_WindowPos2s)
+    {"glBlendFunci", P(GL_BlendFunci)},
+    DESKTOP_ONLY("glTexCoordP3uiv", GL_TexCoordP3uiv)
+    {"glTexImage2DExternalANGLE", P(GL_TexImage2DExternalANGLE)},
+    DESKTOP_ONLY("glSecondaryColor3us", GL_SecondaryColor3us)
+    {"glGetProgramiv", P(GL_GetProgramiv)},
+    DESKTOP_ONLY("glColorMaterial", GL_ColorMaterial)
+    {"glProgramUniform3fvEXT", P(GL_ProgramUniform3fvEXT)},
+    DESKTOP_ONLY("glCreateQueries", GL_CreateQueries)
+    DESKTOP_ONLY("glGetCompressedTextureSubImage", GL_GetCompressedTextureSubImage)
+    {"glGetPerfMonitorCountersAMD", P(GL_GetPerfMonitorCountersAMD)},
+    DESKTOP_ONLY("glFogi", GL_Fogi)
+    {"glProgramUniform2uiEXT", P(GL_ProgramUniform2uiEXT)},
+    {"glDrawElementsInstancedEXT", P(GL_DrawElementsInstancedEXT)},
+    DESKTOP_ONLY("glGetTransformFeedbackiv", GL_GetTransformFeedbackiv)
+    DESKTOP_ONLY("glMultiTexCoord4i", GL_MultiTexCoord4i)
+    {"eglCreateWindowSurface", P(EGL_CreateWindowSurface)},
+    {"glGenerateMipmap", P(GL_GenerateMipmap)},
+    {"glGetProgramPipelineivEXT", P(GL_GetProgramPipelineivEXT)},
+    DESKTOP_ONLY("glMultiTexCoordP4uiv", GL_MultiTexCoordP4uiv)
+    {"eglGetCurrentSurface", P(EGL_GetCurrentSurface)},
+    {"glGetSynciv", P(GL_GetSynciv)},
+    DESKTOP_ONLY("glGetQueryIndexediv", GL_GetQueryIndexediv)
+    {"eglCreateStreamProducerD3DTextureANGLE", P(EGL_CreateStreamProducerD3DTextureANGLE)},
+    DESKTOP_ONLY("glGetDoublei_v", GL_GetDoublei_v)
+    {"glSamplerParameterf", P(GL_SamplerParameterf)},
+    DESKTOP_ONLY("glGetnMapiv", GL_GetnMapiv)
+    DESKTOP_ONLY("glTexCoord4fv", GL_TexCoord4fv)
+    {"glBlitFramebufferANGLE", P(GL_BlitFramebufferANGLE)},
+    {"glTexEnvf", P(GL_TexEnvf)},
+    DESKTOP_ONLY("glGetMapdv", GL_GetMapdv)
+    {"glProgramUniform2ivEXT", P(GL_ProgramUniform2ivEXT)},
+    {"glCompressedTexImage3DRobustANGLE", P(GL_CompressedTexImage3DRobustANGLE)},
+    DESKTOP_ONLY("glGetCompressedTexImage", GL_GetCompressedTexImage)
+    {"glUnmapBuffer", P(GL_UnmapBuffer)},
+    DESKTOP_ONLY("glTexCoord1i", GL_TexCoord1i)
+    {"glGetTexLevelParameterivRobustANGLE", P(GL_GetTexLevelParameterivRobustANGLE)},
+    DESKTOP_ONLY("glClearNamedBufferData", GL_ClearNamedBufferData)
+    {"eglAcquireExternalContextANGLE", P(EGL_AcquireExternalContextANGLE)},
+    DESKTOP_ONLY("glRectdv", GL_Rectdv)
+    DESKTOP_ONLY("glTexCoord1iv", GL_TexCoord1iv)
+    {"glReleaseShaderCompiler", P(GL_ReleaseShaderCompiler)},
+    {"glLightx", P(GL_Lightx)},
+    {"glCompressedTexSubImage2DRobustANGLE", P(GL_CompressedTexSubImage2DRobustANGLE)},
+    DESKTOP_ONLY("glTexCoord3s", GL_TexCoord3s)
+    DESKTOP_ONLY("glIndexi", GL_Indexi)
+    DESKTOP_ONLY("glNamedFramebufferParameteri", GL_NamedFramebufferParameteri)
+    {"glGetMultisamplefvANGLE", P(GL_GetMultisamplefvANGLE)},
+    DESKTOP_ONLY("glGetNamedFramebufferParameteriv", GL_GetNamedFramebufferParameteriv)
+    DESKTOP_ONLY("glProvokingVertex", GL_ProvokingVertex)
+    {"glReadnPixels", P(GL_ReadnPixels)},
+    {"glGetVertexAttribiv", P(GL_GetVertexAttribiv)},
+    DESKTOP_ONLY("glCopyTexSubImage1D", GL_CopyTexSubImage1D)
+    {"glGetQueryivEXT", P(GL_GetQueryivEXT)},
+    DESKTOP_ONLY("glTexCoord1s", GL_TexCoord1s)
+    {"glPopDebugGroupKHR", P(GL_PopDebugGroupKHR)},
+    {"glStencilFunc", P(GL_StencilFunc)},
+    {"glDebugMessageControl", P(GL_DebugMessageControl)},
+    DESKTOP_ONLY("glMultiDrawElementsIndirect", GL_MultiDrawElementsIndirect)
+    DESKTOP_ONLY("glScaled", GL_Scaled)
+    {"eglHandleGPUSwitchANGLE", P(EGL_HandleGPUSwitchANGLE)},
+    DESKTOP_ONLY("glGetMapfv", GL_GetMapfv)
+    {"glGetTranslatedShaderSourceANGLE", P(GL_GetTranslatedShaderSourceANGLE)},
+    {"glGetQueryObjectivEXT", P(GL_GetQueryObjectivEXT)},
+    DESKTOP_ONLY("glVertex3iv", GL_Vertex3iv)
+    DESKTOP_ONLY("glMultiTexCoord2sv", GL_MultiTexCoord2sv)
+    {"glClearDepthf", P(GL_ClearDepthf)},
+    {"glImportSemaphoreZirconHandleANGLE", P(GL_ImportSemaphoreZirconHandleANGLE)},
+    DESKTOP_ONLY("glClearTexImage", GL_ClearTexImage)
+    {"glGetAttachedShaders", P(GL_GetAttachedShaders)},
+    {"glDrawTexfOES", P(GL_DrawTexfOES)},
     {"glUniform4iv", P(GL_Uniform4iv)},
-    {"glUniform4ui", P(GL_Uniform4ui)},
-    {"glUniform4uiv", P(GL_Uniform4uiv)},
-    {"glUniformBlockBinding", P(GL_UniformBlockBinding)},
-    DESKTOP_ONLY("glUniformMatrix2dv", GL_UniformMatrix2dv)
-    {"glUniformMatrix2fv", P(GL_UniformMatrix2fv)},
-    DESKTOP_ONLY("glUniformMatrix2x3dv", GL_UniformMatrix2x3dv)
-    {"glUniformMatrix2x3fv", P(GL_UniformMatrix2x3fv)},
+    {"glProgramUniformMatrix3x2fvEXT", P(GL_ProgramUniformMatrix3x2fvEXT)},
+    DESKTOP_ONLY("glWindowPos3iv", GL_WindowPos3iv)
+    {"glGetProgramPipelineInfoLogEXT", P(GL_GetProgramPipelineInfoLogEXT)},
+    DESKTOP_ONLY("glProgramUniform3d", GL_ProgramUniform3d)
+    DESKTOP_ONLY("glBegin", GL_Begin)
+    {"glCopyImageSubDataEXT", P(GL_CopyImageSubDataEXT)},
+    DESKTOP_ONLY("glFogCoorddv", GL_FogCoorddv)
+    {"glTexStorage2DMultisample", P(GL_TexStorage2DMultisample)},
+    {"glSampleMaski", P(GL_SampleMaski)},
     DESKTOP_ONLY("glUniformMatrix2x4dv", GL_UniformMatrix2x4dv)
-    {"glUniformMatrix2x4fv", P(GL_UniformMatrix2x4fv)},
-    DESKTOP_ONLY("glUniformMatrix3dv", GL_UniformMatrix3dv)
-    {"glUniformMatrix3fv", P(GL_UniformMatrix3fv)},
-    DESKTOP_ONLY("glUniformMatrix3x2dv", GL_UniformMatrix3x2dv)
-    {"glUniformMatrix3x2fv", P(GL_UniformMatrix3x2fv)},
-    DESKTOP_ONLY("glUniformMatrix3x4dv", GL_UniformMatrix3x4dv)
-    {"glUniformMatrix3x4fv", P(GL_UniformMatrix3x4fv)},
-    DESKTOP_ONLY("glUniformMatrix4dv", GL_UniformMatrix4dv)
-    {"glUniformMatrix4fv", P(GL_UniformMatrix4fv)},
-    DESKTOP_ONLY("glUniformMatrix4x2dv", GL_UniformMatrix4x2dv)
-    {"glUniformMatrix4x2fv", P(GL_UniformMatrix4x2fv)},
-    DESKTOP_ONLY("glUniformMatrix4x3dv", GL_UniformMatrix4x3dv)
-    {"glUniformMatrix4x3fv", P(GL_UniformMatrix4x3fv)},
-    DESKTOP_ONLY("glUniformSubroutinesuiv", GL_UniformSubroutinesuiv)
-    {"glUnmapBuffer", P(GL_UnmapBuffer)},
-    {"glUnmapBufferOES", P(GL_UnmapBufferOES)},
-    DESKTOP_ONLY("glUnmapNamedBuffer", GL_UnmapNamedBuffer)
-    {"glUseProgram", P(GL_UseProgram)},
-    {"glUseProgramStages", P(GL_UseProgramStages)},
-    {"glUseProgramStagesEXT", P(GL_UseProgramStagesEXT)},
-    {"glValidateProgram", P(GL_ValidateProgram)},
-    {"glValidateProgramPipeline", P(GL_ValidateProgramPipeline)},
-    {"glValidateProgramPipelineEXT", P(GL_ValidateProgramPipelineEXT)},
-    DESKTOP_ONLY("glVertex2d", GL_Vertex2d)
-    DESKTOP_ONLY("glVertex2dv", GL_Vertex2dv)
-    DESKTOP_ONLY("glVertex2f", GL_Vertex2f)
-    DESKTOP_ONLY("glVertex2fv", GL_Vertex2fv)
-    DESKTOP_ONLY("glVertex2i", GL_Vertex2i)
-    DESKTOP_ONLY("glVertex2iv", GL_Vertex2iv)
-    DESKTOP_ONLY("glVertex2s", GL_Vertex2s)
-    DESKTOP_ONLY("glVertex2sv", GL_Vertex2sv)
-    DESKTOP_ONLY("glVertex3d", GL_Vertex3d)
-    DESKTOP_ONLY("glVertex3dv", GL_Vertex3dv)
-    DESKTOP_ONLY("glVertex3f", GL_Vertex3f)
-    DESKTOP_ONLY("glVertex3fv", GL_Vertex3fv)
+    DESKTOP_ONLY("glSecondaryColor3ubv", GL_SecondaryColor3ubv)
+    DESKTOP_ONLY("glPixelMapuiv", GL_PixelMapuiv)
+    DESKTOP_ONLY("glRasterPos2s", GL_RasterPos2s)
+    {"glGetBufferPointervOES", P(GL_GetBufferPointervOES)},
+    DESKTOP_ONLY("glEvalMesh1", GL_EvalMesh1)
+    {"eglQueryDmaBufFormatsEXT", P(EGL_QueryDmaBufFormatsEXT)},
+    {"glBindVertexBuffer", P(GL_BindVertexBuffer)},
+    {"glUniform1uiv", P(GL_Uniform1uiv)},
+    {"glProgramUniform2ui", P(GL_ProgramUniform2ui)},
+    DESKTOP_ONLY("glTexCoord4s", GL_TexCoord4s)
+    {"glGetDebugMessageLog", P(GL_GetDebugMessageLog)},
+    DESKTOP_ONLY("glRectiv", GL_Rectiv)
+    DESKTOP_ONLY("glRasterPos3iv", GL_RasterPos3iv)
+    {"eglDebugMessageControlKHR", P(EGL_DebugMessageControlKHR)},
+    DESKTOP_ONLY("glRasterPos2d", GL_RasterPos2d)
+    DESKTOP_ONLY("glVertexP4uiv", GL_VertexP4uiv)
+    {"glGetTexEnviv", P(GL_GetTexEnviv)},
+    DESKTOP_ONLY("glTexCoord4i", GL_TexCoord4i)
+    {"glTexStorageMemFlags2DMultisampleANGLE", P(GL_TexStorageMemFlags2DMultisampleANGLE)},
+    {"glGetQueryiv", P(GL_GetQueryiv)},
+    {"glDrawRangeElementsBaseVertexOES", P(GL_DrawRangeElementsBaseVertexOES)},
+    {"glUniform1f", P(GL_Uniform1f)},
+    DESKTOP_ONLY("glGetnPixelMapuiv", GL_GetnPixelMapuiv)
+    DESKTOP_ONLY("glCheckNamedFramebufferStatus", GL_CheckNamedFramebufferStatus)
+    DESKTOP_ONLY("glGetActiveUniformName", GL_GetActiveUniformName)
+    {"glBindSampler", P(GL_BindSampler)},
+    {"glTexEnviv", P(GL_TexEnviv)},
+    DESKTOP_ONLY("glViewportIndexedf", GL_ViewportIndexedf)
+    DESKTOP_ONLY("glCopyTextureSubImage3D", GL_CopyTextureSubImage3D)
+    DESKTOP_ONLY("glGetPolygonStipple", GL_GetPolygonStipple)
+    {"glGetActiveAttrib", P(GL_GetActiveAttrib)},
+    DESKTOP_ONLY("glColorP3uiv", GL_ColorP3uiv)
+    {"glMaxShaderCompilerThreadsKHR", P(GL_MaxShaderCompilerThreadsKHR)},
+    {"glEGLImageTargetTexture2DOES", P(GL_EGLImageTargetTexture2DOES)},
+    {"glGetSamplerParameterIivRobustANGLE", P(GL_GetSamplerParameterIivRobustANGLE)},
+    {"eglDestroyStreamKHR", P(EGL_DestroyStreamKHR)},
+    {"glProgramUniformMatrix2fvEXT", P(GL_ProgramUniformMatrix2fvEXT)},
+    DESKTOP_ONLY("glPassThrough", GL_PassThrough)
+    {"glProgramUniformMatrix2x3fvEXT", P(GL_ProgramUniformMatrix2x3fvEXT)},
+    {"glCreateMemoryObjectsEXT", P(GL_CreateMemoryObjectsEXT)},
+    {"glVertexAttribDivisorEXT", P(GL_VertexAttribDivisorEXT)},
+    {"glDisable", P(GL_Disable)},
+    {"glTexSubImage3D", P(GL_TexSubImage3D)},
+    {"glGetProgramInterfaceivRobustANGLE", P(GL_GetProgramInterfaceivRobustANGLE)},
+    {"glFramebufferPixelLocalStorageInterruptANGLE", P(GL_FramebufferPixelLocalStorageInterruptANGLE)},
+    {"glGetIntegerv", P(GL_GetIntegerv)},
+    {"glIsFramebufferOES", P(GL_IsFramebufferOES)},
+    DESKTOP_ONLY("glClipPlane", GL_ClipPlane)
+    DESKTOP_ONLY("glVertexAttrib3s", GL_VertexAttrib3s)
+    DESKTOP_ONLY("glClipControl", GL_ClipControl)
+    {"glMaterialf", P(GL_Materialf)},
+    DESKTOP_ONLY("glVertexAttribI1i", GL_VertexAttribI1i)
+    {"glWaitSemaphoreEXT", P(GL_WaitSemaphoreEXT)},
+    {"eglDupNativeFenceFDANDROID", P(EGL_DupNativeFenceFDANDROID)},
+    DESKTOP_ONLY("glGetUniformdv", GL_GetUniformdv)
+    {"glBindBufferRange", P(GL_BindBufferRange)},
+    DESKTOP_ONLY("glNormal3sv", GL_Normal3sv)
     DESKTOP_ONLY("glVertex3i", GL_Vertex3i)
-    DESKTOP_ONLY("glVertex3iv", GL_Vertex3iv)
-    DESKTOP_ONLY("glVertex3s", GL_Vertex3s)
+    {"glProgramUniform2f", P(GL_ProgramUniform2f)},
+    {"glSamplerParameterIuivEXT", P(GL_SamplerParameterIuivEXT)},
+    DESKTOP_ONLY("glVertexArrayBindingDivisor", GL_VertexArrayBindingDivisor)
+    {"glGetObjectLabelKHR", P(GL_GetObjectLabelKHR)},
+    {"glGetSamplerParameterIiv", P(GL_GetSamplerParameterIiv)},
     DESKTOP_ONLY("glVertex3sv", GL_Vertex3sv)
-    DESKTOP_ONLY("glVertex4d", GL_Vertex4d)
-    DESKTOP_ONLY("glVertex4dv", GL_Vertex4dv)
-    DESKTOP_ONLY("glVertex4f", GL_Vertex4f)
-    DESKTOP_ONLY("glVertex4fv", GL_Vertex4fv)
-    DESKTOP_ONLY("glVertex4i", GL_Vertex4i)
-    DESKTOP_ONLY("glVertex4iv", GL_Vertex4iv)
+    DESKTOP_ONLY("glGetTextureLevelParameteriv", GL_GetTextureLevelParameteriv)
+    DESKTOP_ONLY("glGetTransformFeedbacki_v", GL_GetTransformFeedbacki_v)
+    {"glIsQueryEXT", P(GL_IsQueryEXT)},
+    {"glMemoryBarrierByRegion", P(GL_MemoryBarrierByRegion)},
+    DESKTOP_ONLY("glVertexP3ui", GL_VertexP3ui)
+    DESKTOP_ONLY("glRasterPos4iv", GL_RasterPos4iv)
+    {"glShadingRateQCOM", P(GL_ShadingRateQCOM)},
+    {"glBlendBarrier", P(GL_BlendBarrier)},
+    DESKTOP_ONLY("glRenderMode", GL_RenderMode)
+    {"glLogicOp", P(GL_LogicOp)},
+    {"glBlendFunciOES", P(GL_BlendFunciOES)},
+    {"glClearColor", P(GL_ClearColor)},
+    {"eglGetSyncAttribKHR", P(EGL_GetSyncAttribKHR)},
+    {"glPointSizePointerOES", P(GL_PointSizePointerOES)},
+    DESKTOP_ONLY("glFogCoordd", GL_FogCoordd)
+    {"glTexStorage3D", P(GL_TexStorage3D)},
+    {"glDeleteSemaphoresEXT", P(GL_DeleteSemaphoresEXT)},
+    {"glDrawBuffers", P(GL_DrawBuffers)},
+    DESKTOP_ONLY("glWindowPos3sv", GL_WindowPos3sv)
+    DESKTOP_ONLY("glMultiTexCoord2iv", GL_MultiTexCoord2iv)
+    DESKTOP_ONLY("glVertexAttribI3ui", GL_VertexAttribI3ui)
+    {"glProgramUniform4iv", P(GL_ProgramUniform4iv)},
+    {"glCompressedTexImage3D", P(GL_CompressedTexImage3D)},
+    {"glLogicOpANGLE", P(GL_LogicOpANGLE)},
+    {"glDeleteTransformFeedbacks", P(GL_DeleteTransformFeedbacks)},
+    {"glBindTexture", P(GL_BindTexture)},
+    {"glProgramUniform3iEXT", P(GL_ProgramUniform3iEXT)},
+    {"glTexParameterIivEXT", P(GL_TexParameterIivEXT)},
+    DESKTOP_ONLY("glMultiTexCoord3s", GL_MultiTexCoord3s)
+    {"glGetPerfMonitorGroupStringAMD", P(GL_GetPerfMonitorGroupStringAMD)},
+    DESKTOP_ONLY("glGetQueryBufferObjecti64v", GL_GetQueryBufferObjecti64v)
+    {"glScalex", P(GL_Scalex)},
+    {"glBlendFuncSeparateiOES", P(GL_BlendFuncSeparateiOES)},
+    DESKTOP_ONLY("glEvalCoord1dv", GL_EvalCoord1dv)
+    DESKTOP_ONLY("glMateriali", GL_Materiali)
+    DESKTOP_ONLY("glBindBuffersRange", GL_BindBuffersRange)
+    {"glGetFramebufferParameterivRobustANGLE", P(GL_GetFramebufferParameterivRobustANGLE)},
+    {"glProgramUniform3fv", P(GL_ProgramUniform3fv)},
+    {"glUniform4fv", P(GL_Uniform4fv)},
+    {"glGetTexGenfvOES", P(GL_GetTexGenfvOES)},
+    {"glFinishFenceNV", P(GL_FinishFenceNV)},
+    {"glEnableVertexAttribArray", P(GL_EnableVertexAttribArray)},
+    {"glProgramUniform4f", P(GL_ProgramUniform4f)},
+    DESKTOP_ONLY("glTexCoord2iv", GL_TexCoord2iv)
+    {"glGetProgramResourceLocation", P(GL_GetProgramResourceLocation)},
+    {"glCopyTexSubImage2D", P(GL_CopyTexSubImage2D)},
+    {"glPushDebugGroupKHR", P(GL_PushDebugGroupKHR)},
+    {"glFramebufferTextureOES", P(GL_FramebufferTextureOES)},
+    DESKTOP_ONLY("glVertexAttribP1ui", GL_VertexAttribP1ui)
+    {"glBeginQueryEXT", P(GL_BeginQueryEXT)},
     DESKTOP_ONLY("glVertex4s", GL_Vertex4s)
-    DESKTOP_ONLY("glVertex4sv", GL_Vertex4sv)
-    DESKTOP_ONLY("glVertexArrayAttribBinding", GL_VertexArrayAttribBinding)
-    DESKTOP_ONLY("glVertexArrayAttribFormat", GL_VertexArrayAttribFormat)
-    DESKTOP_ONLY("glVertexArrayAttribIFormat", GL_VertexArrayAttribIFormat)
-    DESKTOP_ONLY("glVertexArrayAttribLFormat", GL_VertexArrayAttribLFormat)
-    DESKTOP_ONLY("glVertexArrayBindingDivisor", GL_VertexArrayBindingDivisor)
-    DESKTOP_ONLY("glVertexArrayElementBuffer", GL_VertexArrayElementBuffer)
+    DESKTOP_ONLY("glEndList", GL_EndList)
+    {"glVertexAttribFormat", P(GL_VertexAttribFormat)},
+    {"glMatrixIndexPointerOES", P(GL_MatrixIndexPointerOES)},
+    {"glUniform4f", P(GL_Uniform4f)},
+    DESKTOP_ONLY("glGetClipPlane", GL_GetClipPlane)
+    {"glUniformMatrix4x2fv", P(GL_UniformMatrix4x2fv)},
+    {"glProgramUniform3fEXT", P(GL_ProgramUniform3fEXT)},
+    DESKTOP_ONLY("glNamedBufferData", GL_NamedBufferData)
     DESKTOP_ONLY("glVertexArrayVertexBuffer", GL_VertexArrayVertexBuffer)
-    DESKTOP_ONLY("glVertexArrayVertexBuffers", GL_VertexArrayVertexBuffers)
-    DESKTOP_ONLY("glVertexAttrib1d", GL_VertexAttrib1d)
-    DESKTOP_ONLY("glVertexAttrib1dv", GL_VertexAttrib1dv)
-    {"glVertexAttrib1f", P(GL_VertexAttrib1f)},
-    {"glVertexAttrib1fv", P(GL_VertexAttrib1fv)},
-    DESKTOP_ONLY("glVertexAttrib1s", GL_VertexAttrib1s)
-    DESKTOP_ONLY("glVertexAttrib1sv", GL_VertexAttrib1sv)
-    DESKTOP_ONLY("glVertexAttrib2d", GL_VertexAttrib2d)
-    DESKTOP_ONLY("glVertexAttrib2dv", GL_VertexAttrib2dv)
-    {"glVertexAttrib2f", P(GL_VertexAttrib2f)},
-    {"glVertexAttrib2fv", P(GL_VertexAttrib2fv)},
-    DESKTOP_ONLY("glVertexAttrib2s", GL_VertexAttrib2s)
-    DESKTOP_ONLY("glVertexAttrib2sv", GL_VertexAttrib2sv)
-    DESKTOP_ONLY("glVertexAttrib3d", GL_VertexAttrib3d)
-    DESKTOP_ONLY("glVertexAttrib3dv", GL_VertexAttrib3dv)
-    {"glVertexAttrib3f", P(GL_VertexAttrib3f)},
-    {"glVertexAttrib3fv", P(GL_VertexAttrib3fv)},
-    DESKTOP_ONLY("glVertexAttrib3s", GL_VertexAttrib3s)
-    DESKTOP_ONLY("glVertexAttrib3sv", GL_VertexAttrib3sv)
-    DESKTOP_ONLY("glVertexAttrib4Nbv", GL_VertexAttrib4Nbv)
-    DESKTOP_ONLY("glVertexAttrib4Niv", GL_VertexAttrib4Niv)
-    DESKTOP_ONLY("glVertexAttrib4Nsv", GL_VertexAttrib4Nsv)
-    DESKTOP_ONLY("glVertexAttrib4Nub", GL_VertexAttrib4Nub)
-    DESKTOP_ONLY("glVertexAttrib4Nubv", GL_VertexAttrib4Nubv)
     DESKTOP_ONLY("glVertexAttrib4Nuiv", GL_VertexAttrib4Nuiv)
-    DESKTOP_ONLY("glVertexAttrib4Nusv", GL_VertexAttrib4Nusv)
-    DESKTOP_ONLY("glVertexAttrib4bv", GL_VertexAttrib4bv)
-    DESKTOP_ONLY("glVertexAttrib4d", GL_VertexAttrib4d)
-    DESKTOP_ONLY("glVertexAttrib4dv", GL_VertexAttrib4dv)
-    {"glVertexAttrib4f", P(GL_VertexAttrib4f)},
-    {"glVertexAttrib4fv", P(GL_VertexAttrib4fv)},
-    DESKTOP_ONLY("glVertexAttrib4iv", GL_VertexAttrib4iv)
-    DESKTOP_ONLY("glVertexAttrib4s", GL_VertexAttrib4s)
-    DESKTOP_ONLY("glVertexAttrib4sv", GL_VertexAttrib4sv)
-    DESKTOP_ONLY("glVertexAttrib4ubv", GL_VertexAttrib4ubv)
-    DESKTOP_ONLY("glVertexAttrib4uiv", GL_VertexAttrib4uiv)
-    DESKTOP_ONLY("glVertexAttrib4usv", GL_VertexAttrib4usv)
-    {"glVertexAttribBinding", P(GL_VertexAttribBinding)},
-    {"glVertexAttribDivisor", P(GL_VertexAttribDivisor)},
-    {"glVertexAttribDivisorANGLE", P(GL_VertexAttribDivisorANGLE)},
-    {"glVertexAttribDivisorEXT", P(GL_VertexAttribDivisorEXT)},
-    {"glVertexAttribFormat", P(GL_VertexAttribFormat)},
-    DESKTOP_ONLY("glVertexAttribI1i", GL_VertexAttribI1i)
-    DESKTOP_ONLY("glVertexAttribI1iv", GL_VertexAttribI1iv)
-    DESKTOP_ONLY("glVertexAttribI1ui", GL_VertexAttribI1ui)
-    DESKTOP_ONLY("glVertexAttribI1uiv", GL_VertexAttribI1uiv)
-    DESKTOP_ONLY("glVertexAttribI2i", GL_VertexAttribI2i)
-    DESKTOP_ONLY("glVertexAttribI2iv", GL_VertexAttribI2iv)
-    DESKTOP_ONLY("glVertexAttribI2ui", GL_VertexAttribI2ui)
-    DESKTOP_ONLY("glVertexAttribI2uiv", GL_VertexAttribI2uiv)
-    DESKTOP_ONLY("glVertexAttribI3i", GL_VertexAttribI3i)
-    DESKTOP_ONLY("glVertexAttribI3iv", GL_VertexAttribI3iv)
-    DESKTOP_ONLY("glVertexAttribI3ui", GL_VertexAttribI3ui)
-    DESKTOP_ONLY("glVertexAttribI3uiv", GL_VertexAttribI3uiv)
-    DESKTOP_ONLY("glVertexAttribI4bv", GL_VertexAttribI4bv)
-    {"glVertexAttribI4i", P(GL_VertexAttribI4i)},
-    {"glVertexAttribI4iv", P(GL_VertexAttribI4iv)},
-    DESKTOP_ONLY("glVertexAttribI4sv", GL_VertexAttribI4sv)
-    DESKTOP_ONLY("glVertexAttribI4ubv", GL_VertexAttribI4ubv)
-    {"glVertexAttribI4ui", P(GL_VertexAttribI4ui)},
-    {"glVertexAttribI4uiv", P(GL_VertexAttribI4uiv)},
-    DESKTOP_ONLY("glVertexAttribI4usv", GL_VertexAttribI4usv)
-    {"glVertexAttribIFormat", P(GL_VertexAttribIFormat)},
-    {"glVertexAttribIPointer", P(GL_VertexAttribIPointer)},
-    DESKTOP_ONLY("glVertexAttribL1d", GL_VertexAttribL1d)
-    DESKTOP_ONLY("glVertexAttribL1dv", GL_VertexAttribL1dv)
-    DESKTOP_ONLY("glVertexAttribL2d", GL_VertexAttribL2d)
-    DESKTOP_ONLY("glVertexAttribL2dv", GL_VertexAttribL2dv)
-    DESKTOP_ONLY("glVertexAttribL3d", GL_VertexAttribL3d)
-    DESKTOP_ONLY("glVertexAttribL3dv", GL_VertexAttribL3dv)
-    DESKTOP_ONLY("glVertexAttribL4d", GL_VertexAttribL4d)
-    DESKTOP_ONLY("glVertexAttribL4dv", GL_VertexAttribL4dv)
-    DESKTOP_ONLY("glVertexAttribLFormat", GL_VertexAttribLFormat)
-    DESKTOP_ONLY("glVertexAttribLPointer", GL_VertexAttribLPointer)
-    DESKTOP_ONLY("glVertexAttribP1ui", GL_VertexAttribP1ui)
-    DESKTOP_ONLY("glVertexAttribP1uiv", GL_VertexAttribP1uiv)
-    DESKTOP_ONLY("glVertexAttribP2ui", GL_VertexAttribP2ui)
-    DESKTOP_ONLY("glVertexAttribP2uiv", GL_VertexAttribP2uiv)
-    DESKTOP_ONLY("glVertexAttribP3ui", GL_VertexAttribP3ui)
-    DESKTOP_ONLY("glVertexAttribP3uiv", GL_VertexAttribP3uiv)
-    DESKTOP_ONLY("glVertexAttribP4ui", GL_VertexAttribP4ui)
-    DESKTOP_ONLY("glVertexAttribP4uiv", GL_VertexAttribP4uiv)
-    {"glVertexAttribPointer", P(GL_VertexAttribPointer)},
-    {"glVertexBindingDivisor", P(GL_VertexBindingDivisor)},
-    DESKTOP_ONLY("glVertexP2ui", GL_VertexP2ui)
-    DESKTOP_ONLY("glVertexP2uiv", GL_VertexP2uiv)
-    DESKTOP_ONLY("glVertexP3ui", GL_VertexP3ui)
+    DESKTOP_ONLY("glFeedbackBuffer", GL_FeedbackBuffer)
+    DESKTOP_ONLY("glTexCoordP2ui", GL_TexCoordP2ui)
+    {"glEndQuery", P(GL_EndQuery)},
+    DESKTOP_ONLY("glNamedRenderbufferStorage", GL_NamedRenderbufferStorage)
+    {"glEnableClientState", P(GL_EnableClientState)},
+    DESKTOP_ONLY("glVertex2s", GL_Vertex2s)
+    {"glTexImage3DOES", P(GL_TexImage3DOES)},
+    {"glLightModelxv", P(GL_LightModelxv)},
+    {"glValidateProgramPipeline", P(GL_ValidateProgramPipeline)},
+    DESKTOP_ONLY("glFogCoordf", GL_FogCoordf)
+    DESKTOP_ONLY("glSecondaryColor3bv", GL_SecondaryColor3bv)
     DESKTOP_ONLY("glVertexP3uiv", GL_VertexP3uiv)
-    DESKTOP_ONLY("glVertexP4ui", GL_VertexP4ui)
-    DESKTOP_ONLY("glVertexP4uiv", GL_VertexP4uiv)
-    {"glVertexPointer", P(GL_VertexPointer)},
-    {"glViewport", P(GL_Viewport)},
-    DESKTOP_ONLY("glViewportArrayv", GL_ViewportArrayv)
-    DESKTOP_ONLY("glViewportIndexedf", GL_ViewportIndexedf)
-    DESKTOP_ONLY("glViewportIndexedfv", GL_ViewportIndexedfv)
-    {"glWaitSemaphoreEXT", P(GL_WaitSemaphoreEXT)},
-    {"glWaitSync", P(GL_WaitSync)},
-    {"glWeightPointerOES", P(GL_WeightPointerOES)},
-    DESKTOP_ONLY("glWindowPos2d", GL_WindowPos2d)
-    DESKTOP_ONLY("glWindowPos2dv", GL_WindowPos2dv)
-    DESKTOP_ONLY("glWindowPos2f", GL_WindowPos2f)
-    DESKTOP_ONLY("glWindowPos2fv", GL_WindowPos2fv)
-    DESKTOP_ONLY("glWindowPos2i", GL_WindowPos2i)
-    DESKTOP_ONLY("glWindowPos2iv", GL_WindowPos2iv)
-    DESKTOP_ONLY("glWindowPos2s", GL_WindowPos2s)
-    DESKTOP_ONLY("glWindowPos2sv", GL_WindowPos2sv)
-    DESKTOP_ONLY("glWindowPos3d", GL_WindowPos3d)
-    DESKTOP_ONLY("glWindowPos3dv", GL_WindowPos3dv)
-    DESKTOP_ONLY("glWindowPos3f", GL_WindowPos3f)
-    DESKTOP_ONLY("glWindowPos3fv", GL_WindowPos3fv)
-    DESKTOP_ONLY("glWindowPos3i", GL_WindowPos3i)
-    DESKTOP_ONLY("glWindowPos3iv", GL_WindowPos3iv)
-    DESKTOP_ONLY("glWindowPos3s", GL_WindowPos3s)
-    DESKTOP_ONLY("glWindowPos3sv", GL_WindowPos3sv)
+    DESKTOP_ONLY("glVertex4sv", GL_Vertex4sv)
+    {"glGetFloatvRobustANGLE", P(GL_GetFloatvRobustANGLE)},
+    {"glClearTexImageEXT", P(GL_ClearTexImageEXT)},
+    DESKTOP_ONLY("glGetnConvolutionFilter", GL_GetnConvolutionFilter)
+    {"glGetUniformfvRobustANGLE", P(GL_GetUniformfvRobustANGLE)},
+    {"glGetLightfv", P(GL_GetLightfv)},
+    {"glFramebufferTextureEXT", P(GL_FramebufferTextureEXT)},
+    {"glGetProgramivRobustANGLE", P(GL_GetProgramivRobustANGLE)},
+    {"glGetTexParameteriv", P(GL_GetTexParameteriv)},
+    {"glGetSamplerParameterIuivOES", P(GL_GetSamplerParameterIuivOES)},
+    DESKTOP_ONLY("glColor3s", GL_Color3s)
+    {"glDrawTexiOES", P(GL_DrawTexiOES)},
+    DESKTOP_ONLY("glColor4uiv", GL_Color4uiv)
+    DESKTOP_ONLY("glMultiTexCoord1sv", GL_MultiTexCoord1sv)
+    DESKTOP_ONLY("glClearNamedFramebufferiv", GL_ClearNamedFramebufferiv)
+    {"glGetFenceivNV", P(GL_GetFenceivNV)},
+    {"glSetFenceNV", P(GL_SetFenceNV)},
+    {"glLabelObjectEXT", P(GL_LabelObjectEXT)},
+    {"glProgramUniformMatrix3fv", P(GL_ProgramUniformMatrix3fv)},
+    {"glTexSubImage3DRobustANGLE", P(GL_TexSubImage3DRobustANGLE)},
+    {"glProgramUniform1iEXT", P(GL_ProgramUniform1iEXT)},
+    {"glDrawElementsBaseVertex", P(GL_DrawElementsBaseVertex)},
+    {"glFramebufferTextureMultiviewOVR", P(GL_FramebufferTextureMultiviewOVR)},
+    {"glProgramParameteriEXT", P(GL_ProgramParameteriEXT)},
+    DESKTOP_ONLY("glVertexAttrib4Niv", GL_VertexAttrib4Niv)
+    DESKTOP_ONLY("glBindFragDataLocation", GL_BindFragDataLocation)
+    DESKTOP_ONLY("glInvalidateNamedFramebufferData", GL_InvalidateNamedFramebufferData)
+    DESKTOP_ONLY("glDrawTransformFeedbackStream", GL_DrawTransformFeedbackStream)
+    {"eglDestroySyncKHR", P(EGL_DestroySyncKHR)},
+    {"glTransformFeedbackVaryings", P(GL_TransformFeedbackVaryings)},
+    DESKTOP_ONLY("glProgramUniformMatrix4x2dv", GL_ProgramUniformMatrix4x2dv)
+    {"glBeginPixelLocalStorageANGLE", P(GL_BeginPixelLocalStorageANGLE)},
+    {"glVertexAttrib1f", P(GL_VertexAttrib1f)},
+    DESKTOP_ONLY("glNormalP3uiv", GL_NormalP3uiv)
 };
 // clang-format on
 const size_t g_numProcs = std::size(g_procTable);
+
+const ProcEntry *FindProcEntry(const char *name)
+{
+    const ProcEntry &entry = g_procTable[MinimalPerfectHash(name, kProcSeeds, 535, 1603)];
+    return entry.first != nullptr && strcmp(entry.first, name) == 0 ? &entry : nullptr;
+}
 }  // namespace egl
@@ -28,6 +28,9 @@ using ProcEntry = std::pair<const char *, __GLXextFuncPtr>;
 
 extern const glx::ProcEntry g_procTable[];
 extern const size_t g_numProcs;
+
+// Returns the entry of g_procTable named |name|, or nullptr if there is none.
+const glx::ProcEntry *FindProcEntry(const char *name);
 }  // namespace glx
 
 #endif  // LIBGL_GLX_PROC_TABLE_H_
@@ -25,1544 +25,1605 @@
 #include "libGLESv2/entry_points_glx.h"
 #include "platform/PlatformMethods.h"
 
+#include <cstring>
 #include <iterator>
 
 #define P(FUNC) reinterpret_cast<__GLXextFuncPtr>(FUNC)
 
 namespace glx
 {
+namespace
+{
+// Minimal perfect hash function built by scripts/minimal_perfect_hash.py.
+constexpr uint32_t MinimalPerfectHash(const char *key,
+                                      const uint16_t *seeds,
+                                      uint32_t numSeeds,
+                                      uint32_t numKeys)
+{
+    uint32_t hash = 0x811c9dc5u;
+    for (; *key != '\0'; ++key)
+    {
+        hash = (hash ^ static_cast<unsigned char>(*key)) * 16777619u;
+    }
+    hash ^= seeds[(static_cast<uint64_t>(hash) * numSeeds) >> 32];
+    hash ^= hash >> 16;
+    hash *= 0x85ebca6bu;
+    hash ^= hash >> 13;
+    hash *= 0xc2b2ae35u;
+    hash ^= hash >> 16;
+    return static_cast<uint32_t>((static_cast<uint64_t>(hash) * numKeys) >> 32);
+}
+
+constexpr uint16_t kProcSeeds[] = {
+    0,   6,   4,    16,  0,   28,  5,   0,   0,   72,  53,  7,   0,    1,   0,   89,  9,    21,
+    7,   1,   9,    0,   24,  0,   24,  5,   2,   13,  16,  14,  9,    0,   5,   0,   0,    0,
+    28,  0,   27,   7,   12,  25,  3,   74,  2,   39,  3,   6,   0,    3,   40,  2,   1,    51,
+    22,  21,  18,   1,   21,  3,   40,  7,   4,   8,   8,   0,   6,    3,   26,  1,   0,    3,
+    2,   1,   15,   23,  0,   0,   4,   12,  0,   0,   11,  5,   27,   32,  6,   46,  8,    1,
+    12,  3,   4,    6,   15,  83,  235, 3,   29,  12,  37,  8,   29,   28,  23,  12,  37,   23,
+    9,   1,   2,    0,   2,   0,   28,  13,  45,  8,   9,   15,  2,    0,   43,  5,   41,   10,
+    2,   15,  23,   0,   4,   22,  28,  1,   4,   7,   2,   2,   3,    35,  1,   32,  49,   2,
+    75,  91,  31,   26,  32,  8,   77,  1,   8,   3,   44,  25,  57,   10,  11,  0,   5,    61,
+    30,  1,   1,    33,  23,  0,   11,  6,   43,  2,   31,  32,  17,   75,  34,  257, 28,   2,
+    2,   79,  1,    0,   21,  0,   19,  1,   3,   27,  8,   1,   14,   3,   19,  33,  4,    2,
+    15,  1,   38,   83,  6,   6,   26,  8,   0,   68,  0,   0,   7,    12,  22,  0,   13,   9,
+    21,  1,   5,    6,   68,  12,  13,  1,   78,  3,   41,  1,   10,   0,   21,  72,  6,    9,
+    16,  11,  0,    63,  18,  2,   33,  11,  0,   1,   2,   1,   89,   18,  1,   8,   40,   4,
+    16,  1,   10,   70,  23,  0,   43,  53,  17,  0,   0,   45,  91,   7,   95,  37,  32,   0,
+    34,  92,  3,    49,  0,   0,   55,  10,  12,  30,  39,  33,  14,   25,  47,  35,  1,    16,
+    6,   65,  49,   0,   89,  3,   0,   117, 25,  0,   0,   8,   0,    37,  113, 37,  51,   13,
+    145, 5,   193,  48,  17,  17,  71,  2,   1,   135, 31,  190, 18,   11,  0,   0,   0,    39,
+    4,   3,   137,  109, 4,   2,   111, 15,  42,  15,  1,   0,   0,    8,   128, 3,   0,    4,
+    161, 0,   0,    9,   53,  355, 161, 62,  189, 1,   7,   2,   0,    0,   376, 38,  30,   14,
+    43,  62,  13,   133, 8,   12,  35,  50,  15,  1,   11,  134, 54,   108, 47,  36,  64,   98,
+    7,   166, 59,   1,   3,   40,  62,  26,  85,  48,  47,  13,  37,   70,  3,   27,  15,   211,
+    46,  0,   0,    7,   11,  24,  41,  0,   0,   251, 24,  155, 18,   284, 7,   5,   84,   96,
+    115, 80,  1,    25,  11,  59,  2,   165, 40,  3,   47,  23,  7,    48,  0,   42,  13,   41,
+    3,   16,  104,  84,  36,  622, 58,  43,  162, 4,   12,  14,  1,    60,  10,  224, 17,   0,
+    0,   25,  145,  122, 0,   8,   12,  617, 164, 1,   206, 82,  107,  25,  6,   134, 27,   41,
+    39,  6,   132,  107, 187, 734, 4,   4,   251, 0,   125, 188, 48,   1,   163, 259, 2206, 32,
+    6,   0,   2767, 8,   2,   1,   96,  7,   2,   108, 3,   439, 2578, 10,  162, 4,   6,    1,
+    78,  0,   43,   36,  0,   20};
+}  // anonymous namespace
+
 // clang-format off
 const ProcEntry g_procTable[] = {
-    {"ANGLEGetDisplayPlatform", P(ANGLEGetDisplayPlatform)},
-    {"ANGLEResetDisplayPlatform", P(ANGLEResetDisplayPlatform)},
-    {"glAccum", P(GL_Accum)},
-    {"glAcquireTexturesANGLE", P(GL_AcquireTexturesANGLE)},
-    {"glActiveShaderProgram", P(GL_ActiveShaderProgram)},
-    {"glActiveShaderProgramEXT", P(GL_ActiveShaderProgramEXT)},
-    {"glActiveTexture", P(GL_ActiveTexture)},
-    {"glAlphaFunc", P(GL_AlphaFunc)},
-    {"glAlphaFuncx", P(GL_AlphaFuncx)},
-    {"glAreTexturesResident", P(GL_AreTexturesResident)},
-    {"glArrayElement", P(GL_ArrayElement)},
-    {"glAttachShader", P(GL_AttachShader)},
-    {"glBegin", P(GL_Begin)},
-    {"glBeginConditionalRender", P(GL_BeginConditionalRender)},
-    {"glBeginPerfMonitorAMD", P(GL_BeginPerfMonitorAMD)},
-    {"glBeginPixelLocalStorageANGLE", P(GL_BeginPixelLocalStorageANGLE)},
-    {"glBeginQuery", P(GL_BeginQuery)},
-    {"glBeginQueryEXT", P(GL_BeginQueryEXT)},
-    {"glBeginQueryIndexed", P(GL_BeginQueryIndexed)},
-    {"glBeginTransformFeedback", P(GL_BeginTransformFeedback)},
-    {"glBindAttribLocation", P(GL_BindAttribLocation)},
-    {"glBindBuffer", P(GL_BindBuffer)},
-    {"glBindBufferBase", P(GL_BindBufferBase)},
-    {"glBindBufferRange", P(GL_BindBufferRange)},
-    {"glBindBuffersBase", P(GL_BindBuffersBase)},
-    {"glBindBuffersRange", P(GL_BindBuffersRange)},
-    {"glBindFragDataLocation", P(GL_BindFragDataLocation)},
-    {"glBindFragDataLocationEXT", P(GL_BindFragDataLocationEXT)},
-    {"glBindFragDataLocationIndexed", P(GL_BindFragDataLocationIndexed)},
-    {"glBindFragDataLocationIndexedEXT", P(GL_BindFragDataLocationIndexedEXT)},
-    {"glBindFramebuffer", P(GL_BindFramebuffer)},
-    {"glBindFramebufferOES", P(GL_BindFramebufferOES)},
-    {"glBindImageTexture", P(GL_BindImageTexture)},
-    {"glBindImageTextures", P(GL_BindImageTextures)},
-    {"glBindProgramPipeline", P(GL_BindProgramPipeline)},
-    {"glBindProgramPipelineEXT", P(GL_BindProgramPipelineEXT)},
-    {"glBindRenderbuffer", P(GL_BindRenderbuffer)},
-    {"glBindRenderbufferOES", P(GL_BindRenderbufferOES)},
-    {"glBindSampler", P(GL_BindSampler)},
-    {"glBindSamplers", P(GL_BindSamplers)},
-    {"glBindTexture", P(GL_BindTexture)},
-    {"glBindTextureUnit", P(GL_BindTextureUnit)},
-    {"glBindTextures", P(GL_BindTextures)},
-    {"glBindTransformFeedback", P(GL_BindTransformFeedback)},
-    {"glBindUniformLocationCHROMIUM", P(GL_BindUniformLocationCHROMIUM)},
-    {"glBindVertexArray", P(GL_BindVertexArray)},
-    {"glBindVertexArrayOES", P(GL_BindVertexArrayOES)},
-    {"glBindVertexBuffer", P(GL_BindVertexBuffer)},
-    {"glBindVertexBuffers", P(GL_BindVertexBuffers)},
+    {"glMapBufferOES", P(GL_MapBufferOES)},
+    {"glGetQueryObjectuivEXT", P(GL_GetQueryObjectuivEXT)},
+    {"glUniform2i", P(GL_Uniform2i)},
+    {"glVertexAttrib4d", P(GL_VertexAttrib4d)},
+    {"glTexCoordP4ui", P(GL_TexCoordP4ui)},
+    {"glTexGendv", P(GL_TexGendv)},
+    {"glUniform3f", P(GL_Uniform3f)},
+    {"glGetQueryObjecti64vRobustANGLE", P(GL_GetQueryObjecti64vRobustANGLE)},
+    {"glCreateVertexArrays", P(GL_CreateVertexArrays)},
+    {"glDisableVertexAttribArray", P(GL_DisableVertexAttribArray)},
     {"glBitmap", P(GL_Bitmap)},
-    {"glBlendBarrier", P(GL_BlendBarrier)},
-    {"glBlendBarrierKHR", P(GL_BlendBarrierKHR)},
-    {"glBlendColor", P(GL_BlendColor)},
-    {"glBlendEquation", P(GL_BlendEquation)},
-    {"glBlendEquationSeparate", P(GL_BlendEquationSeparate)},
-    {"glBlendEquationSeparatei", P(GL_BlendEquationSeparatei)},
-    {"glBlendEquationSeparateiEXT", P(GL_BlendEquationSeparateiEXT)},
-    {"glBlendEquationSeparateiOES", P(GL_BlendEquationSeparateiOES)},
-    {"glBlendEquationi", P(GL_BlendEquationi)},
-    {"glBlendEquationiEXT", P(GL_BlendEquationiEXT)},
-    {"glBlendEquationiOES", P(GL_BlendEquationiOES)},
-    {"glBlendFunc", P(GL_BlendFunc)},
-    {"glBlendFuncSeparate", P(GL_BlendFuncSeparate)},
+    {"glTexCoord2i", P(GL_TexCoord2i)},
+    {"glVertex3i", P(GL_Vertex3i)},
+    {"glCopyTexSubImage3D", P(GL_CopyTexSubImage3D)},
+    {"glGetMaterialiv", P(GL_GetMaterialiv)},
+    {"glTexCoordP2uiv", P(GL_TexCoordP2uiv)},
+    {"glTexCoord3fv", P(GL_TexCoord3fv)},
+    {"glCopyTexSubImage1D", P(GL_CopyTexSubImage1D)},
+    {"glIsFramebufferOES", P(GL_IsFramebufferOES)},
+    {"glDrawElementsInstancedBaseVertexEXT", P(GL_DrawElementsInstancedBaseVertexEXT)},
+    {"glUniformSubroutinesuiv", P(GL_UniformSubroutinesuiv)},
+    {"glInvalidateFramebuffer", P(GL_InvalidateFramebuffer)},
+    {"glUniform4iv", P(GL_Uniform4iv)},
+    {"glGetnUniformfv", P(GL_GetnUniformfv)},
+    {"glTexImage3DRobustANGLE", P(GL_TexImage3DRobustANGLE)},
+    {"glGetShaderiv", P(GL_GetShaderiv)},
+    {"glShaderStorageBlockBinding", P(GL_ShaderStorageBlockBinding)},
+    {"glVertexAttrib4Nsv", P(GL_VertexAttrib4Nsv)},
+    {"glProgramUniform2uiv", P(GL_ProgramUniform2uiv)},
+    {"glDrawArraysInstancedBaseInstanceANGLE", P(GL_DrawArraysInstancedBaseInstanceANGLE)},
+    {"glFogCoordf", P(GL_FogCoordf)},
+    {"glVertexAttrib1sv", P(GL_VertexAttrib1sv)},
+    {"glTexStorage2DEXT", P(GL_TexStorage2DEXT)},
+    {"glFrustumf", P(GL_Frustumf)},
+    {"glXCreateGLXPixmap", P(glXCreateGLXPixmap)},
+    {"glGetVertexAttribiv", P(GL_GetVertexAttribiv)},
+    {"glUniform1uiv", P(GL_Uniform1uiv)},
+    {"glFramebufferMemorylessPixelLocalStorageANGLE", P(GL_FramebufferMemorylessPixelLocalStorageANGLE)},
+    {"glMultiTexCoord4f", P(GL_MultiTexCoord4f)},
+    {"glTextureView", P(GL_TextureView)},
+    {"glTexStorage2D", P(GL_TexStorage2D)},
+    {"glEndList", P(GL_EndList)},
+    {"glGetUniformiv", P(GL_GetUniformiv)},
+    {"glCheckFramebufferStatusOES", P(GL_CheckFramebufferStatusOES)},
+    {"glGetVertexAttribIiv", P(GL_GetVertexAttribIiv)},
+    {"glTexSubImage3D", P(GL_TexSubImage3D)},
+    {"glGenTransformFeedbacks", P(GL_GenTransformFeedbacks)},
+    {"glColor4ubv", P(GL_Color4ubv)},
+    {"glDeleteMemoryObjectsEXT", P(GL_DeleteMemoryObjectsEXT)},
+    {"glReleaseShaderCompiler", P(GL_ReleaseShaderCompiler)},
+    {"glMultiDrawElementsIndirectCount", P(GL_MultiDrawElementsIndirectCount)},
+    {"glGetMaterialfv", P(GL_GetMaterialfv)},
+    {"glTexImage2DExternalANGLE", P(GL_TexImage2DExternalANGLE)},
+    {"glUniform2uiv", P(GL_Uniform2uiv)},
+    {"glLighti", P(GL_Lighti)},
+    {"glMultiTexCoordP2ui", P(GL_MultiTexCoordP2ui)},
+    {"glFogCoordPointer", P(GL_FogCoordPointer)},
+    {"glTextureParameterfv", P(GL_TextureParameterfv)},
+    {"glUniformMatrix2x4fv", P(GL_UniformMatrix2x4fv)},
+    {"glTexCoord1fv", P(GL_TexCoord1fv)},
+    {"glClearNamedFramebufferiv", P(GL_ClearNamedFramebufferiv)},
+    {"glUniformMatrix3fv", P(GL_UniformMatrix3fv)},
     {"glBlendFuncSeparatei", P(GL_BlendFuncSeparatei)},
-    {"glBlendFuncSeparateiEXT", P(GL_BlendFuncSeparateiEXT)},
-    {"glBlendFuncSeparateiOES", P(GL_BlendFuncSeparateiOES)},
-    {"glBlendFunci", P(GL_BlendFunci)},
-    {"glBlendFunciEXT", P(GL_BlendFunciEXT)},
-    {"glBlendFunciOES", P(GL_BlendFunciOES)},
-    {"glBlitFramebuffer", P(GL_BlitFramebuffer)},
-    {"glBlitFramebufferANGLE", P(GL_BlitFramebufferANGLE)},
-    {"glBlitFramebufferNV", P(GL_BlitFramebufferNV)},
-    {"glBlitNamedFramebuffer", P(GL_BlitNamedFramebuffer)},
-    {"glBufferData", P(GL_BufferData)},
-    {"glBufferStorage", P(GL_BufferStorage)},
-    {"glBufferStorageEXT", P(GL_BufferStorageEXT)},
-    {"glBufferStorageExternalEXT", P(GL_BufferStorageExternalEXT)},
+    {"glDrawElementsBaseVertex", P(GL_DrawElementsBaseVertex)},
+    {"glTextureBarrier", P(GL_TextureBarrier)},
+    {"glWindowPos2f", P(GL_WindowPos2f)},
+    {"glGetNamedRenderbufferParameteriv", P(GL_GetNamedRenderbufferParameteriv)},
+    {"glXSelectEvent", P(glXSelectEvent)},
+    {"glVertexAttrib4sv", P(GL_VertexAttrib4sv)},
+    {"glFrustum", P(GL_Frustum)},
+    {"glTexEnvi", P(GL_TexEnvi)},
+    {"glGetMemoryObjectParameterivEXT", P(GL_GetMemoryObjectParameterivEXT)},
+    {"glQueryCounterEXT", P(GL_QueryCounterEXT)},
+    {"glGetnHistogram", P(GL_GetnHistogram)},
+    {"glTexImage1D", P(GL_TexImage1D)},
+    {"glDeleteBuffers", P(GL_DeleteBuffers)},
+    {"glCompressedCopyTextureCHROMIUM", P(GL_CompressedCopyTextureCHROMIUM)},
+    {"glGetSamplerParameteriv", P(GL_GetSamplerParameteriv)},
+    {"glInvalidateBufferData", P(GL_InvalidateBufferData)},
+    {"glCreateShaderProgramv", P(GL_CreateShaderProgramv)},
+    {"glLightModelfv", P(GL_LightModelfv)},
+    {"glTexParameterfvRobustANGLE", P(GL_TexParameterfvRobustANGLE)},
+    {"glProgramUniform2f", P(GL_ProgramUniform2f)},
+    {"glSpecializeShader", P(GL_SpecializeShader)},
+    {"glUseProgramStages", P(GL_UseProgramStages)},
     {"glBufferStorageMemEXT", P(GL_BufferStorageMemEXT)},
-    {"glBufferSubData", P(GL_BufferSubData)},
-    {"glCallList", P(GL_CallList)},
-    {"glCallLists", P(GL_CallLists)},
-    {"glCheckFramebufferStatus", P(GL_CheckFramebufferStatus)},
-    {"glCheckFramebufferStatusOES", P(GL_CheckFramebufferStatusOES)},
-    {"glCheckNamedFramebufferStatus", P(GL_CheckNamedFramebufferStatus)},
-    {"glClampColor", P(GL_ClampColor)},
-    {"glClear", P(GL_Clear)},
-    {"glClearAccum", P(GL_ClearAccum)},
-    {"glClearBufferData", P(GL_ClearBufferData)},
-    {"glClearBufferSubData", P(GL_ClearBufferSubData)},
-    {"glClearBufferfi", P(GL_ClearBufferfi)},
-    {"glClearBufferfv", P(GL_ClearBufferfv)},
-    {"glClearBufferiv", P(GL_ClearBufferiv)},
-    {"glClearBufferuiv", P(GL_ClearBufferuiv)},
-    {"glClearColor", P(GL_ClearColor)},
-    {"glClearColorx", P(GL_ClearColorx)},
-    {"glClearDepth", P(GL_ClearDepth)},
-    {"glClearDepthf", P(GL_ClearDepthf)},
-    {"glClearDepthx", P(GL_ClearDepthx)},
-    {"glClearIndex", P(GL_ClearIndex)},
-    {"glClearNamedBufferData", P(GL_ClearNamedBufferData)},
-    {"glClearNamedBufferSubData", P(GL_ClearNamedBufferSubData)},
+    {"glIsFramebuffer", P(GL_IsFramebuffer)},
+    {"glGetTexParameterIuivRobustANGLE", P(GL_GetTexParameterIuivRobustANGLE)},
+    {"glFramebufferTexture2DMultisampleEXT", P(GL_FramebufferTexture2DMultisampleEXT)},
+    {"glMaterialfv", P(GL_Materialfv)},
+    {"glTexCoord3i", P(GL_TexCoord3i)},
+    {"glIsTexture", P(GL_IsTexture)},
+    {"glGetProgramPipelineiv", P(GL_GetProgramPipelineiv)},
+    {"glSamplerParameterIivRobustANGLE", P(GL_SamplerParameterIivRobustANGLE)},
+    {"glGetDoublev", P(GL_GetDoublev)},
+    {"glNamedRenderbufferStorage", P(GL_NamedRenderbufferStorage)},
+    {"glVertexArrayVertexBuffers", P(GL_VertexArrayVertexBuffers)},
+    {"glFramebufferPixelLocalClearValuefvANGLE", P(GL_FramebufferPixelLocalClearValuefvANGLE)},
+    {"glVertexAttribI4usv", P(GL_VertexAttribI4usv)},
+    {"glColor3iv", P(GL_Color3iv)},
+    {"glRotated", P(GL_Rotated)},
     {"glClearNamedFramebufferfi", P(GL_ClearNamedFramebufferfi)},
-    {"glClearNamedFramebufferfv", P(GL_ClearNamedFramebufferfv)},
-    {"glClearNamedFramebufferiv", P(GL_ClearNamedFramebufferiv)},
-    {"glClearNamedFramebufferuiv", P(GL_ClearNamedFramebufferuiv)},
-    {"glClearStencil", P(GL_ClearStencil)},
-    {"glClearTexImage", P(GL_ClearTexImage)},
-    {"glClearTexImageEXT", P(GL_ClearTexImageEXT)},
-    {"glClearTexSubImage", P(GL_ClearTexSubImage)},
-    {"glClearTexSubImageEXT", P(GL_ClearTexSubImageEXT)},
-    {"glClientActiveTexture", P(GL_ClientActiveTexture)},
-    {"glClientWaitSync", P(GL_ClientWaitSync)},
-    {"glClipControl", P(GL_ClipControl)},
-    {"glClipControlEXT", P(GL_ClipControlEXT)},
-    {"glClipPlane", P(GL_ClipPlane)},
-    {"glClipPlanef", P(GL_ClipPlanef)},
-    {"glClipPlanex", P(GL_ClipPlanex)},
-    {"glColor3b", P(GL_Color3b)},
-    {"glColor3bv", P(GL_Color3bv)},
-    {"glColor3d", P(GL_Color3d)},
+    {"glXUseXFont", P(glXUseXFont)},
+    {"glVertexAttribI4uiv", P(GL_VertexAttribI4uiv)},
+    {"glTexParameterIuivOES", P(GL_TexParameterIuivOES)},
+    {"glCheckFramebufferStatus", P(GL_CheckFramebufferStatus)},
     {"glColor3dv", P(GL_Color3dv)},
-    {"glColor3f", P(GL_Color3f)},
-    {"glColor3fv", P(GL_Color3fv)},
-    {"glColor3i", P(GL_Color3i)},
-    {"glColor3iv", P(GL_Color3iv)},
-    {"glColor3s", P(GL_Color3s)},
-    {"glColor3sv", P(GL_Color3sv)},
-    {"glColor3ub", P(GL_Color3ub)},
-    {"glColor3ubv", P(GL_Color3ubv)},
-    {"glColor3ui", P(GL_Color3ui)},
-    {"glColor3uiv", P(GL_Color3uiv)},
-    {"glColor3us", P(GL_Color3us)},
-    {"glColor3usv", P(GL_Color3usv)},
-    {"glColor4b", P(GL_Color4b)},
-    {"glColor4bv", P(GL_Color4bv)},
-    {"glColor4d", P(GL_Color4d)},
-    {"glColor4dv", P(GL_Color4dv)},
-    {"glColor4f", P(GL_Color4f)},
-    {"glColor4fv", P(GL_Color4fv)},
-    {"glColor4i", P(GL_Color4i)},
-    {"glColor4iv", P(GL_Color4iv)},
-    {"glColor4s", P(GL_Color4s)},
-    {"glColor4sv", P(GL_Color4sv)},
-    {"glColor4ub", P(GL_Color4ub)},
-    {"glColor4ubv", P(GL_Color4ubv)},
-    {"glColor4ui", P(GL_Color4ui)},
-    {"glColor4uiv", P(GL_Color4uiv)},
-    {"glColor4us", P(GL_Color4us)},
-    {"glColor4usv", P(GL_Color4usv)},
-    {"glColor4x", P(GL_Color4x)},
-    {"glColorMask", P(GL_ColorMask)},
-    {"glColorMaski", P(GL_ColorMaski)},
-    {"glColorMaskiEXT", P(GL_ColorMaskiEXT)},
-    {"glColorMaskiOES", P(GL_ColorMaskiOES)},
-    {"glColorMaterial", P(GL_ColorMaterial)},
-    {"glColorP3ui", P(GL_ColorP3ui)},
-    {"glColorP3uiv", P(GL_ColorP3uiv)},
-    {"glColorP4ui", P(GL_ColorP4ui)},
-    {"glColorP4uiv", P(GL_ColorP4uiv)},
-    {"glColorPointer", P(GL_ColorPointer)},
-    {"glCompileShader", P(GL_CompileShader)},
-    {"glCompressedCopyTextureCHROMIUM", P(GL_CompressedCopyTextureCHROMIUM)},
-    {"glCompressedTexImage1D", P(GL_CompressedTexImage1D)},
-    {"glCompressedTexImage2D", P(GL_CompressedTexImage2D)},
-    {"glCompressedTexImage2DRobustANGLE", P(GL_CompressedTexImage2DRobustANGLE)},
-    {"glCompressedTexImage3D", P(GL_CompressedTexImage3D)},
-    {"glCompressedTexImage3DOES", P(GL_CompressedTexImage3DOES)},
-    {"glCompressedTexImage3DRobustANGLE", P(GL_CompressedTexImage3DRobustANGLE)},
-    {"glCompressedTexSubImage1D", P(GL_CompressedTexSubImage1D)},
-    {"glCompressedTexSubImage2D", P(GL_CompressedTexSubImage2D)},
-    {"glCompressedTexSubImage2DRobustANGLE", P(GL_CompressedTexSubImage2DRobustANGLE)},
-    {"glCompressedTexSubImage3D", P(GL_CompressedTexSubImage3D)},
-    {"glCompressedTexSubImage3DOES", P(GL_CompressedTexSubImage3DOES)},
-    {"glCompressedTexSubImage3DRobustANGLE", P(GL_CompressedTexSubImage3DRobustANGLE)},
-    {"glCompressedTextureSubImage1D", P(GL_CompressedTextureSubImage1D)},
-    {"glCompressedTextureSubImage2D", P(GL_CompressedTextureSubImage2D)},
-    {"glCompressedTextureSubImage3D", P(GL_CompressedTextureSubImage3D)},
-    {"glCopyBufferSubData", P(GL_CopyBufferSubData)},
-    {"glCopyImageSubData", P(GL_CopyImageSubData)},
-    {"glCopyImageSubDataEXT", P(GL_CopyImageSubDataEXT)},
-    {"glCopyImageSubDataOES", P(GL_CopyImageSubDataOES)},
-    {"glCopyNamedBufferSubData", P(GL_CopyNamedBufferSubData)},
-    {"glCopyPixels", P(GL_CopyPixels)},
-    {"glCopySubTexture3DANGLE", P(GL_CopySubTexture3DANGLE)},
-    {"glCopySubTextureCHROMIUM", P(GL_CopySubTextureCHROMIUM)},
-    {"glCopyTexImage1D", P(GL_CopyTexImage1D)},
-    {"glCopyTexImage2D", P(GL_CopyTexImage2D)},
-    {"glCopyTexSubImage1D", P(GL_CopyTexSubImage1D)},
-    {"glCopyTexSubImage2D", P(GL_CopyTexSubImage2D)},
-    {"glCopyTexSubImage3D", P(GL_CopyTexSubImage3D)},
-    {"glCopyTexSubImage3DOES", P(GL_CopyTexSubImage3DOES)},
-    {"glCopyTexture3DANGLE", P(GL_CopyTexture3DANGLE)},
-    {"glCopyTextureCHROMIUM", P(GL_CopyTextureCHROMIUM)},
-    {"glCopyTextureSubImage1D", P(GL_CopyTextureSubImage1D)},
-    {"glCopyTextureSubImage2D", P(GL_CopyTextureSubImage2D)},
-    {"glCopyTextureSubImage3D", P(GL_CopyTextureSubImage3D)},
-    {"glCoverageModulationCHROMIUM", P(GL_CoverageModulationCHROMIUM)},
-    {"glCreateBuffers", P(GL_CreateBuffers)},
-    {"glCreateFramebuffers", P(GL_CreateFramebuffers)},
-    {"glCreateMemoryObjectsEXT", P(GL_CreateMemoryObjectsEXT)},
+    {"glIsEnabledi", P(GL_IsEnabledi)},
     {"glCreateProgram", P(GL_CreateProgram)},
-    {"glCreateProgramPipelines", P(GL_CreateProgramPipelines)},
-    {"glCreateQueries", P(GL_CreateQueries)},
-    {"glCreateRenderbuffers", P(GL_CreateRenderbuffers)},
+    {"glUniform2dv", P(GL_Uniform2dv)},
+    {"glBindTextureUnit", P(GL_BindTextureUnit)},
+    {"glProgramUniformMatrix2x4fvEXT", P(GL_ProgramUniformMatrix2x4fvEXT)},
+    {"glEnableiEXT", P(GL_EnableiEXT)},
+    {"glGetTextureParameteriv", P(GL_GetTextureParameteriv)},
+    {"glProgramUniform2dv", P(GL_ProgramUniform2dv)},
+    {"glMultiTexCoordP2uiv", P(GL_MultiTexCoordP2uiv)},
+    {"glIsProgramPipeline", P(GL_IsProgramPipeline)},
+    {"glVertexAttrib3d", P(GL_VertexAttrib3d)},
+    {"glVertexAttribL2d", P(GL_VertexAttribL2d)},
+    {"glLabelObjectEXT", P(GL_LabelObjectEXT)},
+    {"glGetActiveSubroutineName", P(GL_GetActiveSubroutineName)},
+    {"glInvalidateTexImage", P(GL_InvalidateTexImage)},
+    {"glColor3b", P(GL_Color3b)},
+    {"glDispatchCompute", P(GL_DispatchCompute)},
+    {"glRenderbufferStorageOES", P(GL_RenderbufferStorageOES)},
+    {"glEvalCoord1fv", P(GL_EvalCoord1fv)},
+    {"glSamplerParameterIivOES", P(GL_SamplerParameterIivOES)},
+    {"glScalex", P(GL_Scalex)},
+    {"glTexParameterIuiv", P(GL_TexParameterIuiv)},
+    {"glProgramUniform3fvEXT", P(GL_ProgramUniform3fvEXT)},
+    {"glPrimitiveRestartIndex", P(GL_PrimitiveRestartIndex)},
+    {"glWindowPos3iv", P(GL_WindowPos3iv)},
+    {"glMultiDrawElements", P(GL_MultiDrawElements)},
+    {"glXGetConfig", P(glXGetConfig)},
+    {"glClearNamedFramebufferuiv", P(GL_ClearNamedFramebufferuiv)},
+    {"glPixelStorei", P(GL_PixelStorei)},
+    {"glScissorIndexed", P(GL_ScissorIndexed)},
+    {"glSecondaryColor3usv", P(GL_SecondaryColor3usv)},
+    {"glBindSamplers", P(GL_BindSamplers)},
+    {"glColor3uiv", P(GL_Color3uiv)},
+    {"glVertexAttribL2dv", P(GL_VertexAttribL2dv)},
+    {"glColor4ui", P(GL_Color4ui)},
+    {"glTexImage2D", P(GL_TexImage2D)},
+    {"glBufferData", P(GL_BufferData)},
+    {"glStencilMask", P(GL_StencilMask)},
+    {"glMemoryBarrier", P(GL_MemoryBarrier)},
+    {"glGetProgramivRobustANGLE", P(GL_GetProgramivRobustANGLE)},
+    {"glMultiTexCoordP3ui", P(GL_MultiTexCoordP3ui)},
+    {"glClearBufferSubData", P(GL_ClearBufferSubData)},
+    {"glGetLightiv", P(GL_GetLightiv)},
+    {"glTexCoord4fv", P(GL_TexCoord4fv)},
+    {"glUniform4dv", P(GL_Uniform4dv)},
+    {"glFenceSync", P(GL_FenceSync)},
+    {"glRenderbufferStorageMultisampleEXT", P(GL_RenderbufferStorageMultisampleEXT)},
+    {"glVertexAttrib4Niv", P(GL_VertexAttrib4Niv)},
+    {"glPushGroupMarkerEXT", P(GL_PushGroupMarkerEXT)},
+    {"glGenPerfMonitorsAMD", P(GL_GenPerfMonitorsAMD)},
+    {"glGetGraphicsResetStatusEXT", P(GL_GetGraphicsResetStatusEXT)},
+    {"glBindAttribLocation", P(GL_BindAttribLocation)},
+    {"glPushAttrib", P(GL_PushAttrib)},
+    {"glPointSize", P(GL_PointSize)},
+    {"glUniformMatrix4x3fv", P(GL_UniformMatrix4x3fv)},
+    {"glXGetClientString", P(glXGetClientString)},
+    {"glMap1d", P(GL_Map1d)},
+    {"glVertexAttrib4uiv", P(GL_VertexAttrib4uiv)},
+    {"glFramebufferParameteri", P(GL_FramebufferParameteri)},
+    {"glTexSubImage3DOES", P(GL_TexSubImage3DOES)},
     {"glCreateSamplers", P(GL_CreateSamplers)},
-    {"glCreateShader", P(GL_CreateShader)},
-    {"glCreateShaderProgramv", P(GL_CreateShaderProgramv)},
-    {"glCreateShaderProgramvEXT", P(GL_CreateShaderProgramvEXT)},
-    {"glCreateTextures", P(GL_CreateTextures)},
-    {"glCreateTransformFeedbacks", P(GL_CreateTransformFeedbacks)},
-    {"glCreateVertexArrays", P(GL_CreateVertexArrays)},
-    {"glCullFace", P(GL_CullFace)},
-    {"glCurrentPaletteMatrixOES", P(GL_CurrentPaletteMatrixOES)},
-    {"glDebugMessageCallback", P(GL_DebugMessageCallback)},
-    {"glDebugMessageCallbackKHR", P(GL_DebugMessageCallbackKHR)},
-    {"glDebugMessageControl", P(GL_DebugMessageControl)},
-    {"glDebugMessageControlKHR", P(GL_DebugMessageControlKHR)},
-    {"glDebugMessageInsert", P(GL_DebugMessageInsert)},
-    {"glDebugMessageInsertKHR", P(GL_DebugMessageInsertKHR)},
-    {"glDeleteBuffers", P(GL_DeleteBuffers)},
-    {"glDeleteFencesNV", P(GL_DeleteFencesNV)},
-    {"glDeleteFramebuffers", P(GL_DeleteFramebuffers)},
-    {"glDeleteFramebuffersOES", P(GL_DeleteFramebuffersOES)},
-    {"glDeleteLists", P(GL_DeleteLists)},
-    {"glDeleteMemoryObjectsEXT", P(GL_DeleteMemoryObjectsEXT)},
-    {"glDeletePerfMonitorsAMD", P(GL_DeletePerfMonitorsAMD)},
-    {"glDeleteProgram", P(GL_DeleteProgram)},
-    {"glDeleteProgramPipelines", P(GL_DeleteProgramPipelines)},
+    {"glGetActiveSubroutineUniformiv", P(GL_GetActiveSubroutineUniformiv)},
+    {"glMultiTexCoord3dv", P(GL_MultiTexCoord3dv)},
+    {"glGetnPixelMapusv", P(GL_GetnPixelMapusv)},
     {"glDeleteProgramPipelinesEXT", P(GL_DeleteProgramPipelinesEXT)},
-    {"glDeleteQueries", P(GL_DeleteQueries)},
-    {"glDeleteQueriesEXT", P(GL_DeleteQueriesEXT)},
-    {"glDeleteRenderbuffers", P(GL_DeleteRenderbuffers)},
-    {"glDeleteRenderbuffersOES", P(GL_DeleteRenderbuffersOES)},
-    {"glDeleteSamplers", P(GL_DeleteSamplers)},
-    {"glDeleteSemaphoresEXT", P(GL_DeleteSemaphoresEXT)},
-    {"glDeleteShader", P(GL_DeleteShader)},
-    {"glDeleteSync", P(GL_DeleteSync)},
-    {"glDeleteTextures", P(GL_DeleteTextures)},
-    {"glDeleteTransformFeedbacks", P(GL_DeleteTransformFeedbacks)},
-    {"glDeleteVertexArrays", P(GL_DeleteVertexArrays)},
-    {"glDeleteVertexArraysOES", P(GL_DeleteVertexArraysOES)},
-    {"glDepthFunc", P(GL_DepthFunc)},
-    {"glDepthMask", P(GL_DepthMask)},
-    {"glDepthRange", P(GL_DepthRange)},
-    {"glDepthRangeArrayv", P(GL_DepthRangeArrayv)},
-    {"glDepthRangeIndexed", P(GL_DepthRangeIndexed)},
-    {"glDepthRangef", P(GL_DepthRangef)},
-    {"glDepthRangex", P(GL_DepthRangex)},
-    {"glDetachShader", P(GL_DetachShader)},
-    {"glDisable", P(GL_Disable)},
-    {"glDisableClientState", P(GL_DisableClientState)},
-    {"glDisableExtensionANGLE", P(GL_DisableExtensionANGLE)},
-    {"glDisableVertexArrayAttrib", P(GL_DisableVertexArrayAttrib)},
-    {"glDisableVertexAttribArray", P(GL_DisableVertexAttribArray)},
-    {"glDisablei", P(GL_Disablei)},
-    {"glDisableiEXT", P(GL_DisableiEXT)},
-    {"glDisableiOES", P(GL_DisableiOES)},
-    {"glDiscardFramebufferEXT", P(GL_DiscardFramebufferEXT)},
-    {"glDispatchCompute", P(GL_DispatchCompute)},
-    {"glDispatchComputeIndirect", P(GL_DispatchComputeIndirect)},
-    {"glDrawArrays", P(GL_DrawArrays)},
-    {"glDrawArraysIndirect", P(GL_DrawArraysIndirect)},
-    {"glDrawArraysInstanced", P(GL_DrawArraysInstanced)},
-    {"glDrawArraysInstancedANGLE", P(GL_DrawArraysInstancedANGLE)},
-    {"glDrawArraysInstancedBaseInstance", P(GL_DrawArraysInstancedBaseInstance)},
-    {"glDrawArraysInstancedBaseInstanceANGLE", P(GL_DrawArraysInstancedBaseInstanceANGLE)},
-    {"glDrawArraysInstancedBaseInstanceEXT", P(GL_DrawArraysInstancedBaseInstanceEXT)},
-    {"glDrawArraysInstancedEXT", P(GL_DrawArraysInstancedEXT)},
-    {"glDrawBuffer", P(GL_DrawBuffer)},
-    {"glDrawBuffers", P(GL_DrawBuffers)},
-    {"glDrawBuffersEXT", P(GL_DrawBuffersEXT)},
-    {"glDrawElements", P(GL_DrawElements)},
-    {"glDrawElementsBaseVertex", P(GL_DrawElementsBaseVertex)},
+    {"glCopyTexSubImage2D", P(GL_CopyTexSubImage2D)},
     {"glDrawElementsBaseVertexEXT", P(GL_DrawElementsBaseVertexEXT)},
-    {"glDrawElementsBaseVertexOES", P(GL_DrawElementsBaseVertexOES)},
-    {"glDrawElementsIndirect", P(GL_DrawElementsIndirect)},
-    {"glDrawElementsInstanced", P(GL_DrawElementsInstanced)},
-    {"glDrawElementsInstancedANGLE", P(GL_DrawElementsInstancedANGLE)},
-    {"glDrawElementsInstancedBaseInstance", P(GL_DrawElementsInstancedBaseInstance)},
-    {"glDrawElementsInstancedBaseInstanceEXT", P(GL_DrawElementsInstancedBaseInstanceEXT)},
-    {"glDrawElementsInstancedBaseVertex", P(GL_DrawElementsInstancedBaseVertex)},
-    {"glDrawElementsInstancedBaseVertexBaseInstance", P(GL_DrawElementsInstancedBaseVertexBaseInstance)},
-    {"glDrawElementsInstancedBaseVertexBaseInstanceANGLE", P(GL_DrawElementsInstancedBaseVertexBaseInstanceANGLE)},
-    {"glDrawElementsInstancedBaseVertexBaseInstanceEXT", P(GL_DrawElementsInstancedBaseVertexBaseInstanceEXT)},
-    {"glDrawElementsInstancedBaseVertexEXT", P(GL_DrawElementsInstancedBaseVertexEXT)},
-    {"glDrawElementsInstancedBaseVertexOES", P(GL_DrawElementsInstancedBaseVertexOES)},
-    {"glDrawElementsInstancedEXT", P(GL_DrawElementsInstancedEXT)},
-    {"glDrawPixels", P(GL_DrawPixels)},
-    {"glDrawRangeElements", P(GL_DrawRangeElements)},
-    {"glDrawRangeElementsBaseVertex", P(GL_DrawRangeElementsBaseVertex)},
-    {"glDrawRangeElementsBaseVertexEXT", P(GL_DrawRangeElementsBaseVertexEXT)},
-    {"glDrawRangeElementsBaseVertexOES", P(GL_DrawRangeElementsBaseVertexOES)},
-    {"glDrawTexfOES", P(GL_DrawTexfOES)},
-    {"glDrawTexfvOES", P(GL_DrawTexfvOES)},
-    {"glDrawTexiOES", P(GL_DrawTexiOES)},
-    {"glDrawTexivOES", P(GL_DrawTexivOES)},
-    {"glDrawTexsOES", P(GL_DrawTexsOES)},
-    {"glDrawTexsvOES", P(GL_DrawTexsvOES)},
-    {"glDrawTexxOES", P(GL_DrawTexxOES)},
-    {"glDrawTexxvOES", P(GL_DrawTexxvOES)},
-    {"glDrawTransformFeedback", P(GL_DrawTransformFeedback)},
-    {"glDrawTransformFeedbackInstanced", P(GL_DrawTransformFeedbackInstanced)},
-    {"glDrawTransformFeedbackStream", P(GL_DrawTransformFeedbackStream)},
-    {"glDrawTransformFeedbackStreamInstanced", P(GL_DrawTransformFeedbackStreamInstanced)},
-    {"glEGLImageTargetRenderbufferStorageOES", P(GL_EGLImageTargetRenderbufferStorageOES)},
-    {"glEGLImageTargetTexStorageEXT", P(GL_EGLImageTargetTexStorageEXT)},
-    {"glEGLImageTargetTexture2DOES", P(GL_EGLImageTargetTexture2DOES)},
-    {"glEGLImageTargetTextureStorageEXT", P(GL_EGLImageTargetTextureStorageEXT)},
-    {"glEdgeFlag", P(GL_EdgeFlag)},
-    {"glEdgeFlagPointer", P(GL_EdgeFlagPointer)},
-    {"glEdgeFlagv", P(GL_EdgeFlagv)},
-    {"glEnable", P(GL_Enable)},
-    {"glEnableClientState", P(GL_EnableClientState)},
-    {"glEnableVertexArrayAttrib", P(GL_EnableVertexArrayAttrib)},
-    {"glEnableVertexAttribArray", P(GL_EnableVertexAttribArray)},
-    {"glEnablei", P(GL_Enablei)},
-    {"glEnableiEXT", P(GL_EnableiEXT)},
-    {"glEnableiOES", P(GL_EnableiOES)},
-    {"glEnd", P(GL_End)},
-    {"glEndConditionalRender", P(GL_EndConditionalRender)},
-    {"glEndList", P(GL_EndList)},
-    {"glEndPerfMonitorAMD", P(GL_EndPerfMonitorAMD)},
-    {"glEndPixelLocalStorageANGLE", P(GL_EndPixelLocalStorageANGLE)},
-    {"glEndQuery", P(GL_EndQuery)},
-    {"glEndQueryEXT", P(GL_EndQueryEXT)},
-    {"glEndQueryIndexed", P(GL_EndQueryIndexed)},
-    {"glEndTilingQCOM", P(GL_EndTilingQCOM)},
-    {"glEndTransformFeedback", P(GL_EndTransformFeedback)},
+    {"glProgramUniform2fEXT", P(GL_ProgramUniform2fEXT)},
+    {"glVertexAttrib4Nuiv", P(GL_VertexAttrib4Nuiv)},
     {"glEvalCoord1d", P(GL_EvalCoord1d)},
-    {"glEvalCoord1dv", P(GL_EvalCoord1dv)},
-    {"glEvalCoord1f", P(GL_EvalCoord1f)},
-    {"glEvalCoord1fv", P(GL_EvalCoord1fv)},
-    {"glEvalCoord2d", P(GL_EvalCoord2d)},
-    {"glEvalCoord2dv", P(GL_EvalCoord2dv)},
-    {"glEvalCoord2f", P(GL_EvalCoord2f)},
-    {"glEvalCoord2fv", P(GL_EvalCoord2fv)},
-    {"glEvalMesh1", P(GL_EvalMesh1)},
-    {"glEvalMesh2", P(GL_EvalMesh2)},
-    {"glEvalPoint1", P(GL_EvalPoint1)},
-    {"glEvalPoint2", P(GL_EvalPoint2)},
-    {"glFeedbackBuffer", P(GL_FeedbackBuffer)},
-    {"glFenceSync", P(GL_FenceSync)},
-    {"glFinish", P(GL_Finish)},
-    {"glFinishFenceNV", P(GL_FinishFenceNV)},
-    {"glFlush", P(GL_Flush)},
-    {"glFlushMappedBufferRange", P(GL_FlushMappedBufferRange)},
-    {"glFlushMappedBufferRangeEXT", P(GL_FlushMappedBufferRangeEXT)},
-    {"glFlushMappedNamedBufferRange", P(GL_FlushMappedNamedBufferRange)},
-    {"glFogCoordPointer", P(GL_FogCoordPointer)},
-    {"glFogCoordd", P(GL_FogCoordd)},
-    {"glFogCoorddv", P(GL_FogCoorddv)},
-    {"glFogCoordf", P(GL_FogCoordf)},
-    {"glFogCoordfv", P(GL_FogCoordfv)},
-    {"glFogf", P(GL_Fogf)},
-    {"glFogfv", P(GL_Fogfv)},
-    {"glFogi", P(GL_Fogi)},
-    {"glFogiv", P(GL_Fogiv)},
-    {"glFogx", P(GL_Fogx)},
-    {"glFogxv", P(GL_Fogxv)},
-    {"glFramebufferFetchBarrierEXT", P(GL_FramebufferFetchBarrierEXT)},
-    {"glFramebufferFoveationConfigQCOM", P(GL_FramebufferFoveationConfigQCOM)},
-    {"glFramebufferFoveationParametersQCOM", P(GL_FramebufferFoveationParametersQCOM)},
-    {"glFramebufferMemorylessPixelLocalStorageANGLE", P(GL_FramebufferMemorylessPixelLocalStorageANGLE)},
-    {"glFramebufferParameteri", P(GL_FramebufferParameteri)},
-    {"glFramebufferParameteriMESA", P(GL_FramebufferParameteriMESA)},
-    {"glFramebufferPixelLocalClearValuefvANGLE", P(GL_FramebufferPixelLocalClearValuefvANGLE)},
-    {"glFramebufferPixelLocalClearValueivANGLE", P(GL_FramebufferPixelLocalClearValueivANGLE)},
-    {"glFramebufferPixelLocalClearValueuivANGLE", P(GL_FramebufferPixelLocalClearValueuivANGLE)},
-    {"glFramebufferPixelLocalStorageInterruptANGLE", P(GL_FramebufferPixelLocalStorageInterruptANGLE)},
-    {"glFramebufferPixelLocalStorageRestoreANGLE", P(GL_FramebufferPixelLocalStorageRestoreANGLE)},
-    {"glFramebufferRenderbuffer", P(GL_FramebufferRenderbuffer)},
-    {"glFramebufferRenderbufferOES", P(GL_FramebufferRenderbufferOES)},
-    {"glFramebufferTexture", P(GL_FramebufferTexture)},
-    {"glFramebufferTexture1D", P(GL_FramebufferTexture1D)},
-    {"glFramebufferTexture2D", P(GL_FramebufferTexture2D)},
-    {"glFramebufferTexture2DMultisampleEXT", P(GL_FramebufferTexture2DMultisampleEXT)},
-    {"glFramebufferTexture2DOES", P(GL_FramebufferTexture2DOES)},
-    {"glFramebufferTexture3D", P(GL_FramebufferTexture3D)},
-    {"glFramebufferTexture3DOES", P(GL_FramebufferTexture3DOES)},
-    {"glFramebufferTextureEXT", P(GL_FramebufferTextureEXT)},
-    {"glFramebufferTextureLayer", P(GL_FramebufferTextureLayer)},
-    {"glFramebufferTextureMultiviewOVR", P(GL_FramebufferTextureMultiviewOVR)},
-    {"glFramebufferTextureOES", P(GL_FramebufferTextureOES)},
-    {"glFramebufferTexturePixelLocalStorageANGLE", P(GL_FramebufferTexturePixelLocalStorageANGLE)},
-    {"glFrontFace", P(GL_FrontFace)},
-    {"glFrustum", P(GL_Frustum)},
-    {"glFrustumf", P(GL_Frustumf)},
-    {"glFrustumx", P(GL_Frustumx)},
-    {"glGenBuffers", P(GL_GenBuffers)},
-    {"glGenFencesNV", P(GL_GenFencesNV)},
-    {"glGenFramebuffers", P(GL_GenFramebuffers)},
-    {"glGenFramebuffersOES", P(GL_GenFramebuffersOES)},
-    {"glGenLists", P(GL_GenLists)},
-    {"glGenPerfMonitorsAMD", P(GL_GenPerfMonitorsAMD)},
-    {"glGenProgramPipelines", P(GL_GenProgramPipelines)},
-    {"glGenProgramPipelinesEXT", P(GL_GenProgramPipelinesEXT)},
-    {"glGenQueries", P(GL_GenQueries)},
-    {"glGenQueriesEXT", P(GL_GenQueriesEXT)},
-    {"glGenRenderbuffers", P(GL_GenRenderbuffers)},
-    {"glGenRenderbuffersOES", P(GL_GenRenderbuffersOES)},
-    {"glGenSamplers", P(GL_GenSamplers)},
-    {"glGenSemaphoresEXT", P(GL_GenSemaphoresEXT)},
-    {"glGenTextures", P(GL_GenTextures)},
-    {"glGenTransformFeedbacks", P(GL_GenTransformFeedbacks)},
-    {"glGenVertexArrays", P(GL_GenVertexArrays)},
-    {"glGenVertexArraysOES", P(GL_GenVertexArraysOES)},
-    {"glGenerateMipmap", P(GL_GenerateMipmap)},
-    {"glGenerateMipmapOES", P(GL_GenerateMipmapOES)},
-    {"glGenerateTextureMipmap", P(GL_GenerateTextureMipmap)},
-    {"glGetActiveAtomicCounterBufferiv", P(GL_GetActiveAtomicCounterBufferiv)},
-    {"glGetActiveAttrib", P(GL_GetActiveAttrib)},
-    {"glGetActiveSubroutineName", P(GL_GetActiveSubroutineName)},
-    {"glGetActiveSubroutineUniformName", P(GL_GetActiveSubroutineUniformName)},
-    {"glGetActiveSubroutineUniformiv", P(GL_GetActiveSubroutineUniformiv)},
-    {"glGetActiveUniform", P(GL_GetActiveUniform)},
-    {"glGetActiveUniformBlockName", P(GL_GetActiveUniformBlockName)},
-    {"glGetActiveUniformBlockiv", P(GL_GetActiveUniformBlockiv)},
-    {"glGetActiveUniformBlockivRobustANGLE", P(GL_GetActiveUniformBlockivRobustANGLE)},
-    {"glGetActiveUniformName", P(GL_GetActiveUniformName)},
-    {"glGetActiveUniformsiv", P(GL_GetActiveUniformsiv)},
-    {"glGetAttachedShaders", P(GL_GetAttachedShaders)},
-    {"glGetAttribLocation", P(GL_GetAttribLocation)},
-    {"glGetBooleani_v", P(GL_GetBooleani_v)},
-    {"glGetBooleani_vRobustANGLE", P(GL_GetBooleani_vRobustANGLE)},
-    {"glGetBooleanv", P(GL_GetBooleanv)},
-    {"glGetBooleanvRobustANGLE", P(GL_GetBooleanvRobustANGLE)},
-    {"glGetBufferParameteri64v", P(GL_GetBufferParameteri64v)},
-    {"glGetBufferParameteri64vRobustANGLE", P(GL_GetBufferParameteri64vRobustANGLE)},
-    {"glGetBufferParameteriv", P(GL_GetBufferParameteriv)},
-    {"glGetBufferParameterivRobustANGLE", P(GL_GetBufferParameterivRobustANGLE)},
-    {"glGetBufferPointerv", P(GL_GetBufferPointerv)},
-    {"glGetBufferPointervOES", P(GL_GetBufferPointervOES)},
-    {"glGetBufferPointervRobustANGLE", P(GL_GetBufferPointervRobustANGLE)},
-    {"glGetBufferSubData", P(GL_GetBufferSubData)},
-    {"glGetClipPlane", P(GL_GetClipPlane)},
-    {"glGetClipPlanef", P(GL_GetClipPlanef)},
-    {"glGetClipPlanex", P(GL_GetClipPlanex)},
-    {"glGetCompressedTexImage", P(GL_GetCompressedTexImage)},
-    {"glGetCompressedTexImageANGLE", P(GL_GetCompressedTexImageANGLE)},
-    {"glGetCompressedTextureImage", P(GL_GetCompressedTextureImage)},
-    {"glGetCompressedTextureSubImage", P(GL_GetCompressedTextureSubImage)},
-    {"glGetDebugMessageLog", P(GL_GetDebugMessageLog)},
-    {"glGetDebugMessageLogKHR", P(GL_GetDebugMessageLogKHR)},
-    {"glGetDoublei_v", P(GL_GetDoublei_v)},
-    {"glGetDoublev", P(GL_GetDoublev)},
-    {"glGetError", P(GL_GetError)},
-    {"glGetFenceivNV", P(GL_GetFenceivNV)},
-    {"glGetFixedv", P(GL_GetFixedv)},
-    {"glGetFloati_v", P(GL_GetFloati_v)},
-    {"glGetFloatv", P(GL_GetFloatv)},
-    {"glGetFloatvRobustANGLE", P(GL_GetFloatvRobustANGLE)},
-    {"glGetFragDataIndex", P(GL_GetFragDataIndex)},
-    {"glGetFragDataIndexEXT", P(GL_GetFragDataIndexEXT)},
-    {"glGetFragDataLocation", P(GL_GetFragDataLocation)},
-    {"glGetFramebufferAttachmentParameteriv", P(GL_GetFramebufferAttachmentParameteriv)},
-    {"glGetFramebufferAttachmentParameterivOES", P(GL_GetFramebufferAttachmentParameterivOES)},
-    {"glGetFramebufferAttachmentParameterivRobustANGLE", P(GL_GetFramebufferAttachmentParameterivRobustANGLE)},
-    {"glGetFramebufferParameteriv", P(GL_GetFramebufferParameteriv)},
-    {"glGetFramebufferParameterivMESA", P(GL_GetFramebufferParameterivMESA)},
-    {"glGetFramebufferParameterivRobustANGLE", P(GL_GetFramebufferParameterivRobustANGLE)},
-    {"glGetFramebufferPixelLocalStorageParameterfvANGLE", P(GL_GetFramebufferPixelLocalStorageParameterfvANGLE)},
-    {"glGetFramebufferPixelLocalStorageParameterfvRobustANGLE", P(GL_GetFramebufferPixelLocalStorageParameterfvRobustANGLE)},
-    {"glGetFramebufferPixelLocalStorageParameterivANGLE", P(GL_GetFramebufferPixelLocalStorageParameterivANGLE)},
-    {"glGetFramebufferPixelLocalStorageParameterivRobustANGLE", P(GL_GetFramebufferPixelLocalStorageParameterivRobustANGLE)},
-    {"glGetGraphicsResetStatus", P(GL_GetGraphicsResetStatus)},
-    {"glGetGraphicsResetStatusEXT", P(GL_GetGraphicsResetStatusEXT)},
-    {"glGetGraphicsResetStatusKHR", P(GL_GetGraphicsResetStatusKHR)},
-    {"glGetInteger64i_v", P(GL_GetInteger64i_v)},
-    {"glGetInteger64i_vRobustANGLE", P(GL_GetInteger64i_vRobustANGLE)},
-    {"glGetInteger64v", P(GL_GetInteger64v)},
-    {"glGetInteger64vEXT", P(GL_GetInteger64vEXT)},
-    {"glGetInteger64vRobustANGLE", P(GL_GetInteger64vRobustANGLE)},
-    {"glGetIntegeri_v", P(GL_GetIntegeri_v)},
-    {"glGetIntegeri_vRobustANGLE", P(GL_GetIntegeri_vRobustANGLE)},
-    {"glGetIntegerv", P(GL_GetIntegerv)},
-    {"glGetIntegervRobustANGLE", P(GL_GetIntegervRobustANGLE)},
-    {"glGetInternalformati64v", P(GL_GetInternalformati64v)},
-    {"glGetInternalformativ", P(GL_GetInternalformativ)},
-    {"glGetInternalformativRobustANGLE", P(GL_GetInternalformativRobustANGLE)},
-    {"glGetLightfv", P(GL_GetLightfv)},
-    {"glGetLightiv", P(GL_GetLightiv)},
-    {"glGetLightxv", P(GL_GetLightxv)},
-    {"glGetMapdv", P(GL_GetMapdv)},
-    {"glGetMapfv", P(GL_GetMapfv)},
-    {"glGetMapiv", P(GL_GetMapiv)},
-    {"glGetMaterialfv", P(GL_GetMaterialfv)},
-    {"glGetMaterialiv", P(GL_GetMaterialiv)},
-    {"glGetMaterialxv", P(GL_GetMaterialxv)},
-    {"glGetMemoryObjectParameterivEXT", P(GL_GetMemoryObjectParameterivEXT)},
-    {"glGetMultisamplefv", P(GL_GetMultisamplefv)},
-    {"glGetMultisamplefvANGLE", P(GL_GetMultisamplefvANGLE)},
-    {"glGetMultisamplefvRobustANGLE", P(GL_GetMultisamplefvRobustANGLE)},
-    {"glGetNamedBufferParameteri64v", P(GL_GetNamedBufferParameteri64v)},
-    {"glGetNamedBufferParameteriv", P(GL_GetNamedBufferParameteriv)},
-    {"glGetNamedBufferPointerv", P(GL_GetNamedBufferPointerv)},
-    {"glGetNamedBufferSubData", P(GL_GetNamedBufferSubData)},
-    {"glGetNamedFramebufferAttachmentParameteriv", P(GL_GetNamedFramebufferAttachmentParameteriv)},
-    {"glGetNamedFramebufferParameteriv", P(GL_GetNamedFramebufferParameteriv)},
-    {"glGetNamedRenderbufferParameteriv", P(GL_GetNamedRenderbufferParameteriv)},
-    {"glGetObjectLabel", P(GL_GetObjectLabel)},
-    {"glGetObjectLabelEXT", P(GL_GetObjectLabelEXT)},
-    {"glGetObjectLabelKHR", P(GL_GetObjectLabelKHR)},
-    {"glGetObjectPtrLabel", P(GL_GetObjectPtrLabel)},
-    {"glGetObjectPtrLabelKHR", P(GL_GetObjectPtrLabelKHR)},
-    {"glGetPerfMonitorCounterDataAMD", P(GL_GetPerfMonitorCounterDataAMD)},
-    {"glGetPerfMonitorCounterInfoAMD", P(GL_GetPerfMonitorCounterInfoAMD)},
-    {"glGetPerfMonitorCounterStringAMD", P(GL_GetPerfMonitorCounterStringAMD)},
-    {"glGetPerfMonitorCountersAMD", P(GL_GetPerfMonitorCountersAMD)},
-    {"glGetPerfMonitorGroupStringAMD", P(GL_GetPerfMonitorGroupStringAMD)},
-    {"glGetPerfMonitorGroupsAMD", P(GL_GetPerfMonitorGroupsAMD)},
-    {"glGetPixelMapfv", P(GL_GetPixelMapfv)},
-    {"glGetPixelMapuiv", P(GL_GetPixelMapuiv)},
-    {"glGetPixelMapusv", P(GL_GetPixelMapusv)},
-    {"glGetPointerv", P(GL_GetPointerv)},
-    {"glGetPointervKHR", P(GL_GetPointervKHR)},
-    {"glGetPointervRobustANGLERobustANGLE", P(GL_GetPointervRobustANGLERobustANGLE)},
-    {"glGetPolygonStipple", P(GL_GetPolygonStipple)},
-    {"glGetProgramBinary", P(GL_GetProgramBinary)},
-    {"glGetProgramBinaryOES", P(GL_GetProgramBinaryOES)},
-    {"glGetProgramInfoLog", P(GL_GetProgramInfoLog)},
-    {"glGetProgramInterfaceiv", P(GL_GetProgramInterfaceiv)},
-    {"glGetProgramInterfaceivRobustANGLE", P(GL_GetProgramInterfaceivRobustANGLE)},
-    {"glGetProgramPipelineInfoLog", P(GL_GetProgramPipelineInfoLog)},
-    {"glGetProgramPipelineInfoLogEXT", P(GL_GetProgramPipelineInfoLogEXT)},
-    {"glGetProgramPipelineiv", P(GL_GetProgramPipelineiv)},
-    {"glGetProgramPipelineivEXT", P(GL_GetProgramPipelineivEXT)},
-    {"glGetProgramResourceIndex", P(GL_GetProgramResourceIndex)},
-    {"glGetProgramResourceLocation", P(GL_GetProgramResourceLocation)},
-    {"glGetProgramResourceLocationIndex", P(GL_GetProgramResourceLocationIndex)},
-    {"glGetProgramResourceLocationIndexEXT", P(GL_GetProgramResourceLocationIndexEXT)},
-    {"glGetProgramResourceName", P(GL_GetProgramResourceName)},
-    {"glGetProgramResourceiv", P(GL_GetProgramResourceiv)},
-    {"glGetProgramStageiv", P(GL_GetProgramStageiv)},
-    {"glGetProgramiv", P(GL_GetProgramiv)},
-    {"glGetProgramivRobustANGLE", P(GL_GetProgramivRobustANGLE)},
-    {"glGetQueryBufferObjecti64v", P(GL_GetQueryBufferObjecti64v)},
-    {"glGetQueryBufferObjectiv", P(GL_GetQueryBufferObjectiv)},
-    {"glGetQueryBufferObjectui64v", P(GL_GetQueryBufferObjectui64v)},
-    {"glGetQueryBufferObjectuiv", P(GL_GetQueryBufferObjectuiv)},
-    {"glGetQueryIndexediv", P(GL_GetQueryIndexediv)},
-    {"glGetQueryObjecti64v", P(GL_GetQueryObjecti64v)},
-    {"glGetQueryObjecti64vEXT", P(GL_GetQueryObjecti64vEXT)},
-    {"glGetQueryObjecti64vRobustANGLE", P(GL_GetQueryObjecti64vRobustANGLE)},
-    {"glGetQueryObjectiv", P(GL_GetQueryObjectiv)},
-    {"glGetQueryObjectivEXT", P(GL_GetQueryObjectivEXT)},
-    {"glGetQueryObjectivRobustANGLE", P(GL_GetQueryObjectivRobustANGLE)},
-    {"glGetQueryObjectui64v", P(GL_GetQueryObjectui64v)},
-    {"glGetQueryObjectui64vEXT", P(GL_GetQueryObjectui64vEXT)},
-    {"glGetQueryObjectui64vRobustANGLE", P(GL_GetQueryObjectui64vRobustANGLE)},
-    {"glGetQueryObjectuiv", P(GL_GetQueryObjectuiv)},
-    {"glGetQueryObjectuivEXT", P(GL_GetQueryObjectuivEXT)},
-    {"glGetQueryObjectuivRobustANGLE", P(GL_GetQueryObjectuivRobustANGLE)},
-    {"glGetQueryiv", P(GL_GetQueryiv)},
-    {"glGetQueryivEXT", P(GL_GetQueryivEXT)},
-    {"glGetQueryivRobustANGLE", P(GL_GetQueryivRobustANGLE)},
-    {"glGetRenderbufferImageANGLE", P(GL_GetRenderbufferImageANGLE)},
-    {"glGetRenderbufferParameteriv", P(GL_GetRenderbufferParameteriv)},
-    {"glGetRenderbufferParameterivOES", P(GL_GetRenderbufferParameterivOES)},
-    {"glGetRenderbufferParameterivRobustANGLE", P(GL_GetRenderbufferParameterivRobustANGLE)},
-    {"glGetSamplerParameterIiv", P(GL_GetSamplerParameterIiv)},
-    {"glGetSamplerParameterIivEXT", P(GL_GetSamplerParameterIivEXT)},
-    {"glGetSamplerParameterIivOES", P(GL_GetSamplerParameterIivOES)},
-    {"glGetSamplerParameterIivRobustANGLE", P(GL_GetSamplerParameterIivRobustANGLE)},
-    {"glGetSamplerParameterIuiv", P(GL_GetSamplerParameterIuiv)},
-    {"glGetSamplerParameterIuivEXT", P(GL_GetSamplerParameterIuivEXT)},
-    {"glGetSamplerParameterIuivOES", P(GL_GetSamplerParameterIuivOES)},
-    {"glGetSamplerParameterIuivRobustANGLE", P(GL_GetSamplerParameterIuivRobustANGLE)},
-    {"glGetSamplerParameterfv", P(GL_GetSamplerParameterfv)},
-    {"glGetSamplerParameterfvRobustANGLE", P(GL_GetSamplerParameterfvRobustANGLE)},
-    {"glGetSamplerParameteriv", P(GL_GetSamplerParameteriv)},
-    {"glGetSamplerParameterivRobustANGLE", P(GL_GetSamplerParameterivRobustANGLE)},
-    {"glGetSemaphoreParameterui64vEXT", P(GL_GetSemaphoreParameterui64vEXT)},
-    {"glGetShaderInfoLog", P(GL_GetShaderInfoLog)},
-    {"glGetShaderPrecisionFormat", P(GL_GetShaderPrecisionFormat)},
-    {"glGetShaderSource", P(GL_GetShaderSource)},
-    {"glGetShaderiv", P(GL_GetShaderiv)},
-    {"glGetShaderivRobustANGLE", P(GL_GetShaderivRobustANGLE)},
-    {"glGetString", P(GL_GetString)},
-    {"glGetStringi", P(GL_GetStringi)},
-    {"glGetSubroutineIndex", P(GL_GetSubroutineIndex)},
-    {"glGetSubroutineUniformLocation", P(GL_GetSubroutineUniformLocation)},
-    {"glGetSynciv", P(GL_GetSynciv)},
-    {"glGetTexEnvfv", P(GL_GetTexEnvfv)},
-    {"glGetTexEnviv", P(GL_GetTexEnviv)},
-    {"glGetTexEnvxv", P(GL_GetTexEnvxv)},
-    {"glGetTexGendv", P(GL_GetTexGendv)},
-    {"glGetTexGenfv", P(GL_GetTexGenfv)},
-    {"glGetTexGenfvOES", P(GL_GetTexGenfvOES)},
-    {"glGetTexGeniv", P(GL_GetTexGeniv)},
-    {"glGetTexGenivOES", P(GL_GetTexGenivOES)},
-    {"glGetTexGenxvOES", P(GL_GetTexGenxvOES)},
-    {"glGetTexImage", P(GL_GetTexImage)},
-    {"glGetTexImageANGLE", P(GL_GetTexImageANGLE)},
-    {"glGetTexLevelParameterfv", P(GL_GetTexLevelParameterfv)},
-    {"glGetTexLevelParameterfvANGLE", P(GL_GetTexLevelParameterfvANGLE)},
-    {"glGetTexLevelParameterfvRobustANGLE", P(GL_GetTexLevelParameterfvRobustANGLE)},
-    {"glGetTexLevelParameteriv", P(GL_GetTexLevelParameteriv)},
-    {"glGetTexLevelParameterivANGLE", P(GL_GetTexLevelParameterivANGLE)},
-    {"glGetTexLevelParameterivRobustANGLE", P(GL_GetTexLevelParameterivRobustANGLE)},
-    {"glGetTexParameterIiv", P(GL_GetTexParameterIiv)},
-    {"glGetTexParameterIivEXT", P(GL_GetTexParameterIivEXT)},
-    {"glGetTexParameterIivOES", P(GL_GetTexParameterIivOES)},
-    {"glGetTexParameterIivRobustANGLE", P(GL_GetTexParameterIivRobustANGLE)},
-    {"glGetTexParameterIuiv", P(GL_GetTexParameterIuiv)},
-    {"glGetTexParameterIuivEXT", P(GL_GetTexParameterIuivEXT)},
-    {"glGetTexParameterIuivOES", P(GL_GetTexParameterIuivOES)},
-    {"glGetTexParameterIuivRobustANGLE", P(GL_GetTexParameterIuivRobustANGLE)},
-    {"glGetTexParameterfv", P(GL_GetTexParameterfv)},
-    {"glGetTexParameterfvRobustANGLE", P(GL_GetTexParameterfvRobustANGLE)},
-    {"glGetTexParameteriv", P(GL_GetTexParameteriv)},
-    {"glGetTexParameterivRobustANGLE", P(GL_GetTexParameterivRobustANGLE)},
-    {"glGetTexParameterxv", P(GL_GetTexParameterxv)},
-    {"glGetTextureImage", P(GL_GetTextureImage)},
-    {"glGetTextureLevelParameterfv", P(GL_GetTextureLevelParameterfv)},
-    {"glGetTextureLevelParameteriv", P(GL_GetTextureLevelParameteriv)},
-    {"glGetTextureParameterIiv", P(GL_GetTextureParameterIiv)},
-    {"glGetTextureParameterIuiv", P(GL_GetTextureParameterIuiv)},
-    {"glGetTextureParameterfv", P(GL_GetTextureParameterfv)},
-    {"glGetTextureParameteriv", P(GL_GetTextureParameteriv)},
-    {"glGetTextureSubImage", P(GL_GetTextureSubImage)},
-    {"glGetTransformFeedbackVarying", P(GL_GetTransformFeedbackVarying)},
-    {"glGetTransformFeedbacki64_v", P(GL_GetTransformFeedbacki64_v)},
-    {"glGetTransformFeedbacki_v", P(GL_GetTransformFeedbacki_v)},
-    {"glGetTransformFeedbackiv", P(GL_GetTransformFeedbackiv)},
-    {"glGetTranslatedShaderSourceANGLE", P(GL_GetTranslatedShaderSourceANGLE)},
-    {"glGetUniformBlockIndex", P(GL_GetUniformBlockIndex)},
-    {"glGetUniformIndices", P(GL_GetUniformIndices)},
-    {"glGetUniformLocation", P(GL_GetUniformLocation)},
-    {"glGetUniformSubroutineuiv", P(GL_GetUniformSubroutineuiv)},
-    {"glGetUniformdv", P(GL_GetUniformdv)},
-    {"glGetUniformfv", P(GL_GetUniformfv)},
-    {"glGetUniformfvRobustANGLE", P(GL_GetUniformfvRobustANGLE)},
-    {"glGetUniformiv", P(GL_GetUniformiv)},
-    {"glGetUniformivRobustANGLE", P(GL_GetUniformivRobustANGLE)},
-    {"glGetUniformuiv", P(GL_GetUniformuiv)},
-    {"glGetUniformuivRobustANGLE", P(GL_GetUniformuivRobustANGLE)},
-    {"glGetUnsignedBytei_vEXT", P(GL_GetUnsignedBytei_vEXT)},
-    {"glGetUnsignedBytevEXT", P(GL_GetUnsignedBytevEXT)},
-    {"glGetVertexArrayIndexed64iv", P(GL_GetVertexArrayIndexed64iv)},
-    {"glGetVertexArrayIndexediv", P(GL_GetVertexArrayIndexediv)},
-    {"glGetVertexArrayiv", P(GL_GetVertexArrayiv)},
-    {"glGetVertexAttribIiv", P(GL_GetVertexAttribIiv)},
-    {"glGetVertexAttribIivRobustANGLE", P(GL_GetVertexAttribIivRobustANGLE)},
-    {"glGetVertexAttribIuiv", P(GL_GetVertexAttribIuiv)},
-    {"glGetVertexAttribIuivRobustANGLE", P(GL_GetVertexAttribIuivRobustANGLE)},
-    {"glGetVertexAttribLdv", P(GL_GetVertexAttribLdv)},
-    {"glGetVertexAttribPointerv", P(GL_GetVertexAttribPointerv)},
-    {"glGetVertexAttribPointervRobustANGLE", P(GL_GetVertexAttribPointervRobustANGLE)},
-    {"glGetVertexAttribdv", P(GL_GetVertexAttribdv)},
-    {"glGetVertexAttribfv", P(GL_GetVertexAttribfv)},
-    {"glGetVertexAttribfvRobustANGLE", P(GL_GetVertexAttribfvRobustANGLE)},
-    {"glGetVertexAttribiv", P(GL_GetVertexAttribiv)},
-    {"glGetVertexAttribivRobustANGLE", P(GL_GetVertexAttribivRobustANGLE)},
-    {"glGetnColorTable", P(GL_GetnColorTable)},
-    {"glGetnCompressedTexImage", P(GL_GetnCompressedTexImage)},
-    {"glGetnConvolutionFilter", P(GL_GetnConvolutionFilter)},
-    {"glGetnHistogram", P(GL_GetnHistogram)},
-    {"glGetnMapdv", P(GL_GetnMapdv)},
-    {"glGetnMapfv", P(GL_GetnMapfv)},
-    {"glGetnMapiv", P(GL_GetnMapiv)},
-    {"glGetnMinmax", P(GL_GetnMinmax)},
-    {"glGetnPixelMapfv", P(GL_GetnPixelMapfv)},
-    {"glGetnPixelMapuiv", P(GL_GetnPixelMapuiv)},
-    {"glGetnPixelMapusv", P(GL_GetnPixelMapusv)},
-    {"glGetnPolygonStipple", P(GL_GetnPolygonStipple)},
-    {"glGetnSeparableFilter", P(GL_GetnSeparableFilter)},
-    {"glGetnTexImage", P(GL_GetnTexImage)},
-    {"glGetnUniformdv", P(GL_GetnUniformdv)},
-    {"glGetnUniformfv", P(GL_GetnUniformfv)},
-    {"glGetnUniformfvEXT", P(GL_GetnUniformfvEXT)},
-    {"glGetnUniformfvKHR", P(GL_GetnUniformfvKHR)},
-    {"glGetnUniformfvRobustANGLE", P(GL_GetnUniformfvRobustANGLE)},
-    {"glGetnUniformiv", P(GL_GetnUniformiv)},
-    {"glGetnUniformivEXT", P(GL_GetnUniformivEXT)},
-    {"glGetnUniformivKHR", P(GL_GetnUniformivKHR)},
-    {"glGetnUniformivRobustANGLE", P(GL_GetnUniformivRobustANGLE)},
-    {"glGetnUniformuiv", P(GL_GetnUniformuiv)},
-    {"glGetnUniformuivKHR", P(GL_GetnUniformuivKHR)},
-    {"glGetnUniformuivRobustANGLE", P(GL_GetnUniformuivRobustANGLE)},
-    {"glHint", P(GL_Hint)},
-    {"glImportMemoryFdEXT", P(GL_ImportMemoryFdEXT)},
-    {"glImportMemoryZirconHandleANGLE", P(GL_ImportMemoryZirconHandleANGLE)},
-    {"glImportSemaphoreFdEXT", P(GL_ImportSemaphoreFdEXT)},
-    {"glImportSemaphoreZirconHandleANGLE", P(GL_ImportSemaphoreZirconHandleANGLE)},
-    {"glIndexMask", P(GL_IndexMask)},
-    {"glIndexPointer", P(GL_IndexPointer)},
-    {"glIndexd", P(GL_Indexd)},
-    {"glIndexdv", P(GL_Indexdv)},
-    {"glIndexf", P(GL_Indexf)},
-    {"glIndexfv", P(GL_Indexfv)},
-    {"glIndexi", P(GL_Indexi)},
-    {"glIndexiv", P(GL_Indexiv)},
-    {"glIndexs", P(GL_Indexs)},
-    {"glIndexsv", P(GL_Indexsv)},
-    {"glIndexub", P(GL_Indexub)},
-    {"glIndexubv", P(GL_Indexubv)},
-    {"glInitNames", P(GL_InitNames)},
-    {"glInsertEventMarkerEXT", P(GL_InsertEventMarkerEXT)},
-    {"glInterleavedArrays", P(GL_InterleavedArrays)},
-    {"glInvalidateBufferData", P(GL_InvalidateBufferData)},
-    {"glInvalidateBufferSubData", P(GL_InvalidateBufferSubData)},
-    {"glInvalidateFramebuffer", P(GL_InvalidateFramebuffer)},
-    {"glInvalidateNamedFramebufferData", P(GL_InvalidateNamedFramebufferData)},
-    {"glInvalidateNamedFramebufferSubData", P(GL_InvalidateNamedFramebufferSubData)},
-    {"glInvalidateSubFramebuffer", P(GL_InvalidateSubFramebuffer)},
-    {"glInvalidateTexImage", P(GL_InvalidateTexImage)},
-    {"glInvalidateTexSubImage", P(GL_InvalidateTexSubImage)},
-    {"glInvalidateTextureANGLE", P(GL_InvalidateTextureANGLE)},
-    {"glIsBuffer", P(GL_IsBuffer)},
-    {"glIsEnabled", P(GL_IsEnabled)},
-    {"glIsEnabledi", P(GL_IsEnabledi)},
-    {"glIsEnablediEXT", P(GL_IsEnablediEXT)},
-    {"glIsEnablediOES", P(GL_IsEnablediOES)},
-    {"glIsFenceNV", P(GL_IsFenceNV)},
-    {"glIsFramebuffer", P(GL_IsFramebuffer)},
-    {"glIsFramebufferOES", P(GL_IsFramebufferOES)},
-    {"glIsList", P(GL_IsList)},
-    {"glIsMemoryObjectEXT", P(GL_IsMemoryObjectEXT)},
-    {"glIsProgram", P(GL_IsProgram)},
-    {"glIsProgramPipeline", P(GL_IsProgramPipeline)},
-    {"glIsProgramPipelineEXT", P(GL_IsProgramPipelineEXT)},
-    {"glIsQuery", P(GL_IsQuery)},
-    {"glIsQueryEXT", P(GL_IsQueryEXT)},
-    {"glIsRenderbuffer", P(GL_IsRenderbuffer)},
-    {"glIsRenderbufferOES", P(GL_IsRenderbufferOES)},
-    {"glIsSampler", P(GL_IsSampler)},
-    {"glIsSemaphoreEXT", P(GL_IsSemaphoreEXT)},
-    {"glIsShader", P(GL_IsShader)},
-    {"glIsSync", P(GL_IsSync)},
-    {"glIsTexture", P(GL_IsTexture)},
-    {"glIsTransformFeedback", P(GL_IsTransformFeedback)},
-    {"glIsVertexArray", P(GL_IsVertexArray)},
-    {"glIsVertexArrayOES", P(GL_IsVertexArrayOES)},
-    {"glLabelObjectEXT", P(GL_LabelObjectEXT)},
-    {"glLightModelf", P(GL_LightModelf)},
-    {"glLightModelfv", P(GL_LightModelfv)},
-    {"glLightModeli", P(GL_LightModeli)},
-    {"glLightModeliv", P(GL_LightModeliv)},
-    {"glLightModelx", P(GL_LightModelx)},
-    {"glLightModelxv", P(GL_LightModelxv)},
-    {"glLightf", P(GL_Lightf)},
-    {"glLightfv", P(GL_Lightfv)},
-    {"glLighti", P(GL_Lighti)},
-    {"glLightiv", P(GL_Lightiv)},
-    {"glLightx", P(GL_Lightx)},
-    {"glLightxv", P(GL_Lightxv)},
-    {"glLineStipple", P(GL_LineStipple)},
-    {"glLineWidth", P(GL_LineWidth)},
-    {"glLineWidthx", P(GL_LineWidthx)},
-    {"glLinkProgram", P(GL_LinkProgram)},
+    {"glTexCoord2sv", P(GL_TexCoord2sv)},
+    {"glMultiTexCoord3sv", P(GL_MultiTexCoord3sv)},
+    {"glProgramUniformMatrix3dv", P(GL_ProgramUniformMatrix3dv)},
+    {"glResumeTransformFeedback", P(GL_ResumeTransformFeedback)},
     {"glListBase", P(GL_ListBase)},
-    {"glLoadIdentity", P(GL_LoadIdentity)},
-    {"glLoadMatrixd", P(GL_LoadMatrixd)},
+    {"glVertex2i", P(GL_Vertex2i)},
+    {"glMultiDrawArraysIndirect", P(GL_MultiDrawArraysIndirect)},
+    {"glLightModelxv", P(GL_LightModelxv)},
+    {"glVertex4i", P(GL_Vertex4i)},
+    {"glIsBuffer", P(GL_IsBuffer)},
+    {"glMultiTexCoord1f", P(GL_MultiTexCoord1f)},
+    {"glGenRenderbuffers", P(GL_GenRenderbuffers)},
+    {"glProgramUniform4ivEXT", P(GL_ProgramUniform4ivEXT)},
+    {"glXCreatePixmap", P(glXCreatePixmap)},
+    {"glTexParameterxv", P(GL_TexParameterxv)},
+    {"glNamedBufferStorageExternalEXT", P(GL_NamedBufferStorageExternalEXT)},
+    {"glDrawElementsInstancedBaseVertexOES", P(GL_DrawElementsInstancedBaseVertexOES)},
+    {"glNormal3iv", P(GL_Normal3iv)},
+    {"glGetTextureImage", P(GL_GetTextureImage)},
+    {"glTexSubImage2DRobustANGLE", P(GL_TexSubImage2DRobustANGLE)},
+    {"glBindUniformLocationCHROMIUM", P(GL_BindUniformLocationCHROMIUM)},
+    {"glGetTransformFeedbacki64_v", P(GL_GetTransformFeedbacki64_v)},
+    {"glGetShaderInfoLog", P(GL_GetShaderInfoLog)},
     {"glLoadMatrixf", P(GL_LoadMatrixf)},
-    {"glLoadMatrixx", P(GL_LoadMatrixx)},
+    {"glRasterPos4f", P(GL_RasterPos4f)},
+    {"glMultiTexCoord4x", P(GL_MultiTexCoord4x)},
+    {"glVertexP4uiv", P(GL_VertexP4uiv)},
+    {"glGetObjectPtrLabel", P(GL_GetObjectPtrLabel)},
+    {"glProgramUniform2uiEXT", P(GL_ProgramUniform2uiEXT)},
     {"glLoadName", P(GL_LoadName)},
-    {"glLoadPaletteFromModelViewMatrixOES", P(GL_LoadPaletteFromModelViewMatrixOES)},
-    {"glLoadTransposeMatrixd", P(GL_LoadTransposeMatrixd)},
-    {"glLoadTransposeMatrixf", P(GL_LoadTransposeMatrixf)},
-    {"glLogicOp", P(GL_LogicOp)},
-    {"glLogicOpANGLE", P(GL_LogicOpANGLE)},
-    {"glLoseContextCHROMIUM", P(GL_LoseContextCHROMIUM)},
-    {"glMap1d", P(GL_Map1d)},
-    {"glMap1f", P(GL_Map1f)},
-    {"glMap2d", P(GL_Map2d)},
-    {"glMap2f", P(GL_Map2f)},
-    {"glMapBuffer", P(GL_MapBuffer)},
-    {"glMapBufferOES", P(GL_MapBufferOES)},
-    {"glMapBufferRange", P(GL_MapBufferRange)},
-    {"glMapBufferRangeEXT", P(GL_MapBufferRangeEXT)},
-    {"glMapGrid1d", P(GL_MapGrid1d)},
-    {"glMapGrid1f", P(GL_MapGrid1f)},
+    {"glGetQueryObjectui64v", P(GL_GetQueryObjectui64v)},
+    {"glVertexP3uiv", P(GL_VertexP3uiv)},
     {"glMapGrid2d", P(GL_MapGrid2d)},
-    {"glMapGrid2f", P(GL_MapGrid2f)},
-    {"glMapNamedBuffer", P(GL_MapNamedBuffer)},
-    {"glMapNamedBufferRange", P(GL_MapNamedBufferRange)},
-    {"glMaterialf", P(GL_Materialf)},
-    {"glMaterialfv", P(GL_Materialfv)},
-    {"glMateriali", P(GL_Materiali)},
+    {"glBlendFunci", P(GL_BlendFunci)},
+    {"ANGLEResetDisplayPlatform", P(ANGLEResetDisplayPlatform)},
+    {"glDetachShader", P(GL_DetachShader)},
+    {"glPointParameteriv", P(GL_PointParameteriv)},
+    {"glXChooseFBConfig", P(glXChooseFBConfig)},
+    {"glPopMatrix", P(GL_PopMatrix)},
+    {"glDisableExtensionANGLE", P(GL_DisableExtensionANGLE)},
+    {"glBindFragDataLocationIndexed", P(GL_BindFragDataLocationIndexed)},
+    {"glTexSubImage1D", P(GL_TexSubImage1D)},
+    {"glGetTransformFeedbackVarying", P(GL_GetTransformFeedbackVarying)},
+    {"glShadeModel", P(GL_ShadeModel)},
+    {"glRequestExtensionANGLE", P(GL_RequestExtensionANGLE)},
+    {"glRasterPos2d", P(GL_RasterPos2d)},
+    {"glTexCoord2d", P(GL_TexCoord2d)},
+    {"glProgramUniform3fEXT", P(GL_ProgramUniform3fEXT)},
+    {"glMultiTexCoordP4uiv", P(GL_MultiTexCoordP4uiv)},
+    {"glGenProgramPipelinesEXT", P(GL_GenProgramPipelinesEXT)},
+    {"glIsEnablediOES", P(GL_IsEnablediOES)},
+    {"glLoadTransposeMatrixf", P(GL_LoadTransposeMatrixf)},
+    {"glGetTexParameterIivOES", P(GL_GetTexParameterIivOES)},
+    {"glGetTexParameterfvRobustANGLE", P(GL_GetTexParameterfvRobustANGLE)},
+    {"glCurrentPaletteMatrixOES", P(GL_CurrentPaletteMatrixOES)},
+    {"glProgramUniformMatrix3x2fvEXT", P(GL_ProgramUniformMatrix3x2fvEXT)},
+    {"glMultiTexCoord1d", P(GL_MultiTexCoord1d)},
+    {"glMultTransposeMatrixf", P(GL_MultTransposeMatrixf)},
+    {"glGetMaterialxv", P(GL_GetMaterialxv)},
+    {"glPopName", P(GL_PopName)},
+    {"glVertexAttribI3ui", P(GL_VertexAttribI3ui)},
+    {"glVertexArrayVertexBuffer", P(GL_VertexArrayVertexBuffer)},
+    {"glAcquireTexturesANGLE", P(GL_AcquireTexturesANGLE)},
+    {"glScalef", P(GL_Scalef)},
+    {"glVertexAttribI1uiv", P(GL_VertexAttribI1uiv)},
+    {"glProgramUniform2ui", P(GL_ProgramUniform2ui)},
+    {"glRecti", P(GL_Recti)},
+    {"glRasterPos3dv", P(GL_RasterPos3dv)},
+    {"glGetProgramBinary", P(GL_GetProgramBinary)},
+    {"glNormalPointer", P(GL_NormalPointer)},
+    {"glMultiTexCoord2f", P(GL_MultiTexCoord2f)},
+    {"glGetGraphicsResetStatusKHR", P(GL_GetGraphicsResetStatusKHR)},
+    {"glFogCoorddv", P(GL_FogCoorddv)},
+    {"glTranslatex", P(GL_Translatex)},
+    {"glProgramUniform1fEXT", P(GL_ProgramUniform1fEXT)},
+    {"glCopyTexImage1D", P(GL_CopyTexImage1D)},
+    {"glMultiTexCoordP4ui", P(GL_MultiTexCoordP4ui)},
+    {"glVertexAttrib3f", P(GL_VertexAttrib3f)},
+    {"glFramebufferRenderbufferOES", P(GL_FramebufferRenderbufferOES)},
+    {"glPassThrough", P(GL_PassThrough)},
+    {"glIsVertexArray", P(GL_IsVertexArray)},
+    {"glVertexArrayAttribIFormat", P(GL_VertexArrayAttribIFormat)},
+    {"glTexEnvxv", P(GL_TexEnvxv)},
+    {"glProgramUniform3f", P(GL_ProgramUniform3f)},
+    {"glGetPerfMonitorGroupsAMD", P(GL_GetPerfMonitorGroupsAMD)},
+    {"glFrustumx", P(GL_Frustumx)},
+    {"glNamedBufferSubData", P(GL_NamedBufferSubData)},
+    {"glCopyImageSubDataOES", P(GL_CopyImageSubDataOES)},
+    {"glDrawTexfvOES", P(GL_DrawTexfvOES)},
+    {"glNamedFramebufferParameteri", P(GL_NamedFramebufferParameteri)},
+    {"glDrawBuffers", P(GL_DrawBuffers)},
+    {"glGetClipPlanef", P(GL_GetClipPlanef)},
+    {"glXMakeCurrent", P(glXMakeCurrent)},
+    {"glMultiTexCoord3i", P(GL_MultiTexCoord3i)},
+    {"glVertexAttribI2iv", P(GL_VertexAttribI2iv)},
+    {"glClearNamedBufferData", P(GL_ClearNamedBufferData)},
+    {"glLightModelf", P(GL_LightModelf)},
+    {"glTexParameterIuivRobustANGLE", P(GL_TexParameterIuivRobustANGLE)},
+    {"glDrawTexsOES", P(GL_DrawTexsOES)},
+    {"glDebugMessageInsertKHR", P(GL_DebugMessageInsertKHR)},
+    {"glLoadTransposeMatrixd", P(GL_LoadTransposeMatrixd)},
+    {"glGetUniformLocation", P(GL_GetUniformLocation)},
+    {"glXQueryVersion", P(glXQueryVersion)},
+    {"glBlendEquationSeparateiEXT", P(GL_BlendEquationSeparateiEXT)},
+    {"glTexBufferRangeEXT", P(GL_TexBufferRangeEXT)},
+    {"glGetIntegeri_vRobustANGLE", P(GL_GetIntegeri_vRobustANGLE)},
+    {"glGetTexParameterIiv", P(GL_GetTexParameterIiv)},
+    {"glLightxv", P(GL_Lightxv)},
+    {"glGetClipPlanex", P(GL_GetClipPlanex)},
+    {"glTexCoord1iv", P(GL_TexCoord1iv)},
+    {"glMultiTexCoord3fv", P(GL_MultiTexCoord3fv)},
+    {"glGetTexParameterivRobustANGLE", P(GL_GetTexParameterivRobustANGLE)},
+    {"glOrtho", P(GL_Ortho)},
+    {"glUniformMatrix3x4dv", P(GL_UniformMatrix3x4dv)},
+    {"glShaderSource", P(GL_ShaderSource)},
+    {"glPolygonModeANGLE", P(GL_PolygonModeANGLE)},
+    {"glPolygonMode", P(GL_PolygonMode)},
+    {"glEvalCoord2f", P(GL_EvalCoord2f)},
+    {"glIsSync", P(GL_IsSync)},
+    {"glBlendBarrier", P(GL_BlendBarrier)},
+    {"glProgramUniform2ivEXT", P(GL_ProgramUniform2ivEXT)},
+    {"glGetProgramBinaryOES", P(GL_GetProgramBinaryOES)},
+    {"glIndexPointer", P(GL_IndexPointer)},
+    {"glXSwapBuffers", P(glXSwapBuffers)},
+    {"glAttachShader", P(GL_AttachShader)},
+    {"glProgramUniform3i", P(GL_ProgramUniform3i)},
+    {"glLightfv", P(GL_Lightfv)},
     {"glMaterialiv", P(GL_Materialiv)},
-    {"glMaterialx", P(GL_Materialx)},
-    {"glMaterialxv", P(GL_Materialxv)},
-    {"glMatrixIndexPointerOES", P(GL_MatrixIndexPointerOES)},
-    {"glMatrixMode", P(GL_MatrixMode)},
-    {"glMaxShaderCompilerThreadsKHR", P(GL_MaxShaderCompilerThreadsKHR)},
-    {"glMemoryBarrier", P(GL_MemoryBarrier)},
-    {"glMemoryBarrierByRegion", P(GL_MemoryBarrierByRegion)},
-    {"glMemoryObjectParameterivEXT", P(GL_MemoryObjectParameterivEXT)},
-    {"glMinSampleShading", P(GL_MinSampleShading)},
-    {"glMinSampleShadingOES", P(GL_MinSampleShadingOES)},
-    {"glMultMatrixd", P(GL_MultMatrixd)},
+    {"glXCreatePbuffer", P(glXCreatePbuffer)},
+    {"glCreateQueries", P(GL_CreateQueries)},
+    {"glDeleteFramebuffersOES", P(GL_DeleteFramebuffersOES)},
+    {"glGetTexParameterIivRobustANGLE", P(GL_GetTexParameterIivRobustANGLE)},
+    {"glGetNamedBufferParameteriv", P(GL_GetNamedBufferParameteriv)},
+    {"glClearTexSubImageEXT", P(GL_ClearTexSubImageEXT)},
+    {"glUniform3iv", P(GL_Uniform3iv)},
+    {"glGetPerfMonitorCounterInfoAMD", P(GL_GetPerfMonitorCounterInfoAMD)},
+    {"glTextureStorage3D", P(GL_TextureStorage3D)},
+    {"glUniform4uiv", P(GL_Uniform4uiv)},
+    {"glBlendFuncSeparateiOES", P(GL_BlendFuncSeparateiOES)},
+    {"glProgramUniform1iEXT", P(GL_ProgramUniform1iEXT)},
+    {"glTexGenf", P(GL_TexGenf)},
+    {"glGetSamplerParameterIivRobustANGLE", P(GL_GetSamplerParameterIivRobustANGLE)},
+    {"glVertexPointer", P(GL_VertexPointer)},
+    {"glPolygonModeNV", P(GL_PolygonModeNV)},
+    {"glVertexAttribP1uiv", P(GL_VertexAttribP1uiv)},
+    {"glColor4bv", P(GL_Color4bv)},
+    {"glTexEnviv", P(GL_TexEnviv)},
+    {"glVertexArrayAttribLFormat", P(GL_VertexArrayAttribLFormat)},
+    {"glTexStorage2DMultisample", P(GL_TexStorage2DMultisample)},
+    {"glGetShaderSource", P(GL_GetShaderSource)},
+    {"glIndexMask", P(GL_IndexMask)},
+    {"glTexStorage3DMultisample", P(GL_TexStorage3DMultisample)},
+    {"glGetUniformSubroutineuiv", P(GL_GetUniformSubroutineuiv)},
+    {"glTexGend", P(GL_TexGend)},
+    {"glUniform4f", P(GL_Uniform4f)},
+    {"glBufferStorage", P(GL_BufferStorage)},
+    {"glColor4uiv", P(GL_Color4uiv)},
+    {"glTexImage3D", P(GL_TexImage3D)},
+    {"glGetActiveSubroutineUniformName", P(GL_GetActiveSubroutineUniformName)},
+    {"glNamedBufferStorage", P(GL_NamedBufferStorage)},
+    {"glRasterPos2f", P(GL_RasterPos2f)},
+    {"glGetnConvolutionFilter", P(GL_GetnConvolutionFilter)},
+    {"glNormalP3ui", P(GL_NormalP3ui)},
+    {"glDebugMessageCallback", P(GL_DebugMessageCallback)},
+    {"glDrawElementsInstancedBaseVertexBaseInstanceANGLE", P(GL_DrawElementsInstancedBaseVertexBaseInstanceANGLE)},
+    {"glGetnMapiv", P(GL_GetnMapiv)},
+    {"glMultiDrawArraysIndirectCount", P(GL_MultiDrawArraysIndirectCount)},
+    {"glProgramUniform1i", P(GL_ProgramUniform1i)},
+    {"glReadPixels", P(GL_ReadPixels)},
+    {"glTextureSubImage1D", P(GL_TextureSubImage1D)},
+    {"glVertexBindingDivisor", P(GL_VertexBindingDivisor)},
+    {"glMultiDrawElementsInstancedBaseVertexBaseInstanceANGLE", P(GL_MultiDrawElementsInstancedBaseVertexBaseInstanceANGLE)},
+    {"glCreateFramebuffers", P(GL_CreateFramebuffers)},
+    {"glGetRenderbufferParameterivOES", P(GL_GetRenderbufferParameterivOES)},
+    {"glTranslatef", P(GL_Translatef)},
+    {"glUniform2fv", P(GL_Uniform2fv)},
+    {"glXWaitX", P(glXWaitX)},
+    {"glSamplerParameterIuiv", P(GL_SamplerParameterIuiv)},
+    {"glMultiTexCoord3d", P(GL_MultiTexCoord3d)},
+    {"glArrayElement", P(GL_ArrayElement)},
+    {"glClearColor", P(GL_ClearColor)},
+    {"glBegin", P(GL_Begin)},
+    {"glPopAttrib", P(GL_PopAttrib)},
+    {"glProgramUniformMatrix3x4fv", P(GL_ProgramUniformMatrix3x4fv)},
+    {"glDepthRangeArrayv", P(GL_DepthRangeArrayv)},
+    {"glDisableiOES", P(GL_DisableiOES)},
+    {"glRasterPos2fv", P(GL_RasterPos2fv)},
+    {"glMultiTexCoord1sv", P(GL_MultiTexCoord1sv)},
+    {"glVertexAttribP2uiv", P(GL_VertexAttribP2uiv)},
+    {"glProgramUniform1fvEXT", P(GL_ProgramUniform1fvEXT)},
+    {"glDrawArraysInstancedEXT", P(GL_DrawArraysInstancedEXT)},
+    {"glIsShader", P(GL_IsShader)},
+    {"glProgramUniformMatrix2dv", P(GL_ProgramUniformMatrix2dv)},
+    {"glClearBufferfv", P(GL_ClearBufferfv)},
+    {"glEdgeFlag", P(GL_EdgeFlag)},
+    {"glTextureParameteriv", P(GL_TextureParameteriv)},
+    {"glDrawTransformFeedback", P(GL_DrawTransformFeedback)},
     {"glMultMatrixf", P(GL_MultMatrixf)},
+    {"glAreTexturesResident", P(GL_AreTexturesResident)},
+    {"glDrawArraysInstancedBaseInstance", P(GL_DrawArraysInstancedBaseInstance)},
+    {"glCreateShaderProgramvEXT", P(GL_CreateShaderProgramvEXT)},
+    {"glVertexAttribI1i", P(GL_VertexAttribI1i)},
+    {"glGetAttachedShaders", P(GL_GetAttachedShaders)},
+    {"glReadnPixelsEXT", P(GL_ReadnPixelsEXT)},
+    {"glVertexAttribDivisor", P(GL_VertexAttribDivisor)},
+    {"glProgramParameteriEXT", P(GL_ProgramParameteriEXT)},
+    {"glPrimitiveBoundingBox", P(GL_PrimitiveBoundingBox)},
+    {"glGetnPixelMapfv", P(GL_GetnPixelMapfv)},
+    {"glProgramUniform4uivEXT", P(GL_ProgramUniform4uivEXT)},
+    {"glGenQueries", P(GL_GenQueries)},
+    {"glDeletePerfMonitorsAMD", P(GL_DeletePerfMonitorsAMD)},
+    {"glRasterPos3f", P(GL_RasterPos3f)},
+    {"glEnableVertexArrayAttrib", P(GL_EnableVertexArrayAttrib)},
+    {"glIsList", P(GL_IsList)},
+    {"glMultiTexCoord2s", P(GL_MultiTexCoord2s)},
+    {"glTexBufferEXT", P(GL_TexBufferEXT)},
+    {"glGetVertexArrayIndexediv", P(GL_GetVertexArrayIndexediv)},
+    {"glDrawTexfOES", P(GL_DrawTexfOES)},
+    {"glTexParameteriv", P(GL_TexParameteriv)},
+    {"glTexStorage2DMultisampleANGLE", P(GL_TexStorage2DMultisampleANGLE)},
     {"glMultMatrixx", P(GL_MultMatrixx)},
-    {"glMultTransposeMatrixd", P(GL_MultTransposeMatrixd)},
-    {"glMultTransposeMatrixf", P(GL_MultTransposeMatrixf)},
+    {"glReadBuffer", P(GL_ReadBuffer)},
+    {"glVertexAttribL4dv", P(GL_VertexAttribL4dv)},
+    {"glProgramUniformMatrix2x3fv", P(GL_ProgramUniformMatrix2x3fv)},
+    {"glGenTextures", P(GL_GenTextures)},
+    {"glGetTexLevelParameteriv", P(GL_GetTexLevelParameteriv)},
+    {"glDrawTexsvOES", P(GL_DrawTexsvOES)},
+    {"glVertexAttrib1dv", P(GL_VertexAttrib1dv)},
+    {"glColorP3uiv", P(GL_ColorP3uiv)},
+    {"glTextureParameterIiv", P(GL_TextureParameterIiv)},
+    {"glTextureParameterIuiv", P(GL_TextureParameterIuiv)},
+    {"glProgramUniform1iv", P(GL_ProgramUniform1iv)},
+    {"glMultiTexCoordP1ui", P(GL_MultiTexCoordP1ui)},
+    {"glClampColor", P(GL_ClampColor)},
+    {"glProgramUniform2iv", P(GL_ProgramUniform2iv)},
+    {"glGetNamedFramebufferAttachmentParameteriv", P(GL_GetNamedFramebufferAttachmentParameteriv)},
+    {"glBlendFuncSeparate", P(GL_BlendFuncSeparate)},
+    {"glLightModeli", P(GL_LightModeli)},
+    {"glObjectPtrLabelKHR", P(GL_ObjectPtrLabelKHR)},
+    {"glGetActiveUniformBlockName", P(GL_GetActiveUniformBlockName)},
+    {"glFogCoordfv", P(GL_FogCoordfv)},
+    {"glDispatchComputeIndirect", P(GL_DispatchComputeIndirect)},
+    {"glSecondaryColorPointer", P(GL_SecondaryColorPointer)},
+    {"glColor3f", P(GL_Color3f)},
+    {"glGetFramebufferAttachmentParameterivOES", P(GL_GetFramebufferAttachmentParameterivOES)},
+    {"glTexStorage3DMultisampleOES", P(GL_TexStorage3DMultisampleOES)},
+    {"glVertexAttribI2ui", P(GL_VertexAttribI2ui)},
+    {"glClearStencil", P(GL_ClearStencil)},
+    {"glCreateRenderbuffers", P(GL_CreateRenderbuffers)},
+    {"glFramebufferParameteriMESA", P(GL_FramebufferParameteriMESA)},
+    {"glProvokingVertexANGLE", P(GL_ProvokingVertexANGLE)},
+    {"glNormal3fv", P(GL_Normal3fv)},
+    {"glProgramUniform4uiEXT", P(GL_ProgramUniform4uiEXT)},
+    {"glUniform3dv", P(GL_Uniform3dv)},
+    {"glGetProgramResourceIndex", P(GL_GetProgramResourceIndex)},
+    {"glLoadIdentity", P(GL_LoadIdentity)},
+    {"glTextureSubImage3D", P(GL_TextureSubImage3D)},
+    {"glGetTextureLevelParameterfv", P(GL_GetTextureLevelParameterfv)},
+    {"glRectd", P(GL_Rectd)},
+    {"glGetFramebufferPixelLocalStorageParameterfvRobustANGLE", P(GL_GetFramebufferPixelLocalStorageParameterfvRobustANGLE)},
     {"glMultiDrawArrays", P(GL_MultiDrawArrays)},
-    {"glMultiDrawArraysANGLE", P(GL_MultiDrawArraysANGLE)},
-    {"glMultiDrawArraysIndirect", P(GL_MultiDrawArraysIndirect)},
-    {"glMultiDrawArraysIndirectCount", P(GL_MultiDrawArraysIndirectCount)},
+    {"glMultiTexCoord4d", P(GL_MultiTexCoord4d)},
+    {"glVertexAttrib4Nbv", P(GL_VertexAttrib4Nbv)},
+    {"glLightf", P(GL_Lightf)},
+    {"glMemoryObjectParameterivEXT", P(GL_MemoryObjectParameterivEXT)},
+    {"glGetGraphicsResetStatus", P(GL_GetGraphicsResetStatus)},
+    {"glVertex4dv", P(GL_Vertex4dv)},
+    {"glSampleCoverage", P(GL_SampleCoverage)},
+    {"glDebugMessageCallbackKHR", P(GL_DebugMessageCallbackKHR)},
+    {"glTexStorage3DEXT", P(GL_TexStorage3DEXT)},
+    {"glDeleteQueriesEXT", P(GL_DeleteQueriesEXT)},
+    {"glGetProgramInterfaceivRobustANGLE", P(GL_GetProgramInterfaceivRobustANGLE)},
+    {"glProgramUniformMatrix2x4fv", P(GL_ProgramUniformMatrix2x4fv)},
+    {"glVertexAttribP3ui", P(GL_VertexAttribP3ui)},
+    {"glGetCompressedTextureSubImage", P(GL_GetCompressedTextureSubImage)},
+    {"glGetPixelMapuiv", P(GL_GetPixelMapuiv)},
+    {"glDrawArraysInstancedANGLE", P(GL_DrawArraysInstancedANGLE)},
+    {"glXDestroyWindow", P(glXDestroyWindow)},
+    {"glDrawPixels", P(GL_DrawPixels)},
+    {"glGetQueryBufferObjecti64v", P(GL_GetQueryBufferObjecti64v)},
+    {"glGetActiveAttrib", P(GL_GetActiveAttrib)},
+    {"glIndexfv", P(GL_Indexfv)},
+    {"glGetVertexAttribdv", P(GL_GetVertexAttribdv)},
+    {"glDeleteFencesNV", P(GL_DeleteFencesNV)},
+    {"glTexCoord4sv", P(GL_TexCoord4sv)},
+    {"glCreateShader", P(GL_CreateShader)},
+    {"glGetPerfMonitorCounterDataAMD", P(GL_GetPerfMonitorCounterDataAMD)},
+    {"glGetInteger64vEXT", P(GL_GetInteger64vEXT)},
+    {"glClipPlanef", P(GL_ClipPlanef)},
+    {"glSelectPerfMonitorCountersAMD", P(GL_SelectPerfMonitorCountersAMD)},
+    {"glGetUniformfv", P(GL_GetUniformfv)},
+    {"glVertexAttrib4Nub", P(GL_VertexAttrib4Nub)},
+    {"glMapNamedBufferRange", P(GL_MapNamedBufferRange)},
+    {"glProgramUniform4iEXT", P(GL_ProgramUniform4iEXT)},
+    {"glVertexArrayAttribFormat", P(GL_VertexArrayAttribFormat)},
+    {"glGetSamplerParameterIiv", P(GL_GetSamplerParameterIiv)},
+    {"glGetBooleanvRobustANGLE", P(GL_GetBooleanvRobustANGLE)},
+    {"glEnablei", P(GL_Enablei)},
+    {"glGetProgramPipelineInfoLog", P(GL_GetProgramPipelineInfoLog)},
     {"glMultiDrawArraysIndirectEXT", P(GL_MultiDrawArraysIndirectEXT)},
-    {"glMultiDrawArraysInstancedANGLE", P(GL_MultiDrawArraysInstancedANGLE)},
     {"glMultiDrawArraysInstancedBaseInstanceANGLE", P(GL_MultiDrawArraysInstancedBaseInstanceANGLE)},
-    {"glMultiDrawElements", P(GL_MultiDrawElements)},
-    {"glMultiDrawElementsANGLE", P(GL_MultiDrawElementsANGLE)},
-    {"glMultiDrawElementsBaseVertex", P(GL_MultiDrawElementsBaseVertex)},
-    {"glMultiDrawElementsBaseVertexEXT", P(GL_MultiDrawElementsBaseVertexEXT)},
-    {"glMultiDrawElementsIndirect", P(GL_MultiDrawElementsIndirect)},
-    {"glMultiDrawElementsIndirectCount", P(GL_MultiDrawElementsIndirectCount)},
-    {"glMultiDrawElementsIndirectEXT", P(GL_MultiDrawElementsIndirectEXT)},
-    {"glMultiDrawElementsInstancedANGLE", P(GL_MultiDrawElementsInstancedANGLE)},
-    {"glMultiDrawElementsInstancedBaseVertexBaseInstanceANGLE", P(GL_MultiDrawElementsInstancedBaseVertexBaseInstanceANGLE)},
-    {"glMultiTexCoord1d", P(GL_MultiTexCoord1d)},
-    {"glMultiTexCoord1dv", P(GL_MultiTexCoord1dv)},
-    {"glMultiTexCoord1f", P(GL_MultiTexCoord1f)},
-    {"glMultiTexCoord1fv", P(GL_MultiTexCoord1fv)},
-    {"glMultiTexCoord1i", P(GL_MultiTexCoord1i)},
+    {"glProgramUniformMatrix4x3fv", P(GL_ProgramUniformMatrix4x3fv)},
+    {"glSamplerParameterIiv", P(GL_SamplerParameterIiv)},
+    {"glSecondaryColor3sv", P(GL_SecondaryColor3sv)},
+    {"glGetPerfMonitorCounterStringAMD", P(GL_GetPerfMonitorCounterStringAMD)},
+    {"glGetFragDataLocation", P(GL_GetFragDataLocation)},
+    {"glCopyTextureSubImage3D", P(GL_CopyTextureSubImage3D)},
+    {"glBlendFuncSeparateiEXT", P(GL_BlendFuncSeparateiEXT)},
+    {"glGetQueryiv", P(GL_GetQueryiv)},
+    {"glClearBufferiv", P(GL_ClearBufferiv)},
+    {"glTexGenivOES", P(GL_TexGenivOES)},
+    {"glIndexd", P(GL_Indexd)},
+    {"glViewport", P(GL_Viewport)},
+    {"glVertex4fv", P(GL_Vertex4fv)},
+    {"glMultiTexCoord2iv", P(GL_MultiTexCoord2iv)},
+    {"glGetTexGenfvOES", P(GL_GetTexGenfvOES)},
+    {"glReadnPixelsRobustANGLE", P(GL_ReadnPixelsRobustANGLE)},
+    {"glVertexAttrib4Nusv", P(GL_VertexAttrib4Nusv)},
+    {"glTexParameteri", P(GL_TexParameteri)},
+    {"glXChooseVisual", P(glXChooseVisual)},
+    {"glProgramUniformMatrix2x3fvEXT", P(GL_ProgramUniformMatrix2x3fvEXT)},
+    {"glGetVertexAttribIivRobustANGLE", P(GL_GetVertexAttribIivRobustANGLE)},
+    {"glViewportIndexedfv", P(GL_ViewportIndexedfv)},
+    {"glAlphaFunc", P(GL_AlphaFunc)},
+    {"glGetStringi", P(GL_GetStringi)},
+    {"glIsVertexArrayOES", P(GL_IsVertexArrayOES)},
+    {"glCopyTextureSubImage1D", P(GL_CopyTextureSubImage1D)},
+    {"glFramebufferTextureMultiviewOVR", P(GL_FramebufferTextureMultiviewOVR)},
+    {"glProgramUniform3d", P(GL_ProgramUniform3d)},
+    {"glTexCoord4d", P(GL_TexCoord4d)},
+    {"glColorMaskiOES", P(GL_ColorMaskiOES)},
+    {"glProgramUniform3uiEXT", P(GL_ProgramUniform3uiEXT)},
+    {"glColor3usv", P(GL_Color3usv)},
+    {"glGetVertexAttribIuiv", P(GL_GetVertexAttribIuiv)},
+    {"glScissor", P(GL_Scissor)},
+    {"glTexBufferRangeOES", P(GL_TexBufferRangeOES)},
+    {"glDrawBuffer", P(GL_DrawBuffer)},
+    {"glGetProgramResourceLocationIndexEXT", P(GL_GetProgramResourceLocationIndexEXT)},
+    {"glAccum", P(GL_Accum)},
+    {"glMultiTexCoord3s", P(GL_MultiTexCoord3s)},
+    {"glGetTexGenfv", P(GL_GetTexGenfv)},
+    {"glRasterPos2iv", P(GL_RasterPos2iv)},
+    {"glReadnPixels", P(GL_ReadnPixels)},
+    {"glGetSubroutineUniformLocation", P(GL_GetSubroutineUniformLocation)},
+    {"glGetIntegervRobustANGLE", P(GL_GetIntegervRobustANGLE)},
     {"glMultiTexCoord1iv", P(GL_MultiTexCoord1iv)},
-    {"glMultiTexCoord1s", P(GL_MultiTexCoord1s)},
-    {"glMultiTexCoord1sv", P(GL_MultiTexCoord1sv)},
+    {"glGetBooleani_v", P(GL_GetBooleani_v)},
+    {"glGetFloatvRobustANGLE", P(GL_GetFloatvRobustANGLE)},
+    {"glPopGroupMarkerEXT", P(GL_PopGroupMarkerEXT)},
+    {"glCompressedTexSubImage3DOES", P(GL_CompressedTexSubImage3DOES)},
+    {"glGetSamplerParameterIuivOES", P(GL_GetSamplerParameterIuivOES)},
+    {"glTextureFoveationParametersQCOM", P(GL_TextureFoveationParametersQCOM)},
+    {"glFogxv", P(GL_Fogxv)},
+    {"glGetSubroutineIndex", P(GL_GetSubroutineIndex)},
+    {"glUniform2d", P(GL_Uniform2d)},
+    {"glTexStorage1D", P(GL_TexStorage1D)},
+    {"glGetProgramResourceLocation", P(GL_GetProgramResourceLocation)},
+    {"glColor4us", P(GL_Color4us)},
+    {"glGetShaderPrecisionFormat", P(GL_GetShaderPrecisionFormat)},
+    {"glVertex4iv", P(GL_Vertex4iv)},
+    {"glProgramUniformMatrix4x2fv", P(GL_ProgramUniformMatrix4x2fv)},
+    {"glGetnUniformuivKHR", P(GL_GetnUniformuivKHR)},
+    {"glSecondaryColor3ubv", P(GL_SecondaryColor3ubv)},
+    {"glGetQueryBufferObjectuiv", P(GL_GetQueryBufferObjectuiv)},
+    {"glInvalidateTextureANGLE", P(GL_InvalidateTextureANGLE)},
+    {"glVertexAttribL3dv", P(GL_VertexAttribL3dv)},
+    {"glUniform1ui", P(GL_Uniform1ui)},
+    {"glFramebufferRenderbuffer", P(GL_FramebufferRenderbuffer)},
+    {"glDrawTexivOES", P(GL_DrawTexivOES)},
+    {"glCreateProgramPipelines", P(GL_CreateProgramPipelines)},
+    {"glXQueryExtension", P(glXQueryExtension)},
+    {"glVertex2d", P(GL_Vertex2d)},
+    {"glColor3fv", P(GL_Color3fv)},
+    {"glPointSizex", P(GL_PointSizex)},
+    {"glGetProgramInfoLog", P(GL_GetProgramInfoLog)},
+    {"glEvalMesh2", P(GL_EvalMesh2)},
+    {"glPolygonOffset", P(GL_PolygonOffset)},
+    {"glMultiDrawElementsBaseVertexEXT", P(GL_MultiDrawElementsBaseVertexEXT)},
+    {"glTexStorageMemFlags3DANGLE", P(GL_TexStorageMemFlags3DANGLE)},
+    {"glMultiTexCoord3f", P(GL_MultiTexCoord3f)},
+    {"glMapBuffer", P(GL_MapBuffer)},
+    {"glXDestroyContext", P(glXDestroyContext)},
+    {"glGetnColorTable", P(GL_GetnColorTable)},
+    {"glPushDebugGroupKHR", P(GL_PushDebugGroupKHR)},
+    {"glDisablei", P(GL_Disablei)},
+    {"glEndTransformFeedback", P(GL_EndTransformFeedback)},
+    {"glBindRenderbufferOES", P(GL_BindRenderbufferOES)},
+    {"glTexCoord1sv", P(GL_TexCoord1sv)},
+    {"glPolygonOffsetClampEXT", P(GL_PolygonOffsetClampEXT)},
+    {"glSecondaryColor3dv", P(GL_SecondaryColor3dv)},
+    {"glUniform3d", P(GL_Uniform3d)},
+    {"glMultiTexCoord4dv", P(GL_MultiTexCoord4dv)},
+    {"glGetFenceivNV", P(GL_GetFenceivNV)},
+    {"glCopyImageSubDataEXT", P(GL_CopyImageSubDataEXT)},
+    {"glCopyPixels", P(GL_CopyPixels)},
+    {"glAlphaFuncx", P(GL_AlphaFuncx)},
+    {"glTexCoord4dv", P(GL_TexCoord4dv)},
+    {"glClipPlane", P(GL_ClipPlane)},
+    {"glActiveShaderProgram", P(GL_ActiveShaderProgram)},
+    {"glXGetCurrentReadDrawable", P(glXGetCurrentReadDrawable)},
+    {"glIsFenceNV", P(GL_IsFenceNV)},
+    {"glBindImageTexture", P(GL_BindImageTexture)},
+    {"glGetQueryObjectivEXT", P(GL_GetQueryObjectivEXT)},
+    {"glDebugMessageControl", P(GL_DebugMessageControl)},
+    {"glTextureParameterf", P(GL_TextureParameterf)},
+    {"glGetPointervRobustANGLERobustANGLE", P(GL_GetPointervRobustANGLERobustANGLE)},
+    {"glBlendFunciOES", P(GL_BlendFunciOES)},
+    {"glDrawTransformFeedbackStreamInstanced", P(GL_DrawTransformFeedbackStreamInstanced)},
+    {"glSamplerParameterfvRobustANGLE", P(GL_SamplerParameterfvRobustANGLE)},
+    {"glCompressedTexImage2DRobustANGLE", P(GL_CompressedTexImage2DRobustANGLE)},
+    {"glVertexAttribDivisorEXT", P(GL_VertexAttribDivisorEXT)},
+    {"glGetMapdv", P(GL_GetMapdv)},
+    {"glOrthox", P(GL_Orthox)},
+    {"glVertexAttrib4usv", P(GL_VertexAttrib4usv)},
+    {"glGetnUniformivRobustANGLE", P(GL_GetnUniformivRobustANGLE)},
+    {"glGetUnsignedBytevEXT", P(GL_GetUnsignedBytevEXT)},
+    {"glGetBufferParameteri64vRobustANGLE", P(GL_GetBufferParameteri64vRobustANGLE)},
+    {"glTextureStorage3DMultisample", P(GL_TextureStorage3DMultisample)},
+    {"glClearIndex", P(GL_ClearIndex)},
+    {"glColorP4uiv", P(GL_ColorP4uiv)},
+    {"glSamplerParameterIuivOES", P(GL_SamplerParameterIuivOES)},
+    {"glColor4b", P(GL_Color4b)},
+    {"glNamedFramebufferDrawBuffers", P(GL_NamedFramebufferDrawBuffers)},
+    {"glTexBuffer", P(GL_TexBuffer)},
+    {"glDrawBuffersEXT", P(GL_DrawBuffersEXT)},
+    {"glEnableiOES", P(GL_EnableiOES)},
+    {"glXQueryContext", P(glXQueryContext)},
+    {"glSecondaryColor3us", P(GL_SecondaryColor3us)},
+    {"glVertexAttribLPointer", P(GL_VertexAttribLPointer)},
+    {"glSecondaryColor3fv", P(GL_SecondaryColor3fv)},
+    {"glTexParameterfv", P(GL_TexParameterfv)},
+    {"glGetVertexAttribivRobustANGLE", P(GL_GetVertexAttribivRobustANGLE)},
+    {"glSecondaryColor3d", P(GL_SecondaryColor3d)},
+    {"glProgramUniform4dv", P(GL_ProgramUniform4dv)},
+    {"glDeleteSamplers", P(GL_DeleteSamplers)},
+    {"glTexCoord3f", P(GL_TexCoord3f)},
+    {"glPointParameterf", P(GL_PointParameterf)},
+    {"glColorP3ui", P(GL_ColorP3ui)},
+    {"glIsQueryEXT", P(GL_IsQueryEXT)},
+    {"glDrawRangeElementsBaseVertex", P(GL_DrawRangeElementsBaseVertex)},
+    {"glVertex3sv", P(GL_Vertex3sv)},
+    {"glUniform1f", P(GL_Uniform1f)},
+    {"glPatchParameterfv", P(GL_PatchParameterfv)},
+    {"glVertexAttrib2d", P(GL_VertexAttrib2d)},
+    {"glBlendEquationSeparateiOES", P(GL_BlendEquationSeparateiOES)},
+    {"glWaitSemaphoreEXT", P(GL_WaitSemaphoreEXT)},
+    {"glGetNamedBufferParameteri64v", P(GL_GetNamedBufferParameteri64v)},
+    {"glClearDepth", P(GL_ClearDepth)},
+    {"glVertexAttribL1dv", P(GL_VertexAttribL1dv)},
+    {"glTexGeni", P(GL_TexGeni)},
+    {"glCompressedTexSubImage1D", P(GL_CompressedTexSubImage1D)},
+    {"glGetnUniformfvEXT", P(GL_GetnUniformfvEXT)},
+    {"glFrontFace", P(GL_FrontFace)},
+    {"glVertex3fv", P(GL_Vertex3fv)},
+    {"glCompressedTexImage3D", P(GL_CompressedTexImage3D)},
+    {"glColor3d", P(GL_Color3d)},
+    {"glProgramUniform1ui", P(GL_ProgramUniform1ui)},
+    {"glWindowPos3sv", P(GL_WindowPos3sv)},
+    {"glProgramUniform1f", P(GL_ProgramUniform1f)},
+    {"glDebugMessageControlKHR", P(GL_DebugMessageControlKHR)},
+    {"glXGetProcAddress", P(glXGetProcAddress)},
+    {"glTexBufferRange", P(GL_TexBufferRange)},
+    {"glRectiv", P(GL_Rectiv)},
+    {"glUniform2ui", P(GL_Uniform2ui)},
+    {"glTextureBuffer", P(GL_TextureBuffer)},
+    {"glTexStorageMemFlags3DMultisampleANGLE", P(GL_TexStorageMemFlags3DMultisampleANGLE)},
+    {"glVertexAttribLFormat", P(GL_VertexAttribLFormat)},
+    {"glGetFramebufferAttachmentParameteriv", P(GL_GetFramebufferAttachmentParameteriv)},
+    {"glPopDebugGroup", P(GL_PopDebugGroup)},
+    {"glWindowPos3fv", P(GL_WindowPos3fv)},
+    {"glXCreateWindow", P(glXCreateWindow)},
+    {"glVertexAttrib3dv", P(GL_VertexAttrib3dv)},
+    {"glXDestroyPbuffer", P(glXDestroyPbuffer)},
+    {"glTextureStorage2DMultisample", P(GL_TextureStorage2DMultisample)},
+    {"glProgramUniformMatrix4fv", P(GL_ProgramUniformMatrix4fv)},
+    {"glMultiDrawElementsIndirectEXT", P(GL_MultiDrawElementsIndirectEXT)},
+    {"glTextureParameteri", P(GL_TextureParameteri)},
+    {"glGetCompressedTexImageANGLE", P(GL_GetCompressedTexImageANGLE)},
+    {"glCompressedTexImage2D", P(GL_CompressedTexImage2D)},
+    {"glTexParameterIivRobustANGLE", P(GL_TexParameterIivRobustANGLE)},
+    {"glGetQueryObjectui64vEXT", P(GL_GetQueryObjectui64vEXT)},
+    {"glGetAttribLocation", P(GL_GetAttribLocation)},
+    {"glGetnTexImage", P(GL_GetnTexImage)},
+    {"glCallList", P(GL_CallList)},
     {"glMultiTexCoord2d", P(GL_MultiTexCoord2d)},
+    {"glGetFramebufferPixelLocalStorageParameterfvANGLE", P(GL_GetFramebufferPixelLocalStorageParameterfvANGLE)},
+    {"glColor4fv", P(GL_Color4fv)},
+    {"glEnd", P(GL_End)},
+    {"glSampleMaskiANGLE", P(GL_SampleMaskiANGLE)},
+    {"glGenFramebuffers", P(GL_GenFramebuffers)},
+    {"glEdgeFlagv", P(GL_EdgeFlagv)},
+    {"glNormal3dv", P(GL_Normal3dv)},
+    {"glColorMaskiEXT", P(GL_ColorMaskiEXT)},
+    {"glBindVertexBuffers", P(GL_BindVertexBuffers)},
+    {"glBindTextures", P(GL_BindTextures)},
+    {"glUniform3i", P(GL_Uniform3i)},
+    {"glGetTexEnviv", P(GL_GetTexEnviv)},
+    {"glEGLImageTargetTexStorageEXT", P(GL_EGLImageTargetTexStorageEXT)},
+    {"glFramebufferTexture2DOES", P(GL_FramebufferTexture2DOES)},
+    {"glGetSamplerParameterIuivEXT", P(GL_GetSamplerParameterIuivEXT)},
+    {"glClearBufferfi", P(GL_ClearBufferfi)},
+    {"glWindowPos2s", P(GL_WindowPos2s)},
+    {"glGetQueryivEXT", P(GL_GetQueryivEXT)},
+    {"glRasterPos3s", P(GL_RasterPos3s)},
+    {"glProgramUniform1d", P(GL_ProgramUniform1d)},
+    {"glIsTransformFeedback", P(GL_IsTransformFeedback)},
+    {"glGetFixedv", P(GL_GetFixedv)},
+    {"glVertex3dv", P(GL_Vertex3dv)},
+    {"glBlendEquationi", P(GL_BlendEquationi)},
+    {"glBindImageTextures", P(GL_BindImageTextures)},
+    {"glUniform2iv", P(GL_Uniform2iv)},
+    {"glShaderBinary", P(GL_ShaderBinary)},
+    {"glGetPointervKHR", P(GL_GetPointervKHR)},
+    {"glPointParameterxv", P(GL_PointParameterxv)},
+    {"glFramebufferTexture2D", P(GL_FramebufferTexture2D)},
+    {"glColorMaterial", P(GL_ColorMaterial)},
+    {"glXWaitGL", P(glXWaitGL)},
+    {"glDeleteSemaphoresEXT", P(GL_DeleteSemaphoresEXT)},
+    {"glDebugMessageInsert", P(GL_DebugMessageInsert)},
+    {"glPixelZoom", P(GL_PixelZoom)},
+    {"glEvalCoord2dv", P(GL_EvalCoord2dv)},
+    {"glTexGenfv", P(GL_TexGenfv)},
+    {"glRectdv", P(GL_Rectdv)},
+    {"glVertexAttribI3uiv", P(GL_VertexAttribI3uiv)},
+    {"glGetTexGenivOES", P(GL_GetTexGenivOES)},
+    {"glTextureStorage2D", P(GL_TextureStorage2D)},
+    {"glDeleteQueries", P(GL_DeleteQueries)},
+    {"glVertexAttrib1d", P(GL_VertexAttrib1d)},
+    {"glGetProgramiv", P(GL_GetProgramiv)},
+    {"glMapGrid1f", P(GL_MapGrid1f)},
+    {"glBlendBarrierKHR", P(GL_BlendBarrierKHR)},
+    {"glClearTexSubImage", P(GL_ClearTexSubImage)},
+    {"glInterleavedArrays", P(GL_InterleavedArrays)},
+    {"glXDestroyGLXPixmap", P(glXDestroyGLXPixmap)},
     {"glMultiTexCoord2dv", P(GL_MultiTexCoord2dv)},
-    {"glMultiTexCoord2f", P(GL_MultiTexCoord2f)},
-    {"glMultiTexCoord2fv", P(GL_MultiTexCoord2fv)},
-    {"glMultiTexCoord2i", P(GL_MultiTexCoord2i)},
-    {"glMultiTexCoord2iv", P(GL_MultiTexCoord2iv)},
-    {"glMultiTexCoord2s", P(GL_MultiTexCoord2s)},
-    {"glMultiTexCoord2sv", P(GL_MultiTexCoord2sv)},
-    {"glMultiTexCoord3d", P(GL_MultiTexCoord3d)},
-    {"glMultiTexCoord3dv", P(GL_MultiTexCoord3dv)},
-    {"glMultiTexCoord3f", P(GL_MultiTexCoord3f)},
-    {"glMultiTexCoord3fv", P(GL_MultiTexCoord3fv)},
-    {"glMultiTexCoord3i", P(GL_MultiTexCoord3i)},
-    {"glMultiTexCoord3iv", P(GL_MultiTexCoord3iv)},
-    {"glMultiTexCoord3s", P(GL_MultiTexCoord3s)},
-    {"glMultiTexCoord3sv", P(GL_MultiTexCoord3sv)},
-    {"glMultiTexCoord4d", P(GL_MultiTexCoord4d)},
-    {"glMultiTexCoord4dv", P(GL_MultiTexCoord4dv)},
-    {"glMultiTexCoord4f", P(GL_MultiTexCoord4f)},
-    {"glMultiTexCoord4fv", P(GL_MultiTexCoord4fv)},
-    {"glMultiTexCoord4i", P(GL_MultiTexCoord4i)},
+    {"glEvalPoint2", P(GL_EvalPoint2)},
+    {"glGetObjectPtrLabelKHR", P(GL_GetObjectPtrLabelKHR)},
+    {"glTexEnvx", P(GL_TexEnvx)},
+    {"glSecondaryColor3ub", P(GL_SecondaryColor3ub)},
+    {"glCopyBufferSubData", P(GL_CopyBufferSubData)},
+    {"glGetActiveUniformsiv", P(GL_GetActiveUniformsiv)},
+    {"glGetnUniformuiv", P(GL_GetnUniformuiv)},
+    {"glTexStorageMem2DEXT", P(GL_TexStorageMem2DEXT)},
+    {"glStencilOp", P(GL_StencilOp)},
+    {"glBlitFramebufferNV", P(GL_BlitFramebufferNV)},
+    {"glGetActiveAtomicCounterBufferiv", P(GL_GetActiveAtomicCounterBufferiv)},
+    {"glGetBooleanv", P(GL_GetBooleanv)},
     {"glMultiTexCoord4iv", P(GL_MultiTexCoord4iv)},
-    {"glMultiTexCoord4s", P(GL_MultiTexCoord4s)},
-    {"glMultiTexCoord4sv", P(GL_MultiTexCoord4sv)},
-    {"glMultiTexCoord4x", P(GL_MultiTexCoord4x)},
-    {"glMultiTexCoordP1ui", P(GL_MultiTexCoordP1ui)},
-    {"glMultiTexCoordP1uiv", P(GL_MultiTexCoordP1uiv)},
-    {"glMultiTexCoordP2ui", P(GL_MultiTexCoordP2ui)},
-    {"glMultiTexCoordP2uiv", P(GL_MultiTexCoordP2uiv)},
-    {"glMultiTexCoordP3ui", P(GL_MultiTexCoordP3ui)},
-    {"glMultiTexCoordP3uiv", P(GL_MultiTexCoordP3uiv)},
-    {"glMultiTexCoordP4ui", P(GL_MultiTexCoordP4ui)},
-    {"glMultiTexCoordP4uiv", P(GL_MultiTexCoordP4uiv)},
-    {"glNamedBufferData", P(GL_NamedBufferData)},
-    {"glNamedBufferStorage", P(GL_NamedBufferStorage)},
-    {"glNamedBufferStorageExternalEXT", P(GL_NamedBufferStorageExternalEXT)},
-    {"glNamedBufferSubData", P(GL_NamedBufferSubData)},
-    {"glNamedFramebufferDrawBuffer", P(GL_NamedFramebufferDrawBuffer)},
-    {"glNamedFramebufferDrawBuffers", P(GL_NamedFramebufferDrawBuffers)},
-    {"glNamedFramebufferParameteri", P(GL_NamedFramebufferParameteri)},
-    {"glNamedFramebufferReadBuffer", P(GL_NamedFramebufferReadBuffer)},
-    {"glNamedFramebufferRenderbuffer", P(GL_NamedFramebufferRenderbuffer)},
+    {"glDrawRangeElementsBaseVertexOES", P(GL_DrawRangeElementsBaseVertexOES)},
+    {"glMapBufferRangeEXT", P(GL_MapBufferRangeEXT)},
+    {"glDepthMask", P(GL_DepthMask)},
+    {"glUniformMatrix4x3dv", P(GL_UniformMatrix4x3dv)},
+    {"glBeginTransformFeedback", P(GL_BeginTransformFeedback)},
+    {"glRotatex", P(GL_Rotatex)},
+    {"glEndQueryIndexed", P(GL_EndQueryIndexed)},
+    {"glLightModeliv", P(GL_LightModeliv)},
+    {"glDeleteLists", P(GL_DeleteLists)},
+    {"glPolygonOffsetClamp", P(GL_PolygonOffsetClamp)},
+    {"glMap2d", P(GL_Map2d)},
+    {"glClearNamedBufferSubData", P(GL_ClearNamedBufferSubData)},
+    {"glGetClipPlane", P(GL_GetClipPlane)},
+    {"glGetFramebufferPixelLocalStorageParameterivRobustANGLE", P(GL_GetFramebufferPixelLocalStorageParameterivRobustANGLE)},
+    {"glGetQueryObjecti64vEXT", P(GL_GetQueryObjecti64vEXT)},
+    {"glFlushMappedNamedBufferRange", P(GL_FlushMappedNamedBufferRange)},
+    {"glProgramParameteri", P(GL_ProgramParameteri)},
+    {"glSecondaryColor3i", P(GL_SecondaryColor3i)},
+    {"glStencilFuncSeparate", P(GL_StencilFuncSeparate)},
+    {"glSecondaryColor3uiv", P(GL_SecondaryColor3uiv)},
+    {"glColor4sv", P(GL_Color4sv)},
+    {"glGetnUniformfvKHR", P(GL_GetnUniformfvKHR)},
+    {"glGetTexParameterIivEXT", P(GL_GetTexParameterIivEXT)},
+    {"glProgramUniform4fEXT", P(GL_ProgramUniform4fEXT)},
+    {"glVertexAttrib1s", P(GL_VertexAttrib1s)},
+    {"glFogi", P(GL_Fogi)},
+    {"glGetBufferParameterivRobustANGLE", P(GL_GetBufferParameterivRobustANGLE)},
+    {"glGenQueriesEXT", P(GL_GenQueriesEXT)},
+    {"glBufferStorageExternalEXT", P(GL_BufferStorageExternalEXT)},
+    {"glColorMask", P(GL_ColorMask)},
+    {"glRectsv", P(GL_Rectsv)},
+    {"glSecondaryColor3iv", P(GL_SecondaryColor3iv)},
+    {"glGetMultisamplefv", P(GL_GetMultisamplefv)},
+    {"glIndexiv", P(GL_Indexiv)},
+    {"glGetSamplerParameterIuiv", P(GL_GetSamplerParameterIuiv)},
+    {"glInvalidateSubFramebuffer", P(GL_InvalidateSubFramebuffer)},
+    {"glBlendColor", P(GL_BlendColor)},
+    {"glColor3us", P(GL_Color3us)},
+    {"glDepthRangeIndexed", P(GL_DepthRangeIndexed)},
+    {"glBeginPerfMonitorAMD", P(GL_BeginPerfMonitorAMD)},
+    {"glStencilFunc", P(GL_StencilFunc)},
+    {"glMultiDrawElementsANGLE", P(GL_MultiDrawElementsANGLE)},
+    {"glDeleteSync", P(GL_DeleteSync)},
+    {"glVertexAttribL1d", P(GL_VertexAttribL1d)},
+    {"glUniform3fv", P(GL_Uniform3fv)},
+    {"glCopyTextureSubImage2D", P(GL_CopyTextureSubImage2D)},
+    {"glGenerateMipmapOES", P(GL_GenerateMipmapOES)},
+    {"glFramebufferTexture", P(GL_FramebufferTexture)},
+    {"glGetQueryObjectuivRobustANGLE", P(GL_GetQueryObjectuivRobustANGLE)},
+    {"glTexCoord2s", P(GL_TexCoord2s)},
+    {"glUniform3uiv", P(GL_Uniform3uiv)},
+    {"glGetInteger64i_v", P(GL_GetInteger64i_v)},
+    {"glGenVertexArrays", P(GL_GenVertexArrays)},
+    {"glSamplerParameteriv", P(GL_SamplerParameteriv)},
+    {"glPixelMapusv", P(GL_PixelMapusv)},
+    {"glVertexAttribIPointer", P(GL_VertexAttribIPointer)},
+    {"glValidateProgram", P(GL_ValidateProgram)},
+    {"glSelectBuffer", P(GL_SelectBuffer)},
+    {"glReadnPixelsKHR", P(GL_ReadnPixelsKHR)},
+    {"glVertexAttribP2ui", P(GL_VertexAttribP2ui)},
+    {"glGetBooleani_vRobustANGLE", P(GL_GetBooleani_vRobustANGLE)},
+    {"glGetNamedFramebufferParameteriv", P(GL_GetNamedFramebufferParameteriv)},
+    {"glUniformMatrix4x2fv", P(GL_UniformMatrix4x2fv)},
     {"glNamedFramebufferTexture", P(GL_NamedFramebufferTexture)},
-    {"glNamedFramebufferTextureLayer", P(GL_NamedFramebufferTextureLayer)},
-    {"glNamedRenderbufferStorage", P(GL_NamedRenderbufferStorage)},
-    {"glNamedRenderbufferStorageMultisample", P(GL_NamedRenderbufferStorageMultisample)},
-    {"glNewList", P(GL_NewList)},
-    {"glNormal3b", P(GL_Normal3b)},
-    {"glNormal3bv", P(GL_Normal3bv)},
-    {"glNormal3d", P(GL_Normal3d)},
-    {"glNormal3dv", P(GL_Normal3dv)},
+    {"glSecondaryColor3ui", P(GL_SecondaryColor3ui)},
+    {"glDrawArraysInstanced", P(GL_DrawArraysInstanced)},
+    {"glFramebufferFoveationParametersQCOM", P(GL_FramebufferFoveationParametersQCOM)},
+    {"glProgramUniformMatrix2x4dv", P(GL_ProgramUniformMatrix2x4dv)},
+    {"glIndexi", P(GL_Indexi)},
+    {"glGetRenderbufferImageANGLE", P(GL_GetRenderbufferImageANGLE)},
+    {"glCompressedTexImage3DOES", P(GL_CompressedTexImage3DOES)},
+    {"glTransformFeedbackBufferBase", P(GL_TransformFeedbackBufferBase)},
+    {"glBindBuffer", P(GL_BindBuffer)},
+    {"glTexCoord1i", P(GL_TexCoord1i)},
+    {"glUniform4fv", P(GL_Uniform4fv)},
+    {"glBeginQueryEXT", P(GL_BeginQueryEXT)},
+    {"glProgramUniform3uivEXT", P(GL_ProgramUniform3uivEXT)},
+    {"glRasterPos2i", P(GL_RasterPos2i)},
+    {"glNamedFramebufferRenderbuffer", P(GL_NamedFramebufferRenderbuffer)},
+    {"glTestFenceNV", P(GL_TestFenceNV)},
+    {"glInvalidateTexSubImage", P(GL_InvalidateTexSubImage)},
+    {"glVertex4f", P(GL_Vertex4f)},
+    {"glFinish", P(GL_Finish)},
+    {"glSecondaryColor3b", P(GL_SecondaryColor3b)},
+    {"glGetObjectLabel", P(GL_GetObjectLabel)},
+    {"glTexGeniv", P(GL_TexGeniv)},
+    {"glColor4f", P(GL_Color4f)},
+    {"glEGLImageTargetRenderbufferStorageOES", P(GL_EGLImageTargetRenderbufferStorageOES)},
+    {"glMultiDrawArraysInstancedANGLE", P(GL_MultiDrawArraysInstancedANGLE)},
+    {"glBindBufferBase", P(GL_BindBufferBase)},
+    {"glWindowPos3dv", P(GL_WindowPos3dv)},
+    {"glEGLImageTargetTextureStorageEXT", P(GL_EGLImageTargetTextureStorageEXT)},
+    {"glPatchParameteriOES", P(GL_PatchParameteriOES)},
+    {"glGetTexParameterIuivOES", P(GL_GetTexParameterIuivOES)},
+    {"glGetFragDataIndexEXT", P(GL_GetFragDataIndexEXT)},
+    {"glTexCoord1dv", P(GL_TexCoord1dv)},
+    {"glGetBufferPointervOES", P(GL_GetBufferPointervOES)},
+    {"glClearDepthf", P(GL_ClearDepthf)},
+    {"glVertex3f", P(GL_Vertex3f)},
+    {"glIndexf", P(GL_Indexf)},
+    {"glVertexAttrib1fv", P(GL_VertexAttrib1fv)},
+    {"glGetInternalformativRobustANGLE", P(GL_GetInternalformativRobustANGLE)},
+    {"glPolygonStipple", P(GL_PolygonStipple)},
+    {"glVertex2s", P(GL_Vertex2s)},
+    {"glObjectPtrLabel", P(GL_ObjectPtrLabel)},
+    {"glProgramUniformMatrix4x3fvEXT", P(GL_ProgramUniformMatrix4x3fvEXT)},
+    {"glDrawTexxOES", P(GL_DrawTexxOES)},
+    {"glGetDoublei_v", P(GL_GetDoublei_v)},
+    {"glPushDebugGroup", P(GL_PushDebugGroup)},
+    {"glColor4dv", P(GL_Color4dv)},
+    {"glProgramUniform4d", P(GL_ProgramUniform4d)},
+    {"glDrawElementsInstancedBaseVertex", P(GL_DrawElementsInstancedBaseVertex)},
+    {"glVertexAttrib2dv", P(GL_VertexAttrib2dv)},
+    {"glIsSampler", P(GL_IsSampler)},
+    {"glDrawTransformFeedbackStream", P(GL_DrawTransformFeedbackStream)},
+    {"glGetnUniformfvRobustANGLE", P(GL_GetnUniformfvRobustANGLE)},
+    {"glGetVertexArrayIndexed64iv", P(GL_GetVertexArrayIndexed64iv)},
+    {"glBindTransformFeedback", P(GL_BindTransformFeedback)},
+    {"glSampleMaski", P(GL_SampleMaski)},
+    {"glUseProgramStagesEXT", P(GL_UseProgramStagesEXT)},
+    {"glGenLists", P(GL_GenLists)},
+    {"glGetTextureLevelParameteriv", P(GL_GetTextureLevelParameteriv)},
+    {"glColor3ui", P(GL_Color3ui)},
     {"glNormal3f", P(GL_Normal3f)},
-    {"glNormal3fv", P(GL_Normal3fv)},
-    {"glNormal3i", P(GL_Normal3i)},
-    {"glNormal3iv", P(GL_Normal3iv)},
-    {"glNormal3s", P(GL_Normal3s)},
-    {"glNormal3sv", P(GL_Normal3sv)},
-    {"glNormal3x", P(GL_Normal3x)},
-    {"glNormalP3ui", P(GL_NormalP3ui)},
-    {"glNormalP3uiv", P(GL_NormalP3uiv)},
-    {"glNormalPointer", P(GL_NormalPointer)},
+    {"glGetFloati_v", P(GL_GetFloati_v)},
+    {"glGetActiveUniformName", P(GL_GetActiveUniformName)},
+    {"glXQueryExtensionsString", P(glXQueryExtensionsString)},
+    {"glUniformMatrix2x3dv", P(GL_UniformMatrix2x3dv)},
+    {"glCompressedTextureSubImage2D", P(GL_CompressedTextureSubImage2D)},
+    {"glBindBuffersRange", P(GL_BindBuffersRange)},
+    {"glBlendEquation", P(GL_BlendEquation)},
+    {"glVertexAttrib4s", P(GL_VertexAttrib4s)},
+    {"glTexEnvfv", P(GL_TexEnvfv)},
+    {"glEndQuery", P(GL_EndQuery)},
+    {"glProgramUniform4ui", P(GL_ProgramUniform4ui)},
+    {"glBindSampler", P(GL_BindSampler)},
+    {"glProgramUniform1uivEXT", P(GL_ProgramUniform1uivEXT)},
+    {"glColor4s", P(GL_Color4s)},
+    {"glTexSubImage2D", P(GL_TexSubImage2D)},
+    {"glCullFace", P(GL_CullFace)},
+    {"glWindowPos2dv", P(GL_WindowPos2dv)},
+    {"glXCopyContext", P(glXCopyContext)},
+    {"glGetnUniformivEXT", P(GL_GetnUniformivEXT)},
+    {"glGetnMapdv", P(GL_GetnMapdv)},
+    {"glLightiv", P(GL_Lightiv)},
     {"glObjectLabel", P(GL_ObjectLabel)},
-    {"glObjectLabelKHR", P(GL_ObjectLabelKHR)},
-    {"glObjectPtrLabel", P(GL_ObjectPtrLabel)},
-    {"glObjectPtrLabelKHR", P(GL_ObjectPtrLabelKHR)},
-    {"glOrtho", P(GL_Ortho)},
-    {"glOrthof", P(GL_Orthof)},
-    {"glOrthox", P(GL_Orthox)},
-    {"glPassThrough", P(GL_PassThrough)},
-    {"glPatchParameterfv", P(GL_PatchParameterfv)},
+    {"glDeleteTransformFeedbacks", P(GL_DeleteTransformFeedbacks)},
+    {"glReleaseTexturesANGLE", P(GL_ReleaseTexturesANGLE)},
+    {"glMapGrid1d", P(GL_MapGrid1d)},
+    {"glFogfv", P(GL_Fogfv)},
+    {"glColor3sv", P(GL_Color3sv)},
+    {"glActiveTexture", P(GL_ActiveTexture)},
+    {"glNormal3d", P(GL_Normal3d)},
+    {"glLineWidth", P(GL_LineWidth)},
+    {"glTexCoord1s", P(GL_TexCoord1s)},
+    {"glDrawElementsInstanced", P(GL_DrawElementsInstanced)},
+    {"glWeightPointerOES", P(GL_WeightPointerOES)},
     {"glPatchParameteri", P(GL_PatchParameteri)},
-    {"glPatchParameteriEXT", P(GL_PatchParameteriEXT)},
-    {"glPatchParameteriOES", P(GL_PatchParameteriOES)},
-    {"glPauseTransformFeedback", P(GL_PauseTransformFeedback)},
-    {"glPixelLocalStorageBarrierANGLE", P(GL_PixelLocalStorageBarrierANGLE)},
-    {"glPixelMapfv", P(GL_PixelMapfv)},
-    {"glPixelMapuiv", P(GL_PixelMapuiv)},
-    {"glPixelMapusv", P(GL_PixelMapusv)},
-    {"glPixelStoref", P(GL_PixelStoref)},
-    {"glPixelStorei", P(GL_PixelStorei)},
-    {"glPixelTransferf", P(GL_PixelTransferf)},
-    {"glPixelTransferi", P(GL_PixelTransferi)},
-    {"glPixelZoom", P(GL_PixelZoom)},
-    {"glPointParameterf", P(GL_PointParameterf)},
-    {"glPointParameterfv", P(GL_PointParameterfv)},
-    {"glPointParameteri", P(GL_PointParameteri)},
-    {"glPointParameteriv", P(GL_PointParameteriv)},
+    {"glGetVertexAttribfv", P(GL_GetVertexAttribfv)},
+    {"glGetQueryBufferObjectiv", P(GL_GetQueryBufferObjectiv)},
+    {"glPushMatrix", P(GL_PushMatrix)},
+    {"glGetFramebufferParameterivRobustANGLE", P(GL_GetFramebufferParameterivRobustANGLE)},
+    {"glGetVertexArrayiv", P(GL_GetVertexArrayiv)},
+    {"glMatrixIndexPointerOES", P(GL_MatrixIndexPointerOES)},
+    {"glDepthRange", P(GL_DepthRange)},
+    {"glNamedRenderbufferStorageMultisample", P(GL_NamedRenderbufferStorageMultisample)},
+    {"glBindFramebufferOES", P(GL_BindFramebufferOES)},
+    {"glRasterPos4dv", P(GL_RasterPos4dv)},
+    {"glBindRenderbuffer", P(GL_BindRenderbuffer)},
+    {"glSignalSemaphoreEXT", P(GL_SignalSemaphoreEXT)},
+    {"glCreateMemoryObjectsEXT", P(GL_CreateMemoryObjectsEXT)},
+    {"glGetTexGenxvOES", P(GL_GetTexGenxvOES)},
+    {"glProgramUniform3fv", P(GL_ProgramUniform3fv)},
+    {"glGetMapiv", P(GL_GetMapiv)},
+    {"glCompressedTexImage1D", P(GL_CompressedTexImage1D)},
+    {"glGetProgramResourceLocationIndex", P(GL_GetProgramResourceLocationIndex)},
+    {"glDepthFunc", P(GL_DepthFunc)},
+    {"glGetBufferParameteriv", P(GL_GetBufferParameteriv)},
     {"glPointParameterx", P(GL_PointParameterx)},
-    {"glPointParameterxv", P(GL_PointParameterxv)},
-    {"glPointSize", P(GL_PointSize)},
-    {"glPointSizePointerOES", P(GL_PointSizePointerOES)},
-    {"glPointSizex", P(GL_PointSizex)},
-    {"glPolygonMode", P(GL_PolygonMode)},
-    {"glPolygonModeANGLE", P(GL_PolygonModeANGLE)},
-    {"glPolygonModeNV", P(GL_PolygonModeNV)},
-    {"glPolygonOffset", P(GL_PolygonOffset)},
-    {"glPolygonOffsetClamp", P(GL_PolygonOffsetClamp)},
-    {"glPolygonOffsetClampEXT", P(GL_PolygonOffsetClampEXT)},
-    {"glPolygonOffsetx", P(GL_PolygonOffsetx)},
-    {"glPolygonStipple", P(GL_PolygonStipple)},
-    {"glPopAttrib", P(GL_PopAttrib)},
-    {"glPopClientAttrib", P(GL_PopClientAttrib)},
-    {"glPopDebugGroup", P(GL_PopDebugGroup)},
-    {"glPopDebugGroupKHR", P(GL_PopDebugGroupKHR)},
-    {"glPopGroupMarkerEXT", P(GL_PopGroupMarkerEXT)},
-    {"glPopMatrix", P(GL_PopMatrix)},
-    {"glPopName", P(GL_PopName)},
-    {"glPrimitiveBoundingBox", P(GL_PrimitiveBoundingBox)},
-    {"glPrimitiveBoundingBoxEXT", P(GL_PrimitiveBoundingBoxEXT)},
-    {"glPrimitiveBoundingBoxOES", P(GL_PrimitiveBoundingBoxOES)},
-    {"glPrimitiveRestartIndex", P(GL_PrimitiveRestartIndex)},
-    {"glPrioritizeTextures", P(GL_PrioritizeTextures)},
-    {"glProgramBinary", P(GL_ProgramBinary)},
-    {"glProgramBinaryOES", P(GL_ProgramBinaryOES)},
-    {"glProgramParameteri", P(GL_ProgramParameteri)},
-    {"glProgramParameteriEXT", P(GL_ProgramParameteriEXT)},
-    {"glProgramUniform1d", P(GL_ProgramUniform1d)},
-    {"glProgramUniform1dv", P(GL_ProgramUniform1dv)},
-    {"glProgramUniform1f", P(GL_ProgramUniform1f)},
-    {"glProgramUniform1fEXT", P(GL_ProgramUniform1fEXT)},
-    {"glProgramUniform1fv", P(GL_ProgramUniform1fv)},
-    {"glProgramUniform1fvEXT", P(GL_ProgramUniform1fvEXT)},
-    {"glProgramUniform1i", P(GL_ProgramUniform1i)},
-    {"glProgramUniform1iEXT", P(GL_ProgramUniform1iEXT)},
-    {"glProgramUniform1iv", P(GL_ProgramUniform1iv)},
-    {"glProgramUniform1ivEXT", P(GL_ProgramUniform1ivEXT)},
-    {"glProgramUniform1ui", P(GL_ProgramUniform1ui)},
+    {"glNamedFramebufferTextureLayer", P(GL_NamedFramebufferTextureLayer)},
+    {"glGetQueryObjectuiv", P(GL_GetQueryObjectuiv)},
+    {"glTexParameterx", P(GL_TexParameterx)},
+    {"glTexGenxvOES", P(GL_TexGenxvOES)},
+    {"glFlush", P(GL_Flush)},
+    {"glBindBuffersBase", P(GL_BindBuffersBase)},
+    {"glTexImage3DMultisample", P(GL_TexImage3DMultisample)},
+    {"glTexCoord2iv", P(GL_TexCoord2iv)},
+    {"glTexParameterivRobustANGLE", P(GL_TexParameterivRobustANGLE)},
+    {"glTexImage2DMultisample", P(GL_TexImage2DMultisample)},
+    {"glCopyTexSubImage3DOES", P(GL_CopyTexSubImage3DOES)},
+    {"glDrawRangeElements", P(GL_DrawRangeElements)},
+    {"glViewportIndexedf", P(GL_ViewportIndexedf)},
+    {"glGetTexParameterIuivEXT", P(GL_GetTexParameterIuivEXT)},
+    {"glVertexAttrib4fv", P(GL_VertexAttrib4fv)},
+    {"glRasterPos4i", P(GL_RasterPos4i)},
+    {"glVertex4d", P(GL_Vertex4d)},
+    {"glRasterPos3iv", P(GL_RasterPos3iv)},
+    {"glTexGenfOES", P(GL_TexGenfOES)},
+    {"glGetNamedBufferSubData", P(GL_GetNamedBufferSubData)},
+    {"glTexCoordP1uiv", P(GL_TexCoordP1uiv)},
+    {"glTexCoord3dv", P(GL_TexCoord3dv)},
+    {"glUniformMatrix2dv", P(GL_UniformMatrix2dv)},
+    {"glGetRenderbufferParameterivRobustANGLE", P(GL_GetRenderbufferParameterivRobustANGLE)},
+    {"glVertexAttrib4dv", P(GL_VertexAttrib4dv)},
+    {"glDeleteVertexArrays", P(GL_DeleteVertexArrays)},
+    {"glGetSamplerParameterIivEXT", P(GL_GetSamplerParameterIivEXT)},
+    {"glLineStipple", P(GL_LineStipple)},
+    {"glGetTexParameterfv", P(GL_GetTexParameterfv)},
+    {"glMateriali", P(GL_Materiali)},
+    {"glTexCoord2dv", P(GL_TexCoord2dv)},
+    {"glRasterPos4d", P(GL_RasterPos4d)},
+    {"glTexParameterIivOES", P(GL_TexParameterIivOES)},
+    {"glGetTexGeniv", P(GL_GetTexGeniv)},
+    {"glInsertEventMarkerEXT", P(GL_InsertEventMarkerEXT)},
+    {"glRasterPos4s", P(GL_RasterPos4s)},
+    {"glScissorIndexedv", P(GL_ScissorIndexedv)},
+    {"glFramebufferPixelLocalStorageRestoreANGLE", P(GL_FramebufferPixelLocalStorageRestoreANGLE)},
+    {"glLogicOp", P(GL_LogicOp)},
+    {"glVertex2fv", P(GL_Vertex2fv)},
+    {"glColor3i", P(GL_Color3i)},
+    {"glUniformMatrix2x3fv", P(GL_UniformMatrix2x3fv)},
+    {"glClearColorx", P(GL_ClearColorx)},
+    {"glProgramUniformMatrix3x2fv", P(GL_ProgramUniformMatrix3x2fv)},
+    {"glXGetVisualFromFBConfig", P(glXGetVisualFromFBConfig)},
+    {"glGetFramebufferParameterivMESA", P(GL_GetFramebufferParameterivMESA)},
+    {"glDrawArraysIndirect", P(GL_DrawArraysIndirect)},
+    {"glVertex2sv", P(GL_Vertex2sv)},
+    {"glMapBufferRange", P(GL_MapBufferRange)},
+    {"glCreateBuffers", P(GL_CreateBuffers)},
+    {"glProgramUniformMatrix3x2dv", P(GL_ProgramUniformMatrix3x2dv)},
+    {"glVertex2iv", P(GL_Vertex2iv)},
+    {"glDeleteFramebuffers", P(GL_DeleteFramebuffers)},
+    {"glRects", P(GL_Rects)},
+    {"glIsQuery", P(GL_IsQuery)},
+    {"glBindVertexArray", P(GL_BindVertexArray)},
+    {"glGetTextureParameterIuiv", P(GL_GetTextureParameterIuiv)},
+    {"glGetQueryBufferObjectui64v", P(GL_GetQueryBufferObjectui64v)},
+    {"glCompressedTexSubImage2D", P(GL_CompressedTexSubImage2D)},
+    {"glUniform3ui", P(GL_Uniform3ui)},
+    {"glSecondaryColor3bv", P(GL_SecondaryColor3bv)},
+    {"glUniformMatrix3x4fv", P(GL_UniformMatrix3x4fv)},
+    {"glGetIntegeri_v", P(GL_GetIntegeri_v)},
+    {"glColorP4ui", P(GL_ColorP4ui)},
+    {"glBlendFunc", P(GL_BlendFunc)},
+    {"glGetProgramResourceiv", P(GL_GetProgramResourceiv)},
+    {"glSetFenceNV", P(GL_SetFenceNV)},
+    {"glGetProgramPipelineInfoLogEXT", P(GL_GetProgramPipelineInfoLogEXT)},
+    {"glVertexP4ui", P(GL_VertexP4ui)},
+    {"glClearBufferuiv", P(GL_ClearBufferuiv)},
+    {"glGetPixelMapfv", P(GL_GetPixelMapfv)},
+    {"glVertexAttribI4ubv", P(GL_VertexAttribI4ubv)},
+    {"glGetInternalformati64v", P(GL_GetInternalformati64v)},
+    {"glGetTransformFeedbackiv", P(GL_GetTransformFeedbackiv)},
+    {"glIsEnablediEXT", P(GL_IsEnablediEXT)},
+    {"glGenProgramPipelines", P(GL_GenProgramPipelines)},
+    {"glProgramUniform2fvEXT", P(GL_ProgramUniform2fvEXT)},
+    {"glTexCoord4s", P(GL_TexCoord4s)},
+    {"glTexStorageMemFlags2DANGLE", P(GL_TexStorageMemFlags2DANGLE)},
+    {"glGetTexLevelParameterfvRobustANGLE", P(GL_GetTexLevelParameterfvRobustANGLE)},
+    {"glGetBufferPointervRobustANGLE", P(GL_GetBufferPointervRobustANGLE)},
+    {"glMatrixMode", P(GL_MatrixMode)},
+    {"glEndPerfMonitorAMD", P(GL_EndPerfMonitorAMD)},
+    {"glGetActiveUniform", P(GL_GetActiveUniform)},
+    {"glGetInternalformativ", P(GL_GetInternalformativ)},
+    {"glGetSemaphoreParameterui64vEXT", P(GL_GetSemaphoreParameterui64vEXT)},
+    {"glCompressedTexSubImage3DRobustANGLE", P(GL_CompressedTexSubImage3DRobustANGLE)},
+    {"glSamplerParameterivRobustANGLE", P(GL_SamplerParameterivRobustANGLE)},
+    {"glGetUniformIndices", P(GL_GetUniformIndices)},
+    {"glDeleteProgramPipelines", P(GL_DeleteProgramPipelines)},
+    {"glFinishFenceNV", P(GL_FinishFenceNV)},
+    {"glUniformMatrix2x4dv", P(GL_UniformMatrix2x4dv)},
+    {"glGetDebugMessageLog", P(GL_GetDebugMessageLog)},
     {"glProgramUniform1uiEXT", P(GL_ProgramUniform1uiEXT)},
-    {"glProgramUniform1uiv", P(GL_ProgramUniform1uiv)},
-    {"glProgramUniform1uivEXT", P(GL_ProgramUniform1uivEXT)},
-    {"glProgramUniform2d", P(GL_ProgramUniform2d)},
-    {"glProgramUniform2dv", P(GL_ProgramUniform2dv)},
-    {"glProgramUniform2f", P(GL_ProgramUniform2f)},
-    {"glProgramUniform2fEXT", P(GL_ProgramUniform2fEXT)},
+    {"glTexGeniOES", P(GL_TexGeniOES)},
+    {"glColor4i", P(GL_Color4i)},
+    {"glVertexP2uiv", P(GL_VertexP2uiv)},
+    {"glGetUniformfvRobustANGLE", P(GL_GetUniformfvRobustANGLE)},
+    {"glGetSamplerParameterIivOES", P(GL_GetSamplerParameterIivOES)},
+    {"glBindFragDataLocationIndexedEXT", P(GL_BindFragDataLocationIndexedEXT)},
+    {"glVertexAttribI1ui", P(GL_VertexAttribI1ui)},
+    {"glGenRenderbuffersOES", P(GL_GenRenderbuffersOES)},
+    {"glDrawElements", P(GL_DrawElements)},
+    {"glGetNamedBufferPointerv", P(GL_GetNamedBufferPointerv)},
+    {"glXGetSelectedEvent", P(glXGetSelectedEvent)},
+    {"glProgramUniformMatrix2fv", P(GL_ProgramUniformMatrix2fv)},
+    {"glDepthRangef", P(GL_DepthRangef)},
+    {"glVertexAttribI4sv", P(GL_VertexAttribI4sv)},
+    {"glClientActiveTexture", P(GL_ClientActiveTexture)},
+    {"glViewportArrayv", P(GL_ViewportArrayv)},
+    {"glVertexAttrib1f", P(GL_VertexAttrib1f)},
+    {"glGetnMinmax", P(GL_GetnMinmax)},
+    {"glMultiTexCoord3iv", P(GL_MultiTexCoord3iv)},
+    {"glEnable", P(GL_Enable)},
+    {"glProgramUniformMatrix3x4dv", P(GL_ProgramUniformMatrix3x4dv)},
+    {"glColor3ub", P(GL_Color3ub)},
+    {"glCopyTexImage2D", P(GL_CopyTexImage2D)},
+    {"glXMakeContextCurrent", P(glXMakeContextCurrent)},
+    {"glVertexP3ui", P(GL_VertexP3ui)},
+    {"glUniform1fv", P(GL_Uniform1fv)},
+    {"glDeleteProgram", P(GL_DeleteProgram)},
+    {"glGetLightfv", P(GL_GetLightfv)},
     {"glProgramUniform2fv", P(GL_ProgramUniform2fv)},
-    {"glProgramUniform2fvEXT", P(GL_ProgramUniform2fvEXT)},
-    {"glProgramUniform2i", P(GL_ProgramUniform2i)},
-    {"glProgramUniform2iEXT", P(GL_ProgramUniform2iEXT)},
-    {"glProgramUniform2iv", P(GL_ProgramUniform2iv)},
-    {"glProgramUniform2ivEXT", P(GL_ProgramUniform2ivEXT)},
-    {"glProgramUniform2ui", P(GL_ProgramUniform2ui)},
-    {"glProgramUniform2uiEXT", P(GL_ProgramUniform2uiEXT)},
-    {"glProgramUniform2uiv", P(GL_ProgramUniform2uiv)},
-    {"glProgramUniform2uivEXT", P(GL_ProgramUniform2uivEXT)},
-    {"glProgramUniform3d", P(GL_ProgramUniform3d)},
+    {"glSecondaryColorP3uiv", P(GL_SecondaryColorP3uiv)},
+    {"glBindTexture", P(GL_BindTexture)},
+    {"glGetTexEnvfv", P(GL_GetTexEnvfv)},
+    {"glNormal3bv", P(GL_Normal3bv)},
+    {"glInvalidateNamedFramebufferData", P(GL_InvalidateNamedFramebufferData)},
+    {"glGetTexParameteriv", P(GL_GetTexParameteriv)},
+    {"glEdgeFlagPointer", P(GL_EdgeFlagPointer)},
+    {"glGenBuffers", P(GL_GenBuffers)},
+    {"glVertexAttribI4ui", P(GL_VertexAttribI4ui)},
+    {"glVertexAttrib4Nubv", P(GL_VertexAttrib4Nubv)},
+    {"glGenSamplers", P(GL_GenSamplers)},
+    {"glVertex2f", P(GL_Vertex2f)},
+    {"glImportSemaphoreZirconHandleANGLE", P(GL_ImportSemaphoreZirconHandleANGLE)},
+    {"glGenFramebuffersOES", P(GL_GenFramebuffersOES)},
+    {"glDepthRangex", P(GL_DepthRangex)},
+    {"glMultiTexCoord4fv", P(GL_MultiTexCoord4fv)},
+    {"glVertexAttrib4bv", P(GL_VertexAttrib4bv)},
+    {"glIndexubv", P(GL_Indexubv)},
+    {"glMultiDrawElementsIndirect", P(GL_MultiDrawElementsIndirect)},
+    {"glMultiTexCoord1dv", P(GL_MultiTexCoord1dv)},
+    {"glTexCoord3d", P(GL_TexCoord3d)},
+    {"glXCreateNewContext", P(glXCreateNewContext)},
+    {"glProgramBinary", P(GL_ProgramBinary)},
+    {"glDrawTexiOES", P(GL_DrawTexiOES)},
+    {"glDrawArraysInstancedBaseInstanceEXT", P(GL_DrawArraysInstancedBaseInstanceEXT)},
+    {"glGetnCompressedTexImage", P(GL_GetnCompressedTexImage)},
+    {"glVertexAttribP3uiv", P(GL_VertexAttribP3uiv)},
+    {"glGetActiveUniformBlockivRobustANGLE", P(GL_GetActiveUniformBlockivRobustANGLE)},
+    {"glGetUnsignedBytei_vEXT", P(GL_GetUnsignedBytei_vEXT)},
+    {"glVertexAttribDivisorANGLE", P(GL_VertexAttribDivisorANGLE)},
+    {"glCompressedTexSubImage3D", P(GL_CompressedTexSubImage3D)},
+    {"glIsMemoryObjectEXT", P(GL_IsMemoryObjectEXT)},
+    {"glInvalidateNamedFramebufferSubData", P(GL_InvalidateNamedFramebufferSubData)},
+    {"glCompressedTextureSubImage1D", P(GL_CompressedTextureSubImage1D)},
+    {"glUniformMatrix4fv", P(GL_UniformMatrix4fv)},
+    {"glGetQueryObjectui64vRobustANGLE", P(GL_GetQueryObjectui64vRobustANGLE)},
+    {"glMultiTexCoord2sv", P(GL_MultiTexCoord2sv)},
+    {"glBindVertexArrayOES", P(GL_BindVertexArrayOES)},
     {"glProgramUniform3dv", P(GL_ProgramUniform3dv)},
-    {"glProgramUniform3f", P(GL_ProgramUniform3f)},
-    {"glProgramUniform3fEXT", P(GL_ProgramUniform3fEXT)},
-    {"glProgramUniform3fv", P(GL_ProgramUniform3fv)},
-    {"glProgramUniform3fvEXT", P(GL_ProgramUniform3fvEXT)},
-    {"glProgramUniform3i", P(GL_ProgramUniform3i)},
-    {"glProgramUniform3iEXT", P(GL_ProgramUniform3iEXT)},
-    {"glProgramUniform3iv", P(GL_ProgramUniform3iv)},
-    {"glProgramUniform3ivEXT", P(GL_ProgramUniform3ivEXT)},
-    {"glProgramUniform3ui", P(GL_ProgramUniform3ui)},
-    {"glProgramUniform3uiEXT", P(GL_ProgramUniform3uiEXT)},
+    {"glEnableVertexAttribArray", P(GL_EnableVertexAttribArray)},
+    {"glGetFloatv", P(GL_GetFloatv)},
+    {"glBlendFunciEXT", P(GL_BlendFunciEXT)},
+    {"glGetTexParameterIuiv", P(GL_GetTexParameterIuiv)},
+    {"glMultiDrawElementsInstancedANGLE", P(GL_MultiDrawElementsInstancedANGLE)},
+    {"glHint", P(GL_Hint)},
+    {"glXQueryDrawable", P(glXQueryDrawable)},
+    {"glValidateProgramPipeline", P(GL_ValidateProgramPipeline)},
     {"glProgramUniform3uiv", P(GL_ProgramUniform3uiv)},
-    {"glProgramUniform3uivEXT", P(GL_ProgramUniform3uivEXT)},
-    {"glProgramUniform4d", P(GL_ProgramUniform4d)},
-    {"glProgramUniform4dv", P(GL_ProgramUniform4dv)},
-    {"glProgramUniform4f", P(GL_ProgramUniform4f)},
-    {"glProgramUniform4fEXT", P(GL_ProgramUniform4fEXT)},
-    {"glProgramUniform4fv", P(GL_ProgramUniform4fv)},
+    {"glBeginQuery", P(GL_BeginQuery)},
+    {"glGetTexGendv", P(GL_GetTexGendv)},
+    {"glGetTextureSubImage", P(GL_GetTextureSubImage)},
+    {"glGetObjectLabelKHR", P(GL_GetObjectLabelKHR)},
+    {"glVertexAttribL4d", P(GL_VertexAttribL4d)},
+    {"glTexImage2DRobustANGLE", P(GL_TexImage2DRobustANGLE)},
+    {"glWindowPos3d", P(GL_WindowPos3d)},
+    {"glTexCoord1f", P(GL_TexCoord1f)},
+    {"glVertexAttribI4bv", P(GL_VertexAttribI4bv)},
+    {"glPrimitiveBoundingBoxEXT", P(GL_PrimitiveBoundingBoxEXT)},
+    {"glColor4ub", P(GL_Color4ub)},
+    {"glVertexAttribI4i", P(GL_VertexAttribI4i)},
+    {"glCopySubTextureCHROMIUM", P(GL_CopySubTextureCHROMIUM)},
     {"glProgramUniform4fvEXT", P(GL_ProgramUniform4fvEXT)},
-    {"glProgramUniform4i", P(GL_ProgramUniform4i)},
-    {"glProgramUniform4iEXT", P(GL_ProgramUniform4iEXT)},
-    {"glProgramUniform4iv", P(GL_ProgramUniform4iv)},
-    {"glProgramUniform4ivEXT", P(GL_ProgramUniform4ivEXT)},
-    {"glProgramUniform4ui", P(GL_ProgramUniform4ui)},
-    {"glProgramUniform4uiEXT", P(GL_ProgramUniform4uiEXT)},
-    {"glProgramUniform4uiv", P(GL_ProgramUniform4uiv)},
-    {"glProgramUniform4uivEXT", P(GL_ProgramUniform4uivEXT)},
-    {"glProgramUniformMatrix2dv", P(GL_ProgramUniformMatrix2dv)},
-    {"glProgramUniformMatrix2fv", P(GL_ProgramUniformMatrix2fv)},
-    {"glProgramUniformMatrix2fvEXT", P(GL_ProgramUniformMatrix2fvEXT)},
-    {"glProgramUniformMatrix2x3dv", P(GL_ProgramUniformMatrix2x3dv)},
-    {"glProgramUniformMatrix2x3fv", P(GL_ProgramUniformMatrix2x3fv)},
-    {"glProgramUniformMatrix2x3fvEXT", P(GL_ProgramUniformMatrix2x3fvEXT)},
-    {"glProgramUniformMatrix2x4dv", P(GL_ProgramUniformMatrix2x4dv)},
-    {"glProgramUniformMatrix2x4fv", P(GL_ProgramUniformMatrix2x4fv)},
-    {"glProgramUniformMatrix2x4fvEXT", P(GL_ProgramUniformMatrix2x4fvEXT)},
-    {"glProgramUniformMatrix3dv", P(GL_ProgramUniformMatrix3dv)},
-    {"glProgramUniformMatrix3fv", P(GL_ProgramUniformMatrix3fv)},
-    {"glProgramUniformMatrix3fvEXT", P(GL_ProgramUniformMatrix3fvEXT)},
-    {"glProgramUniformMatrix3x2dv", P(GL_ProgramUniformMatrix3x2dv)},
-    {"glProgramUniformMatrix3x2fv", P(GL_ProgramUniformMatrix3x2fv)},
-    {"glProgramUniformMatrix3x2fvEXT", P(GL_ProgramUniformMatrix3x2fvEXT)},
-    {"glProgramUniformMatrix3x4dv", P(GL_ProgramUniformMatrix3x4dv)},
-    {"glProgramUniformMatrix3x4fv", P(GL_ProgramUniformMatrix3x4fv)},
-    {"glProgramUniformMatrix3x4fvEXT", P(GL_ProgramUniformMatrix3x4fvEXT)},
-    {"glProgramUniformMatrix4dv", P(GL_ProgramUniformMatrix4dv)},
-    {"glProgramUniformMatrix4fv", P(GL_ProgramUniformMatrix4fv)},
-    {"glProgramUniformMatrix4fvEXT", P(GL_ProgramUniformMatrix4fvEXT)},
+    {"glGetnUniformdv", P(GL_GetnUniformdv)},
+    {"glPauseTransformFeedback", P(GL_PauseTransformFeedback)},
+    {"glStencilMaskSeparate", P(GL_StencilMaskSeparate)},
+    {"glVertex3d", P(GL_Vertex3d)},
+    {"glGetUniformBlockIndex", P(GL_GetUniformBlockIndex)},
+    {"glMultiTexCoord2fv", P(GL_MultiTexCoord2fv)},
+    {"glMinSampleShading", P(GL_MinSampleShading)},
     {"glProgramUniformMatrix4x2dv", P(GL_ProgramUniformMatrix4x2dv)},
-    {"glProgramUniformMatrix4x2fv", P(GL_ProgramUniformMatrix4x2fv)},
-    {"glProgramUniformMatrix4x2fvEXT", P(GL_ProgramUniformMatrix4x2fvEXT)},
-    {"glProgramUniformMatrix4x3dv", P(GL_ProgramUniformMatrix4x3dv)},
-    {"glProgramUniformMatrix4x3fv", P(GL_ProgramUniformMatrix4x3fv)},
-    {"glProgramUniformMatrix4x3fvEXT", P(GL_ProgramUniformMatrix4x3fvEXT)},
-    {"glProvokingVertex", P(GL_ProvokingVertex)},
-    {"glProvokingVertexANGLE", P(GL_ProvokingVertexANGLE)},
-    {"glPushAttrib", P(GL_PushAttrib)},
-    {"glPushClientAttrib", P(GL_PushClientAttrib)},
-    {"glPushDebugGroup", P(GL_PushDebugGroup)},
-    {"glPushDebugGroupKHR", P(GL_PushDebugGroupKHR)},
-    {"glPushGroupMarkerEXT", P(GL_PushGroupMarkerEXT)},
-    {"glPushMatrix", P(GL_PushMatrix)},
-    {"glPushName", P(GL_PushName)},
-    {"glQueryCounter", P(GL_QueryCounter)},
-    {"glQueryCounterEXT", P(GL_QueryCounterEXT)},
-    {"glQueryMatrixxOES", P(GL_QueryMatrixxOES)},
-    {"glRasterPos2d", P(GL_RasterPos2d)},
-    {"glRasterPos2dv", P(GL_RasterPos2dv)},
-    {"glRasterPos2f", P(GL_RasterPos2f)},
-    {"glRasterPos2fv", P(GL_RasterPos2fv)},
-    {"glRasterPos2i", P(GL_RasterPos2i)},
-    {"glRasterPos2iv", P(GL_RasterPos2iv)},
-    {"glRasterPos2s", P(GL_RasterPos2s)},
-    {"glRasterPos2sv", P(GL_RasterPos2sv)},
-    {"glRasterPos3d", P(GL_RasterPos3d)},
-    {"glRasterPos3dv", P(GL_RasterPos3dv)},
-    {"glRasterPos3f", P(GL_RasterPos3f)},
-    {"glRasterPos3fv", P(GL_RasterPos3fv)},
-    {"glRasterPos3i", P(GL_RasterPos3i)},
-    {"glRasterPos3iv", P(GL_RasterPos3iv)},
-    {"glRasterPos3s", P(GL_RasterPos3s)},
-    {"glRasterPos3sv", P(GL_RasterPos3sv)},
-    {"glRasterPos4d", P(GL_RasterPos4d)},
-    {"glRasterPos4dv", P(GL_RasterPos4dv)},
-    {"glRasterPos4f", P(GL_RasterPos4f)},
-    {"glRasterPos4fv", P(GL_RasterPos4fv)},
-    {"glRasterPos4i", P(GL_RasterPos4i)},
-    {"glRasterPos4iv", P(GL_RasterPos4iv)},
-    {"glRasterPos4s", P(GL_RasterPos4s)},
-    {"glRasterPos4sv", P(GL_RasterPos4sv)},
-    {"glReadBuffer", P(GL_ReadBuffer)},
-    {"glReadPixels", P(GL_ReadPixels)},
-    {"glReadPixelsRobustANGLE", P(GL_ReadPixelsRobustANGLE)},
-    {"glReadnPixels", P(GL_ReadnPixels)},
-    {"glReadnPixelsEXT", P(GL_ReadnPixelsEXT)},
-    {"glReadnPixelsKHR", P(GL_ReadnPixelsKHR)},
-    {"glReadnPixelsRobustANGLE", P(GL_ReadnPixelsRobustANGLE)},
-    {"glRectd", P(GL_Rectd)},
-    {"glRectdv", P(GL_Rectdv)},
-    {"glRectf", P(GL_Rectf)},
-    {"glRectfv", P(GL_Rectfv)},
-    {"glRecti", P(GL_Recti)},
-    {"glRectiv", P(GL_Rectiv)},
-    {"glRects", P(GL_Rects)},
-    {"glRectsv", P(GL_Rectsv)},
-    {"glReleaseShaderCompiler", P(GL_ReleaseShaderCompiler)},
-    {"glReleaseTexturesANGLE", P(GL_ReleaseTexturesANGLE)},
-    {"glRenderMode", P(GL_RenderMode)},
-    {"glRenderbufferStorage", P(GL_RenderbufferStorage)},
-    {"glRenderbufferStorageMultisample", P(GL_RenderbufferStorageMultisample)},
-    {"glRenderbufferStorageMultisampleANGLE", P(GL_RenderbufferStorageMultisampleANGLE)},
-    {"glRenderbufferStorageMultisampleEXT", P(GL_RenderbufferStorageMultisampleEXT)},
-    {"glRenderbufferStorageOES", P(GL_RenderbufferStorageOES)},
-    {"glRequestExtensionANGLE", P(GL_RequestExtensionANGLE)},
-    {"glResumeTransformFeedback", P(GL_ResumeTransformFeedback)},
-    {"glRotated", P(GL_Rotated)},
-    {"glRotatef", P(GL_Rotatef)},
-    {"glRotatex", P(GL_Rotatex)},
-    {"glSampleCoverage", P(GL_SampleCoverage)},
-    {"glSampleCoveragex", P(GL_SampleCoveragex)},
-    {"glSampleMaski", P(GL_SampleMaski)},
-    {"glSampleMaskiANGLE", P(GL_SampleMaskiANGLE)},
-    {"glSamplerParameterIiv", P(GL_SamplerParameterIiv)},
-    {"glSamplerParameterIivEXT", P(GL_SamplerParameterIivEXT)},
-    {"glSamplerParameterIivOES", P(GL_SamplerParameterIivOES)},
-    {"glSamplerParameterIivRobustANGLE", P(GL_SamplerParameterIivRobustANGLE)},
-    {"glSamplerParameterIuiv", P(GL_SamplerParameterIuiv)},
-    {"glSamplerParameterIuivEXT", P(GL_SamplerParameterIuivEXT)},
-    {"glSamplerParameterIuivOES", P(GL_SamplerParameterIuivOES)},
-    {"glSamplerParameterIuivRobustANGLE", P(GL_SamplerParameterIuivRobustANGLE)},
-    {"glSamplerParameterf", P(GL_SamplerParameterf)},
-    {"glSamplerParameterfv", P(GL_SamplerParameterfv)},
-    {"glSamplerParameterfvRobustANGLE", P(GL_SamplerParameterfvRobustANGLE)},
-    {"glSamplerParameteri", P(GL_SamplerParameteri)},
-    {"glSamplerParameteriv", P(GL_SamplerParameteriv)},
-    {"glSamplerParameterivRobustANGLE", P(GL_SamplerParameterivRobustANGLE)},
-    {"glScaled", P(GL_Scaled)},
-    {"glScalef", P(GL_Scalef)},
-    {"glScalex", P(GL_Scalex)},
-    {"glScissor", P(GL_Scissor)},
-    {"glScissorArrayv", P(GL_ScissorArrayv)},
-    {"glScissorIndexed", P(GL_ScissorIndexed)},
-    {"glScissorIndexedv", P(GL_ScissorIndexedv)},
-    {"glSecondaryColor3b", P(GL_SecondaryColor3b)},
-    {"glSecondaryColor3bv", P(GL_SecondaryColor3bv)},
-    {"glSecondaryColor3d", P(GL_SecondaryColor3d)},
-    {"glSecondaryColor3dv", P(GL_SecondaryColor3dv)},
-    {"glSecondaryColor3f", P(GL_SecondaryColor3f)},
-    {"glSecondaryColor3fv", P(GL_SecondaryColor3fv)},
-    {"glSecondaryColor3i", P(GL_SecondaryColor3i)},
-    {"glSecondaryColor3iv", P(GL_SecondaryColor3iv)},
+    {"glGetSamplerParameterivRobustANGLE", P(GL_GetSamplerParameterivRobustANGLE)},
+    {"glGetInteger64i_vRobustANGLE", P(GL_GetInteger64i_vRobustANGLE)},
+    {"glDrawElementsInstancedBaseVertexBaseInstance", P(GL_DrawElementsInstancedBaseVertexBaseInstance)},
+    {"glFlushMappedBufferRange", P(GL_FlushMappedBufferRange)},
+    {"glVertexP2ui", P(GL_VertexP2ui)},
+    {"glVertexAttribIFormat", P(GL_VertexAttribIFormat)},
+    {"glBindFramebuffer", P(GL_BindFramebuffer)},
+    {"glMultiDrawElementsBaseVertex", P(GL_MultiDrawElementsBaseVertex)},
+    {"glIndexs", P(GL_Indexs)},
+    {"glLightx", P(GL_Lightx)},
+    {"glClientWaitSync", P(GL_ClientWaitSync)},
+    {"glEndPixelLocalStorageANGLE", P(GL_EndPixelLocalStorageANGLE)},
     {"glSecondaryColor3s", P(GL_SecondaryColor3s)},
-    {"glSecondaryColor3sv", P(GL_SecondaryColor3sv)},
-    {"glSecondaryColor3ub", P(GL_SecondaryColor3ub)},
-    {"glSecondaryColor3ubv", P(GL_SecondaryColor3ubv)},
-    {"glSecondaryColor3ui", P(GL_SecondaryColor3ui)},
-    {"glSecondaryColor3uiv", P(GL_SecondaryColor3uiv)},
-    {"glSecondaryColor3us", P(GL_SecondaryColor3us)},
-    {"glSecondaryColor3usv", P(GL_SecondaryColor3usv)},
-    {"glSecondaryColorP3ui", P(GL_SecondaryColorP3ui)},
-    {"glSecondaryColorP3uiv", P(GL_SecondaryColorP3uiv)},
-    {"glSecondaryColorPointer", P(GL_SecondaryColorPointer)},
-    {"glSelectBuffer", P(GL_SelectBuffer)},
-    {"glSelectPerfMonitorCountersAMD", P(GL_SelectPerfMonitorCountersAMD)},
-    {"glSemaphoreParameterui64vEXT", P(GL_SemaphoreParameterui64vEXT)},
-    {"glSetFenceNV", P(GL_SetFenceNV)},
-    {"glShadeModel", P(GL_ShadeModel)},
-    {"glShaderBinary", P(GL_ShaderBinary)},
-    {"glShaderSource", P(GL_ShaderSource)},
-    {"glShaderStorageBlockBinding", P(GL_ShaderStorageBlockBinding)},
-    {"glShadingRateQCOM", P(GL_ShadingRateQCOM)},
-    {"glSignalSemaphoreEXT", P(GL_SignalSemaphoreEXT)},
-    {"glSpecializeShader", P(GL_SpecializeShader)},
-    {"glStartTilingQCOM", P(GL_StartTilingQCOM)},
-    {"glStencilFunc", P(GL_StencilFunc)},
-    {"glStencilFuncSeparate", P(GL_StencilFuncSeparate)},
-    {"glStencilMask", P(GL_StencilMask)},
-    {"glStencilMaskSeparate", P(GL_StencilMaskSeparate)},
-    {"glStencilOp", P(GL_StencilOp)},
+    {"glGetDebugMessageLogKHR", P(GL_GetDebugMessageLogKHR)},
+    {"glOrthof", P(GL_Orthof)},
+    {"glFramebufferTextureLayer", P(GL_FramebufferTextureLayer)},
+    {"glPopDebugGroupKHR", P(GL_PopDebugGroupKHR)},
+    {"glGetSamplerParameterIuivRobustANGLE", P(GL_GetSamplerParameterIuivRobustANGLE)},
+    {"glClearDepthx", P(GL_ClearDepthx)},
+    {"glBlitNamedFramebuffer", P(GL_BlitNamedFramebuffer)},
+    {"glActiveShaderProgramEXT", P(GL_ActiveShaderProgramEXT)},
+    {"glImportSemaphoreFdEXT", P(GL_ImportSemaphoreFdEXT)},
+    {"glVertexArrayElementBuffer", P(GL_VertexArrayElementBuffer)},
+    {"glNormalP3uiv", P(GL_NormalP3uiv)},
     {"glStencilOpSeparate", P(GL_StencilOpSeparate)},
-    {"glTestFenceNV", P(GL_TestFenceNV)},
-    {"glTexBuffer", P(GL_TexBuffer)},
-    {"glTexBufferEXT", P(GL_TexBufferEXT)},
-    {"glTexBufferOES", P(GL_TexBufferOES)},
-    {"glTexBufferRange", P(GL_TexBufferRange)},
-    {"glTexBufferRangeEXT", P(GL_TexBufferRangeEXT)},
-    {"glTexBufferRangeOES", P(GL_TexBufferRangeOES)},
-    {"glTexCoord1d", P(GL_TexCoord1d)},
-    {"glTexCoord1dv", P(GL_TexCoord1dv)},
-    {"glTexCoord1f", P(GL_TexCoord1f)},
-    {"glTexCoord1fv", P(GL_TexCoord1fv)},
-    {"glTexCoord1i", P(GL_TexCoord1i)},
-    {"glTexCoord1iv", P(GL_TexCoord1iv)},
-    {"glTexCoord1s", P(GL_TexCoord1s)},
-    {"glTexCoord1sv", P(GL_TexCoord1sv)},
-    {"glTexCoord2d", P(GL_TexCoord2d)},
-    {"glTexCoord2dv", P(GL_TexCoord2dv)},
-    {"glTexCoord2f", P(GL_TexCoord2f)},
-    {"glTexCoord2fv", P(GL_TexCoord2fv)},
-    {"glTexCoord2i", P(GL_TexCoord2i)},
-    {"glTexCoord2iv", P(GL_TexCoord2iv)},
-    {"glTexCoord2s", P(GL_TexCoord2s)},
-    {"glTexCoord2sv", P(GL_TexCoord2sv)},
-    {"glTexCoord3d", P(GL_TexCoord3d)},
-    {"glTexCoord3dv", P(GL_TexCoord3dv)},
-    {"glTexCoord3f", P(GL_TexCoord3f)},
-    {"glTexCoord3fv", P(GL_TexCoord3fv)},
-    {"glTexCoord3i", P(GL_TexCoord3i)},
-    {"glTexCoord3iv", P(GL_TexCoord3iv)},
-    {"glTexCoord3s", P(GL_TexCoord3s)},
-    {"glTexCoord3sv", P(GL_TexCoord3sv)},
-    {"glTexCoord4d", P(GL_TexCoord4d)},
-    {"glTexCoord4dv", P(GL_TexCoord4dv)},
-    {"glTexCoord4f", P(GL_TexCoord4f)},
-    {"glTexCoord4fv", P(GL_TexCoord4fv)},
-    {"glTexCoord4i", P(GL_TexCoord4i)},
-    {"glTexCoord4iv", P(GL_TexCoord4iv)},
-    {"glTexCoord4s", P(GL_TexCoord4s)},
-    {"glTexCoord4sv", P(GL_TexCoord4sv)},
-    {"glTexCoordP1ui", P(GL_TexCoordP1ui)},
-    {"glTexCoordP1uiv", P(GL_TexCoordP1uiv)},
-    {"glTexCoordP2ui", P(GL_TexCoordP2ui)},
-    {"glTexCoordP2uiv", P(GL_TexCoordP2uiv)},
-    {"glTexCoordP3ui", P(GL_TexCoordP3ui)},
+    {"glGetTextureParameterfv", P(GL_GetTextureParameterfv)},
+    {"glXGetFBConfigs", P(glXGetFBConfigs)},
+    {"glVertexAttrib4iv", P(GL_VertexAttrib4iv)},
+    {"glProgramUniform1dv", P(GL_ProgramUniform1dv)},
+    {"glMaterialf", P(GL_Materialf)},
+    {"glVertexAttrib3sv", P(GL_VertexAttrib3sv)},
+    {"glMaxShaderCompilerThreadsKHR", P(GL_MaxShaderCompilerThreadsKHR)},
+    {"glColor4x", P(GL_Color4x)},
+    {"glEndTilingQCOM", P(GL_EndTilingQCOM)},
+    {"glWindowPos3f", P(GL_WindowPos3f)},
+    {"glUniformMatrix3x2dv", P(GL_UniformMatrix3x2dv)},
+    {"glProgramUniformMatrix2x3dv", P(GL_ProgramUniformMatrix2x3dv)},
     {"glTexCoordP3uiv", P(GL_TexCoordP3uiv)},
-    {"glTexCoordP4ui", P(GL_TexCoordP4ui)},
-    {"glTexCoordP4uiv", P(GL_TexCoordP4uiv)},
-    {"glTexCoordPointer", P(GL_TexCoordPointer)},
-    {"glTexEnvf", P(GL_TexEnvf)},
-    {"glTexEnvfv", P(GL_TexEnvfv)},
-    {"glTexEnvi", P(GL_TexEnvi)},
-    {"glTexEnviv", P(GL_TexEnviv)},
-    {"glTexEnvx", P(GL_TexEnvx)},
-    {"glTexEnvxv", P(GL_TexEnvxv)},
-    {"glTexGend", P(GL_TexGend)},
-    {"glTexGendv", P(GL_TexGendv)},
-    {"glTexGenf", P(GL_TexGenf)},
-    {"glTexGenfOES", P(GL_TexGenfOES)},
-    {"glTexGenfv", P(GL_TexGenfv)},
-    {"glTexGenfvOES", P(GL_TexGenfvOES)},
-    {"glTexGeni", P(GL_TexGeni)},
-    {"glTexGeniOES", P(GL_TexGeniOES)},
-    {"glTexGeniv", P(GL_TexGeniv)},
-    {"glTexGenivOES", P(GL_TexGenivOES)},
-    {"glTexGenxOES", P(GL_TexGenxOES)},
-    {"glTexGenxvOES", P(GL_TexGenxvOES)},
-    {"glTexImage1D", P(GL_TexImage1D)},
-    {"glTexImage2D", P(GL_TexImage2D)},
-    {"glTexImage2DExternalANGLE", P(GL_TexImage2DExternalANGLE)},
-    {"glTexImage2DMultisample", P(GL_TexImage2DMultisample)},
-    {"glTexImage2DRobustANGLE", P(GL_TexImage2DRobustANGLE)},
-    {"glTexImage3D", P(GL_TexImage3D)},
-    {"glTexImage3DMultisample", P(GL_TexImage3DMultisample)},
-    {"glTexImage3DOES", P(GL_TexImage3DOES)},
-    {"glTexImage3DRobustANGLE", P(GL_TexImage3DRobustANGLE)},
-    {"glTexParameterIiv", P(GL_TexParameterIiv)},
-    {"glTexParameterIivEXT", P(GL_TexParameterIivEXT)},
-    {"glTexParameterIivOES", P(GL_TexParameterIivOES)},
-    {"glTexParameterIivRobustANGLE", P(GL_TexParameterIivRobustANGLE)},
-    {"glTexParameterIuiv", P(GL_TexParameterIuiv)},
-    {"glTexParameterIuivEXT", P(GL_TexParameterIuivEXT)},
-    {"glTexParameterIuivOES", P(GL_TexParameterIuivOES)},
-    {"glTexParameterIuivRobustANGLE", P(GL_TexParameterIuivRobustANGLE)},
-    {"glTexParameterf", P(GL_TexParameterf)},
-    {"glTexParameterfv", P(GL_TexParameterfv)},
-    {"glTexParameterfvRobustANGLE", P(GL_TexParameterfvRobustANGLE)},
-    {"glTexParameteri", P(GL_TexParameteri)},
-    {"glTexParameteriv", P(GL_TexParameteriv)},
-    {"glTexParameterivRobustANGLE", P(GL_TexParameterivRobustANGLE)},
-    {"glTexParameterx", P(GL_TexParameterx)},
-    {"glTexParameterxv", P(GL_TexParameterxv)},
-    {"glTexStorage1D", P(GL_TexStorage1D)},
-    {"glTexStorage1DEXT", P(GL_TexStorage1DEXT)},
-    {"glTexStorage2D", P(GL_TexStorage2D)},
-    {"glTexStorage2DEXT", P(GL_TexStorage2DEXT)},
-    {"glTexStorage2DMultisample", P(GL_TexStorage2DMultisample)},
-    {"glTexStorage2DMultisampleANGLE", P(GL_TexStorage2DMultisampleANGLE)},
-    {"glTexStorage3D", P(GL_TexStorage3D)},
-    {"glTexStorage3DEXT", P(GL_TexStorage3DEXT)},
-    {"glTexStorage3DMultisample", P(GL_TexStorage3DMultisample)},
-    {"glTexStorage3DMultisampleOES", P(GL_TexStorage3DMultisampleOES)},
-    {"glTexStorageMem2DEXT", P(GL_TexStorageMem2DEXT)},
-    {"glTexStorageMem2DMultisampleEXT", P(GL_TexStorageMem2DMultisampleEXT)},
-    {"glTexStorageMem3DEXT", P(GL_TexStorageMem3DEXT)},
-    {"glTexStorageMem3DMultisampleEXT", P(GL_TexStorageMem3DMultisampleEXT)},
-    {"glTexStorageMemFlags2DANGLE", P(GL_TexStorageMemFlags2DANGLE)},
-    {"glTexStorageMemFlags2DMultisampleANGLE", P(GL_TexStorageMemFlags2DMultisampleANGLE)},
-    {"glTexStorageMemFlags3DANGLE", P(GL_TexStorageMemFlags3DANGLE)},
-    {"glTexStorageMemFlags3DMultisampleANGLE", P(GL_TexStorageMemFlags3DMultisampleANGLE)},
-    {"glTexSubImage1D", P(GL_TexSubImage1D)},
-    {"glTexSubImage2D", P(GL_TexSubImage2D)},
-    {"glTexSubImage2DRobustANGLE", P(GL_TexSubImage2DRobustANGLE)},
-    {"glTexSubImage3D", P(GL_TexSubImage3D)},
-    {"glTexSubImage3DOES", P(GL_TexSubImage3DOES)},
-    {"glTexSubImage3DRobustANGLE", P(GL_TexSubImage3DRobustANGLE)},
-    {"glTextureBarrier", P(GL_TextureBarrier)},
-    {"glTextureBuffer", P(GL_TextureBuffer)},
-    {"glTextureBufferRange", P(GL_TextureBufferRange)},
-    {"glTextureFoveationParametersQCOM", P(GL_TextureFoveationParametersQCOM)},
-    {"glTextureParameterIiv", P(GL_TextureParameterIiv)},
-    {"glTextureParameterIuiv", P(GL_TextureParameterIuiv)},
-    {"glTextureParameterf", P(GL_TextureParameterf)},
-    {"glTextureParameterfv", P(GL_TextureParameterfv)},
-    {"glTextureParameteri", P(GL_TextureParameteri)},
-    {"glTextureParameteriv", P(GL_TextureParameteriv)},
+    {"glRenderbufferStorageMultisampleANGLE", P(GL_RenderbufferStorageMultisampleANGLE)},
+    {"glRasterPos2dv", P(GL_RasterPos2dv)},
+    {"glCreateTextures", P(GL_CreateTextures)},
+    {"glSemaphoreParameterui64vEXT", P(GL_SemaphoreParameterui64vEXT)},
+    {"glMapGrid2f", P(GL_MapGrid2f)},
+    {"glFogiv", P(GL_Fogiv)},
+    {"glEvalPoint1", P(GL_EvalPoint1)},
+    {"glGetString", P(GL_GetString)},
+    {"glLoadMatrixd", P(GL_LoadMatrixd)},
+    {"glVertexAttribFormat", P(GL_VertexAttribFormat)},
+    {"glVertex3iv", P(GL_Vertex3iv)},
+    {"glIndexdv", P(GL_Indexdv)},
+    {"glEndQueryEXT", P(GL_EndQueryEXT)},
+    {"glClearTexImage", P(GL_ClearTexImage)},
+    {"glRenderMode", P(GL_RenderMode)},
+    {"glIsSemaphoreEXT", P(GL_IsSemaphoreEXT)},
+    {"glWindowPos2i", P(GL_WindowPos2i)},
     {"glTextureStorage1D", P(GL_TextureStorage1D)},
-    {"glTextureStorage2D", P(GL_TextureStorage2D)},
-    {"glTextureStorage2DMultisample", P(GL_TextureStorage2DMultisample)},
-    {"glTextureStorage3D", P(GL_TextureStorage3D)},
-    {"glTextureStorage3DMultisample", P(GL_TextureStorage3DMultisample)},
-    {"glTextureSubImage1D", P(GL_TextureSubImage1D)},
-    {"glTextureSubImage2D", P(GL_TextureSubImage2D)},
-    {"glTextureSubImage3D", P(GL_TextureSubImage3D)},
-    {"glTextureView", P(GL_TextureView)},
-    {"glTransformFeedbackBufferBase", P(GL_TransformFeedbackBufferBase)},
-    {"glTransformFeedbackBufferRange", P(GL_TransformFeedbackBufferRange)},
-    {"glTransformFeedbackVaryings", P(GL_TransformFeedbackVaryings)},
-    {"glTranslated", P(GL_Translated)},
-    {"glTranslatef", P(GL_Translatef)},
-    {"glTranslatex", P(GL_Translatex)},
-    {"glUniform1d", P(GL_Uniform1d)},
-    {"glUniform1dv", P(GL_Uniform1dv)},
-    {"glUniform1f", P(GL_Uniform1f)},
-    {"glUniform1fv", P(GL_Uniform1fv)},
-    {"glUniform1i", P(GL_Uniform1i)},
-    {"glUniform1iv", P(GL_Uniform1iv)},
-    {"glUniform1ui", P(GL_Uniform1ui)},
-    {"glUniform1uiv", P(GL_Uniform1uiv)},
-    {"glUniform2d", P(GL_Uniform2d)},
-    {"glUniform2dv", P(GL_Uniform2dv)},
-    {"glUniform2f", P(GL_Uniform2f)},
-    {"glUniform2fv", P(GL_Uniform2fv)},
-    {"glUniform2i", P(GL_Uniform2i)},
-    {"glUniform2iv", P(GL_Uniform2iv)},
-    {"glUniform2ui", P(GL_Uniform2ui)},
-    {"glUniform2uiv", P(GL_Uniform2uiv)},
-    {"glUniform3d", P(GL_Uniform3d)},
-    {"glUniform3dv", P(GL_Uniform3dv)},
-    {"glUniform3f", P(GL_Uniform3f)},
-    {"glUniform3fv", P(GL_Uniform3fv)},
-    {"glUniform3i", P(GL_Uniform3i)},
-    {"glUniform3iv", P(GL_Uniform3iv)},
-    {"glUniform3ui", P(GL_Uniform3ui)},
-    {"glUniform3uiv", P(GL_Uniform3uiv)},
-    {"glUniform4d", P(GL_Uniform4d)},
-    {"glUniform4dv", P(GL_Uniform4dv)},
-    {"glUniform4f", P(GL_Uniform4f)},
-    {"glUniform4fv", P(GL_Uniform4fv)},
-    {"glUniform4i", P(GL_Uniform4i)},
-    {"glUniform4iv", P(GL_Uniform4iv)},
-    {"glUniform4ui", P(GL_Uniform4ui)},
-    {"glUniform4uiv", P(GL_Uniform4uiv)},
-    {"glUniformBlockBinding", P(GL_UniformBlockBinding)},
-    {"glUniformMatrix2dv", P(GL_UniformMatrix2dv)},
+    {"glGetVertexAttribPointerv", P(GL_GetVertexAttribPointerv)},
+    {"glSecondaryColor3f", P(GL_SecondaryColor3f)},
+    {"glTexCoord1d", P(GL_TexCoord1d)},
+    {"glTexParameterf", P(GL_TexParameterf)},
+    {"glTexBufferOES", P(GL_TexBufferOES)},
+    {"glGetCompressedTexImage", P(GL_GetCompressedTexImage)},
+    {"glProgramUniformMatrix2fvEXT", P(GL_ProgramUniformMatrix2fvEXT)},
+    {"glGetnUniformuivRobustANGLE", P(GL_GetnUniformuivRobustANGLE)},
+    {"glRasterPos4fv", P(GL_RasterPos4fv)},
+    {"glGetBufferSubData", P(GL_GetBufferSubData)},
+    {"glProgramUniform2iEXT", P(GL_ProgramUniform2iEXT)},
+    {"glLightModelx", P(GL_LightModelx)},
+    {"glGetQueryObjectiv", P(GL_GetQueryObjectiv)},
+    {"glBlendEquationSeparatei", P(GL_BlendEquationSeparatei)},
+    {"glPointParameterfv", P(GL_PointParameterfv)},
+    {"glMultiTexCoord1i", P(GL_MultiTexCoord1i)},
+    {"glPixelTransferi", P(GL_PixelTransferi)},
+    {"glLoseContextCHROMIUM", P(GL_LoseContextCHROMIUM)},
+    {"glGetTexLevelParameterfvANGLE", P(GL_GetTexLevelParameterfvANGLE)},
+    {"glMultiTexCoordP3uiv", P(GL_MultiTexCoordP3uiv)},
+    {"glUseProgram", P(GL_UseProgram)},
+    {"glVertexAttrib3fv", P(GL_VertexAttrib3fv)},
+    {"glEvalMesh1", P(GL_EvalMesh1)},
     {"glUniformMatrix2fv", P(GL_UniformMatrix2fv)},
-    {"glUniformMatrix2x3dv", P(GL_UniformMatrix2x3dv)},
-    {"glUniformMatrix2x3fv", P(GL_UniformMatrix2x3fv)},
-    {"glUniformMatrix2x4dv", P(GL_UniformMatrix2x4dv)},
-    {"glUniformMatrix2x4fv", P(GL_UniformMatrix2x4fv)},
-    {"glUniformMatrix3dv", P(GL_UniformMatrix3dv)},
-    {"glUniformMatrix3fv", P(GL_UniformMatrix3fv)},
-    {"glUniformMatrix3x2dv", P(GL_UniformMatrix3x2dv)},
-    {"glUniformMatrix3x2fv", P(GL_UniformMatrix3x2fv)},
-    {"glUniformMatrix3x4dv", P(GL_UniformMatrix3x4dv)},
-    {"glUniformMatrix3x4fv", P(GL_UniformMatrix3x4fv)},
-    {"glUniformMatrix4dv", P(GL_UniformMatrix4dv)},
-    {"glUniformMatrix4fv", P(GL_UniformMatrix4fv)},
-    {"glUniformMatrix4x2dv", P(GL_UniformMatrix4x2dv)},
-    {"glUniformMatrix4x2fv", P(GL_UniformMatrix4x2fv)},
-    {"glUniformMatrix4x3dv", P(GL_UniformMatrix4x3dv)},
-    {"glUniformMatrix4x3fv", P(GL_UniformMatrix4x3fv)},
-    {"glUniformSubroutinesuiv", P(GL_UniformSubroutinesuiv)},
-    {"glUnmapBuffer", P(GL_UnmapBuffer)},
-    {"glUnmapBufferOES", P(GL_UnmapBufferOES)},
+    {"glMultiTexCoord2i", P(GL_MultiTexCoord2i)},
+    {"glImportMemoryFdEXT", P(GL_ImportMemoryFdEXT)},
+    {"glProgramUniform4fv", P(GL_ProgramUniform4fv)},
+    {"glIsRenderbufferOES", P(GL_IsRenderbufferOES)},
+    {"glXQueryServerString", P(glXQueryServerString)},
+    {"glDeleteShader", P(GL_DeleteShader)},
+    {"glGetInteger64vRobustANGLE", P(GL_GetInteger64vRobustANGLE)},
+    {"glMultiDrawArraysANGLE", P(GL_MultiDrawArraysANGLE)},
+    {"glFramebufferFetchBarrierEXT", P(GL_FramebufferFetchBarrierEXT)},
+    {"glFogx", P(GL_Fogx)},
+    {"glProgramUniformMatrix4fvEXT", P(GL_ProgramUniformMatrix4fvEXT)},
+    {"glGetQueryObjecti64v", P(GL_GetQueryObjecti64v)},
     {"glUnmapNamedBuffer", P(GL_UnmapNamedBuffer)},
-    {"glUseProgram", P(GL_UseProgram)},
-    {"glUseProgramStages", P(GL_UseProgramStages)},
-    {"glUseProgramStagesEXT", P(GL_UseProgramStagesEXT)},
-    {"glValidateProgram", P(GL_ValidateProgram)},
-    {"glValidateProgramPipeline", P(GL_ValidateProgramPipeline)},
-    {"glValidateProgramPipelineEXT", P(GL_ValidateProgramPipelineEXT)},
-    {"glVertex2d", P(GL_Vertex2d)},
-    {"glVertex2dv", P(GL_Vertex2dv)},
-    {"glVertex2f", P(GL_Vertex2f)},
-    {"glVertex2fv", P(GL_Vertex2fv)},
-    {"glVertex2i", P(GL_Vertex2i)},
-    {"glVertex2iv", P(GL_Vertex2iv)},
-    {"glVertex2s", P(GL_Vertex2s)},
-    {"glVertex2sv", P(GL_Vertex2sv)},
-    {"glVertex3d", P(GL_Vertex3d)},
-    {"glVertex3dv", P(GL_Vertex3dv)},
-    {"glVertex3f", P(GL_Vertex3f)},
-    {"glVertex3fv", P(GL_Vertex3fv)},
-    {"glVertex3i", P(GL_Vertex3i)},
-    {"glVertex3iv", P(GL_Vertex3iv)},
+    {"glUniform4ui", P(GL_Uniform4ui)},
+    {"glFramebufferTexture3D", P(GL_FramebufferTexture3D)},
+    {"glGetLightxv", P(GL_GetLightxv)},
+    {"glSamplerParameteri", P(GL_SamplerParameteri)},
+    {"glGetTranslatedShaderSourceANGLE", P(GL_GetTranslatedShaderSourceANGLE)},
+    {"glScaled", P(GL_Scaled)},
+    {"glVertexAttribI3iv", P(GL_VertexAttribI3iv)},
+    {"glFlushMappedBufferRangeEXT", P(GL_FlushMappedBufferRangeEXT)},
     {"glVertex3s", P(GL_Vertex3s)},
-    {"glVertex3sv", P(GL_Vertex3sv)},
-    {"glVertex4d", P(GL_Vertex4d)},
-    {"glVertex4dv", P(GL_Vertex4dv)},
-    {"glVertex4f", P(GL_Vertex4f)},
-    {"glVertex4fv", P(GL_Vertex4fv)},
-    {"glVertex4i", P(GL_Vertex4i)},
-    {"glVertex4iv", P(GL_Vertex4iv)},
+    {"glUniformMatrix3dv", P(GL_UniformMatrix3dv)},
+    {"glNormal3b", P(GL_Normal3b)},
+    {"glWindowPos2sv", P(GL_WindowPos2sv)},
+    {"glFramebufferTexture3DOES", P(GL_FramebufferTexture3DOES)},
+    {"glVertexAttrib4ubv", P(GL_VertexAttrib4ubv)},
+    {"glIndexsv", P(GL_Indexsv)},
+    {"glSamplerParameterf", P(GL_SamplerParameterf)},
+    {"glBlendEquationSeparate", P(GL_BlendEquationSeparate)},
+    {"glEGLImageTargetTexture2DOES", P(GL_EGLImageTargetTexture2DOES)},
+    {"glCopyImageSubData", P(GL_CopyImageSubData)},
+    {"glVertexAttrib2f", P(GL_VertexAttrib2f)},
+    {"glColor3ubv", P(GL_Color3ubv)},
+    {"glPixelStoref", P(GL_PixelStoref)},
+    {"glUniformMatrix3x2fv", P(GL_UniformMatrix3x2fv)},
+    {"glTexStorageMem3DMultisampleEXT", P(GL_TexStorageMem3DMultisampleEXT)},
+    {"glVertexAttribL3d", P(GL_VertexAttribL3d)},
+    {"glVertexAttribI3i", P(GL_VertexAttribI3i)},
+    {"glTexCoord2fv", P(GL_TexCoord2fv)},
+    {"glMultiTexCoord1fv", P(GL_MultiTexCoord1fv)},
+    {"glTexCoord3s", P(GL_TexCoord3s)},
+    {"glGetQueryivRobustANGLE", P(GL_GetQueryivRobustANGLE)},
+    {"glGetnSeparableFilter", P(GL_GetnSeparableFilter)},
+    {"glPixelMapfv", P(GL_PixelMapfv)},
+    {"glColor3bv", P(GL_Color3bv)},
+    {"glVertexAttribPointer", P(GL_VertexAttribPointer)},
     {"glVertex4s", P(GL_Vertex4s)},
+    {"glUniform2f", P(GL_Uniform2f)},
+    {"glGetVertexAttribPointervRobustANGLE", P(GL_GetVertexAttribPointervRobustANGLE)},
+    {"glImportMemoryZirconHandleANGLE", P(GL_ImportMemoryZirconHandleANGLE)},
+    {"glTextureBufferRange", P(GL_TextureBufferRange)},
+    {"glMap2f", P(GL_Map2f)},
+    {"glMultiTexCoord1s", P(GL_MultiTexCoord1s)},
+    {"glGenerateMipmap", P(GL_GenerateMipmap)},
+    {"glVertexAttrib2s", P(GL_VertexAttrib2s)},
+    {"glGetUniformuiv", P(GL_GetUniformuiv)},
+    {"glGetInteger64v", P(GL_GetInteger64v)},
+    {"glClipPlanex", P(GL_ClipPlanex)},
     {"glVertex4sv", P(GL_Vertex4sv)},
+    {"glTexImage3DOES", P(GL_TexImage3DOES)},
+    {"glCopyTextureCHROMIUM", P(GL_CopyTextureCHROMIUM)},
+    {"glValidateProgramPipelineEXT", P(GL_ValidateProgramPipelineEXT)},
+    {"glPatchParameteriEXT", P(GL_PatchParameteriEXT)},
+    {"glProgramBinaryOES", P(GL_ProgramBinaryOES)},
+    {"glClearAccum", P(GL_ClearAccum)},
+    {"glColorMaski", P(GL_ColorMaski)},
+    {"glGetProgramInterfaceiv", P(GL_GetProgramInterfaceiv)},
+    {"glEvalCoord2fv", P(GL_EvalCoord2fv)},
+    {"glRenderbufferStorageMultisample", P(GL_RenderbufferStorageMultisample)},
+    {"glGetObjectLabelEXT", P(GL_GetObjectLabelEXT)},
+    {"glLoadPaletteFromModelViewMatrixOES", P(GL_LoadPaletteFromModelViewMatrixOES)},
+    {"glUniform4i", P(GL_Uniform4i)},
+    {"glColorPointer", P(GL_ColorPointer)},
+    {"glRasterPos4sv", P(GL_RasterPos4sv)},
+    {"glMap1f", P(GL_Map1f)},
+    {"glDeleteVertexArraysOES", P(GL_DeleteVertexArraysOES)},
+    {"glXCreateContext", P(glXCreateContext)},
+    {"glDeleteRenderbuffers", P(GL_DeleteRenderbuffers)},
+    {"glUniform4d", P(GL_Uniform4d)},
+    {"glProgramUniformMatrix4dv", P(GL_ProgramUniformMatrix4dv)},
+    {"glGetProgramResourceName", P(GL_GetProgramResourceName)},
+    {"glXIsDirect", P(glXIsDirect)},
+    {"glProgramUniform2i", P(GL_ProgramUniform2i)},
+    {"glUniform1i", P(GL_Uniform1i)},
+    {"glProgramUniformMatrix4x2fvEXT", P(GL_ProgramUniformMatrix4x2fvEXT)},
+    {"glMinSampleShadingOES", P(GL_MinSampleShadingOES)},
+    {"glIsEnabled", P(GL_IsEnabled)},
+    {"glRotatef", P(GL_Rotatef)},
+    {"glGenFencesNV", P(GL_GenFencesNV)},
+    {"glPushClientAttrib", P(GL_PushClientAttrib)},
+    {"glCompileShader", P(GL_CompileShader)},
+    {"glPixelLocalStorageBarrierANGLE", P(GL_PixelLocalStorageBarrierANGLE)},
+    {"glGetPointerv", P(GL_GetPointerv)},
+    {"glXDestroyPixmap", P(glXDestroyPixmap)},
+    {"glCompressedTexImage3DRobustANGLE", P(GL_CompressedTexImage3DRobustANGLE)},
+    {"glGetnPolygonStipple", P(GL_GetnPolygonStipple)},
+    {"glGetMapfv", P(GL_GetMapfv)},
+    {"glTranslated", P(GL_Translated)},
+    {"glEvalCoord1f", P(GL_EvalCoord1f)},
+    {"glGetnUniformivKHR", P(GL_GetnUniformivKHR)},
+    {"glGetBufferPointerv", P(GL_GetBufferPointerv)},
+    {"glDeleteRenderbuffersOES", P(GL_DeleteRenderbuffersOES)},
+    {"glFramebufferPixelLocalClearValueivANGLE", P(GL_FramebufferPixelLocalClearValueivANGLE)},
+    {"glFramebufferTexture1D", P(GL_FramebufferTexture1D)},
+    {"glColor4usv", P(GL_Color4usv)},
+    {"glPushName", P(GL_PushName)},
+    {"glObjectLabelKHR", P(GL_ObjectLabelKHR)},
+    {"glIsProgram", P(GL_IsProgram)},
+    {"glProgramUniform2uivEXT", P(GL_ProgramUniform2uivEXT)},
+    {"glLinkProgram", P(GL_LinkProgram)},
+    {"glPointParameteri", P(GL_PointParameteri)},
+    {"glTexGenxOES", P(GL_TexGenxOES)},
+    {"glBindProgramPipelineEXT", P(GL_BindProgramPipelineEXT)},
+    {"glProgramUniform4iv", P(GL_ProgramUniform4iv)},
+    {"glCopySubTexture3DANGLE", P(GL_CopySubTexture3DANGLE)},
+    {"glGetTexImage", P(GL_GetTexImage)},
+    {"glReadPixelsRobustANGLE", P(GL_ReadPixelsRobustANGLE)},
+    {"glEnableClientState", P(GL_EnableClientState)},
+    {"glTexCoord3iv", P(GL_TexCoord3iv)},
+    {"glCoverageModulationCHROMIUM", P(GL_CoverageModulationCHROMIUM)},
+    {"glWindowPos2fv", P(GL_WindowPos2fv)},
+    {"glMultiTexCoord4s", P(GL_MultiTexCoord4s)},
+    {"glGetProgramPipelineivEXT", P(GL_GetProgramPipelineivEXT)},
+    {"glTexEnvf", P(GL_TexEnvf)},
+    {"glMultiTexCoord4i", P(GL_MultiTexCoord4i)},
+    {"glGetTexParameterxv", P(GL_GetTexParameterxv)},
+    {"glGetSamplerParameterfvRobustANGLE", P(GL_GetSamplerParameterfvRobustANGLE)},
     {"glVertexArrayAttribBinding", P(GL_VertexArrayAttribBinding)},
-    {"glVertexArrayAttribFormat", P(GL_VertexArrayAttribFormat)},
-    {"glVertexArrayAttribIFormat", P(GL_VertexArrayAttribIFormat)},
-    {"glVertexArrayAttribLFormat", P(GL_VertexArrayAttribLFormat)},
+    {"glEndConditionalRender", P(GL_EndConditionalRender)},
     {"glVertexArrayBindingDivisor", P(GL_VertexArrayBindingDivisor)},
-    {"glVertexArrayElementBuffer", P(GL_VertexArrayElementBuffer)},
-    {"glVertexArrayVertexBuffer", P(GL_VertexArrayVertexBuffer)},
-    {"glVertexArrayVertexBuffers", P(GL_VertexArrayVertexBuffers)},
-    {"glVertexAttrib1d", P(GL_VertexAttrib1d)},
-    {"glVertexAttrib1dv", P(GL_VertexAttrib1dv)},
-    {"glVertexAttrib1f", P(GL_VertexAttrib1f)},
-    {"glVertexAttrib1fv", P(GL_VertexAttrib1fv)},
-    {"glVertexAttrib1s", P(GL_VertexAttrib1s)},
-    {"glVertexAttrib1sv", P(GL_VertexAttrib1sv)},
-    {"glVertexAttrib2d", P(GL_VertexAttrib2d)},
-    {"glVertexAttrib2dv", P(GL_VertexAttrib2dv)},
-    {"glVertexAttrib2f", P(GL_VertexAttrib2f)},
-    {"glVertexAttrib2fv", P(GL_VertexAttrib2fv)},
-    {"glVertexAttrib2s", P(GL_VertexAttrib2s)},
-    {"glVertexAttrib2sv", P(GL_VertexAttrib2sv)},
-    {"glVertexAttrib3d", P(GL_VertexAttrib3d)},
-    {"glVertexAttrib3dv", P(GL_VertexAttrib3dv)},
-    {"glVertexAttrib3f", P(GL_VertexAttrib3f)},
-    {"glVertexAttrib3fv", P(GL_VertexAttrib3fv)},
-    {"glVertexAttrib3s", P(GL_VertexAttrib3s)},
-    {"glVertexAttrib3sv", P(GL_VertexAttrib3sv)},
-    {"glVertexAttrib4Nbv", P(GL_VertexAttrib4Nbv)},
-    {"glVertexAttrib4Niv", P(GL_VertexAttrib4Niv)},
-    {"glVertexAttrib4Nsv", P(GL_VertexAttrib4Nsv)},
-    {"glVertexAttrib4Nub", P(GL_VertexAttrib4Nub)},
-    {"glVertexAttrib4Nubv", P(GL_VertexAttrib4Nubv)},
-    {"glVertexAttrib4Nuiv", P(GL_VertexAttrib4Nuiv)},
-    {"glVertexAttrib4Nusv", P(GL_VertexAttrib4Nusv)},
-    {"glVertexAttrib4bv", P(GL_VertexAttrib4bv)},
-    {"glVertexAttrib4d", P(GL_VertexAttrib4d)},
-    {"glVertexAttrib4dv", P(GL_VertexAttrib4dv)},
-    {"glVertexAttrib4f", P(GL_VertexAttrib4f)},
-    {"glVertexAttrib4fv", P(GL_VertexAttrib4fv)},
-    {"glVertexAttrib4iv", P(GL_VertexAttrib4iv)},
-    {"glVertexAttrib4s", P(GL_VertexAttrib4s)},
-    {"glVertexAttrib4sv", P(GL_VertexAttrib4sv)},
-    {"glVertexAttrib4ubv", P(GL_VertexAttrib4ubv)},
-    {"glVertexAttrib4uiv", P(GL_VertexAttrib4uiv)},
-    {"glVertexAttrib4usv", P(GL_VertexAttrib4usv)},
-    {"glVertexAttribBinding", P(GL_VertexAttribBinding)},
-    {"glVertexAttribDivisor", P(GL_VertexAttribDivisor)},
-    {"glVertexAttribDivisorANGLE", P(GL_VertexAttribDivisorANGLE)},
-    {"glVertexAttribDivisorEXT", P(GL_VertexAttribDivisorEXT)},
-    {"glVertexAttribFormat", P(GL_VertexAttribFormat)},
-    {"glVertexAttribI1i", P(GL_VertexAttribI1i)},
-    {"glVertexAttribI1iv", P(GL_VertexAttribI1iv)},
-    {"glVertexAttribI1ui", P(GL_VertexAttribI1ui)},
-    {"glVertexAttribI1uiv", P(GL_VertexAttribI1uiv)},
-    {"glVertexAttribI2i", P(GL_VertexAttribI2i)},
-    {"glVertexAttribI2iv", P(GL_VertexAttribI2iv)},
-    {"glVertexAttribI2ui", P(GL_VertexAttribI2ui)},
-    {"glVertexAttribI2uiv", P(GL_VertexAttribI2uiv)},
-    {"glVertexAttribI3i", P(GL_VertexAttribI3i)},
-    {"glVertexAttribI3iv", P(GL_VertexAttribI3iv)},
-    {"glVertexAttribI3ui", P(GL_VertexAttribI3ui)},
-    {"glVertexAttribI3uiv", P(GL_VertexAttribI3uiv)},
-    {"glVertexAttribI4bv", P(GL_VertexAttribI4bv)},
-    {"glVertexAttribI4i", P(GL_VertexAttribI4i)},
+    {"glLoadMatrixx", P(GL_LoadMatrixx)},
+    {"glTexCoord2f", P(GL_TexCoord2f)},
+    {"glVertexAttribP1ui", P(GL_VertexAttribP1ui)},
+    {"glPointSizePointerOES", P(GL_PointSizePointerOES)},
+    {"glDrawElementsInstancedBaseInstance", P(GL_DrawElementsInstancedBaseInstance)},
+    {"glDrawTransformFeedbackInstanced", P(GL_DrawTransformFeedbackInstanced)},
+    {"glBeginPixelLocalStorageANGLE", P(GL_BeginPixelLocalStorageANGLE)},
+    {"glProgramUniform1ivEXT", P(GL_ProgramUniform1ivEXT)},
+    {"glDeleteTextures", P(GL_DeleteTextures)},
+    {"glGetProgramStageiv", P(GL_GetProgramStageiv)},
+    {"glGetPixelMapusv", P(GL_GetPixelMapusv)},
+    {"glSamplerParameterIivEXT", P(GL_SamplerParameterIivEXT)},
+    {"glProgramUniform2d", P(GL_ProgramUniform2d)},
+    {"glGetActiveUniformBlockiv", P(GL_GetActiveUniformBlockiv)},
+    {"glGetQueryObjectivRobustANGLE", P(GL_GetQueryObjectivRobustANGLE)},
+    {"glRectfv", P(GL_Rectfv)},
+    {"glUniformBlockBinding", P(GL_UniformBlockBinding)},
+    {"glGetTransformFeedbacki_v", P(GL_GetTransformFeedbacki_v)},
+    {"glWindowPos2iv", P(GL_WindowPos2iv)},
+    {"glNormal3i", P(GL_Normal3i)},
+    {"glTexParameterIuivEXT", P(GL_TexParameterIuivEXT)},
+    {"glMultiTexCoordP1uiv", P(GL_MultiTexCoordP1uiv)},
+    {"glCallLists", P(GL_CallLists)},
+    {"glGenSemaphoresEXT", P(GL_GenSemaphoresEXT)},
+    {"glVertex2dv", P(GL_Vertex2dv)},
+    {"glGetMultisamplefvANGLE", P(GL_GetMultisamplefvANGLE)},
+    {"glGetRenderbufferParameteriv", P(GL_GetRenderbufferParameteriv)},
+    {"glProvokingVertex", P(GL_ProvokingVertex)},
+    {"glCreateTransformFeedbacks", P(GL_CreateTransformFeedbacks)},
+    {"glWaitSync", P(GL_WaitSync)},
+    {"glPolygonOffsetx", P(GL_PolygonOffsetx)},
+    {"glRasterPos3sv", P(GL_RasterPos3sv)},
+    {"glPixelMapuiv", P(GL_PixelMapuiv)},
+    {"glTexStorage1DEXT", P(GL_TexStorage1DEXT)},
+    {"glTexCoordPointer", P(GL_TexCoordPointer)},
+    {"glGetSamplerParameterfv", P(GL_GetSamplerParameterfv)},
+    {"glRasterPos3d", P(GL_RasterPos3d)},
+    {"glProgramUniformMatrix3x4fvEXT", P(GL_ProgramUniformMatrix3x4fvEXT)},
+    {"glFramebufferTexturePixelLocalStorageANGLE", P(GL_FramebufferTexturePixelLocalStorageANGLE)},
+    {"glXGetCurrentContext", P(glXGetCurrentContext)},
+    {"glGetBufferParameteri64v", P(GL_GetBufferParameteri64v)},
+    {"glProgramUniform4i", P(GL_ProgramUniform4i)},
+    {"glClear", P(GL_Clear)},
+    {"glCompressedTextureSubImage3D", P(GL_CompressedTextureSubImage3D)},
+    {"glGetQueryIndexediv", P(GL_GetQueryIndexediv)},
+    {"glTexCoord4i", P(GL_TexCoord4i)},
+    {"glGetUniformuivRobustANGLE", P(GL_GetUniformuivRobustANGLE)},
+    {"glRasterPos2sv", P(GL_RasterPos2sv)},
+    {"glMultTransposeMatrixd", P(GL_MultTransposeMatrixd)},
+    {"glTexParameterIivEXT", P(GL_TexParameterIivEXT)},
+    {"glBlitFramebuffer", P(GL_BlitFramebuffer)},
+    {"glPopClientAttrib", P(GL_PopClientAttrib)},
+    {"glUniform1dv", P(GL_Uniform1dv)},
+    {"glTexCoordP1ui", P(GL_TexCoordP1ui)},
+    {"glBlendEquationiOES", P(GL_BlendEquationiOES)},
+    {"glBufferStorageEXT", P(GL_BufferStorageEXT)},
+    {"glClearNamedFramebufferfv", P(GL_ClearNamedFramebufferfv)},
+    {"glProgramUniform3iv", P(GL_ProgramUniform3iv)},
+    {"glClearBufferData", P(GL_ClearBufferData)},
+    {"glClearTexImageEXT", P(GL_ClearTexImageEXT)},
+    {"glRasterPos2s", P(GL_RasterPos2s)},
+    {"glRasterPos3i", P(GL_RasterPos3i)},
+    {"glIsProgramPipelineEXT", P(GL_IsProgramPipelineEXT)},
+    {"glFramebufferPixelLocalClearValueuivANGLE", P(GL_FramebufferPixelLocalClearValueuivANGLE)},
+    {"glVertexAttribI1iv", P(GL_VertexAttribI1iv)},
+    {"glPrioritizeTextures", P(GL_PrioritizeTextures)},
+    {"glProgramUniformMatrix4x3dv", P(GL_ProgramUniformMatrix4x3dv)},
+    {"glUniformMatrix4x2dv", P(GL_UniformMatrix4x2dv)},
+    {"glGetPerfMonitorCountersAMD", P(GL_GetPerfMonitorCountersAMD)},
+    {"glSampleCoveragex", P(GL_SampleCoveragex)},
+    {"ANGLEGetDisplayPlatform", P(ANGLEGetDisplayPlatform)},
+    {"glUnmapBufferOES", P(GL_UnmapBufferOES)},
+    {"glCopyTexture3DANGLE", P(GL_CopyTexture3DANGLE)},
+    {"glGenerateTextureMipmap", P(GL_GenerateTextureMipmap)},
+    {"glBindProgramPipeline", P(GL_BindProgramPipeline)},
+    {"glTexStorageMemFlags2DMultisampleANGLE", P(GL_TexStorageMemFlags2DMultisampleANGLE)},
+    {"glQueryMatrixxOES", P(GL_QueryMatrixxOES)},
+    {"glFeedbackBuffer", P(GL_FeedbackBuffer)},
+    {"glEvalCoord1dv", P(GL_EvalCoord1dv)},
+    {"glGetShaderivRobustANGLE", P(GL_GetShaderivRobustANGLE)},
+    {"glWindowPos3i", P(GL_WindowPos3i)},
     {"glVertexAttribI4iv", P(GL_VertexAttribI4iv)},
-    {"glVertexAttribI4sv", P(GL_VertexAttribI4sv)},
-    {"glVertexAttribI4ubv", P(GL_VertexAttribI4ubv)},
-    {"glVertexAttribI4ui", P(GL_VertexAttribI4ui)},
-    {"glVertexAttribI4uiv", P(GL_VertexAttribI4uiv)},
-    {"glVertexAttribI4usv", P(GL_VertexAttribI4usv)},
-    {"glVertexAttribIFormat", P(GL_VertexAttribIFormat)},
-    {"glVertexAttribIPointer", P(GL_VertexAttribIPointer)},
-    {"glVertexAttribL1d", P(GL_VertexAttribL1d)},
-    {"glVertexAttribL1dv", P(GL_VertexAttribL1dv)},
-    {"glVertexAttribL2d", P(GL_VertexAttribL2d)},
-    {"glVertexAttribL2dv", P(GL_VertexAttribL2dv)},
-    {"glVertexAttribL3d", P(GL_VertexAttribL3d)},
-    {"glVertexAttribL3dv", P(GL_VertexAttribL3dv)},
-    {"glVertexAttribL4d", P(GL_VertexAttribL4d)},
-    {"glVertexAttribL4dv", P(GL_VertexAttribL4dv)},
-    {"glVertexAttribLFormat", P(GL_VertexAttribLFormat)},
-    {"glVertexAttribLPointer", P(GL_VertexAttribLPointer)},
-    {"glVertexAttribP1ui", P(GL_VertexAttribP1ui)},
-    {"glVertexAttribP1uiv", P(GL_VertexAttribP1uiv)},
-    {"glVertexAttribP2ui", P(GL_VertexAttribP2ui)},
-    {"glVertexAttribP2uiv", P(GL_VertexAttribP2uiv)},
-    {"glVertexAttribP3ui", P(GL_VertexAttribP3ui)},
-    {"glVertexAttribP3uiv", P(GL_VertexAttribP3uiv)},
+    {"glGetFragDataIndex", P(GL_GetFragDataIndex)},
+    {"glGetTexImageANGLE", P(GL_GetTexImageANGLE)},
+    {"glFramebufferTextureOES", P(GL_FramebufferTextureOES)},
+    {"glCopyNamedBufferSubData", P(GL_CopyNamedBufferSubData)},
+    {"glTransformFeedbackBufferRange", P(GL_TransformFeedbackBufferRange)},
+    {"glProgramUniform3ivEXT", P(GL_ProgramUniform3ivEXT)},
+    {"glScissorArrayv", P(GL_ScissorArrayv)},
+    {"glDrawElementsIndirect", P(GL_DrawElementsIndirect)},
+    {"glPixelTransferf", P(GL_PixelTransferf)},
+    {"glIndexub", P(GL_Indexub)},
+    {"glUniform1iv", P(GL_Uniform1iv)},
+    {"glGetTexLevelParameterivRobustANGLE", P(GL_GetTexLevelParameterivRobustANGLE)},
+    {"glTexCoordP3ui", P(GL_TexCoordP3ui)},
+    {"glDisableClientState", P(GL_DisableClientState)},
+    {"glEvalCoord2d", P(GL_EvalCoord2d)},
+    {"glDisable", P(GL_Disable)},
+    {"glSamplerParameterfv", P(GL_SamplerParameterfv)},
+    {"glTexStorageMem2DMultisampleEXT", P(GL_TexStorageMem2DMultisampleEXT)},
+    {"glVertexAttribI2uiv", P(GL_VertexAttribI2uiv)},
+    {"glVertexAttribI2i", P(GL_VertexAttribI2i)},
+    {"glGetUniformivRobustANGLE", P(GL_GetUniformivRobustANGLE)},
+    {"glProgramUniform1fv", P(GL_ProgramUniform1fv)},
+    {"glVertexAttrib3s", P(GL_VertexAttrib3s)},
+    {"glNewList", P(GL_NewList)},
+    {"glPrimitiveBoundingBoxOES", P(GL_PrimitiveBoundingBoxOES)},
+    {"glProgramUniform4f", P(GL_ProgramUniform4f)},
+    {"glUnmapBuffer", P(GL_UnmapBuffer)},
+    {"glGetUniformdv", P(GL_GetUniformdv)},
+    {"glNormal3x", P(GL_Normal3x)},
+    {"glNormal3sv", P(GL_Normal3sv)},
+    {"glDisableVertexArrayAttrib", P(GL_DisableVertexArrayAttrib)},
+    {"glXGetCurrentDrawable", P(glXGetCurrentDrawable)},
+    {"glTransformFeedbackVaryings", P(GL_TransformFeedbackVaryings)},
+    {"glGetTexEnvxv", P(GL_GetTexEnvxv)},
+    {"glCheckNamedFramebufferStatus", P(GL_CheckNamedFramebufferStatus)},
+    {"glProgramUniform1uiv", P(GL_ProgramUniform1uiv)},
+    {"glProgramUniformMatrix3fvEXT", P(GL_ProgramUniformMatrix3fvEXT)},
+    {"glGetTexLevelParameterfv", P(GL_GetTexLevelParameterfv)},
+    {"glClipControlEXT", P(GL_ClipControlEXT)},
+    {"glGetVertexAttribIuivRobustANGLE", P(GL_GetVertexAttribIuivRobustANGLE)},
+    {"glMemoryBarrierByRegion", P(GL_MemoryBarrierByRegion)},
+    {"glInitNames", P(GL_InitNames)},
+    {"glRasterPos4iv", P(GL_RasterPos4iv)},
+    {"glTexCoord4f", P(GL_TexCoord4f)},
+    {"glCompressedTexSubImage2DRobustANGLE", P(GL_CompressedTexSubImage2DRobustANGLE)},
+    {"glGetVertexAttribfvRobustANGLE", P(GL_GetVertexAttribfvRobustANGLE)},
+    {"glGetFramebufferAttachmentParameterivRobustANGLE", P(GL_GetFramebufferAttachmentParameterivRobustANGLE)},
+    {"glSamplerParameterIuivRobustANGLE", P(GL_SamplerParameterIuivRobustANGLE)},
+    {"glDrawElementsInstancedBaseVertexBaseInstanceEXT", P(GL_DrawElementsInstancedBaseVertexBaseInstanceEXT)},
+    {"glWindowPos2d", P(GL_WindowPos2d)},
+    {"glFogCoordd", P(GL_FogCoordd)},
+    {"glBeginConditionalRender", P(GL_BeginConditionalRender)},
+    {"glTexCoordP2ui", P(GL_TexCoordP2ui)},
+    {"glGetTextureParameterIiv", P(GL_GetTextureParameterIiv)},
+    {"glTexParameterIiv", P(GL_TexParameterIiv)},
+    {"glDrawElementsInstancedANGLE", P(GL_DrawElementsInstancedANGLE)},
+    {"glGetSynciv", P(GL_GetSynciv)},
+    {"glGetError", P(GL_GetError)},
+    {"glBlitFramebufferANGLE", P(GL_BlitFramebufferANGLE)},
     {"glVertexAttribP4ui", P(GL_VertexAttribP4ui)},
+    {"glNamedFramebufferReadBuffer", P(GL_NamedFramebufferReadBuffer)},
+    {"glClipControl", P(GL_ClipControl)},
+    {"glProgramUniform3iEXT", P(GL_ProgramUniform3iEXT)},
+    {"glLineWidthx", P(GL_LineWidthx)},
+    {"glTexGenfvOES", P(GL_TexGenfvOES)},
+    {"glGetPerfMonitorGroupStringAMD", P(GL_GetPerfMonitorGroupStringAMD)},
+    {"glGetnPixelMapuiv", P(GL_GetnPixelMapuiv)},
+    {"glUniformMatrix4dv", P(GL_UniformMatrix4dv)},
+    {"glNormal3s", P(GL_Normal3s)},
+    {"glIsRenderbuffer", P(GL_IsRenderbuffer)},
+    {"glDrawElementsInstancedEXT", P(GL_DrawElementsInstancedEXT)},
+    {"glMultiTexCoord4sv", P(GL_MultiTexCoord4sv)},
+    {"glNamedFramebufferDrawBuffer", P(GL_NamedFramebufferDrawBuffer)},
+    {"glBindVertexBuffer", P(GL_BindVertexBuffer)},
+    {"glGetCompressedTextureImage", P(GL_GetCompressedTextureImage)},
+    {"glGetVertexAttribLdv", P(GL_GetVertexAttribLdv)},
+    {"glVertexAttrib4f", P(GL_VertexAttrib4f)},
+    {"glRasterPos3fv", P(GL_RasterPos3fv)},
+    {"glTextureSubImage2D", P(GL_TextureSubImage2D)},
+    {"glVertexAttrib2fv", P(GL_VertexAttrib2fv)},
+    {"glGetPolygonStipple", P(GL_GetPolygonStipple)},
+    {"glGetFramebufferParameteriv", P(GL_GetFramebufferParameteriv)},
+    {"glUniform1d", P(GL_Uniform1d)},
+    {"glDrawRangeElementsBaseVertexEXT", P(GL_DrawRangeElementsBaseVertexEXT)},
+    {"glShadingRateQCOM", P(GL_ShadingRateQCOM)},
+    {"glTexStorage3D", P(GL_TexStorage3D)},
     {"glVertexAttribP4uiv", P(GL_VertexAttribP4uiv)},
-    {"glVertexAttribPointer", P(GL_VertexAttribPointer)},
-    {"glVertexBindingDivisor", P(GL_VertexBindingDivisor)},
-    {"glVertexP2ui", P(GL_VertexP2ui)},
-    {"glVertexP2uiv", P(GL_VertexP2uiv)},
-    {"glVertexP3ui", P(GL_VertexP3ui)},
-    {"glVertexP3uiv", P(GL_VertexP3uiv)},
-    {"glVertexP4ui", P(GL_VertexP4ui)},
-    {"glVertexP4uiv", P(GL_VertexP4uiv)},
-    {"glVertexPointer", P(GL_VertexPointer)},
-    {"glViewport", P(GL_Viewport)},
-    {"glViewportArrayv", P(GL_ViewportArrayv)},
-    {"glViewportIndexedf", P(GL_ViewportIndexedf)},
-    {"glViewportIndexedfv", P(GL_ViewportIndexedfv)},
-    {"glWaitSemaphoreEXT", P(GL_WaitSemaphoreEXT)},
-    {"glWaitSync", P(GL_WaitSync)},
-    {"glWeightPointerOES", P(GL_WeightPointerOES)},
-    {"glWindowPos2d", P(GL_WindowPos2d)},
-    {"glWindowPos2dv", P(GL_WindowPos2dv)},
-    {"glWindowPos2f", P(GL_WindowPos2f)},
-    {"glWindowPos2fv", P(GL_WindowPos2fv)},
-    {"glWindowPos2i", P(GL_WindowPos2i)},
-    {"glWindowPos2iv", P(GL_WindowPos2iv)},
-    {"glWindowPos2s", P(GL_WindowPos2s)},
-    {"glWindowPos2sv", P(GL_WindowPos2sv)},
-    {"glWindowPos3d", P(GL_WindowPos3d)},
-    {"glWindowPos3dv", P(GL_WindowPos3dv)},
-    {"glWindowPos3f", P(GL_WindowPos3f)},
-    {"glWindowPos3fv", P(GL_WindowPos3fv)},
-    {"glWindowPos3i", P(GL_WindowPos3i)},
-    {"glWindowPos3iv", P(GL_WindowPos3iv)},
-    {"glWindowPos3s", P(GL_WindowPos3s)},
-    {"glWindowPos3sv", P(GL_WindowPos3sv)},
-    {"glXChooseFBConfig", P(glXChooseFBConfig)},
-    {"glXChooseVisual", P(glXChooseVisual)},
-    {"glXCopyContext", P(glXCopyContext)},
-    {"glXCreateContext", P(glXCreateContext)},
-    {"glXCreateGLXPixmap", P(glXCreateGLXPixmap)},
-    {"glXCreateNewContext", P(glXCreateNewContext)},
-    {"glXCreatePbuffer", P(glXCreatePbuffer)},
-    {"glXCreatePixmap", P(glXCreatePixmap)},
-    {"glXCreateWindow", P(glXCreateWindow)},
-    {"glXDestroyContext", P(glXDestroyContext)},
-    {"glXDestroyGLXPixmap", P(glXDestroyGLXPixmap)},
-    {"glXDestroyPbuffer", P(glXDestroyPbuffer)},
-    {"glXDestroyPixmap", P(glXDestroyPixmap)},
-    {"glXDestroyWindow", P(glXDestroyWindow)},
-    {"glXGetClientString", P(glXGetClientString)},
-    {"glXGetConfig", P(glXGetConfig)},
-    {"glXGetCurrentContext", P(glXGetCurrentContext)},
+    {"glGetTexLevelParameterivANGLE", P(GL_GetTexLevelParameterivANGLE)},
+    {"glSecondaryColorP3ui", P(GL_SecondaryColorP3ui)},
+    {"glFramebufferFoveationConfigQCOM", P(GL_FramebufferFoveationConfigQCOM)},
+    {"glProgramUniform3ui", P(GL_ProgramUniform3ui)},
+    {"glBufferSubData", P(GL_BufferSubData)},
+    {"glLogicOpANGLE", P(GL_LogicOpANGLE)},
+    {"glNamedBufferData", P(GL_NamedBufferData)},
+    {"glStartTilingQCOM", P(GL_StartTilingQCOM)},
+    {"glInvalidateBufferSubData", P(GL_InvalidateBufferSubData)},
+    {"glDrawElementsInstancedBaseInstanceEXT", P(GL_DrawElementsInstancedBaseInstanceEXT)},
+    {"glFramebufferPixelLocalStorageInterruptANGLE", P(GL_FramebufferPixelLocalStorageInterruptANGLE)},
+    {"glRectf", P(GL_Rectf)},
+    {"glDrawElementsBaseVertexOES", P(GL_DrawElementsBaseVertexOES)},
+    {"glColor4iv", P(GL_Color4iv)},
     {"glXGetCurrentDisplay", P(glXGetCurrentDisplay)},
-    {"glXGetCurrentDrawable", P(glXGetCurrentDrawable)},
-    {"glXGetCurrentReadDrawable", P(glXGetCurrentReadDrawable)},
+    {"glFogf", P(GL_Fogf)},
+    {"glDisableiEXT", P(GL_DisableiEXT)},
+    {"glTexCoord3sv", P(GL_TexCoord3sv)},
+    {"glMaterialxv", P(GL_Materialxv)},
+    {"glGetnMapfv", P(GL_GetnMapfv)},
+    {"glTexCoord4iv", P(GL_TexCoord4iv)},
+    {"glDrawArrays", P(GL_DrawArrays)},
+    {"glGetnUniformiv", P(GL_GetnUniformiv)},
+    {"glTexCoordP4uiv", P(GL_TexCoordP4uiv)},
+    {"glTexStorageMem3DEXT", P(GL_TexStorageMem3DEXT)},
+    {"glDiscardFramebufferEXT", P(GL_DiscardFramebufferEXT)},
+    {"glFramebufferTextureEXT", P(GL_FramebufferTextureEXT)},
+    {"glProgramUniform4uiv", P(GL_ProgramUniform4uiv)},
+    {"glVertexAttrib2sv", P(GL_VertexAttrib2sv)},
+    {"glColor3s", P(GL_Color3s)},
     {"glXGetFBConfigAttrib", P(glXGetFBConfigAttrib)},
-    {"glXGetFBConfigs", P(glXGetFBConfigs)},
-    {"glXGetProcAddress", P(glXGetProcAddress)},
-    {"glXGetSelectedEvent", P(glXGetSelectedEvent)},
-    {"glXGetVisualFromFBConfig", P(glXGetVisualFromFBConfig)},
-    {"glXIsDirect", P(glXIsDirect)},
-    {"glXMakeContextCurrent", P(glXMakeContextCurrent)},
-    {"glXMakeCurrent", P(glXMakeCurrent)},
-    {"glXQueryContext", P(glXQueryContext)},
-    {"glXQueryDrawable", P(glXQueryDrawable)},
-    {"glXQueryExtension", P(glXQueryExtension)},
-    {"glXQueryExtensionsString", P(glXQueryExtensionsString)},
-    {"glXQueryServerString", P(glXQueryServerString)},
-    {"glXQueryVersion", P(glXQueryVersion)},
-    {"glXSelectEvent", P(glXSelectEvent)},
-    {"glXSwapBuffers", P(glXSwapBuffers)},
-    {"glXUseXFont", P(glXUseXFont)},
-    {"glXWaitGL", P(glXWaitGL)},
-    {"glXWaitX", P(glXWaitX)},
+    {"glGetMultisamplefvRobustANGLE", P(GL_GetMultisamplefvRobustANGLE)},
+    {"glBeginQueryIndexed", P(GL_BeginQueryIndexed)},
+    {"glVertexAttribBinding", P(GL_VertexAttribBinding)},
+    {"glBindBufferRange", P(GL_BindBufferRange)},
+    {"glColor4d", P(GL_Color4d)},
+    {"glSamplerParameterIuivEXT", P(GL_SamplerParameterIuivEXT)},
+    {"glProgramUniformMatrix3fv", P(GL_ProgramUniformMatrix3fv)},
+    {"glTexSubImage3DRobustANGLE", P(GL_TexSubImage3DRobustANGLE)},
+    {"glMapNamedBuffer", P(GL_MapNamedBuffer)},
+    {"glGetFramebufferPixelLocalStorageParameterivANGLE", P(GL_GetFramebufferPixelLocalStorageParameterivANGLE)},
+    {"glDrawTexxvOES", P(GL_DrawTexxvOES)},
+    {"glRenderbufferStorage", P(GL_RenderbufferStorage)},
+    {"glBindFragDataLocation", P(GL_BindFragDataLocation)},
+    {"glMultMatrixd", P(GL_MultMatrixd)},
+    {"glBlendEquationiEXT", P(GL_BlendEquationiEXT)},
+    {"glGenVertexArraysOES", P(GL_GenVertexArraysOES)},
+    {"glWindowPos3s", P(GL_WindowPos3s)},
+    {"glBindFragDataLocationEXT", P(GL_BindFragDataLocationEXT)},
+    {"glQueryCounter", P(GL_QueryCounter)},
+    {"glMaterialx", P(GL_Materialx)},
+    {"glGetIntegerv", P(GL_GetIntegerv)},
 };
 // clang-format on
 const size_t g_numProcs = std::size(g_procTable);
+
+const ProcEntry *FindProcEntry(const char *name)
+{
+    const ProcEntry &entry = g_procTable[MinimalPerfectHash(name, kProcSeeds, 510, 1529)];
+    return entry.first != nullptr && strcmp(entry.first, name) == 0 ? &entry : nullptr;
+}
 }  // namespace glx
@@ -32,6 +32,9 @@ using ProcEntry = std::pair<const char *, PROC>;
 
 extern const wgl::ProcEntry g_procTable[];
 extern const size_t g_numProcs;
+
+// Returns the entry of g_procTable named |name|, or nullptr if there is none.
+const wgl::ProcEntry *FindProcEntry(const char *name);
 }  // namespace wgl
 
 #endif  // LIBGL_PROC_TABLE_H_
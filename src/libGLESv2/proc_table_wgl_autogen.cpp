@@ -25,1531 +25,1590 @@
 #include "libGLESv2/entry_points_wgl.h"
 #include "platform/PlatformMethods.h"
 
+#include <cstring>
 #include <iterator>
 
 #define P(FUNC) reinterpret_cast<PROC>(FUNC)
 
 namespace wgl
 {
+namespace
+{
+// Minimal perfect hash function built by scripts/minimal_perfect_hash.py.
+constexpr uint32_t MinimalPerfectHash(const char *key,
+                                      const uint16_t *seeds,
+                                      uint32_t numSeeds,
+                                      uint32_t numKeys)
+{
+    uint32_t hash = 0x811c9dc5u;
+    for (; *key != '\0'; ++key)
+    {
+        hash = (hash ^ static_cast<unsigned char>(*key)) * 16777619u;
+    }
+    hash ^= seeds[(static_cast<uint64_t>(hash) * numSeeds) >> 32];
+    hash ^= hash >> 16;
+    hash *= 0x85ebca6bu;
+    hash ^= hash >> 13;
+    hash *= 0xc2b2ae35u;
+    hash ^= hash >> 16;
+    return static_cast<uint32_t>((static_cast<uint64_t>(hash) * numKeys) >> 32);
+}
+
+constexpr uint16_t kProcSeeds[] = {
+    0,   4,   22,  12,  9,   16,   15,  4,   0,   19,  1,   11,  0,   1,   0,   56,  17,  2,   0,
+    1,   14,  0,   28,  12,  0,    1,   2,   1,   5,   37,  20,  0,   20,  5,   8,   9,   0,   3,
+    25,  2,   20,  37,  10,  0,    4,   1,   0,   11,  9,   27,  32,  5,   10,  11,  5,   25,  8,
+    55,  19,  2,   0,   37,  5,    70,  2,   1,   1,   15,  0,   2,   4,   1,   7,   17,  41,  0,
+    0,   34,  12,  51,  28,  0,    5,   13,  3,   0,   11,  0,   15,  44,  2,   34,  0,   1,   32,
+    61,  0,   17,  126, 13,  0,    9,   5,   42,  4,   15,  14,  13,  0,   7,   5,   0,   9,   18,
+    1,   60,  1,   3,   14,  9,    2,   114, 5,   104, 6,   39,  10,  24,  21,  25,  10,  57,  1,
+    23,  49,  29,  5,   73,  8,    0,   11,  29,  0,   4,   7,   13,  3,   8,   21,  51,  7,   32,
+    1,   8,   29,  40,  1,   30,   0,   38,  8,   0,   0,   9,   18,  63,  0,   24,  0,   31,  12,
+    0,   19,  19,  16,  67,  30,   32,  2,   6,   73,  23,  0,   1,   26,  2,   1,   39,  0,   8,
+    39,  25,  161, 2,   0,   4,    3,   18,  31,  10,  0,   0,   27,  2,   2,   140, 0,   1,   9,
+    1,   98,  0,   6,   0,   7,    36,  0,   59,  20,  7,   10,  12,  15,  32,  5,   8,   66,  5,
+    5,   14,  3,   13,  11,  0,    0,   30,  42,  5,   14,  4,   1,   1,   7,   0,   36,  31,  0,
+    9,   189, 45,  15,  13,  68,   0,   22,  2,   33,  5,   0,   0,   21,  20,  50,  69,  222, 26,
+    0,   2,   6,   19,  3,   83,   2,   10,  5,   7,   28,  11,  39,  2,   11,  117, 18,  7,   33,
+    23,  50,  39,  0,   93,  3,    13,  0,   193, 65,  0,   18,  35,  14,  19,  3,   0,   40,  14,
+    9,   0,   91,  0,   39,  131,  17,  18,  28,  0,   19,  2,   29,  232, 32,  0,   4,   151, 5,
+    68,  6,   16,  0,   19,  47,   8,   202, 0,   17,  0,   54,  37,  24,  28,  50,  45,  171, 5,
+    9,   9,   52,  125, 39,  5,    4,   5,   0,   97,  249, 19,  77,  6,   58,  5,   151, 48,  8,
+    126, 4,   50,  5,   41,  0,    18,  17,  0,   25,  178, 1,   63,  327, 38,  27,  106, 1,   3,
+    26,  203, 65,  0,   78,  17,   27,  40,  8,   136, 212, 0,   73,  30,  36,  0,   55,  0,   103,
+    12,  5,   0,   4,   28,  30,   44,  1,   73,  20,  187, 86,  128, 10,  11,  0,   72,  34,  182,
+    125, 5,   5,   132, 186, 0,    252, 37,  14,  0,   110, 22,  23,  297, 12,  168, 20,  237, 28,
+    8,   11,  9,   4,   0,   387,  218, 113, 32,  39,  1,   328, 52,  94,  0,   35,  16,  112, 37,
+    0,   76,  52,  146, 42,  8,    129, 42,  108, 1,   489, 168, 151, 28,  16,  58,  16,  0,   81,
+    40,  185, 9,   873, 91,  1741, 324, 10,  0,   0,   14,  188, 2,   210, 127, 3,   465, 10,  757,
+    50,  4,   26,  6,   4,   2,    8,   0,   2,   40,  0,   106};
+}  // anonymous namespace
+
 // clang-format off
 const ProcEntry g_procTable[] = {
-    {"ANGLEGetDisplayPlatform", P(ANGLEGetDisplayPlatform)},
-    {"ANGLEResetDisplayPlatform", P(ANGLEResetDisplayPlatform)},
-    {"glAccum", P(GL_Accum)},
-    {"glAcquireTexturesANGLE", P(GL_AcquireTexturesANGLE)},
-    {"glActiveShaderProgram", P(GL_ActiveShaderProgram)},
-    {"glActiveShaderProgramEXT", P(GL_ActiveShaderProgramEXT)},
-    {"glActiveTexture", P(GL_ActiveTexture)},
-    {"glAlphaFunc", P(GL_AlphaFunc)},
-    {"glAlphaFuncx", P(GL_AlphaFuncx)},
-    {"glAreTexturesResident", P(GL_AreTexturesResident)},
-    {"glArrayElement", P(GL_ArrayElement)},
-    {"glAttachShader", P(GL_AttachShader)},
-    {"glBegin", P(GL_Begin)},
-    {"glBeginConditionalRender", P(GL_BeginConditionalRender)},
-    {"glBeginPerfMonitorAMD", P(GL_BeginPerfMonitorAMD)},
-    {"glBeginPixelLocalStorageANGLE", P(GL_BeginPixelLocalStorageANGLE)},
-    {"glBeginQuery", P(GL_BeginQuery)},
-    {"glBeginQueryEXT", P(GL_BeginQueryEXT)},
-    {"glBeginQueryIndexed", P(GL_BeginQueryIndexed)},
-    {"glBeginTransformFeedback", P(GL_BeginTransformFeedback)},
-    {"glBindAttribLocation", P(GL_BindAttribLocation)},
-    {"glBindBuffer", P(GL_BindBuffer)},
-    {"glBindBufferBase", P(GL_BindBufferBase)},
-    {"glBindBufferRange", P(GL_BindBufferRange)},
-    {"glBindBuffersBase", P(GL_BindBuffersBase)},
-    {"glBindBuffersRange", P(GL_BindBuffersRange)},
-    {"glBindFragDataLocation", P(GL_BindFragDataLocation)},
-    {"glBindFragDataLocationEXT", P(GL_BindFragDataLocationEXT)},
-    {"glBindFragDataLocationIndexed", P(GL_BindFragDataLocationIndexed)},
-    {"glBindFragDataLocationIndexedEXT", P(GL_BindFragDataLocationIndexedEXT)},
-    {"glBindFramebuffer", P(GL_BindFramebuffer)},
-    {"glBindFramebufferOES", P(GL_BindFramebufferOES)},
-    {"glBindImageTexture", P(GL_BindImageTexture)},
-    {"glBindImageTextures", P(GL_BindImageTextures)},
-    {"glBindProgramPipeline", P(GL_BindProgramPipeline)},
-    {"glBindProgramPipelineEXT", P(GL_BindProgramPipelineEXT)},
-    {"glBindRenderbuffer", P(GL_BindRenderbuffer)},
-    {"glBindRenderbufferOES", P(GL_BindRenderbufferOES)},
-    {"glBindSampler", P(GL_BindSampler)},
-    {"glBindSamplers", P(GL_BindSamplers)},
-    {"glBindTexture", P(GL_BindTexture)},
-    {"glBindTextureUnit", P(GL_BindTextureUnit)},
-    {"glBindTextures", P(GL_BindTextures)},
-    {"glBindTransformFeedback", P(GL_BindTransformFeedback)},
-    {"glBindUniformLocationCHROMIUM", P(GL_BindUniformLocationCHROMIUM)},
-    {"glBindVertexArray", P(GL_BindVertexArray)},
-    {"glBindVertexArrayOES", P(GL_BindVertexArrayOES)},
-    {"glBindVertexBuffer", P(GL_BindVertexBuffer)},
-    {"glBindVertexBuffers", P(GL_BindVertexBuffers)},
-    {"glBitmap", P(GL_Bitmap)},
-    {"glBlendBarrier", P(GL_BlendBarrier)},
-    {"glBlendBarrierKHR", P(GL_BlendBarrierKHR)},
-    {"glBlendColor", P(GL_BlendColor)},
-    {"glBlendEquation", P(GL_BlendEquation)},
-    {"glBlendEquationSeparate", P(GL_BlendEquationSeparate)},
-    {"glBlendEquationSeparatei", P(GL_BlendEquationSeparatei)},
-    {"glBlendEquationSeparateiEXT", P(GL_BlendEquationSeparateiEXT)},
-    {"glBlendEquationSeparateiOES", P(GL_BlendEquationSeparateiOES)},
-    {"glBlendEquationi", P(GL_BlendEquationi)},
-    {"glBlendEquationiEXT", P(GL_BlendEquationiEXT)},
-    {"glBlendEquationiOES", P(GL_BlendEquationiOES)},
-    {"glBlendFunc", P(GL_BlendFunc)},
-    {"glBlendFuncSeparate", P(GL_BlendFuncSeparate)},
-    {"glBlendFuncSeparatei", P(GL_BlendFuncSeparatei)},
-    {"glBlendFuncSeparateiEXT", P(GL_BlendFuncSeparateiEXT)},
-    {"glBlendFuncSeparateiOES", P(GL_BlendFuncSeparateiOES)},
-    {"glBlendFunci", P(GL_BlendFunci)},
-    {"glBlendFunciEXT", P(GL_BlendFunciEXT)},
-    {"glBlendFunciOES", P(GL_BlendFunciOES)},
-    {"glBlitFramebuffer", P(GL_BlitFramebuffer)},
-    {"glBlitFramebufferANGLE", P(GL_BlitFramebufferANGLE)},
-    {"glBlitFramebufferNV", P(GL_BlitFramebufferNV)},
-    {"glBlitNamedFramebuffer", P(GL_BlitNamedFramebuffer)},
-    {"glBufferData", P(GL_BufferData)},
-    {"glBufferStorage", P(GL_BufferStorage)},
-    {"glBufferStorageEXT", P(GL_BufferStorageEXT)},
-    {"glBufferStorageExternalEXT", P(GL_BufferStorageExternalEXT)},
-    {"glBufferStorageMemEXT", P(GL_BufferStorageMemEXT)},
-    {"glBufferSubData", P(GL_BufferSubData)},
-    {"glCallList", P(GL_CallList)},
-    {"glCallLists", P(GL_CallLists)},
-    {"glCheckFramebufferStatus", P(GL_CheckFramebufferStatus)},
-    {"glCheckFramebufferStatusOES", P(GL_CheckFramebufferStatusOES)},
-    {"glCheckNamedFramebufferStatus", P(GL_CheckNamedFramebufferStatus)},
-    {"glClampColor", P(GL_ClampColor)},
-    {"glClear", P(GL_Clear)},
-    {"glClearAccum", P(GL_ClearAccum)},
-    {"glClearBufferData", P(GL_ClearBufferData)},
-    {"glClearBufferSubData", P(GL_ClearBufferSubData)},
-    {"glClearBufferfi", P(GL_ClearBufferfi)},
-    {"glClearBufferfv", P(GL_ClearBufferfv)},
+    {"glColor3ui", P(GL_Color3ui)},
+    {"glMultTransposeMatrixd", P(GL_MultTransposeMatrixd)},
+    {"glVertexAttribI4bv", P(GL_VertexAttribI4bv)},
+    {"glSamplerParameterIivOES", P(GL_SamplerParameterIivOES)},
+    {"glVertexAttribI3iv", P(GL_VertexAttribI3iv)},
+    {"glVertexAttribL4d", P(GL_VertexAttribL4d)},
+    {"glIndexiv", P(GL_Indexiv)},
+    {"glDepthRangeArrayv", P(GL_DepthRangeArrayv)},
     {"glClearBufferiv", P(GL_ClearBufferiv)},
-    {"glClearBufferuiv", P(GL_ClearBufferuiv)},
-    {"glClearColor", P(GL_ClearColor)},
-    {"glClearColorx", P(GL_ClearColorx)},
-    {"glClearDepth", P(GL_ClearDepth)},
-    {"glClearDepthf", P(GL_ClearDepthf)},
-    {"glClearDepthx", P(GL_ClearDepthx)},
-    {"glClearIndex", P(GL_ClearIndex)},
-    {"glClearNamedBufferData", P(GL_ClearNamedBufferData)},
-    {"glClearNamedBufferSubData", P(GL_ClearNamedBufferSubData)},
-    {"glClearNamedFramebufferfi", P(GL_ClearNamedFramebufferfi)},
+    {"glIndexub", P(GL_Indexub)},
+    {"glTexSubImage3DOES", P(GL_TexSubImage3DOES)},
+    {"glGetProgramPipelineivEXT", P(GL_GetProgramPipelineivEXT)},
+    {"glGetUniformIndices", P(GL_GetUniformIndices)},
+    {"glOrthox", P(GL_Orthox)},
     {"glClearNamedFramebufferfv", P(GL_ClearNamedFramebufferfv)},
-    {"glClearNamedFramebufferiv", P(GL_ClearNamedFramebufferiv)},
-    {"glClearNamedFramebufferuiv", P(GL_ClearNamedFramebufferuiv)},
+    {"glProgramUniform3fvEXT", P(GL_ProgramUniform3fvEXT)},
+    {"glUniform4uiv", P(GL_Uniform4uiv)},
+    {"glBufferStorageMemEXT", P(GL_BufferStorageMemEXT)},
+    {"glDepthRangeIndexed", P(GL_DepthRangeIndexed)},
+    {"wglGetLayerPaletteEntries", P(wglGetLayerPaletteEntries)},
+    {"glIndexi", P(GL_Indexi)},
+    {"glInvalidateFramebuffer", P(GL_InvalidateFramebuffer)},
+    {"glVertexAttrib1d", P(GL_VertexAttrib1d)},
+    {"glNewList", P(GL_NewList)},
+    {"wglGetProcAddress", P(wglGetProcAddress)},
+    {"glGetShaderiv", P(GL_GetShaderiv)},
+    {"glLineStipple", P(GL_LineStipple)},
+    {"glBeginPixelLocalStorageANGLE", P(GL_BeginPixelLocalStorageANGLE)},
+    {"glUniformMatrix4x2fv", P(GL_UniformMatrix4x2fv)},
+    {"glVertexAttrib3s", P(GL_VertexAttrib3s)},
+    {"glBlendEquationiOES", P(GL_BlendEquationiOES)},
+    {"glWindowPos3sv", P(GL_WindowPos3sv)},
+    {"glProgramUniform2fv", P(GL_ProgramUniform2fv)},
+    {"glFinish", P(GL_Finish)},
+    {"glImportSemaphoreFdEXT", P(GL_ImportSemaphoreFdEXT)},
+    {"glDrawElements", P(GL_DrawElements)},
+    {"glGetActiveUniformName", P(GL_GetActiveUniformName)},
+    {"glProgramUniform3iv", P(GL_ProgramUniform3iv)},
+    {"glEGLImageTargetTexture2DOES", P(GL_EGLImageTargetTexture2DOES)},
+    {"glGetSamplerParameterfv", P(GL_GetSamplerParameterfv)},
+    {"glDrawBuffer", P(GL_DrawBuffer)},
+    {"wglGetEnhMetaFilePixelFormat", P(wglGetEnhMetaFilePixelFormat)},
+    {"glGetUniformiv", P(GL_GetUniformiv)},
     {"glClearStencil", P(GL_ClearStencil)},
-    {"glClearTexImage", P(GL_ClearTexImage)},
-    {"glClearTexImageEXT", P(GL_ClearTexImageEXT)},
-    {"glClearTexSubImage", P(GL_ClearTexSubImage)},
-    {"glClearTexSubImageEXT", P(GL_ClearTexSubImageEXT)},
-    {"glClientActiveTexture", P(GL_ClientActiveTexture)},
-    {"glClientWaitSync", P(GL_ClientWaitSync)},
-    {"glClipControl", P(GL_ClipControl)},
-    {"glClipControlEXT", P(GL_ClipControlEXT)},
-    {"glClipPlane", P(GL_ClipPlane)},
-    {"glClipPlanef", P(GL_ClipPlanef)},
-    {"glClipPlanex", P(GL_ClipPlanex)},
-    {"glColor3b", P(GL_Color3b)},
-    {"glColor3bv", P(GL_Color3bv)},
-    {"glColor3d", P(GL_Color3d)},
-    {"glColor3dv", P(GL_Color3dv)},
+    {"glPopMatrix", P(GL_PopMatrix)},
+    {"glSemaphoreParameterui64vEXT", P(GL_SemaphoreParameterui64vEXT)},
+    {"glGetLightxv", P(GL_GetLightxv)},
+    {"glMultiTexCoordP1uiv", P(GL_MultiTexCoordP1uiv)},
+    {"glVertex2fv", P(GL_Vertex2fv)},
+    {"glReleaseShaderCompiler", P(GL_ReleaseShaderCompiler)},
     {"glColor3f", P(GL_Color3f)},
-    {"glColor3fv", P(GL_Color3fv)},
-    {"glColor3i", P(GL_Color3i)},
+    {"glProgramUniform2iEXT", P(GL_ProgramUniform2iEXT)},
+    {"glGetQueryObjectui64v", P(GL_GetQueryObjectui64v)},
+    {"glUniform2uiv", P(GL_Uniform2uiv)},
+    {"glGetTexImage", P(GL_GetTexImage)},
+    {"glFogCoordPointer", P(GL_FogCoordPointer)},
+    {"glProgramUniformMatrix2dv", P(GL_ProgramUniformMatrix2dv)},
+    {"glCurrentPaletteMatrixOES", P(GL_CurrentPaletteMatrixOES)},
+    {"glUniformMatrix2x3fv", P(GL_UniformMatrix2x3fv)},
+    {"glCreateMemoryObjectsEXT", P(GL_CreateMemoryObjectsEXT)},
+    {"glCopyPixels", P(GL_CopyPixels)},
+    {"glDisableVertexAttribArray", P(GL_DisableVertexAttribArray)},
+    {"glClearAccum", P(GL_ClearAccum)},
+    {"glUnmapNamedBuffer", P(GL_UnmapNamedBuffer)},
+    {"glTexCoord3fv", P(GL_TexCoord3fv)},
+    {"glDrawBuffersEXT", P(GL_DrawBuffersEXT)},
+    {"glPointParameterxv", P(GL_PointParameterxv)},
+    {"glGetActiveAttrib", P(GL_GetActiveAttrib)},
+    {"glGetActiveUniformBlockivRobustANGLE", P(GL_GetActiveUniformBlockivRobustANGLE)},
+    {"glProgramBinaryOES", P(GL_ProgramBinaryOES)},
+    {"glVertexAttrib2dv", P(GL_VertexAttrib2dv)},
+    {"glCopyBufferSubData", P(GL_CopyBufferSubData)},
+    {"glClearNamedFramebufferiv", P(GL_ClearNamedFramebufferiv)},
+    {"glVertexArrayVertexBuffers", P(GL_VertexArrayVertexBuffers)},
+    {"glDeleteBuffers", P(GL_DeleteBuffers)},
+    {"glTexCoordP3ui", P(GL_TexCoordP3ui)},
+    {"glDrawPixels", P(GL_DrawPixels)},
+    {"glEnableVertexArrayAttrib", P(GL_EnableVertexArrayAttrib)},
+    {"glDeleteTransformFeedbacks", P(GL_DeleteTransformFeedbacks)},
+    {"glGetError", P(GL_GetError)},
+    {"glGetTexLevelParameterfvRobustANGLE", P(GL_GetTexLevelParameterfvRobustANGLE)},
+    {"glDeletePerfMonitorsAMD", P(GL_DeletePerfMonitorsAMD)},
+    {"glFramebufferMemorylessPixelLocalStorageANGLE", P(GL_FramebufferMemorylessPixelLocalStorageANGLE)},
+    {"glFramebufferTextureEXT", P(GL_FramebufferTextureEXT)},
+    {"glUseProgramStages", P(GL_UseProgramStages)},
+    {"glMapGrid2d", P(GL_MapGrid2d)},
+    {"glGetTexParameterIuivRobustANGLE", P(GL_GetTexParameterIuivRobustANGLE)},
+    {"glTextureParameterIiv", P(GL_TextureParameterIiv)},
+    {"glMaterialfv", P(GL_Materialfv)},
+    {"glGetMapiv", P(GL_GetMapiv)},
+    {"glBlendEquationSeparatei", P(GL_BlendEquationSeparatei)},
+    {"glRasterPos4iv", P(GL_RasterPos4iv)},
+    {"glTexBufferRangeEXT", P(GL_TexBufferRangeEXT)},
+    {"glNamedFramebufferDrawBuffers", P(GL_NamedFramebufferDrawBuffers)},
+    {"glClearBufferData", P(GL_ClearBufferData)},
+    {"glEnable", P(GL_Enable)},
+    {"glSecondaryColor3f", P(GL_SecondaryColor3f)},
+    {"glVertexAttribI4usv", P(GL_VertexAttribI4usv)},
     {"glColor3iv", P(GL_Color3iv)},
-    {"glColor3s", P(GL_Color3s)},
-    {"glColor3sv", P(GL_Color3sv)},
-    {"glColor3ub", P(GL_Color3ub)},
-    {"glColor3ubv", P(GL_Color3ubv)},
-    {"glColor3ui", P(GL_Color3ui)},
-    {"glColor3uiv", P(GL_Color3uiv)},
-    {"glColor3us", P(GL_Color3us)},
-    {"glColor3usv", P(GL_Color3usv)},
-    {"glColor4b", P(GL_Color4b)},
-    {"glColor4bv", P(GL_Color4bv)},
-    {"glColor4d", P(GL_Color4d)},
-    {"glColor4dv", P(GL_Color4dv)},
-    {"glColor4f", P(GL_Color4f)},
-    {"glColor4fv", P(GL_Color4fv)},
-    {"glColor4i", P(GL_Color4i)},
-    {"glColor4iv", P(GL_Color4iv)},
-    {"glColor4s", P(GL_Color4s)},
-    {"glColor4sv", P(GL_Color4sv)},
-    {"glColor4ub", P(GL_Color4ub)},
-    {"glColor4ubv", P(GL_Color4ubv)},
-    {"glColor4ui", P(GL_Color4ui)},
-    {"glColor4uiv", P(GL_Color4uiv)},
+    {"glTextureBuffer", P(GL_TextureBuffer)},
+    {"glSamplerParameterIuivRobustANGLE", P(GL_SamplerParameterIuivRobustANGLE)},
+    {"glFramebufferPixelLocalClearValuefvANGLE", P(GL_FramebufferPixelLocalClearValuefvANGLE)},
+    {"glVertexAttribI4uiv", P(GL_VertexAttribI4uiv)},
+    {"glInsertEventMarkerEXT", P(GL_InsertEventMarkerEXT)},
+    {"glGetnUniformivRobustANGLE", P(GL_GetnUniformivRobustANGLE)},
+    {"glColor3dv", P(GL_Color3dv)},
     {"glColor4us", P(GL_Color4us)},
-    {"glColor4usv", P(GL_Color4usv)},
-    {"glColor4x", P(GL_Color4x)},
-    {"glColorMask", P(GL_ColorMask)},
-    {"glColorMaski", P(GL_ColorMaski)},
-    {"glColorMaskiEXT", P(GL_ColorMaskiEXT)},
-    {"glColorMaskiOES", P(GL_ColorMaskiOES)},
-    {"glColorMaterial", P(GL_ColorMaterial)},
-    {"glColorP3ui", P(GL_ColorP3ui)},
-    {"glColorP3uiv", P(GL_ColorP3uiv)},
-    {"glColorP4ui", P(GL_ColorP4ui)},
-    {"glColorP4uiv", P(GL_ColorP4uiv)},
-    {"glColorPointer", P(GL_ColorPointer)},
-    {"glCompileShader", P(GL_CompileShader)},
-    {"glCompressedCopyTextureCHROMIUM", P(GL_CompressedCopyTextureCHROMIUM)},
-    {"glCompressedTexImage1D", P(GL_CompressedTexImage1D)},
+    {"glGetInteger64vEXT", P(GL_GetInteger64vEXT)},
+    {"glVertexAttrib4fv", P(GL_VertexAttrib4fv)},
+    {"glPopDebugGroupKHR", P(GL_PopDebugGroupKHR)},
+    {"glUniformMatrix3x2dv", P(GL_UniformMatrix3x2dv)},
+    {"glProgramUniformMatrix2x4fv", P(GL_ProgramUniformMatrix2x4fv)},
+    {"glEndPixelLocalStorageANGLE", P(GL_EndPixelLocalStorageANGLE)},
+    {"glFrustum", P(GL_Frustum)},
+    {"glViewport", P(GL_Viewport)},
+    {"wglChoosePixelFormat", P(wglChoosePixelFormat)},
+    {"glBindRenderbufferOES", P(GL_BindRenderbufferOES)},
+    {"glTexBufferOES", P(GL_TexBufferOES)},
+    {"glReadPixels", P(GL_ReadPixels)},
+    {"glDrawElementsBaseVertexOES", P(GL_DrawElementsBaseVertexOES)},
+    {"glGetDoublev", P(GL_GetDoublev)},
+    {"glUseProgramStagesEXT", P(GL_UseProgramStagesEXT)},
+    {"glGetTextureLevelParameteriv", P(GL_GetTextureLevelParameteriv)},
+    {"glRenderbufferStorageOES", P(GL_RenderbufferStorageOES)},
+    {"glTexParameterfvRobustANGLE", P(GL_TexParameterfvRobustANGLE)},
+    {"glUniform1uiv", P(GL_Uniform1uiv)},
+    {"glClearDepthx", P(GL_ClearDepthx)},
+    {"glLightModelf", P(GL_LightModelf)},
+    {"wglSetLayerPaletteEntries", P(wglSetLayerPaletteEntries)},
+    {"glGetActiveSubroutineUniformiv", P(GL_GetActiveSubroutineUniformiv)},
+    {"glVertexAttribDivisor", P(GL_VertexAttribDivisor)},
+    {"glIsBuffer", P(GL_IsBuffer)},
+    {"glVertexAttrib4dv", P(GL_VertexAttrib4dv)},
+    {"glWindowPos3iv", P(GL_WindowPos3iv)},
+    {"glProgramUniform4f", P(GL_ProgramUniform4f)},
+    {"glFramebufferTexture3DOES", P(GL_FramebufferTexture3DOES)},
     {"glCompressedTexImage2D", P(GL_CompressedTexImage2D)},
-    {"glCompressedTexImage2DRobustANGLE", P(GL_CompressedTexImage2DRobustANGLE)},
-    {"glCompressedTexImage3D", P(GL_CompressedTexImage3D)},
-    {"glCompressedTexImage3DOES", P(GL_CompressedTexImage3DOES)},
-    {"glCompressedTexImage3DRobustANGLE", P(GL_CompressedTexImage3DRobustANGLE)},
-    {"glCompressedTexSubImage1D", P(GL_CompressedTexSubImage1D)},
-    {"glCompressedTexSubImage2D", P(GL_CompressedTexSubImage2D)},
-    {"glCompressedTexSubImage2DRobustANGLE", P(GL_CompressedTexSubImage2DRobustANGLE)},
-    {"glCompressedTexSubImage3D", P(GL_CompressedTexSubImage3D)},
-    {"glCompressedTexSubImage3DOES", P(GL_CompressedTexSubImage3DOES)},
-    {"glCompressedTexSubImage3DRobustANGLE", P(GL_CompressedTexSubImage3DRobustANGLE)},
-    {"glCompressedTextureSubImage1D", P(GL_CompressedTextureSubImage1D)},
-    {"glCompressedTextureSubImage2D", P(GL_CompressedTextureSubImage2D)},
-    {"glCompressedTextureSubImage3D", P(GL_CompressedTextureSubImage3D)},
-    {"glCopyBufferSubData", P(GL_CopyBufferSubData)},
-    {"glCopyImageSubData", P(GL_CopyImageSubData)},
-    {"glCopyImageSubDataEXT", P(GL_CopyImageSubDataEXT)},
-    {"glCopyImageSubDataOES", P(GL_CopyImageSubDataOES)},
-    {"glCopyNamedBufferSubData", P(GL_CopyNamedBufferSubData)},
-    {"glCopyPixels", P(GL_CopyPixels)},
-    {"glCopySubTexture3DANGLE", P(GL_CopySubTexture3DANGLE)},
-    {"glCopySubTextureCHROMIUM", P(GL_CopySubTextureCHROMIUM)},
-    {"glCopyTexImage1D", P(GL_CopyTexImage1D)},
-    {"glCopyTexImage2D", P(GL_CopyTexImage2D)},
-    {"glCopyTexSubImage1D", P(GL_CopyTexSubImage1D)},
-    {"glCopyTexSubImage2D", P(GL_CopyTexSubImage2D)},
-    {"glCopyTexSubImage3D", P(GL_CopyTexSubImage3D)},
-    {"glCopyTexSubImage3DOES", P(GL_CopyTexSubImage3DOES)},
-    {"glCopyTexture3DANGLE", P(GL_CopyTexture3DANGLE)},
-    {"glCopyTextureCHROMIUM", P(GL_CopyTextureCHROMIUM)},
-    {"glCopyTextureSubImage1D", P(GL_CopyTextureSubImage1D)},
-    {"glCopyTextureSubImage2D", P(GL_CopyTextureSubImage2D)},
-    {"glCopyTextureSubImage3D", P(GL_CopyTextureSubImage3D)},
-    {"glCoverageModulationCHROMIUM", P(GL_CoverageModulationCHROMIUM)},
-    {"glCreateBuffers", P(GL_CreateBuffers)},
-    {"glCreateFramebuffers", P(GL_CreateFramebuffers)},
-    {"glCreateMemoryObjectsEXT", P(GL_CreateMemoryObjectsEXT)},
-    {"glCreateProgram", P(GL_CreateProgram)},
-    {"glCreateProgramPipelines", P(GL_CreateProgramPipelines)},
-    {"glCreateQueries", P(GL_CreateQueries)},
-    {"glCreateRenderbuffers", P(GL_CreateRenderbuffers)},
-    {"glCreateSamplers", P(GL_CreateSamplers)},
-    {"glCreateShader", P(GL_CreateShader)},
-    {"glCreateShaderProgramv", P(GL_CreateShaderProgramv)},
-    {"glCreateShaderProgramvEXT", P(GL_CreateShaderProgramvEXT)},
-    {"glCreateTextures", P(GL_CreateTextures)},
-    {"glCreateTransformFeedbacks", P(GL_CreateTransformFeedbacks)},
-    {"glCreateVertexArrays", P(GL_CreateVertexArrays)},
-    {"glCullFace", P(GL_CullFace)},
-    {"glCurrentPaletteMatrixOES", P(GL_CurrentPaletteMatrixOES)},
-    {"glDebugMessageCallback", P(GL_DebugMessageCallback)},
-    {"glDebugMessageCallbackKHR", P(GL_DebugMessageCallbackKHR)},
-    {"glDebugMessageControl", P(GL_DebugMessageControl)},
-    {"glDebugMessageControlKHR", P(GL_DebugMessageControlKHR)},
-    {"glDebugMessageInsert", P(GL_DebugMessageInsert)},
-    {"glDebugMessageInsertKHR", P(GL_DebugMessageInsertKHR)},
-    {"glDeleteBuffers", P(GL_DeleteBuffers)},
-    {"glDeleteFencesNV", P(GL_DeleteFencesNV)},
-    {"glDeleteFramebuffers", P(GL_DeleteFramebuffers)},
-    {"glDeleteFramebuffersOES", P(GL_DeleteFramebuffersOES)},
-    {"glDeleteLists", P(GL_DeleteLists)},
-    {"glDeleteMemoryObjectsEXT", P(GL_DeleteMemoryObjectsEXT)},
-    {"glDeletePerfMonitorsAMD", P(GL_DeletePerfMonitorsAMD)},
-    {"glDeleteProgram", P(GL_DeleteProgram)},
-    {"glDeleteProgramPipelines", P(GL_DeleteProgramPipelines)},
-    {"glDeleteProgramPipelinesEXT", P(GL_DeleteProgramPipelinesEXT)},
-    {"glDeleteQueries", P(GL_DeleteQueries)},
-    {"glDeleteQueriesEXT", P(GL_DeleteQueriesEXT)},
-    {"glDeleteRenderbuffers", P(GL_DeleteRenderbuffers)},
-    {"glDeleteRenderbuffersOES", P(GL_DeleteRenderbuffersOES)},
-    {"glDeleteSamplers", P(GL_DeleteSamplers)},
-    {"glDeleteSemaphoresEXT", P(GL_DeleteSemaphoresEXT)},
-    {"glDeleteShader", P(GL_DeleteShader)},
-    {"glDeleteSync", P(GL_DeleteSync)},
-    {"glDeleteTextures", P(GL_DeleteTextures)},
-    {"glDeleteTransformFeedbacks", P(GL_DeleteTransformFeedbacks)},
-    {"glDeleteVertexArrays", P(GL_DeleteVertexArrays)},
+    {"glUniformMatrix4dv", P(GL_UniformMatrix4dv)},
+    {"glTextureParameterIuiv", P(GL_TextureParameterIuiv)},
+    {"glBindSamplers", P(GL_BindSamplers)},
+    {"glColor4ui", P(GL_Color4ui)},
+    {"glBlendEquationi", P(GL_BlendEquationi)},
+    {"glClearDepthf", P(GL_ClearDepthf)},
+    {"glBindBuffersBase", P(GL_BindBuffersBase)},
     {"glDeleteVertexArraysOES", P(GL_DeleteVertexArraysOES)},
-    {"glDepthFunc", P(GL_DepthFunc)},
-    {"glDepthMask", P(GL_DepthMask)},
-    {"glDepthRange", P(GL_DepthRange)},
-    {"glDepthRangeArrayv", P(GL_DepthRangeArrayv)},
-    {"glDepthRangeIndexed", P(GL_DepthRangeIndexed)},
-    {"glDepthRangef", P(GL_DepthRangef)},
-    {"glDepthRangex", P(GL_DepthRangex)},
-    {"glDetachShader", P(GL_DetachShader)},
-    {"glDisable", P(GL_Disable)},
-    {"glDisableClientState", P(GL_DisableClientState)},
-    {"glDisableExtensionANGLE", P(GL_DisableExtensionANGLE)},
-    {"glDisableVertexArrayAttrib", P(GL_DisableVertexArrayAttrib)},
-    {"glDisableVertexAttribArray", P(GL_DisableVertexAttribArray)},
-    {"glDisablei", P(GL_Disablei)},
-    {"glDisableiEXT", P(GL_DisableiEXT)},
-    {"glDisableiOES", P(GL_DisableiOES)},
-    {"glDiscardFramebufferEXT", P(GL_DiscardFramebufferEXT)},
-    {"glDispatchCompute", P(GL_DispatchCompute)},
-    {"glDispatchComputeIndirect", P(GL_DispatchComputeIndirect)},
-    {"glDrawArrays", P(GL_DrawArrays)},
-    {"glDrawArraysIndirect", P(GL_DrawArraysIndirect)},
+    {"glIsEnablediEXT", P(GL_IsEnablediEXT)},
+    {"glProgramUniform2iv", P(GL_ProgramUniform2iv)},
+    {"glClearBufferSubData", P(GL_ClearBufferSubData)},
+    {"glTexParameterIuiv", P(GL_TexParameterIuiv)},
+    {"glClearIndex", P(GL_ClearIndex)},
+    {"glGetProgramResourceLocation", P(GL_GetProgramResourceLocation)},
+    {"glLoadPaletteFromModelViewMatrixOES", P(GL_LoadPaletteFromModelViewMatrixOES)},
+    {"glScaled", P(GL_Scaled)},
+    {"glColor4f", P(GL_Color4f)},
+    {"glDeleteMemoryObjectsEXT", P(GL_DeleteMemoryObjectsEXT)},
+    {"glGetTransformFeedbacki64_v", P(GL_GetTransformFeedbacki64_v)},
+    {"glInvalidateTexImage", P(GL_InvalidateTexImage)},
+    {"glTexCoord1i", P(GL_TexCoord1i)},
+    {"glGetTexImageANGLE", P(GL_GetTexImageANGLE)},
+    {"glCreateVertexArrays", P(GL_CreateVertexArrays)},
+    {"glUniformMatrix4x3fv", P(GL_UniformMatrix4x3fv)},
+    {"glMap2d", P(GL_Map2d)},
+    {"glGetnCompressedTexImage", P(GL_GetnCompressedTexImage)},
+    {"glProgramUniform3uiv", P(GL_ProgramUniform3uiv)},
+    {"glMultiTexCoord4sv", P(GL_MultiTexCoord4sv)},
+    {"glTexImage3DOES", P(GL_TexImage3DOES)},
+    {"glCompressedTexSubImage3DRobustANGLE", P(GL_CompressedTexSubImage3DRobustANGLE)},
+    {"glGetBooleani_vRobustANGLE", P(GL_GetBooleani_vRobustANGLE)},
+    {"glIsRenderbufferOES", P(GL_IsRenderbufferOES)},
+    {"glInvalidateNamedFramebufferSubData", P(GL_InvalidateNamedFramebufferSubData)},
     {"glDrawArraysInstanced", P(GL_DrawArraysInstanced)},
-    {"glDrawArraysInstancedANGLE", P(GL_DrawArraysInstancedANGLE)},
-    {"glDrawArraysInstancedBaseInstance", P(GL_DrawArraysInstancedBaseInstance)},
-    {"glDrawArraysInstancedBaseInstanceANGLE", P(GL_DrawArraysInstancedBaseInstanceANGLE)},
-    {"glDrawArraysInstancedBaseInstanceEXT", P(GL_DrawArraysInstancedBaseInstanceEXT)},
-    {"glDrawArraysInstancedEXT", P(GL_DrawArraysInstancedEXT)},
-    {"glDrawBuffer", P(GL_DrawBuffer)},
-    {"glDrawBuffers", P(GL_DrawBuffers)},
-    {"glDrawBuffersEXT", P(GL_DrawBuffersEXT)},
-    {"glDrawElements", P(GL_DrawElements)},
-    {"glDrawElementsBaseVertex", P(GL_DrawElementsBaseVertex)},
     {"glDrawElementsBaseVertexEXT", P(GL_DrawElementsBaseVertexEXT)},
-    {"glDrawElementsBaseVertexOES", P(GL_DrawElementsBaseVertexOES)},
-    {"glDrawElementsIndirect", P(GL_DrawElementsIndirect)},
-    {"glDrawElementsInstanced", P(GL_DrawElementsInstanced)},
-    {"glDrawElementsInstancedANGLE", P(GL_DrawElementsInstancedANGLE)},
-    {"glDrawElementsInstancedBaseInstance", P(GL_DrawElementsInstancedBaseInstance)},
-    {"glDrawElementsInstancedBaseInstanceEXT", P(GL_DrawElementsInstancedBaseInstanceEXT)},
-    {"glDrawElementsInstancedBaseVertex", P(GL_DrawElementsInstancedBaseVertex)},
-    {"glDrawElementsInstancedBaseVertexBaseInstance", P(GL_DrawElementsInstancedBaseVertexBaseInstance)},
-    {"glDrawElementsInstancedBaseVertexBaseInstanceANGLE", P(GL_DrawElementsInstancedBaseVertexBaseInstanceANGLE)},
-    {"glDrawElementsInstancedBaseVertexBaseInstanceEXT", P(GL_DrawElementsInstancedBaseVertexBaseInstanceEXT)},
-    {"glDrawElementsInstancedBaseVertexEXT", P(GL_DrawElementsInstancedBaseVertexEXT)},
-    {"glDrawElementsInstancedBaseVertexOES", P(GL_DrawElementsInstancedBaseVertexOES)},
-    {"glDrawElementsInstancedEXT", P(GL_DrawElementsInstancedEXT)},
-    {"glDrawPixels", P(GL_DrawPixels)},
-    {"glDrawRangeElements", P(GL_DrawRangeElements)},
-    {"glDrawRangeElementsBaseVertex", P(GL_DrawRangeElementsBaseVertex)},
-    {"glDrawRangeElementsBaseVertexEXT", P(GL_DrawRangeElementsBaseVertexEXT)},
-    {"glDrawRangeElementsBaseVertexOES", P(GL_DrawRangeElementsBaseVertexOES)},
-    {"glDrawTexfOES", P(GL_DrawTexfOES)},
-    {"glDrawTexfvOES", P(GL_DrawTexfvOES)},
-    {"glDrawTexiOES", P(GL_DrawTexiOES)},
-    {"glDrawTexivOES", P(GL_DrawTexivOES)},
-    {"glDrawTexsOES", P(GL_DrawTexsOES)},
-    {"glDrawTexsvOES", P(GL_DrawTexsvOES)},
-    {"glDrawTexxOES", P(GL_DrawTexxOES)},
-    {"glDrawTexxvOES", P(GL_DrawTexxvOES)},
-    {"glDrawTransformFeedback", P(GL_DrawTransformFeedback)},
-    {"glDrawTransformFeedbackInstanced", P(GL_DrawTransformFeedbackInstanced)},
-    {"glDrawTransformFeedbackStream", P(GL_DrawTransformFeedbackStream)},
-    {"glDrawTransformFeedbackStreamInstanced", P(GL_DrawTransformFeedbackStreamInstanced)},
-    {"glEGLImageTargetRenderbufferStorageOES", P(GL_EGLImageTargetRenderbufferStorageOES)},
-    {"glEGLImageTargetTexStorageEXT", P(GL_EGLImageTargetTexStorageEXT)},
-    {"glEGLImageTargetTexture2DOES", P(GL_EGLImageTargetTexture2DOES)},
-    {"glEGLImageTargetTextureStorageEXT", P(GL_EGLImageTargetTextureStorageEXT)},
-    {"glEdgeFlag", P(GL_EdgeFlag)},
-    {"glEdgeFlagPointer", P(GL_EdgeFlagPointer)},
-    {"glEdgeFlagv", P(GL_EdgeFlagv)},
-    {"glEnable", P(GL_Enable)},
-    {"glEnableClientState", P(GL_EnableClientState)},
-    {"glEnableVertexArrayAttrib", P(GL_EnableVertexArrayAttrib)},
-    {"glEnableVertexAttribArray", P(GL_EnableVertexAttribArray)},
-    {"glEnablei", P(GL_Enablei)},
+    {"glColorMaskiOES", P(GL_ColorMaskiOES)},
+    {"glGetTexEnvxv", P(GL_GetTexEnvxv)},
+    {"glGetShaderInfoLog", P(GL_GetShaderInfoLog)},
+    {"glGetInteger64v", P(GL_GetInteger64v)},
+    {"glGetProgramInterfaceivRobustANGLE", P(GL_GetProgramInterfaceivRobustANGLE)},
+    {"glProgramUniformMatrix4x3fv", P(GL_ProgramUniformMatrix4x3fv)},
+    {"glProgramUniformMatrix3dv", P(GL_ProgramUniformMatrix3dv)},
+    {"glGetStringi", P(GL_GetStringi)},
+    {"glMapNamedBufferRange", P(GL_MapNamedBufferRange)},
+    {"glBeginQueryEXT", P(GL_BeginQueryEXT)},
+    {"glTexCoord4f", P(GL_TexCoord4f)},
+    {"glGetAttachedShaders", P(GL_GetAttachedShaders)},
     {"glEnableiEXT", P(GL_EnableiEXT)},
-    {"glEnableiOES", P(GL_EnableiOES)},
-    {"glEnd", P(GL_End)},
-    {"glEndConditionalRender", P(GL_EndConditionalRender)},
-    {"glEndList", P(GL_EndList)},
-    {"glEndPerfMonitorAMD", P(GL_EndPerfMonitorAMD)},
-    {"glEndPixelLocalStorageANGLE", P(GL_EndPixelLocalStorageANGLE)},
-    {"glEndQuery", P(GL_EndQuery)},
-    {"glEndQueryEXT", P(GL_EndQueryEXT)},
-    {"glEndQueryIndexed", P(GL_EndQueryIndexed)},
-    {"glEndTilingQCOM", P(GL_EndTilingQCOM)},
-    {"glEndTransformFeedback", P(GL_EndTransformFeedback)},
-    {"glEvalCoord1d", P(GL_EvalCoord1d)},
-    {"glEvalCoord1dv", P(GL_EvalCoord1dv)},
-    {"glEvalCoord1f", P(GL_EvalCoord1f)},
-    {"glEvalCoord1fv", P(GL_EvalCoord1fv)},
-    {"glEvalCoord2d", P(GL_EvalCoord2d)},
-    {"glEvalCoord2dv", P(GL_EvalCoord2dv)},
-    {"glEvalCoord2f", P(GL_EvalCoord2f)},
-    {"glEvalCoord2fv", P(GL_EvalCoord2fv)},
-    {"glEvalMesh1", P(GL_EvalMesh1)},
-    {"glEvalMesh2", P(GL_EvalMesh2)},
-    {"glEvalPoint1", P(GL_EvalPoint1)},
-    {"glEvalPoint2", P(GL_EvalPoint2)},
-    {"glFeedbackBuffer", P(GL_FeedbackBuffer)},
-    {"glFenceSync", P(GL_FenceSync)},
-    {"glFinish", P(GL_Finish)},
-    {"glFinishFenceNV", P(GL_FinishFenceNV)},
-    {"glFlush", P(GL_Flush)},
-    {"glFlushMappedBufferRange", P(GL_FlushMappedBufferRange)},
-    {"glFlushMappedBufferRangeEXT", P(GL_FlushMappedBufferRangeEXT)},
-    {"glFlushMappedNamedBufferRange", P(GL_FlushMappedNamedBufferRange)},
-    {"glFogCoordPointer", P(GL_FogCoordPointer)},
-    {"glFogCoordd", P(GL_FogCoordd)},
-    {"glFogCoorddv", P(GL_FogCoorddv)},
-    {"glFogCoordf", P(GL_FogCoordf)},
-    {"glFogCoordfv", P(GL_FogCoordfv)},
-    {"glFogf", P(GL_Fogf)},
-    {"glFogfv", P(GL_Fogfv)},
-    {"glFogi", P(GL_Fogi)},
-    {"glFogiv", P(GL_Fogiv)},
-    {"glFogx", P(GL_Fogx)},
-    {"glFogxv", P(GL_Fogxv)},
-    {"glFramebufferFetchBarrierEXT", P(GL_FramebufferFetchBarrierEXT)},
-    {"glFramebufferFoveationConfigQCOM", P(GL_FramebufferFoveationConfigQCOM)},
-    {"glFramebufferFoveationParametersQCOM", P(GL_FramebufferFoveationParametersQCOM)},
-    {"glFramebufferMemorylessPixelLocalStorageANGLE", P(GL_FramebufferMemorylessPixelLocalStorageANGLE)},
-    {"glFramebufferParameteri", P(GL_FramebufferParameteri)},
-    {"glFramebufferParameteriMESA", P(GL_FramebufferParameteriMESA)},
-    {"glFramebufferPixelLocalClearValuefvANGLE", P(GL_FramebufferPixelLocalClearValuefvANGLE)},
-    {"glFramebufferPixelLocalClearValueivANGLE", P(GL_FramebufferPixelLocalClearValueivANGLE)},
-    {"glFramebufferPixelLocalClearValueuivANGLE", P(GL_FramebufferPixelLocalClearValueuivANGLE)},
-    {"glFramebufferPixelLocalStorageInterruptANGLE", P(GL_FramebufferPixelLocalStorageInterruptANGLE)},
-    {"glFramebufferPixelLocalStorageRestoreANGLE", P(GL_FramebufferPixelLocalStorageRestoreANGLE)},
-    {"glFramebufferRenderbuffer", P(GL_FramebufferRenderbuffer)},
-    {"glFramebufferRenderbufferOES", P(GL_FramebufferRenderbufferOES)},
-    {"glFramebufferTexture", P(GL_FramebufferTexture)},
-    {"glFramebufferTexture1D", P(GL_FramebufferTexture1D)},
-    {"glFramebufferTexture2D", P(GL_FramebufferTexture2D)},
-    {"glFramebufferTexture2DMultisampleEXT", P(GL_FramebufferTexture2DMultisampleEXT)},
-    {"glFramebufferTexture2DOES", P(GL_FramebufferTexture2DOES)},
-    {"glFramebufferTexture3D", P(GL_FramebufferTexture3D)},
-    {"glFramebufferTexture3DOES", P(GL_FramebufferTexture3DOES)},
-    {"glFramebufferTextureEXT", P(GL_FramebufferTextureEXT)},
-    {"glFramebufferTextureLayer", P(GL_FramebufferTextureLayer)},
-    {"glFramebufferTextureMultiviewOVR", P(GL_FramebufferTextureMultiviewOVR)},
-    {"glFramebufferTextureOES", P(GL_FramebufferTextureOES)},
-    {"glFramebufferTexturePixelLocalStorageANGLE", P(GL_FramebufferTexturePixelLocalStorageANGLE)},
-    {"glFrontFace", P(GL_FrontFace)},
-    {"glFrustum", P(GL_Frustum)},
-    {"glFrustumf", P(GL_Frustumf)},
-    {"glFrustumx", P(GL_Frustumx)},
-    {"glGenBuffers", P(GL_GenBuffers)},
-    {"glGenFencesNV", P(GL_GenFencesNV)},
-    {"glGenFramebuffers", P(GL_GenFramebuffers)},
-    {"glGenFramebuffersOES", P(GL_GenFramebuffersOES)},
-    {"glGenLists", P(GL_GenLists)},
-    {"glGenPerfMonitorsAMD", P(GL_GenPerfMonitorsAMD)},
-    {"glGenProgramPipelines", P(GL_GenProgramPipelines)},
-    {"glGenProgramPipelinesEXT", P(GL_GenProgramPipelinesEXT)},
-    {"glGenQueries", P(GL_GenQueries)},
-    {"glGenQueriesEXT", P(GL_GenQueriesEXT)},
+    {"glVertex2s", P(GL_Vertex2s)},
+    {"glTexParameterxv", P(GL_TexParameterxv)},
     {"glGenRenderbuffers", P(GL_GenRenderbuffers)},
-    {"glGenRenderbuffersOES", P(GL_GenRenderbuffersOES)},
-    {"glGenSamplers", P(GL_GenSamplers)},
-    {"glGenSemaphoresEXT", P(GL_GenSemaphoresEXT)},
-    {"glGenTextures", P(GL_GenTextures)},
-    {"glGenTransformFeedbacks", P(GL_GenTransformFeedbacks)},
-    {"glGenVertexArrays", P(GL_GenVertexArrays)},
-    {"glGenVertexArraysOES", P(GL_GenVertexArraysOES)},
-    {"glGenerateMipmap", P(GL_GenerateMipmap)},
-    {"glGenerateMipmapOES", P(GL_GenerateMipmapOES)},
-    {"glGenerateTextureMipmap", P(GL_GenerateTextureMipmap)},
-    {"glGetActiveAtomicCounterBufferiv", P(GL_GetActiveAtomicCounterBufferiv)},
-    {"glGetActiveAttrib", P(GL_GetActiveAttrib)},
-    {"glGetActiveSubroutineName", P(GL_GetActiveSubroutineName)},
-    {"glGetActiveSubroutineUniformName", P(GL_GetActiveSubroutineUniformName)},
-    {"glGetActiveSubroutineUniformiv", P(GL_GetActiveSubroutineUniformiv)},
-    {"glGetActiveUniform", P(GL_GetActiveUniform)},
-    {"glGetActiveUniformBlockName", P(GL_GetActiveUniformBlockName)},
-    {"glGetActiveUniformBlockiv", P(GL_GetActiveUniformBlockiv)},
-    {"glGetActiveUniformBlockivRobustANGLE", P(GL_GetActiveUniformBlockivRobustANGLE)},
-    {"glGetActiveUniformName", P(GL_GetActiveUniformName)},
-    {"glGetActiveUniformsiv", P(GL_GetActiveUniformsiv)},
-    {"glGetAttachedShaders", P(GL_GetAttachedShaders)},
-    {"glGetAttribLocation", P(GL_GetAttribLocation)},
-    {"glGetBooleani_v", P(GL_GetBooleani_v)},
-    {"glGetBooleani_vRobustANGLE", P(GL_GetBooleani_vRobustANGLE)},
-    {"glGetBooleanv", P(GL_GetBooleanv)},
-    {"glGetBooleanvRobustANGLE", P(GL_GetBooleanvRobustANGLE)},
-    {"glGetBufferParameteri64v", P(GL_GetBufferParameteri64v)},
+    {"glPushGroupMarkerEXT", P(GL_PushGroupMarkerEXT)},
+    {"glGetSynciv", P(GL_GetSynciv)},
+    {"glBindFragDataLocationIndexedEXT", P(GL_BindFragDataLocationIndexedEXT)},
+    {"glMultiTexCoord1iv", P(GL_MultiTexCoord1iv)},
+    {"glPolygonOffsetClamp", P(GL_PolygonOffsetClamp)},
     {"glGetBufferParameteri64vRobustANGLE", P(GL_GetBufferParameteri64vRobustANGLE)},
-    {"glGetBufferParameteriv", P(GL_GetBufferParameteriv)},
-    {"glGetBufferParameterivRobustANGLE", P(GL_GetBufferParameterivRobustANGLE)},
-    {"glGetBufferPointerv", P(GL_GetBufferPointerv)},
-    {"glGetBufferPointervOES", P(GL_GetBufferPointervOES)},
-    {"glGetBufferPointervRobustANGLE", P(GL_GetBufferPointervRobustANGLE)},
-    {"glGetBufferSubData", P(GL_GetBufferSubData)},
-    {"glGetClipPlane", P(GL_GetClipPlane)},
-    {"glGetClipPlanef", P(GL_GetClipPlanef)},
-    {"glGetClipPlanex", P(GL_GetClipPlanex)},
-    {"glGetCompressedTexImage", P(GL_GetCompressedTexImage)},
-    {"glGetCompressedTexImageANGLE", P(GL_GetCompressedTexImageANGLE)},
-    {"glGetCompressedTextureImage", P(GL_GetCompressedTextureImage)},
-    {"glGetCompressedTextureSubImage", P(GL_GetCompressedTextureSubImage)},
-    {"glGetDebugMessageLog", P(GL_GetDebugMessageLog)},
-    {"glGetDebugMessageLogKHR", P(GL_GetDebugMessageLogKHR)},
-    {"glGetDoublei_v", P(GL_GetDoublei_v)},
-    {"glGetDoublev", P(GL_GetDoublev)},
-    {"glGetError", P(GL_GetError)},
-    {"glGetFenceivNV", P(GL_GetFenceivNV)},
-    {"glGetFixedv", P(GL_GetFixedv)},
-    {"glGetFloati_v", P(GL_GetFloati_v)},
-    {"glGetFloatv", P(GL_GetFloatv)},
-    {"glGetFloatvRobustANGLE", P(GL_GetFloatvRobustANGLE)},
-    {"glGetFragDataIndex", P(GL_GetFragDataIndex)},
-    {"glGetFragDataIndexEXT", P(GL_GetFragDataIndexEXT)},
-    {"glGetFragDataLocation", P(GL_GetFragDataLocation)},
-    {"glGetFramebufferAttachmentParameteriv", P(GL_GetFramebufferAttachmentParameteriv)},
-    {"glGetFramebufferAttachmentParameterivOES", P(GL_GetFramebufferAttachmentParameterivOES)},
-    {"glGetFramebufferAttachmentParameterivRobustANGLE", P(GL_GetFramebufferAttachmentParameterivRobustANGLE)},
-    {"glGetFramebufferParameteriv", P(GL_GetFramebufferParameteriv)},
-    {"glGetFramebufferParameterivMESA", P(GL_GetFramebufferParameterivMESA)},
-    {"glGetFramebufferParameterivRobustANGLE", P(GL_GetFramebufferParameterivRobustANGLE)},
-    {"glGetFramebufferPixelLocalStorageParameterfvANGLE", P(GL_GetFramebufferPixelLocalStorageParameterfvANGLE)},
-    {"glGetFramebufferPixelLocalStorageParameterfvRobustANGLE", P(GL_GetFramebufferPixelLocalStorageParameterfvRobustANGLE)},
-    {"glGetFramebufferPixelLocalStorageParameterivANGLE", P(GL_GetFramebufferPixelLocalStorageParameterivANGLE)},
-    {"glGetFramebufferPixelLocalStorageParameterivRobustANGLE", P(GL_GetFramebufferPixelLocalStorageParameterivRobustANGLE)},
-    {"glGetGraphicsResetStatus", P(GL_GetGraphicsResetStatus)},
-    {"glGetGraphicsResetStatusEXT", P(GL_GetGraphicsResetStatusEXT)},
-    {"glGetGraphicsResetStatusKHR", P(GL_GetGraphicsResetStatusKHR)},
-    {"glGetInteger64i_v", P(GL_GetInteger64i_v)},
-    {"glGetInteger64i_vRobustANGLE", P(GL_GetInteger64i_vRobustANGLE)},
-    {"glGetInteger64v", P(GL_GetInteger64v)},
-    {"glGetInteger64vEXT", P(GL_GetInteger64vEXT)},
-    {"glGetInteger64vRobustANGLE", P(GL_GetInteger64vRobustANGLE)},
-    {"glGetIntegeri_v", P(GL_GetIntegeri_v)},
-    {"glGetIntegeri_vRobustANGLE", P(GL_GetIntegeri_vRobustANGLE)},
-    {"glGetIntegerv", P(GL_GetIntegerv)},
-    {"glGetIntegervRobustANGLE", P(GL_GetIntegervRobustANGLE)},
-    {"glGetInternalformati64v", P(GL_GetInternalformati64v)},
-    {"glGetInternalformativ", P(GL_GetInternalformativ)},
-    {"glGetInternalformativRobustANGLE", P(GL_GetInternalformativRobustANGLE)},
-    {"glGetLightfv", P(GL_GetLightfv)},
-    {"glGetLightiv", P(GL_GetLightiv)},
-    {"glGetLightxv", P(GL_GetLightxv)},
-    {"glGetMapdv", P(GL_GetMapdv)},
-    {"glGetMapfv", P(GL_GetMapfv)},
-    {"glGetMapiv", P(GL_GetMapiv)},
-    {"glGetMaterialfv", P(GL_GetMaterialfv)},
-    {"glGetMaterialiv", P(GL_GetMaterialiv)},
-    {"glGetMaterialxv", P(GL_GetMaterialxv)},
-    {"glGetMemoryObjectParameterivEXT", P(GL_GetMemoryObjectParameterivEXT)},
-    {"glGetMultisamplefv", P(GL_GetMultisamplefv)},
-    {"glGetMultisamplefvANGLE", P(GL_GetMultisamplefvANGLE)},
-    {"glGetMultisamplefvRobustANGLE", P(GL_GetMultisamplefvRobustANGLE)},
-    {"glGetNamedBufferParameteri64v", P(GL_GetNamedBufferParameteri64v)},
-    {"glGetNamedBufferParameteriv", P(GL_GetNamedBufferParameteriv)},
-    {"glGetNamedBufferPointerv", P(GL_GetNamedBufferPointerv)},
-    {"glGetNamedBufferSubData", P(GL_GetNamedBufferSubData)},
-    {"glGetNamedFramebufferAttachmentParameteriv", P(GL_GetNamedFramebufferAttachmentParameteriv)},
-    {"glGetNamedFramebufferParameteriv", P(GL_GetNamedFramebufferParameteriv)},
-    {"glGetNamedRenderbufferParameteriv", P(GL_GetNamedRenderbufferParameteriv)},
-    {"glGetObjectLabel", P(GL_GetObjectLabel)},
-    {"glGetObjectLabelEXT", P(GL_GetObjectLabelEXT)},
-    {"glGetObjectLabelKHR", P(GL_GetObjectLabelKHR)},
+    {"glTexSubImage2DRobustANGLE", P(GL_TexSubImage2DRobustANGLE)},
+    {"glMultiTexCoord3dv", P(GL_MultiTexCoord3dv)},
+    {"glCreateProgramPipelines", P(GL_CreateProgramPipelines)},
+    {"glUniform2d", P(GL_Uniform2d)},
+    {"glIsTexture", P(GL_IsTexture)},
+    {"glRasterPos3f", P(GL_RasterPos3f)},
+    {"glCompileShader", P(GL_CompileShader)},
+    {"glVertexP4uiv", P(GL_VertexP4uiv)},
     {"glGetObjectPtrLabel", P(GL_GetObjectPtrLabel)},
-    {"glGetObjectPtrLabelKHR", P(GL_GetObjectPtrLabelKHR)},
-    {"glGetPerfMonitorCounterDataAMD", P(GL_GetPerfMonitorCounterDataAMD)},
-    {"glGetPerfMonitorCounterInfoAMD", P(GL_GetPerfMonitorCounterInfoAMD)},
-    {"glGetPerfMonitorCounterStringAMD", P(GL_GetPerfMonitorCounterStringAMD)},
-    {"glGetPerfMonitorCountersAMD", P(GL_GetPerfMonitorCountersAMD)},
-    {"glGetPerfMonitorGroupStringAMD", P(GL_GetPerfMonitorGroupStringAMD)},
-    {"glGetPerfMonitorGroupsAMD", P(GL_GetPerfMonitorGroupsAMD)},
-    {"glGetPixelMapfv", P(GL_GetPixelMapfv)},
-    {"glGetPixelMapuiv", P(GL_GetPixelMapuiv)},
-    {"glGetPixelMapusv", P(GL_GetPixelMapusv)},
-    {"glGetPointerv", P(GL_GetPointerv)},
-    {"glGetPointervKHR", P(GL_GetPointervKHR)},
-    {"glGetPointervRobustANGLERobustANGLE", P(GL_GetPointervRobustANGLERobustANGLE)},
-    {"glGetPolygonStipple", P(GL_GetPolygonStipple)},
-    {"glGetProgramBinary", P(GL_GetProgramBinary)},
-    {"glGetProgramBinaryOES", P(GL_GetProgramBinaryOES)},
-    {"glGetProgramInfoLog", P(GL_GetProgramInfoLog)},
-    {"glGetProgramInterfaceiv", P(GL_GetProgramInterfaceiv)},
-    {"glGetProgramInterfaceivRobustANGLE", P(GL_GetProgramInterfaceivRobustANGLE)},
-    {"glGetProgramPipelineInfoLog", P(GL_GetProgramPipelineInfoLog)},
-    {"glGetProgramPipelineInfoLogEXT", P(GL_GetProgramPipelineInfoLogEXT)},
-    {"glGetProgramPipelineiv", P(GL_GetProgramPipelineiv)},
-    {"glGetProgramPipelineivEXT", P(GL_GetProgramPipelineivEXT)},
-    {"glGetProgramResourceIndex", P(GL_GetProgramResourceIndex)},
-    {"glGetProgramResourceLocation", P(GL_GetProgramResourceLocation)},
-    {"glGetProgramResourceLocationIndex", P(GL_GetProgramResourceLocationIndex)},
-    {"glGetProgramResourceLocationIndexEXT", P(GL_GetProgramResourceLocationIndexEXT)},
-    {"glGetProgramResourceName", P(GL_GetProgramResourceName)},
-    {"glGetProgramResourceiv", P(GL_GetProgramResourceiv)},
-    {"glGetProgramStageiv", P(GL_GetProgramStageiv)},
-    {"glGetProgramiv", P(GL_GetProgramiv)},
-    {"glGetProgramivRobustANGLE", P(GL_GetProgramivRobustANGLE)},
-    {"glGetQueryBufferObjecti64v", P(GL_GetQueryBufferObjecti64v)},
-    {"glGetQueryBufferObjectiv", P(GL_GetQueryBufferObjectiv)},
-    {"glGetQueryBufferObjectui64v", P(GL_GetQueryBufferObjectui64v)},
-    {"glGetQueryBufferObjectuiv", P(GL_GetQueryBufferObjectuiv)},
-    {"glGetQueryIndexediv", P(GL_GetQueryIndexediv)},
-    {"glGetQueryObjecti64v", P(GL_GetQueryObjecti64v)},
-    {"glGetQueryObjecti64vEXT", P(GL_GetQueryObjecti64vEXT)},
-    {"glGetQueryObjecti64vRobustANGLE", P(GL_GetQueryObjecti64vRobustANGLE)},
-    {"glGetQueryObjectiv", P(GL_GetQueryObjectiv)},
-    {"glGetQueryObjectivEXT", P(GL_GetQueryObjectivEXT)},
+    {"glDrawArrays", P(GL_DrawArrays)},
+    {"glLoadName", P(GL_LoadName)},
+    {"glProgramUniform1uivEXT", P(GL_ProgramUniform1uivEXT)},
+    {"glVertexP3uiv", P(GL_VertexP3uiv)},
     {"glGetQueryObjectivRobustANGLE", P(GL_GetQueryObjectivRobustANGLE)},
-    {"glGetQueryObjectui64v", P(GL_GetQueryObjectui64v)},
-    {"glGetQueryObjectui64vEXT", P(GL_GetQueryObjectui64vEXT)},
-    {"glGetQueryObjectui64vRobustANGLE", P(GL_GetQueryObjectui64vRobustANGLE)},
-    {"glGetQueryObjectuiv", P(GL_GetQueryObjectuiv)},
-    {"glGetQueryObjectuivEXT", P(GL_GetQueryObjectuivEXT)},
-    {"glGetQueryObjectuivRobustANGLE", P(GL_GetQueryObjectuivRobustANGLE)},
-    {"glGetQueryiv", P(GL_GetQueryiv)},
-    {"glGetQueryivEXT", P(GL_GetQueryivEXT)},
-    {"glGetQueryivRobustANGLE", P(GL_GetQueryivRobustANGLE)},
-    {"glGetRenderbufferImageANGLE", P(GL_GetRenderbufferImageANGLE)},
-    {"glGetRenderbufferParameteriv", P(GL_GetRenderbufferParameteriv)},
-    {"glGetRenderbufferParameterivOES", P(GL_GetRenderbufferParameterivOES)},
-    {"glGetRenderbufferParameterivRobustANGLE", P(GL_GetRenderbufferParameterivRobustANGLE)},
-    {"glGetSamplerParameterIiv", P(GL_GetSamplerParameterIiv)},
-    {"glGetSamplerParameterIivEXT", P(GL_GetSamplerParameterIivEXT)},
-    {"glGetSamplerParameterIivOES", P(GL_GetSamplerParameterIivOES)},
-    {"glGetSamplerParameterIivRobustANGLE", P(GL_GetSamplerParameterIivRobustANGLE)},
-    {"glGetSamplerParameterIuiv", P(GL_GetSamplerParameterIuiv)},
-    {"glGetSamplerParameterIuivEXT", P(GL_GetSamplerParameterIuivEXT)},
-    {"glGetSamplerParameterIuivOES", P(GL_GetSamplerParameterIuivOES)},
-    {"glGetSamplerParameterIuivRobustANGLE", P(GL_GetSamplerParameterIuivRobustANGLE)},
-    {"glGetSamplerParameterfv", P(GL_GetSamplerParameterfv)},
-    {"glGetSamplerParameterfvRobustANGLE", P(GL_GetSamplerParameterfvRobustANGLE)},
-    {"glGetSamplerParameteriv", P(GL_GetSamplerParameteriv)},
-    {"glGetSamplerParameterivRobustANGLE", P(GL_GetSamplerParameterivRobustANGLE)},
-    {"glGetSemaphoreParameterui64vEXT", P(GL_GetSemaphoreParameterui64vEXT)},
-    {"glGetShaderInfoLog", P(GL_GetShaderInfoLog)},
-    {"glGetShaderPrecisionFormat", P(GL_GetShaderPrecisionFormat)},
-    {"glGetShaderSource", P(GL_GetShaderSource)},
-    {"glGetShaderiv", P(GL_GetShaderiv)},
-    {"glGetShaderivRobustANGLE", P(GL_GetShaderivRobustANGLE)},
-    {"glGetString", P(GL_GetString)},
-    {"glGetStringi", P(GL_GetStringi)},
-    {"glGetSubroutineIndex", P(GL_GetSubroutineIndex)},
-    {"glGetSubroutineUniformLocation", P(GL_GetSubroutineUniformLocation)},
-    {"glGetSynciv", P(GL_GetSynciv)},
-    {"glGetTexEnvfv", P(GL_GetTexEnvfv)},
-    {"glGetTexEnviv", P(GL_GetTexEnviv)},
-    {"glGetTexEnvxv", P(GL_GetTexEnvxv)},
-    {"glGetTexGendv", P(GL_GetTexGendv)},
-    {"glGetTexGenfv", P(GL_GetTexGenfv)},
-    {"glGetTexGenfvOES", P(GL_GetTexGenfvOES)},
-    {"glGetTexGeniv", P(GL_GetTexGeniv)},
-    {"glGetTexGenivOES", P(GL_GetTexGenivOES)},
-    {"glGetTexGenxvOES", P(GL_GetTexGenxvOES)},
-    {"glGetTexImage", P(GL_GetTexImage)},
-    {"glGetTexImageANGLE", P(GL_GetTexImageANGLE)},
-    {"glGetTexLevelParameterfv", P(GL_GetTexLevelParameterfv)},
-    {"glGetTexLevelParameterfvANGLE", P(GL_GetTexLevelParameterfvANGLE)},
-    {"glGetTexLevelParameterfvRobustANGLE", P(GL_GetTexLevelParameterfvRobustANGLE)},
-    {"glGetTexLevelParameteriv", P(GL_GetTexLevelParameteriv)},
-    {"glGetTexLevelParameterivANGLE", P(GL_GetTexLevelParameterivANGLE)},
-    {"glGetTexLevelParameterivRobustANGLE", P(GL_GetTexLevelParameterivRobustANGLE)},
-    {"glGetTexParameterIiv", P(GL_GetTexParameterIiv)},
-    {"glGetTexParameterIivEXT", P(GL_GetTexParameterIivEXT)},
-    {"glGetTexParameterIivOES", P(GL_GetTexParameterIivOES)},
-    {"glGetTexParameterIivRobustANGLE", P(GL_GetTexParameterIivRobustANGLE)},
-    {"glGetTexParameterIuiv", P(GL_GetTexParameterIuiv)},
-    {"glGetTexParameterIuivEXT", P(GL_GetTexParameterIuivEXT)},
-    {"glGetTexParameterIuivOES", P(GL_GetTexParameterIuivOES)},
-    {"glGetTexParameterIuivRobustANGLE", P(GL_GetTexParameterIuivRobustANGLE)},
-    {"glGetTexParameterfv", P(GL_GetTexParameterfv)},
-    {"glGetTexParameterfvRobustANGLE", P(GL_GetTexParameterfvRobustANGLE)},
-    {"glGetTexParameteriv", P(GL_GetTexParameteriv)},
-    {"glGetTexParameterivRobustANGLE", P(GL_GetTexParameterivRobustANGLE)},
-    {"glGetTexParameterxv", P(GL_GetTexParameterxv)},
-    {"glGetTextureImage", P(GL_GetTextureImage)},
-    {"glGetTextureLevelParameterfv", P(GL_GetTextureLevelParameterfv)},
-    {"glGetTextureLevelParameteriv", P(GL_GetTextureLevelParameteriv)},
-    {"glGetTextureParameterIiv", P(GL_GetTextureParameterIiv)},
-    {"glGetTextureParameterIuiv", P(GL_GetTextureParameterIuiv)},
-    {"glGetTextureParameterfv", P(GL_GetTextureParameterfv)},
-    {"glGetTextureParameteriv", P(GL_GetTextureParameteriv)},
-    {"glGetTextureSubImage", P(GL_GetTextureSubImage)},
-    {"glGetTransformFeedbackVarying", P(GL_GetTransformFeedbackVarying)},
-    {"glGetTransformFeedbacki64_v", P(GL_GetTransformFeedbacki64_v)},
-    {"glGetTransformFeedbacki_v", P(GL_GetTransformFeedbacki_v)},
-    {"glGetTransformFeedbackiv", P(GL_GetTransformFeedbackiv)},
-    {"glGetTranslatedShaderSourceANGLE", P(GL_GetTranslatedShaderSourceANGLE)},
-    {"glGetUniformBlockIndex", P(GL_GetUniformBlockIndex)},
-    {"glGetUniformIndices", P(GL_GetUniformIndices)},
+    {"glNamedFramebufferDrawBuffer", P(GL_NamedFramebufferDrawBuffer)},
+    {"glGenFramebuffersOES", P(GL_GenFramebuffersOES)},
+    {"glColorP3ui", P(GL_ColorP3ui)},
+    {"glPushDebugGroup", P(GL_PushDebugGroup)},
+    {"glDeleteTextures", P(GL_DeleteTextures)},
+    {"glMultiTexCoord4i", P(GL_MultiTexCoord4i)},
+    {"glProgramUniform4dv", P(GL_ProgramUniform4dv)},
+    {"glNormal3bv", P(GL_Normal3bv)},
+    {"glTexImage3DMultisample", P(GL_TexImage3DMultisample)},
+    {"glVertexAttrib3fv", P(GL_VertexAttrib3fv)},
     {"glGetUniformLocation", P(GL_GetUniformLocation)},
-    {"glGetUniformSubroutineuiv", P(GL_GetUniformSubroutineuiv)},
-    {"glGetUniformdv", P(GL_GetUniformdv)},
-    {"glGetUniformfv", P(GL_GetUniformfv)},
-    {"glGetUniformfvRobustANGLE", P(GL_GetUniformfvRobustANGLE)},
-    {"glGetUniformiv", P(GL_GetUniformiv)},
-    {"glGetUniformivRobustANGLE", P(GL_GetUniformivRobustANGLE)},
-    {"glGetUniformuiv", P(GL_GetUniformuiv)},
+    {"glRequestExtensionANGLE", P(GL_RequestExtensionANGLE)},
+    {"glUniform1i", P(GL_Uniform1i)},
+    {"glTexParameterf", P(GL_TexParameterf)},
+    {"glProgramUniform2ivEXT", P(GL_ProgramUniform2ivEXT)},
+    {"glGetVertexAttribPointervRobustANGLE", P(GL_GetVertexAttribPointervRobustANGLE)},
+    {"glVertexAttribP4uiv", P(GL_VertexAttribP4uiv)},
+    {"glIsEnablediOES", P(GL_IsEnablediOES)},
+    {"glCopyTexImage2D", P(GL_CopyTexImage2D)},
+    {"glProgramUniform1f", P(GL_ProgramUniform1f)},
+    {"glFramebufferTexture2DMultisampleEXT", P(GL_FramebufferTexture2DMultisampleEXT)},
+    {"glUniform4f", P(GL_Uniform4f)},
+    {"glVertexAttribI3uiv", P(GL_VertexAttribI3uiv)},
+    {"glWindowPos3f", P(GL_WindowPos3f)},
+    {"glGetProgramPipelineiv", P(GL_GetProgramPipelineiv)},
+    {"glPatchParameteriOES", P(GL_PatchParameteriOES)},
+    {"glGetnPolygonStipple", P(GL_GetnPolygonStipple)},
+    {"glTexGeniv", P(GL_TexGeniv)},
+    {"glColorMaterial", P(GL_ColorMaterial)},
+    {"glPixelZoom", P(GL_PixelZoom)},
+    {"glGetProgramPipelineInfoLogEXT", P(GL_GetProgramPipelineInfoLogEXT)},
+    {"glGenTransformFeedbacks", P(GL_GenTransformFeedbacks)},
+    {"glLightf", P(GL_Lightf)},
+    {"glWindowPos2sv", P(GL_WindowPos2sv)},
+    {"glDrawTransformFeedback", P(GL_DrawTransformFeedback)},
+    {"glGetProgramBinary", P(GL_GetProgramBinary)},
+    {"glClipPlanex", P(GL_ClipPlanex)},
+    {"glCreateShaderProgramvEXT", P(GL_CreateShaderProgramvEXT)},
+    {"glArrayElement", P(GL_ArrayElement)},
+    {"glTexBuffer", P(GL_TexBuffer)},
+    {"glTexEnvxv", P(GL_TexEnvxv)},
+    {"glProgramUniform1fEXT", P(GL_ProgramUniform1fEXT)},
+    {"glImportMemoryFdEXT", P(GL_ImportMemoryFdEXT)},
+    {"glRecti", P(GL_Recti)},
+    {"glLightModelfv", P(GL_LightModelfv)},
+    {"glSecondaryColor3s", P(GL_SecondaryColor3s)},
+    {"glMaxShaderCompilerThreadsKHR", P(GL_MaxShaderCompilerThreadsKHR)},
+    {"glRenderbufferStorageMultisample", P(GL_RenderbufferStorageMultisample)},
+    {"glBindFramebufferOES", P(GL_BindFramebufferOES)},
+    {"glColor3s", P(GL_Color3s)},
+    {"glObjectPtrLabel", P(GL_ObjectPtrLabel)},
+    {"glGetPerfMonitorGroupsAMD", P(GL_GetPerfMonitorGroupsAMD)},
+    {"glGetShaderSource", P(GL_GetShaderSource)},
+    {"glVertexAttribIPointer", P(GL_VertexAttribIPointer)},
+    {"glGetnUniformfvKHR", P(GL_GetnUniformfvKHR)},
+    {"glTexStorageMem2DEXT", P(GL_TexStorageMem2DEXT)},
     {"glGetUniformuivRobustANGLE", P(GL_GetUniformuivRobustANGLE)},
-    {"glGetUnsignedBytei_vEXT", P(GL_GetUnsignedBytei_vEXT)},
-    {"glGetUnsignedBytevEXT", P(GL_GetUnsignedBytevEXT)},
-    {"glGetVertexArrayIndexed64iv", P(GL_GetVertexArrayIndexed64iv)},
+    {"glVertexAttrib4iv", P(GL_VertexAttrib4iv)},
+    {"glVertexAttrib4sv", P(GL_VertexAttrib4sv)},
+    {"glInvalidateNamedFramebufferData", P(GL_InvalidateNamedFramebufferData)},
+    {"glVertexAttribLFormat", P(GL_VertexAttribLFormat)},
+    {"glNormal3sv", P(GL_Normal3sv)},
+    {"glMultiTexCoord2sv", P(GL_MultiTexCoord2sv)},
+    {"glPrimitiveBoundingBoxOES", P(GL_PrimitiveBoundingBoxOES)},
+    {"glBlendFuncSeparate", P(GL_BlendFuncSeparate)},
+    {"glBeginQueryIndexed", P(GL_BeginQueryIndexed)},
+    {"glIsList", P(GL_IsList)},
+    {"glOrthof", P(GL_Orthof)},
+    {"glDisableExtensionANGLE", P(GL_DisableExtensionANGLE)},
+    {"glVertex2i", P(GL_Vertex2i)},
+    {"glGetFragDataLocation", P(GL_GetFragDataLocation)},
+    {"glLighti", P(GL_Lighti)},
+    {"glRasterPos3d", P(GL_RasterPos3d)},
+    {"glGetFixedv", P(GL_GetFixedv)},
+    {"glGetnUniformiv", P(GL_GetnUniformiv)},
+    {"glTexCoord2f", P(GL_TexCoord2f)},
+    {"glGetTexLevelParameterivANGLE", P(GL_GetTexLevelParameterivANGLE)},
+    {"glMultiTexCoord3fv", P(GL_MultiTexCoord3fv)},
+    {"glGetNamedRenderbufferParameteriv", P(GL_GetNamedRenderbufferParameteriv)},
+    {"glFlushMappedBufferRangeEXT", P(GL_FlushMappedBufferRangeEXT)},
+    {"glShaderSource", P(GL_ShaderSource)},
+    {"glLinkProgram", P(GL_LinkProgram)},
+    {"glColor3i", P(GL_Color3i)},
+    {"glRasterPos4i", P(GL_RasterPos4i)},
+    {"wglShareLists", P(wglShareLists)},
     {"glGetVertexArrayIndexediv", P(GL_GetVertexArrayIndexediv)},
-    {"glGetVertexArrayiv", P(GL_GetVertexArrayiv)},
-    {"glGetVertexAttribIiv", P(GL_GetVertexAttribIiv)},
-    {"glGetVertexAttribIivRobustANGLE", P(GL_GetVertexAttribIivRobustANGLE)},
+    {"glSecondaryColorP3ui", P(GL_SecondaryColorP3ui)},
+    {"glProgramUniform1d", P(GL_ProgramUniform1d)},
+    {"glPointParameteri", P(GL_PointParameteri)},
+    {"glClientWaitSync", P(GL_ClientWaitSync)},
+    {"glBindBuffersRange", P(GL_BindBuffersRange)},
     {"glGetVertexAttribIuiv", P(GL_GetVertexAttribIuiv)},
-    {"glGetVertexAttribIuivRobustANGLE", P(GL_GetVertexAttribIuivRobustANGLE)},
-    {"glGetVertexAttribLdv", P(GL_GetVertexAttribLdv)},
-    {"glGetVertexAttribPointerv", P(GL_GetVertexAttribPointerv)},
-    {"glGetVertexAttribPointervRobustANGLE", P(GL_GetVertexAttribPointervRobustANGLE)},
-    {"glGetVertexAttribdv", P(GL_GetVertexAttribdv)},
-    {"glGetVertexAttribfv", P(GL_GetVertexAttribfv)},
-    {"glGetVertexAttribfvRobustANGLE", P(GL_GetVertexAttribfvRobustANGLE)},
-    {"glGetVertexAttribiv", P(GL_GetVertexAttribiv)},
-    {"glGetVertexAttribivRobustANGLE", P(GL_GetVertexAttribivRobustANGLE)},
-    {"glGetnColorTable", P(GL_GetnColorTable)},
-    {"glGetnCompressedTexImage", P(GL_GetnCompressedTexImage)},
-    {"glGetnConvolutionFilter", P(GL_GetnConvolutionFilter)},
+    {"glTexCoordP4uiv", P(GL_TexCoordP4uiv)},
+    {"glQueryMatrixxOES", P(GL_QueryMatrixxOES)},
+    {"glPushDebugGroupKHR", P(GL_PushDebugGroupKHR)},
+    {"glVertexArrayAttribLFormat", P(GL_VertexArrayAttribLFormat)},
+    {"glCreateQueries", P(GL_CreateQueries)},
+    {"glMateriali", P(GL_Materiali)},
+    {"glVertexAttribI1ui", P(GL_VertexAttribI1ui)},
+    {"glClearTexSubImageEXT", P(GL_ClearTexSubImageEXT)},
+    {"glSamplerParameteriv", P(GL_SamplerParameteriv)},
+    {"glUniform3iv", P(GL_Uniform3iv)},
+    {"glBindFragDataLocationIndexed", P(GL_BindFragDataLocationIndexed)},
+    {"glTextureStorage1D", P(GL_TextureStorage1D)},
+    {"glEvalCoord2f", P(GL_EvalCoord2f)},
+    {"glTexCoord1s", P(GL_TexCoord1s)},
+    {"glGetBufferParameteri64v", P(GL_GetBufferParameteri64v)},
+    {"glMultiTexCoord4fv", P(GL_MultiTexCoord4fv)},
+    {"glVertexPointer", P(GL_VertexPointer)},
     {"glGetnHistogram", P(GL_GetnHistogram)},
-    {"glGetnMapdv", P(GL_GetnMapdv)},
-    {"glGetnMapfv", P(GL_GetnMapfv)},
-    {"glGetnMapiv", P(GL_GetnMapiv)},
-    {"glGetnMinmax", P(GL_GetnMinmax)},
-    {"glGetnPixelMapfv", P(GL_GetnPixelMapfv)},
-    {"glGetnPixelMapuiv", P(GL_GetnPixelMapuiv)},
-    {"glGetnPixelMapusv", P(GL_GetnPixelMapusv)},
-    {"glGetnPolygonStipple", P(GL_GetnPolygonStipple)},
-    {"glGetnSeparableFilter", P(GL_GetnSeparableFilter)},
-    {"glGetnTexImage", P(GL_GetnTexImage)},
-    {"glGetnUniformdv", P(GL_GetnUniformdv)},
-    {"glGetnUniformfv", P(GL_GetnUniformfv)},
-    {"glGetnUniformfvEXT", P(GL_GetnUniformfvEXT)},
-    {"glGetnUniformfvKHR", P(GL_GetnUniformfvKHR)},
-    {"glGetnUniformfvRobustANGLE", P(GL_GetnUniformfvRobustANGLE)},
-    {"glGetnUniformiv", P(GL_GetnUniformiv)},
-    {"glGetnUniformivEXT", P(GL_GetnUniformivEXT)},
-    {"glGetnUniformivKHR", P(GL_GetnUniformivKHR)},
-    {"glGetnUniformivRobustANGLE", P(GL_GetnUniformivRobustANGLE)},
-    {"glGetnUniformuiv", P(GL_GetnUniformuiv)},
-    {"glGetnUniformuivKHR", P(GL_GetnUniformuivKHR)},
-    {"glGetnUniformuivRobustANGLE", P(GL_GetnUniformuivRobustANGLE)},
-    {"glHint", P(GL_Hint)},
-    {"glImportMemoryFdEXT", P(GL_ImportMemoryFdEXT)},
-    {"glImportMemoryZirconHandleANGLE", P(GL_ImportMemoryZirconHandleANGLE)},
-    {"glImportSemaphoreFdEXT", P(GL_ImportSemaphoreFdEXT)},
-    {"glImportSemaphoreZirconHandleANGLE", P(GL_ImportSemaphoreZirconHandleANGLE)},
-    {"glIndexMask", P(GL_IndexMask)},
-    {"glIndexPointer", P(GL_IndexPointer)},
-    {"glIndexd", P(GL_Indexd)},
-    {"glIndexdv", P(GL_Indexdv)},
-    {"glIndexf", P(GL_Indexf)},
-    {"glIndexfv", P(GL_Indexfv)},
-    {"glIndexi", P(GL_Indexi)},
-    {"glIndexiv", P(GL_Indexiv)},
-    {"glIndexs", P(GL_Indexs)},
+    {"glGetTexGeniv", P(GL_GetTexGeniv)},
+    {"glColor4bv", P(GL_Color4bv)},
+    {"glEndTransformFeedback", P(GL_EndTransformFeedback)},
+    {"glMultiTexCoord4d", P(GL_MultiTexCoord4d)},
+    {"glVertexAttrib4ubv", P(GL_VertexAttrib4ubv)},
+    {"glPopClientAttrib", P(GL_PopClientAttrib)},
+    {"glMapGrid2f", P(GL_MapGrid2f)},
+    {"glGetTexParameterfvRobustANGLE", P(GL_GetTexParameterfvRobustANGLE)},
+    {"glGetVertexAttribiv", P(GL_GetVertexAttribiv)},
+    {"glGetTextureSubImage", P(GL_GetTextureSubImage)},
+    {"glEndQueryIndexed", P(GL_EndQueryIndexed)},
+    {"glCheckFramebufferStatusOES", P(GL_CheckFramebufferStatusOES)},
+    {"glTexParameterIivOES", P(GL_TexParameterIivOES)},
+    {"glBlendEquationiEXT", P(GL_BlendEquationiEXT)},
+    {"glShaderStorageBlockBinding", P(GL_ShaderStorageBlockBinding)},
+    {"glRects", P(GL_Rects)},
+    {"glTexImage2D", P(GL_TexImage2D)},
+    {"glGetTexParameterIivEXT", P(GL_GetTexParameterIivEXT)},
+    {"glProgramUniform4fvEXT", P(GL_ProgramUniform4fvEXT)},
+    {"glRasterPos4d", P(GL_RasterPos4d)},
+    {"glValidateProgram", P(GL_ValidateProgram)},
+    {"glWindowPos2f", P(GL_WindowPos2f)},
     {"glIndexsv", P(GL_Indexsv)},
-    {"glIndexub", P(GL_Indexub)},
-    {"glIndexubv", P(GL_Indexubv)},
-    {"glInitNames", P(GL_InitNames)},
-    {"glInsertEventMarkerEXT", P(GL_InsertEventMarkerEXT)},
-    {"glInterleavedArrays", P(GL_InterleavedArrays)},
-    {"glInvalidateBufferData", P(GL_InvalidateBufferData)},
-    {"glInvalidateBufferSubData", P(GL_InvalidateBufferSubData)},
-    {"glInvalidateFramebuffer", P(GL_InvalidateFramebuffer)},
-    {"glInvalidateNamedFramebufferData", P(GL_InvalidateNamedFramebufferData)},
-    {"glInvalidateNamedFramebufferSubData", P(GL_InvalidateNamedFramebufferSubData)},
-    {"glInvalidateSubFramebuffer", P(GL_InvalidateSubFramebuffer)},
-    {"glInvalidateTexImage", P(GL_InvalidateTexImage)},
-    {"glInvalidateTexSubImage", P(GL_InvalidateTexSubImage)},
-    {"glInvalidateTextureANGLE", P(GL_InvalidateTextureANGLE)},
-    {"glIsBuffer", P(GL_IsBuffer)},
-    {"glIsEnabled", P(GL_IsEnabled)},
-    {"glIsEnabledi", P(GL_IsEnabledi)},
-    {"glIsEnablediEXT", P(GL_IsEnablediEXT)},
-    {"glIsEnablediOES", P(GL_IsEnablediOES)},
-    {"glIsFenceNV", P(GL_IsFenceNV)},
-    {"glIsFramebuffer", P(GL_IsFramebuffer)},
-    {"glIsFramebufferOES", P(GL_IsFramebufferOES)},
-    {"glIsList", P(GL_IsList)},
-    {"glIsMemoryObjectEXT", P(GL_IsMemoryObjectEXT)},
-    {"glIsProgram", P(GL_IsProgram)},
-    {"glIsProgramPipeline", P(GL_IsProgramPipeline)},
-    {"glIsProgramPipelineEXT", P(GL_IsProgramPipelineEXT)},
-    {"glIsQuery", P(GL_IsQuery)},
-    {"glIsQueryEXT", P(GL_IsQueryEXT)},
-    {"glIsRenderbuffer", P(GL_IsRenderbuffer)},
-    {"glIsRenderbufferOES", P(GL_IsRenderbufferOES)},
-    {"glIsSampler", P(GL_IsSampler)},
-    {"glIsSemaphoreEXT", P(GL_IsSemaphoreEXT)},
-    {"glIsShader", P(GL_IsShader)},
-    {"glIsSync", P(GL_IsSync)},
-    {"glIsTexture", P(GL_IsTexture)},
-    {"glIsTransformFeedback", P(GL_IsTransformFeedback)},
-    {"glIsVertexArray", P(GL_IsVertexArray)},
+    {"glAttachShader", P(GL_AttachShader)},
+    {"glTranslated", P(GL_Translated)},
+    {"glLineWidthx", P(GL_LineWidthx)},
+    {"glVertexBindingDivisor", P(GL_VertexBindingDivisor)},
+    {"glGenBuffers", P(GL_GenBuffers)},
+    {"glGetActiveUniformBlockiv", P(GL_GetActiveUniformBlockiv)},
+    {"glColor4d", P(GL_Color4d)},
+    {"glUniform2ui", P(GL_Uniform2ui)},
     {"glIsVertexArrayOES", P(GL_IsVertexArrayOES)},
-    {"glLabelObjectEXT", P(GL_LabelObjectEXT)},
-    {"glLightModelf", P(GL_LightModelf)},
-    {"glLightModelfv", P(GL_LightModelfv)},
-    {"glLightModeli", P(GL_LightModeli)},
-    {"glLightModeliv", P(GL_LightModeliv)},
-    {"glLightModelx", P(GL_LightModelx)},
-    {"glLightModelxv", P(GL_LightModelxv)},
-    {"glLightf", P(GL_Lightf)},
-    {"glLightfv", P(GL_Lightfv)},
-    {"glLighti", P(GL_Lighti)},
-    {"glLightiv", P(GL_Lightiv)},
     {"glLightx", P(GL_Lightx)},
-    {"glLightxv", P(GL_Lightxv)},
-    {"glLineStipple", P(GL_LineStipple)},
-    {"glLineWidth", P(GL_LineWidth)},
-    {"glLineWidthx", P(GL_LineWidthx)},
-    {"glLinkProgram", P(GL_LinkProgram)},
-    {"glListBase", P(GL_ListBase)},
+    {"glRasterPos3iv", P(GL_RasterPos3iv)},
+    {"glProgramUniformMatrix4x3fvEXT", P(GL_ProgramUniformMatrix4x3fvEXT)},
+    {"glProgramUniformMatrix3x4fv", P(GL_ProgramUniformMatrix3x4fv)},
+    {"glEvalPoint1", P(GL_EvalPoint1)},
+    {"glBegin", P(GL_Begin)},
+    {"glBlendFuncSeparateiOES", P(GL_BlendFuncSeparateiOES)},
+    {"glNamedBufferSubData", P(GL_NamedBufferSubData)},
+    {"glRectsv", P(GL_Rectsv)},
+    {"glTexCoord4i", P(GL_TexCoord4i)},
     {"glLoadIdentity", P(GL_LoadIdentity)},
-    {"glLoadMatrixd", P(GL_LoadMatrixd)},
-    {"glLoadMatrixf", P(GL_LoadMatrixf)},
-    {"glLoadMatrixx", P(GL_LoadMatrixx)},
-    {"glLoadName", P(GL_LoadName)},
-    {"glLoadPaletteFromModelViewMatrixOES", P(GL_LoadPaletteFromModelViewMatrixOES)},
-    {"glLoadTransposeMatrixd", P(GL_LoadTransposeMatrixd)},
-    {"glLoadTransposeMatrixf", P(GL_LoadTransposeMatrixf)},
-    {"glLogicOp", P(GL_LogicOp)},
-    {"glLogicOpANGLE", P(GL_LogicOpANGLE)},
-    {"glLoseContextCHROMIUM", P(GL_LoseContextCHROMIUM)},
-    {"glMap1d", P(GL_Map1d)},
-    {"glMap1f", P(GL_Map1f)},
-    {"glMap2d", P(GL_Map2d)},
-    {"glMap2f", P(GL_Map2f)},
-    {"glMapBuffer", P(GL_MapBuffer)},
-    {"glMapBufferOES", P(GL_MapBufferOES)},
-    {"glMapBufferRange", P(GL_MapBufferRange)},
-    {"glMapBufferRangeEXT", P(GL_MapBufferRangeEXT)},
-    {"glMapGrid1d", P(GL_MapGrid1d)},
-    {"glMapGrid1f", P(GL_MapGrid1f)},
-    {"glMapGrid2d", P(GL_MapGrid2d)},
-    {"glMapGrid2f", P(GL_MapGrid2f)},
-    {"glMapNamedBuffer", P(GL_MapNamedBuffer)},
-    {"glMapNamedBufferRange", P(GL_MapNamedBufferRange)},
-    {"glMaterialf", P(GL_Materialf)},
-    {"glMaterialfv", P(GL_Materialfv)},
-    {"glMateriali", P(GL_Materiali)},
-    {"glMaterialiv", P(GL_Materialiv)},
-    {"glMaterialx", P(GL_Materialx)},
-    {"glMaterialxv", P(GL_Materialxv)},
-    {"glMatrixIndexPointerOES", P(GL_MatrixIndexPointerOES)},
-    {"glMatrixMode", P(GL_MatrixMode)},
-    {"glMaxShaderCompilerThreadsKHR", P(GL_MaxShaderCompilerThreadsKHR)},
-    {"glMemoryBarrier", P(GL_MemoryBarrier)},
-    {"glMemoryBarrierByRegion", P(GL_MemoryBarrierByRegion)},
-    {"glMemoryObjectParameterivEXT", P(GL_MemoryObjectParameterivEXT)},
-    {"glMinSampleShading", P(GL_MinSampleShading)},
-    {"glMinSampleShadingOES", P(GL_MinSampleShadingOES)},
-    {"glMultMatrixd", P(GL_MultMatrixd)},
-    {"glMultMatrixf", P(GL_MultMatrixf)},
-    {"glMultMatrixx", P(GL_MultMatrixx)},
-    {"glMultTransposeMatrixd", P(GL_MultTransposeMatrixd)},
-    {"glMultTransposeMatrixf", P(GL_MultTransposeMatrixf)},
-    {"glMultiDrawArrays", P(GL_MultiDrawArrays)},
-    {"glMultiDrawArraysANGLE", P(GL_MultiDrawArraysANGLE)},
-    {"glMultiDrawArraysIndirect", P(GL_MultiDrawArraysIndirect)},
+    {"glGetMaterialxv", P(GL_GetMaterialxv)},
+    {"glVertexAttribP2uiv", P(GL_VertexAttribP2uiv)},
+    {"glRasterPos2d", P(GL_RasterPos2d)},
+    {"glWaitSemaphoreEXT", P(GL_WaitSemaphoreEXT)},
+    {"glIsShader", P(GL_IsShader)},
+    {"glTexCoord1f", P(GL_TexCoord1f)},
+    {"glGetSubroutineUniformLocation", P(GL_GetSubroutineUniformLocation)},
+    {"glIsEnabledi", P(GL_IsEnabledi)},
+    {"glEndQueryEXT", P(GL_EndQueryEXT)},
+    {"glGetInteger64vRobustANGLE", P(GL_GetInteger64vRobustANGLE)},
+    {"glAccum", P(GL_Accum)},
     {"glMultiDrawArraysIndirectCount", P(GL_MultiDrawArraysIndirectCount)},
-    {"glMultiDrawArraysIndirectEXT", P(GL_MultiDrawArraysIndirectEXT)},
-    {"glMultiDrawArraysInstancedANGLE", P(GL_MultiDrawArraysInstancedANGLE)},
-    {"glMultiDrawArraysInstancedBaseInstanceANGLE", P(GL_MultiDrawArraysInstancedBaseInstanceANGLE)},
-    {"glMultiDrawElements", P(GL_MultiDrawElements)},
-    {"glMultiDrawElementsANGLE", P(GL_MultiDrawElementsANGLE)},
-    {"glMultiDrawElementsBaseVertex", P(GL_MultiDrawElementsBaseVertex)},
-    {"glMultiDrawElementsBaseVertexEXT", P(GL_MultiDrawElementsBaseVertexEXT)},
-    {"glMultiDrawElementsIndirect", P(GL_MultiDrawElementsIndirect)},
-    {"glMultiDrawElementsIndirectCount", P(GL_MultiDrawElementsIndirectCount)},
-    {"glMultiDrawElementsIndirectEXT", P(GL_MultiDrawElementsIndirectEXT)},
-    {"glMultiDrawElementsInstancedANGLE", P(GL_MultiDrawElementsInstancedANGLE)},
-    {"glMultiDrawElementsInstancedBaseVertexBaseInstanceANGLE", P(GL_MultiDrawElementsInstancedBaseVertexBaseInstanceANGLE)},
-    {"glMultiTexCoord1d", P(GL_MultiTexCoord1d)},
+    {"glUniformMatrix2x4dv", P(GL_UniformMatrix2x4dv)},
+    {"glVertexAttrib4bv", P(GL_VertexAttrib4bv)},
+    {"glMap1f", P(GL_Map1f)},
+    {"glBlendEquation", P(GL_BlendEquation)},
+    {"glViewportIndexedfv", P(GL_ViewportIndexedfv)},
+    {"glTexParameterIuivOES", P(GL_TexParameterIuivOES)},
+    {"glPrimitiveBoundingBox", P(GL_PrimitiveBoundingBox)},
+    {"glGetnPixelMapfv", P(GL_GetnPixelMapfv)},
+    {"glVertex4s", P(GL_Vertex4s)},
+    {"glGetQueryBufferObjecti64v", P(GL_GetQueryBufferObjecti64v)},
+    {"glGenQueries", P(GL_GenQueries)},
+    {"glUniform4d", P(GL_Uniform4d)},
+    {"glSecondaryColor3usv", P(GL_SecondaryColor3usv)},
+    {"glIsFramebuffer", P(GL_IsFramebuffer)},
+    {"glGetQueryObjecti64vRobustANGLE", P(GL_GetQueryObjecti64vRobustANGLE)},
+    {"glFramebufferRenderbufferOES", P(GL_FramebufferRenderbufferOES)},
+    {"glDisablei", P(GL_Disablei)},
+    {"glUniform4ui", P(GL_Uniform4ui)},
+    {"glTexParameteriv", P(GL_TexParameteriv)},
+    {"glPixelTransferi", P(GL_PixelTransferi)},
+    {"glColor4sv", P(GL_Color4sv)},
+    {"glTexImage2DMultisample", P(GL_TexImage2DMultisample)},
+    {"wglUseFontOutlinesW", P(wglUseFontOutlinesW)},
+    {"glClearBufferuiv", P(GL_ClearBufferuiv)},
+    {"glGenTextures", P(GL_GenTextures)},
+    {"glIndexdv", P(GL_Indexdv)},
+    {"glMultMatrixx", P(GL_MultMatrixx)},
+    {"glBufferStorage", P(GL_BufferStorage)},
+    {"glGetObjectLabel", P(GL_GetObjectLabel)},
+    {"glProgramUniform2fEXT", P(GL_ProgramUniform2fEXT)},
+    {"glVertexArrayAttribBinding", P(GL_VertexArrayAttribBinding)},
+    {"glSamplerParameterIuiv", P(GL_SamplerParameterIuiv)},
+    {"glUniformMatrix3fv", P(GL_UniformMatrix3fv)},
+    {"glIndexPointer", P(GL_IndexPointer)},
+    {"glRenderbufferStorageMultisampleEXT", P(GL_RenderbufferStorageMultisampleEXT)},
+    {"glGetDebugMessageLogKHR", P(GL_GetDebugMessageLogKHR)},
+    {"glGetNamedFramebufferAttachmentParameteriv", P(GL_GetNamedFramebufferAttachmentParameteriv)},
+    {"glGetnUniformuivKHR", P(GL_GetnUniformuivKHR)},
+    {"glEGLImageTargetTexStorageEXT", P(GL_EGLImageTargetTexStorageEXT)},
+    {"glGetSamplerParameterIuivOES", P(GL_GetSamplerParameterIuivOES)},
+    {"glCreateProgram", P(GL_CreateProgram)},
+    {"glRasterPos2iv", P(GL_RasterPos2iv)},
+    {"glSecondaryColorPointer", P(GL_SecondaryColorPointer)},
+    {"glProgramParameteri", P(GL_ProgramParameteri)},
+    {"glVertexAttrib3sv", P(GL_VertexAttrib3sv)},
+    {"glColor3usv", P(GL_Color3usv)},
+    {"glVertexAttribI2ui", P(GL_VertexAttribI2ui)},
+    {"glGetGraphicsResetStatusKHR", P(GL_GetGraphicsResetStatusKHR)},
+    {"glCreateRenderbuffers", P(GL_CreateRenderbuffers)},
+    {"glUniform3i", P(GL_Uniform3i)},
+    {"glMapGrid1f", P(GL_MapGrid1f)},
+    {"glSecondaryColor3d", P(GL_SecondaryColor3d)},
+    {"glVertexAttrib4uiv", P(GL_VertexAttrib4uiv)},
+    {"glActiveTexture", P(GL_ActiveTexture)},
+    {"glBlendFunciOES", P(GL_BlendFunciOES)},
+    {"glMultiTexCoord2dv", P(GL_MultiTexCoord2dv)},
+    {"glGetFloatv", P(GL_GetFloatv)},
+    {"glGetProgramInfoLog", P(GL_GetProgramInfoLog)},
+    {"glDebugMessageControlKHR", P(GL_DebugMessageControlKHR)},
+    {"glVertex4i", P(GL_Vertex4i)},
+    {"glProgramUniform3uivEXT", P(GL_ProgramUniform3uivEXT)},
+    {"glGetQueryivEXT", P(GL_GetQueryivEXT)},
     {"glMultiTexCoord1dv", P(GL_MultiTexCoord1dv)},
-    {"glMultiTexCoord1f", P(GL_MultiTexCoord1f)},
-    {"glMultiTexCoord1fv", P(GL_MultiTexCoord1fv)},
-    {"glMultiTexCoord1i", P(GL_MultiTexCoord1i)},
-    {"glMultiTexCoord1iv", P(GL_MultiTexCoord1iv)},
-    {"glMultiTexCoord1s", P(GL_MultiTexCoord1s)},
+    {"glVertexAttrib4f", P(GL_VertexAttrib4f)},
+    {"glTexGend", P(GL_TexGend)},
     {"glMultiTexCoord1sv", P(GL_MultiTexCoord1sv)},
-    {"glMultiTexCoord2d", P(GL_MultiTexCoord2d)},
-    {"glMultiTexCoord2dv", P(GL_MultiTexCoord2dv)},
-    {"glMultiTexCoord2f", P(GL_MultiTexCoord2f)},
-    {"glMultiTexCoord2fv", P(GL_MultiTexCoord2fv)},
-    {"glMultiTexCoord2i", P(GL_MultiTexCoord2i)},
-    {"glMultiTexCoord2iv", P(GL_MultiTexCoord2iv)},
-    {"glMultiTexCoord2s", P(GL_MultiTexCoord2s)},
-    {"glMultiTexCoord2sv", P(GL_MultiTexCoord2sv)},
-    {"glMultiTexCoord3d", P(GL_MultiTexCoord3d)},
-    {"glMultiTexCoord3dv", P(GL_MultiTexCoord3dv)},
-    {"glMultiTexCoord3f", P(GL_MultiTexCoord3f)},
-    {"glMultiTexCoord3fv", P(GL_MultiTexCoord3fv)},
-    {"glMultiTexCoord3i", P(GL_MultiTexCoord3i)},
-    {"glMultiTexCoord3iv", P(GL_MultiTexCoord3iv)},
-    {"glMultiTexCoord3s", P(GL_MultiTexCoord3s)},
-    {"glMultiTexCoord3sv", P(GL_MultiTexCoord3sv)},
-    {"glMultiTexCoord4d", P(GL_MultiTexCoord4d)},
-    {"glMultiTexCoord4dv", P(GL_MultiTexCoord4dv)},
-    {"glMultiTexCoord4f", P(GL_MultiTexCoord4f)},
-    {"glMultiTexCoord4fv", P(GL_MultiTexCoord4fv)},
-    {"glMultiTexCoord4i", P(GL_MultiTexCoord4i)},
-    {"glMultiTexCoord4iv", P(GL_MultiTexCoord4iv)},
-    {"glMultiTexCoord4s", P(GL_MultiTexCoord4s)},
-    {"glMultiTexCoord4sv", P(GL_MultiTexCoord4sv)},
-    {"glMultiTexCoord4x", P(GL_MultiTexCoord4x)},
-    {"glMultiTexCoordP1ui", P(GL_MultiTexCoordP1ui)},
-    {"glMultiTexCoordP1uiv", P(GL_MultiTexCoordP1uiv)},
-    {"glMultiTexCoordP2ui", P(GL_MultiTexCoordP2ui)},
-    {"glMultiTexCoordP2uiv", P(GL_MultiTexCoordP2uiv)},
-    {"glMultiTexCoordP3ui", P(GL_MultiTexCoordP3ui)},
-    {"glMultiTexCoordP3uiv", P(GL_MultiTexCoordP3uiv)},
-    {"glMultiTexCoordP4ui", P(GL_MultiTexCoordP4ui)},
-    {"glMultiTexCoordP4uiv", P(GL_MultiTexCoordP4uiv)},
-    {"glNamedBufferData", P(GL_NamedBufferData)},
-    {"glNamedBufferStorage", P(GL_NamedBufferStorage)},
-    {"glNamedBufferStorageExternalEXT", P(GL_NamedBufferStorageExternalEXT)},
-    {"glNamedBufferSubData", P(GL_NamedBufferSubData)},
-    {"glNamedFramebufferDrawBuffer", P(GL_NamedFramebufferDrawBuffer)},
-    {"glNamedFramebufferDrawBuffers", P(GL_NamedFramebufferDrawBuffers)},
-    {"glNamedFramebufferParameteri", P(GL_NamedFramebufferParameteri)},
-    {"glNamedFramebufferReadBuffer", P(GL_NamedFramebufferReadBuffer)},
-    {"glNamedFramebufferRenderbuffer", P(GL_NamedFramebufferRenderbuffer)},
-    {"glNamedFramebufferTexture", P(GL_NamedFramebufferTexture)},
-    {"glNamedFramebufferTextureLayer", P(GL_NamedFramebufferTextureLayer)},
-    {"glNamedRenderbufferStorage", P(GL_NamedRenderbufferStorage)},
+    {"glTexSubImage1D", P(GL_TexSubImage1D)},
     {"glNamedRenderbufferStorageMultisample", P(GL_NamedRenderbufferStorageMultisample)},
-    {"glNewList", P(GL_NewList)},
-    {"glNormal3b", P(GL_Normal3b)},
-    {"glNormal3bv", P(GL_Normal3bv)},
-    {"glNormal3d", P(GL_Normal3d)},
-    {"glNormal3dv", P(GL_Normal3dv)},
-    {"glNormal3f", P(GL_Normal3f)},
-    {"glNormal3fv", P(GL_Normal3fv)},
-    {"glNormal3i", P(GL_Normal3i)},
-    {"glNormal3iv", P(GL_Normal3iv)},
-    {"glNormal3s", P(GL_Normal3s)},
-    {"glNormal3sv", P(GL_Normal3sv)},
-    {"glNormal3x", P(GL_Normal3x)},
-    {"glNormalP3ui", P(GL_NormalP3ui)},
-    {"glNormalP3uiv", P(GL_NormalP3uiv)},
-    {"glNormalPointer", P(GL_NormalPointer)},
-    {"glObjectLabel", P(GL_ObjectLabel)},
-    {"glObjectLabelKHR", P(GL_ObjectLabelKHR)},
-    {"glObjectPtrLabel", P(GL_ObjectPtrLabel)},
-    {"glObjectPtrLabelKHR", P(GL_ObjectPtrLabelKHR)},
-    {"glOrtho", P(GL_Ortho)},
-    {"glOrthof", P(GL_Orthof)},
-    {"glOrthox", P(GL_Orthox)},
-    {"glPassThrough", P(GL_PassThrough)},
-    {"glPatchParameterfv", P(GL_PatchParameterfv)},
-    {"glPatchParameteri", P(GL_PatchParameteri)},
-    {"glPatchParameteriEXT", P(GL_PatchParameteriEXT)},
-    {"glPatchParameteriOES", P(GL_PatchParameteriOES)},
-    {"glPauseTransformFeedback", P(GL_PauseTransformFeedback)},
-    {"glPixelLocalStorageBarrierANGLE", P(GL_PixelLocalStorageBarrierANGLE)},
-    {"glPixelMapfv", P(GL_PixelMapfv)},
-    {"glPixelMapuiv", P(GL_PixelMapuiv)},
-    {"glPixelMapusv", P(GL_PixelMapusv)},
+    {"glUniform2iv", P(GL_Uniform2iv)},
+    {"glMultiTexCoordP3ui", P(GL_MultiTexCoordP3ui)},
+    {"glPolygonModeANGLE", P(GL_PolygonModeANGLE)},
+    {"glFramebufferRenderbuffer", P(GL_FramebufferRenderbuffer)},
+    {"glFinishFenceNV", P(GL_FinishFenceNV)},
+    {"glVertexAttribP3ui", P(GL_VertexAttribP3ui)},
+    {"glTexGeni", P(GL_TexGeni)},
+    {"glGetPixelMapuiv", P(GL_GetPixelMapuiv)},
+    {"glTexStorageMem3DEXT", P(GL_TexStorageMem3DEXT)},
+    {"glProgramUniform1uiEXT", P(GL_ProgramUniform1uiEXT)},
+    {"glBlitFramebufferNV", P(GL_BlitFramebufferNV)},
+    {"glTexStorage2DMultisampleANGLE", P(GL_TexStorage2DMultisampleANGLE)},
+    {"glBindBuffer", P(GL_BindBuffer)},
+    {"glEdgeFlag", P(GL_EdgeFlag)},
+    {"glGetVertexAttribdv", P(GL_GetVertexAttribdv)},
+    {"glBindVertexArray", P(GL_BindVertexArray)},
+    {"glBlendEquationSeparateiEXT", P(GL_BlendEquationSeparateiEXT)},
+    {"glBlendFunci", P(GL_BlendFunci)},
+    {"glGetProgramResourceName", P(GL_GetProgramResourceName)},
+    {"glGetCompressedTexImageANGLE", P(GL_GetCompressedTexImageANGLE)},
+    {"glValidateProgramPipelineEXT", P(GL_ValidateProgramPipelineEXT)},
+    {"glSelectPerfMonitorCountersAMD", P(GL_SelectPerfMonitorCountersAMD)},
+    {"glGetUniformfv", P(GL_GetUniformfv)},
+    {"glGenPerfMonitorsAMD", P(GL_GenPerfMonitorsAMD)},
+    {"glMultiTexCoord1fv", P(GL_MultiTexCoord1fv)},
+    {"glMultMatrixd", P(GL_MultMatrixd)},
+    {"glFramebufferParameteri", P(GL_FramebufferParameteri)},
+    {"glTexCoord4s", P(GL_TexCoord4s)},
+    {"glRectfv", P(GL_Rectfv)},
+    {"glDrawElementsBaseVertex", P(GL_DrawElementsBaseVertex)},
+    {"glVertexAttribP2ui", P(GL_VertexAttribP2ui)},
+    {"glFogiv", P(GL_Fogiv)},
+    {"glTexGenf", P(GL_TexGenf)},
+    {"glGetBufferSubData", P(GL_GetBufferSubData)},
+    {"glGetTexParameterivRobustANGLE", P(GL_GetTexParameterivRobustANGLE)},
+    {"glGetNamedBufferParameteriv", P(GL_GetNamedBufferParameteriv)},
+    {"glRotatex", P(GL_Rotatex)},
+    {"glProgramUniform2fvEXT", P(GL_ProgramUniform2fvEXT)},
+    {"glVertexAttribP1uiv", P(GL_VertexAttribP1uiv)},
+    {"glIndexd", P(GL_Indexd)},
+    {"glDrawElementsInstancedBaseVertexOES", P(GL_DrawElementsInstancedBaseVertexOES)},
+    {"glCopyTexSubImage3DOES", P(GL_CopyTexSubImage3DOES)},
+    {"glTexGenivOES", P(GL_TexGenivOES)},
+    {"glColor3d", P(GL_Color3d)},
     {"glPixelStoref", P(GL_PixelStoref)},
-    {"glPixelStorei", P(GL_PixelStorei)},
-    {"glPixelTransferf", P(GL_PixelTransferf)},
-    {"glPixelTransferi", P(GL_PixelTransferi)},
-    {"glPixelZoom", P(GL_PixelZoom)},
+    {"glVertex4fv", P(GL_Vertex4fv)},
+    {"glRasterPos2dv", P(GL_RasterPos2dv)},
+    {"glCreateShader", P(GL_CreateShader)},
+    {"glGetUniformivRobustANGLE", P(GL_GetUniformivRobustANGLE)},
+    {"glVertexAttribI3ui", P(GL_VertexAttribI3ui)},
+    {"glTexParameteri", P(GL_TexParameteri)},
+    {"glGetNamedBufferSubData", P(GL_GetNamedBufferSubData)},
+    {"glIndexubv", P(GL_Indexubv)},
+    {"glUniform2f", P(GL_Uniform2f)},
+    {"glUniform3f", P(GL_Uniform3f)},
+    {"glSelectBuffer", P(GL_SelectBuffer)},
+    {"glColor4s", P(GL_Color4s)},
+    {"glGenFramebuffers", P(GL_GenFramebuffers)},
+    {"glMultiTexCoord4f", P(GL_MultiTexCoord4f)},
+    {"glMultiDrawArraysInstancedANGLE", P(GL_MultiDrawArraysInstancedANGLE)},
+    {"glProgramUniform3d", P(GL_ProgramUniform3d)},
+    {"glProgramUniform4i", P(GL_ProgramUniform4i)},
+    {"glQueryCounter", P(GL_QueryCounter)},
+    {"wglGetPixelFormat", P(wglGetPixelFormat)},
+    {"glFogf", P(GL_Fogf)},
+    {"glRectdv", P(GL_Rectdv)},
+    {"glScissor", P(GL_Scissor)},
+    {"glMultTransposeMatrixf", P(GL_MultTransposeMatrixf)},
+    {"glGetProgramResourceLocationIndexEXT", P(GL_GetProgramResourceLocationIndexEXT)},
+    {"glTexStorage3DMultisampleOES", P(GL_TexStorage3DMultisampleOES)},
+    {"glGetnPixelMapusv", P(GL_GetnPixelMapusv)},
+    {"glClearDepth", P(GL_ClearDepth)},
+    {"glVertexAttrib4usv", P(GL_VertexAttrib4usv)},
+    {"glTexCoord4d", P(GL_TexCoord4d)},
+    {"glCompressedTexSubImage3DOES", P(GL_CompressedTexSubImage3DOES)},
+    {"glCopyTextureSubImage3D", P(GL_CopyTextureSubImage3D)},
+    {"glMultiTexCoord2fv", P(GL_MultiTexCoord2fv)},
+    {"glFramebufferPixelLocalStorageInterruptANGLE", P(GL_FramebufferPixelLocalStorageInterruptANGLE)},
+    {"glVertexAttrib4Nsv", P(GL_VertexAttrib4Nsv)},
+    {"glVertexP4ui", P(GL_VertexP4ui)},
+    {"glGetActiveSubroutineName", P(GL_GetActiveSubroutineName)},
+    {"glGenSemaphoresEXT", P(GL_GenSemaphoresEXT)},
+    {"glTextureFoveationParametersQCOM", P(GL_TextureFoveationParametersQCOM)},
+    {"glVertex3f", P(GL_Vertex3f)},
+    {"glCoverageModulationCHROMIUM", P(GL_CoverageModulationCHROMIUM)},
+    {"glFramebufferTexture1D", P(GL_FramebufferTexture1D)},
+    {"glSamplerParameterIiv", P(GL_SamplerParameterIiv)},
+    {"glLogicOp", P(GL_LogicOp)},
+    {"wglRealizeLayerPalette", P(wglRealizeLayerPalette)},
+    {"glViewportIndexedf", P(GL_ViewportIndexedf)},
+    {"glFogCoordfv", P(GL_FogCoordfv)},
+    {"glLoseContextCHROMIUM", P(GL_LoseContextCHROMIUM)},
+    {"glGetnPixelMapuiv", P(GL_GetnPixelMapuiv)},
+    {"glVertexAttrib1fv", P(GL_VertexAttrib1fv)},
+    {"glGetObjectLabelKHR", P(GL_GetObjectLabelKHR)},
+    {"glStartTilingQCOM", P(GL_StartTilingQCOM)},
+    {"glTexStorageMemFlags3DMultisampleANGLE", P(GL_TexStorageMemFlags3DMultisampleANGLE)},
+    {"glClientActiveTexture", P(GL_ClientActiveTexture)},
+    {"glDrawArraysInstancedBaseInstance", P(GL_DrawArraysInstancedBaseInstance)},
+    {"glWaitSync", P(GL_WaitSync)},
+    {"glInvalidateBufferData", P(GL_InvalidateBufferData)},
+    {"glProgramUniformMatrix3x2fv", P(GL_ProgramUniformMatrix3x2fv)},
+    {"glGetVertexAttribivRobustANGLE", P(GL_GetVertexAttribivRobustANGLE)},
+    {"glGetFramebufferAttachmentParameteriv", P(GL_GetFramebufferAttachmentParameteriv)},
+    {"glColor3fv", P(GL_Color3fv)},
+    {"glGetBufferPointervRobustANGLE", P(GL_GetBufferPointervRobustANGLE)},
+    {"glGetFramebufferAttachmentParameterivRobustANGLE", P(GL_GetFramebufferAttachmentParameterivRobustANGLE)},
+    {"glTexParameterIivEXT", P(GL_TexParameterIivEXT)},
+    {"glBlendBarrier", P(GL_BlendBarrier)},
+    {"wglMakeCurrent", P(wglMakeCurrent)},
+    {"glGetFramebufferParameterivMESA", P(GL_GetFramebufferParameterivMESA)},
+    {"glVertexAttribP1ui", P(GL_VertexAttribP1ui)},
+    {"glRenderMode", P(GL_RenderMode)},
     {"glPointParameterf", P(GL_PointParameterf)},
-    {"glPointParameterfv", P(GL_PointParameterfv)},
-    {"glPointParameteri", P(GL_PointParameteri)},
-    {"glPointParameteriv", P(GL_PointParameteriv)},
-    {"glPointParameterx", P(GL_PointParameterx)},
-    {"glPointParameterxv", P(GL_PointParameterxv)},
-    {"glPointSize", P(GL_PointSize)},
-    {"glPointSizePointerOES", P(GL_PointSizePointerOES)},
-    {"glPointSizex", P(GL_PointSizex)},
-    {"glPolygonMode", P(GL_PolygonMode)},
-    {"glPolygonModeANGLE", P(GL_PolygonModeANGLE)},
-    {"glPolygonModeNV", P(GL_PolygonModeNV)},
-    {"glPolygonOffset", P(GL_PolygonOffset)},
-    {"glPolygonOffsetClamp", P(GL_PolygonOffsetClamp)},
+    {"glPopAttrib", P(GL_PopAttrib)},
+    {"glVertexArrayVertexBuffer", P(GL_VertexArrayVertexBuffer)},
+    {"glGetTexGenivOES", P(GL_GetTexGenivOES)},
+    {"glCopyTextureCHROMIUM", P(GL_CopyTextureCHROMIUM)},
+    {"glTexEnvf", P(GL_TexEnvf)},
     {"glPolygonOffsetClampEXT", P(GL_PolygonOffsetClampEXT)},
+    {"glSecondaryColor3dv", P(GL_SecondaryColor3dv)},
+    {"glUniformMatrix2fv", P(GL_UniformMatrix2fv)},
+    {"glStencilMask", P(GL_StencilMask)},
+    {"glColor4iv", P(GL_Color4iv)},
+    {"glMultiDrawElementsIndirectEXT", P(GL_MultiDrawElementsIndirectEXT)},
+    {"glCreateShaderProgramv", P(GL_CreateShaderProgramv)},
+    {"glAlphaFuncx", P(GL_AlphaFuncx)},
     {"glPolygonOffsetx", P(GL_PolygonOffsetx)},
-    {"glPolygonStipple", P(GL_PolygonStipple)},
-    {"glPopAttrib", P(GL_PopAttrib)},
-    {"glPopClientAttrib", P(GL_PopClientAttrib)},
-    {"glPopDebugGroup", P(GL_PopDebugGroup)},
-    {"glPopDebugGroupKHR", P(GL_PopDebugGroupKHR)},
+    {"glTexCoord4fv", P(GL_TexCoord4fv)},
+    {"glProgramUniform4d", P(GL_ProgramUniform4d)},
+    {"glProgramUniform4uivEXT", P(GL_ProgramUniform4uivEXT)},
+    {"glImportSemaphoreZirconHandleANGLE", P(GL_ImportSemaphoreZirconHandleANGLE)},
+    {"glBindImageTexture", P(GL_BindImageTexture)},
+    {"glGetQueryObjectivEXT", P(GL_GetQueryObjectivEXT)},
+    {"glVertexAttribL3dv", P(GL_VertexAttribL3dv)},
+    {"glUniform2i", P(GL_Uniform2i)},
+    {"glFrustumf", P(GL_Frustumf)},
+    {"glGenerateMipmapOES", P(GL_GenerateMipmapOES)},
+    {"glProgramUniformMatrix4fvEXT", P(GL_ProgramUniformMatrix4fvEXT)},
+    {"glDeleteRenderbuffersOES", P(GL_DeleteRenderbuffersOES)},
+    {"glShadingRateQCOM", P(GL_ShadingRateQCOM)},
+    {"glStencilOp", P(GL_StencilOp)},
+    {"glGetFramebufferParameteriv", P(GL_GetFramebufferParameteriv)},
+    {"glClipControl", P(GL_ClipControl)},
+    {"glActiveShaderProgramEXT", P(GL_ActiveShaderProgramEXT)},
+    {"glGenFencesNV", P(GL_GenFencesNV)},
+    {"glGetUnsignedBytevEXT", P(GL_GetUnsignedBytevEXT)},
+    {"glClearNamedBufferData", P(GL_ClearNamedBufferData)},
+    {"glDeleteFencesNV", P(GL_DeleteFencesNV)},
+    {"glVertexAttribDivisorEXT", P(GL_VertexAttribDivisorEXT)},
+    {"glGetPerfMonitorCounterDataAMD", P(GL_GetPerfMonitorCounterDataAMD)},
+    {"glProgramUniformMatrix2x4dv", P(GL_ProgramUniformMatrix2x4dv)},
+    {"glGetTextureParameteriv", P(GL_GetTextureParameteriv)},
+    {"glGetPointervKHR", P(GL_GetPointervKHR)},
+    {"glIndexs", P(GL_Indexs)},
+    {"glEnableiOES", P(GL_EnableiOES)},
+    {"glBufferStorageExternalEXT", P(GL_BufferStorageExternalEXT)},
+    {"glObjectPtrLabelKHR", P(GL_ObjectPtrLabelKHR)},
+    {"glSecondaryColor3uiv", P(GL_SecondaryColor3uiv)},
+    {"glMultiTexCoordP1ui", P(GL_MultiTexCoordP1ui)},
+    {"glSecondaryColor3fv", P(GL_SecondaryColor3fv)},
+    {"glGetSamplerParameterIuivEXT", P(GL_GetSamplerParameterIuivEXT)},
+    {"glProgramUniformMatrix4x2fv", P(GL_ProgramUniformMatrix4x2fv)},
+    {"glGetActiveUniformsiv", P(GL_GetActiveUniformsiv)},
+    {"glVertexAttrib3f", P(GL_VertexAttrib3f)},
+    {"glDeleteSamplers", P(GL_DeleteSamplers)},
+    {"glGetTexGenfv", P(GL_GetTexGenfv)},
+    {"glMultMatrixf", P(GL_MultMatrixf)},
+    {"glWindowPos3i", P(GL_WindowPos3i)},
+    {"glDrawRangeElementsBaseVertex", P(GL_DrawRangeElementsBaseVertex)},
+    {"glDeleteProgramPipelinesEXT", P(GL_DeleteProgramPipelinesEXT)},
+    {"glRasterPos2i", P(GL_RasterPos2i)},
+    {"glGetQueryiv", P(GL_GetQueryiv)},
+    {"glVertex4iv", P(GL_Vertex4iv)},
+    {"glDebugMessageInsertKHR", P(GL_DebugMessageInsertKHR)},
+    {"glUseProgram", P(GL_UseProgram)},
+    {"glActiveShaderProgram", P(GL_ActiveShaderProgram)},
+    {"glSecondaryColor3i", P(GL_SecondaryColor3i)},
+    {"glDrawTransformFeedbackInstanced", P(GL_DrawTransformFeedbackInstanced)},
+    {"glDrawElementsInstancedBaseVertexEXT", P(GL_DrawElementsInstancedBaseVertexEXT)},
+    {"glPolygonMode", P(GL_PolygonMode)},
+    {"glMaterialiv", P(GL_Materialiv)},
+    {"glGetFenceivNV", P(GL_GetFenceivNV)},
+    {"glIsQuery", P(GL_IsQuery)},
+    {"glCompressedTexImage3D", P(GL_CompressedTexImage3D)},
+    {"glIndexMask", P(GL_IndexMask)},
+    {"glRasterPos3dv", P(GL_RasterPos3dv)},
+    {"glMemoryObjectParameterivEXT", P(GL_MemoryObjectParameterivEXT)},
+    {"glReadnPixelsKHR", P(GL_ReadnPixelsKHR)},
+    {"glMap1d", P(GL_Map1d)},
+    {"wglUseFontOutlines", P(wglUseFontOutlines)},
+    {"glFramebufferTexturePixelLocalStorageANGLE", P(GL_FramebufferTexturePixelLocalStorageANGLE)},
+    {"glTexBufferRange", P(GL_TexBufferRange)},
+    {"glGetMultisamplefvANGLE", P(GL_GetMultisamplefvANGLE)},
+    {"glFramebufferPixelLocalStorageRestoreANGLE", P(GL_FramebufferPixelLocalStorageRestoreANGLE)},
+    {"glColor4ubv", P(GL_Color4ubv)},
+    {"glBlendColor", P(GL_BlendColor)},
+    {"glUniform2fv", P(GL_Uniform2fv)},
+    {"glColor4fv", P(GL_Color4fv)},
+    {"glVertex2d", P(GL_Vertex2d)},
+    {"glVertexP2uiv", P(GL_VertexP2uiv)},
+    {"glVertexAttrib3dv", P(GL_VertexAttrib3dv)},
+    {"glGetMapfv", P(GL_GetMapfv)},
+    {"glTexEnvi", P(GL_TexEnvi)},
+    {"glProgramUniformMatrix4fv", P(GL_ProgramUniformMatrix4fv)},
+    {"glPixelMapusv", P(GL_PixelMapusv)},
+    {"wglDescribeLayerPlane", P(wglDescribeLayerPlane)},
+    {"glFramebufferFoveationParametersQCOM", P(GL_FramebufferFoveationParametersQCOM)},
+    {"glVertex3s", P(GL_Vertex3s)},
+    {"glPassThrough", P(GL_PassThrough)},
+    {"glTexCoord3d", P(GL_TexCoord3d)},
+    {"glCopyNamedBufferSubData", P(GL_CopyNamedBufferSubData)},
+    {"glCreateTextures", P(GL_CreateTextures)},
+    {"glMaterialf", P(GL_Materialf)},
+    {"glTexImage1D", P(GL_TexImage1D)},
+    {"glTexEnviv", P(GL_TexEnviv)},
+    {"glUniform1d", P(GL_Uniform1d)},
+    {"glGetSamplerParameterIivRobustANGLE", P(GL_GetSamplerParameterIivRobustANGLE)},
+    {"glAlphaFunc", P(GL_AlphaFunc)},
+    {"wglSetPixelFormat", P(wglSetPixelFormat)},
+    {"glFramebufferTextureMultiviewOVR", P(GL_FramebufferTextureMultiviewOVR)},
+    {"glRasterPos4dv", P(GL_RasterPos4dv)},
+    {"glBindTextureUnit", P(GL_BindTextureUnit)},
+    {"glDrawTransformFeedbackStream", P(GL_DrawTransformFeedbackStream)},
+    {"glBindTextures", P(GL_BindTextures)},
+    {"glGetVertexArrayIndexed64iv", P(GL_GetVertexArrayIndexed64iv)},
+    {"glGetTexEnviv", P(GL_GetTexEnviv)},
+    {"glProgramUniformMatrix2x3fvEXT", P(GL_ProgramUniformMatrix2x3fvEXT)},
+    {"glMultiTexCoordP4ui", P(GL_MultiTexCoordP4ui)},
     {"glPopGroupMarkerEXT", P(GL_PopGroupMarkerEXT)},
-    {"glPopMatrix", P(GL_PopMatrix)},
-    {"glPopName", P(GL_PopName)},
-    {"glPrimitiveBoundingBox", P(GL_PrimitiveBoundingBox)},
-    {"glPrimitiveBoundingBoxEXT", P(GL_PrimitiveBoundingBoxEXT)},
-    {"glPrimitiveBoundingBoxOES", P(GL_PrimitiveBoundingBoxOES)},
-    {"glPrimitiveRestartIndex", P(GL_PrimitiveRestartIndex)},
-    {"glPrioritizeTextures", P(GL_PrioritizeTextures)},
-    {"glProgramBinary", P(GL_ProgramBinary)},
-    {"glProgramBinaryOES", P(GL_ProgramBinaryOES)},
-    {"glProgramParameteri", P(GL_ProgramParameteri)},
-    {"glProgramParameteriEXT", P(GL_ProgramParameteriEXT)},
-    {"glProgramUniform1d", P(GL_ProgramUniform1d)},
-    {"glProgramUniform1dv", P(GL_ProgramUniform1dv)},
-    {"glProgramUniform1f", P(GL_ProgramUniform1f)},
-    {"glProgramUniform1fEXT", P(GL_ProgramUniform1fEXT)},
-    {"glProgramUniform1fv", P(GL_ProgramUniform1fv)},
-    {"glProgramUniform1fvEXT", P(GL_ProgramUniform1fvEXT)},
-    {"glProgramUniform1i", P(GL_ProgramUniform1i)},
+    {"glClearColorx", P(GL_ClearColorx)},
+    {"glIndexf", P(GL_Indexf)},
+    {"glTexStorageMemFlags2DANGLE", P(GL_TexStorageMemFlags2DANGLE)},
+    {"glRasterPos3s", P(GL_RasterPos3s)},
+    {"glIsTransformFeedback", P(GL_IsTransformFeedback)},
+    {"glDisable", P(GL_Disable)},
+    {"glObjectLabelKHR", P(GL_ObjectLabelKHR)},
+    {"glUniform3fv", P(GL_Uniform3fv)},
+    {"glUniform3ui", P(GL_Uniform3ui)},
+    {"glVertexAttribI4ui", P(GL_VertexAttribI4ui)},
+    {"glGetVertexAttribIivRobustANGLE", P(GL_GetVertexAttribIivRobustANGLE)},
+    {"glScissorIndexed", P(GL_ScissorIndexed)},
+    {"glMultiTexCoord3iv", P(GL_MultiTexCoord3iv)},
+    {"glUniformMatrix3x4dv", P(GL_UniformMatrix3x4dv)},
+    {"glGetPerfMonitorCounterStringAMD", P(GL_GetPerfMonitorCounterStringAMD)},
+    {"glSecondaryColor3iv", P(GL_SecondaryColor3iv)},
+    {"glFenceSync", P(GL_FenceSync)},
+    {"glIsProgramPipeline", P(GL_IsProgramPipeline)},
+    {"glDebugMessageInsert", P(GL_DebugMessageInsert)},
+    {"wglUseFontOutlinesA", P(wglUseFontOutlinesA)},
+    {"wglCreateContext", P(wglCreateContext)},
+    {"wglGetCurrentDC", P(wglGetCurrentDC)},
+    {"glMapBuffer", P(GL_MapBuffer)},
+    {"glGetTranslatedShaderSourceANGLE", P(GL_GetTranslatedShaderSourceANGLE)},
+    {"glTexCoord3i", P(GL_TexCoord3i)},
+    {"glTextureStorage2D", P(GL_TextureStorage2D)},
+    {"glTexImage2DExternalANGLE", P(GL_TexImage2DExternalANGLE)},
+    {"glGetSamplerParameterIivEXT", P(GL_GetSamplerParameterIivEXT)},
+    {"glDetachShader", P(GL_DetachShader)},
+    {"wglCopyContext", P(wglCopyContext)},
+    {"glVertexArrayAttribFormat", P(GL_VertexArrayAttribFormat)},
+    {"glGetRenderbufferParameterivOES", P(GL_GetRenderbufferParameterivOES)},
+    {"glInterleavedArrays", P(GL_InterleavedArrays)},
+    {"glGetProgramResourceLocationIndex", P(GL_GetProgramResourceLocationIndex)},
+    {"glEGLImageTargetRenderbufferStorageOES", P(GL_EGLImageTargetRenderbufferStorageOES)},
+    {"glDispatchCompute", P(GL_DispatchCompute)},
+    {"glProgramUniform4fv", P(GL_ProgramUniform4fv)},
+    {"glGetAttribLocation", P(GL_GetAttribLocation)},
+    {"glBlendFuncSeparatei", P(GL_BlendFuncSeparatei)},
+    {"glColorMask", P(GL_ColorMask)},
+    {"glGenVertexArrays", P(GL_GenVertexArrays)},
+    {"glBeginQuery", P(GL_BeginQuery)},
+    {"glProgramUniform4iEXT", P(GL_ProgramUniform4iEXT)},
+    {"glVertex2dv", P(GL_Vertex2dv)},
+    {"glGetProgramResourceIndex", P(GL_GetProgramResourceIndex)},
+    {"glGetActiveAtomicCounterBufferiv", P(GL_GetActiveAtomicCounterBufferiv)},
+    {"glCreateBuffers", P(GL_CreateBuffers)},
+    {"glDeleteProgramPipelines", P(GL_DeleteProgramPipelines)},
+    {"glNormal3i", P(GL_Normal3i)},
+    {"glSamplerParameterfv", P(GL_SamplerParameterfv)},
     {"glProgramUniform1iEXT", P(GL_ProgramUniform1iEXT)},
-    {"glProgramUniform1iv", P(GL_ProgramUniform1iv)},
-    {"glProgramUniform1ivEXT", P(GL_ProgramUniform1ivEXT)},
+    {"glGetnUniformuivRobustANGLE", P(GL_GetnUniformuivRobustANGLE)},
+    {"glDrawRangeElementsBaseVertexEXT", P(GL_DrawRangeElementsBaseVertexEXT)},
+    {"glTexCoordP4ui", P(GL_TexCoordP4ui)},
+    {"glMemoryBarrier", P(GL_MemoryBarrier)},
+    {"glTextureStorage3D", P(GL_TextureStorage3D)},
+    {"glVertex4f", P(GL_Vertex4f)},
+    {"glDepthRange", P(GL_DepthRange)},
+    {"glVertexAttribFormat", P(GL_VertexAttribFormat)},
+    {"glNormal3dv", P(GL_Normal3dv)},
+    {"glProgramUniformMatrix2fv", P(GL_ProgramUniformMatrix2fv)},
+    {"glPointSizex", P(GL_PointSizex)},
+    {"glVertex2iv", P(GL_Vertex2iv)},
+    {"glVertexAttribI1iv", P(GL_VertexAttribI1iv)},
+    {"glVertexAttribBinding", P(GL_VertexAttribBinding)},
+    {"glTranslatex", P(GL_Translatex)},
+    {"glSecondaryColor3ui", P(GL_SecondaryColor3ui)},
+    {"glTexStorage3D", P(GL_TexStorage3D)},
+    {"glNamedRenderbufferStorage", P(GL_NamedRenderbufferStorage)},
+    {"glGetIntegeri_v", P(GL_GetIntegeri_v)},
+    {"glNormal3iv", P(GL_Normal3iv)},
+    {"glSampleCoveragex", P(GL_SampleCoveragex)},
+    {"glFogi", P(GL_Fogi)},
+    {"glBlitFramebuffer", P(GL_BlitFramebuffer)},
+    {"glWindowPos2d", P(GL_WindowPos2d)},
+    {"glDiscardFramebufferEXT", P(GL_DiscardFramebufferEXT)},
+    {"glMultiDrawElementsBaseVertexEXT", P(GL_MultiDrawElementsBaseVertexEXT)},
+    {"glNamedBufferStorage", P(GL_NamedBufferStorage)},
+    {"glFramebufferFoveationConfigQCOM", P(GL_FramebufferFoveationConfigQCOM)},
+    {"glGetMultisamplefv", P(GL_GetMultisamplefv)},
+    {"glMapBufferRangeEXT", P(GL_MapBufferRangeEXT)},
+    {"glVertexAttrib3d", P(GL_VertexAttrib3d)},
+    {"glEvalMesh2", P(GL_EvalMesh2)},
+    {"glRasterPos4s", P(GL_RasterPos4s)},
+    {"glBindVertexArrayOES", P(GL_BindVertexArrayOES)},
+    {"glSampleMaski", P(GL_SampleMaski)},
+    {"glColor4usv", P(GL_Color4usv)},
+    {"glGetUniformBlockIndex", P(GL_GetUniformBlockIndex)},
+    {"glTexImage3DRobustANGLE", P(GL_TexImage3DRobustANGLE)},
+    {"glReadnPixels", P(GL_ReadnPixels)},
+    {"glGetCompressedTextureSubImage", P(GL_GetCompressedTextureSubImage)},
+    {"glVertexAttribI1i", P(GL_VertexAttribI1i)},
+    {"glGetActiveSubroutineUniformName", P(GL_GetActiveSubroutineUniformName)},
+    {"glTexSubImage3D", P(GL_TexSubImage3D)},
+    {"glUniform3dv", P(GL_Uniform3dv)},
+    {"glFramebufferTexture", P(GL_FramebufferTexture)},
+    {"glTexCoordP2ui", P(GL_TexCoordP2ui)},
+    {"glFlushMappedNamedBufferRange", P(GL_FlushMappedNamedBufferRange)},
+    {"glDeleteQueriesEXT", P(GL_DeleteQueriesEXT)},
+    {"glTextureStorage3DMultisample", P(GL_TextureStorage3DMultisample)},
+    {"glEnd", P(GL_End)},
+    {"glTexCoord2d", P(GL_TexCoord2d)},
+    {"glNormal3b", P(GL_Normal3b)},
+    {"glGetLightfv", P(GL_GetLightfv)},
+    {"glClearTexImageEXT", P(GL_ClearTexImageEXT)},
+    {"glNamedFramebufferTextureLayer", P(GL_NamedFramebufferTextureLayer)},
+    {"glDrawElementsInstancedBaseInstanceEXT", P(GL_DrawElementsInstancedBaseInstanceEXT)},
+    {"glFeedbackBuffer", P(GL_FeedbackBuffer)},
+    {"glGetUniformuiv", P(GL_GetUniformuiv)},
+    {"glGetTexLevelParameteriv", P(GL_GetTexLevelParameteriv)},
+    {"glTexGenfvOES", P(GL_TexGenfvOES)},
+    {"glEnableClientState", P(GL_EnableClientState)},
     {"glProgramUniform1ui", P(GL_ProgramUniform1ui)},
-    {"glProgramUniform1uiEXT", P(GL_ProgramUniform1uiEXT)},
+    {"glRectf", P(GL_Rectf)},
+    {"glFogCoordf", P(GL_FogCoordf)},
+    {"glGetQueryObjectui64vEXT", P(GL_GetQueryObjectui64vEXT)},
+    {"glEvalCoord1f", P(GL_EvalCoord1f)},
+    {"glMultiTexCoord2f", P(GL_MultiTexCoord2f)},
+    {"glTransformFeedbackBufferBase", P(GL_TransformFeedbackBufferBase)},
+    {"glGetProgramStageiv", P(GL_GetProgramStageiv)},
+    {"glGetProgramResourceiv", P(GL_GetProgramResourceiv)},
+    {"glUniform1ui", P(GL_Uniform1ui)},
+    {"glIsProgramPipelineEXT", P(GL_IsProgramPipelineEXT)},
+    {"glMultiDrawElementsInstancedANGLE", P(GL_MultiDrawElementsInstancedANGLE)},
+    {"glGetBooleani_v", P(GL_GetBooleani_v)},
+    {"glMultiTexCoordP4uiv", P(GL_MultiTexCoordP4uiv)},
+    {"glEvalCoord1dv", P(GL_EvalCoord1dv)},
+    {"glGetnMapfv", P(GL_GetnMapfv)},
+    {"glBufferSubData", P(GL_BufferSubData)},
+    {"glShaderBinary", P(GL_ShaderBinary)},
     {"glProgramUniform1uiv", P(GL_ProgramUniform1uiv)},
-    {"glProgramUniform1uivEXT", P(GL_ProgramUniform1uivEXT)},
-    {"glProgramUniform2d", P(GL_ProgramUniform2d)},
-    {"glProgramUniform2dv", P(GL_ProgramUniform2dv)},
-    {"glProgramUniform2f", P(GL_ProgramUniform2f)},
-    {"glProgramUniform2fEXT", P(GL_ProgramUniform2fEXT)},
-    {"glProgramUniform2fv", P(GL_ProgramUniform2fv)},
-    {"glProgramUniform2fvEXT", P(GL_ProgramUniform2fvEXT)},
-    {"glProgramUniform2i", P(GL_ProgramUniform2i)},
-    {"glProgramUniform2iEXT", P(GL_ProgramUniform2iEXT)},
-    {"glProgramUniform2iv", P(GL_ProgramUniform2iv)},
-    {"glProgramUniform2ivEXT", P(GL_ProgramUniform2ivEXT)},
     {"glProgramUniform2ui", P(GL_ProgramUniform2ui)},
-    {"glProgramUniform2uiEXT", P(GL_ProgramUniform2uiEXT)},
-    {"glProgramUniform2uiv", P(GL_ProgramUniform2uiv)},
-    {"glProgramUniform2uivEXT", P(GL_ProgramUniform2uivEXT)},
-    {"glProgramUniform3d", P(GL_ProgramUniform3d)},
-    {"glProgramUniform3dv", P(GL_ProgramUniform3dv)},
-    {"glProgramUniform3f", P(GL_ProgramUniform3f)},
-    {"glProgramUniform3fEXT", P(GL_ProgramUniform3fEXT)},
-    {"glProgramUniform3fv", P(GL_ProgramUniform3fv)},
-    {"glProgramUniform3fvEXT", P(GL_ProgramUniform3fvEXT)},
-    {"glProgramUniform3i", P(GL_ProgramUniform3i)},
-    {"glProgramUniform3iEXT", P(GL_ProgramUniform3iEXT)},
-    {"glProgramUniform3iv", P(GL_ProgramUniform3iv)},
-    {"glProgramUniform3ivEXT", P(GL_ProgramUniform3ivEXT)},
-    {"glProgramUniform3ui", P(GL_ProgramUniform3ui)},
-    {"glProgramUniform3uiEXT", P(GL_ProgramUniform3uiEXT)},
-    {"glProgramUniform3uiv", P(GL_ProgramUniform3uiv)},
-    {"glProgramUniform3uivEXT", P(GL_ProgramUniform3uivEXT)},
-    {"glProgramUniform4d", P(GL_ProgramUniform4d)},
-    {"glProgramUniform4dv", P(GL_ProgramUniform4dv)},
-    {"glProgramUniform4f", P(GL_ProgramUniform4f)},
-    {"glProgramUniform4fEXT", P(GL_ProgramUniform4fEXT)},
-    {"glProgramUniform4fv", P(GL_ProgramUniform4fv)},
-    {"glProgramUniform4fvEXT", P(GL_ProgramUniform4fvEXT)},
-    {"glProgramUniform4i", P(GL_ProgramUniform4i)},
-    {"glProgramUniform4iEXT", P(GL_ProgramUniform4iEXT)},
-    {"glProgramUniform4iv", P(GL_ProgramUniform4iv)},
-    {"glProgramUniform4ivEXT", P(GL_ProgramUniform4ivEXT)},
-    {"glProgramUniform4ui", P(GL_ProgramUniform4ui)},
-    {"glProgramUniform4uiEXT", P(GL_ProgramUniform4uiEXT)},
-    {"glProgramUniform4uiv", P(GL_ProgramUniform4uiv)},
-    {"glProgramUniform4uivEXT", P(GL_ProgramUniform4uivEXT)},
-    {"glProgramUniformMatrix2dv", P(GL_ProgramUniformMatrix2dv)},
-    {"glProgramUniformMatrix2fv", P(GL_ProgramUniformMatrix2fv)},
-    {"glProgramUniformMatrix2fvEXT", P(GL_ProgramUniformMatrix2fvEXT)},
-    {"glProgramUniformMatrix2x3dv", P(GL_ProgramUniformMatrix2x3dv)},
-    {"glProgramUniformMatrix2x3fv", P(GL_ProgramUniformMatrix2x3fv)},
-    {"glProgramUniformMatrix2x3fvEXT", P(GL_ProgramUniformMatrix2x3fvEXT)},
-    {"glProgramUniformMatrix2x4dv", P(GL_ProgramUniformMatrix2x4dv)},
-    {"glProgramUniformMatrix2x4fv", P(GL_ProgramUniformMatrix2x4fv)},
-    {"glProgramUniformMatrix2x4fvEXT", P(GL_ProgramUniformMatrix2x4fvEXT)},
-    {"glProgramUniformMatrix3dv", P(GL_ProgramUniformMatrix3dv)},
-    {"glProgramUniformMatrix3fv", P(GL_ProgramUniformMatrix3fv)},
-    {"glProgramUniformMatrix3fvEXT", P(GL_ProgramUniformMatrix3fvEXT)},
-    {"glProgramUniformMatrix3x2dv", P(GL_ProgramUniformMatrix3x2dv)},
-    {"glProgramUniformMatrix3x2fv", P(GL_ProgramUniformMatrix3x2fv)},
-    {"glProgramUniformMatrix3x2fvEXT", P(GL_ProgramUniformMatrix3x2fvEXT)},
-    {"glProgramUniformMatrix3x4dv", P(GL_ProgramUniformMatrix3x4dv)},
-    {"glProgramUniformMatrix3x4fv", P(GL_ProgramUniformMatrix3x4fv)},
-    {"glProgramUniformMatrix3x4fvEXT", P(GL_ProgramUniformMatrix3x4fvEXT)},
-    {"glProgramUniformMatrix4dv", P(GL_ProgramUniformMatrix4dv)},
-    {"glProgramUniformMatrix4fv", P(GL_ProgramUniformMatrix4fv)},
-    {"glProgramUniformMatrix4fvEXT", P(GL_ProgramUniformMatrix4fvEXT)},
+    {"glGetGraphicsResetStatusEXT", P(GL_GetGraphicsResetStatusEXT)},
+    {"glTexCoord1dv", P(GL_TexCoord1dv)},
+    {"glUniform1fv", P(GL_Uniform1fv)},
+    {"glTexCoord4iv", P(GL_TexCoord4iv)},
+    {"glBindBufferBase", P(GL_BindBufferBase)},
+    {"glNamedBufferStorageExternalEXT", P(GL_NamedBufferStorageExternalEXT)},
+    {"glVertexAttribL1d", P(GL_VertexAttribL1d)},
+    {"glLineWidth", P(GL_LineWidth)},
+    {"glDrawElementsInstancedBaseInstance", P(GL_DrawElementsInstancedBaseInstance)},
+    {"glGetFragDataIndexEXT", P(GL_GetFragDataIndexEXT)},
+    {"glCopyTexImage1D", P(GL_CopyTexImage1D)},
     {"glProgramUniformMatrix4x2dv", P(GL_ProgramUniformMatrix4x2dv)},
-    {"glProgramUniformMatrix4x2fv", P(GL_ProgramUniformMatrix4x2fv)},
-    {"glProgramUniformMatrix4x2fvEXT", P(GL_ProgramUniformMatrix4x2fvEXT)},
-    {"glProgramUniformMatrix4x3dv", P(GL_ProgramUniformMatrix4x3dv)},
-    {"glProgramUniformMatrix4x3fv", P(GL_ProgramUniformMatrix4x3fv)},
-    {"glProgramUniformMatrix4x3fvEXT", P(GL_ProgramUniformMatrix4x3fvEXT)},
-    {"glProvokingVertex", P(GL_ProvokingVertex)},
-    {"glProvokingVertexANGLE", P(GL_ProvokingVertexANGLE)},
-    {"glPushAttrib", P(GL_PushAttrib)},
-    {"glPushClientAttrib", P(GL_PushClientAttrib)},
-    {"glPushDebugGroup", P(GL_PushDebugGroup)},
-    {"glPushDebugGroupKHR", P(GL_PushDebugGroupKHR)},
-    {"glPushGroupMarkerEXT", P(GL_PushGroupMarkerEXT)},
-    {"glPushMatrix", P(GL_PushMatrix)},
-    {"glPushName", P(GL_PushName)},
-    {"glQueryCounter", P(GL_QueryCounter)},
-    {"glQueryCounterEXT", P(GL_QueryCounterEXT)},
-    {"glQueryMatrixxOES", P(GL_QueryMatrixxOES)},
-    {"glRasterPos2d", P(GL_RasterPos2d)},
-    {"glRasterPos2dv", P(GL_RasterPos2dv)},
+    {"glNormalP3ui", P(GL_NormalP3ui)},
     {"glRasterPos2f", P(GL_RasterPos2f)},
-    {"glRasterPos2fv", P(GL_RasterPos2fv)},
-    {"glRasterPos2i", P(GL_RasterPos2i)},
-    {"glRasterPos2iv", P(GL_RasterPos2iv)},
-    {"glRasterPos2s", P(GL_RasterPos2s)},
-    {"glRasterPos2sv", P(GL_RasterPos2sv)},
-    {"glRasterPos3d", P(GL_RasterPos3d)},
-    {"glRasterPos3dv", P(GL_RasterPos3dv)},
-    {"glRasterPos3f", P(GL_RasterPos3f)},
-    {"glRasterPos3fv", P(GL_RasterPos3fv)},
-    {"glRasterPos3i", P(GL_RasterPos3i)},
-    {"glRasterPos3iv", P(GL_RasterPos3iv)},
-    {"glRasterPos3s", P(GL_RasterPos3s)},
-    {"glRasterPos3sv", P(GL_RasterPos3sv)},
-    {"glRasterPos4d", P(GL_RasterPos4d)},
-    {"glRasterPos4dv", P(GL_RasterPos4dv)},
-    {"glRasterPos4f", P(GL_RasterPos4f)},
-    {"glRasterPos4fv", P(GL_RasterPos4fv)},
-    {"glRasterPos4i", P(GL_RasterPos4i)},
-    {"glRasterPos4iv", P(GL_RasterPos4iv)},
-    {"glRasterPos4s", P(GL_RasterPos4s)},
-    {"glRasterPos4sv", P(GL_RasterPos4sv)},
-    {"glReadBuffer", P(GL_ReadBuffer)},
-    {"glReadPixels", P(GL_ReadPixels)},
-    {"glReadPixelsRobustANGLE", P(GL_ReadPixelsRobustANGLE)},
-    {"glReadnPixels", P(GL_ReadnPixels)},
-    {"glReadnPixelsEXT", P(GL_ReadnPixelsEXT)},
-    {"glReadnPixelsKHR", P(GL_ReadnPixelsKHR)},
-    {"glReadnPixelsRobustANGLE", P(GL_ReadnPixelsRobustANGLE)},
-    {"glRectd", P(GL_Rectd)},
-    {"glRectdv", P(GL_Rectdv)},
-    {"glRectf", P(GL_Rectf)},
-    {"glRectfv", P(GL_Rectfv)},
-    {"glRecti", P(GL_Recti)},
-    {"glRectiv", P(GL_Rectiv)},
-    {"glRects", P(GL_Rects)},
-    {"glRectsv", P(GL_Rectsv)},
-    {"glReleaseShaderCompiler", P(GL_ReleaseShaderCompiler)},
-    {"glReleaseTexturesANGLE", P(GL_ReleaseTexturesANGLE)},
-    {"glRenderMode", P(GL_RenderMode)},
-    {"glRenderbufferStorage", P(GL_RenderbufferStorage)},
-    {"glRenderbufferStorageMultisample", P(GL_RenderbufferStorageMultisample)},
-    {"glRenderbufferStorageMultisampleANGLE", P(GL_RenderbufferStorageMultisampleANGLE)},
-    {"glRenderbufferStorageMultisampleEXT", P(GL_RenderbufferStorageMultisampleEXT)},
-    {"glRenderbufferStorageOES", P(GL_RenderbufferStorageOES)},
-    {"glRequestExtensionANGLE", P(GL_RequestExtensionANGLE)},
-    {"glResumeTransformFeedback", P(GL_ResumeTransformFeedback)},
-    {"glRotated", P(GL_Rotated)},
-    {"glRotatef", P(GL_Rotatef)},
-    {"glRotatex", P(GL_Rotatex)},
-    {"glSampleCoverage", P(GL_SampleCoverage)},
-    {"glSampleCoveragex", P(GL_SampleCoveragex)},
-    {"glSampleMaski", P(GL_SampleMaski)},
-    {"glSampleMaskiANGLE", P(GL_SampleMaskiANGLE)},
-    {"glSamplerParameterIiv", P(GL_SamplerParameterIiv)},
-    {"glSamplerParameterIivEXT", P(GL_SamplerParameterIivEXT)},
-    {"glSamplerParameterIivOES", P(GL_SamplerParameterIivOES)},
-    {"glSamplerParameterIivRobustANGLE", P(GL_SamplerParameterIivRobustANGLE)},
-    {"glSamplerParameterIuiv", P(GL_SamplerParameterIuiv)},
-    {"glSamplerParameterIuivEXT", P(GL_SamplerParameterIuivEXT)},
-    {"glSamplerParameterIuivOES", P(GL_SamplerParameterIuivOES)},
-    {"glSamplerParameterIuivRobustANGLE", P(GL_SamplerParameterIuivRobustANGLE)},
+    {"glTextureParameterfv", P(GL_TextureParameterfv)},
+    {"glClearNamedFramebufferuiv", P(GL_ClearNamedFramebufferuiv)},
+    {"glMultiDrawArraysIndirectEXT", P(GL_MultiDrawArraysIndirectEXT)},
+    {"glPolygonOffset", P(GL_PolygonOffset)},
+    {"wglDescribePixelFormat", P(wglDescribePixelFormat)},
+    {"glMultiDrawArraysANGLE", P(GL_MultiDrawArraysANGLE)},
+    {"glTexCoord3iv", P(GL_TexCoord3iv)},
+    {"glDrawTexxOES", P(GL_DrawTexxOES)},
+    {"glGetBufferParameterivRobustANGLE", P(GL_GetBufferParameterivRobustANGLE)},
+    {"glDebugMessageCallback", P(GL_DebugMessageCallback)},
+    {"glColor4dv", P(GL_Color4dv)},
     {"glSamplerParameterf", P(GL_SamplerParameterf)},
-    {"glSamplerParameterfv", P(GL_SamplerParameterfv)},
-    {"glSamplerParameterfvRobustANGLE", P(GL_SamplerParameterfvRobustANGLE)},
-    {"glSamplerParameteri", P(GL_SamplerParameteri)},
-    {"glSamplerParameteriv", P(GL_SamplerParameteriv)},
-    {"glSamplerParameterivRobustANGLE", P(GL_SamplerParameterivRobustANGLE)},
-    {"glScaled", P(GL_Scaled)},
-    {"glScalef", P(GL_Scalef)},
-    {"glScalex", P(GL_Scalex)},
-    {"glScissor", P(GL_Scissor)},
-    {"glScissorArrayv", P(GL_ScissorArrayv)},
-    {"glScissorIndexed", P(GL_ScissorIndexed)},
+    {"glDrawElementsInstancedBaseVertex", P(GL_DrawElementsInstancedBaseVertex)},
+    {"glPointSizePointerOES", P(GL_PointSizePointerOES)},
+    {"glDrawArraysInstancedEXT", P(GL_DrawArraysInstancedEXT)},
+    {"glEvalCoord1d", P(GL_EvalCoord1d)},
+    {"glGetnUniformfvRobustANGLE", P(GL_GetnUniformfvRobustANGLE)},
+    {"glGetBooleanvRobustANGLE", P(GL_GetBooleanvRobustANGLE)},
+    {"glTexGendv", P(GL_TexGendv)},
+    {"glSecondaryColor3sv", P(GL_SecondaryColor3sv)},
+    {"glGetInternalformati64v", P(GL_GetInternalformati64v)},
+    {"glGenLists", P(GL_GenLists)},
+    {"glMultiTexCoord4s", P(GL_MultiTexCoord4s)},
+    {"glMultiTexCoord3i", P(GL_MultiTexCoord3i)},
+    {"glFramebufferParameteriMESA", P(GL_FramebufferParameteriMESA)},
+    {"glMultiTexCoord4dv", P(GL_MultiTexCoord4dv)},
+    {"glBlendFunciEXT", P(GL_BlendFunciEXT)},
+    {"glDrawElementsInstancedANGLE", P(GL_DrawElementsInstancedANGLE)},
+    {"glGetTexLevelParameterfv", P(GL_GetTexLevelParameterfv)},
+    {"glClearTexSubImage", P(GL_ClearTexSubImage)},
+    {"glProgramUniform1fv", P(GL_ProgramUniform1fv)},
+    {"glCreateSamplers", P(GL_CreateSamplers)},
+    {"glDrawBuffers", P(GL_DrawBuffers)},
+    {"glWindowPos3fv", P(GL_WindowPos3fv)},
+    {"glProgramUniform2f", P(GL_ProgramUniform2f)},
+    {"glClearNamedFramebufferfi", P(GL_ClearNamedFramebufferfi)},
+    {"glLightModelxv", P(GL_LightModelxv)},
+    {"glMultiTexCoord4iv", P(GL_MultiTexCoord4iv)},
+    {"glGetQueryIndexediv", P(GL_GetQueryIndexediv)},
+    {"glDispatchComputeIndirect", P(GL_DispatchComputeIndirect)},
+    {"glWindowPos2dv", P(GL_WindowPos2dv)},
+    {"glQueryCounterEXT", P(GL_QueryCounterEXT)},
+    {"glColorPointer", P(GL_ColorPointer)},
+    {"glVertexAttribP3uiv", P(GL_VertexAttribP3uiv)},
+    {"glLightiv", P(GL_Lightiv)},
+    {"glObjectLabel", P(GL_ObjectLabel)},
+    {"glTexStorage1DEXT", P(GL_TexStorage1DEXT)},
+    {"glReleaseTexturesANGLE", P(GL_ReleaseTexturesANGLE)},
+    {"glLightxv", P(GL_Lightxv)},
+    {"glColor4b", P(GL_Color4b)},
+    {"glBindTransformFeedback", P(GL_BindTransformFeedback)},
+    {"glColor3sv", P(GL_Color3sv)},
+    {"glFogx", P(GL_Fogx)},
+    {"glClearBufferfi", P(GL_ClearBufferfi)},
+    {"glProgramUniform2d", P(GL_ProgramUniform2d)},
+    {"glGetFloati_v", P(GL_GetFloati_v)},
+    {"glTextureParameterf", P(GL_TextureParameterf)},
+    {"glUniformMatrix4x2dv", P(GL_UniformMatrix4x2dv)},
+    {"glGetVertexAttribfv", P(GL_GetVertexAttribfv)},
+    {"glMultiTexCoord3d", P(GL_MultiTexCoord3d)},
+    {"glPushMatrix", P(GL_PushMatrix)},
     {"glScissorIndexedv", P(GL_ScissorIndexedv)},
-    {"glSecondaryColor3b", P(GL_SecondaryColor3b)},
-    {"glSecondaryColor3bv", P(GL_SecondaryColor3bv)},
-    {"glSecondaryColor3d", P(GL_SecondaryColor3d)},
-    {"glSecondaryColor3dv", P(GL_SecondaryColor3dv)},
-    {"glSecondaryColor3f", P(GL_SecondaryColor3f)},
-    {"glSecondaryColor3fv", P(GL_SecondaryColor3fv)},
-    {"glSecondaryColor3i", P(GL_SecondaryColor3i)},
-    {"glSecondaryColor3iv", P(GL_SecondaryColor3iv)},
-    {"glSecondaryColor3s", P(GL_SecondaryColor3s)},
-    {"glSecondaryColor3sv", P(GL_SecondaryColor3sv)},
-    {"glSecondaryColor3ub", P(GL_SecondaryColor3ub)},
-    {"glSecondaryColor3ubv", P(GL_SecondaryColor3ubv)},
-    {"glSecondaryColor3ui", P(GL_SecondaryColor3ui)},
-    {"glSecondaryColor3uiv", P(GL_SecondaryColor3uiv)},
+    {"glGetVertexArrayiv", P(GL_GetVertexArrayiv)},
+    {"glClipPlanef", P(GL_ClipPlanef)},
+    {"glMaterialxv", P(GL_Materialxv)},
+    {"glVertexAttribL1dv", P(GL_VertexAttribL1dv)},
+    {"glPointSize", P(GL_PointSize)},
     {"glSecondaryColor3us", P(GL_SecondaryColor3us)},
-    {"glSecondaryColor3usv", P(GL_SecondaryColor3usv)},
-    {"glSecondaryColorP3ui", P(GL_SecondaryColorP3ui)},
-    {"glSecondaryColorP3uiv", P(GL_SecondaryColorP3uiv)},
-    {"glSecondaryColorPointer", P(GL_SecondaryColorPointer)},
-    {"glSelectBuffer", P(GL_SelectBuffer)},
-    {"glSelectPerfMonitorCountersAMD", P(GL_SelectPerfMonitorCountersAMD)},
-    {"glSemaphoreParameterui64vEXT", P(GL_SemaphoreParameterui64vEXT)},
-    {"glSetFenceNV", P(GL_SetFenceNV)},
-    {"glShadeModel", P(GL_ShadeModel)},
-    {"glShaderBinary", P(GL_ShaderBinary)},
-    {"glShaderSource", P(GL_ShaderSource)},
-    {"glShaderStorageBlockBinding", P(GL_ShaderStorageBlockBinding)},
-    {"glShadingRateQCOM", P(GL_ShadingRateQCOM)},
+    {"glBindRenderbuffer", P(GL_BindRenderbuffer)},
+    {"glBindUniformLocationCHROMIUM", P(GL_BindUniformLocationCHROMIUM)},
+    {"glValidateProgramPipeline", P(GL_ValidateProgramPipeline)},
+    {"glGetTexGenxvOES", P(GL_GetTexGenxvOES)},
+    {"glGetRenderbufferParameterivRobustANGLE", P(GL_GetRenderbufferParameterivRobustANGLE)},
+    {"glColor3b", P(GL_Color3b)},
+    {"glGetnUniformivKHR", P(GL_GetnUniformivKHR)},
+    {"glCompressedTexSubImage2DRobustANGLE", P(GL_CompressedTexSubImage2DRobustANGLE)},
+    {"glTexCoord2s", P(GL_TexCoord2s)},
+    {"glCallLists", P(GL_CallLists)},
+    {"glGetRenderbufferImageANGLE", P(GL_GetRenderbufferImageANGLE)},
+    {"glGenerateTextureMipmap", P(GL_GenerateTextureMipmap)},
+    {"glMapGrid1d", P(GL_MapGrid1d)},
+    {"glGetRenderbufferParameteriv", P(GL_GetRenderbufferParameteriv)},
+    {"glCompressedTexSubImage1D", P(GL_CompressedTexSubImage1D)},
+    {"glFlush", P(GL_Flush)},
+    {"glGetTexParameterIuiv", P(GL_GetTexParameterIuiv)},
+    {"glClearColor", P(GL_ClearColor)},
+    {"glColorMaski", P(GL_ColorMaski)},
+    {"glTexParameterivRobustANGLE", P(GL_TexParameterivRobustANGLE)},
+    {"glTexStorageMem3DMultisampleEXT", P(GL_TexStorageMem3DMultisampleEXT)},
+    {"glProgramUniform4ivEXT", P(GL_ProgramUniform4ivEXT)},
+    {"glGetVertexAttribfvRobustANGLE", P(GL_GetVertexAttribfvRobustANGLE)},
+    {"glTexGenfOES", P(GL_TexGenfOES)},
+    {"glGetTexParameterIivOES", P(GL_GetTexParameterIivOES)},
+    {"glWindowPos3d", P(GL_WindowPos3d)},
+    {"glDrawTexsvOES", P(GL_DrawTexsvOES)},
+    {"glVertex4d", P(GL_Vertex4d)},
+    {"glGetString", P(GL_GetString)},
+    {"glTexCoord1d", P(GL_TexCoord1d)},
+    {"glColorP4ui", P(GL_ColorP4ui)},
+    {"glDrawTexsOES", P(GL_DrawTexsOES)},
+    {"glLogicOpANGLE", P(GL_LogicOpANGLE)},
+    {"glGetVertexAttribIiv", P(GL_GetVertexAttribIiv)},
+    {"glNamedFramebufferReadBuffer", P(GL_NamedFramebufferReadBuffer)},
+    {"glLightModeliv", P(GL_LightModeliv)},
+    {"glRasterPos3i", P(GL_RasterPos3i)},
+    {"glMultiTexCoord1d", P(GL_MultiTexCoord1d)},
+    {"glProgramUniform4ui", P(GL_ProgramUniform4ui)},
+    {"glVertexAttrib2f", P(GL_VertexAttrib2f)},
+    {"glDebugMessageControl", P(GL_DebugMessageControl)},
+    {"glFogxv", P(GL_Fogxv)},
+    {"glGetMultisamplefvRobustANGLE", P(GL_GetMultisamplefvRobustANGLE)},
+    {"glDepthMask", P(GL_DepthMask)},
+    {"glLoadMatrixd", P(GL_LoadMatrixd)},
+    {"glGetTexGenfvOES", P(GL_GetTexGenfvOES)},
+    {"glTexCoord1fv", P(GL_TexCoord1fv)},
+    {"glVertexAttrib4d", P(GL_VertexAttrib4d)},
+    {"glTexCoord3sv", P(GL_TexCoord3sv)},
+    {"glGetTexParameterIuivOES", P(GL_GetTexParameterIuivOES)},
+    {"glHint", P(GL_Hint)},
+    {"glGetnMapdv", P(GL_GetnMapdv)},
+    {"glColor3uiv", P(GL_Color3uiv)},
+    {"glBindSampler", P(GL_BindSampler)},
+    {"glGetQueryObjectiv", P(GL_GetQueryObjectiv)},
+    {"glProgramUniform3uiEXT", P(GL_ProgramUniform3uiEXT)},
     {"glSignalSemaphoreEXT", P(GL_SignalSemaphoreEXT)},
-    {"glSpecializeShader", P(GL_SpecializeShader)},
-    {"glStartTilingQCOM", P(GL_StartTilingQCOM)},
-    {"glStencilFunc", P(GL_StencilFunc)},
-    {"glStencilFuncSeparate", P(GL_StencilFuncSeparate)},
-    {"glStencilMask", P(GL_StencilMask)},
+    {"glTranslatef", P(GL_Translatef)},
+    {"glUniformMatrix3dv", P(GL_UniformMatrix3dv)},
+    {"glMapBufferRange", P(GL_MapBufferRange)},
+    {"glProgramUniformMatrix3x2dv", P(GL_ProgramUniformMatrix3x2dv)},
+    {"glNormal3d", P(GL_Normal3d)},
+    {"glDeleteFramebuffers", P(GL_DeleteFramebuffers)},
+    {"glDeleteSemaphoresEXT", P(GL_DeleteSemaphoresEXT)},
+    {"glGetUniformSubroutineuiv", P(GL_GetUniformSubroutineuiv)},
+    {"glViewportArrayv", P(GL_ViewportArrayv)},
+    {"glGetnSeparableFilter", P(GL_GetnSeparableFilter)},
+    {"glGenProgramPipelinesEXT", P(GL_GenProgramPipelinesEXT)},
+    {"glGetQueryBufferObjectui64v", P(GL_GetQueryBufferObjectui64v)},
+    {"glCompressedTexSubImage2D", P(GL_CompressedTexSubImage2D)},
+    {"glSecondaryColor3bv", P(GL_SecondaryColor3bv)},
+    {"glPixelMapuiv", P(GL_PixelMapuiv)},
+    {"glUniformMatrix2x3dv", P(GL_UniformMatrix2x3dv)},
+    {"glGetBufferParameteriv", P(GL_GetBufferParameteriv)},
+    {"glUniform3d", P(GL_Uniform3d)},
+    {"glVertex3i", P(GL_Vertex3i)},
+    {"glSamplerParameterivRobustANGLE", P(GL_SamplerParameterivRobustANGLE)},
+    {"glGetUnsignedBytei_vEXT", P(GL_GetUnsignedBytei_vEXT)},
+    {"glTextureSubImage1D", P(GL_TextureSubImage1D)},
+    {"glFramebufferTexture2D", P(GL_FramebufferTexture2D)},
+    {"glGetPixelMapfv", P(GL_GetPixelMapfv)},
+    {"glVertexAttribI4ubv", P(GL_VertexAttribI4ubv)},
+    {"glMultiTexCoord3f", P(GL_MultiTexCoord3f)},
+    {"glNormalP3uiv", P(GL_NormalP3uiv)},
+    {"glGetTransformFeedbackiv", P(GL_GetTransformFeedbackiv)},
+    {"glPrimitiveBoundingBoxEXT", P(GL_PrimitiveBoundingBoxEXT)},
+    {"glGenProgramPipelines", P(GL_GenProgramPipelines)},
+    {"glTexGenxvOES", P(GL_TexGenxvOES)},
+    {"glGetTexParameterIuivEXT", P(GL_GetTexParameterIuivEXT)},
+    {"glGetQueryObjectuivEXT", P(GL_GetQueryObjectuivEXT)},
+    {"glIsVertexArray", P(GL_IsVertexArray)},
+    {"glTexGenxOES", P(GL_TexGenxOES)},
+    {"glWindowPos3dv", P(GL_WindowPos3dv)},
+    {"glCopyTextureSubImage1D", P(GL_CopyTextureSubImage1D)},
+    {"glCopyTexSubImage3D", P(GL_CopyTexSubImage3D)},
+    {"glBlendEquationSeparateiOES", P(GL_BlendEquationSeparateiOES)},
+    {"glMaterialx", P(GL_Materialx)},
+    {"glReadBuffer", P(GL_ReadBuffer)},
+    {"glGetMaterialiv", P(GL_GetMaterialiv)},
+    {"glGetPointerv", P(GL_GetPointerv)},
     {"glStencilMaskSeparate", P(GL_StencilMaskSeparate)},
-    {"glStencilOp", P(GL_StencilOp)},
-    {"glStencilOpSeparate", P(GL_StencilOpSeparate)},
-    {"glTestFenceNV", P(GL_TestFenceNV)},
-    {"glTexBuffer", P(GL_TexBuffer)},
+    {"glVertexAttrib4Nuiv", P(GL_VertexAttrib4Nuiv)},
+    {"glNormalPointer", P(GL_NormalPointer)},
+    {"glGetFramebufferPixelLocalStorageParameterivRobustANGLE", P(GL_GetFramebufferPixelLocalStorageParameterivRobustANGLE)},
+    {"glPolygonModeNV", P(GL_PolygonModeNV)},
+    {"glColor4i", P(GL_Color4i)},
+    {"glDrawTexxvOES", P(GL_DrawTexxvOES)},
+    {"glLabelObjectEXT", P(GL_LabelObjectEXT)},
+    {"glTextureBufferRange", P(GL_TextureBufferRange)},
+    {"glBlendEquationSeparate", P(GL_BlendEquationSeparate)},
+    {"glGetTextureImage", P(GL_GetTextureImage)},
+    {"glVertexAttrib2fv", P(GL_VertexAttrib2fv)},
+    {"glGenRenderbuffersOES", P(GL_GenRenderbuffersOES)},
+    {"glBindProgramPipelineEXT", P(GL_BindProgramPipelineEXT)},
+    {"glGetNamedBufferPointerv", P(GL_GetNamedBufferPointerv)},
+    {"glGetSamplerParameteriv", P(GL_GetSamplerParameteriv)},
+    {"glResumeTransformFeedback", P(GL_ResumeTransformFeedback)},
+    {"glGetVertexAttribLdv", P(GL_GetVertexAttribLdv)},
+    {"glCompressedTextureSubImage3D", P(GL_CompressedTextureSubImage3D)},
+    {"glSecondaryColor3ub", P(GL_SecondaryColor3ub)},
+    {"glProgramUniform4uiEXT", P(GL_ProgramUniform4uiEXT)},
+    {"glCopyImageSubDataOES", P(GL_CopyImageSubDataOES)},
+    {"glProgramUniform1fvEXT", P(GL_ProgramUniform1fvEXT)},
+    {"glTexStorageMemFlags3DANGLE", P(GL_TexStorageMemFlags3DANGLE)},
+    {"glRasterPos3sv", P(GL_RasterPos3sv)},
+    {"glTexCoord1sv", P(GL_TexCoord1sv)},
+    {"glGetShaderPrecisionFormat", P(GL_GetShaderPrecisionFormat)},
+    {"glVertexAttribP4ui", P(GL_VertexAttribP4ui)},
+    {"glBitmap", P(GL_Bitmap)},
+    {"glEvalCoord1fv", P(GL_EvalCoord1fv)},
+    {"glProgramUniformMatrix4dv", P(GL_ProgramUniformMatrix4dv)},
+    {"glNamedFramebufferRenderbuffer", P(GL_NamedFramebufferRenderbuffer)},
+    {"glVertex3sv", P(GL_Vertex3sv)},
+    {"glGetTexEnvfv", P(GL_GetTexEnvfv)},
+    {"glProgramUniform2uiEXT", P(GL_ProgramUniform2uiEXT)},
+    {"glBindTexture", P(GL_BindTexture)},
+    {"glUniform4dv", P(GL_Uniform4dv)},
+    {"glDrawElementsInstanced", P(GL_DrawElementsInstanced)},
+    {"glDrawElementsInstancedBaseVertexBaseInstance", P(GL_DrawElementsInstancedBaseVertexBaseInstance)},
+    {"glColorP4uiv", P(GL_ColorP4uiv)},
+    {"glTextureStorage2DMultisample", P(GL_TextureStorage2DMultisample)},
+    {"glCompressedTextureSubImage1D", P(GL_CompressedTextureSubImage1D)},
+    {"glVertexAttrib4Nubv", P(GL_VertexAttrib4Nubv)},
+    {"glWindowPos3s", P(GL_WindowPos3s)},
+    {"glVertex2f", P(GL_Vertex2f)},
+    {"glMultiDrawElementsInstancedBaseVertexBaseInstanceANGLE", P(GL_MultiDrawElementsInstancedBaseVertexBaseInstanceANGLE)},
+    {"glIsSampler", P(GL_IsSampler)},
+    {"glEndConditionalRender", P(GL_EndConditionalRender)},
+    {"glPatchParameteriEXT", P(GL_PatchParameteriEXT)},
+    {"glGetFloatvRobustANGLE", P(GL_GetFloatvRobustANGLE)},
+    {"glColor4uiv", P(GL_Color4uiv)},
+    {"glGetActiveUniform", P(GL_GetActiveUniform)},
+    {"glCompressedTexImage1D", P(GL_CompressedTexImage1D)},
+    {"glTexStorageMem2DMultisampleEXT", P(GL_TexStorageMem2DMultisampleEXT)},
+    {"glMultiTexCoord3s", P(GL_MultiTexCoord3s)},
+    {"glProgramBinary", P(GL_ProgramBinary)},
+    {"glDrawTexiOES", P(GL_DrawTexiOES)},
+    {"glRectiv", P(GL_Rectiv)},
+    {"glPushAttrib", P(GL_PushAttrib)},
+    {"glStencilFuncSeparate", P(GL_StencilFuncSeparate)},
+    {"glTexGeniOES", P(GL_TexGeniOES)},
+    {"glGetDoublei_v", P(GL_GetDoublei_v)},
+    {"glTexImage3D", P(GL_TexImage3D)},
+    {"glCompressedTexSubImage3D", P(GL_CompressedTexSubImage3D)},
+    {"glColor3ubv", P(GL_Color3ubv)},
+    {"glProgramUniform4uiv", P(GL_ProgramUniform4uiv)},
+    {"glSecondaryColorP3uiv", P(GL_SecondaryColorP3uiv)},
+    {"glClear", P(GL_Clear)},
+    {"glVertexAttribLPointer", P(GL_VertexAttribLPointer)},
+    {"glGetMaterialfv", P(GL_GetMaterialfv)},
+    {"glBindFragDataLocationEXT", P(GL_BindFragDataLocationEXT)},
+    {"glProgramUniform3dv", P(GL_ProgramUniform3dv)},
+    {"glEvalCoord2dv", P(GL_EvalCoord2dv)},
+    {"glMultiTexCoord1s", P(GL_MultiTexCoord1s)},
+    {"glTexCoordP3uiv", P(GL_TexCoordP3uiv)},
+    {"glPopDebugGroup", P(GL_PopDebugGroup)},
+    {"glCullFace", P(GL_CullFace)},
+    {"ANGLEResetDisplayPlatform", P(ANGLEResetDisplayPlatform)},
+    {"glVertexAttribL4dv", P(GL_VertexAttribL4dv)},
+    {"glGetObjectPtrLabelKHR", P(GL_GetObjectPtrLabelKHR)},
+    {"glGetNamedBufferParameteri64v", P(GL_GetNamedBufferParameteri64v)},
+    {"glProgramUniformMatrix2x3dv", P(GL_ProgramUniformMatrix2x3dv)},
+    {"glVertexArrayElementBuffer", P(GL_VertexArrayElementBuffer)},
+    {"glEnableVertexAttribArray", P(GL_EnableVertexAttribArray)},
+    {"glGetTexParameterxv", P(GL_GetTexParameterxv)},
+    {"glGetClipPlanex", P(GL_GetClipPlanex)},
+    {"glPointParameteriv", P(GL_PointParameteriv)},
+    {"glMapNamedBuffer", P(GL_MapNamedBuffer)},
+    {"glGetSamplerParameterivRobustANGLE", P(GL_GetSamplerParameterivRobustANGLE)},
+    {"glDeleteLists", P(GL_DeleteLists)},
+    {"glInvalidateTexSubImage", P(GL_InvalidateTexSubImage)},
+    {"glLightModeli", P(GL_LightModeli)},
+    {"glVertexAttribI4i", P(GL_VertexAttribI4i)},
+    {"glBindVertexBuffer", P(GL_BindVertexBuffer)},
+    {"glClipPlane", P(GL_ClipPlane)},
+    {"glGetSamplerParameterIuivRobustANGLE", P(GL_GetSamplerParameterIuivRobustANGLE)},
+    {"glBufferData", P(GL_BufferData)},
+    {"glPrimitiveRestartIndex", P(GL_PrimitiveRestartIndex)},
+    {"glProgramUniform4fEXT", P(GL_ProgramUniform4fEXT)},
+    {"glMap2f", P(GL_Map2f)},
+    {"glAcquireTexturesANGLE", P(GL_AcquireTexturesANGLE)},
+    {"glMultiTexCoord1f", P(GL_MultiTexCoord1f)},
+    {"glUniform1iv", P(GL_Uniform1iv)},
+    {"glGetTransformFeedbackVarying", P(GL_GetTransformFeedbackVarying)},
+    {"glGetSemaphoreParameterui64vEXT", P(GL_GetSemaphoreParameterui64vEXT)},
+    {"glGetInteger64i_vRobustANGLE", P(GL_GetInteger64i_vRobustANGLE)},
+    {"glVertexP2ui", P(GL_VertexP2ui)},
+    {"glVertex2sv", P(GL_Vertex2sv)},
+    {"glGetTexGendv", P(GL_GetTexGendv)},
+    {"glBeginConditionalRender", P(GL_BeginConditionalRender)},
+    {"glDisableiEXT", P(GL_DisableiEXT)},
+    {"glGetTexLevelParameterivRobustANGLE", P(GL_GetTexLevelParameterivRobustANGLE)},
+    {"glUniform4iv", P(GL_Uniform4iv)},
     {"glTexBufferEXT", P(GL_TexBufferEXT)},
-    {"glTexBufferOES", P(GL_TexBufferOES)},
-    {"glTexBufferRange", P(GL_TexBufferRange)},
-    {"glTexBufferRangeEXT", P(GL_TexBufferRangeEXT)},
-    {"glTexBufferRangeOES", P(GL_TexBufferRangeOES)},
-    {"glTexCoord1d", P(GL_TexCoord1d)},
-    {"glTexCoord1dv", P(GL_TexCoord1dv)},
-    {"glTexCoord1f", P(GL_TexCoord1f)},
-    {"glTexCoord1fv", P(GL_TexCoord1fv)},
-    {"glTexCoord1i", P(GL_TexCoord1i)},
-    {"glTexCoord1iv", P(GL_TexCoord1iv)},
-    {"glTexCoord1s", P(GL_TexCoord1s)},
-    {"glTexCoord1sv", P(GL_TexCoord1sv)},
-    {"glTexCoord2d", P(GL_TexCoord2d)},
-    {"glTexCoord2dv", P(GL_TexCoord2dv)},
-    {"glTexCoord2f", P(GL_TexCoord2f)},
-    {"glTexCoord2fv", P(GL_TexCoord2fv)},
-    {"glTexCoord2i", P(GL_TexCoord2i)},
-    {"glTexCoord2iv", P(GL_TexCoord2iv)},
-    {"glTexCoord2s", P(GL_TexCoord2s)},
-    {"glTexCoord2sv", P(GL_TexCoord2sv)},
-    {"glTexCoord3d", P(GL_TexCoord3d)},
+    {"glSecondaryColor3b", P(GL_SecondaryColor3b)},
+    {"glDisableiOES", P(GL_DisableiOES)},
+    {"glDrawElementsInstancedBaseVertexBaseInstanceEXT", P(GL_DrawElementsInstancedBaseVertexBaseInstanceEXT)},
+    {"glUniformMatrix4x3dv", P(GL_UniformMatrix4x3dv)},
+    {"glTextureSubImage2D", P(GL_TextureSubImage2D)},
+    {"glGetBooleanv", P(GL_GetBooleanv)},
+    {"glSampleMaskiANGLE", P(GL_SampleMaskiANGLE)},
+    {"glGetObjectLabelEXT", P(GL_GetObjectLabelEXT)},
     {"glTexCoord3dv", P(GL_TexCoord3dv)},
+    {"glIndexfv", P(GL_Indexfv)},
+    {"glSamplerParameterfvRobustANGLE", P(GL_SamplerParameterfvRobustANGLE)},
+    {"glGetnUniformuiv", P(GL_GetnUniformuiv)},
+    {"glTexCoordPointer", P(GL_TexCoordPointer)},
+    {"glStencilOpSeparate", P(GL_StencilOpSeparate)},
+    {"glClearNamedBufferSubData", P(GL_ClearNamedBufferSubData)},
+    {"glTexStorage3DEXT", P(GL_TexStorage3DEXT)},
+    {"glVertexAttribI4sv", P(GL_VertexAttribI4sv)},
+    {"glPixelLocalStorageBarrierANGLE", P(GL_PixelLocalStorageBarrierANGLE)},
+    {"glTextureParameteri", P(GL_TextureParameteri)},
+    {"glColor3us", P(GL_Color3us)},
+    {"glDisableVertexArrayAttrib", P(GL_DisableVertexArrayAttrib)},
+    {"glDeleteQueries", P(GL_DeleteQueries)},
+    {"glPatchParameterfv", P(GL_PatchParameterfv)},
     {"glTexCoord3f", P(GL_TexCoord3f)},
-    {"glTexCoord3fv", P(GL_TexCoord3fv)},
-    {"glTexCoord3i", P(GL_TexCoord3i)},
-    {"glTexCoord3iv", P(GL_TexCoord3iv)},
+    {"glVertexAttrib2sv", P(GL_VertexAttrib2sv)},
+    {"glCompressedTexImage2DRobustANGLE", P(GL_CompressedTexImage2DRobustANGLE)},
+    {"glProgramUniformMatrix3x4fvEXT", P(GL_ProgramUniformMatrix3x4fvEXT)},
+    {"glFrontFace", P(GL_FrontFace)},
+    {"glGetnColorTable", P(GL_GetnColorTable)},
+    {"glColor4ub", P(GL_Color4ub)},
+    {"glMultiTexCoord4x", P(GL_MultiTexCoord4x)},
+    {"glTexStorage2DEXT", P(GL_TexStorage2DEXT)},
+    {"glUniform2dv", P(GL_Uniform2dv)},
+    {"glWindowPos2iv", P(GL_WindowPos2iv)},
+    {"glDepthFunc", P(GL_DepthFunc)},
+    {"glReadnPixelsRobustANGLE", P(GL_ReadnPixelsRobustANGLE)},
+    {"glOrtho", P(GL_Ortho)},
+    {"glShadeModel", P(GL_ShadeModel)},
+    {"glMultiTexCoord2iv", P(GL_MultiTexCoord2iv)},
+    {"glScalef", P(GL_Scalef)},
+    {"glUniformSubroutinesuiv", P(GL_UniformSubroutinesuiv)},
+    {"glGetFramebufferPixelLocalStorageParameterfvRobustANGLE", P(GL_GetFramebufferPixelLocalStorageParameterfvRobustANGLE)},
+    {"glNormal3fv", P(GL_Normal3fv)},
+    {"glFrustumx", P(GL_Frustumx)},
+    {"glPopName", P(GL_PopName)},
+    {"glCheckNamedFramebufferStatus", P(GL_CheckNamedFramebufferStatus)},
+    {"glIsEnabled", P(GL_IsEnabled)},
+    {"glTexParameterIuivEXT", P(GL_TexParameterIuivEXT)},
+    {"glCopyTextureSubImage2D", P(GL_CopyTextureSubImage2D)},
+    {"wglCreateLayerContext", P(wglCreateLayerContext)},
+    {"glGetQueryObjectuivRobustANGLE", P(GL_GetQueryObjectuivRobustANGLE)},
+    {"glTextureParameteriv", P(GL_TextureParameteriv)},
+    {"glTexParameterIivRobustANGLE", P(GL_TexParameterIivRobustANGLE)},
+    {"glProgramUniform1iv", P(GL_ProgramUniform1iv)},
+    {"glMultiTexCoordP2ui", P(GL_MultiTexCoordP2ui)},
+    {"glEdgeFlagv", P(GL_EdgeFlagv)},
+    {"glIsMemoryObjectEXT", P(GL_IsMemoryObjectEXT)},
+    {"glDisableClientState", P(GL_DisableClientState)},
+    {"glPointParameterfv", P(GL_PointParameterfv)},
+    {"glReadnPixelsEXT", P(GL_ReadnPixelsEXT)},
+    {"glMultiTexCoord1i", P(GL_MultiTexCoord1i)},
+    {"glProgramUniform1dv", P(GL_ProgramUniform1dv)},
+    {"glGetTexLevelParameterfvANGLE", P(GL_GetTexLevelParameterfvANGLE)},
+    {"glTexCoordP2uiv", P(GL_TexCoordP2uiv)},
+    {"glGetVertexAttribPointerv", P(GL_GetVertexAttribPointerv)},
+    {"glInvalidateBufferSubData", P(GL_InvalidateBufferSubData)},
+    {"glEvalMesh1", P(GL_EvalMesh1)},
+    {"glDeleteVertexArrays", P(GL_DeleteVertexArrays)},
+    {"glMultiTexCoord2i", P(GL_MultiTexCoord2i)},
+    {"glVertexAttribL2dv", P(GL_VertexAttribL2dv)},
+    {"glProgramUniformMatrix3x4dv", P(GL_ProgramUniformMatrix3x4dv)},
+    {"glGetCompressedTexImage", P(GL_GetCompressedTexImage)},
+    {"glRectd", P(GL_Rectd)},
+    {"glTextureSubImage3D", P(GL_TextureSubImage3D)},
+    {"glCopyTexture3DANGLE", P(GL_CopyTexture3DANGLE)},
+    {"glRasterPos2sv", P(GL_RasterPos2sv)},
+    {"glGetFragDataIndex", P(GL_GetFragDataIndex)},
+    {"glBindAttribLocation", P(GL_BindAttribLocation)},
+    {"glProgramUniform3f", P(GL_ProgramUniform3f)},
+    {"glDrawTexivOES", P(GL_DrawTexivOES)},
+    {"glGetTexParameterIiv", P(GL_GetTexParameterIiv)},
+    {"glBindProgramPipeline", P(GL_BindProgramPipeline)},
+    {"glCompressedTexImage3DOES", P(GL_CompressedTexImage3DOES)},
+    {"glEGLImageTargetTextureStorageEXT", P(GL_EGLImageTargetTextureStorageEXT)},
+    {"glPixelTransferf", P(GL_PixelTransferf)},
+    {"glEndQuery", P(GL_EndQuery)},
+    {"glUniformMatrix2x4fv", P(GL_UniformMatrix2x4fv)},
+    {"glGetClipPlanef", P(GL_GetClipPlanef)},
+    {"glTexEnvfv", P(GL_TexEnvfv)},
+    {"glSamplerParameterIivEXT", P(GL_SamplerParameterIivEXT)},
+    {"glGetQueryObjecti64v", P(GL_GetQueryObjecti64v)},
+    {"glCompressedCopyTextureCHROMIUM", P(GL_CompressedCopyTextureCHROMIUM)},
+    {"glGetTexParameterfv", P(GL_GetTexParameterfv)},
+    {"glCompressedTextureSubImage2D", P(GL_CompressedTextureSubImage2D)},
+    {"glGetTextureParameterIuiv", P(GL_GetTextureParameterIuiv)},
+    {"glVertexAttribI4iv", P(GL_VertexAttribI4iv)},
+    {"glFlushMappedBufferRange", P(GL_FlushMappedBufferRange)},
+    {"glProgramUniform2dv", P(GL_ProgramUniform2dv)},
+    {"glDepthRangex", P(GL_DepthRangex)},
+    {"glVertexAttrib2s", P(GL_VertexAttrib2s)},
+    {"glDrawArraysInstancedBaseInstanceEXT", P(GL_DrawArraysInstancedBaseInstanceEXT)},
+    {"glBindVertexBuffers", P(GL_BindVertexBuffers)},
+    {"glColorMaskiEXT", P(GL_ColorMaskiEXT)},
+    {"glUniformMatrix3x2fv", P(GL_UniformMatrix3x2fv)},
+    {"glPushName", P(GL_PushName)},
+    {"glVertexAttribI3i", P(GL_VertexAttribI3i)},
+    {"glDrawRangeElements", P(GL_DrawRangeElements)},
+    {"glDepthRangef", P(GL_DepthRangef)},
+    {"glMultiDrawElements", P(GL_MultiDrawElements)},
     {"glTexCoord3s", P(GL_TexCoord3s)},
-    {"glTexCoord3sv", P(GL_TexCoord3sv)},
-    {"glTexCoord4d", P(GL_TexCoord4d)},
+    {"glGetProgramInterfaceiv", P(GL_GetProgramInterfaceiv)},
+    {"wglUseFontBitmapsA", P(wglUseFontBitmapsA)},
+    {"glCheckFramebufferStatus", P(GL_CheckFramebufferStatus)},
+    {"glProgramParameteriEXT", P(GL_ProgramParameteriEXT)},
+    {"glVertexAttribPointer", P(GL_VertexAttribPointer)},
+    {"glTransformFeedbackBufferRange", P(GL_TransformFeedbackBufferRange)},
+    {"glVertexAttrib4s", P(GL_VertexAttrib4s)},
+    {"glTransformFeedbackVaryings", P(GL_TransformFeedbackVaryings)},
+    {"glGetFramebufferPixelLocalStorageParameterivANGLE", P(GL_GetFramebufferPixelLocalStorageParameterivANGLE)},
+    {"glLoadMatrixx", P(GL_LoadMatrixx)},
+    {"glProgramUniformMatrix2x4fvEXT", P(GL_ProgramUniformMatrix2x4fvEXT)},
+    {"wglUseFontBitmapsW", P(wglUseFontBitmapsW)},
+    {"glGetClipPlane", P(GL_GetClipPlane)},
+    {"glVertexAttribL2d", P(GL_VertexAttribL2d)},
+    {"glGetIntegervRobustANGLE", P(GL_GetIntegervRobustANGLE)},
     {"glTexCoord4dv", P(GL_TexCoord4dv)},
-    {"glTexCoord4f", P(GL_TexCoord4f)},
-    {"glTexCoord4fv", P(GL_TexCoord4fv)},
-    {"glTexCoord4i", P(GL_TexCoord4i)},
-    {"glTexCoord4iv", P(GL_TexCoord4iv)},
-    {"glTexCoord4s", P(GL_TexCoord4s)},
+    {"glProvokingVertexANGLE", P(GL_ProvokingVertexANGLE)},
     {"glTexCoord4sv", P(GL_TexCoord4sv)},
-    {"glTexCoordP1ui", P(GL_TexCoordP1ui)},
-    {"glTexCoordP1uiv", P(GL_TexCoordP1uiv)},
-    {"glTexCoordP2ui", P(GL_TexCoordP2ui)},
-    {"glTexCoordP2uiv", P(GL_TexCoordP2uiv)},
-    {"glTexCoordP3ui", P(GL_TexCoordP3ui)},
-    {"glTexCoordP3uiv", P(GL_TexCoordP3uiv)},
-    {"glTexCoordP4ui", P(GL_TexCoordP4ui)},
-    {"glTexCoordP4uiv", P(GL_TexCoordP4uiv)},
-    {"glTexCoordPointer", P(GL_TexCoordPointer)},
-    {"glTexEnvf", P(GL_TexEnvf)},
-    {"glTexEnvfv", P(GL_TexEnvfv)},
-    {"glTexEnvi", P(GL_TexEnvi)},
-    {"glTexEnviv", P(GL_TexEnviv)},
-    {"glTexEnvx", P(GL_TexEnvx)},
-    {"glTexEnvxv", P(GL_TexEnvxv)},
-    {"glTexGend", P(GL_TexGend)},
-    {"glTexGendv", P(GL_TexGendv)},
-    {"glTexGenf", P(GL_TexGenf)},
-    {"glTexGenfOES", P(GL_TexGenfOES)},
-    {"glTexGenfv", P(GL_TexGenfv)},
-    {"glTexGenfvOES", P(GL_TexGenfvOES)},
-    {"glTexGeni", P(GL_TexGeni)},
-    {"glTexGeniOES", P(GL_TexGeniOES)},
-    {"glTexGeniv", P(GL_TexGeniv)},
-    {"glTexGenivOES", P(GL_TexGenivOES)},
-    {"glTexGenxOES", P(GL_TexGenxOES)},
-    {"glTexGenxvOES", P(GL_TexGenxvOES)},
-    {"glTexImage1D", P(GL_TexImage1D)},
-    {"glTexImage2D", P(GL_TexImage2D)},
-    {"glTexImage2DExternalANGLE", P(GL_TexImage2DExternalANGLE)},
-    {"glTexImage2DMultisample", P(GL_TexImage2DMultisample)},
-    {"glTexImage2DRobustANGLE", P(GL_TexImage2DRobustANGLE)},
-    {"glTexImage3D", P(GL_TexImage3D)},
-    {"glTexImage3DMultisample", P(GL_TexImage3DMultisample)},
-    {"glTexImage3DOES", P(GL_TexImage3DOES)},
-    {"glTexImage3DRobustANGLE", P(GL_TexImage3DRobustANGLE)},
+    {"glTexCoord2i", P(GL_TexCoord2i)},
+    {"glFramebufferFetchBarrierEXT", P(GL_FramebufferFetchBarrierEXT)},
+    {"glGetPerfMonitorCounterInfoAMD", P(GL_GetPerfMonitorCounterInfoAMD)},
+    {"glIsQueryEXT", P(GL_IsQueryEXT)},
+    {"glMultiDrawElementsIndirectCount", P(GL_MultiDrawElementsIndirectCount)},
+    {"glGetDebugMessageLog", P(GL_GetDebugMessageLog)},
+    {"glVertexAttrib1sv", P(GL_VertexAttrib1sv)},
+    {"glDrawArraysIndirect", P(GL_DrawArraysIndirect)},
+    {"glEvalCoord2fv", P(GL_EvalCoord2fv)},
+    {"glProgramUniformMatrix2fvEXT", P(GL_ProgramUniformMatrix2fvEXT)},
+    {"glGetQueryBufferObjectuiv", P(GL_GetQueryBufferObjectuiv)},
+    {"glGetTexParameterIivRobustANGLE", P(GL_GetTexParameterIivRobustANGLE)},
+    {"glLoadTransposeMatrixd", P(GL_LoadTransposeMatrixd)},
+    {"glFogfv", P(GL_Fogfv)},
+    {"glGetTextureParameterIiv", P(GL_GetTextureParameterIiv)},
+    {"glLoadTransposeMatrixf", P(GL_LoadTransposeMatrixf)},
+    {"glBlendFunc", P(GL_BlendFunc)},
+    {"glDeleteRenderbuffers", P(GL_DeleteRenderbuffers)},
     {"glTexParameterIiv", P(GL_TexParameterIiv)},
-    {"glTexParameterIivEXT", P(GL_TexParameterIivEXT)},
-    {"glTexParameterIivOES", P(GL_TexParameterIivOES)},
-    {"glTexParameterIivRobustANGLE", P(GL_TexParameterIivRobustANGLE)},
-    {"glTexParameterIuiv", P(GL_TexParameterIuiv)},
-    {"glTexParameterIuivEXT", P(GL_TexParameterIuivEXT)},
-    {"glTexParameterIuivOES", P(GL_TexParameterIuivOES)},
-    {"glTexParameterIuivRobustANGLE", P(GL_TexParameterIuivRobustANGLE)},
-    {"glTexParameterf", P(GL_TexParameterf)},
-    {"glTexParameterfv", P(GL_TexParameterfv)},
-    {"glTexParameterfvRobustANGLE", P(GL_TexParameterfvRobustANGLE)},
-    {"glTexParameteri", P(GL_TexParameteri)},
-    {"glTexParameteriv", P(GL_TexParameteriv)},
-    {"glTexParameterivRobustANGLE", P(GL_TexParameterivRobustANGLE)},
-    {"glTexParameterx", P(GL_TexParameterx)},
-    {"glTexParameterxv", P(GL_TexParameterxv)},
-    {"glTexStorage1D", P(GL_TexStorage1D)},
-    {"glTexStorage1DEXT", P(GL_TexStorage1DEXT)},
+    {"glProgramUniform2uivEXT", P(GL_ProgramUniform2uivEXT)},
+    {"glDeleteFramebuffersOES", P(GL_DeleteFramebuffersOES)},
+    {"wglSwapLayerBuffers", P(wglSwapLayerBuffers)},
+    {"glGetActiveUniformBlockName", P(GL_GetActiveUniformBlockName)},
+    {"glVertexAttribDivisorANGLE", P(GL_VertexAttribDivisorANGLE)},
+    {"glUniformMatrix2dv", P(GL_UniformMatrix2dv)},
+    {"glTestFenceNV", P(GL_TestFenceNV)},
+    {"glGetMapdv", P(GL_GetMapdv)},
+    {"glBeginPerfMonitorAMD", P(GL_BeginPerfMonitorAMD)},
+    {"glUniform1f", P(GL_Uniform1f)},
+    {"glPushClientAttrib", P(GL_PushClientAttrib)},
+    {"glGetQueryivRobustANGLE", P(GL_GetQueryivRobustANGLE)},
+    {"glMultiTexCoordP2uiv", P(GL_MultiTexCoordP2uiv)},
+    {"glVertexAttrib4Nusv", P(GL_VertexAttrib4Nusv)},
+    {"glEvalPoint2", P(GL_EvalPoint2)},
+    {"glVertexAttribL3d", P(GL_VertexAttribL3d)},
+    {"glStencilFunc", P(GL_StencilFunc)},
+    {"glGenSamplers", P(GL_GenSamplers)},
+    {"glMultiDrawArraysIndirect", P(GL_MultiDrawArraysIndirect)},
+    {"glBindImageTextures", P(GL_BindImageTextures)},
+    {"glRotatef", P(GL_Rotatef)},
+    {"glGetBufferPointerv", P(GL_GetBufferPointerv)},
+    {"glColor3bv", P(GL_Color3bv)},
     {"glTexStorage2D", P(GL_TexStorage2D)},
-    {"glTexStorage2DEXT", P(GL_TexStorage2DEXT)},
-    {"glTexStorage2DMultisample", P(GL_TexStorage2DMultisample)},
-    {"glTexStorage2DMultisampleANGLE", P(GL_TexStorage2DMultisampleANGLE)},
-    {"glTexStorage3D", P(GL_TexStorage3D)},
-    {"glTexStorage3DEXT", P(GL_TexStorage3DEXT)},
-    {"glTexStorage3DMultisample", P(GL_TexStorage3DMultisample)},
-    {"glTexStorage3DMultisampleOES", P(GL_TexStorage3DMultisampleOES)},
-    {"glTexStorageMem2DEXT", P(GL_TexStorageMem2DEXT)},
-    {"glTexStorageMem2DMultisampleEXT", P(GL_TexStorageMem2DMultisampleEXT)},
-    {"glTexStorageMem3DEXT", P(GL_TexStorageMem3DEXT)},
-    {"glTexStorageMem3DMultisampleEXT", P(GL_TexStorageMem3DMultisampleEXT)},
-    {"glTexStorageMemFlags2DANGLE", P(GL_TexStorageMemFlags2DANGLE)},
-    {"glTexStorageMemFlags2DMultisampleANGLE", P(GL_TexStorageMemFlags2DMultisampleANGLE)},
-    {"glTexStorageMemFlags3DANGLE", P(GL_TexStorageMemFlags3DANGLE)},
-    {"glTexStorageMemFlags3DMultisampleANGLE", P(GL_TexStorageMemFlags3DMultisampleANGLE)},
-    {"glTexSubImage1D", P(GL_TexSubImage1D)},
+    {"glGetFramebufferAttachmentParameterivOES", P(GL_GetFramebufferAttachmentParameterivOES)},
+    {"glGetMemoryObjectParameterivEXT", P(GL_GetMemoryObjectParameterivEXT)},
+    {"glCopyImageSubDataEXT", P(GL_CopyImageSubDataEXT)},
+    {"glLightModelx", P(GL_LightModelx)},
+    {"glDrawArraysInstancedANGLE", P(GL_DrawArraysInstancedANGLE)},
+    {"glNamedFramebufferTexture", P(GL_NamedFramebufferTexture)},
+    {"glRasterPos4fv", P(GL_RasterPos4fv)},
+    {"glPixelStorei", P(GL_PixelStorei)},
+    {"glTexEnvx", P(GL_TexEnvx)},
+    {"glProgramUniform3fv", P(GL_ProgramUniform3fv)},
+    {"glProgramUniform1i", P(GL_ProgramUniform1i)},
+    {"glCopySubTexture3DANGLE", P(GL_CopySubTexture3DANGLE)},
+    {"wglSwapBuffers", P(wglSwapBuffers)},
+    {"glReadPixelsRobustANGLE", P(GL_ReadPixelsRobustANGLE)},
+    {"glVertexAttrib4Nub", P(GL_VertexAttrib4Nub)},
+    {"glGetSamplerParameterIivOES", P(GL_GetSamplerParameterIivOES)},
+    {"glPixelMapfv", P(GL_PixelMapfv)},
+    {"glWindowPos2fv", P(GL_WindowPos2fv)},
+    {"glGetGraphicsResetStatus", P(GL_GetGraphicsResetStatus)},
+    {"glMatrixMode", P(GL_MatrixMode)},
+    {"glTexParameterx", P(GL_TexParameterx)},
+    {"glProgramUniform2i", P(GL_ProgramUniform2i)},
+    {"glGetnUniformivEXT", P(GL_GetnUniformivEXT)},
+    {"glGetSamplerParameterfvRobustANGLE", P(GL_GetSamplerParameterfvRobustANGLE)},
+    {"glVertex4dv", P(GL_Vertex4dv)},
+    {"glCallList", P(GL_CallList)},
     {"glTexSubImage2D", P(GL_TexSubImage2D)},
-    {"glTexSubImage2DRobustANGLE", P(GL_TexSubImage2DRobustANGLE)},
-    {"glTexSubImage3D", P(GL_TexSubImage3D)},
-    {"glTexSubImage3DOES", P(GL_TexSubImage3DOES)},
-    {"glTexSubImage3DRobustANGLE", P(GL_TexSubImage3DRobustANGLE)},
+    {"glBeginTransformFeedback", P(GL_BeginTransformFeedback)},
+    {"glSamplerParameteri", P(GL_SamplerParameteri)},
+    {"glSampleCoverage", P(GL_SampleCoverage)},
+    {"glGetCompressedTextureImage", P(GL_GetCompressedTextureImage)},
+    {"glGetnMapiv", P(GL_GetnMapiv)},
+    {"glFramebufferTextureLayer", P(GL_FramebufferTextureLayer)},
+    {"glDrawElementsInstancedBaseVertexBaseInstanceANGLE", P(GL_DrawElementsInstancedBaseVertexBaseInstanceANGLE)},
+    {"glTexCoord2sv", P(GL_TexCoord2sv)},
+    {"glColor3ub", P(GL_Color3ub)},
+    {"glLightfv", P(GL_Lightfv)},
+    {"glGetPixelMapusv", P(GL_GetPixelMapusv)},
     {"glTextureBarrier", P(GL_TextureBarrier)},
-    {"glTextureBuffer", P(GL_TextureBuffer)},
-    {"glTextureBufferRange", P(GL_TextureBufferRange)},
-    {"glTextureFoveationParametersQCOM", P(GL_TextureFoveationParametersQCOM)},
-    {"glTextureParameterIiv", P(GL_TextureParameterIiv)},
-    {"glTextureParameterIuiv", P(GL_TextureParameterIuiv)},
-    {"glTextureParameterf", P(GL_TextureParameterf)},
-    {"glTextureParameterfv", P(GL_TextureParameterfv)},
-    {"glTextureParameteri", P(GL_TextureParameteri)},
-    {"glTextureParameteriv", P(GL_TextureParameteriv)},
-    {"glTextureStorage1D", P(GL_TextureStorage1D)},
-    {"glTextureStorage2D", P(GL_TextureStorage2D)},
-    {"glTextureStorage2DMultisample", P(GL_TextureStorage2DMultisample)},
-    {"glTextureStorage3D", P(GL_TextureStorage3D)},
-    {"glTextureStorage3DMultisample", P(GL_TextureStorage3DMultisample)},
-    {"glTextureSubImage1D", P(GL_TextureSubImage1D)},
-    {"glTextureSubImage2D", P(GL_TextureSubImage2D)},
-    {"glTextureSubImage3D", P(GL_TextureSubImage3D)},
-    {"glTextureView", P(GL_TextureView)},
-    {"glTransformFeedbackBufferBase", P(GL_TransformFeedbackBufferBase)},
-    {"glTransformFeedbackBufferRange", P(GL_TransformFeedbackBufferRange)},
-    {"glTransformFeedbackVaryings", P(GL_TransformFeedbackVaryings)},
-    {"glTranslated", P(GL_Translated)},
-    {"glTranslatef", P(GL_Translatef)},
-    {"glTranslatex", P(GL_Translatex)},
-    {"glUniform1d", P(GL_Uniform1d)},
-    {"glUniform1dv", P(GL_Uniform1dv)},
-    {"glUniform1f", P(GL_Uniform1f)},
-    {"glUniform1fv", P(GL_Uniform1fv)},
-    {"glUniform1i", P(GL_Uniform1i)},
-    {"glUniform1iv", P(GL_Uniform1iv)},
-    {"glUniform1ui", P(GL_Uniform1ui)},
-    {"glUniform1uiv", P(GL_Uniform1uiv)},
-    {"glUniform2d", P(GL_Uniform2d)},
-    {"glUniform2dv", P(GL_Uniform2dv)},
-    {"glUniform2f", P(GL_Uniform2f)},
-    {"glUniform2fv", P(GL_Uniform2fv)},
-    {"glUniform2i", P(GL_Uniform2i)},
-    {"glUniform2iv", P(GL_Uniform2iv)},
-    {"glUniform2ui", P(GL_Uniform2ui)},
-    {"glUniform2uiv", P(GL_Uniform2uiv)},
-    {"glUniform3d", P(GL_Uniform3d)},
-    {"glUniform3dv", P(GL_Uniform3dv)},
-    {"glUniform3f", P(GL_Uniform3f)},
-    {"glUniform3fv", P(GL_Uniform3fv)},
-    {"glUniform3i", P(GL_Uniform3i)},
-    {"glUniform3iv", P(GL_Uniform3iv)},
-    {"glUniform3ui", P(GL_Uniform3ui)},
+    {"glGenerateMipmap", P(GL_GenerateMipmap)},
+    {"wglUseFontBitmaps", P(wglUseFontBitmaps)},
+    {"glTexCoordP1ui", P(GL_TexCoordP1ui)},
+    {"glTexStorage1D", P(GL_TexStorage1D)},
+    {"glVertex3dv", P(GL_Vertex3dv)},
+    {"glMatrixIndexPointerOES", P(GL_MatrixIndexPointerOES)},
+    {"glVertexAttrib4Niv", P(GL_VertexAttrib4Niv)},
+    {"glAreTexturesResident", P(GL_AreTexturesResident)},
+    {"glTexImage2DRobustANGLE", P(GL_TexImage2DRobustANGLE)},
+    {"glUnmapBufferOES", P(GL_UnmapBufferOES)},
+    {"glDrawArraysInstancedBaseInstanceANGLE", P(GL_DrawArraysInstancedBaseInstanceANGLE)},
+    {"glGetShaderivRobustANGLE", P(GL_GetShaderivRobustANGLE)},
+    {"glRasterPos2fv", P(GL_RasterPos2fv)},
+    {"glNormal3f", P(GL_Normal3f)},
+    {"glProvokingVertex", P(GL_ProvokingVertex)},
+    {"glCreateTransformFeedbacks", P(GL_CreateTransformFeedbacks)},
+    {"glFramebufferTexture2DOES", P(GL_FramebufferTexture2DOES)},
+    {"glTexCoordP1uiv", P(GL_TexCoordP1uiv)},
+    {"glMinSampleShading", P(GL_MinSampleShading)},
+    {"glCreateFramebuffers", P(GL_CreateFramebuffers)},
     {"glUniform3uiv", P(GL_Uniform3uiv)},
-    {"glUniform4d", P(GL_Uniform4d)},
-    {"glUniform4dv", P(GL_Uniform4dv)},
-    {"glUniform4f", P(GL_Uniform4f)},
-    {"glUniform4fv", P(GL_Uniform4fv)},
+    {"glGetQueryObjectui64vRobustANGLE", P(GL_GetQueryObjectui64vRobustANGLE)},
+    {"glColor4x", P(GL_Color4x)},
+    {"glMultiDrawElementsIndirect", P(GL_MultiDrawElementsIndirect)},
+    {"glGetnUniformfv", P(GL_GetnUniformfv)},
+    {"glScalex", P(GL_Scalex)},
+    {"glGetnConvolutionFilter", P(GL_GetnConvolutionFilter)},
+    {"glCopySubTextureCHROMIUM", P(GL_CopySubTextureCHROMIUM)},
+    {"glGetTextureLevelParameterfv", P(GL_GetTextureLevelParameterfv)},
+    {"glVertexP3ui", P(GL_VertexP3ui)},
+    {"glVertexAttrib2d", P(GL_VertexAttrib2d)},
+    {"glRenderbufferStorageMultisampleANGLE", P(GL_RenderbufferStorageMultisampleANGLE)},
+    {"glClearTexImage", P(GL_ClearTexImage)},
+    {"glGetInteger64i_v", P(GL_GetInteger64i_v)},
+    {"glDrawTexfOES", P(GL_DrawTexfOES)},
+    {"ANGLEGetDisplayPlatform", P(ANGLEGetDisplayPlatform)},
+    {"glGetSubroutineIndex", P(GL_GetSubroutineIndex)},
+    {"glCopyTexSubImage1D", P(GL_CopyTexSubImage1D)},
     {"glUniform4i", P(GL_Uniform4i)},
-    {"glUniform4iv", P(GL_Uniform4iv)},
-    {"glUniform4ui", P(GL_Uniform4ui)},
-    {"glUniform4uiv", P(GL_Uniform4uiv)},
+    {"wglGetCurrentContext", P(wglGetCurrentContext)},
+    {"glMultiTexCoord2s", P(GL_MultiTexCoord2s)},
+    {"glTexCoord2iv", P(GL_TexCoord2iv)},
+    {"glFogCoorddv", P(GL_FogCoorddv)},
+    {"glRasterPos4f", P(GL_RasterPos4f)},
+    {"glTexSubImage3DRobustANGLE", P(GL_TexSubImage3DRobustANGLE)},
+    {"glGetProgramivRobustANGLE", P(GL_GetProgramivRobustANGLE)},
+    {"glGetUniformfvRobustANGLE", P(GL_GetUniformfvRobustANGLE)},
+    {"glRasterPos2s", P(GL_RasterPos2s)},
+    {"glMinSampleShadingOES", P(GL_MinSampleShadingOES)},
+    {"glIsRenderbuffer", P(GL_IsRenderbuffer)},
+    {"glDebugMessageCallbackKHR", P(GL_DebugMessageCallbackKHR)},
+    {"glSamplerParameterIivRobustANGLE", P(GL_SamplerParameterIivRobustANGLE)},
+    {"glPrioritizeTextures", P(GL_PrioritizeTextures)},
+    {"glDeleteShader", P(GL_DeleteShader)},
+    {"glProgramUniformMatrix4x3dv", P(GL_ProgramUniformMatrix4x3dv)},
+    {"glNormal3s", P(GL_Normal3s)},
+    {"glVertexAttrib1f", P(GL_VertexAttrib1f)},
+    {"glCopyTexSubImage2D", P(GL_CopyTexSubImage2D)},
+    {"glTexGenfv", P(GL_TexGenfv)},
+    {"glGetnTexImage", P(GL_GetnTexImage)},
+    {"glInvalidateSubFramebuffer", P(GL_InvalidateSubFramebuffer)},
+    {"glEdgeFlagPointer", P(GL_EdgeFlagPointer)},
+    {"glPatchParameteri", P(GL_PatchParameteri)},
+    {"glCopyImageSubData", P(GL_CopyImageSubData)},
+    {"glDrawRangeElementsBaseVertexOES", P(GL_DrawRangeElementsBaseVertexOES)},
+    {"wglDeleteContext", P(wglDeleteContext)},
+    {"glDrawTransformFeedbackStreamInstanced", P(GL_DrawTransformFeedbackStreamInstanced)},
+    {"glGetFramebufferPixelLocalStorageParameterfvANGLE", P(GL_GetFramebufferPixelLocalStorageParameterfvANGLE)},
+    {"glTexStorage3DMultisample", P(GL_TexStorage3DMultisample)},
+    {"glRasterPos3fv", P(GL_RasterPos3fv)},
+    {"glUnmapBuffer", P(GL_UnmapBuffer)},
+    {"glGetnUniformfvEXT", P(GL_GetnUniformfvEXT)},
+    {"glTexStorage2DMultisample", P(GL_TexStorage2DMultisample)},
+    {"glIsFenceNV", P(GL_IsFenceNV)},
+    {"glProgramUniform3ivEXT", P(GL_ProgramUniform3ivEXT)},
+    {"glScissorArrayv", P(GL_ScissorArrayv)},
+    {"glDrawElementsIndirect", P(GL_DrawElementsIndirect)},
     {"glUniformBlockBinding", P(GL_UniformBlockBinding)},
-    {"glUniformMatrix2dv", P(GL_UniformMatrix2dv)},
-    {"glUniformMatrix2fv", P(GL_UniformMatrix2fv)},
-    {"glUniformMatrix2x3dv", P(GL_UniformMatrix2x3dv)},
-    {"glUniformMatrix2x3fv", P(GL_UniformMatrix2x3fv)},
-    {"glUniformMatrix2x4dv", P(GL_UniformMatrix2x4dv)},
-    {"glUniformMatrix2x4fv", P(GL_UniformMatrix2x4fv)},
-    {"glUniformMatrix3dv", P(GL_UniformMatrix3dv)},
-    {"glUniformMatrix3fv", P(GL_UniformMatrix3fv)},
-    {"glUniformMatrix3x2dv", P(GL_UniformMatrix3x2dv)},
-    {"glUniformMatrix3x2fv", P(GL_UniformMatrix3x2fv)},
-    {"glUniformMatrix3x4dv", P(GL_UniformMatrix3x4dv)},
-    {"glUniformMatrix3x4fv", P(GL_UniformMatrix3x4fv)},
-    {"glUniformMatrix4dv", P(GL_UniformMatrix4dv)},
+    {"glPointParameterx", P(GL_PointParameterx)},
+    {"glVertexArrayBindingDivisor", P(GL_VertexArrayBindingDivisor)},
+    {"glVertexAttrib1dv", P(GL_VertexAttrib1dv)},
+    {"glImportMemoryZirconHandleANGLE", P(GL_ImportMemoryZirconHandleANGLE)},
+    {"glBufferStorageEXT", P(GL_BufferStorageEXT)},
+    {"glBlitFramebufferANGLE", P(GL_BlitFramebufferANGLE)},
+    {"glWindowPos2i", P(GL_WindowPos2i)},
+    {"glBlendBarrierKHR", P(GL_BlendBarrierKHR)},
+    {"glBindFramebuffer", P(GL_BindFramebuffer)},
+    {"glClearBufferfv", P(GL_ClearBufferfv)},
+    {"glVertexAttribI2i", P(GL_VertexAttribI2i)},
+    {"glCompressedTexImage3DRobustANGLE", P(GL_CompressedTexImage3DRobustANGLE)},
+    {"glWeightPointerOES", P(GL_WeightPointerOES)},
+    {"glProgramUniform1ivEXT", P(GL_ProgramUniform1ivEXT)},
+    {"glMapBufferOES", P(GL_MapBufferOES)},
+    {"glGetProgramPipelineInfoLog", P(GL_GetProgramPipelineInfoLog)},
+    {"glTextureView", P(GL_TextureView)},
+    {"glGetVertexAttribIuivRobustANGLE", P(GL_GetVertexAttribIuivRobustANGLE)},
+    {"glGetUniformdv", P(GL_GetUniformdv)},
+    {"glVertexAttribIFormat", P(GL_VertexAttribIFormat)},
+    {"glGetInternalformativ", P(GL_GetInternalformativ)},
+    {"glTexCoord1iv", P(GL_TexCoord1iv)},
+    {"glGetQueryObjecti64vEXT", P(GL_GetQueryObjecti64vEXT)},
+    {"glVertexAttrib1s", P(GL_VertexAttrib1s)},
+    {"glEnablei", P(GL_Enablei)},
+    {"glWindowPos2s", P(GL_WindowPos2s)},
+    {"glProgramUniform4iv", P(GL_ProgramUniform4iv)},
+    {"glProgramUniformMatrix3fvEXT", P(GL_ProgramUniformMatrix3fvEXT)},
+    {"glGetTransformFeedbacki_v", P(GL_GetTransformFeedbacki_v)},
+    {"glClipControlEXT", P(GL_ClipControlEXT)},
+    {"glFramebufferPixelLocalClearValueivANGLE", P(GL_FramebufferPixelLocalClearValueivANGLE)},
+    {"glMemoryBarrierByRegion", P(GL_MemoryBarrierByRegion)},
+    {"glGetIntegeri_vRobustANGLE", P(GL_GetIntegeri_vRobustANGLE)},
+    {"glGetBufferPointervOES", P(GL_GetBufferPointervOES)},
+    {"glTexBufferRangeOES", P(GL_TexBufferRangeOES)},
+    {"glSpecializeShader", P(GL_SpecializeShader)},
+    {"glMultiDrawArrays", P(GL_MultiDrawArrays)},
+    {"glIsFramebufferOES", P(GL_IsFramebufferOES)},
+    {"glEndTilingQCOM", P(GL_EndTilingQCOM)},
+    {"glTexParameterIuivRobustANGLE", P(GL_TexParameterIuivRobustANGLE)},
+    {"glIsProgram", P(GL_IsProgram)},
+    {"glFogCoordd", P(GL_FogCoordd)},
+    {"glLoadMatrixf", P(GL_LoadMatrixf)},
+    {"glMultiDrawArraysInstancedBaseInstanceANGLE", P(GL_MultiDrawArraysInstancedBaseInstanceANGLE)},
+    {"glGetNamedFramebufferParameteriv", P(GL_GetNamedFramebufferParameteriv)},
+    {"glVertexArrayAttribIFormat", P(GL_VertexArrayAttribIFormat)},
+    {"glGetQueryObjectuiv", P(GL_GetQueryObjectuiv)},
+    {"glGetFramebufferParameterivRobustANGLE", P(GL_GetFramebufferParameterivRobustANGLE)},
+    {"glVertex3iv", P(GL_Vertex3iv)},
+    {"glGetSamplerParameterIiv", P(GL_GetSamplerParameterIiv)},
+    {"glEndPerfMonitorAMD", P(GL_EndPerfMonitorAMD)},
+    {"glBlitNamedFramebuffer", P(GL_BlitNamedFramebuffer)},
+    {"glProgramUniform3iEXT", P(GL_ProgramUniform3iEXT)},
+    {"glIsSemaphoreEXT", P(GL_IsSemaphoreEXT)},
+    {"glVertex3fv", P(GL_Vertex3fv)},
+    {"glGetPerfMonitorGroupStringAMD", P(GL_GetPerfMonitorGroupStringAMD)},
+    {"glGetnMinmax", P(GL_GetnMinmax)},
+    {"glMultiTexCoord3sv", P(GL_MultiTexCoord3sv)},
+    {"glProgramUniform3i", P(GL_ProgramUniform3i)},
+    {"glFramebufferPixelLocalClearValueuivANGLE", P(GL_FramebufferPixelLocalClearValueuivANGLE)},
+    {"glDrawElementsInstancedEXT", P(GL_DrawElementsInstancedEXT)},
+    {"glInitNames", P(GL_InitNames)},
+    {"glDeleteSync", P(GL_DeleteSync)},
+    {"glSecondaryColor3ubv", P(GL_SecondaryColor3ubv)},
+    {"glUniform4fv", P(GL_Uniform4fv)},
+    {"glVertexAttrib4Nbv", P(GL_VertexAttrib4Nbv)},
+    {"glNamedFramebufferParameteri", P(GL_NamedFramebufferParameteri)},
+    {"glRotated", P(GL_Rotated)},
+    {"glGetnUniformdv", P(GL_GetnUniformdv)},
+    {"glVertexAttribI2iv", P(GL_VertexAttribI2iv)},
+    {"glClampColor", P(GL_ClampColor)},
+    {"glTexCoord2fv", P(GL_TexCoord2fv)},
+    {"glFramebufferTextureOES", P(GL_FramebufferTextureOES)},
+    {"glMultiDrawElementsANGLE", P(GL_MultiDrawElementsANGLE)},
+    {"glBlendFuncSeparateiEXT", P(GL_BlendFuncSeparateiEXT)},
+    {"glIsSync", P(GL_IsSync)},
+    {"glSamplerParameterIuivOES", P(GL_SamplerParameterIuivOES)},
     {"glUniformMatrix4fv", P(GL_UniformMatrix4fv)},
-    {"glUniformMatrix4x2dv", P(GL_UniformMatrix4x2dv)},
-    {"glUniformMatrix4x2fv", P(GL_UniformMatrix4x2fv)},
-    {"glUniformMatrix4x3dv", P(GL_UniformMatrix4x3dv)},
-    {"glUniformMatrix4x3fv", P(GL_UniformMatrix4x3fv)},
-    {"glUniformSubroutinesuiv", P(GL_UniformSubroutinesuiv)},
-    {"glUnmapBuffer", P(GL_UnmapBuffer)},
-    {"glUnmapBufferOES", P(GL_UnmapBufferOES)},
-    {"glUnmapNamedBuffer", P(GL_UnmapNamedBuffer)},
-    {"glUseProgram", P(GL_UseProgram)},
-    {"glUseProgramStages", P(GL_UseProgramStages)},
-    {"glUseProgramStagesEXT", P(GL_UseProgramStagesEXT)},
-    {"glValidateProgram", P(GL_ValidateProgram)},
-    {"glValidateProgramPipeline", P(GL_ValidateProgramPipeline)},
-    {"glValidateProgramPipelineEXT", P(GL_ValidateProgramPipelineEXT)},
-    {"glVertex2d", P(GL_Vertex2d)},
-    {"glVertex2dv", P(GL_Vertex2dv)},
-    {"glVertex2f", P(GL_Vertex2f)},
-    {"glVertex2fv", P(GL_Vertex2fv)},
-    {"glVertex2i", P(GL_Vertex2i)},
-    {"glVertex2iv", P(GL_Vertex2iv)},
-    {"glVertex2s", P(GL_Vertex2s)},
-    {"glVertex2sv", P(GL_Vertex2sv)},
+    {"glGetPolygonStipple", P(GL_GetPolygonStipple)},
+    {"glUniformMatrix3x4fv", P(GL_UniformMatrix3x4fv)},
+    {"glGetTextureParameterfv", P(GL_GetTextureParameterfv)},
+    {"glProgramUniform3fEXT", P(GL_ProgramUniform3fEXT)},
+    {"glDrawTexfvOES", P(GL_DrawTexfvOES)},
+    {"glNamedBufferData", P(GL_NamedBufferData)},
+    {"glGetPerfMonitorCountersAMD", P(GL_GetPerfMonitorCountersAMD)},
+    {"glMultiTexCoord2d", P(GL_MultiTexCoord2d)},
+    {"glGetPointervRobustANGLERobustANGLE", P(GL_GetPointervRobustANGLERobustANGLE)},
+    {"glProgramUniformMatrix2x3fv", P(GL_ProgramUniformMatrix2x3fv)},
+    {"glGetProgramBinaryOES", P(GL_GetProgramBinaryOES)},
+    {"glNormal3x", P(GL_Normal3x)},
+    {"glMultiTexCoordP3uiv", P(GL_MultiTexCoordP3uiv)},
+    {"glPauseTransformFeedback", P(GL_PauseTransformFeedback)},
+    {"glProgramUniform3ui", P(GL_ProgramUniform3ui)},
+    {"glRasterPos4sv", P(GL_RasterPos4sv)},
+    {"glTexCoord2dv", P(GL_TexCoord2dv)},
+    {"glGenQueriesEXT", P(GL_GenQueriesEXT)},
     {"glVertex3d", P(GL_Vertex3d)},
-    {"glVertex3dv", P(GL_Vertex3dv)},
-    {"glVertex3f", P(GL_Vertex3f)},
-    {"glVertex3fv", P(GL_Vertex3fv)},
-    {"glVertex3i", P(GL_Vertex3i)},
-    {"glVertex3iv", P(GL_Vertex3iv)},
-    {"glVertex3s", P(GL_Vertex3s)},
-    {"glVertex3sv", P(GL_Vertex3sv)},
-    {"glVertex4d", P(GL_Vertex4d)},
-    {"glVertex4dv", P(GL_Vertex4dv)},
-    {"glVertex4f", P(GL_Vertex4f)},
-    {"glVertex4fv", P(GL_Vertex4fv)},
-    {"glVertex4i", P(GL_Vertex4i)},
-    {"glVertex4iv", P(GL_Vertex4iv)},
-    {"glVertex4s", P(GL_Vertex4s)},
     {"glVertex4sv", P(GL_Vertex4sv)},
-    {"glVertexArrayAttribBinding", P(GL_VertexArrayAttribBinding)},
-    {"glVertexArrayAttribFormat", P(GL_VertexArrayAttribFormat)},
-    {"glVertexArrayAttribIFormat", P(GL_VertexArrayAttribIFormat)},
-    {"glVertexArrayAttribLFormat", P(GL_VertexArrayAttribLFormat)},
-    {"glVertexArrayBindingDivisor", P(GL_VertexArrayBindingDivisor)},
-    {"glVertexArrayElementBuffer", P(GL_VertexArrayElementBuffer)},
-    {"glVertexArrayVertexBuffer", P(GL_VertexArrayVertexBuffer)},
-    {"glVertexArrayVertexBuffers", P(GL_VertexArrayVertexBuffers)},
-    {"glVertexAttrib1d", P(GL_VertexAttrib1d)},
-    {"glVertexAttrib1dv", P(GL_VertexAttrib1dv)},
-    {"glVertexAttrib1f", P(GL_VertexAttrib1f)},
-    {"glVertexAttrib1fv", P(GL_VertexAttrib1fv)},
-    {"glVertexAttrib1s", P(GL_VertexAttrib1s)},
-    {"glVertexAttrib1sv", P(GL_VertexAttrib1sv)},
-    {"glVertexAttrib2d", P(GL_VertexAttrib2d)},
-    {"glVertexAttrib2dv", P(GL_VertexAttrib2dv)},
-    {"glVertexAttrib2f", P(GL_VertexAttrib2f)},
-    {"glVertexAttrib2fv", P(GL_VertexAttrib2fv)},
-    {"glVertexAttrib2s", P(GL_VertexAttrib2s)},
-    {"glVertexAttrib2sv", P(GL_VertexAttrib2sv)},
-    {"glVertexAttrib3d", P(GL_VertexAttrib3d)},
-    {"glVertexAttrib3dv", P(GL_VertexAttrib3dv)},
-    {"glVertexAttrib3f", P(GL_VertexAttrib3f)},
-    {"glVertexAttrib3fv", P(GL_VertexAttrib3fv)},
-    {"glVertexAttrib3s", P(GL_VertexAttrib3s)},
-    {"glVertexAttrib3sv", P(GL_VertexAttrib3sv)},
-    {"glVertexAttrib4Nbv", P(GL_VertexAttrib4Nbv)},
-    {"glVertexAttrib4Niv", P(GL_VertexAttrib4Niv)},
-    {"glVertexAttrib4Nsv", P(GL_VertexAttrib4Nsv)},
-    {"glVertexAttrib4Nub", P(GL_VertexAttrib4Nub)},
-    {"glVertexAttrib4Nubv", P(GL_VertexAttrib4Nubv)},
-    {"glVertexAttrib4Nuiv", P(GL_VertexAttrib4Nuiv)},
-    {"glVertexAttrib4Nusv", P(GL_VertexAttrib4Nusv)},
-    {"glVertexAttrib4bv", P(GL_VertexAttrib4bv)},
-    {"glVertexAttrib4d", P(GL_VertexAttrib4d)},
-    {"glVertexAttrib4dv", P(GL_VertexAttrib4dv)},
-    {"glVertexAttrib4f", P(GL_VertexAttrib4f)},
-    {"glVertexAttrib4fv", P(GL_VertexAttrib4fv)},
-    {"glVertexAttrib4iv", P(GL_VertexAttrib4iv)},
-    {"glVertexAttrib4s", P(GL_VertexAttrib4s)},
-    {"glVertexAttrib4sv", P(GL_VertexAttrib4sv)},
-    {"glVertexAttrib4ubv", P(GL_VertexAttrib4ubv)},
-    {"glVertexAttrib4uiv", P(GL_VertexAttrib4uiv)},
-    {"glVertexAttrib4usv", P(GL_VertexAttrib4usv)},
-    {"glVertexAttribBinding", P(GL_VertexAttribBinding)},
-    {"glVertexAttribDivisor", P(GL_VertexAttribDivisor)},
-    {"glVertexAttribDivisorANGLE", P(GL_VertexAttribDivisorANGLE)},
-    {"glVertexAttribDivisorEXT", P(GL_VertexAttribDivisorEXT)},
-    {"glVertexAttribFormat", P(GL_VertexAttribFormat)},
-    {"glVertexAttribI1i", P(GL_VertexAttribI1i)},
-    {"glVertexAttribI1iv", P(GL_VertexAttribI1iv)},
-    {"glVertexAttribI1ui", P(GL_VertexAttribI1ui)},
+    {"glEvalCoord2d", P(GL_EvalCoord2d)},
     {"glVertexAttribI1uiv", P(GL_VertexAttribI1uiv)},
-    {"glVertexAttribI2i", P(GL_VertexAttribI2i)},
-    {"glVertexAttribI2iv", P(GL_VertexAttribI2iv)},
-    {"glVertexAttribI2ui", P(GL_VertexAttribI2ui)},
+    {"glListBase", P(GL_ListBase)},
+    {"glMultiDrawElementsBaseVertex", P(GL_MultiDrawElementsBaseVertex)},
+    {"glGetProgramiv", P(GL_GetProgramiv)},
     {"glVertexAttribI2uiv", P(GL_VertexAttribI2uiv)},
-    {"glVertexAttribI3i", P(GL_VertexAttribI3i)},
-    {"glVertexAttribI3iv", P(GL_VertexAttribI3iv)},
-    {"glVertexAttribI3ui", P(GL_VertexAttribI3ui)},
-    {"glVertexAttribI3uiv", P(GL_VertexAttribI3uiv)},
-    {"glVertexAttribI4bv", P(GL_VertexAttribI4bv)},
-    {"glVertexAttribI4i", P(GL_VertexAttribI4i)},
-    {"glVertexAttribI4iv", P(GL_VertexAttribI4iv)},
-    {"glVertexAttribI4sv", P(GL_VertexAttribI4sv)},
-    {"glVertexAttribI4ubv", P(GL_VertexAttribI4ubv)},
-    {"glVertexAttribI4ui", P(GL_VertexAttribI4ui)},
-    {"glVertexAttribI4uiv", P(GL_VertexAttribI4uiv)},
-    {"glVertexAttribI4usv", P(GL_VertexAttribI4usv)},
-    {"glVertexAttribIFormat", P(GL_VertexAttribIFormat)},
-    {"glVertexAttribIPointer", P(GL_VertexAttribIPointer)},
-    {"glVertexAttribL1d", P(GL_VertexAttribL1d)},
-    {"glVertexAttribL1dv", P(GL_VertexAttribL1dv)},
-    {"glVertexAttribL2d", P(GL_VertexAttribL2d)},
-    {"glVertexAttribL2dv", P(GL_VertexAttribL2dv)},
-    {"glVertexAttribL3d", P(GL_VertexAttribL3d)},
-    {"glVertexAttribL3dv", P(GL_VertexAttribL3dv)},
-    {"glVertexAttribL4d", P(GL_VertexAttribL4d)},
-    {"glVertexAttribL4dv", P(GL_VertexAttribL4dv)},
-    {"glVertexAttribLFormat", P(GL_VertexAttribLFormat)},
-    {"glVertexAttribLPointer", P(GL_VertexAttribLPointer)},
-    {"glVertexAttribP1ui", P(GL_VertexAttribP1ui)},
-    {"glVertexAttribP1uiv", P(GL_VertexAttribP1uiv)},
-    {"glVertexAttribP2ui", P(GL_VertexAttribP2ui)},
-    {"glVertexAttribP2uiv", P(GL_VertexAttribP2uiv)},
-    {"glVertexAttribP3ui", P(GL_VertexAttribP3ui)},
-    {"glVertexAttribP3uiv", P(GL_VertexAttribP3uiv)},
-    {"glVertexAttribP4ui", P(GL_VertexAttribP4ui)},
-    {"glVertexAttribP4uiv", P(GL_VertexAttribP4uiv)},
-    {"glVertexAttribPointer", P(GL_VertexAttribPointer)},
-    {"glVertexBindingDivisor", P(GL_VertexBindingDivisor)},
-    {"glVertexP2ui", P(GL_VertexP2ui)},
-    {"glVertexP2uiv", P(GL_VertexP2uiv)},
-    {"glVertexP3ui", P(GL_VertexP3ui)},
-    {"glVertexP3uiv", P(GL_VertexP3uiv)},
-    {"glVertexP4ui", P(GL_VertexP4ui)},
-    {"glVertexP4uiv", P(GL_VertexP4uiv)},
-    {"glVertexPointer", P(GL_VertexPointer)},
-    {"glViewport", P(GL_Viewport)},
-    {"glViewportArrayv", P(GL_ViewportArrayv)},
-    {"glViewportIndexedf", P(GL_ViewportIndexedf)},
-    {"glViewportIndexedfv", P(GL_ViewportIndexedfv)},
-    {"glWaitSemaphoreEXT", P(GL_WaitSemaphoreEXT)},
-    {"glWaitSync", P(GL_WaitSync)},
-    {"glWeightPointerOES", P(GL_WeightPointerOES)},
-    {"glWindowPos2d", P(GL_WindowPos2d)},
-    {"glWindowPos2dv", P(GL_WindowPos2dv)},
-    {"glWindowPos2f", P(GL_WindowPos2f)},
-    {"glWindowPos2fv", P(GL_WindowPos2fv)},
-    {"glWindowPos2i", P(GL_WindowPos2i)},
-    {"glWindowPos2iv", P(GL_WindowPos2iv)},
-    {"glWindowPos2s", P(GL_WindowPos2s)},
-    {"glWindowPos2sv", P(GL_WindowPos2sv)},
-    {"glWindowPos3d", P(GL_WindowPos3d)},
-    {"glWindowPos3dv", P(GL_WindowPos3dv)},
-    {"glWindowPos3f", P(GL_WindowPos3f)},
-    {"glWindowPos3fv", P(GL_WindowPos3fv)},
-    {"glWindowPos3i", P(GL_WindowPos3i)},
-    {"glWindowPos3iv", P(GL_WindowPos3iv)},
-    {"glWindowPos3s", P(GL_WindowPos3s)},
-    {"glWindowPos3sv", P(GL_WindowPos3sv)},
-    {"wglChoosePixelFormat", P(wglChoosePixelFormat)},
-    {"wglCopyContext", P(wglCopyContext)},
-    {"wglCreateContext", P(wglCreateContext)},
-    {"wglCreateLayerContext", P(wglCreateLayerContext)},
-    {"wglDeleteContext", P(wglDeleteContext)},
-    {"wglDescribeLayerPlane", P(wglDescribeLayerPlane)},
-    {"wglDescribePixelFormat", P(wglDescribePixelFormat)},
-    {"wglGetCurrentContext", P(wglGetCurrentContext)},
-    {"wglGetCurrentDC", P(wglGetCurrentDC)},
-    {"wglGetEnhMetaFilePixelFormat", P(wglGetEnhMetaFilePixelFormat)},
-    {"wglGetLayerPaletteEntries", P(wglGetLayerPaletteEntries)},
-    {"wglGetPixelFormat", P(wglGetPixelFormat)},
-    {"wglGetProcAddress", P(wglGetProcAddress)},
-    {"wglMakeCurrent", P(wglMakeCurrent)},
-    {"wglRealizeLayerPalette", P(wglRealizeLayerPalette)},
-    {"wglSetLayerPaletteEntries", P(wglSetLayerPaletteEntries)},
-    {"wglSetPixelFormat", P(wglSetPixelFormat)},
-    {"wglShareLists", P(wglShareLists)},
-    {"wglSwapBuffers", P(wglSwapBuffers)},
-    {"wglSwapLayerBuffers", P(wglSwapLayerBuffers)},
-    {"wglUseFontBitmaps", P(wglUseFontBitmaps)},
-    {"wglUseFontBitmapsA", P(wglUseFontBitmapsA)},
-    {"wglUseFontBitmapsW", P(wglUseFontBitmapsW)},
-    {"wglUseFontOutlines", P(wglUseFontOutlines)},
-    {"wglUseFontOutlinesA", P(wglUseFontOutlinesA)},
-    {"wglUseFontOutlinesW", P(wglUseFontOutlinesW)},
+    {"glUniform1dv", P(GL_Uniform1dv)},
+    {"glGetTexParameteriv", P(GL_GetTexParameteriv)},
+    {"glGetLightiv", P(GL_GetLightiv)},
+    {"glFramebufferTexture3D", P(GL_FramebufferTexture3D)},
+    {"glTexStorageMemFlags2DMultisampleANGLE", P(GL_TexStorageMemFlags2DMultisampleANGLE)},
+    {"glPolygonStipple", P(GL_PolygonStipple)},
+    {"glGetQueryBufferObjectiv", P(GL_GetQueryBufferObjectiv)},
+    {"glBindBufferRange", P(GL_BindBufferRange)},
+    {"glSetFenceNV", P(GL_SetFenceNV)},
+    {"glSamplerParameterIuivEXT", P(GL_SamplerParameterIuivEXT)},
+    {"glProgramUniformMatrix3fv", P(GL_ProgramUniformMatrix3fv)},
+    {"glProgramUniformMatrix3x2fvEXT", P(GL_ProgramUniformMatrix3x2fvEXT)},
+    {"glProgramUniformMatrix4x2fvEXT", P(GL_ProgramUniformMatrix4x2fvEXT)},
+    {"glColorP3uiv", P(GL_ColorP3uiv)},
+    {"glProgramUniform2uiv", P(GL_ProgramUniform2uiv)},
+    {"glRenderbufferStorage", P(GL_RenderbufferStorage)},
+    {"glEndList", P(GL_EndList)},
+    {"glBindFragDataLocation", P(GL_BindFragDataLocation)},
+    {"glDeleteProgram", P(GL_DeleteProgram)},
+    {"glGenVertexArraysOES", P(GL_GenVertexArraysOES)},
+    {"glGetInternalformativRobustANGLE", P(GL_GetInternalformativRobustANGLE)},
+    {"glInvalidateTextureANGLE", P(GL_InvalidateTextureANGLE)},
+    {"glGetSamplerParameterIuiv", P(GL_GetSamplerParameterIuiv)},
+    {"glTexParameterfv", P(GL_TexParameterfv)},
+    {"glGetIntegerv", P(GL_GetIntegerv)},
 };
 // clang-format on
 const size_t g_numProcs = std::size(g_procTable);
+
+const ProcEntry *FindProcEntry(const char *name)
+{
+    const ProcEntry &entry = g_procTable[MinimalPerfectHash(name, kProcSeeds, 506, 1516)];
+    return entry.first != nullptr && strcmp(entry.first, name) == 0 ? &entry : nullptr;
+}
 }  // namespace wgl
@@ -56,6 +56,7 @@ constexpr double kNanoSecondsPerSecond                   = 1e9;
 constexpr size_t kNumberOfStepsPerformedToComputeGPUTime = 16;
 constexpr char kPeakMemoryMetric[]                       = ".memory_max";
 constexpr char kMedianMemoryMetric[]                     = ".memory_median";
+constexpr char kSampleDoneMarker[]                       = "ANGLE_PERF_SAMPLE_DONE";
 
 struct TraceCategory
 {
@@ -275,6 +276,23 @@ bool ATraceEnabled()
 }
 void ATraceCounter(const char *counterName, int64_t counterValue) {}
 #endif
+
+// With --sample-server, run_perf_tests.py keeps the test process alive between samples instead of
+// relaunching it. After each sample the outputs recorded so far are written, then the runner is
+// notified and asked whether to run another sample ("sample") or to finish ("quit" or EOF).
+bool WaitForNextSampleRequest(uint32_t samplesDone)
+{
+    TestSuite::GetInstance()->flushPerfOutputs();
+    printf("%s %u\n", kSampleDoneMarker, samplesDone);
+    fflush(stdout);
+
+    char command[32] = {};
+    if (fgets(command, sizeof(command), stdin) == nullptr)
+    {
+        return false;
+    }
+    return strncmp(command, "sample", strlen("sample")) == 0;
+}
 }  // anonymous namespace
 
 TraceEvent::TraceEvent(char phaseIn,
@@ -351,20 +369,16 @@ void ANGLEPerfTest::run()
 
     ATraceCounter("TraceStage", 3);
 
-    for (uint32_t trial = 0; trial < numTrials; ++trial)
+    // Each sample of a sample server counts its steps from where the first sample started, like
+    // a test process run for a single sample, so that --max-steps-performed applies per sample.
+    int totalStepsBeforeSamples = mTotalNumStepsPerformed;
+    uint32_t samplesDone        = 0;
+    do
     {
-        runTrial(gTrialTimeSeconds, mStepsToRun, RunTrialPolicy::RunContinuously);
-        processResults();
-        if (gVerboseLogging)
-        {
-            double trialTime = mTrialTimer.getElapsedWallClockTime();
-            printf("Trial %d time: %.2lf seconds.\n", trial + 1, trialTime);
-
-            double secondsPerStep      = trialTime / static_cast<double>(mTrialNumStepsPerformed);
-            double secondsPerIteration = secondsPerStep / static_cast<double>(mIterationsPerStep);
-            mTestTrialResults.push_back(secondsPerIteration * 1000.0);
-        }
-    }
+        mTotalNumStepsPerformed = totalStepsBeforeSamples;
+        runSample(numTrials);
+        samplesDone++;
+    } while (gSampleServer && WaitForNextSampleRequest(samplesDone));
 
     ATraceCounter("TraceStage", 0);
 
@@ -396,6 +410,24 @@ void ANGLEPerfTest::run()
     }
 }
 
+void ANGLEPerfTest::runSample(uint32_t numTrials)
+{
+    for (uint32_t trial = 0; trial < numTrials; ++trial)
+    {
+        runTrial(gTrialTimeSeconds, mStepsToRun, RunTrialPolicy::RunContinuously);
+        processResults();
+        if (gVerboseLogging)
+        {
+            double trialTime = mTrialTimer.getElapsedWallClockTime();
+            printf("Trial %d time: %.2lf seconds.\n", trial + 1, trialTime);
+
+            double secondsPerStep      = trialTime / static_cast<double>(mTrialNumStepsPerformed);
+            double secondsPerIteration = secondsPerStep / static_cast<double>(mIterationsPerStep);
+            mTestTrialResults.push_back(secondsPerIteration * 1000.0);
+        }
+    }
+}
+
 void ANGLEPerfTest::runTrial(double maxRunTime, int maxStepsToRun, RunTrialPolicy runPolicy)
 {
     mTrialNumStepsPerformed = 0;
@@ -104,6 +104,7 @@ class ANGLEPerfTest : public testing::Test, angle::NonCopyable
     int getNumStepsPerformed() const { return mTrialNumStepsPerformed; }
 
     void runTrial(double maxRunTime, int maxStepsToRun, RunTrialPolicy runPolicy);
+    void runSample(uint32_t numTrials);
 
     // Overriden in trace perf tests.
     virtual void saveScreenshot(const std::string &screenshotName) {}
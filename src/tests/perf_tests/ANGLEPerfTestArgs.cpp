@@ -48,7 +48,10 @@ int gFixedTestTimeWithWarmup       = 0;
 const char *gTraceInterpreter      = nullptr;
 const char *gPrintExtensionsToFile = nullptr;
 const char *gRequestedExtensions   = nullptr;
+const char *gContextVersion        = nullptr;
+bool gIgnoreRequiredExtensions     = false;
 bool gIncludeInactiveResources     = false;
+bool gSampleServer                 = false;
 
 namespace
 {
@@ -61,6 +64,7 @@ bool PerfTestArg(int *argc, char **argv, int argIndex)
            ParseFlag("--verbose-logging", argc, argv, argIndex, &gVerboseLogging) ||
            ParseFlag("--no-finish", argc, argv, argIndex, &gNoFinish) ||
            ParseFlag("--warmup", argc, argv, argIndex, &gWarmup) ||
+           ParseFlag("--sample-server", argc, argv, argIndex, &gSampleServer) ||
            ParseCStringArg("--trace-file", argc, argv, argIndex, &gTraceFile) ||
            ParseCStringArg("--perf-counters", argc, argv, argIndex, &gPerfCounters) ||
            ParseIntArg("--steps-per-trial", argc, argv, argIndex, &gStepsPerTrial) ||
@@ -91,6 +95,9 @@ bool TraceTestArg(int *argc, char **argv, int argIndex)
            ParseCStringArg("--print-extensions-to-file", argc, argv, argIndex,
                            &gPrintExtensionsToFile) ||
            ParseCStringArg("--request-extensions", argc, argv, argIndex, &gRequestedExtensions) ||
+           ParseCStringArg("--context-version", argc, argv, argIndex, &gContextVersion) ||
+           ParseFlag("--ignore-required-extensions", argc, argv, argIndex,
+                     &gIgnoreRequiredExtensions) ||
            ParseFlag("--include-inactive-resources", argc, argv, argIndex,
                      &gIncludeInactiveResources);
 }
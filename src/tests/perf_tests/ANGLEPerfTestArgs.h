@@ -40,7 +40,10 @@ extern bool gOffscreen;
 extern bool gVsync;
 extern const char *gPrintExtensionsToFile;
 extern const char *gRequestedExtensions;
+extern const char *gContextVersion;
+extern bool gIgnoreRequiredExtensions;
 extern bool gIncludeInactiveResources;
+extern bool gSampleServer;
 
 // Constant for when trace's frame count should be used
 constexpr int kAllFrames = -1;
@@ -0,0 +1,76 @@
+//
+// Copyright 2026 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// EGLGetProcAddressPerfTest:
+//   Performance test for eglGetProcAddress. Resolves every EGL and GL entry point like an
+//   application loading them at startup. The WGL and CL entry points are resolved through other
+//   libraries and aren't covered.
+//
+
+#include "ANGLEPerfTest.h"
+#include "common/entry_points_enum_autogen.h"
+#include "common/system_utils.h"
+#include "util/egl_loader_autogen.h"
+
+using namespace testing;
+
+namespace
+{
+class EGLGetProcAddressPerfTest : public ANGLEPerfTest
+{
+  public:
+    EGLGetProcAddressPerfTest();
+
+    void step() override;
+
+  private:
+    std::unique_ptr<angle::Library> mEGLLibrary;
+    LoadProc mGetProc;
+    std::vector<const char *> mNames;
+    // The entry points are resolved into this table rather than with the util loaders, which would
+    // replace the entry points used by the other tests.
+    std::vector<GenericProc> mProcs;
+};
+
+EGLGetProcAddressPerfTest::EGLGetProcAddressPerfTest()
+    : ANGLEPerfTest("EGLGetProcAddress", "", "_run", 1), mGetProc(nullptr)
+{
+    mEGLLibrary.reset(
+        angle::OpenSharedLibrary(ANGLE_EGL_LIBRARY_NAME, angle::SearchType::ModuleDir));
+    if (mEGLLibrary)
+    {
+        mGetProc = reinterpret_cast<LoadProc>(mEGLLibrary->getSymbol("eglGetProcAddress"));
+    }
+
+    if (!mGetProc)
+    {
+        abortTest();
+    }
+
+    for (int entryPoint = static_cast<int>(angle::EntryPoint::Invalid) + 1;
+         entryPoint < angle::kEntryPointCount; ++entryPoint)
+    {
+        const char *name = angle::GetEntryPointName(static_cast<angle::EntryPoint>(entryPoint));
+        if (strncmp(name, "egl", 3) == 0 || strncmp(name, "gl", 2) == 0)
+        {
+            mNames.push_back(name);
+        }
+    }
+    mProcs.resize(mNames.size());
+}
+
+void EGLGetProcAddressPerfTest::step()
+{
+    for (size_t index = 0; index < mNames.size(); ++index)
+    {
+        mProcs[index] = mGetProc(mNames[index]);
+    }
+}
+
+TEST_F(EGLGetProcAddressPerfTest, Run)
+{
+    run();
+}
+}  // anonymous namespace
@@ -0,0 +1,89 @@
+//
+// Copyright 2026 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// GLEnumUtilsPerf:
+//   Performance test for the GLenum to string conversions used by the debug output and the
+//   capture/replay tools.
+//
+
+#include "ANGLEPerfTest.h"
+#include "common/gl_enum_utils.h"
+
+#include <cstring>
+#include <string>
+#include <vector>
+
+namespace
+{
+constexpr unsigned int kMaxEnumValue = 0x10000;
+
+class GLEnumUtilsPerfTest : public ANGLEPerfTest
+{
+  public:
+    GLEnumUtilsPerfTest(const char *story);
+
+  protected:
+    // The GLenums known to GLenumToString, as values and names.
+    std::vector<unsigned int> mValues;
+    std::vector<std::string> mNames;
+    size_t mSink = 0;
+};
+
+GLEnumUtilsPerfTest::GLEnumUtilsPerfTest(const char *story)
+    : ANGLEPerfTest("GLEnumUtilsPerf", "", story, 1)
+{
+    for (unsigned int value = 0; value < kMaxEnumValue; ++value)
+    {
+        const char *name = gl::GLenumToString(gl::GLESEnum::AllEnums, value);
+        if (strncmp(name, "GL_", 3) == 0)
+        {
+            mValues.push_back(value);
+            mNames.push_back(name);
+        }
+    }
+}
+
+class GLenumToStringPerfTest : public GLEnumUtilsPerfTest
+{
+  public:
+    GLenumToStringPerfTest() : GLEnumUtilsPerfTest("_gl_enum_to_string") {}
+    void step() override;
+};
+
+void GLenumToStringPerfTest::step()
+{
+    for (unsigned int value : mValues)
+    {
+        mSink += reinterpret_cast<uintptr_t>(gl::GLenumToString(gl::GLESEnum::AllEnums, value));
+    }
+}
+
+class StringToGLenumPerfTest : public GLEnumUtilsPerfTest
+{
+  public:
+    StringToGLenumPerfTest() : GLEnumUtilsPerfTest("_string_to_gl_enum") {}
+    void step() override;
+};
+
+void StringToGLenumPerfTest::step()
+{
+    for (const std::string &name : mNames)
+    {
+        mSink += gl::StringToGLenum(name.c_str());
+    }
+}
+
+TEST_F(GLenumToStringPerfTest, Run)
+{
+    run();
+    ASSERT_NE(mSink, 0u);
+}
+
+TEST_F(StringToGLenumPerfTest, Run)
+{
+    run();
+    ASSERT_NE(mSink, 0u);
+}
+}  // anonymous namespace
@@ -2712,6 +2712,17 @@ void RegisterTraceTests()
         }
     }
 
+    // The context version and the required extensions of the trace JSON can be overridden, e.g. by
+    // retrace_restricted_traces.py when it searches for the minimum requirements of a trace.
+    int contextMajorVersion = 0;
+    int contextMinorVersion = 0;
+    if (gContextVersion != nullptr &&
+        sscanf(gContextVersion, "%d.%d", &contextMajorVersion, &contextMinorVersion) != 2)
+    {
+        ERR() << "Invalid context version, expected <major>.<minor>: " << gContextVersion;
+        return;
+    }
+
     std::vector<TraceInfo> traceInfos;
     for (const std::string &trace : traces)
     {
@@ -2724,6 +2735,16 @@ void RegisterTraceTests()
         strncpy(traceInfo.name, trace.c_str(), kTraceInfoMaxNameLen);
         traceInfo.initialized = LoadTraceInfoFromJSON(trace, traceJsonPath, &traceInfo);
 
+        if (gContextVersion != nullptr)
+        {
+            traceInfo.contextClientMajorVersion = contextMajorVersion;
+            traceInfo.contextClientMinorVersion = contextMinorVersion;
+        }
+        if (gIgnoreRequiredExtensions)
+        {
+            traceInfo.requiredExtensions.clear();
+        }
+
         traceInfos.push_back(traceInfo);
     }
 
@@ -33,6 +33,7 @@ class _Global(object):
     traces_outside_of_apk = False
     temp_dir = None
     use_run_as = True
+    adb_shell = None
 
 
 def _ApkPath(suite_name):
@@ -101,15 +102,19 @@ def _EnsureTestSuite(suite_name):
         _Global.current_suite = suite_name
 
 
-def _Run(cmd):
-    logging.debug('Executing command: %s', cmd)
+def _StartupInfo():
     startupinfo = None
     if hasattr(subprocess, 'STARTUPINFO'):
         # Prevent console window popping up on Windows
         startupinfo = subprocess.STARTUPINFO()
         startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
         startupinfo.wShowWindow = subprocess.SW_HIDE
-    output = subprocess.check_output(cmd, startupinfo=startupinfo)
+    return startupinfo
+
+
+def _Run(cmd):
+    logging.debug('Executing command: %s', cmd)
+    output = subprocess.check_output(cmd, startupinfo=_StartupInfo())
     return output
 
 
@@ -124,12 +129,121 @@ def _FindAdb():
     return adb
 
 
+# A long-lived `adb shell` that runs commands one after the other, which saves starting adb and
+# connecting to the device for each of them. Each command runs in its own `sh -c` as with
+# `adb shell <cmd>`, and its output is followed by a marker line with its exit status. Commands
+# can be sent in batches, in which case they all go to the device at once.
+class AdbShellSession(object):
+
+    def __init__(self, adb_args, stderr=None):
+        self._adb_args = adb_args
+        self._stderr = stderr
+        self._marker = ('ANGLE_ADB_SHELL_%s' % _RandomHex()).encode()
+        self._process = None
+        self._buffer = b''
+        self._lock = threading.Lock()
+
+    def _Start(self):
+        logging.debug('Starting adb shell session: %s', self._adb_args)
+        self._process = subprocess.Popen(
+            self._adb_args + ['shell', 'sh'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=self._stderr,
+            startupinfo=_StartupInfo())
+        self._buffer = b''
+
+    def Close(self):
+        with self._lock:
+            self._Close()
+
+    def _Close(self):
+        if self._process:
+            try:
+                self._process.stdin.close()
+            except OSError:
+                pass  # The commands left to write when the shell ended
+            self._process.wait()
+            self._process.stdout.close()
+            self._process = None
+
+    def _ReadResult(self, cmd):
+        while True:
+            index = self._buffer.find(self._marker)
+            end = self._buffer.find(b'\n', index) if index != -1 else -1
+            if end != -1:
+                output = self._buffer[:index]
+                status = int(self._buffer[index + len(self._marker):end])
+                self._buffer = self._buffer[end + 1:]
+                return status, output
+
+            data = self._process.stdout.read1(65536)
+            if not data:
+                # The shell ended before the command did, e.g. adb lost the device.
+                raise subprocess.CalledProcessError(-1, cmd, self._buffer)
+            self._buffer += data
+
+    def _Write(self, script):
+        try:
+            self._process.stdin.write(script)
+            self._process.stdin.flush()
+        except OSError:
+            pass  # The shell ended, which _ReadResult reports.
+
+    # Runs the commands and returns their outputs. With check, raises CalledProcessError for the
+    # first command that failed, once all of them are done. Raises it in any case if the shell ends.
+    def RunBatch(self, cmds, check=True):
+        with self._lock:
+            if not self._process:
+                self._Start()
+
+            script = ''
+            for cmd in cmds:
+                logging.debug('Executing shell command: %s', cmd)
+                script += "sh -c '%s' </dev/null; echo %s$?\n" % (cmd.replace(
+                    "'", "'\\''"), self._marker.decode())
+            # Write from another thread, so that the outputs of the first commands of a large batch
+            # can't fill the pipes while the last ones are being written.
+            writer = threading.Thread(target=self._Write, args=(script.encode(),))
+            writer.start()
+            try:
+                results = [self._ReadResult(cmd) for cmd in cmds]
+            except BaseException:
+                # The remaining outputs would be mistaken for those of the next commands.
+                self._process.kill()
+                writer.join()
+                self._Close()
+                raise
+            writer.join()
+
+        for cmd, (status, output) in zip(cmds, results):
+            if check and status != 0:
+                raise subprocess.CalledProcessError(status, cmd, output)
+        return [output for _, output in results]
+
+    def Run(self, cmd, check=True):
+        return self.RunBatch([cmd], check)[0]
+
+
+def _GetAdbShellSession():
+    if not _Global.adb_shell:
+        _Global.adb_shell = AdbShellSession([_FindAdb()])
+    return _Global.adb_shell
+
+
 def _AdbRun(args):
+    if args[0] in ('root', 'unroot', 'reboot') and _Global.adb_shell:
+        # These restart adbd, which ends the shell.
+        _Global.adb_shell.Close()
     return _Run([_FindAdb()] + args)
 
 
 def _AdbShell(cmd):
-    return _Run([_FindAdb(), 'shell', cmd])
+    return _GetAdbShellSession().Run(cmd)
+
+
+def _AdbShellBatch(cmds):
+    return _GetAdbShellSession().RunBatch(cmds)
 
 
 def _GetAdbRoot():
@@ -236,14 +350,15 @@ def _LocalFileHash(local_path, gz_tail_size):
     return h.hexdigest()
 
 
-def _CompareHashes(local_path, device_path):
-    # The last 8 bytes of gzip contain CRC-32 and the initial file size and the preceding
-    # bytes should be affected by changes in the middle if we happen to run into a collision
-    gz_tail_size = 4096
+# The last 8 bytes of gzip contain CRC-32 and the initial file size and the preceding
+# bytes should be affected by changes in the middle if we happen to run into a collision
+_GZ_TAIL_SIZE = 4096
 
+
+def _DeviceHashCommand(local_path, device_path):
     if local_path.endswith('.gz'):
         cmd = 'test -f {path} && tail -c {gz_tail_size} {path} | sha256sum -b || true'.format(
-            path=device_path, gz_tail_size=gz_tail_size)
+            path=device_path, gz_tail_size=_GZ_TAIL_SIZE)
     else:
         cmd = 'test -f {path} && sha256sum -b {path} || true'.format(path=device_path)
 
@@ -251,12 +366,16 @@ def _CompareHashes(local_path, device_path):
         # Use run-as for files that reside on /data, which aren't accessible without root
         cmd = "run-as com.android.angle.test sh -c '{cmd}'".format(cmd=cmd)
 
-    device_hash = _AdbShell(cmd).decode().strip()
+    return cmd
+
+
+def _CompareHashes(local_path, device_path):
+    device_hash = _AdbShell(_DeviceHashCommand(local_path, device_path)).decode().strip()
     if not device_hash:
         logging.debug('_CompareHashes: File not found on device')
         return False  # file not on device
 
-    return _LocalFileHash(local_path, gz_tail_size) == device_hash
+    return _LocalFileHash(local_path, _GZ_TAIL_SIZE) == device_hash
 
 
 def _CheckSameApkInstalled(apk_path):
@@ -286,13 +405,12 @@ def _PrepareTestSuite(suite_name):
         'android.permission.READ_EXTERNAL_STORAGE', 'android.permission.RECORD_AUDIO',
         'android.permission.WRITE_EXTERNAL_STORAGE'
     ]
-    _AdbShell('for q in %s;do pm grant com.android.angle.test "$q";done;' %
-              (' '.join(permissions)))
-
-    _AdbShell('appops set com.android.angle.test MANAGE_EXTERNAL_STORAGE allow || true')
-
-    _AdbShell('mkdir -p /sdcard/chromium_tests_root/')
-    _AdbShell('mkdir -p %s' % _Global.temp_dir)
+    _AdbShellBatch([
+        'for q in %s;do pm grant com.android.angle.test "$q";done;' % (' '.join(permissions)),
+        'appops set com.android.angle.test MANAGE_EXTERNAL_STORAGE allow || true',
+        'mkdir -p /sdcard/chromium_tests_root/',
+        'mkdir -p %s' % _Global.temp_dir,
+    ])
 
     if suite_name == ANGLE_TRACE_TEST_SUITE:
         _AddRestrictedTracesJson()
@@ -307,80 +425,170 @@ def _PrepareTestSuite(suite_name):
         ])
 
 
-def PrepareRestrictedTraces(traces):
-    start = time.time()
-    total_size = 0
-    skipped = 0
+# Host file hashes from previous runs, keyed by path and valid while the size and mtime match.
+_LOCAL_HASH_CACHE_PATH = 'angle_local_file_hashes.json'
 
-    # In order to get files to the app's home directory and loadable as libraries, we must first
-    # push them to tmp on the device.  We then use `run-as` which allows copying files from tmp.
-    # Note that `mv` is not allowed with `run-as`.  This means there will briefly be two copies
-    # of the trace on the device, so keep that in mind as space becomes a problem in the future.
-    app_tmp_path = '/data/local/tmp/angle_traces/'
 
-    if _Global.use_run_as:
-        _AdbShell('mkdir -p ' + app_tmp_path +
-                  ' && run-as com.android.angle.test mkdir -p angle_traces')
+class _LocalHashCache(object):
+
+    def __init__(self, path):
+        self._path = path
+        self._hashes = {}
+        if os.path.exists(path):
+            try:
+                with open(path) as f:
+                    self._hashes = json.load(f)
+            except ValueError:
+                logging.warning('Ignoring invalid hash cache %s', path)
+
+    def Hash(self, local_path):
+        stat = os.stat(local_path)
+        key = os.path.abspath(local_path)
+        entry = self._hashes.get(key)
+        if not entry or entry['size'] != stat.st_size or entry['mtime'] != stat.st_mtime_ns:
+            entry = {
+                'size': stat.st_size,
+                'mtime': stat.st_mtime_ns,
+                'hash': _LocalFileHash(local_path, _GZ_TAIL_SIZE)
+            }
+            self._hashes[key] = entry
+        return entry['hash']
+
+    def Save(self):
+        with open(self._path + '.tmp', 'w') as f:
+            json.dump(self._hashes, f)
+        os.replace(self._path + '.tmp', self._path)
+
+
+# Returns a shell command listing "<hash> <path>" for the existing files matching the patterns (or
+# plain paths) in device_dir, hashed as _DeviceHashCommand does.
+def _DeviceHashListingCommand(device_dir, patterns, gz):
+    if gz:
+        hash_cmd = 'tail -c %d "$f" | sha256sum -b' % _GZ_TAIL_SIZE
     else:
-        _AdbShell('mkdir -p ' + app_tmp_path + ' /data/data/com.android.angle.test/angle_traces/')
+        hash_cmd = 'sha256sum -b "$f"'
+    cmd = 'cd %s && for f in %s; do test -f "$f" && echo "$(%s) $f"; done; true' % (
+        device_dir, ' '.join(patterns), hash_cmd)
 
-    def _HashesMatch(local_path, device_path):
-        nonlocal total_size, skipped
-        if _CompareHashes(local_path, device_path):
-            skipped += 1
-            return True
-        else:
-            total_size += os.path.getsize(local_path)
-            return False
-
-    def _Push(local_path, path_from_root):
-        device_path = '/sdcard/chromium_tests_root/' + path_from_root
-        if not _HashesMatch(local_path, device_path):
-            _AdbRun(['push', local_path, device_path])
-
-    def _PushLibToAppDir(lib_name):
-        local_path = lib_name
-        if not os.path.exists(local_path):
-            print('Error: missing library: ' + local_path)
-            print('Is angle_restricted_traces set in gn args?')  # b/294861737
-            sys.exit(1)
+    if _Global.use_run_as and device_dir.startswith('/data'):
+        # Use run-as for files that reside on /data, which aren't accessible without root
+        cmd = "run-as com.android.angle.test sh -c '{cmd}'".format(cmd=cmd)
 
-        device_path = '/data/user/0/com.android.angle.test/angle_traces/' + lib_name
-        if _HashesMatch(local_path, device_path):
-            return
+    return cmd
 
-        if _Global.use_run_as:
-            tmp_path = posixpath.join(app_tmp_path, lib_name)
-            logging.debug('_PushToAppDir: Pushing %s to %s' % (local_path, tmp_path))
-            try:
-                _AdbRun(['push', local_path, tmp_path])
-                _AdbShell('run-as com.android.angle.test cp ' + tmp_path + ' ./angle_traces/')
-                _AdbShell('rm ' + tmp_path)
-            finally:
-                _RemoveDeviceFile(tmp_path)
-        else:
-            _AdbRun(['push', local_path, '/data/data/com.android.angle.test/angle_traces/'])
 
-    # Set up each trace
-    for idx, trace in enumerate(sorted(traces)):
-        logging.info('Syncing %s trace (%d/%d)', trace, idx + 1, len(traces))
+def _ParseHashListing(listing):
+    hashes = {}
+    for line in listing.decode().splitlines():
+        if line.strip():
+            device_hash, path = line.split(' ', 1)
+            hashes[path] = device_hash
+    return hashes
 
-        path_from_root = 'src/tests/restricted_traces/' + trace + '/' + trace + '.angledata.gz'
-        _Push('../../' + path_from_root, path_from_root)
 
-        if _Global.traces_outside_of_apk:
-            lib_name = 'libangle_restricted_traces_' + trace + '.so'
-            _PushLibToAppDir(lib_name)
+def _ResetTarOwner(tarinfo):
+    # Files extracted as root would otherwise get the host user's ids
+    tarinfo.uid = tarinfo.gid = 0
+    tarinfo.uname = tarinfo.gname = ''
+    return tarinfo
+
+
+# Streams the (local_path, arcname) files to the device as a tar archive, extracted by the shell
+# command. This pushes all the files at once without making a copy of them first.
+def _PushTarStream(files, extract_cmd):
+    logging.debug('Streaming %d files to: %s', len(files), extract_cmd)
+    process = subprocess.Popen([_FindAdb(), 'shell', extract_cmd],
+                               stdin=subprocess.PIPE,
+                               startupinfo=_StartupInfo())
+    try:
+        with tarfile.open(fileobj=process.stdin, mode='w|', format=tarfile.GNU_FORMAT) as tar:
+            for local_path, arcname in files:
+                tar.add(local_path, arcname=arcname, filter=_ResetTarOwner)
+    finally:
+        process.stdin.close()
+        returncode = process.wait()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, extract_cmd)
 
+
+def PrepareRestrictedTraces(traces):
+    start = time.time()
+
+    tests_root = '/sdcard/chromium_tests_root'
+    if _Global.use_run_as:
+        # run-as starts in the app's home directory
+        app_traces_dir = 'angle_traces'
+        app_traces_device_dir = '/data/user/0/com.android.angle.test/angle_traces'
+    else:
+        app_traces_dir = app_traces_device_dir = '/data/data/com.android.angle.test/angle_traces'
+
+    files = []  # (local_path, path_from_root)
+    libs = []
+    for trace in sorted(traces):
+        path_from_root = 'src/tests/restricted_traces/' + trace + '/' + trace + '.angledata.gz'
+        files.append(('../../' + path_from_root, path_from_root))
         tracegz = 'gen/tracegz_' + trace + '.gz'
-        _Push(tracegz, tracegz)
+        files.append((tracegz, tracegz))
+        if _Global.traces_outside_of_apk:
+            libs.append('libangle_restricted_traces_' + trace + '.so')
 
     # Push one additional file when running outside the APK
     if _Global.traces_outside_of_apk:
-        _PushLibToAppDir('libangle_trace_interpreter.so')
+        libs.append('libangle_trace_interpreter.so')
+
+    for lib_name in libs:
+        if not os.path.exists(lib_name):
+            print('Error: missing library: ' + lib_name)
+            print('Is angle_restricted_traces set in gn args?')  # b/294861737
+            sys.exit(1)
+
+    # Get the hashes of the requested traces' files already on the device with a single batch of
+    # commands. Only these files are listed, so that syncing a single trace stays cheap when many
+    # other traces are on the device.
+    listing_cmds = [
+        'mkdir -p %s' % tests_root,
+        _DeviceHashListingCommand(
+            tests_root, [path_from_root for _, path_from_root in files], gz=True)
+    ]
+    if libs:
+        if _Global.use_run_as:
+            listing_cmds.append('run-as com.android.angle.test mkdir -p ' + app_traces_dir)
+        else:
+            listing_cmds.append('mkdir -p ' + app_traces_dir)
+        listing_cmds.append(_DeviceHashListingCommand(app_traces_device_dir, libs, gz=False))
+    listings = _AdbShellBatch(listing_cmds)
+    device_file_hashes = _ParseHashListing(listings[1])
+    device_lib_hashes = _ParseHashListing(listings[3]) if libs else {}
+
+    local_hashes = _LocalHashCache(_LOCAL_HASH_CACHE_PATH)
+    stale_files = [(local_path, path_from_root)
+                   for local_path, path_from_root in files
+                   if device_file_hashes.get(path_from_root) != local_hashes.Hash(local_path)]
+    stale_libs = [(lib_name, lib_name)
+                  for lib_name in libs
+                  if device_lib_hashes.get(lib_name) != local_hashes.Hash(lib_name)]
+    local_hashes.Save()
+
+    total_size = sum(os.path.getsize(local_path) for local_path, _ in stale_files + stale_libs)
+    skipped = len(files) + len(libs) - len(stale_files) - len(stale_libs)
+    logging.info('Syncing %d files (%.1fMB) for %d traces, %d files already ok',
+                 len(stale_files) + len(stale_libs), total_size / 1e6, len(traces), skipped)
+
+    push_start = time.time()
+    if stale_files:
+        _PushTarStream(stale_files, 'tar -xf - -C ' + tests_root)
+
+    if stale_libs:
+        # Libraries have to be in the app's home directory to be loadable. They are extracted
+        # there by the app with run-as, which can't read files pushed to /sdcard.
+        extract_cmd = 'tar -xf - -C ' + app_traces_dir
+        if _Global.use_run_as:
+            extract_cmd = 'run-as com.android.angle.test ' + extract_cmd
+        _PushTarStream(stale_libs, extract_cmd)
+    push_time = time.time() - push_start
 
-    logging.info('Synced files for %d traces (%.1fMB, %d files already ok) in %.1fs', len(traces),
-                 total_size / 1e6, skipped,
+    logging.info('Synced files for %d traces (%.1fMB at %.1fMB/s, %d files already ok) in %.1fs',
+                 len(traces), total_size / 1e6, total_size / 1e6 / max(push_time, 1e-3), skipped,
                  time.time() - start)
 
 
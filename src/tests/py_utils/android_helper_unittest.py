@@ -0,0 +1,200 @@
+#! /usr/bin/env python3
+#
+# Copyright 2026 The ANGLE Project Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+#
+# android_helper_unittest.py:
+#   Tests for the adb shell session and the trace sync of android_helper.py, run against a
+#   stand-in for adb that runs the shell on the host.
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import android_helper
+
+# Handles `adb [-s <serial>] shell [<cmd>]` like adb does with a device.
+FAKE_ADB = """import os
+import sys
+
+# Use the device tools next to this script
+os.environ['PATH'] = os.path.dirname(os.path.abspath(__file__)) + os.pathsep + os.environ['PATH']
+
+args = sys.argv[1:]
+if args[0] == '-s':
+    args = args[2:]
+assert args[0] == 'shell'
+if len(args) == 1:
+    os.execvp('sh', ['sh'])
+os.execvp('sh', ['sh', '-c', ' '.join(args[1:])])
+"""
+
+# Like toybox, where -b prints the hash only.
+FAKE_SHA256SUM = """import hashlib
+import sys
+
+paths = [arg for arg in sys.argv[1:] if arg != '-b']
+if paths:
+    with open(paths[0], 'rb') as f:
+        data = f.read()
+else:
+    data = sys.stdin.buffer.read()
+print(hashlib.sha256(data).hexdigest())
+"""
+
+
+def _WriteFile(path, contents):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(contents)
+
+
+def _WriteScript(path, source):
+    _WriteFile(path, ('#!' + sys.executable + '\n' + source).encode())
+    os.chmod(path, 0o755)
+
+
+@unittest.skipIf(os.name == 'nt', 'The stand-in for adb needs a POSIX shell')
+class FakeAdbTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.fake_adb_path = os.path.join(self.temp_dir.name, 'adb')
+        _WriteScript(self.fake_adb_path, FAKE_ADB)
+        _WriteScript(os.path.join(self.temp_dir.name, 'sha256sum'), FAKE_SHA256SUM)
+        self.session = android_helper.AdbShellSession([self.fake_adb_path])
+
+    def tearDown(self):
+        self.session.Close()
+        self.temp_dir.cleanup()
+
+
+class AdbShellSessionTest(FakeAdbTestCase):
+
+    def test_run(self):
+        self.assertEqual(self.session.Run('echo hello'), b'hello\n')
+        self.assertEqual(self.session.Run('printf "no newline"'), b'no newline')
+        self.assertEqual(self.session.Run('true'), b'')
+
+    def test_quoting(self):
+        self.assertEqual(self.session.Run('echo "a  b" \'c  d\''), b'a  b c  d\n')
+        self.assertEqual(self.session.Run('echo "it\'s"'), b"it's\n")
+
+    def test_commands_are_independent(self):
+        self.session.Run('cd / && x=1 && exit 0')
+        self.assertEqual(self.session.Run('echo "$x"'), b'\n')
+        self.assertNotEqual(self.session.Run('pwd'), b'/\n')
+
+    def test_failure(self):
+        with self.assertRaises(subprocess.CalledProcessError) as context:
+            self.session.Run('echo partial; exit 3')
+        self.assertEqual(context.exception.returncode, 3)
+        self.assertEqual(context.exception.output, b'partial\n')
+        self.assertEqual(self.session.Run('echo partial; exit 3', check=False), b'partial\n')
+        # The session is still usable
+        self.assertEqual(self.session.Run('echo ok'), b'ok\n')
+
+    def test_batch(self):
+        cmds = ['echo %d; seq 1000' % i for i in range(1000)]
+        outputs = self.session.RunBatch(cmds)
+        self.assertEqual(len(outputs), len(cmds))
+        for i, output in enumerate(outputs):
+            self.assertEqual(output.split(b'\n')[0], str(i).encode())
+            self.assertTrue(output.endswith(b'\n1000\n'))
+
+    def test_batch_failure(self):
+        with self.assertRaises(subprocess.CalledProcessError) as context:
+            self.session.RunBatch(['true', 'exit 1', 'exit 2', 'true'])
+        self.assertEqual(context.exception.cmd, 'exit 1')
+
+    def test_shell_ended(self):
+        self.session = android_helper.AdbShellSession([self.fake_adb_path],
+                                                      stderr=subprocess.DEVNULL)
+        with self.assertRaises(subprocess.CalledProcessError) as context:
+            self.session.RunBatch(['echo before', 'kill -9 $PPID', 'echo after'])
+        self.assertEqual(context.exception.returncode, -1)
+        # A new shell is started for the next commands
+        self.assertEqual(self.session.Run('echo again'), b'again\n')
+
+
+class TraceSyncTest(FakeAdbTestCase):
+
+    def test_compare_hashes(self):
+        local_path = os.path.join(self.temp_dir.name, 'local.gz')
+        same_path = os.path.join(self.temp_dir.name, 'same.gz')
+        other_path = os.path.join(self.temp_dir.name, 'other.gz')
+        for path, contents in [(local_path, b'trace'), (same_path, b'trace'),
+                               (other_path, b'other')]:
+            _WriteFile(path, contents)
+        missing_path = os.path.join(self.temp_dir.name, 'missing.gz')
+
+        android_helper._Global.adb_shell = self.session
+        try:
+            self.assertTrue(android_helper._CompareHashes(local_path, same_path))
+            self.assertFalse(android_helper._CompareHashes(local_path, other_path))
+            self.assertFalse(android_helper._CompareHashes(local_path, missing_path))
+        finally:
+            android_helper._Global.adb_shell = None
+
+    def test_hash_listing(self):
+        device_dir = os.path.join(self.temp_dir.name, 'device')
+        local_path = os.path.join(self.temp_dir.name, 'local.gz')
+        _WriteFile(local_path, b'x' * 10000)
+        _WriteFile(os.path.join(device_dir, 'a', 'a.gz'), b'x' * 10000)
+        _WriteFile(os.path.join(device_dir, 'b', 'b.gz'), b'y')
+        _WriteFile(os.path.join(device_dir, 'c', 'c.so'), b'z')
+
+        listing = self.session.Run(
+            android_helper._DeviceHashListingCommand(
+                device_dir, ['a/a.gz', 'b/*.gz', 'missing/missing.gz'], gz=True))
+        hashes = android_helper._ParseHashListing(listing)
+        self.assertEqual(sorted(hashes), ['a/a.gz', 'b/b.gz'])
+        self.assertEqual(hashes['a/a.gz'],
+                         android_helper._LocalFileHash(local_path, android_helper._GZ_TAIL_SIZE))
+        self.assertNotEqual(hashes['b/b.gz'], hashes['a/a.gz'])
+
+    def test_local_hash_cache(self):
+        cache_path = os.path.join(self.temp_dir.name, 'hashes.json')
+        local_path = os.path.join(self.temp_dir.name, 'local.gz')
+        _WriteFile(local_path, b'trace')
+        expected_hash = android_helper._LocalFileHash(local_path, android_helper._GZ_TAIL_SIZE)
+
+        with mock.patch.object(
+                android_helper, '_LocalFileHash',
+                wraps=android_helper._LocalFileHash) as local_file_hash:
+            cache = android_helper._LocalHashCache(cache_path)
+            self.assertEqual(cache.Hash(local_path), expected_hash)
+            cache.Save()
+            self.assertEqual(
+                android_helper._LocalHashCache(cache_path).Hash(local_path), expected_hash)
+            self.assertEqual(local_file_hash.call_count, 1)
+
+            _WriteFile(local_path, b'changed trace')
+            self.assertNotEqual(
+                android_helper._LocalHashCache(cache_path).Hash(local_path), expected_hash)
+            self.assertEqual(local_file_hash.call_count, 2)
+
+    def test_push_tar_stream(self):
+        local_dir = os.path.join(self.temp_dir.name, 'local')
+        device_dir = os.path.join(self.temp_dir.name, 'device')
+        os.makedirs(device_dir)
+        _WriteFile(os.path.join(local_dir, 'trace.gz'), b'trace')
+        _WriteFile(os.path.join(local_dir, 'lib.so'), b'lib')
+
+        with mock.patch.object(android_helper, '_FindAdb', return_value=self.fake_adb_path):
+            android_helper._PushTarStream([(os.path.join(local_dir, 'trace.gz'), 'a/b/trace.gz'),
+                                           (os.path.join(local_dir, 'lib.so'), 'lib.so')],
+                                          'tar -xf - -C ' + device_dir)
+
+        with open(os.path.join(device_dir, 'a', 'b', 'trace.gz'), 'rb') as f:
+            self.assertEqual(f.read(), b'trace')
+        with open(os.path.join(device_dir, 'lib.so'), 'rb') as f:
+            self.assertEqual(f.read(), b'lib')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,7 @@
 # Use of this source code is governed by a BSD-style license that can be
 # found in the LICENSE file.
 
+import collections
 import contextlib
 import datetime
 import fnmatch
@@ -14,7 +15,6 @@ import signal
 import subprocess
 import sys
 import threading
-import time
 
 import android_helper
 import angle_path_util
@@ -133,37 +133,99 @@ def _popen(*args, **kwargs):
     return subprocess.Popen(*args, **kwargs)
 
 
-# Forked from testing/test_env.py to add ability to suppress logging with log=False
-def run_command_with_output(argv, stdoutfile, env=None, cwd=None, log=True):
+# Keeps a test's output, or only its last max_lines lines if set, and passes every line to
+# incremental parsers so that callers bounding the output can still parse all of it.
+class OutputCapture:
+
+    def __init__(self, max_lines=None, parsers=()):
+        self._lines = collections.deque(maxlen=max_lines)
+        self._parsers = parsers
+
+    def AddLine(self, line):
+        self._lines.append(line)
+        for parser in self._parsers:
+            parser.AddLine(line.rstrip('\r\n'))
+
+    def AddOutput(self, output):
+        for line in output.splitlines(keepends=True):
+            self.AddLine(line)
+
+    def GetOutput(self):
+        return ''.join(self._lines)
+
+
+# Collects the tests printed by --list-tests between 'Tests list:' and 'End tests list.'.
+class TestListParser:
+
+    def __init__(self):
+        self._in_list = False
+        self._tests = []
+        self.tests = None  # Set once the end of the list is found
+
+    def AddLine(self, line):
+        if line == 'Tests list:':
+            self._in_list = True
+            self._tests = []
+        elif line == 'End tests list.' and self._in_list:
+            self._in_list = False
+            self.tests = self._tests
+        elif self._in_list:
+            self._tests.append(line)
+
+
+def _stream_output(process, writer, log, capture):
+    for line in iter(process.stdout.readline, b''):
+        writer.write(line)
+        line = line.decode('utf-8', errors='replace')
+        if log:
+            sys.stdout.write(line)
+        if capture:
+            capture.AddLine(line)
+
+
+# Forked from testing/test_env.py to add ability to suppress logging with log=False. The output is
+# streamed line by line to stdoutfile, to stdout if log is set and to the optional OutputCapture.
+def run_command_with_output(argv, stdoutfile, env=None, cwd=None, log=True, capture=None):
     assert stdoutfile
-    with io.open(stdoutfile, 'wb') as writer, \
-          io.open(stdoutfile, 'rb') as reader:
-        process = _popen(argv, env=env, cwd=cwd, stdout=writer, stderr=subprocess.STDOUT)
+    with io.open(stdoutfile, 'wb') as writer:
+        process = _popen(argv, env=env, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        # Pipes can't be waited on with select() on Windows, read them from a thread instead.
+        reader = threading.Thread(target=_stream_output, args=(process, writer, log, capture))
+        reader.start()
         with forward_signals([process]):
-            while process.poll() is None:
-                if log:
-                    sys.stdout.write(reader.read().decode('utf-8'))
-                # This sleep is needed for signal propagation. See the
+            while reader.is_alive():
+                # The timeout is needed for signal propagation. See the
                 # wait_with_signals() docstring.
-                time.sleep(0.1)
-            if log:
-                sys.stdout.write(reader.read().decode('utf-8'))
+                reader.join(0.1)
+            process.wait()
+            process.stdout.close()
             return process.returncode
 
 
+def TestSuiteCommand(test_suite):
+    return ExecutablePathInCurrentDir(test_suite) if os.path.exists(
+        os.path.basename(test_suite)) else test_suite
+
+
+# Returns the exit code, the output and the json results. Every output line is also passed to
+# output_parsers (e.g. a TestListParser for --list-tests), so callers that only parse the output can
+# set max_output_lines to keep just its last lines in memory.
 def RunTestSuite(test_suite,
                  cmd_args,
                  env,
                  show_test_stdout=True,
-                 use_xvfb=False):
+                 use_xvfb=False,
+                 output_parsers=(),
+                 max_output_lines=None):
+    capture = OutputCapture(max_output_lines, output_parsers)
+
     if android_helper.IsAndroid():
         result, output, json_results = android_helper.RunTests(
             test_suite, cmd_args, log_output=show_test_stdout)
-        return result, output, json_results
+        capture.AddOutput(output)
+        return result, capture.GetOutput(), json_results
 
-    cmd = ExecutablePathInCurrentDir(test_suite) if os.path.exists(
-        os.path.basename(test_suite)) else test_suite
-    runner_cmd = [cmd] + cmd_args
+    runner_cmd = [TestSuiteCommand(test_suite)] + cmd_args
 
     logging.debug(' '.join(runner_cmd))
     with contextlib.ExitStack() as stack:
@@ -184,27 +246,29 @@ def RunTestSuite(test_suite,
             # % egrep 'Width|Height' src/tests/restricted_traces/*/*.json | awk '{print $3 $2}' | sort -n
             exit_code = xvfb.run_executable(
                 runner_cmd, env, stdoutfile=stdout_path, xvfb_whd=xvfb_whd)
+            with open(stdout_path, errors='replace') as f:
+                for line in f:
+                    capture.AddLine(line)
         else:
             exit_code = run_command_with_output(
-                runner_cmd, env=env, stdoutfile=stdout_path, log=show_test_stdout)
-        with open(stdout_path) as f:
-            output = f.read()
-        with open(results_path) as f:
-            data = f.read()
-            json_results = json.loads(data) if data else None  # --list-tests => empty file
+                runner_cmd, env=env, stdoutfile=stdout_path, log=show_test_stdout, capture=capture)
+
+        if os.path.getsize(results_path) == 0:
+            json_results = None  # --list-tests => empty file
+        else:
+            with open(results_path) as f:
+                json_results = json.load(f)
 
-    return exit_code, output, json_results
+    return exit_code, capture.GetOutput(), json_results
 
 
 def GetTestsFromOutput(output):
-    out_lines = output.split('\n')
-    try:
-        start = out_lines.index('Tests list:')
-        end = out_lines.index('End tests list.')
-    except ValueError as e:
-        logging.exception(e)
-        return None
-    return out_lines[start + 1:end]
+    test_list = TestListParser()
+    for line in output.split('\n'):
+        test_list.AddLine(line)
+    if test_list.tests is None:
+        logging.error('Test list not found in output')
+    return test_list.tests
 
 
 def FilterTests(tests, test_filter):
@@ -25,22 +25,219 @@ It can run in multiple ways.
 
     python3 compare_trace_screenshots.py versus_upgrade --before /my/trace/before --after /my/trace/after --out /my/trace/compare
 
+The images are compared in parallel, with --jobs processes. Both modes can also write the results
+of each comparison to a --report file (.csv or .json), which --resume uses to skip the comparisons
+already done, and write the images of the differences with --diff-images.
+
 Prerequisites
-sudo apt-get install imagemagick
+pip install numpy pillow
 '''
 
 import argparse
+import concurrent.futures
+import csv
 import json
 import logging
 import os
-import subprocess
 import sys
 
+import numpy as np
+from PIL import Image
+
 DEFAULT_LOG_LEVEL = 'info'
 
 EXIT_SUCCESS = 0
 EXIT_FAILURE = 1
 
+# Fuzz factors for the absolute error counts, in percents of the color range
+FUZZ_LEVELS = [0, 1, 2, 5, 10, 20]
+
+REPORT_FIELDS = {
+    'versus_native': ['trace', 'angle_image', 'native_image'] +
+                     ['ae_fuzz%d' % fuzz for fuzz in FUZZ_LEVELS] + ['rmse', 'error'],
+    'versus_upgrade': ['image', 'rmse', 'ae_fuzz0', 'error'],
+}
+
+
+def load_images(path, reference_path):
+    with Image.open(path) as image, Image.open(reference_path) as reference:
+        # Compare the alpha channel if either image has one
+        mode = 'RGBA' if 'A' in image.getbands() + reference.getbands() else 'RGB'
+        return np.asarray(image.convert(mode)), np.asarray(reference.convert(mode))
+
+
+# Compares two images like ImageMagick's `compare` does with `-metric AE -fuzz <fuzz>%` for each
+# fuzz level and with `-metric RMSE`, decoding them once and computing all the metrics from the
+# same per-pixel distances. Returns the number of pixels differing by more than each fuzz level,
+# the normalized RMSE and the squared distances. Raises OSError if an image can't be read and
+# ValueError if the sizes differ.
+def compare_images(path, reference_path, fuzz_levels):
+    image, reference = load_images(path, reference_path)
+    if image.shape != reference.shape:
+        raise ValueError('Image sizes differ: %dx%d vs. %dx%d' %
+                         (image.shape[1], image.shape[0], reference.shape[1], reference.shape[0]))
+
+    # Squared color distance of each pixel, in 8-bit units
+    delta = image.astype(np.int32) - reference.astype(np.int32)
+    distances = np.einsum('ijk,ijk->ij', delta, delta)
+
+    # A pixel differs at a fuzz level if its distance is above the fuzz, so count the pixels by the
+    # number of fuzz levels they are above.
+    thresholds = [(fuzz * 255 / 100)**2 for fuzz in fuzz_levels]
+    above = np.bincount(
+        np.searchsorted(thresholds, distances.ravel(), side='left'), minlength=len(thresholds) + 1)
+    ae = [int(above[index + 1:].sum()) for index in range(len(thresholds))]
+
+    rmse = float(np.sqrt(distances.sum(dtype=np.float64) / (delta.size * 255**2)))
+    return ae, rmse, distances
+
+
+# Writes the image the way ImageMagick's `compare` does: the pixels that differ in red, over a
+# faded copy of the image.
+def write_diff_image(path, image_path, distances, fuzz):
+    with Image.open(image_path) as image:
+        rgb = np.asarray(image.convert('RGB'))
+    diff = (rgb * 0.2 + 255 * 0.8).astype(np.uint8)
+    diff[distances > (fuzz * 255 / 100)**2] = [255, 0, 0]
+    Image.fromarray(diff).save(path)
+
+
+def format_rmse(rmse):
+    # As printed by `compare -metric RMSE`, in 16-bit units then normalized
+    return '%g (%g)' % (rmse * 65535, rmse)
+
+
+def get_trace_key_frame(restricted_traces_path, trace):
+    with open(os.path.join(restricted_traces_path, trace, trace + ".json")) as f:
+        single_trace_data = json.load(f)
+
+    metadata = single_trace_data['TraceMetadata']
+    keyframe = ""
+    if 'KeyFrames' in metadata:
+        keyframe = metadata['KeyFrames'][0]
+    return keyframe
+
+
+def compare_native_trace(screenshot_dir, trace_list_path, trace, diff_images):
+    frame = ""
+    if trace_list_path != None:
+        keyframe = get_trace_key_frame(trace_list_path, trace)
+        if keyframe != "":
+            frame = "_frame" + str(keyframe)
+
+    native_file = "angle_native_" + trace + frame + ".png"
+    native_file = os.path.join(screenshot_dir, native_file)
+    if not os.path.isfile(native_file):
+        native_file = "MISSING_EXT.png"
+
+    vulkan_file = "angle_vulkan_" + trace + frame + ".png"
+    vulkan_file = os.path.join(screenshot_dir, vulkan_file)
+    if not os.path.isfile(vulkan_file):
+        vulkan_file = "angle_vulkan_swiftshader_" + trace + frame + ".png"
+        vulkan_file = os.path.join(screenshot_dir, vulkan_file)
+        if not os.path.isfile(vulkan_file):
+            vulkan_file = "MISSING_EXT.png"
+
+    row = {
+        'trace': trace,
+        'angle_image': os.path.basename(vulkan_file),
+        'native_image': os.path.basename(native_file)
+    }
+
+    if "MISSING_EXT.png" in (vulkan_file, native_file):
+        row['error'] = 'Missing screenshot'
+        return row
+
+    # Compare the images with different fuzz factors so we can see how each is doing
+    try:
+        ae, rmse, distances = compare_images(vulkan_file, native_file, FUZZ_LEVELS)
+    except (OSError, ValueError) as e:
+        row['error'] = str(e)
+        return row
+
+    for fuzz, count in zip(FUZZ_LEVELS, ae):
+        row['ae_fuzz%d' % fuzz] = count
+    row['rmse'] = rmse
+
+    if diff_images:
+        for fuzz in FUZZ_LEVELS:
+            diff_file = trace + "_fuzz" + str(fuzz) + "%_TEST_diff.png"
+            write_diff_image(os.path.join(screenshot_dir, diff_file), vulkan_file, distances, fuzz)
+
+    return row
+
+
+def compare_upgrade_image(before_path, after_path, diff_path):
+    row = {'image': os.path.basename(before_path)}
+    try:
+        ae, rmse, distances = compare_images(before_path, after_path, [0])
+    except (OSError, ValueError) as e:
+        row['error'] = str(e)
+        return row
+
+    row['rmse'] = rmse
+    row['ae_fuzz0'] = ae[0]
+    if diff_path and ae[0] != 0:
+        write_diff_image(diff_path, before_path, distances, 0)
+    return row
+
+
+def read_report(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, newline='') as f:
+        if path.endswith('.json'):
+            return json.load(f)
+        rows = []
+        for row in csv.DictReader(f):
+            for field, value in row.items():
+                if field.startswith('ae_') and value != '':
+                    row[field] = int(value)
+                elif field == 'rmse' and value != '':
+                    row[field] = float(value)
+            rows.append({field: value for field, value in row.items() if value != ''})
+        return rows
+
+
+# Rewrites the whole report, so that it is always complete and can be resumed from.
+def write_report(path, command, rows):
+    with open(path + '.tmp', 'w', newline='') as f:
+        if path.endswith('.json'):
+            json.dump(rows, f, indent=1)
+        else:
+            writer = csv.DictWriter(f, fieldnames=REPORT_FIELDS[command])
+            writer.writeheader()
+            writer.writerows(rows)
+    os.replace(path + '.tmp', path)
+
+
+# Runs compare(*task) for each of the tasks in a process pool, and yields the results in order.
+# The tasks already in the report are skipped with --resume, and their results taken from it.
+def run_comparisons(args, key, tasks, compare):
+    done = {}
+    if args.report and args.resume:
+        done = {row[key]: row for row in read_report(args.report) if 'error' not in row}
+        logging.info('Resuming from %s: %d of %d comparisons already done' %
+                     (args.report, len([name for name in tasks if name in done]), len(tasks)))
+
+    rows = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        futures = {
+            name: executor.submit(compare, *task)
+            for name, task in tasks.items()
+            if name not in done
+        }
+        try:
+            for name in tasks:
+                row = done[name] if name in done else futures[name].result()
+                rows.append(row)
+                if args.report and name not in done:
+                    write_report(args.report, args.command, rows)
+                yield row
+        finally:
+            for future in futures.values():
+                future.cancel()
+
 
 def versus_native(args):
 
@@ -70,61 +267,21 @@ def versus_native(args):
         for i in trace_and_version:
             traces.add(i.split(' ',)[0])
 
-    def get_trace_key_frame(restricted_traces_path, trace):
-        with open(os.path.join(restricted_traces_path, trace, trace + ".json")) as f:
-            single_trace_data = json.load(f)
-
-        metadata = single_trace_data['TraceMetadata']
-        keyframe = ""
-        if 'KeyFrames' in metadata:
-            keyframe = metadata['KeyFrames'][0]
-        return keyframe
-
     if args.trace_list_path != None:
         get_traces_from_file(args.trace_list_path)
     else:
         get_traces_from_images()
 
-    for trace in sorted(traces):
-        if args.trace_list_path != None:
-            keyframe = get_trace_key_frame(args.trace_list_path, trace)
-            frame = ""
-            if keyframe != "":
-                frame = "_frame" + str(keyframe)
+    tasks = {
+        trace: (args.screenshot_dir, args.trace_list_path, trace, args.diff_images)
+        for trace in sorted(traces)
+    }
+    for row in run_comparisons(args, 'trace', tasks, compare_native_trace):
+        if 'error' in row and row['error'] != 'Missing screenshot':
+            logging.warning('Could not compare %s: %s' % (row['trace'], row['error']))
 
-        native_file = "angle_native_" + trace + frame + ".png"
-        native_file = os.path.join(args.screenshot_dir, native_file)
-        if not os.path.isfile(native_file):
-            native_file = "MISSING_EXT.png"
-
-        vulkan_file = "angle_vulkan_" + trace + frame + ".png"
-        vulkan_file = os.path.join(args.screenshot_dir, vulkan_file)
-        if not os.path.isfile(vulkan_file):
-            vulkan_file = "angle_vulkan_swiftshader_" + trace + frame + ".png"
-            vulkan_file = os.path.join(args.screenshot_dir, vulkan_file)
-            if not os.path.isfile(vulkan_file):
-                vulkan_file = "MISSING_EXT.png"
-
-        # Compare each of the images with different fuzz factors so we can see how each is doing
-        # `compare -metric AE -fuzz ${FUZZ} ${VULKAN} ${NATIVE} ${TRACE}_fuzz${FUZZ}_diff.png`
-        results = []
-        for fuzz in {0, 1, 2, 5, 10, 20}:
-            diff_file = trace + "_fuzz" + str(fuzz) + "%_TEST_diff.png"
-            diff_file = os.path.join(args.screenshot_dir, diff_file)
-            command = "compare -metric AE -fuzz " + str(
-                fuzz) + "% " + vulkan_file + " " + native_file + " " + diff_file
-            logging.debug("Running " + command)
-            diff = subprocess.run(command, shell=True, capture_output=True)
-            for line in diff.stderr.splitlines():
-                if "unable to open image".encode('UTF-8') in line:
-                    results.append("NA".encode('UTF-8'))
-                else:
-                    results.append(diff.stderr)
-            logging.debug(" for " + trace + " " + str(fuzz) + "%")
-
-        print(trace, os.path.basename(vulkan_file), os.path.basename(native_file),
-              results[0].decode('UTF-8'), results[1].decode('UTF-8'), results[2].decode('UTF-8'),
-              results[3].decode('UTF-8'), results[4].decode('UTF-8'), results[5].decode('UTF-8'))
+        results = [str(row.get('ae_fuzz%d' % fuzz, 'NA')) for fuzz in FUZZ_LEVELS]
+        print(row['trace'], row['angle_image'], row['native_image'], *results)
 
 
 def versus_upgrade(args):
@@ -146,35 +303,49 @@ def versus_upgrade(args):
             print("Extra after files: %s" % after_minus_before)
         exit(1)
 
-    # Walk through the before list and compare it with after
-    for before_image, after_image in zip(sorted(before_files), sorted(after_files)):
-
-        # Compare each of the images using root mean squared, no fuzz factor
-        # `compare -metric RMSE ${BEFORE} ${AFTER} ${TRACE}_RMSE_diff.png;`
-
-        results = []
-        diff_file = args.outdir + "/" + before_image + "_TEST_diff.png"
-        command = "compare -metric RMSE " + os.path.join(
-            args.before, before_image) + " " + os.path.join(args.after,
-                                                            after_image) + " " + diff_file
-        diff = subprocess.run(command, shell=True, capture_output=True)
-        for line in diff.stderr.splitlines():
-            if "unable to open image".encode('UTF-8') in line:
-                results.append("NA".encode('UTF-8'))
-            else:
-                # If the last element of the diff isn't zero, there was a pixel diff
-                if line.split()[-1] != b'(0)':
-                    print(before_image, diff.stderr.decode('UTF-8'))
-                    print("Pixel diff detected!")
-                    exit(1)
-                else:
-                    results.append(diff.stderr)
-
-        print(before_image, results[0].decode('UTF-8'))
+    # Compare each of the before images with the after one using root mean squared, no fuzz factor
+    tasks = {}
+    for before_image, after_image in zip(before_files, after_files):
+        diff_file = None
+        if args.diff_images:
+            diff_file = os.path.join(args.outdir, before_image + "_TEST_diff.png")
+        before_path = os.path.join(args.before, before_image)
+        after_path = os.path.join(args.after, after_image)
+        tasks[before_image] = (before_path, after_path, diff_file)
+
+    for row in run_comparisons(args, 'image', tasks, compare_upgrade_image):
+        if 'error' in row:
+            print(row['image'], row['error'])
+            print("Pixel diff detected!")
+            exit(1)
+
+        print(row['image'], format_rmse(row['rmse']))
+
+        # If any pixel is different, there was a pixel diff
+        if row['ae_fuzz0'] != 0:
+            print("Pixel diff detected!")
+            exit(1)
 
     print("Test completed successfully, no diffs detected")
 
 
+def add_comparison_args(parser):
+    parser.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        default=os.cpu_count(),
+        help='Number of processes comparing images. Default is the number of CPUs.')
+    parser.add_argument(
+        '--report', help='Write the results to this file, as CSV or as JSON if it ends in .json')
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Skip the comparisons already in --report, e.g. after an interrupted run')
+    parser.add_argument(
+        '--diff-images', action='store_true', help='Write images of the pixel differences')
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument('-l', '--log', help='Logging level.', default=DEFAULT_LOG_LEVEL)
@@ -189,6 +360,7 @@ def main():
         '--screenshot-dir', help='Directory containing two sets of screenshots', required=True)
     versus_native_parser.add_argument(
         '--trace-list-path', help='Path to dir containing restricted_traces.json')
+    add_comparison_args(versus_native_parser)
 
     # This mode will compare before and after images when upgrading a trace
     versus_upgrade_parser = subparsers.add_parser(
@@ -198,19 +370,18 @@ def main():
     versus_upgrade_parser.add_argument(
         '--after', help='Full path to dir containing *after* screenshots', required=True)
     versus_upgrade_parser.add_argument('--outdir', help='Where to write output files', default='.')
+    add_comparison_args(versus_upgrade_parser)
 
     args = parser.parse_args()
 
-    try:
-        if args.command == 'versus_native':
-            return versus_native(args)
-        elif args.command == 'versus_upgrade':
-            return versus_upgrade(args)
-        else:
-            logging.fatal('Unknown command: %s' % args.command)
-            return EXIT_FAILURE
-    except subprocess.CalledProcessError as e:
-        logging.exception('There was an exception: %s', e.output.decode())
+    logging.basicConfig(level=args.log.upper())
+
+    if args.command == 'versus_native':
+        return versus_native(args)
+    elif args.command == 'versus_upgrade':
+        return versus_upgrade(args)
+    else:
+        logging.fatal('Unknown command: %s' % args.command)
         return EXIT_FAILURE
 
 
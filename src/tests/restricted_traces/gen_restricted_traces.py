@@ -15,6 +15,9 @@ import json
 import os
 import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../scripts'))
+import autogen_writer
+
 CIPD_TRACE_PREFIX = 'angle/traces'
 EXPERIMENTAL_CIPD_PREFIX = 'experimental/google.com/%s/angle/traces'
 DEPS_PATH = '../../../DEPS'
@@ -88,8 +91,7 @@ def update_deps(trace_pairs):
         DEPS_VAR_TEMPLATE.format(trace=trace) for (trace, _) in trace_pairs
     ]
 
-    with open(DEPS_PATH, 'w') as f:
-        f.write(''.join(lines))
+    autogen_writer.write_if_changed(DEPS_PATH, ''.join(lines))
 
     return True
 
@@ -106,7 +108,7 @@ def main():
 
     # auto_script parameters.
     if len(sys.argv) > 1:
-        inputs = [json_file]
+        inputs = [json_file, '../../../scripts/autogen_writer.py']
 
         # Note: we do not include DEPS in the list of outputs to simplify the integration.
         # Otherwise we'd continually need to regenerate on any roll. We include .gitignore
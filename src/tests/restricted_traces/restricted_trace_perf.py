@@ -31,6 +31,14 @@ Recommended command to run:
 Output will be printed to the terminal as it is collected.
 
 Of the 5 runs, the high and low for each data point will be dropped, average of the remaining three will be tracked in the summary spreadsheet.
+
+To share the runs between several devices of the same model, pass each of them with --device:
+
+  python3 restricted_trace_perf.py --device <serial1> --device <serial2> ...
+
+Every measurement is also recorded in journal.<output-tag>.jsonl, and the summary spreadsheet is
+updated after each of them. If the script stops, run it again with the same arguments and --resume
+to measure only the remaining tests.
 '''
 
 import argparse
@@ -52,6 +60,9 @@ from collections import defaultdict, namedtuple
 from datetime import datetime
 from psutil import process_iter
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'py_utils'))
+import android_helper
+
 DEFAULT_TEST_DIR = '.'
 DEFAULT_TEST_JSON = 'restricted_traces.json'
 DEFAULT_LOG_LEVEL = 'info'
@@ -101,21 +112,95 @@ def run_async_command(args):
     return async_process
 
 
+# When running on several devices at once, each thread sends its adb commands to its own device.
+# Each thread also has its own adb shell session, as the power measurements are taken while the
+# test runs.
+_thread_device = threading.local()
+
+
+def set_thread_device(serial):
+    close_adb_shell()
+    _thread_device.serial = serial
+
+
+def get_adb_args():
+    serial = getattr(_thread_device, 'serial', None)
+    return ['adb', '-s', serial] if serial else ['adb']
+
+
+def get_adb_shell():
+    if not getattr(_thread_device, 'shell', None):
+        _thread_device.shell = android_helper.AdbShellSession(
+            get_adb_args(), stderr=subprocess.DEVNULL)
+    return _thread_device.shell
+
+
+def close_adb_shell():
+    if getattr(_thread_device, 'shell', None):
+        _thread_device.shell.Close()
+        _thread_device.shell = None
+
+
 def run_adb_command(args):
-    return run_command('adb ' + args)
+    if args.startswith('shell '):
+        return run_adb_shell_commands([args[len('shell '):]])[0]
+    if args == 'root':
+        # Restarts adbd, which ends the shell
+        close_adb_shell()
+    return run_command(' '.join(get_adb_args() + [args]))
+
+
+# Runs the commands in one round trip to the device. Like run_command, failures aren't reported
+# other than through the output.
+def run_adb_shell_commands(cmds):
+    logging.debug('Running adb shell %s' % cmds)
+
+    start_time = time.time()
+
+    try:
+        outputs = get_adb_shell().RunBatch(cmds, check=False)
+    except subprocess.CalledProcessError as e:
+        logging.warning('adb shell ended while running %s' % e.cmd)
+        outputs = [b''] * len(cmds)
+
+    time_elapsed = time.time() - start_time
+
+    return [Result(output.decode(), '', time_elapsed) for output in outputs]
 
 
 def run_async_adb_command(args):
-    return run_async_command('adb ' + args)
+    return run_async_command(' '.join(get_adb_args() + [args]))
+
+
+# Starts a daemon thread running target(*args), with its adb commands sent to the device of the
+# calling thread.
+def start_device_thread(target, args):
+    serial = getattr(_thread_device, 'serial', None)
+
+    def _run():
+        set_thread_device(serial)
+        try:
+            target(*args)
+        finally:
+            close_adb_shell()
+
+    thread = threading.Thread(target=_run)
+    thread.daemon = True
+    thread.start()
+    return thread
+
+
+CLEANUP_COMMAND = 'rm -f /sdcard/Download/out.txt /sdcard/Download/gpumem.txt'
+CLEAR_BLOB_CACHE_COMMAND = (
+    'run-as com.android.angle.test rm -rf /data/user_de/0/com.android.angle.test/cache')
 
 
 def cleanup():
-    run_adb_command('shell rm -f /sdcard/Download/out.txt /sdcard/Download/gpumem.txt')
+    run_adb_shell_commands([CLEANUP_COMMAND])
 
 
 def clear_blob_cache():
-    run_adb_command(
-        'shell run-as com.android.angle.test rm -rf /data/user_de/0/com.android.angle.test/cache')
+    run_adb_shell_commands([CLEAR_BLOB_CACHE_COMMAND])
 
 
 def select_device(device_arg):
@@ -161,9 +246,11 @@ def select_device(device_arg):
     if device_serial is not None:
         logging.info('Device with serial {} selected.'.format(device_serial))
         os.environ['ANDROID_SERIAL'] = device_serial
+        return device_serial
 
     else:
         logging.info('Default device ({}) selected.'.format(result_dev_out[0]))
+        return result_dev_out[0]
 
 
 def get_mode(args):
@@ -226,7 +313,7 @@ shell am instrument -w \
     -e org.chromium.native_test.NativeTestInstrumentationTestRunner.NativeTestActivity \
     com.android.angle.test.AngleUnitTestActivity \
     com.android.angle.test/org.chromium.build.gtest_apk.NativeTestInstrumentationTestRunner
-    '''.format(flags=r'\ '.join(flags)).strip()  # Note: space escaped due to subprocess shell=True
+    '''.format(flags=' '.join(flags)).strip()
 
     result = run_adb_command(adb_command)
 
@@ -237,41 +324,78 @@ shell am instrument -w \
     return result.time
 
 
-def get_test_time():
-    # Pull the results from the device and parse
-    result = run_adb_command('shell cat /sdcard/Download/out.txt | grep -v Error | grep -v Frame')
+# The results of a run of a trace, as written to out.txt by the test.
+TestResults = namedtuple('TestResults', [
+    'wall_time', 'gpu_time', 'cpu_time', 'frame_count', 'missing_extension', 'proc_mem_median',
+    'proc_mem_peak'
+])
 
+
+def parse_test_output(output):
+    # Lines are excluded from the wall time and frame count as in a "grep -v Error | grep -v Frame"
     measured_time = None
+    missing_extension = None
+    gpu_time = None
+    cpu_time = None
+    frame_count = None
+    memory_median = ''
+    memory_max = ''
 
-    for line in result.stdout.splitlines():
+    for line in output.splitlines():
         logging.debug('Checking line: %s' % line)
 
-        # Look for this line and grab the second to last entry:
+        # Most lines are of the form "<key>: <value> <unit>", grab the second to last entry:
         #   Mean result time: 1.2793 ms
-        if "Mean result time" in line:
-            measured_time = line.split()[-2]
-            break
+        if "gpu_time" in line and gpu_time is None:
+            gpu_time = line.split()[-2]
 
-        # Check for skipped tests
-        if "Test skipped due to missing extension" in line:
-            missing_ext = line.split()[-1]
-            logging.debug('Skipping test due to missing extension: %s' % missing_ext)
-            measured_time = missing_ext
-            break
+        if "cpu_time" in line and cpu_time is None:
+            cpu_time = line.split()[-2]
+
+        if "memory_median" in line:
+            memory_median = line.split()[-2]
+        elif "memory_max" in line:
+            memory_max = line.split()[-2]
+
+        if "Error" in line or "Frame" in line:
+            continue
+
+        if measured_time is None:
+            if "Mean result time" in line:
+                measured_time = line.split()[-2]
+
+            # Check for skipped tests
+            if "Test skipped due to missing extension" in line:
+                missing_extension = line.split()[-1]
+                logging.debug('Skipping test due to missing extension: %s' % missing_extension)
+                measured_time = missing_extension
+
+        if "trial_steps" in line and frame_count is None:
+            frame_count = line.split()[-2]
 
     if measured_time is None:
-        if '[  PASSED  ]' in result.stdout:
+        if '[  PASSED  ]' in output:
             measured_time = 'missing'
         else:
             measured_time = 'crashed'
 
-    return measured_time
+    return TestResults(
+        wall_time=measured_time,
+        gpu_time=gpu_time or '0',
+        cpu_time=cpu_time or '0',
+        frame_count=frame_count or 0,
+        missing_extension=missing_extension,
+        proc_mem_median=safe_cast_int(memory_median),
+        proc_mem_peak=safe_cast_int(memory_max))
 
 
-def get_gpu_memory(trace_duration):
+def get_test_results():
     # Pull the results from the device and parse
-    result = run_adb_command('shell cat /sdcard/Download/gpumem.txt | awk "NF"')
+    result = run_adb_command('shell cat /sdcard/Download/out.txt')
+    return parse_test_output(result.stdout)
+
 
+def parse_gpu_memory(output, trace_duration):
     # The gpumem script grabs snapshots of memory per process
     # Output looks like this, repeated once per sleep_duration of the test:
     #
@@ -291,7 +415,7 @@ def get_gpu_memory(trace_duration):
     test_process = ''
     gpu_mem = []
     gpu_mem_sustained = []
-    for line in result.stdout.splitlines():
+    for line in output.splitlines():
         logging.debug('Checking line: %s' % line)
 
         if "time_elapsed" in line:
@@ -336,73 +460,10 @@ def get_gpu_memory(trace_duration):
     return gpu_mem_average, gpu_mem_max
 
 
-def get_proc_memory():
-    # Pull the results from the device and parse
-    result = run_adb_command('shell cat /sdcard/Download/out.txt')
-    memory_median = ''
-    memory_max = ''
-
-    for line in result.stdout.splitlines():
-        # Look for "memory_max" in the line and grab the second to last entry:
-        logging.debug('Checking line: %s' % line)
-
-        if "memory_median" in line:
-            memory_median = line.split()[-2]
-            continue
-
-        if "memory_max" in line:
-            memory_max = line.split()[-2]
-            continue
-
-    return safe_cast_int(memory_max), safe_cast_int(memory_median)
-
-
-def get_gpu_time():
-    # Pull the results from the device and parse
-    result = run_adb_command('shell cat /sdcard/Download/out.txt')
-    gpu_time = '0'
-
-    for line in result.stdout.splitlines():
-        # Look for "gpu_time" in the line and grab the second to last entry:
-        logging.debug('Checking line: %s' % line)
-
-        if "gpu_time" in line:
-            gpu_time = line.split()[-2]
-            break
-
-    return gpu_time
-
-
-def get_cpu_time():
-    # Pull the results from the device and parse
-    result = run_adb_command('shell cat /sdcard/Download/out.txt')
-    cpu_time = '0'
-
-    for line in result.stdout.splitlines():
-        # Look for "cpu_time" in the line and grab the second to last entry:
-        logging.debug('Checking line: %s' % line)
-
-        if "cpu_time" in line:
-            cpu_time = line.split()[-2]
-            break
-
-    return cpu_time
-
-
-def get_frame_count():
+def get_gpu_memory(trace_duration):
     # Pull the results from the device and parse
-    result = run_adb_command('shell cat /sdcard/Download/out.txt | grep -v Error | grep -v Frame')
-
-    frame_count = 0
-
-    for line in result.stdout.splitlines():
-        logging.debug('Checking line: %s' % line)
-        if "trial_steps" in line:
-            frame_count = line.split()[-2]
-            break
-
-    logging.debug('Frame count: %s' % frame_count)
-    return frame_count
+    result = run_adb_command('shell cat /sdcard/Download/gpumem.txt')
+    return parse_gpu_memory(result.stdout, trace_duration)
 
 
 class GPUPowerStats():
@@ -468,10 +529,11 @@ class GPUPowerStats():
 
 
 def wait_for_test_warmup(done_event):
-    p = subprocess.Popen(['adb', 'logcat', '*:S', 'ANGLE:I'],
-                         stdout=subprocess.PIPE,
-                         text=True,
-                         bufsize=1)  # line-buffered
+    p = subprocess.Popen(
+        get_adb_args() + ['logcat', '*:S', 'ANGLE:I'],
+        stdout=subprocess.PIPE,
+        text=True,
+        bufsize=1)  # line-buffered
     os.set_blocking(p.stdout.fileno(), False)
 
     start_time = time.time()
@@ -583,7 +645,7 @@ def drop_high_low_and_average(values):
     if len(values) >= 2 and average != 0:
         variance = statistics.stdev(values) / average
 
-    print(average, variance)
+    logging.debug('%s: average %s, variance %s' % (values, average, variance))
 
     return float(average), float(variance)
 
@@ -642,7 +704,16 @@ def main():
     parser.add_argument(
         '--loop-count', help='How many times to loop through the traces', default=5)
     parser.add_argument(
-        '--device', help='Which device to run the tests on (use serial)', default='')
+        '--device',
+        help='Which device to run the tests on (use serial). Repeat to run on several devices of '
+        'the same model at once, each taking the next test as soon as it is free.',
+        action='append')
+    parser.add_argument(
+        '--resume',
+        help='Continue the sweep recorded in the journal of --output-tag, skipping the tests '
+        'already measured.',
+        action='store_true',
+        default=False)
     parser.add_argument(
         '--sleep', help='Add a sleep of this many seconds between each test)', type=int, default=0)
     parser.add_argument(
@@ -670,19 +741,7 @@ def main():
 
     logging.basicConfig(level=args.log.upper())
 
-    run_adb_command('root')
-
-    try:
-        if args.custom_throttling_temp:
-            set_vendor_thermal_control(disabled=1)
-        run_traces(args)
-    finally:
-        if args.custom_throttling_temp:
-            set_vendor_thermal_control(disabled=0)
-        # Clean up settings, including in case of exceptions (including Ctrl-C)
-        run_adb_command('shell settings delete global angle_debug_package')
-        run_adb_command('shell settings delete global angle_gl_driver_selection_pkgs')
-        run_adb_command('shell settings delete global angle_gl_driver_selection_values')
+    run_traces(args)
 
     return 0
 
@@ -694,283 +753,237 @@ def logged_args():
     return ' '.join(extra_args)
 
 
-def run_traces(args):
-    # Load trace names
-    with open(os.path.join(DEFAULT_TEST_DIR, DEFAULT_TEST_JSON)) as f:
-        traces = json.loads(f.read())
+# One measurement of a sweep: a run of a trace with a renderer, in one of the loops.
+SweepItem = namedtuple('SweepItem', ['renderer', 'loop', 'trace'])
 
-    # Have to split the 'trace version' thing up
-    trace_and_version = traces['traces']
-    traces = [i.split(' ',)[0] for i in trace_and_version]
+METRICS = [
+    'wall_time', 'gpu_time', 'cpu_time', 'gpu_power', 'cpu_power', 'gpu_mem_sustained',
+    'gpu_mem_peak', 'proc_mem_median', 'proc_mem_peak'
+]
 
-    failures = []
+# Arguments that change the measurements, in addition to the mode. Journal entries measured with
+# other values are neither resumed nor summarized.
+MEASUREMENT_ARGS = ['maxsteps', 'fixedtime', 'minimizegpuwork', 'power', 'memory']
 
-    mode = get_mode(args)
-    trace_width = get_trace_width(mode)
 
-    # Select the target device
-    select_device(args.device)
+def get_measurement_settings(args):
+    return {name: getattr(args, name) for name in MEASUREMENT_ARGS}
 
-    # Add an underscore to the mode for use in loop below
-    if mode != '':
-        mode = mode + '_'
 
-    # Create output CSV
-    raw_data_filename = "raw_data." + args.output_tag + ".csv"
-    output_file = open(raw_data_filename, 'w', newline='')
-    output_writer = csv.writer(output_file)
+# Returns the journal entries of the sweep items measured in mode with settings.
+def get_sweep_entries(entries, items, mode, settings):
+    items = set(items)
+    return [
+        entry for entry in entries
+        if entry['mode'] == mode and entry.get('settings') == settings and
+        SweepItem(entry['renderer'], entry['loop'], entry['trace']) in items
+    ]
 
-    # Set some widths that allow easily reading the values, but fit on smaller monitors.
-    column_width = {
-        'trace': trace_width,
-        'wall_time': 15,
-        'gpu_time': 15,
-        'cpu_time': 15,
-        'gpu_power': 10,
-        'cpu_power': 10,
-        'gpu_mem_sustained': 20,
-        'gpu_mem_peak': 15,
-        'proc_mem_median': 20,
-        'proc_mem_peak': 15
-    }
 
-    if args.walltimeonly:
-        print('%-*s' % (trace_width, 'wall_time_per_frame'))
-    else:
-        print('%-*s %-*s %-*s %-*s %-*s %-*s %-*s %-*s %-*s %-*s' %
-              (column_width['trace'], 'trace', column_width['wall_time'], 'wall_time',
-               column_width['gpu_time'], 'gpu_time', column_width['cpu_time'], 'cpu_time',
-               column_width['gpu_power'], 'gpu_power', column_width['cpu_power'], 'cpu_power',
-               column_width['gpu_mem_sustained'], 'gpu_mem_sustained',
-               column_width['gpu_mem_peak'], 'gpu_mem_peak', column_width['proc_mem_median'],
-               'proc_mem_median', column_width['proc_mem_peak'], 'proc_mem_peak'))
-        output_writer.writerow([
-            'trace', 'wall_time(ms)', 'gpu_time(ms)', 'cpu_time(ms)', 'gpu_power(W)',
-            'cpu_power(W)', 'gpu_mem_sustained', 'gpu_mem_peak', 'proc_mem_median', 'proc_mem_peak'
+def get_metric_value(metric, value):
+    if metric == 'wall_time':
+        try:
+            return safe_cast_float(value)
+        except ValueError:  # e.g. 'crashed'
+            return -1
+    if metric in ('gpu_time', 'cpu_time', 'gpu_power', 'cpu_power'):
+        return safe_cast_float(value)
+    return safe_cast_int(value)
+
+
+# Records every measurement of a sweep as a line of JSON as soon as it is taken, so that the sweep
+# can be resumed and its summary computed after a crash.
+class MeasurementJournal():
+
+    def __init__(self, path, resume):
+        self.path = path
+        self.entries = []
+        if resume and os.path.exists(path):
+            with open(path) as f:
+                for line in f:
+                    try:
+                        self.entries.append(json.loads(line))
+                    except ValueError:
+                        # The last line is cut short if the run was killed while writing it.
+                        logging.warning('Ignoring incomplete journal entry: %s' % line)
+        self.file = open(path, 'a' if resume else 'w')
+
+    def append(self, entry):
+        self.entries.append(entry)
+        self.file.write(json.dumps(entry) + '\n')
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+
+def set_renderer(renderer):
+    if renderer == "native":
+        # Force the settings to native
+        run_adb_shell_commands([
+            'settings put global angle_debug_package org.chromium.angle',
+            'settings put global angle_gl_driver_selection_pkgs com.android.angle.test',
+            'settings put global angle_gl_driver_selection_values native'
+        ])
+    elif renderer == "vulkan":
+        # Force the settings to ANGLE
+        run_adb_shell_commands([
+            'settings put global angle_debug_package org.chromium.angle',
+            'settings put global angle_gl_driver_selection_pkgs com.android.angle.test',
+            'settings put global angle_gl_driver_selection_values angle'
         ])
+    elif renderer == "default":
+        logging.info('Deleting Android settings for forcing selection of GLES driver, ' +
+                     'allowing system to load the default')
+        delete_renderer_settings()
+    else:
+        logging.error('Unsupported renderer {}'.format(renderer))
+        exit()
 
-    if args.power:
-        starting_power = GPUPowerStats()
-        ending_power = GPUPowerStats()
 
-    renderers = []
-    if args.renderer != "both":
-        renderers.append(args.renderer)
-    else:
-        renderers = ("native", "vulkan")
+def delete_renderer_settings():
+    run_adb_shell_commands([
+        'settings delete global angle_debug_package',
+        'settings delete global angle_gl_driver_selection_pkgs',
+        'settings delete global angle_gl_driver_selection_values'
+    ])
 
-    wall_times = defaultdict(dict)
-    gpu_times = defaultdict(dict)
-    cpu_times = defaultdict(dict)
-    gpu_powers = defaultdict(dict)
-    cpu_powers = defaultdict(dict)
-    gpu_mem_sustaineds = defaultdict(dict)
-    gpu_mem_peaks = defaultdict(dict)
-    proc_mem_medians = defaultdict(dict)
-    proc_mem_peaks = defaultdict(dict)
-
-    for renderer in renderers:
-
-        if renderer == "native":
-            # Force the settings to native
-            run_adb_command('shell settings put global angle_debug_package org.chromium.angle')
-            run_adb_command(
-                'shell settings put global angle_gl_driver_selection_pkgs com.android.angle.test')
-            run_adb_command('shell settings put global angle_gl_driver_selection_values native')
-        elif renderer == "vulkan":
-            # Force the settings to ANGLE
-            run_adb_command('shell settings put global angle_debug_package org.chromium.angle')
-            run_adb_command(
-                'shell settings put global angle_gl_driver_selection_pkgs com.android.angle.test')
-            run_adb_command('shell settings put global angle_gl_driver_selection_values angle')
-        elif renderer == "default":
-            logging.info('Deleting Android settings for forcing selection of GLES driver, ' +
-                         'allowing system to load the default')
-            run_adb_command('shell settings delete global angle_debug_package')
-            run_adb_command('shell settings delete global angle_gl_driver_selection_pkgs')
-            run_adb_command('shell settings delete global angle_gl_driver_selection_values')
-        else:
-            logging.error('Unsupported renderer {}'.format(renderer))
-            exit()
-
-        for i in range(int(args.loop_count)):
-            print("\nStarting run %i with %s at %s\n" %
-                  (i + 1, renderer, datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
-            for trace in fnmatch.filter(traces, args.filter):
-                # Remove any previous perf results
-                cleanup()
-                # Clear blob cache to avoid post-warmup cache eviction b/298028816
-                clear_blob_cache()
-
-                test = trace.split(' ')[0]
-
-                if args.power:
-                    assert args.fixedtime, '--power requires --fixedtime'
-                    done_event = threading.Event()
-                    run_adb_command('logcat -c')  # needed for wait_for_test_warmup
-                    power_results = {}  # output arg
-                    power_thread = threading.Thread(
-                        target=collect_power,
-                        args=(done_event, float(args.fixedtime), power_results))
-                    power_thread.daemon = True
-                    power_thread.start()
-
-                logging.debug('Running %s' % test)
-                test_time = run_trace(test, args)
-
-                gpu_power, cpu_power = 0, 0
-                if args.power:
-                    done_event.set()
-                    power_thread.join(timeout=2)
-                    if power_thread.is_alive():
-                        logging.warning('collect_power thread did not terminate')
-                    else:
-                        gpu_power = power_results['gpu']
-                        cpu_power = power_results['cpu']
-
-                wall_time = get_test_time()
-
-                gpu_time = get_gpu_time() if args.vsync else '0'
-
-                cpu_time = get_cpu_time()
-
-                gpu_mem_sustained, gpu_mem_peak = 0, 0
-                proc_mem_peak, proc_mem_median = 0, 0
-                if args.memory:
-                    gpu_mem_sustained, gpu_mem_peak = get_gpu_memory(test_time)
-                    logging.debug(
-                        '%s = %i, %s = %i' %
-                        ('gpu_mem_sustained', gpu_mem_sustained, 'gpu_mem_peak', gpu_mem_peak))
-
-                    proc_mem_peak, proc_mem_median = get_proc_memory()
-
-                trace_name = mode + renderer + '_' + test
-
-                if len(wall_times[test]) == 0:
-                    wall_times[test] = defaultdict(list)
-                try:
-                    wt = safe_cast_float(wall_time)
-                except ValueError:  # e.g. 'crashed'
-                    wt = -1
-                wall_times[test][renderer].append(wt)
-
-                if len(gpu_times[test]) == 0:
-                    gpu_times[test] = defaultdict(list)
-                gpu_times[test][renderer].append(safe_cast_float(gpu_time))
-
-                if len(cpu_times[test]) == 0:
-                    cpu_times[test] = defaultdict(list)
-                cpu_times[test][renderer].append(safe_cast_float(cpu_time))
-
-                if len(gpu_powers[test]) == 0:
-                    gpu_powers[test] = defaultdict(list)
-                gpu_powers[test][renderer].append(safe_cast_float(gpu_power))
-
-                if len(cpu_powers[test]) == 0:
-                    cpu_powers[test] = defaultdict(list)
-                cpu_powers[test][renderer].append(safe_cast_float(cpu_power))
-
-                if len(gpu_mem_sustaineds[test]) == 0:
-                    gpu_mem_sustaineds[test] = defaultdict(list)
-                gpu_mem_sustaineds[test][renderer].append(safe_cast_int(gpu_mem_sustained))
-
-                if len(gpu_mem_peaks[test]) == 0:
-                    gpu_mem_peaks[test] = defaultdict(list)
-                gpu_mem_peaks[test][renderer].append(safe_cast_int(gpu_mem_peak))
-
-                if len(proc_mem_medians[test]) == 0:
-                    proc_mem_medians[test] = defaultdict(list)
-                proc_mem_medians[test][renderer].append(safe_cast_int(proc_mem_median))
-
-                if len(proc_mem_peaks[test]) == 0:
-                    proc_mem_peaks[test] = defaultdict(list)
-                proc_mem_peaks[test][renderer].append(safe_cast_int(proc_mem_peak))
-
-                if args.walltimeonly:
-                    print('%-*s' % (trace_width, wall_time))
-                else:
-                    print(
-                        '%-*s %-*s %-*s %-*s %-*s %-*s %-*i %-*i %-*i %-*i' %
-                        (column_width['trace'], trace_name, column_width['wall_time'], wall_time,
-                         column_width['gpu_time'], gpu_time, column_width['cpu_time'], cpu_time,
-                         column_width['gpu_power'], '%.3f' % gpu_power, column_width['cpu_power'],
-                         '%.3f' % cpu_power, column_width['gpu_mem_sustained'], gpu_mem_sustained,
-                         column_width['gpu_mem_peak'], gpu_mem_peak,
-                         column_width['proc_mem_median'], proc_mem_median,
-                         column_width['proc_mem_peak'], proc_mem_peak))
-                    output_writer.writerow([
-                        mode + renderer + '_' + test, wall_time, gpu_time, cpu_time, gpu_power,
-                        cpu_power, gpu_mem_sustained, gpu_mem_peak, proc_mem_median, proc_mem_peak
-                    ])
-
-
-                # Early exit for testing
-                #exit()
-
-                # Depending on workload, sleeps might be needed to dissipate heat or recharge battery
-                if args.sleep != 0:
-                    time.sleep(args.sleep)
-
-                if args.custom_throttling_temp:
-                    sleep_until_temps_below(args.custom_throttling_temp)
-
-                if args.min_battery_level:
-                    sleep_until_battery_level(args.min_battery_level)
 
-    # Organize the data for writing out
-    rows = defaultdict(dict)
+# Runs a trace on the device of the calling thread and returns its measurements.
+def measure_trace(args, test):
+    # Remove any previous perf results, and clear blob cache to avoid post-warmup cache eviction
+    # b/298028816
+    run_adb_shell_commands([CLEANUP_COMMAND, CLEAR_BLOB_CACHE_COMMAND])
 
-    def populate_row(rows, name, results):
-        if len(rows[name]) == 0:
-            rows[name] = defaultdict(list)
-        for renderer, wtimes in results.items():
-            average, variance = drop_high_low_and_average(wtimes)
-            rows[name][renderer].append(average)
-            rows[name][renderer].append(variance)
+    if args.power:
+        assert args.fixedtime, '--power requires --fixedtime'
+        done_event = threading.Event()
+        run_adb_command('logcat -c')  # needed for wait_for_test_warmup
+        power_results = {}  # output arg
+        power_thread = start_device_thread(collect_power,
+                                           (done_event, float(args.fixedtime), power_results))
 
-    for name, results in wall_times.items():
-        populate_row(rows, name, results)
+    logging.debug('Running %s' % test)
+    test_time = run_trace(test, args)
 
-    for name, results in gpu_times.items():
-        populate_row(rows, name, results)
+    gpu_power, cpu_power = 0, 0
+    if args.power:
+        done_event.set()
+        power_thread.join(timeout=2)
+        if power_thread.is_alive():
+            logging.warning('collect_power thread did not terminate')
+        else:
+            gpu_power = power_results['gpu']
+            cpu_power = power_results['cpu']
 
-    for name, results in cpu_times.items():
-        populate_row(rows, name, results)
+    results = get_test_results()
 
-    for name, results in gpu_powers.items():
-        populate_row(rows, name, results)
+    gpu_mem_sustained, gpu_mem_peak = 0, 0
+    proc_mem_peak, proc_mem_median = 0, 0
+    if args.memory:
+        gpu_mem_sustained, gpu_mem_peak = get_gpu_memory(test_time)
+        logging.debug('%s = %i, %s = %i' %
+                      ('gpu_mem_sustained', gpu_mem_sustained, 'gpu_mem_peak', gpu_mem_peak))
+
+        proc_mem_peak, proc_mem_median = results.proc_mem_peak, results.proc_mem_median
+
+    return {
+        'wall_time': results.wall_time,
+        'gpu_time': results.gpu_time if args.vsync else '0',
+        'cpu_time': results.cpu_time,
+        'gpu_power': gpu_power,
+        'cpu_power': cpu_power,
+        'gpu_mem_sustained': gpu_mem_sustained,
+        'gpu_mem_peak': gpu_mem_peak,
+        'proc_mem_median': proc_mem_median,
+        'proc_mem_peak': proc_mem_peak,
+    }
 
-    for name, results in cpu_powers.items():
-        populate_row(rows, name, results)
 
-    for name, results in gpu_mem_sustaineds.items():
-        populate_row(rows, name, results)
+# Sets up the device, then measures the sweep items returned by next_item() until there are none
+# left, passing each measurement to record().
+def run_device_sweep(args, serial, next_item, record):
+    set_thread_device(serial)
+    run_adb_command('root')
 
-    for name, results in gpu_mem_peaks.items():
-        populate_row(rows, name, results)
+    try:
+        if args.custom_throttling_temp:
+            set_vendor_thermal_control(disabled=1)
 
-    for name, results in proc_mem_medians.items():
-        populate_row(rows, name, results)
+        renderer = None
+        while True:
+            item = next_item()
+            if item is None:
+                break
 
-    for name, results in proc_mem_peaks.items():
-        populate_row(rows, name, results)
+            if item.renderer != renderer:
+                renderer = item.renderer
+                set_renderer(renderer)
 
-    # Generate the SUMMARY output
-    summary_file = open("summary." + args.output_tag + ".csv", 'w', newline='')
-    summary_writer = csv.writer(summary_file)
+            record(serial, item, measure_trace(args, item.trace))
+
+            # Depending on workload, sleeps might be needed to dissipate heat or recharge battery
+            if args.sleep != 0:
+                time.sleep(args.sleep)
 
-    android_version = run_adb_command('shell getprop ro.build.fingerprint').stdout.strip()
+            if args.custom_throttling_temp:
+                sleep_until_temps_below(args.custom_throttling_temp)
+
+            if args.min_battery_level:
+                sleep_until_battery_level(args.min_battery_level)
+    finally:
+        if args.custom_throttling_temp:
+            set_vendor_thermal_control(disabled=0)
+        # Clean up settings, including in case of exceptions (including Ctrl-C)
+        delete_renderer_settings()
+        close_adb_shell()
+
+
+def get_summary_header(devices, raw_data_filename):
+    android_versions = []
+    for serial in devices:
+        android_version = run_command('adb -s %s shell getprop ro.build.fingerprint' %
+                                      serial).stdout.strip()
+        if android_version not in android_versions:
+            android_versions.append(android_version)
+    android_version = ', '.join(android_versions)
     angle_version = run_command('git rev-parse HEAD').stdout.strip()
     origin_main_version = run_command('git rev-parse origin/main').stdout.strip()
     if origin_main_version != angle_version:
         angle_version += ' (origin/main %s)' % origin_main_version
     # test_time = run_command('date \"+%Y%m%d\"').stdout.read().strip()
 
-    summary_writer.writerow([
-        "\"Android: " + android_version + "\n" + "ANGLE: " + angle_version + "\n" +
-        #  "Date: " + test_time + "\n" +
-        "Source: " + raw_data_filename + "\n" + "Args: " + logged_args() + "\""
-    ])
+    return ("\"Android: " + android_version + "\n" + "ANGLE: " + angle_version + "\n" +
+            #  "Date: " + test_time + "\n" +
+            "Source: " + raw_data_filename + "\n" + "Args: " + logged_args() + "\"")
+
+
+# Writes the summary of the journal entries of a sweep. Traces that haven't been measured with all
+# the renderers yet are listed as missing after the others. The file is replaced at once, so it is
+# always complete.
+def write_summary(summary_filename, summary_header, renderers, traces, entries):
+    results = {metric: defaultdict(lambda: defaultdict(list)) for metric in METRICS}
+    for entry in entries:
+        for metric in METRICS:
+            results[metric][entry['trace']][entry['renderer']].append(
+                get_metric_value(metric, entry[metric]))
+
+    # Organize the data for writing out
+    rows = {}
+    for name in traces:
+        if not all(renderer in results['wall_time'][name] for renderer in renderers):
+            continue
+        rows[name] = defaultdict(list)
+        for metric in METRICS:
+            for renderer in renderers:
+                average, variance = drop_high_low_and_average(
+                    list(results[metric][name][renderer]))
+                rows[name][renderer].append(average)
+                rows[name][renderer].append(variance)
+
+    # Generate the SUMMARY output
+    summary_file = open(summary_filename + '.tmp', 'w', newline='')
+    summary_writer = csv.writer(summary_file)
+
+    summary_writer.writerow([summary_header])
 
     # Write the summary file
     trace_number = 0
@@ -1116,6 +1129,179 @@ def run_traces(args):
                 percent(safe_divide(data["native"][16], data["vulkan"][16]))
             ])
 
+    missing = [name for name in traces if name not in rows]
+    if missing:
+        summary_writer.writerow([])
+        summary_writer.writerow(["\"Missing\"", "\"Trace\"", "\"Renderers\nnot\nmeasured\""])
+        for name in missing:
+            not_measured = [
+                renderer for renderer in renderers if renderer not in results['wall_time'][name]
+            ]
+            summary_writer.writerow(['', name, ' '.join(not_measured)])
+
+    summary_file.close()
+    os.replace(summary_filename + '.tmp', summary_filename)
+
+
+def run_traces(args):
+    # Load trace names
+    with open(os.path.join(DEFAULT_TEST_DIR, DEFAULT_TEST_JSON)) as f:
+        traces = json.loads(f.read())
+
+    # Have to split the 'trace version' thing up
+    trace_and_version = traces['traces']
+    traces = [i.split(' ',)[0] for i in trace_and_version]
+
+    mode = get_mode(args)
+    trace_width = get_trace_width(mode)
+
+    # Select the target devices
+    devices = list(dict.fromkeys(select_device(device) for device in (args.device or [''])))
+
+    renderers = []
+    if args.renderer != "both":
+        renderers.append(args.renderer)
+    else:
+        renderers = ("native", "vulkan")
+
+    tests = fnmatch.filter(traces, args.filter)
+    items = [
+        SweepItem(renderer, loop, test)
+        for renderer in renderers
+        for loop in range(int(args.loop_count))
+        for test in tests
+    ]
+
+    # Skip the measurements already in the journal when resuming. Only the entries of this sweep's
+    # items, mode and settings are resumed and summarized.
+    journal = MeasurementJournal("journal." + args.output_tag + ".jsonl", args.resume)
+    settings = get_measurement_settings(args)
+    sweep_entries = get_sweep_entries(journal.entries, items, mode, settings)
+    measured = set(
+        SweepItem(entry['renderer'], entry['loop'], entry['trace']) for entry in sweep_entries)
+    pending_items = [item for item in items if item not in measured]
+    if journal.entries:
+        logging.info('Resuming from %s: %d of %d tests already measured' %
+                     (journal.path, len(items) - len(pending_items), len(items)))
+
+    # Add an underscore to the mode for use in the trace names
+    if mode != '':
+        mode = mode + '_'
+
+    # Create output CSV
+    raw_data_filename = "raw_data." + args.output_tag + ".csv"
+    output_file = open(raw_data_filename, 'a' if journal.entries else 'w', newline='')
+    output_writer = csv.writer(output_file)
+
+    summary_filename = "summary." + args.output_tag + ".csv"
+    summary_header = get_summary_header(devices, raw_data_filename)
+
+    # Set some widths that allow easily reading the values, but fit on smaller monitors.
+    column_width = {
+        'trace': trace_width,
+        'wall_time': 15,
+        'gpu_time': 15,
+        'cpu_time': 15,
+        'gpu_power': 10,
+        'cpu_power': 10,
+        'gpu_mem_sustained': 20,
+        'gpu_mem_peak': 15,
+        'proc_mem_median': 20,
+        'proc_mem_peak': 15
+    }
+
+    if args.walltimeonly:
+        print('%-*s' % (trace_width, 'wall_time_per_frame'))
+    else:
+        print('%-*s %-*s %-*s %-*s %-*s %-*s %-*s %-*s %-*s %-*s' %
+              (column_width['trace'], 'trace', column_width['wall_time'], 'wall_time',
+               column_width['gpu_time'], 'gpu_time', column_width['cpu_time'], 'cpu_time',
+               column_width['gpu_power'], 'gpu_power', column_width['cpu_power'], 'cpu_power',
+               column_width['gpu_mem_sustained'], 'gpu_mem_sustained',
+               column_width['gpu_mem_peak'], 'gpu_mem_peak', column_width['proc_mem_median'],
+               'proc_mem_median', column_width['proc_mem_peak'], 'proc_mem_peak'))
+        if not journal.entries:
+            output_writer.writerow([
+                'trace', 'wall_time(ms)', 'gpu_time(ms)', 'cpu_time(ms)', 'gpu_power(W)',
+                'cpu_power(W)', 'gpu_mem_sustained', 'gpu_mem_peak', 'proc_mem_median',
+                'proc_mem_peak'
+            ])
+
+    lock = threading.Lock()
+    stop_event = threading.Event()
+    state = {'run': None}
+
+    def _next_item():
+        with lock:
+            if stop_event.is_set() or not pending_items:
+                return None
+            item = pending_items.pop(0)
+            if (item.renderer, item.loop) != state['run']:
+                state['run'] = (item.renderer, item.loop)
+                print("\nStarting run %i with %s at %s\n" %
+                      (item.loop + 1, item.renderer, datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
+            return item
+
+    def _record(serial, item, measurement):
+        with lock:
+            entry = {
+                'renderer': item.renderer,
+                'loop': item.loop,
+                'trace': item.trace,
+                'mode': get_mode(args),
+                'settings': settings,
+                'device': serial,
+                **measurement
+            }
+            journal.append(entry)
+            sweep_entries.append(entry)
+
+            trace_name = mode + item.renderer + '_' + item.trace
+            if args.walltimeonly:
+                print('%-*s' % (trace_width, measurement['wall_time']))
+            else:
+                print('%-*s %-*s %-*s %-*s %-*s %-*s %-*i %-*i %-*i %-*i' %
+                      (column_width['trace'], trace_name, column_width['wall_time'],
+                       measurement['wall_time'], column_width['gpu_time'], measurement['gpu_time'],
+                       column_width['cpu_time'], measurement['cpu_time'],
+                       column_width['gpu_power'], '%.3f' % measurement['gpu_power'],
+                       column_width['cpu_power'], '%.3f' % measurement['cpu_power'],
+                       column_width['gpu_mem_sustained'], measurement['gpu_mem_sustained'],
+                       column_width['gpu_mem_peak'], measurement['gpu_mem_peak'],
+                       column_width['proc_mem_median'], measurement['proc_mem_median'],
+                       column_width['proc_mem_peak'], measurement['proc_mem_peak']))
+                output_writer.writerow([trace_name] + [measurement[metric] for metric in METRICS])
+                output_file.flush()
+
+            write_summary(summary_filename, summary_header, renderers, tests, sweep_entries)
+
+    if len(devices) == 1:
+        run_device_sweep(args, devices[0], _next_item, _record)
+    else:
+
+        def _run_device(serial):
+            try:
+                run_device_sweep(args, serial, _next_item, _record)
+            except Exception:
+                # The remaining tests are left to the other devices.
+                logging.exception('Stopped running tests on device %s' % serial)
+
+        threads = [threading.Thread(target=_run_device, args=(serial,)) for serial in devices]
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                thread.join()
+        except KeyboardInterrupt:
+            # Let the devices finish their current test and restore their settings.
+            stop_event.set()
+            for thread in threads:
+                thread.join()
+            raise
+
+    output_file.close()
+    write_summary(summary_filename, summary_header, renderers, tests, sweep_entries)
+
 
 if __name__ == '__main__':
     sys.exit(main())
@@ -0,0 +1,162 @@
+#! /usr/bin/env python3
+#
+# Copyright 2026 The ANGLE Project Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+#
+# restricted_trace_perf_unittest.py:
+#   Tests for the parsing of the test outputs pulled from the device by restricted_trace_perf.py,
+#   and for the summary of its measurements.
+
+import csv
+import os
+import tempfile
+import unittest
+
+from restricted_trace_perf import (METRICS, SweepItem, get_sweep_entries, parse_gpu_memory,
+                                   parse_test_output, write_summary)
+
+PASSED_OUTPUT = """[==========] Running 1 test from 1 test suite.
+[ RUN      ] TraceTest.aztec_ruins_high
+running test name: "TracePerf", backend: "_native", story: "aztec_ruins_high"
+Frame 12 took too long
+*RESULT TracePerf_native.wall_time: aztec_ruins_high= 16.6170000000 ms
+RESULT TracePerf_native.trial_steps: aztec_ruins_high= 602 count
+*RESULT TracePerf_native.cpu_time: aztec_ruins_high= 2.5060000000 ms
+*RESULT TracePerf_native.gpu_time: aztec_ruins_high= 14.2380000000 ms
+RESULT TracePerf_native.memory_median: aztec_ruins_high= 348479488 sizeInBytes
+RESULT TracePerf_native.memory_max: aztec_ruins_high= 351625216 sizeInBytes
+Mean result time: 16.6170 ms.
+[       OK ] TraceTest.aztec_ruins_high (10432 ms)
+[==========] 1 test from 1 test suite ran. (10432 ms total)
+[  PASSED  ] 1 test.
+"""
+
+SKIPPED_OUTPUT = """[==========] Running 1 test from 1 test suite.
+[ RUN      ] TraceTest.minecraft
+Test skipped due to missing extension: GL_EXT_geometry_shader
+[  SKIPPED ] TraceTest.minecraft (12 ms)
+[  PASSED  ] 0 tests.
+"""
+
+GPU_MEMORY_OUTPUT = """time_elapsed: 1
+com.android.angle.test:test_process 16513
+Memory snapshot for GPU 0:
+Global total: 516833280
+Proc 504 total: 170385408
+Proc 16513 total: 100
+
+time_elapsed: 6
+com.android.angle.test:test_process 16513
+Memory snapshot for GPU 0:
+Global total: 516833280
+Proc 504 total: 170385408
+Proc 16513 total: 300
+
+time_elapsed: 9
+com.android.angle.test:test_process 16513
+Memory snapshot for GPU 0:
+Global total: 516833280
+Proc 16513 total: 200
+"""
+
+
+class ParseTestOutputTest(unittest.TestCase):
+
+    def test_passed(self):
+        results = parse_test_output(PASSED_OUTPUT)
+        self.assertEqual(results.wall_time, '16.6170')
+        self.assertEqual(results.gpu_time, '14.2380000000')
+        self.assertEqual(results.cpu_time, '2.5060000000')
+        self.assertEqual(results.frame_count, '602')
+        self.assertIsNone(results.missing_extension)
+        self.assertEqual(results.proc_mem_median, 348479488)
+        self.assertEqual(results.proc_mem_peak, 351625216)
+
+    def test_missing_extension(self):
+        results = parse_test_output(SKIPPED_OUTPUT)
+        self.assertEqual(results.wall_time, 'GL_EXT_geometry_shader')
+        self.assertEqual(results.missing_extension, 'GL_EXT_geometry_shader')
+        self.assertEqual(results.gpu_time, '0')
+        self.assertEqual(results.frame_count, 0)
+        self.assertEqual(results.proc_mem_peak, 0)
+
+    def test_missing_result(self):
+        output = PASSED_OUTPUT.replace('Mean result time', 'Median result time')
+        self.assertEqual(parse_test_output(output).wall_time, 'missing')
+
+    def test_crashed(self):
+        output = PASSED_OUTPUT[:PASSED_OUTPUT.index('*RESULT')]
+        self.assertEqual(parse_test_output(output).wall_time, 'crashed')
+        self.assertEqual(parse_test_output('').wall_time, 'crashed')
+
+    def test_error_lines_ignored_for_wall_time(self):
+        output = 'Error: Mean result time: 1.0 ms.\n' + PASSED_OUTPUT
+        self.assertEqual(parse_test_output(output).wall_time, '16.6170')
+
+
+class ParseGpuMemoryTest(unittest.TestCase):
+
+    def test_sustained_and_peak(self):
+        # Only the snapshots from the second half of the run are sustained.
+        self.assertEqual(parse_gpu_memory(GPU_MEMORY_OUTPUT, '10'), (250, 300))
+
+    def test_empty(self):
+        self.assertEqual(parse_gpu_memory('', '10'), (0, 0))
+
+
+SETTINGS = {
+    'maxsteps': '',
+    'fixedtime': '',
+    'minimizegpuwork': False,
+    'power': False,
+    'memory': False
+}
+
+
+def journal_entry(renderer, loop, trace, wall_time, mode='', settings=SETTINGS):
+    entry = {metric: 0 for metric in METRICS}
+    entry.update({
+        'renderer': renderer,
+        'loop': loop,
+        'trace': trace,
+        'mode': mode,
+        'settings': settings,
+        'wall_time': wall_time
+    })
+    return entry
+
+
+class SummaryTest(unittest.TestCase):
+
+    def test_sweep_entries(self):
+        items = [SweepItem('native', 0, 'a'), SweepItem('vulkan', 0, 'a')]
+        sweep_entry = journal_entry('native', 0, 'a', '1.0')
+        entries = [
+            sweep_entry,
+            journal_entry('vulkan', 0, 'a', '2.0', mode='vsync'),
+            journal_entry('vulkan', 0, 'a', '2.0', settings=dict(SETTINGS, maxsteps='10')),
+            journal_entry('native', 1, 'a', '3.0'),
+            journal_entry('native', 0, 'b', '4.0'),
+        ]
+        self.assertEqual(get_sweep_entries(entries, items, '', SETTINGS), [sweep_entry])
+
+    def test_missing_renderer(self):
+        entries = [
+            journal_entry('native', 0, 'a', '1.0'),
+            journal_entry('vulkan', 0, 'a', '2.0'),
+            journal_entry('native', 0, 'b', '3.0'),
+        ]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            summary_path = os.path.join(temp_dir, 'summary.csv')
+            write_summary(summary_path, 'header', ('native', 'vulkan'), ['a', 'b', 'c'], entries)
+            with open(summary_path, newline='') as f:
+                rows = list(csv.reader(f))
+
+        self.assertEqual(rows[2][:3], ['1', 'a', '1.000'])
+        self.assertEqual(len(rows), 7)
+        self.assertEqual(rows[5:], [['', 'b', 'vulkan'], ['', 'c', 'native vulkan']])
+
+
+if __name__ == '__main__':
+    unittest.main()
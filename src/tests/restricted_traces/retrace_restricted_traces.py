@@ -10,6 +10,7 @@ use this to update traces without needing to re-run the app on a device.
 '''
 
 import argparse
+import concurrent.futures
 import fnmatch
 import json
 import logging
@@ -20,6 +21,7 @@ import stat
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 
 from gen_restricted_traces import read_json as read_json, write_json as write_json
@@ -38,6 +40,16 @@ DEFAULT_TEST_SUITE = angle_test_util.ANGLE_TRACE_TEST_SUITE
 DEFAULT_TEST_JSON = 'restricted_traces.json'
 DEFAULT_LOG_LEVEL = 'info'
 DEFAULT_BACKUP_FOLDER = 'retrace-backups'
+DEFAULT_JOBS = 1
+
+# Number of traces listed in the timing summary.
+NUM_SLOWEST_TRACES = 10
+
+# Arguments that don't change the outcome of a trace. Results recorded in a journal with different
+# values for the other arguments (e.g. --limit or the output path) are not reused.
+JOURNAL_IGNORED_ARGS = [
+    'command', 'jobs', 'journal', 'log', 'show_test_stdout', 'test_output', 'traces', 'verbose'
+]
 
 EXIT_SUCCESS = 0
 EXIT_FAILURE = 1
@@ -172,7 +184,19 @@ def run_autoninja(args):
         subprocess.check_output(autoninja_args)
 
 
-def run_test_suite(args, trace_binary, trace, max_steps, additional_args, additional_env):
+# When a scratch directory is given, it's used as the temporary directory of the test binary so that
+# concurrent runs don't share temporary files.
+def run_test_suite(args,
+                   trace_binary,
+                   trace,
+                   max_steps,
+                   additional_args,
+                   additional_env,
+                   scratch_dir=None):
+    if scratch_dir:
+        additional_env = dict(
+            additional_env, TMPDIR=scratch_dir, TMP=scratch_dir, TEMP=scratch_dir)
+
     run_args = [
         angle_test_util.ExecutablePathInCurrentDir(trace_binary),
         '--gtest_filter=TraceTest.%s' % trace,
@@ -193,13 +217,19 @@ def run_test_suite(args, trace_binary, trace, max_steps, additional_args, additi
         logging.info('Test stdout:\n%s' % p.stdout.decode())
 
 
-def upgrade_single_trace(args, trace_binary, trace, out_path, no_overwrite, c_sources):
+def upgrade_single_trace(args,
+                         trace_binary,
+                         trace,
+                         out_path,
+                         no_overwrite,
+                         c_sources,
+                         scratch_dir=None):
     logging.debug('Tracing %s' % trace)
 
     trace_path = os.path.abspath(os.path.join(out_path, trace))
     if no_overwrite and path_contains_header(trace_path):
         logging.info('Skipping "%s" because the out folder already exists' % trace)
-        return
+        return True
 
     json_data = load_trace_json(trace)
     num_frames = get_num_frames(json_data)
@@ -235,7 +265,8 @@ def upgrade_single_trace(args, trace_binary, trace, out_path, no_overwrite, c_so
         if not os.path.isdir(trace_path):
             os.makedirs(trace_path)
 
-        run_test_suite(args, trace_binary, trace, max_steps, additional_args, additional_env)
+        run_test_suite(args, trace_binary, trace, max_steps, additional_args, additional_env,
+                       scratch_dir)
 
         json_file = "{}/{}.json".format(trace_path, trace)
         if not os.path.exists(json_file):
@@ -256,16 +287,142 @@ def upgrade_single_trace(args, trace_binary, trace, out_path, no_overwrite, c_so
     return True
 
 
+def get_journal_options(args):
+    return {name: value for name, value in vars(args).items() if name not in JOURNAL_IGNORED_ARGS}
+
+
+# Records the result of each trace of a command and its options as a line of JSON. Traces that
+# passed according to the journal are not run again, so an interrupted run resumes where it stopped
+# when given the same journal and options. Failed traces are run again.
+class ProgressJournal:
+
+    def __init__(self, path, command, options):
+        self.path = path
+        self.command = command
+        self.options = options
+        self.results = {}
+        self.lock = threading.Lock()
+
+        num_other_options = 0
+        if path and os.path.exists(path):
+            with open(path) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # The last line is cut short if the run was killed while writing it.
+                        continue
+                    if entry['command'] != command:
+                        continue
+                    if entry.get('options') != options:
+                        num_other_options += 1
+                        continue
+                    self.results[entry['trace']] = entry
+        if num_other_options:
+            logging.warning('Ignoring %d %s results of %s recorded with other options' %
+                            (num_other_options, command, path))
+
+    def record(self, trace, result, seconds):
+        entry = {
+            'command': self.command,
+            'options': self.options,
+            'trace': trace,
+            'result': result,
+            'seconds': seconds
+        }
+        with self.lock:
+            self.results[trace] = entry
+            if self.path:
+                with open(self.path, 'a') as f:
+                    f.write(json.dumps(entry) + '\n')
+
+
+def print_trace_report(command, results, elapsed, jobs):
+    trace_seconds = sum(result['seconds'] for result in results)
+    num_failures = len([result for result in results if result['result'] == FAIL])
+    print('%s: %d traces, %d failed. %.1fs elapsed with %d jobs, %.1fs spent in traces.' %
+          (command, len(results), num_failures, elapsed, jobs, trace_seconds))
+
+    slowest = sorted(results, key=lambda result: result['seconds'], reverse=True)
+    print('Slowest traces:')
+    for result in slowest[:NUM_SLOWEST_TRACES]:
+        print('  %-50s %8.1fs %s' % (result['trace'], result['seconds'], result['result']))
+
+
+# Calls run_trace(trace, scratch_dir) for each trace on args.jobs worker threads, each trace with an
+# empty scratch directory of its own. run_trace returns whether the trace passed. Returns the
+# results of all the traces, including those recorded in the journal by a previous run.
+def run_traces(args, command, traces, run_trace):
+    journal = ProgressJournal(args.journal, command, get_journal_options(args))
+    pending_traces = [
+        trace for trace in traces
+        if trace not in journal.results or journal.results[trace]['result'] != PASS
+    ]
+    if len(pending_traces) < len(traces):
+        logging.info('Skipping %d traces that passed according to %s' %
+                     (len(traces) - len(pending_traces), args.journal))
+
+    lock = threading.Lock()
+    interrupted = threading.Event()
+
+    def _next_trace():
+        with lock:
+            if interrupted.is_set() or not pending_traces:
+                return None
+            return pending_traces.pop(0)
+
+    def _run_worker():
+        while True:
+            trace = _next_trace()
+            if not trace:
+                return
+
+            start = time.time()
+            try:
+                with tempfile.TemporaryDirectory(prefix='retrace_%s_' % trace) as scratch_dir:
+                    passed = run_trace(trace, scratch_dir)
+            except Exception:
+                logging.exception('There was an exception running "%s"' % trace)
+                passed = False
+
+            # Traces cut short by an interruption are run again when resuming.
+            if not interrupted.is_set():
+                journal.record(trace, PASS if passed else FAIL, time.time() - start)
+
+    start = time.time()
+    threads = [threading.Thread(target=_run_worker) for _ in range(max(1, args.jobs))]
+    for thread in threads:
+        thread.start()
+    try:
+        for thread in threads:
+            thread.join()
+    except KeyboardInterrupt:
+        # The test binaries got the interrupt too. Let the workers clean up before exiting.
+        interrupted.set()
+        for thread in threads:
+            thread.join()
+        raise
+
+    results = [journal.results[trace] for trace in traces]
+    print_trace_report(command, results, time.time() - start, args.jobs)
+    return results
+
+
+def get_failed_traces(results):
+    return [result['trace'] for result in results if result['result'] == FAIL]
+
+
 def upgrade_traces(args, traces):
     run_autoninja(args)
     trace_binary = os.path.join(args.gn_path, args.test_suite)
 
-    failures = []
+    def _upgrade_trace(trace, scratch_dir):
+        return upgrade_single_trace(args, trace_binary, trace, args.out_path, args.no_overwrite,
+                                    args.c_sources, scratch_dir)
 
-    for trace in angle_test_util.FilterTests(traces, args.traces):
-        if not upgrade_single_trace(args, trace_binary, trace, args.out_path, args.no_overwrite,
-                                    args.c_sources):
-            failures += [trace]
+    results = run_traces(args, 'upgrade', angle_test_util.FilterTests(traces, args.traces),
+                         _upgrade_trace)
+    failures = get_failed_traces(results)
 
     if failures:
         print('The following traces failed to upgrade:\n')
@@ -275,12 +432,18 @@ def upgrade_traces(args, traces):
     return EXIT_SUCCESS
 
 
-def validate_single_trace(args, trace_binary, trace, additional_args, additional_env):
+def validate_single_trace(args,
+                          trace_binary,
+                          trace,
+                          additional_args,
+                          additional_env,
+                          scratch_dir=None):
     json_data = load_trace_json(trace)
     num_frames = get_num_frames(json_data)
     max_steps = min(args.limit, num_frames) if args.limit else num_frames
     try:
-        run_test_suite(args, trace_binary, trace, max_steps, additional_args, additional_env)
+        run_test_suite(args, trace_binary, trace, max_steps, additional_args, additional_env,
+                       scratch_dir)
     except subprocess.CalledProcessError as e:
         logging.error('There was a failure running "%s":\n%s' % (trace, e.output.decode()))
         return False
@@ -296,12 +459,15 @@ def validate_traces(args, traces):
         'ANGLE_FEATURE_OVERRIDES_ENABLED': 'allocateNonZeroMemory:forceInitShaderVariables'
     }
 
-    failures = []
     trace_binary = os.path.join(args.gn_path, args.test_suite)
 
-    for trace in angle_test_util.FilterTests(traces, args.traces):
-        if not validate_single_trace(args, trace_binary, trace, additional_args, additional_env):
-            failures += [trace]
+    def _validate_trace(trace, scratch_dir):
+        return validate_single_trace(args, trace_binary, trace, additional_args, additional_env,
+                                     scratch_dir)
+
+    results = run_traces(args, 'validate', angle_test_util.FilterTests(traces, args.traces),
+                         _validate_trace)
+    failures = get_failed_traces(results)
 
     if failures:
         print('The following traces failed to validate:\n')
@@ -333,25 +499,38 @@ def interpret_traces(args, traces):
     else:
         trace_binary = args.test_suite
 
-    for trace in angle_test_util.FilterTests(traces, args.traces):
-        with tempfile.TemporaryDirectory() as backup_path:
-            backup_single_trace(trace, backup_path)
-            result = FAIL
-            try:
-                with tempfile.TemporaryDirectory() as out_path:
-                    logging.debug('Using temporary path %s.' % out_path)
-                    if upgrade_single_trace(args, trace_binary, trace, out_path, False, True):
-                        if restore_single_trace(trace, out_path):
-                            validate_args = ['--trace-interpreter=c']
-                            if args.verbose:
-                                validate_args += ['--verbose-logging']
-                            if validate_single_trace(args, trace_binary, trace, validate_args, {}):
-                                logging.info('%s passed!' % trace)
-                                result = PASS
-            finally:
-                restore_single_trace(trace, backup_path)
-            results['num_failures_by_type'][result] += 1
-            results['tests'][test_name][trace] = {'expected': PASS, 'actual': result}
+    # Each trace is retraced into its scratch directory and replaced by the retrace in the trace
+    # folder while the interpreter runs it. The trace folder is then restored from its backup.
+    def _interpret_trace(trace, scratch_dir):
+        backup_path = os.path.join(scratch_dir, 'backup')
+        out_path = os.path.join(scratch_dir, 'out')
+        backup_single_trace(trace, backup_path)
+        try:
+            logging.debug('Using temporary path %s.' % out_path)
+            if not upgrade_single_trace(args, trace_binary, trace, out_path, False, True,
+                                        scratch_dir):
+                return False
+            if not restore_single_trace(trace, out_path):
+                return False
+            validate_args = ['--trace-interpreter=c']
+            if args.verbose:
+                validate_args += ['--verbose-logging']
+            if not validate_single_trace(args, trace_binary, trace, validate_args, {},
+                                         scratch_dir):
+                return False
+            logging.info('%s passed!' % trace)
+            return True
+        finally:
+            restore_single_trace(trace, backup_path)
+
+    for result in run_traces(args, 'interpret', angle_test_util.FilterTests(traces, args.traces),
+                             _interpret_trace):
+        results['num_failures_by_type'][result['result']] += 1
+        results['tests'][test_name][result['trace']] = {
+            'expected': PASS,
+            'actual': result['result'],
+            'time': result['seconds'],
+        }
 
     if results['num_failures_by_type'][FAIL]:
         logging.error('Some tests failed.')
@@ -382,143 +561,196 @@ def add_upgrade_args(parser):
         help='Limits the number of captured frames to produce a shorter trace than the original.')
 
 
-def get_min_reqs(args, traces):
-    run_autoninja(args)
+def add_parallel_args(parser):
+    parser.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        help='Number of traces to run at the same time. Default is %d.' % DEFAULT_JOBS,
+        default=DEFAULT_JOBS)
+    parser.add_argument(
+        '--journal',
+        help='File recording the result of each trace. Traces that passed according to it with '
+        'the same options are skipped, so an interrupted run can be resumed by passing the same '
+        'journal again.')
+
+
+# Runs the probes of the minimum requirements search of get_min_reqs on a pool of args.jobs
+# threads. Each probe runs a trace with a GLES version and, optionally, only the given extensions
+# requested. The requirements in the trace JSON are overridden on the command line, so probes of
+# several traces can run at the same time. Probe results are memoized per trace, GLES version and
+# set of extensions. With more than one job, probes whose result may not be needed are started
+# ahead of time and cancelled if they haven't started when their result turns out not to be needed.
+class MinReqsSearch:
+
+    def __init__(self, args, trace_binary, executor):
+        self.args = args
+        self.trace_binary = trace_binary
+        self.executor = executor
+        self.speculate = args.jobs > 1
+        self.lock = threading.Lock()
+        self.probes = {}
+
+    def _override_args(self, gles_version):
+        return ['--ignore-required-extensions', '--context-version', '%d.%d' % gles_version]
+
+    def _run_probe(self, trace, max_steps, gles_version, extensions):
+        additional_args = ['--no-warmup'] + self._override_args(gles_version)
+        if extensions is not None:
+            additional_args += ['--request-extensions', ' '.join(extensions)]
+
+        with tempfile.TemporaryDirectory() as scratch_dir:
+            try:
+                run_test_suite(self.args, self.trace_binary, trace, max_steps, additional_args, {},
+                               scratch_dir)
+            except subprocess.CalledProcessError:
+                return False
+        return True
 
-    env = {}
-    default_args = ["--no-warmup"]
+    # Returns a future for whether the trace runs. When extensions is None, all the extensions are
+    # enabled by default. A probe that is cancelled before it starts is submitted again when asked
+    # for another time.
+    def probe(self, trace, max_steps, gles_version, extensions=None):
+        key = (trace, gles_version, None if extensions is None else frozenset(extensions))
+        with self.lock:
+            future = self.probes.get(key)
+            if not future or future.cancelled():
+                future = self.executor.submit(self._run_probe, trace, max_steps, gles_version,
+                                              extensions)
+                self.probes[key] = future
+            return future
+
+    def _get_requestable_extensions(self, trace, max_steps, gles_version, scratch_dir):
+        extensions_file = os.path.join(scratch_dir, 'extensions.txt')
+        additional_args = self._override_args(gles_version) + [
+            '--print-extensions-to-file', extensions_file
+        ]
+        run_test_suite(self.args, self.trace_binary, trace, max_steps, additional_args, {},
+                       scratch_dir)
+        with open(extensions_file) as f:
+            return [line.strip() for line in f]
+
+    def get_requestable_extensions(self, trace, max_steps, gles_version, scratch_dir):
+        return self.executor.submit(self._get_requestable_extensions, trace, max_steps,
+                                    gles_version, scratch_dir).result()
+
+    # Returns the first of gles_versions the trace runs with, or the last one if it doesn't run with
+    # any.
+    def find_min_gles_version(self, trace, max_steps, gles_versions):
+        if self.speculate:
+            probes = [self.probe(trace, max_steps, version) for version in gles_versions]
+        for index, version in enumerate(gles_versions):
+            if self.probe(trace, max_steps, version).result():
+                if self.speculate:
+                    for later_probe in probes[index + 1:]:
+                        later_probe.cancel()
+                return version
+        return gles_versions[-1]
+
+    # Uses a divide and conquer strategy to find the required extensions. Max depth is log(N) where
+    # N is the number of extensions. Expected runtime is p*log(N), where p is the number of required
+    # extensions.
+    # others: A list that contains one or more required extensions, but is not actively being
+    #         searched
+    # exts: The list of extensions actively being searched. The trace is known to run with others
+    #       and exts.
+    def find_required_extensions(self, trace, max_steps, gles_version, others, exts, depth=0):
+        if len(exts) <= 1:
+            return exts
+        middle = int(len(exts) / 2)
+        left_partition = exts[:middle]
+        right_partition = exts[middle:]
+
+        # Below the top level, the right partition isn't needed if the left one passes.
+        left_probe = self.probe(trace, max_steps, gles_version, others + left_partition)
+        if depth == 0 or self.speculate:
+            right_probe = self.probe(trace, max_steps, gles_version, others + right_partition)
+        left_passed = left_probe.result()
+
+        if depth > 0 and left_passed:
+            if self.speculate:
+                right_probe.cancel()
+            return self.find_required_extensions(trace, max_steps, gles_version, others,
+                                                 left_partition, depth + 1)
+
+        right_passed = self.probe(trace, max_steps, gles_version,
+                                  others + right_partition).result()
+        if left_passed and right_passed:
+            # Neither left nor right contain necessary extensions
+            return []
+        elif left_passed:
+            # Only left contains necessary extensions
+            return self.find_required_extensions(trace, max_steps, gles_version, others,
+                                                 left_partition, depth + 1)
+        elif right_passed:
+            # Only right contains necessary extensions
+            return self.find_required_extensions(trace, max_steps, gles_version, others,
+                                                 right_partition, depth + 1)
+        else:
+            # Both left and right contain necessary extensions
+            left_reqs = self.find_required_extensions(trace, max_steps, gles_version,
+                                                      others + right_partition, left_partition,
+                                                      depth + 1)
+            right_reqs = self.find_required_extensions(trace, max_steps, gles_version,
+                                                       others + left_reqs, right_partition,
+                                                       depth + 1)
+            return left_reqs + right_reqs
+
+
+# Returns None when the requirements of the trace were found and saved to its JSON, or the reason
+# the trace was skipped.
+def find_trace_min_reqs(search, trace, scratch_dir):
+    print(f"Finding requirements for {trace}")
+    json_data = load_trace_json(trace)
+    max_steps = get_num_frames(json_data)
 
-    skipped_traces = []
-    trace_binary = os.path.join(args.gn_path, args.test_suite)
+    # Use the GLES version of the trace and no required extensions so that previous data doesn't
+    # affect the current run.
+    if not search.probe(trace, max_steps, get_gles_version(json_data), []).result():
+        return "Fails to run in default configuration on this machine"
 
-    for trace in angle_test_util.FilterTests(traces, args.traces):
-        print(f"Finding requirements for {trace}")
-        extensions = []
-        json_data = load_trace_json(trace)
-        max_steps = get_num_frames(json_data)
+    # Find minimum GLES version.
+    gles_versions = [(1, 0), (1, 1), (2, 0), (3, 0), (3, 1), (3, 2)]
+    min_version = search.find_min_gles_version(trace, max_steps, gles_versions)
 
-        # exts: a list of extensions to use with run_test_suite. If empty,
-        #       then run_test_suite runs with all extensions enabled by default.
-        def run_test_suite_with_exts(exts):
-            additional_args = default_args.copy()
-            additional_args += ['--request-extensions', ' '.join(exts)]
+    # Get the list of requestable extensions for the GLES version.
+    try:
+        extensions = search.get_requestable_extensions(trace, max_steps, min_version, scratch_dir)
+    except Exception:
+        return "Failed to read extension list, likely that test is skipped"
 
-            try:
-                run_test_suite(args, trace_binary, trace, max_steps, additional_args, env)
-            except subprocess.CalledProcessError as error:
-                return False
-            return True
+    if len(extensions) > 0 and not search.probe(trace, max_steps, min_version,
+                                                extensions).result():
+        return "Requesting all extensions results in test failure"
 
-        original_gles_version = get_gles_version(json_data)
-        original_extensions = None if 'RequiredExtensions' not in json_data else json_data[
-            'RequiredExtensions']
+    json_data['RequiredExtensions'] = search.find_required_extensions(
+        trace, max_steps, min_version, [], extensions)
+    set_gles_version(json_data, min_version)
+    save_trace_json(trace, json_data)
+    return None
 
-        def restore_trace():
-            if original_extensions is not None:
-                json_data['RequiredExtensions'] = original_extensions
-            set_gles_version(json_data, original_gles_version)
-            save_trace_json(trace, json_data)
 
-        try:
-            # Use the highest GLES version we have and empty the required
-            # extensions so that previous data doesn't affect the current
-            # run.
-            json_data['RequiredExtensions'] = []
-            save_trace_json(trace, json_data)
-            if not run_test_suite_with_exts([]):
-                skipped_traces.append(
-                    (trace, "Fails to run in default configuration on this machine"))
-                restore_trace()
-                continue
-
-            # Find minimum GLES version.
-            gles_versions = [(1, 0), (1, 1), (2, 0), (3, 0), (3, 1), (3, 2)]
-            min_version = None
-            for idx in range(len(gles_versions)):
-                min_version = gles_versions[idx]
-                set_gles_version(json_data, min_version)
-                save_trace_json(trace, json_data)
-                try:
-                    run_test_suite(args, trace_binary, trace, max_steps, default_args, env)
-                except subprocess.CalledProcessError as error:
-                    continue
-                break
-
-            # Get the list of requestable extensions for the GLES version.
-            try:
-                # Get the list of requestable extensions
-                with tempfile.NamedTemporaryFile() as tmp:
-                    # Some operating systems will not allow a file to be open for writing
-                    # by multiple processes. So close the temp file we just made before
-                    # running the test suite.
-                    tmp.close()
-                    additional_args = ["--print-extensions-to-file", tmp.name]
-                    run_test_suite(args, trace_binary, trace, max_steps, additional_args, env)
-                    with open(tmp.name) as f:
-                        for line in f:
-                            extensions.append(line.strip())
-            except Exception:
-                skipped_traces.append(
-                    (trace, "Failed to read extension list, likely that test is skipped"))
-                restore_trace()
-                continue
-
-            if len(extensions) > 0 and not run_test_suite_with_exts(extensions):
-                skipped_traces.append((trace, "Requesting all extensions results in test failure"))
-                restore_trace()
-                continue
-
-            # Reset RequiredExtensions so it doesn't interfere with our search
-            json_data['RequiredExtensions'] = []
-            save_trace_json(trace, json_data)
-
-            # Use a divide and conquer strategy to find the required extensions.
-            # Max depth is log(N) where N is the number of extensions. Expected
-            # runtime is p*log(N), where p is the number of required extensions.
-            # p*log(N)
-            # others: A list that contains one or more required extensions,
-            #         but is not actively being searched
-            # exts: The list of extensions actively being searched
-            def recurse_run(others, exts, depth=0):
-                if len(exts) <= 1:
-                    return exts
-                middle = int(len(exts) / 2)
-                left_partition = exts[:middle]
-                right_partition = exts[middle:]
-                left_passed = run_test_suite_with_exts(others + left_partition)
-
-                if depth > 0 and left_passed:
-                    # We know right_passed must be False because one stack up
-                    # run_test_suite(exts) returned False.
-                    return recurse_run(others, left_partition)
-
-                right_passed = run_test_suite_with_exts(others + right_partition)
-                if left_passed and right_passed:
-                    # Neither left nor right contain necessary extensions
-                    return []
-                elif left_passed:
-                    # Only left contains necessary extensions
-                    return recurse_run(others, left_partition, depth + 1)
-                elif right_passed:
-                    # Only right contains necessary extensions
-                    return recurse_run(others, right_partition, depth + 1)
-                else:
-                    # Both left and right contain necessary extensions
-                    left_reqs = recurse_run(others + right_partition, left_partition, depth + 1)
-                    right_reqs = recurse_run(others + left_reqs, right_partition, depth + 1)
-                    return left_reqs + right_reqs
-
-            recurse_reqs = recurse_run([], extensions, 0)
-
-            json_data['RequiredExtensions'] = recurse_reqs
-            save_trace_json(trace, json_data)
-        except BaseException as e:
-            restore_trace()
-            raise e
+def get_min_reqs(args, traces):
+    run_autoninja(args)
+
+    trace_binary = os.path.join(args.gn_path, args.test_suite)
+    skipped_traces = {}
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, args.jobs)) as executor:
+        search = MinReqsSearch(args, trace_binary, executor)
+
+        def _find_trace_min_reqs(trace, scratch_dir):
+            reason = find_trace_min_reqs(search, trace, scratch_dir)
+            if reason:
+                skipped_traces[trace] = reason
+            return reason is None
+
+        run_traces(args, 'get_min_reqs', angle_test_util.FilterTests(traces, args.traces),
+                   _find_trace_min_reqs)
 
     if skipped_traces:
         print("Finished get_min_reqs, skipped traces:")
-        for trace, reason in skipped_traces:
+        for trace, reason in sorted(skipped_traces.items()):
             print(f"\t{trace}: {reason}")
     else:
         print("Finished get_min_reqs for all traces specified")
@@ -577,6 +809,7 @@ def main():
     upgrade_parser.add_argument(
         '-c', '--c-sources', help='Output to c sources instead of cpp.', action='store_true')
     add_upgrade_args(upgrade_parser)
+    add_parallel_args(upgrade_parser)
     upgrade_parser.add_argument(
         '--show-test-stdout', help='Log test output.', action='store_true', default=False)
 
@@ -588,6 +821,7 @@ def main():
         'traces', help='Traces to validate. Supports fnmatch expressions.', default='*')
     validate_parser.add_argument(
         '-L', '--limit', '--frame-limit', type=int, help='Limits the number of tested frames.')
+    add_parallel_args(validate_parser)
     validate_parser.add_argument(
         '--show-test-stdout', help='Log test output.', action='store_true', default=False)
 
@@ -598,6 +832,7 @@ def main():
     interpret_parser.add_argument(
         'traces', help='Traces to test. Supports fnmatch expressions.', default='*')
     add_upgrade_args(interpret_parser)
+    add_parallel_args(interpret_parser)
     interpret_parser.add_argument(
         '--show-test-stdout', help='Log test output.', action='store_true', default=False)
     interpret_parser.add_argument(
@@ -617,6 +852,7 @@ def main():
         default='*')
     get_min_reqs_parser.add_argument(
         '--show-test-stdout', help='Log test output.', action='store_true', default=False)
+    add_parallel_args(get_min_reqs_parser)
 
     args, extra_flags = parser.parse_known_args()
 
@@ -8,12 +8,14 @@
 #   Runs ANGLE perf tests using some statistical averaging.
 
 import argparse
+import collections
 import contextlib
 import glob
 import importlib
 import io
 import json
 import logging
+import math
 import tempfile
 import time
 import os
@@ -22,6 +24,8 @@ import re
 import subprocess
 import shutil
 import sys
+import queue
+import threading
 
 SCRIPT_DIR = str(pathlib.Path(__file__).resolve().parent)
 PY_UTILS = str(pathlib.Path(SCRIPT_DIR) / 'py_utils')
@@ -46,6 +50,23 @@ DEFAULT_SAMPLES = 10
 DEFAULT_TRIALS = 4
 DEFAULT_MAX_ERRORS = 3
 DEFAULT_TRIAL_TIME = 3
+DEFAULT_MIN_SAMPLES = 2
+
+# Printed by the perf test harness after each sample with --sample-server.
+SAMPLE_DONE_MARKER = 'ANGLE_PERF_SAMPLE_DONE'
+# Seconds a --sample-server process may take to complete a sample before it's considered hung.
+SAMPLE_SERVER_TIMEOUT = 600
+# Lines of a sample's output kept to report its failure. Earlier lines are dropped as they're read.
+SAMPLE_OUTPUT_MAX_LINES = 1000
+
+# Student's t quantiles for the two-sided 95% confidence interval used by --target-ci, by degrees
+# of freedom. Larger degrees of freedom use a series expansion around the normal quantile.
+CI_95_T = [
+    None, 12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228, 2.201, 2.179,
+    2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086, 2.080, 2.074, 2.069, 2.064, 2.060,
+    2.056, 2.052, 2.048, 2.045, 2.042
+]
+CI_95_Z = 1.959964
 
 # Test expectations
 FAIL = 'FAIL'
@@ -107,6 +128,23 @@ def _sum_of_square_deviations(data, c):
     return ss
 
 
+def _sample_standard_deviation(data):
+    """Return the sample (n - 1) standard deviation of data."""
+    n = len(data)
+    if n < 2:
+        raise ValueError('variance requires at least two data points')
+    return (_sum_of_square_deviations(data, _mean(data)) / (n - 1))**0.5
+
+
+def _t_quantile_95(degrees_of_freedom):
+    """Return the Student's t quantile of the two-sided 95% confidence interval."""
+    if degrees_of_freedom < len(CI_95_T):
+        return CI_95_T[degrees_of_freedom]
+    z = CI_95_Z
+    return (z + (z**3 + z) / (4.0 * degrees_of_freedom) + (5 * z**5 + 16 * z**3 + 3 * z) /
+            (96.0 * degrees_of_freedom**2))
+
+
 def _coefficient_of_variation(data):
     """Calculates the population coefficient of variation."""
     n = len(data)
@@ -184,6 +222,11 @@ class Results:
         }
         self._results['num_failures_by_type'][FAIL] += 1
 
+    # Records a result reported by a device slot worker (see _run_tests_on_device_slots).
+    def result_from_worker(self, test, test_result):
+        self._test_results[self._testname(test)] = test_result
+        self._results['num_failures_by_type'][test_result['actual']] += 1
+
     def save_to_output_file(self, test_suite, fname):
         self._update_results(test_suite)
         with open(fname, 'w') as out_file:
@@ -227,12 +270,17 @@ def _merge_into_one_histogram(test_histogram_set):
         return merged_histogram
 
 
-def _wall_times_stats(wall_times):
+def _truncated_wall_times(wall_times):
     if len(wall_times) > 7:
         truncation_n = len(wall_times) >> 3
         logging.debug('Truncation: Removing the %d highest and lowest times from wall_times.' %
                       truncation_n)
-        wall_times = _truncated_list(wall_times, truncation_n)
+        return _truncated_list(wall_times, truncation_n)
+    return wall_times
+
+
+def _wall_times_stats(wall_times):
+    wall_times = _truncated_wall_times(wall_times)
 
     if len(wall_times) > 1:
         return ('truncated mean wall_time = %.2f, cov = %.2f%%' %
@@ -241,16 +289,43 @@ def _wall_times_stats(wall_times):
     return None
 
 
-def _run_test_suite(args, cmd_args, env):
+def _is_adaptive_sampling(args):
+    return args.target_cov is not None or args.target_ci is not None
+
+
+# With adaptive sampling, a test stops sampling once the mean wall_times of its samples are stable
+# enough: their coefficient of variation is below --target-cov and/or the 95% confidence interval
+# of their mean is within --target-ci of the mean (both in percent). The trials of a sample run in
+# the same process and aren't independent, so each sample only contributes its mean.
+def _wall_times_converged(args, sample_means):
+    num_samples = len(sample_means)
+    if not _is_adaptive_sampling(args) or num_samples < max(args.min_samples, 2):
+        return False
+
+    cov = _sample_standard_deviation(sample_means) / _mean(sample_means)
+    if args.target_cov is not None and cov * 100.0 > args.target_cov:
+        return False
+    ci = _t_quantile_95(num_samples - 1) * cov / math.sqrt(num_samples)
+    if args.target_ci is not None and ci * 100.0 > args.target_ci:
+        return False
+
+    logging.debug('wall_times converged after %d samples: cov = %.2f%%, ci = %.2f%%' %
+                  (num_samples, cov * 100.0, ci * 100.0))
+    return True
+
+
+def _run_test_suite(args, cmd_args, env, output_parsers=(), max_output_lines=None):
     return angle_test_util.RunTestSuite(
         args.test_suite,
         cmd_args,
         env,
         use_xvfb=args.xvfb,
-        show_test_stdout=args.show_test_stdout)
+        show_test_stdout=args.show_test_stdout,
+        output_parsers=output_parsers,
+        max_output_lines=max_output_lines)
 
 
-def _run_perf(args, common_args, env, steps_per_trial=None):
+def _perf_run_args(args, common_args, steps_per_trial):
     run_args = common_args + [
         '--trials',
         str(args.trials_per_sample),
@@ -267,22 +342,35 @@ def _run_perf(args, common_args, env, steps_per_trial=None):
     if args.perf_counters:
         run_args += ['--perf-counters', args.perf_counters]
 
+    return run_args
+
+
+def _move_debug_files(args, render_output_dir):
+    # Extract debug files for https://issuetracker.google.com/296921272
+    if args.isolated_script_test_output:
+        isolated_out_dir = os.path.dirname(args.isolated_script_test_output)
+        for path in glob.glob(os.path.join(render_output_dir, '*gzdbg*')):
+            shutil.move(path, isolated_out_dir)
+
+
+def _run_perf(args, common_args, env, steps_per_trial=None):
+    run_args = _perf_run_args(args, common_args, steps_per_trial)
+
     with temporary_dir() as render_output_dir:
         histogram_file_path = os.path.join(render_output_dir, 'histogram')
         run_args += ['--isolated-script-test-perf-output=%s' % histogram_file_path]
         run_args += ['--render-test-output-dir=%s' % render_output_dir]
 
-        exit_code, output, json_results = _run_test_suite(args, run_args, env)
+        # The results are read from the metrics and histogram files, the output is only reported
+        # if the test fails.
+        exit_code, output, json_results = _run_test_suite(
+            args, run_args, env, max_output_lines=SAMPLE_OUTPUT_MAX_LINES)
         if exit_code != EXIT_SUCCESS:
             raise RuntimeError('%s failed. Output:\n%s' % (args.test_suite, output))
         if SKIP in json_results['num_failures_by_type']:
             return SKIP, None, None
 
-        # Extract debug files for https://issuetracker.google.com/296921272
-        if args.isolated_script_test_output:
-            isolated_out_dir = os.path.dirname(args.isolated_script_test_output)
-            for path in glob.glob(os.path.join(render_output_dir, '*gzdbg*')):
-                shutil.move(path, isolated_out_dir)
+        _move_debug_files(args, render_output_dir)
 
         sample_metrics = _read_metrics(os.path.join(render_output_dir, 'angle_metrics'))
 
@@ -297,6 +385,183 @@ class _MaxErrorsException(Exception):
     pass
 
 
+class _SampleServerError(Exception):
+    pass
+
+
+# A test process started with --sample-server, which runs one sample per request instead of
+# exiting after the first one. This saves the process start, initialization, trace load and warmup
+# of every sample but the first. After each sample the process appends the sample's metrics to
+# angle_metrics and rewrites the histogram file with all the samples so far. Not supported on
+# Android or with xvfb, where the test process can't be driven through its stdin.
+class _SampleServer:
+
+    def __init__(self, args, common_args, env, steps_per_trial):
+        self._args = args
+        self._output_dir = tempfile.mkdtemp(prefix='angle_perf_server_')
+        self._histogram_path = os.path.join(self._output_dir, 'histogram')
+        self._results_path = os.path.join(self._output_dir, 'results.json')
+        self._metrics_offset = 0
+        self._num_samples = 0
+        self._last_output = ''
+        self._timed_out = False
+
+        cmd = [angle_test_util.TestSuiteCommand(args.test_suite)] + _perf_run_args(
+            args, common_args, steps_per_trial) + [
+                '--sample-server',
+                '--isolated-script-test-perf-output=%s' % self._histogram_path,
+                '--isolated-script-test-output=%s' % self._results_path,
+                '--render-test-output-dir=%s' % self._output_dir,
+            ]
+        logging.debug(' '.join(cmd))
+        self._process = subprocess.Popen(
+            cmd, env=env, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+
+        # Pipes can't be waited on with a timeout on Windows, so the output is read by a thread.
+        # It keeps draining the pipe while the process isn't sampling, e.g. while it exits.
+        self._output_lines = queue.Queue()
+        self._reader = threading.Thread(target=self._read_output, daemon=True)
+        self._reader.start()
+
+    def _read_output(self):
+        for line in iter(self._process.stdout.readline, b''):
+            self._output_lines.put(line.decode('utf-8', errors='replace'))
+        self._output_lines.put(None)
+
+    def _send(self, command):
+        try:
+            self._process.stdin.write((command + '\n').encode())
+            self._process.stdin.flush()
+        except OSError:  # e.g. BrokenPipeError if the process crashed
+            pass
+
+    # Reads the output of the current sample. Returns False if the process exited instead of
+    # completing the sample, or was killed for not completing it within SAMPLE_SERVER_TIMEOUT.
+    def _read_sample_output(self):
+        output = collections.deque(maxlen=SAMPLE_OUTPUT_MAX_LINES)
+        deadline = time.monotonic() + SAMPLE_SERVER_TIMEOUT
+        while True:
+            try:
+                line = self._output_lines.get(timeout=max(0, deadline - time.monotonic()))
+            except queue.Empty:
+                self._timed_out = True
+                self._process.kill()
+                break
+            if line is None:
+                break
+            if self._args.show_test_stdout:
+                sys.stdout.write(line)
+            if line.startswith(SAMPLE_DONE_MARKER):
+                return True
+            output.append(line)
+        self._last_output = ''.join(output)
+        return False
+
+    def _read_new_metrics(self):
+        metrics_path = os.path.join(self._output_dir, 'angle_metrics')
+        if not os.path.exists(metrics_path):
+            return []
+        with open(metrics_path) as f:
+            f.seek(self._metrics_offset)
+            new_metrics = f.read()
+            self._metrics_offset = f.tell()
+        return [json.loads(l) for l in new_metrics.splitlines()]
+
+    def run_sample(self):
+        if self._num_samples > 0:
+            self._send('sample')
+
+        if not self._read_sample_output():
+            exit_code = self._process.wait()
+            if exit_code == EXIT_SUCCESS and os.path.exists(self._results_path):
+                with open(self._results_path) as f:
+                    if SKIP in json.load(f)['num_failures_by_type']:
+                        return SKIP, None
+            if self._timed_out:
+                raise _SampleServerError(
+                    '%s did not complete sample %d within %d seconds. Output:\n%s' %
+                    (self._args.test_suite, self._num_samples + 1, SAMPLE_SERVER_TIMEOUT,
+                     self._last_output))
+            raise _SampleServerError(
+                '%s exited with code %d during sample %d. Output:\n%s' %
+                (self._args.test_suite, exit_code, self._num_samples + 1, self._last_output))
+
+        self._num_samples += 1
+        sample_metrics = self._read_new_metrics()
+        return (PASS, sample_metrics) if sample_metrics else (FAIL, None)
+
+    # Stops the process and returns the histograms of all the completed samples.
+    def close(self):
+        if self._process.poll() is None:
+            self._send('quit')
+            try:
+                self._process.wait(timeout=60)
+            except subprocess.TimeoutExpired:
+                logging.warning('%s did not exit, killing it' % self._args.test_suite)
+                self._process.kill()
+                self._process.wait()
+        # The reader stops at the end of the output, show what's left of it.
+        self._reader.join()
+        while not self._output_lines.empty():
+            line = self._output_lines.get()
+            if line is not None and self._args.show_test_stdout:
+                sys.stdout.write(line)
+        self._process.stdin.close()
+        self._process.stdout.close()
+
+        sample_histograms = None
+        if self._num_samples > 0 and os.path.exists(self._histogram_path):
+            sample_histograms = _read_histogram(self._histogram_path)
+        _move_debug_files(self._args, self._output_dir)
+        shutil.rmtree(self._output_dir)
+        return sample_histograms
+
+
+# Runs the samples of one test, each in its own test process or all in a _SampleServer with
+# --sample-server. If the server crashes, the test falls back to one process per sample from the
+# failed sample on.
+class _TestSampler:
+
+    def __init__(self, args, common_args, env, steps_per_trial):
+        self._args = args
+        self._common_args = common_args
+        self._env = env
+        self._steps_per_trial = steps_per_trial
+        self._histograms = histogram_set.HistogramSet()
+        self._server = None
+        if args.sample_server:
+            self._server = _SampleServer(args, common_args, env, steps_per_trial)
+
+    def _stop_server(self):
+        server_histograms = self._server.close()
+        if server_histograms:
+            self._histograms.Merge(server_histograms)
+        self._server = None
+
+    # Returns the test status and the metrics of the sample.
+    def run_sample(self):
+        if self._server:
+            try:
+                return self._server.run_sample()
+            except _SampleServerError as e:
+                logging.warning(e)
+                logging.warning('Relaunching %s for each remaining sample.' %
+                                self._args.test_suite)
+                self._stop_server()
+
+        test_status, sample_metrics, sample_histogram = _run_perf(self._args, self._common_args,
+                                                                  self._env, self._steps_per_trial)
+        if sample_histogram:
+            self._histograms.Merge(sample_histogram)
+        return test_status, sample_metrics
+
+    # Returns the histograms of all the samples.
+    def finish(self):
+        if self._server:
+            self._stop_server()
+        return self._histograms
+
+
 def _skipped_or_glmark2(test, test_status):
     if test_status == SKIP:
         logging.info('Test skipped by suite: %s' % test)
@@ -333,13 +598,14 @@ def _maybe_throttle_or_log_temps(custom_throttling_temp):
                       ','.join([str(int(n) // 1000) for n in out.decode().split('\n') if n]))
 
 
-def _run_tests(tests, args, extra_flags, env):
+def _create_results(args):
     if args.split_shard_samples and args.shard_index is not None:
-        test_suffix = Results('_shard%d' % args.shard_index)
-    else:
-        test_suffix = ''
+        return Results('_shard%d' % args.shard_index)
+    return Results('')
+
 
-    results = Results(test_suffix)
+def _run_tests(tests, args, extra_flags, env):
+    results = _create_results(args)
 
     histograms = histogram_set.HistogramSet()
     metrics = []
@@ -370,17 +636,22 @@ def _run_tests(tests, args, extra_flags, env):
             steps_per_trial = None
             trial_limit = 'trial_time=%d' % args.trial_time
 
-        logging.info('Test %d/%d: %s (samples=%d trials_per_sample=%d %s)' %
-                     (test_index + 1, len(tests), test, args.samples_per_test,
-                      args.trials_per_sample, trial_limit))
+        if _is_adaptive_sampling(args):
+            samples = '%d-%d' % (args.min_samples, args.samples_per_test)
+        else:
+            samples = str(args.samples_per_test)
+
+        logging.info(
+            'Test %d/%d: %s (samples=%s trials_per_sample=%d %s)' %
+            (test_index + 1, len(tests), test, samples, args.trials_per_sample, trial_limit))
 
         wall_times = []
-        test_histogram_set = histogram_set.HistogramSet()
+        sample_means = []
+        sampler = _TestSampler(args, common_args, env, steps_per_trial)
         for sample in range(args.samples_per_test):
             try:
                 _maybe_throttle_or_log_temps(args.custom_throttling_temp)
-                test_status, sample_metrics, sample_histogram = _run_perf(
-                    args, common_args, env, steps_per_trial)
+                test_status, sample_metrics = sampler.run_sample()
             except RuntimeError as e:
                 logging.error(e)
                 results.result_fail(test)
@@ -411,11 +682,20 @@ def _run_tests(tests, args, extra_flags, env):
                 break
 
             wall_times += sample_wall_times
-            test_histogram_set.Merge(sample_histogram)
+            sample_means.append(_mean(sample_wall_times))
             metrics.append(sample_metrics)
 
+            if _wall_times_converged(args, sample_means):
+                logging.info('Test %d/%d: %s: wall_time converged after %d samples' %
+                             (test_index + 1, len(tests), test, sample + 1))
+                break
+
+        test_histogram_set = sampler.finish()
+
         if not results.has_result(test):
-            assert len(wall_times) == (args.samples_per_test * args.trials_per_sample)
+            num_samples = len(wall_times) // args.trials_per_sample
+            assert len(wall_times) == (num_samples * args.trials_per_sample)
+            assert num_samples == args.samples_per_test or _is_adaptive_sampling(args)
             stats = _wall_times_stats(wall_times)
             if stats:
                 logging.info('Test %d/%d: %s: %s' % (test_index + 1, len(tests), test, stats))
@@ -425,6 +705,187 @@ def _run_tests(tests, args, extra_flags, env):
     return results, histograms, metrics
 
 
+# Command line of a worker running a single test on a device slot. The worker is another instance
+# of this script so that per-device state (e.g. android_helper's) stays in its own process.
+def _device_slot_worker_cmd(args, extra_flags, test, out_dir):
+    cmd = [
+        sys.executable,
+        os.path.join(SCRIPT_DIR, 'run_perf_tests.py'),
+        '--device-slot-worker',
+        '--test-suite',
+        args.test_suite,
+        '--filter',
+        test,
+        '--log',
+        args.log,
+        '--samples-per-test',
+        str(args.samples_per_test),
+        '--trials-per-sample',
+        str(args.trials_per_sample),
+        '--isolated-script-test-output=%s' % os.path.join(out_dir, 'output.json'),
+        '--isolated-script-test-perf-output=%s' % os.path.join(out_dir, 'perf_output.json'),
+    ]
+
+    if args.steps_per_trial:
+        cmd += ['--steps-per-trial', str(args.steps_per_trial)]
+    else:
+        cmd += ['--trial-time', str(args.trial_time)]
+
+    if args.smoke_test_mode:
+        cmd += ['--smoke-test-mode']
+    if args.xvfb:
+        cmd += ['--xvfb']
+    if args.show_test_stdout:
+        cmd += ['--show-test-stdout']
+    if args.perf_counters:
+        cmd += ['--perf-counters', args.perf_counters]
+    if args.custom_throttling_temp:
+        cmd += ['--custom-throttling-temp', str(args.custom_throttling_temp)]
+    if args.sample_server:
+        cmd += ['--sample-server']
+    if args.target_cov is not None:
+        cmd += ['--target-cov', str(args.target_cov)]
+    if args.target_ci is not None:
+        cmd += ['--target-ci', str(args.target_ci)]
+    cmd += ['--min-samples', str(args.min_samples)]
+
+    return cmd + extra_flags
+
+
+# Returns the worker output and the test result, histograms and metrics it saved. The result is
+# None if the worker didn't save all of them (e.g. it crashed).
+def _run_test_on_device_slot(args, extra_flags, env, test):
+    with temporary_dir('angle_perf_slot_') as out_dir:
+        cmd = _device_slot_worker_cmd(args, extra_flags, test, out_dir)
+        logging.debug(' '.join(cmd))
+        process = subprocess.run(cmd, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        output = process.stdout.decode('utf-8', errors='replace')
+
+        output_path = os.path.join(out_dir, 'output.json')
+        if not os.path.exists(output_path):
+            return output, None, None, []
+
+        try:
+            with open(output_path) as f:
+                test_result = json.load(f)['tests'].get(args.test_suite, {}).get(test)
+            test_histograms = _read_histogram(os.path.join(out_dir, 'perf_output.json'))
+            with open(os.path.join(out_dir, args.test_suite, 'angle_metrics.json')) as f:
+                test_metrics = json.load(f)
+        except (OSError, ValueError, KeyError) as e:
+            logging.error('Could not read the results of %s: %s' % (test, e))
+            return output, None, None, []
+
+        # Keep the debug files that the worker extracted next to its output.
+        if args.isolated_script_test_output:
+            isolated_out_dir = os.path.dirname(args.isolated_script_test_output)
+            for path in glob.glob(os.path.join(out_dir, '*gzdbg*')):
+                shutil.move(path, isolated_out_dir)
+
+        return output, test_result, test_histograms, test_metrics
+
+
+# Runs tests concurrently on several device slots (e.g. Android devices or GPUs), each selected by
+# its own environment variables. Every slot takes the next test as soon as it is free, and the
+# results are merged as if the tests ran sequentially in _run_tests.
+def _run_tests_on_device_slots(tests, args, extra_flags, env):
+    results = _create_results(args)
+    histograms = histogram_set.HistogramSet()
+    metrics = {}
+    lock = threading.Lock()
+    pending_tests = list(enumerate(tests))
+    state = {'total_errors': 0, 'exceptions': []}
+
+    def _next_test():
+        with lock:
+            if state['total_errors'] >= args.max_errors or not pending_tests:
+                return None
+            return pending_tests.pop(0)
+
+    def _run_slot(slot_index, slot_env):
+        slot_env = dict(env, **slot_env)
+        while True:
+            next_test = _next_test()
+            if not next_test:
+                return
+            test_index, test = next_test
+
+            logging.info('Test %d/%d: %s (slot %d)' %
+                         (test_index + 1, len(tests), test, slot_index))
+            try:
+                output, test_result, test_histograms, test_metrics = _run_test_on_device_slot(
+                    args, extra_flags, slot_env, test)
+            except Exception:
+                # Fail this test only, the slot moves on to the next one.
+                logging.exception('Running %s on slot %d failed' % (test, slot_index))
+                output, test_result, test_histograms, test_metrics = '', None, None, []
+
+            with lock:
+                sys.stdout.write('Output of %s (slot %d):\n%s' % (test, slot_index, output))
+                if test_result:
+                    results.result_from_worker(test, test_result)
+                    histograms.Merge(test_histograms)
+                    metrics[test_index] = test_metrics
+                else:
+                    logging.error('Test %s did not report a result' % test)
+                    results.result_fail(test)
+                if not test_result or test_result['actual'] == FAIL:
+                    state['total_errors'] += 1
+
+    # Errors outside of the tests (e.g. reporting) stop all slots and are raised in this thread.
+    def _run_slot_thread(slot_index, slot_env):
+        try:
+            _run_slot(slot_index, slot_env)
+        except BaseException as e:
+            with lock:
+                state['exceptions'].append(e)
+                del pending_tests[:]
+
+    threads = [
+        threading.Thread(target=_run_slot_thread, args=(slot_index, slot_env))
+        for slot_index, slot_env in enumerate(args.device_slot)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if state['exceptions']:
+        raise state['exceptions'][0]
+
+    if state['total_errors'] >= args.max_errors:
+        raise _MaxErrorsException()
+
+    # Keep the metrics in test order regardless of which slot finished first.
+    return results, histograms, [m for index in sorted(metrics) for m in metrics[index]]
+
+
+# Applies the environment of a device slot to this process for the duration of the block, for the
+# helpers that select their device from the process environment (e.g. adb with ANDROID_SERIAL).
+@contextlib.contextmanager
+def _device_slot_environment(slot_env):
+    saved_env = {name: os.environ.get(name) for name in slot_env}
+    os.environ.update(slot_env)
+    try:
+        yield
+    finally:
+        for name, value in saved_env.items():
+            if value is None:
+                del os.environ[name]
+            else:
+                os.environ[name] = value
+
+
+def _parse_device_slot(value):
+    slot_env = {}
+    for assignment in value.split(','):
+        name, sep, env_value = assignment.partition('=')
+        if not sep or not name:
+            raise argparse.ArgumentTypeError('Expected NAME=VALUE[,NAME=VALUE...], got: %s' %
+                                             value)
+        slot_env[name] = env_value
+    return slot_env
+
+
 def _find_test_suite_directory(test_suite):
     if os.path.exists(angle_test_util.ExecutablePathInCurrentDir(test_suite)):
         return '.'
@@ -479,8 +940,9 @@ def _log_nvidia_gpu_temperature():
 
 
 @contextlib.contextmanager
-def _maybe_lock_gpu_clocks():
-    if not _should_lock_gpu_clocks():
+def _maybe_lock_gpu_clocks(args):
+    # Device slot workers run while the main instance holds the lock.
+    if args.device_slot_worker or not _should_lock_gpu_clocks():
         yield
         return
 
@@ -567,6 +1029,38 @@ def main():
         '--custom-throttling-temp',
         help='Android: custom thermal throttling with limit set to this temperature (off by default)',
         type=float)
+    parser.add_argument(
+        '--sample-server',
+        help='Keep one test process running for all the samples of a test instead of relaunching '
+        'it for each sample. Falls back to relaunching if the process crashes. Not supported on '
+        'Android or with xvfb.',
+        action='store_true')
+    parser.add_argument(
+        '--target-cov',
+        help='Adaptive sampling: stop sampling a test once the coefficient of variation of the '
+        'mean wall_times of its samples is below this percentage. --samples-per-test is then the '
+        'maximum number of samples.',
+        type=float)
+    parser.add_argument(
+        '--target-ci',
+        help='Adaptive sampling: stop sampling a test once the 95%% confidence interval of the '
+        'mean of its per-sample mean wall_times is within this percentage of the mean. '
+        '--samples-per-test is then the maximum number of samples.',
+        type=float)
+    parser.add_argument(
+        '--min-samples',
+        help='Adaptive sampling: minimum number of samples per test. Default is %d.' %
+        DEFAULT_MIN_SAMPLES,
+        type=int,
+        default=DEFAULT_MIN_SAMPLES)
+    parser.add_argument(
+        '--device-slot',
+        help='Run tests concurrently on several devices. Each use adds a device slot, given as the '
+        'comma-separated environment variables selecting its device, e.g. '
+        'ANDROID_SERIAL=<serial>. Tests are assigned to slots as they become free.',
+        type=_parse_device_slot,
+        action='append')
+    parser.add_argument('--device-slot-worker', help=argparse.SUPPRESS, action='store_true')
 
     args, extra_flags = parser.parse_known_args()
 
@@ -596,14 +1090,25 @@ def main():
         else:
             os.chdir(test_suite_dir)
 
-    angle_test_util.Initialize(args.test_suite)
-
-    # Get test list
-    exit_code, output, _ = _run_test_suite(args, ['--list-tests', '--verbose'] + extra_flags, env)
-    if exit_code != EXIT_SUCCESS:
+    # Tests are listed (and on Android, the test suite initialized) on the first device slot. Its
+    # environment isn't kept in env, which the other slots' environments are applied to.
+    first_slot_env = args.device_slot[0] if args.device_slot else {}
+    with _device_slot_environment(first_slot_env):
+        angle_test_util.Initialize(args.test_suite)
+
+        if args.sample_server and (angle_test_util.IsAndroid() or args.xvfb):
+            logging.warning(
+                '--sample-server is not supported on Android or with xvfb, ignoring it.')
+            args.sample_server = False
+
+        # Get test list
+        test_list = angle_test_util.TestListParser()
+        exit_code, output, _ = _run_test_suite(args, ['--list-tests', '--verbose'] + extra_flags,
+                                               dict(env, **first_slot_env), [test_list])
+    if exit_code != EXIT_SUCCESS or test_list.tests is None:
         logging.fatal('Could not find test list from test output:\n%s' % output)
         sys.exit(EXIT_FAILURE)
-    tests = angle_test_util.GetTestsFromOutput(output)
+    tests = test_list.tests
 
     if args.filter:
         tests = angle_test_util.FilterTests(tests, args.filter)
@@ -621,11 +1126,17 @@ def main():
         logging.error('No tests to run.')
         return EXIT_FAILURE
 
+    args.min_samples = min(args.min_samples, args.samples_per_test)
+
     logging.info('Running %d test%s' % (len(tests), 's' if len(tests) > 1 else ' '))
 
     try:
-        with _maybe_lock_gpu_clocks():
-            results, histograms, metrics = _run_tests(tests, args, extra_flags, env)
+        with _maybe_lock_gpu_clocks(args):
+            if args.device_slot:
+                results, histograms, metrics = _run_tests_on_device_slots(
+                    tests, args, extra_flags, env)
+            else:
+                results, histograms, metrics = _run_tests(tests, args, extra_flags, env)
     except _MaxErrorsException:
         logging.error('Error count exceeded max errors (%d). Aborting.' % args.max_errors)
         return EXIT_FAILURE
@@ -857,6 +857,14 @@ void MetricWriter::writeIntegerValue(size_t value)
     }
 }
 
+void MetricWriter::flush()
+{
+    if (mFile != nullptr)
+    {
+        fflush(mFile);
+    }
+}
+
 void MetricWriter::close()
 {
     if (mFile != nullptr)
@@ -1870,6 +1878,16 @@ void TestSuite::addHistogramSample(const std::string &measurement,
     mHistogramWriter.addSample(measurement, story, value, units);
 }
 
+void TestSuite::flushPerfOutputs()
+{
+    if (!mHistogramJsonFile.empty())
+    {
+        WriteHistogramJson(mHistogramWriter, mHistogramJsonFile);
+    }
+
+    mMetricWriter.flush();
+}
+
 bool TestSuite::hasTestArtifactsDirectory() const
 {
     return !mTestArtifactDirectory.empty();
@@ -139,6 +139,7 @@ class MetricWriter
     void writeDoubleValue(double value);
     void writeIntegerValue(size_t value);
 
+    void flush();
     void close();
 
   private:
@@ -159,6 +160,9 @@ class TestSuite
                             const std::string &story,
                             double value,
                             const std::string &units);
+    // Writes the histograms and metrics recorded so far, for runners that read them while the
+    // test process keeps running.
+    void flushPerfOutputs();
 
     static TestSuite *GetInstance() { return mInstance; }
     static MetricWriter &GetMetricWriter() { return GetInstance()->mMetricWriter; }
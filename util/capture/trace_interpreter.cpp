@@ -12,6 +12,7 @@
 #include "anglebase/no_destructor.h"
 #include "common/gl_enum_utils.h"
 #include "common/string_utils.h"
+#include "common/system_utils.h"
 #include "trace_fixture.h"
 
 #define USE_SYSTEM_ZLIB
@@ -609,6 +610,7 @@ void TraceInterpreter::parseTraceGz()
 
 void TraceInterpreter::setupReplay()
 {
+    double parseStartTime = GetCurrentSystemTime();
     if (!gTraceGzPath.empty())
     {
         parseTraceGz();
@@ -618,6 +620,19 @@ void TraceInterpreter::setupReplay()
         parseTraceUncompressed();
     }
 
+    // Parse throughput of the trace, to measure changes to the parser.
+    if (mVerboseLogging)
+    {
+        double parseTime      = GetCurrentSystemTime() - parseStartTime;
+        size_t numParsedCalls = 0;
+        for (const auto &nameAndFunction : mTraceFunctions)
+        {
+            numParsedCalls += nameAndFunction.second.size();
+        }
+        printf("Parsed %zu calls in %.1f ms (%.0f calls/s).\n", numParsedCalls, parseTime * 1000.0,
+               numParsedCalls / parseTime);
+    }
+
     if (mTraceFunctions.count("SetupReplay") == 0)
     {
         printf("Did not find a SetupReplay function to run among %zu parsed functions.\n",
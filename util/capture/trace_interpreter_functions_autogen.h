@@ -0,0 +1,2092 @@
+// GENERATED FILE - DO NOT EDIT.
+// Generated by gen_interpreter_utils.py using data from gl.xml and gl_angle_ext.xml.
+//
+// Copyright 2026 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// trace_interpreter_functions_autogen.h:
+//   Lookup of the entry points and trace fixture functions known to the trace interpreter by
+//   name. Kept separate from the interpreter so that it can be unit tested.
+
+#ifndef ANGLE_TRACE_INTERPRETER_FUNCTIONS_AUTOGEN_H_
+#define ANGLE_TRACE_INTERPRETER_FUNCTIONS_AUTOGEN_H_
+
+#include <stdint.h>
+#include <string.h>
+
+namespace angle
+{
+namespace interpreter
+{
+// Minimal perfect hash function built by scripts/minimal_perfect_hash.py.
+constexpr uint32_t MinimalPerfectHash(const char *key,
+                                      const uint16_t *seeds,
+                                      uint32_t numSeeds,
+                                      uint32_t numKeys)
+{
+    uint32_t hash = 0x811c9dc5u;
+    for (; *key != '\0'; ++key)
+    {
+        hash = (hash ^ static_cast<unsigned char>(*key)) * 16777619u;
+    }
+    hash ^= seeds[(static_cast<uint64_t>(hash) * numSeeds) >> 32];
+    hash ^= hash >> 16;
+    hash *= 0x85ebca6bu;
+    hash ^= hash >> 13;
+    hash *= 0xc2b2ae35u;
+    hash ^= hash >> 16;
+    return static_cast<uint32_t>((static_cast<uint64_t>(hash) * numKeys) >> 32);
+}
+
+constexpr uint16_t kInterpreterFunctionSeeds[] = {
+    2,   8,    3,   12,  9,   35,  31,  8,   1,   10,  6,   20,  0,   15,  1,   0,    0,   17,  3,
+    6,   19,   2,   20,  0,   5,   27,  2,   6,   22,  15,  25,  12,  21,  3,   14,   4,   7,   0,
+    82,  1,    0,   1,   31,  0,   23,  2,   37,  9,   4,   10,  1,   8,   21,  52,   26,  0,   5,
+    0,   1,    92,  6,   4,   23,  33,  9,   63,  6,   4,   26,  41,  50,  15,  5,    0,   0,   16,
+    6,   1,    1,   123, 13,  2,   0,   18,  2,   5,   72,  6,   23,  28,  24,  0,    0,   30,  10,
+    28,  15,   14,  48,  2,   6,   35,  0,   2,   7,   1,   46,  1,   8,   0,   67,   0,   5,   2,
+    45,  7,    30,  10,  0,   22,  0,   2,   2,   63,  116, 77,  70,  0,   1,   0,    18,  16,  37,
+    0,   6,    47,  14,  72,  7,   40,  0,   14,  1,   165, 4,   0,   3,   62,  9,    87,  66,  7,
+    0,   0,    34,  0,   0,   11,  3,   0,   20,  7,   178, 40,  73,  18,  4,   37,   7,   14,  7,
+    50,  1,    65,  10,  90,  35,  18,  13,  2,   3,   7,   230, 0,   60,  23,  31,   154, 31,  114,
+    0,   25,   76,  9,   14,  0,   157, 54,  8,   140, 17,  4,   0,   2,   20,  0,    11,  0,   1,
+    21,  133,  2,   165, 2,   0,   0,   20,  152, 0,   17,  1,   26,  340, 0,   57,   3,   0,   36,
+    73,  15,   39,  2,   83,  60,  1,   12,  140, 0,   8,   4,   0,   1,   2,   244,  88,  67,  92,
+    0,   125,  27,  0,   6,   90,  19,  19,  90,  110, 0,   66,  14,  0,   12,  12,   89,  1,   77,
+    107, 5,    132, 134, 270, 385, 11,  27,  52,  15,  24,  9,   298, 22,  139, 4,    46,  2,   370,
+    0,   587,  59,  7,   91,  172, 140, 548, 30,  53,  2,   47,  9,   2,   6,   266,  155, 89,  51,
+    8,   477,  285, 3,   590, 16,  20,  6,   22,  26,  0,   552, 125, 57,  96,  1362, 11,  707, 9,
+    4,   2304, 630, 1,   18,  192, 45,  19,  0,   45,  917};
+
+// The entry points and trace fixture functions, indexed by GetInterpreterFunctionHash.
+constexpr const char *kInterpreterFunctionNames[] = {
+    "glUniform1uiv",
+    "glGetActiveUniformBlockiv",
+    "glTexEnvfv",
+    "glGetObjectLabel",
+    "glActiveTexture",
+    "glColorMaskiOES",
+    "glGetQueryObjectui64vEXT",
+    "glUniform2iv",
+    "glRenderbufferStorage",
+    "glDepthFunc",
+    "glImportSemaphoreZirconHandleANGLE",
+    "glDetachShader",
+    "glObjectLabelKHR",
+    "glGetStringi",
+    "CreatePbufferSurface",
+    "glGetUniformfvRobustANGLE",
+    "glTexStorageMem2DMultisampleEXT",
+    "glUniformMatrix3fv",
+    "glBeginPixelLocalStorageANGLE",
+    "CreateEGLSync",
+    "glGetInternalformativ",
+    "glGetFragDataIndexEXT",
+    "glProgramUniform1fvEXT",
+    "glDrawArraysInstancedBaseInstanceEXT",
+    "CreateProgram",
+    "glGetTexParameterIuiv",
+    "glGetClipPlanef",
+    "glSetFenceNV",
+    "glProgramUniformMatrix4x3fvEXT",
+    "glGetnUniformfvRobustANGLE",
+    "glGetSamplerParameterfvRobustANGLE",
+    "glDeleteVertexArraysOES",
+    "eglCopyMetalSharedEventANGLE",
+    "eglChooseConfig",
+    "eglStreamAttribKHR",
+    "glGetSamplerParameterIiv",
+    "glMatrixIndexPointerOES",
+    "glCurrentPaletteMatrixOES",
+    "glDeletePerfMonitorsAMD",
+    "glGetInteger64vRobustANGLE",
+    "glGetUniformIndices",
+    "glSampleCoverage",
+    "glFinishFenceNV",
+    "UpdateSemaphoreID",
+    "glGetMaterialfv",
+    "glGetProgramPipelineivEXT",
+    "glDrawElementsBaseVertex",
+    "glTexParameterIivOES",
+    "glPolygonOffset",
+    "glDeleteBuffers",
+    "glPolygonOffsetx",
+    "eglCopyBuffers",
+    "glUseProgram",
+    "glMatrixMode",
+    "glPointSizex",
+    "glBlendEquationSeparateiEXT",
+    "glTexBufferRange",
+    "glDeleteVertexArrays",
+    "UpdateClientBufferData",
+    "glGetPerfMonitorCounterInfoAMD",
+    "glGetProgramPipelineiv",
+    "glProgramUniform2fv",
+    "glVertexAttribI4i",
+    "glEnable",
+    "glGetMaterialxv",
+    "glGetProgramBinary",
+    "glGetTexParameterIuivOES",
+    "glDrawElementsInstancedANGLE",
+    "eglGetCompositorTimingANDROID",
+    "eglGetNextFrameIdANDROID",
+    "glTexGenfOES",
+    "glIsQueryEXT",
+    "glGetTexParameterfvRobustANGLE",
+    "glEndPixelLocalStorageANGLE",
+    "glFramebufferTexture2D",
+    "glGetAttribLocation",
+    "glGetnUniformfvKHR",
+    "glDrawTexivOES",
+    "glScalef",
+    "glTexStorage3D",
+    "glBlitFramebuffer",
+    "glBeginQueryEXT",
+    "glGetnUniformuiv",
+    "glGetFramebufferPixelLocalStorageParameterivRobustANGLE",
+    "glPrimitiveBoundingBox",
+    "eglQueryStreamu64KHR",
+    "glTexParameterIuivEXT",
+    "glGetDebugMessageLog",
+    "InitializeReplay",
+    "glVertexAttribPointer",
+    "glIsVertexArray",
+    "glGetTexLevelParameterivRobustANGLE",
+    "glGetFramebufferAttachmentParameterivOES",
+    "glCompressedTexImage3D",
+    "glDrawElementsInstancedBaseVertex",
+    "glLineWidthx",
+    "glGetIntegeri_v",
+    "glBlendFunciEXT",
+    "glClearTexSubImageEXT",
+    "glEnableiEXT",
+    "glDrawArraysInstanced",
+    "glDeleteFramebuffers",
+    "glFrustumx",
+    "eglSwapBuffersWithFrameTokenANGLE",
+    "glGetTexParameterIuivRobustANGLE",
+    "glProgramUniform4iEXT",
+    "glOrthof",
+    "glFramebufferPixelLocalClearValueuivANGLE",
+    "glUniform3uiv",
+    "glIsRenderbufferOES",
+    "glGetFramebufferAttachmentParameterivRobustANGLE",
+    "glGetQueryiv",
+    "glProgramUniformMatrix4x2fv",
+    "glTexBufferOES",
+    "glGetTexEnvxv",
+    "eglCreateNativeClientBufferANDROID",
+    "eglGetCurrentContext",
+    "glGetPerfMonitorCountersAMD",
+    "glTexEnviv",
+    "glBlendFunciOES",
+    "glStencilMask",
+    "glIsBuffer",
+    "glProgramUniform1fEXT",
+    "glProgramUniform4ivEXT",
+    "glBindBuffer",
+    "glBufferSubData",
+    "glVertexPointer",
+    "glIsMemoryObjectEXT",
+    "glDeleteProgramPipelines",
+    "glScalex",
+    "glGetTexLevelParameteriv",
+    "glGetPointervRobustANGLERobustANGLE",
+    "glCreateShader",
+    "glGetObjectPtrLabel",
+    "glEndPerfMonitorAMD",
+    "glGetVertexAttribiv",
+    "glUseProgramStages",
+    "glGetBufferParameterivRobustANGLE",
+    "glBlitFramebufferNV",
+    "glGetActiveUniformsiv",
+    "eglSwapInterval",
+    "glProgramUniform1ui",
+    "eglCreatePbufferSurface",
+    "glDisableiEXT",
+    "glPolygonModeANGLE",
+    "glTexStorageMem3DEXT",
+    "glShaderBinary",
+    "glUniform4f",
+    "glCreateShaderProgramv",
+    "glProgramUniform1iEXT",
+    "glEnableVertexAttribArray",
+    "glUnmapBuffer",
+    "glTexStorage2D",
+    "glEnableClientState",
+    "glTexParameterxv",
+    "glInvalidateSubFramebuffer",
+    "glColorMaskiEXT",
+    "eglDestroyImageKHR",
+    "glCompressedTexSubImage2D",
+    "glPushDebugGroupKHR",
+    "glVertexAttribBinding",
+    "glGetBooleani_v",
+    "glTexBuffer",
+    "glGetFramebufferParameteriv",
+    "glDepthRangef",
+    "glProgramUniform4fv",
+    "eglClientWaitSyncKHR",
+    "glGetVertexAttribfv",
+    "glGetQueryObjecti64vEXT",
+    "glFramebufferParameteriMESA",
+    "glGetQueryObjecti64vRobustANGLE",
+    "glLightx",
+    "glFramebufferTextureEXT",
+    "eglLabelObjectKHR",
+    "glLightf",
+    "glBlendFuncSeparate",
+    "glDisableExtensionANGLE",
+    "glVertexAttrib4fv",
+    "eglGetDisplay",
+    "glTexEnvf",
+    "glTexParameterfvRobustANGLE",
+    "glGetTexLevelParameterivANGLE",
+    "glRenderbufferStorageMultisampleANGLE",
+    "glGetSamplerParameterIivOES",
+    "eglHandleGPUSwitchANGLE",
+    "glUniformMatrix4x3fv",
+    "eglClientWaitSync",
+    "glGetProgramInterfaceiv",
+    "eglGetMscRateANGLE",
+    "glGenQueries",
+    "glBindTransformFeedback",
+    "glGetQueryivRobustANGLE",
+    "InitializeReplay4",
+    "glMultiDrawElementsANGLE",
+    "glGetFragDataLocation",
+    "eglLockSurfaceKHR",
+    "glFinish",
+    "glAttachShader",
+    "eglCreateContext",
+    "UpdateClientArrayPointer",
+    "glVertexAttribDivisor",
+    "glGetProgramResourceLocation",
+    "glGetTexParameterIivRobustANGLE",
+    "glUniform2fv",
+    "eglQueryDmaBufFormatsEXT",
+    "glCompressedTexImage3DRobustANGLE",
+    "glBindVertexBuffer",
+    "glProgramUniform2ui",
+    "glGetVertexAttribfvRobustANGLE",
+    "glDeleteProgramPipelinesEXT",
+    "glGetSamplerParameterIivEXT",
+    "glEndTransformFeedback",
+    "glProgramUniform1iv",
+    "UpdateRenderbufferID",
+    "glGetProgramResourceIndex",
+    "glUniform2ui",
+    "glMultiDrawElementsIndirectEXT",
+    "glBindUniformLocationCHROMIUM",
+    "glGetMultisamplefvRobustANGLE",
+    "glProgramUniform3fEXT",
+    "eglSwapBuffersWithDamageKHR",
+    "glCompressedTexSubImage2DRobustANGLE",
+    "glTexParameterIuivOES",
+    "glTexEnvi",
+    "glTexStorageMemFlags3DMultisampleANGLE",
+    "glProgramUniform1i",
+    "glTexImage2D",
+    "glGenBuffers",
+    "glUniformMatrix3x2fv",
+    "glBlendEquationSeparateiOES",
+    "glObjectLabel",
+    "glTexParameteriv",
+    "glIsTexture",
+    "glGenPerfMonitorsAMD",
+    "glTextureFoveationParametersQCOM",
+    "glUniform2i",
+    "eglStreamConsumerGLTextureExternalAttribsNV",
+    "glSamplerParameterIiv",
+    "glBeginTransformFeedback",
+    "glHint",
+    "glFramebufferPixelLocalClearValueivANGLE",
+    "glDisable",
+    "glViewport",
+    "glRenderbufferStorageMultisample",
+    "eglStreamPostD3DTextureANGLE",
+    "glCopyTexSubImage3D",
+    "glBlendFunci",
+    "glObjectPtrLabelKHR",
+    "glGetAttachedShaders",
+    "glProgramBinary",
+    "glDeleteMemoryObjectsEXT",
+    "eglGetSyncValuesCHROMIUM",
+    "glTexStorage1DEXT",
+    "glDeleteTransformFeedbacks",
+    "MapBufferOES",
+    "glGetQueryObjectivEXT",
+    "glDisablei",
+    "eglCreatePixmapSurface",
+    "glGetIntegeri_vRobustANGLE",
+    "glTexStorage2DMultisampleANGLE",
+    "glBindRenderbufferOES",
+    "glGetVertexAttribIuiv",
+    "glDrawRangeElementsBaseVertexEXT",
+    "glClearDepthf",
+    "glGetTexGenivOES",
+    "glProgramUniform2fEXT",
+    "DestroyEGLImage",
+    "eglGetError",
+    "DestroyEGLImageKHR",
+    "glLightModelx",
+    "glDeleteSamplers",
+    "glProgramUniform4uiv",
+    "glBindProgramPipeline",
+    "glLoadPaletteFromModelViewMatrixOES",
+    "glGetFixedv",
+    "glGetShaderInfoLog",
+    "glAcquireTexturesANGLE",
+    "glGetGraphicsResetStatusKHR",
+    "glUniform3i",
+    "glProgramUniform2fvEXT",
+    "glProgramUniformMatrix4x2fvEXT",
+    "glGetPerfMonitorCounterDataAMD",
+    "eglDestroyContext",
+    "glCreateProgram",
+    "glIsRenderbuffer",
+    "glGetUniformLocation",
+    "glGetClipPlanex",
+    "UpdateResourceIDBuffer",
+    "glGetFramebufferParameterivMESA",
+    "glFramebufferFoveationParametersQCOM",
+    "glVertexAttribIPointer",
+    "glGenFramebuffersOES",
+    "glGetSamplerParameterIuivEXT",
+    "glBlendEquation",
+    "glSelectPerfMonitorCountersAMD",
+    "glGetnUniformfvEXT",
+    "glGetProgramInfoLog",
+    "glProgramUniform4f",
+    "glNormal3x",
+    "glShadeModel",
+    "glFramebufferTextureOES",
+    "FenceSync2",
+    "glProgramUniform2uiEXT",
+    "glGetCompressedTexImageANGLE",
+    "glTexStorageMem3DMultisampleEXT",
+    "glGetUniformfv",
+    "eglMakeCurrent",
+    "UpdateFenceNVID",
+    "glDrawArraysInstancedANGLE",
+    "glProgramUniform3iv",
+    "glDrawElementsInstancedBaseVertexOES",
+    "glPauseTransformFeedback",
+    "glNormalPointer",
+    "glGetMultisamplefvANGLE",
+    "glResumeTransformFeedback",
+    "UpdateCurrentProgram",
+    "eglStreamConsumerAcquireKHR",
+    "glGetBooleanv",
+    "eglCreateSyncKHR",
+    "glVertexAttrib4f",
+    "glFramebufferTextureMultiviewOVR",
+    "glTexEnvxv",
+    "eglSetValidationEnabledANGLE",
+    "glGenProgramPipelines",
+    "glMultiDrawElementsInstancedANGLE",
+    "glGetBufferPointervOES",
+    "glProgramUniform1uiEXT",
+    "eglReacquireHighPowerGPUANGLE",
+    "glBufferStorageEXT",
+    "glFlushMappedBufferRangeEXT",
+    "glProgramUniform4i",
+    "glDrawBuffers",
+    "glProgramUniformMatrix3fvEXT",
+    "glIsProgramPipelineEXT",
+    "glMinSampleShading",
+    "eglAcquireExternalContextANGLE",
+    "glPatchParameteriEXT",
+    "glProgramUniform4uivEXT",
+    "glCompileShader",
+    "glMemoryBarrier",
+    "glEndQueryEXT",
+    "glEGLImageTargetRenderbufferStorageOES",
+    "eglProgramCacheGetAttribANGLE",
+    "glProgramUniform2f",
+    "glProgramUniform2uiv",
+    "glColor4ub",
+    "glProgramUniform3ui",
+    "glClientActiveTexture",
+    "glGetVertexAttribPointervRobustANGLE",
+    "eglProgramCachePopulateANGLE",
+    "glClear",
+    "glCompressedTexSubImage3DOES",
+    "glProgramUniform2uivEXT",
+    "glStencilOp",
+    "glGenTextures",
+    "glUniform1ui",
+    "glProgramBinaryOES",
+    "eglTerminate",
+    "glPointSizePointerOES",
+    "glPushMatrix",
+    "glCopySubTextureCHROMIUM",
+    "eglReleaseTexImage",
+    "eglReleaseThread",
+    "eglUnlockSurfaceKHR",
+    "glGetFloatv",
+    "glDebugMessageInsertKHR",
+    "glClipControlEXT",
+    "glGetFramebufferParameterivRobustANGLE",
+    "eglReleaseExternalContextANGLE",
+    "glDeleteProgram",
+    "glDrawElementsInstancedBaseInstanceEXT",
+    "glUniformMatrix2fv",
+    "glGetBufferParameteri64v",
+    "glGetActiveUniformBlockivRobustANGLE",
+    "glDeleteTextures",
+    "eglPresentationTimeANDROID",
+    "glIsEnabledi",
+    "glPrimitiveBoundingBoxEXT",
+    "eglQuerySurface",
+    "CreateEGLSyncKHR",
+    "eglSwapBuffers",
+    "eglCreateWindowSurface",
+    "glClipPlanex",
+    "glCompressedTexImage2DRobustANGLE",
+    "glTexStorageMem2DEXT",
+    "glGenerateMipmapOES",
+    "glProgramUniform3fvEXT",
+    "glGenFencesNV",
+    "glSamplerParameterIuivRobustANGLE",
+    "glGetnUniformivRobustANGLE",
+    "eglGetConfigs",
+    "glPolygonModeNV",
+    "glGetUniformiv",
+    "glLoadIdentity",
+    "glBufferStorageExternalEXT",
+    "glVertexAttribI4iv",
+    "glPrimitiveBoundingBoxOES",
+    "glMinSampleShadingOES",
+    "glUniform3iv",
+    "glTestFenceNV",
+    "glFramebufferPixelLocalStorageInterruptANGLE",
+    "glMultMatrixf",
+    "glRenderbufferStorageOES",
+    "glGetUniformivRobustANGLE",
+    "glSemaphoreParameterui64vEXT",
+    "InitializeReplay2",
+    "glProgramUniform4uiEXT",
+    "glActiveShaderProgram",
+    "glFramebufferTexture",
+    "glEGLImageTargetTexture2DOES",
+    "eglQueryAPI",
+    "eglQuerySurfacePointerANGLE",
+    "glTexStorageMemFlags2DANGLE",
+    "glDebugMessageCallbackKHR",
+    "glUniformMatrix3x4fv",
+    "glDisableClientState",
+    "glVertexAttrib1f",
+    "glPointSize",
+    "SetBufferID",
+    "glTexGenxvOES",
+    "glBlendColor",
+    "glIsSync",
+    "glImportMemoryFdEXT",
+    "glGetLightxv",
+    "glProgramUniform2iv",
+    "glLightModelf",
+    "glProgramUniformMatrix3x4fvEXT",
+    "glProgramUniformMatrix2fvEXT",
+    "glProgramUniform1uivEXT",
+    "glMultiDrawArraysInstancedANGLE",
+    "eglPrepareSwapBuffersANGLE",
+    "glMaterialf",
+    "eglBindAPI",
+    "glMemoryBarrierByRegion",
+    "glDrawElementsInstancedBaseVertexBaseInstanceEXT",
+    "eglCreateSync",
+    "eglInitialize",
+    "glColorPointer",
+    "UpdateQueryID",
+    "glTexImage3DRobustANGLE",
+    "glTexBufferRangeEXT",
+    "glEndTilingQCOM",
+    "eglGetSyncAttribKHR",
+    "glInsertEventMarkerEXT",
+    "glGetPerfMonitorCounterStringAMD",
+    "glGenSemaphoresEXT",
+    "glIsTransformFeedback",
+    "glSamplerParameterfvRobustANGLE",
+    "glBlendEquationi",
+    "eglGetCurrentDisplay",
+    "glFramebufferTextureLayer",
+    "glFramebufferFetchBarrierEXT",
+    "glProgramUniformMatrix3fv",
+    "eglReleaseDeviceANGLE",
+    "glDebugMessageInsert",
+    "eglProgramCacheQueryANGLE",
+    "glDrawTexxOES",
+    "glQueryCounterEXT",
+    "glSignalSemaphoreEXT",
+    "FenceSync",
+    "glGetVertexAttribIivRobustANGLE",
+    "glGetTexParameterIivEXT",
+    "eglDestroyStreamKHR",
+    "glImportSemaphoreFdEXT",
+    "glGetTexLevelParameterfvRobustANGLE",
+    "glDispatchCompute",
+    "glBindRenderbuffer",
+    "glTexEnvx",
+    "glGetProgramiv",
+    "glReleaseTexturesANGLE",
+    "glBlendEquationiOES",
+    "eglCreatePlatformWindowSurfaceEXT",
+    "glGetError",
+    "eglQueryDebugKHR",
+    "glPopDebugGroupKHR",
+    "glDrawElementsIndirect",
+    "glGetTexEnviv",
+    "eglWaitSyncKHR",
+    "glTexGenivOES",
+    "glBufferData",
+    "glGetShaderSource",
+    "glProgramParameteriEXT",
+    "glGetFramebufferPixelLocalStorageParameterfvRobustANGLE",
+    "glColor4x",
+    "SetCurrentContextID",
+    "glUniformMatrix4fv",
+    "glTexParameteri",
+    "glUnmapBufferOES",
+    "glDiscardFramebufferEXT",
+    "UpdateBufferID",
+    "glGetTexParameterIivOES",
+    "glMultiTexCoord4f",
+    "glSamplerParameterIivOES",
+    "glEGLImageTargetTexStorageEXT",
+    "glGetPerfMonitorGroupsAMD",
+    "glGetMultisamplefv",
+    "glGetSamplerParameterIuiv",
+    "glDebugMessageCallback",
+    "glSampleMaski",
+    "glEnableiOES",
+    "glMultiDrawElementsBaseVertexEXT",
+    "eglGetConfigAttrib",
+    "glLoseContextCHROMIUM",
+    "glVertexAttribDivisorEXT",
+    "glGetTexParameterIiv",
+    "glSamplerParameterfv",
+    "glBindVertexArrayOES",
+    "glTexGeniOES",
+    "glTexParameterIuiv",
+    "glTexImage3D",
+    "glLogicOpANGLE",
+    "glProgramUniform3f",
+    "glBindImageTexture",
+    "glGetFramebufferPixelLocalStorageParameterivANGLE",
+    "glGetObjectPtrLabelKHR",
+    "UpdateTransformFeedbackID",
+    "eglGetCompositorTimingSupportedANDROID",
+    "glBeginQuery",
+    "eglGetFrameTimestampSupportedANDROID",
+    "glGetRenderbufferImageANGLE",
+    "eglDebugMessageControlKHR",
+    "eglProgramCacheResizeANGLE",
+    "glGetUnsignedBytevEXT",
+    "glCheckFramebufferStatusOES",
+    "glClearColor",
+    "glProgramUniform3ivEXT",
+    "glGenQueriesEXT",
+    "glTransformFeedbackVaryings",
+    "glGetIntegervRobustANGLE",
+    "UpdateProgramPipelineID",
+    "glBindVertexArray",
+    "glVertexAttrib3fv",
+    "eglDestroySync",
+    "glBindFramebuffer",
+    "glGetVertexAttribivRobustANGLE",
+    "eglGetPlatformDisplay",
+    "glIsEnablediEXT",
+    "glProgramUniform4fEXT",
+    "UpdateUniformLocation",
+    "glPixelStorei",
+    "glMultiDrawElementsInstancedBaseVertexBaseInstanceANGLE",
+    "glDrawElementsBaseVertexOES",
+    "glNamedBufferStorageExternalEXT",
+    "eglQueryDisplayAttribEXT",
+    "glGetProgramInterfaceivRobustANGLE",
+    "glCopyBufferSubData",
+    "glVertexAttribI4ui",
+    "glAlphaFuncx",
+    "glIsSampler",
+    "glReadnPixelsRobustANGLE",
+    "glTexStorage2DMultisample",
+    "glGetBufferParameteri64vRobustANGLE",
+    "glGetRenderbufferParameterivOES",
+    "glStartTilingQCOM",
+    "glLabelObjectEXT",
+    "glClearBufferuiv",
+    "glDeleteSemaphoresEXT",
+    "glIsSemaphoreEXT",
+    "glUniform1i",
+    "glUniform3ui",
+    "glGetTexParameterivRobustANGLE",
+    "glGetnUniformivKHR",
+    "glCreateMemoryObjectsEXT",
+    "glLightModelxv",
+    "glTexParameterx",
+    "glLineWidth",
+    "glDrawElements",
+    "glClearBufferiv",
+    "glPolygonOffsetClampEXT",
+    "glDrawArrays",
+    "glGetTexLevelParameterfvANGLE",
+    "glImportMemoryZirconHandleANGLE",
+    "glProgramUniformMatrix2x3fvEXT",
+    "glCullFace",
+    "glFogfv",
+    "glDrawElementsInstancedBaseVertexEXT",
+    "glFogf",
+    "glIsFenceNV",
+    "glGetTexGenxvOES",
+    "glDebugMessageControl",
+    "glFramebufferRenderbuffer",
+    "glFramebufferFoveationConfigQCOM",
+    "glSamplerParameteriv",
+    "glGetBufferPointerv",
+    "eglSignalSyncKHR",
+    "glUniformMatrix2x4fv",
+    "glGetGraphicsResetStatusEXT",
+    "MapBufferRange",
+    "glBindAttribLocation",
+    "glTexSubImage3DOES",
+    "glValidateProgramPipeline",
+    "glGetActiveUniform",
+    "glProgramUniform1uiv",
+    "glDrawElementsInstancedBaseVertexBaseInstanceANGLE",
+    "glGetProgramResourceName",
+    "glColorMaski",
+    "UniformBlockBinding",
+    "eglBindTexImage",
+    "glBindSampler",
+    "glGetActiveUniformBlockName",
+    "glCopyImageSubData",
+    "eglCreateImage",
+    "glGetInteger64vEXT",
+    "glInvalidateFramebuffer",
+    "glBlendFuncSeparatei",
+    "glCoverageModulationCHROMIUM",
+    "glBindFragDataLocationEXT",
+    "glSamplerParameterivRobustANGLE",
+    "glGetVertexAttribIiv",
+    "glGetActiveAttrib",
+    "glGetTexParameterfv",
+    "glInvalidateTextureANGLE",
+    "eglWaitNative",
+    "eglDestroyImage",
+    "glTexImage2DExternalANGLE",
+    "glVertexAttrib1fv",
+    "glProgramUniform3uivEXT",
+    "CreateEGLImage",
+    "glTexBufferRangeOES",
+    "glUniform2f",
+    "glProgramUniform3uiEXT",
+    "glDrawArraysIndirect",
+    "glMapBufferRange",
+    "ValidateSerializedState",
+    "eglCreateImageKHR",
+    "glPopDebugGroup",
+    "CreateShader",
+    "glMapBufferOES",
+    "glShaderSource",
+    "glProgramUniform3iEXT",
+    "glLightfv",
+    "glTexStorage3DMultisampleOES",
+    "glPatchParameteri",
+    "glTexImage2DRobustANGLE",
+    "glFramebufferTexture3DOES",
+    "glGetUnsignedBytei_vEXT",
+    "glCopyImageSubDataOES",
+    "glIsFramebufferOES",
+    "glUniform1f",
+    "glLightxv",
+    "glRotatex",
+    "glGetSynciv",
+    "glTranslatef",
+    "glVertexBindingDivisor",
+    "glVertexAttribI4uiv",
+    "glFramebufferPixelLocalStorageRestoreANGLE",
+    "glLogicOp",
+    "glGetSemaphoreParameterui64vEXT",
+    "glPushGroupMarkerEXT",
+    "glGetPointerv",
+    "glDrawBuffersEXT",
+    "glFenceSync",
+    "glDispatchComputeIndirect",
+    "glProgramUniformMatrix4x3fv",
+    "glDepthMask",
+    "eglWaitGL",
+    "glUniform1fv",
+    "glGetQueryObjectuivEXT",
+    "glCopyTexImage2D",
+    "glBindFragDataLocationIndexedEXT",
+    "glPointParameterx",
+    "glGetFenceivNV",
+    "glClearBufferfi",
+    "glProgramUniform3fv",
+    "glSamplerParameterIivRobustANGLE",
+    "glGetDebugMessageLogKHR",
+    "eglExportVkImageANGLE",
+    "glGetPointervKHR",
+    "glVertexAttrib2f",
+    "glProgramUniformMatrix4fv",
+    "glDisableiOES",
+    "glCopyTextureCHROMIUM",
+    "glGetTexEnvfv",
+    "glDrawTexsOES",
+    "glReadnPixels",
+    "glGenRenderbuffersOES",
+    "glTexParameterIuivRobustANGLE",
+    "glGetTransformFeedbackVarying",
+    "glReadBuffer",
+    "glGetProgramResourceiv",
+    "glBeginPerfMonitorAMD",
+    "glStencilMaskSeparate",
+    "glGetFloatvRobustANGLE",
+    "glStencilOpSeparate",
+    "glSamplerParameterIuivOES",
+    "eglGetCurrentSurface",
+    "glIsProgramPipeline",
+    "glGenVertexArraysOES",
+    "eglCreateStreamKHR",
+    "glProgramUniformMatrix2fv",
+    "glDrawArraysInstancedEXT",
+    "glBlendBarrier",
+    "glGetMemoryObjectParameterivEXT",
+    "CreateEGLImageKHR",
+    "glGetQueryObjectui64vRobustANGLE",
+    "glGetnUniformfv",
+    "glGetGraphicsResetStatus",
+    "eglWaitUntilWorkScheduledANGLE",
+    "glAlphaFunc",
+    "glGetSamplerParameteriv",
+    "glDrawRangeElementsBaseVertex",
+    "glRotatef",
+    "glCompressedTexSubImage3DRobustANGLE",
+    "glTexGenfvOES",
+    "eglDestroySyncKHR",
+    "glGetTexParameterxv",
+    "glLoadMatrixf",
+    "UpdateFramebufferID",
+    "glGetQueryObjectuivRobustANGLE",
+    "glGetBooleani_vRobustANGLE",
+    "glValidateProgram",
+    "glSampleCoveragex",
+    "glGetRenderbufferParameteriv",
+    "glClearBufferfv",
+    "glGetBufferParameteriv",
+    "glFramebufferPixelLocalClearValuefvANGLE",
+    "glGetShaderPrecisionFormat",
+    "glGetBufferPointervRobustANGLE",
+    "glGetInteger64i_vRobustANGLE",
+    "eglQueryDisplayAttribANGLE",
+    "glFlushMappedBufferRange",
+    "glMaterialxv",
+    "CreateShaderProgramv",
+    "glGetTexParameteriv",
+    "glUniform4iv",
+    "glPixelLocalStorageBarrierANGLE",
+    "glTexStorageMemFlags3DANGLE",
+    "glShadingRateQCOM",
+    "glCreateShaderProgramvEXT",
+    "glGetProgramBinaryOES",
+    "glGetObjectLabelEXT",
+    "eglWaitClient",
+    "glMaxShaderCompilerThreadsKHR",
+    "glTexCoordPointer",
+    "glLightModelfv",
+    "glDeleteFencesNV",
+    "glProgramUniformMatrix2x4fv",
+    "glFramebufferMemorylessPixelLocalStorageANGLE",
+    "glDeleteQueries",
+    "glPopGroupMarkerEXT",
+    "eglCreateStreamProducerD3DTextureANGLE",
+    "glGetnUniformivEXT",
+    "glBlendEquationSeparate",
+    "DeleteUniformLocations",
+    "glMultiTexCoord4x",
+    "glTexStorage2DEXT",
+    "glGetnUniformuivKHR",
+    "glGetString",
+    "eglStreamConsumerGLTextureExternalKHR",
+    "glDebugMessageControlKHR",
+    "eglQueryString",
+    "glOrthox",
+    "glFogx",
+    "glEnablei",
+    "glGetVertexAttribPointerv",
+    "glIsEnabled",
+    "glGetPerfMonitorGroupStringAMD",
+    "glBlendFuncSeparateiOES",
+    "glIsQuery",
+    "glGetUniformBlockIndex",
+    "eglCreatePlatformPixmapSurfaceEXT",
+    "UpdateMemoryObjectID",
+    "glFlush",
+    "glMemoryObjectParameterivEXT",
+    "eglSetDamageRegionKHR",
+    "glGetShaderiv",
+    "glDrawElementsInstanced",
+    "glUniform3fv",
+    "glGenVertexArrays",
+    "glTexGenxOES",
+    "eglQueryContext",
+    "glTexParameterf",
+    "glProgramUniformMatrix2x3fv",
+    "eglQueryDeviceStringEXT",
+    "eglQueryDeviceAttribEXT",
+    "glTexParameterivRobustANGLE",
+    "eglStreamConsumerReleaseKHR",
+    "UpdateUniformBlockIndex",
+    "glGetQueryObjectuiv",
+    "eglGetProcAddress",
+    "glFramebufferTexturePixelLocalStorageANGLE",
+    "glGetTranslatedShaderSourceANGLE",
+    "glUniformMatrix4x2fv",
+    "glMaterialx",
+    "glClearDepthx",
+    "glGetProgramResourceLocationIndexEXT",
+    "glGenerateMipmap",
+    "glGetInteger64v",
+    "glSamplerParameterIuiv",
+    "glEGLImageTargetTextureStorageEXT",
+    "glGetSamplerParameterfv",
+    "glMultiDrawArraysANGLE",
+    "glTexStorage3DMultisample",
+    "glGetObjectLabelKHR",
+    "glPopMatrix",
+    "glGetInternalformativRobustANGLE",
+    "InitializeReplay3",
+    "glGetnUniformiv",
+    "glUniform1iv",
+    "glNormal3f",
+    "glUniform4uiv",
+    "glFramebufferTexture2DMultisampleEXT",
+    "glDepthRangex",
+    "glCompressedTexSubImage3D",
+    "glProgramUniformMatrix2x4fvEXT",
+    "glCopyTexSubImage2D",
+    "glGetSamplerParameterIivRobustANGLE",
+    "glScissor",
+    "glDeleteRenderbuffersOES",
+    "glVertexAttribDivisorANGLE",
+    "glValidateProgramPipelineEXT",
+    "glTexImage3DOES",
+    "glUniform4ui",
+    "glBindFramebufferOES",
+    "glBlendFunc",
+    "glIsEnablediOES",
+    "glBindBufferBase",
+    "glGetQueryivEXT",
+    "glGetProgramivRobustANGLE",
+    "glUniform2uiv",
+    "glPointParameterfv",
+    "glDeleteRenderbuffers",
+    "glDeleteFramebuffersOES",
+    "glBlendBarrierKHR",
+    "glProgramUniform2i",
+    "glFramebufferTexture2DOES",
+    "glTexBufferEXT",
+    "UpdateTextureID",
+    "glLoadMatrixx",
+    "glDrawRangeElementsBaseVertexOES",
+    "glWaitSemaphoreEXT",
+    "glGetBooleanvRobustANGLE",
+    "glColorMask",
+    "glGenSamplers",
+    "eglSetBlobCacheFuncsANDROID",
+    "glGetSamplerParameterIuivRobustANGLE",
+    "glMultiDrawArraysInstancedBaseInstanceANGLE",
+    "glEndQuery",
+    "glDrawTexxvOES",
+    "glQueryMatrixxOES",
+    "glPatchParameteriOES",
+    "glLinkProgram",
+    "glSamplerParameterIivEXT",
+    "glGetQueryObjectivRobustANGLE",
+    "UpdateClientBufferDataWithOffset",
+    "glCopySubTexture3DANGLE",
+    "glReadPixelsRobustANGLE",
+    "eglDestroySurface",
+    "glCopyImageSubDataEXT",
+    "SetTextureID",
+    "glDrawElementsInstancedEXT",
+    "glCompressedCopyTextureCHROMIUM",
+    "glWeightPointerOES",
+    "glRenderbufferStorageMultisampleEXT",
+    "glTexSubImage2D",
+    "glGetSamplerParameterIuivOES",
+    "glSamplerParameteri",
+    "UpdateShaderProgramID",
+    "glGetInteger64i_v",
+    "glCompressedTexImage2D",
+    "eglReleaseHighPowerGPUANGLE",
+    "glProgramUniformMatrix3x2fvEXT",
+    "eglQueryDmaBufModifiersEXT",
+    "glBindBufferRange",
+    "glDrawTexiOES",
+    "glGetSamplerParameterivRobustANGLE",
+    "glUniformBlockBinding",
+    "glReadnPixelsEXT",
+    "glReleaseShaderCompiler",
+    "SetFramebufferID",
+    "glDrawArraysInstancedBaseInstanceANGLE",
+    "glGetShaderivRobustANGLE",
+    "glProgramUniform1ivEXT",
+    "glClipPlanef",
+    "glWaitSync",
+    "glClearColorx",
+    "glIsFramebuffer",
+    "glGenRenderbuffers",
+    "glDrawRangeElements",
+    "glMaterialfv",
+    "glProgramUniform4iv",
+    "eglSurfaceAttrib",
+    "glBlendEquationiEXT",
+    "glSampleMaskiANGLE",
+    "eglGetFrameTimestampsANDROID",
+    "glIsVertexArrayOES",
+    "glBlitFramebufferANGLE",
+    "eglWaitSync",
+    "glVertexAttrib3f",
+    "glUniform4i",
+    "glProgramUniformMatrix4fvEXT",
+    "glGetRenderbufferParameterivRobustANGLE",
+    "glUseProgramStagesEXT",
+    "glCompressedTexImage3DOES",
+    "glGetTexParameterIuivEXT",
+    "glBindProgramPipelineEXT",
+    "glGenProgramPipelinesEXT",
+    "glTexStorage3DEXT",
+    "glObjectPtrLabel",
+    "glVertexAttrib2fv",
+    "SetRenderbufferID",
+    "glMultiDrawArraysIndirectEXT",
+    "glCopyTexture3DANGLE",
+    "UpdateVertexArrayID",
+    "glTexStorageMemFlags2DMultisampleANGLE",
+    "glActiveShaderProgramEXT",
+    "glDeleteShader",
+    "UpdateSamplerID",
+    "glBufferStorageMemEXT",
+    "glPointParameterf",
+    "glProgramUniform4ui",
+    "glGetTexGenfvOES",
+    "glProgramUniform3uiv",
+    "glTexSubImage2DRobustANGLE",
+    "glFramebufferParameteri",
+    "glDrawTexfOES",
+    "glReadnPixelsKHR",
+    "eglQueryStreamKHR",
+    "eglQuerySurface64KHR",
+    "glColor4f",
+    "glDisableVertexAttribArray",
+    "glGetIntegerv",
+    "glGetUniformuivRobustANGLE",
+    "glClearTexImageEXT",
+    "glGetProgramPipelineInfoLog",
+    "glBlendFuncSeparateiEXT",
+    "glClearStencil",
+    "eglGetSyncAttrib",
+    "glProgramUniform2iEXT",
+    "glVertexAttribIFormat",
+    "glSamplerParameterIuivEXT",
+    "glTranslatex",
+    "glFrontFace",
+    "eglDupNativeFenceFDANDROID",
+    "glGenTransformFeedbacks",
+    "glGetVertexAttribIuivRobustANGLE",
+    "glRequestExtensionANGLE",
+    "glProgramUniform1f",
+    "glGetUniformuiv",
+    "glProgramUniform2ivEXT",
+    "eglCreatePlatformWindowSurface",
+    "eglPostSubBufferNV",
+    "glMultMatrixx",
+    "glTexParameterIivRobustANGLE",
+    "glTexParameterIiv",
+    "glStencilFunc",
+    "glGetProgramPipelineInfoLogEXT",
+    "glFogxv",
+    "MapBufferRangeEXT",
+    "glUniform3f",
+    "glCopyTexSubImage3DOES",
+    "glPushDebugGroup",
+    "eglCreatePlatformPixmapSurface",
+    "glProgramUniform3i",
+    "glGetFramebufferPixelLocalStorageParameterfvANGLE",
+    "glDrawElementsBaseVertexEXT",
+    "glDeleteSync",
+    "glUniform4fv",
+    "glGenFramebuffers",
+    "glGetLightfv",
+    "glProgramUniformMatrix3x2fv",
+    "glStencilFuncSeparate",
+    "glMapBufferRangeEXT",
+    "eglQueryStringiANGLE",
+    "CreateContext",
+    "glVertexAttribFormat",
+    "glUniformMatrix2x3fv",
+    "glBlendEquationSeparatei",
+    "glIsProgram",
+    "glDrawTexfvOES",
+    "eglGetPlatformDisplayEXT",
+    "glProgramUniform4fvEXT",
+    "glGetTexImageANGLE",
+    "CreateNativeClientBufferANDROID",
+    "eglGetNativeClientBufferANDROID",
+    "glGetTexLevelParameterfv",
+    "glPointParameterxv",
+    "glGetFramebufferAttachmentParameteriv",
+    "glProgramParameteri",
+    "glDeleteQueriesEXT",
+    "glProgramUniform1fv",
+    "glCheckFramebufferStatus",
+    "eglForceGPUSwitchANGLE",
+    "glProgramUniformMatrix3x4fv",
+    "glProvokingVertexANGLE",
+    "glTexParameterIivEXT",
+    "glIsShader",
+    "glBindTexture",
+    "glTexSubImage3D",
+    "glSamplerParameterf",
+    "glTexSubImage3DRobustANGLE",
+    "eglCreatePbufferFromClientBuffer",
+    "glFrustumf",
+    "glReadPixels",
+    "glDrawTexsvOES",
+    "glGetnUniformuivRobustANGLE",
+    "glFramebufferRenderbufferOES",
+    "glClientWaitSync",
+    "eglCreateDeviceANGLE",
+    "glTexParameterfv"};
+
+constexpr uint32_t kNumInterpreterFunctions = 1000;
+
+constexpr uint32_t GetInterpreterFunctionHash(const char *name)
+{
+    return MinimalPerfectHash(name, kInterpreterFunctionSeeds, 334, kNumInterpreterFunctions);
+}
+
+// Checks that the C++ hash matches the one computed by gen_interpreter_utils.py.
+static_assert(GetInterpreterFunctionHash("eglAcquireExternalContextANGLE") == 335);
+static_assert(GetInterpreterFunctionHash("eglBindAPI") == 432);
+static_assert(GetInterpreterFunctionHash("eglBindTexImage") == 597);
+static_assert(GetInterpreterFunctionHash("eglChooseConfig") == 33);
+static_assert(GetInterpreterFunctionHash("eglClientWaitSync") == 186);
+static_assert(GetInterpreterFunctionHash("eglClientWaitSyncKHR") == 166);
+static_assert(GetInterpreterFunctionHash("eglCopyBuffers") == 51);
+static_assert(GetInterpreterFunctionHash("eglCopyMetalSharedEventANGLE") == 32);
+static_assert(GetInterpreterFunctionHash("eglCreateContext") == 198);
+static_assert(GetInterpreterFunctionHash("eglCreateDeviceANGLE") == 998);
+static_assert(GetInterpreterFunctionHash("eglCreateImage") == 601);
+static_assert(GetInterpreterFunctionHash("eglCreateImageKHR") == 624);
+static_assert(GetInterpreterFunctionHash("eglCreateNativeClientBufferANDROID") == 115);
+static_assert(GetInterpreterFunctionHash("eglCreatePbufferFromClientBuffer") == 991);
+static_assert(GetInterpreterFunctionHash("eglCreatePbufferSurface") == 142);
+static_assert(GetInterpreterFunctionHash("eglCreatePixmapSurface") == 257);
+static_assert(GetInterpreterFunctionHash("eglCreatePlatformPixmapSurface") == 952);
+static_assert(GetInterpreterFunctionHash("eglCreatePlatformPixmapSurfaceEXT") == 760);
+static_assert(GetInterpreterFunctionHash("eglCreatePlatformWindowSurface") == 940);
+static_assert(GetInterpreterFunctionHash("eglCreatePlatformWindowSurfaceEXT") == 471);
+static_assert(GetInterpreterFunctionHash("eglCreateStreamKHR") == 688);
+static_assert(GetInterpreterFunctionHash("eglCreateStreamProducerD3DTextureANGLE") == 740);
+static_assert(GetInterpreterFunctionHash("eglCreateSync") == 435);
+static_assert(GetInterpreterFunctionHash("eglCreateSyncKHR") == 318);
+static_assert(GetInterpreterFunctionHash("eglCreateWindowSurface") == 381);
+static_assert(GetInterpreterFunctionHash("eglDebugMessageControlKHR") == 520);
+static_assert(GetInterpreterFunctionHash("eglDestroyContext") == 282);
+static_assert(GetInterpreterFunctionHash("eglDestroyImage") == 613);
+static_assert(GetInterpreterFunctionHash("eglDestroyImageKHR") == 157);
+static_assert(GetInterpreterFunctionHash("eglDestroyStreamKHR") == 462);
+static_assert(GetInterpreterFunctionHash("eglDestroySurface") == 847);
+static_assert(GetInterpreterFunctionHash("eglDestroySync") == 532);
+static_assert(GetInterpreterFunctionHash("eglDestroySyncKHR") == 704);
+static_assert(GetInterpreterFunctionHash("eglDupNativeFenceFDANDROID") == 933);
+static_assert(GetInterpreterFunctionHash("eglExportVkImageANGLE") == 666);
+static_assert(GetInterpreterFunctionHash("eglForceGPUSwitchANGLE") == 982);
+static_assert(GetInterpreterFunctionHash("eglGetCompositorTimingANDROID") == 68);
+static_assert(GetInterpreterFunctionHash("eglGetCompositorTimingSupportedANDROID") == 516);
+static_assert(GetInterpreterFunctionHash("eglGetConfigAttrib") == 501);
+static_assert(GetInterpreterFunctionHash("eglGetConfigs") == 390);
+static_assert(GetInterpreterFunctionHash("eglGetCurrentContext") == 116);
+static_assert(GetInterpreterFunctionHash("eglGetCurrentDisplay") == 449);
+static_assert(GetInterpreterFunctionHash("eglGetCurrentSurface") == 685);
+static_assert(GetInterpreterFunctionHash("eglGetDisplay") == 178);
+static_assert(GetInterpreterFunctionHash("eglGetError") == 267);
+static_assert(GetInterpreterFunctionHash("eglGetFrameTimestampSupportedANDROID") == 518);
+static_assert(GetInterpreterFunctionHash("eglGetFrameTimestampsANDROID") == 884);
+static_assert(GetInterpreterFunctionHash("eglGetMscRateANGLE") == 188);
+static_assert(GetInterpreterFunctionHash("eglGetNativeClientBufferANDROID") == 974);
+static_assert(GetInterpreterFunctionHash("eglGetNextFrameIdANDROID") == 69);
+static_assert(GetInterpreterFunctionHash("eglGetPlatformDisplay") == 535);
+static_assert(GetInterpreterFunctionHash("eglGetPlatformDisplayEXT") == 970);
+static_assert(GetInterpreterFunctionHash("eglGetProcAddress") == 779);
+static_assert(GetInterpreterFunctionHash("eglGetSyncAttrib") == 927);
+static_assert(GetInterpreterFunctionHash("eglGetSyncAttribKHR") == 442);
+static_assert(GetInterpreterFunctionHash("eglGetSyncValuesCHROMIUM") == 251);
+static_assert(GetInterpreterFunctionHash("eglHandleGPUSwitchANGLE") == 184);
+static_assert(GetInterpreterFunctionHash("eglInitialize") == 436);
+static_assert(GetInterpreterFunctionHash("eglLabelObjectKHR") == 173);
+static_assert(GetInterpreterFunctionHash("eglLockSurfaceKHR") == 195);
+static_assert(GetInterpreterFunctionHash("eglMakeCurrent") == 306);
+static_assert(GetInterpreterFunctionHash("eglPostSubBufferNV") == 941);
+static_assert(GetInterpreterFunctionHash("eglPrepareSwapBuffersANGLE") == 430);
+static_assert(GetInterpreterFunctionHash("eglPresentationTimeANDROID") == 375);
+static_assert(GetInterpreterFunctionHash("eglProgramCacheGetAttribANGLE") == 342);
+static_assert(GetInterpreterFunctionHash("eglProgramCachePopulateANGLE") == 349);
+static_assert(GetInterpreterFunctionHash("eglProgramCacheQueryANGLE") == 455);
+static_assert(GetInterpreterFunctionHash("eglProgramCacheResizeANGLE") == 521);
+static_assert(GetInterpreterFunctionHash("eglQueryAPI") == 410);
+static_assert(GetInterpreterFunctionHash("eglQueryContext") == 770);
+static_assert(GetInterpreterFunctionHash("eglQueryDebugKHR") == 473);
+static_assert(GetInterpreterFunctionHash("eglQueryDeviceAttribEXT") == 774);
+static_assert(GetInterpreterFunctionHash("eglQueryDeviceStringEXT") == 773);
+static_assert(GetInterpreterFunctionHash("eglQueryDisplayAttribANGLE") == 719);
+static_assert(GetInterpreterFunctionHash("eglQueryDisplayAttribEXT") == 543);
+static_assert(GetInterpreterFunctionHash("eglQueryDmaBufFormatsEXT") == 204);
+static_assert(GetInterpreterFunctionHash("eglQueryDmaBufModifiersEXT") == 862);
+static_assert(GetInterpreterFunctionHash("eglQueryStreamKHR") == 917);
+static_assert(GetInterpreterFunctionHash("eglQueryStreamu64KHR") == 85);
+static_assert(GetInterpreterFunctionHash("eglQueryString") == 750);
+static_assert(GetInterpreterFunctionHash("eglQueryStringiANGLE") == 963);
+static_assert(GetInterpreterFunctionHash("eglQuerySurface") == 378);
+static_assert(GetInterpreterFunctionHash("eglQuerySurface64KHR") == 918);
+static_assert(GetInterpreterFunctionHash("eglQuerySurfacePointerANGLE") == 411);
+static_assert(GetInterpreterFunctionHash("eglReacquireHighPowerGPUANGLE") == 327);
+static_assert(GetInterpreterFunctionHash("eglReleaseDeviceANGLE") == 453);
+static_assert(GetInterpreterFunctionHash("eglReleaseExternalContextANGLE") == 368);
+static_assert(GetInterpreterFunctionHash("eglReleaseHighPowerGPUANGLE") == 860);
+static_assert(GetInterpreterFunctionHash("eglReleaseTexImage") == 361);
+static_assert(GetInterpreterFunctionHash("eglReleaseThread") == 362);
+static_assert(GetInterpreterFunctionHash("eglSetBlobCacheFuncsANDROID") == 834);
+static_assert(GetInterpreterFunctionHash("eglSetDamageRegionKHR") == 764);
+static_assert(GetInterpreterFunctionHash("eglSetValidationEnabledANGLE") == 322);
+static_assert(GetInterpreterFunctionHash("eglSignalSyncKHR") == 584);
+static_assert(GetInterpreterFunctionHash("eglStreamAttribKHR") == 34);
+static_assert(GetInterpreterFunctionHash("eglStreamConsumerAcquireKHR") == 316);
+static_assert(GetInterpreterFunctionHash("eglStreamConsumerGLTextureExternalAttribsNV") == 236);
+static_assert(GetInterpreterFunctionHash("eglStreamConsumerGLTextureExternalKHR") == 748);
+static_assert(GetInterpreterFunctionHash("eglStreamConsumerReleaseKHR") == 776);
+static_assert(GetInterpreterFunctionHash("eglStreamPostD3DTextureANGLE") == 244);
+static_assert(GetInterpreterFunctionHash("eglSurfaceAttrib") == 881);
+static_assert(GetInterpreterFunctionHash("eglSwapBuffers") == 380);
+static_assert(GetInterpreterFunctionHash("eglSwapBuffersWithDamageKHR") == 220);
+static_assert(GetInterpreterFunctionHash("eglSwapBuffersWithFrameTokenANGLE") == 103);
+static_assert(GetInterpreterFunctionHash("eglSwapInterval") == 140);
+static_assert(GetInterpreterFunctionHash("eglTerminate") == 357);
+static_assert(GetInterpreterFunctionHash("eglUnlockSurfaceKHR") == 363);
+static_assert(GetInterpreterFunctionHash("eglWaitClient") == 731);
+static_assert(GetInterpreterFunctionHash("eglWaitGL") == 655);
+static_assert(GetInterpreterFunctionHash("eglWaitNative") == 612);
+static_assert(GetInterpreterFunctionHash("eglWaitSync") == 887);
+static_assert(GetInterpreterFunctionHash("eglWaitSyncKHR") == 477);
+static_assert(GetInterpreterFunctionHash("eglWaitUntilWorkScheduledANGLE") == 697);
+static_assert(GetInterpreterFunctionHash("glAcquireTexturesANGLE") == 276);
+static_assert(GetInterpreterFunctionHash("glActiveShaderProgram") == 407);
+static_assert(GetInterpreterFunctionHash("glActiveShaderProgramEXT") == 905);
+static_assert(GetInterpreterFunctionHash("glActiveTexture") == 4);
+static_assert(GetInterpreterFunctionHash("glAlphaFunc") == 698);
+static_assert(GetInterpreterFunctionHash("glAlphaFuncx") == 547);
+static_assert(GetInterpreterFunctionHash("glAttachShader") == 197);
+static_assert(GetInterpreterFunctionHash("glBeginPerfMonitorAMD") == 680);
+static_assert(GetInterpreterFunctionHash("glBeginPixelLocalStorageANGLE") == 18);
+static_assert(GetInterpreterFunctionHash("glBeginQuery") == 517);
+static_assert(GetInterpreterFunctionHash("glBeginQueryEXT") == 81);
+static_assert(GetInterpreterFunctionHash("glBeginTransformFeedback") == 238);
+static_assert(GetInterpreterFunctionHash("glBindAttribLocation") == 588);
+static_assert(GetInterpreterFunctionHash("glBindBuffer") == 124);
+static_assert(GetInterpreterFunctionHash("glBindBufferBase") == 816);
+static_assert(GetInterpreterFunctionHash("glBindBufferRange") == 863);
+static_assert(GetInterpreterFunctionHash("glBindFragDataLocationEXT") == 606);
+static_assert(GetInterpreterFunctionHash("glBindFragDataLocationIndexedEXT") == 659);
+static_assert(GetInterpreterFunctionHash("glBindFramebuffer") == 533);
+static_assert(GetInterpreterFunctionHash("glBindFramebufferOES") == 813);
+static_assert(GetInterpreterFunctionHash("glBindImageTexture") == 512);
+static_assert(GetInterpreterFunctionHash("glBindProgramPipeline") == 272);
+static_assert(GetInterpreterFunctionHash("glBindProgramPipelineEXT") == 895);
+static_assert(GetInterpreterFunctionHash("glBindRenderbuffer") == 466);
+static_assert(GetInterpreterFunctionHash("glBindRenderbufferOES") == 260);
+static_assert(GetInterpreterFunctionHash("glBindSampler") == 598);
+static_assert(GetInterpreterFunctionHash("glBindTexture") == 987);
+static_assert(GetInterpreterFunctionHash("glBindTransformFeedback") == 190);
+static_assert(GetInterpreterFunctionHash("glBindUniformLocationCHROMIUM") == 217);
+static_assert(GetInterpreterFunctionHash("glBindVertexArray") == 530);
+static_assert(GetInterpreterFunctionHash("glBindVertexArrayOES") == 506);
+static_assert(GetInterpreterFunctionHash("glBindVertexBuffer") == 206);
+static_assert(GetInterpreterFunctionHash("glBlendBarrier") == 691);
+static_assert(GetInterpreterFunctionHash("glBlendBarrierKHR") == 823);
+static_assert(GetInterpreterFunctionHash("glBlendColor") == 420);
+static_assert(GetInterpreterFunctionHash("glBlendEquation") == 293);
+static_assert(GetInterpreterFunctionHash("glBlendEquationSeparate") == 742);
+static_assert(GetInterpreterFunctionHash("glBlendEquationSeparatei") == 967);
+static_assert(GetInterpreterFunctionHash("glBlendEquationSeparateiEXT") == 55);
+static_assert(GetInterpreterFunctionHash("glBlendEquationSeparateiOES") == 229);
+static_assert(GetInterpreterFunctionHash("glBlendEquationi") == 448);
+static_assert(GetInterpreterFunctionHash("glBlendEquationiEXT") == 882);
+static_assert(GetInterpreterFunctionHash("glBlendEquationiOES") == 470);
+static_assert(GetInterpreterFunctionHash("glBlendFunc") == 814);
+static_assert(GetInterpreterFunctionHash("glBlendFuncSeparate") == 175);
+static_assert(GetInterpreterFunctionHash("glBlendFuncSeparatei") == 604);
+static_assert(GetInterpreterFunctionHash("glBlendFuncSeparateiEXT") == 925);
+static_assert(GetInterpreterFunctionHash("glBlendFuncSeparateiOES") == 757);
+static_assert(GetInterpreterFunctionHash("glBlendFunci") == 246);
+static_assert(GetInterpreterFunctionHash("glBlendFunciEXT") == 97);
+static_assert(GetInterpreterFunctionHash("glBlendFunciOES") == 119);
+static_assert(GetInterpreterFunctionHash("glBlitFramebuffer") == 80);
+static_assert(GetInterpreterFunctionHash("glBlitFramebufferANGLE") == 886);
+static_assert(GetInterpreterFunctionHash("glBlitFramebufferNV") == 138);
+static_assert(GetInterpreterFunctionHash("glBufferData") == 479);
+static_assert(GetInterpreterFunctionHash("glBufferStorageEXT") == 328);
+static_assert(GetInterpreterFunctionHash("glBufferStorageExternalEXT") == 394);
+static_assert(GetInterpreterFunctionHash("glBufferStorageMemEXT") == 908);
+static_assert(GetInterpreterFunctionHash("glBufferSubData") == 125);
+static_assert(GetInterpreterFunctionHash("glCheckFramebufferStatus") == 981);
+static_assert(GetInterpreterFunctionHash("glCheckFramebufferStatusOES") == 523);
+static_assert(GetInterpreterFunctionHash("glClear") == 350);
+static_assert(GetInterpreterFunctionHash("glClearBufferfi") == 662);
+static_assert(GetInterpreterFunctionHash("glClearBufferfv") == 713);
+static_assert(GetInterpreterFunctionHash("glClearBufferiv") == 567);
+static_assert(GetInterpreterFunctionHash("glClearBufferuiv") == 555);
+static_assert(GetInterpreterFunctionHash("glClearColor") == 524);
+static_assert(GetInterpreterFunctionHash("glClearColorx") == 875);
+static_assert(GetInterpreterFunctionHash("glClearDepthf") == 263);
+static_assert(GetInterpreterFunctionHash("glClearDepthx") == 784);
+static_assert(GetInterpreterFunctionHash("glClearStencil") == 926);
+static_assert(GetInterpreterFunctionHash("glClearTexImageEXT") == 923);
+static_assert(GetInterpreterFunctionHash("glClearTexSubImageEXT") == 98);
+static_assert(GetInterpreterFunctionHash("glClientActiveTexture") == 347);
+static_assert(GetInterpreterFunctionHash("glClientWaitSync") == 997);
+static_assert(GetInterpreterFunctionHash("glClipControlEXT") == 366);
+static_assert(GetInterpreterFunctionHash("glClipPlanef") == 873);
+static_assert(GetInterpreterFunctionHash("glClipPlanex") == 382);
+static_assert(GetInterpreterFunctionHash("glColor4f") == 919);
+static_assert(GetInterpreterFunctionHash("glColor4ub") == 345);
+static_assert(GetInterpreterFunctionHash("glColor4x") == 483);
+static_assert(GetInterpreterFunctionHash("glColorMask") == 832);
+static_assert(GetInterpreterFunctionHash("glColorMaski") == 595);
+static_assert(GetInterpreterFunctionHash("glColorMaskiEXT") == 156);
+static_assert(GetInterpreterFunctionHash("glColorMaskiOES") == 5);
+static_assert(GetInterpreterFunctionHash("glColorPointer") == 437);
+static_assert(GetInterpreterFunctionHash("glCompileShader") == 338);
+static_assert(GetInterpreterFunctionHash("glCompressedCopyTextureCHROMIUM") == 851);
+static_assert(GetInterpreterFunctionHash("glCompressedTexImage2D") == 859);
+static_assert(GetInterpreterFunctionHash("glCompressedTexImage2DRobustANGLE") == 383);
+static_assert(GetInterpreterFunctionHash("glCompressedTexImage3D") == 93);
+static_assert(GetInterpreterFunctionHash("glCompressedTexImage3DOES") == 893);
+static_assert(GetInterpreterFunctionHash("glCompressedTexImage3DRobustANGLE") == 205);
+static_assert(GetInterpreterFunctionHash("glCompressedTexSubImage2D") == 158);
+static_assert(GetInterpreterFunctionHash("glCompressedTexSubImage2DRobustANGLE") == 221);
+static_assert(GetInterpreterFunctionHash("glCompressedTexSubImage3D") == 803);
+static_assert(GetInterpreterFunctionHash("glCompressedTexSubImage3DOES") == 351);
+static_assert(GetInterpreterFunctionHash("glCompressedTexSubImage3DRobustANGLE") == 702);
+static_assert(GetInterpreterFunctionHash("glCopyBufferSubData") == 545);
+static_assert(GetInterpreterFunctionHash("glCopyImageSubData") == 600);
+static_assert(GetInterpreterFunctionHash("glCopyImageSubDataEXT") == 848);
+static_assert(GetInterpreterFunctionHash("glCopyImageSubDataOES") == 636);
+static_assert(GetInterpreterFunctionHash("glCopySubTexture3DANGLE") == 845);
+static_assert(GetInterpreterFunctionHash("glCopySubTextureCHROMIUM") == 360);
+static_assert(GetInterpreterFunctionHash("glCopyTexImage2D") == 658);
+static_assert(GetInterpreterFunctionHash("glCopyTexSubImage2D") == 805);
+static_assert(GetInterpreterFunctionHash("glCopyTexSubImage3D") == 245);
+static_assert(GetInterpreterFunctionHash("glCopyTexSubImage3DOES") == 950);
+static_assert(GetInterpreterFunctionHash("glCopyTexture3DANGLE") == 902);
+static_assert(GetInterpreterFunctionHash("glCopyTextureCHROMIUM") == 671);
+static_assert(GetInterpreterFunctionHash("glCoverageModulationCHROMIUM") == 605);
+static_assert(GetInterpreterFunctionHash("glCreateMemoryObjectsEXT") == 562);
+static_assert(GetInterpreterFunctionHash("glCreateProgram") == 283);
+static_assert(GetInterpreterFunctionHash("glCreateShader") == 132);
+static_assert(GetInterpreterFunctionHash("glCreateShaderProgramv") == 148);
+static_assert(GetInterpreterFunctionHash("glCreateShaderProgramvEXT") == 728);
+static_assert(GetInterpreterFunctionHash("glCullFace") == 573);
+static_assert(GetInterpreterFunctionHash("glCurrentPaletteMatrixOES") == 37);
+static_assert(GetInterpreterFunctionHash("glDebugMessageCallback") == 497);
+static_assert(GetInterpreterFunctionHash("glDebugMessageCallbackKHR") == 413);
+static_assert(GetInterpreterFunctionHash("glDebugMessageControl") == 579);
+static_assert(GetInterpreterFunctionHash("glDebugMessageControlKHR") == 749);
+static_assert(GetInterpreterFunctionHash("glDebugMessageInsert") == 454);
+static_assert(GetInterpreterFunctionHash("glDebugMessageInsertKHR") == 365);
+static_assert(GetInterpreterFunctionHash("glDeleteBuffers") == 49);
+static_assert(GetInterpreterFunctionHash("glDeleteFencesNV") == 735);
+static_assert(GetInterpreterFunctionHash("glDeleteFramebuffers") == 101);
+static_assert(GetInterpreterFunctionHash("glDeleteFramebuffersOES") == 822);
+static_assert(GetInterpreterFunctionHash("glDeleteMemoryObjectsEXT") == 250);
+static_assert(GetInterpreterFunctionHash("glDeletePerfMonitorsAMD") == 38);
+static_assert(GetInterpreterFunctionHash("glDeleteProgram") == 369);
+static_assert(GetInterpreterFunctionHash("glDeleteProgramPipelines") == 128);
+static_assert(GetInterpreterFunctionHash("glDeleteProgramPipelinesEXT") == 209);
+static_assert(GetInterpreterFunctionHash("glDeleteQueries") == 738);
+static_assert(GetInterpreterFunctionHash("glDeleteQueriesEXT") == 979);
+static_assert(GetInterpreterFunctionHash("glDeleteRenderbuffers") == 821);
+static_assert(GetInterpreterFunctionHash("glDeleteRenderbuffersOES") == 808);
+static_assert(GetInterpreterFunctionHash("glDeleteSamplers") == 270);
+static_assert(GetInterpreterFunctionHash("glDeleteSemaphoresEXT") == 556);
+static_assert(GetInterpreterFunctionHash("glDeleteShader") == 906);
+static_assert(GetInterpreterFunctionHash("glDeleteSync") == 956);
+static_assert(GetInterpreterFunctionHash("glDeleteTextures") == 374);
+static_assert(GetInterpreterFunctionHash("glDeleteTransformFeedbacks") == 253);
+static_assert(GetInterpreterFunctionHash("glDeleteVertexArrays") == 57);
+static_assert(GetInterpreterFunctionHash("glDeleteVertexArraysOES") == 31);
+static_assert(GetInterpreterFunctionHash("glDepthFunc") == 9);
+static_assert(GetInterpreterFunctionHash("glDepthMask") == 654);
+static_assert(GetInterpreterFunctionHash("glDepthRangef") == 164);
+static_assert(GetInterpreterFunctionHash("glDepthRangex") == 802);
+static_assert(GetInterpreterFunctionHash("glDetachShader") == 11);
+static_assert(GetInterpreterFunctionHash("glDisable") == 241);
+static_assert(GetInterpreterFunctionHash("glDisableClientState") == 415);
+static_assert(GetInterpreterFunctionHash("glDisableExtensionANGLE") == 176);
+static_assert(GetInterpreterFunctionHash("glDisableVertexAttribArray") == 920);
+static_assert(GetInterpreterFunctionHash("glDisablei") == 256);
+static_assert(GetInterpreterFunctionHash("glDisableiEXT") == 143);
+static_assert(GetInterpreterFunctionHash("glDisableiOES") == 670);
+static_assert(GetInterpreterFunctionHash("glDiscardFramebufferEXT") == 488);
+static_assert(GetInterpreterFunctionHash("glDispatchCompute") == 465);
+static_assert(GetInterpreterFunctionHash("glDispatchComputeIndirect") == 652);
+static_assert(GetInterpreterFunctionHash("glDrawArrays") == 569);
+static_assert(GetInterpreterFunctionHash("glDrawArraysIndirect") == 621);
+static_assert(GetInterpreterFunctionHash("glDrawArraysInstanced") == 100);
+static_assert(GetInterpreterFunctionHash("glDrawArraysInstancedANGLE") == 308);
+static_assert(GetInterpreterFunctionHash("glDrawArraysInstancedBaseInstanceANGLE") == 870);
+static_assert(GetInterpreterFunctionHash("glDrawArraysInstancedBaseInstanceEXT") == 23);
+static_assert(GetInterpreterFunctionHash("glDrawArraysInstancedEXT") == 690);
+static_assert(GetInterpreterFunctionHash("glDrawBuffers") == 331);
+static_assert(GetInterpreterFunctionHash("glDrawBuffersEXT") == 650);
+static_assert(GetInterpreterFunctionHash("glDrawElements") == 566);
+static_assert(GetInterpreterFunctionHash("glDrawElementsBaseVertex") == 46);
+static_assert(GetInterpreterFunctionHash("glDrawElementsBaseVertexEXT") == 955);
+static_assert(GetInterpreterFunctionHash("glDrawElementsBaseVertexOES") == 541);
+static_assert(GetInterpreterFunctionHash("glDrawElementsIndirect") == 475);
+static_assert(GetInterpreterFunctionHash("glDrawElementsInstanced") == 766);
+static_assert(GetInterpreterFunctionHash("glDrawElementsInstancedANGLE") == 67);
+static_assert(GetInterpreterFunctionHash("glDrawElementsInstancedBaseInstanceEXT") == 370);
+static_assert(GetInterpreterFunctionHash("glDrawElementsInstancedBaseVertex") == 94);
+static_assert(GetInterpreterFunctionHash("glDrawElementsInstancedBaseVertexBaseInstanceANGLE") ==
+              593);
+static_assert(GetInterpreterFunctionHash("glDrawElementsInstancedBaseVertexBaseInstanceEXT") ==
+              434);
+static_assert(GetInterpreterFunctionHash("glDrawElementsInstancedBaseVertexEXT") == 575);
+static_assert(GetInterpreterFunctionHash("glDrawElementsInstancedBaseVertexOES") == 310);
+static_assert(GetInterpreterFunctionHash("glDrawElementsInstancedEXT") == 850);
+static_assert(GetInterpreterFunctionHash("glDrawRangeElements") == 878);
+static_assert(GetInterpreterFunctionHash("glDrawRangeElementsBaseVertex") == 700);
+static_assert(GetInterpreterFunctionHash("glDrawRangeElementsBaseVertexEXT") == 262);
+static_assert(GetInterpreterFunctionHash("glDrawRangeElementsBaseVertexOES") == 829);
+static_assert(GetInterpreterFunctionHash("glDrawTexfOES") == 915);
+static_assert(GetInterpreterFunctionHash("glDrawTexfvOES") == 969);
+static_assert(GetInterpreterFunctionHash("glDrawTexiOES") == 864);
+static_assert(GetInterpreterFunctionHash("glDrawTexivOES") == 77);
+static_assert(GetInterpreterFunctionHash("glDrawTexsOES") == 673);
+static_assert(GetInterpreterFunctionHash("glDrawTexsvOES") == 994);
+static_assert(GetInterpreterFunctionHash("glDrawTexxOES") == 456);
+static_assert(GetInterpreterFunctionHash("glDrawTexxvOES") == 838);
+static_assert(GetInterpreterFunctionHash("glEGLImageTargetRenderbufferStorageOES") == 341);
+static_assert(GetInterpreterFunctionHash("glEGLImageTargetTexStorageEXT") == 493);
+static_assert(GetInterpreterFunctionHash("glEGLImageTargetTexture2DOES") == 409);
+static_assert(GetInterpreterFunctionHash("glEGLImageTargetTextureStorageEXT") == 789);
+static_assert(GetInterpreterFunctionHash("glEnable") == 63);
+static_assert(GetInterpreterFunctionHash("glEnableClientState") == 153);
+static_assert(GetInterpreterFunctionHash("glEnableVertexAttribArray") == 150);
+static_assert(GetInterpreterFunctionHash("glEnablei") == 753);
+static_assert(GetInterpreterFunctionHash("glEnableiEXT") == 99);
+static_assert(GetInterpreterFunctionHash("glEnableiOES") == 499);
+static_assert(GetInterpreterFunctionHash("glEndPerfMonitorAMD") == 134);
+static_assert(GetInterpreterFunctionHash("glEndPixelLocalStorageANGLE") == 73);
+static_assert(GetInterpreterFunctionHash("glEndQuery") == 837);
+static_assert(GetInterpreterFunctionHash("glEndQueryEXT") == 340);
+static_assert(GetInterpreterFunctionHash("glEndTilingQCOM") == 441);
+static_assert(GetInterpreterFunctionHash("glEndTransformFeedback") == 211);
+static_assert(GetInterpreterFunctionHash("glFenceSync") == 651);
+static_assert(GetInterpreterFunctionHash("glFinish") == 196);
+static_assert(GetInterpreterFunctionHash("glFinishFenceNV") == 42);
+static_assert(GetInterpreterFunctionHash("glFlush") == 762);
+static_assert(GetInterpreterFunctionHash("glFlushMappedBufferRange") == 720);
+static_assert(GetInterpreterFunctionHash("glFlushMappedBufferRangeEXT") == 329);
+static_assert(GetInterpreterFunctionHash("glFogf") == 576);
+static_assert(GetInterpreterFunctionHash("glFogfv") == 574);
+static_assert(GetInterpreterFunctionHash("glFogx") == 752);
+static_assert(GetInterpreterFunctionHash("glFogxv") == 947);
+static_assert(GetInterpreterFunctionHash("glFramebufferFetchBarrierEXT") == 451);
+static_assert(GetInterpreterFunctionHash("glFramebufferFoveationConfigQCOM") == 581);
+static_assert(GetInterpreterFunctionHash("glFramebufferFoveationParametersQCOM") == 289);
+static_assert(GetInterpreterFunctionHash("glFramebufferMemorylessPixelLocalStorageANGLE") == 737);
+static_assert(GetInterpreterFunctionHash("glFramebufferParameteri") == 914);
+static_assert(GetInterpreterFunctionHash("glFramebufferParameteriMESA") == 169);
+static_assert(GetInterpreterFunctionHash("glFramebufferPixelLocalClearValuefvANGLE") == 715);
+static_assert(GetInterpreterFunctionHash("glFramebufferPixelLocalClearValueivANGLE") == 240);
+static_assert(GetInterpreterFunctionHash("glFramebufferPixelLocalClearValueuivANGLE") == 107);
+static_assert(GetInterpreterFunctionHash("glFramebufferPixelLocalStorageInterruptANGLE") == 400);
+static_assert(GetInterpreterFunctionHash("glFramebufferPixelLocalStorageRestoreANGLE") == 645);
+static_assert(GetInterpreterFunctionHash("glFramebufferRenderbuffer") == 580);
+static_assert(GetInterpreterFunctionHash("glFramebufferRenderbufferOES") == 996);
+static_assert(GetInterpreterFunctionHash("glFramebufferTexture") == 408);
+static_assert(GetInterpreterFunctionHash("glFramebufferTexture2D") == 74);
+static_assert(GetInterpreterFunctionHash("glFramebufferTexture2DMultisampleEXT") == 801);
+static_assert(GetInterpreterFunctionHash("glFramebufferTexture2DOES") == 825);
+static_assert(GetInterpreterFunctionHash("glFramebufferTexture3DOES") == 634);
+static_assert(GetInterpreterFunctionHash("glFramebufferTextureEXT") == 172);
+static_assert(GetInterpreterFunctionHash("glFramebufferTextureLayer") == 450);
+static_assert(GetInterpreterFunctionHash("glFramebufferTextureMultiviewOVR") == 320);
+static_assert(GetInterpreterFunctionHash("glFramebufferTextureOES") == 300);
+static_assert(GetInterpreterFunctionHash("glFramebufferTexturePixelLocalStorageANGLE") == 780);
+static_assert(GetInterpreterFunctionHash("glFrontFace") == 932);
+static_assert(GetInterpreterFunctionHash("glFrustumf") == 992);
+static_assert(GetInterpreterFunctionHash("glFrustumx") == 102);
+static_assert(GetInterpreterFunctionHash("glGenBuffers") == 227);
+static_assert(GetInterpreterFunctionHash("glGenFencesNV") == 387);
+static_assert(GetInterpreterFunctionHash("glGenFramebuffers") == 958);
+static_assert(GetInterpreterFunctionHash("glGenFramebuffersOES") == 291);
+static_assert(GetInterpreterFunctionHash("glGenPerfMonitorsAMD") == 233);
+static_assert(GetInterpreterFunctionHash("glGenProgramPipelines") == 323);
+static_assert(GetInterpreterFunctionHash("glGenProgramPipelinesEXT") == 896);
+static_assert(GetInterpreterFunctionHash("glGenQueries") == 189);
+static_assert(GetInterpreterFunctionHash("glGenQueriesEXT") == 526);
+static_assert(GetInterpreterFunctionHash("glGenRenderbuffers") == 877);
+static_assert(GetInterpreterFunctionHash("glGenRenderbuffersOES") == 675);
+static_assert(GetInterpreterFunctionHash("glGenSamplers") == 833);
+static_assert(GetInterpreterFunctionHash("glGenSemaphoresEXT") == 445);
+static_assert(GetInterpreterFunctionHash("glGenTextures") == 354);
+static_assert(GetInterpreterFunctionHash("glGenTransformFeedbacks") == 934);
+static_assert(GetInterpreterFunctionHash("glGenVertexArrays") == 768);
+static_assert(GetInterpreterFunctionHash("glGenVertexArraysOES") == 687);
+static_assert(GetInterpreterFunctionHash("glGenerateMipmap") == 786);
+static_assert(GetInterpreterFunctionHash("glGenerateMipmapOES") == 385);
+static_assert(GetInterpreterFunctionHash("glGetActiveAttrib") == 609);
+static_assert(GetInterpreterFunctionHash("glGetActiveUniform") == 591);
+static_assert(GetInterpreterFunctionHash("glGetActiveUniformBlockName") == 599);
+static_assert(GetInterpreterFunctionHash("glGetActiveUniformBlockiv") == 1);
+static_assert(GetInterpreterFunctionHash("glGetActiveUniformBlockivRobustANGLE") == 373);
+static_assert(GetInterpreterFunctionHash("glGetActiveUniformsiv") == 139);
+static_assert(GetInterpreterFunctionHash("glGetAttachedShaders") == 248);
+static_assert(GetInterpreterFunctionHash("glGetAttribLocation") == 75);
+static_assert(GetInterpreterFunctionHash("glGetBooleani_v") == 161);
+static_assert(GetInterpreterFunctionHash("glGetBooleani_vRobustANGLE") == 709);
+static_assert(GetInterpreterFunctionHash("glGetBooleanv") == 317);
+static_assert(GetInterpreterFunctionHash("glGetBooleanvRobustANGLE") == 831);
+static_assert(GetInterpreterFunctionHash("glGetBufferParameteri64v") == 372);
+static_assert(GetInterpreterFunctionHash("glGetBufferParameteri64vRobustANGLE") == 551);
+static_assert(GetInterpreterFunctionHash("glGetBufferParameteriv") == 714);
+static_assert(GetInterpreterFunctionHash("glGetBufferParameterivRobustANGLE") == 137);
+static_assert(GetInterpreterFunctionHash("glGetBufferPointerv") == 583);
+static_assert(GetInterpreterFunctionHash("glGetBufferPointervOES") == 325);
+static_assert(GetInterpreterFunctionHash("glGetBufferPointervRobustANGLE") == 717);
+static_assert(GetInterpreterFunctionHash("glGetClipPlanef") == 26);
+static_assert(GetInterpreterFunctionHash("glGetClipPlanex") == 286);
+static_assert(GetInterpreterFunctionHash("glGetCompressedTexImageANGLE") == 303);
+static_assert(GetInterpreterFunctionHash("glGetDebugMessageLog") == 87);
+static_assert(GetInterpreterFunctionHash("glGetDebugMessageLogKHR") == 665);
+static_assert(GetInterpreterFunctionHash("glGetError") == 472);
+static_assert(GetInterpreterFunctionHash("glGetFenceivNV") == 661);
+static_assert(GetInterpreterFunctionHash("glGetFixedv") == 274);
+static_assert(GetInterpreterFunctionHash("glGetFloatv") == 364);
+static_assert(GetInterpreterFunctionHash("glGetFloatvRobustANGLE") == 682);
+static_assert(GetInterpreterFunctionHash("glGetFragDataIndexEXT") == 21);
+static_assert(GetInterpreterFunctionHash("glGetFragDataLocation") == 194);
+static_assert(GetInterpreterFunctionHash("glGetFramebufferAttachmentParameteriv") == 977);
+static_assert(GetInterpreterFunctionHash("glGetFramebufferAttachmentParameterivOES") == 92);
+static_assert(GetInterpreterFunctionHash("glGetFramebufferAttachmentParameterivRobustANGLE") ==
+              110);
+static_assert(GetInterpreterFunctionHash("glGetFramebufferParameteriv") == 163);
+static_assert(GetInterpreterFunctionHash("glGetFramebufferParameterivMESA") == 288);
+static_assert(GetInterpreterFunctionHash("glGetFramebufferParameterivRobustANGLE") == 367);
+static_assert(GetInterpreterFunctionHash("glGetFramebufferPixelLocalStorageParameterfvANGLE") ==
+              954);
+static_assert(
+    GetInterpreterFunctionHash("glGetFramebufferPixelLocalStorageParameterfvRobustANGLE") == 482);
+static_assert(GetInterpreterFunctionHash("glGetFramebufferPixelLocalStorageParameterivANGLE") ==
+              513);
+static_assert(
+    GetInterpreterFunctionHash("glGetFramebufferPixelLocalStorageParameterivRobustANGLE") == 83);
+static_assert(GetInterpreterFunctionHash("glGetGraphicsResetStatus") == 696);
+static_assert(GetInterpreterFunctionHash("glGetGraphicsResetStatusEXT") == 586);
+static_assert(GetInterpreterFunctionHash("glGetGraphicsResetStatusKHR") == 277);
+static_assert(GetInterpreterFunctionHash("glGetInteger64i_v") == 858);
+static_assert(GetInterpreterFunctionHash("glGetInteger64i_vRobustANGLE") == 718);
+static_assert(GetInterpreterFunctionHash("glGetInteger64v") == 787);
+static_assert(GetInterpreterFunctionHash("glGetInteger64vEXT") == 602);
+static_assert(GetInterpreterFunctionHash("glGetInteger64vRobustANGLE") == 39);
+static_assert(GetInterpreterFunctionHash("glGetIntegeri_v") == 96);
+static_assert(GetInterpreterFunctionHash("glGetIntegeri_vRobustANGLE") == 258);
+static_assert(GetInterpreterFunctionHash("glGetIntegerv") == 921);
+static_assert(GetInterpreterFunctionHash("glGetIntegervRobustANGLE") == 528);
+static_assert(GetInterpreterFunctionHash("glGetInternalformativ") == 20);
+static_assert(GetInterpreterFunctionHash("glGetInternalformativRobustANGLE") == 795);
+static_assert(GetInterpreterFunctionHash("glGetLightfv") == 959);
+static_assert(GetInterpreterFunctionHash("glGetLightxv") == 423);
+static_assert(GetInterpreterFunctionHash("glGetMaterialfv") == 44);
+static_assert(GetInterpreterFunctionHash("glGetMaterialxv") == 64);
+static_assert(GetInterpreterFunctionHash("glGetMemoryObjectParameterivEXT") == 692);
+static_assert(GetInterpreterFunctionHash("glGetMultisamplefv") == 495);
+static_assert(GetInterpreterFunctionHash("glGetMultisamplefvANGLE") == 313);
+static_assert(GetInterpreterFunctionHash("glGetMultisamplefvRobustANGLE") == 218);
+static_assert(GetInterpreterFunctionHash("glGetObjectLabel") == 3);
+static_assert(GetInterpreterFunctionHash("glGetObjectLabelEXT") == 730);
+static_assert(GetInterpreterFunctionHash("glGetObjectLabelKHR") == 793);
+static_assert(GetInterpreterFunctionHash("glGetObjectPtrLabel") == 133);
+static_assert(GetInterpreterFunctionHash("glGetObjectPtrLabelKHR") == 514);
+static_assert(GetInterpreterFunctionHash("glGetPerfMonitorCounterDataAMD") == 281);
+static_assert(GetInterpreterFunctionHash("glGetPerfMonitorCounterInfoAMD") == 59);
+static_assert(GetInterpreterFunctionHash("glGetPerfMonitorCounterStringAMD") == 444);
+static_assert(GetInterpreterFunctionHash("glGetPerfMonitorCountersAMD") == 117);
+static_assert(GetInterpreterFunctionHash("glGetPerfMonitorGroupStringAMD") == 756);
+static_assert(GetInterpreterFunctionHash("glGetPerfMonitorGroupsAMD") == 494);
+static_assert(GetInterpreterFunctionHash("glGetPointerv") == 649);
+static_assert(GetInterpreterFunctionHash("glGetPointervKHR") == 667);
+static_assert(GetInterpreterFunctionHash("glGetPointervRobustANGLERobustANGLE") == 131);
+static_assert(GetInterpreterFunctionHash("glGetProgramBinary") == 65);
+static_assert(GetInterpreterFunctionHash("glGetProgramBinaryOES") == 729);
+static_assert(GetInterpreterFunctionHash("glGetProgramInfoLog") == 296);
+static_assert(GetInterpreterFunctionHash("glGetProgramInterfaceiv") == 187);
+static_assert(GetInterpreterFunctionHash("glGetProgramInterfaceivRobustANGLE") == 544);
+static_assert(GetInterpreterFunctionHash("glGetProgramPipelineInfoLog") == 924);
+static_assert(GetInterpreterFunctionHash("glGetProgramPipelineInfoLogEXT") == 946);
+static_assert(GetInterpreterFunctionHash("glGetProgramPipelineiv") == 60);
+static_assert(GetInterpreterFunctionHash("glGetProgramPipelineivEXT") == 45);
+static_assert(GetInterpreterFunctionHash("glGetProgramResourceIndex") == 214);
+static_assert(GetInterpreterFunctionHash("glGetProgramResourceLocation") == 201);
+static_assert(GetInterpreterFunctionHash("glGetProgramResourceLocationIndexEXT") == 785);
+static_assert(GetInterpreterFunctionHash("glGetProgramResourceName") == 594);
+static_assert(GetInterpreterFunctionHash("glGetProgramResourceiv") == 679);
+static_assert(GetInterpreterFunctionHash("glGetProgramiv") == 468);
+static_assert(GetInterpreterFunctionHash("glGetProgramivRobustANGLE") == 818);
+static_assert(GetInterpreterFunctionHash("glGetQueryObjecti64vEXT") == 168);
+static_assert(GetInterpreterFunctionHash("glGetQueryObjecti64vRobustANGLE") == 170);
+static_assert(GetInterpreterFunctionHash("glGetQueryObjectivEXT") == 255);
+static_assert(GetInterpreterFunctionHash("glGetQueryObjectivRobustANGLE") == 843);
+static_assert(GetInterpreterFunctionHash("glGetQueryObjectui64vEXT") == 6);
+static_assert(GetInterpreterFunctionHash("glGetQueryObjectui64vRobustANGLE") == 694);
+static_assert(GetInterpreterFunctionHash("glGetQueryObjectuiv") == 778);
+static_assert(GetInterpreterFunctionHash("glGetQueryObjectuivEXT") == 657);
+static_assert(GetInterpreterFunctionHash("glGetQueryObjectuivRobustANGLE") == 708);
+static_assert(GetInterpreterFunctionHash("glGetQueryiv") == 111);
+static_assert(GetInterpreterFunctionHash("glGetQueryivEXT") == 817);
+static_assert(GetInterpreterFunctionHash("glGetQueryivRobustANGLE") == 191);
+static_assert(GetInterpreterFunctionHash("glGetRenderbufferImageANGLE") == 519);
+static_assert(GetInterpreterFunctionHash("glGetRenderbufferParameteriv") == 712);
+static_assert(GetInterpreterFunctionHash("glGetRenderbufferParameterivOES") == 552);
+static_assert(GetInterpreterFunctionHash("glGetRenderbufferParameterivRobustANGLE") == 891);
+static_assert(GetInterpreterFunctionHash("glGetSamplerParameterIiv") == 35);
+static_assert(GetInterpreterFunctionHash("glGetSamplerParameterIivEXT") == 210);
+static_assert(GetInterpreterFunctionHash("glGetSamplerParameterIivOES") == 183);
+static_assert(GetInterpreterFunctionHash("glGetSamplerParameterIivRobustANGLE") == 806);
+static_assert(GetInterpreterFunctionHash("glGetSamplerParameterIuiv") == 496);
+static_assert(GetInterpreterFunctionHash("glGetSamplerParameterIuivEXT") == 292);
+static_assert(GetInterpreterFunctionHash("glGetSamplerParameterIuivOES") == 855);
+static_assert(GetInterpreterFunctionHash("glGetSamplerParameterIuivRobustANGLE") == 835);
+static_assert(GetInterpreterFunctionHash("glGetSamplerParameterfv") == 790);
+static_assert(GetInterpreterFunctionHash("glGetSamplerParameterfvRobustANGLE") == 30);
+static_assert(GetInterpreterFunctionHash("glGetSamplerParameteriv") == 699);
+static_assert(GetInterpreterFunctionHash("glGetSamplerParameterivRobustANGLE") == 865);
+static_assert(GetInterpreterFunctionHash("glGetSemaphoreParameterui64vEXT") == 647);
+static_assert(GetInterpreterFunctionHash("glGetShaderInfoLog") == 275);
+static_assert(GetInterpreterFunctionHash("glGetShaderPrecisionFormat") == 716);
+static_assert(GetInterpreterFunctionHash("glGetShaderSource") == 480);
+static_assert(GetInterpreterFunctionHash("glGetShaderiv") == 765);
+static_assert(GetInterpreterFunctionHash("glGetShaderivRobustANGLE") == 871);
+static_assert(GetInterpreterFunctionHash("glGetString") == 747);
+static_assert(GetInterpreterFunctionHash("glGetStringi") == 13);
+static_assert(GetInterpreterFunctionHash("glGetSynciv") == 641);
+static_assert(GetInterpreterFunctionHash("glGetTexEnvfv") == 672);
+static_assert(GetInterpreterFunctionHash("glGetTexEnviv") == 476);
+static_assert(GetInterpreterFunctionHash("glGetTexEnvxv") == 114);
+static_assert(GetInterpreterFunctionHash("glGetTexGenfvOES") == 911);
+static_assert(GetInterpreterFunctionHash("glGetTexGenivOES") == 264);
+static_assert(GetInterpreterFunctionHash("glGetTexGenxvOES") == 578);
+static_assert(GetInterpreterFunctionHash("glGetTexImageANGLE") == 972);
+static_assert(GetInterpreterFunctionHash("glGetTexLevelParameterfv") == 975);
+static_assert(GetInterpreterFunctionHash("glGetTexLevelParameterfvANGLE") == 570);
+static_assert(GetInterpreterFunctionHash("glGetTexLevelParameterfvRobustANGLE") == 464);
+static_assert(GetInterpreterFunctionHash("glGetTexLevelParameteriv") == 130);
+static_assert(GetInterpreterFunctionHash("glGetTexLevelParameterivANGLE") == 181);
+static_assert(GetInterpreterFunctionHash("glGetTexLevelParameterivRobustANGLE") == 91);
+static_assert(GetInterpreterFunctionHash("glGetTexParameterIiv") == 504);
+static_assert(GetInterpreterFunctionHash("glGetTexParameterIivEXT") == 461);
+static_assert(GetInterpreterFunctionHash("glGetTexParameterIivOES") == 490);
+static_assert(GetInterpreterFunctionHash("glGetTexParameterIivRobustANGLE") == 202);
+static_assert(GetInterpreterFunctionHash("glGetTexParameterIuiv") == 25);
+static_assert(GetInterpreterFunctionHash("glGetTexParameterIuivEXT") == 894);
+static_assert(GetInterpreterFunctionHash("glGetTexParameterIuivOES") == 66);
+static_assert(GetInterpreterFunctionHash("glGetTexParameterIuivRobustANGLE") == 104);
+static_assert(GetInterpreterFunctionHash("glGetTexParameterfv") == 610);
+static_assert(GetInterpreterFunctionHash("glGetTexParameterfvRobustANGLE") == 72);
+static_assert(GetInterpreterFunctionHash("glGetTexParameteriv") == 723);
+static_assert(GetInterpreterFunctionHash("glGetTexParameterivRobustANGLE") == 560);
+static_assert(GetInterpreterFunctionHash("glGetTexParameterxv") == 705);
+static_assert(GetInterpreterFunctionHash("glGetTransformFeedbackVarying") == 677);
+static_assert(GetInterpreterFunctionHash("glGetTranslatedShaderSourceANGLE") == 781);
+static_assert(GetInterpreterFunctionHash("glGetUniformBlockIndex") == 759);
+static_assert(GetInterpreterFunctionHash("glGetUniformIndices") == 40);
+static_assert(GetInterpreterFunctionHash("glGetUniformLocation") == 285);
+static_assert(GetInterpreterFunctionHash("glGetUniformfv") == 305);
+static_assert(GetInterpreterFunctionHash("glGetUniformfvRobustANGLE") == 15);
+static_assert(GetInterpreterFunctionHash("glGetUniformiv") == 392);
+static_assert(GetInterpreterFunctionHash("glGetUniformivRobustANGLE") == 403);
+static_assert(GetInterpreterFunctionHash("glGetUniformuiv") == 938);
+static_assert(GetInterpreterFunctionHash("glGetUniformuivRobustANGLE") == 922);
+static_assert(GetInterpreterFunctionHash("glGetUnsignedBytei_vEXT") == 635);
+static_assert(GetInterpreterFunctionHash("glGetUnsignedBytevEXT") == 522);
+static_assert(GetInterpreterFunctionHash("glGetVertexAttribIiv") == 608);
+static_assert(GetInterpreterFunctionHash("glGetVertexAttribIivRobustANGLE") == 460);
+static_assert(GetInterpreterFunctionHash("glGetVertexAttribIuiv") == 261);
+static_assert(GetInterpreterFunctionHash("glGetVertexAttribIuivRobustANGLE") == 935);
+static_assert(GetInterpreterFunctionHash("glGetVertexAttribPointerv") == 754);
+static_assert(GetInterpreterFunctionHash("glGetVertexAttribPointervRobustANGLE") == 348);
+static_assert(GetInterpreterFunctionHash("glGetVertexAttribfv") == 167);
+static_assert(GetInterpreterFunctionHash("glGetVertexAttribfvRobustANGLE") == 208);
+static_assert(GetInterpreterFunctionHash("glGetVertexAttribiv") == 135);
+static_assert(GetInterpreterFunctionHash("glGetVertexAttribivRobustANGLE") == 534);
+static_assert(GetInterpreterFunctionHash("glGetnUniformfv") == 695);
+static_assert(GetInterpreterFunctionHash("glGetnUniformfvEXT") == 295);
+static_assert(GetInterpreterFunctionHash("glGetnUniformfvKHR") == 76);
+static_assert(GetInterpreterFunctionHash("glGetnUniformfvRobustANGLE") == 29);
+static_assert(GetInterpreterFunctionHash("glGetnUniformiv") == 797);
+static_assert(GetInterpreterFunctionHash("glGetnUniformivEXT") == 741);
+static_assert(GetInterpreterFunctionHash("glGetnUniformivKHR") == 561);
+static_assert(GetInterpreterFunctionHash("glGetnUniformivRobustANGLE") == 389);
+static_assert(GetInterpreterFunctionHash("glGetnUniformuiv") == 82);
+static_assert(GetInterpreterFunctionHash("glGetnUniformuivKHR") == 746);
+static_assert(GetInterpreterFunctionHash("glGetnUniformuivRobustANGLE") == 995);
+static_assert(GetInterpreterFunctionHash("glHint") == 239);
+static_assert(GetInterpreterFunctionHash("glImportMemoryFdEXT") == 422);
+static_assert(GetInterpreterFunctionHash("glImportMemoryZirconHandleANGLE") == 571);
+static_assert(GetInterpreterFunctionHash("glImportSemaphoreFdEXT") == 463);
+static_assert(GetInterpreterFunctionHash("glImportSemaphoreZirconHandleANGLE") == 10);
+static_assert(GetInterpreterFunctionHash("glInsertEventMarkerEXT") == 443);
+static_assert(GetInterpreterFunctionHash("glInvalidateFramebuffer") == 603);
+static_assert(GetInterpreterFunctionHash("glInvalidateSubFramebuffer") == 155);
+static_assert(GetInterpreterFunctionHash("glInvalidateTextureANGLE") == 611);
+static_assert(GetInterpreterFunctionHash("glIsBuffer") == 121);
+static_assert(GetInterpreterFunctionHash("glIsEnabled") == 755);
+static_assert(GetInterpreterFunctionHash("glIsEnabledi") == 376);
+static_assert(GetInterpreterFunctionHash("glIsEnablediEXT") == 536);
+static_assert(GetInterpreterFunctionHash("glIsEnablediOES") == 815);
+static_assert(GetInterpreterFunctionHash("glIsFenceNV") == 577);
+static_assert(GetInterpreterFunctionHash("glIsFramebuffer") == 876);
+static_assert(GetInterpreterFunctionHash("glIsFramebufferOES") == 637);
+static_assert(GetInterpreterFunctionHash("glIsMemoryObjectEXT") == 127);
+static_assert(GetInterpreterFunctionHash("glIsProgram") == 968);
+static_assert(GetInterpreterFunctionHash("glIsProgramPipeline") == 686);
+static_assert(GetInterpreterFunctionHash("glIsProgramPipelineEXT") == 333);
+static_assert(GetInterpreterFunctionHash("glIsQuery") == 758);
+static_assert(GetInterpreterFunctionHash("glIsQueryEXT") == 71);
+static_assert(GetInterpreterFunctionHash("glIsRenderbuffer") == 284);
+static_assert(GetInterpreterFunctionHash("glIsRenderbufferOES") == 109);
+static_assert(GetInterpreterFunctionHash("glIsSampler") == 548);
+static_assert(GetInterpreterFunctionHash("glIsSemaphoreEXT") == 557);
+static_assert(GetInterpreterFunctionHash("glIsShader") == 986);
+static_assert(GetInterpreterFunctionHash("glIsSync") == 421);
+static_assert(GetInterpreterFunctionHash("glIsTexture") == 232);
+static_assert(GetInterpreterFunctionHash("glIsTransformFeedback") == 446);
+static_assert(GetInterpreterFunctionHash("glIsVertexArray") == 90);
+static_assert(GetInterpreterFunctionHash("glIsVertexArrayOES") == 885);
+static_assert(GetInterpreterFunctionHash("glLabelObjectEXT") == 554);
+static_assert(GetInterpreterFunctionHash("glLightModelf") == 425);
+static_assert(GetInterpreterFunctionHash("glLightModelfv") == 734);
+static_assert(GetInterpreterFunctionHash("glLightModelx") == 269);
+static_assert(GetInterpreterFunctionHash("glLightModelxv") == 563);
+static_assert(GetInterpreterFunctionHash("glLightf") == 174);
+static_assert(GetInterpreterFunctionHash("glLightfv") == 630);
+static_assert(GetInterpreterFunctionHash("glLightx") == 171);
+static_assert(GetInterpreterFunctionHash("glLightxv") == 639);
+static_assert(GetInterpreterFunctionHash("glLineWidth") == 565);
+static_assert(GetInterpreterFunctionHash("glLineWidthx") == 95);
+static_assert(GetInterpreterFunctionHash("glLinkProgram") == 841);
+static_assert(GetInterpreterFunctionHash("glLoadIdentity") == 393);
+static_assert(GetInterpreterFunctionHash("glLoadMatrixf") == 706);
+static_assert(GetInterpreterFunctionHash("glLoadMatrixx") == 828);
+static_assert(GetInterpreterFunctionHash("glLoadPaletteFromModelViewMatrixOES") == 273);
+static_assert(GetInterpreterFunctionHash("glLogicOp") == 646);
+static_assert(GetInterpreterFunctionHash("glLogicOpANGLE") == 510);
+static_assert(GetInterpreterFunctionHash("glLoseContextCHROMIUM") == 502);
+static_assert(GetInterpreterFunctionHash("glMapBufferOES") == 627);
+static_assert(GetInterpreterFunctionHash("glMapBufferRange") == 622);
+static_assert(GetInterpreterFunctionHash("glMapBufferRangeEXT") == 962);
+static_assert(GetInterpreterFunctionHash("glMaterialf") == 431);
+static_assert(GetInterpreterFunctionHash("glMaterialfv") == 879);
+static_assert(GetInterpreterFunctionHash("glMaterialx") == 783);
+static_assert(GetInterpreterFunctionHash("glMaterialxv") == 721);
+static_assert(GetInterpreterFunctionHash("glMatrixIndexPointerOES") == 36);
+static_assert(GetInterpreterFunctionHash("glMatrixMode") == 53);
+static_assert(GetInterpreterFunctionHash("glMaxShaderCompilerThreadsKHR") == 732);
+static_assert(GetInterpreterFunctionHash("glMemoryBarrier") == 339);
+static_assert(GetInterpreterFunctionHash("glMemoryBarrierByRegion") == 433);
+static_assert(GetInterpreterFunctionHash("glMemoryObjectParameterivEXT") == 763);
+static_assert(GetInterpreterFunctionHash("glMinSampleShading") == 334);
+static_assert(GetInterpreterFunctionHash("glMinSampleShadingOES") == 397);
+static_assert(GetInterpreterFunctionHash("glMultMatrixf") == 401);
+static_assert(GetInterpreterFunctionHash("glMultMatrixx") == 942);
+static_assert(GetInterpreterFunctionHash("glMultiDrawArraysANGLE") == 791);
+static_assert(GetInterpreterFunctionHash("glMultiDrawArraysIndirectEXT") == 901);
+static_assert(GetInterpreterFunctionHash("glMultiDrawArraysInstancedANGLE") == 429);
+static_assert(GetInterpreterFunctionHash("glMultiDrawArraysInstancedBaseInstanceANGLE") == 836);
+static_assert(GetInterpreterFunctionHash("glMultiDrawElementsANGLE") == 193);
+static_assert(GetInterpreterFunctionHash("glMultiDrawElementsBaseVertexEXT") == 500);
+static_assert(GetInterpreterFunctionHash("glMultiDrawElementsIndirectEXT") == 216);
+static_assert(GetInterpreterFunctionHash("glMultiDrawElementsInstancedANGLE") == 324);
+static_assert(
+    GetInterpreterFunctionHash("glMultiDrawElementsInstancedBaseVertexBaseInstanceANGLE") == 540);
+static_assert(GetInterpreterFunctionHash("glMultiTexCoord4f") == 491);
+static_assert(GetInterpreterFunctionHash("glMultiTexCoord4x") == 744);
+static_assert(GetInterpreterFunctionHash("glNamedBufferStorageExternalEXT") == 542);
+static_assert(GetInterpreterFunctionHash("glNormal3f") == 799);
+static_assert(GetInterpreterFunctionHash("glNormal3x") == 298);
+static_assert(GetInterpreterFunctionHash("glNormalPointer") == 312);
+static_assert(GetInterpreterFunctionHash("glObjectLabel") == 230);
+static_assert(GetInterpreterFunctionHash("glObjectLabelKHR") == 12);
+static_assert(GetInterpreterFunctionHash("glObjectPtrLabel") == 898);
+static_assert(GetInterpreterFunctionHash("glObjectPtrLabelKHR") == 247);
+static_assert(GetInterpreterFunctionHash("glOrthof") == 106);
+static_assert(GetInterpreterFunctionHash("glOrthox") == 751);
+static_assert(GetInterpreterFunctionHash("glPatchParameteri") == 632);
+static_assert(GetInterpreterFunctionHash("glPatchParameteriEXT") == 336);
+static_assert(GetInterpreterFunctionHash("glPatchParameteriOES") == 840);
+static_assert(GetInterpreterFunctionHash("glPauseTransformFeedback") == 311);
+static_assert(GetInterpreterFunctionHash("glPixelLocalStorageBarrierANGLE") == 725);
+static_assert(GetInterpreterFunctionHash("glPixelStorei") == 539);
+static_assert(GetInterpreterFunctionHash("glPointParameterf") == 909);
+static_assert(GetInterpreterFunctionHash("glPointParameterfv") == 820);
+static_assert(GetInterpreterFunctionHash("glPointParameterx") == 660);
+static_assert(GetInterpreterFunctionHash("glPointParameterxv") == 976);
+static_assert(GetInterpreterFunctionHash("glPointSize") == 417);
+static_assert(GetInterpreterFunctionHash("glPointSizePointerOES") == 358);
+static_assert(GetInterpreterFunctionHash("glPointSizex") == 54);
+static_assert(GetInterpreterFunctionHash("glPolygonModeANGLE") == 144);
+static_assert(GetInterpreterFunctionHash("glPolygonModeNV") == 391);
+static_assert(GetInterpreterFunctionHash("glPolygonOffset") == 48);
+static_assert(GetInterpreterFunctionHash("glPolygonOffsetClampEXT") == 568);
+static_assert(GetInterpreterFunctionHash("glPolygonOffsetx") == 50);
+static_assert(GetInterpreterFunctionHash("glPopDebugGroup") == 625);
+static_assert(GetInterpreterFunctionHash("glPopDebugGroupKHR") == 474);
+static_assert(GetInterpreterFunctionHash("glPopGroupMarkerEXT") == 739);
+static_assert(GetInterpreterFunctionHash("glPopMatrix") == 794);
+static_assert(GetInterpreterFunctionHash("glPrimitiveBoundingBox") == 84);
+static_assert(GetInterpreterFunctionHash("glPrimitiveBoundingBoxEXT") == 377);
+static_assert(GetInterpreterFunctionHash("glPrimitiveBoundingBoxOES") == 396);
+static_assert(GetInterpreterFunctionHash("glProgramBinary") == 249);
+static_assert(GetInterpreterFunctionHash("glProgramBinaryOES") == 356);
+static_assert(GetInterpreterFunctionHash("glProgramParameteri") == 978);
+static_assert(GetInterpreterFunctionHash("glProgramParameteriEXT") == 481);
+static_assert(GetInterpreterFunctionHash("glProgramUniform1f") == 937);
+static_assert(GetInterpreterFunctionHash("glProgramUniform1fEXT") == 122);
+static_assert(GetInterpreterFunctionHash("glProgramUniform1fv") == 980);
+static_assert(GetInterpreterFunctionHash("glProgramUniform1fvEXT") == 22);
+static_assert(GetInterpreterFunctionHash("glProgramUniform1i") == 225);
+static_assert(GetInterpreterFunctionHash("glProgramUniform1iEXT") == 149);
+static_assert(GetInterpreterFunctionHash("glProgramUniform1iv") == 212);
+static_assert(GetInterpreterFunctionHash("glProgramUniform1ivEXT") == 872);
+static_assert(GetInterpreterFunctionHash("glProgramUniform1ui") == 141);
+static_assert(GetInterpreterFunctionHash("glProgramUniform1uiEXT") == 326);
+static_assert(GetInterpreterFunctionHash("glProgramUniform1uiv") == 592);
+static_assert(GetInterpreterFunctionHash("glProgramUniform1uivEXT") == 428);
+static_assert(GetInterpreterFunctionHash("glProgramUniform2f") == 343);
+static_assert(GetInterpreterFunctionHash("glProgramUniform2fEXT") == 265);
+static_assert(GetInterpreterFunctionHash("glProgramUniform2fv") == 61);
+static_assert(GetInterpreterFunctionHash("glProgramUniform2fvEXT") == 279);
+static_assert(GetInterpreterFunctionHash("glProgramUniform2i") == 824);
+static_assert(GetInterpreterFunctionHash("glProgramUniform2iEXT") == 928);
+static_assert(GetInterpreterFunctionHash("glProgramUniform2iv") == 424);
+static_assert(GetInterpreterFunctionHash("glProgramUniform2ivEXT") == 939);
+static_assert(GetInterpreterFunctionHash("glProgramUniform2ui") == 207);
+static_assert(GetInterpreterFunctionHash("glProgramUniform2uiEXT") == 302);
+static_assert(GetInterpreterFunctionHash("glProgramUniform2uiv") == 344);
+static_assert(GetInterpreterFunctionHash("glProgramUniform2uivEXT") == 352);
+static_assert(GetInterpreterFunctionHash("glProgramUniform3f") == 511);
+static_assert(GetInterpreterFunctionHash("glProgramUniform3fEXT") == 219);
+static_assert(GetInterpreterFunctionHash("glProgramUniform3fv") == 663);
+static_assert(GetInterpreterFunctionHash("glProgramUniform3fvEXT") == 386);
+static_assert(GetInterpreterFunctionHash("glProgramUniform3i") == 953);
+static_assert(GetInterpreterFunctionHash("glProgramUniform3iEXT") == 629);
+static_assert(GetInterpreterFunctionHash("glProgramUniform3iv") == 309);
+static_assert(GetInterpreterFunctionHash("glProgramUniform3ivEXT") == 525);
+static_assert(GetInterpreterFunctionHash("glProgramUniform3ui") == 346);
+static_assert(GetInterpreterFunctionHash("glProgramUniform3uiEXT") == 620);
+static_assert(GetInterpreterFunctionHash("glProgramUniform3uiv") == 912);
+static_assert(GetInterpreterFunctionHash("glProgramUniform3uivEXT") == 616);
+static_assert(GetInterpreterFunctionHash("glProgramUniform4f") == 297);
+static_assert(GetInterpreterFunctionHash("glProgramUniform4fEXT") == 537);
+static_assert(GetInterpreterFunctionHash("glProgramUniform4fv") == 165);
+static_assert(GetInterpreterFunctionHash("glProgramUniform4fvEXT") == 971);
+static_assert(GetInterpreterFunctionHash("glProgramUniform4i") == 330);
+static_assert(GetInterpreterFunctionHash("glProgramUniform4iEXT") == 105);
+static_assert(GetInterpreterFunctionHash("glProgramUniform4iv") == 880);
+static_assert(GetInterpreterFunctionHash("glProgramUniform4ivEXT") == 123);
+static_assert(GetInterpreterFunctionHash("glProgramUniform4ui") == 910);
+static_assert(GetInterpreterFunctionHash("glProgramUniform4uiEXT") == 406);
+static_assert(GetInterpreterFunctionHash("glProgramUniform4uiv") == 271);
+static_assert(GetInterpreterFunctionHash("glProgramUniform4uivEXT") == 337);
+static_assert(GetInterpreterFunctionHash("glProgramUniformMatrix2fv") == 689);
+static_assert(GetInterpreterFunctionHash("glProgramUniformMatrix2fvEXT") == 427);
+static_assert(GetInterpreterFunctionHash("glProgramUniformMatrix2x3fv") == 772);
+static_assert(GetInterpreterFunctionHash("glProgramUniformMatrix2x3fvEXT") == 572);
+static_assert(GetInterpreterFunctionHash("glProgramUniformMatrix2x4fv") == 736);
+static_assert(GetInterpreterFunctionHash("glProgramUniformMatrix2x4fvEXT") == 804);
+static_assert(GetInterpreterFunctionHash("glProgramUniformMatrix3fv") == 452);
+static_assert(GetInterpreterFunctionHash("glProgramUniformMatrix3fvEXT") == 332);
+static_assert(GetInterpreterFunctionHash("glProgramUniformMatrix3x2fv") == 960);
+static_assert(GetInterpreterFunctionHash("glProgramUniformMatrix3x2fvEXT") == 861);
+static_assert(GetInterpreterFunctionHash("glProgramUniformMatrix3x4fv") == 983);
+static_assert(GetInterpreterFunctionHash("glProgramUniformMatrix3x4fvEXT") == 426);
+static_assert(GetInterpreterFunctionHash("glProgramUniformMatrix4fv") == 669);
+static_assert(GetInterpreterFunctionHash("glProgramUniformMatrix4fvEXT") == 890);
+static_assert(GetInterpreterFunctionHash("glProgramUniformMatrix4x2fv") == 112);
+static_assert(GetInterpreterFunctionHash("glProgramUniformMatrix4x2fvEXT") == 280);
+static_assert(GetInterpreterFunctionHash("glProgramUniformMatrix4x3fv") == 653);
+static_assert(GetInterpreterFunctionHash("glProgramUniformMatrix4x3fvEXT") == 28);
+static_assert(GetInterpreterFunctionHash("glProvokingVertexANGLE") == 984);
+static_assert(GetInterpreterFunctionHash("glPushDebugGroup") == 951);
+static_assert(GetInterpreterFunctionHash("glPushDebugGroupKHR") == 159);
+static_assert(GetInterpreterFunctionHash("glPushGroupMarkerEXT") == 648);
+static_assert(GetInterpreterFunctionHash("glPushMatrix") == 359);
+static_assert(GetInterpreterFunctionHash("glQueryCounterEXT") == 457);
+static_assert(GetInterpreterFunctionHash("glQueryMatrixxOES") == 839);
+static_assert(GetInterpreterFunctionHash("glReadBuffer") == 678);
+static_assert(GetInterpreterFunctionHash("glReadPixels") == 993);
+static_assert(GetInterpreterFunctionHash("glReadPixelsRobustANGLE") == 846);
+static_assert(GetInterpreterFunctionHash("glReadnPixels") == 674);
+static_assert(GetInterpreterFunctionHash("glReadnPixelsEXT") == 867);
+static_assert(GetInterpreterFunctionHash("glReadnPixelsKHR") == 916);
+static_assert(GetInterpreterFunctionHash("glReadnPixelsRobustANGLE") == 549);
+static_assert(GetInterpreterFunctionHash("glReleaseShaderCompiler") == 868);
+static_assert(GetInterpreterFunctionHash("glReleaseTexturesANGLE") == 469);
+static_assert(GetInterpreterFunctionHash("glRenderbufferStorage") == 8);
+static_assert(GetInterpreterFunctionHash("glRenderbufferStorageMultisample") == 243);
+static_assert(GetInterpreterFunctionHash("glRenderbufferStorageMultisampleANGLE") == 182);
+static_assert(GetInterpreterFunctionHash("glRenderbufferStorageMultisampleEXT") == 853);
+static_assert(GetInterpreterFunctionHash("glRenderbufferStorageOES") == 402);
+static_assert(GetInterpreterFunctionHash("glRequestExtensionANGLE") == 936);
+static_assert(GetInterpreterFunctionHash("glResumeTransformFeedback") == 314);
+static_assert(GetInterpreterFunctionHash("glRotatef") == 701);
+static_assert(GetInterpreterFunctionHash("glRotatex") == 640);
+static_assert(GetInterpreterFunctionHash("glSampleCoverage") == 41);
+static_assert(GetInterpreterFunctionHash("glSampleCoveragex") == 711);
+static_assert(GetInterpreterFunctionHash("glSampleMaski") == 498);
+static_assert(GetInterpreterFunctionHash("glSampleMaskiANGLE") == 883);
+static_assert(GetInterpreterFunctionHash("glSamplerParameterIiv") == 237);
+static_assert(GetInterpreterFunctionHash("glSamplerParameterIivEXT") == 842);
+static_assert(GetInterpreterFunctionHash("glSamplerParameterIivOES") == 492);
+static_assert(GetInterpreterFunctionHash("glSamplerParameterIivRobustANGLE") == 664);
+static_assert(GetInterpreterFunctionHash("glSamplerParameterIuiv") == 788);
+static_assert(GetInterpreterFunctionHash("glSamplerParameterIuivEXT") == 930);
+static_assert(GetInterpreterFunctionHash("glSamplerParameterIuivOES") == 684);
+static_assert(GetInterpreterFunctionHash("glSamplerParameterIuivRobustANGLE") == 388);
+static_assert(GetInterpreterFunctionHash("glSamplerParameterf") == 989);
+static_assert(GetInterpreterFunctionHash("glSamplerParameterfv") == 505);
+static_assert(GetInterpreterFunctionHash("glSamplerParameterfvRobustANGLE") == 447);
+static_assert(GetInterpreterFunctionHash("glSamplerParameteri") == 856);
+static_assert(GetInterpreterFunctionHash("glSamplerParameteriv") == 582);
+static_assert(GetInterpreterFunctionHash("glSamplerParameterivRobustANGLE") == 607);
+static_assert(GetInterpreterFunctionHash("glScalef") == 78);
+static_assert(GetInterpreterFunctionHash("glScalex") == 129);
+static_assert(GetInterpreterFunctionHash("glScissor") == 807);
+static_assert(GetInterpreterFunctionHash("glSelectPerfMonitorCountersAMD") == 294);
+static_assert(GetInterpreterFunctionHash("glSemaphoreParameterui64vEXT") == 404);
+static_assert(GetInterpreterFunctionHash("glSetFenceNV") == 27);
+static_assert(GetInterpreterFunctionHash("glShadeModel") == 299);
+static_assert(GetInterpreterFunctionHash("glShaderBinary") == 146);
+static_assert(GetInterpreterFunctionHash("glShaderSource") == 628);
+static_assert(GetInterpreterFunctionHash("glShadingRateQCOM") == 727);
+static_assert(GetInterpreterFunctionHash("glSignalSemaphoreEXT") == 458);
+static_assert(GetInterpreterFunctionHash("glStartTilingQCOM") == 553);
+static_assert(GetInterpreterFunctionHash("glStencilFunc") == 945);
+static_assert(GetInterpreterFunctionHash("glStencilFuncSeparate") == 961);
+static_assert(GetInterpreterFunctionHash("glStencilMask") == 120);
+static_assert(GetInterpreterFunctionHash("glStencilMaskSeparate") == 681);
+static_assert(GetInterpreterFunctionHash("glStencilOp") == 353);
+static_assert(GetInterpreterFunctionHash("glStencilOpSeparate") == 683);
+static_assert(GetInterpreterFunctionHash("glTestFenceNV") == 399);
+static_assert(GetInterpreterFunctionHash("glTexBuffer") == 162);
+static_assert(GetInterpreterFunctionHash("glTexBufferEXT") == 826);
+static_assert(GetInterpreterFunctionHash("glTexBufferOES") == 113);
+static_assert(GetInterpreterFunctionHash("glTexBufferRange") == 56);
+static_assert(GetInterpreterFunctionHash("glTexBufferRangeEXT") == 440);
+static_assert(GetInterpreterFunctionHash("glTexBufferRangeOES") == 618);
+static_assert(GetInterpreterFunctionHash("glTexCoordPointer") == 733);
+static_assert(GetInterpreterFunctionHash("glTexEnvf") == 179);
+static_assert(GetInterpreterFunctionHash("glTexEnvfv") == 2);
+static_assert(GetInterpreterFunctionHash("glTexEnvi") == 223);
+static_assert(GetInterpreterFunctionHash("glTexEnviv") == 118);
+static_assert(GetInterpreterFunctionHash("glTexEnvx") == 467);
+static_assert(GetInterpreterFunctionHash("glTexEnvxv") == 321);
+static_assert(GetInterpreterFunctionHash("glTexGenfOES") == 70);
+static_assert(GetInterpreterFunctionHash("glTexGenfvOES") == 703);
+static_assert(GetInterpreterFunctionHash("glTexGeniOES") == 507);
+static_assert(GetInterpreterFunctionHash("glTexGenivOES") == 478);
+static_assert(GetInterpreterFunctionHash("glTexGenxOES") == 769);
+static_assert(GetInterpreterFunctionHash("glTexGenxvOES") == 419);
+static_assert(GetInterpreterFunctionHash("glTexImage2D") == 226);
+static_assert(GetInterpreterFunctionHash("glTexImage2DExternalANGLE") == 614);
+static_assert(GetInterpreterFunctionHash("glTexImage2DRobustANGLE") == 633);
+static_assert(GetInterpreterFunctionHash("glTexImage3D") == 509);
+static_assert(GetInterpreterFunctionHash("glTexImage3DOES") == 811);
+static_assert(GetInterpreterFunctionHash("glTexImage3DRobustANGLE") == 439);
+static_assert(GetInterpreterFunctionHash("glTexParameterIiv") == 944);
+static_assert(GetInterpreterFunctionHash("glTexParameterIivEXT") == 985);
+static_assert(GetInterpreterFunctionHash("glTexParameterIivOES") == 47);
+static_assert(GetInterpreterFunctionHash("glTexParameterIivRobustANGLE") == 943);
+static_assert(GetInterpreterFunctionHash("glTexParameterIuiv") == 508);
+static_assert(GetInterpreterFunctionHash("glTexParameterIuivEXT") == 86);
+static_assert(GetInterpreterFunctionHash("glTexParameterIuivOES") == 222);
+static_assert(GetInterpreterFunctionHash("glTexParameterIuivRobustANGLE") == 676);
+static_assert(GetInterpreterFunctionHash("glTexParameterf") == 771);
+static_assert(GetInterpreterFunctionHash("glTexParameterfv") == 999);
+static_assert(GetInterpreterFunctionHash("glTexParameterfvRobustANGLE") == 180);
+static_assert(GetInterpreterFunctionHash("glTexParameteri") == 486);
+static_assert(GetInterpreterFunctionHash("glTexParameteriv") == 231);
+static_assert(GetInterpreterFunctionHash("glTexParameterivRobustANGLE") == 775);
+static_assert(GetInterpreterFunctionHash("glTexParameterx") == 564);
+static_assert(GetInterpreterFunctionHash("glTexParameterxv") == 154);
+static_assert(GetInterpreterFunctionHash("glTexStorage1DEXT") == 252);
+static_assert(GetInterpreterFunctionHash("glTexStorage2D") == 152);
+static_assert(GetInterpreterFunctionHash("glTexStorage2DEXT") == 745);
+static_assert(GetInterpreterFunctionHash("glTexStorage2DMultisample") == 550);
+static_assert(GetInterpreterFunctionHash("glTexStorage2DMultisampleANGLE") == 259);
+static_assert(GetInterpreterFunctionHash("glTexStorage3D") == 79);
+static_assert(GetInterpreterFunctionHash("glTexStorage3DEXT") == 897);
+static_assert(GetInterpreterFunctionHash("glTexStorage3DMultisample") == 792);
+static_assert(GetInterpreterFunctionHash("glTexStorage3DMultisampleOES") == 631);
+static_assert(GetInterpreterFunctionHash("glTexStorageMem2DEXT") == 384);
+static_assert(GetInterpreterFunctionHash("glTexStorageMem2DMultisampleEXT") == 16);
+static_assert(GetInterpreterFunctionHash("glTexStorageMem3DEXT") == 145);
+static_assert(GetInterpreterFunctionHash("glTexStorageMem3DMultisampleEXT") == 304);
+static_assert(GetInterpreterFunctionHash("glTexStorageMemFlags2DANGLE") == 412);
+static_assert(GetInterpreterFunctionHash("glTexStorageMemFlags2DMultisampleANGLE") == 904);
+static_assert(GetInterpreterFunctionHash("glTexStorageMemFlags3DANGLE") == 726);
+static_assert(GetInterpreterFunctionHash("glTexStorageMemFlags3DMultisampleANGLE") == 224);
+static_assert(GetInterpreterFunctionHash("glTexSubImage2D") == 854);
+static_assert(GetInterpreterFunctionHash("glTexSubImage2DRobustANGLE") == 913);
+static_assert(GetInterpreterFunctionHash("glTexSubImage3D") == 988);
+static_assert(GetInterpreterFunctionHash("glTexSubImage3DOES") == 589);
+static_assert(GetInterpreterFunctionHash("glTexSubImage3DRobustANGLE") == 990);
+static_assert(GetInterpreterFunctionHash("glTextureFoveationParametersQCOM") == 234);
+static_assert(GetInterpreterFunctionHash("glTransformFeedbackVaryings") == 527);
+static_assert(GetInterpreterFunctionHash("glTranslatef") == 642);
+static_assert(GetInterpreterFunctionHash("glTranslatex") == 931);
+static_assert(GetInterpreterFunctionHash("glUniform1f") == 638);
+static_assert(GetInterpreterFunctionHash("glUniform1fv") == 656);
+static_assert(GetInterpreterFunctionHash("glUniform1i") == 558);
+static_assert(GetInterpreterFunctionHash("glUniform1iv") == 798);
+static_assert(GetInterpreterFunctionHash("glUniform1ui") == 355);
+static_assert(GetInterpreterFunctionHash("glUniform1uiv") == 0);
+static_assert(GetInterpreterFunctionHash("glUniform2f") == 619);
+static_assert(GetInterpreterFunctionHash("glUniform2fv") == 203);
+static_assert(GetInterpreterFunctionHash("glUniform2i") == 235);
+static_assert(GetInterpreterFunctionHash("glUniform2iv") == 7);
+static_assert(GetInterpreterFunctionHash("glUniform2ui") == 215);
+static_assert(GetInterpreterFunctionHash("glUniform2uiv") == 819);
+static_assert(GetInterpreterFunctionHash("glUniform3f") == 949);
+static_assert(GetInterpreterFunctionHash("glUniform3fv") == 767);
+static_assert(GetInterpreterFunctionHash("glUniform3i") == 278);
+static_assert(GetInterpreterFunctionHash("glUniform3iv") == 398);
+static_assert(GetInterpreterFunctionHash("glUniform3ui") == 559);
+static_assert(GetInterpreterFunctionHash("glUniform3uiv") == 108);
+static_assert(GetInterpreterFunctionHash("glUniform4f") == 147);
+static_assert(GetInterpreterFunctionHash("glUniform4fv") == 957);
+static_assert(GetInterpreterFunctionHash("glUniform4i") == 889);
+static_assert(GetInterpreterFunctionHash("glUniform4iv") == 724);
+static_assert(GetInterpreterFunctionHash("glUniform4ui") == 812);
+static_assert(GetInterpreterFunctionHash("glUniform4uiv") == 800);
+static_assert(GetInterpreterFunctionHash("glUniformBlockBinding") == 866);
+static_assert(GetInterpreterFunctionHash("glUniformMatrix2fv") == 371);
+static_assert(GetInterpreterFunctionHash("glUniformMatrix2x3fv") == 966);
+static_assert(GetInterpreterFunctionHash("glUniformMatrix2x4fv") == 585);
+static_assert(GetInterpreterFunctionHash("glUniformMatrix3fv") == 17);
+static_assert(GetInterpreterFunctionHash("glUniformMatrix3x2fv") == 228);
+static_assert(GetInterpreterFunctionHash("glUniformMatrix3x4fv") == 414);
+static_assert(GetInterpreterFunctionHash("glUniformMatrix4fv") == 485);
+static_assert(GetInterpreterFunctionHash("glUniformMatrix4x2fv") == 782);
+static_assert(GetInterpreterFunctionHash("glUniformMatrix4x3fv") == 185);
+static_assert(GetInterpreterFunctionHash("glUnmapBuffer") == 151);
+static_assert(GetInterpreterFunctionHash("glUnmapBufferOES") == 487);
+static_assert(GetInterpreterFunctionHash("glUseProgram") == 52);
+static_assert(GetInterpreterFunctionHash("glUseProgramStages") == 136);
+static_assert(GetInterpreterFunctionHash("glUseProgramStagesEXT") == 892);
+static_assert(GetInterpreterFunctionHash("glValidateProgram") == 710);
+static_assert(GetInterpreterFunctionHash("glValidateProgramPipeline") == 590);
+static_assert(GetInterpreterFunctionHash("glValidateProgramPipelineEXT") == 810);
+static_assert(GetInterpreterFunctionHash("glVertexAttrib1f") == 416);
+static_assert(GetInterpreterFunctionHash("glVertexAttrib1fv") == 615);
+static_assert(GetInterpreterFunctionHash("glVertexAttrib2f") == 668);
+static_assert(GetInterpreterFunctionHash("glVertexAttrib2fv") == 899);
+static_assert(GetInterpreterFunctionHash("glVertexAttrib3f") == 888);
+static_assert(GetInterpreterFunctionHash("glVertexAttrib3fv") == 531);
+static_assert(GetInterpreterFunctionHash("glVertexAttrib4f") == 319);
+static_assert(GetInterpreterFunctionHash("glVertexAttrib4fv") == 177);
+static_assert(GetInterpreterFunctionHash("glVertexAttribBinding") == 160);
+static_assert(GetInterpreterFunctionHash("glVertexAttribDivisor") == 200);
+static_assert(GetInterpreterFunctionHash("glVertexAttribDivisorANGLE") == 809);
+static_assert(GetInterpreterFunctionHash("glVertexAttribDivisorEXT") == 503);
+static_assert(GetInterpreterFunctionHash("glVertexAttribFormat") == 965);
+static_assert(GetInterpreterFunctionHash("glVertexAttribI4i") == 62);
+static_assert(GetInterpreterFunctionHash("glVertexAttribI4iv") == 395);
+static_assert(GetInterpreterFunctionHash("glVertexAttribI4ui") == 546);
+static_assert(GetInterpreterFunctionHash("glVertexAttribI4uiv") == 644);
+static_assert(GetInterpreterFunctionHash("glVertexAttribIFormat") == 929);
+static_assert(GetInterpreterFunctionHash("glVertexAttribIPointer") == 290);
+static_assert(GetInterpreterFunctionHash("glVertexAttribPointer") == 89);
+static_assert(GetInterpreterFunctionHash("glVertexBindingDivisor") == 643);
+static_assert(GetInterpreterFunctionHash("glVertexPointer") == 126);
+static_assert(GetInterpreterFunctionHash("glViewport") == 242);
+static_assert(GetInterpreterFunctionHash("glWaitSemaphoreEXT") == 830);
+static_assert(GetInterpreterFunctionHash("glWaitSync") == 874);
+static_assert(GetInterpreterFunctionHash("glWeightPointerOES") == 852);
+static_assert(GetInterpreterFunctionHash("CreateContext") == 964);
+static_assert(GetInterpreterFunctionHash("CreateEGLImage") == 617);
+static_assert(GetInterpreterFunctionHash("CreateEGLImageKHR") == 693);
+static_assert(GetInterpreterFunctionHash("CreateEGLSync") == 19);
+static_assert(GetInterpreterFunctionHash("CreateEGLSyncKHR") == 379);
+static_assert(GetInterpreterFunctionHash("CreateNativeClientBufferANDROID") == 973);
+static_assert(GetInterpreterFunctionHash("CreatePbufferSurface") == 14);
+static_assert(GetInterpreterFunctionHash("CreateProgram") == 24);
+static_assert(GetInterpreterFunctionHash("CreateShader") == 626);
+static_assert(GetInterpreterFunctionHash("CreateShaderProgramv") == 722);
+static_assert(GetInterpreterFunctionHash("DeleteUniformLocations") == 743);
+static_assert(GetInterpreterFunctionHash("DestroyEGLImage") == 266);
+static_assert(GetInterpreterFunctionHash("DestroyEGLImageKHR") == 268);
+static_assert(GetInterpreterFunctionHash("FenceSync") == 459);
+static_assert(GetInterpreterFunctionHash("FenceSync2") == 301);
+static_assert(GetInterpreterFunctionHash("InitializeReplay") == 88);
+static_assert(GetInterpreterFunctionHash("InitializeReplay2") == 405);
+static_assert(GetInterpreterFunctionHash("InitializeReplay3") == 796);
+static_assert(GetInterpreterFunctionHash("InitializeReplay4") == 192);
+static_assert(GetInterpreterFunctionHash("MapBufferOES") == 254);
+static_assert(GetInterpreterFunctionHash("MapBufferRange") == 587);
+static_assert(GetInterpreterFunctionHash("MapBufferRangeEXT") == 948);
+static_assert(GetInterpreterFunctionHash("SetBufferID") == 418);
+static_assert(GetInterpreterFunctionHash("SetCurrentContextID") == 484);
+static_assert(GetInterpreterFunctionHash("SetFramebufferID") == 869);
+static_assert(GetInterpreterFunctionHash("SetRenderbufferID") == 900);
+static_assert(GetInterpreterFunctionHash("SetTextureID") == 849);
+static_assert(GetInterpreterFunctionHash("UniformBlockBinding") == 596);
+static_assert(GetInterpreterFunctionHash("UpdateBufferID") == 489);
+static_assert(GetInterpreterFunctionHash("UpdateClientArrayPointer") == 199);
+static_assert(GetInterpreterFunctionHash("UpdateClientBufferData") == 58);
+static_assert(GetInterpreterFunctionHash("UpdateClientBufferDataWithOffset") == 844);
+static_assert(GetInterpreterFunctionHash("UpdateCurrentProgram") == 315);
+static_assert(GetInterpreterFunctionHash("UpdateFenceNVID") == 307);
+static_assert(GetInterpreterFunctionHash("UpdateFramebufferID") == 707);
+static_assert(GetInterpreterFunctionHash("UpdateMemoryObjectID") == 761);
+static_assert(GetInterpreterFunctionHash("UpdateProgramPipelineID") == 529);
+static_assert(GetInterpreterFunctionHash("UpdateQueryID") == 438);
+static_assert(GetInterpreterFunctionHash("UpdateRenderbufferID") == 213);
+static_assert(GetInterpreterFunctionHash("UpdateResourceIDBuffer") == 287);
+static_assert(GetInterpreterFunctionHash("UpdateSamplerID") == 907);
+static_assert(GetInterpreterFunctionHash("UpdateSemaphoreID") == 43);
+static_assert(GetInterpreterFunctionHash("UpdateShaderProgramID") == 857);
+static_assert(GetInterpreterFunctionHash("UpdateTextureID") == 827);
+static_assert(GetInterpreterFunctionHash("UpdateTransformFeedbackID") == 515);
+static_assert(GetInterpreterFunctionHash("UpdateUniformBlockIndex") == 777);
+static_assert(GetInterpreterFunctionHash("UpdateUniformLocation") == 538);
+static_assert(GetInterpreterFunctionHash("UpdateVertexArrayID") == 903);
+static_assert(GetInterpreterFunctionHash("ValidateSerializedState") == 623);
+
+// Returns the index of the function in kInterpreterFunctionNames, or kNumInterpreterFunctions if
+// the function is not known.
+inline uint32_t GetInterpreterFunctionIndex(const char *name)
+{
+    uint32_t index = GetInterpreterFunctionHash(name);
+    return strcmp(name, kInterpreterFunctionNames[index]) == 0 ? index : kNumInterpreterFunctions;
+}
+}  // namespace interpreter
+}  // namespace angle
+
+#endif  // ANGLE_TRACE_INTERPRETER_FUNCTIONS_AUTOGEN_H_
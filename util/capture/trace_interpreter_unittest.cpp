@@ -0,0 +1,67 @@
+//
+// Copyright 2026 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+
+// trace_interpreter_unittest.cpp: Unit tests of the trace interpreter's function lookup.
+
+#include "gtest/gtest.h"
+
+#include <string>
+#include <vector>
+
+#include "util/capture/trace_interpreter_functions_autogen.h"
+
+using namespace angle::interpreter;
+
+namespace
+{
+// The lookup the perfect hash replaced: compares the name with every known function.
+uint32_t FindFunctionIndex(const std::string &name)
+{
+    for (uint32_t index = 0; index < kNumInterpreterFunctions; ++index)
+    {
+        if (name == kInterpreterFunctionNames[index])
+        {
+            return index;
+        }
+    }
+    return kNumInterpreterFunctions;
+}
+
+// Every entry point and trace fixture function is found at its index in the names table.
+TEST(TraceInterpreterFunctionsTest, FindsAllFunctions)
+{
+    for (uint32_t index = 0; index < kNumInterpreterFunctions; ++index)
+    {
+        const char *name = kInterpreterFunctionNames[index];
+        EXPECT_EQ(GetInterpreterFunctionHash(name), index) << name;
+        EXPECT_EQ(GetInterpreterFunctionIndex(name), index) << name;
+    }
+}
+
+// Names close to known functions hash to an index in the table, but are only found if they are
+// themselves known functions.
+TEST(TraceInterpreterFunctionsTest, RejectsUnknownFunctions)
+{
+    std::vector<std::string> names = {"", "g", "gl", "egl", "glUnknownFunction", "SetupReplay"};
+    for (uint32_t index = 0; index < kNumInterpreterFunctions; ++index)
+    {
+        std::string name = kInterpreterFunctionNames[index];
+        names.push_back(name + "X");
+        names.push_back("X" + name);
+        names.push_back(name.substr(0, name.size() - 1));
+        names.push_back(name.substr(1));
+
+        std::string swappedCase = name;
+        swappedCase.back()      = swappedCase.back() ^ 0x20;
+        names.push_back(swappedCase);
+    }
+
+    for (const std::string &name : names)
+    {
+        EXPECT_LT(GetInterpreterFunctionHash(name.c_str()), kNumInterpreterFunctions) << name;
+        EXPECT_EQ(GetInterpreterFunctionIndex(name.c_str()), FindFunctionIndex(name)) << name;
+    }
+}
+}  // anonymous namespace